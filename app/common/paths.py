@@ -0,0 +1,42 @@
+import os
+import sys
+from platform import system
+
+APP_DIR_NAME = "HITSZ Connect Verge"
+# Lower-case name for XDG directories on Linux
+XDG_DIR_NAME = "hitsz-connect-verge"
+
+
+def get_base_path():
+    """Get the directory that contains the ``app`` folder, packaged or not"""
+    if "__compiled__" in globals():
+        return os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def get_state_dir():
+    """Get the per-user directory for state that must survive a reboot"""
+    if system() == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base, APP_DIR_NAME)
+    elif system() == "Darwin":
+        return os.path.join(
+            os.path.expanduser("~/Library/Application Support"), APP_DIR_NAME
+        )
+
+    base = os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state")
+    return os.path.join(base, XDG_DIR_NAME)
+
+
+def get_log_dir():
+    """Get the per-user directory for log files"""
+    if system() == "Darwin":
+        return os.path.join(os.path.expanduser("~/Library/Logs"), APP_DIR_NAME)
+    return os.path.join(get_state_dir(), "logs")
+
+
+def get_runtime_dir():
+    """Get the per-user directory for the control socket and instance lock"""
+    if system() == "Linux" and os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], XDG_DIR_NAME)
+    return get_state_dir()
@@ -1,13905 +1,30 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.9.1
-# WARNING! All changes made in this file will be lost!
+import os
+import sys
 
-from PySide6 import QtCore
+from PySide6.QtCore import QResource
+from .paths import get_base_path
 
-qt_resource_data = b"\
-\x00\x00\x00\x06\
-1\
-.2.2\x0a\
-\x00\x00H\xfa\
-\x00\
-\x02\x92\xc1x\xda\xed\x1d\x09\x5cM\xcd\xf7\xb6\x90l!\
-\xdb'\xa4\xbd\x84\xec|\xb6\xfa\xc8\xf6Y\xff\xc8\x1e\xf1\
-YK\x9b\xa5U\xf5lY\xa3\x94\x12R\xb2\x14%\x89\
-\xa4\xd2\xa6\x90\xd0B%\x8aBh\xdf\xb4/\xf7\xfeg\
-^\xf7\xf1zz\xbd\xed\xbe-\xcd\xefw\xdc\xb9\xba\xef\
-\xde\x99s\xce\x9c9\xe7\xcc\x993\x08\x22\x82H\x22\xb0\
-\x88 \xc3\x10\x83A\x08\xe2\x0a\xea$R\xf3\xbdj\x17\
-\x11DD\x06A\xf4\xf4\x9a\xef}]\x10DMA\x04\
-\x997\xaf\xf9\xfe\xd8\x0a\x04I\x09\x11A\xb4\xb4\xf0\xe7\
-g\x22\xc8\x9a\xee\xa2\xc8\xe8\xd1\xf8\xf3J\x08r`\xb1\
-(2l\x18~\xdf\x0b\xfc~\xaf(2p \xfe{\
-\xf0\xe9\x94\xc3\xa2H\xaf^\xcd\xf7;\xc4\xc1\xefO\x8b\
-\x22\xc7\x97.\x9e\xdb\xa3\xeb\xa0\xae\xa0)=\xe6\xcf\xd3\
-^\x06\xff\x0a\xa1KgpY\xbf\xdbw\x1b\xb8H\x9a\
-\xcc[\xb3\x07Az\xc6B\x10yf\xec\xbb\x05A\x06\
-\x0d\x99\xaf\xfd\xcf\x0a\x8bK\xc5\x1flv\x0d\xfe\xea!\
-QV\xfa\xb2\xa4\xfe\xfaVg\xa5\xc5\xf3.\xec\x93v\
-\x93\xcf(\xfa\xa0\x96(\xdbSmz\xe2\x82=N\xfe\
-\x0f\x06\xdbG\xceV\x19\xf6m\xf1\xaaN;\xa4\xb07\
-\xae\xb7\x8e\xa6\xbbNV\x8d\xd8\xd0/\xc7;\xb7V\xac\
-\xbb\xe1\x12\x9d};G\x1c\xb8u\xbbK`\xe8\xd4+\
-\x8e\x97\x02\x1e\xac\xf8\xbb\xa7\xe1\xe3\xce\x97H\xf3w\x0d\
-\xce\xcc\xc90\xb0.=\xe3\xbe/\xbd:\xf2U\xd1\xcb\
-i\xe3\x92\xf6k\xbe\xee\xba\xab4\x11\xfd\xb7\xa6\xae\xf8\
-\xc7\xc4\xa8\xb9\x22\x96+\xa7\xb9\x9f@v\xa4\xd9-\xcc\
-\xc3v\xa5\xc8\x22\xbdD\x02#\x9e\x86\xfc%>\xfa\x0a\
-f=\xc7\x0e\xd1Z\x8b}\x8f^j\xfcL<\xde\xb9\
-o\x8a\xc8\xd2\xad\xe5[n\xf5[{\xd5(M\xb67\
-R,\xff\xdf\xf0\xcf\x93\xefk\x8f\xf1\xd2\x1c;+b\
-\x88\xd8\xe6Y\xde\xff\x9eG\xd6\xcf1.\x92\x5coP\
-\x14l{\xe8\xe4\xc4c\x06\xf3\xe5^]\xcb\x19\xb5\x10\
-9\xf8\xc4\xf9\xa6\xf8\xfd\xce\x9e\xa4\x86\xc8\xb4\xe2\xdd\x83\
-\xdf\xf7\x92\x9f\x9e\x9a\xe9\xd4_\xe6D\xd4\x18\x91\xc9\xfe\
-92\x91\xd2\xe8\xce\xb2s\x83%\x92\xa5\xaa{\x0d~\
-&\x9eC\xb2\x18\x9bv\xdc\xc0\xc1\xd6/c\xc7\xfa\xd2\
-i\x01J\x87lSb\xe2OKF+[]M\xd2\
-L\xef\xda\xf3\x99_\x80\xd6\x82\xceM\x0b;W\xeb\x89\
-\x06:~\x8c(\xed,\x131\xa4\xe2y\x0erT2\
-}\x93\xa8\xafSd\xff\xecN\xb7?\xdd\xb3.=\xf5\
-\x03\xe9\x89\xe4}\x19z\xf8\xfdh\x91\xf3\xd7\x92>\x9a\
-\x8bd\xa8L\xec\x93m\xdd{\xad\xfc\xbc\x93=\xe3N\
-\x9eG\xba\x9fPY\xae\x8bXE\x1b[\x87\xfc-\xe5\
-\xb5\xdd7\xe4\xea\x92\xbd\xc36<\x16_\xda)\xe2b\
-\xf6m\xcd\xc9\x0f\xccC\xd4\x93\xed%$&O\xf3=\
-%\xe9u\x0a4L\xf4v\x8a\xf9\x81\x1e\xd9\x06\x01H\
-\xde!\xd7.c7\xcf2\xd5P&\xc9W\xdag\x8b\
-\x9d.\xddZ.\x7f\xff\xd3?s\xf6\x0e3\x8a\x15_\
-\xea\xe5\xe5\xe7\xd9wH\xb7w\xde\x03\x06\x0f\x1a\x11+\
-\x8e\x9c.\xb7\xb1\xdf#\xdei\xbf'2\xd9\xaft\xdd\
-\xfa\x09\xa43\xd2\xa4H\x83R\xc4b\xd6\xe9\xec!\x12\
-\xc9\xc5o?\x1c\x89\x5c\x80X\x99GID+\x1c\x9c\
-%gn9h\xed\x99\xe8U\xb1\xa2\x1b\x95\x90\xa6\xce\
-\x1e3L.-y\xa2+\x92\xfc\xd5G\xe6\xcc~'\
-\xa4rk\xc4\x8c\xc0\xf0%i\x7f\xf7\x1c\xd9{\x8b\xb6\
-\xc4\xe6I:{\x11\xb3\x93*\xcb?$'\xfc\xefn\
-\xf9\xf2\xe0\xf7\x22\xdd\xf3<\x87\xdc\x9c\x9f)\x96\xfc\xac\
-\xbeI/\xd6\xe7=@\xafZa\x16\xc9e:b\xe3\
-\xef)\x22\xa3\x99\x160Dk\x0e\xb6p\xfe\xdc[C\
-\x91\xed\xb5\xcf\xb7\xbd\xbe\xddw\x9e3R\xb9\xafi\x86\
-E\xd4\xa9\x89\xa1\x99\xc3\xeeK\xceT\xab\xee1\xcf\x09\
-y\xf8hnO\xe7m\xa1\xc9?\xf6 \xe5[\x0a\x10\
-\xd2U\xbd/*\xdf\xfd;\x99\xac\xc0\x8a,/l\xb7\
-F.}Uq+\xab\x1c~@\xc5\x1a\xa9\xb7\xf04\
-h\xc8\xed\x5c\x8c\xbc\xae\xdf\xfez\xcf\xb4\xb7b\xc9'\
-M\xab\x0f\xe9\xda\xeevSO\xb6\x12\xdd\x99r`\xe0\
-\xa7\x9bCI\xb6\x85%2\xe0\x1d5k\xba\xe5\xf4h\
-\x1aW\xf0\xd7\xe5\xf9\xe0\xc5\xb7$\xa2\xbby\x7f\x19v\
-+\xa7S\xd3\xbd\x02\xc9\xcb\x03E\xe3\x9co\xce\x08\x9c\
-!k\xf9\xe2$`0]\xefC\xbeqU\x92$\x07\
-\xcfi/\xab\xe6G\xa7\xc1\x9abN\x81bN\x82\xb8\
-\xd7\x9dr\x9f\x18\xc3\x08\xc5\xa3\xff \x92\x93J\xfa\x99\
-\xe8\x8a\x82w\xcf\x0f\x1d+\xf9\xd0\xb4\xdf\xb0\x1e\x13m\
-\xcf&\x99\xed\xf04\x5ce\xaa#\x9a\xfc\xacqW\xa3\
-\xa2_q\xfd\xf6\xac\x09\xeb\xc7\x89\xe7\x1c\x96\xad;f\
-\xa0\xdcY\xd7\x09\xc9\xa8}~t\xbd\x93\xf8a)\x91\
-J\xdd\xe5\xbb\x1as'5d\x05\xfe\xb7t\x87\x94V\
-\xf6\xa4W\xc5\x11\xb9\xdb\xa5\x8eM\xbb\xbcp\xb5hr\
-i\x81\xf5\xac\xd4\x06\xe9\xd0\xf8!\xde%\xf2}\xcf\x22\
-\x95\xd6>ortm\xb4If\xea\xa63\xb5=\xfe\
-y&\x8dL\xaa\xef\xd5Oi\xcbU\xc7c\xf3\xa3m\
-\x03\xcb\xa5o\xdf\x1f\xb26\xd3\xc4\xe5\xaa\xa4\x96\x86w\
-\xfc\xd8\x0d\xdaO\x82\xa7\xea\xeeH\xbd+G\xda\x10\xd6\
-\xe0\xbb\xbctn\xee&\xf3\xa9:\xbb\xb3\x9c\xc4\xa3\xe7\
-k\xca\xcf\x1a|\xb1\xef\xfd\xe9\x22&\xaf\xcf\xc4\xf7\x9d\
-\xab\xdc\xc9\xe3\xbcX\x1e\xa0\x94\xd3\xff2\xaf\x04\x0fY\
-\xf7\xee\xbdX\xceCO\xdfm\x0f\x12%2\x5c\x91\xca\
-\x00\xbb\xce\x83k\xa4\xd3>w%\xf5\x0f\xb7\x175\xeb\
-)ba!\xf1\xbf\xe2\xf4\xc7O\x9bD\x1e(\xc2\x11\
-\xd4#\xa0Fz\xcdu]\xe3\xe5\xae\xf7\xf6w\xe9\xb5\
-\xe4\xc6Z/\x8f\xccg\xc6v\xf2\x85\xebE\x92\xa7\x80\
-\xf1w\xb7\xc2\xdb\xac\x12\xa9\x8f~\xbadKpp\xf2\
-{\xd7\xeb#\x16!\xf5\xfe\x9a\xe1\xa8v\xf5\x8e\xb7\x99\
-\xe7\xb7\x8e\x90\x115I\xf7\x8c\xef\xed\x1a\xd0u\xf5\xbb\
-\xe6\x86|H\x7f\xfc\xb8\xc7L\xd7J\xa42\x02\x8d\x0a\
-\xf9\xbcV{\xc5\xb9!+\xb3\xd4\xf5t\xa4\xa2S\xd6\
-\x0d<\x1e\x7fa\xe2\xaa=\xa2\xc9\xdd\xacw\x7f>\x13\
-\xbf\xa6\xd8*\xd3o\xfe\xa2Y\x88\xcdgc$:}\
-\xad\x98\x9c|l\xe2\xacL\x19=\xab\x99\x81\xe9C\xb5\
-&e\xd4\x1e\xd7~\xd7\xf5v\x8f\x0b\xdb\xc2$\xa2\xb7\
-j\xca\xaf\xf2\xdd\xb9&\xd0\x15\xff\xc3\xba\x93\x83\xacD\
-nX!\xf5\xb6\x98\xf9\xcbH\xb5\xdekJ\xf6l+\
-\x91\x1e\x9d)\x967\xa6n\x8a|\xd0\xdc3\xee\x03\xfe\
-*\x11)\xcb\xf4\x8c\x0f\xee^#\xfa\xb2\x12\xb1Z\xf8\
-\xc8\xfeX\xd1v\x8bQ\xd1K\xa5H\xe30\xed\x80m\
-\x16\xb3\xa3w\x90\xab%[Au\xa1\xe80\xf9\x9a \
-\x15\x91\xbc\x86\xd3u\xc5Kr\x8d\x0c\x1c\xb2\x14z\x8d\
-7\xf944\xf6\x8a\xa3F\xdc\xc4#\xbd\x8d\xba\x9c\xb3\
-I\xbc\xf9\xf2\xe1\xac\x94^\xf7\x1f\xbc_\xf5J\xda\xef\
-\x82\xf8)\x95\xe5\x92\x88\xf1\xf9\x9eG\xaf\xf5r\x18\xef\
-}{\xeb\x90\xcd\x17\x1f\xd7\xff\xd7\xe3q\x8f9\x91\xb3\
-\xeek\x9b\x98~\x1en\xafy>\xee\xf9\xcb\xc9\xe0\x12\
-\xa4\xb66;\xfc?\xdf\x10\x05\xdd\xfc\xf9ih\xd4[\
-\x9d\xe5\xaa\xb9k\xee.\xda\xb4\xf7\xc1\x9c\xbbS\xcd\xc4\
-&\xce\x1dd\x10\xb9a\xdd\x8b)H\xb4nFw\xe4\
-|\xd8\x943o\x8fj\xc6\x19\xc4^\xb50\xac\x8d\xbd\
-pg\xc9\x820/\x8f\xe7kV>\x19J\x8a\xac\xac\
-\xf9_q\xb9\xe3*m\x05\x87\xbc]\x0e\xde\xf7\xf6\xdd\
-Sr\x88\x5c[\xb7\xa5\xec\xf5\xf1\xee\xd6\x9d\xd3\x1fF\
-\xbe>\xab7a:i\x94\xc1f\xb9\x90\x93s\x06\x95\
-\x9b|V\xceJ\x0b[\x13\xdfpT\xe6\xe0C\xbf}\
-\xe3J\xf4?\x9cZ\xeen\xda\xd8\x18gY\xddU\xff\
-\xcd\x91\xae\xe7\x0e\xdd\x9a\x8f\xac\xafw\xbe\x94g\xbfq\
-!h\xc2\xfd`\xff\xd8\x9b/'\xf7\xbc\x91\xb4\xbbO\
-\xca%\xa3\x15\xf3\x90\xadG\x91\x11\xd5j!&\xb3z\
-I\xa9\x18=\xb6\x09\xcf\xda\xf8\xe6\xeb\x8am\x835\x0b\
-0\xb1Q\x0b_\x1e\xeb\xf9\xc4 \xa1\xbf\xd4\xed\xfbR\
-\xa4l\xf4\xac\xbe\xc1\x9a\xa3\xd9EQ\xaf\xa4\x1dd\x93\
-?O\x0f\xc2&f\x95:Y\xe8^\xdb%\x13\xe0\x82\
-\x8c\x98~\xe4p\xd6\xa7\x94\xd3\x03\xeb\xc3\xde\x0f\xf6\xc8\
-\xb97\xf3\xa1\xdc1\xd9\xbc\xbb2\xba\xb6\x95w\x83\x0c\
-\x1f\xe6\xf6\xd2\xd2<\x98\xe7\xfb\xf5\x93\xe3\xe8O\xf6\xc3\
-6\x14\xbd?\xben\xe2\x91\xd9G\x97\xdd\xbb\xe9\xf7\xa3\
-\xb6\xc4\xaeQcq\x84\xf5\xec\xbd\xaa\x1bLj\x96\x1a\
-\xcfMQx\xfa\xa2\x0a\xa9-\xd6p\xca\xb81zC\
-\xb1\x91\x9bw\xb9\xd8\xda\xb1\x85\x0d\xe1\xba\xb5\x175\xd7\
-\xa9L\xe9\xab\xa1\xfa\xce\xd5\x1d\xd9\xef\x05\xe8R\x1ff\
-\xf6\xef;C\xdb\x0a\x19C\x8b2\x0dM\xf5)\xddC\
-\xd4\xdf\xb9\x8a=\xb1\xbdi\x8e\xd5\xbc\xeb\xdf\xf3\xef\x1b\
-\xf7&\x9c\xd8^S\xa2e\x93|\xda9\xe7\xc3\xa6\xef\
-\x0e2\x81uo\x86o\xc0\x14\xdc\xba.\xd8\x91\xe1\xf8\
-\xd0\xbc\xecu\xf9\xc6\xeew\x1ag\xdd\x5c2\xfb\xf1G\
-\x8bxI\xc3\x91\x85eI\x1ev\xa3\xa6t\x9f\x9b\xf5\
-\xc1L!\xd2\xeeY\xff\x94M\x0f\xd7xgh,P\
-B\xcc\xb0\xe9\xa3\x1e\xa8\x9d\x02/\xec5\xc4\xfeju\
-\xb0q\xec*\xcdl$\xb7\xff\xec\xa3\x9f\xe7\xcc\xce\xac\
-\xbc%\xeee\x8c~\xda\xecw\xf4\x88\xcc\xc1\xd7\xa7\xeb\
-\xd4-\x0b\x22\xcd\x1au\xc6\xc7+\x06\xbe_\x19a\xa8\
-\xb1\xdc_\xc21P\xb3\x7f\xd0\x9b\x933\x0c\x1b-5\
-C\xef\x0c\x99\x94\xbeh\xd3\x98\xa9\xeaS\xfa\x86\xcc\xf7\
-o\x9c}W<\xba$\xea\xe8\xf4\xf7\xbd\x9d\xb7\xddL\
-\xf27\xf9o\x88mP\xe9\x82\xf322\x9b\xfa\xac6\
-\xd2\xc9\x1c\xe5\x8aX\xa4\x86\xcc\x0d\x0e\xf6\xff\xf12}\
-C\xb8\xa1\xc1\x863\xcf\x22\xcbg\xbf\xd4\xb5\x1d\xd0m\
-\x9c\xb3w\xac\xe9I\x1dC\xeb5\xa2\xc9\xea\x98\xa3\x04\
-\xf8\xbe\xc5c\x95qhZ\xc1\xfb\x88!!\x1f\x07\xcf\
-6\xdb\xdc\xf7\x87\xec\xc5\x19\xff\xac\x1b\xae\x9eY\x9b0\
-TK4w>\xa0wE\xd6G[\x95i\xd5\xb73\
-E\x90\x1f\xcen\x8e\x1e\x03\xfb\x0dvPW\xecj\xb7\
-\xfa\xef\xe5.\xc8\xdf\xca\x83v\xc6}\x9b\xa7\x90>^\
-\xbcw\xe6\xfdm\xf95*U\xd6\xd9G\x01\xd7\xa7\xa6\
-\xd5\xdd\x0a\x88\x0d\xb03\xcd\xbc\xf0\xf6\x8bA\x88a\xac\
-\xd3\xa4%\x1a=:\xcd4\x98\x84\x9cx$su\xf8\
-\xbc\xbeh\xe0X\x11\x93F\xe3\xab\x80|f\xcf&z\
-\xdf\xfeZ\x7f\xfd\xbd\xc5\x93i\x87\x934\x9a\x1aR\xd3\
-,/%\x9c\xfa\x02x\xecN\x0f\xbb\xd5\x95\xb6\x16Q\
-\xbb\xaa\xc7\x14\xde5\xfexz\x95D\xe2\xa6\x0a\xe75\
-#^.\xdc<f\xea\xc9\xfa\xaaW\xb6\x8bD_\xbc\
-\xaf}\xfd\x814\x02\xddt\x06p\xa8y\xc8\x1c\xd3\xec\
-\x80\xdb\xae{S\x96l}\x9a\xa2i\xd2\xbbIl\x00\
-\x92[S\x17\x92\xb6_\xf7\xdd\xf4\x1f\x09\xf3\xa75U\
-<\xbf\xeeyNozA\xba\xa1}\x9f\xb2\xaf\xbb\xf3\
-\x9799>\xc6\xaa$\xc7\xdc\x8dW\xcb\xea\x15\xd7\x14\
-\xbe\xd6\x04\xbe \xe0\xf9\xf7\x05[\xa7_\xaa\x9d\x06\x06\
-\xc2f\xf3\xa2\xce/\x02F\xde\x930\x0b\x19\xb5\x00\x09\
-\xad[\xf3r\xc3\x943a7\xb6\xf9^\xb1:\xe0$\
-\xe9\x84\x04\x0e\x17\xf1\x7f\xaf\xa4\xfd\xad\xe8\xf4\x07\xd2\xdc\
-\xa9\x9b\x1f,N0<=>\xa8\xd0X\xeb\xe1]\xa3\
-\x9d\xa3\xf4\xe6\x1b\xf5\xde\xf3\x9fB\x97\xd9\x13\xe5\x93M\
-<\x1e\xe6\x5c\x0aIMO\xdb\x1c\xa5\xb8\xe7\xfe\xf5\x87\
-Q\xd1\xe3\xac\xcdM\xe6|<24#\xc2\xa6Jc\
-\xcf\xc9x\xdb\xca\xc8\xec\xea\xae}\x17!\xb3\xd1\xc2\xa5\
-\xc1\x15ifY+\xd6\xb8\xb9f\xa6?\x1aZ\x9e\x14\
-\xa0Q\x1fR\x14\xa7\xfa\xcd\xe7\xe9\xe0\xd3\xf3\xce_\x7f\
-\x10 \xba@\x9a\xb4\xe5\xec\xae4\xb3-\xd5\xc1\x1a\xbb\
-\xd4\xebB\xea\xf2M\xb3\x8b\xfa\xc5\x87\xd4\xed\x97\xf2\x9a\
-\xbd^\xf5c\x7f\x87\xf1\xf5\xd5\x89S5\xde\xbf\xb1\xfa\
-\xef]\x94\x06@[\xc9\xd5\x9a&\x93I\x9b\xba\x99\x8c\
-\x14\x09\x94\xd0\x83C\x10p\xaa\xde\x97\x1a\xc7\x1d\xcb\x07\
-\xbeZd\x900c{y\xc1\xf8m\x1ag\xe2/\x8b\
-\xbbV!\xe7\x91\x85\x16f\xa5=\xcd\x1a\xa6\xefXR\
-\xf8}\xf8\x8c\xb9\xeb\x94\xf7\xaf\xfa\x16.\xe9\xa6D:\
-\x16\xad5-\x1f\xd5]\xf7\xa2\xe4\x9bB\xcd\xfb}\x0b\
-\xf6\xe8$\xbd\x18\xb9ek\xe4\xf5\xc9\xa2\xeb\x17 Y\
-\xa2\xbb\xb4\xc6\xbf>v\xb4\xcf\xa4\xe3=\x0f-|\x9f\
-\xbe~\xbf\x92\x97\xaa\xcd\x1d\xd2\xe1\x17\x87\x8b\x11\xaf\x82\
-gv\xce\x22g\xcc\xe2&\x97\xd4\x04\xeep\x8e\xd9\xb4\
-\xce\xa8\xf7\xbb\xe3\xff\xcb?\xab\x05\x14N\xdf\x9c\xdal\
-\xc7\x07\xae\xfbj\xfb\x84d[}\xbc=in\x8f(\
-\xe5\xa9cN\x14\xe5*\xc9x\xf7\xbe\x91\xe6\x162+\
-\xed\xe0\xd1\xe5\x09\x9b^\xf9\xbc,\xc66\xd6Z\xcc\xbc\
-\x15!:\xdcBzi\x9a\xb7\xd3\x1c\xdb\x86\x05\xde\xa9\
-\xa7\xa3\xf5!\x7f\x18\x15\x1d\xec\xfe\xe2\xb0d5\xd2=\
-\xc7\xc3\xdc%dr\xcd\xf1\xbe\xd6\x9dV\x98\x0c\xd0K\
-\x9b\xb2\xce\xe1\x8c\xccs\x8f\xf4\xf1\xe9\xb6\xddL\x8cl\
-\xfb\xaf\x9a\x9b]^1vS7i\xads\x8f{\xfc\
-cT\xef\x14\xff`\x90=\xf2\x22\xef\xc5\xe1\xa1\x8bD\
-G\x0e\x16]\xb1SeR\xd3R\xb5\xd0\xd9I\xae\xb2\
-\xabbtI:j#\xde\xcf_qJ\xa2\xa6\xab\xf6\
-\x8a\xc0\x9eZ:\xde#\xca\xe4\xceu\xfbo\xf9\x83\xf5\
-\x93\xa6\x8e)\xb8\xbe\xf5qqV\xe2\xca\xeb\xaf\x9c:\
-\xa7\xc89\x1e\x99\xf3\xb4\xa8\xe1F\xf5\xb2:S\xf3\xb9\
-ss\xff\x07F\xe1\xe5\xd5\xca[D\x87m\xbc\xd0\x18\
-\x87\xaei\xc8j\x1c\x01p=,di\x9d\xc9\x80\xff\
-\x9dG\xe2\xdd\xec?\x86\x17\xc57\xe4\xbe8\x13\xbe\xcf\
-\xddQ\x92\xb4?\xbf\xf2\xd88I$:8Bt\x8f\
-\xdf\x92}}\x1c\xc0\x7fm\xd7\xdf\x96\xe8$\x17=v\
-\xd4m\xf5h\xf1\xa5\xd7?I\x15\xad\x99(\xff\xbdG\
-\x84J\x89\xeb\x86\x90s\xb2\xdf\xc7\xeau\x02\xf2\xd3\xec\
-\x81\xff\xacS\x99\xa4\xeb\xe5\xe9\x99\x03\x0eGb\x8d\x95\
-\x93ww\xfb\x01x\xb0\xab\x83\x98\x9e\xa8\xeaM \xf2\
->\xdc\x95\xb1h\xb8sx\xf1\xa5\xde\x17\x11\xc4\xd0}\
-\xb4\xdb:m\xdd-W\x93#D\x17\x22\x9d\x8a\xa6$\
-;g}u\x9aj\xfe\xb9\xc1\xe6\xce\xbb\xb0\xbf|\x07\
-\xad\xad+\xf7O\xbe\x9ap\xceb\xec9\xe9\x8a\xc4Q\
-_\xe2\x0e\x5c\xce\x1d\xba|\xdc\x9e\xda\x0d\xd9c\x1eM\
-1Y\xbcWu\xe9\xc1*\xf8\xfe\xbf\xafg\xd48\x93\
-\xeab\xa7[x\xf9D\x1d\x96)4\xa9\x8d\xd1\x18\xa0\
-9:u\x13\x187\x9bB\xfa6L\x11\x01\x13j\xf9\
-\xc5\xa6\x10\xd3K\xa5\xffa\x95\xaf2\xcb5t\xedF\
-N\xe9\xbe\xe9\xc5\xe1\xc8EH\xf8\x7f\x93\xbc\xee\x18\xa8\
-DUI\xd6\xec\x97\xb3\x7f\x16i\x19\x9e7\xfa\xb0\x8b\
-l\xcdVQ0\xdb}\xfe\xebr\xfe\xdcNaf\xc6\
-\xcf\xde\x1a\xa9\xdb\xec\x0et\xbe4B3@t\xe0\xde\
-\x5c\x8f\xf5\xf2@\xe4\x82\xa1\xe7\x1d;l@\xfd\xf3\xc8\
-\x0f\x13t\xba=8;\xeb\xeb3\x09\x1dD\xda,\xea\
-\xe4\xba\xc32\x07\xa7%\x5cL\x98\xd2\x98\xb3j\xa1\xe7\
-_z\x13$\x12\xce,\xa9\xd5\xef\x12}\xf5\xd1\xcd\xb3\
-;\x96g\xf4S\x17\xb34s\x93]%\xb2eWh\
-\xd0\x8b\xb2\xf1\x1bo\xa5k\xda\xeeS\xb9p1k\xb9\
-\xd8\xeb\xa7\x15_\xfe\xda\xa8H2\x99\xe5\xe8SwV\
-\xeeLV\xe8\xf2\xbd]^\xbc[n;\xed\xcbI\xb9\
-h\xa9\xa9\x0f\xee\x16.\xb1\xcf\xfaq\xe4\xbc\x9f\x95\x08\
-\xb2K\x0d4h\xde:\xb3\x09\x03N\xcc\x19d\xba\xaa\
-p[\xca&G\x89\xd0\x9d\xa3\xbc\x1c\x8fXwz\xfd\
-\xba\x06\xb1\xb84\xc0=\xd8\xa7jN\x8a\x9c\xcb\x16\x9d\
-:\xd3~\xd1Z\xc5\x9f\x1e\xaeR\x89jz~\x0d\x0c\
-\xc0\x90\x8fE\x1f5\x1c\x8f\xb8?_\xeb\x1cM\x02Z\
-\x98\x5c\xf1\x0c\x12\x10\x90!\xf5\xcb\x16\x99}\xf8\xfcQ\
-\x1c\xc9\xfb\xfaL#\xc2@\xdf\xdd\xc47\xe4\xbf\x9d\xb2\
-\xd1\xa6\x06\xb1\xbb\x8f~\x18S\xdeoU|fV\x96\
-X\xfc\xb85\xb6\x8d\x93M\x8a7 j\xd6\x22\x86#\
-\xdf\x9e\xecy`Zb7Id\xb4\x8e\xed~\xd1\x87\
-\xae\xc8\xb5K\x129Oe\x83\x0e\x16\xba\x8a-\x18\xb3\
-\xd2v?\xe28Y\xa4l\xf4\x92\xa0\x7f\xef?\x9f\xd5\
-i\x93\xdf\x1d\xf5\xc0\x11\x22[\x8aN\xcd\x17_\x8c:\
-ynU\x993\x063}\xe7d\xd39Y\x1a\x98y\
-G\xf7NG\xe4\xa3.z>Z\xb1\xdb}t\xf6\xb7\
-n\x93D\xebn\x8dB\x9cdG4\xcb\x94U\xa3\xa4\
-G\x05W=\x16\x8f\xde\x808\x1d\xbe_\xf1\xe5\x85\x91\
-\xda\x06\xfd\xc2\x85\x88\xf6\x0c\xc7lu/\x0d\xe9\xfe\x8b\
-\x90\x9d>\x87\xe4+\x0e\xde\xfc\xcb|h\xb1\xe1\x8a\x7f\
-\xea\xca\xb1\x04\xccHM$~b\xef\xc9\xfb&\xa8O\
-\x11?\x1b\x97l\xdds\xa8\x92QH\x96\xbc\xbd\xe7\xc3\
-B\xacB3\xe0\x91\xcc\xd2\x0b#c\xa6\xbdr\xf37\
-\xb1\xd2\xf6~*\x85\x9c\xb0\x0a*{vNrX\xf1\
-z\xc5\xea\xa9\xb1\x8aZ\x13\xa6\x8c|\x13\xa2\x89\xa8&\
-`}Q\xd5}\xa2\x93\xdd\xff\x1a0D\xd42K2\
-f\xee\xf1u\x8b\xfe\x97\xfa\xb6\xab\xdd\x06W\xc4\xdej\
-\xea\xeb\xd3s\xfe\xbb\xb7|!\xb2Ba\xd2\xe0\xa1\xfa\
-\xd7\xef\x1d\xad\xc6\x1e\x94}\xdf\xdc\xef\xc05w\x09\xa0\
-a\xcdZ\xa8;a\xefI\xc5\x94\xb3\xff\x1d*\xd5\xab\
-\x90\xfe{%\x82\xf8\x0f\xc2\xc4\x9eHkE\x89]\x99\
-\xfc\xad\xea\x93\xd4\xec\xa3ZC\xab<\x8d/\xf7\x1fr\
-\xf0z\xdf\x09e\x15\x09\xd9\xfd\x16 ;\x1bf\x99&\
-\xc6Tzj\x83?\xee\xdd\xb4\xeb\xdf\xb0\x12\xbbQn\
-S\x1fT\x98\xfb\xf5!E\xca\xe6<R\xe8\xfdw\xce\
-\xe3\xb8\xee\xdfE\xe3\x03}6\xaeI[W=\xf9\xeb\
-\xe7\xd0X\xa9\xcb\xab\xeb2\x97\xe9\x1c\xb8>\xa8s\xe3\
-\xe4\x09#\xa6\x88W8\x86|\x8c$)\x9c\xdd\x87]\
-\xb9u\xd3;jTy\xe5}\x1b\xa7\xc9\xc6\xb5\x87\xd4\
-\x1a\x1b\x0f\x8f\xf7\x18\x14\xf4\xeeK\x14j\x9c\x22\xb7z\
-1\xe8\xd1\xc9\xa6\xc8\x1d\xa2\x03\x0b\x8a\xf3$L\x9e\xa4\
-\x1f\x1bl6\xbaIe\xfd%\xdf[+\xfa\xd4e\x8c\
-\xbbs\xc9\xc5\xa0P\x03\xd1r\x9fa\xbd\x03\xd38\xd9\
-t=+f\xd8\xb2\x1eb7\x02\x12\xbf\x84G\xd5G\
-\xe4\x8d\x8e\x7fr\xbaG\xe4!\x9f\x8d\xae\x86ERZ\
-:v\xab*\x96l\xdd\xa0\xac#\x8a\xdc\xbf\x12}\xa6\
-\x1e\x1b6\xa5\xfb\xee+o\x14\xdc\xca#\x22u\x9cs\
-\x97-\xed[\xb5\xe3y\xd49\xebM\xd3\xdc/ \x81\
-\xe9\x15\xc7\xc4\xc3\xed\xde\xael\xf4RP\x06\xcf\x1d\x87\
-\xcf\x85`V+\x02\x16i.p\xc9\xdf\x93d\xe3\xb3\
-E\xe7\xcd\xbf\xdb\xc5\xfe}\xdb\x0d!\xb9-\xbe\xf4l\
-\xf9\xfa\xbf\x86\xc5\x7f\xac\xfd\xdf\x83\x06\xa9\x15\x8b\x11\x89\
-\x11\xdd\x9f\xe8l\x98bz9V\xc4s\xea\xc4\xda\xd3\
-Y\x0e\xb2\x88W\xe3\xfd\xa2\x8d\xea\x11\xc0t\xda\x8a\xec\
-\x0a\x1e>8\xe4\xb8a\xd7/\xef\x22\xa6\xae\x9e\x93\xb5\
-\xfd\xb2\xe5\xd7k\x97\xa4m_\xa8\x0eH\x9a^\xe3\x11\
-4WFg\xcf\xb4\x87\xf7#\x10\xad\x8b\x03\x1f}/\
-\xbbh\x91\xbf(\xf4\x81\xcd2S\xe3\x08\x1b\x11\xf3\x19\
-\xa8\xba\xecx[-Iq)\x9d\xfd\x8b\xaf\xab\x00\xc3\
-\xb0\x0b\xe9\xcc\x88\xe3\xf1_\xbd\x0d\x0a\xcbk=2\x03\
-\x7f(\x0f\x1d>\xfc\x22\x10\xd0\x16\xf5\xe7\x9c+\x8a\xcb\
-\xd4gIN\xf0\xd7\xb4.\x93}\x9a0\xc3\xe7B\xb7\
-'\xc0\x92D\x1a\xfc\xbb$t\x9b\x98\xbe\xb5\xdcc\xaa\
-\xd1\xe3\xcb\xe92\xbd\x8d\xfc\xa5\x87\xf4L\xcb\xc9\xc8\x99\
-j\x81f \x1f\xcf\xfa\x07\xce\x9d\xad\x9f\x13\x0f\xe8g\
-\x13\xf1\xfa\xcd\xadE\x08\xd0\xfdS\x079\xbb\x8d\xd8\x16\
-\xdc\xf5\x96\xf5\x83\x10\xbd\xb7\xaf\xfe\x97e\xb5\xa0/P\
-xN\xf6<9|\xf2\xf4\xdd\x7f\xf9d\x87\x9f\x926\
-\xde\x18\xed'\xf6]\xd13G}\x91\xe4\xe1\xc8\xa0\xa0\
-\xda\xb9)\xdfu\xac\xffy\xa7\x22v2a\xa4\xfe\xf7\
-\x80\xa4\x8d\x0d\xbd&L\xba\xadf\xb9:\xf7\xc8]5\
-\xe3!\x8ajN7\xdd\xd7H\x86\x94]\xd0\xb1\xac\xd0\
-\xd0\xd8\x91sk:\xb2at\xbf3\xab\xd4\x86\x17L\
-\xda\xf5\x8fYE\x9f\xfe\x95\x87\xfa\xcf}\xaa<f\xec\
-\xca\xfa\xdc\xb4\xddv\x0a\xbb\x0f\xf6\xe92cM\xd5\x1e\
-\x87\xf5\xab\xd3=\x0e\xa4\xad>\xef\xae]\x9dp\xfd\xdc\
-v\xff\xde\xa1\x0b\xeb<\xec\xd4u\xeeu_=\xaf@\
-)f\xb7\xa8\x83\xc1\xd2\xb7\xa9\xdd\x95VkL\xe9\xeb\
-\xfdzE\xd5\xdf\xb3\x96L\xb2\xa8\x13s,\x9a\xb8I\
-!u\xe9\xf4\x82\xb7\x93f\x19>\x04\x82\x5c{\xb6\xea\
-\x9b\x7f\x87U\x1evZ5\xf0_\x04X\xd7\xd2H\xfd\
-\xa9Gs\xa6\x9c8\x11V\xa8y(g_\xa1\xf6\xdc\
-\x99\xf7/\xddB\xc3^\x87a\xb7\xdc\xce[\xc8d\xf7\
-\x14\xeb\xda)v\x91\xaf\x81~\xe7\xbe\xe30\xc9\xe3\xfe\
->\xe2\x075'\xd6\x0f\x8a\xf5\xfcx\xe5\xe3\xe9\xee\xa4\
-\x01\x0e\x91\x8b\xe7\xe8\xeb*\x80\xf6\x7f}\x84\x1c\xf7\xe9\
-|\xfa\xd2\xf4\xdab\xcdA\xb6\xee\xcfC\x0a\x81\xc5\x96\
-\xafz`\x18\xec\x9b\x97\xa9C\xde\xd2\xf8\x10\x97\x9dJ\
-\xbd\x1a\xaf\xb8\xaf\xba\xf0/b\xa5\xe1\xf5\xf6\xa5\xc1\xd6\
-~'vi\xab>\xb6\xee2\x0f\xd1\xb1I|\x19\xa2\
-\xa9\x17)\x81\xd4\xee\x9f\xedu^\xeb\xcb\xa0\xd4\xdb\xd9\
-\xa2J\xbd\xfa\x0c\xe9Zg_\xee\x8e\xcd\xbc!M\x8a\
-\x94\x8f\x96\x8c\xe9\x07;4i\xd7\x81\xb55j)W\
-\x1ce}\x0b\xf6\xcc\xd9\x8e\xbaE<z\x0a\xc4\xc5\xf1\
-\xc5\xbd\x83Ny{\x07\xa8%\x5c\x9f\x19\xe4\xbe\xfb\xae\
-\xab\xb1\x9d\xd7Sq\xaf\x1aQ+\xfdP\xfb\x97\x07?\
-)\x1f\x0e\xc0\xba\xbbu}\xde\xff\xdfa\xb5[Ff\
-\xa3\xa4\x18k\x91\x7f\x8f\xab,\xdf\x89\x14\xaf\x5c\xbf`\
-\xce\xc9wk\xb6\xa8\xccq\xfb\xa03o\x85\xf4\xec\xe9\
-\x96%\xd9\xb2\x91\xc1\xe9/VW\xa5\xa5\x1a\xa6\xec\xbb\
-\xe6\x92=\xf3%x\xed)\xef\x19\x9b\x9fl\x1d1\x1f\
-\xa9?\xfex\xc9:\xd3\x91;\xd5\x86\xcftr\xe8\x12\
-\xf0n\xd8\x94>\x15S&\x94\xed\xbf\xebl\xbbH7\
-\xe1\xc4\xc9<\xab\xe8\xad1'\x0ez\x9e\xf62j\xea\
-\x9f\xd8\xcdq~\xc2\xfd>]l\xb2o\xf9\xad\xa9V\
-KU\x11\x0f\xf7\x0f\xbb\xfc\x12\xf4e\xd0D\xdb\xd3\xeb\
-\x8e=\x1f\xad\xd4+kca\x5cvP\xe1\x9a}W\
-\xa6-\xee2h\xf9j\xc3c\xbe#N*\xa3]\xdf\
-\xa5H\x15\x8b\x1e\x15\xd5\xe9v\xfb\x9d\x97\xa1\xdc7G\
-R\xc2\xb2\x1b\xe7\xf4\xf26\xf8\xdd\xd1\xaf\xf3Y\x1c\xb5\
-\xc4\xebYAa\xc2\xa94{\xdf>J\xbd\xf6'\x14\
-\xd9bAo\x83\xeb\x0fZ\x0e\xeez\xdeq]\x5cV\
-\x9cj\xff;\x8bO\x9e>\x9c\x15g\x1f`w\xd9\xa3\
-)q\xb1\x89\xaa^w\xbf\x1e)\xc3A{\xfc\x1b\x82\
-tW\x85\x8c\x141\xd1\x89\x9e\xb6R\xc6{\x9a\xdf\xf6\
-\xa6UAU\xd2\x13S3S\xa4\x8cz\x8d=\x92f\
-\xdfE?\xa7\x0eJ\xd5\xd7\xe9!\x81?>\x87\x0dE\
-\x0e\xf5|tf\xefj\xc3\xf8$\x97q+\x8dj\xd5\
-\xeaF\x99E\x89 `h\xaeDv\xd6V.\xed\xad\
-\x0e\xa6\x0d\xf9\xa9c\x86\x03Qrxl\x8f\x09\x81\xcf\
-n\x15G~\x9d<6>\xb5\xb4_\xde\xee\xcf\x11[\
-\x9e\xe8\xcfB\xaf\x88\x1fl\xf0\xd8\xd1H\x9a%\x89\xe4\
-\xec'\xf5\x03/\x93\x18<\xb0f\xc0\xee-]\x96\x1e\
-k\x10\xf3\x1f\xa39\xc1\x1e\xa8\xbb`\x82=\xb7k}\
-\xa9\xc6\xec\xb8)\xcbU&\xab\xad\x1e\xb7R\xe6\xac\xc3\
-\xee\xa7\x89U\xe8\xd9\xd2\x82J\x19\xd1K}\xef\xf7\xf1\
-\xeb\xf1<:t~\x94NiQ\xa5\xcc7\xe8m$\
-M\xd2\x8e\x88Z\xb1\xfbd\xfc\x86\xd0\xc3G\xdc\xe7\xa7\
-89J\x02\x86?\x07{\xb02\xce\xba[\xa1f\xcf\
-*\xb3k\x22\xd3\x86\x154]\x7f\xac?\xeb\xf2u\xf1\
-\x99\xd9\xfd\xd2jE\x86\x0d+p\x10\xc9\x81\xc6\xe0\xae\
-yY~\xc8\xbcc\xa7f\xf5\xd7\xd7\x15K\xb5/\x0c\
-\x1c=\xae\xd30\x95)\x83oi\xf7h,\xca\xfa$\
-!;\xe0\xaf\x83\x81rZW,\xc6\xa6I\xe8y\xe6\
-M\xbe\xe6\xb4.\xae\xe8k\xef\xc4n\x0f\xdd\x07M\xde\
-]R6k\xe3\x80!\xf6\xea}\x90hE=\x89\x95\
-2\xbb\xd5\xdc\xc6\xdbF\xcf\x96D\xf4\xfa\x04\xc6>~\
-\xa9\x18\xb4j\x94H\xe8\xec\x94+\xbdrn=\x95z\
-8B\x04\x01z\xf1 $Pw\xef\xe0\xb1\x9f\x96]\
-Y\xd0%#o\xf9q\x19s'\xc5h\x87\x99\xae\x09\
-\xb2\x0b\xbd'\xae\x07\x06\xaf\xac\xf4\xbd\x14\x9f>o\xab\
-\x10d\xd8\xe5\x85\xb3\xbd\x0c\xfbn^\x12\xbd9k\xe6\
-\x88\x83\xbb\xe7H\xa6\xd9\xa5$>\x1e\xba-t\xacH\
-\xae\xe9\xe2\xe8\xa1'\xf7\x8c;/\x13\x15o)\xa2\xf2\
-p\xd7\xcb\xa8\xb3~\xd2\xb0\x1dnY\x8f\xa7}{\xaa\
-\xb1{C\xf4\xe2Q\xc6\x8d$\x09r\xe3|\x80\xb9\x11\
-\xd2+3F\xccA\xd6\xe4\xbbb\xcep\xe8kC\xac\
-f?\x93\xbb\xbat\xcbU\xb3\xd1\x92k\xe6\xf6h|\
-\xd9\xcdA\xb6l\x9e\xd40\x8d\xcb\x0b\xf7\x89X\xfc\x03\
-\x1a\xb9\xf6e\xa2|CJC\xfc\xc8-\xc0\xe8\xddY\
-\xff\x11\xb5\x93\x1e27x\xda9\x84t=\xbcKC\
-\xcc\xba\xe3\xb7\xdd\x00\xcb\xd56\xac\xbe\xd4\xa0\xbdWq\
-\xe8\xb5\x85\xea\x07rB\xb4?f\xfcg\xafb\x8f\x1c\
-\xa9\x0c\xef\x22\x9d\xb3A\xa4\x10\x08\xbc\x0b\xde\xd3\xce\xc7\
-\x8d\xfe\xda=5z\xe8\x9d\x09\xb6\xd1\x87\xa6\x93\xa6\xd9\
-\xdc\xd1\xd2\x5c\xbd\xe1e\xffn\xab|\x82\x87\xc7\xad\x1f\
->b\xc9\xff\x96\x0c\x8f\x09\xd3\x087u\x88\x1aty\
-\x11bIvB\xce\xd5~&\xa7`$\x17\xa0\xd5c\
-\x9a\x1d\xc0\xb6\x9d\xc6\x94Sk-f\x90\x11Y \x9e\
-,\x91\xd8m\xf5\x994\xfb\x13Ko\x9c\xd32\x89r\
-N\xb3.\x96\x9f-\x8a\xb8\x16t\xaf>\x90y\xd4p\
-\x0cV.\xfeME\xe3x\xcf\xd8N.\xe3\x96\x8a\xe9\
-\xca\x17\xd4\xbc\x8b\xd9\xe3L\xba\x9ew\xf4\x8cb\xf4=\
-\x89]\xbd\x1b\xf7\x8a\xef+\x0c\xa9\x0d\xefzw\x90\xc5\
-\x06\x80\xdc\xff\xb9>\x95\x9a\x97*\xa6\x1a'w\xc0a\
-\xff\x1a\xc3y\x97Ga\xff.SFH~\xe2f?\
-\x16\x05\xcb\xcd\x9e~C\xbc\xb0\xdaj\x9fkT\x9f\x9d\
-\xd2Z\x1b@\x13\xec\xcdf\x8e\xb1\x16\xeb\xef\x1c\xfe\xde\
-q\xecm\xf1\x83K<\xa6\xdf\xdf\xb8#eq\xf8|\
-O2\xf5\x82\xb5d\xfa\x04N\xd2\x1b\xa3\xe6\xd6\xb5_\
-\xd5\xb5>\xdd?XW\xe7\x84`\xaaS\xfa\x86\xd7\xc9\
-\x03\x0a\x1aE+\x87\xce~\xb9\xe8\xd4\xe6\xf2\x82\xfby\
-\xf3\xf4\x15KWG\xf5\xdd\xb8(\xbf@\xa5o\x08I\
-\xbdS\xfa\xb2\x15\xa9\xba\xd8_\xc6\xc6r\xe9\xdbj\xd7\
-5\xa6\xd6\x8axV!]\xf3\x1b:\xf7$\xc5\x8a.\
-\xb0\x0cx\xef\xe8}\xf9\xb0\xf7\x0c\xf97\xaf/\xf7\x06\
-\x0a\xb7e\xfd\xc8\xa7\xd3\x91\x07'\x1c\xb4\x87~\xf4\x9d\
-xm\xfd\x0a\xd1\x18\x95\x88\xbd\x85\x01C\xf6{\x02r\
-)\xc5\x1a5\xc5\xd4\x89\x9c|x\x0f\xb4\xb4\x87\x8e\xcd\
-b\xc9\xc3\x97\x1d\xf7\xedL\xea\xa2L\x12\xedt|\x98\
-\xda\x94\xfe\xd0\x16\xd77\xef\xd7\xf5\x99\xfd\xc6\xee\xd2Z\
-\xbd\xeb\x836I\xad>\x9a\xdc\xe7\xb1_\x8f\x9b\x07\x14\
-\x80\x00\x9d\xa59\xa2\xf0\xaf'\xe2K\xed/w\x09\x13\
-\xd9{`\xd6\xa1\xf7\x937\x18\xaab\x0e\xb2\xd3^\xda\
-o\x1c$\xad\xd5o\xf2\x5c\xbd!\x0dR\xca\x9bVe\
-wQF\x0e=\xd4_:\xd5\xfaV\x0f\xd3\x95\xd9\xdd\
-\x95\x11\xe7\xca\xcf\xd7ts\xa6\x1dPs5\x94[)\
-6\xb7\xefl\x9b\x8f'\xabj\xb3H\x92^s\xea\xcb\
-\xbc\xba\xbd/#E\x88*,\x5c%\xb3l\xd4\xf0\x03\
-9r\xbe\x07f\x15}{k/\x19=\xb3\xbe\xe4\xb1\
-\x11\xe2\x91\xb3\xfe\x9f\xb4[~\x13\xaf-\x9c\xa5c'\
-\xa1\xaaYU\x180}\xeah\x91\x0c\xed\xa8rUL\
-o\xac\xafWm\xff\xcd\xb7S\xd4OX\xa5\x1a[W\
-z<\x16\xcfA\xa6\xff\xa5\xe8\xa5$\xd6S\xfa\xdf\xe7\
-#7\x9b\xed\xca\x9di\xb4\x095?\xe1\x1d\x998\xc7\
-XS\x199\x9a\x1f{X\xfc\xfe\x96h\x19\xa7\xf1\xcf\
-\xae\xe8\x18\xff[\x18<\xe4\xb9\xdcB\xe4`\xbe\x9fd\
-\xdd\xd1\x8d}\x1e\x9b\x22;w\xf4\x981rb_\xbb\
-\xffDM\xdc\x0f\x0e\x9d\xe9\x87\x96Y\xb9\xff\xf8\x07\x11\
-\xab?\x94]6*V<G\xc4j\xd9\x8e\x98\xe0k\
-\xbd\x0e4Xu{&\xb20g\xed\x7fI\x81w\xc3\
-e\xa5IG\xf3\xad{\xad\xad\x92\x95\xae\xd7\x5cW)\
-\xe1\xa5tb\xadu\xafC\xc9\x83&\x22[\xc0\xdd\xbe\
-O\x22zz\xbe!\xb1\x12_\x0f|\xad\xc4\xee\xd7'\
-\x9d\xf8b\xa3\x94\x02\x97\xbb\xe6\xcf^\xac\x1d0S\xef\
-\xa0*\x5c\xeej^\xff\x22/A\x91K\x17\x11\xa4\xbd\
-\x97\x87v\xc3\xbb\x03\x18\x0f`=\x80C\x00<\x01D\
-\x01x\x0b\xe0\x0b\x00\x8c\x01|\xc1\x9f\x8d\xc2\x7f{\x08\
-\x7f\x17|gw\xa4\xa3\x08\x1a\xbdG\x030\x06\xe0\x03\
- \x93\x09\xfar\x0a\xf0\x1b>\xc16j\xc6\xf7\xf6\xab\
-\x8e\xee\xa0\x00\xcf\xe9\xdd\x17\x1f\x8f\x90\xde\xa5<\xa07\
-#(\x0d\xb1\x1d\xees\xd1@A\xcf]_\xa1\x7f\x07\
-\x85\xb8&\xd3\xb7\x00\x08\x07\xd0 \x004\xff\x09\xf7\xf7\
-\xaba\x17\x0c\x140\xe7m\xf2\x10\x1a\xcfm\x97\x8fq\
-\xd9&\xbf\x1d@\xcf\x0e\xcaqL\xf7\xc9\xf8\x1c\x5c#\
-H4\xa7@\x80\x85\x0a\xe6\xbaC\x9eB{Z\xa8\x05\
-\x7f\xbb\x0a\xf8az\x07%Y\xa2\xb98.\xdf\x93\x04\
-\x91\xe6\x14\xf0\xd9\xa3L\x8f\xee\xbf\x01\x90\x05o\x00\xe8\
-\x01^\x10\xef\xa00]\xbaw\xc1\xf5\xb8lA\xa6\xfb\
-\x03\x1b5\xcc\xd3H\x91i\xda\xd3\xf0A6\xe0\x81\xbd\
-.\xdb\xe5%;(\xdeb\xbc\xeb\x09:\xdd!\x04Y\
-\xabb\xe7\xf5\x15\xd8\xa2=-\x1f\xb8n\x97\xdf\xf2\xa7\
-\xcb\x03\x80\xd3i\x82.\xe7)\xe0o\xa6\x82\x81q\xcb\
-1\xed[\x99\x17\xb4\xfeP\x1b\xee\xaa0\xd0\x1d\xd8v\
-\xd8US%B\xe9N\x0b@\x16\xf8\x02>\xe8\xff\x87\
-\xd0^O@\xecv\xa6l\xbbK\xbb\x14\xb8J{*\
-(\x07\xf6\xc2\xd6v>\xe6\xef\x08\x03\xdd!\x04Z\xaa\
-bn;\xe4yE\xfb\x9f\x00t\x82\xc0\xf6&\x0b\x00\
->\xb5\x99\xf4\xbd\x0b\x04\xdc\xdc\xab\xccs\xba\xd3\xc07\
-0'\xcck'\xb47\x174\x9f][\xb6\xdd\x15c\
-%~\xd3\x9e\xda\x97h#\xe4>[\x1fa\x19\xf3\xf7\
-\xac\xd50w}\x05A\xa1=\xf5|\xe0/l\xbed\
-\x80\xcf\x81\x00^\x08\x0b\xedo[\xa8@<\x0b\x1c\xed\
-\xa9\xec\xc4D\x002BB{Ua\xf0\xe5P\xe0\xfa\
-ne\x81\xa5;\x0d|\x06\xa0.\x04\xb4\xff.\x0ct\
-\x0f\x06s\xbd\xc7.Ea\xa1=\x05\x0a\x04\x95\x07p\
-_\xde\x0fa\xa0\xfd]+`\xdb\xedT\x106\xdaS\
-\xa0\x0a\xd8\xa5\x9a\x028\xee\x85\x82\xf6\xb7\xf6)\x13\xee\
-\xc7\xe5\x03\x94\x0b\x8a\x1c\x10\x16\x99\x0f\xfd\xb8\xde&J\
-\xc2Nw\x81\x9a\x0bp=?[\x18\xfc\xb8\x17\x0d\x14\
-\xda\x13\xed\x7f\xea\x84\xfc\xb2\x0bp\xfb^\xe0m<\x06\
-1:B\x0f\xb8m\xd8\x93\x0f\xf4\x17x\xdf\x0e+1\
-:\xc2\x0c\xd0G\xc4\x07\x9fn\xbb\x8c\xd1\x11b\x1e\xb0\
-\xe1\x11\xed\xb5\x05\xd9\x9fOT\x8c\x8e\x10B#\xb7\xd7\
-\x8c\xf05\xdc/\x7fR\x8c\x8e\x90\xc17n\xae\x1d\x0b\
-\xea\xfa=/bt\x84h\x1e\xb8\xc7\xc5\xb8\x9d?=\
-FG(\x80\xe88\x22\x5c\xee\x97v\xc4\xe8\x08\x8f\x7f\
-\x90\xc8y@\x10c5\x05 FG\xb0e\xc0vy\
-_\x02\xd7u:bt\x84\xd37\xa4\xc5!\xed\xc5\x05\
-)>_Pct\x04\x98\xfeo8\xd9c\x22H:\
-\x9f\xa0\xc7\xe8\x08\xf0<\xb0\x85\x83\xfdx\xd9\x1d1:\
-B/\x03\xb2\xd9\xd9o\x88\xef\xc5\xec\x88\xd1i\x1f>\
-\x81\xbdl\xcc\xfb\xd9\x1d1:\xedF\x06|aE\x0f\
-\xc0\xf7\xdfw\xc4\xe8\xb4/\x1e\xd0c\x81\xfeI\xfc\x8e\
-\xd1\xf1\xd8;\x11\xf3\xb2\x9cN\x06\xea\xba0\xc2y\xc3\
-\x11\x02a\x0b0I\xfb\xc9|\xb1\xebI\x1a\xd8\x13\x1f\
-+,'5\x06\xab\xaf\xad\xc4\xda[)\xcb\xcf\xc1\xd2\
-b}1\xff\x13+\xf9\xa9\x07Lg\x82\xfe\x9e\xbc\xa4\
-{\xe8\x81\x91X\xea\xfdCX]u9\xf6\xa7\x94\xc2\
-\xcfi|\xe1\x03\x98\x8f\x88\x89\x98.\x9e\xe5Z\x8a<\
-9\x03+\xf9\xf4\x0a\xfbSKb\xd8E\xcce\x07O\
-}\x99\xb5m\xc5\x8a\xe19\xd6xB\xfb(\x87\x7f\xb0\
-\xaa\xe2O\xd8\x9f^2_=\xe0)\x0f\xc0\xdctm\
-\xd0?\x9c\x17\xb4\x0f?2\x1e\xab,\xfc\x80u\x94\xe6\
-\x92\x11\x1f\xc8K\x1d \xa6\x8d5^\x9e\xc4u\xe5&\
-\xdd\xe9 :M\x89\xbea\xc7\xb38\xb1\xd6\xd6\x86y\
-e\xf3\xc7{\xac\xef v+\xa5\xb6\xaa\x9cl\xe7\xf2\
-\xcb\x17\xc0\xabx\xee\xfc\xb7\x8f:\x88MO\x1f\x0c\xbd\
-\xc8\xb7xq^\xc4\xf7D\x1c\x9f\x82\xa1M\x0d\x1d\x84\
-\xa6S\xaa\x7f\x94\xf0J\x17,\xa7\xa1\xfdh^\x8c\xfd\
-d\xbf=\x1dDfP\x02N\xad\xe1\x95/`\x02\xaf\
-\xd7\xfa>>\xb9\xdcA`\x06%\xce\xcf\x9e'\xf4w\
-\xdb!\xbf\x9b\xd7s\x7f\x87\xde\xcf\xb8\xa4\xc6\xfar_\
-\xff\xdb.\x8f\xf9\x99\xa9\xf8R\xd1?\xb3\x83\xfe\x82Q\
-\xd2\x9f\xf8s[\xeecw,U\xc9\xe7\x98P\xf9|\
-\xb1\x0e\xfa\xb7\x7f\xfa\x9f\xdf\xa9@\xde\x1f\xf73\xa6\xce\
-\x5c\x85rV\x12O\xe8\xff!\xf6b\x07\x81\x19\x947\
-\xd1\xd7\xb9B{xF\x09\xdc+\xd32\x9eVu<\
-/c=\x12}vu\x10\x98Ay|\xf3 \xe1\xb4\
-\x871t0n\xbe\x95\xf8:\xca\x19i\x18\xaf\xfc\xfe\
-\x8d\x0d\xb5\x1dDn\xa3\xf8\x1c\x5c@(\xed\xe1^\x09\
-\x18W\xd3z\xbc\x8d\xda!^\xaf\xf7\x7f{\xf3\xa0\x83\
-\xc8t\x0a\x8c\x11!\x92\xf60n\x9a\x01=(g#\
-\xf2\x8c\xfeq\xe7\x16w\xf8\x00\xe9\xca\xfeC\x84\xd1\xfe\
-\xe6>ef\xe8A9\x17\x93\xa7\xb1^\x1d~\xa0\xdf\
-Ky\xd1\x17\xccU_\x8d\x10\xdb\x1e\xe8\xf5\xcc\xd2\x82\
-\xd93Q\x09\x8f\xf9\xfa\x93\xe3~Z+w\x9d\xf4\x08\
-\xb1\xed\x03\xadTY\xa1\x05\xdfry\xc0\xd8\xaf\xf2\xef\
-o;\x08\x0f\xca\xb3@\x07\xcem{\xfd\x96\xb6\xbd0\
-\x00\xb4\x07\xfet}0!\xd8\x85c\xda_l\xc5\xb6\
-\x17&\x80~\x81?-\x16\x10\xc6{<\xbc`\xc41\
-\xeda\x9e\xb3\xd6l{a\x84\x17W6c\x9f_\xf8\
-b\xf55\xed?\x16\xfcCR\x18\xc7\xb4\x87{e\xe8\
-\xd9\xf6\xc2\x0c\x15\xf9\xef\xdb=\xfda\xac\x07'\xb4\xbf\
-\xb1G\xb9\xdd\xd1\x9d\x02\xd5\xa5\xb9\x7f\xc4\x1cpq\xf7\
-8\xb6h\xefg\xa6\xd2ni\xff'\xd1\x9f\xd5=@\
-\xd0\xb6\xbfc\xa1\xda\xaei\x0f\xa1\xb2\xf0c\x87\xcd\xdf\
-\x8am\x7f\xd7\x8a+\xb4\x17\xb8|\x9e\x05\xef\xa2\xff\x08\
-\xfa\x87{\xeec\xda\xb6\xe7\x92}\xf7\x85\x1f\xfe_F\
-\xf0.\xfc\xf4\x1fA\xff\x07\xe7\xf5\x99\xb2\xed\xb9h\xdf\
-\xbd\xe5\xf5\xfa\x0f3\xf0\xd8i\xde\x1fA\x7fF\xb1\xbe\
-^\xc0\xb6\xe7\xb2}\x17\xc5\xeb\xf5_f\xa1\xe8\xc3\xd3\
-vO\x7fo\xeb\x7f\xe8\xd2\x1e\xe63\xe6\x01\x9e=y\
-\x19\xff\xc1\x0a<u\xd7i\xd7\xeb\xc4\x0d\xf5\xb5ti\
-\xef\xb3\x97g\xb6\xfd!~\xe7\xfa\xf9S\xd7\x89\xbf\x7f\
-Hjm_\x1e\xafm\xfb\xf5\xbc\x8c\xffdg\x9d\xb8\
-03\xb6]\xd2\xffy\x90#\xbd\xb8l^\xc2x^\
-\xc6\x7f\xb3\xbbF\xd8\x1e\xedA\xea8?\xb7\x9d|[\
-\xbb\xed\xce\xcb\xfd\x1f\x9c\xc8\x81\xf7\x11N\xed&v4\
-?\xe7\xf5O\xda\xbb\xeb\xf3m\xed6S\x98\xce\xf2\xa2\
-\xd8\x85_^\xf93\xc5\x07\xa5_\x92\xc9\xeb\xca\x82h\
-G\x84y\x98\xb6\x19\x97\xcd#\xf0\x11\xa4\x5c\xaf\xac\xce\
-\x09\x90\xb6p?\xc9\xd7\x94 \xac8;\x81\x9cW\xe0\
-\xd3\xf3\xebX\xda=\x12\x99O(\xcf>\xbb\xb8Z\xa0\
-h_\xf4\xf5\x1dy\x8fw[q\xd9<\x02c^\xef\
-\xff\xe6\x17\x08\xd2\xbe\xb3;\xa7\xd7c\xd7w+\x09\x02\
-^F\xf3:\xff\x03\xbf\xe0\xd1\xd1IXM\xf9w\xbe\
-\xd3\xfeM\xccuf\xe3\xb2\xb9\x0d\xa5\xc2x\x9e''\
-\x00\xe7\x01~\xfa\x93\x8a\xbe\xa4cA\xb6c\x05\x05\x1f\
->\x82\x96\xf3\xb9=\xe7\x1f\xa9,\xfd\x8e\x85\x1e\x9d.\
-H\xb8X\xcf\xcf\xfco\xfc\x04\xa8\x1f\xf2R\x0eT\x96\
-\xe4b1N\x0b\x04\x09\x07\x90\xc6}\xf9\x99\xff\x91\xdf\
-\xf0\xea\xfaN\xac\xa1\xae\x8a\xeb\xb4/\xcb}\x83=:\
->]\xd0\xfa\x1f.\x08\xf9_\x05\xc1\x97\x00}\x04\xdc\
-(P\xbe\xc0\xb5\x0b\xe8\xb7\x12\xc0\xbeo\x11\x94\xfc\xcf\
-\x82\xe0WL\x0f>\x8c\xd5\xfe($\x8c\xf6\xc5\xd9\xcf\
-\xc9\xba\xa6\x80\xf6\xb9\x86\xe2\xf3\x15\x94\xfc\xef\x82\x00a\
-\x87FcoC\x8e\xb2\x1dw\x08\xc7;\x5c\xa3H\xb8\
-\xb2Y\xd0\xfb\xea)\xa8\xe7?\x08\x0a<q[\x86e\
-F\xb9\x90\xfd\xc6uU%\xf4\xf5:\xc0+p\xefZ\
-\xea]\x1br^K!\xe9\xdfdA>\xffEP}\
-\xcd1g\xb4[\x80\x90\xf6%IX\xce\x7f\xea\x00\xde\
-\xd8\xfc\x0c\xce\x7f\xfb\xd2\x81\xb3v\x03\xf0,?qa\
-;\xff\xb1\x03\x88_\xeb\x13\xc6\xf3_;\x80\xe3\xb1\xdf\
-E\xd8\xcf\x7f\xee\x00\xb6A\xaf\xbd\x9c\xff\xde\x01\xac\xeb\
-\xfc\xac\xce\xfb\xad\xf0\xc0\xb4\x0e<\x0a-LC\x08(\
-\xe0=W;p)tp\x15!\xa8\xe0k\xc3\xa5\x1d\
-8\x15\x1a(\xa5\xb7\xc6\xcb\x01\x0ft\xe8\x82\x7f\x80\xce\
-\xc7\x80\x07\xeet\xe0V\xe0\xe1\x0e\xc2\xa5\x82\xcf\x03\x1d\
-~A\xc1\x85/D\xcb\xfdVx@\xfbO\x88\x13\x13\
-B\x804\xd1FxP\xc0w\xcc;\xf0-p`\x8e\
-\xf0\xb0\xb4\xf7xq!\x03\x1f\x84\xc7\x05\x8f\x15{\xd1\
-\x81{\xbe\xc3\x0bF1]\x5c\xe4\x81\x81\x1dkD|\
-_\xdb\x19\x88\xf0\xb1\x80\xef\xab\x02\xf8\xdeA\x0b\x9e\x03\
-\xc4\xb9*\x22\x00\x05\xe7\x81\x1f\x1d4\xe1\x19\xfc\x10\x14\
-\xda\xd3\xac\x13u\xf0\x00oh?\x0d\x11\xc0\xd21\x17\
-\xfc92\x9f\x01\x0ft\xe8\x84\xdc\xd1\xf5\x04\x9a\xf64\
-vA\x87mH\xac\x8d7\x10\x11\xa2\x82\xfb\x07\xfc:\
-h\xc7\xb9o\x87_\xf6=\x81\xbe\xe2\x8e\xf5\x02\xf6\xfc\
-\xf9\xe6H;(\xf8\x9aQ\xc7\xba!k\xebx\xdaH\
-;*\xf8\xdaqG\xfc\x00\x13\xeb\xf7\xdc^\xc3\xe53\
-\x1f\xe8u\xc4\x92\xd1\x8d\xd9\xd2C\xfe\x80\x82\xcb\x82\x8e\
-\x98R\xaaX\xcd\xf6<\xe6\x19\xf8\x0c\xff\xe4\xfd\x05I\
-\x82\xea\xcb\xe3!\x0f\x88\xe3sB\xf6\x1f\xe6\xcb\xd1\xe3\
-toF;\xe3\x83.\xf8\x9e\xd3\xecvNwcv\
-\xf7\xe3\xfdA\xf2`};\x9b\x17\x92\xf0>u\x8cw\
-\xd6xa2\x9e\x8fH\x18sR\xd5\xe0m\x9f\xdcA\
-IB|\xc9[\xf0\xfc\x84\x0d\x02\xee\xb3\x0b\xc7\xdb\xda\
-\xbd\x83r\x5c\xb3\x1d\xd7\xe3~\xf1R\x01\xb1\xdb}\xf0\
-6\xf5\xed\xa0\x10\xcf\xf9a4\xaeSA\x1a\xf0\xe2\x1c\
-\x93L\xfc[\xf0\x9b\xa3;( \x90s\xc5x|<\
-\x1e\xc2\xe7\xe0\xa8\x87\xcdg]~a\xd2\xf7N9\x17\
-\xd3\xf3\xe1\xaf3\xd2\xc6\xb7G\x99\x8eg\xaaE\x10)\
-\xea\xecv\xbf\xfeB\xf9s\x8b\x07H\xf0^\xe4W\xfe\
-\xc3\xe6W\xd9\xb5x\x9c\xea\x07\xd1\xcd\xf7b\xd4o\xa7\
-\xfa\x02J\xb9\xc7_PK\xb9\x97m\xf1\xba\x9f/\x8c\
-\xa6\xdc\x8bQ\xb5\x86\xaaE4\x9dk\xfcu\xaf\xd9\xe2\
-\xf5\xf8\x07\xca~\xdd\x93?\x90\xf3\xeb^\xa2\xc5\xe7\xf0\
-\x0f\x92~\xdd\x8b\xb4\xfc\x1c\xf9\x83(\xf5\xbd]\x8b\xcf\
-\x93\x1b@{_K}/\xdb\xa29\xe4\x06\xe5P\xdf\
-K\xfc~\x1fM}/\xd6\xa2y\xe4\x06\xd2\xde\xd3\x90\
-\x1fmyoG{\xdf\xd8\xf2^\x93\xf6\xbe\xb6\xe5\xbd\
-,\xa3\xfb\xb2\x96\xf7R\xb4\xf79-\xef%\x18\xddG\
-\xb7\xbc\x17c\xf5\x9e\xd4\xf2^\x84\xd5\xfb\x0e\x89\xcb\xdf\
-\xc2)\xfd8\xe5\x1fV\xf9\x95\x11\xff\xb3:\x9e\x18\x8d\
-OF\xe3\x9bV\x1e0\x94\x1f\xb4\xf2\x86\x91|\xa2\x95\
-g\xb4\xf2\x8e\x91|\xa4\x95\xa7\xb4\xf2\xf67yL+\
-\xafi\xe59\xad\xbc\xa7\x9d\x0fh\xe7\x0b\xda\xf9\xe4\xb7\
-\xf9\x86v>\xa2\x9d\xafh\xe73\xda\xf9\x8ev>\xfc\
-m\xbe\xa4\x9dOi\xe7[\xda\xf9\xf8\xb7\xf9\x9av>\
-\xa7\x9a\xefa@\xa1\x1e\x80h\xb20\x1b\xd6<\xa6\x5c\
-\x84\xcag\xac\x16b\xab\xb6\x18\x8f3\xba\x08\xea\x11\xe0\
-\x9a\x0e \x1f\xd4Q\x8a^GS\xcf\xc7\x9f\x89\x00\xf5\
-\x8b\xf0\xb7\xf0\x1d\x00\xd4\x82m\xd4:|\xb3t\x0a\xc0\
-O\x17<\xbew'\xa8\xfb\x83k\x0e\x8cGo\x03\xcf\
-L\xd7\xf1+|W\xce\x03\xf0\xee@K\xd5\x9d>{\
-\x94\xd4.\x19(Hv\xe0]M\x15\x00\x09\xc0+\x00\
-\xb5\x10W\xdc\x86\xbbV\xaa\xa8\xbb\xbeB\x9d\xcb6\xf9\
-\xa4s\xdb\xe5\x0f\xb9l\x93S\xff\xc3\xec\xc8^\x00\x0f\
-\xba\xe0\xfa\x14@\x13'\xbc\xcd\x02\xff\xc3+v\xcbL\
-\x05\x058'\x9f\x11yv\xab\x1c\x8a\x9f\x15\xda\xe4\xb2\
-]>\x1e\xd0C\x0f\xd4{\xb7c^\x87\xb1\xe3\xfb\xe1\
-Z\x195\x9ex\x81\x7f w\xb0k\xa6J\x10\xd7\x14\
-\x9cS\xe3\x9fR\x87\x90\x03ha\x03h1\xa8\x1d\xe1\
-\xbd'\x00\x0b\x00y\xbc\x90/\xb4p\x7f\xbf\x1azi\
-\x97\x22\x19\xbf\x10\xcf\xcc\x00x6\x0f\x8c\x13k@\x07\
-)!\x963\x9dA\xff\xd7\x82kn[|\xcaM\xfe\
-\x0f\xb0P\xc1\xdcv\xb4\xc9\xf3m\xd6\x01|\x034\xd0\
-\x05\xd7\xceB\x86{\x0d\x00\x0f\x01\x0e\x1a\x18\xe1\x89K\
-2\x07\xf3\xdd\xabL\x96\xf5\xac\xe2\xbc\x95z#\xa0A\
-8\x801B k\xc4\x00\xe8\x03(\xe3\x87\xac!\xcb\
-z\x1b5\xf4\x8a1\x947rL\xcb\x1b&eR9\
-\x98\x1b\x0c\xc0U\x5c@y^\x06\xc0]Vy\x96H\
-\xfe\x87\xba\xe5\x05}\x85\x16|L\x00\xff\xb7\xa8\x03\x1a\
-\xdc\x07\xd7\xc1\x02\xc6\xf7p\x0d\xe1=\x00\x94\x1f\xf8\x87\
-\xf2\xc6\xdf\x5c\x05smE\xd6\x13\x8d\x7f\x5cO\xfa\x00\
-\xe4\xd1D\x01\xe1\xfb\xe5\xa0\xffE\xec\xe2\x8f\x08\xfc_\
-\xdf\xad\x8c\xb9\xd0\xc1\x17\x17\xf0O\xa9\x17\x83o\xae\xe4\
-3\xdf\x9b\x02\xa8\xe3\x97\xac\x87\xba\xa5\x07\xd0-\x89\x94\
-\xf3\xac\xcd\x09ru\x00\xf6\xf1\x81\xe7\xc5A\xff\xa1_\
-\xac\x9eS\xfee\xf7\xf7w,U\xb1\xf3;\x15\x18\xf2\
-+\x17\xf9\x1f\xd7Q\xe5\x1a\xc08\xb0\x02\xf5N<\xe4\
-{\xe8Wl\xe0\x17\xdf\xdf\xdcG\xd6-\xf9\xc6\xf7\xbf\
-\x8d\x83\xadrPG\xb5\xe0\x95\xcc\x81|O\x94\xce\xc2\
-\xcao\x80n\x89y\x9b(\xb1\xc4\xa3\xdc\xe6\x7f\xaaz\
-\x03\xb7e\x11>\xd7\xd6\x11\xa932\xfb\x5c\x90\xb5*\
-zi\x97\x02\xcbx\xe1!\xfe\xa1,\xaa\xe3\xd6\x9c\x0c\
-uL\xa8\xe7\xf0C\xde\x04X\xa8\xa0P\xb7\x14\x14y\
-\xc3`N.&Z7\xc5m\xab\xf7\xad\xf9u\xb9\xcd\
-\xff7\xf6(s\xc4\x97\xbc\xe4\x7f\xaa\xfa\x07\xa2l4\
-\xe8S\x80v-\xb4\xadx\x89\xff` \xeb=\x8d\x14\
-9\xc6\x05\x9f\xf0\x8f\xe2v\xb28\x01\xf8\xd7\xe7\xb5\xbc\
-\xc1\xd7\xa8\x84B\xde\xb4\x05\x80\x06\x86\x9c\xfa1\xa1/\
-\xad5^\xe5\x16\xff\xdfj\xd6-\x09\xe3E>\xf1?\
-\xf6\xd3g\xc7\xa6\xdf\x14\xfa\xefq\x1f2\xca\x0b\xfcC\
-\xdd\x92\x895*a\xc3?\xf4\x8b\x84\xb3\xb3~\x00\xd7\
-Nxec\xdd\xe3\xb3\x1f\x81\xcb\xfa\x10\xb4\x0btY\
-]3lm\xdd\x8ah\xfe\x0f\x01\x00\xfd\x08\xae;\xe4\
-\xb9\xc6\x7f\xfc\xe6\x7f\xaau4)\x16\xf0o\xc1HV\
-\x13\xe13\xf6\xdd\xab\x8c\x11\xb4F%\xd0\xf8\x87u\xb8\
-\x9e\xccl\x9c\x02\xb7\xd7\xca\x1f\x00\xf02fmM\x5c\
-\xf8\xe5\x90|\x1e3q\x150F\x84\x19]\x85]\xfe\
-\x07\xba%v\x01\xe8\x96Tc\xf3\x8f\xe0\x7fx\x05c\
-\xc0\x8eQl\x14m|\x0e\x91\xf8\xf77S\xc1\xdcv\
-*b\xae\xfa\xaa(\x00\xec\xdcN\x15X\xffy\xcf\xa5\
-:\xd3\xcf\xf2\x80\x169m\xc5x\xc1\xb84\xae\xc8\x1c\
-;u4\xd2u\x0d\x9a\x12y\x05\xfd\xfa>\x01-\xf8\
-\x9cF\x86\xfc\x9c\xd7?\xeb|\x87O\xa9h\xf6\x9b(\
-4\xfe\xee\x19\xf4\x8a\x95&\xb7\xfc\xd4(\x8c\xb3k\x83\
-\xff\x9f2k+1\xcb\xf3\xcf.\xae\xc1\x8a?%b\
-((?\xe3\xbc\xa9\xea\xb4\xf7D\xd7\xd9\xf9]SS\
-#\x96\x11\x1f\x88yY\xce |,\xc0XGz\xb1\
-\xb0\x8c\xe21Y\xc3\xbf:\x96r\xdb\x1cm\xa8\xabj\
-\xb3\xbf\x82\x88\x7fJ\xbd\xa2\xf8+z\xeb\xe82bu\
-\xd1\xadrM`\x0c\xa8\xb7\x82\x7f\x12+\xbe\x02F\xf8\
-O\xf25\xc6\x1a\xebk\x18\xf6Q\x90\xf1\x0f\xebUe\
-\x05\x98\xcf\xa1\x85\x84\xce\x05\x00\xff\x87h\xe3\xef\xf1\x18\
-pB\xe4}\x8c\xe3\x5c\xb4\xae\xb2\x18m/\xa5\xf8[\
-&\xean<\x9aH]4\x09\x80$\x95\xdc\x87q\xf8\
-\xb5D\xf1\xff\xe7\x177\x99\xe61A\xe7\x7f\xfc\x8a=\
-\xbds\x8a\xc8\xb9\xa0\x0e\xc0p*\xfc\xefd\xd5WI\
-\xef\x99\xf0\xc3\xe3\xd0F\x062_\xd8\xf0\x0f\xcb\x8f\x92\
-\xef\xa8\xcbv\x05\x22\xfdr\x06T\xf2\xc7\x9f(\xd9\xf3\
-\xf2\xeav\xb4\xbd\x160\x17\x13\xb96\x10H\xb5\xd7-\
-\x87(\xfe\x7f\xfb\xf08K|%,\xfc\x0f\xeb\x91W\
-\xad\x09\xe3\x7f\xb7\x9d\xf29^\xc6\x8a\xe4}\x86\xcc\xee\
-uc\x06\xff\xef\xc2\x1c\xda-\xfe\x9f\xdc>N\x08\xfe\
-a\xdc\xd8]+\xd5\x1f7\xf7)\xab\xe1\xfb3\x09\xb3\
-u3BO\xb6[\xf9\x03\xf0\xcf\xb1\xdc\xb9h\xa0@\
-\x8e\x9b\xc4\xd7Y\x17Q\xce|%\x8a\xff\x13}\x8d\xda\
--\xffGx[p\xc4\xff\x97\x0d\x15a\x5c\xc1O\x5c\
-\x05\xef'\xc7p^$\x12\xff\x11\xc7\xfeF\x9b\x1a\x1b\
-\xda%\xfeo\x90\xe6\xb1\x8d\x7f\x18\xb7\x07\xf7\x01\xd2\xe0\
-\x8d\xbc\xaf\x9ch\x7f[^ZX\xbb\x93=\xd0\x06c\
-\xd3\xd6\x82\xf1\xf1\xf4pE\xd9\xd3O\x18\xff\xc3\xfa\xd3\
-\xf3+\xb0\x86\x9a\x1f\xed\xc7\xfejj\xc2\x80\xeca\xdd\
-\xcf\xb0]\x1e\x03sl[\xb8\x22\xe7S \x1a\xff\xf0\
-\x9a\x11z\x02\xb4\xbf\xa9]\xe0\xff\xeb\xfb\x04\xcc\xcd`\
-8\xab~N\xf4\xb6\xb9\x0ay\x8d\xbb\xad|\x15\xdcZ\
-c\x0c=0\x12\xcd\x8av\x05$h\x14j\xb9S\x96\
-\x9f\x83zYNgI\xe6\x00\xdd\x1e\x0d\xb4Te\x0a\
-O\xec\xc6J1\xf5<I\x1dM\xf6\xdb\x8bU\x15\x7f\
-\x16:\xfe\x87\x17\xb8>t\xc5Z\x8b%\x99\x03\xf7\xff\
-\x05Y\xabreO3\xbb\xeb\x8f\x11\xc7\xa7b\xa9w\
-m\xd1\xe2\x8f\xcf\x81,m\x14\x0a\xfc\xd7T\x96\xb1\xbc\
-\xfe\x82\xeb\xf6\xac\xc6\x81\xf0\x0c\xe2\x5c\x16\xa3\x8du\xd5\
-B!w\x80\x0e\x8d\xfa\x1d[\xc1l\x8c\x15\xeae\xa4\
-H\xde{\xcc*Nx\xc1\xff\x94\xfa\x13\xb7eXc\
-C\xad\xd0\xcc\xbf\xe1\x9e{\x99\x89\xadB\xaf\x9a\xb6\xaa\
-\xdb\x0b\x8c\xfc\xa1\xd4\xe3\xce-\x81kbB\x83\xff8\
-?{\x86\xf8\xbfA\xd6\xed9\x8aC\xcb\xe7\x95\xfc\x01\
-\xf3\x00Z[Y$4\xba\xcf\xcb\x107\xba2\x07\xee\
-\xff\xf33S\xe1\x14'\xf9\xdc\xb0\xbf\xda\xaa\x17f=\
-\x11\x1e\xfe\xf7?\xda*\xcf\xbb\x02\xdc\xc3\xdc*!\x9c\
-\xcb\x1cr\xae:^\xe2?\xe5\xb6\xb9\x10\xc9\xff}\xad\
-\xf9\xed\xb1@+U\xa2d{\x04\xee\x03\xe2\x99\x0e\x14\
-vh,Z\x92\xf3R(\xf4\x1f\xda\xf5\xae\x0b@\xbf\
-\xbc\xb7\x9fP|\x5c$\xda\xff\xccL=\xceu)Z\
-_]&\xd0\xfc_YV\x80]4\x1d\xfb\x93\xff\xe1\
-\xfe\x84`\x16u{&\xea\xe6D\xaf\xbf0\xbfN\xbc\
-\x0d\xad\xab*\x15X\xfe\xff\x90\x14\xf6\x93\xefa\xac6\
-;\xba=\x13\xb0\x88\xe8\xf5GV\xea\xb1\xce\x0b\xb0\xc2\
-\xccX\x86~:8V\x80\xdd\xc03\xfe\x87\xb7Ag\
-7\xc3\xfd\xd4\xe8\xf5\xddJD\xcc\xb3\xad\xd5!\xce\xd5\
-\x88^\x7fg\xb5\x1ezP\x03{\xe1\xbd\x05\xcdM\xba\
-\x83U\x16\xe5`0n\x0b\xe2\xbb\xa6<\x1f+\xf9\x94\
-\x88\xbe\x0b?\x8dE\x9f\xd1\xc6\xbe\xbc\xba\xcd3\xfc\xe7\
-e\xa7`\xee\x86\xea\xe4\x1cf\x10\xf7\x5c\xb2\xa7 \xce\
-%\x88\x8e?\xe1\x04\x1e\x92F\x90m\x84h\x87Y(\
-\x8c#j\x11Swf\x0e\xcfb\xea\xee9m$B\
-\xb7g\x04\xfe\xdc\x88\xbf\xe2f\xfe\x8d\xd7\x01\x96\xbf\xf9\
-\xef\x88\xe4\x7fxI\x8f\xbdA\xcem\xc3\xed\xbc\xa4\x10\
-\xe7\xdc\x8a?\xe4\x16\xfeC\x0f\x8c\xc4r\x9e]\xe5\x1a\
-\xfe\xf3\xb3\xe2\xb1\x87\x87'\xa1<\xc8\x0b\x0bq\xad\xca\
-\xad\xf8[nB\xe8\xc1Q\xe8\xb77\x0f\x08\x979\xa5\
-\xb9\xa9h\xe4\xa9\x7fx\xd5\x0f\x88\xeb.41\xd0v\
-\x82\xce\xff?\xe7l\xb8\xb6\x16s\x1ekj\xa8\xe3\x98\
-\xff\x81\xee\x85\xe5\xa5?B\xc3\x8e\x8c\xe7\x85\xcc\xa1\xd4\
-\xed\xb8\xbf\xff\x82\xcb\xf9\xf7H\xea@o\xda\x8a\xfd(\
-\xc8\x82\xd6*[\xf8\xaf\xa9\xc8\xc7\xd2\xee\x1f\x84:\x18\
-/pN\xa97Q\xcb\x1e\x1a\x1a<\x15\x06\x19D\x0d\
-\xe1G\xc6\xa3pm\xad\x22\xff=\xd3\xb2\xa6\xb6\x22\x9f\
-\xbc6\x1dyb:?\xda\xfc\xb4\x8d\xfd_\xbam\xe5\
-\xf0\x14(\xfeo\xa5\xfe\xc4u\x19\xfa.\xcc\x01\xfb\x9e\
-\x1a\x82\x95~IF\xcb\xbf\xbf\xc5\xca\xbf\xa5\xa3e_\
-\xdf`\xf9\x19\x91\xd8\x87\x18w\xf4\xf9\xe5\x8dX(i\
-$\xaf\xe4\x0cm\x1d\xe2V\x97_\xfbOy\x99\x7f\x1b\
-\xce\x11a\x87Fca\x07G\xc39\x9b\xd7x\xa6W\
-\x87\xb8\x95b\xb0\xff\xddV\xd8d\x90\x10\x815\x13\xfb\
-\xdf\xc9\xf9\x07\x84\x9d\xff\x89n'\x01u\x88\xd3\x81\x82\
-\x92\x7f\xe3\x0f\xc4\xbf\x05+\xf9g\x00\xe4v\xc8\x0b\xc2\
-\x00\xe2\xb2'\x8b\xf9\xaf\xe0\xd9\x15\x0d\x1d\xfc\xcfq\x1d\
-\xe2p-\x1b\xf9\xc7:\xf12\xffX;\xc6?\xc4a\
-'6s\x1f\x8e\xe2\xe7Y\x16\xed\x00 \xeeFq\x9a\
-\x7f\xb2\x83\xff\xd9\xae\xeb\x0bk\xfeU!\xc7?\xe4\xfd\
-@p\x15#(\x07\xee \x00\xef;\xe4\x09\xd3\x00q\
-E\xe8\x19n\xf89\xf1E\x1d\xfc\xcf\xb0\x0e\xcfb\x19\
-\xdf\xde\xf2\xcf\x0b\x09\xfe!n\x96\xf3\xe0\xcc\x97\xfa\x0e\
-\x19\xf3\x1b@\x9c\x98\xf2\xe8\xfc\x17\x18\xb7\xd5\xd8\xc1\xff\
-?\xeb\x10\x17\xe6\x7f\xd2\xf9;\x02\x84\xffz<\x86\x93\
-\xe7\xe7\xe2\xf1\xfb\xfc)\x01\x80:^\xc9\x1c\x06sr\
-\xf1\x1f\xc8\xffE\xdc\x9ekY\x18\x07\x13\xf8y\xfe \
-\x8f\xf1O\xd6\xef\xb9\xa5crh\xa3\xdd\xfd\x03dN\
- \xd1\xb6\x15\x81\xb2H\x0c\xf7\x17\x95\xb5C\xfe\x87}\
-\xd2'\xca\xa7\xc0e:\x8c\xe2\xe7\xf9\xcb\x04\xe3\xbf\x01\
-\xef\xcb(D\x88\x0ahog\xfc\x0c\x8d\x5c!_\xb7\
-Z\xcb\xae\xff^@\xc6\x02<K\xc3\x82\x995}\x01\
-\xe2\xff<\xbc\xcd=\x91vR\xe0\xb9\x0e\xf0l\x01\xda\
-\xf8\x22\x01\xc2?\x8a\xb7\xcd\x9a\xd98\x05!\xa5\x83\x14\
-\x9e\xe7\x1e\xc6:6\x09\x80\x8ci\xc2\xdb\xa2\xcb(6\
-\xaa\xbd\x15\x18\x87\x0a\x80\x04\xe3\xb1\xf1\x98x^\xf1\x7f\
--\xfeM;z\xb1\xb0\x7fR\x81\xb1\xf08-\xe0>\
-\x1c\x7f\xb87\x8a\xd9=\x81L\xe2\xff\x07\xbe\xdf\x0a\xbe\
-{'\xbe\xdf\xa4\x0b\xd2Q\xe8\xd1C\x02\xee\x0d\x84\xfb\
-3\xf1=\xb2\x94<\x81\xe9\x0c\xf2U\xe4\xe3\xcfP\xf6\
-\x95\x9b\xe3\xefP\xa3\xecu\x13\xb4\x02c\xe1k\x11D\
-\x96\x12\x17OB\x10\x11J\x88<\xfc\xbb]s\xbd\x0c\
-\xd6\xa5\x9a\xeb\xd1\xb0.\xd6\x5c\xff\xf5\x12\xac\xb1\xb9\xae\
-\x89\xbf\x11\x16\xf2[s\x9a\xeb\x12?\x7f\x8a\xff\x98\xd4\
-\x5c\x17\xf9\xf5\x1a\xf2\x8bPJ\xdd\xee\xe7k\xc8/\xa2\
-\xae\x97Q\xeaR?_O\xfe@4\xa5.\xf6\xf3\xf5\
-\xe4\x0fPw\x97\xaa\x8e\xfe\xaa\xdb5\xfe\xaakR\xd7\
-k\x7f\xd5e\xa9\xebe\xbf\xeaR\xd4\xf5\x9c_u\x09\
-z\xf5\xe8_u1\xea:\xe9W]\x84\x99z\xc7H\
-m.\xac\xe2\x8d\x1e\xfe\x99\xa1\x1d=\xba\xd3\xe3\x13z\
-|E\xcd{\xf4\xf8\xb3\x05\x0fS\xf365\xcfS\x8f\
-\x05z\xe3\x85zLQ\x8f\xb5\x16c\x90zlR\x8f\
-Y\xea\xb1L=\xc6\xa9\xc7~\x0b\x99@-+\xa8e\
-\x08\xb5l\xf9)s\xe0\xe4?\x0f\x80#\x99\xa1\x87\x91\
-_\xa9\xb7\x82\xefz\xd1\x00\x00\xb3\x00\xec\x05\xe0\x01 \
-\x06\xc0G\x00\x15\xd4v\x03\x0e\x15\xf8\xdf\xe03\x1e!\
-\xb6\xc3\xf7\x02Y?\xeb\x9e\xb5\xea\x80v\xa4'\x8a\x02\
-P\x07`\x03\xe0\x09\x80\xf2V\xf0\xc0*\x94\x03\x1c=\
-\xb9h\xa0`\xe7\xbaC~\xa4\xf36yQ!\xc4K\
-?@\xeb]\xe0\x9a\xd8\x96\xee\xdb\x96.L\xef\x0a\xf3\
-W\xc2<\xe9\xf8\x99=0\x0fH\xb2\xcb6y#p\
-\xed/\x04x\x19\x02\xc0\x01_#\xc1\x88\x04\x98\x8f\xe0\
-\xd6\xbe\xe6s+\xa9\xcf\xf0\xa3\x82b\x97\xed\xf2g\x00\
-\xaed\x05\xd1\x17\x04\xdao\x0f\xfd\xd3\x9c\xf0\x06\xbd\xbf\
-\xc1\x1cx\xde&J(\xa3\xb3\x08\xf1k\x19\xc0\xd1q\
-g\x16\xce%\xe5\xb2|\xd1\x81\xfe\x0f\xa2\xf9\x85\x02@\
-\xd6\xc0\xfc\x98\xf4x\xa6-\xf8\x04\xf0\xb4\x8a_\xf2\x09\
-\xb4]\x1a\xd0\xf6\x1a\xed\xde\x5c\x22\xf9\x07\xe62\xa3\x9c\
-\xc1\xdb\xd6\xb9\x95\xf4\xae\x00\xe0\x99b\xd7\xc1\xb5/\x8f\
-q3\x09@\x16\xb7x\x06\xca\x9a\x1b{\x94\xd9\xe1\x19\
-z\xf0\x11\xc0\xdf<\xc2\xcdj\x82\xe6\xe9V!\xd8F\
-\x0d\xf34R$\x127\x14\xa8\x00\xbc\xb4\x8e\xcb\xf6\xfd\
-\x1e\xea\xbd-D\xcf\xdd\xf0\x8cY0w\xa3L\x8e\x1d\
-v\x9eit\xde&g\xc6%\xbe\xb1\xc3\xe3\xa9\xb82\
-\x9e\xfc\xccT\xda\x9a\xbb\x89\x84F\xc0G$.\xf0M\
-#\xb7\xe6\xee\xab\xa6JL\xf3\x04\x87\xfcC8\x1f\xe1\
-\xf2\xa6\x81\x1b|\x03sZ{\xecR\xe4\x05\xcf\xd0\xe3\
-\xa3u\x04\xccS\xe5\xdc\x98\xbba\xae\x22\x98\xef\x9eU\
-\x9e \x88\x7f(\xd7\x0av\xe75\xa8\xdfpc\x0e\xa7\
-\x9co\xef\xb2]\x9e_|\xd3\xda\xdc\xdf\x97U\xbd\x18\
-\xd7\xfd0\x22u?\x98\xcb\xf0\x8a\xb1\x129\xbf\x1e\xbb\
-<A0\xff`\xf8\x99\x847X\xd1\xb3q\x9b\xa1\x89\
-H\xbe\x81g\x17\xc03\x0c\x04\x84gh\x01\xea\xd9\xab\
-X\x88; \xd4\x9e\x82\xe7\x99\x00;APq\x83Q\
-\x9d\xb1.\xc5\xc4\x5cnO\xd4\xdc\x0de\x0d<\xe3\x88\
-\xc8\xf1\xc0\x8d\xf1Eu\xf6\xe7q&\xfc7eD\xd9\
-\x09\xf0\xdc3\x01\xe7\x19Z\x80\xbe\x91\xa1m\xe0\xc7\x81\
-\x88\xb9;\xd0\xf2w;A\x18\xf8\x07?[\xca\x91\x9e\
-O\x94S\xbf\x1f\x1cO\xfe\x96#0\xcf}\x93\xb0+\
-V\x9a\x98\x97\xc5t\xf2\x95\x17p\xd1t,\xe6\xb2C\
-\x89\x08\x1e*n\xcdW\x8b\xfb\x8b\xd9\x9e\xbb#\x8eM\
-A\xdfE\xbaae\x05\x9f\xc8\xe9\xcc\xda\xcasF\xef\
-\xca\xcc3\xf4\x9eml\xac\xc7\x0a>\xa7\xa1\xd1>v\
-\x98k+gb\xb1\xc2c\xd0\x9f\xdd\x8a\x1f0\x91]\
-\xbey\xea\xbe\x12\xab.\xfb\x86\x09B!\x9f\x9f\xf4)\
-\x15\xf3\xb2\x9c\xce\x09\x0f%S\xebCp\x0d\x86]\xdd\
-/\xd6y!V\xfb\xa3\x88\x10\xde\xe0\x84\x7fh\xaf\xc5\
-\xdf\xb20\x8f\xbd\x13\xd9\xe2\x1f|]d$\x15~l\
-\xd8\xe5\x9d\xe2\xec\x04LP\xcb\xbb\xe7w9\xe1!\x12\
-\x15~\x9e\xb0;\xae(9\x16\x05\xb14\x01\x99\xe4\xbd\
-\x7f&\xbb\xf8yF\xb5\xe6[\xce\xce\xf8z\x1fq\x96\
-\xd0\xb1C\xe4\xf8\xa2<\xf3\xd8\xf7 \xbb:@\xc5\xf9\
-\x9d\xf2\x03\xf1\xf5p\xb6\xc6\xd6\xe7\x1771A/\xaf\
-\xa3\xae\xb2\xc5?\xd0V\xf4\xd9\xa3L\x89\x15`\xcb6\
-\xff\xfc\xc2W\xe0\xf9\xe7M\xcc\x0d\x96\xf9\x87|f\x05\
-\xd0\xff\xefZ\xa9R\xe2(\xd8\xe2\x9f\x8c\xb0S\x02\xcf\
-?/\x82]X\xe2\x1b/cE\xf2\x99e\xb8?\x86\
-\x12c\xc2\x16\xff\xc0s\xf5`^tA\xe5\x1fx\xb9\
-sZ\x97i\xfe\xb9f\xaa\x84R\x9f\xf9\x00\xae\x94\xf8\
-\x1b\xb6m\x8a\xbc\xb40\x81\xe5\x9d\xe2\xaf\xef\x99\xb69\
-\xa0O\x93r&\x03\x15\xfc\x8cMbW?\x8c:\xa5\
-\x85U\x97\xe4\x0a\x1c\xff46\xd4a\x81g60\xd4\
-\x0f\xa1\x9f\xd7\x9f|fB\xab\xfd\xab \xc2\x97\x11\xe3\
-8\x07+\xcb}\x83\xd1\x1c\x9f\xc5\xb7\xd2X_\x87E\
-x[2\xe4\x19\xe8\xb3\xa3\x9ci\xc0m\x08;4\x16\
-K\xbdk\x83\x95|z\xc5w\x9d\xf1\x91\x97\x19C\xdc\
-\xb8\xedT\xc0\x82\xacTY\xf1M\x10\xb2v\x13sf\
-6J}\x16'?\xc6W\x8c\x0f\xa9M\xdd\x0f\xc6\xcb\
-\xdc\xdf\xcfZ\xff\x88\x82\x18\xc7\xb9d\xbd\x9e\x9f%\xf9\
-\x91']\xbe\x81>M\xa8\xdb\xb0\xd0\xa7\x0a\x22\xf9'\
-\xe2\xd8\xdf(\xf5\x19\xf7\xfc\xe0\x9f\x8cgwZ9\x1f\
-Q\x0e\xf56!\x9f\xc7\xcaJ\xff*8\x9d\xdf[\xb7\
-\xe9_\x08\x9cMA9\xcf\x8a\xc5\xbe|\xe4D?\xa4\
-\xf7L\x92\xaf1_\xf9\xe7\xc9\xed\xe3\xd4k\x7f\xe8\xcd\
-}\xca\xec\xf6/\x86\x13\xfb\x82\x1e\x84\x92F`\xdf\xde\
-\x84\xf0\xcd\x7f\x18xF\x97\x8c\x1b\x18/\x03\xd7\xde\xd8\
-\xe0\x1b\x0axpb\x9f\xb6\xf5L\xb8\xfdD\x14\x9e-\
-\xc0k\xfe\xa9*/\xc0\xdc\x8dF\xa1\x14\xdd\x86\xc3\xb5\
-\xf1\xbd\x9c\xf87\x18\xf2\xd1\x81\x91\xd8\x9b;\xd6XE\
-\xde{0\xa75\xfc\xf2[\x01\xdd\x16\xea\x93_^\xf9\
-\x13\xaeS&\x86]\xc4\xdc\xf5\x15\xc8q\xaf\x04\xf4a\
-&'\xfe1f\x9f\x81xz\xec4\x0fK\xf0\xda\x84\
-&xn$\xebH\x0f\xc1\x18\x0c;4\x06\x9e/B\
-\x18\xff\xd4T\x96\xa17\xac\xfefY\xb7\xa1\xf37\x88\
-\x93\x01\x9c\xf8W\x89\x80g\x17Wc\x8du\xd5\x9c\xfb\
-R\x9b\x1a\xb1\xa77\xf6\xfd\xf4M\x10\x00O\x88\xf0\xcf\
-\x13\x01\xaf\xefXa\x14?\x09\xbb2\xf9}\xf4\x05,\
-\xc4N\x9d\xc8v\xd9\x10\xb1\xbeC\xd43\xc9\xb7\xf6`\
-\xf55\x15,\x8f/(\xcb2\xc2N\x83\xf7\xa8\x13\xdd\
-.u\xa2\xd6\x07\x89\x02\xb8\x96V\x98\x19\xc7\x14/A\
-\x1b\x18\x9e\xbf\xf3\xfc\xf2\x06n\xb4\x05\xe2B\x94\xc8\xf5\
-e\xa2\x9e\x81\xf9,\xe2/\xad\x85\xbe\x7f\xb4\xb2(\x1b\
-\xce{\xe8\xaf\xf3]\x9b\xe0:-\xfa5\xe5\x1e\xf6\xea\
-\xdaN\xf2Y9\x5cj\xd7\xaeV\xe2\x13\xfarc_\
-\x12g\xfa\xc1(\xec\xd1\xd1\xc9p\xbe\x030\x07\x8b8\
->\x15\x9e\x1b\xc4\xed\xefB\x1c\xf4\xa5\x13\xc3q\x86\xdf\
-\xfc\xc3\xe8\x19\x1e|\xd3\x81\x17\xf1QB\x0a\xb0\xefC\
-x\x15_'\x84\xfcc\xcf\x8f\xf8L!\x01\xd8\xe7\x9e\
-\xfc\x8a\xef\x15p\x80}\xd5\xe1w|\xb8\x00\x8f\xafk\
-\xb4\xfa\x0e\xbf\xf6\x17\x08 \xc0>J\x0b\xda\xfe\x14\x01\
-\xe1\x1f\xb8\x0fr\x92\xa0\xeeo\xe23\xc0>\xad\x16\xf4\
-\xfdq|\xe2\x1f\xd8\x97=\xc2\xb2\xbf\x92\xc7\xd0\xd8\xda\
-9\xd2\xc2\xb0?\x97\x07\xfc\xd3@4\xdf\xd0\x91G\x15\
-B\xc87\xe5D\xc9\x1b~\xe7\x07\xe0\xd2\x1c>\x09\xe1\
-a\xe1E~\x09\x02\xde\xd7\x84\xb7Q\x1a\xe1C\xe1E\
-~\x12\x0e\xed)\x1dV\xf5ba\xcco\xc3\xe2\xb3e\
-x[\x04.\x8717\xf3#1\xe9\xf7s`\xe4\xbf\
-\x11\x10<\xf5\xe5V~\xadV\x9eM\xc4\xbf\xd5\x17\x11\
-\xb2\xc2\xad\xfcl\xf8\xbbl\xf0w\x0b]~\xb66\xf4\
-K\xb8\x96=\x13_\xf7\xf7\xa0\xc4\x17S\xc7\x89\xd2\xc6\
-&QbL\xf0\xdf\xcc\xa4\xac\xf9\xf2\xaa\x90\x932J\
-4g]lN\xabh\x87\xd7k\x9b\x933\x92\xeb9\
-\xcdI\x1b\x7f&\x8fl\xce}\x8a\xe7\x7f$\xe7\x99\xc4\
-S8j\x92\xeb\xb5xfGX/\xc3\x93H\xc2z\
-\x0e\x9e\xfd\x11\xd6\xa3\xf1\xac\x90\xb0N\xc2\xb3E\xc2:\
-\xa5]\x00(\xe9%\xa11@\xc9q\xa9\x09\x80\x92\x82\
-R\x96\xa6NIY)ES\xa7\xa4\xb5\x94\xa0\xa9S\
-R_\x8a\xd1\xd4)\x1b\x9bD\x98\xac\xb7\xd7\xc2*\x1e\
-\xe8\xe1\x93\x1e\xfe\xe9\xd1\x8b\x1e}\xa9y\x80\x9a7\xa8\
-y\xa6\x05/Q\xf3\x185\xefQ\xf3$5\xafR\xf3\
-05oS\xf3|\x8b\xb1@=F\xa8\xc7\xce\xaf1\
-\x05\xf3\x90j\xe1x\xa2\xe4!Ef\xf2E\x96\xab\x00\
-\xd0\x83kp\x00B\x00\xbc\x05P\xd2\x8a|.\xc1\xff\
-\x16\x82\xaf\xd7\xe9\xdd\xdb\xaf\xaa\x22\x84s\x17<_x\
-.\x80\x0b\x00\xber:o\xdd\xb1T\xfd\xea\xbaC\xfe\
-\xd2\xb9\xed\xf2\xff:o\x93\x17\x13\xe0~\xc3=u\x07\
-\x88\xe83\x05\xe0\xde\x10\x9ax\xd3o\x00\x0e\x03\xf8K\
-\x80\xfa\xfd\x17\x80s\x00j\x88\xea7\x8cU\x82\xfb\xa9\
-\xda\x88\xf3\xafq\xd9&\xef\x0a`\x10\x1f\xfb\xdd\x09?\
-'\xf1\x07\xd1\xf9j\xdc\x99\xcfWS\x09p`\x09\xae\
-\x9dx\xdc\xf7\xd1\x00\xde\x10m\xcb\xf8\x9b\xb3\x9dK.\
-\x0d\xe0a\x0c\x8f\xfanH9[\x83\xc8\xdcV0\x8e\
-\x9c\xc3\xfc\x14\xb5\x00\x07&\x5c\xecwg\x00\x9e\xdc\xc8\
-;Id.8\x80\x03op\xedLp\xdf\xbb\x02\x08\
-'\xba\xef\x81V\xaa\xe4\xfdJ\x5c\xc8w\x13\x01\xa0+\
-\x81}\x8f'\xba\xef0\xe7\xb3\x0b\x17s\xfe\x80w?\
-\xe7\x14\x078\xcf\x87\x13=\xd6\xaf\x98(\xf1*\xefQ\
-\x04'c\x81\xe8\xf1~o\xbf\x1av\xc1\x80\xb7\xb9\xd8\
-\xa0<\xe0@\xce\x13\xd6w<'3_\xf2_\xb1:\
-/\xe0\xf3{-1\xfc>\x9c\xe8\x9c\xcb\xec\xce\x8dc\
-Y\xd0\xeb\x08\xd1m\x1e\x08V\xae\xb44f\xf4D\x5c\
-\xa7\xe5\xb8\xefx\xced\x81\xca\x03\x07ue&l\x19\
-\x8e\xf5y\x98\x13Y\x80\xf2\x94\xd2\xda\x0b\x83\xda\xe8\xff\
-9N\xe7\xb6\xab\xa6J\x02\x9d\x0b\x10\xda\x8dm\xd8\xef\
-l\xdb\xb00\xa7\xf1\xa5]\x0a\xc2\x90\x0b\xb1\xb65\xff\
-\x01\xee\xbb`/G\xc0qM,\xd6\xd7\x0eK\x0c\xbb\
-D\x86\xa4G\x97\xb9\x06\xafB/`a\x97\xf7`\xee\
-\xc6\x1a\x9c\xe0\xe0p+>+\x96\xfd6\xa1\x075\xb0\
-\x8fO<[\xec\x01\xe4U\xa9\xaf\xa9\xc4bo\x1df\
-\xb7\xff\xdf\xa8}i\xb8\xbf\x8e5\xba\x93F`\xf9\xef\
-\xa2\x04 \xcf\x937\xbb8\xf8\x97\xaa\xff\x17X\xcfa\
-\xe4 0\xf9f\xc2<v\xb3\xd3\xffKT\xfdg\x89\
-\xf7\xe1\xfe\x96\xba\xcab\x81\xe9\x7fY\xc1'v\xfa\xff\
-\x9d\xca?\xcf\xe2\xde\xcc5\x02\x97s\xe8\xc6\x81y,\
-\xe3\xe0\xfcNy5|m\x82\xa5\xfe'\xfa\xec\x12\xb8\
-\xfe\xdf?\xb7\x8d\xa5\xbe\xc3\x5c(\xb7\xf6)S\xd6e\
-X\xea\xff\xcbk\xdb\x05\xae\xff\xf7\x5c\xb62\xddwh\
-\x93@\x1f;\xd0Y(kR,\xf5?\xf2\xc4t\x81\
-\xcb\x1fy\xd5F\x9b\xa9\xbe\xc3\x5c&\x94\xbc\x0b\xe0J\
-Y\x8fcY\xe7)\x10\x80\xb9\x8fR\x8ar3\x98\xea\
-;\xb4\xc3i\xfaAo-\x92q>\x1f\xa7y\xe4}\
-\xc5\x02\xc1\xfb\xce\xff1\xec\xfb\xad}*\x18\x9d5W\
-\xb6\xed\x9dx\x8f\xf5Xme\x11_\xfb\xfe<\xc8\xb1\
-\xcd~\xc3\xf5\x14\xe8{\xe2V\xfcY\xc4\xf1)\xd8\x87\
-\xd8\x8b|\xc9\xd3\x1c\x7f\xf74\xc3<iw\xadx\x93\
-'-=\xf8\xb0@\xd1\x9e\x9c+d\xbf\x1a\xcf\xe2\x10\
-\xd3\x1f\x1c\xe1y\xff\xd3\x9f\xden\xb5\xef\xd0\x0eg!\
-\x97W\x09\x11\xfd\x7fym\x07\xcf\xfb\x9f\xf5*\xe4\xb7\
-\xbe\xc33\xdcX\xc8+T\xc2\xee\xfc\xf7{\x9e\xc01\
-X}u\x19O\xfb\xff&\xe6F\x8b\xbeC\xdf\x13\xf4\
-7\xb3\xd0\xee\xb7\xec\xe8?\xf4\xc7\x80=O\xfb\xff\xf8\
-\xe6\xc1\x9f}\xf7\xd9\xab\xccN\x9bC\xd8\xd1\x7f\xdb\x82\
-/\x89\xb7y\xd6\xff\xeb\xa4y\xe45D\xe8oe\xb3\
-\xbdg\xd8\xb1\x7f\x18Aj\x90\x1dVS\x9e\xf7[{\
-K>'\x126F\xf2>&\x93\xe7v\x0e\xf3\x80\xea\
-\xb1c\xff2\xeb\x1fzva\x15\x96\xec\xb7\x17\xd8\x8b\
-\x86\xe4\xfc\x8fD\xe6~\x0ev\xd6#\xc7\xcap\xd8N\
-\x15v\xfc\x1f\x9c\xe6\x0e\x83|\xc0\x91\xdc\x8f\xf7#\xfb\
-\x9b9l\xcbWN\xfc_\x9c@\xe4\x89iXe\xe1\
-G\xb6\xfa^\x90\xf9\x04{x`\x14\x11\xed\xb8\xc0\x91\
-\xff\x93S\xbd\xf9\xd8\xdfXaf,K\xb9\xaa>%\
-\xf8\x90}o\x04\xb5a.\xa7\xfeo\x22 \xf9\xd6n\
-\xac\x22/\xa3\xcd~\x17}\x8c\xc7\x9e_\xd6%\xf2\xbb\
-\xb0\xafbD\xad\x7f\x10\x01q\xe7\x16ci\xf7\x0fb\
-\x1f\xe3<\xb0\x9cgW\xc86\x15\xcco\x16}z\x16\
-7\xbew\x80\xce\xfaW-?q\xc0#\x80k|\x03\
-\xb9\xb1\xfe)$p\x8e\xdb\xeb\xdf\x02\x0c\xb0o\x7f\xf1\
-\x22\xfeA@\xc1\x9c\x97\xf1/\x02\x06\xb0O\x9dx\x1d\
-\xff$ \x00\xfb2\x9a\x9f\xf1o|\x06CA\x88\x7f\
-\xe4\x13x\x0aR\xfc+\x8f\x01\xb6\xbd\xb3 \xc6?\xf3\
-\x00`\x9b\xbb\x0ar\xfc;\x97\xe9\xde\x95\xe0=\x00p\
-,x\x09\xc3x\xe7\x94\xe7y\xbd\xff\x85\xc09\xce\x10\
-\xe1A\xe1\xd6\xfe'\x0eu\x9b\xd1\x08\x0f\x0b\xb7\xf6\xbf\
-\xb1\xa1\xcf\x9b3\xab\xd7\x09\xcb\xfeG&m\xd8s\x8c\
-l\x19a\xdf\xffJ\xc7os\x80\x9e\xfd\xde\x1e\xf7?\
-\xe3\xef\xb8\x80\xbfS`\xf7?\x13\xbd\xff\x9d\xb26\xc1\
-\x83<\x1c\xe4\x7f0\x98\x9c@\x0a^\xa3a\xe6\x82\xe6\
-$\x02\xf0\x0f\x8d\xcd\xa9\x09\x9a\xf3\x15\xc8b\xcd9\x0c\
-\xa4\xb0\xe6\x1c\x07b\xcd)\x0a\xf0\x1c\x05\xbf\xd2\x17 \
-v\x94+\x9e;A\x13\xcf\xa7 \x8b\xe7[\x90\xa2\x5c\
-\xf1\xbc\x0c\x12\x94+\x9e\xbfA\x8cr\xc5\xf3<\x88\xd0\
-\xbb\x0aH\xae\x0a\xba\xed\xa3\xed\x0fm\x7fi\xf1A\xc1\
-\x13\x05o\xb4\xf8\xa4\xe0\xf9'\xde)t\xa0\xd0\x85B\
-'\x0a\xdd(t\xfcIW\x0a\x9d\x9b\xe9\x0e\xf3D\xc0\
-\x89S\x8f*O\x04I\x89+\xe3\x00\xe6\xf4Q\x04\xb0\
-\x15\x1f\xcfq\x00r\x01\xd4Q\x8d\x81:\xfc\xff\xe2B\
-l\xd5.\x04\xdb\xa8m\xf53SV\xbc\xb4K\x81o\
-\xb9z@;d@{\xac\xc1\xf55\x80\x9f9\xe5\xa8\
-\xf3.\xd1\xab\xc3\xf3X.\xedRlr\xde&\x9f\x0a\
-`?\x80\xc1<l\xb7\x1c\x00O\x00\xd5\xac\xb4\x99R\
-\xbfc\xa9\x8a\xba\xed\x94\xa7=\xd3\x14\xe6\x1d\xf0\x04\xa0\
-\xc0Ey\xd9\x0d\xc0\x11vul\x18\xfb\x01\xf3F\xb8\
-0\xde\x03b\x0f\xa0;\xc1m\x1f\x07\xbe\x9fN\x8dK\
-Vp\xfe\xc0F\x0d\xbdb\xac\xf4\x13\xe7\xad\x9daH\
-\xf3\x7f\xe9\x00&\x10\xc4/\xba\xa0\x0dU\xb4\xedb\xb6\
-\xfd\xf0\x5c\xa6\x0b\xfa\x0ah\x1bm\xfd\xed\xff\xf0z5\
-\x80\x0d\x1c\xe0\x5c\x04\x80\x05\xbby\xd5C\x00\xdcf?\
-\xef\x02\x05\xe0\x18\xb7\x02 \xc2F\xfb-h\xf1\xc9,\
-\xfe\xf1\xbc\x09\x10\x87m\xe1\x97\x11\xfe\xa9\xebVl\xf0\
-L\x13;\xed\x07\xb2\x1d\x85q\xd8L\xb4\x89\x95\xf67\
-1\xcbKp\xacB~g7o\x01\x17\xf7vV3\
-\x1a\xd3PFB9C\x0f\xb7m\xe1\x9f\x9cw`\xbb\
-<\xca\x02N16\x9e}\xdb\x96l\xc5\xe5;\xcbr\
-\xdd\xdb\x84\xa7{+\xed\xe9\xcd\xabpnj\x8b\xb7i\
-\xf1\x0f\xe3P/\x1a(\xb0\x8csv\xf1\x8f\xd7k[\
-\x9b\xa7\xa1N\xc0H\x9eS\xff_\x80\x85\x0a\xf9LB\
-v\xda\xcca\xfb\xe1\x1c\xeeE\xab\x8b1\xa3\xcf\xe0r\
-\x1d\x8d8\xbb\x0c\x8d\xbaf\x8dF_\xb7\xc5\xa2o\xd8\
-\xa18\xb0[\xc7\x1e]1G\xaf\xdaj3\xdd~\xa8\
-/Q\xeb|P\x8fdv\x7fI\xd1\x87g\x5c;\x87\
-\xf3\xfd\x8b\xfb\xd8y\xa3Q\xcc\x8e\x83\xfd\x14\xfd\x1d\xd7\
-\x81\xdb\xd4\x07\xe0\xd9\x86e_\xd3\xf0s\xb1\x9a\xcb\xaf\
-s\xb2\xd8\xaf\xd3\xfe\xdf\xe7\xf48\xd4e\x87\x123|\
-\x07uo\xb2\xed\x01\xf5wF\xedO\x0d\xb2k\xf1-\
-n\xb5\x1f^\x1f^0b\xa2\xfdrpNS\xc2\xed\
-&\x86\xbc\x93\x97\x1e\xce\xb3\xf8\xd3w\x09AL\xf1\x90\
-\xbb\xbe\xc26h\xf31\xa3O\x16f=\xe1\x19\xfe!\
-\x0f1\xc2\xffe#E\xf4\xae\x95\xea\x05\xdc&e\xd8\
-\xfe\xcf/|y\xd6\xfe\x8c\xf8;m\xb6\x1f\xcc\x97\x94\
-9\x88bk3u\xee&'gJ\xb2\x22\x87\xda\xda\
-\xb3H\xb3W\x8b\xec'`\xd6\x1e\xc9\x8ct\xe6:\xfe\
-?$\x85\xa2\xce\xdb\x15[\x9b\xb3\x80\x8e\xa5\x82\x86\xb4\
-\xd4\x01\xeaX\xb1\xc1\xc9{L}\x8d\xd1\xd2/)\x5c\
-i\x7f\xce\x9b(\xcc\xd5@\xed7\x9e\xc1\xf7J\xa1\xf4\
-tHv\xf6Ir#7@F|\xe0o\xfc\xe2\xc6\
-x\xafS\x1d+\xf8\x87\xd7GG'\xa1\x8d\x0d\xb5\x84\
-\xe3\xffK\xc6\xb3\x16<\x03\xe4#\xb0\x9f\xdb\xb4\xf3\xc8\
-~1V\xdb\x0f\xcf\xac,\xf9\x94Hx\xfb\xb3_G\
-\xfel\xff\xa5]\x8ap\xaf\x11#;5\x17\xf7\xf7\xb1\
-\xccC\xf0\x9cQ\xa2y(1\xf4\x02\x99g\xbc\x8c\x14\
-\x99=\x178\x8e\xd9\xf9\xab\xb5\xb1\x03c|\xeb\xaaJ\
-[\xe0\x13\x9e\x1f\x0a\xf7\x10\xb3\x83\xff\xdb'W\xc3\xbd\
->L\xfbf\xa0/\x15\xea\x0f\xec\xb6\xbf9^{\x0a\
-\xfa:\xc0\x12\xcd\x8av\xc3\xd2\x83\x8f\xa0\x8f\xcf\xceG\
-\xbf\xa7>d\xb9\xfd\xdf2_\xa07\xf7\xa9\xb2\xe4\x8f\
-\x04\xb0\x15\xf7\x1d\x13zv^\xe4\xc9\x19XM\xd9w\
-\xa6\xf9\xa6\xae\xba\x1c\x8bp\x5c\xc8\xce\x19x\x8a\xcc\xea\
-\xcf\xac\xfa\xdf\xe2\xce-A\xabJ\xbe0\xc4?\xccW\
-\x11\xef\xa1\xcb\x92?\x12\xaf\xc36\x8b\xb2b\xbf\xb0\xb3\
-\x17 '\xfe*\xd6XW\xf5\xfb\xf9\xdd\x0duXn\
-\xd2\x1d,\xca\xe1\x1fv\xdfo\xcd\x96\xfd\xc8\x86\xff6\
-\xfc\xf08\xf4\xe5\xd5mh\xda\xbd\x030\x96\x1d}u\
-]\x1f\x85\xe7\xe0\xb2\x81sJ\xbd\x1a\xb6\x99\x13\xfb\x9d\
-\x83o\xd3}'\x0b\xf5\xcb\xad\xf8~\xe4\x84$\xb6\x14\
-\xb6Q\x8e\x9e\xffJ\x08\xf0\x7f\x84\x1b\xfeC\x1e\xb5\x1f\
-\xae\xa1t\xe3\x96\xff\x96\xcb\x00\xdb4\x8e\xdb\xfes.\
-\xe1\x1f\xb6E\x97W\xeb\x17\x5ch\xbf\x05\xaf\xd7\x8f\x08\
-<'\x17\xb6A\x84_\xebw\x1c\xe0\xbf\x8aU\x9e\xe1\
-\xd6\xfa)\x1b\xedOgv\xac\xf2j\xfd\x9a\x85\xb9\xe9\
-\x08#\x19I@\xfc\xc0ev\xe3\x07\xe8\xe0\x1f\xea3\
-\x97\xe9\xcd\xab\x82\x16\xbfA%\x13_\xe3\xef\x90\xe1c\
-\x1c\x0a\xb4\x1f\x14q;\xee\x02\xc5\xa7\x07}\x03Tm\
-\xae\xa3\xd8\xda\xf83[q\xbf7\xc7\xf13\xcd\xe1B\
-\xcdg\xd5\xc0\x83j\x9a\xc3\x88\x9a\xcf\xba\x81\x07\xdd\xc0\
-x$x\xf8Ms\xb8\x11~f\x8e\xe6\xafksX\
-\x12~\xde\x8e\x14~\x1e\x8f\xc4\xafks\x18\xd3\xaf+\
-\x09\x8f\xee\x22\x09D\x94\xd7\xef\xed\xa1m/m\x7f(\
-\xfd\xa4\xf4\x9b\x16\x1f\x14<\xfd\xc4\x1b\x05\x8f\x14\xbcR\
-\xf0\x8c\x03\x8c\xd3\x82\xd1YZ\xd4qZ\xbd8\x92S\
-}\x00l\x04p\x05@\x0a<_\x90J\xbe\xc0z\xca\
-\x03[\xb5+\xd7L\x95\xf4\xcem\x97\x97&P>\xc2\
-\xb3\xd7\xae2\x92\x8fp\xbd\xf7\xda\xaf3!`\xbc\xce\
-5\x97m\xf2#8\xf8nw\x00\xce\xcc\x9cU\xdc\xc6\
-\x99\x0c\x8d\x00\x5cX\x8d\x1b\x02\xef\x84y\x063\x98\x8a\
--\xb0\x84g\x220\x5cSy\x07`8\x93\xdf\x9e\xc4\
-l\x8e\x9f\x9b\xac\x9dIP\x02`\x12\x13\xfdf\xf8m\
-\xe8\x83\xbbb\xcc\xd6\xda~\x09=<\xe0\xf4f\x88s\
-\x02r\xf2\xbfk\x8d\x1fp^c\x98\x13\xff\x1c1y\
-\xb2]Z\x19c\x8dm\x8d-\x82s\xd27R\x8fM\
-||\xb7\xde\xef\x03\x1a\xd8C\xe7\xb5\xd8]\xc7\x8d\xd8\
-]'=\xa6\xc1\xef\xd8\x0a\xcceG\x9b<r\x9dJ\
-\xae\xb5*[\x9e\xb8\xfe\x8f\xa3<m%y\x1f0\xef\
-\xfd3\xdb\x8a)\x94\xc6ej+}Wg;\xe7G\
-\x8b\xfc\x1f\x9fR\xdb\xc2\x81\x1e.\xcf\x7f\xcfW\xe88\
-\x870\xff\xb9\x97\xc54zy\xc7\xbc\xf1\xb9\xa4U_\
-+\xee\x8e\xe4\xb8x\x9aOm5\xaf\xe5\x03\x1b5\xda\
-y\xac\x05\xe4gDr\xfc\xed\xef\x1f\x12\x7f\xfb\xb6\xcf\
-\xaf\xb5\xca\xb2\xb6\xc6\xfb#\xfb\x89XnR \xd6\xd8\
-P\xcb\xd6\xb7\xcb\x0b?c^\x96\xd3[|\x9b\x9d\xdc\
-O\x05\xef\x1fs\xdc\xf76\xf2*\x961\xfa~\xce3\
-o\xb6\xbe_\xf8%\x9d\xd1Z_\x19=\xfe\xa3\x06\xe8\
-K\xae\xad(`=\xde\xe1y\x10\xa3\xbc\x82)\xf4\xc6\
-\xdfom8\xa9\x89}x|\x01\xfb\x9e\x1a\x82\xbd{\
-t\x86)\xd9\x10zn#\xa3\xbc~W\xe8\xcb\x1f\xc6\
-\xeb\xfe\x8d\xf5\xd5t\xbf\x9d\xfd\xdc\x87\x99\xbcz\x1b\xdb\
-\x92\xbf\x8c\xe0\xe9\xf9\x15XY\xee\xeb\x96y\xde\xab\xcb\
-\xb1\x8c\xd0\x93d\xf9\xc9\x84M\xdc\x07\x9f\x03\xaeqb\
-_?v\x9a\x8f\xbd\xf0\xde\x82\xc5_Z\x8b\x85\x1d\x1c\
-\xcd\xec\xef\xae2;\xffr\x01\xe0\xb7\xd4Y\xd5?\x08\
-\x04gv\xf5/\x02\x00~\xa3;'\xfa'\x07\x00\xdf\
-\xadF\x94\xfe\xcd\xc6\xb7'\x11m\x7f\xb0\x80s5n\
-\xd9_\x0c\xf8\xdc\x99\x1e\xbd\x89\xb4?[\x91-Wi\
-\xc7\x18\x87v0C\xfb\x9bJ\x9e\xf7a\xdaO\x13-\
-\xf6\xd3MS\xdb\xbc\xdf\x0e\xee\xb1\x83\xfb\xea\xe0\x1e4\
-\xb8\x9f\x0e\xeeM\x13a\xc3\xffA\xfe\x1d\xe5=9\xcd\
-{\xd7\xe0~5\xd9\x9f\xae\x0a\xf0m\xe8\xa7\x18\x88\xef\
-)\xa3\xf8)\xf4$Y\xfb\x16\x98\xe3\x94\xc0\x5c\x03\xcf\
-i\x8f\x02\x90\x8f\xfb\xe0\xa0\xef.\x1f\xe8xQ\x97\x0d\
-\x15m\x9d\xb7\xc9)\xb3\xe1C\x83\xfe\xb3\x00\xc8G\xb4\
-1M\xf8~-r\x9c6\xd5\x9e\x8e\x00\xf0\x1dE&\
-\xdf\xbd\x09@%\xb5\xdf\x9a\x1a\xeeX\xa8\xc28j\x94\
-\x127C\x15\xffS\x09`3\x03^\xd9\x0fcy\xa8\
-\xdbL\xe5\xf3#\xeb\x9f\xd4{@(:\x1aU\x1d^\
-m\xe8\xb5\x1b\xbe\x9b\xfa\x9d\x94:<\xbf\x0b\xe6\xd3\xa5\
-\x8d\xe1n\xe5\xfd\x00\xc8\xf5\xcd\xb4\xf8\xa6\x87\x93 k\
-U\xd4\x1d\xdf/\xc4,\x80\xf7W\x01P\xa4\xc2K@\
-k8\xc1\xcfQE\xa9\xf5dF\xed\xa7\xaa\x07Px\
-\x90\x96OB\x0f\x8cB3\xc2\x1d\xb1\xec\xd7\x11\x00\xa2\
-P\x00\x18\x15\xa0\xd4\xd7\x8f)\x11X\x9c\x9f=J\xb1\
-Y\xa9\xde\x0f\xf9J\x19\xf27-N\xb2\x9f^AY\
--/\x1e\x9ck\x0dO\xb6\xf8\xd8iA\xd3\xca\xa2l\
-\x94*\xfe\x12\xa5\x89\xc7Di\xff\x1f\xd6K\xbe\x7f\xf8\
-\x0dW\x80'(\xe3\xb2\xc5\xfb\xf33\xa2X~\xff\xe7\
-\xf4\xb8\x16\xef\x87\xe7\xc0\x82w\xe6S\xd6\xe3\xa8\xdf\x1f\
-}Z\x1b-\xfd\x9cD\xb6#\x99y\x7fMe)z\
-\xe3\xc0\xbf\x14\x1e@\xa1\x7f\x0b\x7fg\x13%\x16\x9c\x16\
-\xc2\x0e\x8d\x85\xc1YL\xe1\x1e\xe0\x86\x8co\xb8\x9f\xe6\
-\xb6\xb9\x0a\xf5{\x9aZ\xc3\x0f\xa5^\x9c\xfd\x9c\xa9\xf6\
-\x17|N#\xef\xbd\x80>A\x9a\xf7\xe4\x03\x88\xa2'\
-k\x22\x8fOCa\x1cr\xd1\x87\xa7(\xb0y\xe9\xb6\
-?\xf1\xc1Y\xf28l\xe5\x1d\x90\xbe6\xf4\xdaO]\
-\x87g@\x15e=\xfd\xad\xfd%\x9f\x12\xb1P\x80K\
-:\xbf\x85\xbc\xff\xdb\xf8\xa2W\x879c\xdf\xdc\xb5A\
-\xbf\xa7\x85by\xe9a(\xcc\x13\x09\xbfK\xe7y\xf8\
-N%\x5c\xfe\x04\xd0\xc3\x11\x07\x10@+\xdf\x18\xb5\xbf\
-\x95\xb8Lz\xcf\xc3w)2+\x9f\xd9x\xff&:\
-s\xc0~\x02\xf0\xb2\x9f\xc1\x1c\xb6\x89\x1e\xae\x18\xb4\xbf\
-\x92^\xbbY\x9d\xdf[\xe1\x93\x00Z|3\xf9\x1d%\
-\x9c\x87\xa3\xf0\xb1H\x91'\x94qiC\xe1Az\x05\
-E\xec\x90ZD\x16)C\xa4\x90\x1cD\x02\x89F\xc4\
-\x80\x8e%B\x06\xe6u\xb2\xe6\xe7\xe1o\xe1;\xe0\xbb\
-\xe0;\xe1\xbb\xa1\x1e\xd6\x0b_3\xa2\xe8aZ\xe2\x8c\
-\xdf\x09t\xabq\xf8\xfe\xfc,\x00\x0d\x10\x80\x8c\xc8:\
-\xbfS\xfe\xc2\xc1\xb5C\xc7\xd3\xfb\x9d\xb5\xce`\x98#\
-\xcb\x83\xc2\xab\x14\xa0\xd9[\x0be\xfce\xfd\xf9\x03\xbb\
-\xb6\xf2\xdb\xb8\xdf\xcf\x04\xa7\xeb\xa3~b\xf0\xef\xafw\
-\xe0\xdfm\xb9~\xc3\xf8\xdc\xd1\xcbT\xfd\xfd\xd5\xe6\xc3\
-\x930\x1f\xdb\x99\x98\xb7\xf5?\xbf\x01\xcd\x99{\xa8\xbd\
-\xee\xd0\xf1\xd4\xb9\xa3\x13\xbc6\xb5\xe9\xdb\xab\xaf\xab\xc6\
-\xfcO\xac\xa4~\xc7E\x1c\xcf\xe4\xdfg?\xf5b\xe8\
-\x03J\x0a\xf7\xa0\xf6yRh\xd4\xec\xdfv[\x86\xd5\
-T\xe4\xd3\xfdmC}\x0d\xd9\x8fN\xe5\xb3l\xa0\xfe\
-}\xf3\xd9VFt\x7f_Y\x9aG\x9bo\xbe\x81\xba\
-\xfd\x94\xf9 79\x10+\xfd\x92\xf2\x9b?)\xf7m\
-,\x16`\xd1\xc2o\x97\xd5V\xee\xedd\xbf=XC\
-\xed\x8f\xe6o\x17~\xc4b\x9c\xe6\xff\x96\xc3\x1a\xe0`\
-\x1c-\xcf\xd1\x9e\xcb\x10}F\xbb5\xff\x11\xdc\x0b;\
-\xae5\xfea\x12<(\xfcwx\xdd\xd0\xae,\xc6\xb7\
-\xc79l\x1a\xd6b\x0c\x1cY?\xb4\xd5\xf1C\xdbf\
-\xf8\x0c\xedo\xa9\x0b\xa0\xebo\xe3\x97\x82gJ\x7f\xa9\
-K\x99\x14\x82D\xc3\xf5v\x91f`(s\xf0\xe7\xe0\
-o\xe0o\xff\x0f\xabD\x0f\xbb\
-\x00\x03\x08\x0a\
-i\
-cns\x00\x03\x08\x0ainfo\x00\x00\x01>b\
-plist00\xd4\x01\x02\x03\x04\x05\x06\x07\x0a\
-X$versionY$archi\
-verT$topX$object\
-s\x12\x00\x01\x86\xa0_\x10\x0fNSKeyed\
-Archiver\xd1\x08\x09Troot\
-\x80\x01\xa7\x0b\x0c\x17\x18\x19\x1a\x1eU$null\
-\xd3\x0d\x0e\x0f\x10\x13\x16WNS.keysZ\
-NS.objectsV$clas\
-s\xa2\x11\x12\x80\x02\x80\x03\xa2\x14\x15\x80\x04\x80\x05\x80\
-\x06Tname_\x10\x16assetca\
-talog-referenceT\
-icon\xd3\x0d\x0e\x0f\x1b\x1c\x16\xa0\xa0\x80\x06\xd2\
-\x1f !\x22Z$classnameX\
-$classes\x5cNSDicti\
-onary\xa2!#XNSObjec\
-t\x08\x11\x1a$)27ILQS[ahp\
-{\x82\x85\x87\x89\x8c\x8e\x90\x92\x97\xb0\xb5\xbc\xbd\xbe\xc0\
-\xc5\xd0\xd9\xe6\xe9\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\
-\x00\x00\x00\x00$\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xf2ic12\x00\x00\x14=\x89PN\
-G\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\
-@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\x00\x00\
-\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00De\
-XIfMM\x00*\x00\x00\x00\x08\x00\x01\x87i\x00\
-\x04\x00\x00\x00\x01\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x03\xa0\
-\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\x00\
-\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\x01\x00\
-\x00\x00@\x00\x00\x00\x00FQB\xb0\x00\x00\x13\x9fI\
-DATx\x01\xed\x9a[\x8c\x9d\xd7U\xc7\xf79\xdf\
-9g\xc63\xe3k}\xaf\xed8\x09\xa9\xed&\xc1A\
-v\xd2:$\xd0\x1a\xb5\x89\xe4\x87\x8a\x07.*D \
-x \x14\x01\x0f\x88\xa8*R\x15\x95\x08\x95(\xe2\xa6\
-\xf4\xa9\x0f\xa5\x8a\xe8\x03\xa5j\x91\x0a\xa8@d\x9a\xb6\
-\x08R\x13'\xa1\xb1\x0bj\x83]\xdbu\x9d\xd8\x8e/\
-3\xe3\x999\x97\x8f\xffo\xad\xbd\xce\xf9f\xe6\x1c;\
-\xb1\x00!5;\xf3\x9d\xbd\xf7\xdak\xaf\xb5\xfe\xff\xbd\
-\xf6\xfe.NJo\x97\xb7\x19x\x9b\x81\xb7\x19\xf8!\
-f\xa0v\x93\xd8ov\xdeM\xba{\xd3\xd3\xca7\xad\
-\x99\x15\xdf\x0a\x10t\xb9\xea\xdb>y|Omr\xf2\
-\xa1To\xdeW\xd6j\xb7\xd4j\xb5\xed\x1aZY\xa6\
-r\x5c\x0a\x8dT\xcbf\x15\x8ed6\x89\xc8LZ\xaa\
-E\x83\xda*\x1f\xef\xb7\xf3\xd4<(5\x8d\x9b\xbeK\
-4\xb1\xab\xd6\x5c\xea\x95WS\xadw\xaa\xd7+O\xd6\
-\xcb\xde\xf3\xe5\xd5K_9\xfd\xf1\xfd\xc75\xd6\xd3\x85\
-qw\xa0\xc6\xf5J\xd5\xdd\xf5\xf4\xea\x1a,\xb6>q\
-\xe4=\xf5\xb5[\xfe\xa0Vo<\x18\xd6\x05\xde\x82d\
-r?\xce\x1c\xb4cE\xd3G\x00\xd3\xd7\x8b\xb6\x0dA\
-S\xf0R\xd1\xc9\xe4\xd9$\xb5m\xbe\x86!\xa4j\x0b\
-\xac\xe6\xab\xb3\xf0\xf5\xce\xeb'\x7f\xef\xec\x1f>\xf4/\
-\x9a\xd3\xd1\x05\x19\xd7-\xb8\xbfQ\x01|s\xcbS\xc7\
-\x7f\xa71\xb1\xee\xf1\xb2\x96\x9a\x80\xc6c\x04\xdd\x0f\xc0\
-,\xe5@\xd56lh\x19&V\xda%\xe1\xd0V7\
-w\xb0\x16\xc188\xd7\x8f6j>\x1e^\xddOu\
-\x8egJ\xd9\xee\x5c=\xff\x89\xb3\x1f?\xf0\x94\xa6\xb4\
-uEF`bY\x89\xf9\xcb\x06\xb2\x00\xf0\xadm\x7f\
-z\xe2s\xb5\xd6\x8a\x9f\xae\xb2\x1e\x01\x0f\x93\xd9\xdc\xbc\
-\xc2n\xc7I`\x0e\x05\xa7\xcc\xcb<\x1a\x99\xb1\xaa\x8b\
-\x03r\xfd \xd0M:Q\xee?\xb2/dA\x92L\
-\xce\xcd|\xe9\xf4\xc7~\xec\x17\xe4j^\x17\xdbfh\
-)\x86J]\xe8+\xff\xc9\x97\x7f\xb7\x98X\xf5\x91\xb2\
-\xec)p\x0f\xda\xf2\xcdV\xcc\x1d\xd7,\xb2\x1c\x04m\
-\xc0\xc9F\xac^\xb4\xa9\x1d`\xd61=\xd7\xc5%v\
-\x9c$dj1\xaeK\x96\xbc]\xcb\xba&\xc3\x96\xf7\
-]\xc7\xfb\xc4i\xfe\x8b\xc6\xee\x89\xf7\xfc\xcc\xc2\xf4s\
-\x7f\xfe\xaf202\x0bF\x11@\x9c\x8dM\x1f\xfd\xdb\
-\x07\x1a\xebw~Z\x9d\x02A\x04\xe4dd\x808\xb4\
-@\x08R$I\xd1\x81@\x18C\xaa\x85\xc1\xe7\xbb,\
-V\x9f@\xfb\x01\xd3\x0e@\xb4\xd4\x1fd\x85\x03\xed\xfb\
-\xcf\xfe\xb0\x8dl\xe0\xdf\xe7\xe0\x0f[\xc5\xd8\xc4\x03+\
-v\xbd\xf7\xab3\xcf\x7f\xf1\xb4\x94\x08tYi,\x93\
-\xb8\x80x[\xcd\x8d\xef\xfa}5\x9ae\xcf\xe7\x1a \
-s\x0e\xae\x0cP\x8a8\x03\xa2\xad\x04AYO?\xf2\
-\x19\xc0\xe9\xd9\xfc<\xcf\xc00\x87\xd9yB\xacd\x80\
-'\xe4\xfe\xb8\xf4\xdc\x7f\x90\xe9\xfd\x88\xc9\xecc\xc8\xfe\
-\xfa\xba\xcd\xe6\x96\xddOh\xec\x83\xba\xd8\x06\xcb\xb6\x02\
-i\xbe\xb4`\xb3\xd8\xf8\x1b\x9f\xfd\xd1\xd4l\xdd\x0f\xcb\
-\xbe\x8a^\xfb\x8ay\x9b\xc8m\xd5\xa9{]k\x13A\
-\x0d\x12\xe8C\x5c\xbe\x90ag0\x9fH\xd1#C\xb2\
-~\xd6\xf1>\xba\x8a\xd7d\xddL\xae\xfb\xb3;!r\
-1\x14:\x03\xff\xd8#\x9el\xbb\x18;\xb0\xf1\x97\xfe\
-x/\x98t\x05\x87jz\x19\x96\x01(5\x1a\x1b\xee\
-x\xd8\x82V\x87\x94\x02\x98\xaf\x0c\xc3\x04oB\xb7\xa8\
-&+eZ\x92\xa3\xe1sL\xe2:=\xcdG\x8e\x88\
-b\x00\xd4\xcf'\xe1\xa2\xf9\x92E6\xa0jc\x80\xd2\
-\x7f\x83\xf9\xb2f~\xcd\x98\xcb\x11\xf5\xfd\xf7\x07\xb5\x97\
-w=$\xad\xa3\xba\xb85j`PF\x12\x90\xc6V\
-\xec#H\xc7\x89\xe3\x9c\xae\xac\x98\xcd\xc7\x8eB3\x05\
-\x1f\x1f\x04\xa8\x96\x05B\xe8\x16\x95\x01e\x9ee\x0c3\
-\x89O\x02\xcb\x12\xf5\xeb\xb45\x87\x94,\x8d,\x07\x8b\
-\xcc=\xe1\xcdu\x98'e\xfdx\x9f\xday\x1c\x10d\
-\xfeq\xcd\x7f\xad\xb1}R\x01+3\x17\x95\x91\x04\xe8\
-ag;Nb%\xca\xbc\x9f\xfbA\x98\x19\xd2\xda\x9d\
-\xc7\x8a\x22\xc6\xb9\x17\x02\xca\x81f\xe2|\xcfIn\x86\
-<\x22\xc0S\x08\xd6\x800\xc7\xfe|>\xe6Hxl\
-\x99\xaa:>E}\x06\x99$\xd2l\x12ZZ8\x1b\
-\x97\x9c\xf1\xa2hl\xd3\xe0[\x22\xa0\x10\x01[\xd8W\
-\x1826e\xcc\x81\xe5 B\xae\xda\x82\x95#\xe2\xa0\
-\xdd\x07m2\x0f\xa8nR\x1b\xb4\xcdh\x10j=\xad\
-8\x99\x05<\xc7a\xb6\x94\x1eHz]\xd9\x14;z\
-\xdc\x95\x9e\xe8\x91=`\x1a8\xd5\x1e\x17\x8a\xca\xd4\xbe\
-\x9c3@\x1d\x95 \xa2\xac\x17[\xd4\x85\xfb\x98\xca\xb0\
-\x95\xa5\x19\x10\x0a`\x99\xb4- 5\x13\x02FW\x94\
- \xc3G\x91\xeb\xe2O\x97\x13\x11\xe9\x0cHd\xde\xc7\
-\x16+^\x17x\xda\x05\x99\xd5\xe5\x00\xe5\x80\x16p\x91\
-\x8e\xcdB\xb3XTfC9\xbaF@^\x08\xf7/\
-!\x05\x9f\xfc\xd0$NSv\x19\xf1\x88\xe4I\x0dy\
-\xf2!\xb6\x19h{Zxk\xf0\x8bB\xad\xac\x95c\
-\xb6O+\x86Q\x89@\xa8\xbd\xe3\xe7D\x154,\x18\
-\x11ri\xc6\xd05\x18\xba\xa7\xda\xb425\x08\xb4\xec\
-\xa4Zg>\xed\x5cY\xa4;7\x8f\xa7\xedk\xc6\xd2\
-\xa6\xa9\xf1tin!\x9dzc.}\xe3\xc4\xa5\xf4\
-\xbd\xab\xd2+\xc6u\xff\xcaDp>\x00\xd8\x1c\xca\x18\
-\xfdl\xdb\xc1\xcb\xa3\xe9@\x84o\x019\x1a3\xb7\x1e\
-\x8e\x9a\x83\xb24\x03b\x84\xbc\xd5m\x03g\xce\xac\x01\
-V\x9fbm\xc9-\x10\xeb\x03F\x0d\x09\x88\xcb\xd6K\
-\x02\xf4\x08\x8e\xa7\xa8\xba\x06\x0aR^\xa44\xd8\xa3\x0b\
-si\xef\xa6z\xfa\xe5{oI\xef\xbdc\xb3\x13%\
-\xbd\xae\x01R-{\xbf\xdd\xed\xa5\x97\xbfw!=}\
-\xf8\xbb\xe9\xc5\xd7DVc,\xf5\xea\xca\x0d\xd9.\xf5\
-R2\x88\x0d\xe7\x19\xac\xc5\xab>\x22\xbc\x13\x93B0\
-\x05DK\xca(\x024)\xefKM\x08Gf\x8c\xbe\
-[w\x80r\xe0\x87\x18)N\x96\x01\xbc'\xb0\x9e\xb6\
-\x00\x86\x88\xa2.\xf0D\xd2k\x0b\xfcL\xfa\xd5{7\
-\xa6_{\xff\x9e\xd4\x15\xc8 Jj\xa9\x81\x09JG\
-\xe7\x8f\xdawm[\x93>\xf5\xc8\xbd\xe93\xffp4\
-}\xfa\xe8\xe5\xa4w\x12YozLR\xb0\x98d\xc0\
-\xf6\xbb\x19\x02\xb4|\xd2\x16\x99U\xdbfw\xc9\xcf(\
-\x02\xa0W\xaa\x99\xc1<\x09c\x0e\x90\xca(\x16Q\xee\
-\x04\xb8\xb5Z\xd7\x8eZ@\xdb>728\x85kZ\
-u\xc9\xb4\xcfk\x0b\xb3\xe9\xb1\x83\xdb\xd3\x87\xf6\xdd\xaa\
-C\x0eR\x08\xd6\xddY\xca\xaa\xdd\xd3\xa16\xd6j\x8a\
-\x1c\x12_o3\x9d^z\xe4\xe0\xde49\xf6\xad\xf4\
-'\xff|^\xb7\xb5\xa9T\x02\x9e\x87-BR1\xa0\
-\x19\xb0\xc5I|\xf6\xe7\xf1\xb9\xd6\xf2\xdfQ\x04h2\
-\x07\x13\x86qa\xe6\xd5\xa7\x9d{\x01\x1c\x00\xe8\xd5\xcb\
-\xd4\x04\xb8\xf4\x9b\xf4\x15\x5c!B\x0a\xf5\xebJW\xe4\
-ew!=|\xc7d\xfa\xd0\xfe\xdb\xec^\xcf*\x05\
-\xe8\xa8\xb1\xdfh4\xfa\xbe\xcc\x9f\xf4z\xbdN:t\
-\xdf\xee\xf4\xedS_K_>y)\xa5\xb1\x958U\
-drj\xdb\xa6\x024\xc7\xd9_,\x8c\x8c(#\x09\
-\xb0GT\xc3\xed)e\xc6\x88\xb8B\x02m\xbb\x8dI\
-\xcc\xa1\xc6\x01W\xd7q\xd5\xec\xce\xa5\x83\xb7N\xa5\xbb\
-\xb7\xaeI;7L\xa6\x0bW\x17\xd2\xd1\x93\x17\xd2\x91\
-\xef^L\xbf\xf9\x81\xfb\xcc\x06\xa6\x84@g\x82,\xa8\
-\xc3\x15\x04\xdb\x88\xfa1VWF\x8c\x0bd[\xd7\xaf\
-<\xbc?=\xfb\xe4_\xa6k\xabn1\x12j:W\
-\x80\xeew(\x0b\xb8o\xc7\x5c@\xbc\xaf\x1bf\x97\x95\
-\x91\x04\xd8\x19\x90'z\x16hn\xf5~\x0bx\xf2\xd3\
-\xd6@\xa7\xba\xd2\xa0\xd6i\xa7\x1d\x93\xbd\xf4\xf8\xa1=\
-i\xef\x8euR\xf7-\x84\x99\x87\xeez\xa7\xf6\xae^\
-/\xec\xbdr\xf8\xcaC\xc2\xb0\x82\xbcQ\xd4\xd3\x0a\x1d\
-\x10\xab\xc6[\xe9\xd0\xbe\x1fI\x9f\xfb\xfa+\xa9\xb1\xe1\
-\xf6T[\xb1\xda\x00\xdb\xcc8\xb7\x8c\x87\x01\xea\xea\xed\
-{\xa9}\x83\xb0Th}\x01\xb4\xc7T\x8c\xf6\xdb\x02\
-\xa96\xe4\xd8%\x80\x85\xda\x0d\xadB\xd1m\xa7\xa9r\
-6=\xfd\xf3\xf7\x18\xf88\x9c\xc0\xc4>o(\xf8\x96\
-\xc0\x17\x95\x15\x8f\x95\x1f\xea?\x0b\xd1!\x13\xb8\xc4A\
-j\xc9\xce\xfe];\xe4O[\xf4\xfc\x89TN_\xb0\
-Xxf\xe1\xb2\xe7\x09\x9e%hS\xe7\xf6(\x1f#\
-3\x00C\x1cl\xb6\x15h\x09\x04'-)\x0f\xb8B\
-\xa8x\x98\xf1\x93]\xa4(\xed\x1f}p[z\xe7\xba\
-I\xf9\xd4\xe1\xe5\xe9a5 \x8c\x90,\xbb\x1e\xf0\xea\
-6\x88v\xd42b\x84\xdf\xb6u\xbd\xdde\xda,\xcc\
-\xc53\xa9\xd6n\xa7b\xd5z\xf7\x11HY(\x8bY\
-u\xc8\x86\xd4#\x09\xf0\xb4\xc9\xb7(\x01\xb7\x83\x0e\x03\
-j\x03\xdejyh\xa8\xd9Tr'=\xd0\x1c\xbcS\
-\x8f\xdc\xe6\xd8]\xc6\xca\x19x\xa2\xc9\x05\x02(Q\xf7\
-\x01\xe6q*d\xd5\xab\xd3\xe9\xd8\xdd\xa1\xd7\xed\xd8\xa2\
-\xacY5\x9e\xceO\xabM,3\xe7u\xd7\x5cH\xc5\
-\xea\x8dXu\x22\xf0\xa1\x0cuO\x83\xedPqa\xcd\
-\x91\x04\xc4{\x80Op\x03\x18\x93y]<\xd4\x00\xbe\
-L-\x09\x9br>\xd5\xea\xa5\x8d\xab'\xcc9s\x00\
-W\xcd\x02\xb7\xe3\xc0\x86\xb5\x91\x05\x11\xd4\xdc\x0aCF\
-\x1b\x19\xb7E\x88h\xeb\xb6\xc8\xa32\xd1\x14\xbaz\x04\
-6wUs:\xa9\xbeJ\x0fU\x22\xc53\xd7L\xf4\
-\xedzo\xf1\xefH\x02\x06\x07\x87\xb3\xc8\xb3\xbcb0\
-\xe0\xb8n\xe8\xb4oiS\xb6$\xaf+\xb0\xa6\x1ek\
-\xa1\x89Xb\xe5q\x15\xabL;\x00\xd2\x8e\x12\xe0\xa2\
-\x1f:!\x8f\xba\xad4\xa7\xdd\xd6\xb3\xc3\xfcB;M\
-\xebq\xb9Qp\x93\xc5\xae~p\xdc\x9eO\xe5\x95\xb3\
-\xfa\x17\x8a\xf5\xf2;\xf8\xda\xc7\xd0\xa82\x92\x80\xfe\x19\
-\x80\x0by\x80U\xdb\xff\x02^\xe8\xbe\xce6h\xe8\x9c\
-\xa8\xeb\xf0{G\xb3\x93\x0e\xbek\x8b?\xd4X$\x0e\
-\x16\xf0\x01(\x02\x88>\xf5\xd2v\xc8\x96\xd6\xac<\xe0\
-\xadV\xfb\xd4k\xe7ED'\x15\x8d\x22\xb5\x15K\x8d\
-\xb3\xc5\xec\xa9\xd2\x9d\xa8{\xe5u\xbd\xfe\xacM\xf5B\
-7f\xc27\x9a\x22\x82\xc5\xf5H\x02<\x03X}\xe8\
-UQ\x00\x00\x82\xd7\xba\x1ek\x0b\xed\xaf$g\x1f\xbe\
-wsz\xf4\x03w\x99\x8a\x05\xa1\x16z\xc3V\x1e\x10\
-\x94\x00\x1e\xab\x1b\x80c\x8c>`\xa3O\x9b\x8b\xf4/\
-\x94i\xbb7\xaeL\xef\xbf\xfb\xd6\xf4O\xc7\xce\x18\xe9\
-X\xb5m`K\xad\x1fN\xfe\x99\x8b)\xadX\xa3\x94\
-m\xe6%1s\xcb~F\x12\xc0!\x07s\xecw\x7f\
-\xce\xc6z&Ci\x98z\xf3\xe9#\xef\xdb\x99\x1e\xf9\
-\x89= 2\xc3\xfc\x02\x9c-\x10\xa0\x02,\x0a\xb4\xab\
-\xa0CV\x95\x87\x0c\xbd\xb8\x18\x0f\x128\xf3V\x8f\xd5\
-\xd2\xaf\x7f\xf0\x1e\xadp#\xfd\xfd+\xa7\x15\x8b\xb6!\
-\xd9\xc6\xb9\x00\xf9fD\xe2k\x97S}L\xe7\x92^\
-\xa2F\x95\xeb\x12\xe0\x86\xfcN\xc0m@\x7f2\xee\xf7\
-\xd7\xdb\xd7\x16\xe9\xc3\x0f\xec\xb2\xc3&\x82\x8eU\x8f\xd5\
-\x0b9\x00\x96^\x8c-%\xa3\x0a8H\x09\x196\xa3\
-\x0dT^\xaa~\xf6\xfe\xdd\xe9\xc8\xab?H\x17f\xc8\
-\x16\x8bV,+>\xde\xa2\x88\x17\xd9\xc25\xfb\xde\x80\
-\xbfae$\x01\xd5Ga\x9b(\x96\xa1\xa2\xae\x14\xec\
-v\xae\xa5_<p\xb71oy\x22\x80\xb1\xea\xe8F\
-\xf0\xe1\xb0\x0a>@\x87^\xe8RSb\x9c\x1a\xd0\xd5\
-q\xb6\x00\xc5\x0eD\x9d\x015u\x7f|\xd7\xd6\xf4\xd7\
-\xdf<\x99\xec\xe5]\x99\xe7o\xa4h\x09\xbc\xfe,+\
-E\xd6\xa82\x92\x80x\x1d&\x80\xcc\xadl(-\x15\
-T\xa1\xdb\xde\x1d[\xd6Z\x80|\xc1)t\x1a\x13l\
-d\x00s\xaa\x17`(\xa3dU\xd0\xa1\x83\xacz\x85\
-\x1c\x12h\xf7\xf4\xba\xdciw\xd3\xc6U\x13Z\x14\xe9\
-*J\xdb\xae\xb1\x05,jI\xd4\xbf^\x19I\x00\xa9\
-\x04}L\xb7S\xd4\x16\x88=\xacU\xd1m\xe8\x1d\xba\
-\xe7w\xf2C\x09\x81\xe2(\x9c\x05 \x02\xa5\x04\x10\xda\
-\x01$\xea\xd8.\xd1\xa7\x8e\x95\x0fY\xcc\x8f1\xc6;\
-\xf29\xdf\xee\xa4\xf1\xa6\xc8WL\xb5\x9a\xde e\xdf\
-\x0eo\xde\x12y\x16p\xf7\xb8\x1dYF\x13\x809Y\
-\xc0\xa9\x91H\x97}\xa5\x87\x0dH8s\xfej\xbam\
-\xfd\x84Vb\x90^AB\x10\x80W\xe6G\xbf\xdaf\
-\xac\x0a,t\xab:\xd5y\xc8c\x0c\x02\xe6\xb4\xfa\xd7\
-:e\xba<sM\xa8\x05\x96$\xb3\xef>Z2\xfa\
-\xea\xda\x82\xd0\xb5e\xc4\xc3\xf22\x9a\x00K\xdb\x9c\xfe\
-\xc6$\x0c\x90\x96\xaad\xe7\xd9\x97_M\x9b\x1e|w\
-\xaak\x15\xfc\xffY\xc8\x0e5\x16\xc1.\xad\x87\x01\x0a\
-P\xd4\x94\xa5s\x90\x05Q\xd1\x9e\x9do\xa7\xcbs\xbd\
-\xb4\xa0{\xdf\xf1S\x17\xb40d\x1f@\xfd. #\
-\xea\x0f\xda6\xc8\xe4!e$\x01\xfe \xa4\x19\x19<\
-\x95\xa7\x97^\x80\xf4]\xee3\x87\xbf\x95\x0e\xec\xde\x91\
-6L5E\x82>s\xe9p\xe4V\x04\xeb\x01b\x18\
-`d\x04\x88\xbd\x00\x1fq\xc5<\xfaK\xdb\xc8\xf8^\
-\xc8\xca_Y\xd0\xca\xcf\x97\xe9\xfb\x97f\xd3\xf3\xdf9\
-\xabg\xf1q\x05\xa7\xe5\x17fh\xb0\x05\x87\x91>\x11\
-\xc8\x87\x97\x91\x04\xc4\x83\x90MS\xb4\x9eT\xb2I\xfc\
-:mg\xe6Rz\xea\xf3\x87\xd3c?\xf7Sz8\
-\x91g\xa5c\xa1\x7fy\xea\xf2-\xcf|\x93\xfa\x9e\xb6\
-\x01\xc6\xc0\xcb }J\xc8\x09\xb4/\xb3\x91\x81\x8eu\
-eO\xa6\xf4\xf4W\xa6km]\xba\xeb\x91\xfe\x9f\xff\
-\xc61\xffH\xca\x87R\xf6\xbc\xa2\xc4\xb7-\x02=\xeb\
-x?\x9b]V\x8d\x22@\x11\xe9\x06\x07\x83\x95\x80\xdc\
-\xb8\x82\xeb\xe9\x90i\xb4\xd2\x0b\xa7\xaf\xa6\xdf\xfa\xd4\x17\
-\xd2\xa3\x87\xeeO\xb7n\xdd\x90\xe6\xe6\xf4\xbf\xee(-\
-\xf9\xd6\xd7\x03d\x05\x18\x142\xe6\x856\x9b\x96~\xc8\
-\xf2\xd0\x90\xca\xc8\x91sh\xeb\xe9\xd3\xdb\xb7O\xfd \
-\xfd\x95>\x88\xcc*\x8e\xba\x1erx\xee\xf7m\xc0\x87\
-7\x8a\xdb4B\x94\x16\x9eo6\xb0\xecg\x14\x01l\
-<c3H0\x93,\x83\xc5\xac\x9fz#\xd5[\xad\
-tN/%\x8f\xff\xc5\xb3i\xd3D-m\xdf\xb06\
-\x8d\x8f\xf9\x17[\xf0\xe7h\x96\x04\x00\x10\x0f3\x02]\
-\x14\x95\xc7\xbeH\xe4\x9dZ\x9a\xd3\xdd\xe7\xc4\xb9\x8b\xe9\
-\xf2\xacR\xa0\xd9J\xb5\xa6\x9e\xf5u\x0b6\x02\x08\xcc\
-\xfe\xe2\xc8\xa3\x132\xb16\xa2\x8c&\xa0\xd4Q[\xd6\
-\xf4\x0d'\xcf\x05\x91\xec\xf5\xdf\xb1\xf9._o\xe9Q\
-[\x0c\xeb\xc0yMw\x83\xef\x7f\xe7\x8c}\xce\xb6\x19\
-8\xd7\x04~\xadX_-\xd5\x96\x9aYlA\x9am\
-t=`w\x84\xae\xa9\xab\xc1\x81\xa6\x8a\x10x\xb6\xd7\
-g1\xa5\xa0\xa6r\xc5\xdew\x83\xe6\xcf|1\xc7\xb7\
-\x81\xcc\x93nC\xcbH\x02\xca^g^'\xe9\x04\xb3\
-<\x0br\x04\x86N\xf6\x08\x8e\xf4\xd2\xfe\xab5\x95\x86\
-Z\x89VcsjO_\xd2\x1b\xd9\x82\xc6\xf2:\x07\
-`j\x8cq:S\xa9/\x0e\x891\xcb\xcc \x1d\xe3\
-$\xf4\xac\x03\xd9\x1a\xe6\x1b\x846\xbbT\xe4\x93\xefc\
-:{\xb8\xdfS\xec\xd47\x86\xe8c\x03\xffjCZ\
-\xad\xe4\xff\x13\x1aZF\x11 \xce\xba3:\xd6\x8d\x00\
-\xc0\xc4~vw\x99\x14u\xdc\xb1\xde\x12\xf5i\x88\x7f\
-\xadi\xae\xd9\x94:\xb3\x97\xf5\x222mw\x05)\xa0\
-\xe4\xce\x09\x9e\x92I\xb0\xb6\x00xF@\x90\xc63 \
-\x9bC\xf0\xeastp\x87QObl\xf0b\x0e\xf9\
-\xb0Ga\x8c\xb6\xe4\xd2s\xa9\xf4l\x8a~\xba\xc2\xe2\
-\x0a\xaa\x16\x97a\x040\xbf\xd4'\xaes\xfa\xd0\xbf\xc1\
-\x80K\x80as\xa3|\x0a<x\xb0uf\x8cT4\
-=}\x1e\x9f\xd2crC\xff\xb01{\x85\x89.7\
-\xf0j\x9b\x1d_\x1d\x03\x0e \x931f\x16\x9c\x04E\
-a\xef\xf9\x92\xd9\xca\xdbX\xf8\xe0`\xcb\xbaL2\x1f\
-\xc4@\xe0\xd4\xd6\xe8\xd7\xfa\x8cvN\xda\x8e\xcb\xe6\x0d\
-~\xa0\xb3Z\xdc.G\xe0\xc2\x826\xb4\x17\xb3'\xe0\
-\xb6\x15\xd4\xb1-\xab!;\x9dU\xfbxV& Y\
-)\xc6W\xa6\xc6\xd4:\x81aUp#y\xffr\x19\
-\xa4A\xab\xad\xa6\x11\x01\x19\xbalo\x08,\x86m\x0e\
-2\xc0\xab\x8f,*\xdb\x0e\x12K\xe0b\xfc\xe4\xb8l\
-\xae\x85\xa2\xe7\xb46X\xe2\x1c\x08\x8c\xa6\xeb3\xac\xd9\
-\xffA\xa1\xd7\x9b\x9b~\xc9\x00\xca\x10\x80\xa3\x04h\xeb\
-\xe7\x01\xaaE\xf2\xec\xbc\xa6\x07\x94\xe6\xe4:a\xe2\xa4\
-\xf6\xa8\xf5\xabxu\xfb2\xc0.3\xbc\x88CGc\
-fB?F\x1ej\xb1\xd7\x05\xd6\xdd\x9a%f\xd9\x1f\
-\xe9\xcf\x9f\x11\x1a[MqaGX^\x94\x22\xef\xcc\
-\x15$\xea\xa9\x8c\x22\xa0\xb3p\xe6?\x9eEa\x110\
-\x04\xb9\xdcX\x9e}\xe9\xd4.\xb4%\x00m!g\xe0\
-\xdc\xb7A\x02h\xfec\xef\x1b0\xfd@\x08\x22\x93\xa3\
-\xa7\x96\xa56:\xf4\x90!V\xf1\xa7O\xd9\x16\x12t\
-ln\xc0\xc4\xb6\x06\xe6\xce\x1c;,\xd5\xb7F\xc0\xc5\
-\xe7>\xfbJo~\xe6\x88y\xe1\x87\xc0\x880j\x8b\
-K?\xb9O\x97qb\xa3\xd6\xdf\xa0(\xd5\xebd\x82\
-\x1e\x9e(\x0eZ\x0dKa\x96\x8dI6  \x10E\
-\x1f\x8b\x5c\x0c\xdb\xd2\x9aNd\x09kG\xdb\x88d\xb2\
-\xf4}\x86~i\x901\x1a\xef\xce\xcf\xfc\xdb\xc5\xc3\xcf\
-\xbc\x22\x09om\xd5\xa8\xd4\xc5\xca\xf2\x82\x12_\x1e\xae\
-\xcd\xbd\xfa\xc2\x93\xfa\x1c\xa6\x7f\x7f\x90\x88 )\xaa\xcd\
-1>\xab(\xf3pUd\xfaY\xc0\x9c\xfa\xf8*\xfd\
-\x0f\xe6N\x02\xcf\x0e\x1e\xb2ia\xd8\xecR\x87\x0fo\
-\xfa\x81\x87yV\x981*\xbb,|\xacH\xc7d\xfc\
-PT{|\x9d\x99\xff\xfc\xe6\x93\x12\xe8\xc1}x\x06\
-\xf8\xb1\xca\x9c!\xe5\xda\x7f\x1d\xbd\xb8b\xe7=\xf5b\
-r\xcd\x01c~\x88\x8e-\xb5\x91\x03o\x04\xe0\xab\xef\
-\xfaN\x9cg\x06\xe9\xab>_j\xa5\xc6\xbbF\xeck\
-\xcc\xda\x89o\xf3\xd5\x86d\xdb\xc7A\x0a2_qS\
-\xc9\xe4\xf9|\x8c\xe9\x0f\xf7\x10\x92W\x1e\x1b\x0b\xaf\x9d\
-\xfc\xb3\xd7\xbf\xfcG_\xd0\xc0U]\x0b\xba\xe2 T\
-\xd3\xcbu\x09\x90J9s\xec\xab\xc7\xa6\xde\xfd\xbe=\
-:\xd0n\x8fI\xd5\xda`\x1b\x01\x02\x08(\x82\xb1>\
-Z.\x0b}\x0d\x99\xcc>W\x13\xb5\xbd\xc4K+\x83\
-\xb5Q3\x90S\xde\xda\x15{\x01.\xaf8+o*\
-\x04\xc1\x18\x97\x07\x94\xca\xd9K\xffx\xe6\x99\xc7>\xa1\
-\x917t\xe9\xa3\x81e\x80\xaa\xc5\xe5F\x04\xc0X9\
-\xfd\xd2W\x0e\x8f\xef\xb8\xbbW\x9f\x5c\xbd\x9fp\x01\x18\
-\xe9\xbf\xb8-e[\x89\xc5N\x08rP\x5c\xc1\xb6\x00\
-w\x07\x8f\x18\x94N\x1c\xb6\xa5\xcc]\x22\xa6\x19A\xea\
-WuH\xfc>\xd180e\xfb\xe9,\x9c{\xf5\xe9\
-3\xcf|\xf4\x09\x99\xd1\xb7\xf14\xadk\xe8\xfe\x97\xdc\
-\xbe\xa1P\x0f+\xc4\xc1\xc5\xe9\xd9\x9d=\xfe\xdcK\xc5\
-\xf8\xc4\x0b\xc5\xeaM;\xeb\xcd\xb1-}\xe7\x1a\x0c\x80\
-U\x99\xc4\x95R\xdd\x16\x0e\xcb\x88#jH\xe8g\x02\
-c\x00s\xf08\xef\x1f\x80\x10\xa4\xff\xd8\xeb\xbe\xf2\xae\
-k\xceYy\xb2b~\xe6\xe8\x95\x7f?\xfc\xb1\xf3\x7f\
-\xf7\xf4\x97$\x00<\xa9\x0f\xf8e\xa9/\x99\x15f\xde\
-\xa8\x88z\xfb\x7f\x1fV\xa8\x9e\xd2\xb5rj\xdf\xa1\xbb\
-V\xec\xd8\xfb\x93\xf5\xc9\xb5wjkl\xd6[\xd9\x06\
-\xbd\x98L*9\xf8W\x88!YeP\x96e\x8d\x91\
-\xc0\xb6\x11\xcf|m\x86n\xdb\xd7\xae.W\xa0\xf54\
-G\xcb\xc6z\xfa\xdfN\x92>\xf3\xf6z\xb3z]y\
-\xbd\xec\xcc\x9d\xedN\xbfql\xf6\xc4\x8b_\xbbr\xe4\
-o8\xed\x01\xcd\xc5\xe3o\x80\xc7\xe2\xd0\xf2f\x08`\
-\x22$\x00L'X\x82\x08\xde\x11 \x83Z\x9fcL\
-\xcec5zo\xd6\xa6To\xaa\x00\x86\x8b\xcc\xe4n\
-\xc5\x8b\xce\xac.\x00\x93\xee\xb49\xf0\x18\x1b\xb9\xf2\x1a\
-\xb32\xec] \xc6\xaa\xb5\x9d\x05\x12\x84S\x1cpq\
-{\xf9\xff@\x00\x87\x1c\x04P\xdfp\xd5\xa5\xd3/7\
-\xb3Z\x91\x0d\x90GFP\x93\x1d\xd8\x8aK\xcd\xff\xd5\
-\x12Y\xc0\xc2\xb0\xd2\x80\xe6\xa2\x1dcj\xde\xb8\xdc\x0c\
-\x01X\x0d\xa0\x90A\x89\xbe\xf7\xfeo~\x01J\x09\xc0\
-\x91\xee!\xf7\xd1\x1b\xfc\xde,\x01K\xcd\xfeO\xd9Y\
-j\xf7F\xfd\xb7\x04\xf6F\xc6~(\xc7\xff\x1b\x13u\
-\xc6m\x8e\xbf\x8c\x1d\x00\x00\x00\x00IEND\xaeB\
-`\x82ic14\x00\x02\xb1\x0c\x89PNG\x0d\x0a\
-\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x02\x00\x00\x00\
-\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\x00\x00\x00\x01s\
-RGB\x00\xae\xce\x1c\xe9\x00\x00\x00DeXIf\
-MM\x00*\x00\x00\x00\x08\x00\x01\x87i\x00\x04\x00\x00\
-\x00\x01\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x03\xa0\x01\x00\x03\
-\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\x00\x00\x00\x01\
-\x00\x00\x02\x00\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x02\x00\
-\x00\x00\x00\x00\x0b\xf8\xb5\x85\x00\x00@\x00IDAT\
-x\x01\xec\xbd\x0b\xb0\xe5\xd9u\xd6w\xfb\xde\x9eG\xcf\
-K3\xd2\x8cf4B\x15l)~`\x82\x0d\xc16\
-\x0f\xc7\x0fL\xb0M@8P\xd8\x18\x8218J0\
-\xd8!\xc6U\x0e/\x8bD\x04\x97\x02\x89I\x0aC\x81\
-\x03\xe6\x11\x9e\xe52\xaf\x0a$\x80\x13\xc0\x86Jp \
-\xa4H %\xc0\xb8*`I\xc6\xc2\x0f\xc9\xb6\xa4\xd1\
-Lw\xbe\xdf\xf7\xad\xb5\xf7\xfe\x9fsnw\xcfH#\
-Mw\xff\xf7\xeds\xf6\xdek\xad\xef[\xdfZ{\xff\
-\xcf\xb9\xd3\x92Fgg\xfb\xd8;\xb0w`\xef\xc0\xde\
-\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\
-\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\
-\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\
-\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w\
-`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0\
-w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\
-\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8\
-;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\
-\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\
-\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\
-\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\
-\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\
-\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\
-\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03\
-{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\
-\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\
-\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\
-\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\
-\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\
-\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\
-\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w\
-`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0\
-w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\
-\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8\
-;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\
-\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\
-\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\
-\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\
-\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\
-\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\
-\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03\
-{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\
-\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\
-\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\xde\
-\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\xc0\
-\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\xef\
-\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w`\
-\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0w\
-`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\xb0\
-w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8;\
-\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\xd8\
-;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\x1d\
-\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\xec\
-\x1d\xd8;\xb0w`\xef\xc0\xde\x81\xbd\x03{\x07\xf6\x0e\
-\xec\x1d\xd8;\xb0w`\xef\xc0\xde\x81\x8fq\x07\xae|\
-\x8c\xf3\xef\xe9\xef\xee\x0e\xec\xf7\xeb\xee>\xdf\xbd\xba\x8f\
-N\x07n|t\xd2\xecY\xee\xb5\x0e\xec\x1f\xd0\xf7\xda\
-\x89\xbf\xb8z\xf7\xfb\xf1\xe2\xfa\xb5G\xef\x1dx\xa5v\
-`\xff%\xe2\x95z2\x1fC]\xfb\x07\xfc\xc7\xb0\xf9\
-\x1f\xe3\xd4\x1f\xe9\xb3\xffH\xf3}\x8c\xdb\xb3\xa7\xdf;\
-\xf0\x8a\xee\xc0G\xfa\x0b\xfd#\xcd\xf7\x8an\xde..\
-\x1d\xd8?\xb4\xef\xfe\x9b\xf0R\xce\xf8\xa3\x85\xb9\xfb\xbb\
-\xbfW\xb8w\xe0\xe5\xe9\xc0K\xfd\xc2~\xb1\xb8\x17\x1b\
-\xff\xf2T\xbb\xb3\xbe,\x1dx)\x1f\xf4/\x8b\x90\x9d\
-\xf4#\xd6\x81\xdb9\xd3[\xc5|\xb8\xfe[\x15s+\
-\xfe[\xe1w\xff\xde\x81\xbb\xb5\x03\x1f\xce\x17\xee\xed`\
-o\x16s3\xdf\xda\xef\xdb\x8d[1\xfb\xfa\x15\xd8\x81\
-\xfd\x83\xf8\x15x(/R\xd2\xad\xce\xf0\x94\xffvm\
-H9\x15{3\xfb)\xf9\x97q\x9c\x8a\xddm\x97\xf7\
-\xfcN\xef\xcd\xfe\xc5\xf1\xe2O\xf0v{v\xb3\xb8S\
-\xbe\xdb\xb5\xa1\xf8TlWr3_\xc7\xec\xf3+\xb4\
-\x03\xfb\x07\xf3+\xf4`n!\xeb\xb2s;e?\xb4\
-\xad\xfbuM\xca[\xedO\xc5\xb4\xd4Cl\xdb\x0f\xe7\
-\xdb\x8d;\xc4\xdd\xad\xfb{\xbd\x1f\xfb\x17\xc8\xf1\xcd\xbe\
-\xdd\x9e\x5c\x16wh\xffp\xf6\x87X\xd4\x9e\xb2u\x15\
-7\xf3u\xcc>\xbfB:p\xaf\x7f\xf8\xbcB\x8e\xe1\
-\xb6d\x5cvV\x87\xf6u\x7fj}\xca\x86\x80[\xda\
-\x1f\xfb\x99\xbf\xf4\xc1\xfb\x7f\xe6\x97=y\xffc\xcf<\
-y\xfd\xbeG^u~\xdf\xf9\xe3W.\xee\x7f\xec\xca\
-\xf9\xf9\xabn\x9c_}\xec\xca\xd9\x95\xc7\xce\xae\x5cy\
-\xf8\xec\xca\xc5\xb5\xb3+\xd7\x1f\xbarv\xfe\x90\xf6\xd7\
-\xc4\xcd|\xbf>\x19\xee\xd3G\xc7\xfdJt\xdf\xd9\xf9\
-\xf9}7\xbc\xbeq\x9f|\xe7z]\x91\xef\xfc\xc6\xd9\
-\x0d-\xae0\x9f3\xbb3(S0\x12e\xd7{\xa4\
-f\x8d\xb9\xa4+\xa4\xfd=\x7f\xec\xf1\x12\x85>\xeb\xcf\
-'g\xa9\x95\xd6m\xd3\xd1zCqi\xc5\xb1o\xf5\
-\xcf5\xab\xc9H\x1av\xe6\x1e\x8b2x:\xec_c\
-\xe5\x1c\xfe\xd6yL`\xfe\x82\xb4\xd6 \xf3\xde\xb65\
-\xce\x9e2\xd8\x8fA\x1c\xadu\x91?zr\xaa7\xc0\
-\xd6sM\xae\x22c\xd2h\xdb\xa5x\xfa\xb3\xea'y\
-\xed\x07^\x86\x99\xa7\x00\x88\x85_\xaf\x0e?\xaa\x11\xbf\
-\x8c'\xce\xef\xba<z]\xb9.?\x17\x5ckBo\
-\x5c\xd7\xfaC\xba\xea\xcf\x9d\x9d]\xff\x90L\x1f\xba~\
-\xfd\xec9]z\xd9n<\xa7D?.\xd8\xfb\x99o\
-\x5c\xbf\xf1\xe3\x8ay\xff\xf5\xeb7~L\xf0\xf7^y\
-\xe1\xfa{o\x5c\x7f\xfeGn\xdcx\xfe\xbd\xd7\x9f{\
-\xe1\x87\xcf\x9f\xfb\xf1\x1fy\xee\x87\xdf\xf5\x9e\xe7\xfe\xcf\
-o\x7f\xcf{\xff\xb7o\xfb\x80\xf8\xd7\x11\xf1\xb1\x9cZ\
-\x9f\xb2\x11};\xf6\xc3\xb8d\xc9\xfb\x8a_\xed\xfb\xfa\
-\x15\xd2\x81\xbe\xcb\xaf\x109\xbb\x8c\x83\x0e\x9c:\x9fC\
-\xdb\xba\xef\xf5\xed\xce\xa4s\xec\xd3_\xfd\xc7\x9f>{\
-\xfaS>\xee\xea\xb5\x07\xdepv\xf5\xa1\xd7\xeb\xbb\xf7\
-\xf5W\xce/\x9e\xd5\x97\xf9\xb3\xfa@{\xea\xfa\xf9\x95\
-'\xf5\xc5\xfb\xa8?\xdc\xea\xc3\x90/b>(C\xd2\
-\x1f\x9a0&\xbd>\xe0\xca7?I\xee^|jt\
-\xe5\xd4\xaf\xd2go\xb4\xa6\x152\xe3OWN\xac\xeb\
-\xcb\xc3M#\xae\xfb\x07]\x816\xfd[\xed\xc5\x0b\x7f\
-N\xb41\xf9\xc2\x9fZ\x8e\xcf\xac!%\xb1\x08\x0a!\
-\xa3\xcbA\x80\x16C\x7fi\x9d\x1a\xc5\x8b\xcdd~\x9f\
-\xfae+\xf9\xfer\xa4\x98\xce5\xec\x15\x13$$`\
-\xe4\xd5\x9fQ\xb3\x9c\xad\xa0\xe4\x98'1\xa9\xb7\xae^\
-\xf0&_\xeb\x17\x9a\x04\xa6]\xed\xe1%\x9f\xf3\xbb\xe0\
-\xca\xafpC\xe0r~S\xa7V\xc59\xc5\x88\x11~\
-\x110{\x13m \xed\xef\xfa\xc5G\x1d\xb6\xeb\xadR\
-$!\xfbr\x1e>gD&v=\xcb\x89\x17\xee}\
-\xf2\xbc\xe7\xc6\x0b\xd7\x7f@\xd6w\xdex\xe1\xf9w\x9e\
-]\x7f\xee\xfb\xce\x9e\x7f\xfe\xfb\xce\x9e\xfb\xf1\x7f\xf1\xfc\
-\xbf\xfc\xc7\xdf\xfb\xfd\x7f\xe8-\xff\xaaR\x92\xbe\xcb\xb8\
-\xdd\xf9\x14\x06\x1b\xa39\xb2\x9b\xef\x97\xd9g\xc4\xbe\xfa\
-\xa8w\xc0\xf7\xfd\xa3\x9euOx\xb3\x0e\x9c:\x93C\
-[\xefo6\x1f\xfb>\xfe\xe7\xde\xf7\xba/\xfb\xad\xff\
-\xe6\xf9\x13\xcf|\xca\x8d\xab\xd7>\xe5\xe2\xbe\xfb>\xe1\
-\xec\xec\xfc\x8d\xfaG\x92\x8f\xd3'\xd3\xc3\xeb\x07\x0d\x02\
-{\x9f\x0f-\x9e\xec\xf9\x01\xe9\x0f\xfb\xa3\x0f\xca\xf9\x81\
-to\xe2\x97O?}x\xfb\x8b\xcb}\xa4\x1b\xdd\xbf\
-\x1c\x0b\x9f\x86}@\xe3\x83\x9e/\x94\xfeF\xc0\xaf\x00\
-\xb6\xf9RQ\xf7YC4\xecZ\xcb\x96\xaf\x03\xcc\xf4\
-\x9f\x91w\xf6Y\x1b\xe5\xb8\xacrN\xed\xef\x94u\x9c\
-\x05\xaf/3\xa8\x02\xb2\xb6hQ\x88@\xeb\x9a\xac\xad\
-\x975\xa3`YX\xe7\xb4-\xb4\x07\xfa+\x10<\x84\
-\xae%sz\x013\xf9\xf1\xcf5q\xc4\xa7\x16\xd8\x0b\
-\xbf$\xb2\xe6x\xd2\x8b\x12\x9c\xe8h\xeb5D]\x9f\
-!z\xdb\xd4L\xbe\xaa\xb0\xcf,\xf9\x07C\xf4m\xf2\
-'\x07\xb0\xa1_\xfe\xed\xf9-x\xf3O\x82\xf1\xfc\xc9\
-\x9e\xf5\xec\x0b\x1a\xab\x9c\x92{\x0b\xfd\xd7\xaf\xf37\x09\
-\xdf{v\xfd\xfa\xf7\xbc\xf0\xc2s\xff\xe4\xcas\x1f\xfc\
-G\xd7\x7f\xec\x07\xfe\xd1\xbb\xfe\xf4\xef\xfa\xa7g\xff\xfc\
-;\xf4\xb7\x11\x1e$oA\xeb\xbc\xae\x09\xec\xfd\xcd\xd6\
-\xf8\x18kl,\xfb\xfb\xc7\xac\x03\xf5\x08}\xcc\xf2\xef\
-\x89g\x07N\x9d\xc5j\xeb\xf5\xa9y\xb5\xb1\xber\xf6\
-\xd4\xa7\x9c?\xf3k\x7f\xdf'_<\xfe\xfa\x9f~v\
-\xff\x03\x9f~\xe5\xfc\xeaO\xd7?\xd1\x7f\xa2\x9e\xbe\xfb\
-I\x99/\x8b\xfa\x10\x03\xe1ON-\x96\xf5\xe1\x07S\
-cv|\xb5\xc9}\xa4\x1b\xa7\x87\xfb\xa7\x86\xf7\x17C\
-\xcfD\xf7:_bj\xba\xbf\x11\x8a\xa7>\x22\xfb\x93\
-\xd2G\x02F\xaf\xd8rn\xf3K\x00\x1c\x1e\x22\x18\x1d\
-\x95\x9dq2\xf9\x0b\xa2\xdc\xfde\x91\xfc\x89\x1b\xefE\
-u\xf8\xc5\xd6\x9a\x89k-\xce\xd8d\xabC\xeb\xa8\xe8\
-\xd8\xa9\x19\x87\xb9\xb4\x88\xe2f\xdb\x12\xf8J\x92Kn\
-\xb7\xa7f\x98[\x8b\xbf\x84\x8f\xe0)`\xde\xdfh9\
-\x0a\x83\x9b\x94\x97\x8c\x9b\x9f\xdf\xd4d\x96[\x9e\xdfR\
-\xbf\xf2\xf5\xb3d\xfd\xce_M\x1f\xebhfk\xdd\xee\
-Y\xd9\x94+\xf5\xcbw\xaa\x80j\xd6\xed\x9f\x9f\x92\x90\
->\xe3\xb9\xb3\x1b/\xbc\xe3\xfa\x0b\xcf\xff\xbd\xb3\xe7\xde\
-\xff\x7f\xbc\xf0\x83\xef\xfa\xfb\xef\xfe\xd6\xdf\xf0\xff\x9e\xbd\
-\xe7\x1d/\xc8MTG\x1e\xaeA\xaf\xb6\xde33\x1a\
-\x97\xdd\xf1\xbe\xed\xfb\xfcQ\xec\xc0\xa9\xeb\xf3QL\xbf\
-\xa7R\x07\x0e\xcf`\xdd\xf7z\x9d\x0f\xd7\xecm{\xfa\
-\x1b\xbe\xeb\xdf\xbax\xf5\xd3\x9fs~\xf5\x91\xcf>\xbb\
-z\xfeY\xfapyU\x7fz\xf2\xf4\xcd\x0fK\xed\xea\
-S\xb5\x9fJ\x08\xe6\xba\xff\x09\x03\x90<\xfa@\xd9\xf1\
-\xd5d\xb5d\x1d\xfe\x90U\x8f\xdc\xbf\xfa\x12`\x87\x9d\
-\x0f\xe9\x0c\xf5\xafZn\x96\xdeh\x9e=\xa7\xff\xa3\xcb\
-^\xcf\xf3\x8a/Y`L\x9c\xad\xb5L~\xb9\xb4\xe8\
-\xf5H\xbf @\xafc|I\xa0\xd9\xbc\xc2\x0bh\xfd\
-\x04BR:\xe1\xed=K\xc6\xa1f\xb2'\xffA\xfd\
-\x8a\xbdT?\xbe\xa4\x81\xb2\xd6\xf9\xc2\x0c\xd9\xac\xb8\xf7\
-\x95\xa4\x14\xc3\x9d\x18\xe3km\xbd\xe5\xe9\x8e\xe1_\xc7\
-\xcd\xcf\x8f\xc80\xf7\x91y\xef\x8d\x5c\x22\x85\x97QQ\
-^\xa5\x96C\xfd\xb5wt\xabQ\xf7ji\xfc\xc1\x1a\
-\x9e\x1e3\x7f[4+~\x9cY\xb6v\xde\xfc\xfc\x96\
-@/\x93t\xea\xa7\x96\xc3\xfb{\xfdG\xae\xbf\xf0\xc2\
-\xdf\xbe\xf2\xa1\x0f|\xe7\x87\xde\xf3\xae\xef\xfc\xfe\xdf\xf5\
-\xef\xfe\xdf\xc5\x02\xb8_Z\xdet\x8d\x9fA\xfc\xe18\
-e;\x8c\xd9\xf7/C\x07\x96+\xf62\xb0\xef\x947\
-\xeb\xc0a\xef\xd7}\xaf\x99\x0f\xd7m\xbbr\xf6\xe4'\
-^<\xfb\xb5\x7f\xe2g\x9c?\xf2\xd4/:\xbb\xef\x81\
-7\xeb\x9f\xf0\xdf\x90\x0fn\x85\xe8\x8f\xd7\xfa\x14Y\xe7\
-\x16\xe4\x87\x5c\xcf\xa2\xbf\xa4\xf4\xf8\xf1A2?8\xee\
-!\xbc\xdb;\xbf\xc6\xdc\x87j\x12\x9fJ4{\xf4\x0f\
-\xbb?\xb1e_\xfa\x1a\xf3\xd2?@B\x06\x17H\xbe\
-\x14\xb0g\x98WK\x7f\xc8\xdf\xac\xff\xf0p65k\
-iQ\xd1Ux\x99\xa6\xd6\xc5&\xad\xabN\xf4\xf4X\
-\xed\xd8F\x8d`0t}\xf8\xd8\xd6\xdc\xbb\xec\xa3K\
-.\xc5\x94F\xe7\xc4\xd2\xf5/3L%\xa1\xfb\xe1\xfa\
-\xc1\xcb\x1e[q*\xc1FS\xe9\x81\x99\xd1z\xf2K\
-\xc5G\xf3\xfc\xd2\x8dQ\xbfEW\xfd\xa51\x9a\xca\xb6\
-\xf6\xa1\xeb\x17\xd8\xf8\xaa\x99z6\xf5\xc3i\x9bz\xd1\
-\x9c5\xdb\xa1\xb7\xd5\xeeL\xe6\xaa^\x13$\x0asj\
-9\xce\x06{\x1d@\xdf\xa7\xd3Z\x89[\xce\xcdg\xaa\
-}\xeb\xbf~\xfd_\x9c\xbd\xf0\xc1\xbft\xfd\xbd\xff\xfa\
-/\xbe\xf3\xf7\x7f\xe5\xff~\xf0\xb7\x034\x88\xc1\xdc\xaf\
-\xde\x9f\x9a\xb1\xf5hl\xef\xf7\xf9e\xee@n\xda\xcb\
-\x9cd\xa7\xdft\xe0\xb0\xe7\xbd?5c\xdb\xbc\x1e\xff\
-\xb4/\xbe\xff\xa1/y\xebg\x9f?\xfa\xd4\x9bo\x5c\
-\xbd\xef\x17\x9c\x9f\x9d?\xdd\x0f\xb8\xb3(\xba?\xe8\xd7\
-\x87|\x8d\xf1\xba?Xx\xd0\xf5\xd3\x1f\x04d\xbb{\
-\xf19\x07>efo\xf2)E\x93{\xf4\xa7\x10\xb6\
-\xc4\xa6'|\xe82\xb6_L\xec\xc5\xb7\x10\xb0g`\
-\x9b\x1f\xc29H\xec\xe6\xb4\xaf\xbe4\xd7\xfe\xdb\x1f\x02\
-(\x1d\xcb\xacE\xe7\x186\xd9\x1d#gk\x93\xc9\xfa\
-\x98\xd7/\x09k\x8e\xd1\xfe\xe1#\x9eX|5\xd83\
-6\xf9\x17\x8d}_2\xb7\xb6\x19=\xee\xcf4m\xf5\
-W-\xb37\xa5\xbf\x84\x0c\xfc\xa2\xa0s\xa1\xab\xf5\x1e\
-\xce\xf8\x18\xc6\xabY\x9b\x9a\x96\x1e\xb9\x17\xf2gn\xfd\
-\xc1\x06\x9f\xf5\x06\x7fX\x7f\x1f\xae\xb2t?\x9a\x81=\
-c\x83\x97\xe9\xf0\xfcF\xfc\xa2\x0d\xdb\xa8\xbfs\xb4V\
-\x9c\x22u\xdf\xdaG|\xccx=\x92\xfd \xff\xa1~\
-\xabKd\xf8\x1a\x1d~v\xd6[\xe4k\xccX\xe3\xbb\
-q\xe3\xfbo<\xff\xfe\xbf|\xfd\xfd?\xf2\x17\xdf\xf9\
-G\xbe\xe1o\xd5\x7f\x7f\xc0\x1e\xbc\xcbK\xcb\xb1\xef\xf5\
-:\xb3\xee\x01n\x1f\x1f\x85\x0e\xacw\xf4\xa3\x90\xee\x9e\
-Nq\xd8\xeb\xde\xaf\xf3\xe1\x9a=\xaf\xf3\xd7|\xf5\x9f\
-z\xc3\xb5O\xf8Y\xbf\xe6\xc6\xd5\x07\x7f\xd5\xf9\x95\xf3\
-\xd7\x8e\x0f\x99\xfa \xe8'\x86`\xd6&Z>8l\
-\x1b\xfb\xfam\x9e\xb8\xbb\x19\xaf.\xf4\x17G\xf7d\xcc\
-\xf5)\xe6>\xd13\xef\xe9[\x7f1\xc4\xb3\xfd\x92h\
-\x1f\xf1\x02i\x9c\xee_\xfdB%\x0a\xe3\x87\x8e\xd6\x13\
-\x1e\x99\x9d\x8f\x133\x9f\xf7\xe1\xe6X\x18%s\x99\xf3\
-e\x99/\x09\xa9\x1dq\x11\xc4\xb6k\xc4\x99\xfce\x93\
-\xb3\xcat\x0c\xfc\xc6\x0b\x90\xfb\x94/\xcd\xd4\x1c\xe2\xf4\
-o\xab\x1b\xcc\xa6\xfe\xd6_|\x1b\xbc\xb8\xa3i\xeav\
-\x8fK\xc1\xe9\xfe\x05\x83\xbe\xae\xe5h\xae\xc6D%z\
-\x92\xc8\xb9X\xdaQ\xf5k\x9d\xf0\xed\x1e\xfe\x93\xf5+\
-\xab;a\x5c\xd6\xa7\xfa\xf0\xe1\x9f\x1f\xf9I\xc2\x1f*\
-L\xdd\xac\x22\xfff\xe7\x97\xa8\xad~p]\xa3\x19\xcc\
-\xcb\xaa\xa2\xdd'\xa7L\xba\xe4'\xaa\xf7\x8e\xbd\xa4~\
-\x01s\x9f4\x9b\xb1\xf5g'\xdf\xbf\xba\xf2\xdc\x8f\xfd\
-\xf1\xf7\xff\xb3\xbf\xf7\x87\xff\xf5\xb7\xfc\xea\x7fQia\
-\xbe\xec%W\x11\xcd\x19\x1b\xa3\x14e\xb3\xbf\xbf<\x1d\
-\xc8-yy\xb8w\xd6t\xe0\xb0\xc7\xbd_g\xd6\xc7\
-\xaf\xa7\x9e:\x7f\xf67\xfc\xb5\xcf?\x7f\xe2\xe9\xb7\x9c\
-\x9d_|\xa1\x02.\xf8\xc4\xcaC\x08y\x1eD>D\
-\xfa\xc14\x8b\x1e\x9d\xf1\x80b\xd0\x9f\x81\x19\xb1w\x11\
-\xbe\xfb@I5\xfa\xd3\x83\xa62\x5c\xbfj?\x1cm\
-\xa7_\xf9\xfaK\x04vF \xdd_\x0cz-\xe4\x03\
-/\x9b\xd9\xcb\xbf\xe9\xbf!\xf03V\x82P\xb5%~\
-\x07%\x854\xf8\x0bB&\xe7\x01\xeb`\x04d=\xf3\
-\x17?\x82\x85[$:t\xe0C?\xde\xbb\xee\x9e\xdb\
-a\x06j\x22\x9fr%O{\xe7L\x9b*e\xc5\xc6\
-\x97\xf6UO-i\xab\xaf\x19\xaa\x12\xebu\xaarX\
-\xffa\xfd\x11\xd3P\xcf\x9b\xfaK+]M\xfe\x03\xfd\
- \x881\xb9\xe1D\xba\xc7\xa3?\xe5w\xfd\x0e\x8f\xaa\
-Y\xff\x96`\xd4_\xd4a\xd5\xbbr47\xb6\xf0k\
-\xd1\xcd\xc2\xa8\xf5F\x7f\xd9Z|\xf7\x06\xcdC\x1f1\
-\xcbp\x0e\xce\x87:\x5c\x5c;e\x11AZ\xd6y\xda\
-7\xe7\x8e\xe9yxZ?\x9c#\xbf\xbc\xab~m[\
-c\xcf\x85\x7f\xe1\xc6\xf3\xcf\xfd\xd5\xeb?\xfa\x9eoy\
-\xe7\xef\xfdE\xff\xeb\xd9{\xde\xc3\xbf\xf7\xc0\xff\xee\x83\
-\x82\x10\xbe\xbe\x80\xb1g\xf4\x9c\xdd\xf1\xbe\xed\xfb\xfc\x11\
-\xe8\x00\xb7y\x1f/O\x07\x0e{\xdb\xfbuf}\xf4\
-z\xf43\xfe\xfdk\x8f\xfd\xb2\xdf\xfd\x15\xe7\xd7\x1e\xf9\
-*=\xd6o\xf4o\xf5z.zFn\xafC\xd6\x1f\
-\x00\xf3i\xf1\x87\x81\x9c\xfd\xc1\xd1\x1f\x10\xccw\x1e>\
-uQk\x7f:\xf4:\xf5W\x9d|\xa0R\x9c>\xcd\
-6_\x9c\x07\x1f\xb4\xae\xbfm\xde\x18\xb2\xf9l\xe3s\
-\x8e\xe1\x0fFf\xbd:'\xbb\xd9\xff\x04\xa6\xbf\x89\x03\
-\xe7\xfe\x1bGl\xf1h\x01\x1f\x03\xfe\xf5Cw\xfd\x22\
-\x88\xbfx\xa9E\x06\xe7/\xcd\x1b<\x1b\x8d\xad\xbeh\
-\x05x\xf2\xfc\x15<~it\x9a\xf9\x05\xb1\xea\x83%\
-\xba\xa6\xd6\xf8\xd3\xdf\xe6>\xcc\x83\x9e\xed\xfd;\xad\xaf\
-5\x1f\xe9\xa7\xe6:\x80\xb5/\xad\xd9\xfc\xd5\x8b\x92\x9f\
-^\xca\x01'\xa3\xe0\x8b\x9d>\xe69\xb1\xbf\xd6\xc6/\
-\xeb\x81\x0f\x8b\xf8\xaa\xff\xeeY\xfa@\x96\xd6rJg\
-\xf2\x87\xb9{d\x9e\xdb>\xbfh\x85'\xf9\xa3{\xe8\
-\xb7\x96y6\x87\xe7\x94\xfc~\xbf\xbd\xf3;\xc8\x13\xa4\
-\xf4\xebO\xf4\xa3\xc3[\xcf\xf1O\x1b\xfbqND\x94\
->\xdb\xaf\xbf\xf0=\xd7\xdf\xff\xbe?\xf0\xbe\xbf\xf0\xb6\
-?\xf2\xbe\xef\xfe\xf3\xfc\x0b\x8a\xa0\xba\xec\x97\x01Cx\
-\xd3 n\x1d\x87\xfb\xd5\xb7\xaf_b\x07rK_\x22\
-x\x87]\xda\x81\xc3\xbe\xf6\x9e\xf9\xb2\xd7\xf9\xa3\x9f\xfb\
-e\xd7\x1e}\xf3\x7f\xf1\xab/\x1e|\xec7\xea\x7f\x9b\
-\xff\x8cA\xe3\x83\x8e\x1d\x1f\x07\x22\xe0\xd3M\x8b\xe3\x0f\
-\x15\xec\x8e\x88\x0fyw$\xde\xe5\xb9Q\xb4+\x1f\x82\
-\x14\xb3\xda\xe7\x9a\x0f\x1f\xeat\xbf\x126>\xf8\x8c\x1f\
-_(brh\xf52\xb0\xb4L8\xdaJ_\x19L\
-\xcd\xb7]\x9f\xf8p6)\xf1\x93`\x8bY\xb8\xe4p\
-\x1er\x94.\xeb'\x1f\x8e\x08\x8cO6\x82\x13\x07\xa0\
-tU\x9a\xceQ\xb7b\xe8\x05\x96\x9e\xa5\x82\xb9^#\
-\xb5\xb6\x96\xf0\x83i]\xc6\xe3\xb3qH\xaa\xfc\xf9\xf2\
-\x8b\x96\xf9E\x18|\xe9\xd7\xa6\xb5\x99KoQr\xda\
-\x9e\xf3#\x86\xa8 G\xcd\xb2e\x1dn{-\xb4\xf5\
-\x0bA!\xa0\x1b>X\xb4\xf0\xfa\xf8\xcc\xc8S\xa8\xe0\
-\x85\x9d\xf9[E\xe3\x17\xfd\x02u\x9fZW\xf2c\x8f\
-\xc6\xe4,\x8cl\x8e\x0bUr\x96\xce\xe4_\x95T\x90\
-&\xd4E\xcf\xba\x9e\x9am\xb5\x96\x83\xf3+R\x9f-\
-t%\xa9{c^\xeb,\xde\xd2\xe7P\xdb!\xc0W\
-\xfao\xba\x8eF\xd7\xbf\xe9_\x9f\x19L]\xff\xf5w\
-\xbf\xf0\xfe\xf7}\xd3{\xff\xca7\xfe\xd1\x1f\xfd\xaeo\
-\xd3\xbf\xd5\xd0)^\xec/\x02\x11\x07\xed>>\x22\x1d\
-\xe0*\xee\xe3#\xd7\x81\xc3~\xf6\x9ey]\xf3\xaf\xb8\
-m\xdb\xf8\xe2?\x7f\xf0\xd1\xdf\xa8\xff&\xff3\xf9\xc0\
-\xd0\x83\xe3g$\xe2\xf8p9\xb4C\x90\x075\xd4\xfd\
-p\x1f\xc6\xc1\xf0\xca\xc6\xa7\xc6\xfe\xd0Y\xe7x\xd2,\
-\xd7E\x1f0\xea\x13\xce5i\xd9\x8d\x1d~\xfb\x1c\xd2\
-p\x7fh\xf7\x87\xa2\xf1b\xe1\x03\xb6s\x99r\xd8\xda\
-\x97H|\x8em\xde\x04\x87\xd3>\x0c\xc9\x97\xcf\xd0\xd2\
-FB\x0d\x7f\x90K\xe4\xaa/v\xd9\xec\xe7\xad\xce\xb7\
-g\x99:\xfb\xa8o\xe8\xc3y\xa2\xfe\xf6\xb7\x8f\xfc\x02\
-\x07\xdf\xfc\xc5\x8b\xcb\x9a2\x8bq\xa3\xaf\xef\x0bv\xe3\
-\x87.z\x16e\xe1%\x22\x03+6\xa7\x85\xbb\xec\x1d\
-7\xea\xc7\xa3?\xe4X\xa3\x86\xdf\xfa\xc3\x03\x85\xf1\xf0\
-a\xd7Ox\xb3\xae\x14\x9e|\xff\xed\xef\xb8D&\xff\
-\xe9\xfa7xk\xaa<U/\xfe\x9b\x9d\xdf\xc0w\x7f\
-\xac\xb3\xfaP\xce\xe4\xa7\xd2\xd6%\x87klO\x02\xb7\
-\xf5G/\x1e\xb7\x89\xba\xaa/4\xa0\x9fu\xd6ry\
-\x5c\x8a\xc7\xdb\xfa\x12\xba\xc2\xca\x02g\xe9.m\xf0\xc1\
-\xed\xfa\xe5k~g\xc7\xb5\x91\xdf\xfaz&>\xd4\x0e\
-\xd3\x9b\xf1\xd7o\xbc\xfb\x85\x0f\xfc\xc8\xefy\xef\xff\xf4\
-\xf6?r\x1b\xbf\x08\x14\x83\xa5\x0d\x9dHY7\xfb\xfa\
-\xa5w`s\x84/\x9dfG\xaa\x03k/{\xbd\xce\
-\xacy\xf5\x97\xff\xf9\xd9\x93O\x9e?\xfb\xf5\xdf\xf9\xe5\
-\x17\x8f\xbe\xfa\xb7\xc9\xfc\xcc\xe6\x83\x95\xa7\x8bk\x0eB\
-\xf3\xf4\xc9\x80\x8b\x87T?\xeb\x07\xc1\x8c\x01\xf7J\xc0\
-Kx\xe9\xd8hk\xdd)\x8dr<\xfa\xa9\xee}\x99\
-\xe3\xabO\x93|iT\xfd\xe2>\xfcP\x22\xd8x\xde\
-6\xfd3\xcd\xf0\xdd\xb2\x7f\x8e\x9c\x04N/\xce\xd6\xc6\
-\xde\xa5\xd5\x0c{$\xd6\x17S\x07&\xadu\xb2\xdc\xe8\
-\x07\xd36\x81Y3\x0c\xe5\xad\x0d^f3>\x8c\xe5\
-\xf4\xf9\x0b\xd7_\xa4\x8e\xd0\x1b\xba\xc22\x09\xa2\xad}\
-\xd1\x1a\xfd\x85Wh+\x08\x5c\xef\x80\xaa\xc8f\xb2\xaf\
-\xa4\xb1\xc6\xbe\xda\xb4\x1d{\xd6=\xe87cS\xbf\xb8\
-o\xff\xfc\x0a_\xech\x1d\xf7\x7f\xb19G2\xe9\xbd\
-U\xa7\x14\xc2\x86V\xb96\xf5\x13\xedpx5\xaan\
-\xcf\xf6U\xfe8\xa3\x1b{\x85\xb2HD\xe5 \xae\x0d\
-^fs\xfb\xe7'\xd02^\xf2\xf9\xb9\x9a>\xd9\xa5\
-~q\xb7D\x97T\xb9\xba\xafKj/O\x9f_z\
-\xd6\xf7\xaf{P-\xaa\xe6\x08\xee\xde\x1c\xd4\x7f\xfd\x85\
-w_\xff\xb1\x1f\xfe/\xdf\xf9{\xbe\xe0\x7f8\xfb\xc1\
-\x1f\xe4_2t\xd9\xdf\x06\x00\x0cx\xcehj\x1b\xeb\
-}\xbc\xc4\x0e\xacg\xff\x12)\xeey\xd8a\x0f{\xcf\
-|\xf8\x1a_\xfeO\xff\xe7\xdf\xf53\xae>\xf5\xf1\xbf\
-\xeb\xfc\xe2\xbe\x9f:\x1e\xae~$\xeb\x83q\xed\xacI\
-\xebC\x89\x9b?>\xfc\x96\xd8|\xb8\xc8\xbb\xd8\x9a\xe3\
-\xa3\x8a\x97\xba\xf9\x91\x13\x05\xce_b\xfaC\x7f\xcc\xd8\
-\xf5\x09\xd7_\x0e\xd9n\x9foJw;\x15\xe7\xfa\xb5\
-\xe7C\xb1Z\x02A\xf0v\xc6\x87\xcd\x18|\xf4\x16\x8e\
-\xc6\x97\xc6\xee#\xa1\xc9\xa1\x18\xc2\xfa\xad0\x87\xda\xd8\
-\x0f\xfd\x08\xd1pL\x89\xea3\xb5\x03_\x02\x96\xfc\xab\
-:\x9c\xa5\x91\xa5\x86\xab\x9c\xf2K\x9b\xc5l\xean\x1d\
-`6\xfa\xb7\x05(\xbf\xb0\x81\x9b\xbb\xeb\xde\xe0;@\
-\xf3\xc7\xe4\xfc\x9c\x9fJ\xaa\xfe,\xfd>\xf5\xd7\xf9;\
-\x86\x92J\xab\xea=Y?F\x9d\x89\xcf\xa6\xf8\xd6s\
-\xdb\xd4_\xb1\x10\x9d>\xbf$\x9d\xc7\x923K\xab\x0f\
-r\xa8\x83\xfcqI\x9a\xa3\xed\xd4\xf9Y\x9e\x95%&\
-\x22s\xa5&\xc1q\xfd\xa9{\xd4_\xa9\x82N\xea\x99\
-\xff@[\xf5c\xf4\xa1\xb4\xa6G\xc9yT?\xd2)\
-FXGd\xe9\xbaZ\xab\xf1%\xb9\xf1\xa98m\xe8\
-f\xcc\xaaDy\xfd\xfa?\xf8\xd0\xbf\xfa\x9e\xaf\xff\xfe\
-\xb7\x7f\xe1\xdfeW/B\x0e\x7f!\x90\xc9\xa9\xf1\xad\
-\xe3p\xbf\xfa\xf6\xf5-:\xe0c\xbdE\xcc\xee\xbe\xbc\
-\x03k\xffz\xbd\xce\xac\xc7\x97\xbe\xd6W\x9e|\xcb\x1f\
-{\xfd\x03?\xe5\xf3\xdev~\xdf\x83_\xa2\x87I~\
-B\xfa\xa1\x9a\x1f<~\xe0\xf3\xa8u\x88\xa3\xfa\x81\xcf\
-\xc36\x1f%\xaf\x96\x0f\xae\x8f\x1e>\xcd\x99J\xb2\xef\
-&dw\x1cs\xe8\x1f\x1fF\xf94\xc9\x07f\x93\x16\
-\x09.>${v{\xda\xa7\xcd\xe6\xc3\xbc?y=\
-w\xfe\xfe\xc0\xce\x9c\xcf\x93\xf2\x0d\xee$]?\x8c+\
-\x85\xbf\x14:\xc7\xe8\x7f\x092j\xd3\xffF\xcd9\xcc\
-\xc9zT?\xfa\xf5\xe3\x0fN97\xe7g\x0a\xdd\x91\
-\xa11}p\xfdE4}\xa5\x7f\xa6\xbd\xc5\xfdI\xe0\
-\xaa\x0d\xcb\xa1>l3f\xed\x1f\x91\xadm\xb9\xbf1\
-O\x22\x81\x8d\x97\xbd\xb5\xda\x00\xb1\x06O@\xf7\x96\xfd\
-\xc9\xfam/\x1e+\x841\xa39\xf3\xc5#\xf4\x89\x02\
-\xd6;6\xcfO\xf8\xa1m\xd1\xdf\xc4\xcbl\xfd\x09?\
-\xea\x8f\xf5\xcb:\xcfo\x01\xd6rjT}\x07\xfdY\
-\xb5\x11\x9e\xfa\xbd\x08\xda\x1a\xeb\x8eT\xaf\xdc\xc8x)\
-a\xd3\x91\x13\xe5+f\xc1\x8f\xe8\x08\x89\xb6\xa5\xfe\x03\
-}$Xs\x0c\xfd#\xff\xe4\xc6t\xeb\xf3+`\xa6\
-\x1b\xd7?\xf8\x81o\xfb\xe0;\xfe\xd6[\xdf\xf3\xad\xbf\
-\xee\xfbd\xea/\xff\x9eI\xbd\xbe@\xb1\xef\xb1\xae\xdb\
-\xb6\xcf\xb7\xd1\x81S\xf7\xe46`{\x88:\xb0\xf6\xae\
-\xd7\xcc\x87/~\x018?{\xe2\xe3\xaf\xbe\xfe\x1b\xfe\
-\xe7\xaf\xb9\xf2\xe0c\xbfI\x1f>\x0fsc\xb7\x1fx\
-\xfd\x80\xe9!\xd4\xcf\xeaS\xa8G\xdbH\xf01\xc1\xab\
-\xb4|\x88\xb4\xd6\xf9\x14\x0eMh\xd3\xa7Ik\xf5'\
-\x1d\x9f.\x1am\xe3\xc3\xe3\xe8\x03\x07\x9cc\xda\x97\x19\
-\x5c\x8f\xe0\xe6\x07\x0d\x1f2\xe8a\xcc\xfc\xadq\xfaB\
-\x5c1\x0a\x9f\xf9;G\xebm_\xef\xc3=\xf3\x8b\x93\
-\xdad\x88\xd6\xec\xb7\xf9\xdb\x07\xb7\xa3*\x9a\xfc\x85\xa7\
-~Y\x87~m\xac\xc96p\xec'7\xfc\x8cm\xfd\
-so\x1f\xdc\xfai\xce\x93\xf8\x11\xd3\xf93\x93\xd0\xf1\
-\xe4\xd0k{~\x18\xc805\xcd\xfeM\x8d\xb3'\xe0\
-[[p!\x902\xea&\xd7\xd0\x11\xcd\xe6\xd6\x1bi\
-\x06O\xc5\x98\xa1\x1c[mk\x8e\xd2\xdfu,\xb3\xf1\
-\xf5\xd6=\x199\xac'\xcea\xd3v\xed\xe3T\xc4*\
-\xf5\xba\x0e\xc5u\x1d\x08\x9f6j\xac=\xba\x97qT\
-\xbf\x0c\xb9#pu\xfd\xe9Ik]\xe0KL\xc7f\
-&\xe1\xcb\x7f~\xb3\xde\xae\xbbg4N\xfd\xadm\x9e\
-\xed\xbc?\xf2\xb5\xd6\xd1\xa34\xc9\xfa\xf5\x7fPt\xe3\
-\xb9\x1f{\xfb\xf7\xfdW\xbf\xf8\xf7\x9e\xfd\xd0?\x7f\xbe\
-Z\xb2\xfe\xad\x00\xc1\xdd\xd5u\x8d\x04F\xfb\xb2\xdb\xdf\
-o\xd9\x01\xcem\x1f/\xae\x03\x87=c\xdf\xb6^\xaf\
-\xff\xd4\x7f\xfe\xd4\x7f\xfa\xe7\xdf\xf4\xc0\x9b>\xfd\x0f^\
-\xb9\xb8\xff3\xfa\xc3\x85\x94Y\x83.\xb8\xaeo\xfb{\
-&.O\x17w\xbb>\x1c*\xdd\xcb\x87\xcf\x93\xd4E\
-\x95\x00K\x89\x0a/\xc7\xc3\x9c\xdd\xd66\xf5\x17\xc2\x9f\
-\x8a\xe2\xd5v\x94\xcb\x1a\xd8L\x14N\xd7\xb9\x98\xf1C\
-\xe3)_ ^\xfb\xc3\x84U\x13(k\xf1\x13\xdeV\
-\x22z\xf4\x07\x10\xfbu\xbd\xf1\xe3\xd3\x8b\x0f\xa5I\x18\
-\x01+\xef\xac\xb1\xd1\xe0\xfa\x0b\xee0\x7f\x90\xc9\x99\xf8\
-\xd6\x9a]\x8al[\xcf\x83\xb9\x12\x1bOe\x96F.\
-\x8d\xd1\xd0\xce_\xfa\x07x.6\xfa\x95\xc45N\xf7\
-\xd2\x93\x8e\x1c\x89+\xe7\x92N\xae\xe4/\x02\xed\xbb\xfe\
-\x852A\x14\xa4\xe8\xd5?{a\x16\xf9\xe5\x85\xb3\xb7\
-\x1b\x92l\xd63[{\xd1\xa1\xb1\xd5\x0e\x1e\xa7\xd5\xc2\
-\xf9k[\xeeU\xcb\x06o\x01\xd1\xdb\xf6 C\xd3\xfa\
-Ni\x1d\xfa\x1a~0\xaf\x9a\xa7V\xe9\xb3V\x14e\
-9\xf3nW\xab\xe6\x91k\x09\x89M\x06\x13\x8d\x06\x94\
-\xf019\xc9\xaa\xc5\x14\xc2\xac\xfc\x83\xb6\xb4\x01\x8a\x1f\
-\x8f\xd6j@\xf7\x22\xaa\xe5\x15\xc7\xb4\x0d\x86\xb1X5\
-'?T$\xc8\xc0v\xf6\xc2\xf3\xdf\xfd\xc1\x7f\xf6w\
-\x7f\xed\x0f\xfc\x81_\xf5Oe\xa5\x92S\xbf\x04`\xe7\
-\xc5\xe8\xf9pm\xe7\xfevy\x07f\xe7/\x8f\xd9=\
-\xb3\x03k\xbfz\xcd|\xf8\xca?\xf5\xbf\xfa\xd5\x17\xaf\
-\xff-\x7f\xe7-\xe7\x0f=\xf16\xfd\xcf\xfa\x1e\x82\xc6\
-\xbf\xe9r\xc9Y\xd7\x03\xb5\xaeMZ\x0f\x84\x1f\x06\xc7\
-\xcd\x1b\xfe\x91\xc5/\xbc\xca\x83\xaa.\x0aMV\xe9\x87\
-<\x0f;\x0f*\xfe\x8d\x9d\x9d\xfe\xb4\xaeH\x0f\xcbi\
-\xfd\x0a7Ar\xd5\xb2x\xf3\xe5\xd9I\xf8\xb0a8\
-'K-\xb6=+-K\xcc\xf2YRy\xf2%7\
-\xb4(\xe0\xe4Z\x1c\x95BIR\xe5Vg\xbc\xa9\x8c\
-\xd8h\x9d\x1a\xfb\xc3\xb1#\x12\x03)t\x83\xab6f\
-\xdb\xd8\x13ctQ\x0c\x9d\xaaz\xe4Y\xf1\xa5YS\
-zT3{\x069H\xdcg\x83\x90\xa2v\x0fl'\
-\xca\x1a\xd3\x17\xe8\xc3\x06\xd4\x0c\x83\xdb\x1e\xfc\x86t\xfd\
-X;\x7fl\x0d\x18\x9a\xe57\x95\xb0}\x83\xd8\xbb\x14\
-\xa3\x0b_\xb62\xcd\xfc\x0a\x1cZ\x0c\x0a\xf3\xa8k\xe4\
-\x0fO\x17Y\xf2K\x0e\xb5,\xf5\xab\x88\xa1\xa5<\xb0\
-\xa6?y\x9f9K?q\xa3\xfe\xe35\xf1\xe6\x0c|\
-j\x16\x8e\xec\x0c4\xd3\x8c\xa8\x89\xad\xd7=\xc7Z\x18\
-8\xbb~A\x87f\x05\x9bKL\xd4Y\xb4\x9e\x89\x02\
-\x8d\x9dQ;\xaf\xa6\xfe\xae\xdf\x91\xe6M\xfdDgD\
-e\xe1K\xdc6\x7f\xc7\xcd\x18\xf37\xbe\x04\x0c\xfd\xb2\
-o\xea\x8f\xb0\xd1\x8bJ\xd1\x82\x7f\xfc\xfa\x8f\xfe\xe0[\
-\xbf\xef\x9b\xbe\xe0\x0f\x9d\xfd\xd0\x0f\xdd\xeco\x03\xaaJ\
-\xd3T\xe6\xcd\xbam\xfb|\xa2\x03\xf3\xb4O8w\xd3\
-\xa6\x03k\xafz\xcd\xbc\xbe\xf2\xc5\xaf\xbf\xf2\xd7\xbf\xba\
-\xf7'\x5c\xfb\xa4\xcf\xfd\xfdg\x17\x17\x9f\x97K\xdf\x0f\
-\x1a\x88\xfe\xb0\x15T\xd7w>h\xf3\x83\x9e\xcc<l\
-~(\xfdt\x7f\x18xK\x5c\xf0\xcdk{g\xef\xe7\
-\x8e\xcc\x16\xe5\x87u<\x94X\xeb\xc3\xc8\x11\x07kl\
-\x96\xd9\x8f\xe3\xb2\xef\x0f\x85\xf5\x03\x92\xcf\x06\xdb\x9d*\
-\xa0\xae\x17.$\xb8o,Z\xa7m\xf6\x0e\xabC7\
-\x1f4\xb68(}\x9f\xa0\xe4\x97K\x89G-\xc2\x92\
-\x81\xc1A\xf6\x9aU>\xec\xec\xf2\x9b\xcf\xc2Qx\xa7\
-\x1f.\x06\xf9\xccV$]_A\xf2A\xed@\xe1\x15\
-c\xbf\xf6\x1b|q%\xac\x14\x11X:\xb10H1\
-\xd6\xceW_\x14vF@\xfa\x87!#5\xb3^\xea\
-Gq\xc2\xad\xa7\xd7dH\xff\x1cn\x02\xe3\xd7\xfa\xad\
-\x8b\xc8\xca\x07o\xad\x99\xba>\x83\xf5\x06w\xdb\xb6\xeb\
-\xc2\xcb\xd9\xbd\x00\xf319\xbf\xd9\x80hEZ5z\
-\xaby\xad\xe5\x12\xfd\x066A:3\xcel\xd2\xa6f\
-9r\xff\xe5(\x0d9\xbf\xc6c\xe6L\xe4\xa7\xcf^\
-\xb3\xb9\xc9\xf9\xb5\xf0J\xfa\xca9\xbf\xbe\x0b\x12\xa6:\
-\xd2\xbd\xb49\xeb\xbc\xbb\x1f\xcf?\xf77\xdf\xff\x8e\xbf\
-\xf1\xeb\xfe\xf5\x1f\xfa\xf5\xfc\xab\x85\xfb\xbf\x13p8\xd3\
-\x14@M\xd5{\xe6}\xdc\xa4\x03u5n\x12\xb1\xbb\
-\xe8\xc0\xda\xa7^3\xf7\xab\xbf\xf8\xd9_<\xfb;\xfe\
-\xee\xe7_\xbc\xe6'~\xab\xfe+~O\x04\x9c\x0f\xc6\
-\xf5\x0b\xae\xd7\xccf\xf1C\xbf]\xf7\xa3\xb1\xc6\x9e\xb2\
-m\xf0$\xac\xe7\xa0\x9f\x06D\xb1\xee\x99\x87\x8e\x0f\x97\
-\xb6\x8185\xfa\xc3\xd8\xb1\x8d\xb1Nq\x89\x8c%\x9c\
-\x93x\xbb>\xa5\xf5\xd8vH\xc0>\xc3\xfa\xc9\xd1\xb9\
-j\xa6\x9aU\x93\xa3-\xc6j\x22LF\xe35ce\
-\xdd\xb3\x96c]\x08LGc\xa3\xb5\xeb\x87\xe9@\xd3\
-d+\x8aJV\xad*\xfdS3Q\xf3L\xd9HE\
-\x07\x0fe7\xd1\xbfh\xf1\xfd\xa9\xb4s\x8a\x80y~\
-\xa1_\xd3\xf4\xda\xf5\x9fj\x8c\xc8`\xe1}j\xcd=\
-\xc6\xda\x10\xe3\xc7\x0e\xcf\x1c\xc6\xeb-\xb9\x0e\xea\x97q\
-~\x89\x09C\xfd\x042\xaa\x17\xc9\xbf\xcd\x15[k\x8a\
-/\xa0\xe3\xf7\x93\xe7W\xdc\xa3\xfeJ\xb9A\x93D\xf6\
-\x84N\xdd}\xe7\x88\x9d=a3\x82\x03\x1c\x9d#2\
-\x1a\x8b2\x1e\x11\xe7\xf9K\x1d\x89\xea\x08vUe\xa6\
-A\xbf\xa6\xe9\xb5\xe5\xf3V\xb1\xebQl\xeaW@k\
-&CC\x8c\x1f;<sT\xab*\xff\xec\x03\x11\xdd\
-\x0bt\x98\x8d\xe0u-\xeb\xa1\xa4\xce\x89\xa7\xb50\x1f\
-\x0f\x90\x9b\xbb\xf6C\xcf\x7f\xff\xf7~\xe5\xbb\xde\xfe\xf3\
-\xbeC\x8e\xfe\x8f\x03\xfa\x97\x00\x82\x0f_M\xd9\x12z\
-\xbf\xcf\x07\x1d8\xd5\xfd\x83\x90{~\xbb\xf6\x88u\xef\
-\xfb?\xe7g\xdf\xbf\x00\x9c?\xfb_\xbf\xe3k/\x1e\
-~\xe2\xadz\xf8.\x1cXOj\xae\xb4,\x18\xfd\xb0\
-h\xa1\xb9o\xa8\xcd\xd5\xea\xf9p\x90m\xc6\xf9ai\
-|\x88.\xc1\xe7\x89 \xb4G\xf2\xf7n\xce\x87_\x12\
-xN=\xdc\x03\xdfBkN\x05y\x8c\xbb\x9a\xa9_\
-A\x8e\xeb(\xb3\xeb\xad\xd9d\xafe\x859>\xeb|\
-\xe0\x80`\x9c\xfc\xb2\xb8\xb4\x7f3C\xb5id\x0c\xdb\
-|w\xfd\x96\x99/$\xe2\xad_\xdc\xe3\xc3M\xe8V\
-\x5c\x05\x0d\x82\xf4o\xad_kqXo\xc8\xd8\x14\xde\
-\xe4\xde7\x0f\xbc\x0cy\x0ezqP\x7f\xc5\x10;G\
-\xf5O\x86\xba&v\xf5\x1a\xcev\x0c\xfdN\x84]/\
-\x19\x17e\xb5\xc6\x95\x0f_\xe3+p\xe0\x1b\x08\xb7\xc6\
-\xf6\xfc\x14\xa5\xe4\xa6v\xff\xc2\x90\xb8\xa5\x1e@%\x12\
-^F\xc9\xd9\xac\x8d.\xc7\xcc\xef\x90\xf1v\xdb\xe7W\
-)\x07\x90\x85l'\xeb\x97\xb6\xd3\xe7'L7w\xe9\
-\x0bTG\xfa\x0f\xebW\xa6t\x86\xe8\x1e\x1f\xa9\xf3#\
-\xff\xfa\x85\xf9b\xce/\x8d\xb1~4\xeb\x87?\xae\x9f\
-Z\x19\xd5'>\x17\xb2\xaff*^+\x0f<\xac+\
-b\xae\xcb\xb1\xfa\x82\xe0\xbd\xeaW\x8c\xc3\x8a\xd6\x9e\xb1\
-\x0e\x81R\xbdp\xfd\x03?\xf4\xb6w\xfe\x96\xcf\xf8o\
-\xe5_\x7f\x098\xf5\x8b@\xc8y\xcf \xfd>Nt\
-\xe0\xe2\x84m7\xcd\x0ep\xfbz\xb0\xeeW\x7f\xf93\
-\xd3\xc3\x8b\x87\x7f\xfe\xaf{\xf4\xe9\xff\xe4\xdb\xff\xf0\x95\
-\x07\x1f\xf9*=D\xe7\xf9\x0d_\x00>L\x00z\x9e\
-\xf70\x0fl\xec\xebZ\xa1J\xa2\x9f\xc6i}\x1a?\
-\x1f\xb8<\x22\xe04\xea\x83\xc7\xb6Z\xf7\xc3\xec\xc7\xb5\
-$\x98\xbfc\xc9%;6\x06\xef,c\xf3c:\xf4\
-$+1\xfd!\xc3\xaab\xbc*\xfc\xe2\x9f<\x0e\xd4\
-\xdb\x96\xdfx\xe7\xc7\x9f/\x8aU\xdf\xd0\x0fQ\x8d\xe4\
-\x0c\xcf\xba\xc6\xcd>\xb6|\xa0\x0d<\x9d\x84BN\xeb\
-\xef\x5c\xdau\x0c~jO\xfe\xac\x87~\xa7\x0fA\xfa\
-\xd3Z\xab~\xf7\x8f\x9c\x85\x17Y\xfa\xa4=9\x9c\x5c\
-N\xfcz\x95\x94\xb9\xb6\xb19\xa7\xa6\xd6\xc6\xdcc\x9e\
-\x8f\x98\x85\x8bF\x08\xc2m\x1bk|\xfaq=\xf6\x86\
-\xa3\xf50;-1^\x15^\xeb\xd67\xea\x07o\x0d\
-\x8at\xce\xd2js\xd6\x1f\xfe\xf9E\xc7\xaai\xd4\x8f\
-\xa2\x12\x85\xd6\xb6\xafk\xfch\x8b\xbe\x9e\xa3-\xed\x83\
-\x00{\xce\x83y\xe4\x02\x84o\xf5\x8f>\xa4\x1f\x0e\xa8\
-\x98\x92R\xf8\xe0nV?\xbedo]\x99W\xad\xf0\
-'\x7f\x9f[\xcf\xd1\xd6\x0c\xaeYl\xcc\xebz\xe0e\
-m}}~\xf8r\x87\x84\x10\xdd\xec\xdf\x5c\xf7]\xc9\
-\xfd\xaf\xbe\x91\xa7D\x0e\xfdp\xe9\x85\x19e\xbd6\xde\
-\x8a\xb0E_\xe7\xb1\xa5DY\xb3\xd6\xa3\xff\xb5n\xad\
-kO\x0a\x7f~~\xf5\xda\xe7=\xf6s\xde\xf2\xc9\xcf\
-\x7f\xf0}\xdf\xf1\xa1\xff\xef\x1f\xf2\xdf\x0b\xe8\x91\xe6\xf4\
-.\xf3j[\xd7\xdb\xa8{|\xb77\xe6\xf2\x0b\xb0\xf6\
-\x86\xf5\xe1k\xfcS\xffk\xbf\xe6\xcf\xbc\xf1\x81O\xfc\
-\x9c?\xa5\xff\xbc\xff'\x11\x95\x87\x0c@}\xc8,3\
-\xe9\xfa!\xf3\xc5>\xf0\xb5\x9f\x99\x84\xf5\xbc\x8c9\xfe\
-\x03\x9f\x9e\x1a?\xa085F~=E\xf5\xf0\xd4\xdc\
-~\xe1\xdbG\xbc^<p\x9d\x84\x87\x90\xb1\x98\xe4\xca\
-\xc3\x8c\xbd\xd7\x99\x07\x0c\x97G\xc1\xb7x\x19\x9dC\x11\
-\xfd\x90\xcf\xf92\xfd\x15\x0bF/\xf40\xbc\xd6\xc6x\
-\xef\xa7\xb6\xf8\xa3`\xd3\x7f\x05'\xff\xe1\x99\x14O\x93\
-\xc3\x17\xf8AO*\x87\xf3Fo\xce\xaf\xf4,\xd5\xd2\
-\x17\xc6By\xac\x9f<\x15\xd3g\x04\x86\xb1\x9e_7\
-+1\xed\xa7\x97u\xb6\xc4\xeb\xb5=\xbf0o\xf3\xcf\
-\x1e\xf5\xf9\x059u\x84\x9d\xfc\x10\x1e\xe8w\xff\xc28\
-\xf4V\xdc\xd8\x17\xc1\xd0\xdf\x84\x9a+\xd4\x16\xaf\xa1b\
-\xe1ij\xeb=3\xe7\xd7\xc8M\xfd\x1b_\xf4\xf6\xdd\
-\x02w\xbb\xe7\xd7\x81\xab6\xe3y\xd3H\xb5Y\xaf1\
-\xeb\x1a\xef\xa5\xf5#\x0a1=\x15\xa1M\xac!\xf2\x94\
-\xfb\xd4M\x9a\xfd\xeb\xa0\xbe\xb3D\xf7\xba}\xa1)j\
-\x02R\x96\x0c[[\xe5\xb0\xbf\xf3\xa1\xad\xee\xd1\xd0\x9a\
-=<\x1b\xfc\xb2w\xfd8W\xfdK\xf4\xbc\xff\x1d\xd4\
-9`m\xbd\xed\x8b\xde\xed\xf99\xc3\xd1\x9d\xf6}\x10\
-\xec\xc6\x0b\xcf\xff\xe3\x0f\xbe\xe3\xbb~\xc5\x0f\xfc\xf7\xff\
-\xd1\xf7\x88\xeef\x7f\x1b\xd0\xe9\x98\x19\xa58\x9b\xfd=\
-\x7fu\xbd\xf7\xe1\xb8\x03\xdcN\x06\xf3\xe1\xab\xbf\xf8\xfd\
-O\xfeO\xfd\xd6\xbf\xfei\xf7\x7f\xf2\xe7|\xc7\x8d\x8b\
-\xf3\x9f\xe4\x8b_\x9f>&h\x96\xbew\xda\xf7\x87o\
-?\xe4\xb0\x13\x86\xddx\xbd\xf3\x04\x0f(*\x96\xe1\x0f\
-\x1b\xed\x83\xcf}\xce\xb3+\xb4sO\xdb\x80\x95&\xf6\
-,\x9d\xef\x06\xcf\x8dF\xe7\x97\xc3\xf9\x0d_\xf3c\x08\
-'\xe1\xc4\x04\xdf\xb6\xfa\x98\xd6v\xa4\xd1b\xe8\x9fF\
-\xe0\xd6\xd8z\x9b\xb7\xf9\xac\xbf\xe2\x07\xde\xa8\xf96\xf2\
-_\xef\xfc\x94\x90\x0f\x18\xebG\xab\xfe\x0c\xbc\xc3f\xec\
-\xa6\x7fe\x9e\xf9\x11H\xae\xa9\x7f\xf6Df\x05n\xf0\
-\x84\xaa\x18\xe3\x85\x09\x9d\xde\x97\xfa+\x859\x09\xdf\xe0\
-\xbb\xd6\xe2=\xae\xbf8G\x0fM\x9d|\x97\x9e_2\
-\xaa#\xa4+U\xab\x8ay~m\xdd\xd4_(l\x0c\
-k\xcar\xec\xfb\x97\x8f\xaex\xe2\xc5\xd85\x15\xa6s\
-4\x05\x18\xc7\xeb\xfc&\xfe\xf2\xf3\x0b\xddda\x9f|\
-\xd7;U\xed\xc5F\x98C\x0f\xcfo\xc5\x1f\xd4?\xce\
-\xaf\xa0\x08\x15\xd1\xa8?\x84M,\xd7\x82wB_\x01\
-\xdb/??H3\x80\x8c~a\xd2fs\x7f\x9b\xb3\
-\xe3=/\xfa\xbb\x7f\x8ak\xeb\xe0kC\xc5\x00=}\
-~\xb1w\xf8\xc0\x07\xe0\x8c\xd8\xd0\xd616\xea\x8d\xac\
-\x8e\xdf\x9c_\xf3\x11\xad\x97\xfe\x18O\xb4\x09\xfcf\x8a\
-Y\xff\xa9\xf3\x03\x9b\xd8\xe0\xa1\x9a6\x08\xdc\xff\xf3\x8b\
-\x9f\xf4\xc0'}\xf6_\x7f\xeak\xbf\xed\xd3d\xe2s\
-\xb8?\x93{\x06\xde\x14=\xcb4l\xac\xf7\xa1\x0e\xac\
-\xcd\xd9\x1b\x92\x0etO\xd6\x995\xaf\xbe`\x9e\x9fy\
-\xeb\xdf\xfe\xac\xab\xcf\xbc\xe9\xcf\x5c9?\x7f,\x1f\x0c\
-\x0a!\x8a;\xcb\x9b\x86\xbf\x1ed\x8b?\x96~\x88\xd8\
-\x11U\x10\xcf\xd8\x18F\xeba\xe8\x7f\xb27\x9e\xc0\x11\
-\x9du\xec\xebo\xd8a\xab\xe7(\x9c#\xbf\x16q\x03\
-\xf6\x88\x16\xbe.x\xb0qfX\xbfD\xf0e\x0dh\
-\xe6\xaf\x80\x9a\xfc@+\xa6\xe7\xf6\x12\xcf\xd8\xe8\x8f!\
-\xc1^O\x9c\xf1\xd8j\x04=5m\xf5\xe1\x8d\xd6Q\
-\xbf\xf5\x03\xc6n\xf5L\xa5\x9f<\xc5\x157\x81\x0e\x1d\
-\xf8\x03\x7f1$\x8b\x9a\x10|`\xeb{+\xe9\xb9}\
-\xeci\xca\xa6~K\xd6\xdb(\xb6\xfb\xdas\xa3\x13\xa2\
-w\xe5W\xbc!sM]=\xba/\x99\xb1:I:\
-\xa0\xb8\x97z~htM!\x98\xf5\xb3G\x7f\x8d\xc4\
-,%\xb5Csk\xc3\x94>\xb3B_\xe3\xbbn\xcd\
-\xfa\x89\xf2\xf2+\xa4\xb9A\xbd\xd8\xf3\x03m<\xe0\x97\
-p~#\xe7Z\xbf\x05\xeam\x9c_-\xdbd?H\
-\x0d\xeb\x9fg\xb6\xd5?\x94Y\xa5\x7f\x01\xd0*p\xde\
-\xf1O\xee\xac\xe5/-v\xd6[\xfa:\xfb8|\xe3\
-\xfc\xb0\x94\xdf\xcb\x12[\x81\xad\xa4\xe72{zi\xe7\
-7\x89\xcdY=\xd9\xd6_1\x96Ru\xf9N\xc9@\
-\xbc\xcb\xbf\x9d\xf3\xbb\xf1\xde\x0f\xbd\xeb\x9f|\xd9\xbb\x7f\
-\xf7/\xfc\xdbB\xf1O4\xeb\xff\xa7\xc0\xfa\xdf\x0d \
-\xa1YYh\xac\xebX\xee\xd1w\xbe\xc8\xf61;P\
-\xd7\xb5\x9e\xc5\x5cGl\xbc\xd6/\xff\x8b\xd7\xbf\xed\xef\
-\x7f\xd1\xd5\xd7\xbd\xe9\xcf\xe9\xa1|l^']Z?\
-xy\x98y`}\x8d}\xb9\x93d\xdd\xe7\xa1\xa8\xe4\
-\x15c\xbc\xd6NZ\x1f\x5c\xeb}\x8d\xbf\xb8*n\xf8\
-u\xad\x07^\x04|^$_\xe5\xd0d\x7f\x09\xc6G\
-\x1e\xe3\xc7C'\xeb\xc8O|\xf9\x1d\x97=~[G\
-\xfe\x193\xf3\xebc\xad\xf5W|c\x82\x0e\x97\xf3/\
-9\xd0\xd4\xba\xfa\x831\xc9\xfc^\xf5%\x9fu6A\
-\x91&\x7f\x1d\x1c\xf5\x93\xbb\x13\xd6\x1e~\x0a7>T\
-!'\xb3\xe2G~\x9f\x9f\x5c\xab~oC8\xf0\xe6\
-\x98\xb6\xb6\x8f\xfa\x87\x80\xe4l9\x1d7\x04\xcaa\xb9\
-z\xa3\xacy\x7fH\x90\xd1\xfa\xd8\xb5N\xe3\x8b\xd4\xea\
-\x07>|\xf6\x97\x06\xe3\xab\x9e\xe4\x1fj\x1c<\xfc\x12\
-0\xf4W\xbcsj\xcd\xcf&\xbf\xb7\xd3\xd6\xfe\xcd\xf9\
-\x19\x91/\xa2\xa6s~\x0a\x85/\xf0\xf4\x9f\x00\xe7G\
-\xd2\xf4\xf5\x99\x99_\xfe\xe8\x0f\xdc\xf4([\xf4%?\
-\xfe\x22\xafPs\xda\xdc\xf7\x7f\xc6\x18_\xf1\xa3\xfe\x16\
-W\x98f#\xac\xe5\xbb\x00\xa4\x92\x7f\xc5/\xb5\x09^\
-\xfaX\x81\xe8\xfc\x00\xa7\xad\xe0y~\xcb\x1e\xef\x96\x9f\
-<\xce?\x9d3\xbf\xfbG\xbfI4I\xac\xaf\x92\xcd\
-\xfc\x10$\x06\x1b?\x0c\xf7/\x04\xde\xf3\x96\xfa\xb2u\
-\xfen@\xa5 \x1c;\xc2\xfc\xf9cC\xc1e\xdb\xe4\
-\x97/\xf0\xce\xa8Y\xb6\xde\xe13-\x1c\xa5\xc9^\xef\
-\xe1:{\xec\xbeg>\xe1\xdb\x9f\xfd\xad\xdf\xf1E\x0a\
-\xf0\xdf\xc8\xd6\xdc\x9f\xd5P8\xc52k9l\xac\xef\
-\xe9\xb1\xff\x020\x8f\xff\xf0\xa2\xf4\xe5a\xee\x0b\xc5|\
-\xf1\xba\xb7\xff\xc3/=\x7f\xea\x0d\x7fR\xf7\xe8An\
-y_X\xeeU\x83\xfa\xe2\xb2g\xcd\xdc\x83\x0f\x96u\
-\xf8\x81)\x03\xae\xf9\xe0\xe8\x01\x81_\x04\x86\x98t\xbb\
-\x86x\xe0\xc1\x8ag<\xb8\x02\xe6C0s?DQ\
-Yd\x8a\xf7\xf3\x04P\xc3x\xbd\xd9\xc6\xbe\xd6\xce\xef\
-\x88h\xf2\x927\xfb'\x97\xf12[\x93\xf3'+\xf6\
-\x1es\x1d\xdc\xd0\xaf\x80\xe0\xbb\xa7\x8b~\x83\x12?\xb5\
-\x84\xf1\x18\xdf\xf9\xd1\x1f.\xd7\x5cE\xb9\xff]\xa02\
-\xce\xf3\xeb\xfc\xd1L\x13HK\xd6U\xf3\x8b;?\xb4\
-\xa0\xa3\x88\xe0Z\xd6\x10G?A\xfc\x995'\xff\xa2\
-\xdfJ\x88Y\x09\x0a\x8f\x09n^z\xeb\xf2\xb2\xae3\
-K\xfb\xdc\x13\x07\x1b \xfe%\xd8x\xd9m\xd2\x1b\xfb\
-m\xfd\x9d\x7f0L\xbcL\x03oT\xd5\x02\x0f\x8e\xd6\
-\xef\xf5\xcd\xf0\xa5\xc9}[\xea/\x9d\xb7}~\xcaw\
-\xac\x1f-[\x01\xa3\xfe\xd6/\xb7m\xa5\x9b\xb4\x86\x8c\
-\xfeu)8\xa8\xaa\x1d]\x7f4\xd3\xc4\xf9\xfcQo\
-\xe2\x92\xbd0X\x9d\x00\x7f\xe1;?\xfbZ\xaf5G\
-\x7f\xe7\x5c\xcf\xaf\xf3\xc3)\xb0\xf3'kr\x92!\x9a\
-X\xf58\xaa_\x8e\xd4D\xafL\x93\xfa\x0bp\xd0\xbe\
-\xe8_js\xcd\x08 \xbf\x82\xe1:z\xfe*\x1e\xca\
-\xd3\xf9\x93\x0c\xdd\x03\xef`z2\xab\xd1\xe6\xc1\xf3W\
-\xbf\xe1O\xbc\xee\x1b\xfe\xd6\x97\xca\xbd\xff\xc7\x01i\xdb\
-m\xbf/\x9d\xbcm\xcc\xdd\x18\xb8\xf6\x81\xf5\xfa\xda~\
-\xf9\x7f\xe3?\xf8\xd2\x8b'\x9e\xfd\x83\xc4\x10\xc4s\xd6\
-\xe0^s\xa1}\xf1y\x08\xec\xac\x8f\xec\xd5^\x04\x0e\
-)\x82^\xaf\xb3\xc2<Hf^\x11\x92\x87\xcc\xf9p\
-Y\xf3\x97\xcdy\x88WXq3\x0d^\xc3K\xe3\x0c\
-\x09?\x0f\xac\xf1\xf3\x83\xc5\x14m\x87\x07\xbc\x869k\
-f\xdf\xe9\xfa\x81\xcd\x87\x08q\x111x\x89\xd4\x1f\xd7\
-4\xf0\xdb\xbc\xa9\x17\xd6*A\x14\x03o\x01\x07\xf5o\
-\xfc\xeds`e\xa7o\xd8K\x7f\xe5w\x82z\x1b\xba\
-\x0f\xeb\xb7\xfc\xad> h\xa4\x8eJ0\xfb[\xdc\xee\
-\x7f\xbb[\x9f\x82\xa3*\x1aK\x8d\xa3\xb6\xf9\xa97`\
-\xa7\xd7\x92}\xf7\x8c\xcd\xe6\x83\xd0\xfe\xd8f\x9f\x92)\
-\xf2K?qz1\x9a7\xbb\xd8\xb1\x0d\x1d\x15y\xb3\
-\xf3k,l\xc9\xbb\xe8\xacD\xc9\x8f\xbd4\xcb\xde9\
-\x06^A\xed\xf7\xec>-\xfak\xdf\x9a;v\xe0\xd1\
-]\xfc\xeb\x8c\xdf\xe7\xb4\xe8\xa3,\x98/?\xbf\x9c\x0d\
-\x1a\x8d\x17\x96?\xad\x0b\xb4\xf1\xf6\xf6\x1b\xe7Z8\xeb\
- ^\xbe@\x1d\xd4\xba\xd8\xack;\x17[\xfb\x98\x19\
-\xaeYbm\xb7\x05\x05e\xaf=\xd3\xc8\xdf:\x1c\xd5\
-q}>\xb0)R\x04\xe9\xcb$h\xdb:\xe3M\xfe\
-E\xb3\xb0\x9d\x8b\x95#\x14\xb4\xeaN\x96p\x1b\xafe\
-\xf3b\xed\xd8D\xe4\xbdm\xeb\x8c\xe7\x96\xe7\xe7\xa0\xb3\
-\xeb\xcf\xff\xd0\xbb\xbf\xea]\xbf\xe3s\xfe\xac\xb6\xfd\x1f\
-\x05\xac\xff\x05A\x84\xf2b\x1c\xce\xb1\xde\x83\xef\xfb\xdf\
-\x00\xd4\xfd\xae\xb3\xe7\xae\xae\xaf\xcd\x97\xff3o\xfb\xee\
-/\xbc\xfa\xc4\xb3\xbfO\x01}\xa7s\xab\xc7\xc5\xe1\xc1\
-\xe2C.\x06>\xa0\xf3\x93\x0b\x1fk}\x08\x0eL-\
-\xeaJ\xfa!)\x93\x85T2x{\xcc\xe4X\xda\x9e\
-\xd9\x0f\xe6\xc8?\x8bY\xe0\x8bx\xe0\x8d\x0f\xbb\xf5g\
-\x99FT1\x9b\xfc[\x01k7\xa4&\x1f\x82P\xcc\
-\xea\xab\xfe\xd6\xb5*pz\x1c\xa5_z\x9a\x9e\xd9\xe9\
-\xb5\xb8<\xbfp\x86_\x82G\x88\x06\xbaz\x98\xdfo\
-[^\xc7\x91\xbf|\xcc\xfd%;\xf3O\xbf\xe3\x9b\xb4\
-\xe8ig\xc1=\xf7z\xe2\xa7\x7f\xe2\x89*\xfd\x9a7\
-\xf9\x8b?\xf8\xc44\xa7\xf1\xb7<\xbf\x10\xdc<\x7f%\
-\xd1t\xd3\xf3s\x18\xe73\x15\xcc\xf4\xa5\xff\xb0~B\
-\xf5Z\xf3/p\xe7\xf3\x9e\xbe\x93\xbffR\x15\x94e\
-\xe2\xbc\xaa\xb7j\xd2\xca\x8b\xc9x\x80\x1a\xa7\xcf\x0f\x87\
-\xdd~\x8bj-Kw\xf2+\xc0\x7f\xfa\xe9\x0d\xefD\
-M\x82\xe0\xd9\x97~\xe6r;\x7f\x81V\x9d\x93g\xe5\
-\xbd\xa4\xfe\xe2\xba\x14\x8f\xf0\x1a\xa8\xcd\xf9\xc5\x00\xb4\xcf\
-j\xe2g<Q\xf3\xfc\xd2\x16\xf6\x95\xd2\xb3k\x91a\
-\xe2M\x0a\xd4\xc3l\x00n\xe7\xfc\xae,\xb9+\xc9\xca\
-K.\xf6\x9b\xfe\xd5f\x8d\x1b\x02I\x8b\x0a\xe7?;\
-\xbf\xfa\xf83\xdf\xfc\xf4o\xfa\xab_(\xcb\xed\xfeM\
-@\xa9\x80\xe4\xde\x1c\xf7z\x03\xd6\xfaY\xaf\xaf\xed\x97\
-\xff[\xff\xe6\xcf\xbe\xefu\x9f\xf4\xe7\x14\xf2`.\xe9\
-\xfc\x8d\xba/g\xbe,\xb8\x92\xf1\xadW\xca\x89x\x93\
-\xbb?d=\xeb\x82\xe7!\xe4\x03\xc0Q\x86\xe1[G\
-<!\xf0C\xaa\xe5\x98\x09\xf4\x83\xb3\xe0\x0d\x8f\x162\
-\xf6\x17\x19q\xb6:o\xecS?<z\x157\xb4\x19\
-\xc7\xda\xe6\x87M>t\xc0\x9d\xac?\x92\xeb\xa1\xcef\
-\xe86&u\x0c\x8d#?\x8b9\x5c\x19\x1f\x06\xad_\
-\xae\x84V~\xed\x1dS\x10\xa3\x97D\xa3~p\xb2\xb3\
-_g`'\xf5\x17_\xf2\x03\xe6O\xfa\xf1\xf2\x9e\xdf\
-A\xfd\xd4\xce\xe8\xfaO\xe9OD\xc2\xc6;\xb8:\xbf\
-,\xb7\xfa\xd55\xdf\x08\xa5;Y\x7fa:=\xb4K\
-[}\xae\xec\x9d\x83 \xd6L1\xe2\xf0\x80\xa6\x83+\
-\xa4C=\xf3\xb6\xc9A\xfc\x92h\x9e\x9f\xd4:\xf6\xd4\
-\xf9\x01\xca\xd8\xa6\xbf\x8d\xfa\x05\xcb\xf3\x17u\xb3'S\
-\x86\x0b\x93\xd0EVJ\x22\xa5\x8cS\xe3\xac\xbf\xda\x97\
-\xbb\xe9\xfe\x98\xb9[aL\xf7\xca=\x8a\xfc\xf4D\xef\
-\xebsV.\x14l\xecS\xeb\xcc68ej\xbd\x03\
-_\xbd\x9e\xf7\x1fO\xe9O\xf9\xc2\xb0\xe8\x8a3\xb7\xe8\
-\x0a\x11b\xfa\x8f\xea\xc7\xab?\xf4\xa4\xf3\x98P\xc6\xe8\
-\x99\xf6\x91ki@\xd2o\xebt\x13M\xbb\xb5\xa7\xa3\
-h\xa1\xd8\xeb\x1f\xf8\xd0;\xdf\xf1K\xde\xfdM_\xfc\
-w\x94o\xff\x9b\x804\xfd\xd2\xf7{\xf9o\x00\x96\xeb\
-\xe6\xab\xc5\xbe_\x9b/\xff\xa7\xbe\xee/\x7f\xda}\xcf\
-|\xd2\x9f\xd1\xa5|p\xedd\x08xp\xa6\x95\x8b\xeb\
-\x0b\xdfd\xf2\xb5?\x97\x9aX\x8c\xfc\xd1\x1b\x0f\xc9\x84\
-\xf3x\xf8\x07\xdb|%\xa2/z\x03\x9aw\x83W\x92\
-<p\x85\x97\xb3?\x98\xfc\xa05\xa8\xf8y\x1a7x\
-\xb2\x97&\xecy%b\xe4/\xbd\x8d\xeb\x193\xd8\x91\
-_\x0e|\x9d\xd2\xf9\x0b\xcb\xd4\xb8\x9e\xb1\x91\xc3xy\
-\x8d\xf5\x9c\x88\xd3\xf8\x03\xfd\xd4_\xdc\xd4m\x8e\x12p\
-)~\x08 w\xe9o\x0e\xe6\xf2\xe3\x1bC6\x9be\
-\xe3+\xb4\x87\xf5k\x8fo}\xe1\x8f\xb2r0\x99\xa0\
-x\x08\xd0@\xa3\xeb_\xb4\xfb\xfc\xca\x9e\xa4\x89M\xfe\
-\xa5~\x19\x92\xbfs\xcf\x1e6w\x90\x0b\xbe\xb4\xb6}\
-\xd4/.\xf4\x91\xa3un\xea\xc7^\xa0\x9e\xd9:\xbf\
-\x02\x8d\xab\x98\xa8Hm\x05\xf1\xd48\xcf\xf5O\x87\xae\
-\xbf4\x9d>\xbfFu~\xe5\x9a\xa6:\xbf\xd2\xdd\xf9\
-+`s\xfe\xc24\xacgD\xb9\xfe\x91\xdf2\x07\xff\
-K9?\xc0\x9b\xe7/\x94~w\xde\xeaU\x9b\x0f\xcf\
-\x0f\xfb\xe8\x9ft\xad#\xba\x97\xf3\x97\xd3\xfa\xe1\x94\xb3\
-\xfb\xd23\xbe\x8c,\x92\x1f\xfe\xe1\xd0J?\xa5)\xfc\
-\xb3O\x9b\xfe\x89h\xe3\xaf\xcd<?\xeaN\xb6\xd4\x1f\
-\xde\x12\xe0)\xeeC\xfd\xc4\x85\xbb\xeb>\xec\xdf&\xef\
-\xa2\x03R\xb1=x\xf5\xf5\x9f\xf8\xa7\x9f\xfc\x9a?u\
-\xf8?\x11\x04\xc6\xe7:sSh\xe9q\xb8o\xfb]\
-?\xf3W%\xf7\xe2X\x0f\xbc/D\xcf\xdb/\xff_\
-\xfb\xc7\xde\xf8\xc0'\xfd\xec\xffQ\xb7\xf9\x09.b?\
-\x1c<2\x5c\xf0~\xa8\x00\xdb\xe6n\xf2\x00\xf2X\xb5\
-\x85\x99[\x17\xdb\x8c\xad\x18\xb9\xcd\xe5\x18\xbd\xf5~\x0b\
-\xaf|\xc5\xcdCZz\xc2]\xf9!\xd2H~/\xc7\
-\x9bs\xc0-\xcb\x96Z\x5c\xd6\x16\x8dx[\xab\xc1\x15\
-l\x9b\xf3*\x02\x9e5\xbfHcK\xba\xe4\xdaf\xe9\
-\xf8\xe6\xee=\x88US\xf6\xf4f;\x1c\xd3u\x0f\x8c\
-\xa2Z\x0b\xba\xab\xc8\x95\xbbY\xda6r\x95\xe6Yo\
-txOm\x07\x0a\x86n\x11\xa6\xb2\xdb=\xbf\x8av\
-\xbeyn\xad\x07}\xab&\xef\x9d\x9f\xd5\x1c#F\xa6\
-0f\xb6^\x9f_\xcem\xdd\x1b]\xc1\xc7\xe7\xa7H\
-|\x1a\xd56\xcf\xc6\x93\xdf\xce\xceJLl\xa3\x0f#\
-f\xd1\x1f\xbaQOm=\x99i\x9c\xdfr\xc7\xa4\xc1\
-\xf9\xadCQ\xdew\xfe\xc9\xe0\x18|2!\xbb\xf7\xd6\
-\xeb\xfa\xe3\x1b\xfa\x1d\xb5\xe0G\x8f\x0a_\xfb\xe4\x9b\x9c\
-c\xef$$cA\xbe\xdb\xa8\x1fq\x1d\x9b\xe5x\x8f\
-\xee\xae\xbb\xeb(\xee\xa1-Q\xddc\x83\x132\xf3+\
-\x04I\xb3\xfe\xb9\xc6F%\xadu$\xd7\xa2m\xc9P\
-\xfb\xea\x91a\xc4\x14\xa0c\xb2E\x00\x8a\xc8;\xb9\x9b\
-\x8f\x98\xe4\x0dg\xfaG\xaf\xf0\xcc\xd1z\x9b\xbb\xf7\xd6\
-[\x99+K\xb4\x96\xb6fpO\x9c\x1fD\x14\xf9\x19\
-\xad^\x10g\x1d7\xce\x1e\xd0\x7f\x1c\xf0\x0b\xee\x7f\xfd\
-'\xff\xe5\x1f\xff\xbf\xfe\xca\x0f7\xfe\x16s\x97~\x8b\
-\xb0\xbb\xcb}/\xff\x0d\x00'\xd9\x87\xce\xbc\xbe\xe8\xcb\
-\xc5\xb5\x9f\xf3\xe5\x8f>\xf8\x93?\xffO^9\xbfx\
-2\x81\xf3F\xe7\xf2\xf20\xd7\xa5\xd3\x825\x17r\x5c\
-\xd4\xac\xfc~\x84'\x96\xcb\xdcx\xe6\xb6i\xe1\x0b\xae\
-\xb9\xfd\xcc\xeb\xe8\x87/~\x02\x97\x07T\x81\x83[k\
-\xb4\x1ao\xf9\xa9\x81\xfd\x8c\xb1w\xe6\xc7Wu\xe0!\
-W\x22\x0e\xeb\xbf\x1e\xee8\xbdnN\x1e\xfe\xc6\xf5\xec\
-\xa2\xc4\x07\xfb\xecQi\xb3\x05O\xf6\xc9\x9f\xb55\x18\
-7\xdf\xb0u.\xf8\x19\x833\xce\xa1m\xd6\x7f\xa8\xbf\
-\xfb/@\xfe(\x7f\xb4\x89\xdc|P\xc1\xcb\x1cu^\
-x?\xf3\x1f\xd8\x08v\xfd\xa5\xdf\xfd\x9b\xb9\x89F\xf3\
-\xc4\x93<9\xdc7\x02\xfan\x10[/\xcc\xad\xc1)\
-F\x0c;\xe2&'q\x8d\x1b\xfdGT\x0dz2\xf3\
-\xc78mv\x9e8\xbf\xc6\x87{\xe0\x9bSs\xdb0\
-\x8d\xfc\xb5\xc6\xd6c\xd5\x9a\xf3\xeb\xfa\xc5\x0d\x90\xda4\
-\x9b\xa3\xe6\xc8\x8f\x86\x84t\x8d\x09\xb0\xcduk\xe5\xde\
-\x84\x93w|2\xfa\x9d7\xc7\xea_\xa6\xc4\xec|\xc3\
-\xd6\xf9c\x8f\xbf\xf1 \x19\xc4\xcc^\x1b\xaf\xb7p\x86\
-;\xf9\xb3\xc6\x8fo\x1d\x89]\xf4\xcb\x09\xc3\xec_\xfb\
-d\x07o\x82E\xbf\xf6\x1d\x1b_bb\xb3\xd3\x1a\xe1\
-\x1c\xe7\xaf\x9e\xf4\x80n\xe0\xdb\xb8\xd80\x11\x93\x97\x95\
-a\x1ac\xd4\xaf\x80>?\x9c\xcd\xa9\x855\x1bO\x8c\
-\x9d\xe3\xcd\xfb\x8e\x85=\x01t6u\x1b/\xa3\xf15\
-\xe3\xed\x81\xfd\xc6\xc1\xf9\x99\xddy\xc1]y\xf2\xda'\
-\x7f\xee\x9f\xb8\xf6\x99\xbf\xf8Q\xd9\xfb\x7f\x22\xd8\xffp\
-\x17\xda.\xafI\x87\x8ai\xb8\xdbW4\xe2^\x1b]\
-\xf3:s1\xd8\xfb\x8b\xbf\xe7\x9f\xf0{\xbe\xf7\x8f\x9e\
-=\xf0\xe0/\xe2:q1\x09\xe1a\xcbs\xc4Em\
-\xbb=\x8e\x09i\xde\x8d\x11l`d\xc6\xe3k\xdcv\
-\xed1$\x86\x87&X\x9b\xeb\x81\x1d\x18\x19\xfb\xc1\xc3\
-\xbf\xb1k\x0f\xaf\xd1\xe5p\x1eY\xad\x13.\xd9Y\x13\
-\xe9\xadr\xa5\xae\xe2*\x1d\xb5\xab:\xb5\x13\x84\x87\xd5\
-\xe8\xc1\x1d\xad\xb1\xdbc.\xf3\x13\xa31}\xd1\x86m\
-\xe4\xf7z\xb5g]PB'\x1e\x9d\xdd\x8b\x88Q\xae\
-\xd6\xe5\xd0\xd2\x08?\x8e\xd8\x02Y\xcfI\xd9\xf1\x09L\
-\xddh\x99\xf5g\x1dh\xde\xed\xab\x9eT\xf9Mm=\
-9\x8b\xe4\xea\x1e\xdd\xce\xf9\x09\x8c\x84\xc9U\xeba[\
-4\xc2n\x9d\x08\x90}\xf4\xcf\xba\x12h\x97\x96=\x87\
-Y9 \x04o_\xd87\xf5\xdb\xb1\xed\x05\x8c\x01\xc4\
-\xee\xad\xde\x8a\xeaH3\xfe0O\x1el\x8cyf\xac\
-cs\x7f\xb41&\xf2\x17|\x94w\x92`\x0e\xce)\
-\xc5\x14&\x043\x7f\xe1M\x90\x1c\x04\x8e\xfa\xb5p}\
-\xa5\xad\xcf\x0a\x9d9\xcb\xccQ\xba\xe8'\xbe\x8c\x1b\xfd\
-e;\xce\x1fG)P\xce\xdc_tDa\xce&\xfb\
-p\xbb\x92\xd2Z\xb4\xd5\xb3E\x1b\xea\x1d\x08&}\xc9\
-\x0a\xf3r\x7f]p{\x06\xc4\xd0\xc1=\xf0K\xfe\xc5\
-F\xdc\xe1\xf9E\xbe\xde_\xe2\xf9\x1d\xe1\xab\x98\xe3\xfe\
-\xa5H\xf7\xbcz\xd2g4\xf4\xd7\x99I\xb2\xfe\xac=\
-RD5\xd6\xfa?\xf4\xfe\xbf\xf8/\x7f\xf3O\xfb\xd5\
-\xb2\xf2\xdf\x078\xfc\xef\x04\x90b}i\xeb=\xf3=\
-1\xee\xb5\xff\x08\xc0w\xb0N\x96u\xbf\xfa7\xc3\xfe\
-\x05\xe0\xe2\xd9\xb7\xff?_{\xfe\xf0\xab\xfe\xe3\xfe\xc8\
-\xc8\x9c\x87\xaeI\xb0\xb5\x1fN\xec\xdc\xa6\xbeB\xdc\xc3\
-~\xc8=\xd7\xa5\x1dx\xfc\xc4\x17\xa0?\x84l\xd2\x1b\
-{\xfb{\xc6V/b\xe0\xdc\xe0\xb5s~\xde\xf5g\
-\xe0e\xcf\x07W0\x8d\x1a\xfe\x80\xcc'\x895\xf2P\
-%\x7f\xb8 \xb5\xa2$-\xfe\xda\xa0\xc7\xf9\x07\x81v\
-\x9d\xe9x&\xc9\xf0WR\xf4\xf8Cs\xe8Y\xea\xef\
-\x9c\x0d\x04/\x1b\xaf\x1e\xac\x03\xcd;\xe8b\xa8\x19\xfd\
-\x8c~/\xef\xc8W\xf8e\xdf\xfc\x9e\xfbC\xa7\x12\xba\
-\x7f\xa6\xaa|\x0a\xea\x0fMg\x91\xcf\xee\x9eG\xe6\x10\
-4w\xabF\x8d\xeb\xc7-\xcaq>\xb2\xb3\x8e\x0d\xa7\
-Ycc[\xc3!\xa5\x9d\xe0\x81'\xbf\x93\x1d\x9f_\
-c\x99\x93\xbf,\xce\xdf\x99\x8e\xe7\xc4w\xece\xf5W\
-\x7f\x95\xdb\xe9\x9d\xa3\xdf\xd0\xd4\xeb\x05o\xca\xda[\x11\
-\x06x\xaaf\xfb{\x9d\x99\xbe0\xe0\xf3\xb2\xde\x5c\x7f\
-\x85\xa4\x7f\xe9I\xa2\x89/g\x19\xd8o\xce\x0fN|\
-z\xeb\xc8\x9em\x1e\x9b\xa9\xf7f\xe7\xc75_S\x8e\
-\xfc\x81G\x7fi\x0f\x7f\xd5M~\xb4q\xa6K\xe2\x81\
-\xc7\xa6\x81\xaf\xa8\xc6\xbe%\xc6W\xe7o/\xf1\xe5]\
-\x9f\xbfZ\x13\x82VGh\xc1\x1a\xee\xecC\x80-\x86\
-d\x85o\xd4oWg`\xc6W\xe1\x01\xd9f\xa6\x12\
-\xdd9RD\xce\xca9\xc0iq\xf8K\x80\xeb\xb7 \
-\xb3T\x8f\xb2\xe6\xdd\xf2.\xee\xfb\xa4G~\xd6\x97}\
-\xf0}\x7f\xf3[\xbf{z\x92\xa1\xf6\x95\xbdD\xb5\xc4\
-%\xf8n^.\xed\xbb\x9b\xcbtmk\xad\xbe\x1b\xb2\
-2\xf7?\xfd\xf7\xfft\xe4\xea\xeb\xde\xfa\x9d\x9f\x7f\xf5\
-\x99O\xf8\xb3\xba\xcc\xfe\x05\xa9/v\xcf\x5c\x9f\xbe\xac\
-+\xe9a\x07\xf3,\xe5\x22\xf7\xe5\xed\x0f\x98q\xa1\x01\
-\x99l}\x0a\xb2^o&kr\xb5\xa7\xb50gt\
-\x04\xbb\x8e\xca\xb2\xe9{&\xa2\xd7\xcc\x1e\xc7p\xb1\x84\
-g\xcd5m\xcb\x07\xc2\xa2\xac\xd8\x06%\x0b\xebV3\
-\xbaf\xdb\x948=\xa9\x08\x9ae-z\xabu\xfa\xb7\
-\xd5\x1a[>\xc8\x86d'\x80\xa7G<\xa7\xb4\xba\x22\
-Ru\x1a\xe7l\xdcv\x1e\xb9\x86\xd6h&\xaaS\x1a\
-\xded\xabCk\xe7\x1a\xb1\xad9\xd6\xb5\xa7\xc0\xd6n\
-6\xf2\xa6\xf5[S\xea\xb8\x04\xfe\x22\xce\xcf\x0cGo\
-QZ\xba%\xe6\xa6\xe7\xb7V\x8b\xf0\xea/\xa4\xa3W\
-\xc36{\xe1\xfb\xeb\x00\xb2\xb1`t\xe6\xec\x06\xbe=\
-\xd0\x17\x17\xf3e\xe3\xe8Ys\xcf\xc2=\xf0\x80{\xe3\
-\xb5\xde\x12\xd2S\xe9\x9f\x9a\x13\xc6\x17\x1a\xb6\x03\xd0\xa8\
-V4\xc5\xd3\xf4=\x93 \xbd\xac\x8a\xd7\x02\xa130\
-\xfc+{\x87\x1d\xda\xd8\x9f\x1aN\xbf\x9c\xdb\xf6\xfc\x92\
-\x06MVQg\xb6\xae\x87~E\xb8V\x05\xc76{\
-q\xdb\xe7'1\xae\x9ft\xbd\xae\x19\xd3\xa9q\xd3\xf3\
-\x13\x80\xfaZ\xbe7\x90,M\xc2O\x944\xbe\xf0\xa1\
-w\xbd\xe3\x97\xbd\xfb\xbf\xf9\xe2\xffE\x06\xfe_\x04o\
-\xf67\x01\x80\x18\x81g}\xd7\xbe\xdfK\x7f\x03\xe0\xbb\
-\xa2\x93d^_\xfdO\xff\xf4\xe2\xe2\x89_\xf9\xdf\xbd\
-\xe1\xc1O\xfcw\xfe\x82N\xff!.\xac/x\xdd\x85\
-\x01b\xa1\xc1\x94K\xaa(m\x8e.,\xe88F<\
-{\xc3k\xee[f.G\x15o.nbm\xcfC\
-G\x9c\xf1pk\xed\x07R\x8bSkR\xf3\xea\xd1{\
-\x9b\xf0\x81\x1f\xb5\xad\x1f8\xf3\xc3\xcd\xfaG\x0c\x98\xd2\
-/\xac\xf1\xf5\xc11\xd7\xad+\x1fr\xd8\xc9\xc2p\xed\
-\xd4mc\xc5\xd9\xd3Z\xb2\xc1O/\x89pl5\x09\
-\x18\xfb \x99[}\xe1\x89\xb3?}Yca6\xbe\
-8\xbc\x97\xe1\xe6\xe7'L\xc4\x10\x1e\xbc\xf6\xf0\x8c<\
-\xac5\xb0EM\xfc\xfe\xc0\x94\xd5\xb1\x8e \xa6\x7f\x82\
-0\xe6@3\x80\xb6[\xbf7!\xe8\xbdY;\xae{\
-+Tw\x03\x7f\xf2\x8b\x0b\xd0\x88\x097\x16\x86=>\
-?3\xa6\x17\xe6\x15\x9e\xfe\xbb\xd6\x05\x8f\xcf6\xc0\x85\
-1Sq\xf5Zq\x9b\xf3\xb3}\x9eg\x90\x07\x18\xc5\
- \x05Q\xce\xa85\xd2;\x16\x0a\xec~\xf1\xc6Zs\
-\xce\x8fui.G\xf2\xc7\x1e\xe2\xc6\x16\xa3\xb0\xd0\xcc\
-\x9ee\xdd\xf9^\xea\xf9Y\x9au\x91;\xafj\xff\xd8\
-;\x07\xbe\x91\xbd\xb5d\xa6\x84j\x85\xebb\xcf\x80\xbb\
-_\xbdw\xfdJ\x84\xdd5\x93t\xac\x15\xef=l\xac\
-\xb3\xaf\x90`\xec\x09o\xdf\x19\x1c\xe9\x9fxC\x17\xbc\
-\x1c\xe6\x18\xbb\xe8dKX]%{{=\xe0Z\xb0\
-\xf6\xab\x8cpY?vm\x92\xd3\x9b\xb1\xb6~_\x8c\
-\xc6\xa6V\x92@\x93\xf3\xab\xfa\xb5k\xef<?G\x9d\
-\x9f?\xf2\xc4\xcf\xbbx\xfc\x99o\xff\xc0?\xfe\x1b\xef\
-\x03{\x1b\xa3T\xdeF\xe4\x1d\x1c\xc2\x97\xdf\xbd0\xfa\
-0{\xa6f\xd6\xbc\xfa\x17\x80\xf3\xb3G\x1f\xbd\xfa\xd0\
-O\x7f\xf37\x9f\x9d_y<\x97\x930]%]@\
-\x02y\x8cX\xf7\xa5\xb5]\x81}\x91\xf3\xb09(\x17\
-\xda\x88\xe0\x1c\xd3x\xcd\x22\xb1\xb7E\xf4\x03\x9fh\x84\
-\xcd\x8f\x87\xe4\xcf>\xf9M\x00\xc5x {])\x87\
-\xa6\xa4\xe2\xc3|jwfa\x99\xd1\xdc\xb9\x86~\xec\
-\xce_:\xc9\xc3\xd2[\xfd\xbfxA\xaa1\xea_\xd6\
-\x16U\xbc\xf8\x13\x87\xce<\xe0\x1b\xfdr\xa2\xcb\xdaj\
-\xed,\xe4#\x9eL\xfe\xd3\xfd\x97\xc5}\x83\xd7^\xeb\
-lm\xd6\x8fK\xc3\x9c^\x07\xe3\x18\xb8\xc0\x0f]U\
-\xbf\x9c\xd8F\xfd\xb5\x0eU\xe5!F\xbc\xfc\x17\x8f\x8a\
-\xd6\x0a\xe05\xb7v\xf4,Q\xd8R\xaf\x0c\xe1f\xcf\
-\x8f\xf3\xdb\xaaut\x1aUk\x85xD\x7f6\xe0z\
-o<A\xfeS\xfa\x8b{\xe8'\x9e\xbcN\x93\x9c\xbd\
-\x1fx\xfcUg\xf2\x87+ t\xad\xfa\xb3wN\xf4\
-[aft57\xeb\x12\x16\xbc\x01X\xd0\x93\xa8\x99\
-\xbf\xf0Bl\xf0!\x1f\xf5\x1a\x8d\xce\xa6&\xbf^\xde\
-bW\xd2\xd6\xea9\x8e\xca\x1f\x10\xd1\xd1F\xcd\x87\xe7\
-7\x94YcT\xa1\xa9\xee\x9f\xb0\xee\x93\x15$w\xd2\
-\xb3\x0e\xaf\xf5\xd7z\xe0e\x1c:\xa9\xbf\x82F\xfd\x8a\
-\xb7.g\xaa\xb5\x82\xb01\x1c\xceBI\x92\x9fM8\
-;\x87\xed\xd4_\xf6\xee\x03lY\x1b1tB\xee\xfc\
-\x95\x04\x1et%Wa\x1cD]U?\x18\xe2:\xca\
-\xff/\x80\x0b\xaf\x96\xad\x15\xae\xf4\x06|r9RF\
-bp&\x7f\x04\x0c\xfd\xe4\x22\xc69\x13g<\x18g\
-\xc7\xe7\x8d\xe28\xbf\xc2\x97.\x5c\xad\x11\x1e\x86\xcf\xaf\
-\xd6LW\xae\x5c<\xfe\xf0O\xfb\x85\xbf\x97\xcfx\xb9\
-\xfb3\x1f\xe8\xa9\x17\x14\xf7\xc4\xb8\x17~\x01\xa8\xab3\
-\xces=\xf0\xbe\x08\xcc\x17\xcf\xfe\xe6\xef\xfc\xca\xf3\xfb\
-\x1e\xfc\x1c.L.M\xcfuA\x15\xc4%\xdd\x0c\x05\
-\xe6\xf2\xca\xaau_b\xdbl\xca\xe57\x9f\xf6\x07h\
-S\xe5\xf2z\x99\x8b\xeb\xeb\x1c\x1cW\xdb\x0f\x03\xdc\xe0\
-O\x10\xcc\xfc\xf1\xb3\x8fM\xc1\xc6-\xfa[A\xf3\x10\
-K\x0e\xd2W\x0e\x1e\xa1a\xab\x9c]O\xea\xcfC\xd6\
-T#\x97\xb5\x92\x0b\xaa\xe86\xa7e\x1c\xebO\xce\x8a\
-u~\xfa#<?\xd6B\x04\xb8\xd8\xd8\x19C\xac\xad\
-\xcc\xc4\xb6=9\x93_\xb6\xc0s&\xa5g=?s\
-\xc9~\xa4\x15V\xe2C\xef\xb9\xf7\xf9 \xc4\xb1Q0\
-\xd4\xf4\x07\x0f5\xe4\xacZS\xf8\xd6\xf3\xebZF~\
-8ed\x9f|\xde\x98\xfb(\xbf\x5c\xc6\x13\xeb\x1e\x09\
-\x5c\x9as~\xe57\xe7r\xfe\x8b\x80\xd6\x97\xfc\xb0\xa1\
-5\xb1\xb1\x15\xa7e\xe4\xcc\x17x\xe5\x07\x95\xda4E\
-+\x16k)N3\x17^\xeb\x1e\xd6\xaf\x8dB\xc3\xa5\
-5\xfc`\x87&xJ\x13A\x1f\xce\xf9\x917\xe7\xb7\
-\xd5\x12\xfd\xad\xb5\xea\xef\x9a\x98K\x93\xf1\x84\xd5\xe8\xe5\
-\xecU\xf4\x0d\xfd\x08\xae>`c4f\xae\xc9^v\
-\xc7\xd2\xcf\xbc:v\xd4O\xdcr\x00\xf1/\xbd\x1aZ\
-\xd3C\x87\x8al\xa3\x9f\xc45\xdc\x0b\xf9G\xfd\xc4\xea\
-\x87\xbdkr\x5c\xce\x16\x1bcI?\xd6\x946\xb5&\
-wz\x22+5\x094\xea\xd7z\xc4B(\xff\xc8\xb5\
-\xd6\xdf\x9c\xad\x89$\x1a\xa07\xf8\xa1\x15\xeb\xcc\x85\xde\
-h\xcd\xec\x1c\xf7=\xf09\xcf\xfe\x86\xbf\xf4\x95\x0a\xe4\
-o{\xd7\xcf~\xd6M\xab\xe5X\xaf6\xecw\xdd\xa0\
-\xf0{ep\x98\x87\xaf\xbe\x04\x17\xafy\xcb\xb7\xbc\xe9\
-\xfcU\xaf\xfd\xed\xb9\xe7}yh\x8d.^]>\xef\
-\xfa\x92\xb6\xad.4[_Q\xdb\x85'\xd8#\x17\xb7\
-\xbc\x8a\x89/\x0fD|\xc4\xb2\x1f6\x99\x1b\xdfi\x8a\
-,\x0f\x8b\x9c\x89\x8d\xd5\x0f-x\x14\x14\xc0x\xb6\x1b\
-\x0d\xec+\xbf~\x93\xef1\xf2\xb7A\x1c3\xff\x8c\xc3\
-M\xde\x8e/\xf2\xb1w\xea5?\xf1\x06\xd5\x9b\x80+\
-\xdeze3\x9f\x95\x11\xad\x97\xfe`ca|\xbd\xdb\
-R>\xff\x93@\x9c~\xd0\xe1uOl[\xf4\x83-\
-M\xc1O\xfd\x0e\xed\xfc\xe0\x93\xd2y\x93\x7f*\xc0\xc5\
- \xcaz\x1do\xc4\xdc;\xcf\xb49>[c\xb3\x17\
-^\x04\xd6\x9b\x8c\xc2\xcf/\xdd\xd6:\xf3\x1b5\xf1\x9d\
-\xff\xfa\xfc\x9b\x98\xa9\xa7\xc2\xa4c\xe0\x17M#\xbf\x16\
-\xe9\x17\x96|\xa0\x8e}\xc5\x0f<\x1a]C\x0a!n\
-\xe6\x93M\x1b\xef\x15\x94\x0e&>\xf8\xea)ij@\
-?\xf0\xa1\x9c\xfd\xc0\xe9\xfc\x89\x01\xe2\x90\xb2\xb1\xdb\xe6\
-W@\xe7WLb\x83J~#0\x8cA\xd4\xc8_\
-\xd6\xb1\x9f\x04\x8e\xc1=RW\xac\xf3\x0b\xe0~%\xe3\
-\xc2w\xa8\xbf\xeb7\xb1\x19X%\xdf\xa9\xf3\xab8%\
-%\x86A\x1e\xaa\xe8qT\xbf\x227\xfa\x1d\xba\xe0\xc1\
-N\xb8\x96k\xfdq\x18o\x0f\xfb\xc4\x8f\xfc#q\x16\
-\x9b\xfc\xd5\x9cq\x9f\xd9\xb7\xadp\xceP6\x84\xa6\x1e\
-\xe6\xaa_\xb6\x99\xbfA\x07\xfa\xd14\x5cY\xc3\x13Z\
-\xd5_\xbc\xd9\xe3_\xf0\xd9\xda\x06\xc5\xf9cO\xbd\xf5\
-5_\xfeMo\xd2\xd2\xff\x91/&\xbd\x90\xb0\xbe\xb4\
-\x1d\x03\xfb];\xee\xf6_\x00\xfa\xf0z\xe6 Y\xf7\
-\x17\x7f\xe6G\x9e\xb9\xef\xdaO\xfe\x82\xdfw\xe5\xca\xf9\
-Cx\xfb7\xd6\xbe\xec\xbea u\xc3\xb8l\x0c&\
-^}\xa1\xdb\x96\x99\xdf\xa2\xe3\xcb\xe3\xc9\x06\x0f\x17\xd3\
-(\xf3\x1c\xe11h\xe4B\x17\xbel&\x10\x87\xff\x09\
-\x00\x1d\xcd\xc4\xado\x5c\xd0\x95\x01\xc4|\x10\xeai\xe9\
-\xd0\xe3\xfc\xe2\xe8T\xae\x1f\xf4R\xaf\xa9{_)\xfb\
-\xc1k\xa0\xf1\xc5C\xb9\xa3\x7f\x06\xdb\xa0P\xa2\xa2\x8b\
-u\xfa\x97\xccyO\xfd@6x\xea\xd4p\xff\xc9\xaf\
-\xc5\xc8oOl\xd0\xbbG\xad\x7f\x80\xb4@\x7f\xc7j\
-f]\xb4\xdeM\x9f=\x95\xbf\xacN\x9f\xbe[\xbf\xcc\
-\x8e\x9a\x04\xd1\x06S\xe0\xc1\x17\x1c\x8c\xf3G\xb4\xb1\xa3\
-\xfe\x8a\xc9\x94\x0e\x89\x86\x0a\x86\xde\x16\xdat\xae\x9f\x98\
-\xce/\xc7\xea#\xde\xfd\xb3\xb1<\xb2\xb56,\xa3\x7f\
-\xe5\xee\xd0V\x90\xfe\x97\x13A\xd6\xc3>\xba\xbc\xea\xfc\
-\xb2v\xa4s\x10E>\xcd\x1e\x15\x97\xfc\xe8\xb8\xec\xfc\
-b\x073\xf0&\xa1\x7f\xd5[\xf90\xf1\x22\xa6G\xe7\
-\x8a\xfe\xaa\xbf\x9d\x0eCO\xa2\xd0\xb1\xe2Y\xb7\xeeh\
-\xac\xfc\x09\x97\x97\xfc\xd1\xed\x99x\xfd$\x7fX;\xb4\
-gR\xf6\x1a\x0c\xa3\xf7\x87\xe7\x17=\xf1\xfa\xfe*\xde\
-\xf5\xdbT(\xe7\x17\x89\xa8\xb0\x80q~\xcd\xdeW\x82\
-m\xfdxzt\xfd\xcc\xc1p\xc7\x18\xbd\xf7\xba \xce\
-o/o\x8a[\xebW\x0c:S\x7f\xe1M\xa2\xec\x87\
-x\xef\xc1'\xce9\x94\x11\xf3\x06\x8fC\xc3\xf5+x\
-\xe6W\xa4e\xd2\xff\x8e!\xee\x00?|\x89\x1f\xf8\xb2\
-[\xff\xf9\xf9C\xd7>\xf9\xe7|\xf3\xd9#O\xdf'\
-\xa6\xf5{\x80\xa8\xc3W\x92\xdd\xc5\xefw\xf3/\x00}\
-\xec}|\x87\x87\xdb\x87\x7f\xf1\xeco\xfbk_}v\
-\xf5\xbeO\xe7\x82pi\xfa\xe2\xf8\x82\x81\x96\xad\x07\xcb\
-~h\x98G\x92\x8a\xc16\xf1\xfd\x80\xacx\xfcac\
-\x1exn8\x7fd4^\x8e\xf1\x80U<(\xfbK\
-\x0c\xb9\x8coB\xfc\xfe\x997\x99\xfd:\x9a\x1f[\xe7\
-\xb1\xdfa\xc9m\xbb\x8c\xc9\xef@\x87\x90\x8cT\xe6\xf4\
-\xba\xf3\xe3N\x9e\xe8\x8b\x9dG<\xf9\xa7\x06\xf6-\xb7\
-\xf3\x18[!\xe6\xaf\x80Q\x7f\xb2\xfb\xbd\xf9\x9dQq\
-\x9b\xfa\xb5\xb7\x7f\xe0K\x95\xf7\xa5\xcf\x8a\xe6\x1a\x85E\
-\xac\xe9\x10\x7f\xd9\xf9\x15\xbe\xf3\x87 e\x94\x06\x84\x0d\
-\xfd\x95\x82S\x89~\x00\xe9\xcdF\x7f\x148&\x11\xa2\
-\xacZ\xd83\xd6\xfaX\xf7\x07b\xcaX\xf4\x8f\xfc\x06\
-\x19\x1b\xbc\xab$\xbd\xb9\x92\xdf\x1e\xc7D_\x04\xdf\xfa\
-\xfcL\x13\xee\xd2\xb9\xea\x1b\xf5'b\xe1o\xc8e\xe7\
-\x17\xff|\xfe&\xc1\xaaO\xd5RF\x86%/\xf5\xcb\
-3\xeeo\x9f\xb1\x22W}\xac\x1b\x0f\x97\xff\xc8\x86\x1d\
-\xc7\xd0_\xb5\x91(\xf9;e\xe3\x8d\xb6\x11\x19\xbd\x83\
-\xdb\x5c\x09\x8f\xbf\xf9\xcb\x97\xf3#'\xee\xe4\x9e\xf9\xc1\
-;\xd0>G\x80G(\x16\xad\xad_\xdb\xd8\x0ao?\
-\xa7\x97;\x86\xb7 \x8eK\xae\x05_\x5c\xcd\xd9\x9aG\
-\xfd8\x18\x12\x8b/\xd9\xb3N\xfe\xb2\x91\x06\x7f%\xc8\
-\xf9\xcd\xdcP\x10Y\xd1\x9e\x8d\xc7n\xd2`'\x9e\x1c\
-A\xf1\xce`\xdf~\xe6\x81\x17\x9b\xff\xc8\xd6~\xeb\x8f\
-1`\xe3\x15\xa7\xcf\xfag\xbf\xee\xdb~\xbd\xb6\xf7\xfc\
-\x7f\x14p7\xff\x02\xd0\x87\xce\x1d9|\xf5\x97\xff\xf9\
-\x13_\xfa;\x9f=\x7f\xe45_\xe7`Eu`\xdf\
-;\xf6\xac\x993\xb8ts\x87\xcd\x17\xaeLL\xbe\xf8\
-\xbe\xb9\x8a\x95\x81%s\x8f\xb9\xc6Qx\x9cZ\x13\xe6\
-\x07\x17\x90^\xfd\x10\x07\x8e\x92\xc4\xc8\xe95o}\xe1\
-Y\x07\x8f\xb7c\xf3!\xc0\xc3\xd0\x98u\x0d\xe2$\x1e\
-8\xf9\x05c\xe9\xfc\xa6\xc4VF\xd9\x19\x9d\x8b5q\
-\xbcbC\xff\x82\xd7\x9a1\xeb\xcf>\xf9[o\xf8m\
-s\xfe\xfa\xa0q\xce\x8aY\xd6$\x88\x15\xe25\xbf\xf6\
-r\xb4\x96\xf5\xcc\xd65\x11\xceE\xa0\xd6PO\xfa\xaa\
-\x1f\x9e\x10\x11\xa4\xb56\x9d\x94%ge\x07\x0cy\x0d\
-\xfd\xf0\xeb\x07{\x83\xd6\xb5\xad\x8d\xd7\xc6x\xf1wO\
-\xc9\x05\xd7zf\xeb\x1a\xc4\xc8\xdfx2!\xc9\xb8d\
-MN\xd9\xd0\xb2\xea\xb7\xa5\x8bY\xf4+\xce\xb1~\x8f\
-\xc7\x8f\xa1Z\x00\x00@\x00IDAT]K\x0f\xe0\
-\x19\xc1\x1d\xe5/\xcd\xc9\xdf\xfa\x85\xa8:\x93\xbfr\x8a\
-\xabk\xa5x\xa8y\xd9\xa6\x90^\xe7\xcc\x82\x19ko\
-\xab~\x02\x15\x8d6\x97\x97\x06\xd4:6\x97\xa4\xb7\xf4\
-\x8fx\x0d\xc5\x0f\xfd`c\x8a\x8d\xfeiO\x1a\xe6\x1e\
-\xeb\x1a[\xf0\xad\x8dXi2\xaa{\xdd9+\xc6\x0d\
-\xcc:\xf8f^\xf3C<\xf3\xa6\xe6\xc4m\xf4\x13V\
-}M\xe6`F\xfe\xa2vJ\xd6p\x1e\x140\xf1\xc1\
-\x8e\xfeQ\x7f6\xc1T\x1e\xe3;\xa7\xb8\xc6\xf9\x89\x1e\
-\xeaQ\xbf\xf5c\xa1\x8f\x99\xb5\x99k\xb7\xe0\xe0\xfe*\
-\xacR\x06W\xb0\xe4\x04\xdd\x9aXk\xc8?\xf4\x83\x8d\
-)\x9a\xd0\xef\xa0\xd8ki\xdb\xc5\xc3\xaf\xfe\xba'\xde\
-\xfc[^/\xdb\xfaK@\xc3{n\xc8];\xdf\xad\
-\xbf\x00\x5cv\xee\xe3\x8b_'\xca\xfa\xe2\xa1\xcf\xfc\x92\
-\xdf\xaeK\xfe0\x80\xbeH\xcc\xbd\xe7r\xf383\x86\
-\x9d\xeb\xd51\xf8\x15\xdc\xf1#N\x06b\xf4\xc7\xbea\
-/\x9e\xc6\x13\x00\xd6\x0f\x0d\xc1Z%\xa7\xf0\xc4\xc2\xaf\
-\x99\xd1\x18\xdb\x0b\x87\x9d\x87\xf4(?<\x8a1\x06\x80\
-\x06\xf4y\xb8\x16]\xc5\xd3v\x88:'sr\x86 \
-\xeb\x857\xac\xce\xbd\xcdO\x15\xc9\xe7\x9c\x8e[\xf4\x8b\
-\xce\x5c\x15\xc4D\x0d\xd8\x10\x98<\xe8\x98\x18v\xec;\
-Ok\xc4h|\xc5j\x9ax\xf1\x8d\xb8\xc5n\xae\xaa\
-[\xc1\xeeI\xf3\x0e\xbc\x0c\xe8h-\xb6\x8b\x8d80\
-\x83\xb7x\xe6\xf9\xc1^:\x09m\x8ca\xc7g)\xb3\
-k?\xca\xafLG\xf9\xabV\xe7\xaf\xbc\xac\xc1\xde\xd6\
-\xf9\xb5\x16\xf47\xbel\xc7\xf9\xbb\xfe\xd4\x82\xce\x81Y\
-\xf1\xf0(\xf9\xad\xcfo\xe9\x05\xf8\xa1\x05\xfe\x9b\xdc\xdf\
-\x8es\xfe\xd6\x82\xfe\xd4\xec\xfa%>\xfa\xf9\xbf\x7f/\
-\x9d2\xcc\xfeq\x22\x9d\xdf\x8eM-`\x83\xef\xb8\xda\
-\x1b\x93\xb5\xf1\xd4\xcaBc\xf4\x02}\xd4\xaf\x1fl\xab\
-\x8fm\xdb\x9c]{\xe3\xe5\x18\xf8\xb2]z~\xe2\x07\
-\xbb\xf2\x0a<\xf1\xce\x7f\xa0_\xfe\xae\x07\x0d=\x9c3\
-\x8e\x89\xaf\xd8y~h^\xea_\x08\xd63[\xd7\xe3\
-\xfc6:\xeb\xfe\x96-\xfa\xbb\x97\xa5\xbf\xb4P\xfb\xa8\
-_\x81\xad\x93\x99\xd7\xa8\x9fZ\x8bh\xe6\x8f-T\xd5\
-\xa7\x8a#f)\x7f\xd6\x1c\xfb\xc3\x0f\x7f\xc6\x17\xbfU\
-t\x87\xdf\x09P\x1d\xbe\xc8\xea\xd4,\xee\xa6q\xb7\xfe\
-\x02\xb0\x9e\xd1\xe1a\xf6\x81_<\xf5\x1b\xff\xc2g^\
-y\xe0\xa1_\xb2\x06\xfbb\xd5Q\xfbb\xd6\xb9\xe7\x22\
-&rs\x13\xd6\x1b&\xb7/oa\xfc`T\xf0\x16\
-?\x19\x02g\xbf\xbd\xbcd\xc2\xda\x91\xc6\xd7\xa6m\xc4\
-L\xde\xc2\xeb\x81i?35`\x98qe\x03\xac\xe1\
-G\x84\x98\xaa\x838\xb6\x8c@\xb3\x1bq\x0a\xb4\xa5\x82\
-\xfc|&\xbc\xf2L\xfe~\xb0q_\x9e\x9fD\x22+\
-\xa2\x91_&RT\x9a\xc2\xcfn\xc1\xc9\xd8>\xe2\xd9\
-\xbbf\xf9\x9c\xbf\x18\xd6\xfc\x06\xd6[\x95=L\xc9\x9f\
-\xac9\xbf\xac'\x1eD\xab\x22_\x8f\xf4e\xf5\x12\xd5\
-\x91\x13\xdf\xf1\x99\xa7\xbd\xf0\x87\xfd/\x82\x117H\xe3\
-\x18\xe7\xa2\xc4X\x88+\x88gj`\x1c\xf6\xa9\x83\xd6\
-\xf3\xcb1\x08_\x0d\xf4\x17[\x91\x8d\xfc\x90\x8d\x06/\
-\xf5W\xde\x91_8\xa0\x05\xdf\x9c?\x14=\xa6\xae\xa5\
-\xfe\x02\xdd\xde\xf9\xcd\x13\xa0\xd6\x91_\x09\x9c\xdfZ\xe7\
-\x97s\xe7\xedy\xa2\x13\xff\xe2\xcfo2\x91\xef8\x7f\
-\xfc\xe9_\x1dR7\x85xn\x90\x815\xdd\xec\xfc\x16\
-\x5c7\xf6#r~\xf4h\x9c_t\xc0O\xbaN\x19\
-\xfd\xa9e}\x9f\xf6:?\xd53\xaeGq\x10?\xe3\
-\x1a\x1d\xe6q\xfe\xdd\x86\xc3\xfa\x8b\xec\x18\x1f\x1e\xce\xab\
-\x07\x8c\xec\xfb\xce\xfb\xf9-\xe7\x16\x9f\xdc\xfa\xec\xff\xc5\
-O~\xd5\x1f\xfdL\x85\xac\x7f\x0b\xd0\xdf\x0f\x09*|\
-M\xa7l\xdb\x88;l\xc7\xff&\xf2n\x1b}H\xeb\
-\xcc\x9aW\x1f\xee\xf9\xd9#\x8f\x5c\xdc\xffo|\xea7\
-\xea\x92\xe8\xff\x88T\xd7\x86\x0b\xd8\x08\x05\xce\x0b\x93+\
-6|\x0e\xe5\xb2\xd7\x87\x8d\x1c\x1d\xeb\x0f\xce\x1b!i\
-\x9bod%\x8f\x84\x5cy\xa2`\xce\x0c)\x0f\xce\x14\
-0\xf0\x158}\xc2+\x9cPb\xb0w\xac\xe1E\x1a\
-\x1b\xbc!\xf0CQ\x5c(\xb0\xfe\x9e!\xb4\x96\x0a\xa0\
-6\xd4\x99+\xf3\x22\xedD~\xd0\xa5\x1f\x0av\xc5\x99\
-]\xea,\xd1\xa1\xad\x18gtl4u\xfc\x06/\x09\
-\xc7\xf5/\xfd/\xad[\x8d\x88g0\x97\xb6\xda\x8e\xfa\
-\x0f\xfb\xe7\xd3 h\xd1_4UV|\xf0\x11\xa3W\
-\xcf4\x05\x8d\x1d7\xf4W@\xb4eC\xb9\xec\x89\xe9\
-\x19b\xd6\xfe\x7f\xc5-\x9f3\x1c\x9d\x9fOFyr\
-F\x9e!,N20\xfa\xfc|\xbb\xcb\x17O\xe7]\
-\xfa\x07^\xc3\xfa#t\x9c\x1f|x\xcd\x1b\xb1c\xef\
-:\xf0\x1bOO\x0e\xea\xaf\xbc\x8e+^+\x1b\xf6\xf4\
-\xac{\xe5\xfa\xab\x80\xc9iD\x98K\xcc\xcd\xce/\xf0\
-\xd4&i\xeag\xf7\xcb;\xd4N\xfdZ\xa5\x8f\x98\xa3\
-\xa5\xd2\xcf\xfae\x88\xfe\x05\xbf\xd1\x8f\x9f\x0e\x15\x9e\xa5\
-1,\xc8?\xcf\x09;\xc9\x87\xfe\xce\x0f^\x7f\x5c\xbf\
-Q\x89\x89M\xd1\xe5+\x97\xf3\xf5s\xdf3\xbeS\xf7\
-\xafR:\xb5\x13\x88Lt\x91\x02\xaf\xd6C\xbfv\xec\
-\x19\xb6U\xde\x99?l\xbd'\xc6W\x02\xc6\x8a\xdd\xe0\
-eL\x7f3'Yj\xb3\xdd\xf8\xe5\xac\x94w\x8b\xd7\
-^1\xa2\x1evkk\xde\xc6\x13\xe1\xfc\x07\xfa\x0bg\
-\xbc\x89\xf5\xd6|Y^y\xf0\xdf\xf8\xd4\xdf\xa9\xef\x82\
-\x9fw\xf6\xa3?\xca_\x1f\x11\xda/\x10Fif`\
-\xbf\xeb\xc6\xdd\xfe7\x00}\x80\xcc\xd4\xda\xf3\xc5\xeb\xbe\
-\xfe;~\xc5\xf9\xd5\xfb?\x95s\xed N\x97K\xad\
-?\xe3a<\xfaP\xea`\xcd^\x12\x0b\xb0\x06\xd7\x95\
-\x1fl\xeb\x0b7\xf6u4\xaeg\xc78\xbf\xf0J\x9c\
-\x0f\x04f\x22\x84F\xd82\x8c\x93m\x83w\x5c\xe7\xce\
-\x03\xd1\x8f\xc5I\xbc\xe2'\x9e\x1c\xd1\x89-\xf93\x93\
-v\xa6\x8f\x8e\xc6\xf1\x11\xd7#\xfd;\xa8\xbf\x02O\xe7\
-\x8f\xd6\x81G\xbf5M\xed\xa3\xfe\xceS|n\x8bc\
-\x1b\x8d\xc6\xd4\xb0j7\x9e\xbaf\x01Nj\x1a\xd9\xba\
-\x0eX\xa8$\xf9\xa3\x0b_\xfbg\x95DN{\xfb\xb1\
-\x8d\xfae\x9c\x1a\x12\xb1\xc9\xdfx\x91n\xf0d/M\
-t\x00\xdf\xf6\xfcft\xb1n\xf1\xd4Y\xdc\xe9Ot\
-\xc8\xb4\xad\xbfb\xb0O\xc6E\xffbo\x9e\x8d~\x81\
-\x1a\xd73\x5c\xae_\x0a\xac\xdd\x0e\xadL@W\xab\x83\
-\x05\x08\xafb\x17\x02\xe3\xe9\x89l\xae\x9b\xb9\x02N\xe6\
-\xbf\xc5\xf9\xa1\xa9\xe9G\xfe\xd2\xd1\xf6\x93\xf7\xd7yA\
-G\x0b\xf3&?v\x1b'\x7f\xb6}~}j\xf8\x89\
-\x8c\x9dy\xe6\x0d\xa2\xf7\xde\xdd\xc6\xf9u\xfc\xe1\x1c\xb6\
-\xe8\xc47\xfc\xb5h\xfd\xc3\x0e@\xa3\xf7\xac\xdd\xff\xd2\
-\xd8\xe7r\xd8\xff\x8e\x1f~\x805\x8c\xe7L\x14t\xd9\
-\xf9\x19o\xbf@'\xcf/\x9aF\x9e\xe6><\xb7\x0a\
-\x98\x9d.\xfd#\xbf\x80\xe4\xa98\xd7\xcf\xbe\xf8\x98\xaf\
-\x9c\xdf\xf7\xa9\xaf\xfb\xeao\xfb\x15Z\xf6\xdf\x02\xd8\x1c\
-\xe4\x08\x05\xb1\xc2\xd8\xdf\x15\xe3n\xfb\x05`=\xa4\xf5\
- \xd7/\xff\xf3k?\xe5s\xaf\x9d?\xfe\xeco\xe2\
-\x04uW|\xe9\x09f\xdd\x1fV\xf6\xd5C;/u\
-~[M\xac\x82u'\xf8P\xc9j\xf2\x80e\xb4o\
-}\xa8XO|0\xb6\xc9\xd8s\xd0\xec\xa7?\xda*\
-\x06\xeeJ\x9a\x1c\x93\xb3?lf\xfe\x8e f\xd1o\
-\xd5\xe21W\xe1\xb5\xf6\xc3b\xf25\xb78d\xc3\xb7\
-\xd1/\x03\xfb\x93\xf5\x13\x0bw\xf1\x8f\x18Y\x5c\xbf=\
-\xf8\x8b\xdb\xb1\xd1X.\xd7h~r\x88\xc0\xb81\xc3\
-\x88\x1e^\xc5\x89/\x05\xc4W\xdc\xd1\x18n\xf2\x85\x07\
-<\xe7\x17\x8d\xad\x899\x96\xf0\xda\xef\xfc\x137\xf1\x15\
-3\xf2+&\x04\xe2\xa07\xf8;\x06mY\x0f<\xfb\
-\xfaAI\xea\x18\x04\xc37c\x16\xbc\xbcVZ\xfc\xe1\
-N\x0e'\xa5\x8a\xd2\xdd3\xbdI\x8e\xf8\x10d\x9f\xd5\
-Nn\x13[\x9bl\xcd\xa3\x95u\xf7La\xf8\xf8\xd1\
-z\xf8\xb2\x88\x0fm\xe5'\xdc.b\xb1\x07\x9e\xfc\x8d\
-\xf7<\x09&\xd6+\xe1\xdd\xa5\xc1\x93\xfc\xd1\x08\x8a\x95\
-\xe7\x22\x0fJ\xef\xda\x0f\x8dK\xae\x9c\x11\xbe\xd97\xfa\
-\xd8\x03{^3f\xe5!\x99<\xfe\xe9\xbc\x9b/#\
-+\xea\x88\xae?\xec\xf00\x9a\xbf\xf3z\x1e>\xf2\xce\
-W\x9f_p\x11m\xbf\x0c3\xbf\xbd6$39\xb2\
-\x22f\xe4\x95\xeaD\x86\xdfx\xd9\x92\x1f\x0fwc\xea\
-c\x8do\xe01h\x98[\xeb\x99?L\xf6\x91C\xbe\
-M\xfe\xce\xdb\xf8\xe2hT\xe6\xc9-\x82%G\xeek\
-\xe7\x8d\xc6E?:\x9a\x08\xde\x88(\xfc\x09\xfd\x8a\x15\
-\xfa\xec\xfc\xf1\xd7\xfdg\xd7\xde\xf8\xd9\xd7\x14\xce\xf7D\
-\xbf`Z_\xb0\xddu\xe3n\xfb\x05\xe0\xf0\x808\xc0\
-\xcd\x97?\xfb\xc7\xbf\xf4w\xff\xaa\xf3\x8b\x8b\xa7\xb9\x98\
->anM\xfe\xf8\xb2`\x8b/\x8f3\x0f\x1e6\x19\
-y\xf7HL\xfd\xff\x89ol\xf50\xc8\x06\x8a\xb8\x81\
-\xaf8\xae]?\xccNmr\xc5j&\x85\xb7u\x99\
-\x83o\xdb p\xcc\xd4h\x84\xb3uM\xcea\x0d\xc1\
-&\xe2P\xffR\x7f\xc5\x1a_B\xac\x9b\xday\x91z\
-\xad_\x86\xceE8\x01L<P\xcc\x9a<\xc7\x05~\
-\xe6\xc6m\x0b5\xb2.\x02\xe3\xabnra\x1e/@\
-\x1e\xe2\x81[\xbe\x99\x9f@\xff\x196\xe3\x15/\xb3s\
-1\x1b\xe8\xb9c/;?\xa2\xc9\x9f\xba\xd3\x87\x02z\
-\x8ao\xe6\x97\x91\xfcz\xb5\xcd\xf9\xb1\xe1\xaaym\xc1\
-\xa6\xfe\xa1r\xc1\x93?\xb4cv\xea\x22\xc1\xe7\x5cp\
-\x93@c\xe4\xcf\xc2vsh\xef\x88\xf5\xfc\x1a\x0f\xce\
-\xe0\xcc\x97\x9f\x1fA=\xd0\x96\x0f\xe3\xf0cO\x0eR\
-XN\x9f\x1f\x1e\x059G\xc3\xcb\x96^\x09W\x01\xe6\
-\xac\xba\xb7\xe7\xd7\xf8y\x87\xe0\xeb^\xaf\xdc\xe9\x89\xbd\
-V\x04\xe7<\xbf\x05\xaf\x90\x81o\x82\xc5F\x9b[\xb7\
-\xf1\x18&\xdc\xdc\x03\xef\xeaB\xd26\x82\xb1\xac\xaf\x94\
-\x1f\x12\xb8\xa3\x95<\xc1\xe2\x1fx\xf7\x0f\xf5\xf1;\xe2\
-\xe8\xfc\xb6\xf7\xd7x\xe75\xb9\xb0\x85\xaf\x19\x7f\xc6\xa9\
-\xf3+O\xd5-!\xa9_T\xdd\x87F3\xa3\xb9\xb5\
-Z\xbf\x05Ru\xea6\xbe\x00\xb8\xca]\x96\xec7\xf8\
-\xf2\xc4F4\xf9\x83b\xcer\x1e\x00\xfb\x89\xaf\x04\x8b\
-M\xf0\x91\xd3x\xf8\x07\xbc\xea\xd7\xbf\x0c\x8d\x0c\xe7\xe7\
-\x17O?\xfe\xa5\xbf\xfd\xcb\xb5\xe4o\x01\xfao\x02\xfa\
-{\x83\x10^\x8c\xc39\xd6;\xf8\xfdn\xfa\x05`=\
-\x9c>\xb4\x9e\xa9\x93\xd7\xc5\xb5\x9f\xfc\xd9\x0f]}\xf4\
-\xb5_\xd3\x17\x8d\x0b\xcb\x9a\x0b;./\x17N\xc1\xb1\
-\xb0H\x0c\xf7\xa7\x93\x18\xaf8l\xc41\xda\xe6M\xed\
-\xcdM\x84S\xd4\xa5\x1ekS\xdb\x97\x1c\xc5_\xaa\xc1\
-\x9a\x9b\xf8\xfaY\x95\xb1n{G\xe4A\x89\x82\xce\xc9\
-\xce\x5c\xe2\xb1\x7f\xe4\xcfC\x1c\x8d\x89\xe9\xfa\x08\x0c\xc6\
-\xc1\xcaC\x86\xc2\x17_\xc7\x92\x07'Z\xa2O{\x9b\
-d)\xa7\xb5\x0c\x7f\xec\xab\x16\xa3\xc5\xd1\x9c,f\xfe\
-p\xb3\xcf\x87B\xe1\x1d]9\xe4\xe3\xc7\xf8jB\xc9\
-\x8a\x12\xfb'\xff\xe4J\x1e\xeb5?+\xc6R?\xcc\
-\xd4\xd7\xfeu\xadH|\x0a\x89\x1f\x05U\x84\xf5\xc7\x01\
-\x83\x7f\xb6\xe7G\x1e\xa0!\xe0\xbd\xa4\xc7^\x9c\x8eQ\
-\x12\xf2\xb8~\xaf\xfb.aw`\xe57\xd4\x1a\x92_\
-{\xe2\x9dcH\xf3\xbed\xc6\x07\x85~nv~D\
-\xb4\x7f\xdb\x0b+\x8c\xbeJO\x0f\x9c\xdf\xda\xc2M\xc0\
-m\x9d_qH\x929\xcc\x0e\x8f\xc6\xd0|\xc0\xd51\
-\xb3\x7f\xcb\xf9)\xd6pQ\xacwnr\x09M\xfdp\
-\x92\xa1\x1c\xe9\x9f\x1d\xc1\x8f\xfa\xd3\xcf\x81\x07\xac\x179\
-f~\xf8\xc2\xd9\xda0\xdc\xd6\xf9A\xa2?\xc9\x0fu\
-\xf2\xc1\xd3\xfcX\xc6Y8\xbf\xc2l#\x8a\xa1\xfa\xf9\
-A\x84gl\xe4g\x86\xb2\xd6\xd6\xb8\xd8\xb2\x9c\xf9\xc1\
-w~c \x08oQ%\x87c\x0ck\x06E9\xd2\
-\xfb\xe8h\x7f\xe1-f\xd58\xf5\x01r\xfd&\xa9\x18\
-\xad\x0b\x12\xfdfN\x1c\xc9\x5c\x13\x8d\xeb\x1a\xd1\x19G\
-4j=z\xe6ZB@\x8a\xab\x8f\xbd\xe6k\xae}\
-\xfcg\xad\x7f\x0b\x00K\xff\x12@`\x97\xcb\xfa\xae\x19\
-w\xd3/\x00\x87\x87\xc2\x81\xad/\xff\x12\xa0\x7f\xfa\xff\
-\xf2\xb3\xf3\xabO;X\xde>U.\x01k\xe6\x5c<\
-.\xcb\xf4\xf7\x83+\xd3f\x18\xdf\x97O\xb7\xb3\xb1\xbe\
-\x8cr\xda/D?x\x0a\x98F\xecf\xcbEe\xed\
-\x15\x0f\x13\x17\xd4?\x0eXV(\xec\x11\x8du\xc7\xcd\
-\x05}k g_\xf8\xfe\xe0=\xca_\x02[/\xec\
-\x03\xafu\xb9k\x86\xbcs/\xf3\xa2w\xab_x\x13\
-H\x05\xb3\xb1\x07\x04\xf6W\xbdZo\xf1\xa5^\xf6\xae\
-\xc3\xfa[\x95\xb1\xd1\x01+[\xe6\x93\xfa\x11@s.\
-\x19\xa9\x9f\xf3[\xf0\xce\x1b@\xea\xd0\xba\x13mx\xac\
-\xda\x1aO\xea\x9f\xea\x8b`\x03\xb6.\xe7\xc7{i\xfe\
-\xaa\x8e\x80!F\x00\xcc\x1a-\x8b\xf9d\xfd\x0aD\xdb\
-\xc9!s\xf2\xcf/\x8d\xd6\xd3\xa9f\xfb\x0e8\x9c_\
-\xcc\xd2\xe5\x18\xb2h\xdd|v\xeb\x8d\xf33\x12\xfd'\
-\x06Vb\x99\xd19\xf3\x9bA\xdc\x9cM\xbc'\xe0\x89\
-W(!#\xbf\xf3\x86\xb8\xb59A(G\xef*c\
-i\x5c\xf5wH\xee/\xd9\x89=\x1a]\xaf\xf3/\xf8\
-\xce/\x80\xf5\x03D bz\xd4\x12V\x96\xccC\x7f\
-\xd94\x0dm\xa7\xd2cK\xbfB\xb6\xc1\x17\xbf\xeb\x87\
-\xfcp\xd8_\xfd\xb6\xaeE\xbf\xb3\x0a \xfb\xcd\xcfO\
-\x18\xc2\x8a\x9b]\xf4L\xdb\xf6\xfc:\x12@\xd6\xa3-\
-U\x8b\xf1r\xd9\xcb,\x0d\xce\xb2&\x0a\xd4Y\xf1\xa1\
-\x91\x0en\xea\xb7\x17<=b\xe3\xb7N\x1b/\xe7w\
-\xe5\x5c\x7f\x0b\xf0\x0d\xfc-\x80\xbf'j\x86p}\x11\
-\xcf\x9e\xd1svw\xe8\xfb\xdd\xf2\x0b@\x1f\xc6zX\
-\xbd\x1e\x07z\xedM\x9f\xf9\xe0\xf9\xab\x9e\xf9\x9a\x5c\x96\
-<4}\x92G\x04u\xe1\xb8L\x8c\x5c\xc8|\x08\xf5\
-\xe5\x8c\x8f\x0f\xbe\x5c=.\x17\x17\xad\x13\x03\xed;g\
-\x0c<\xfc\xc8A\xcc\xc0k\x97\xfc\xb9\xc4\x03\xefhg\
-_0\xc1\x05\x8fO\xf9\xb4\x09~\xae\xfb\x81#\x9f\xb3\
-\x92SA\xde\xad\xf9e\x18x\xd6\xf0\xd5\xab\x90\xdau\
-\xce<\x84\xd1??\x90]\xbf\x05\xa4.\xf3\x91K\x04\
-\xbc\xc8j\x8cm\x07\xf5\x93S\x80\x82\x8f5{\xb4\x07\
-\x9eUl\xd8\xf3W\x9f\xe9\xdf\xd4K&b\xfc\x12'\
-\xfe\x8eI\xfeiCc|\xe9\x0b\x18\x19F/\xd8[\
-?\x0a\xf8\x83\x0f\x1b?\xbd&@{\xd4\x1b\xbf\xac\xcd\
-\xefh\x85\x18\x13]\xe6\xdc\xe0e\xef\xfa\x15\x09\x0e\xae\
-y~\xc0\x97\x9c\xde\x96\x16\x93M\x8c\x5c\xc1z\xae\xb3\
-Rn\x06\xbaQyR?\xf9]@x\xadA\xfbh\
-5<5\xdb\xb6h\x19\xf9\xab~\xed\xbb\x16\xe8\x9c\xcb\
-\xc9\xb3\x8a\x0d{tbe`\xe7\xc5\xc8\x1a=\xf3\xac\
-\xccd\xee\xd6D\x1e\xd6\xc2\xeb\x8f\xf5\x06>\xd6\xf0\xc4\
-\x9d\x98\x9c\xd9Z\x7f\xf8!@}\xf2\xcf\xb5\xf9\x8b\x83\
-\x98y\xe6\xf0\x12\x97\x99\xb4]\xf3\xban}\xaeP\xf1\
-\x03S\xb8\x81?\xd4\x0f\x9f_\xa5\xb5zt\xac\xbf\xf3\
-\xa7\x17\xe4C'\xc3\xfd\xd0\xde\xf5\xf3\xa6a\xbcm\x8b\
-\x16\x07,\xfa\xd9\x0b\x9c\xfc\xb0\xf1c\xb0W\xd8\xd9\xcf\
-Z\xc2\x9d\xfeeM\xb8\xf1\xe2!.\xe9+\xa7\xf3o\
-\xb5\x10`\xbd\x00\xa1P\x8c\xf1z7\x1e#\x7f\x88\xc3\
-\xc6O\xafM\x1e;\x98\x10t\xfe\xec\x1c\x82\x07\x8c\xf3\
-7>6P}~W_\xf5\xf4W_\xfb\xf8\x7f{\
-\xfd[\x80\xfe\xee\x08}\xa8\x81\xdc5\xe3n\xf9\x05\xe0\
-\xf0@r\x87\xfa.\xd5ou\x8f\x7f\xc57\x7f9\xff\
-y\xcfz\x9a\xe3\x92\x89\xe1pm\x92\xdc\x9a\xe2\xe7\x12\
-\xf5\x87E\xc8\x8d\xa9[\x96uB\xb9\xa8\xc1\xb3_\x1f\
-\x8eC<\xde\xf8\xa1\x99\xeb\xc2W\xe6\x9e\xfc\xb0\xf0\xa6\
-\xe1\xc7A \xf2\x1a\xd9k\xb9\xb1M\xfd\x0e'd>\
-l\xc6'\x9f\xe10\x80\x1fZ\xc0\xf3\x82\x05 \x1c\xd9\
-'\xbd\xd6\xce\x13\x9c\xbd\xce\xcf*\xb6\xe4gc\x93\xe7\
-\xd1?9\xf1;c\x09\xd8\xae\xe3'f\x1d\xe6\x8c\x98\
-\xe0\x0f4o\xf4\x93\xa3E\x9a$\x9a\x9b\x93\xf9\xf0\xcc\
-J\x8au9\x97\x8b\x9d\x05\xd0\x8f->5@\x0fv\
-\x93_\xb6\x8e\xc5\xcf\x80\xae\x19\xf0%\x7f\xf8Y\x9bD\
-\x0e\xd6\xf8\xad\x1f`\x8d\xe0\xb31\x9e\x8c%:\xf3\xe4\
-2\xde,\xb1\xa1\xce\xfaqh\xa45\x07\xf8\x0a\x9d\xf9\
-\x158\xe1\xd6S\xf0b^\xf0\x90\xb6\x16\xf8\xeb\x85\xb9\
-\xc7j;u\x7f\x07\x9e\xfa\x15\x9c\xf3kt4\x1f\xe7\
-\x8f\xdf\xf5\xb7~\xd7\x0a\x07\xd1\xb3\x80y~\xe9/r\
-\xd73\xeb\xd8M\xfd3}4\xd5\xde\xcc\x22H\xdf)\
-\x1d2\xbd\xe4\xa8\xc9\xf1\x0b\xfc\x18Ov\x8252\xcf\
-5\xfc\xb9+\xe1T\x84\xf7.\x09\x9f\xf3\x80\x07]\xf8\
-em|\x82:@\x98\xbe}\x96\xe9\xdaG\xfe\x908\
-\x16[\xf2\x07\xda\xef\x83S\x06\xd6\xc6\xae\xfa\xbd\xd6\xc9\
-\x82W\xc0\xe6\xfc(\x03[\x91\x19/\x05]\x80\xcf\xa1\
-\xb9\x5ck\xe1k=\xea7\xbe\xcf\x8f\x82St\xd7\x81\
-{\xe8\xafd#\xe7a\xfd\xe4\xeb\x9c\xfc-\xc0\x97|\
-\xe3\xaf\x14|\xfd\xe2\x07\xba\xbe\xa0\x1ftl\xee\xe4q\
-7\xfc\x02\xb0\x1e\xc6zP\xac\xfb \xcf\xcf\x1e~\xf8\
-\xe2\xe2\xb1'\xffC.F_\x14_\x12_\x88\xbe\xb0\
-\x82\xf8.qy\xb1q\xb4\xbe\x96\xbe\xb8\xb9+\xf5\xff\
-b\xc5\xbd\xd1O?P\xbd.\x02\xdd\x10\x7f\xbcy\x0b\
-\xae\xf7\xce\xef\x1b\x83\x0e.xnS\xaf\xfb2&\xbf\
-\x05X/q\xad=\xfa[\x97\x98K\xb6\x1f\xb6H\x1e\
-6\xf8\xac\xcd\x95\x14\x87,\x09\xe3!\xe2\x07\x99\xa9%\
-\xae\x83\xfa[\xbf\xe6h0|\xe8jm\xc9O\x10u\
-U\xfd\x0b\xb7\x95X\x0fFv\xa9=\xf9\xb3\x0es\xf7\
-\x84\x88\xe4\xec\x98\xee\xc1\xb0+\x0f?\xd8\x9d\xdf\x90\x03\
-\xfd\xae\x0d\xa2p93k\xdb\x0f\xea'H\xc3\x9c\x06\
-\x80\xc9\x1e\xbb\xf3\xb3\x00\x8d]\xc2\xac\xad\xd66\xca\xeb\
-\xfa\x09 \xd2\xda\xbc(\xbc\xec\xb2\xe1\x1d\xf8Z\x1b\xa1\
-7\xec\xd1\xc9\xbb\xea\x91\x9f\x91\xfc\x8e*{\xd5O\x8c\
-@I\xb9]c3^\xf3\xfa\xff\xa2\xd8=s.k\
-\x9cwv\x9c\x1f\x98\xe2\xf6\xaat\xc7\x1a^\xd7/m\
-\x99\xa3\xcd\xeb\x88\xb1f\xe7\x87\x09\xfc\xb0S\xa7\xf4\xcb\
-\x89)9]\xe4\xb0%\x0f\xf5`'\x0e5\x16\xe59\
-\xd5'jh\x96'\xe7\x17.sW\x07\x83\x97\xdd\xae\
-\xf0Fk\xe5/m\xe6\xaa5\x18\xf6\x88\x1cx\xd6\xe2\
-\xc0^\xd2\xa2\xd9\xc4\xd8\xa3)R\xd1\x93qC\xff\xc5\
-\xb3 SK\xf4\xa7\xef\xc9\x19\x82u\xed\xfc\xc5\x9b\xf3\
-#s\xe1\xc9oi\xd1hn\xb9\x8dO\xf2\xe8<\xaa\
-\xbf\xf4\x8bg\xe8/N\xb8\x93\x7f\xc9\x83\x11\xe5\xd5\x83\
-\xac\x13\x07\x81\xcc\x95\x93\xb0\xf4\x15\x9b\xe3\x84C\xa3w\
-\xe0Q\xe4?\xf4\x05G\xd5\xef\xd9Q\xb6\x07NNC\
-\xfd\x96\xfc\xd9\xbb/E\xdckf\xc6\xa1~\x0b \xb7\
-\xf3+\xa0\xe6\xa1\xcb\x18\xfd\x97\xc4\x1e{\xea+\xcf\x1e\
-z\x88\x7f?\xce\xfc\xee\xc8\xba*\xb0`\xb9\xef\x8eq\
-7\xfc\x02px\x12\xb9Q\xdc\xaa\xbc|\x90O\x7f\xd5\
-\x9f\xfd\xbc+\xe7W?\x8e\x8b\xb1\x1d\xb9\x146\xebR\
-0k\xf2Eq\xa4\xd6\xcc\xbe`&\xf4\xce\x14\xed\xe7\
-B\xfb\x22\x83\xd7\x0f\xfb\xd8\x08kN|\x5cLC\xfd\
-\xd6\xeb\x5c\xde\xd8\xfb\xe2\xc6\xa6`k\x12\xa7\xb9W|\
-\x1e\x1d\xfc\xfacn\xc7\x8a\x86G`\xd8\xb4nM\xce\
-\x9fH'\x8b\x14\xf0\xd16\xb5\x82\x8fn\xc8\xd2\x13\xfd\
-\xb5\xbb\x00\xad\x19\x82\xd4\x5c\xb1\xf0:\xb6\xeao\xce\x9a\
-;Gr:\xfdP2{\x05g\xf8ls2tt\
-\xfdY\x07\x9dX\x92N\xad\xd1\xac\x94\xb3&4\xe9\x87\
-\x18Fu\xad\xd6\x9a\x88\xd5Oj\xc9\xcc>6\xc2\x9a\
-\xb3\xf0K\x01\xdd\x8b\x91_\xd1\xad56zr\x09^\
-.S9\xff\x5ccsv\xf7-\xbb\x9b\xea'\xda\xb1\
-\xabV\xd2&\xaf\xdc>3\xf6\x8c\xdc\xffZ\x07R\xb1\
-\xcae\xcc\xc1\xf9Q\xbf\xe2\x06\x1eL\x0d\xec\x8c\xd9+\
-\xeaH\xaf\x93\xbf\xf4\xd7\xf9\x11\x9b\xfc\xac\x88e\xa0\x1f\
-;\xcb\xeaU\x96\xf1\xe3+N\xa2}N,4\x06\xde\
-\x1a\xb5\x03/;\xd5m4\xd9\xc5\xbf\xe7\xa5\xf3x9\
-\xb8F\xaf\xec_\xf5\xcb\xd0\x9a\x10\x89\xbf^,X\xe3\
-\xc7\x93uf,\xe6\xb4\x15M\xe9)\xaa\xa8\xdf\xb1`\
-\x0a\x94X\x93\xd9F\xaa\xa1I\xeb\xbeSDl\xf0\x81\
-\xcc\x5ch\xad\x5c\x1bN\xc5Ee\xf4\x8d\xfc\xe05f\
-\xec\xcc\x95\xfcD\xa291\xc4\xb2\xde\xe0\xa9\xdf\x1aM\
-\x94\xd8Q\x7f\xd9\xd0D\x90\x06\xfa6x+C7#\
-3\x91\xe8\x1dqZ\x0c\xbc\xd6\xc3nL|\xb9Wh\
-]\xce\xcf\x94\xc59\xf2\x17\xbey\x94l\xe4\xa2\x8e\x8b\
-\xab\x1f\xf7\xf4W\xfe\xc1\xcf\x15\xb4\x7f\x01 \xdd\xfa\x82\
-\xf5\xae\x19w\xfa/\x00\x87wa\xdd\xb3\xeeC<\xbf\
-x\xe6\x13\xbe\x82s\xcc\xc5\x9e\x17\x8a\x93$\x10\xbb\xaf\
-h\xbd5QY\x09\xf3\xe8\xcb2\xe2e\xdd\xe0a\xe1\
-\x22u\xbc\xf9j\xa3\xc9\xf9kf\xcd\x18x\xf6\x8b\x0d\
-\x9f#\xcaF \xcb\xc4\x1f\xfc\xff\x89+rhU\xd0\
-\xc8o\x86\xe41_\xf9\xac\xbf\xcc\xfd\x80;M\x12n\
-\xf1\x13\xbe\xd5\x0f\xb7\x12YO\xe77IlC?\x8b\
-\x1a\x9b\xfa\xad\x8d\xd8\xf9\xd0V\xc5\xe6\x04\x12\xba)\xc0\
-x%\x1c\xff\x7f\xe2\x8aq~\x05\x96tP\x13o\xeb\
-\x82/\x9f\xeb'\x81\xc6\x06O\xbc\xb8\xb01\x88[\xc7\
-F\x7f\xf9\x06\x9e\xfdbC\x87\xd1\x0b\x05\xee\x11_\xc4\
-\xde;\x96@\xbd*\x067\x96\xd5\xb0\xcdo\xe7\xf8\x80\
-vj\x03\x16\xfd\xc5\xe7H%\xda\xe01\xca\xb6\xd1\xb3\
-\xd1\xdf\xf9\x93\x87w*\x9a\xf1Q7\xf6S\x8059\
-\x9e\x90\xe2\xcc\xbe\xf1\x07\xf7W1\xee\xd6)\xfd\xd4P\
-c\x9b\x1fc\xbeP\xa8kDi\x8d&\x06\xf6u\xb8\
-~9\x13\x1f\xdfF\x7f\xc5\x0f\xbcI&C\xb3\x9d\xc4\
-[\x81\x22\xf4g\x83\xc7P\xc0\xd6\xb3\xfeM\xcc\xad\x9f\
-\xbf\x02\x97nK\xeaze#Wu\xcf+\xfa\xbd\xcd\
-\xbf\xe8\xaf\xfa\xac\xbfk-\xdehK.41\x1cR\
-\xe9\xc7\xde\xf6\xea\xb7\xe2\x08\x1d\xfd\x98R\x09\xaf\xb2'\
-A\x9fR\xe2\x1d\xb2\xe0\xb3\xdf\xe8/\x8d\xe5q\x1e\xfe\
-E\x12'\xf1\xa4\xe9\x9a\x00PW\x03k\xde\xe6\x8fw\
-\xa3_\x88\x8b\xa7\xde\xf8\x15\x0a\xbf\xec\x7f\x0eHx\xbf\
-\xb4\xf4\x9a\xf9\x8e\x1cw\xfa/\x00k\xd39\x14F\x1f\
-\xce\xf8\xf2\x7f\xd5/}\xdb\x1b\xce\x1f\xb8\xf6s}\xb1\
-\xf0\xea\xdc;(\x97\xde\xb8q\x92\xfeBR\x10?M\
-\x0a\x06`\xefy@X\x0f|\xed\x89\xf2\xc3\xa3x|\
-\xfd 9\xa9\xf7\x0adv\x5c\xfdf\x5cA\xd8px\
-\xd6\xd2xl\x1e\x10N\x1f\x1a\x89\xeb\x0bMH,\x9a\
-K\xc0\xc4+\xb2\xf5\x07d]\x84\xd5\xf3\x124>\xbd\
-\xb6x\x0c\xb0kX7\x9b\xd2o\x93\x89\xf1\x8e\xb0\x19\
->\xfb\x95D\xf4\xa3\xf0\x9a\xdc\xe7)\xc0\x9alMH\
-\xeao2\x0a\xa0\xfe\xf2\x8d\xfaW\xbcU\x84\x97\xe0y\
-~\x02u\xfd\xa5\x12\x1eS5\xbe\xf6\xae\xc3\x8d\x11\x84\
-z\x9d\x10+\xf9k\xcf,\x8b\xc3\xc0\xb3a_o\xb5\
-\x0d\xde\x1e\xde,\xa0C5\xe7\xb4\x8e\xcfO\xf6\x22\x98\
-\xe7Wp\xe7\xcf\x9a\x98\x91_&\xf3\x81\xb3\x9d\x85\x98\
-K'6\x0f\xef\xb3\xe1\xddQ\xe8\xafu\x87\xf5<\xf0\
-\x048\x8e\xba\x8drn\xd6\xc4$\xbb\xde\x0d,\xfd2\
-\x0f\xbc\xed\x18:&\x083m\xf2;p\xe48}~\
-\x88\x09\xcf\x06\xafM\xd0\xf8\xb4\x12\xaf\xf3GT@\xb2\
-\xb5\x8f\xd8\xd1\xbf\xc2\x1a_k\x00C\xbf\xd1\xd4\xd99\
-\xea\xfc\xa9\xbf\xcfu\xe0\xaa~\xc5\x1e\xe1\xbb~f~\
-\x84!\xa6y-\x15\x1e/\xd6\xf3\x93\x91\x81~\xfd0\
-x\xe7\xb5\xc1\xe3\xd0\xe8;\xbb\xc9\xef<U\xbf4\x93\
-\xe2d~\xe3\xf5&Y\xfc\x92\xe2l~\xc3\x10\x8cs\
-\xc8s\x9c\xdf\x81\xc1@a\xbdDk\xb8\xcc\xf4\x8d\xad\
-\xf3c\x1e\xf5we\xa5_v\xe3\xdd\x0b\x10\x1a\xf0Y\
-\xb4b\xb4\x1d\xf9\xb5\xe8=\x0b\xd6\x8cm~\x0b\x90\x0f\
-ot\xb0N~\xad\x06\xee\xca\xd9\xc5\x03\x0f\x7f\xfe\xab\
-\xde\xfc\xf5?A\x81\xe3;\xa4\xd6\x80\x9b^\xcb;\x7f\
-\xdcM\xbf\x00p\x1a}@\xeb|\xfe\xf0O}\xb3\xfe\
-\xe7\x1d7\xf8\x8d\xce\x07\xde\x0f-\xf3\xf64\xb1\xe4'\
-\x04<\xe0F\xf9\xdd+\x19\xfa\xd2\xe6\x82\x96\xab.2\
-6\xfbE\xc0e\xf5\xba|\xc1\xc3\xaf!\xbf\xf11\xf2\
-\xeeAhEX[\xafK\x88}\xe6T\xf4\xc0\xe34\
-ir\xb7\xdf\xcfJ\xd9+\xc0\x98\xe6\x1c\xf8\x8e)\xed\
-\xc1\xf3P\xd4\x07\xdc\xaa\xdf\x0aJ\xab\xa6\xd1\xbf\x8a\x01\
-;\xf3\xf7\x03\x96x\xa2\xe3g\x9fu\xf0\x16`\x89\xc3\
-\xef\xfe\xa5\xc6\xd4\x16\x0e\xfb\xcb@\x1d#\xbf\xddX\x96\
-\xfc\xce\x81\xa3\xf8Y-\xfaX\xd3#\x8fC\xfd\xce_\
-\xfa\xcbG\x5c\xf2O\x88\xe1\xdd\xbf\xe1O>\x7f\xc0t\
-\xeeQ\xe2\xd4\xe7\xfc\xa6\x92\xb38\xa2/\xfc\xf3\xfc\xd8\
-+@\xc9\x92?d\x03o8o\xe1\xc6Np\xce\x0f\
-h\xe2\xc3B\x872X\xcd\xf2cM\xfe\xac\xc7\xfd\x1d\
-\x88\xca_\x04#\xbf\xfc6\xe9m\xe0\xdd?\xed\xf1T\
-\xbc\xf3\xa3\xb1\x0c\xcc\xc9\xbfZ\xb4.\xbd\xf8\xb2\x84 \
-$\x83\xdf\xbey~\x8d\x19~5o\xe8_\xebw~\
-\x94\x84\xdb\xf9-q\xe1\xaf\x5c\x97\x9f\x1f\xe8\xed\xfd\xed\
-\x14\xc9\x8f_\x11\x22o]1d\xefj\xcb7\xf3+\
-\x02m\xf5\x0a^9X49K~j\xcfl\xbcC\
-\x16\xfd\xe5\x1f\xf5W=\xa1\x02\xcf*\xb4\x03O\x0c\x7f\
-\xe4l\xfe\xdc\x9f\xd8\x83(\x7f\xf1\xa1%xVf\xd4\
-\x0c>\xd1G\xf7W\xe6\x95\x7f\xa3\x1f\x86\xca\xed\xfc\xb7\
-s~\xe2\x9b\xfd+\x05p\xc0e\x1f\xfdc\x9d=s\
-\xf2\xdb\xed5\x1ac\x9f6\xc5\x5c<\xfcS\xbe`\xfd\
-\x9f\x04\x12u\xd9\x0b\xa0Y\xc2pg\xbd\xdf\xc9\xbf\x00\
-t\xd3/;\x18\xff\xf6v\xed\xd97>p\xe5\xe1\xc7\
-\x7f9\x0fs_\x84u\xcd\xd9\xf9\xc2\xf9\xdc\xe2\x99\x91\
-\xb9\xe0\x5c\x9f\x5c\x94\x1c.\x0f\xc6:&~\xde\x12\xdb\
-t\x19\x095~\x01\x18\xdewR\xf6\xbe\xb0\x84\xc0<\
-?x\xc8\x9fK\x9c\x9c\x01\xadk0\xfd\xc0\xb16\x9e\
-\x9c\x84\xea\xe5\xfc\xd6QB\x88iQ\x05\x18\xf9eO\
-\xfe\xd2\x04.4\x9e\x09g`\xcb\x88\x1e\xd7ZF\xa8\
-;',\xe4\xc2\x8f\xad\x85\xaek\xc8F\xff\xc0*,\
-\xa1\xe2F\xbf~\xd0\x17e\xc9\xb7\xae\x89\x18\xf8\xc2&\
-?\x0a\x93\x97^8'&\xdb\xc80\xc7\x11^.\xdb\
-J7YW\xc4\xca\x05\xcb\xe8_\xc5\xb5f\xe7j\xfd\
-&\x10\x93\xb5\xb8B\xa0\x1eG\xf9\xe5FsbY\xa7\
-\x8f1RK\x07(F\xeb\x99?\x9d\x09;\xb9\xe8\x9b\
-i\xb6\xfa\x9d\xb5\x1cLN\x16#\xd4\xa1\x8f\x00\xd6\xad\
-\x83\x99\xd1\xb6l\x16<X\xfc\xfa\x19\xfd\xb3\xe5f\xe7\
-\x07\xdeLMW\xf9c\xeb\x5c\xb9\xf3m#\xcb\x1c\x1b\
-\xfd2[2\xa4U?\x91+b\xae\x93\xf8$\xde\xc5\
-N\xdd\xd6\x81M\x7f\xc6\xba$\x1c\xe1\x95 \xf5\x13\xeb\
-\xcd\x98\xad\xa5l\x81\xaf\xe7\x17\x9d\xe8\xb3\xb2\x93\xfa\xeb\
-.Tn\xa6M~\x81C\x8fVbC\xd63\xf1\xeb\
-\x9a\xc6\x80'\x8c7\xce\xce\xe7\xe7Z\x97\xfaqF\x95\
-\xfd\xbd\x06&\xb8\xbd\xac\x89J~vYG\x87<\x95\
-g=K\x82g~2\x87#\xfd+]e3\xdf\xb2\
-n\x0d\x03_\xbe(\xa5\x83\x0b\x1e\xa3\x86\xf9k\x1d\x0b\
-\xb2\x968\xc7H\xc7\xc3\x8f\x7f\xd9\xd9\xab\x9f\xbd\xbf \
-|\x97\x18\xba\xccZ\xde\xf9\xe3N\xfe\x05\xe0\xb0\xfb}\
-@\xfe\xe2\x97\xd3\xf3c\xbf\xfc\x9b~\xf6\xf9\xf9\xf9\x93\
-\x04\xf7E\xe5\x03\xb3\xd7\xbe$B\x02\xe6\xaf\xbc\x12\x97\
-\x0b\xc1\xc5\xf0\xe5 X\xc3k\x05\x0e{\x8c\xe3Ra\
-gC\xb4\xf9\x8c\xc9:\xa1\xcd[\x5c\x18}Is\xf1\
-\x8d\xc7\x22\x9e\xe8\x99k\xe2\x8a\x1e\xe3\x88!\x19\xb1y\
-\xe8*\x7f\xe3\x8d\x99\x97[(\xc7\x1a\xbf\xac\x8d\xaf\xbc\
-\x9a\x06\xb7\xeb\xec\xb8\xc5\x1e-\x93\x8b\xdc\xfe\xd0@\xa0\
-\xe3Z\xcf\xe4\xb2\xbd\xb9\x146\xb5\x04\x9bz\x0b\xef\xb8\
-|0\x8e\xb8\xe6\x85\x08tJ\xf5:\xf9\x93\xcb^\xea\
-\x17\xa1\xf5\xbb\x17\xadkj\xee\x1eC\xb4\xa9\x1f\x9c\xf3\
-g\x9ey\xc2G,\x98\xe0\xd9\x81\xcf\x0f6\xaain\
-\xb6\xbd\x0e,\xba&\xde\xf0\xa0\xc9[\xc9\x1a\x83\x8e^\
-\x1bov0x\xc8\x945s\x94\x9c\xb8\xbf\xd6wP\
-\x7f\xf3\x1a\x14M\xdd\xaf\xa2\x1c\x1f\xe2.\x09\xa3\x06Y\
-\x93s]w\xfd\xa5\x7f\x89#k\x94\x16Z\x06\xe3;\
-?f\x8d[\x9d\x1f,\x8c\xd1\x0b\xea\xd7+Z2\x0f\
-\xfd2\xb6N\xe6 \x0d\x9f\x18\xec\x8d\xd7:\xf9sn\
-(\xa4f\xb8\x99\x89k\x12c\xec\x88=\xf9\x89\xd5\x0f\
-y\x0b\x18\xee\xba\xbf\xd8\x18E\x13LtyM~\xb9\
-y\xb5\xda\xe0\xc3\x17[8\xda\xeeH\xf1\x92\x13\x91\xd6\
-\xaf\xb5\xf3\xdb\x14\x1b\xd8N/\xb3\xf9\x81h\xb1\xac\xc9\
-\x8f\xb5\xeb\x0f\x8f\xa9\x0b\x03\xc4\x08r\x1d\xad\x85\x8c\xf1\
-8\xbf\xe2[S\x18\x0c&\x81\xed\x86\x0d\xce\xe4M\x5c\
-\xf2X?b\x07\xac\xd7\x0b^\xfem\xfe\xc3\xf3\x13\xb8\
-`\xd6R\x85\x8d^:\xbf\x8c\xfa\xd3~\xf2\x9e_\xb9\
-x\xf2\xe9_\xf6\x8d\x9f%\xf4\xfa}\x02\x9a\x17\xa3\xe7\
-\xec\xee\xd0\xf7;\xf5\x17\x80n\xfe\xa9\x19[\xbf\xce\xaf\
-\xbe\xf6\xe3\xff=\xcef\xbd\x88\x0d:\xb4\x03\x1b\x17\xa3\
-I\xfct\xad\xf8y\xe1\x8c\xe7\x0d\xc2q\xc9\xe6\xcdh\
-\x11\x89S@%\xf6Tk\xdd\xbf\x1a\xf1;\x7f\xc7i\
-\xde^\xee\x0a-?|\x5c\xd6m\xfezH\xc1*<\
-\x0f\xf7\xaa\xbf\xf3e\x1e\xe9\x1d\x1b\xbe\xfe\x0d\x9d\xf94\
-\xbe\x05\x8c\xb2\x85\xae\x87\xb6\xe4\xc0\xee\xfc\x15\xba\xf6\x1f\
-_\x0f\xeb\xf7\xa6\xf0\xc5\x83)\xfa\x13y)~6\xd0\
-\xf1'\xcfO\x14\x03\xbf\x92b\x87\xbe42\x05\x1f\xc3\
-\xac\xbe\xf0\x15g\x80\xd7|\x10A\xc0\xe8\xfa\xab\xff\xb2\
-\xf8\xea\x14f\xe4'\xb4y4\xcf\xf3;\xc0\xcbG\xd8\
-\xe9\xfeC\x921\xfb\x97X\xeb/\xfey~\xf3\xc3\xbd\
-q=/\xf2\x9d\x8fz\x0a\x9e\xfc\xb5\xd9\xe8o\xb0\xe6\
-\x81\xef\xfak&$\xfa\x13<\xfb\x94}\xbf\xaf\xbc\xc4\
-[\x7f9\x8d\xaf\x07`\x8d\x1b\x02\x89'\xd6\xc0\x9a\x94\
-\xa8{\xb69?\x22\x89\xf3\xd0\xa2\xd6\xd1\x15\x02\xbf\x83\
-/\xdf8?\xedO\xe6\xc7\xde\xbc\xce\xbb\xe8\x97\x0f\x1a\
-^\x8c\xf5\x9cb\xc9\xfb\xcaK\xac\xeb/\x90\xf3\x17\xc3\
-\x1a\xb7\xc1\xf7\xa6\xca\xa3\x9eM\xfd\xc5u\x1a\xbf\xaa\xaa\
-\xfb'\xa5\xa3~q\x0f\xfdiTg\x1b\xf3\xca;\xf4\
-\x97\x97}\x7f\x96\xacq\x83T\xfe\xd1?bk\xbf\xd1\
-_\xc1\xc6\xb7\x18l\xb5^e\x19_\xe7 \xaa\xf9\xfc\
-\xc9qy\xfeN\x5c\xf57^M\xb8\xfa\xd4O\xfc\xf9\
-\xf2\xf6/\x00\xd0\xb3f\xe6\xc58\x5c\xc7z\x07\xbd\xdf\
-\xa9\xbf\x00\xac-><\x0c\xf69\xb4k\xaf\xb9z\xf6\
-\xc0#_\xc0\xe1\x8f\x87Y\xce\xdeg\xce\x87c\xdbL\
-\xa6`\xf6|\xb8x\xae\x87\xcb\x0f\x86\xd6r\xf9\xe4\x89\
- \x9e\xbd\xf1Z\xb7\x18|\xe1\xc8\x8c=\x17{\xee\x8d\
-\x91#9\xc25\xf0\xe4_^\xfe0\xc3Y6\xf6\xc6\
-\xd7\xach\xe7\xde\xe2\x15^:\xb0\xaf\xbeP\x95\xfe\x8a\
-Q\xc8&f\x9b_>\x1a0\xf2{\xe9\xbe\xcad-\
-Gx\xf1:^s\xf2;+\xd9\xbc_g8\x8e\xf0\
-&\x0e\xf7\xed\x9c\x1f\xa4d@\x94\xb5\xb3F/\xa6\x98\
-\xb5/>\x5c\xad\x83\x98\x12\xd0\x1f>\xf8b\xcb\xec\xfc\
-\xadZ\xb1\xaeD\x5ciI\xc5\x8e\xfc\xc9a\xfc\xc8'\
-\xe6\x04\x9b7xx\x16\xad\xa5S\x93c6\xf9\x0f|\
-G\xf8\xd6\x8f\xa39\xb1\xe9\x05\x0f\xe6\x99?\xfd\xb0]\
-\x0e\x87\xd1\x18#=%?6\xf0\xfa1\xde\xefs\xdf\
-v[ 9\xc4\x97\xad\xf3P~(\xc5\xa7M\xecU\
-?\xb1\xf2\x13\xc2\x1b>3\xd6\x8c\xddx(dc?\
-\xf2\x13\xa3\x17\xc3\xf8\xf2\xc5\x16\x9f\xf1\x8dj<)\xe5\
-p.\xf0Z\x0f|s\xd6l|\x82g\xfe\xc1SZ\
-\xd7\xfc\x8dGK\xc5\xad\xdc\xacm\xaf>D+wD\
-\x0e\xa9\x88&\x07i\x1d]\xf6i\xdd|\xc1\x97\xfet\
-k\xab?\xcd\x1e}\xca\xdd\x9e\xfdh^\xd4'\xff\xa9\
-\xfa\xa7\xcey\x7f8\xbfi\x8f\xd6\xa5\x7f\xe5sW\xe8\
-\x83~(+\xb5-\xfamw\xf0\xe5\xf9K\x1b\xd8c\
-\xfd\xd1\xa1\x90\xe0\x1d\xe3\xf6y\xef\x9a\xc8\xafW\xf2\xcf\
-\x5c\xec[\x97\x02\x82\x0fT\xef\xf0\xe9o\xd3\xee\x7f\xf4\
-\x0b\xce\xae\xbd\x9a\x7f'\x00\xe1\xeb\x97\xbf\xe9\x88\xbb\xd3\
-\xc7\xdd\xf0\x0b\x00g\xd0\x07\xb2\xce\xe7\xaf}\xcb7\x7f\
-\x86\xfe\xcd\x7fO\xf9\xe2*\xa8/y\x1f\x1a\xc1\x1c\xbe\
-\xe72\xea.9n%j\xbfB\x97\xa8$\xc5`\x7f\
-\x05\xf9a\xf0\xc5\x96]6\xcc\xeb\xc5/\x02O\x059\
-\xc8\xdf\x17\x96\xeb^?&\x98\x97\xb49\x82?\xa1\x9f\
-\x9c\xbc\xf4\x96\xb9\x22\xbb\x80lK\xd7\x01\xbe\x1e\xa6\x89\
-\xbdD\x7fq\xf3\xf0\x15\x9de\xf1P\xf1\x83\xad\xedy\
-p\xd5W\xfd\xacc\xfa\xa7\xd5\xfd\xe3L\xe44\x8e\xd9\
-\xf5\xbf\xb4\xf3\x83\xb9\xf3\x9c<\xff\xc5O\xec\xe1\xf9a\
-\xab\xf4\xa7\xef\x0f~\x82j\xb8z\xdf\xa9\xae\xba\xf5\xcb\
-\xd3\xfd\xaf\xd8\xe0\x0e\xfb\x9f.\xe1\xeb\xba{\x1e\xfd\xab\
-\x84\xd1\x95^\x8d\xfc\x07\xe7\x87\xb8c\xfd94\xd3\xdc\
-\xd6\xf9\x85\xbd\xf3W\xfaQw\xef\x89\x9a\xe7\xa7\xfa+\
-q\xe6\xaa_\xff\x13\xae\x8eO\xfe\xb97\xde\x1c\xe9\xe9\
-&\xae\xb8\x899\xb4\xf7\x1e\x1f-F\x03\xb6\xae\xbb\xe7\
-\xee\x7f\xc7\x1f\xce\xc6sK\x0f\xcf\xaf2\xde\x16^X\
-~\x92?\x19\xba\x0fGx\xbb\x15\xdbB\x9c\xbb\xf4\xcb\
-f3s\xf97\xf8\xf6\xfb\xfc*\x80\xfa\xeb\x07K[\
-{\xc6\xc7h\xbe1\xdb\x9a7r\xf0B\xb3qz\xb3\
-\xfe\xb2cl>\xcf\xc4\xae\xf8\xaa\x01[?\x01=o\
-\xf4\xdb\x0f0\x9aX1DW\xf9\x8fu\x1e\xe3\xd7\xcc\
-\x85w\xfe\xea\x7fLC\xc71\xbe\x02\x98\x8a\x8a\x18~\
-\xd0\xac\xff\xc7\xd8\xa7^\xfb\x1f\xbc\xfd\xd3\xe5\xbd\xec\xcb\
-\xffX\xc0By',\xef\xe4_\x00\xba\xf9\xcc\xeb\x8b\
-\x9a\xfc\xba\xfa\xf4'\xfe|\x1fh]^.2{\x82\
-}\x19\xb4\xe0\xfa\xe5\xc0\xeb\xe2i\x1fk\xec\xb9\x0e}\
-)f\x8c\xf1b\xb2\xa79\xb98&7I]\xe6`\
-\x14b\xdfQ~\xb4\x81#\xabyXiX[|\xd8\
-\xd1\xd9\xd4\x99\xb1\xa0\xb1qY\x1bM\xb2\xb2\x1b\x0b\x1e\
-\xee\xc3\xfa\xd1\xafP^\xe6t\x8c\x91\xc1\x9b#\xfcC\
-\xe3\xa25\x91\xd1\xd8\x9a\x92\x1fOq\x9b\x83\xfcK\x8e\
-\xb2\x11\xd5\xfaf~3\xe0R&p\xf3Eo]G\
-\xe1\x10M\xa5\xc4\x05\x9f\x1c\xb1\xc6n\x0eG\x10sp\
-\xfe\xb5\xb7\xb6\xe66\x11\xd9\x85\xaf\xde\xb4\x86\x93\xf9\xd1\
-7\xf2'\x87\xc1\x8b6\xe3e\x8c\xc6\xd2\xea\xa0(\xed\
-\x9a0\xf5\x87-\xeb\xce\xdb\xf3\xd0o]T>5\xc2\
-\x8d`\xcf\xd2\xe3-\xca\xd0\xb7j\x5c\xb4\xa2(\xea'\
-.<\x86Cg\xa6pL\xfd\xe6\xc6\xa9\xd1\xfc#\xbf\
-\x1f\x00\xbb\x86o\xe0\x15T0\xfb\x8c\x87\xa34\x91\xec\
-H?\xde\xa1?\xe7g\x9c\x89\xb2g\xe9\xb4Z$}\
-k3\xf9\xd0\xd1\xe77\xf0\xd6\x93\x0e\x0c\xfd8\x19\xf8\
-\xb2B\x81\xd7\xc4\xa0\x85\x11Kfl\xc6\xcb\x9a\xf3s\
-Hb\xe5K\xfd\xd16\xf0\xcd#\xba\x81\xd7\xbayF\
-\x8e\xc6\xc3\xad\x9f\x91\xd7\xf8:?\xad\x1b\xe7\xb9\x84W\
-\x8a\xca\x1f\xee\xe3\xfc\xd1\x17\x5c\xe9\x8f|\xe5\xd2\x18\xf9\
-\xd3\xe3\xc9)\x9f@\xc4\xa0\xa9\xf3\xa21\xd6\xd8\xfd\x0e\
-\x87c\x0e\xcfO^\x11\xf0\xda\x9e\x9f(`\xb13\xb3\
-{D>l\xb0\x19T\xbe\x91\xbf\xfb`\xb8\xac=\x93\
-\xfd\xa0\xfe\xf2Z\x99\xb8\xac\x1f\x1e_\x92\xc2\xc9~\xf5\
-\xb5o\x5c\xffc\x80\xc3_\x04\x08\x04\x1a\xf8\x9cCp\
-\x07\xbc\xdf\x89\xbf\x00t\xb3i\xef\xe1\xba\x0f\xc3\xf3\xf9\
-\xc3\xaf\xfa\x22/t\xa8\x0e\xf4\xe5\xc9\xa9\xb0\xf7\xa52\
-\x89\xbd\x8e\x89\xcd^\xed\xd7\x1fp}\xa5\x94X!\x03\
-\x1f\xf8\xc4\x07\xee\x18\x96\x5c*\x87L\xb8m\x03\x8f\xb7\
-b\xf2\xa0\x90*\x97\xd2x8\xf4\xf2\xa8\x1a\xd8\x0f<\
-b4\x86-\x8b\xe4\xd7z\xe4o\xfd\xd2\x11\xfd\xf5\xff\
-'N<q\x9aF\xfd\xc4\x14g\xba\xa0\xcd\x18h\xcb\
-\xc3\xdc1\xb8\x06\x9e\x85\x1f\xa6\xe2\xd0\xbe$\xe2\xf0@\
-\xd3F\x7f\xc5\xb4\xcd\xf5cS4X\xe6\xc8O\x13\xd9\
-wluw\xe6\xcfJ\xef\xf1\xf4\x5c\x040U\xfd<\
-\xf0Y\x1f\xda\xc8\xd5yG\xff\x92Z\xa1'\xeaW\xb0\
-5\xd9G\xc8%\xe7G\x22\x8d\x8d~\x12\xd5pMq\
-\x0em#\x7f\x1a\xe0H \xa3~\xe2\x8b\x22\xf7\xc7N\
-W\x9f\xda\xa3mS\xbf \x03_\xb9\x99F~\xad7\
-\xf5\x17\x7f\x87\x1e\x9f\x9f\x02\x9c6uo\xea\x8f\xab\xd2\
-/\xe7W\xbdju#\xbf\x93\xa4\xc7\xa4\xbd\xbc\xfe\x83\
-\x7f;\xe5\xc8\xcf\x22\xfa\xa1\x1a\xf8\x9b\x9d\x9fsF\x22\
-9[?Kk`\xb1\x0c4\x8f\xfe\xdd\xe4\xfc\x00w\
-\x1f\x17\xb8m\x1b\xbc\x93\x92?u'\x7f\x8c9C\xd0\
-\xa3\x00k\x9a\xf8\xc9|x~xF\xfd#L9$\
-j\xe2\xa7\xc8\xb6m\xea\xc7\x0d\xd6\xe9\xa3\x81=\xffZ\
-c\xe6\x9b\x9d\x1f\xb0\x99\x7f\xd1/`\xe7\x1a\xed[l\
-\xce_\x8e\x81\xbf\xf4\xf3\x9b,\x19\xcd\xc9\x0em\x8ch\
-\xcc\xba\xdf\x8f\xcf/\xd1\xc6\xb3\xe4\xf9\xd5|\xfe\xd0\xab\
-\xbeH\xbb\xfe\x87\xca\xa6Z\xe7\xa6\xbc#\xe7;\xf1\x17\
-\x80\xc3F\xaf\x87\xd1\xeb\xf3\xd7\xfc\x9ao\xf9\x14\xfd\xdf\
-\xfe\xbe>w\xd6\xbf\xe7\xf9\xfe\x12\xc0\x18\x0f\x9aW\xb9\
-\x98\xb6u\x80\xae\x0d\x97\x81\x97\xa35\xb1\xf4\x9d<\xb1\
-6'\x97\xe6\xff\xe7\xee]bm\xdd\xf2\xeb\xaeu\xf6\
-\xb9\x8f\xba\xf5~\xd8u\xeba\xbbLl\xa7\xca\xd8\x0e\
-v\x1c\x1c0v\xa2\x08\x1c\x14@i\x91\x18\x90\xa0\x81\
-\x84\xdcGi@\x13\x1a A\x0b\xd1\xa0\x0b\x12-Z\
-\xe9\x84 H/\x08!\x88@`GH\x0e!6\xd8\
-\xe0(\x8e-\x07\xdb\x89]u\xefa\xfc\xc6\xf8\x8f9\
-\xe7\xb7\xf6>U\xe5X\xc8w\xd7\x5c{}s\xce\xff\
-c\x8c1\x1f\xdf\xfa\xbe\xb5\xf6:\xfbt\xdb\x09\xc7\xf9\
-\xb0\x823\x0f6s\xf0r\xf28o\xc5\xecM[{\
-\xf87\xd6%\x1f,\xb0\x11\x06\xbe\xf9\xc9\x94=.\xdc\
-\x89\xb1\x7f\xf4\xdb\xb4\xb5:\x1f\x99z\xa0\xae\xa5\x9a\x83\
-}\xf5\x9bk\x82\xcd\xa1\xa4\xd86\x02\xfd`\xa7^\xfe\
-\xb1{*&\x0f\xa1\xe08\xfb\xc0EC~\x18\x08~\
-\x9cX\xab?\xede\xdb\xf4\xe6\x06\xd3>\x1a\xfa\xd9\xeb\
-\xa7\xfc@\x8dF\xb9\x15\xf3\xfa\xf5\x0bN\xfd\xe1\xc7f\
-X\x92\x81\x8f~[\xb1\xeb\x11\x01S\xc39\xfa\xe1\xa2\
-M\x9ecRG\xbe\x8eq\xe1\x1e\xecC\xbfM\xd5:\
-\xf9vck\xd1\xfe]\xfc\xc4\xc4^?}K1V\
-|k}\x06\x82\xbe\xb5\x1d\xf5\xa9ycA\x1e\x0e\xdb\
-\xc6\x01%\x1a\xfc\x03\xa1\x1a_w\xfd\x14\x13M\x01\x08\
-?b\xaa\xe3~\xfd\x14g\xea\xcd\xb1\xf8q\xa1)\x01\
-\x1c\x8d\x13d#\xae\xb9\x8a\xefjK\xf4\xf0\x92Y\xfd\
-\x97\xf53\xe4\xf2\x11R|\x1a\xf43\x7f\xc1FD\xc6\
-\x17\xdc5\x17\x09\xb4\xd6\x95oh\xe2F\x89\xeb\x8d\x0f\
-\xee^\xbf8c\xdb\x08\xf4\xc3\xaf\x1ar\xe7 ,\xba\
-\x1a\xb9bd\xb7m\x1c\xc9\x228\xf14N\xcdk/\
-\x13\xa0g\xf8\xd1\x1b\x80\xf0W\x7fpf\xfa&\x96\xb8\
-\xe4\x01\xe1\xfc\xa6+\xd0\xf9qpt\x19i\xee\x9fm\
-\x9c\xe8\x8d\xa6\xc4Z\xbf'p8\x96?\xfdSKt\
-T\xb9\xf2\x05\xee\xd4\x87\x87/~\xfa\xa7\xff\xfd\x1f\x88\
-\xe5\xd1\xaf\x02 \xaa\x0c\xda\xcf\xae<\xf7\x1b\x00&\xff\
-|\xf6N\xed\xe1\xcd\xef\xfa\xfe\x9f\xa8\x83U\xe9\xc6e\
-\xa1\x1f\x95c\xf3\xb1\xe8\xd9\xb89\xc1\xba\xba9\xd9p\
-\x1aL\x07\x1a*\x0e\xe8\x86\xda/\xba\xdd\xcc\xc9\x0f\xbb\
-\xe3\xbd\xab\xdc\xda\x07\xd9\x1a\xaf\xd6\xe6G\xf5\x08\xc8\x0b\
-/)K@\xf2\xc7\x0f,\xb1x\x97~\xb5\xed\xd6a\
-\x8d\x7fd;yri\xc3K\x8c\xf3\xe9\x09\x10wC\
-z\xb28\xef\xd1a\xe2\x15Tn\xe7\xab\xef|j\x03\
-@\x84\xd0{\x00\xd8\xc3\xf7\xa4~\x85G[\xd4=\x02\
-\x90\xb9\xb0\xd4\xd5\x00e\xa9\xe0\x87\x83\x9feD\xc6\x04\
-\x84\xffu\xeb\x970R\x03\xe0\xc6>\x88\xb4\xf3\x05\xce\
-\xe2G\xf5\xe0\x9b\xdf\x00AY\xc9\xe5\x97\x99X\xbc;\
-\x7f\xe4\xc9\xbe\xc6\xcf\x00/%\x00\xd1?\xf9\xa3\x01\xcf\
-\xe6\x07\xf7L<;\xa3\x9f9\x9a\xb1x<\xe6\x0dH\
-\xb5\x19$\x94#\x0eL\x8fz\xa6\xf2\x1c\xff\x0e\xc9\xfc\
-'v[\xe9\xabH\x0a\xda\xac\xd5\xed\xea\xd9\x91\xaf]\
-\xbf X\x01sd\xb8\x19\x83\xc7?~\xda\xe7\x88\xc7\
-\x9cj\xc5'\xaas\x00\xde\x9e?\xe6\x86\xf0;\x14S\
-\xa2w\xf4\x13\xb1\xf0F\xbfb\xae\xeb\xe7\xa4pW\xb3\
-z\xb5^\xf2\xc7\xe8\xf9\x8f\x80\xc9\xbbVY/\x05\x0f\
-w\xfa\x07?.RN\x8c\x12z\xf6r\xfe\x11\xb5\xf9\
-;\xa3\xc2\x91\x80\xa4\x82\xa2\xc4\x95\x0bf`\xff\xe1\xd6\
-/@b]\x90\x9b\x7f\xd3\x10e\xfd\xaa)\x9c\xa9\xab\
-\xcc\x98\xad\xf6\x1c?q\x86\xcf:n\xfd\x1b7\xa4{\
-\xbf\x81y\xcf\xff\xa1\xef\xfa\xa1\x7fJf\xae-\xa0\xb5\
-\xa6m\xf4\xa9\xcf\xb6L\xcf\xa3<\xb7\x1b\x80s\x92\xdb\
-f\xa6i_\x9e/?\xfc\x99\x1fgS\xf1`\xeb\xf8\
-\x84\xa0\xe5\xcd:\x17\x9b\xec\x08o\x92\x82\xb1a\x0c\xa4\
-\x83c\xc9o\x0e'\xc1\xc2\xe2\x84\xb0\xc3'\x87\xf3\xd5\
-w\xee\x88\x91\x97T\x1f\x17?\xbd\x89s\xbe\xfa\x9c\x5c\
-\xd9\xa8p\xa7M\x1f?\x14\xa08\xa7\x9a\xce|\xf9\x89\
-\x85\x17\xb2\xb6\xc1\xb1V\x8c\xfeA\xdb\xa9?\xf88\xcd\
-I\xbe\xdb\xc1\x0a\x7fcRoM\xca\x19}\xceQ'\
-\xfc\xd8\xd3\xa6o\xfd\x86\x1d\xfdf\x18\xac\xf1\xe3\x0e\xbf\
-\x11\x8cC\xab/\xf8\x92\xaer\xe43\x96s\xfc\x8e\x8d\
-f\x22\xd1\xe5|\x1d\xc3?\xe3w\xce\x13\xe3\x1f{\xd8\
-\x99\x8b\xe6\xc3\x9a'\xb8\x8b\xf3\xa2%\xea\xf6\xfa\xed\xb9\
-\xec\xfc\x08\xde(\xce\x178}\x9e\xf0`\x83\xa4\x9a\xcf\
-6s\xb2\xd7/-\xe7\xdci\x01\xa0\x9aaj;\xfc\
-\xc3\xd1\x1c9='\xe2\xf5\xfc\x8e\x98\xae\x19\xc2\xda6\
-W\xe4\x91\xe4<\xdb\x8a5\xb5*qf\xcdi\xa7\x97\
-1Y\xb50\xd0\xb8\xe6\x0fLx\xb0\xc2\xaf\xb2\xc6\xef\
-\x0e\x08\xd8\xbe\xc9\xf5\xf3\xf8\xcb?x\xe4\xebI\x0f\x0d\
-\x94\xc5\x89\xe5\x11\xbf\xf2Ipl\xb02\x7f\xc4\xc6\xee\
-\x1c\xc5\xd0\xbf\xe4\xab\xdf9\x9b\xf4\xe8\xd7\x11\xee\xa4\xa7\
-\xb54\x95\xdf\xde\xeb\xfa\xc1\xe6\xf9\xe8\xf8# \x9c\x87\
-\xad\xf3\x83\xa0\xcd\x8f\x98\x8c\xdd\x5ch\x8d\xfc\xad\xd9\x9a\
-\xee\xe6_I\xc4\xa7\x1c\xe3'v\x00^;~%Y\
-\xefN7\x16(\xe4x\x06\xd0\x81Nl\xc6<\xf9\xd3\
-\xde\xfc\x87~a:\x9f\xda\xf9\xe9\xd3&*\xb5\xf2%\
-\x00\x0dxi\xd0\xa4O\x98C\xcb\xb9l\xe4\xe3#\x80\
-Xrp\xda\x9c|\x1dG\xbd\xfe(\xd0'~\x5c\x9e\
-\xbe\xb94\xbc\xfag\x9d\xc4gx|n7\x00\xf7S\
-|.B\xdb\x0f\xfc\xd3\x8d\x17o}\xe8\x8f\xc7\xc0q\
-\x176\x06O\x0a\x15\x9b \x9b\xa4mvD\xdal\x01\
-6\xc7\xda\x19\x0a\x5c'\x1b\xbe\xf1d#N\xbel\x14\
-l\xf8y\xbaL\xc3\xb6\xb6U\x87?;\xef\xdaN\xee\
-I\xcf\x06\xb5~\x00\x95\x0bLO(L\xf7m\xfc9\
-\x1dfg\x8f\xe6G\xe3\x07\x98|&bB\xad\x1f\x0e\
-\x82;A\xe0\xa9\x0f.\x85\xda)\xe3w\xea\xd1\xc6_\
-.\xe2)\xb6\x0dB\xf2{\x9a\xb1\x0e D\x80\xf9\x1d\
-O\xd4.\xe0\xd5\xb2\xf2\xcbI\xcdS\x0eP\xf1_\xd6\
-\x0f\xdb#\xfd\xe5'5\xdc\xb0m\xfe\xe1\x1eR\xbfT\
-\xb4\x0d\x8fr\x9a\xe7\xf4\xf2GF\xc6_Xl\xca\x99\
-t\xd5\xe1N\xfe\xe8\x18\x0d\xf4\x88\xdb\xb3\x1d\x1d\xb6\x0d\
-\x00U\xf8\xe33\xcep\xd1~\xc17\xee!\x1cL5\
-\xdcOz\xf0\x09\x0f?^\xf5\xee\xf9\x87+\x0c\xd1^\
-\x13\xb5\xf9\xc9\x9b6(iOl\x83m\x95M\xfd\x9a\
-V~9\xa9y\xcaa\xfd\xcay\xb4~\xc7\x8c8\xdf\
-|\xe5L\x1d\xfe\x8co\xed\xff!}j\xfd\xcc9\xd4\
-\x9b?:\xd1;Cr\x1d\xfd\x01[\xfc\xd6\x7f\xae_\
-.N\xf8\xbb~\xc980\xed\xcb8\x8b\xefu8\xe6\
-\xc2{u\xd6\xcf\xf9\xf2\xed\xfd\xbb\xd7\xcf\x9a-\x93A\
-\xa81\xed\xf0\xa7\xbf\xf9\xab(Z\xb2\xf6I\xba\xb6\x1f\
-k\x05\xe9\xa9\xf5\x0b\xbf\xc6\x8f\xf6\xea\x97\x10\xf3\xcf\x04\
-\x86\xff\xd4\x7f\xf2Gc\xf8w;\xfa9\x06+\xb5\xf4\
-\x1bl\xc6\x8ft\xf3\x0e5m\xf9\xc1r~\xd2\xb3\x0e\
-\xb8\xd4\xef\x0c\xc4U\xcd\xb3~3\x81+_\xd1\x0fo\
-\xbd\xf3c\xb7w>\xc5\x9f\x927\xe4\xd4\xaa\xdc\xa7~\
-\xb6\xe5\xb9\xdf\x000\xf1,\x0ae-\xceg\xfe\xfc\xbf\
-\xfb\x87_<<|<{1\x1b\x93\x85\xf7>\xd1\xa1\
-\x1b\x8d%\xef\x09\xd5\xb6\x91\xd8<J`oq\xa0f\
-\xd3P\x93k\xfb\xb4K\xba\xf2!Qq\xfe\xb4\xb3\x99\
-\x22\xc0\xf9\x0eQ\x86jo\xc8\xd1F\xdbe\xece\x0a\
-\xf6\xb8\xcc\xaf\x00\xff\xb0\xc9\xf3p\x8c\xda\x05\xb0^\xc5\
-\x10\x18\xfe\xf1\x90\x7f\xea\x12)Y\x8e\xf1\x98\x9dt\xd5\
-/?\xe3A\xb0\xf5\x03e\x1d\xa3\x9f.1\xae'\xbf\
-mu7\x7f\xf3\x89\xa1\x1d\xdc\xf0\x07k\xa4y^\xa2\
-39\x9e\x9b\xc1\x92\xc5\x84\xd4Y\xbf\x5cJ\xf7\x9a\x9d\
-\xeb\xe7\xe8=3\xfa\xf7\xbd\xb0S:\xe6\xea>\xd7\xec\
-lG\xff1~\x03\xa0k\xc6\x1fW4\x8f6O\xd7\
-E\xa7\x19\xcd\x19E\x1e\x82t\xcd\xfc\xcb\xed5#\x8c\
-qq\x5c<\xe9\xdb#c\xe6\xe5\xd0o\xfe\x8eYI\
-\x8a\x89~2@\xcb<[\x0e\xf9c\xa4\x05\x8f\xb9&\
-\xa6\xda\xa2\x05\xac\xe1\x99(\xb8\xf5\xa3\x92\x1a\x9ej\x9d\
--\x82s\xd6\xcfM\xeb\xfd}\xad\x1f\xe3\x09\x94\xb0\xee\
-\xd6o<]\xcb\xce\xcdu\xfd2\xb7\x08\x7f\xac\x1f\xb1\
-\x9d#\x8f\xca\x9dG\xebg\xfe\xc9\xcf\x0c\xfa\x98\xd1O\
-\xbe\x80:7{.\x923\xf2\x87\xdf\x13\xe86:\xcd\
-\xcf\x18\xd5\xce\xd4v\xfd\xe8)\x9f\xe4\x99\x00\xeb\xa7/\
-#\x9e5/n\xe7<H\xf8ngN\x88\x1c\xfd!\
-\xb1V\xe8)\xe8\x8ef;/m\xe7;}\xf2\x85\x93\
-\x9f\xe8t\xbe\x0eK\xbf\xb58\xc4\xc0\xe1'J\xdd\xf7\
-\xef\xd6o\x04\x10\xb3\xd7\xecl\x1bb\xc4\xd1F\xc3`\
-\xc1\x83.=1Y\x7f\x84\x8d\x96\xadse\x90\xef\xe8\
-\x1c\xaf\xeb7\x5c\xc52\x0fq/>\xfe\xe9\x7f\xe1/\
-|Y\xe6\xfbO\x01\x80\x1d\x054\xd7r\xb8\xf3\x1c\x0e\
-\xcf\xf1\x06\x80\x09\xa7\xdcO<}/\xd0\x9b\xdf\xf1\xfd\
-?\xc2&\xf1\xe6p\xcd\x89\xa9e$i6\x5c\x01\xd8\
-M^b\x0c\x13\xc3\xba7\x9e\xadE\xde\xab\xdb|c\
-\x9e\xb8)\xc5J,Q\xc1\xcf&\x9d\xcd\x09\xa6\x5c\xd8\
-\xe2w\x956G\x99\x17\x17Zm\x92\x22kq\xa2l\
-\xd1Op7,\xa9al,\x96\xd1Z\xcc\x04\xe4d\
-X\xfcc\x5c\xf9\xc3\x1f\x91+vk*\xe6\xe8\x87f\
-\x8a\x91\xe0\x1a^\xcc\xd6jK\xb5\xaaV\xe0e\xfc\x81\
-\xb2\xdd\xd9\xeawY\x1ak~w\xf0u\xfci\x9b^\
-\x98\xe1\x87=\x1aEb\x1b\xf0K\xbf5\x1d\xfc+b\
-s&\x164\xb4\x86+\xfc\x06\xb26\xfa\x14$\xb5\x84\
-\xff\xe0b\x1czXQ\xd7\xcf\xda\x0e\xfd\xe6\x0fB\xa0\
-\x14\xed<l\xa3_}\xdb\x22ii\x22\x02}\x95\x10\
-~\xf2\xa3\x9b$\xf4\xa14cr\xc3\xf1\xfd3\xd7\xe4\
-\xec\xfc\xb4\xf6\xfc\x1d\xfaG\x8b5\x11\x06\xb6\xaa\x07\x1d\
-8\xc9\xdcv\x8d\xd8\xd8\xeb'\x96'\xb1/\xa8\x89v\
-~\xda\xce\x97\xc95\xb1\x02h\x9b\x9a\xb2\xf4\xab\xdd5\
-\xc1\x9e\xf1\x93C\xdbUb\xdd\xc9<\x90\x9b9\x91\x1f\
-^\xd3\xef\x9cI\xcb<Xj\xc6\xc68\x9e^?\x14\
-N>\xbc\xa6\x9d\x1c<\xce\xc3\xb8\xb9\x16?\xf1\x12@\
-\x9f\xf2\xfa\xf5\x93\xb3Z\xdd<5\xe1\xba\xe7\xaf\x8eh\
-\xcb\xae g\xf6/Z <4\xd1c..\xe3'\
-bx\xe3\x1f\xad\xd8\x88\x9cz\xf3\x87\x09\x97q\xe4G\
-Y\xdb\xd4Qz\xf0<\x1a\x7f\xe7\x02\xc6\xaeU2\xb3\
-V\x98\xc5oS\xea\xc5/\x1bfJ\xf4\x11:c\x15\
-\xac\xc7\x8f\x82\xda\xd4\x0e\xf2p:\xcf\xe9\x83s\xae\x9f\
-\xf2\x15l\xae\x0b\xff\x8b\xdb[_\xf8\xf2\x0fO*p\
-\xe73`\xb1=\xd5\xae\xed\x03Y\xf7|\xfb@\x8a\xbb\
-\x13\xc5\xa4\xb7\xdc\xb7\xcf\x05y\xf1\xf0\x91O\xfd\xd1\x06\
-x{j1[\xbaY\xa8k%\xf6\xec\xef\xcd#\xfb\
-\x8a\x0a\xc2%\x7fp\xbbi\xf0\x91K\xd9\xfc\xea\x1cD\
-\xb87_:\xdd\xb4\xe1z\x22\x7f\x01Dg\xf2\xf7\x9d\
-\xf4\xe67\xb5\x09}\xf2\xd0:4\xe1\xb5~\x01P\x1f\
-\xb2v\xdf\xfa\xe7\x842\x12Y\xbb\x90u\xd1/\xd7\xb5\
-/\xd4\x0cK\x1eE\x97d \xe8\xdf\xeb]\xf98'\
-\x01\x1b\xc5*\x0f\x10\xeb\xc7.[\xa1\x9d\xefX2T\
-\xe4\xbb\xe4c\x1bC\xf2\xe7Er\x00.z\x1e\xf1\x83\
-\x07\x80\x8a0\xae\xfcr\xc8\x064j\xa2H\xb6\x98\x9d\
-\x92\xd4\x1c1\xec\xfc\xa7\xd6\xafq\xd2_\xbd\x80\xdd\x8d\
-\xbf8\x8eV\xa0\xf9;\x1f6>1~\xab\x89\xce\x9d\
-\x1f\xbe\x9dO_O\xfd\x0c\xfdIm\x04K\x913\xf3\
-\x7f\x97\x8fs\xb4\xae\xfcd\xf9\xc8\xa1\xabv\xbe\x13\xdc\
-\xfc\x13&\x8c\x95o\xbc\xf08\x7f\xf0\xcd?\xe6\xc7\xeb\
-w\xe4\x874\xc0\xa3\xbb8\xd6\x22\x9b\xf9\xad\x0c@\xc6\
-p\x8c?\x99\xeb8\xf4\x19\xff#\xfe\xe4\x12\xbc\xd6\x8f\
-\x84&\xc9\x8enJ\xe6O\x8d\xf27\xd5\xeeS\x7f\xe2\
-\x9dD\x1e\xe2\xa8\x85S\x8f\xf5\xd3\x9f\x5c\xfc\xd8(C\
-\x97\x8e\xfb\x0a\x923\xf9A\xd8\xf9\xea\x9f\x09\xc493\
-G\x9ae=?\x89Y\xf9Ut`d\xbcG\xfe\xf8\
-\xcco\xf3\xb1\x7f\xe9\xdbv\xc4\x87\xb4\x0e\xeb\xb6I8\
-\xd6\x22r\xf3\xbb7\x00;\xbd\x8aHq\xa9\xb4\xf0'\
-p\xef\x1f\xf5\x1b\xd0xj\xd9\x1e>\xfa\xa9\x1fQ\x0b\
-\xaa\xd7=\x89|v\xe59\xdd\x00\xdcO\xee\xeb\x16\xe2\
-\xc5\xcb\xb7?\xfa\x8fy\xabj\xe1\x08\xca\x9aQ\xb7\xbf\
-Wq\xed\x95y!u\xb4\xcf^N(\xe2\x83\x90\x9d\
-\xa4~v\x8bO\xf0n\x1cr(NS\xf8dL>\
-\x0e\xbcl\xae\xfa\xa2\xc3\x17\xfec\xc3%o1\xee|\
-\xa7G\xa99\x80T\x83\xf8\x9c`\x04`k\xad\x86p\
-\xa3\xffp0\x1e\x82F\xc7\xa3\xfc\xa4\x0b7@\x9c`\
-i\xc9a\x9d\xf4\x9de\xaeK\xbe:\x8d\xb5\x0e\x86k\
-\xbe\x01\xed\xf8\x93n\x1cK\x01wr\x8d-cq\x96\
-\xfeB\x1cz\x88\x09\xd4\xcc\xcb\xf4\x09\xf5\x18\x15{\xc9\
-'l\x8d\x9fy .\x1a\x9dC\xde4\x5c;|\xc6\
-o\x83\x07\xa4\x18:\xb1\xd3\x86\x83L\xac\xc9S;\x8d\
-;\xfe\xd19\xbe\xfb\xf5s\xfe$f\x8d\x0e\xfd\x1bp\
-a;~4\xaa:\xf8\xab\x86\xd5\xebz\x11HT\xde\
-\x81K\xf5z'\xef9\x91\x87\x17\x02\x9e\xe0\xe6\x9d\xbb\
-\x1a\x1a\x9b\xdbj\x1a@\x18\x96\xc2<\xca\x82N\x8f_\
-\x9d\xea!\x806\xe52\xff\x11\xb0|k\xfc\xb5\x0f\x06\
-y\xf1\x89l\xf1\xcf\xfc\xba\xaf\xb6\x5c\xd6\x0bQ\xb5\x90\
-\xe7d\xea(X\xfc\xee\x06/\xbe\xfb\xf5;\xf4\x9b\x1f\
- \xa0\xf3\xa9\xdft\x5cu)\xacQ\xb8Y\xff\xc9\xc7\
-\xc9\x0f|\xa6\x0b\xcf\xc8\x89V|*T\x0e\x93\xfe\xb3\
-\x9fv\x00\xa2\x7f\x12\x1c\xd6\xf5T-\xf3\xa3\xfc\x09\xbd\
-\xf0\x8f-\x82\xd0&\xc3\x9a\xb3\xae\xdf\xcc\xaf\xc9;{\
-\x84\x8d~\xec\x87\xcej\xbc\xf0\xab\xd3Lsh\x02\x9c\
-o~\x1f\xc2\xeb\xa4h\x8f\x14\x0d\xcc\xb9\xb1\xa5\x9d\xa0\
-\xc5?\xe9\x02\x18\x8e\xe8r\xd4\xa1\xaba\x1e\xbf%?\
-\xa1\x7f\x82\xb2~=\x7f\xb7\x1e&\xf6Q\xber\x1e\xde\
-\xfe\xb0\xae)\xfb\x14Q\x1b\xa4>\xd5|\x9e\xe59\xdf\
-\x000\xe3\xb3\x9ck!^\xdc>\xf1\xee[\xaf\xdex\
-\xe3\xfb\xe2\xe4\xa5\x8e\xa2\xe3l\x14\xbf,\xb6\xad\xba\x00\
-\xf1g\xd3\xb2\xf1\x80f\x93\xa4\x1d\x14#\xc9\xd7\x1ea\
-\xce\xb7A\x07~\xec\xb7!\xf96\x92\x99\x12~\xda\xc1\
-\x0e\x7fr\xb1:?\xe9\xde\x88\xe1\xc7\x93\x12\x7f\x02h\
-/\xfd\xb8\xe1\x9e'\x0e\xeb\x1f{\xb2\xaf\xfa\xd0\xb2\xf3\
-\x07S\xb6rrB\xa7=\x82L\x81?h\xd4=Y\
-j|\xc4O\xd0N7\x1e\xbc\x14b\xcd\xafz,\xe3\
-\x0f>\xbe\x95\x0a\x0e}b\x8fv_tb\x8b/\xed\
-\xae\x9f\xb3\x9c\x0b\x99\xf3\xd3s;\xfc\xf0\x1c\xf8\xd3\xce\
-\xfc\xc9>|A\x82#\x00`9\x9f\xec\xc3\x16\xfe\xcc\
-M\xdbCi\xce\xda.\xf9\x06?\xf4\x0b\xf8\xba~\x8f\
-\xf5\xa19\xfc\x87~k!\x96\x99\xf9&\xd6o\x84\x81\
-\x15\x09\xd1\x00\xf0\xda\xff3\xb6\xe5w\xe4\xb1\x7f5\xf8\
-\x860\xa6\xb6\xd1\xb6zc\xb4\x7f&k\x8f\xbfS\x1c\
-n\xec\x94\xf0\xd3\x9ad\x01\x06_\xfdi\xc3\x81\xbb<\
-\xcb/\xf37\xbf~\xc15\x14\xfa/\xfc\xc3\x8dS\xc5\
-\xf8\x8f\xf4\x0f\xfb\xe4\x8e[\xfc\x96v\x1e\xb6~\xb0\xf4\
-x\xb4\x7f\xb1\x1a\xa0\xfb\x17\xfe\xad!\xfc(\x91Uf\
-\x8f\x9f61\xfc\x8c\x86\xeb\xfa5?\xd8G/\xf9\xe4\
-\x18q\xf2\xa7\x0d\xf6\xf6\xc4\xb8\xf0\xf1)/\xe7?\xb8\
-\xf8\x07?\x9d\xbd~\xee+\x80\xf9P\xdb\x98\xd3\xb6~\
-\xb9l\x1b\xcc\xb4g\xff\xca3\xe0\x108n\xe0mv\
-\xfe\xe4\xd9\x0f\xfe\x04\xac\xfd\x8bc\xca#\xfd\xb6\x0f\xbb\
-\xa9\xc8Op\xd6\xcf\xe2n7\xae)\x9fx\xf7My\
-z\x9f\x5cj\x82i\x9f}l\xcf\xa2<\xd7\x1b\x80s\
-\xc2\xdb\xf6\x9b\x82\xcf\xfc\xf3\xff\xd6\xf7h\xeb\xbc\x995\
-\xcc\x0b$\xcb\xcbfh9\xdb\xd8\xbaaXC\x83\xe9\
-`\x9bv\x827\x81\xc0\x9c~l\x0c\xf6%\xdb\x91\x84\
-\xd9>\x18\x92o\x8f|\xe4\xeba~{\x03\x10)\xc9\
-\xc5l\xae\x91\x87/\x9c\xe4\xd3\x9e\x17\xda\x18\x8db\xfd\
-\xc7.]\xfa\xc9U\x04O\xbb\xcdo\x18\xdb\x9c,\xd0\
-\x8c2=\x8e+_m\xe7\xeb\x10\xdb\xdd\xf8'\x05)\
-g\xb9\xe6\x83>\x17\x1e\xf8\xd1oN2:~+\x5c\
-\x10\xd7\xfc\xd1?\xdeD\x06\xe7\x1b\xe7gd\x99*\xe6\
-/\xfa\xa1\xb5\xe6\xd0_\xda\x0c\xf8\xeb\xaf_\x84\x9cC\
-\xfe\xba\xe3W`\xd7,\xfc\x10\x8c~\xd5\x94\xeb\xfa\xd9\
-\xbdH\xe0\xe1\xe9P\xf2\xe2Q\xdd\x16\xfe\xdd\xc6}?\
-\x7f\xbck7\xa7F\xd6w\xf3\xfb\x9d<\xfc\x03\xea\x89\
-y\x9c\x7fY?sU\xc7\xe8w\xfaL\xe6\x13\xfc\xa6\
-\x07[%Zg\xfc\xb5\x9d\x8b\xa1\x08\xf4W\x12\xb5\xf3\
-I\xc7\x1e\xb0U\xcb8\xf3\x07z\x0a\xeb\xd7We\xbf\
-\x08\xd8\xac8\xe5\x9f\xf6\xc6\xef\xf1O\xfe\xc9/\xe7\xd7\
-[?\xeb\x03@9.\xd3\xc4\x8epj\x9e\xf6\xea`\
-;\x9a\xc7\x1a\x7f\xac\xa4P<~\x9b\x12\x15xO\xc0\
-\x1a\xb75\x0f\x9e\xdb\xc94\xc1\x9a?a\x04?\x98\x9e\
-?\xc7U\xc7\xf6\x8f9(\xe7\xf8e\x01#\xe7\xc4\xa1\
-{\x04\x18\xbfb\x06\x84\xa9\xc0N)\xbf'\x00\xdcq\
-xdK\xbf\x8c\x0co\xca~}8\xf2\x03p\xc1%\
-\xdc\xf8\x83Y\x905\xfe\xe5\x07_\x04\xe6O;\x92\x19\
-\x8f0\xe8\xe0\xa7\xb8\x19;m\xfb\xed \x9f>\x16\xfc\
-\x0fo~\xfaO\xff\xcc\xf7$c\x85\xedp\xe7,;\
-=|\x1f\xf8\xc2\xf9\xf1\x1cJ'\xf3u\x13^\xfb\x8b\
-7\xbf\xe3\xcb_\xe9\x86\xa0n\x9bA\xae\xf6ig\x93\
-\xc8\x97=\xe1\x15_ql\xcc\x95C\xbe7\x82\x81.\
-\xed\x90\xe7B'\xafr\xb2\xfa\xd4+\xc7\xf6\xd9hg\
-\x9bX\x91\x83\x01\x17\xc5\x9c\xb2=\xe6\x9f]\xa58\x22\
-\xc9\x81,\xfcG\xbe\xbc\xc6\x0b\x82\xda\x07.9\xd8'\
-\x8f6cw\xfc\x85?x\x98\xf0QV\x8el\xbb\x0d\
-W\x1e\xd8\x1c\x07&\xf1g\xce\xd9V\xdc\xca\x97\xfd\xc9\
-\xf1O\xfc\x19g-\x11\xaa\xfc\xbb\xf1\xcbn\xfe\xa9\xc3\
-\x1f\x1eA\xb90k\xd8I>\xdb\xd8\x18\x01\xb6qG\
-\xbf\xba\xb1\xd8|\xd1l]&a\xfe\x94\xad\xb6\xf9\x15\
-Z\x1f\xb9\xb5\x19W\x87\xc7\xfc\xb1\x05j\xf8\xc5\xea\xbe\
-\x15\x19\x85\xf4\x83_J5\x06c\x11\xab\xc6%\x1f\x9f\
-\x0c\xc4\xe8g\x95\x95c\xfb\xe4\x13\xab\x08\x8f\x9f`%\
-vn\xc2\xbc\x01V\xfeE\x0b)d\xef\xb1&N8\
-\xc3#@\x97\x81'\xd0\xba\xc8\xa1\xe1Z\x07\xe2\xe9l\
-~\xe2\xa2\x02\x8c\xda\xc9\x09\x87\x01\x92\x0f\x14A\xd4\x83\
-I\x1d\x8b\xcd\xcb\x8e\xd11\x10\x13\xeb\x09\x8c\xde\x95o\
-\x1d\x89\x9b\xec\x85O\x0e\x0f\xd2\xc1rMSv\x9b\xc0\
-\xb4+q6\xd2_bd\x9f\x18\x00\xa0\xa7\x5c\xf2e\
-\xa3_\x9b\xfd\x90\xb9q\xe4/\x9c\xeag\xfd\xa2\x89z\
-Q\xd2\xde\x02\xdc\x0e\xed\x8c\xff\xf0\x13g\xfdJv\xce\
-\x808}\x1c\x8d\x81\xc08:8\x96zX\xa9m;\
-\xfa\xa2!\xd01\xceS+\xf5\xe4\xdf\xe98$\x0f\xd6\
-\xe4\xa3\x91\x89s-\x9b\xda\xe1o\x8d\x8e\x8d\xa9\xa69\
-\xa9/\xfc\xd6?J\x86,\x9a\x83\xd3\xb1\x90\xf6\xe6\xb7\
-\xfd\xe1\xaf\xa8\x22\xf8uO\xc2\x9eUy.7\x00O\
-MjV\xed~1>\xf2\xc9\xaf\xf4\x84\xa2\xf6&Q\
-v\x16u`\x8eL\xefm\xfa\xb3\x91\x89\xf3\xcb\x19\xb9\
-\xf3 \xeb\x92\xef\xf5\x0f\x96\xf3\xdd\xdf'\xcd\x85?a\
-w\xf9c\x04\xd7\xdb\x94~\xf3ScAV\xb1\xae\xfc\
-xSv~\xe2\xe9\x1f\xc3S;\xbd\xd7\xe6g\x00\x06\
-#r\x8d_m\x8f\x7f\xc0V>\xfd\xb1-\xf5\xee\x8f\
-\xfeG\xfc\x86\xce\xf8W^l\x1c\x17\xae\xda\xb8\xc3\x8f\
-G}\x19\xbe\xf1\xfau\xe1\xee\xf2\xc9\x9d\x07X'\x0f\
-\xfd\x96\xdf\xff\xfa\x0d\x92\xf7\xcd\x9d~\xb9\xfe\xffZ?\
-\xe6\x8a'\xdb\xa7m\x9f\xcc\xdd\xbf\xf6k\x06\x1ct7\
-\xfe\x1a\x93>\x22_\xb3\xff\xe0P\xf1\xfc\x0d\x96\x0d\x8f\
-p\x9f\xc8W\x8c\xa9T_\xe6\xff\xc0\xf1\xfe\xa5\xdfe\
-\x9cydP\x98\xd7\xfe%\xe0,\x83\xa1\xf0U\x0c\x03\
-\xce\x8c\x8fz\xc2\xd6\xbe2\xa6\x0e\xae\x85\xb9\xd2_\xb7\
-~\x83~\xd1\xbf\x18\x91\xbd\x10\x8c\xe9\xf3oH\xc3\x91\
-\xcek\xf3\x8f\x01\x10I\x5cUSw,\xd7\xfc! \
-\x1e-\x1e\xef7q\xfe\x11{W6\xfd\xfd\xfa\xc1=\
-\xd0\xaa/\xfc\x9b>\xe3\xa7\xcf\xbcS\xcd<BC\xbf\
-c9\xe7\x09_\xcb\xe6\x0f\x97\xf3\xcf\xf5\x1b\xae+\xff\
-\x18\xc3.(\xf5\x87\xf71\x7f\x98.\xf9%W}\xea\
-\x02\xf5\xb2~2,&\xf0?\xfe\x19\xfe) \xa6\xf3\
-\xa9\xee\xf3-\xfc_\xc7\xcf\xb1t]\xce\x85p\xfb\x8d\
-\xb7>\xc2\xc74\xc7\x86\xe5\x14\x99\x93\x8a\x08u\xbd\xc8\
-Z\xc3l\x96\xb9c\x94\xcb'\x9cj\x8a7\x0c\x9bZ\
-9l\xd2\xec\xc9\x00\xb4\xbfj\x83\x8aCA\xb3w\x17\
-\xffPz\xc7\x14\x0cE\xb6\xb3\xa9\x8c\x8f%6\xec\x94\
-lX\xf9_I\x9f\x1e=\x91\xea\x83\xcb\xfa\xa9\xcd\x8f\
-F\xa2\x82\x9e|0\xed]\xba\x12\x1a\xad+\x9f\x81\xa8\
-8_|\x88[\xf9r\x05\xd1\x01\x9e\x8c\xf6WM\xbe\
-\xc7\xb2U\x9e\x9a\xcac\x12\xf4(\xbc\xe3\xee8\xc2/\
-\xfb\x80\x86\x9fq\xc3?\xe3Og\xf5\x8d\xcb\x08\xab_\
-mB\x18\x80m\x8b'|\xd8\x8d\xb6\xec{\x1e\xb0{\
-\xfc\x0180\xf1$sD\xaf\xbe\xf9\x15\x1f\xfeh\x9c\
-t\xd9\xd0!\xdb\xefi\xfd\x86\x87\xcc5&\x03\xf9\xa3\
-|\x10!\xf7|\x9c\xeb\xdfX\xd6\x7f\xc4\xae|\xc7\xdf\
-\xe9\x97-315\xf9zf\xff\xc8\xc6\x98B\xd4!\
-\xdf\x1e|w\x91,\xc2\xf9\x95\x02\x1c\xd8\x17\x97\xdaW\
-\xfe\xcc\x09X\x0f\x80&\xdd\xd8\xf4mg\xad\xf4\xc0\xc7\
-\xea\xd1\xa3e\x1b-\x01n>& |\xdd7\xad\xb1\
-\xff\xde\xd7o\x8f\x83\x11\x87\x9f\xd61\xa6\xd1\x82/%\
-z<G3gd\xa0\xb1C$.s\x02\xa6\xbd\xd6\
-\xe6|\xc51\xb6\xea\xa6&9\xa3\x1e\x16\x9b\xb0\x08\xd3\
-\xf1\xaa\xdd9c\x07\x07\x0f\xf9\xa3\xc5q\x8a]k\x12\
-\xb7\xb5\x05ekM\x8e\x83\x97\xa6\xd7\xad\x9f\x95\x01^\
-\xfd\xe2\xf58\x16?\xe3'*\xba=\x225\xbb~\x0c\
-\xb3\xa5Z[\xaf\xf1\x93?\x81K\x7f(a\x01,c\
-\xa5\x89\xdd\xf8iTKi\x9c?\xfe\xc4-\xcf\xca[\
-\xfc\x8cdbW\x14\x06\xd93\xa2\xac\xd7\x1bo\xbd\xf3\
-\xba_\x014\x8d\x9a\xc4gS|Z?\x1b\xb5W\xa1\
-L\xf69\xf1\xee\xbfz\xe3\xed/y1\xc7\x99\xa0\x84\
-uS\x15f\xac\x0b\x04;\xb9\xd9L\xd9o\xd8\xbay\
-\x9f\xce\xdf\x22\x92\xcffb\xc3\x8c\x9d\xfanS\x13\x07\
-\xa9\xf9\xd9x6\xe4\x00\xf7\xe2\x1f\x8fO>\xb9\xb1\xbb\
-LB`\xd9\xa4-\x8a@\xff#\xfe\xf8\xad\x7f\x07\xbf\
-\x9e\x9f|\xa54\xb4\xf57=~\xe9Ds\xe7-\xe3\
-G\xdb\xe8\xb7\x9c=\xaa\xe2cf\x8c\x84\x85?\x9e\xfb\
-\xf9k|\xeas\xfc\x8c=\x18\xce\x9f\xc0\xea(\xff\xca\
-\x1fG\xfd\xe6\x17\x00q\xce\xc7\xa0F\xfd\x97|\xecN\
-\x98\x9a\xb6\x8a\xf5{\xfc\xd8\x1d1u<D\x14/\xf5\
-\x13\xfa\x19\x7f\xf1\xa9\x03\x93\xf9\xab]\x5c6\xcf\x5c\x99\
-\xdc\xfc\xcc\xc1\xa1\xbfq\xf8\x98\x9c\xa3?\xb0\xa3\xb2<\
-\x1d\xff\xfd\xfa}\xe3|\xb0=\xca\xd1t\x1d\xff\xeb\xf2\
-\xcf\xf1\xc3\x1d\x0c\xb4u\xdc\xadG\xfe\xcc'\xe3\xcf\x08\
-\xba?\xcc\xaf \x8f_.{\xa9\x13v\x1d\x7f\xfd\x8f\
-\xe6\xcf#0\xf6\xa4\x0dO\xecp\x04\xaf\xf3\x939\xc5\
-N\x81\x1b\x9d\xc4X\x1f5\x1d\xc6e\x07\xf6\x14\xd7\xd8\
-Z\x12\xe68|\x978\xf5\x1f\xaf_#\x0aP\xfe\xec\
-\xb1\xad3q\x8f\xf3w^[\x1e\xa54\x85?y\x99\
-g\xc6\x85\xd6\xbd^\x83\x9aTw2v\x0c\xceO\xc0\
-\xd3\xf3?1N\x9e8\xda\xe6X\xfc\x09\xca8\xee\xc6\
-\xaf\x1c\xa7\x1d\xd3\xe7|&\xda\x1a\xbb>\xd4D\xc6N\
-\xcc\x9e\x17zW\x80\xf0'\xe6~\xfdn/\xdf\xfcn\
-%p\xcd\x04\xd0\xf4\xaa[\xee\xfb\xb5\x7f\xa0\xeb\xe7x\
-\x03p?\xf9\xed\xbb~x\xe3\xcd/yQ\xd5\xf3f\
->\x8e,(6\x02\xa9YCo\x0b\x1dj[{\x85\
-\x18\xd9\xf3dc\xe7\xa4rm_\x92\xe8\x9f\xb6n\xd6\
-\x13\xdb1f\x0b\xaf\xb9\x00\x06g\x1e\x8b\x1f%q\x19\
-\xd7\xfe{\x0e\xf2\x9a?\x1a\x83)V\x1a\x03p\xe6Z\
-\xa3\x9c\xa7V\x82\xc3\x9f\xf1\xcb\xe9y\x00\x81\x82\x8c<\
-\x13\x15\x8e\x99\xbf\xc5/\x1fy#\xa0/v\xce\xb7\xb6\
-\xf8\x09'\xe6\xcaO\x1f\x8e\xe1%fV\x22\xfc\xe1%\
-'1\xd1__\xea`x\xd8\xe0\x8c\x8e\xf0+\x8b\xdc\
-y\x96\xdf\x8c\x10\xab,_:{\xfch\xb5?\xf8\xb4\
-\x0dmk\xf2\x9c\x822aU\xb7\xeb@\x07{\xfc\xd0\
-\x1d\xd2\xec\x1b\xca\xc9\x87,s\xc4\xaa\x10\x8b\x81/\xb2\
--\x8d\x1a\x00m{\x5c\x7f\xe3\xf5[\xb1zk\xe7/\
-\x07\x82i\xf0]\xc3\xe3w\xf8\xc2\x8c\xcf\x14\xe2R\xad\
-g\xf8\xa3\xed\xc2/\x1c\xfb\xc0\x0c\xd1\x9a\x07wI\xd6\
-\xb3\x0fbV\xbe}x\xb1en\xc81\xbf\x89'V\
-\xed\xf0\x8fFe\xf0\xae\x92\xcc\x17~\xf5J;_r\
-\x1c\x1d\x00\xa9\xe0\xe1\x10\x8d\xe1@\x8b\xcd\xe5P\x1f\xbf\
-\xf5\xab\xcd\xfa\x01\x9f\xf1P\x1b`i\x9c4\xe7\x04'\
-\xf8+>\x03\x08\xc7\xca\xcd\x0c\x80\xbd\xc6\xbf\xf8\xa33\
-\xf9\xd5\xe1t\x94\x05G\xb1<\x88I\xbez\xcd\xc7\xa7\
-g\xe7\xed\xf1\xfa\xc5O8\xbe3\x0f@\xfa<\xb2o\
-\xa7\x0e\xbd\xed\xa8\xcbc\xe6/\x92\xc6\x877\x18\xd6\xaf\
-\xf6#\x8e\xd1\x17\x8dw\xe3W\xb0\xf9\xd1\x06'\xe3\xa0\
-\xa2\x8d6j\x1d\xb6F\xba\xb6\xda\x16\xb7,\x93\x87\xd7\
-\xf9\x09\x01\xce\x00\xe5p/F\xf9\xde\xa7\xeb\xdc\x95\x0f\
-\x0e\x9a\xcaA-\xdb\xe2\x7f\xe3\x8d\xefR\x0a\x14O=\
-\x81\xa3\xd4\x97\xde\x07\xfc\xf8\x9cn\x00\xee'\xb6}j\
-\xca\x8bO\xfc\xd4\xcf|V\x9f\xb8~\xd8\x06\x16\x13\xa3\
-\x9f\xde\xdej\xb1\xa0\xaaT\xb0\xf7\xdf\xf9\xb2i)\xb1\
-\xb1\x09\xd4Q\x1cu\x9e\xcdw\x98\x9d\xde(\xe5 \x9e\
-X<cc\xe3\x8cy\xd5\xcd\xa6\xee\x8bAb8\x1e\
-6w\xa3\xc3~\x1d\x12\xe1\xb0\xc4\xcaP.\xeb%f\
-\xd9\xdc0\x87Z\xb2\x8f~ij\xc1\xbe\xf2k<l\
-\x98\x9c\xeb\xfa\xeb\x8c_A\xbe\xe8\x13\xad\x9fbz\xfc\
-1e\x0e\x01\xdc\xf4\xc6n\xac\xd1\x15\x9b\x90\xcc\x1b\xc1\
-\xd81\xb7>\x01\xb0\xaf\xfc\xc9u>\xf3\x9e\x89\xc8\xb8\
-\x19{\xc7O\xc0\x94\x84\x84\x8b\xb6\x89Tq\xf2\x1b\x8e\
-\xf5\x1fs\xebIu\x85\xa6\xcd\xef\x0c\xdbm\x1b\x00p\
-\x9d;\xf5%_\xb6K>\x81*\xb5\xa9\xa1\xdc\x18\x97\
-\xfeG\xeb\xf7\xf8\xafS\xae|a\x0d\xe4\x13\xe3\xcf\x1c\
-U\xab\xc7\x0f\xb95M\x9e\xe7\x11#\x1f\x93\xeb;\xd0\
-\xa8\xd1\xc9\xd5\xc7\x03o\x844G\xd8i\xc7\x9e\x97\x93\
-\xf4\xe2\xc3\x9e\x98f6\x12\xb2\xc9\x17~\x1f\xb6\xe9\xca\
-\xee\x8b\xf0L\xe0\x1a?\xce)\xb8:V\xda\x02p\xb9\
-_?\x8c\xc1\x8e?\xc7\xcc\xed\xce\xdf\x00\x9d\x13\xc4\x19\
-\x97|\xb9\x07^\xbdh\xb8\xf2\xef\x80b>\xb9~\xa7\
-~\x90\xbc\xc6'\xf6\xb6\x99\x7fX\xf7\xf8\xa3\x9e\xe3\x95\
-\x7f\xec\x92QL\xa8\x1e\xe9\xdf\xd3\xe79i,\xf3\xd3\
-R[\xf8c\xc5\xbb#\xb6\xad\xb1\xe8k\xb1\x8d\xae\xf7\
-O\xec[\xff\x16\x90\x90c\xff\x0e\xc4\xef\x7f\xfdf\xdc\
-\xc7\xfeE\xde\xc0G\xa6\xe7\xa6\xe7\xafF\xbf\x02j\x1b\
-\xfd3\xa8\xa5\xff\xc5\xc3\x87?\xfe\xe3?\xfd\xed2\x03\
-w>\x89\xbcP`Py\xca\x16\xcf\x07\xe4\xf8\x1cn\
-\x00\xbe\x99It\xcc\xcb\xef\xfe\xd1/%8G\xb6\x9b\
-\xf6\x01G\x9f\x184\xbbW\xb3Q\x15'#mG\xb1\
-i\xdc\x220v\xfbd'b\xe5\xb4=\xb1N\x07G\
-\x8f\xcb\xc9\x84\xe5\xc0&\x22\xfe\xd8O-\xce\x86\x7f\x09\
-\x80\x8f\xa7\x81\x8d\xadC\xfcc?\xb1\x08\xb6>4\x0d\
-\x06z\x14j \xd7\xdbeO\xa9&*\xb6C\x00x\
-\xd1O\x1d\x1c\x9f,\xe5\x07`\xda\xe1\x1fj\xecz:\
-\xdf\x01\x84\x19`\x8f_\xfd\xa5\xdf1D`\xa3\xe4h\
-\x0bix,@\x9e\xb8\xdc\x8f\x96\xed#f\xdc\x0e4\
-?yz\x06f\xcf/\xe6\xc6\xd2&\x80\xa8\xa7\xd7\xaf\
-\x1c\xf5\xa7\x7fj\x89\xc6\xad\xcf\xaa\xc14\x7f\xb0\xe1p\
-\x0ez\xf4\xec\xf8\xd1\xc7;}\xa2|B\x0e0z\xb0\
-Z\xbf\xfd\xa7f\xe5\x1cq\x09\xcb\xbbd\xccq\x05\xb3\
-\xbf\x875\x0f\x0e\x99\xcd\xcf\x04\xb8\xdd\x1a~\xa9RL\
-\xd7\x19\x5c\xc7X\xc9\xd6\x8c\xb25\x7f\xe3;mN\x1b\
-\x9e\xb4\xe9TW\xf9\xd1\xa2\xac\x19{\xe6\x84h\x95\xd1\
-v\xd3M\x87c\xb0\xdd\xe7cSq\xbe\xe1\xa5\xdf\xda\
-\x87\xa7\x9f\x14L\x0d@\xd7w\x8d\xbf\xf9\xf2!#\xf3\
-fX\xe3\x16\xdb\xb9\x0a\xf0w\x19Fs\xd7/1\x8c\
-~\xe6d@b1A4\xaa\xb9\xe6L\x18Y\xbf\x15\
-\xe5\x98\xcd\x9f\x8b\x91\xb1G\x1b\x02\xedg\xac\x87V\xda\
-\x0aI>\x0c\x90x\xda\x06[\x01<<\x06;\xd3_\
-Z\xc6G\xc4\xe6\x0fG\xf8\x83-\xf7\xf0\x1d\xdfx\xfb\
-\x00\x00@\x00IDAT+\xdfZL\xe26\xd8\xb6\
-\x11d\x0d\xa3\x9fn\xf9EP|\x14\xac\xb5\x80\xdf?\
-3\x7f\xe4\xa8X\xe5\x0c\xce\xd5\x99c\xfe\x89;b\x8a\
-\xbf\xc6\x8fo\xb0\xd1\xb1\xe6\x9cvY\x1cc\xb6\xb1\x0d\
-\xeeh\xb0~bT\xde\xfeG\xfe\xf1/\xa9\x22\xb5O\
-\xcc\x81\xda5\xb6gQ\xbe\xa5\xbe\x04\xf8\xe6\xc7\xbf\xfd\
-\x0b^&/\xd6,\xf6,\x0d\x0b\xef\xcd\xbcv\xc8\xac\
-\x0f~6\x08\x1b\xa21\xb3\xd8]U\x96\x97\xd7\x90\x8d\
-}\xcd\xc5\x83\x8f\x0d\x9dV0\xbd\xd9\xfc\xe2#\xdf`\
-\xe7\xe3\xcb\xc9?\xaa\xcd\x8f\xd1L\xd9\xac\x01\x0e6\x1a\
-\xdd\x97\xa0\xb1O\xe8\xb5\x8b\xfe\x19O)2L6\xfd\
-\x1aU]\xc6Bw5\xd6\xe1\xa9\x82G\x856\xb0\xbe\
-P\x05,\x0e\x1f\xef\xc6\xdf\x1cs\xa5\xd3\xb9a\x86\x1e\
-\x15\x99\xb0\x9a\x03'D\xa3\xa7r\xab\xcd\x9aj$v\
-\x84e\xfe\x9a\x1a\x8e5R5\xba~\xb3\x1c\xc6\x97\x15\
-\x04\x95\xad\xdf\xed\xa4\x1b:!R\xafD\x8f\x7f\x03$\
-\xb5\xf9\xca\xf1z+h\xd2\xa7\xaf\x00\xf8\xf5\xb0F\x9c\
-k2\xd5\x9e`\x9b\x8d\xc5\x18\xd4\xd3\xd3xc\xdb\xe3\
-\xaf\xe6\xc0\xd8m\x0c.\xfe\xf2\x99?\xa0\x9e\xab47\
-%\xd8@\x8c=\xf0t\xf2N\x1e\x07!\x94\xec\x95t\
-\xbe\xd9\xf5#\xcf\xfa\xc9\xf78\xb1\xa4\xed\xf1\x9b<\xb6\
-qD\xb3h\xaa7\xf9\xc7^\x95#\xeb'\x1b7\x04\
-*{\x96\xdd\xd1}B\xe3\x0f\xfd\x84&|\x8f\xff\xf7\
-\xbc~\x08\xe3\xa7\xeb\xc7|\x00\x1a{\xe7\xb1V92\
-\xfeo\xb0~\x1e+\xc1`\xcd\x9a\xad\xf1\x0fh\xfb\x8e\
-J\x98\xe7\x81\x94\xdc0\xa2\x83\x92\xd9\xe8z\xed\xf5\x8b\
-w\xd4\x1b\xb5\xe7_3\x93>\xf9\x10j \x9d\xdb\xec\
-\xbfD\xee\xfd\xa7\x0c\xc5\x85\x9f\xb6\x9e\xe40\x1d\xab\xcd\
-lt=\xd4T\xf1\xfca\x9b\xf5\x0bj|\xce\xbf\xac\
-\x1f\xf9\x837\x81\x96f\x8e\xf1Mj\xaa\xacy\xf6[\
-\xd5\x87\xd3\xe2\x84\xb1\xbe\x8c;\x93c\xd8\x82\x0a\x04\xd4\
-j2\x82\xb9\xb0\xc4\xda\xf1?|\xec\xdb\xbe\xb0\x8cj\
-\xdc\xb5cyF\xc7\xe7x\x03\xd0u\xea\xea\xac\xfa\xe1\
-\x9dO|\xde\xce9\x9c/D~\xf1\xd1\x82/\x9b\x16\
-\xc96V\xb0\x1bA\x9b\x83\xa6w\xc3\xaa\xb2i\xd9\x14\
-\xdd\xc4\xf8\xbb!B\xde\xa4\xc4t\xd3-.m\xee\x9e\
- \xd9\x7f\xf0\xcc\x0b\x0a\xa8N\xd7\xc1\xb8%>\xb4*\
-\xa9\x1b\x94\x1a0\xa7LM\xbbe\xb5\xc1'\xcb\x98\xc3\
-5\x9c\xc4\xc2\x9999\xc6\xaf\xe0h\x09Z\xb4\xcao\
-\x98\x8cm\xf3\x1f\xfa\xa3\xc6I\xcc\x91I}t\xb4,\
-\xc7\xf8\x89\xb2\xa6\x93\x1fc\xcaE\xff\x08Xse\xcd\
-\xc4\xdd\x8d\xbf\x94\xe0\x0eN\xa2&V/:\xcc\xc5\xa3\
-\xf5\x1b\x9c\xad\x19\xbd\xacGt\xaf\xf1{\xfd\x98\x1b\xc6\
-<\x983\x97\xe4b\xb7\xc3\xe9\xeaO\xe2Z\x7f\xf5\x83\
-\xec\xa1;\x96w\xfa\xdd\x7f \x9e\xc5c\x00\x9f,\xfd\
-\xec\xf1\xc3\x0f\x12\xb6\xc9W\xbd\xf8\x1d\xac~BFk\
-\xfa\xe7\xf8y1\xe4\x9d~\xf8=\x02!N\xd2\xcc\x12\
-\x1cQ\xad|Zr\xfb\x1b\xffv\xe4\x9d\xb0\xf3%\x04\
--gY\xfaI\xb2\xbeh=\xff\xc5\x80\xefU\x84K\
-\xac\x7f\x97\xafP\x0f\x8dxK\x99\xf1\xe3\x7fb\xfd\x1e\
-\x94\x941\xc9?\x00K\xaf\x05\x0c\x1e\xf9\xeaWk\xa6\
-\xafk\x09\xe9?\xc4\xfa\x89\xb9\xeb\xc7\xb8\x87\x8e\xa6\x8b\
-\xfb\x22\xb5\x1e\xa6\x80\xb6\x88[\x13\xb45\xa5\xad\xe0\x14\
-%_\xd7OyO\x8c\x9fU\xcb\xfa)\xde\x0a\x00\xe0\
-i\x8f\xb16$\xeb7\xfcx\xda\x9e\xda\xfb\xc7\x19:\
-\x94\x7f4c\x8e\xd6]\xc3\xc3\x18\x17\xbf;\x18\x886\
-\x84\x8fk=\x14M;\xca\x14\xa4\x1fc\xdaF\xfb\x0a\
-\xe0\xae\x10$\xcf%\xfc\xa3\x7f\x8c\x9dK0\x9d\x8f\x9d\
-x\x05\xf7\xfc\xc3`\x93|\xae\xc14\xe2h\x91\x1df\
-\x9egq?\xa4\xc9S\xbb\xf3\xf7\xf0\xe1\x8f}N\xb1\
-M\xbb\xafO\x98g\xd1~\x8e7\x00\xaf\x9b\xd8\x17/\
-\xde|\xe7s\xde5]0\x22g!\x9d\xc4\x82\xb3d\
-\xb3\x1b8\xd1\xbc5T\xc7,\xbfN6J7\xec\xfd\
-\xf6`\xc3\xf5\x0cu\x8e\xb1\xb2\x91\xd8\x83luB\xdc\
-\x0eT\xf8\x02:\xfcq8\x9f\xf8\xa4P\x15Z\xed`\
-\x1a\xcc\x1e\x00\xd2Kk<!\x15e7i\xa2\xb2a\
-I\x08Kr\x18\xbf\xfa\xe4\xe0\xd23\xcd\xea\xa7\xc6\x8a\
-\xa4i\x9f\xe9\xb2\x9fp\xc9\x8f\xf8\xb6\xed'\x1fs\xa0\
-\x80\x0bY\xab\xb1G\xca\xa1e\xf9g,\xceS\xf0\xe8\
-e\x1a\x1e\xe9\xc7\xc8\x8b\xb8b\x97f\xda\xcaq\xecx\
-\x80\x22b\xaf\x1fm\xe2\xc6n\x9a\xd8p\xe4\xc5M\x0d\
-\x07\x11\x93\x92\xf1c\xac\x0b\xfe\xdd^/\xde\xe3\xf7$\
-\xa0e\xfa\xc9${r\xac3\xbd\xb5f\x8a^\xed\x10\
-&^\xe0k\xfc\xa3+:\xed\xde\x9a\xd5]s1q\
-a`\xf4\xdb\xe0\x96\xf8\xfd\x05@r\x96\x16\xda\xba\xe0\
-\x130\xa5ki\xd3t\xd0r\xe1Wl\xfd\xcbN,\
-\xb8\xe00O4TS\xd2\x94o\xce96\xbf\xe3\x06\
-\xd7\x1f\xb7;r\xecJD?c\x03\xc4\xf9`\xd2\x1f\
-\x5c\xfb\x85\x13~\x19\x97\xdd)\x8f\xf9\x17'\x88\x83\x99\
-P\xa7\x9a^\x07`(\xad\xdb\xdes\x96\xb9H\xc0\xcc\
-\x0b\xc13\xe0\xe4\x09\x7f\xe6\xe3\x92?\xa8K\xb3\x9c{\
-\xfd\x94\xd9\xf9\xb3>\x90\xee\xc6\xaf1PX\xb3}\xf3\
-:\x5c\xf6\xa0;\x0a|\xb4\xa6\x8ce\xad\x13\xf9z\xc6\
-\x0fV\xe6\xc2\xfa\xdb6\xfe\x04N\xacu^^3\xe5\
-\x10\xca9/ \x87\x9dZ\xad\xd1\x8b\xcd\x9aaVg\
-\x8d\xff\xae=n`\x1e\xcf\x1f\xd8\x08\x07\xeb\xd26\xe4\
-\xf0\xa6M\x0c\x9c\xe7q\xeb\xac\x16\xdc[\xbf\xf5v\xfc\
-\xe0\xbf\xf5\xa1\xcf\x1b\x22 \x81\x1b\xc3\x00c\x1bE\xdb\
-\xf1Am=\x87\xef\x00<5wL\xf2\xa3\xe7\xc3[\
-\xef|\xde3\xcf\x82\xb1\x88\xced[\xd0\x0f\x0c\x0b\x9e\
-\x98\xd90\x82\xc9\x8a)F\x0f\xfc\x94\xb3\xbd6&H\
-\xe4\x0f\x005\xb8\xce\x9f\xf6\xa0\xdb^,l\xe1\x9f|\
-\x14\xe4\xc7<\xe1\x1f\x9c\xc8\x0c\xa6\xdb\xc9!\x86b~\
-\x92\xa7\xcd8\xab5/\xc8\xf6\x88\x8f\xb1\xa4]\x9d\xe6\
-\xec\xff\xa7n\xfe\xe8\x0a?m\xe6,\xd8\xc6t\xc2\x9e\
-'\xb7\xdeo\x04\xba\x8e\xf1\x8b\x8a1v\xccg\x1b\x9b\
-\xf5\xab\xb6~\x12UlW\xa0c\x9d?kF<X\
-\x09\xb2&\xe7;\x87\xffEo\xf2Ug\xf4V\xb6\xe6\
-\x81^\xc6_\x1e\xe66\x08\xe1\x07\x18\xfe\xd1\x0f\x97\xdb\
-3\xfe\xb3M\xdc\xe0\x11\xe4|\xf5\xdd\x96o\xf3\xd3&\
-6e\xb5''\xec\xa4\x05\x83\xa8\x8e\x9f\xcc\xb6\xd1\x01\
-\xcau\xfd2\x1f\xa1\x9d\xffE\x10\x09\x13\x87\x06\xda\xbc\
-+\xa6\xd0_m^\x9c\x15\xeb/\xed\x11\x05?1\xf3\
-\xaa\xb9/\xfe\xd8\xa2\xc9\x18G\x9b\x1c\x97\xd1\xde~5\
-\x8bn0_\xbf~\x01\x08~\x14\x90\x93\xf5\xc3\xd7\xf6\
-u\xfc\xf0\xca3\xf4jZ?\xf1h\xc5\x87~\x86]\
--\xc6\xd1\x98\xd7\xf8\x11\xa7\xc2\xa7\x04\x93\x02\x0c\x09\xae\
-\xe3\x05I1\x98\xe3\xbd\xb4;^{g\x0e\x02\x91u\
-:\xdb[\xbf)\x82\x881\xe0\xa2}\xbc~\xce\x17\xef\
->\xff2/\xd6\xe21\x13\x11\xa5h\xb1~\x90\x81\x9d\
-\x01\xb4]\xad\xd7\xfd_~\xe5\x92O\xf0\x8c\x948\x0a\
-\x16\xaf\xfftv\x1b>\xbc)\xe1O\x1f\xfb:\xaf\xa6\
-mh\xda\x02h;u\xf35\xfe\x81\x03\xcb\xf4\x92\x90\
-v\xf61t{.F\xa9\x03\xa3\xdd\xe9\xca\xa5\x9e\xe1\
-\xafv\xb5bo;\xe3\x85\x7f\xf2G@9\xedY\x9c\
-\x89\xf3\xf8C\x14\x9c\x00\xea\xff\x04x\xfb\xfc\x04\x80`\
-<\x95A\xffY\x95\xe7v\x03\xf0\xd4do\xdb\xc3\x1b\
-\xef\xd2a\xdd\xbc\xb8,\x05\x0b\xabG7A6\xacW\
-v\xadZb\x93\xd9\x13'\x9b#\x00\xd9\x0c\x93C\xd8\
-\x946W,\x5c\x0a\xa6\xbf0\xd9\xe4\x8a\xa7Oi\x0e\
-\xc2\xd2\xce6\xad\xdd\xb1\xd9r+\xb6\x98\xce\xb7\x18C\
-\xed|8\x0c\x90\x1a\xaa\xab\xa6\x93?\x0c$O\x8a\xd9\
-</\xd6\x9a\x93\x10U\xf6O\xbd\xf4\xc7h\x01\xe1\x1c\
-\xaeH\xba\x8e\xdfZ\xd1t\xcc\xbf\xda\x85\x08?sU\
--\xe1d\xa6\x96Mm\xaf\x9ftPh_\xf2Q?\
-\xba\x95\xe5y w\x8f\xbf\xb6\xfc\xb3\x1f$]\xf2/\
-\xb1\xf2\xa1ua\x8a\xd0\xd8\xc1\x0b\xff]\xbe\xa3\xaf6\
-\xe7\xcb\xce\xc9\x05\x1a\xefd3\x7f\x99\x8b\x0b\x7f\xb9l\
-\xacV\x98\xe6\xe2\xa6V\xde\x09\x9f\xe3W\xbb\xe3@?\
-\xb1\xb0\xcd<\x5c\xf4\xcb\xc7\x98\x89\xa2\xe6\x82\xd9w\xf6\
-\xb1\x93\xd6\x18\xc1\x8e\xd6\xd8\x940\xbe\xe8\xc7o\xea\xe0\
-\x19Vl\x913\xfc0\x1d6\xc5|s\xebg0\xe3\
-\x83\xb74\x81m\x19!\xd9\xfc\xa3cb\xf9\xfe\x83\xe7\
-\x9a\xc1qs\x83\xee\xd1G\xbd\xf4[O4\xd9\x8f\x8f\
-\xb9!V%\xbb\x8b\xf9\xc8\xba\xe1\xed\x9c\xd8/\x01;\
-\x16\xcb\x8c\xd5Frl\xb2\x841\x19s\xf3G' \
-\xf1{\xb6\x1cS\xcdRo\x10\xfb\xcd\x7f\xe8o\x9e\x22\
-\x98\x0b\xca\x9a+\xb5\x97V\xaf\x9b\x02\x5c\xbf&?\xc9\
-b\xa8\x96\xd4(\xaa\x165\xa2\xdfQi\x0fm\xf4\xcb\
-n~\xb0\x88\x0de\xf2\x09\x14Tl\x19\x15\xfaX'\
-\x8aqL\x959N,^\x1b\xc7\x0f'p;\xc7y\
-\xcd\xc7\xa7\xc7\xb6\x1d\xe7Z2\xf7\x9c\x90\xa3\xc0\x1d+\
-\x03\xd9\x82\xc6\xee1\xab6\x17\xb6\xb8U\x17\x93\xf3\xe7\
-\xadwe\xbeB\x10\xb7mm7\xc6\xce\x0f\xea\xe1\xb9\
-\xdd\x00\x9c\xf3\xc8\x04\x9f\x93\xfc\xe2\xd5\xc3\xcb\xcf8\x80\
-M?\x91\xdeLGV7+u\xb6\x94@\x14\xec\xbe\
-\x0d\x1c\xd8\x90I\xf2\xbek \x9e\xc1N~\x1c\x84\xae\
-\xbe\x13*ls\x04\x0d\xe4\xf8\x12\x1f\xeb\xca/\x99\x82\
-z\x92\x10\x97\xac\xc4\xd2_zm\xca\x0b\x12a;\xf4\
-n\xfc@LAQ7t\xcd\x8b\xdf1\x00U\xff\xc9\
-\x1c\x00\xf3\xabi\xfd&T\xac\x04\xad~m\x8b\xcf\xc1\
-\xe9\x89\x888\xcaz'$\x9b\xf9E\xbafK1\xd8\
-(\xb1U\xe9\x99/\x8f\xcd\x1a\xcd\xe0\x0e\xb4\xb3\xd6\xfa\
-\x05\x84\xa3\xcb\xe6\x1f\xbe\xf2+\xd9\x5c\x03\xb2\xf9\x9b9\
-\xf9\xd3\xf5x\x95A!v\xf7e\xd3\xcf\xcawH\xe2\
-\x885\xbf\x9c\x89\xc7\xb2\xf3\xdb\xe6\xe2\xb3\xf2\x87\xc3\x81\
-:X#\x1d\xdf\xcf\xb0\x92<N<\xf8\x93\xdf9h\
-M\x9a\xf9\x1b\x7f\x8c\xd5z\xe8\x1f6\xc7\xaf\x83\x1a\xd6\
-\xad\xca\xe2\x14\xab\x9aw\xdf\xbe\xe8q\xd1E76\x85\
->L;\xb6\xb1O\xde\xca\x07R\x1d\xfa\x8bZ0\xea\
-\x19#-4\xd1J\xb9\xe8\xc74|k>\xab\xdf\x5c\
-\x97T\x030\x7f\xccX\xe2\x03\xbc\xfa\xce=\xc8B)\
-}\xd1O\xd7\xfc\xd6;\xef\xe4e\x83\xcax\x1e\x84\xa3\
-8\xd8\x91\xf5\xda\x98]\xbfW\xeb\x93\xb4\xfb\xf5S\xde\
-\x8c\x01\x88\xdd\x0c\x86\xf9m\x17\xd28\xaf\xfc\x9bK\xd9\
-\x99\xba\xc3T\xbc\xe4\xca\xa1d\xe7;\x96@=\xcfx\
-D,\xc3\xbe\x10:\x7f\xe2\xb2~\xe8i\xe8\x06\xb0\x82\
-\xdd\x1d\xcd\x1bg\xf1+9\xb1\x0b\xe4\xc2\xec\x8e\xe1\x03\
-\xb6\xf4\xcbv\x19\xff\xd2\x9a\x8c\x8cw\x0bp_\x09\xfd\
-;\x00D\xad|rw\xa8\x01\xacIFb(\xaf^\
->p\x8d\xa1{\xff\xc4\xfdTi\xeaS\xbe?p\xdb\
-s\xf9\x0e@'\xbb\x13vNj}/^\xbc|\xf9\
-i\x02xQa%Yl71\xb2\xb0>\x91\xe3\xab\
-\x9d\x8dD\x1bkW\xd9\xf9\xde\x0by\xb1\xb0\x1d0\xe3\
-)\x92\x1c\xe2U\x9c\xaf\xba}lm\x07{z#\xa6\
-\xbeh\x9c|\x09\xb0}D\xf9\xe3\xd9\xf27\x01\xe0\xd1\
-j\x1dC\xe4\xbfe@\xbe\xe2]\x14\x9f\xdf\xa9\xce\xf8\
-\xc7\x9cj\xc6#\x80\xc2\xb2\xc1i\x0fu \xc6y\xd1\
-\x0f\xe9\xfd\xf8\x95\xd4\x98\xe2\x01\xd4/\xe1tnL\xe0\
-\xf9\x9bq\xc27\x0a\x12\xd3^P\x1e\xaf\x9f\xec\x9e?\
-i\x1d\xa2\xd6\xe1\x9f9_\xbe\xc43%F\xc6N\xc7\
-\xf3\x17\xdf\x84F\xbf\xe3t\x98\xb2|\x9e\x9b\xe9\x99\xbf\
-:\xd1\x11\xfb\xa3\xf1\x8b\x91\x8b_\xa6k\xeb\x8dA\xf9\
-\xa41\x8fp\xe9\xb0\xf2k\xb39A\xa6$n\x95y\
-\xa7\xbf\x00\x9a/(\x03&\xd0\xff\x1a@\xcdb\xc7\x1a\
-M\xd9\xdbYs\x92\x1a\xd35CS\xf7\x12\xbe\x5c\xdc\
-\x0d&\xd7\xe8Ww\xcd\x04s\xbaz\x11Q-\xaf\xde\
-\xd7\xbf\xf3\xae.\xd1\x03\xec\xee1\xd6\xc4\x0c\xda\xc4R\
-a\xcf\xf8\xd5\xf3|\xa2\x9f\xf9T_\x1f\xa3Oh\xf4\
-[\x8f\x0eS\xec3q\xdf\xc5\xcb\x01\xd8R\x1a\x1cX\
-;~\x05\xe0N\xcck\xd6\xcf*\x89qh\x144?\
-s&\x1b?\xfe\x9d8zu#\x04$F\x0ff\xc6\
-\x8f%\xe9\xc3\xbf\xfb\x8e\xf6\x18s\xe9\xe9>\xc3\x0e\xc6\
-u\xfd0a\x83\xd3\x11\xa6j\xdb>\x0bJ.\xce\xa1\
-]\xad\xc6\xd4\xee\x98\x01(\xb6\x91\xc1\x97}\xa6\xf5N\
-\xff\xfd\xfa\x09M\xba<\xe4\xc5\x1f\x0d\x17\xfd6eN\
-6\xffV\x19\xfe\xf1\x04lt\x8f\x0e\xf5\x1a\xa3\x16\x89\
-.\xd5\xe8\xd7\xb6\x05,\xbf\xd6\xa5\xbe\xce\xc4u\xfc\x09\
-\x8eo\xe6?\x88\xc3#\xde\x87\x5ccd^\xc8au\
-\x1f\x1b\xcf\xae\xc6\xb8>\xb8\xd5s\xfe\x04\x80Y\xed\x22\
-\xbcx\xfb\x8b_yK\x9b\xeb\xa3,(O;\xb5\xda\
-i\xee\xf58\xfdY|\x87j\xc5\xd8 \xec\xdb\xc9\x17\
-2\x9b5\xf6\xbb\xfc\xa4\x10\xbe\x04\x94\x93\xf8\xb6\x9d?\
-Z&e\xe3\xcb`~\x8f\xc0,X\xc6\x1f`6\xab\
-\xd3M\x1f\x0d\xd6g\xe6\xc9G\x81\x5cA\x98|\xfb\xd9\
-\xc6>-\x8c;)\x1b\xbf\xfc\xaa)\xd5l\xfc\xd1\xbc\
-\xf4w\x0c\xd63Z\xa7\xad\x8a\xe4\xc2\x07\x7fz\xd6O\
-;\xd2\x89T3\x1a\xddV\x9e\xf3m\x1b/X\xc3\x17\
-\xfe\xd8\x0br\xea\xa3\x9d\xfc\xe0\xc2\xb3\xfd\x1a\xfd\xefw\
-\xfd\x98\xbf\xd1\x82\x0aJ\xf0w\xbb\xfa\xb1\xf8u\xd3\xfa\
-\xe9\xb0\x7f\x12\x8f\xae\x16\xe7/C.\xb0\xc6\xf0\xc1\xb3\
-\xc3l8\xfc\xf5\xeb\x17?X\xfe\x1d\xf8\xe4\xc2\xe7\x99\
-\x18\xcd\xdf\xec\xfay\x97\xf4\xc5\x1d\xeei\xfb\xe2\xaf>\
-\xe3\x02\xda\xf0\xf8\x85\xef\x1b\x06]\xa4\x1f\xdc\xd6\xc7\x11\
-zG\xfb\x82\xbf\xae&[\xdas\xf3\xd0\xdc\x13\x1f\xcc\
-\xd1\xca\xaf7\xdc\xc4\x0f\xf6<_\x88\xfc\xe1\xa5<\x0f\
-\xc4\xea\xa9W*\x9e\x88\xf1\xf5U.j\xe3\xd0v^\
-j\xaf\x19\xba@C\x0f\xba\xdc\xbfk+\x87\x18\xb2\x18\
-\x1d\x17\xee\xb5\xbe\x83\x1d,\x07\xcd\x81\x01\xa1\x89\xac\xc9\
-\x176\x08\xb6\xb8\x9d\xdee\xfd\xceX\xc58\x1aM\x11\
-`\xde\xda\xcc\xc9\xbc\xe8\xd9\xb18\x01\xcer\xb9\x8dj\
-\x15\xc1-\x05G;\xfc68=\xa1\x8a<\xf9\xed\xc1\
-\x96\x10\xe3O\xdbc\xac\xa3#4\x7f\x02\x88\xdd\xfc\xca\
-\xc77O\xd0^\x7f\xfeM~\xe7\xc4\xa9\xdbV}k\
-\xfc\xc3\x0d\xe6\xa9o\xf1{\xf4\xca\xe7\xc7O\x1d$l\
-\xe9W\xb7\xc5\xf9\x83\xc7\x9cY\xbf\xf3\x89\xc0\x92\x07=\
-|\xe0\x19X\xf6\x94\x87\x8f\xbe\xf5\x85\xef~{:\x84\
-\xf49\xa6\xe7U}\xd0o\x00\xb2>\xd79\xad\xedR\
-\xbf\xf5C\xff\xb4?\xfeg\xd1\xb3\xf0J\xd2\xea\xb5M\
-\x9d5\xc4\xa6N\xd7\x93fV\xd9KI\x98C\xb3\x93\
-\xd2\x1e\x9b*\x17\xfcgq\xfe\x189\xe9\xce\x8d\x1b\xae\
-\xe8(\xa9mK\xc0\xc1/\xd0\xcd\xaf\x8e4\x06\x96\x8d\
-\xbaY_\x9f\x9f(\x22\xd9\xc6\x1c\x9b\xe5\xf1\xcbB9\
-\xdb\xf4\xd7\xf8\xf1\x8d\xdf\xb6\x99?b\x8c3s\xb6\xe7\
-2\x8ep\x115\xf9\x8a\xb6\xcd\xfa\xa3&\xca\x02\xf0X\
-\x7fr\x9d\xafp/\x8f\xe5\xcf\xbc\x81cc\xe2\xce6\
-\xc2\x96~rGC\xf8\x8f\xf1o\x8a\x8c\xc5\xfd\xe8\xb9\
-\xae_\xb8\x82\x09\xbf\x09f\xce\x9e\xd0?\xfc\xf0\x02L\
-\xcd3\xf3G\xdb\xbdU',6\xdaD\x10\x8b\x85B\
-]/\xb5\xff0\x8f,\xb9P\xc6\x93\xf9#:\xe5\xc9\
-\xfc\xee_RT\xbaft\xdb\xae\x9d\xb9\x9a0\xd5y\
-d\xef\xc8\xeeu\xd0;\xeeU76s\x01\x06\xa5_\
-\xc6{x\xa9\xb6\x9e\x00\xc2c\xbb\xf0\xad_)\xbe\x86\
-\xe3\xd4\xb5Xf\x97\xf7\xad5\x8c\xb6\xc9\xee\xf9\xd3M\
-\x05}\xdc\xad\xd1\x11\x0cl\xe3\xe7\xe6#P\xe6\xe4F\
-\xc1\xeb\xcf\x85z^\xe1\x5c+\x9c8\x8f\x9f\xf8\x01\xf6\
-\xa7\x10\xd3f\xbe=\xe7\xc4\xea\x86\xa0_\x9e\xdc\xeb\x08\
-\x06(\x0a\x98B\xea\xe2\x97\xadmb\xdc\xc6?\xa4\xf4\
-\xdb\xde\xf9\x87\xfe\xe6{l\xb2\x0f\xd8\xc2q\xbe\x0e\xa6\
-\x8f\x86\xeb\xfa\x81E4\xbe\xdd\x0eLx\xc2\x9f\x5c\x05\
-y\xae\x87\xc6\x99\xe64\xffhU\xdb9\xd4\x8ao\x9b\
-\x5c\x04.~\xb5\xed\xb7C\x87\x89w\xd8\xd8\xe2/[\
-\x8c\xde\xbfc\xb2\x9f\x03\xfc\xe8w\xdb4t\xb7\xbe\xc1\
-\xc3\x90\xfd\xafF~T\xd9h\x8c\xce\xc5\xae\x09\x93\x1f\
-\xb0)Pa\xa1P\xb7\xed\xfet\xbaf\x8c\xf6\xed\xef\
-\xf9\x93\xfd5\x00!\xcf\xba\xcc\xe9\xf1l\xc6\xd0\xb5i\
-]\xe1/\xde\xfe\xcc\x1f\xfa\x8c_4d\xe9\x86bc\
-fsd\xb1\xd7F\xd5\x8a\x9fm\xc0x^\xf2\xa7O\
-f\xc9\x82%\x83\xcan\xe7\xe4`S]\xf2\x95\xc4\xc6\
-\xaa\xed\x92\x03\xbf\x9e\xc6\xf5\xe6\x9b-I\x02\xd8zX\
-\x8f[\xb1=\xce\xaf\xae\x9c$\x8eo\xfe`\xc3\xf1\x88\
-?\x81\x07\x7f\xb8\xd8\xe0\x8e\x95\x1f\x98\xf0\xa7mQ\xd8\
-G\x97\xaa\xa3M~O\xa9\xd1o\xfe\xe0\x91\xd3R\x5c\
-\x08<\xfe!\xe1$\xe7Y\xad\xf5\x91\x1b\xdb\xe0\xaaO\
-\x8a\xf3\x8f66\x9e\x97|\xfa~\xa81\xc5\xb8n\x0f\
-\xff\xb4\xcd/\x84\xe4\xa7\x8e\x9e\x8dI\xe8\xca\xaf~\xd9\
-rA\xb2\xaa\xcdom\xc2\xb9S\xc0\xf8yW\xed_\
-\xf1\x90\x0b(\xb1i(\xdf\x06L\xbe\x08\xc1gM\x87\
-\xa3\x17T\x82\xfc\x0e]>\xa7\xeb\xe0Xj0\x8dL\
-\xfe\xc6Dl\xc6\x8a\xed\xd5\x8d7\xd8\xa8\xecM\x06\xc1\
-}g\xef\xda\xc9\x93\xc3@\xc1\xd5+\x86\xf5\xab\xcf\x85\
-\xdex\xd8`\xd4E\xdd\x1f\x7fS\x83\xac\x94\xf0\xa3\x06\
-\xa6h#\xf0\xd5\x0b~=\x80E\x9f\x22XW\xda\xb1\
-1\xb6D\xd3'\xd3\xd9\xbc\x937\x0a\xbf\x1e\x98|p\
-x\x15\x93\x10\xcf\xb7.\xda\xbc\xe9\xf7\xf8U\xaf\x14\xc1\
-\xf1\xc7\x82\xec\x18\x1d\xd6.\x9boN\x94\xd0\xb9\xf6\xef\
-\x87\x89W\xb2\xdb\x8a\xa7d,n96k\xa9\xb5\x9a\
-WQ\xe7;\x0e\xed\xc1\x8bm\xf7\xe1\xef\xdc:M\xa0\
-h\xe5\xb0\xd7\x0f\x83\xfa<\x92\xba\xfai`'\x8f\xcc\
-\xc9W;\x5c\xad\xc1\x1bL'\x1dm9\x9c\x9ftM\
-\x9d\x1a'?\x89k>\xb7\x80\xd5\x22_\x98\xa4C\xe2\
-\xda\xcdDDG\xf8\x12I\xe0\xc1\xefq5O\xf5\x00\
-\xec<\x05[\x8f\xe1\x9d\xeb|\xb3\x02\x14\xac\xcd\x1f\x80\
-\x95?q\xa8\xd9\xfc\x19s\xc0\xd2\x1e\xda'\xf8\xf78\
-\x8c\xc9|\x80\xe5y\xd1_\x03\xfc\xec\x97\xfc\xabf\x99\
-\x80X0\xc4<\xb7\xf2\x5c\xbe\x03\xf0\xd4\xbcv\xf2\xbd\
-\x00\x0f\x1f\xfb\xcc'h\xb0H\x97\x15aw\xc9\xd6\xcd\
-q\x0f\xc4\xd2\x9e\xf1l\x98u\xb7\xd7\x9d9\xb8\xf7\xb9\
-\xde^\x02HXx\x1f\xf3\x93\x1c]+\xdfB\xd3[\
-|\xe08\xf4N\x7f\xad\xb3\xf9\x16\xc64\xcc7:\x9d\
-\x7f\x8e\xffu\xfa\xb1\x0f\x9e\xab\xe9'\xff:\x1f\xe5{\
-\xed\xfc=5~\x80<\x8f\xcd\xfe\x06\xe3g\x8c\x1d\xff\
-\xa9\x9f\xf4\xd1\xf6Z~B\x86\xc6\xfa\xcf\xf5[\x9e;\
-\xfe\x99S\xd2\xd6\xf8\xc9s\xffn\xfe\x03z\xd9?\x8f\
-\xf8\x06o\xf1\x1fz\xa6\x99\xfc&\xd6X>\x8d1\x0f\
-\xf6\xe9u<\xd9\x5c22A-]\xbf\xb1\xd2\xdd\xf3\
-G\xbe\x0c\xfa\xe1\xc2\xde\xc2>\xa3,\x8b\x1b\xe5\xd3\x98\
-\xb9\xd0\xca\x06\x7f/h\x97\x04\xd9\xd7?\xa5\xc3A_\
-\x8f\xac\x0b\xb5\xa3\xf5\xe9\xbf.\xc8i\xe2U\x8b\x1e<\
-\x09\xd0'\xfa.\x87G\x11\xcdpdz\x0a\xb0\xb5\xf1\
-\xd3\x0f\xa6n\x1b\x84\x87\x1f6\x8f\xdf-\xdfZ\xe4\xc6\
-(\xb4\x88\xb6\xb6\xf2o\xa6\xd1!C\xf2\xb9\x11\x18~\
-\xee3TV\xac\xb8\x93\x8f\x88ZSc_\xaf\x17\xca\
-q\xdf\xd9\x93\xef\xf8=~\xbbH\x9dq\x9d}\x9bg\
-\x9c\xd8\xef\xe7\xc5\xb1M\xe0fF\x85i\x0d\x7f\xd7/\
-5\xbe%\xd5q\x07\xe1\xc1\xcf\xbe0\xcf\xf0>\xd2\x0f\
-\x90J\xc6\x9f\xf6y\x5c\xf92\xb26\xb0\x947u\xc8\
-f\xf9\xe5u\xc4\xd4\xd5\xaf\xae\xca\xe3\xf1\xd7\xf8\xf5\xf8\
-\x93\x07\xee0\xb9.\x1e5%\xfa\x89Hi\xcb\xe3\x1d\
-\xc1\xe1\x0f\x0eQ\x8e\xb1\xef\xba~\x0f\x1f\xfe\xd4'\xeb\
-\x0e\xda\x93\x94\xe3\xfa`W\xcf\xf9\x06\xe0\x9c\xd9\x17\xb7\
-\xb7\xde\xf9\x18K\xd6\x17\x9dnX\xee\xb6\xbb\xe5\x9a\xd0\
-E_5\x11\xfa\xe1D\xeaI\xb7\xf2\x95\xe4\xfc\xec\x06\
-v\xd2\xea\xe7\xe4\xeb\xe6\xe2\xc4S\xf6\x90\xad|~\xaf\
-\xa8\x87q\xb3\xc3r\xd2\x1a7v\xc7\x9a\xbf\x9b\xf9\xc4\
-L\xbb/2\x8ca\xe9\x96\x00\xec\x8bk\xf1\x1f\xb6\xea\
-'Q\xfe\xa5\xbf8\xcc\x18\x03\x19\x8d\x1e\xa6{\xb2\x8d\
-\xa6\x8e3\xea8\x19\x0a\x05\x7f\xf4(\xc5m\xfa\x14C\
-\x0e\xe6u\xfc\xc0\xeeq_\xf4+o\xf1\x07\xc0\xef\x96\
-PW{\xb0\xf7\xb8\x9d\x8fPk\xea\xea\x1d\x9a\xd0B\
-\xbe\x01t\x10n\xfb\xe78\x88\x02\xeb\xf1\xfaM>\xc4\
-\x19l\xf2\x8d\xcb8\xf0\x97\x7f\xeb\x8cm\xeb\xec\x17\xf3\
-\x80\xf9\xfa\xeb\xe7\x818\x86\xd8\xfc\xbd\xbb\xc1\x0d\x99\xd8\
-|\xd93\xafG\xdc1I\x8d?\x15\x80\x83G\xa0<\
-\x80\xd8\x07\xa0\xb8\xf2\xdb\x8e|\x05{\xfc\xf3n~\xed\
-\xa9\xf9\xbdx\xf7/\xdf^g\xd0\x9e\x0at\xf8\xaa\xc9\
-;\xfah\x84\xc1\xe7\x1c\xe4\xd2@\x1eZ\xd6\xcd\x88\x02\
-\xc0\xe6]\xb7k\xc0\x1c\xa1\xca\xd1\xa9\x17\xbf\xbd\xe1\xc3\
-\xa3P~t\x93\x92|>\xc5\xf0\x17\x06e\x03\x89\xdf\
->Pz\x83\x80\x15m\xbc\xdbF\x8d\xdf\xd5\x0f\x8fT\
-g\xbdUw\xae\x18\x17\xc1\xef3Ng\x84\xc7s\x03\
-\x03\xfc\x9e+jta#Vm\xe6b\xe6g\xe9\x97\
-\x0f/\xb0>\x90_\xdc\xd6\xc4\x0c\x96\xe3\x14\xea,\xdb\
-\xca\xb3\x01\x12\x8b\x9d5#\x98h\xda\x9a\xed\x01X\xfc\
-\xc6\x82Z\x8e\x15\xdb&3\x22\xa3\xf3c\x9btcc\
-\x073<\xf5\x94\xf7\xb4\x9f\xfa3\xda\xcd\xef\x91,]\
-\x92\xa9\x9f\xd9\xbf\x83\x1f[\xb4\x94e\xe5;>\xdaF\
-5\xe1\x19\x8aZ\x89\x87?Zw>\xf3\xf5\x94\xfe\xad\
-\xb59\x8c\xd3\x98J~|\xfe\xe3\x8b\xb6!\xbd\xdd>\
-\xc4\xb5\xc6\xa5t\xd3]\x15v ?\xf0\xe5\xb9\xdf\x00\
-0\xd1^\x84\x877?\xf4q\xe6<\xb3\xde\x8d\x91\xf9\
-\xef*u\xe3\xcc\xaeY\x9b\xf2\x5c\xad\xb5\xf1jT\xbd\
-\xf2\xbd\xc9\x849Kk\xbb\xda\x0d\x85\xcd\x0al\xdbV\
-\x9fdx&6xX\x01\x8aVZ\x14\xf3\xaf\x13y\
-\x22\xe7\xac\xee\x86\x8du\xeb\xdaL#\x0d\x9d\x81\xf3\xb1\
-m\xe7\xcb\xd2~t\xdd\xe9\x1f\x91\x8e\x99\xc0\xf3E\x85\
-\xf6\xce\x0f\x09\xb6\xcc[^\x14\xb0\x06;\xc1n\x0b7\
-\xd0\xc3\x8a\xcb\xc3\xbf\x1b\x7f \x17G\xb0bdn\xc9\
-\xae\x9eU\xcb\xbd\xe7\x8fX\xc5!\x12c$`\xb4F\
-\xec\xe6\x8d\xcb1\x0du\x0cI\xfa\x89\xca\x00\xe0g\xad\
-:\x7f\xc4Q\xb0S.\xf9\x0c\x92l\x19}A\xa07\
-B\x9f^\xbf\x5c\x1c\xc9Zb\xc4\xe5\x0b\xb3m\xc1\xb7\
-\xd7\xba\x8cn\xcf\x9e\x8b(\xf0Q\xfc\xd0\xf9\xe3e\x0c\
-\x94\xd6\xfe\xd8\x5c}p\x14T\xf3\x5c\x1dG\xa7\x9c\xc2\
-\xc8\x05\x9b\x19W\xac/\xf2\xb4\x0e]\xe4\x83\xc3\xe7\xed\
-\xf6\x84f2\x02\xc9\x95W%Lxf\xfdt\x01\xe0\
-\xaa\x9c\xfdO\x0c\x9c\x04\x1e\xfbg\xcc\x88t\x93\x94\x84\
-\xec\xf5\x13F\xf6\x9d\x1c\xf1\xeaH\x14\xe3\xdf\xb8\xb1p\
-\x84_G\x1d\xb2\x17\x89\x8c\xb5\xba\xb9\x80\x13\xc3\x0d\x8a\
-'Rm+Uz\xd6\xbf\xa3\x91\xddk\x8d\x83 #\
-\x13\xec|\xbav;_\x07\x953\x9f>\x19\x14\xd7\xd3\
-\xc9\x1e\xb9\xda\x0cM\xe0\x88\xbe\xe4\x15\x00\x0d*\xe1 \
-\x9f(\x19\x95\xecxr'\xc6}\xec\xd5\xef\xcc\x1c\xc2\
-?9C\xdc\xfd\x1b\x00\xf9F@\xea\x01u\xbaf\x11\
-J\xe6y\xe8!w\xf8\x11ft\xec^\x88\x83\x5c\xcd\
-\xec\x91\xc9\x19\x97\xf3\x07\x9f\xaa\xfd\xd6\x13\x96\x08\x09\xc0\
-\xbe5\x1fm\x8b\x83=b\x9c\xef9\xd8\x08\xe6\xf7\xde\
-\xdc\xb6\x99\x0d\x89#O7\xd9o\xf8\x06\xa0\xf4\xad\x9b\
-@\xff\x18m\xcd\x1f\xcc\xda\xaf\x13\x1fLi\xafU\xc5\
-\x04?\x9at\xfd\x89F\xdf\x95\xd91\x8b\xcaf\xf6\x83\
-ZO\xaf\xccQ\x03\xe3\x18-W\xf3\xba\xb9ag\x15\
-\x15>1\xd9\xd4'Nb\xc2\xb1\xf2\x0fi\xce\x8f\x02\
-c\x95\xdfy\x00\xab\x14\xbf'\x8c7\xee\xf2Ew4\
-\xc2\xbf_\xf0\xb0q\x96\xd9'\x9c\xcdoT\x0e\x8b9\
-\x0a\xf7\xf8\xebY1\xc2r\xbe2\xaa\xc3\xbe\x0c`4\
-\x9a\xce|\xf1\xc1\x7f\xccM::\x06\xc9]F-\xec\
-S#ZV\xbe\x1a\xa6X\xfc{\x1c;f\xcf\x81O\
-]\xc6M\x9e\xebo\xbc~\x91\x10\x0c\xc6\x96\xbc\xa3V\
-\x00\x0f\xab>t\x98#LW\xfd\x17\xfe\xe0\x80\x99y\
-\xa3\x06\xe9\xd0(\x9f\xc7?1\x8e\xcd\xe4$\x96\x8b\x98\
-2\xc2?u\xf3\x8f\xba\x1a\xa3?\x9a\xa31\xf8\xceW\
-\xbco\x1cB/^\xe1q\xe0\x17\xe1\x07\x7f\xf3\xb8J\
-\x83\xc4\x91\x17\x02b\xfdMx,\x02\xe4\xd2\xae\xdf\xa8\
-\xabC\xeb\x98#0u\xe1\xe7\xd3\x89\x0a\x0f\x7f\xbb\xc4\
-\xf3|Oc|\xcf5}\xc7\xaf_\x11\xec\xb9\x02\xce\
-\xdc\x83\x19\xcd\x8cK\x18\xba \xfb\x9b\xfc\xe4\xcf$\xf5\
-{\x02\x1e\xa0\xc7\xc6;J\xc6\xd1:m\x8e\xc6\x80@\
-?\xa4{\xfe\xedf\xacj\x88\x93\x98,\x9b\xf8f\xdc\
-\x0e\xe1\xdd\xbc\xf9g\x8e\xe5\xf3|\x19H\xa1\xdePt\
-\xa2\xdf7\x0f\xc2t\x0c\x5c\x90\xfa\x18\xdbe\xff\xda\x87\
-j=\x14\x16\x14\xe6\x04\x8d N\xadv\xf7\x0fAY\
-\xff\xa9\xa7\xef1M\x028N\xc776\xe7\xd3V\x89\
-&\xf2Y\x9f\xf4W\xbe\xbc\x8f^c\xc8`L\x16\x95\
-\xf3\xcdy#\x92\x8a'\xbc\x10\x86\xdf\xcc\xe1\xb2\x1f\xd6\
-\xc3F\xaf\xf9\xf6\x88\x97|\xb5\x93\xef\xced\x04\x7f\xc2\
-w^\xf3U[\xbf\x13G\x7f\xd2\xad\x8b\xc3\xd2\xaf\x98\
-\xc5K>}\xb3\x0e\xbfMY\x13 \xa2\x99c\x1e$\
-\x98\xeb\xcd\xb7\xfb\x09\xc00Y6\x0a\x9e]y\xce\x9f\
-\x00\x5c'\xfc\x8d\xb7\xf5\x09@\x16\xb8/\xc2\xad\xf7Y\
-\x95MH\x5cN\xb4Y\xf8\x03\xc9\x0b<;c\x99{\
-V\xeetEd\xa3$\xa6\x91\xda(\xdaX\x84\xb3}\
-j\xa5w_\x16\xbf\x83'RU\xf8\x15m\x1c\x1b*\
-\xd6\xb6\xe2\x90\xe1\x17\xae;\x16\xb6j.\xc2\xad\x9bq\
-\x88\x97)\xf9\xa3\x95\xce\x14\x9f\x17v\x86\x16\xb3\xdd\xd7\
-\xf4\xf5Ba_\x06,A\xfc\xcc\xb8\xd1?\x98\xad\xa7\
-\xeb\x0a[\xe6J\xad\xe6\x9f6pl\x9f\x1aa\x10L\
-\xc1\xb5\xc6_\x02\xf8\xcd\x8bst+\xde8\xe4\xaft\
-\xb4\xcd\xc9\xdc\x5c\xabe\xfd\x22\x87\xd5\xad\xeb\x90W\xfa\
-=~\x07M\xe4\xe8\xed\x85j 3<p}\xb1\x8f\
-\x082\xaa\xf5\xc4\x7f\xbc~\xd1\x1a\xf1\x93\xab\xe4\xe6\x9f\
-\xef\xf43'\xba\x98#@\x17.\xbf\x8bU\xa4\xf7\x03\
-\xa9hP\x82\xfb\x0a\x81\xdf\x17~Y\xb8\xe03x\x1e\
-\x5c\xa8\x19\xbf\x0e.\xfcS?\x8aC\xf4\xb6?s\xa7\
-pqD\xfb\x80+\xa6\x98N\x97s\xad\x91'\xd60\
-\xe6\xb1V\xf2El\x0c\xeb\xb1+\xb4C\x9f\xf9h\xde\
-\xbeha\x815{\x84\x8e\xd5Y\xf9\xbe\x09\x1a\x10Y\
-yP\xfc\xa9\x85\x0e|\xcf\xc1ZI\xb3N\xfc\xfap\
-z\xa5dl\xaf\xc0\xd5\x8f\xbf\xbb\x10\x08`\xac\xd9\xda\
-<\x10@\xc8\xd6C\xe3\xf4\xfc\xfa\x86\x85\xd9U\xd2h\
-s\xdb\x91\x86\xcc\xdc\x90\x9ftW\xce7f8H_\
-\xfbwr\xc1\xc9\x1aPS\x06\xc3\xeb7p\xd6\x91\x84\
-\x81Og\x8e+\xff\xe0'3\xfc\x0a\x22\xbf\xba\xac\x87\
-\xc1\xcf\x04X\x13!3\xd6\x12\xc8\xee9AO}h\
-\xbd\xcf\x17\x12)\x8bK\xed\x965~\x19\x0a[\x1d\x8d\
-\xa1\x063\xfc\xee\xc4\xa5u]\xb6\xea\x1f\xad\x96n\xf9\
-\x1c\xb2B\x89\x85\xa5L\xa7\xa6\x19\x1b\xfa\xed'\xcf\x00\
-\xb7Wo\xbc\xe9k\xcd$\xee\xe4\x13H\xce\xe7P\x9e\
-\xd3\x0d\xc09\xd1\x9d\xdb\xb5z\xfa#@\xfe\x1b\x00{\
-\xb3d\x83\x10\xa8\x96\x97.'\xbf\x0cZ\xc7\xb5Q\xe9\
-\xaa\x0f\xd0\xb2\xa5\xe3\xbe\xcc~\xd1p\x8c\x00\xba\x19\xd8\
-\x0a\x15\x94\xbc\xc1\xa9\x11<\xef\x97\x9c\x00\xdd\x98=\x19\
-\x9c?'F\xb1Z\xe7\xcc\x13j\x00\xc4\x0fC\xb8\x0b\
-\xdf~T\xa3%\xa3\xac\x1f\x0b1\xfc\x0c\x8dj\xb4 \
-\xcc?\x8f\xda\xfb\x84\xc8\xe0\x16\x7fR\xe6\xc5S\x00\xe8\
-\x01WvJ\xc7&\xd3\xb2\xd9\x1e\xa7x\xb2\x16\xd4\xc9\
-\x99\xfc\x11c\xac\xc0F\x13y*\x9b\x9f\x91H{/\
-\x16\xd6\x9f\xf9h\xdce\xfc\x90L\x0c~\xd6=\x1c\xcd\
-\x81\x7f\xe6\x22\xa1\x99-\xc5Y\x12I*\x8b\xbf\xfae\
-\xbb\xae\x1fA\xfc\x80\xebf\xde\xa5f\x90\xe6\xc4\xda\x0b\
-?\x1a\xfb\xbbprr\x81\xa6\x95yk\xad\xae-\x9b\
-\x1f\xbd|,\xad\xb8^S\x88X\xe3L\xdbc\x02\x04\
-D\xf9v\xbe\xda\xea\xfb\xc2H\x92\xaer\xc6K\xa4\xba\
-\xe8O\x0e\xf0\x94\xec95\x08d\xfc\xeb\xca\x08\xfa{\
-c6I\xf4\x0b\x9c\xdf\x9b\xcb\xa2\xbe\x8e\xfav\xbe\xf9\
-\x95\x9e\xef1\xc8\xea7\xd82\xf0\xb3\xce%\xc59/\
-\x99\xe6\xf7|\x13\xa6@\x15{\xd4D\xfa\xdaA\xea{\
-*\xa4\xef\x95\x1c\xe8\xe7\xfd\xbf\xb3\xd0L\xa1\xe2\x89\x99\
-L\xb7\x19\x8b\xf4\x83\x85\xfd\xfd\x9d\xc9\x10\xc3\xaf\x86~\
-\x82\xa7\xa3\x82\xfd}\x81x\xcde(\x83\xc0\x1f\x0a\xc6\
-\xeb\xef6@G\xd4\xfcz\x04~\xaf\x0d\x1a\xe04\xbc\
-\xe6\x83N\xdb\x83:n\x03\xae\xf5s\x8cL\xc2\xdf\xfb\
-\xcf\xb3l\xa6\x01\xd9C]\xd6$\x92c~\x81g\xfe\
-\xb2\xfe\xd6\x12\x01\xc3\xe7*\xd9HS:\xd8\xd1\xa4Z\
-\x03]\xfa\xd12\x1e\x13;\xf2\xc8\x97o\xad\x9fb\xc1\
-\x22\x17,J\xfb\xe9\xe5\x18\x8d\x8d \xc6\x02\xca\xe2z\
-\x8f\x7fc\x8dP\xcbp6\x07\x86^\xfd\xd2\x8d\x16\xcc\
-\xd5\x8c\xab\xed\xb0;%\xe3s$\x9a\x87_\x1b\xc7\xda\
-\xc8\x10\xc8\xc3\xc3\x9b\x1fuz\x13\x9f\xae-E\xae\x80\
-<\x1d\xf3\x07n}N7\x00LV'\xf5~\xe2X\
-\x96\x0f\xb38]t\xe6\xbd'\x18Y$z\x11\xd7\xd9\
-:h\xb3I\xba!\xd8(^2U\xde\xec\xc3dl\
-\xa78a\xacS\x89\xd4\xf9\x0a\xea\xa6\xc1\xb3\xf8\xa7\x1d\
-~\x80e\xb8\x83q~\xcd\x1eDO0\x19U\xd8\xac\
-\xb0d\xd3\xc6\x96c\x06m\x1f\xb8*\xd5\xf0H?\xd4\
-\xc4\x98\x7f\x18\xa7\x0d\xe5:\xb9pMX[=\x9d\xfd\
-\xb1i\x8c\xc7q\xc6o\xe0\x93_\xe0\xe0\xab\x80\xed\xf1\
-\xbbo\xd28\xe6\x18~u\xc4\x1d\xb4\xbb\xf5\xebI\xcc\
-\xfa\xb5\x1c0{n\xd4\x02\xcc\xe3i \xfc\xe8\xa2\xd6\
-\xe1\xbe\xc8\x81\xd5\x17\xe4i\xd3\xef|\x10\xbe\xf4\x07$\
-`\x99H\xdc\x0a\x98\x8b\x87\x9ak\xfee\xe4\x92\x1f\xf7\
-u\xfd\xf6\xdaDX\xf8\x1c:\xf9\x19?C\x04;\xfa\
-e\xd3\xf8\x9d+\x1d\xa0\xe7\x86@\xd9\xea\xe7?\xc0a\
-\xfc\xc1Y\xdf\xe6W\x02\xef\xe2\xb1{\xfd\xc0s\x08\x18\
-*rP\xafo\xe8;\xd0\xe8\x0d4\x8f\xd7\xcf3\x15\
-\x0d\xd6<8\x5c\xc4\x19)\xd3\x9b\x8f\x97\x85\x19\xd1\xc6\
-\x00\x9fY6\x9f\xec\xe9\xdbX\x84\xf80\xc1\xafBL\
-\xf7\x9b\xe3\xb9\x81\xe0\xc5\xd8\xf9\x0cfp\xc4MF\xde\
-\xf9\xc7O\xbe\x0b\xfbF\x93\xe4_e\x80\xc8XU\x91\
-\xe9\x9b\x1a2e\xe3\x86\xc4\xff\xe6\x9f\x10l\xaa\x1f\xd6\
-^\x0b\xd7\xbe\xc5\xf0\xad\x87c\x14&\x1c=\x89\x07\xd8\
-p:\xa8\x91\xf1\xa3\x22\x9c\xc6%\x90\x1fB(j;\
-\x87\x98\xd5\x89sX\xce\xb0\xcb|\xd8A\xba\xd7\x0b\xa8\
-\x80\xcd\xf4\x85\x7f\x88\xd6\xfeu\xdf\xa3W\xe6\xc4\x03$\
-J\xe4[\xcb\x00\x04OF~\x98G4\xce\x9c\x10\x9a\
-\x12;\xed\xda2\xce\x19\x7f\xa3\xe4\xf4\xfe1\xc9\x8e\xc5\
-\xbd\xd6\xdb\xf3\xe7lgU\x0f\xc2\xcc\x82\xc6\x8e\x95)\
-\x82Pu3\xa2\xf7\xc0[\x8a\x08\x1d\xfd$L\xcf$\
-@`R)_\xf0F\xff\xf2)_\x81\x1e\xff\xcb7\
-\xdeI\xc6\xf3?>\xb7\x1b\x80\xd7\xcf\xf8\xcb7>\xc4\
-\xdav\x11Y\xe4\xb5\xb1\xbayg\x138NH^P\
-\xd5\xd98\xac\xb4\x16\xb8\x0clX\xda\x83\xe9X\x81g\
-\xb3ds\xd4\xb6^\xe8\x14~\xb67\x7f\xb6\xd4\xec\xd7\
-`\x02\xcd\x86\x22G\xcf\x96\xdd\xce\x86\xc5\xee\xcdK,\
-\xfc\x08\xbah\x82\xb3\xd9\xa9\xdd\xd5ai\x15B\xb5.\
-M\xb5\x81\x0f\x00\xc1N\xc8\xa9\x02\x92,.U\x02\xae\
-m\x87\x16\xa2y\xec\xe8\xadgq\xe9E\x07\xe8\xd2\x10\
-\x9b\xf6\x8c\xbf\xe9\x80\xab\x9d\xd7\xachF\xc0z\xf1\x91\
-33\xe9\xb0\x8c\xc9)'@|\xe0D\xab\xfa\xb4\xab\
-\x99Z9~\xa76\xb65~\x93i4\x88UY\xfa\
-\xd5\x1fi\x83\xc9{CPT\x0b\x9c\xd6Y\xd2?\xb5\
-f,\xe8\x18U\xce\x89\xa6\xe8\xbb\xcf\xe7\x8bw\xf8\xc3\
-\xabD\xb5}\x81\x89\x82\xe8W\xdb\xef\xaa\x03\xec\x18\x9a\
-\xed\x16\xf3\x05om5\xa9\xd9?4\xa3\x1b|\xdf\x9e\
-8!L2)\x80\x1f\xd6,\x1f\xb9g$\x8cSN\
-\xfb\x19\xbf\x8a\xda\xbeH\x91\x84\xc1\xc9j\xb2\x80\x9cs\
-\xce\x9f\xb6\x82\x13\xa2\xbe\x8a\xf3\xa7\xf6w\x03\xd4\x9e\xf4\
-\xe5\xa3O4\xf22W\xba\x8cc\x90\xc3cQ\xa7\x9f\
-j\x19\xaf\x87\x01\x0a\x934\xbe\xff5\xc91\x88U\x18\
-s\xf4\xa0\xc4X\x83kF\xe6\xea\x95T\xf9S\x8c\xd1\
-\xaa\xa9\xe0o\x13d\xe4\xcc_4\xd1\xf0MX\xa6\xca\
-\xc1\xdcn\xf8:)\x1d\xe6\xea\xeb\x8fbA\x18\xc4\x8c\
-\xc9\xe3\x8b6s/\xaf\x1aS\x18V>\x81 _\x88\
-\xfa\x89\xe6\xcc\x03\xed\xe6\x82\xbdnr\xcb/\xddLI\
-4\x03\xba\xd7\x9f\xcc\x95n\xb1\xeaS{\x15\xee\xf43\
-.\xc8\x0f\xaf\xf3m\xd9\x07l%3$\xe3\x96\x80j\
-\x8e{l\x0eU\x06\x02=\xb0\xf2\xa7\xeb\xfc\x8e#&\
-\xc7z7\x829\x8f=\xfe(W\xa8\xa3\x81\xf5M\xa3\
-k\x9b<\x86\xcc\x05\x9a\x22u\x86\xe5d\x8f?\x016\
-/\xae\xb1)\xa97\x00\x1e\xaaP[C\xfa\xac\xcas\
-\xbd\x01`\xc2;\xe9\xae\xf5\xe2\xf8\x0e\x9b\xb3\x9b\xd7m\
-/\x05n\xb6\x11%\x1b\xa6}{\xb2\xc3\x0c\xd6M\xea\
-H6\x97w\x87\x13\xd7\x01S\xe1\x92\x1f\xec\xb6\xa9)\
-\x86\xa5q\xc4\xbb{\xf4\x9bCL\xda\xaai\xa8\x17-\
-i\x1b\xcd\xf6\xd1\x9fANN\x98\x9c\xdf\xf1\xa9\xe3|\
-\x03\xbb\x03\x10\xc6\x8c\x89\xb3B%9\xaa\xa7\xbf\xe7l\
-\xf2#\xc6\xb1\xd6\xa0\x0crFd\xf2\xc1\xb4\xad\x9c\xf8\
-M\xb5c\x07\x9fIy4\x7fh\xb6\x9c\xbc\xb8\x5c\xda\
-\xe0\x86%X\x1d\x1f@\xf5\xc0o\x01W\xcdk-\xc7\
-7\x95\xc7\xdf\xf1b\xcb<\x19\xee\xda\x1e\xfc\xa1\x1f\xfe\
-\xa8\xe1\xf8x\x9d2\xe6\x5c\xa4u\xf1\x90\xae\xb4\xcd\xb2\
-\xf3+\xe4\xd4?\xde\xce\x7f/\xfe~q\x8b\xc8\x0a\xd4\
-\xc5F\x06\xe6S\x17W_h\xc0\x999 \x1faI\
-)\xbfB\x87\x93\x19vS\x87\x95C\x8a\xf2=\xa3\xdc\
-\x18\x18\x03x\xe65k\x02\xdd\x0b\xee4\xa8Q\xc2U\
-XW\xfe\xe4\x0d\xa6>J\x7f\x9f\x0bK\x94J\xe2n\
-\xfb\x82\x13\x02\xf9\x89\xa0\x93<\xb0A\xb5\xc5\xe3\x08B\
-~-\x91h\xc6k\xab\xfd\x93\xce8I\xe6\xc2l\x88\
-\xc10\x92\xd0\x95\xe0\xbd\xc4\x8dT/\xcefR\xbc\xf2\
-\x86]CQ`>:\x88\xd7\x5c\xcaq\x928\x8a\x03\
-\x87\x8a\xb9\xe0uI\x1c*\x8dG..\x92Tc\xcf\
-Zj.\xb0\xe3\xb7O\xfc\xf8\xd5v\xf8\xe0E\x95r\
-\x1d\x9a\xd8\xf4\xc0J\x013`\xe4\x03if\x07\x5c\xdb\
-\xc9!&Z\xa6v\x9fC\xfc\xe6D\x84J\xb4\xd0B\
-Wp\xcd7m\x22\x92I\xcc\xe4wL\xeao~\xe6\
-\xe5\xd0_\x8d\xe4\xcf\xf8W>8\xf2S\x92\x1f\x86\xce\
-\xc5\xd6ou\xaf\xe1w\xfap\xb6-\x5cA9_\xa6\
-\xa5\x1b[B\x5c/\xcd\xea\xad\xb6\x92\xda\xae^\xe7\xa0\
-S>}\xd2\xc6\x0d\xc0\x09\x03b\xfb\x83~\xa9\xf0e\
-\x90\x17\xf3\x1f|\xc7\xfb\xf9\x0f^\xc6\xefI\xc19\xd1\
-\xab\xfd\xben\x00\xd8\xac\xb3\x95\xd4\xdam\xaf\xdbPp\
-bw%\xbc\xc8B\xf0\xea\xb0Ig\xe1\x09=\xdb\x89\
-S\x94bh;\x7fj6\x98\xf3\x9d\xc3*\x07=6\
-\xb5\xfd\xd3\x13G^\xbdx6\xa6\xb8;\x9f\x8d\x07;\
-ZL\xe7\xb6\xe3b\x96_\xfa\x13d\x1ct:\xd69\
-\x8c\x19\xc2\x19\x8b\xdb\x96\xe0\xf90\xc4\xe8\xc6\x0a\x15\xdc\
-\x94\xb4\xe1\xb7\x80\xc7\xe3\x9fQ\xe2O\x0cu\xe6\x09W\
-\xdb\xce\xb6=\x98\xe1\xc9x\xccC>l\xfea^P\
-\x10\xdd\xe7\x9a\x9dm\xb0[2\xfe\xf4\xd0\xe1\x13T\xdd\
-\xb6\xa3mt\xe1't\xe2\xfcB\xa3\xb6\xe1\xa6f\xee\
-\x1c\xa2C\xe7\x91>\xe6\xa5S\xb1\xb6\xe5U\x5c\xce\xf4\
-\xcb\x89\x8f\x10\xb4p\xe1\x22\xd3X\x0e\x9b>\x17L\xc7\
-\x09u\xf0\xc0\xb7~9h\xfb\xcb{\x09\x9a\x9b\x07\xe5\
-\x1a\x18l\xaeS:p\xf1\xd5\x8f\xdb\xd2\xc1\xb5\xcb\x5c\
-ng\xd6\x80\xc0_\x1e\xae\x80\xd8\x5c\xc0\xd3\x0f9\xae\
-cT\x9bo\xd9\xcb\x81Q1\x89\x7fO\x17<q\xe8\
-*\xcbE\xf3\xe1\x95\xbe\xd1\xcf\x93\xab\xee{\x8cc.\
-l\xfe&\xbdb\xc9s\xdc\xfb\xfa\xf7\xf8`\xe0\x07O\
-\xb5\xb0M\xa9|\xf2\xb0\xf9&c\xfc\xe0\x12o|\xb5\
-\xe1\xbc\xbd\xfa\x9a\xb8\x88\x1fN\xd9\xfco\xfe\xc9\x7f\x0f\
--\xaay\x97\xae\x077\x1f2\xd8\x16\x0d\xd3\x96\xb6\x17\
-\xc2\xf0\x98\xe0\x14\x16\x7f\xac\x8810?\x8c\xf9A}\
->%\xc9\x94\xe8(;;\x92\x9a\xf9\xf6\x9a>d,\
-\xde\x7f\xf8\x88&_-\x17\xe9\xe0\x93\x80\xdcl\x91\xcf\
-\xfc\x13\x82>\x15\xc0U\xda\xf7\xfcK\xc3\x98\x15\xd3\x1c\
-Gk\xbe\xf6\xfay\x9f\x81(@\xda\xe0\x0a\xc9\xb5q\
-\x22%\xfb\x006\xfd`\x07s\x22\x87\x7f\xf2'\x06?\
-:\x13C\x88G\xad.v\xc3\xf8\xb8\xf6\x11\xbd\xd1\xa0\
-\xa6\xdb\x8f\xce\xbf8\x0e\xfd\xa3b\x00\x9d?1\xa8\x0b\
-;\x5c\xe2d\xcczP\xa2Em~<\xe0\x00\xac|\
-\x22\xe5\xf3\xf8\x15\xdf\xb6C\xc9Wx\xf2\xa6v:9\
-y\xc2\x01W\xf4\x877\xfc\x01;\xdbQD\x86r\xb4\
-\x9f\xde\x7fx\xf1\xa1\xf4\x9e<vHO:?h\xc6\
-\xe7\xf0\x09\x00\x13\xfa\x8d&U7\xda\xfa\x15\x00\x0b\xaa\
-\xe0,X\xdaLx7\x03\x8b\xea\x05\x9f\xddRP6\
-\x85\xed\xb3!\xbaq\xbc\xb9\xec\x13&\xf5)D\x9d\xf5\
-zi^\x19\xd8\x90z\xb0\xb1\xcc;jl\x1b\x9c\xf2\
-\xd8o\x01l\xc8h\xb4~`\x92n\xdd\xc6\x94\x90\xf0\
-\x1f\xfa\xabE\xc1\x84\xc3A\x22\x90N\x9f\xb61m\xbb\
-\xd3\xdf||\xc4z\xb0\xe8\x08\x97\xcc\xb1\xd9\xd7\x98\xd1\
-Y}\x04\xc9o~\x13\x83\x93X\xeb^\x9a\x0e\xfd[\
-\xa1[\x8aN>Xj\x0d\x8c\x88\xd2\xc6ZL\xb4Y\
-\xa78e\x9d\xfc\xf0E\x7f\xc6\xd1\xf5\xf3\x8b3\xfaA\
-\x9e\x9a\xb6\x8b\x1a\xdf\xf4\xfa\xcd\x9c\xa0\x83g\x0a\x5c\xb4\
-\xa4E\xaf\xfa~\x13\xa9^\xe7\x0fu\xfe\x1d\xfcL\xce\
-\xd7[?\x04\xe6Mh.(\xa40\xaf\xc5t\x17\xec\
-\x8ea4P\xa1\x01l>\x0d\x88\xb9s\x8d\x0fm\xd2\
-\x09\x10\x178U\x8e\xd7\xf5\x8fYW$\xd0\x99\x9b\x00\
-\x19\x83\x8b\x94\xe7\x8e\xeb$\x17OG\x06\x8bv>R\
-E_l`q\xa3\xc07\xe6\xedS\x9e\xb1\xed\xa7-\
-\x8e\xf7\x84)\xd0|\x9b>\xbc\x5c\xf0\xf9h^\x12\x89\
-\xe0p)\x1e\x8f/\xe0h4\xb3\xff\xd0\x8f#\x0d\xaa\
-pu\xbc\x83\xf8\xc8\x9el\xf0\xb8\xb0\xea\x13\x89\xec\x15\
-\x0fB\x1a\xb8\xc1\x10\xbfc\xc0c\xc6(\x8av\xacR\
-5n\xfe\xb0P>}P\xa4\xf4{\xdd\xc0\x0c\x8c/\
-\xf2\x99\x92\x99?\x93\x82k\x15\x19k`\x8d\xce\xaf\xaf\
-,UX\xd9\xa3P\x924v\xb5\xcd1_\xd8\xd8\xfb\
-\xc7Cql\x96f\xd6\xef\xc4\x9e6\xcc\x19+9\xcc\
-\xa7\xfa\xa20\x03m=l3+I)\x1d\x7f\xd4`\
-#6\xf2\xe0\x8c\xff\xc0\x941<\x19\xf4\xca\x87k\x12\
-\xa9\x19^\xf7\xaa 7\xa6\xb0\x8b\x09\x1b+\x95c4\
-&\x16kt\x14?\x98\xb2\xc9\x10\x9e\x00\x15\xabkd\
-L\x19\xd7XG\xcc\x9a\x13\xa7\x91\x05\xefha\xfe\x8f\
-v\xbdK\xff\xf8\xa2)\xe3\xd7\xcdu\x7f\x05\x00\xcc\xb3\
-.\xcf\xe1\x06\xe0\x9b\x9a`\xbd\x90\xbc\xc3Jf\x83\xb0\
-Y\xb2=\xce\xcd\x01P\xfb\xd4\x14\xa2\xbc\xe8\xab\xbf\xed\
-\xf8\xbd9b\xa2\xab~6\xab\xbf@\xa4DN.\x1e\
-\xc6s?IC\x9f|\x1f\x9d>\xfc\xe8\xe0\x15\x85\x0d\
-u\xf2\x83D\x09GZj\x97_N\xeb'\xa2z\x05\
-\xe0w\x06\xc3\xe1|\xf9\xd6\xf8\x15[LZ\xceW\xce\
-%\x7fp\xe1\xab\xee\xd4sr\x94\xdf\xbcwz\x95\x8b\
-\xbe\x857\xb1\xe1d$f\x05Ze\x9fl\x8e'W\
-V\x9e\xc9\xcf|\x10\xb7f\xe2\x18\x8b\x11\xdco|^\
-\xd0w~\xb9\x8e\xfc\xc1'\x97\xf2\xf4\xfa\x0d\xde\xe8A\
-t\xe7\x81\x1c_Hi\xa80\xed\xf8N\xbdW\xfe\x8c\
-\x81\x97\xb1\xa8y\xfd\xfa\x81\xd3\x17\xd4D\x9b\x22s\x02\
-\xe8\x94\xac\x7f\xd6\xb4\xbc\x8c\x84b\x0c\x1a\x12\xb60\x9a\
-\x1b\xa1\xfa\x1dx|\x04\xf8\xe2h\xbf;\x9a@\xdd\xa8\
-h+\xf2\xcd~\xfc\x5c y\x17\xeb=E\x9c/`\
- \x13\xaf\xa7\xc4\xe4\xdd\xb20\xeb37 J D\
-\x17`\x8e\xc4\x91\x99\xb9H:\xfb\x9e\xb5\xcd<27\
-\xea\xa9\xa3P\x17b\x9b\x85A\x11z\xa4E\x1b~#\
-\xea\x13\x08\x86G\xdb?\xfdf\xbf\xf0\xc0\xf6\xdd\x93q\
-\x95\xef@\x19U3\x7fF\xf4'\x0e\xca\xf5u\xde@\
-Q\xcd\x18\xdc\x8dN\x18\x92\x13\xb3\xeeG\xcc\x9b\xf3W\
-X\xe8W\xbc5\xd3\xaezl\xa2D\x8a3\xd3po\
-\xe9\x88$\xe7\xbf\x0f0\x91\xd5\x1a\x11\xceg\xc8\x96D\
-\x80\x07\xd7q8\xc1S\x92}\xa1\xb8\x93\x87pBt\
-l~\xfa\xc0h|\xe6\x0a\xf6\xca\xbf\xe7g\xbe\x94\xbc\
-\xf2=\x7f\xe4\x17s\xc6\x5c\x8d\xe6/\x0b\xfc\xc4%&\
-J\xd2w\xfe\x80R\x9d\xfd\x11-+ve\xdd\xf3\xcb\
-\x10\xfe\x00\x18}\xe9q\xda:X\xc9\xe1\x8b\x9eS\xff\
-\x1e\x7f\xe7c\x91\xc2_\xfd3$xu\x17\xd8O\x00\
-f\x04\x8b\xae}j2>\xf0\xe5[\xe6\x06@\x8b\xa7\
-\xff\x0e8\xf3\xed\x85\xd4By\xcdj\xc4\xc5F\xa0\x7f\
-n\x08\xdb\xb4\xa6].\xb9\xdb>7Y7\x05\x9b\x8d\
-\xb5\x0dlNwo\xf0\xe1f;\xf5\x82q\xd9\xd4\xa8\
-\x99\x17\x0b\x9a\xc6\xb1\x94h*'\xf0\xbc\xa8\xc0!i\
-f3\x19\x9dCw\xe9\xa2q\xe2\x18\xa3J6\xf2\xe4\
-w\xfcJg`k\xfc\x03P\x8d\xee\x8e\xcd)\xd0\xe9\
-Q\x9d\x16\xb3\xf4\x8f]\x90\x9d\xa3\xeaA\x09\xb3B)\
-\xf6t\x10\x96\xf1\xc8\xb0dy\xfe\xc7\xbe\xf8\xd5\x90\xdd\
-\x92\x1b\x18\xc0\xad\xdf\xa0\x9bc\xcd\x1f\xd8\xc3\xb2\xf4O\
-.\xe6\xf8\x98\x07\x8c\xf3B\x82.\xcf\x0d\xb6\xd1\xd6\xf1\
-\x8f&1\xe9\x878\x05\xa8\x09\x0es\xc9\x18\xd5\x9c=\
-#\x9b\xaf\xa0\x86\x99\xb9I\xdb\xc7c\xfd\xfa\xee\x9e\x17\
-\xe2\xbe{\x8f\xa6\xc4\x9b&\xd0\x8b\x13b\x7f\xf4\xafz\
-\xf1\xcc;{\x85z\x0c\x04\x93\xeb/\xfe\x99\x8f\x1e\x85\
-\x0b\x1a14\x89VQ\xc5?\x89c\x1c\x99?\xe1\xb2\
-\xf7\x18\x93\x9d\x04\x0c\x97\xaf|\x98\x01`f\xb9\xe0\xeb\
-g\xf8\xf9\x83:\xb9\xe8\xc6\xcb\xbb\xe9\xccM\xce\x91|\
-\xdc\xcfE\x87tM\x12~\x00\x06\xcd\x0d\xb79\xc8>\
-2f4\xc6z\x98w\xc9]W|\xe6\x00G\xc0|\
-\xba\x80<\xdb\xf3\xc1\x85\xc7\x16\xcd\xc2\xf5\xc5\x1b`\xc3\
-K\xafF\xa18p\xd7^}\xa1?&\xec\xf9\x11\x0b\
-\xf3\xc2C\x8b\x85_i\xe1P\xedq\x18R\xf3#\x8f\
-\xe7/\x07\xdfDe|\xcaU\xa05\x92\xcc\x1e#\xda\
-\x17_\xfaL\x83l\xaa\xd9\x0f\x84p\xcc9\xaa\x16s\
-O\x10>\xda\xe8\x1e<\x99T\x82M\x0c\x1aZ\xe2\x9b\
-\x9c\xe98_\xb9\xf5\x99C\x09\x17;BT\xc2\x9f\xf1\
-\xc6\x04:\xfch#\xc9\x92\x1c\xeb\xb1\x98\xdf]\x1f\xc2\
-2\xf9\xc3\xa8T\xe5\xcex\xc0\xba\xe8\xc2w\xe4\x0f\x87\
-9\xc7\x11~!\xd3\xbf\x9f\x17\xd9<\xf5@\xb8\x9d\xb9\
-\xc8\xfc\x05\xd7\xf9\x87\xce\xd2-{\x0d\x86\x88\x80hn\
->c\x8en\x1d\xdf\x22,\x1e\x1f\xcf\xf6a\xfe\xe07\
-\x9f\xf3\x0d@'\xbd\xf5\x9bl\x8c\x9e\x06l\x14\x1c\xe7\
-&`9\xe8S\xeccAi\xc9\xd4\x8d\xb0\xfdxf\
-\xe3;#\x87\xe5'\x8d\x8d\x08\x10\xd9\xc2\xa0\x1d?v\
-e7\x06\x0e\xca\xf2\x13+l\xf2\xb1\x9b\x1fwp&\
-t\xc7X3\xba\x89 >\xf8\xe1\x0fv\xdb\xe1\x0f\xfe\
-\xe2\x1f\xfa\xa4\x1a\xc1\xbc\xd6\x8cQ\xc5\xe3\xd7\xab'5\
-\xc5\xa3\xafF\xbf\xe8\xdb<\xe3\xc3?96\x1f\xe3'\
-_?p\x87?u\xb2\x91>\xf8\xc5\x1e\x07\xd6|\x92\
-\x11\x83\xf3aa\xac\x13cN\xe7c\x8bV\xeaPn\
-\x1b\xe1\xd6\xbfb\x06@\xd5\xe6O\x1b\x1e\x00\xf6\xfc\xa5\
-\x7f\xdd?U\xe0P\x02\xf6\xda\xd0\x99\x89|\xb4~\xb8\
-\x88%\xa6-^\xa9<\x05\xe8\xee\x05\xdd\x01\x89\x92\x8f\
-x\x8f\xdf!\x0e^\xb6\xe8\x1c\xb8\xb8\x04'f~\x07\
-\xcd\xa3\xef$\xc9\xf0\x1cs\x831\x18\xaa<~\xd5\x5c\
-K\xb1\xfao\xe7\xf7b\x8c\x9f\x87u\x19U=]\xa8\
-\xdf'XNiO%\xdf\xa1-9\xba\xba\xea\xa3t\
-\xdf\x08X\x1e\xe8\xf2\xc8\xf6\xe0w\xe7\x80\xbf\xba}\xfc\
-\x9d\x0f\xdd\xde\xfd\xd8\x9b\xb7\x0f\xbf\xfd\xc6\xed\xed7^\
-\xdc>\xf4\xc6\xcb\xdb\x87\xde|\xd0\xf3\xe5\xed\xa5D\xfd\
-\x83\xdf\xfd\xda\xed\xb7y\xfe\xce{\xb7\xdfR\xfd[\xbf\
-\xfb\x9e\xfa\xef\xdd~\xf3\x1f|\xf5\xf6\xdb_\xfd*_\
-=\xf0\xdcs\x83\xa3\xef\xfd\xe4\xca\x09\x13\x17w\xae\xa2\
-hP\xb1>\xe9F\xbf\xcf5\x8c\xbe\xd0\xfb.@s\
-\xa2o\x19\xf4S\x04\xc6\xcf\xaf\x04\x90\xec\xbf\x5c\x98|\
-)g\xf4\x9aSa\xca\xe9\x1c\x88t>\xbc\x10\x16\xbf\
-*\xc8\xffI\xa0\xcf<\xac\x8bOQ\xb8\x03$\x9fl\
-t\x85\x0fhYeh\x8b\xcfI\xa2\x0d\x0fs\x08n\
-j\xe6Wz\x84\xe1\xf5N\x0aa\xeeS3Jk\xa3\
-C\x96b<fw\xc9\x97F\xd3\xa5\xed0\x22\xcb_\
-l;\xcc\xfa\xc4\xf9G<\x5c[@\xd2\x85ikj\
-S*\xa66\xfa\xb4\xd1h\xfd4\xa6l\xfe\xc1\x1e_\
-\xe22^B\xad_\x08\xb6\x1b)\x00+\xbfc\xc6,\
-Q(,\x1f&\xda\xee\x8f\xae\x06d~\x83\x1fN\xa2\
-\xab%\xf3H\x9f\xb9[\xf3\xef\x8d\x815q\x02~3\
-=\x1f\xa1y\xb6\xe59\xdf\x00\x9c\x93\xae7./\xde\
-\xf0\xa6\x99\x0d\x9e\x8d\x93M@\xe0\xb9Jg\x1b\x9f7\
-\xd5\x18\xebc\xa3\xd0n\x9f\x0d\xa1H\x0e\xde\x1cn\xcc\
-!\x9b2\x91>\xae\x93K'\x01\x89\xd2\xe4\xd3a\xb4\
-\xd5\x96tN\xaf}\x82\x05%L\xbe\xe3\x1e\x8e\x9cN\
-t\x84\x151\xe3\x01>Z1\x84\x7f\xdb\x1c*\xf8\xd6\
-\x8e!\xc8\x94q\xac|\xd9\xb3\xd7\xa3\x89\xf6\x9c\xc63\
-\x0fNZ6\xb0(\xce\x1fM\x17~\xd9\xc2;\x9a\xab\
-\xf3N\x0c\xf9~\xd9\x5c\xfc`\xc2\x1d>8\x8c\xeb\x1a\
-[{x\xca\x9fv=O\xaf\xdf\x5c/\x1a\xa4\x14\xa4\
-\x98\xdf\x9a\x8a\xdc\x17\x1e\xfc\x0eXc\xf6|\xc8fm\
-r\x01u*\xa2O\xa9\xad\xfd\xbcs\x1f\xfc\xe1r\x8c\
-\x02\x18\xeb\x5c6\xf4N\x10\xab\x9eT*\xfe\xa4@m\
-\xde\x98\x1e\xafCrK\x81\x0c~\xe7\xa8\x8b\x12\xf9h\
-\x1ah\x83\xf2.\xdc\x8c\xe4'0x\x00{- \xd1\
-\x93\xb6u\x0c\x1eDN%\x91v~\x7f~\xfb\x1aF\
-\x99\x08\xe6\x9f\xd61z\xc4\xeb\x22\xe7\xbd\xea\xe6{\xb7\
-\xcf~\xfc\x9d\xdb\x97?\xfb\xd1\xdbW\xde\xfd\xd8\xed;\
->\xfd\xce\xeds\xea\x7f\xf6\xe3o\xdf\xde\xfd\xc4;\xba\
-\xe8\xeb\xc2I<\xb9\x83\xf5\x1e7\x08j\xf3I\x08u\
-\xf77\x17A\xeb\x93\x15\x9a\xaf\xe9{\x04\xff\xd7\xdf\xfd\
-\xad\xdb/\xe8\xf9\x8b\xbf\xf6\xdb\xb7_\xfc;\xff\xef\xed\
-o\xfd:\xfd\xdf\xbe\xfd\xc6o\xfe\x8e\xae\xbd/\x8d\xcb\
-\x8dA>\xd1\x99\xcfV\xb8`\x83\xc4\x05_5\x93\xc0\
-;WMJ\xe6T\xd8\xbe\xd4\xcb\x99O\xdf\x08J\xf1\
-\xfc\x93\xa5\x9b\x00~M\x82\xb6|\x22\xa06\xb8\x5c\xb4\
-\x99\x7f\xd9\xfdW\x03\xb9\xa8\x13\xcf@T\x1c/\xf1\xaf\
-\xe0\xf4'\x0b6.?\x0b\x97\xf3\x07;\xfc\xf4\xd5F\
-\x9f\xea\xce\x81\x5c.\xad\xdd!\x0e*%d\x84\xee\x92\
-\x14\x10U\x9eK\xfccs>\xed%p\x85:\x19~\
-\x97\xa9\x1d/\xc3\xae\x87t\xc2\xa8\x96\xfe#\xae\xf8\xa5\
-r]\x7f\xc1\xac\x81y\x9bu\xa9?\x83R\xef\xd0\xef\
-\xde\x8esw\x0e\xe1\x0f\xe8\x82\x1e\xec\xcc\xcb\x8c_6\
-\x8f\xaf\xa2\x9c\xff\x04? \x1e?yi\xafZ\x8eW\
-/^~\xab\x5c7o\xcfu ]\xe7\xd6:\x8f\x1e\
-\xde\xecF\xca\x8b\xbf\x166\xab\xb8N\x8e\xbdQ\xe4\xd1\
-\x02gS\xce\x22+\xaa\xfe\xd491\xd8#&\xd1\xa1\
-~`\xcb\x01\x907\xd9\xe1w\x1cx\x09L\xfe\xec)\
-c)g\xe5\xabe\x9b\xfd\xc1*\x0f5%:\xab\x8f\
-@#\xcf\xe6\xac\xfe\xeak\x9dx\xbf[1\xcaU3\
-\xc8\xd5\x12\xfe\xc1G7c\x92\xd1\xf4:c\x96>\xdb\
-\xe9\x89\x7f\xb5\xd1\x97\x88\xda\xce\x1a\xea\x95\xdf\xb6r\x1f\
-\xf3\x87o\xd0\x95#\x1d\x8ej~u\x95\x1f^\xd0\x9f\
-\x1a\x7f|\xd6_N\xc5Z\x97/\x84\x1e\x819\x18\xe4\
-\xfd\xfaA\xdb\x8b\x11\xed\xbc\x88\x98\x09\xc2(;\xc7o\
-\xeb\xe0K\xd4\xfd\xf8y\xb7\xed,\xe7\xa8\x890\xc5\xf9\
-\xa6\x00.\x8f\x83\x18u\xf4$?\xfc&\xbf\xce\xaf\xd9\
-\x89\xe2B\x93\x14\xbeq?\xaa\xe4\xc0\x8a\x0f\x1c5\xc5\
-\xcd\x8b\xde\xfaH~\x22\xf3E7ut\xa1!.\x97\
-\xdap\xf3\x17\xfd<M\xbc\xdd\x16\x0eX\xd4\x19\x17\xd7\
-~\xfa|\xeb_\xff7\xba\xde\x0b\xfd\xe8w~\xf2\xf6\
-\xa3\xdf\xf5\x99\xdb\x97?\xff\xb1\xdb\x97?\xf7\xf1\xdb'\
-?\xfc\xd6z\xe7\xeb\x8b\xa5\xf0x\xf0\x03\xb6u\xd1\xd1\
-\x1c\xbc\xa7\x9b\x81\x97\xbap\x83\xedo\xdb\xc3\xa46s\
-\xfe\x9e\xfe\x15@\xe7\x9e\xb5\xe6\xdd\xf6\x97\xbe\xfd\xa3\xb7\
-/}\x9b\xfe\x10\x9b\xfa\xd1\x93\xf9\xfe{\x7f\xff\xab\xb7\
-\x9f\xfd\xa5_\xbf\xfd\x0f\x7f\xeb\xd7n\x7f\xed\x17~\xf5\
-\xf6\xf3\xbf\xf2\x9b\xbaf\xeb\x1d\xb9.\xf2F#^\xf9\
-\xbc\x8b\x7f\xf5\x1es\x04\xbf\xb4\xa8\x19\x0e_\x89\xd5\x01\
-\x8f4\xde\xd5g\x8es\xf3\x04\x00vxs\xc3\x82&\
-\xdf\x1c\xb9\xa16\x01B\xf3\xdc2\xe9t\x8d.\x06\xb7\
-y\xcf\x0e@\xde\xbb\xc3\xcb\xbf\xaet1\xbc\x94Rs\
-oB=9\xf7\xe7\x17\xf1\x1d;\xed{\x7f|\xcdg\
-\xf4\x14\xaf@\xda\x02\xe6\xe1q\x8b#\xfe\xc1T\xaf\xbe\
-d\xd4\x9fy\xceP\xe5!\xcf\x89\xd1l\x06\x19\xa3\x9b\
-:\xf1\xd8\xcd\x83\x02\xfb30\x86\x96tt\xd0)\xfe\
-\xd4\xc4c\x86h\xca\xcaW\xffl?=\xfe\x8d\xe3\xf4\
-\xd0F\xb30\x1f\xf3oLcw\x1e\x16\xbd\xf0\xf4\xf0\
-\x9a\xbdz\xc5\xaf\x00\xee\x8b\x87qo\xfc\xa0\xf7?\xc8\
-7\x00\xbf\xa7\x09\xd5\x89\xfc&\x09Y\xa4L{7\x1e\
-=\x165;\x8d^\x22cg\xef\xa5\xef#\x9b\x14\x87\
-\x8a\xcdi&\x7f\xdaGz6R\x12c>\xf3\x1b\xaf\
-:[\xee0\x0c\xcbe#\x13G\xfe\x08Hm\xf0\xaf\
-\xcf\x0f\xec\x0c/\xc3\x0c\x80\xc7\x9f\xf4k\xfe1\x80\x9c\
-\x08\x09\x1a\xa6;\xfeh\xf6\xfc\xa5y9n\xfd\x997\
-\xf7'\xc2*\x9e\xe4\xcf\x0a,\xbe\x99\x8b\x9cb\xf1\x01\
-\xe1\xfcc\x9e\xd2\x8cb\x0fX1\x1eo\x02\xed\xa6\xcf\
-\xc5\x8b\x8e\xcd\xe3;\xe75\x810\x04\x85y\xf6ER\
-\x8e\xcc_|\x93z\x8d\x8b\xab\xe2<\xaf}\x01\x02\xe7\
-\xe4\xe9\x85\xdf\xe3\x12\xf0\xfe\xfd\xfd\xf08^P\x10\xf5\
-\xdd\xa1\x16\xd2\xef[u\x9d\xf0\x8b\xcd\xf0\xa1\x8b\xdfI\
-\xc7\xca\x1cD\x02\xd8\xb5\xe5W(\xf3nT\xd9\xfe\xe8\
-\x9f\xab\x09\xc5\xef\xba\x93\x971\x02\x98\xa7\xa8\xdc\xce_\
-\x0b|\xe5\x7f\xc2\xe7\xfd$?7\x1a\x94\xf7\xf5\xee\x9b\
-\xbf\x05\xc0E\xff\x07\xbf\xf0\xb1\xdb\x8f}\xe9\xd3\xb7\x1f\
-\xfb\xeeO\xdf~X\xcf\x97\xd2e\xff\x5c4\xb9pr\
-\xb1\xe6\xe2~\xd3\xc5\xb67:\xb0\xf3\xec|u\xafP\
-3\x86\xfcn\x9c1R\xf2bk\x9f\xf0\x1d\x22+^\
-.\xda\x99\xe7\x5cl\xc1\xff\xd8;o\xde\xfe\xc9\xef\xfd\
-\xf6\xdbO|\xdf\xbb\xf6\xfd\xbd\xbf\xff\xbb\xba\x11\xf8\xb5\
-\xdb\xff\xa8\x9b\x01\xea\xbf\xf9\xab\xbf\xa5_E\x08\x07,\
-=\xb9\x92\xfbK\x8a\x00\xfa&A\x1a\xc0\x95d\xffE\
-E\xad\x87\xff\xabatM\x9eu'L\xb1\x16\xe1\x1c\
- \xbc~`\xeb\xc1\xfe\xf3\x85\x1e\xbbZ\x04\xf9\x13\x07\
-\xd5\xf9\xa4A+3\x03Z\xaf6\xe0:O\xfc\xfc^\
-\x86\xb4\x16\xafC;\xa9\xcd\xa9f\xe7G\x0d\xe4\xbb_\
-\x9fk\x1b\xb1\xbf&_D}\x9dL\xe8Rd<\x0f\
-P1\xd5[\x94r\x80\x8bn\x8a\xf3\xad#\x86\xd7\xbe\
-\xfe(\xa1\x17vde^_\xa3\xdf\xc8L\x07D\xd3\
-qN\xda\xdd\x07Dx\xfe\xe0\xaf\x9e#\xfe\xa2_v\
-\xdf\x90\xa9^\xf9\x03\xef>\xd0\x8d\xc9\xa8\x8e\xf1K\x89\
->m\x0e\xfb\xf3?~\xcb\x0cD+\xe4\xdf\xcbd\xcd\
-9\xe1\xd8Zl\xael\xfel\x0a\xbcl\xe6\xda\xd9,\
-\x8dM\xfb\xdc\x18\xcew\x86\xf7C\x93\xd8\x8a\xdd\x16\xa9\
-\xcb5v\xf2\xbca\xbd\x19\x83\xdf\x17=\xfb\xee\xec[\
-\xabN\x8c\xbcU\xd8\xfa\x83d\x9e!\xb5\x85\x93\xab\x9b\
-w\xe5\xcb&\xabU,\x9b\xba\xd5\xbbT\xcbp\xce\xcb\
-\xa95\xf3\xc7\x9c\x91\xd5\x0c\xe2\xc7#{\xf1\xc2\x7f\x8d\
-\xbd\xe6kN\xf5jM\x06\xcaZ\xe8\xf7\x1dn\xec\xb2\
-X\xd3\x13\xfa5\x1f\xf15\x1b>.F\xe0\x09\xc7\xaf\
-\xb6 J\xa3\xda\x8f\xd6O\x8e\xea\xed\xa0\xdb\xaf\x0e\x02\
-2\x96\xad\xd2\x88\xb2/\x9e\x8e_\xc1\xd5\xd3\x1c\x0c\xc6\
-\x94\xa4\x5c\xf4\x83g\xbfUf\xfc\x91\xac \xc53~\
-\x94\xf9\xe2\xa8\x0b%\xf9\xbe\xf0cv\xc1\xa2\xa2\x8al\
-~\x92\x93w\xec/\x19\xa8p\xac\xcf\xfc`%\xde\xf6\
-\xdaT\x83\xc0\x11~4\xf1Q47\x07<2b\xbd\
-\xa3\xd5\x85\x8f\x95\xf2\xfe\x19=\xfeh\x9b\x1b\x00\xc5\xff\
-\xc8\x17?q\xfb\xd3?\xf0\xee\xed\xa7\xbe\xf2\xee\xed\xd3\
-\x1f\xe5\x8fn\xeaa\x09y\xe7\x9ew\xc6\xdc|\xf8v\
-\x22\x17\x7fD\xab|M\xfff\x1f\x9d~*/L\xe1\
-G\x94\x7f%\xe0\xc9\x89\xbe\xfc^\xdd\xc3\xd3\x9a\xe6b\
-\x09\x92\x94\xb8t^\xf94\x01\x8a\xf7\x22\xc4z\xf8\xba\
-\x02\xb1\x1f}\xe7\xad\xdb\x9f\xfaG?w\xfbS\xdf\xff\
-9\xf3\xfe\xdf\xbf\xfe\xdb\xb7\xff\xf2\x7f\xfd\xa5\xdb_\xfa\
-\xd9_\xba\xfd\xa2~e\x80\xce\xf7\xd1*^\xbe?\xe1\
-\xac\xd18Sf\x1f`>'\xfd=\x00w\xcc\xc3_\
-\x0a\xf4\xfbx/x\xc6\x82-s\x9d+88hy\
-\x9fOK\x0c\xa4\x0e\xc57c\x19\x8f\x87\xeds\x84O\
-\x1bf\xff)\x09D\x17U\xb4\xc0A+\xe4\xedg\xff\
-a\x1a\xfe\xe6+\xd4cP\xe4\xe3\xf3\xaf\xf9\xe7y)\
-\x9b@\x817\x8f\xf3a\xc1\x86o\xf6\x19\x06\x99A`\
--\x97\xdd\xfc\xc4J\xff\x88\xc3G\xf16\xa5v\xe7N\
-\x7f\xed\xe4\x0f\xc7\xe2\x0f\x915\x01\x85\xb6\xa0l\xad\xcd\
-A\xbci\x15\xb3\xf2IB\xa7\x1e\xd6\x8b\x07\xa7\xcc\xed\
-;\x1fc\xf3\xd5&\x9a@\xebW3\xe3\xa7\x96\xb9e\
-\xae5\xea\x9e\xd6z\x9fU\xfd\xdcn\x00^?\xe1s\
-W\xe6u\xd7\x22\x9e\x0b\xd6v6\xcc^\xb59\xdd\xbc\
-\x8a,;\xc5[\x89\x85?\xac%\xcd\x869\xf3\x93\x83\
-\x7f\xb6`6\x8e\x0c\xce\x1fbN\x0cJ\xf8\xcbZ\x1c\
-6)\xf9\x8e`/\xba$CMc\xa9\x96=\xfc\x93\
-\x8f\x9dX=w\xfe\xc6Y\xf9\x81\xd0\x11_\xb8:\x1f\
-\xab\xb6\xcf!\xd1\xaf\xa65#FA\xc6\xeaIR\xde\
-\xd6'\xbflhD\x91s\xd61\xfd\x9ex\xf1Ew\
-\x15\x0f\xfb\x8c\xffu\xebg9F\xb7v\xbf\x15$\x13\
-Dx3\xc6\xce\x89\x0d:\x94\xaf\xeb\x97\x0b\xe9\xb6;\
-n\x82\xac_m_\x98=\xc1x\x83?\xd31x\x8c\
-\x09\xce\xf0\xa2\x87g\xc7\x9f\xcb y\xb2s\x91P\x18\
-\xbe\xc5\x9dk\x05\xc6\xa5\xcf\xf9J\xf1;\xf7d\x9a:\
-(\x02\x90\x1e\xda\xf9\xc8\x1f\xe0\x99gt\xfab\xa8>\
-x\xf4\xf1\xa9\xad\x96\x9a\xca\xd2\x15\x9e\xdf\x81\xfb&\x81\
-K\x97L\xfe\x8e\xc0\x5c\xf8\xfd\x0eU\xf1\xfeb\x1a\xd7\
-C\xb5\xbf\xef\xdb>|\xfb3?\xf4\xee\xed\x9f\xf9\xfe\
-wo_\xf8\xe4\x87\xc5\x9dw\xdc\xfd\xa8\x9e\x1b\xae\xf7\
-\xbe\xa6\x8b\x1b\xf8\xba\x98*%\x9ct\xf5\x80[@\xfe\
-r\x1fJ\xf2i\x02\x9e\x94\x9e\x17\xae\x85\xe1\xfdA\xed\
-D\xf5\xa8\x03b\x9f\xc4Y7\xf3\xc8L@k0\x0d\
-\xc6\x9a\xe8+\x06\xf9\xd8\xc9\xcfz\xbc\xba}\xee\x93\xef\
-\xdc\xfe\xf5?\xf1}z~\xef\xed\xe7~\xf9\xd7o\x7f\
-\xf9\x7f\xf9\xe5\xdb\x7f\xf5s\xbfr\xfb\x8d\xdf\xf9*H\
-\xbaD\xeb\xfb\x03\xe4\xfb\x82\xce\x0df~-\x11\x02\x1d\
-\xb9\xb83\x87\x1agy\xfd\xaf\x0e\xf8\x94\x83\xe2\x1b\x95\
-\x08|\xc1\xbf\xab\xa48\x10\x84\xce\x05\x17\xf9\xc9W\x8b\
-u\x8cV\x84:Az\x15\xa36\xf7&\x14\xcc\xc8r\
-#\x13#XY\xf8\xc1I,\xfe)\x99\x19l\xdb\xba\
-\xdbA\xab\x9aD`\xdb\x85\xf9\x22~\xa4\xdb\xd1u\xf2\
-\x84\xcaa^y\x9c\x7fM\x8f^cl\xcc\xa5\xa4\xfa\
-\xc7\xb5\xec\xf4\xa7c~\xb5\xad\xd9D\xd5\x22\x22\xf2\xed\
-\x0b@R\xae\x02<~\xed\x87\xf8\xe6\xc8`\x083\x7f\
-}\xa5<\xf3\xb3\xe78\x7f\x9c\x99\xf4=\x17\x84\xca&\
-\x04\xae\x9b\xe3\x8d\x96\xe7z|n7\x00\xaf\x9dgm\
-R\xceX/VNz^H\xb2\x99\xd9\x14\x146r\
-l\xb3\x97\xa6o\x1f\x07\xc7g\xafp\x9c\xf5\x9e\xec\xac\
-x6(\xa7\xd0\x81\xad\xc0\x9c$\xf0\x87\x83\xed\xb1\xb8\
-\xc0V\xf1>,\xc7\xd2\x8a'X\x10\xb1\xab\xcc\x5c\xad\
-\xb2\xa1\x83\xc2\xd6\x0do\xb1\xd3w\x9e\xb7#8\xf8\x1c\
-\xec\xba\x9c\xce\xae\xa6bO\x1d\xec$&\x1eKx{\
-\x11\xa1_,\xeb\xf08\xe0\xa7T\x7f\xeas\xe6\xaa\xc7\
-\x17\x1c\xf4\xafq+\xd6z\x0c\xe0v\xc7A\x0cz3\
-\x7f\x0a\x9aW\x9c\xbc3\xdcyk\xae\x1d\x8d\x0c\xf8\xa3\
-[\x95\xb5\xa5\x1f<.\xbe\xc6\x86w4w>sa\
-\x04{b\x02G\x86q\xc0\xab^c\xce8\xb0\xa3\xcf\
-\x17v\xd1\xac5\xf2\x05!z\xd0E\xe1\xa3\xf2\xf2Y\
-\xabe)F\xb5\xf9y\xe11?7\x01\x5c\xd3\xd3\x9f\
-K\xda\xede`\x8c\x85(\xf4\xf8\xad\xbb\xaa\xfcQ\x1e\
-]N2`\xb2M\xebw\xfa\xc2\xf1_\xe9\x13~~\
-\xaf\xadd>\x05P\x85\x1e\xbe\xa9\x8e2~\x9f\xcd\xc7\
-h?\xf9\xbd\x9f\xbe\xfdK\x7f\xfcK\xb7?\xfa\x9d\x9f\
-\xd6\x85\xc8\x93\x05\xda\x9a;B;\x07\x5c\xfcY[>\
-U\xf0\xaf\x02pN\xf1\xc5L\xf9YO\x19\x15\xe8\xf1\
-\x0f&a\x19/\xfc\x8c\x81O\x03\x92\x0f\xaf?\x0a'\
-\xc8&E\xf0\xc6\x9a!\x92O\x93y\xc5\xa7\xda\xf7?\
-j\xbf?\xbfT_8\xc2\xec~-\xcc\x0f|\xfeS\
-\xb7\x1f\xfc\xe2\xa7o\xff\xe6?\xfb\x03\xb7\xbf\xfa\xf3\x7f\
-\xfb\xf6\x17\xff\xa7\xff\xf3\xf6\xdf\xfe\xcd_5\x16\x97e\
-\xde\xaf?hrX\xbd\xbc\x83V\xcdd\xb9\xaf\x1a\xbe\
-Y+.\xe8\xc8X_\xb8\xe4>\x81\x8b8\xf3\xc2\xcd\
-\x01\xdfo\xb08\xc6\xc8\xa7\x06\xf95\x0a\xbf\x86 \x86\
-<<\x1e\x11y\x0c\x07&h\xa8e\xa06\x87}\xd9\
-/\xf6)\x1a\x95\x94\xccH\xacQ>\xf9D$$X\
-\xea\x18s\xd5d\xcf>S\x5c\xd6\xc3#W\x1eup\
-\x88\xda>\xf4$\xa7kk\xfe#>y\x1b\x07 F\
-\x99<\xf27^\xb0!\x02\xb3\xbe\xa9\xd7\x08\x89\xc7V\
-\xcc\xddw>\x04\xf5\xcdx\x12\x1b\x9c\xc6,~b0\
-\xaa\xc4\x96\xde\xe2Pc\xe5'l\x8f\xff\xc1;q\xac\
-\xcf\xbb\xfaV\xb8\x01\xe8:\xb2\xc3\xd6\x06\xf1f\xf0j\
-f\xa3\xd1\xd7\x9a\xafBR\x17x\x19\xb1\xe9Y\xc0\xfb\
-\xfa\x8c;7\xb3w\xe68\xbb\xc1\xc2\x1f\xa3q\x00>\
-\xf9e\x0c\xbf\x1a\xe8\xa4\xc8?/;8\xa5\x03\xfb\xae\
-\x1d\xe0\xc0h\xec\x0b\xcd\x12L4y\x83WX\xf7\x19\
-\xff\x0aL\xcc\x1a\xbf\xe9uP\x0ca\xee\x82S.\x1a\
-\xa4\xf3\x9cr\x19\xff\x8e\x1c~\x82\xce\xfc\xc7\x00^\x1a\
-s\xc8\xb7\x88\x90@\x9e\x0c\xd4\x09Z\xb5\xc5-\xfe\xc6\
-\x92^\x80\xd8\xfc\x8eTq\xb5\x9e\xfeIwN\xe6J\
-q\x9d(i\xae-\xfc\x896\xce\x1a?\x0d!\x8e\xd1\
-\xd8\xcd\x97+\xeb\xa7\x90\x8e\xc3\xf3@\xfc\x020h~\
-\x07\x9a\xb1:}\xc4\xc2\xdf\x1b\x15t%O\x97\x0e.\
-\xd2\xea\xf3\x8e\x91k\x11\xbf\x8fWh\xb0\xcc*\x9b\xfb\
-\xc3C\x8c\x03\xe0P\x87\x1f]`|\x05U\x9b\x1b\x03\
-~o\x1f\xbd\xef\xdf>\xa1o\xf3\xfd\xd9?\xf2\x85\xdb\
-\x9f\xfb\xd1\xef\xba}\xfe\x93\xfc\x9d\x93\xbc\x00\xfa\xf7\xf8\
-\x8a\x7f\xf9\xf2A\x7f}W\x97F\xd5\x14\xfdA]\x7f\
-\x81\xcd\x9at\x81{C\x17e\xa3\xa9\xed\x0b\xb4\xc4d\
-\x1c \x99\xde\x02\xb1\xcdP\xa5'k,x\xe4M_\
-a3\x9f\x5c\xc4i2\x8c\x8e\xd5\x91\x04s\x13 \x7f\
-n,\xd5\xa5\xaf \x5c\xe0\xf7\xc6\x85\x8ey\xe4g~\
-\xbe\xa6y\xf4\x8d\x98\xda\xc4\xfc\xc9\xaf|\xee\xf6\x93_\
-~\xf7\xf67\xfe\xf6o\xdc\xfe\xd3\xbf\xfa\xbf\xdf\xfe\xca\
-\xff\xf6+JP\x12o\xc1\xb9\x89\xd3\xd3\xdf\xc4\xe7W\
-\x00\x02{\xe5\x1b\x01\xb9\xf8\x15\x80/\xf4\xb2\xe2\xe2\x9f\
-\x1cB`\x01\x8a\xe3F\xc5\xe2\x99s\x02(j\xfb&\
-\x08|iE\x83\xac\x99\xd1\xacD\x8e\xbe\x8bH\x16\xa1\
-\x04\xf1\x04{J\xa82?q\xe2\x00\xb36\xd5\x8dm\
-\xc3}\x0b4\xa6c\x892\x81\x9cj\xc6\x06\x14\xf9$\
-\x82g\x87m\x86H\xa8B\xd6\xadK\xcd\xc3O\x1ep\
-S\x1b\xff\x10\x8f\xcf\x90\xd5\x9a\xe8sN\xccO:s\
-4\xf5e\xfc\xb8\xacqr\xa9\xc4\x97\xf9Ss\xf9\xb0\
-\xb6l\x0d\x86\xf4\x5cI\xa5\x09\x12\x93\xf9\x93w|\x08\
-\xf08\xd4\xa7\xed\xc2\xfe\xf8\x16)\xcf\xf1\x06\xe0\xe9\xd9\
-\xf7\x1b\x1a\x16Ke\x0e,\xa6\xbb\xaah\xb1=\x9a\x9c\
-\xbe\xdd\xe3#f\x16;f\xf7qf\xb3\x06\xb6'\x83\
-\xf3\x01S\xc3yjCW|\x1a\xa1\x0ff\xb1\xb3\x99\
-\xd5sl\x00\x9ag\xcc\xe1\xa6\x22\x87\x1f.\x02\xdd\x98\
-\xc5o\xdfq\x02@\x97mg~\x04X\x93\xb1'\x0e\
-r\x1e\x1b\x0b\xddf\x8b-\xb2\xc6\x22\x1f/Z\xce%\
-\xee\xd0<\x00\x0bK$\xbc\x0e\xb7\x84\x1em\xccE\xe6\
-!\xe3\xcf\xd8\xd6\x5c2F=\xc0q\xbe1\xc2\x19\xba\
-\xad\xad\xf0\x1e\xcf\x10\xb5m\x1d&\x88\x03NJM\xe4\
-\xe6\xc2\x10<\xbd\xb6{~;6\xc2\x8bOc\xe9?\
-\xb4U\xb3q#\xceq\x9e\x7f\xe5\xe4\x02\x07\x0a\x1c\x02\
-\x04\x93w\x93\x8c_B\xf8b\x19\x09<|\xa3B\x88\
-t\x18W\x174\xc6/\x93u\xf6\x05\x96w\xef\x99D\
->E\xc0\x0b\x9eLD\xf2\x03/\x98z\x02\xcf\xc1\xdf\
-\xfa\xf7\x05\xe7\x9c\x7f\xe1\x93\xad\x17\xee\xfcS\xbc\xf7n\
-\x1f}\xeb\xe5\xed_\xf9c_\xba\xfd\xcbz\xc7\xff\x91\
-\xb7\xde\xb0\x0e\xb4\xcd\xd0\xac\x91X\xc7/qrs\x81\
-S\xdf\xdf'\xe0ze!\xc2\xd7\x00\xb1e>\xf4n\
-\x17\x95\xc0\xa1\x09v:\xf3D\xab\xf5\xba\x0e'\x17N\
-\xc6\xc1\x05}\xad\x8f\xfc/\xf5\xee\x9f7\xd4\x06R\x05\
-\x1d\x93\xd5|\xbf\xcb\x1e\xb3\xd7\x1b\x1a\xf5=]2p\
-\xb3C\xba?\xb1P\x8d\x17\x8d\xdc\xe0 \xe7\xfb\xde\xfd\
-\xc4\xed\xdf\xfbs\x7f\xec\xf63\xfa\xa7\x85\xff\x99n\x04\
-\xfe\xd2\xcf\xfdr\xc6\xac/1\xbe\x0f\xb9b\x1f\xf4n\
-\xde\x7f\x13\x801\xe9_\x18d\xcd\xf4\xfd\x09\x08\xf5\x83\
-v\xa6(\x1f\xee\xefO%r\xfe\xc2\xc9lP4[\
-\x8a%\x0d\x91\xae\xc1\x94\x10cZ\xb9\xa3\xe2w\x8e\xe2\
-X<\xdf\x88\xb0\xd6;/\x1d\x85\xca\x06?EM\xf7\
-i\xf5\xdc\xc2e|\x05\xe2\xef\xb9<tcs\x90\x93\
-\x13\xa58\xe2\xf5$w\xe0\x15\x1b\xdc0)\xe7\xa2\x9f\
-\xbeJy\x94\xa4&\x11W~\xc0\x10\xe2RM\xea,\
-\x92\xb1\xf9\xa6\x09>\xb9\x98\xac\xe2&Q\xc7\x80dL\
-\xcb\xe8Fu\xb7\xce\x5c\x03\xb1\xb58P\x0e\xdb\x9a~\
-\xe1\xa9\x0e\xf8\x15\xc0\xef\x81\xbeEJ\xa7\xfa\x838\x9c\
-j\xa3\xe6\xc9\xa4\xf3\xe4\x83@\x9e\xdc\xbc\xf0\x89%\xff\
-$\xe3\xcd/\xfe\x07?\xf7\xf3\xfab\x8flY,\xd9\
-\xd6>\xa2M97\xc8\xa5\xcd\xeeT\xe9\xc97\xddY\
-l;t\x10\xae\xc2,J\x07\xb7\xdd\xa1}\xe4\xabY\
-\x05\xeb\x04\x1b%\xd8\x93\xc2\xa9@\x9b\xdeD\x83\xbd\xf0\
-d\xc6_\x03]\x95\xb5i\x9fh\xe3?O\x8e\xf4\x09\
-\xc4\x91\xbaM|n/;=\xc2\xee\xf5L\x80\xed\xe5\
-Od\xb5x$I_\xf3\xb5\xc6\xef\x93\xc8\xc0$E\
-?X\xfai>B\x1a\x7f\xbexa\xdd/7Nw\
-\x1c\xff\x8c\xab\xbd\x0c,X\xd8\xee\xc7\xdf\x0bH\x85\x9d\
-\xeb\x07\xef\x0c\xeb\x1b\xae_\xd7!kF\xda9/\x1b\
-\x88\xe1\xda\xe3\xf9\xc8E\xcc\xba8\xb8d\xfd\x891\x7f\
-\xae\x16\x0c\xc0\xfd\xf0\x90l\x00_\xac|a\x07W\x17\
-\x0c\xf8\xf9\xa8?\xdbMXL\x05v]M\xb8\xc8p\
-\xb1\xcbM\x83\x1b\xc1Q07p~\xcf\xee+\xa8\xf2\
-u1|G\x7f|\xe7_\xfc\x91/\xdc\xfe\xb5\x7f\xe2\
-\xbbo\x9f\xd0?\xdb\xf3\xc5|\xa8}\xc1R\x06\xa5{\
-\x9b\xb6u\xa3Ek\xf0>\xffA\x0f\xb8\x18\xe1`\xb2\
-U{]5\xaeuA\x16\xa6u:\x0e\x14\x85\xcd\xc1\
-\xdb\xc3R9\xc88\x1b\x80\xd0~\xbcos\xa0\xc9r\
-\xc1\xe6\xa7\xc7\x0e\xb72d`~\xb8\xb0\xa2\x09\xbf\x0f\
-\x80\xd1D\xa3\x1e\xfe\xc2\xa0\xfa\xe5\xf6\xaf\x1d\x08D\xbb\
-\xec\xf95\xcd\xed\xf6\xff\xe8K\x83\xff\xf9\x7f\xf77n\
-\x7f\xf1\x7f\xfe\xe5\x1b\xff%\x11\x9f\x02\xbc\xa7;5\xfe\
-j`\xd6Ic\xf4\x06\x1bn/>d<\xf94\x80\
-\x1c\xce\x0e7\xac%\xd3%\x1b\xb1.\xf5\x89Y6\xe6\
-\x15\x9ds\x8d7\xa7\x17\xd8\x98\xd1\xe74\x84\xf2\x1c\x18\
-\x9a\x14\xebR\xc7\xf3\xb0\xfa2\x0c_\xe6\xc0\x0e\x8f\xd7\
-\xf6\x19\xb7\xf39\xa8\x04/\xf3\x15K\x8e\xe0\xees\x92\
-\xa8\x08\x00\x97\x12\xfe\xad\xd3\xb4;\x8c)N\x06i\x17\
-\xfb\xe4\xdb{\xe4O?Y\xb1\xcf\x90\xcd\xd7\xc3\xd0w\
-\x98\x9eC|Y\xa7F1d\xe97\x80\x0e\x16\x13!\
-\x97|I\x89\x9ac\xac\x09\x93=6\xe1|\xed\x97\xfe\
-\x9d?\xf1\x15!\xff\xae\x9e_=\x9e\xf9\xdf\xab\xb2h\
-\xecD\xa0\x02\xb7k\x99>8\xe59~\x02\xf0\xd4\xec\
-\xe95\x80\xa5\xcd\x5c\xb3^\x94s!\xb3\xf8\x9c\x90\xb2\
-\xea\x87\xf0n\x88n\xdcd\xb0\xc5\x09P/\x00\xeew\
-\xbf\xd8\xa6\x83\xa3\xa6^\xf9+\xbe\xfc1\x0c+\x90 \
-\x1b8j\xc1\xc9\xf6v\x03\x9fJ7)\xfa\xd2\xaf\xd6\
-\xd4\x8d\xb1~\xc7\x8fX\xe2\xd5\xf4\xbb\x1e\xd9'=\x17\
-\x061gd\xd54\x98\xb6.e\xa0\xe9\x11\x9c=W\
-ja\x1a\x1a\xf6w\xe6/\xb5\xf5\x06v\xf8\xc1\x83\x7f\
-\xb8\xf4\xca\xb7N\x1e\xb0\xc1J\x841\xd3\xb6\xc1\x87\xf4\
-\x93\x83\x01E\xce\x11\xd1\xc2\x9c6\xdck\xfe\x07\xd8\xb7\
-\x08\xa4\x8c&#\xa9\x13\xcd\x1a\xddl\x03\x00\x00@\x00\
-IDAT\x02\xa4\xadG\xe6O-@\x08^\xf1`\
-\xd2\x1d\x03-5\xe7:\x93<\xf9)\xce\xa5v/\x07\
-_\x17\x16\xbe\x83t\xd0\xc5\x9b\xe3\xd0\x14\x7f>QN\
-\xa2b\xb8\xf8B\x9bX]\x0c\xe4\xf1w\xca\xf4\x8e\xd3\
-\xef\xa6q6\x9a\x7f\x9ag\xdc\x99\x17>AP\xdfs\
--\x22\x7f\x84\xeex\xbe\xe5O\x9e>\xfeV\xfdg\x7f\
-\xf8\xdd\xdb\xbf\xf1\x93\xdf{\xfb6}\x9b\x9f\xc2\xbb\xfb\
-|\x9c\xce\x5c`a\xf0\xa0\xb0\xbe\x5c}\x19\xa7\xfe\x0c\
-\x8el\x0f\xac\xa5\xeeF\xfcm\x7f\xb9\xde\xd3\x1f\x07\xf2\
-\x1f)R\xac\xb5r\xf1w\xaet\xcb\xdf\xbd\x08\x86\xcc\
-\x83oH\x88<o\x9eCS&\x00\x09\x5c\x983G\
-\xc9\xf3\xdc\x83a\x9f\x94\xa9\x01>\xff\x9do\xf7\x04N\
-\x7fO\x04\x5c4x,\xe5R\xdc\xf0E_\x9c\xd8\xf2\
-\xce=8\xdcxp\x81\xfe\xfc\xa7>|\xfb\x0b\xff\xdc\
-\x1f\xb9\xfd\xf4\x8f\xfd\xa1\xdb\x7f\xf8\x97\x7f\xf6\xf6\xdf\xff\
-\x1f\x7fW\xe3\xd4\xef\xf3\xdf\xd3S\xc4\xd6\xec\xbf$8\
-\x17{\x93\x09\xd3\xe3\x87\x1f|\xa13\x08\xffz c\
-\xb5\x0d\x9f\xe6\xd5\xf3\xeb8\xe1yrr>\xb1'\x92\
-\xce/U\x80\x90\xa6\x81RW\xf3\xdc\xbd\x9c}\x0c\xc5\
-*@\x93Da,\xaa<\x17\xd4\xd8T\xb2\xefw]\
-{\xbc\x8d\xc3Z\xde\xccM\xcf\x93h\x9a|\xf8\xbcP\
-X\xf5\xa4\xef\x80t\xdd\xd4\x01%\x8d\xf3X\x14X\x1d\
-\xb5;_\xf6\xac\x14jF?5\xd0#\xd4y\xea\xb4\
-\xae\x9d\x0cJ\xfa\x0a\xee\xf8\xd3\x8c\xbdZ\x14\xb7\xf9\xe9\
-\xcc\xb3\xfa\x19\x88M\xd2\xad\xc5\xb0~\xdb\x00\xf0\xea\xd8\
-\xff\xdc\x0f\xcf\xf9\x06 +\xb4W@\xfb|6\x19\x0b\
-\xb7\xda\x84\xb1\xba\x94\x9c0=C\xec\x91\xab\x1b\xae\x1b\
-\x82uN[\x8d\x95\xce\xc2\xcf\x0b\xe4\xac\x7f\x5cl\x90\
-\xa2\x83?mp\xddIT\xed\xcb\xa40{\xd0IK\
-?\x9b\x7f67P\x808F\xed\x8eI\xb5]\x98\x18\
-\xd3\xc9?\xda\xf6\x86u\xa8\xb9\x92cV\x1b\xdd2f\
-b2gm\x8f~\x82T\xa6\x9a\x93\xc8\x8ae;t\
-*\x06Y\x89\xeb\x09C\xa2,p\x00\x22\xad\xbc\x90\x9f\
-%\x9c\xe3]Z\x067\x13\xe8\xbc0\xaai\x9b\xf04\
-h\xb2\x18:lt\xd2\xb6A\x94\xf8e\x9c *\x87\
-M\x9fn\x9a\x8a#\xd1\x05\xdci\x01\xa9\xf6t\x97\x9d\
-\x0bS\x8d\xf8\xbafy\x07\x1dM\x9d\x17\x7f\xdcO<\
-Z\x86#\xefV\xd5\xd7\xc5K?W\x9d\x1e\x93\xdf\x07\
-\xe2\x11\xcd\x8cZ\x17\x7fA\x987\x17\x16](\x8c\xa7\
-\x83\x1d\x5c\x90\x87\x00.\x7f?\x80\xb9\x8e\xdf_F\xd3\
-U\xee\xcb\x9f\xfd\xc8\xed\xdf\xfe3_\xb9}\xff\xe7?\
-\xa9\xb4\x5cl\xd0\x1f0\xa9q\x9b\xb9\xf7o\xf3\x85\x13\
-~\xb4\xfa\x82+\x09\xc4\xf2)\x8c/\xf7\xba\xe2\xbf\xcc\
-\xef4,.7/y\xb1\xf6M\x10\xd0\xce\xe1\xa02\
-\x12\xb1\xd9\xae>\x17\x5c0\xa0\xe6Y\x0d\xf8\xad\x8dX\
-\xe6\xd0\xb5\xe933\x0a&\x9c\x8b\xdbL\xb1A\x139\
-\xc1\x8a\xc8,\x12Y\xe8\x15\xe1|\xaf\x9fL\xdc\xbcl\
-\x00\xc6\xa0\x8f\xfe\x95\xf6]\xdf\xfe\xb1\xdb\x7f\xfc\xaf\xfe\
-\xf8\xed\xbf\xd6?\x1f\xfc\x8f\xfe\x9b\xbf~\xfb;\xbf\xc9\
-\xbf\x1a\xe0\xa2\xaf_\x07\xcc\xcd\x0e+\x89\x06\xbe\x13\xc0\
-\xc5\x1e\x06\xf0\x88\xcb\x0d\xd3\xfe\x13\xc1\x8e5s\x22\x18\
-\xb3\xd7K\x00haO\xb8\xc8\xedq\x0b\xcc\x1am\x04\
-\xd9\xf7\x18\x96\xaa/bd\x84\x19\x9eQ\x13\xe1\xb0\xcc\
-1\x068b\xf2\xb1m\xbbf\xfe\x88\xe8\x5c\x9c\xed\xcc\
-=\xb3H\xb1X\xcf9\xbd\x95OG%:e\xd5O\
-\xdb^:8\x1c\xa0\x83\x0c\xbe\xd9\xa1I\x0e5\x93@\
-\xdb\xf0m\xb3\xae\xb3\xff\x891\x80\xc32/c[s\
-c\xce`n~\xf2\xe2p\xba\xc9\xe0\x1b\x1cU\xde!\
-\xe7k\xa6}\x9a\x0b=\xc8\x89\x82c\xfcX\xb2\xc4\x01\
-y\xe6\xc7\xe7|\x03\xc0\xd4{]ih#\xf8C\x00\
-o\x08YY\xf8\xb4\xa9\xd3\xa7\xc1\x83\xe2\xbbj\xd7\xee\
-\xae\x18\xe7hC\xac|\xb5\xb3\x19\xa0R\xeb\xb2y\x10\
-0v\xb0\xf4\xd8\xfc{CW\x07\xd4\x9b\xbf\xb1\x19B\
-c\xc2\x9f\xcd\xef\xf6d\xf8\x04 \x9f\x17\x19\x98\x06+\
-\xfc\xc15\xbf\xe2\xa9\xdd\x96\xd85\x8e\x01X\xfa\x05@\
-\xdbfF6\xed\xea\xc0\xdevk\x82\x14\xe6\xb2\xee\x8a\
-\x13h\xfb\xe2\xb2\x064\x09\x9f\x1c=\xf1QhK\xdc\
-E_\x1c\xbc\xb0\xe9\x85\xd5\xb1\xe8\xdam\xdfp\x93\xae\
-\xd4*0-<i\x84\xab\x9a\xbf\xa9\xf5\x0b\x12\xb0\x03\
-\x81,\x86\xe8~\xdeq\xa6\x83&\xffG4\xaa\xad_\
-q\xdc\x08\xc4\x1ea\xd1m\x01\x06\xc9\x05\x90U\xa0+\
-\x1c\x03\xd2\xf1+\xbbj~f\xad\xc0\xd2%\xc3\xab&\
-\x7f\x10\xc1\x22V\x95e`\xcd\xef\xaby\xef\xe8\x0d\xa0\
-+T/\xbaz{>\xb1\xfa\xa4@Mr\xe1e\xbf\
-|D\x1f\xf7\xff\x8c\xde\xf1\xff\xf9\x1f\xfdNc\x83D\
-\xb0/Xj\xf1\xbbm\xebw^p\xfa\x1a\xe7Y\x92\
-\x89\x0b\x93\xff)\xbc\xea\xe8\x06b\xc4\xb9\xc9X\xe4\xd3\
-\xc1/\xb0\xe4\xd0\xd6\x03X\xb2\xb8\x91\xc0\xe2\xf9 \xd8\
-=\xa4&\xc21\xc2\x04VA\xf9>\x81\x5c\x8ew4\
-\x11\xc1\x07\x8by\x81\x8fi\xcaz\xc9\x87]1\xfc\x9d\
-\x7fZY'br\xc3\x13\x98\xce|b\xb1\x11\xc7m\
-\x8f\xff\xf5\xc0h\xc3\x0e\x077)?\xf5\x83_\xbc\xfd\
-\x84\xbe0\xf8\x9f\xfc\x95\xbf~\xfb/\xfe\xda/\xc8\xc8\
-\xfc\x8a\x8c\x1b\x01\xc5\xbf\xafI\xe7\xcb\xe1\xcci\xfeD\
-\xb3V\x89\x98\xd1\xc9E\x1e\xb1\x9es\xc5\x9b\x82\xda\x93\
-\xb5\xf7:\x1a\xf8'\x87`zM\x14\x89\x0d\x83\xcf%\
-D\xa90\xabk\xae\xd5g\xb4\xb6\xe9\x086\xcf\xac]\
-\xe6;\xe7\x9f,\x04\xaa\xacs\x15\x22\x15s\xa9\x9d\x9a\
-}\xb5\xdb\xe48L5\xfb\x14\xf4\xe2\xef\xf3\xef\xc8q\
-\xfc\xe4K$\x94+#\xe9\xeaG\xcb\xd0'F\xa0\xd5\
-\xb1\xf9\xab\xc3N\xc7\xa1\x97\xbc\xe8\x8a\x12\x1c+\xc7\xed\
-\xf1+\x88\xc7\xd29\x13\x80\x1e\xdb=\x12\x10\x15\x83M\
-~\xd6\xe4l\x87\x87\x180=\x00\xad\xea\xb7Fy\xee\
-7\x00k\x15\xbc\xc0^\xe8,\xbc\x17\xd4{\x83\x05\xc5\
-\xc6\xa2f\xe3(\xcc\x85>\xed\xb5\x11\xd88l\x82\x18\
-\xdd6\x8e\xc3&\xdf\x9998\x9f\xe8\xd9p\x8e\x1d.\
-\x22\xb2\xe9\xe0\xef\xc6\x02\xdd\x01\x06\x08\xbf\xd9\xac\x11\xa0\
-nl\xb7\x89\xb2&U\xd6?\xf9\x18G]B\xd0\x06\
-Zjb\xe9\x82uj\xa2o\x1b\xe9*v\xab\xce\xa6\
-W\x8f4\x05\xac\xb9\x22bx\xb1\xb1\xeb\x9bc\x5c@\
-d\x8f\x9a\xb4\xf1c\xa9\xd2p\xee\xf1\x07!\x02\xecK\
-\xda\x9dV\xa22\x17\x80s1\xf5\x90\x04\xfeH\xbf\xfc\
-\xe5#\x16^\xf7\xdd\x16\xb8z[S.\x14X)=\
-\x8b=6\x03\x07\xbf\xf3\xd1\xdfk\x9f\xff[\x5c\xc6\x15\
-p\xcf\x05\xc2\xc0B\x1b\x02\x00\xd5\x8b\x9e_\xd7M\xcc\
-8\xd4P\x1c\xb9\x0c \x17mj\x02(\xf9\xb2\xdcC\
-^\x5c\xa2\x9f\x17\xda\x01\xc9\xc5\x8dw\xf9\x0a\xcd\x97\x01\
-\xd4\x10\x970\xb9\x19\xe0\x02\x05&\x17R\x7fG@\x17\
-\xbf\xff\x8f\xbd7\x8b\xb5-\xbb\xce\xf3\xd6\xad\xba\xd5\x93\
-UEV\x91\xc5*\xb2\xc8bWl\x8bM\x91\x22-\
-S\x96L\x91\xa2\xad\xd6\xa2\xd5XV\xa0\x06\x91\x14\x01\
-Rd\xc0A\x12\xe8A~\x88\xe2\xc4A\xe2@P\x1c\
-$\x86\x93\x08H\xf2\x94\x87<(/\x01\xd2!\x06\x9c\
- A\x02\x1bP(!\xb1\xd5Q-%\x91\xa2\xd8\x88\
-]\xdd{+\xff\xf7\xff\xe3_k\x9e]\xe7\x16\xa9\x9e\
-\xe7\x88\xf3\x9c\xbd\xe6\x98\xa3\xf9\xc7\x98s\x8e5\xe7Z\
-k\xef\xb3\x0f\x0b\x15\xf1\xfc\xc5\xc7\xee\xdf~\xeck_\
-\xbf=\xff\xb9w\xe0\xddw\xad\xfb\xa7\xebi\xebuC\
-\x7f\xfe\xe7G\xfa\x8e\x87\xd1\xe3'}\x88O!i3\
-K\x1c\xe9+\xcb \xe3\xd4?m\x04\x89v\xc7Nb\
-\x15\xf1p\x90Pe\xcf\x06\x98\xf1@\x0f\x01.=.\
-\xa2{\xd1A\xdcH9\xecr\xe9aB\xfb\xb8`@\
-ix\xc6\x01+r\xc7*eo\xfc\xe2\xe2\x9b2\xfb\
-\x8fp\x12\xaf\x99\xc2M<\xea\x9b\x0c\x89\xd1# \x1d\
-_\x10\x88G<\xb7\xe9/ \xfe\xf6_}\xd3\xf6M\
-o}l\xfbw\xff\xbb\x7f\xb6}\xe0C\x1f\x17\x8e\xc6\
-\x9f\xb7g\x9e\xbe\xaa\xcd>\x17\x19\xc4\xc7_\x0b\xf0a\
-@\xbdg K|1\xdf\xd9\xd8\x19\x14.\x12\xbc\xa1\
-\x8b\xc7W\x0b\xf7\xbb\x22\x1c\x17o\xb1\xe0\x90\xde\xa8\xd6\
-%\x86n\xf6\xcd\x10\x95~\xd04\x85\x0acJ\xcb<\
-\xf9\x16\x89\xac\xe3\xca\xa0e^\xc4c\x1c<\xf6c/\
-\xa3\x8e+\x00\x15\xd3c\xe8`b\x12\x1f;\xe6\xa0c\
-Ld\xf1\x1f\x1d8\xf4\x0dsc\xfa\x98\xb61\xcd'\
-\x96\x10\x89-\x8d\xce\x0b\xad\xc6z\x96g0\xa4\xfa\x91\
-\xe7\xdd?\xfc\xf8\x88\xffD*n4-\x83\x072\x11\
-\xc3\xa7|\x9e\xfe\xa3'\xc5\xc6\x98\x98lx)\x0e]\
-\x03/|g\x98 \xfd\xce\xdc6\xf9\xf6f\x043\x91\
-t\xd6\xfaK\x22\x904\xfc\xd8B\xd5\x9e\x1c(/\xc5\
->\xd4\xde\xfd\x89n\x82\xc0K\x10\xb57\xda\xce\xa3e\
-\x9d\xda\x83+G\xf8J<\x100\xd7\xf8\xcd\x80\xe9\x92\
-\x18\x17}qw\xfb\xb1=c\x7f\xd6<\xfee\x10\x7f\
-\x11\xee\xf68o\x07w\x7f\x10\x07H\xa9=\xde\xd5\x7f\
-\xf5\xac\x14\xcd\xf4\xb7V\xf1kD\xf9\x89\xab9%\xa5\
-\xe2\xf6b\x8b\x9e7\xc1\x85\x17\xbc\xe0\x98\xad\xe0\x1d\xbf\
-|gl\x00\xb2\xa5\x0f\x90\xccO_g\xec\xa7\xaf]\
-`,\x13\xcf'\xf9\x011\x81\x05\xa3\xe0\xd9`\x07w\
-<\xd9Ww<x\xc2\xe2\x87\xf8(\xdc\x9d\xb6?\x8d\
-\x03~\xd8\xbe\xcf\xb3\x9c{>\xe2UC\x10\x83\xc1\xc5\
-\x81^\xd9\xfcDsG+=\xe3\xfb\x03y<\x0f\xd6\
-?\xe8\xe1\xd3\xee\xda\xd0o\xd7\x0e\xf2\xaf\xbd\xe7\x15\xdb\
-O\xfc\x8d'\xb3\xf9\x038\x1bY\xc6\x22\x9b\x22n\xf8\
-/|\xf1\x97\x81\xe3\xba\xc31I\x88<w=\xc4\xa3\
-\xb6\x18\xfe,\x80:\xd3\xbb\xeb.\xb5\xb7\x0a\x9f\xb1\xe3\
-\xc5F\x8am'\xd5\xf8\xe0\x85\xe9\x9a\x0b+|\x83O\
-?m#;J6l\xf5\xcew\xdasg\xceX\xa0\
-\xcb\x8fh\x81\xdb\x07\x16\x5c\x88d1c\xfe\xe2\xc7}\
-\x90\x8c\x8d\xc2\xd8\xf0i\xe3C8\xd6S;8\xb1\x03\
-\xd6c\xac\x9a\xcd\x9f\x1f\xfe\x82\xe0\xba^\xc4D\xdf_\
-\xf1\xd0\xbd\xdb?\xfa\xbe\xaf\xdc\xfe\xa5w>\xa6\x7f\x1e\
-\xa8\xcf\x809F\xc6^/\xd1\xc6\xc3V\xf3\xc2\x5c\x88\
-\xd0\xb4\x137sH[\xf4\xf4\x0b\xda\x17\x02c\x87.\
-\xaf\xa4Q\xfc\x13\xe1\xadfp\x01\x03>*\xe8\x99T\
-?\x92'a\x10\xf8\x08\xacg\xed\xccE\xed\xe8>\xf6\
-S\x18\x93\x1d\xcf\xecCF\x04\x14t(m\x1f\xf6\x99\
-\xe7\xa3-\xfd\x05\xbb$}\xb4\xfdZ\x0f\xcd<\xc4\xff\
-Y\xdb\xdd\x9b\xf4\xec\xdfz\x86\x91~\xc6\x01\x01\xb2\xc4\
-\x85\x0f0\xa2\xc3\xb1|\xdb\xd3>\xe3?z\x87\x7f\x1b\
-\xe40\x06\x89k\xe9\xff\xd8\xc7\xf2\x19\xc7\xbay\x86\xe0\
-\x8b\x95qQ\x9f\x00<c\xa0w\x86\x88\xbcO\x9a\xc9\
-vz\x22tn\x90HiT\x9f\x04\x81n\x9b\x89\x22\
-!(L\xfe\xbe\x190\xf1\x12X\xb6\xf0\xabc\x939\
-\xe4\xca\xb4\xfe\x05\x04\x1f{\x9d\xc4\xb1?\xfc\xd9^\x0a\
-\x89\x0b\xaf\xc8l`\x93\xc3?\x82%~\xfbj\x8c\x83\
-7<\xdb\xe0\x8e\xbe\xb53\x0c\x80\xbb %\xe2\x1fO\
-\x87\x7f\x09\xa7\x0cL\xec\xc5s\xbb\xfd\xaf\xce\xe0\xee\xfd\
-\xb7\xd2\xa0R\x01G\xbc;\x1f\xff\xd3\x16\xe9\xbb=\xc9\
-8\x91\x89\x91M\x87\xc2&\x99\xf9\xcb\xa9\xbb\x8e\x0b\xa0\
-\x1d\x9bx\xc2>}i\x1b\x7f\x13\x9ae\xbd\xf3\xf3\x1d\
-\x09~\x10:\x8eZ\xa0?^\xb0uo\x895\xd8\xde\
-\x8fP\xa5\xff\x9a\xbfl2\xd13\x94\x14}\xf7\x9c\xe8\
-\x11\x1c\x18Z\x88\xb1G\x8fB^\x18_m\xf3\xd5\xa6\
-\xdb\xdc\xc5S\xc7\x96Z\x0a0\xb4)h\x7f\xd4\xdd\xa0\
-\xb6\x0e\xf7\x93\xf8\x83\x93\x05\x10=6\x15t9\xe8\xa5\
-\x0d\xe6\xd5\x0f\xde\xb3\xfd\xf8_{\xe3\xf6\x0a\xfd\xd3\x1c\
-\xc6\x87\xcd/\x0e\xa4b\xadc\xc3\xc8\x9d?Lb\x00\
-\x83\x0b\x03&\x01\x16mb\xa5\xd7\x89\x01,\xfd\x17\xdf\
-\xc4\xa3\x9a\x82\xdd~1 \x1el^\xf0SO\x9b>\
-\xb8o\x92\x0c\xb6\xe7\xaf\x034\xbc\xcc\x87,i\x8fl\
-\xc7a\x0e\x14\x8e#\xd3\xc18\xb4\xad;\xbe\xc7\xd4\xfd\
-\x19\xbe7u\xc5\xee\x9e0V\xe8\x10\x9f\xe3\x09\x1e>\
-\xe0'D\xc9\xe4\xc8\xfb\xf2\xf0\xae\xcb\x0e\x9d\x86\xf5\xc3\
-\xef}\xa3\xbe\x22\xf99\xdb\x8f\xff\xb7\xff\xf7\xf6\x89k\
-\xfa@\xa5\xffV\x11L-\xab<\xa9q\x96\xcb\xa3h\
-?\x01`\xd3\x17&o\x07\xf09\x0ar\x92;{h\
-\x83\xd2)\xd4\x1d\x9c\xa2\x8b)\x8c\xf8\x94\x98\xe0\xb8\x90\
-\xf0\x873\xd5L\xbfe!]\x09P\x90\x8c\x81\xe1\x97\
-X\xc26}\xba\xfe\x18\x17\x1d\xd9\xd8\xd6\xe6\xc7\xf9'\
-\x1e\xfd\xa5 N\xfe\xba\xb9\xf03&\xf8i\xf1\x98\xaa\
-\xb1\xce\xad\xed\xd5\xdf\x8cwl\x08\xae:`\xbb\x08\xa7\
-\xb1X\x86'\xfd\x9a&\xfeqR\xaa:\xe5\xa3\x9cX\
-\xd4c\xe2\xb7\xa0~\xf0?n\xa6\xae\x8e\xf1*\x8b\xc3\
-\xe9\xb3\x98\xfa\xb5\xde\x12\xff\x84q\xe1+\xd2\xe6R\x14\
-\x12\x9cBB\x94&\xd9L3{S,\x9d\xa6'\xb5\
-\xfc\xd1\xb1\xfd\xd0\xb6_lQ\x0d~\x8c\x92|\xe6\xc6\
-\xbbpc\x1f9\xc9fW\x87\xfb3\xf1\x11\xcb\xe4\x9c\
-\xf9h'\xbe\x18\x1c\xfe\x0f\x805\xbe\xc3\x7f,q\xb6\
-\xcb\xc9[\xfaO\xfcK\x1f,Ox\xf6\x15\xffxM\
-\xa1n+\xc9Q\xc9\xc8\x85eL\xf4D\xe7\x84\x82\x87\
-<\xd6P\xdeC\xe8\xbfY\x07\xbf\xb69\xa9\xe8\xff\x9c\
-\xca:\xeb=^\xe0\x1b'\x92\xd0\xb2\x07B\xc5\xd2\xd2\
-\xaa\xbd\x91\xba\x13\x87=Nay\xf3\x1f\x1a[\xc6\xc3\
-E5\xa4u\xe0;Hj\xa4\x01G\xceFC\x1b\xbe\
-u9\xb8\x91\x0d\x0f\xa9}\x88o+d`\xe9\xc5\xa6\
-\xee\x8d\x17\x13\xf1s!2\x8a\x8e\x09\x0b=B\xb7o\
-\xf1\xf95\x8b\x0d\x9d\xf8\xb1\x17>r\xdaVA6/\
-<B\xb3C\xa9\xe6\xfb\xe6\xaf\xe8n\xf3\xfdo~d\
-\xfb\xa9\xefy\xc7\xf6*\xfd\xd7<\x97\x89\x89\x0b\x06\xde\
-\x7f\xce\xfb\xfel@2\xe3\x07\x9e\xbe\xe0\xc7X6 \
-\x086,m2\xd6\x81\x19\xff\xdc\xe1\xe3\x96;c\x93\
-\xbe\xe8 t4\xe9\xa7\xbb\xe1zg\x98\xc8\x01-\xbf\
-\xa4\xd8\xb9\xa0.\x1f\xad\x83\x96#\xc92n\x8b=\x0a\
-*\xd5\xe3n\xde?b\x94W9\xb6\xcc\x01\xf5mW\
-ou\x9f\xd1\x81\xe7\xba\xbe\xb1\xe5\x85\xa1\xc6\x9a\xbea\
-C^@\x9b\xadav,\xe2kt\x18\x06\x1b}\xc5\
-\x1b^\xbe\xfd\xd7?\xf2W\xb67<\xa8\x11\xe5\x09\x80\
-^7n\xe8\xa9\x80\xc6\x0f,\xdf\xf1\xfb*\x22\xed+\
-\x5c\x04L\x9b\x8b:\xbe\xdd\xd1O\x06\x8c(\x5c\xe4\xd8\
-\x02\x8fL\x07r\x01-G\xad17\xac\xe7\x08\x1ea\
-\x84G\xc3\xe77\xea\xe8O\x1b\x9c\xe9F\xe4\xc6\x8b\xae\
-\xf9\xf8\xc1DG\xdbO\x0b\x7f\xe5\x0f\xe1\xaa\xe70\xf5\
-\x8ak\x04\xf1*\xdf\xd7\x9f\x1aO<\xc6\x1c:\xfee\
-c\xff\xc4\xe4(\xdc\xb2=\x92\x0a\x13\xe1\x8e\x7f\xf8\x9f\
-\xfe#?\xe3?x\x01\x08\xc8*\x8f\xfd\xf0\xedg\xfa\
-O\x10*\x87\xff#\x00\xdb\xaf\x01Y\xf3\xe2\x1e\xbc\xc4\
-]\xdc\xf0\x8f\xc8\x9b\x88\xd4\xbc\x9cR\x9a\xc8\x95_m\
-N\x8c\xb5$\x11\xc2\xb1\xbd\x14\xe0\x91\x8d$\xc1\x99Z\
-j\xe5\xd9\xc2\xe2\xf1#\xda\xf6\x12\xc4\x7f\xda\xb4\xb2\xe4\
-D/t\xfc\xa1a\xff\x18\xaa\xd8^\x87\xe4 \xfe\xc5\
-T({\x0d\x96\x1bV\xb7\xc1\x1e\xbftm\x8fI\xe3\
-?\xd4LU>lW\xbb\xbdZ\x91s\xe2\x93\xf4K\
-\xdc\x13\x80\xe5\x0df@p\x15~\xedm\xba\xc7M\x7f\
-}\xc7\xe3Z-\xec\x81\x9f\x82/\xec)\xc61U\xff\
-n\xa4\xff\x95K\x09\x08\xdf\xe9\x88\xd7\xf8\xb1%\xa1-\
-\x1b]\xff\xdd6|Vr\xe6\xb3\xf2\xfa7#\x0b\xfd\
-\xdc\xf8N\x0c\xd2u\xbf\x88\x179\x8a\xaa%\xf5\x1d\xdb\
-\xde\x81\xcc\x1f\xf0\xc5\xce\xa7\xefiK_\x01\xd1\xffq\
-#\x9c\xf1EL\x92\xa7\x97\xf8\xc2Y\xe2\xdb7}\xe2\
-\x85\x0f\x8e^\xd0\x9e\x19x\xde#8\xb0\x81_\xd3\x17\
-b\x5c\xdf\xfe\x8d\xf7=\xbe\xfd\xa8\xde\xef\xbfS_\xee\
-\xe3\xbd\x19_\xb6\x90Z\xe3\x0bi\xcf\x89*o\x01X\
-A2\x1e\xa53\x80\xf4\x17\xcfn\xaa\xa6\xb0a\x19\x07\
-\x99\xc8\x5c\xe0\xd0\x074\xcf)\xc4+]\xfaNY\xf3\
-\x969\xeb\xcb:\xe8\xcd\xab|\x9c@\xdb\x16\xfb\xe5e\
-\x1d\xfcZ\xce\xb8\x04?\x18\xd0\xd1g\xec\xa0\xfdEF\
-\xf0P\x94\x0dU7\xf8\xeaz\xbe\xec\x83\x98\x8f\xd8\xd1\
-e<\xfa\x96\x00>pK\x9b\xb7\x04\x1e\xbc\xef\xb9\xdb\
-\x7f\xfa\x83_\xbb}\xe7[\x1f\xd2\x9fl\xea_\x18\xfb\
-B \x17dV\xe4b\x8aM\x7f\x1e\xff{N\xddf\
-\xb3\x97\x1f&\x0b@h\xfc\x8a\xcc\x05\x19m\x91\xf0\xf4\
-b\xae\x99O>\x13\x90\x22\x9eH\x9en\x94Cm\x1a\
-<\xf3i!o\x8d\xfc\xa0i9\x86AD\xc2+e\
-\xc1\x1d\xa6s\xd0\x83x\xe8=\xc3\xde\xf0\xf2O\x7fL\
-K\xb7\xb5\x80W\x1a?G\xff\xc0<b\xcdx\xc4p\
-\x8d\x99\xf1O\x9f\xb0\xb6\x9b=fD\xc5g\xc8B\x13\
-\x87\x04\x19\xae34\x0a{\xfc\xa2A\xe6\xe5\xe2\xf9\x08\
-Y^\xe4m\x1d\xaacA\xb5\x0b\x17\xde\x17-y\x19\
-.\x00\xf6\x01'\x91(\x9dPj\xce\x83\x96\xf2a\x9a\
-\xe6Lc\x92=\xabI\x84=!\xc4\xc3\x14\xbd\x14\xd0\
-\x87\xc6^?v,V\xd2\xe6\xd0\x8d\x9f\xe0\xed6\xc6\
-\x1a(\xac\xf1\xeb\xe6\xf8_\xe4\x89-x\xf1\x1f\xbf\xc1\
-\x22\xb0\xc5~\xc7Y\xfc\x0b\x0bl\xac&bQ\x87\xbc\
-\xf4\xe1\x7f(aUFb\xd0\xb4\x7f\xb3\xf1)\xa6\x81\
-W\xffa\xb1yZW\xf2\xc4\x99\x1a\x1ew8\x1c\xd3\
-\x17\xf4\x01\x9a\x8dp6\xbd\xfa=\xadk\x03\x1f\x1b\xe6\
-\xca\xf6\xc2%F/\xe2\xd4s\x22g\xfe\xd0E[/\
-\xe9\x112\xaf\xfat\xd2\xb39\x1a\x0bY\xa4t\xd0\x14\
-\xb5\x93\xa2\xfe\xd0\x90D\x8f ]d\x0b\xb6\xed\x89c\
-\xd8\xc6'Fd\xc3\x84&^\xd7\xee+\x98\xb4\x850\
-\x8fd\xd9\xf0}1C\xad\x17n\xd8\xf0\xd9\x04\xf0d\
-{h\xc9\xe0\xf1Gx|,\xcc\x9b\x8a\xee\xde\xef\xbf\
-\xeb\xca\xf6\x13\xdf\xf6\xe4\xf6-\xfa\x1a_\x16}\xdf\xa1\
-\xcb\x7f7\x7fw\x85\x98d\xc5F\xc6\xa3\xed\xc4\x98:\
-\x1fz\xcb\xe6O\xbf\xd6\x82\x9e\xddJ\xd0ET\x1c\xd1\
-\xd1\x82\x97\x8b#\xf4\xe0G\xd0yk\x0d\x9fM\x98v\
-\xf5|q&>2^\xab\xee\x8a3\xae\xec\xb0\xf64\
-\x98\x93|~\xa1\x18b\x12\x03\x15?\xa2\xb9\xf3\x0fV\
-\xf8\x9e3)0?\xbc\xe464Fz\xd1\xf6x\xa3\
-\xa8\xb1\x06\xc9\x1b\xb6h\xe3\x88\xe5\xf1b*\xf8\xf1\x07\
-.\xe9\xf7\xb6\xfd\xd07|\xd9\xf6\xe3\xdf\xf4z\xbdE\
-\xc2\xf7.\xe8I\xc05}/\xcc|\x06@\x84\xe2\xe1\
-\x22\x00\xcc\xf9\x5c\x80\xecw\x1fxR\xbc\x94\xe8\x09{\
-\xb90\xd0\xe4!\xe0\x90\xdf\xd1\xa5\xc98Pl\xcfy\
-\x08\xd3\xbd@\x17\x7f)5\xb1\x06*.\x89\x1d\xf2\xf0\
-\x1f\xa1\xdb\x18\x8d\xa1\xdbtT\xed\xeaB\xdb\xbb\xd9\xd2\
-\x8dx\x90\x0159\xedi\x00\xb9\x0b\xc6\xbe\xf1R\xef\
-\xfe0+\x00>\x8b5\xfeq,\x1e!\xc5o\x14\x12\
-\xe7\xf88\x8c\x0e\x9f\xe2\xed\xfeEcN9\xfc\x0e\x8e\
-}\xefNw\xf9\x11S\xec.\xf2\xd1k\xe1E\xee\xc0\
-\x1a\xbb\xf3\xc1\x09\x91)\xe5\x84urH\xa9\x93k\xfd\
-2\xe1\x87\x81\x82\x13\x01\xbd&\x04u\xe93\xf6\xb6\xc9\
-aO\xa4\xd1\xa5]x\xea\xcfk/\x7f-,<g\
-\xfdga\x03\xe5\xf0\x8f~Q\x1b\x7f\x10\xe0\xaeR\xda\
-\xd5<\xec\xa3\xdb\xe3\xe1\xfe&\xfd\x1f\x90Co\x01\x15\
-\xe9\xfe\x8fcW3~,J\xdep|\x9c(\xa6\xb2\
-\xef\xa1W\x5c\xc6\xcb\xfd\x9f\x01d\xfe\xbaH\x9f\xe9\xe9\
-\xc8\xe9\x9c\xfb\xdb\x0dm\xf8\xde\x90$#\xb9\x8f\x04?\
-\xe6\xc5\xfeuH\x08\xe9\xb7\x17}\x0b\xb4\xa1\x8f\x917\
-\xcbQ\xf6\xf8a\x10\xa3V\xee?n\xd9/\xd8\xc8\x1d\
-\xff\xd8\xc0\xcb\xe6\x03c\xe6\xd9z\xf4\x13\x19l\x08\xc5\
-\xa0\xca\xf6\x83\x03\x1f\xb1\xe3\xd2\x22\x0e\xae?-\x0e\xce\
-|\xca__H\xb6\xbd\xf4ywl?\xf5\xdd\xef\xdc\
-\xbe\xec\xe5\x0fhc\x92\x1e6\xc4_\xda>r\xe7\xe8\
-\x18\xf0\xc7\xdd'E:{\xec\xd2\xe3\xc2\x01\xf5\x16\xe2\
-\xa7\xa0\xe3\xd7N\xaf\xf9H\x17\xf0\x8a\xce\xb1\xc9\xe7\xdc\
-\x0b@bg\x5c3\xb0\x95\xf5\x82\x00[\x8f\x1bNT\
-\x8e1;K\xaf2\xcf\x8d\xd4}g?6\xb6\xd6\xc1\
-X\xe2\xa1S\x9a'\x1b\xc8yy\xf3\xb7r\xda\xde\xe0\
-5r\x89Nc\xa0\x8e[\xb7\xf5\xe0s\x07O\x88c\
-j4z\x9e\xfe\xa9\x96\xe4\xab\xdf\xfa\xea\xed\xef\x7f\xfb\
-\x93\xdb\xdd\xb7\xf0\xa5pz\xc9\x86\xb7\x05<\xe6\x8c\xaf\
-\xc6\xdc\x93\xa49`n\xb1u[|.\xec|7\xef\
-\xf1D\xd7\xe8\xc2\x91\x0a\x17O$\x09<\xd5\xf9+\x01\
-\xc1\xea\xc7\x01\x89\x1f\xb1\xea\xa5o6\xc6\x1e'G\xe0\
-\xbb\x8e\xfd\x8f\x12v\x1e\xaf\xdaSO\x87\x0f\xbd\xe0\x14\
-J\xad\xf1\xbf\x87\x117R\xa8\x0e*\x87=\xadC\xe6\
-.\xa6\x03\xd1\xa7\x1fc\xd8\x1a\xfd\xd8\xdb\x1b\xcd\x1d\xdb\
-\xfd\x82\xd1\xeeaO[\xc5\xf54n\xea\xdf\x83\xbf\xe8\
-\xab\xdd\xfc;2\xa6\xfe\xd1#\x86z\x88\xddE>\xce\
-Rw\x91\xbb\xe0\xd8u\xae$9\xd6\xc7\xc2\xe6\x89O\
-\xcd\x94yb\x976&M\xfa&R\xa7\x16\x9b\xf0R\
-\x93\x0cI\x08\xb5\x07/5\x16\xe1\x11\xc9\x19{\x1c\xf0\
-\x8b\xbe\x04N\xe8\xb6\xb12_\x02\xd5\xd0X\xc7>\x0b\
-\x17\x9e-S\x0d?2\xb1t\xd2C#\xdfy\xb6_\
-tv\xcc`\xc7\xffXI\xd6~'\xa6\xf1/1\x09\
-QY\xfc\x13\xc2\xf8\xb7yt\xbd9\xb0\x10Iy_\
-\xc8\xce\xc48\x98DY\xfb\x05;P\x89\xc3}\x94\x0e\
-\x05~\x0a\xed\xf4\x1f9q\xd9\x17z\x83\x87\x1e<\xda\
-\xe8b\xeb\xf8\x11\x94\xc7\xaa(\x99\xed\xa5A\xac\xc53\
-\x9f\xf8\xad\x13\xac\xf4'Q\xb8\xff\xb6N\x9c\xf49p\
-\xf4\xdbNt\x07\xca\x85N\x0a\x1f\xcc\xda7\x1a\x14\xad\
-\x1f[\xc2\xb4=\x11H\x94\xff\xa9\xc3?\xa6!6\x09\
-\xe9\x93*\xfdE\xbec\xe4\x9dfo\xd0l\xe4\x96\xa1\
-+\x96\xee\xf8=\xff\xba\xb3|\xfd\x0b\x9f\xb3\xfd\xa3\xef\
-z\xfb\xf6\x12}k\x1d\x05\x97\xfc\x97:o\x0e\xb9\x0a\
-0/YEo\xd2#\xfcX\x1f\xbf*l\xfc\x146\
-F\xca\x88M\xe3\x9b\xd7Zhw3\x87\xdf\x05\x13\xfa\
-V}\x10\x8evm\xa0o\xa6\x8bl\xb5m{\xb5]\
-\xe5\xe0SV\x1e4\xfa|\x8e\x81\x9a6\xfe\xfcd\xa0\
-\xfdQ\x87\xfc\xc9\xff\x98\xa7\x7f\xe8j<2'y\xfa\
-\x01\xed\x97\xf4<\x8f\x5c I\x87<a.\xc0\x94\x13\
-\x8dilM\xcb\x9fGL\x95\xe3\xd0X\xbe\xed\xd5/\
-\xd9\xfe\xe3\xef~\xd7v\xdfU6\x7f\xfeJ\x80\x0b\x01\
-m\xf0|\x18\x90\x8d\x9c\xcd\x1f\xda\xdf\xe4\x88\x0fbg\
-^\xc9\x85l\xe8\xd6\x83F\x7f\xcew<q\x11\xe0~\
-\xe2Ua9\xa3\x85M!\x14x\x94\xea\x99\xc6\x9f\x88\
-\xe6)\xf6\xe6\xd3\x0f\x8cT\x87\x97L\x01\x95\xb6\xd5\xa6\
-\xc6\xde]e(,P\xad\x1f\xf8\xaaLC\xba\x0d\xcb\
-v\xf8Y\xe2\xb5\xb4\xbe\xa2\x13\xcc\x83W\x80\xdd~p\
-\x88\xec4Vtv\x1eA,\xc5\xf6\x09\xcc\xb19\xfe\
-\x91#\xa3\xd8\xfe$\xa6Q9\xe2\xaf\x7f\x01\x9c\xf6\xbf\
-\xba\x17\xb9nN\x5c\xe4>\x9c\x89\x9d\xb9\xcd\xc4\x1e\xc9\
-\xe8\x89\x93V'\xdeI\xca\x84b)}\xd7\x83BR\
-\xf3\xe3\x843\xafT\xf8\xb0\x8a\x97\xfa\x9c\xc4\x03\xd3\xf8\
-q\x92$\x1d\xffa\xd9\xa9\xfdN2\x8e+\xc2\x19\xff\
-G\x5c\xd63\xdfZ\x8e\x0d\x8a\xc8N\x0b}t\xff\xf1\
-3b\xfb\x97\xe2\x99\xfe\xdb\x1e\xe6Y\x04\xf7R\x18\xed\
-5\xd2\xf8\x09.\xed\xac\xab\xf5>\x00\xe3\xcb\xbe\xc7\xa2\
-~\xa9\xd7\xb1j\xd4\xad\xc1\xdc\x8b\x98,\xba\xc8\xf6\xd7\
-(\xa6_Z\xe0\x8d\x97\x08\xabs\xd8\xb3(\xb0\xb0\xc7\
-'Z\xbeH\xb0\x0226\xba\x8cM6\xfb\xf4o\x5c\
-x\xec\x19\x14\xf4\xec\x01}\xb0\x1cO\xf8l\xc4\xc6\x99\
-\x185\xb0\xde\x14\xfc\xde?2\xe1sba\xc3\xc18\
-\xd0\xc2\xe5.\x9f\x7f5\xcbB\xed/\xd1\xb34\x8b\xbe\
-7\x1b-\xd6l\x16\xbc\x0d\xe0\xb6Wt)kca\
-\xf3\x17\xa1\xdf\xeb\xdb[^|\xef\xf6\x0f\xbe\xe3\xed\xdb\
-\xfdw\xdf9\xf3\x0a\x86>\xa1\xdf\xce\xd9\x0f\x11\x1c\x13\
-\xcc\xe6\xcc\xdc\xc1\xc9\x86\x18Y\xe7I\xec\xbd\xc8\xdc%\
-s\x07\x8e\xec\xc4\xec\x1cP\xb7\x94W\x1d\xeaSL\xda\
-\xb5\xaf\xdd\x8a]ye\xc5\xa8\xceyuu\x91\xb1\xe9\
-[GL\xf7\x9a\xf8&\xc6D\x1f\xfe\x9e\x17\xb2\xd1\xaf\
-u\x5c[i\xf2\x06\xb6\xc6\xb8xy\x0a\x85~\xf2\x00\
-\xbf\xa6\xd5\xf6(\xc8\x96=\x18w\xfc\xa5\x00\xf5\xab\x1e\
-y\xc1\xf6\x9f\xfd\xc0\xbb\xb7\x17\xdd\xad\xb6>\x14\xc8\xe7\
-\x02\xb8H\xc1\x22O\x01r\x11\xe0\xb9\x96M\x90f|\
-\x05\xe6\x9ci\xfc\xc2\x16\xba\x1dT\xcf1\x18\xcb\x11\x88\
-Jm=Rab\xb4\x1e\x1d\x04\xabx0U\xdc\xe5\
-\xdd\x0e\xce\xa0H\xcf\xf6\xb0T\xa2'b\x5c\xb4\xddz\
-\x17\xa0b\x1fc?\x0a\x1e_\x80\xce\xf5/\xfe\x01\x14\
-{\xfcw\xac\xa9\x0dp\x12\xbfll6\x98\xc0S:\
-\x0e\xc8:[\xad\x1bg\xe3I\xddq\xb3yB\xb4\xff\
-\xc1\xc7\x0f`\xa8\xf1\xa2\x1d\xd5Kq\xbc4\x17\x00\x9e\
-\x14&\xae\xd3\x22\xa2S\xeb\x85's\xb7'H\x12\x15\
-\x1d\xfd\xecvc?\x86\xc9\xad\xc8\xa1\xc1\x0e\xefl\xbd\
-\xdb\x83\xb3gK\xb01\x88\x7f\xb0u\xfa\x0e\xc0^\x83\
-9\xb1\xa1\x9b\xf8\x13\xc0\xae\x03\x86~\xe2\x1fY0E\
-\x04\xbbv\xd4\x01@\x04\x9c\xc1yO\x11\x1a\xd9\x8a\x09\
-`\x90\x83\x9d;\x9b\x03`\xa2\x18\x9d\x93\xfe\x8bk\x1f\
-\xf63q\x8b\xc5\x9f\x8c\xad>\xba`\xc1clV\x19\
-\x01\xd1\x06\x89\x8d\x09]\xbc\xd3N?\xc6\x87\x83\xcfF\
-\x9cq\x80?>g\x83\xb4\xbdhG/\xb1\xfdR{\
-e\xce\xeal\x1e\x8b-\x0b\xaaj9\xd7\xfa\xcb\xd8\xe4\
-\x0e\x89\xc5\xd8'\x04\xb1\xe2\x13~\xed\xb9\x0b+O\xe6\
-\xd8\xc6\x97\xf4\x14K\xf7]_\x1caj\x1d\xe2\xa0\xe0\
-\x90\xcd\x9f#\xd8\xc3\xf3g\x0a27\xb7\xd6\x97\x84\x88\
-\xf3\xa5@\xa2\x88\x97\x0f\x8f\xcd\x9d \xedw\xbe\xec~\
-=f~\xcbv\xcf\x9dW\xe5W\x1e4\xe6y7\x1f\
-78!\xb6\xd8\xe2\x89 <\xf6\xdc\x09\x12(\x0e\xa4\
-CE\xc9XG'\x9c\x83G\xbbs\x96\xdc\xaeF\xea\
-\xd3y\xadN\xebjW\x8f\xb6\xe7\x9c\x18\xc715\xaf\
-}\x13\x9fvmoV\xd7\xee\x14\xa7m\xdb1\x1e*\
-\xf1\xcfp2\x17\xc9%\xe6\xc6\x18k[\xa3BX\xfc\
-\xfbcr\x81\x7f\x7fL\x0d\xcf\xf9\xc0\xa81W\xe8\xc1\
-7[s\xc8\xcf\xf8B\x19\xfa\xe1\x07\xee\xdb\xfe\xe1\x0f\
-\xbcw{\xe5}\xb7\xea\xdf\x10\xeb\xc3\x81\xba\xa8\xb8>\
-O\x03\xf2\xfd\x00\xe4%\xb6\xcc\xaf\xf0\xb8\xf8S\xae\x10\
-#O\x80\x12)\xb8\xd2!_\xebC\xd8\xbb/|b\
-\xab@\x9c\xc7\x10I0\xc7$\xa6u\xad?q\x09(\
-\xf6\x0e\xde\xa8\xee\x87\x0c\xd2\x9f!d\x19\x9fF\x82\x1e\
-\xbb\xe1\xee\xdac\x07R\xe2\xb0*\xaea\x8d\x7f\xd1\x8e\
-q\xc1\xb1\xff\xc4\x07\x89\xc1\x84D\xcb\xde\xe1\x11{\xac\
-\x86g\xd5r\x82o{\xfc\xeb\xa7c\x93:\xf6\xe0\x10\
-\xc0YY\x9c \xda\xfd\x8b\xa87\xd7\x92\x15\x07\xa5\xda\
-\xcb\xf2R\x14\xafw\x97\xa2'\xc9\x00O^&s&\
-U\x9d#)8a\x8fr$\x0a\xba$m\xb5\x9d\x0c\
-\x03\x10~\xe4f\x19 8Itp\xf4\xa21\x18$\
-H\xcc\xa762\xfe)G\x0c\xb4\xab\x1b\x99\x15\x86g\
-ip\x07\xff\x19\xf6b\xec\xf6\x08\xe7U\x1e\xae\x8e\xf8\
-\xc7\xff\xe1^\xea9\x190c\xf3\xd8#l\xfc\xf8M\
-H\xae\x0d\xafC\x1f\x97\xd3\xae\xaf.\xb8\xd4\xe6E\x98\
-\xcd\x89\xd0\xc4\x87%!G\x17\xb7\xb5\xc4\xb1\x7fy\xd3\
-T\x1d\x9e6J4\xa4\xcb\xc5\x04\xb6\xb7z\x83\x8b\x9c\
-\xb5\x8d~\xe5\xae>1\xe6\x13\xf2\xf4Cm\xdb\xa5\xce\
-\x9dz\x9e\x00\xec}\xf4\xaa.\x0c\x0b\xb3q\xfb\x0eO\
-\xfcl\xa6\xc3\x93#\x1e\xd3\xc3\xe31\xbf\x1f\xf5\xab\xb6\
-\xae\xfc[6:\xfe\xf38BN\xd8{\x7f\xe9\x17\xf9\
-\xe1\x7f_\xe9\xb8E\xc3\x93]d\xea\xbf\xf8<\x1a\xa6\
-O-l\xfe\xce+\xd9B\xfb\x91>c\xa5\x85\xfe+\
-^y\xff\xf6\xef\x7f\xeb\x93\xdbs\xee\xbc]R\xfd\xf0\
-\x18\xd9\x98\xe9\xa71\xda\xe6\xae\x98\x97\x99Y\xd6\xf8R\
-\x9b\xfa\xea\xbc\xd5/s\xb7\x96\xb6W\xbd\x95F~\xb3\
-M;\x9f\xba\xd7\xbc\xcbY_+6\xbc\xe4\xca\xf1\xb9\
-\x81U^\xba1\xb4}Z#/N\xe9\xd5\x86\xf8(\
-\x8c\x01>i\xfb\xcb\x87\x18[\xd1~\x22\xc0d\x08\xc7\
-\x9b>\xe3\xe5q@.>\x17M\xaa\xf2\xa1L\xe5\x95\
-h\xf4Ty\x8e\x98\xf5\xfd\xdc\xd1\xfc0\x82\xfel\x83\
-M\x9f\xd6\x970\xdd\xb3\xfd'\xff\xca\xfb\xb6W>\xe7\
-\x9a\xbeL\xe8\xdav\x8b\xdf\xaa\xc8\xd753w\x5c\x00\
-\xf0T\xc8\xd9C\xcdf\xce\xbc\x8a\xcf\xdbA\xe9\xdb\xf8\
-\xf2\xf4$\x06\x19\xf8\xa2\x80x<\xbe\xc8\xd4\xb0>\xc2\
-\xb9( P\xeb\x98G^\x81\x95W\xc7\xa9\xf1\xa3B\
-\x0f\xdcV,\xe1s\x0c\xe5\x18QR\x01c\xb7\xa71\
-\xa5\xf1\x0a\xc6~Qt|0\x96\xd2\xf9\x87\x05\x1d\xe5\
-x0\x9c\xfd\xc7\x80\xb6yn\x06\x87\xf6\xe1\xbf\xd2\xe6\
-\x14\x8a\xc78\x19\x7f\xb1\x85\xc4\xe5a\x0f#/\xc7O\
-c\xef?\xba\x83\xcf\xfc\xb8\xb4\x9e\xe6\x05\xaerv\x5c\
-\xcc\x0e\xcc\x94M\xf0\x9a\x93=ywVN K<\
-gM\xeaL\xbe\xe7\x15\xbb\x91Q\xcfT\x1b\x81dp\
-\x92\xa0C\x02\xab\xedd\x18~u\xa3\x83\x06\xf8*\x93\
-0\xc0\xda\x8e#\xe0\x88|\x04j\xb0\x16Yx\xa3 \
-M\xda6\xdb\xeb\x81N(u3:\x83\x89\x07\x9c\xe8\
-e{\xe1\xa3\xd08r*\xa7\xbd\xc7\x82\xceh4\xd7\
-\x89\x02\xdf`\x84\x0e\xce\x99\xfeK\x99\x0d\x19s\xb0\x1c\
-\xbfjt\xb4g\xbbm\xeb\xdd?2\xd00\xe9\x5cL\
-,\xc0\x9b7\xf6\x02\xa0\xed \xa0\xf0\xc1\xc6I\xc6\xd2\
-\xd0\xc2\xec\x0d_\x0b\x1d\x05\x99uL\xe3\xdf\xcbh>\
-8\x85\x8c]T5\xfd\xf7\x02\xcf\x02\x19\xd3\xe0\x11\xa3\
-^\xe6\x89\x0f\x16\xda\xfb'\xbe\xeb\xc7\xde$s\x1b\x1f\
-\xd15[\x0d\xe2\x80\x9bn*^4P\x12?'[\
-}h\xf1\xb7\x92\x16ea\x81\xc7\xcf-\xbe\x0b\x04T\
-r\xd1\xbe\xfb\xe3^P\xf4\x93/}\xce\xf6\xef\xbc\xff\
-\xad\xdb\xedW\x8f\xd3\x16\x1b\x1c\xf8\xc7A\xc7\xbfy`\
-\xe8\xd5/\x8d\xc1\x1d\x9b\x1a\x16.\xe8\x9f\x94u\xbe\xf7\
-\x85ot\xda>\xad\x11\x9f\xda\xa1\x03\xaf\xfc\xd5f\xbd\
-h\xc0\xb6\xed\xea\xc2k\xc1\xeef/t*+}\x9e\
-\x9d7\xfd\xf9l\x82\x02\xd2]8c\xa2\xf8\x18k\x0d\
-J\xdf\x16\xf0\x9cJN\xee\xf4\x02\x93k\x00^\xe4-\
-\xaf\xfd3\x1e\xe8i$\x99\x09\xf4{\x81X\xff\xd4\x8c\
-.\x17\x03w\xe9b\xed?\xfc\x97\xdf\xb7=t\xeb\xef\
-\xfb\x22\xe0\x8a.\x02x\x02\xd0\xcfy0\xc7\x9dk0\
-\xc9O\xf2\xd0\x1f\xfa\x94l\x1fG\xdb(\x08\xe7\x1e\xb1\
-K\xc9\x95\x95g\xacEK\xc5/\xc9\x92\x1fG\x0d>\
-\x05>\xe7\x02T^\xe5!\xa5D\x969a\x1e\x87\x0b\
-[\x05>\xe3\xb1\x98\x87g;\xf1-\x9b\xf9\x97\xae\xcd\
-ms\xe0\x0e\x14`~\xa1\xb3\xf3D\x03\xde\x9ch\x1c\
-\x8d9\xfe\x83e\xfb\xd1uLE\x09\xec`\xd3\x10\xfe\
-n\xd2\xfe\xe3&2c\xe2\xd6AD\xd1\x91\x13\xbfT\
-v\xd13\xc80.\xe2\xf1XI.b\xf4K\xcc\x99\
-\xbc\x994O\x18\x13<\x13>u&qf\xb2\xb6\x9e\
-\xec$Z\x92't\xf1,\xd6\x81\xc4\xb3\xa5A\xcc=\
-\xc0\x85\x85l\xb8J\x96\x9c\xb4\xb4\x93\xb0\xa8\xca\xbeY\
-\xb4\xe8\xd6\xca\xfe0\x10\x104\x18\xc4cLj\xbd\xc4\
-\xdd\x1d\xf5D\x96\x85\x8d\x90\xad'\x07\x8b\x19\xb6\xb6\xdf\
-%\xd1\xe5X\x99\xe5\xf6\x17\xfd\xc3\xbf\xda\x12ZO\x87\
-}\xe3\xa0\x0f\x12\x98\xcf\x11B\x056\x9b\xb3\xe3\x5c\xf0\
-F,5\x22N\xfc\xe8xQ\x95\x1d|\xd61J\xef\
-\xf8=N\xc2 9\x8d);\x7f\xc7=\x0b\x9f\xf8`\
-\xfa\xa5\x03\x17\x1a\xe0Q|w\xae6~<\x9e\xd2\xf2\
-\xbe?>\x88\xd1\x81b\x87\x8d\x84\x19\xc7\xf4\xf5X\xec\
-\xc3g\xf3\xe6\x8e\x1d\xdf\xdc\xf1{N\xb4\xe2z\x93\xc7\
-^\xfc\xdd\x1e]\xe1\x113o\x1b\xf0a.\xee\xfc\xe9\
-_p\x89\x8a\xbb\xbd\xd8YB_\xe8\x92~ x\x1b\
-\x80\x96\xffLL}\xf5\x05\x0em\xdd9\xbe\xfa\x05w\
-m\xff\xde_\x7f\xd2\x9b\xbf\xdf\xbfGM\x85\xbcrQ\
-\xdbc:Mo\xfa#\xf3xFk\xc6e\xb1\x1b>\
-\x95\xc7L6`\xb2i\xb6\xec>\x86\xb1\xde\xdd\x9f\xea\
-\xacy\x0e\xbd\xda\xb6\x8d\x9f\xbejO]\xdd\xd3z\xd5\
-Y\xe9\xc6X\xfd\xc6_\xac\x95\xef\xbbr\xc6\x9b\xbe\x11\
-\xd7\xf8s\x1c\xda\xa4s\x11\x22&:\xaa|\x010\xfa\
-\xd6\x15/O\x08\xe8\x93b\xd5`\x93o\x9e[\xe9\xb1\
-\x81S\xd0\xa5\xd8F\x8a\xce\x10\x89\x9f\xa7'\x01?\xf1\
-\x03\x7fu\xbb\xf7\xdaG\xf4Y\x80\xcf\xf9I\x80\xc7Q\
-\xb6\xbe\x10!\xaf\xc0\xe1\xc3\x80\xca\x83\xc8@\x11_/\
-\xf2BRU\xa2\xc9\xbb4|akR\x22\xe7\x96\xea\
-\xbc\xcd\x11nzJ<=\xff\xca\x07,\xc5nuh\
-\xec\xeb\xdc\xd0W\x0a5\xfc\x96\xeabDd\xc7\xd8\x87\
-\xae\xae\xf5t\xa0\xb6\xf5`\x98?`\xf6'ix\xab\
-}\xc6\x1a5\xe6-\xa6\xa0\xb4W\x01\x80\x83\xcc\xb1\xaa\
-6\x9e\x19\xf1\x0b\xb0\xed\x89\x00e\xda\x98\xc6\xa1Y\xf4\
-\xa1\xa8\xbb\xfd\xa12\xfd\xc7\xe8r\x95\xe3,\xbf\xe0\xfd\
-J\xa22\xbbLv^\xe4@\x92&I\x01\xbf\x93[\
-\x9a\xd9'9\x9c\x0bN\x8e\xd0\xb4I\x0a#\x0a$\x09\
-\x02\x8f\x17'%X\xc7Io{\xf1( 4\xe1\xf0\
-G\xa1N\x12\x0b\x09\x9e\x0c\x22\x83\xef\xa6\xf5\xe0\x83\x05\
-\x06j\x8e\x80\x1a{x\xfc \xb0\x9c:|l\xa0c\
-\xa9\xa3\x18\x91\x86\x1f{px!9\xea\xbd\xff0\xeb\
-\x1f{\xf4\x00Vm\xfbb\xae\xf6\xa8\x8c\x8d\x1d\x06B\
-f\x13\xeb0\xe3\x1f\xc5\xc6_\xff\xda\xe8\xb4\x8a\x82!\
-\x8e\xddyQ%3\xf1;\x172\xd0\xf0AE\x0f\x1b\
-\x0a\xc7=~\xc7\xa5Ey\xc2F/3\x94E\x93\x8d\
-\x9c\xcd\x1b,p\x88\x11[\xbe\x0f\x9bo\xe4\xe3Q,\
-\x8b0\x8f^\xbd\xf1k~y_\xd6\xef\xc7\xab\x9ew\
-\x0d|\xc7\xce\xe6\xec\x0f\xf4\x8d\xbe\xfe\x0f\x8c\xf8z\x09\
->\x1bLF\xc0\xb7hD\xe1\x0d=c\x22S\xe9\x89\
-\xe7\xfc\xe1b\x81\xc5\x9b\xbf\x0d\xa7/\xf8K|\xe4\x17\
-\x7fB\xf6\xf0\xbdw\xe8;\xfd\xbfl{\xce\xdd\xb7\xbb\
-\xbf\x9e\x17\xe9\xd8\xc0\xba\xd8\xa9\x09\xc0\x14\xdbr\xc1D\
-O\xad\x0b\x991Ce\xe7\xd1\x98\x92M0\xfa\xab|\
-\xa5=\xd6'8\xab\x1c\xfaT\xa7\xf8\xad\x91SZc\
-\xb3b\xac\xb2b\xb5\xb6\xe1\x1c\xea\xab\xfa\xa7\x17\x04\xd8\
-\xac\x1b\x7f\xfd\x15\x03\xfd\xdc\xe9k<&\xcf\xd8\xd8\x89\
-\x8e\xf1\xe3\xad\x02\xee\xec\xa1\x1d\xb17yr\x83\xb7\xa5\
-\xb2\xf9\xc3\xa7;\xc1b\xb4\xd3/\x7fI\x10\x8f\xf8\xc5\
-p\x0c\xe2\xbf\xe4\x85\xcf\xdb\xfe\xfe\xf7\x7f\xddv\xdb'\
-?\xa4\x8b\x80O)_\xf2\xc1@?%\x02[9`\
-{\x8d\x07\x1f\x14\xf5\xe7S\x98C\xe6\xcf\xb9\x12\x9ax\
-\xc4\xd0K\xf0\xc8DcG!\xffJ\xc3\xcf\xb8\xaa&\
-\xf7\xa3\xe2\xfe@v\xcc\x89\x9fW\xcb\xde\xb6\xbb\xf8\xd9\
-\xc7z\x99+\xdb\xab\xed\xb9\xc1\x98X\xc0\x12Y8[\
-\x83\xb3\xc7\xd8\x98\xc2\xc3l\xb7\xa7!\xcb\xc3?\xba\xf0\
-b\xe3\x18\xc1\xa2\xffr\x10\xff\xd8\xbb\x89\x9a\x89\xf8\xb7\
-\x82\xfd\xc2w\xfc\x8ej\xf1o\xf0\x8c\x0b6\x01\x08\x96\
-}\xc1I\x00\xb1GI\xed\xf2\xb0\xb8\xe8\xe5\xd2\x5c\x00\
-0\x11M\x88\xd2N\x04O\xda\x91 k\xb2E\xe4\xec\
-\xf0<jj=\xc1\xb6\xd7\xc1\xf6\x96\x8c\xfd\xceC\x02\
-\xaf\x8b+\x99\xd7d9h\xdb\x93IJ\x9aXp\xb2\
-\x9c\xc5:\x8d\x19]c)\x96\xdd~h\x01\xd9\xe7\x8e\
-e\x9f\xd1\xf6\xd1\xa6'\xfe\x11\xa8\xc4F\xb5\x88l\xa4\
-\xe1\xc5\xffac\xff\xd2!\x0clz\x22\xd8\x1e\x9e\x08\
-\xd3\x83\xd91\x83\x9f\x13\xe3\xc0Bo\x96S-h\xd8\
-&\xfe\xdd\x7f\x81\xc6\x17N\xfd\xf8S\xfdd\xf1C\x8c\
-\xae\xf9`a/\x86\x17m\xf1Y\xec\xecm\x1f\xb3\xe8\
-f\x15\x94\xbd\x14\xbc\xe9\x8b\xdd\x0d\xde\xef\xc7+X\xbe\
-M\xcd_\xc3\xcb\xc2\x0b\x90^\xeeK\x10\xbd!\xa4\xb3\
-\xcc1\xbd\x98`\xf1{\x90\xb6\xa1\xe9\x0b\x0b\xb5\xb8[\
-\x93\x858y\xc4\xcb\x096\xea\xe2\xb2\xb9\xabO\xa3c\
-\x1b\xf7\x99\x05\x9d\xbe\xc8f\x16|/r\x8a\xedyw\
-_\xdd~R\x9f\xf6\x7f\xfe=\xb7\xb1\x93X\x8f\xc3\xbe\
-Q\x11\xcfp\xd7\xbb~\xb8\x9e\x13b\xaa\xc2\x8c\xd3\xc1\
-\x90\xd6.\x0c\x08s\xe8s\xe4\x84\xbf\xeaA\xa3\xb7\xea\
-\xae\xed\x09g\xafV\xdb2W\x1e\xf4\xda\xae\xceyu\
-u[\xa3\xd38\xa0O\xf9\xde\x98\xe7iFe\xd4\xf0\
-\x1b\xb3\xff:By\xc5\xacy\xa8<\xa6jk\xbc\xd9\
-\xbco\xbbzu\xbb\xaa/\x14\xe2\x09\x80\xff\xbcp\xc6\
-4\xc3\xda\xf1\x95\xb5\xc7\xce\x01m\xb7\xeam\x1a\xfc\xc0\
-\x03\x95\x0b\x8c\xeb\xd7nl\xafy\xf4E\xdb\xdf\xfb\xbe\
-\xaf\xdb\x9e\xfe\xbd\xdf\xd8n|F\x17\x01\xda\xf4o\x5c\
-\xe3\xe2O\x17{\xfc\xcc_z\xf0W\x08b\xca4\xb8\
-\x90y\xf4/\x7f|x\x14_\xca#\xe7,>\xec\x07\
-%\xe44\xa1\xf1\x8c\xee\xf4\xcb\x9c\xd0\x9cg\x9c[\xd6\
-\x8b\xea\xd0i\xc4\x9e\xbe\xd5\x97\x8c\xc1d\xae\x16\x1ck\
-\x8f\xaf\xc4\x12\xe1\xe1?\xed\xda8\xa2iP\xc5\xff\xe2\
-\xb3X\xb0\xa4\x80\xfb=\xfe\xf2&\x82\x88\xc4\xac\x0d\x8a\
-+m\x88hq4\x90yn\x18\xa5qZ:\xb6+\
-\xed\xfe3\xa66\x11\xfe\xd2\xff\xa0\x5c\xec\xe3E\xbc\x00\
-\xc8\x5c\x9c\x8c;\x13\xc9d5\x09wZz\xe6M&\
-\xa1G\x1e\x91(\xd4\x05+=\xd23\xc9q$\x89\xa4\
-\xd8\xe9\x15\x889A\x0c7\xfe\x03\xee\xc4\x8d\x1a\x88b\
-\xe2HU\xfcC\xf0\xbb\xd8\x0f-\xb6\x159\xcdlg\
-\x7ffFB{\x9a`\xb9[X\x88\x09\xdd\xd8\xdc\x7f\
-\x98\x96\xed\xc2\xf87;8\xbb\xbd\xf4lo\x03\xeeh\
-`H\xd1\xbf6\x00i\x8f\xdf\xf1\x09\xdfw\xbb2\x04\
-->\x03\x90X\xc0\x8c-\xdd7\xc9B'\x16\xba\xf0\
-b\x0f\xb46G\xe2\xd7\x0f\x0a\xdcya\xebG\xfc\xa2\
-\xf94\xb6-\xb4\x07\x1aQ:\xf9S\xb9\xf8\x03\x9c\xcd\
-\x9e\xdbpp\xf9\x8eu\xee\xa4\xd9\xe8\xcd\xc6\x1f\x02\x9c\
-s\x07\xc1\xe2\xa9:w\xf5\xf2#~.\x16D\xcb\x03\
-w`\x8e\x89\xcdZ\xdf\xec\x96;s\xee\xd6\x09@\x1f\
-\xe2\x82\xaf\x97\x1f\xf3\x13'w\xee~\xf4\x00\x16z\xa0\
-\xc4\x9f7~0\xf1\xcd'\xbeE\x13\x0b\x9b}\x9fJ\
-\xc4&\xe3\xeb\x18\xb5\xf1\x5c\xd1\x17\xc9\xfc\xddo~\xf3\
-\xf6\xc8\xf3\xee\x12\x8d\x81;`|?\x22V\xb3o\x9b\
- \xee\xd81\xb6-;%\x9esO1\xc0[\xf3\xa3\
-\xba\xadO\xef\x9aW\xbc\xea\xc0[7Q\xda7\xc3l\
-N\xae\xb6\xa5\xff\xa8\xf5\x1a\xc7\x8a\x05\x9f\xd2\xb8\x88\xb5\
-\xba\xf0\xf7\xb18\x19\x17f\x881\xe5\x09\xd3\xad\xda\xf4\
-\xaf\xea\xb3\x03<R\xcf\x9f\xf0\xc9\x8eyq\xdf\xc9+\
-\xc6r\xc6\x93\xf9\x95\xcb\xf0\xd0K\x9b)\xf7x\x93\xcf\
-z\x81\xf5\xd6W=\xba\xfd\xd8w\xbeo\xbb\xf6\xb1_\
-\xdf\xae\x7f\xe6\xe3\xca\x0b.\x00\x84\xa3\xda_\xf6\xe3\x8b\
-@X\xca3\xd2M6\xf6\xa3\x1c\xcbgR\xc8!\xe5\
-\xafd\xe9\xa5t\x88\xc3\x7fUB\xef\xe8\xf7\xf0\x94\x9b\
-\xce\x0b3\xc3k\xdb6(\x02\x82\x7f\xc6\x02\xbd\x13\xda\
-<\xf8*\x1e\xb7\x90\xf194\xc8\xe4h\xe7\xdaXt\
-^%<;\x89}\x9c\x88N\x9c\xf1\xdf\x981\x18\xba\
-\xf6f\x18i\xb0\xa4\xe0\xdf\xf8\x9c\x0e\xc4?j\x8e\xc5\
-*\xa6\x1b\x93%`\x16W5q\xba\x0c]\xdd\xb3\xf1\
-K#\x03:\xfecr\x19\x8e\x17\xf1\x02\xe0\xdcq\xf7\
-Dv\x12\x9d\x1d$\x87\x0a<W\x9ax\x15\xe8\x99\xf2\
-\xbdf\xd2\x0f^\x93\xb8\xc9\x91\xfaH\x8cS{\x9dF\
-\x82v\x1e\xd9?.\x9d\x9d\xc1D\xa6\x9f\xdd\xde-\x87\
-2rN\xc3\xf1?q$\xd2%&\x05\x07$\x05?\
-lh\xa1\x13\xb5\xe3\x9f\x0e\xec\x89;\xb1`\xe8\xdc\x1d\
-\x00\xdb\xc7|\xfc\x0b{\xf7O\xaci\xdbnZ\x8e\xdf\
-:Z\xf4\xfd\x13g\xee3\xd6\xf80f}\x19d\xc6\
-$1\xbb\xffR\xf2\x1dY\x94c\xa3\x05\x95\x95\x0c\x1f\
-\xf8\xec#Y\xa2h_\xe9/\x0b\xaa\xcb\xd8Z.\x1d\
-j~\xf6\xc7\xf1\xdc\xad\x8f*\x00]<\xf3D\x81\xc5\
-;\x9b\xb8$\xea\x09\xb1\xe7\x82\xc4k'v\xc2g\x91\
-\xa5\xe0?,\xb4\xf9Q\xd1!\xb1\x8e\x10>\xfdG\xc8\
-\xe6 \x1a\xd2o\x13\xa1K\x9f\x8c7\x8b<R\xfaB\
-\xbf}1!M\x1e\x15\x1b'c\xc1w\xfb\xf3\xb7\xe3\
-?\xf2\xee\xc7\xb7\xb7<\xfa<BB\xaa\x03\x80\xf2>\
-w\xb4b\x9b\xe7>x\xd3\x90\xdc,\xea\xd0f\x84)\
-S\xd9\xd2\xa9)\xcc\x05\xa5\xfc\xe4Q6\xf6=\x8fF\
-\xf7\xbc\xaa\xfa+\xe6J\x9fg\x03\xcf\xb9\xa0\xba\xba\xd4\
-\xa5of\xf3\xf9\xf8\xc5h\x8d\xfe)&~{q\x83\
-\xbc\x17\x05\xed\x07m6|\xc6\x8e\xd1\xf3\xc5)\xbb\xba\
-\x1a~\x9b\xca6\xcc\xbe\xe4\xfcM\xbfd}\x9b\x00\xdd\
-\xd2\xc8\x9d\x07\x9a\x9317F\xfa\xcd\xf8^\xd9\xde\xf3\
-\xe4k\xb7oy\xd7\x13\xdb\xf5\x8f~h{\xeaS\xbf\
-\xabT`\xcee\xa7\xbc W\xfbv\x80/\x1e\xe5\x9f\
-9v\x1c\xce%\x05\xe2,\x84\xa7X\xccS=\x17\xbf\
-\xee\x8fDL\xb5i\x22\x1e;\x8f\x0f\xe6*\xc4x\xd8\
-\x8b\xa1vr\xed\xa0\xadG\x13\xe7*\xc8yQ\x18\x09\
-J\xb0C\x83\xef6Xf\xa5>\xfc\xaf\xf6\x18\x8f=\
-\xba\xa2\x1ds\x98\xc1wLK\xfc\xbb\xf7\xe2\x10Yb\
-\x03\xc00\xd3LD`.\xf6\x09\x8a\xb0\x1b}\xe25\
-\x9fX\x97\xf8Q\xea\x98\xa8\xa6\x14\xd3\x8dKp\xb84\
-\x17\x00$\x98\xa7h&\xaas\xd3\xd48\xda\xe1D\x7f\
-&U\xb3\xea\xb6m\xcfZ\x84u\xf0\xdc\xb6\xbeN\xd4\
-\x01%)v\xbc2G\x96\xa8\x0ef\x93u\x8fW)\
-\x15{\xd2\xb7F;\x95\xe44;<\xec0p\xed`\
-\x92\x94\xc6\xa3=\xbc\x1d\x0a\xe2\x80\xdb\xe5\xb6\x1f\xc1,\
-ij\xa1\x08F\xadKrb\x11%\xe6\x15\xb2i\xa7\
-p\xee\xc4?\x0a\xf0r\xd2\xe7\x5c\x13=&=\xb9l\
-'\x1c\x9dj^D\x07\xd9`\xb9\xebG\xa6\x1f\xed\xca\
-6\x05\xbf \xbeX\x80\xcb\x06\xce\x1d\xb8\xbe\xef]\x8e\
-\xf8\x81\xeb\xe3`\xdf\xd2\xc7\xf0\xde\xf4%\x1d06\xfb\
-.\xa8\xf8\xe6B\xc0\x7fk\x8f\xbe\xf1\xb5z\xb2\x18\xd3\
-\xd7y\xf9\xe6\x1e\x00\xb0\xf4\xf2#~/\xb8\xb4GO\
-\xde\xf3\x10@<\xd9\xf9i\x01O\x0fd\xb7\xdb\x97\x8f\
-\x9f\xb9\x08@\xcf\xf1\xe8B\xc0\x1b\x8b\xee\xfc\xde\xfb\xda\
-\x87\xb6o\xff\xb2\xc7\xbc 1n\xfd\xcc\x83v\x07\xeb\
-\xe6Q4]jF%T\x05F\x94\xb3\x90\xd1J\x01\
-\xa3/\xe6\xaa\x1b\xe11\x9f\xd8cy\x14\xf4\xd7\xd26\
-z+\xfd\xf9\xecN1V[d\xd8\x9fb\xac6\x7f\
-\x5c4~yu\xe3o\x1cm\x9f\x89e\xc6\x88\x8b3\
-\xff\xd9\x1fv\xd8G\x89D\xd3\xfcR\x91\xabn\xeaH\
-^0\xf6y\xf5:\x8d\xb6Gv\x867\xc3\xfc\xf4\xf6\
-\xc3\xdf\xfcU\xdb\xe3/yp\xbb\xf1\xf1\x0fo\xd7?\
-\xf1;\xb9\x08h\xfe\xa1\xe4\xb9\xce\xd88\x17\x85\xcf\x0f\
->\xa9\x0b\xea\x0bY\x1a\xe8\x9b\x19G9e\xa0\x13\xa3\
-U,\x87\x13\x1d\x82'\xfe\xbdM\x07\x12 \x94\xca`\
-\xa5\xb1\xcf\x93\xe7k\xf4\xdc?\xc7+\xdd3\xb6c.\
-6>(\x9d\xe7\xd4\x11\xf8\xdc\xb5\xdd9\xf6\xb1:\xec\
-'\x1e\x9f/\x96M\xfc\xf6?\x8c\xf6\x8d\xe6\xe0\x9e\xf1\
-\xafF\xe3\xc0\xda\xfd\xaf}\xe3\xc0\xd6F\x8a\xc9d\xea\
-3\xe3d\xc9\xc5>\x5c\xb4\x0b\x80\xce\xe3:\xea\xe6q\
-\xa8\xb05\x93\x5c\xfaH\x048,`\x99\xfa$B\x92\
-\x00\x1e\xc5\xb5sq\xec\xcd\x87q\xc8\xb00\x92\x13&\
-\xbe\xc3\x09.\xca\xfc\x04RG\xe7O\xdb\xc19c\xaf\
-Ft\x91\xa1/k\xe2oP\x04\xd66\xb5\x03\x85E\
-P\xb1-\xcf\xb5\xd5\x17\x7f\x13\xcbD-\x13\xb4XJ\
-\x1c\xd8\xb4\x02Z\x97\xcf\x1c?b\x03\x98Z\x84~3\
-~&\x8d\xc1!w\xf1RZ\xe2l\x9f\x9cp\xe2\xb3\
-hQ\xea\x83\xc5\x92\x17q\xdd\xc2?BG6:\xd0\
-,\x80y\xcc\xae;-\xf1\xfdh\x7fP<\x04Z\xfc\
-\xbc\x91\xb3A\xeb\xb9)\xfa\xc6&F\x00|d<\xd8\
-\xdc\xc1\xd3\xcb\x1bw6}\xfe\xc6\x9eM\x9a\x8d\xdbo\
-\x1fH\xc9\x8f\xe5\x07\x97\xc5\xd5\x7f\x93\xef\xbb4t\x85\
-\x05\xb0\xda\xbeX\x90>\x17\x1c\x5c 0\xaa]\xbc\xad\
-\xd3X\x84a\x19\xd8\x0e\x82\xb0\x0c\xe2\x8b\x01_\xfc\xe8\
-\x82\xe1\x15\x0f\xde\xb3\xfd\xe8\xd7\xbf\x91\xa0\xb5Q\xf3\xe4\
- \x8b=c\x08I\xedy\xf0Am\xe9AN\xd3\xed\
-\xbd\xef\xc49\x82\xce\x15\xb8\xc1\x00G\x98\x13\x1f\x1ba\
-uZW\xb7:m\xf7\x02\xa28\xf0[NmW\x1d\
-d\xd8~!\x05\xbb?L\xc1\xc7\xcdlO\xf9kl\
-\xa5[3\x1el\xfe\xedO?w\x01\x9f'\x05\x84\x97\
-'\x03\xca\x07h\x8d<sH\xf6\xd2&z\xbf4\xc5\
-\xcc\xbb\xf3\xd9c\xed\xed\xdb\xff\xa8\xe8\xdf\xfa\xdeo\xd8\
-\xee\xbe\xe3\xea\xf6\xf4'\xf4\xd7\x01\xbf\xf7!M8\x8f\
-\xf7\xc9-\xe6\x9c\xef\x0b`\xac\xf25\xc1~[a\xe6\
-\xca\x7f:*\xf0\xc4\x86O\xf2H\x9e\xf1\xe5\xc7Y\x5c\
-(\xc23\xcbR(\xe2\xe1\xe0\xdaB\xc6\x8a\xf6\xce\x99\
-\xb1\xcb\xf9S\xcd@u\x5cc\x83I}\xd8\x9a\x83^\
-\x9d\xb6\xca\xacG\x04\x02\xc9\xf8\xab\xc6\xb7\x8e\xd5I;\
-\xbc\xd2\x95\xc1-]YpN\xf8#\xb4l\xc6)\x8e\
-\x18}\x83$6\xc6\x88\xb6\x8aq\xd5h\x1b\xa2c\x11\
-\x9f\x91\xec\xfd\xb7f\xc65\x08\x17\xfb\x98\x95\xf6b\xf7\
-\xc1\xd17A\xa8K\x93\x08\xa1\x8f\x09\x8b<\x1d\x86\x9e\
-\xe9\x9d\x04q\x8e\x1eI!aN\xdac\x80l\x1fm\
-\xcb\xce\xd8\x9b\x83E\xfc!\x0b\xc5q\xa8%>\xfb\x0f\
-\xc0\x1es\xe2\x93\xaeb\xdf\xe3O\xf69\x88\xf8\x17I\
-l\xa8\xc1U]\x9fk|$r\xf9\xe3\xde\xed\xc0I\
-\x22\x22\xee\xa1\x0d\x1f\xb0!9\x91\xd1Y\x8b\xdb\xde\xd5\
-\x22;\xfc\x132\xbax\x8c\x8d\xe3\x17'>T\x0b+\
-x\x83\xa9\xb6\x17J\xd6-\xd1\xbe\xe3\xd7\x86\xba#8\
-\x00m\x96l\xaa\x02\xf1]4\xeb\x22\x01\xc9\x176\xde\
-\x88\xbd\xf1\x8ak|B\x10-\xfd\x98\x8b\xf6~#|\
-6k-\xa8\xbc\xb7\xce\x06\xcc\xa3V\xfc\x1b\xcbU0\
-\xf3v\x03F8\xe3\xc5]|\x1e\xe1\xc7\x87pTr\
-\x17\xc2\x18\xca\x8eMM\xaf\x95\xe7\xbb6\xfcy\x11\xa7\
-&\x96\xf85\x0e\x8b\xbd\xdb\xf8\xd5\xa6\xa0\xc7\xca\xb7+\
-\xe8\xbf\xfb\xfe7ow\xdf\xae\x0f\xfd\xa9p\xa7\x8f7\
-\xdf\xf3I\x87\xcfB\xc0\xf0\x06\xcc\xc5\x88e\xc4\x826\
-}\x86\x93\x02\xdd\x1cB\xbf\xb2\xf2\xd1\xf2\xb8\x8f\x1e\xed\
-\xeaWw\xd5)}\x9e\x0d\xb2\xb5\x9c\xfa\xc0\xa6e\xc5\
-.\xef\xbcz\xb59O~3\xdey\xf8+\xefft\
-\x9f\x04\xb4\xae\x7f\xe6\x16\x9a\x0b[d\xbe\xc0\x9d\xfe0\
-\xda\xb4\xf3\x99\x95\xc9QVU\xc9\x9dZ\x9e\x0e\xf5]\
-\xbf\xf8\xcd(d\x8e\xc8\xb0G^p\xff\xf6o~\xc7\
-\xd7\x90]\xdbS\x9f\xfe\xc4v\xfd#\xbf\xaa\x0f\x0b\xea\
-\xff\x07\x903R\xce\xb7\x02bO\xde\xa6M.8\xe7\
-\xccCF\xfe\xe0Sq\xf2\xa3\xf3\x85\x22w\xc6@\xb7\
-\x9e\xe9\xc7\xde\xaf\x13>\xca\x87\xfc\xc8\x1d\x83\x18Q\xd4\
-j/:=\xb1\xa5\xd5Vy\xfaK|cL\x14\xd8\
-\xbb\xe9\x1e\x8c=~\xa3\x83\x14\x1d\x0a\xf1\x97\x8e4\xed\
-\xf2\xa8\x0f\xff\xd2\x00{^\x08\xec\x1f\xa8\xc1\x03\x03\x12\
-\x1f\xa6U\xdb~\xe5a?\xf2c\xfd\x8c~\xec\xf1a\
-\xf3Kq\xe0/\xa0.Eq\xb2\xab'\xad\x9d\x1cN\
-\x0215a\xc7\xc9\x80\xd2\xd2e\xd1I$\x94\xf5\xeb\
-\xc95\xd3J$\x01\x00G\x0d;<+ -\xfeH\
-\xca\xa7F3\xfeM\xa5\xdd \x91\xa9\xac\x89\x1c-3\
--;\x13\xb78\x96sp\x9c\x1c\xd6\x13i\xe4\xb6\xb4\
-\x82\xa4Q\x8e\xcbI\xf8\xdd\x89\x15\xed\xdf\x8bZq]\
-\x07\x9b\x93\xc8cB\xcd8 \xe3\xd0\xb3@4\xf1{\
-#u4G\x0cQM\x04\xde\xfc$\xf7\xe3\xf2\x89\x8a\
-\x1b\x16\xe3\xc9\x15wO\x0eu*/\x80\xe0I\xc7\x7f\
-b'\x07\x19'\xfa\xa0\x97|r\xa3\x83\x0fNX\xe3\
-K\xd9\x1b\xbb\x9e P\x87\x87\x1dw\xf98c\x93\x9e\
- \xdb\x17\xfa! _\x88H\xd4~\xcd\x1a*\x1by\
-`\xa3u\xa0]X\xc5\xb3]\xf8l\xde\xbe\xfb\x03Z\
-|\xe2\xb3|\x8dO\xa6\x897\x0by.\x14d'}\
-\xdf\x11\xb3\x98k\xa3\xf9\xfe\xafz\xf5\xf6\xe8\x03\xf7\xa4\
-O\x1ax<27,\xed\xec+B\xf1]'\xdf9\
-OHlH\xb6\x17m)q\xa9$\xde\xa3.\x8f1\
-\xe4uZ\xca\xaf\xdd\xa9\x9c\xb6\xc7_N\xd1)];\
-\xe2\x80nY\xe9\xf2\xce\xc3^y\xe7\xd9\xd4\xf6\x0b\xa9\
-\xb1/\xdeJcK\xbb\xf8\xe8T\x0fYi\x8f\xe3\xd2\
-F\x86\x0d\x7f%@\xb9\xc6\xfb\xfe\x10\xd8\xab\xab\x9e\x97\
-\xb9\xb0B\xcf\xe7\x80\x0e>_d\x22\x11\x00d\x830\
-4\x87\xfa/\x8e7\x00\x80\xa1Z\x22\xe3\xbd\xfb\xad\x8f\
-o\xff\xec_\xfc\xda\xf6\xd3\xff\xdb\xcfl\xd7\x9f\xfa\xd4\
-v\xeb\x87?\xb8\xddx\xfeK\xb6[n\xbbC\x0az\
-:\x00\xd0\x15b\xd0\x13\x01\xe58v\xa0\x92\x0f@Q\
-2\xfd\x05\x87c%\xf1\xc9F\xb4\x0e\x0d\xe2\xa78N\
-\xe4\xbe\x90\x80\xc7\xb8\x0c\x22N\xe0\x0c\xe4^\x97)\xb1\
-Qt\xa0\xef\xa5k\xbe\xfa\x87\xb6|\xaf\x01)o\xec\
-\x1b\xd3\x8e\x8f\x03\xe2\xb1\x83\xa3\xae\xbc\xf6\x92\x9f\xeb\xdf\
-\xe1\x1f>\xe2\x9f\x98\x11\xa4U\x9e\xed\xa7Q\x9e\xe3\xdf\
-5\x1d\x0a\x9e\xf7~\xbaq\x09\x0eYS.AG\xe8\
-\x02\x13\x99:\x13\xe6\x13%\xac\xf0=\xf9(N\xd2\x8d\
-2'I\xc8\xb1\x1f=Z9y,\x15\xbe\xd5\xc2m\
-\xd2\xab5\xb9\xbb\xf8\x1f\x1c\xe9$\xa6\xa3m\x84\xe1\xdb\
-kq\xd4\xb0.\xf5\xee\x1f\xfb\xfa\x1c9\xcd\xd5^\xba\
-\x89>'\x02)Z\x1b\xea\x8eI\xcc\x06l\xf8\xf1\x8f\
-\x85(\xfcb0\xb5\xb6\xc48\x1e\x13\xdb\x87\x13\xff\xa2\
-c_\xffb7n\xe1p\xe2\x82g\x1e\x0bL\x94\x8d\
-\xc0\x22\xc3\x0f\x0b(\x1b-\x226G>|\xc7\x09\xda\
-8\xbc\x89\xb3b\xea\xd7</Tl\xa0ZH\xad\x0b\
-\xdc\xd8\x10\xaf\xe4\xec\x98|j_\x06 y\xf14\xbe\
-\x16O0\xa0\xfd$@w\xdf<^\xf5c~\xdf\xdd\
-s\x97\x97\xb7\x03r\xc7\xce \x09\xccw\xff\xd4y!\
-\xf3\xe7\x05\xc4\xe7\xbd\xfb\xd83H\xb2g\xa1\xc6\xafd\
-\x22\xdcfq\xf5\x87\xbb,W\x0c\xda\xb8y\xac\xef\x7f\
-6\xc3\xbf\xf5\xd5\x0f\xba\xec\x16oz\xc9}\xdb\xb7\xbf\
-\xf3\x15\x1e;\xe2\x94\xaa\xe3\xe5\x9b\xeb\xb8\xc0pAu\
-\xef;f\x8a\xc1\x83;\x8be\xb4\xa2*\xbduS[\
-i\x14\xba\xf1y\x5c\x84\xc1&\xbe\xf2\xa1\x91y\xecE\
-W\x1f>\xa5\xfc\xd2\xa7r+}\x91\x1c\x88\x8d\xfe=\
-[\x8c\xc8x\xb5_m\xb7\x7f\xfe\xdc\xc5\x5cpe\xde\
-2&\xce\xa9\xbd\x9f\xe4\xbe.\x0e4_\xbe \x10\xdf\
-u/\x225\x9e\xc1\x8b\x81\xe7X\x06\xff\xea\xb7|\xd5\
-\xf6\xd8C\xcfW>\xe9Y\x93\xfe\x83\xe05]\x04\x5c\
-\xff\xec\xa75\xc1\xc9\xe5\x5c\x02f\xcc\xc99\xcd\xacs\
-\x87s!\x80\xc8&\xef\xccj?\xc8\xd1\xf1%\x9b\xe8\
-\x1es*\xabd\x96bn\xbf]\xd3\x06{\xe2\xc5\xae\
-}\x86\xb7\xd2\xf4\x9fL=\xec\xcd\x18\xd3q.V\xe5\
-HW\xbasR\x9e\xeb\xce\xc3\x19\xff\xc1\x05\xb8\xba\xd0\
-\xf1\x7f`6\xb6\xd4\xf8O\x0c\xbb\x0d\xd1\xef\xb8\x99\xaf\
-5\xa6\xca\x5c\x1f\xe6\xb1\xc1\xd9n;\xf1\x5c\xe0\xeaR\
-]\x00tn\x9a\x10\xd4\x9c\x8c\x94NjZ\xc7qI\
-O'\x12I\x13\x13o\x8bKr\x1d6+\xb5\xe2b\
-G{\x5c\xbavr\x8b\xb1\xeb!\xac\x02\xfa\x80\xd1\x16\
-\xe1\xca\xf6Q \x82\xaa:\x99\xdb\x80;tr\x91F\
-\x12\xd9\xfeG\xe6\x85hTw\xff\xf57\xb5\xfbK\x16\
-L\xdc\xe8y\xb3\x19;\xa02\x86\xc7Ha\xdab\xfb\
-\xf1\xe7d\xc2~V>\x1e^\xfb\xb1\xbd\xe4\x8eKF\
-\xec1\x89\x0b\xa6~\xa9\xf4b!\xcb\xc3n\xdd-\x89\
-\xe6=\xfe\xfc\x89\x9b\xfaE'\xd9\x88\xad\x17\xcfI\x5c\
-yg\xdc\xb4\xae\xdd\xca\x87\xed\xa6\xc1\x06\xcfEF0\
-%\xd7\x82\xe9\xf7\xef\xd9\xbc\xb5\x08\xf2\xc2\x07|\xed\xc4\
-\x99\x9b\xd2^$Y(\xf3\x02\x03\xda\xff\xb0\x05\xda\xab\
-i\xb0el\xbe1\x07\xdb\x8b0\xe1\x12\x03\xfal\xd0\
-\xf6\xc1B\x0e&\x17\x0e\xd3W\xb5o\xe8o\xc3Y\xe4\
-\xef\xd2\x0d\xde\x8f}\xe3\x9b\xfc(\x19\x5c\x0a\xc3H\x06\
-\xf0>\xb4\xdb\x1a<<z\xae\x18H\x15\xc6\xd5\xaf\xb1\
-Y7-\xe4\xe7.\xae\x0b\xfff\xfa\xd8R\x90\x9f^\
-\x188G\xe4\xbf\xb2\xde\xfds\x81\xd1xV\x19\xf2b\
-\x04\xf58V\x9f\xfa\xd9\xca\xaaw\x1e\x8d->[\xa0\
-\xd7\xf6\xcd\xf8\xc5B\xde\x18\xd6x\x8b\xd1ZJ~\x22\
-\x90\x7f{\xcc\xfc\xc4/\xb5\xbf\x0e\xd81d\xeew\x9e\
-&\x12\xb6\xef\xae=}\x99\xc3\xccs.fo\xd7w\
-\x0d\xfc\xedo\xfbj\xa5\x08\xf9\x82\x5c\xdf\x0f\xf0\xbb\xbf\
-\xba\xdd\xf8\xf4G\x9dG\xbeKw\x8e1N\xcd]\xcd\
-\xbd\xf4\x8b\x83?\xae\x1a\x93\xb3\xaa\x9d\x22\xe6J\x05\xbb\
-\xa3\x98\xab\xc3\xce\x95\xdc<\xd7\xb1\xc9\xea\x13\xbac\x13\
-\x8bH@\xdb\xed\x89i\xe0;\x0d\xad\xadw\x9e\x7f\xec\
-w\xfe\xea?@\xc6\x1bP\xf4\x8a\x8f\xb4\x11\xf8|\x18\
-A\xaaC/\xed\xe1>\xc3>>v\xf7\xc6\xd4\xc1z\
-c\xe9I\x8b\xe0\x8c\xff\xb5c\x81\xb9\xb0\xc7\xac\x22\x17\
-6\xfc#\xf0&R\xa6.\x89\xd5\xc5\x92\x1a~\x92\x86\
-V\xda\xc7\xa4\x8a3\x99p\xd8\xcf\xc6 ;\xebI\xe0\
-y\x97^\xda:\xcdH\x16\x98\xc3\xc3\x89\xed\xcd\x8a\x9f\
-\xc8\xc2\x8f\xfd\xe0\x81;q\xec\xf6{\x8c\x91%\xa6\xf1\
-\xb7\xcb\x8e6!\xaf1I%\xfeUck\xfb\xa9\xe9\
-\xfb\x1a+q:~,\xd0\xc1X\xc5\xf1\xab\xde\xed\x87\
-\x86\xbf\xca\xa0\xd1\xf1[\x07\xf5e\x1f\x12 \xf3f\x80\
-\x0dqpG$\x9a\x83h\xf6A\xf6Q\xb6U@Y\
-\xf0\x1c\x8bh>\x80\xa7-G\x92\x8c\xbf\xff6Z-\
-\xfc\xf1\xc2\x0a\x00/r\xfa\x84\xb6\xff\x86Z\xf2\xe3\x7f\
-\xab\xe3\x00pm\xb8\x92\xdb~\x16I\xdbp\xf7\xad\xc5\
-\x95\xf8|G,]\xdf\xd1\xa3\xa3\x97?\x99/|\x7f\
-!\x0b\x81\x82#~>$\x18\xb9\xef\xde\xad\xaf\x8b\x0e\
-n\xe1\xf8\xf4>mc\x81G\xec\xf9\xbe\xf7<\x01\x00\
-\x03>\xb1\xe5\xbd~o\x96\xfe\xcfp\xf96\xb8\x1f\xfc\
-\xea\xd7l\x0f\xddw\xb7\x5cqq@O\xa5K\xd1\x04\
-7o\xfd\x1d\xf6\xe1\xda\x1f\xf3\xd9\x8d\xd5\x16\xc2\xef\xbc\
-\xdd\xecn\x7f\xdf\xc8\x06\xe7\xf3U\xe8\xdf\xcc\x06~7\
-\xfd\xea\xddL\xf7\xf3\xf9\xf9\xb3\x927\xeeS\xff\x8cc\
-\xcb\xaa\xe3\xfe\x8d\xcc:IJ\xcfC\xc6\x9e\xdc\xe4B\
-\x97\xb9\xd1+\x1335\x88\xc9er\x85\x8b\xc4\xd88\
-=\xb67\xbd\xea%\xdb\xd7\xbc\xfdu\xd2 \x9fH\xbb\
-\x1b\xdb\xb5\x8f\xfe\xd6\xf6\x94\xfeJ\xc0\x8f\x83\xf0K\xfe\
-\x88\xcf\xf9CnqV\x90\xb3\x99o1}\x81\x8a\x0c\
-|\xdc\xa9\x1e\x9f\x0e\x85\x168\x119V)\xf9\xc7\xcc\
-9\xd8^\xdc\xca\xb0M\x1e\x06\x1b5`\xe0S\x8a\x99\
-V\xda\xe6\xe1_/\xa5\xca\x99\xf5\x07\xc3\xf2\x01\x02k\
-\x07\x1b\x19Q\xe5w\xc6l\x9c\x99\x8fO\xfd8\xa6\xf1\
-Q\xdf\xd4`\x1b\x13-\xe2\xc4\xb6\xf6f\x9c\xfaog\
-\xa4\xa4\xdf\xd8\xe3\x1f\xfb\xfa\xb7\xc0\xed\xd5\xd7E\xa6/\
-\xcdg\x00:\x09I\x8a}\xae\xcdN\xe2\x22\xc9DN\
-\x1e$)j8u'{=\xd1MKn\x19\xf9\xa1\
-\xbc\xa0\x18\x87dZ\x8a}\xe8\x966>\xd6\xa3\x94\xac\
-[\xd9\xd9\x18\xd7\xe4\xf4\xc9\x02f\xcc\x8f8\xb1\x17o\
-\xd8{\xbd\xb8O\x1f\xad\x86\x16\xb1\xc9\x9fI\xd14\xcd\
-Y\xeba\x8e\xee\xdeG;\x8a\xa7\xf6\xdf\xf1\x0b\xac\xfe\
-s\x13*{1\x18\x13\xfc\xf8[\xf3\xd8\xec\xe0\x8d3\
-o\xfen\xa0\x87\xbdFIL\x9e\x0edLrG\xcc\
-\xa7\xff\xfd\xb7\xcc\xea'\xef\x8d7\xe0\xe3\xcf\xec\xe6D\
-\xf48\x88\x16\x86\x17B.\x0a\x5cd\xa3\xc7\xea,\xba\
-XsgN<\x5cN\xd8\x8f1\xe3\x1fuo\xf6\xe8\
-\x22V;v\xf8H\x1f\xcf\xce3\x16\xb3\xe0zU\x8f\
-\x0e\x96\xd8\xe68`js\xb7G\xff\x121\xc4\x11\xa3\
-/\x04j'\xfe\xab^x\xf7\xf6MO\xbe\xcc\x1b\x06\
-^ty\xe2' \xc6\x94\xfci\x0d&\x17\x06\x94[\
-\xf4~\xb4/*\xdc\x17\xb3\xe4+\x83\xcb\xdc\xf1\xe2\xa2\
-`\xe5\xa1U~,\xbe\xf0c1k\xd1\x0b\x8el8\
-\xe1\xa2\x83\xbf\xfal\x0d\x7f-7\xe3\xaf:7\xa3k\
-{3y\xf9\xa7>\xcb_\xed\x1b\xef\xaa\x8b\x9c\x17\xbc\
-\xf2W\x1bph\xef\xfd\x9eq\x86o\x9e\xba\xca,\xf8\
-C\x9b\xa2\xfb\x0f\x87\xd8\xb8\x93W\x92r\x22\xe8p\x8d\
-\x0d\x5cX-\xbd\x10\x80\xf7C\xef\xff\xca\xed\x7f\xff\xd9\
-_\xd8~\xff\xb3<\xf1\x22\x16\xe1\x7f\xf2#\xdb\x15\xfe\
-\x7f\xc0\xfd\x8f\xc8|.\x0fe\xee<\xd2\xe3\xaf\xa79\
-\x11\xbc\xd93\xcf\xc9\xbd\x1d_\x18\xceT\xf1q\xcf\xd3\
-\xb6\x96\x85\x94/\x84\xfe\x95~\xb2\xf6\x99zRPi\
-\xe8\xad\xabG\xed\xb1\xad\x0e\xea\xc4\xc9\x81\xc0p@;\
-0\x90qH=\x85\x9cGn\x9bh\x0c-\x05cD\
-\x82\xba\xed\xc1\x5c\x8a\xfb\x8f,BKv:\x833v\
-\xb5_\x8cE\x1e\xfe\x0f\xfe\x0ee\xff\xe7\xdb\x1d\xda\x17\
-\x8brJ^\xac\x90\xcf\x8f\xb6\xc9@\xdd\x94\x98\xf9r\
-R61zr\xafu\x93\x96\x04\xe3\xc4\xd9\xedq%\
-\x1er\xeb\x08\x1c\x9c\xb0E\xd0FE?\xf6o\x96\xb7\
-\xb7\xe8\xecR4\xd0\xcc\x02\xb3\xdbO\x1b\xcc\xd8\xe3\xff\
-\xc4\x87d\xf5\x8f\x12\xf4n?\xed\xc3\x7f\xe2\x18\x0d\xeb\
-9:\xe2?Z\xb1\x17\xc7'\x86\x17\x19\xec\x88\x00\x1e\
-1F\xd9}\x16\xef\xf0\x7f\xc4\x8f\xee\x00\x11\x94\x169\
-!\x88\xc5\xc6\xedx\x88M?\x19\x8d\xe8\xfaS\xfe\xf8\
-\xb3\xab\xd9\x10\xd5&\x09\xf9\x97\xbf\xda\x91\xb3\xf1k\xd3\
-sl\xe2c\x0f~/,\xd8H\xfd(\x95E\x14\x19\
-\xb5^\xfa\xbe6\xf9\x97=\x0b\x22:z9~\xd7\xa2\
-\xb9\x937\x0ew\xff\xba\xeb\xf6\x93\x00\xee\x9c\xe0\xcf\xfb\
-\xf9\xfdw\xad\xd7>\xa7O|=\xb5=\xad\xd7\x15j\
-\xeb\xf2\xe4\x808\x14\xb7\xee\xf8\xf9\xb2\x9e<e\x90=\
-v\xf8\x94^.6x2 \x9f\xac\xca\xe0\xdb>1\
-\x11o\x9e@\x08\x0f\x0c\xbd\xfe\xd6\xfb\x9e\xf0\xe3c\xf0\
-)|\xdc\xcb_F\x94\xa6\xe3\xe6n2\x7f\x92\x96~\
-u#F\xbfv\xcc]\xe6/\x86\xee\xff\x0c\xe4\xaa\x8f\
-\xcdZV=\xec\xcf+\xe5\xb3\xd9\xd5\x1fz\xf5Y\xf9\
-y\xb6_l\xbcg\x8b\xb92b\xa6\x9fk_\xe1\xf5\
-\xe2\x0a=?\xfd\x1a\x1e\xa7\x0f#\xc7\xcbs\x95\xabc\
-\xd3\xb4\x05\x94|UV0\x8f\xb0\xaa\xefd\x17\x1e\xb3\
-\xf6\xfc\xe7\xdc\xb3}\xff\xd7\xbf+9\xe3\x8b>qy\
-\x9a\xf4\xe9\xdf\xdb\xae\xeb-\x01\xf2\x05\xbb\x9c\x07T\xc9\
-\xa7\xe4=\xe7\x12(9\xb7\xf2$\x81>\x88\xc5\xc9\xa9\
-\x02\xcdwj\xa4_\x07\xcf\x98\x9cC\xd6)\x7f\xa9\x0d\
-\x82\xfd\xc2\x1b@x\x89\x89\xf5C:\xf0\xc5q\xadC\
-m\xa2~b/-~z\x9e\xb3\x0eE\x03\x1c\xa8\xd3\
-XO\xec\xd5\xb4\x7f\x07.\xaf\xf6\xbf\xe8(6\xfb'\
-n\xc6x\x8d\xdf\xca\xf1\xb2\xc7o\x8fD\x8a\xe7\x94\xc6\
-a\xde\xd8\x8f\xe8\xc2W\x97\xe5\x09\x80\xe7\xaf\x13\xd4\xc5\
-\x88\xf9\xa5\xb4N+Gt\x9c8g\x14\x92,k2\
-\xecb\xb2\xc1\x19\xc1a\xb6K%C\xa8\xdd\xfd\x91\x8c\
-R\x1e\xad\xbd>Rj\x12\x95Mc\x0dN0If\
-\x13\x91\xc9\x9duH<\xfb'\xa2`\xef\xf1\xc3\x02G\
-:\x89\x0e\x06Q\xa6\xb4vk\x14|\xa2\x11?v\xa3\
-\xe0{e\xf3\xa4\xd9\xbab\xfb\xde\x03\x18w,8B\
-\x9a\xc5\x8e\xbb\x1d~\xfa\xb6@\x16\xc8\xb4\xb3\xfe4>\
-\xe2\x97[\xfa\xcf\x8f\x1a91\xc1'&\xaaY\x8c$\
-\xef\x87\xf5|\xa5\xa0\x05\x0f\x05\xfc\xf2\xd8?wWX\
-\xc9V6\x19\x13\xe6Vz\xb0\xba\xd8\xb1P\xda\xdb\xb5\
-\xed.}\xc5\xebK\x9ew\xf7\xf6\xd2\x07\xee\xde\x1e\xbe\
-\xef\xae\xed\x9e;n\xdd\xee\xba\xedV\xfd\xe9\xdd-\xdb\
-]w\xdc\xe6\xb5\xf23\xfa~\xf6\xcf\xea\xfd\xf9O|\
-\xe6s\xdbG>\xfe\xb9\xed\xc3\xbf\xff\xe9\xedC\x1f\xfb\
-\xec\xf6K\xbf\xf3\xc9\xed)\xc9\x187/\xb3\xbe\x84V\
-\x1f\xae\xd3\x0f\xfc\xbac:tXa\xd0W-\xc7z\
-Y,K\xe2\xe4B\xe4\xab^\xf7\xa2\xed\xcd/} \
-:\x1d\x07\xd5\x1e\x02\xe90\xb6\xfe<\xc1\xc8\xdc?|\
-\xab?\xf8\xf3\xfc\xd9:\x87\xc4 ll%\xa7\x94\xd7\
-6\xbc\xf3\xe4\xf0\x8b\x0bM\xa9\x0d\xfak\xbb\xfc\xd6\x16\
-\xea\xb0\xeaUV^\xeb\xea\xb6\xae^\xdb7\xabof\
-\xbf\xea\x9fb\xd5\xa6\xf5y\xba\xe7\xc9\xd0+V\xe5\xd4\
-\xbcz1\xc5X\x91\xe3\x8c\x0c\xf5\x0d\xe5\x02s%%\
-o\xfc\x5c\xf0>\xc5_\x0e\x88E\x9e\x92/|N@\
-\x0f\xa9\x5c\xe0]\x9fq5\x88\xb8<\xfd\xf9k_\xf1\
-\x96\xed\xbf\xff?~v\xfb\xe7\xbf\xf1a\xe7\x81\xcf\x12\
-`?\xf3\xc9\xed\xdaG>\xb8]}\xfe\xa3\xdbv\xdb\
-\x9d\x9e+\xffU\x80\xec\xb8\xa8v\x8e\x89\xbeE\x0d.\
-2\xf9\xde\x02\x1e\x939\xeb|\xd5M\x9f\xa4+\x1dU\
-\xee\x0b}L?\x13\x14\xfds\xbb5\xba6B\x1e\x1d\
-jx\xd6\xb5\x5c\x87)\xe1\xe1D:\xc3\xc3|7-\
-O\xd2\xf8\x22\x96j6oQ:\xb1\x1f\xbb\x00\x113\
-.\xd0i\xfcRXx\xf6?q\xef\xf1K\xbf\xc5!\
-M\x8c\xf5\x8e,1\x85S~\xe2;l\x13C\x91.\
-v}Y.\x00<\x0b\xeb\xe4\xc1\xa0M\xf1dO\xdd\
-d@\xd2\xc4L\x22eZ=\xe9c\x10k%\x19'\
-\xd4$d\x93\xc1\xf6\x83\x1cz\xec\x17\x80\xdd\xfflB\
-IV9\x96\x81\xf1\x9c\xa0C\x0b\xab>\xa4\xe1\xe0v\
-{\xeb\xd3\x0f\xc5\xb2\xc7v\x9c \xd6W_\x1b\x87\xdb\
-:\x98#\xe6~\xb2\xca\x16\xba\x8f\x16\x83\x85\x95\x8ad\
-lPy\xc0\xa8&\x8b\x19~u n\xc7\xa6q\xc0\
-\x86\x10\x10\xce\xc3H\x1cy\xf1\x01\x895\x87\xe2q\x86\
-\xc6F\x02o\xbf2\xce\x1d\x0a\xfa\xbak\xbf\x85\x8f\xe2\
-\xd9\x89=\xc4\x0e\x9b\xf4\xd3\x1b\x9f,\x0d\x83\x9e\x16W\
-b\xb9\xa2\x8d\x1f&[0\xfb\xbc\x9f\x08\x10\xac/@\
-\xf0\xa5\xbbn\x90\xf1!\xde\xe3/x\xee\xf6\xe4c\xcf\
-\xdf\xde\xfa\xd2\xfb\xb6W\xbf\xf0\xde\xed\x85\xcf\xd5w\xeb\
-+Pp\x89\x8b\x8291\xfb\x89\x00>$\xcf5\x04\
-8Y\xd0\xb9\xf6xJ\xbe\x7f\xfe\xb7?\xbe\xfd\xdc\xaf\
-~t\xfb\xb9\xdf\xfc\xd8\xf6\xff\xfe\xc6G\xb7\xdf\xfa\xf8\
-g06\x12\x98\x1e<\x11\xd8\xb9\x7f\xe0\xe1\x09W\x02\
-\x85\xcf\x9f\xf1\xdd\xa9[\xfd\x1f~\xef\x13X\x9c)\xe8\
-y\x9c\xc1\xa4\xcf\x01\x95\x0eqd\x04au^1\xf6\
-xC\xa8\x94\xc6O\xdb\xe5\xd1\x86\xbf\xb6\xad4\x87S\
->\xed\xe2T\x8fv7\xc1\xf2.jM\xff\xda\xc7\xd3\
-~\x9e\xc7\x87\xb7\x96^01\xd2\xc8\xb8\x16\xe6\xed\x9a\
-b\xf5\x02\x81<\xe0<\x90\xc0y\xea\x0b\x06\x91\xe4X\
-\x0bb\x92\x88;\xf7\xbf\xf5\xad\xef\xde~\xe4'\xff\x1b\
-1\x84\xb9\xbb\x94\xf0\xa9\xcfnO\xfd\xce\x07\xb7[\x1f\
-|T\x7f&x\x97t\xf53\xe7\x00\x17\xbb\xf9s\xd7\
-1\xe8\xba\xa5&n\xfd\x90\xcd<\xb2Q\x17/\xfa\x19\
-\x87\xb8\xb1R\xba\xa7\x06\x84\x8c\x88\xc9\x22j0\xa6\xe1\
-\xfe\x88\xe7\x82\xd2\x10>\xabj\xe0\xe8bg\xff\xe2[\
-\x0e\xbfXc\xd7*\xfe\x83\x86s\xfb\x11\x93\xf1\x04\xd6\
-\xe3\xdf\xb8&F\xf4Z\xd0\xd9\x03\xae\x9ek\xec\xe3\x1d\
-\x95\xc4om\xb7jtv~\x8f8\x05!ka\xd4\
-' \x97\xa0\x5c\x9a\x0b\x00'\xc8LN\xf3\x81\xa6\x93\
-C\x04\x93\xe7I\xccL\xe6d\xdc'\x90t`\x82\x93\
-\x10>y\x99p\x03Di\x10\x8c\x13\xcdz\x89\x0f\xdb\
-\x8f\xbf\xa05Y\xc6^X\x8eQ' n\xbc\x18 \
-Zl\xe2\x9f8\x83\x8d\xa8e\xd4v\xbbU\xb6\xebO\
-\x87\xc7\xdcw%5@\xe4\xae\x8f\xe3\xdd\xbe\xc0\x8a\xcb\
-\x0b\x8d\x5c\xefx\x0eN\x0a\xfc\xceb\xc2\x92\x01\x03\xb3\
-\x8eO\xf5\xf7\x85J>\xe0\xf9S\xfc\xd2\xcb\xd8\xd0\xff\
-\xdc\xb5\xb2\x85\xe5R\xc0\xce\xa4\x90m\xb8\x8fJ\x1d\xbf\
-\xefp\xf1\xc5hv,U\xbb\x13\xb2\xd3\x22K\xdf<\
-\xaf\xec\xcc\xc4g\xc3\xeb\xdbm\x0a\xf2/\xbe\xfc\x81\xed\
-}oxx{\xfbc\x0fl\xf7\xdey\x9b\x9f\x04\x08\
-f\xb00\xe7\xad\x80\xcd\xdf\xe8&\xb6\xf8\xbc\x1d\x80\x1f\
-\x19\x83\x03>\x06^\x5c\x85M-\xce\xedz|\xfb\xfa\
-G\xee\xdf^\xff\xf0\xfdH\xad\xf2\xe1\xdf\xff\xcc\xf6\x8f\
-\x7f\xee7\xb7\xff\xf1\xff\xf9\x95\xed\x17tq\xc0JK\
-\xcc\xfd\xa0\x03v\xf4\xfd\x86b\xcc\x85\x80\xfc(\xe6o\
-\xfd\xf2\xc7\xb7\x17\xea\x83\x7fM3\x7f\x00\x90A\xc4-\
-\xb1\x88\xce\xbc\xe5\x02\x84\x08|\xd7\xc9.#\x01\xfd]\
-\xe7\x00\xbas\x01]\x19a\xb6\xac6\xe5\x9dW\xfbB\
-C\xf8\xdd\xe0\x8a\xd5\xba6\xab?x\x95\x97\xbf\xf2j\
-\xf3\x87\xad\x8b}\x9e\xfd\xeao\x95\x9f\xda\xacz\xa5\xd1\
-\xe9\x0b\x1e\xaf\xd5\x8eO\xfc\x97\x0f\xf6J\xf7B\x88\xf3\
-\xc2o\xdb\xa8\xce\xe6\x9e'>\xcc=\x89\xe3'V\xc2\
-%\xc7\xc9\x1b.\x00!\xe4\xda/\xa7\x9b\x14\x9d\xeb\xd2\
-~\xfd\xcb\x1e\xde\xde\xf5\x86Wn\xff\xe4g\x7f\x91d\
-\xb0\x8e>\x00\x02\x9ar\xe7\xa9\xed\x86.\x02\xae\xe8\xbb\
-\x02\xae\xdc\xf9\x5c\xe3<}\xabt\xf8\xfe\x0b\x9d\x13\x8e\
-\x83s\x03|\x9f\x94\xe4\x8b\xd4\x9c\xcb\x90Dp\x14\xb7\
-8\x10\x0c\xfd\x1f\xb9c3\xdf\xe6\x88\x8c\x89\xa54\x87\
-\x89{#\x88\x07W-\x9a\xe82\xae\x961\xbe@3\
-\xae\xa3k\x00@\xc2\xa7\xf6\x98K\xbc\xe3a\x1fu\xcb\
-l\xef \xe0\x8f\x00{\x8cU\x0a\x89\x1e\x5c\xbc\x97\x07\
-\x05n9\xe5c\x17(b\x13W\x8d\x1dO\xcd\xea\x8d\
-\xc8(;\x13\xe3\x0b^.\xcd\x05\x80'\x8a\x99t\xd2\
-d\x0a3\xb1byR3\xf9\x96\xa8\xed\x84\x98:I\
-\xd1i\x9fI\xcb/Z\xe1\x00\x00@\x00IDAT\
-\x17NS\xc1T\xa0\x97d!WH\x1a\xbb$\xdfR\
-hCO\xc6\x98\x9c\xcd\x93\x04sr\x82%\x15\xdb\xa3\
-\x1aK8\xa6\x8ev8\xbbnc\xc2~\xb0p\xe3\xc4\
-\xb5\xad\xbdi\x01\x0a\x0e\xc1\x9a\xa3\xb6\xc8\x86d?\xe9\
-\x7f|'\xf1\xc7=x\xe8&\xc2\xd8\xab\x0d\xce\xecM\
-9\xf9\xa4\x07:\x0b\x1f\xf1\x11\x07e\x8fG\x04\x9f\x90\
-\xf7\x9f\xf1\xc3\xd4\xea\xc3\xc2\xc8\x9d?\xcb\xa1\x8dX\xd8\
-\xc6\xc8'\xb4\xe7\x83\xb9q\x00\xf6\xa3\xa1\xcb\x7fD\xd3\
-]=\xba\xee\x91\xec\xf0\xebO\xde\xa3\xed\xd5\xf3\xfa\xf6\
-\xc6\x17=w\xfb\xda'\x1e\xde\xbe\xe6\xb5/\xda\x9es\
-\xd7m\xfes-\xeb\xc40>\xf1'}\x7fXK\xeb\
-iF\x88\xbe\x09Gz|Y\x0b\xd7\x00\x84\xe0\xcf\x1d\
-L\x07\x1d6\xb6`QT3&4\x9f\x7f\xcf\x9d\xdb\
-7\xbf\xed\xb1\xed\x9b\xdf\xfer\xbdE\xf0\xf1\xed\x7f\xf8\
-\x99\x0fn\xff\xd3\x07~}\xfb\xd8\xa7\xf5d\x80\xb7\x06\
-\xf4\xe3\xf1\xf3\x91\x0b\x8d\x1b\xdb=W\xafl\xdf\xf1\xe5\
-\xaf\x06\xc9\x18!\x02NLyB!;\xc6\x8d\xbb~\
-\xe7\x9a\x90\x18K\x95\xb6[\x97\xdf\xba|+\xcfa\xe5\
-\xa1G\x9b\xb2\xd2\xa3z\x86\x8f^cX1V\xdd\xcb\
-B\xaf\xe3G\x9f\xda>\xed_\xf9\xeb\x18\x92*d\xb7\
-\xe7O\xb3\x9a6\x89\x04N\x1e\xff\x93\xab\xe4\x9a\xff\x0d\
-\xa5h\xda\xfa\xe5\xf4\x90\xda<%\xca\x14o\xdf\xf1\xde\
-\xb7o\xff\xe4\x03\xbf0\xf9(&\xfa\xfe\xe4,\x89\xab\
-\xe7\x5c\xfaL\xc0\x95\xfb\x1e\xdan}\xce\x83j\xe3D\
-r.2U\xef\x9f\xb7\x996\xf8\xbe\xc0&B\x12]\
-1\xf8)\x80\xe5\x04\x8dSa\xb4\x13j\xd1t_$\
-s\xedL\x85\x92\xb9~\x9c\x0bC[\xf9\x90\xa0 \xd6\
-\xe8.\xeb\x0f*\xc6\x9a\xfcc\x1c=\x96\x93\x8b\xd8\xb1\
-\xfe\x18\xa0\xbc\xe2\xc0V\xa9\xdf\xd6\xb8ZK\xda\x0e`\
-\xd8\x13+\xe3\x8ew\xe1\x87\x84\x80\xae\xee\xb4\xf1_\xd6\
- \xd8\x17z\x13\xcb\xb0/|ui.\x00\x98\x09\xcf\
-\xdb$\x8d\x93\xcc\xb3\x1b\x01\x09K\xc9\xd1d\xe6X\xfa\
-\x9e\x7f\xb12\xc9\x91\xad4\x9c\xda\xed\xb92\xbc&!\
-\x1a;-\xa5\xd2Mn\xdb\xdb\x97\xa8\x89\x11^\xfc\x04\
-\xfd<z$\x13\xa3b%\x92\x9c!\xe6\x01%o\x0e\
-\xf0,\x1d\xdd\xc6k\x1c\xa9q\xf3\x98\x05\x00\x18\x8f\xd8\
-\x1e\x0f-\xc4\x00g\xfc\x80\xc5\x12\xac\x94\xc8Q\x09\x87\
-\x0d61!\x17\x82!%\xf3b\x15\xfbl\xfa`k\
-\xf1\xd1\xee\xeax\xa5\xc8\x05\x05\xf7\xfe^\xd3\x80\xe3\x03\
-s\x0dxb\xe3\xfd\x7f\xfa[\x0cb\xce\x07\xec\x18c\
-Y\xcb\xff\x97\xbf\xfc\xf9\xdb\xf7|\xc5+\xb67\xbf\xf8\
-~oT\x04!+\xcb\xe8\x07\xbf\x14\x5c\x10\xeb\x8d|\
-<_-a\xc9\x1f\xafk\xbc\xad\xa0\xe2ol\xb3o\
-t\xb1\xc5J\xb4*\xd8\xb4\x08\x89\x81\xe2\xfb\x07\x806\
-/j\xdb\xcb_p\xef\xf6\x83\xefy\xe3\xf6\xfd\xef~\
-\xc3\xf6\x7f\xfd\xfc\x87\xb6\xff\xf2\x1f\xff\xdc\xf6\xf3\xbf\xf5\
-{\xb2g\xe1\x11\x22@z\xef\xff\x1b\xde\xf1\x9a\xed\xde\
-\xbb\xef\xf0\x1c\xb0\x01\xf0\xde\xb0\xef\xdc\x86\x06\x97\x82O\
-\xf8\xc0\xefw\xff\xa2;\xfe\xd1\x89\xf6\xca\x83^\xf3\x09\
-\xbdU\x8e\xec\xbcR\xbb\xcao\xb6\xf1W^\xcc\xb6\x8b\
-Y~\xdb\x7f\xd2\xf5\xa9\xbf\xd3x\xea\xbf\xfdk\x9b\xfa\
-T\xb7X7\xe3\xd7\x96\xf9hA\x17;\xe7\x82\xc7v\
-\xda\xd0\xf0U[G\x19\xe3\x8bM&]\xf6y\x0f\x9f\
-\x0bR5e\xcd\xe7\x03za\xfb\xdaG_\xb4=\xf9\
-\xf8\xa3\xdb?\xfd\xe7\xbf\xa6|\x03\x9bs\x85\x8d\x1b\xec\
-\xe4\xc6\xd3\x1f\xfb-}PU\x1fB}\xdeC\x83\x0f\
-\x8a\xce4\xce\x19~\x1c\xcb\xcc\xbd\xcf%\x9d\x7fL\xbd\
-\x0f\xe9;z\x14\x9f\xf3\xcew\x9f5\xb1\xb7\x0c\xach\
-\xc8P?\x00@%\x86\xde\xd5\xa7\xab\x91\xad\xe3\x81z\
-\xecc\xc4\xc5\x09%\xf6\xc5n,\x16%\x16+IK\
-\xc0\xbb\xfd\xd8Y\xa4C\xfc\xa4u3ZZc\xef\x8e\
-k\xec\x12#V\x99\x13(\xb4\xd0\x93'\xbb<h\xb1\
-co\xf3cLcu\xb1\x8f\x97\xe6\x02 S{L\
-b\xd2T\x93\xc8\xa2K\x02q\xc60\xc5\xa3H\x12'\
-a3\x81\xa5[\xe7\x04\x8b\xddn/!\xe6\x94\x1d\xdf\
-\x8a\xe3W\xb4u\xa5\xd7\x85\xc6'\xbe\xf5m&9\x8b\
-\x86\xd3,\xba\x8e\xeb\xc4^\xbc\xdd\xde\x98\xb2@\xcf\xfe\
-\x13A6\x14\xf8\xc5\xf5\x1aaL6\xad\xdd\x9e\xfe\xeb\
-g\xb7\x9f\x0ep\x0e@\xb2\x1d\xc7\xfb\xd2'\xf4\xe1J\
-!'\xcb\xd8\x0fO\x95\xfd\xb2P\xb1qQ\xe8w\xee\
-0$c\xf3w\xdc\xd8\xb1\x5cq\xc3\x83C\xe9\xbaf\
-\x11d\xc1\xd3\x02\xe8\xf8\xb0\xe1\x0e_L\x8fO\xd4\xf8\
-H\x94\x0b\x0b\xad\xec\xba\x88\xe6\x83S\xd7\xb7\xaf|\xc5\
-\x03\xdb\xf7\xfd\xa5Wn\xafy\xe8\xb9\xee\x9f\x87h\xfa\
-\xea\xbfF 4\xb9\xf5\x82KghN\x9c\xbc_\x9a\
-\xbe\xc3\xd3\xa2\x89\xae\x0a\x15\xb1\xa1\x9d\xfe\x8b\xa7\xb6\x1f\
-\xcf\xbbO\xb4u\x81\xc1\xb5J\x15\xc7\xce\xfe\xc7\xe8\xaa\
-\xbe\xfa\xf5/\xbc\xe6\x91\xed\xcb\x1f\x7fd\xfb_>\xf0\
-\xc1\xed\xa7\xfe\xe7\x9f\xd9~\xe3\xa3\x9f\x02u\xbb\xfd6\
-\xdd\xfd\xbf\xeb5\xf1I:\xf8\xaa\x0a\x5c;\xd27\xc1\
-e\xbc\xfd\x9e\xaeX\xfa\xf5\xe6\xaf\xca\xf1\xa3\xb7>\x9a\
-\xdf\xf3\x13\x85\xa5\xec9\x00\xee\x94\xf2h\xda\x9f\xea\xd5\
-\x1e\x9a\xb2\xf2js\xca\xb3\xe2\x05<\xb4\xdf\x0d\xbd}\
-n\x9b\xba}.\xaf\xed\x8e\xc1jS<\xf34~k\
-\xbbv\xcc\x00\xe7\x07y\xe4\x7f\xff\xaca\xe6\xaf\x01\xd8\
-\xf0{!\x19{\xe6\x9bs\x16\x83+\xdbw\xbd\xef\x9d\
-\xdb?\xfd\x17\xba\xd3\xd7\xb9\x82\xe4\x86\xe6\x92\x8ba\xfe\
-P\x14\x1d\xf2\xfc\xda'?\xbc\xdd\xa2o\x0f\xbc\xfa\xc0\
-Kt\x8a\x91L\x9c+y\xa3\xcd\xeb\x848\x14.@\
-}\x99A5\xe7]\xcf\x01\xdb(\x11s\xe9L\x04\xb3\
-nP\x13\xa3s\x885S\xd8\x80\xe9\x1c\x08\x9f\x86\x8a\
-u\xf0\x91\xfe\xef\xfd\x96\xdd\x99\xf5G\xaa\xb6\x97>\xf1\
-\x0f,\x08\xa6\x8d\x09\xad\x97\xed\xd0\x1bLtBC\x11\
-\xd71\xd6j8\xc6\xf0\xce\xd2\xc6\x0c\xa00\x8f\x1b\x96\
-#.#\x1f\xf6\x1a\x9b=~\x8f\x93\xf0\x1a\x11\xfdD\
-\xfd\x92\x94Ks\x01\xd0I9\x12\xb7\x13E2\x1c\x89\
-\xb3'\x9cx\xb5\xd9\x13D\x93\xba\xeb\x9a\xb6\xe1\x91\x0c\
-\x0b\x8f\xf9\xb7\xbd\x8c\x9d\xc80HB*dC\xc36\
-\x8f\xb6\xc0\x9bHp\x1d\x0biNRM`{\xe2a\
-\x17C\xd7N\xec\x9d\x07jpq\xe6D\xc6\x0b8\xfa\
-q{h\x98\xf5\x19\x7f\xb1\xad\xa6\xad\xed\x1f\x7f\x22T\
-\x1c\x8f\xea\xea7&?\xba\x94\x1b\xc2:\xfa\x97\xf8\xfd\
-\xb64|\xbd\xf2\xed\xbdl\xb0\xc2\xd3\xaf\xeb\xc1c\xf1\
-J_\xe1\xa7\xe8\xbe\xc7<\xdf\xe5\xe3\x94?\xcb\xa3\xf2\
-\xc5\xc0\xcc\x9f/*\xb4\xf0\x89\xf7\xd8\xfdwn\xff\xfa\
-\xfb^\xb7\xbdC\x17\x00\x14\xc6&A\xf39\x86,\x0c\
-\xbdk\xf6hH\xdc\xbe\x84H\x5c\xd6\x91\x1f\xe2\xa1?\
-)\x91\xa1O\x0c-\x90~|+&\x0b)_\x0f\xcf\
-FM\x87\xb1t\xbc(\xab\x9d\x19\xa0\x01\xf6\xb6\xbd\xe7\
-\x89\x97n_\xf9\xfa\x97l?\xfd\x7f\xfe\x7f\xdb\x7f\xf5\
-\xbf~`\xfb\x9a7\xbdl{\xe09\xfa\x00\x97|\x82\
-\xcb\xab}\xe0\xa2\xc2\xef+K\xe6\x88|\x10\xbe\x06\xb8\
-\xf3\xf0\x85l\xfe\xc6\xa6_\x04\xb0\x14\xfb9\xa7}\xca\
-\xaf]q\x16\x933d\xed\xaa\x7fF\xf8g\xd88\x8d\
-\xa7q~!!U\xb7\x18m\xaf\xb6\xc8<Obv\
->*g\xc4\xb9HE\x07\x19\x1b\xffu?a\xca\x99\
-\xe8\x0be\xcd+\x0f\x01\xa4`=N\xbd\xcc\xd4\xd8\x0d\
-\xd8\x13\xafx\xf1\xf6\xc6\xc7\x1e\xde>\xf0K\xbf\xe9$\
-#\xb7d\xe0\x1c\xcb\x11;\xf9\xf9\xac\xfe\x91\xd0\x87\x7f\
-y\xbb\xe5\xc1\x97J\xe36\xe5\xe3\x5cY\xb2\x99\x89\xe3\
-\xcb\x07\xdb\x09X<\x8a\x9a\x22\x85gHx\xe4\xa3\xb0\
-\x1c\xfb\x1a\x8f$\xe5E-\xf6>VVL\xce\x8f\xe6\
-5\x0eB\x1f\xbc1\x92\xc8\xcbM\xdc\xcb\xab\x0aq\xb8\
-Z\xec\x89I\x81\xc6\xbf\xa2#h\x14UL\x8a\x96\x8b\
-\x9dv\x9f\x8c\x83]T\xc3\x03s\xec1p+r\xaf\
-\x97xv\xac\x8c\x96t\x8d!9\xb4\x8f\xa9\xa1/S\
-\xb94\x17\x00$\x083\xe5\x09\xca\xfcz\x9e\x8e\xe4\xc8\
-\xb45\x91\x9a\x90M\x04\xdbK\xe5t\x82\x0d\xe5\x84\xc1\
-\xfeHn\xdf5\x8e66\xf1O\x8a\xb9!\xd5 \xed\
-\xc95\xc0\xf1\x1f}\xb3\xa4\xe7\xab\xf4\xf1A\xfa\x91t\
-\x8d$\xfe\xed\xd9\x98\x89\xfb\x88\x03?9\x87\xd1\x1c\xab\
-\xc3|\x90\x92\xbc\xc8\xf7\xf1\x10\x91\x93\xc9\xb0\x89\x1f{\
-\xc7-\x80\xc6\x8f^q\x01\x98B\x1clz\x94\xd6>\
-\xa1a\xec\x84\xc8\x89\x80:\x1b<\xbd\x13\xbeV\xbf|\
-V!q\xf7\xf1?O\x02\xd2\x7f*-[\xfaE\x83\
-O\xe7\xf3\xa9\xf9\xef\xfd\x8a\x97o\xdf\xf5\x17^\xae\x0f\
-\xef1\x06\xe8\x08W\x01\xf0\x22&\xbe\x80\xe5V\xc5\x9e\
-\xfb \xc9Q\x01\x01]\xe2UM\xd7\xb0\xe5\xb1kJ\
-\xfa\x08\xed.\xa1KQ\xc3\xe3\xa1\xb6\x1f\xa9b\xa7\xb8\
-\xb9\xc9\xe2\xa1\x84\xed\x05\xc6]]L\x82\xe3\xc7\xe6\x98\
-\x8b\xc9Z\x0b\xe6\x1d\xda\xc0\xff\xc6\xbb^\xbf}\xc3\xdb\
-^\xa5\x18\xb9\xe0\x09\x9f\xba\x05;\xfe\xfb[7\x14\x8b\
-FN\xdfxQ\xac\xa7\x00<\x07\x5cy\x9d\x94\xea\x95\
-M\xbbs\x0d\xaft\xf5\xd6v\xe9\xda\x9e\xb6ks3\
-y\xf9_lu\xfbq\x1a\xff\xb3\xc5y\xaa[\x8c\xd5\
-\x06\x9d\xf3\xf8\xe8\x90+\xbe\xcb\xd7\xe6\x8f\x0e\xba\x5c\xa0\
-\xe6\xa2@\x97\xc5~\xd2#ErJ|\x9eVr\x9e\
-\xb0\x01;\xa1\xc8iq\xbe\xe3=\xef\xd8\xfe\xce\x7f\xf1\
-\xd3\xe2\x89\xcf\xf9@\xbe\x8b\xe8S\x00\xb4\xe0\xdf\xd0\xff\
-\x0e\xb8\xf1\xa1_\xdcn}\xc1\xcb\xb6\xa7\xf5\x17\x02\xc6\
-\x98s\x11\x0b\xec\xb98\xcf\xb9\x01r\xf0I1\xf7\x03\
-\x1d\xeb'\xcf\x9c\xa1\x90\xb0UQ\xda\xdf\xe8\xc31\xf2\
-\xd8\xd3^\x8aO\x80\xb4w{5\xa1}\x1eM\xf2\xbb\
-\xad\xd8\xa6)\xe1(aj\x9aXS\xe2\x7f\xe2\x80%\
-\xc1n\x7fhE`\x13\x01x\x5c\xdd\xd8\xe3\xdc\xe3\xc7\
-\x1e\x15\xfd\xc4\x87\x1b\x01\x8d\x89\x8f\x91\x8d\xdf=\xd0E\
-\xe1\x82\x92\x97\xe6\x02\xa0\x13\xc4<x~:\xa9\xfbd\
-M\x22\xd0&\xd9\x98n\x93$\x9eZ\x12\xbb\x98Nc\
-O\x92\x11\x91&\xf5\x93\xb4o\xe2\xa8U\x81t\xb3 \
-\xb0`O,\xd8\x03)'\xd6\x83\x0fo\xf7?\xed\xe1\
-\xf5=\xb2\xf8\x97\x92\xf5T5\xee=\x0e\x9d\xc0\xe2\xf1\
-\x18\xcf\x8b\x00\xf6*\x8d%\x8f\xb6\xed)\x89O\xdf\xd2\
-\x9c\x18\x19\x0a\xd9{A9\x0c\x1d\xbf\xf8\x84,\x91u\
-\xd5$\x8c\xd8{\xc1R\xc3\x85>iIAY\x85\x0d\
-/[R\xc6\xca\x7fj\xc4\xe0r\xa7\xe3\x05\x0d\x1c\xc0\
-0`\x8c\xa2g\xec\xb9\xe3\x17\xd3|l\xc0\xe3B\xe0\
-\xd5\x0f\xde\xb3\xfd\xbd\xbf\xfe&\xfd\xed\xfe=b\x13\xb3\
-6Kva\xcb\xe3\x1cR\xd7\x05\xa0\x9a\x9f1\xe1b\
-\x00<\x09\x97\xc2\xbe\x09\x0e\x85\xfe\xd3O\xc7B_\x14\
-\x1b\x92\xabR\xe2\xd3\xda\x1e#\x06\xae\xd8\xd8\xd0\xd4\x81\
-\x10b\x8b\xdf\xf1mg\xc1v7\xc5o\xe1\xc3\x89W\
-\xb6\xdb\x1d\xf6>\x17#\xf4\xc6\xd0\xab\x12\xcc\xe5\xa3%\
-9%\x96\x8c\x88\x87R^uZ\x9f\xf2O\xdb\xd5k\
-\x9d~\xc7\xd9J\x9f\xe7\xab\xbek{\x19\xea\x8e\xcfi\
-\xdf\xce\xe3wL\xd6q\x82\xaem\xe5~\x12\xe5\x8bT\
-\xe5\xaa\xe6\x94\xc7\xfe\xc8\x98c>\x80\x9a'\x04\x5cD\
-:;\xb9\x06\x90\x5c/j\x0dj.\x02\xd4\x10\xf6;\
-^\xf7\xd8\xf6\xf2\x87\x1f\xdc~\xf17?b%\xa6\xdf\
-\xdf\xbd!\xa3\xc48\xab\x11|\xbd\x15p\xfdw~y\
-\xbb\xf2\xc0\xa3\xdb\x95\xdb\xf5_%\x95\xcf\xfe\xd3@\xae\
-\x10J\xcb\x89-\x02\xaf\x04V\x9b\x13\xcd)0k\x04\
-2\xfd\x04\x7fh\xf0\x09R\x01XUqf\x1c\xc4\x97\
-\xcc\x05\x98\xa1-\x1b\xcd\xe8M\x9cR\xdcq\xc1\x12&\
-\xb0\xe2\x06\x02\x00\xff\x223\xcb\xe7\x96\xd7?\xda\x92U\
-}\xc7\xf5B\x11\x88\xac\x9f\xcc\xc9\xaa\x07M\xdc\x01\x18\
-\xd8\xc4\x1f\xb38\x82\x1ea\xb1\x11\x84F&!\xc0\x97\
-\xa4d\xad\xbe\x04\x9d!Y)L\x14/\xe6\x99\xc92\
-\xbd\xcc\x97\xe5(z\x1e'\x91\xb1\x81\xa7\xb2\xcbE\x93\
-\x07\xbbd&\x9d\xb61G\x17\x1dJ\xc4\x91U\x1e\xff\
-\x96Z\xa7z\xc6<\xe3\xff\xf0\x13\xff\x89\xc6\xf6D6\
-\xbe\x83\x84\x8f\xc0\xa1\x1b\xffkL\xa8/\xf6\xe84H\
-\x99\x19\x7f\xe4g\xec'\xb8].\x1b6I#\xe9\xb0\
-\xbf=\xc0\xa6\x1c\xaek\xbf-\x80\x920y\x9c\xc8\xc3\
-F0H,6\x7f?|\xd4\x06\xbe\xf7\x85\x95N\x18\
-\x9c\x8c\xf5\xef\xc7\xef\xde\xfc\xb1\xd5\x13\x80\xb9\x10\xb0o\
-}\xf3\xd9\xfb\xdf\xf4\xf0\xf6S\xdf\xfb\xce\xedQ}y\
-\x0f\x9d\xf1#Ta\xe0\x9b\x0b\x81}\x9e\xf71%\x0e\
-b\xa0\xe3F\xc9d\xaa\xc5X\xe4\x82I\xb5\x1a\xd6 \
-\xa6\x16\x8f\x0d\xe3\x0aB\xf4\xd1\x01\x87/\x1e\xa2\x9f\xd0\
-\xc4\xec\x0fk\xd17krQ\xc2\x05\x08\xe8\xe9?v\
-}1\x1e\xa5\x91C\xf7.\xc8~\xd4\xe6J\x22|\xc6\
-!O\x02\x18\xa3\xb5\xf8\xa2\x07U\x9c\xa9\x9c\xcaO\xdb\
-V\x9a\x03\xe3\xd4\xb1B\x0f\x8c\x15\xa7c\x89z\xf5N\
-m\x8aW~\xdb\x17\xa5~\xb6\xb8\x9fMv\xda?t\
-\x19C\xea\x8ecy;_2\x97\x99\xc3\xe4+s\x90\
-\xdc\xf3\xb93\xb9@N\x91[\xb1`n\x92\x0b\x1c\xc1\
-{\xdf\xdb_\xabI\x91\x5c\xb9\xea\xcf\xb7\xb0\xf9\x0b\xbc\
-\xfad\xab\xcf?\xd2\xc5\xffM\xf0W\xf4\xed\x81\x1f\xd3\
-\xb9F\x04{\x86\x09KyU?bs\x86Z\x83\x18\
-\xe7\x85?\x80\xdb\x1f\xf3\xad\x85\x0a\x9eR\xa8\xed\x1f\xd3\
-r-\x8fFc\x1fuW\xb6\x07_\x05:C$k\
-\xb3\x00\x1a\xda\xfe\xdd\x04\x1c\xed8C>\xb4\xedGd\
-\x1e\xfc\xca\x15\x99\xfd[n\x00(\x95\xc1\x87\x92n\xc6\
-/t\xc4\xc8\xa3\xbf\xf7\x1f\xdc\x16\xe3\xb7q\xf1\xeb\xac\
-\x22\x17\xbf\x1f\xfbD2\xa1I\xca$\x03\x93\xc8\xa4g\
-\xa2\xe7\xa4\x817\x93L\xd7I\x9e\xc8c[]d$\
-\x91\xed\x8b#\xd8b\x22G\xe3H\xa4h\x8f\xaa}\x94\
-\xdek,h4\xa7L\xde\xc4\xff\x92\xa0\x89\x09o\xd8\
-\xe37\x052\xfe\xc3D\x16\xfc\xf4\xdf\x9b%8\xf6\xf9\
-\xcc\xfes\xc3\xcbP\xd8\x1a[\xe1\xf5E\x8c\xddDs\
-:E\xd6\x8d3qH\x1b\x00\xe1`GBq\x17\xee\
-[w\xbd\x0f\xc9\x02\xe3$c\xf1\xb2\x1fb\x91\x9c1\
-\xa7\x8d-\x9b(\x0d\xd1\xfe\x8b\x00\xd5|K\xde\x1d\xb7\
-\xdc\xd8~\xfc\x9b\x9e\xd8~\xf4\xeb\xdf\xb0\xddqU\x91\
-\xb0(J\x86\xb9\xd75\xc3\x04\xcf\x8b)X*\x89C\
-G\xfd&\xfe\xc4E\x1c\x99\xa1\xb9\xc3\x226\x05\xc3\x02\
-\xde\x93\x1e{\xee\xca2^l\xee\xb2\xe1\xa0\xe2~C\
-\xe3F5|\xee\xfe\xd15\x8e\xd9\x89\xc1}\xa6\x8f\xe9\
-\xb4\xf5\xa2\x13\xdd<\x9d\xa1\xebs1\x14\xc8`\xcd\xe6\
-.\x96\xdb\xd4\xc4\xe7yn0\x8b\x0cy\x0b\xb1\xb4/\
-\xeeC\x05\xaa\xcb/\xab\xed\xea\x15\xbf\xed\xea\xfdy\xaf\
-\x19\x8fuLJ\xb7\xee\xf80~\x1dSx\xa5\xfbV\
-\x80\xc7w\xf8\xa4\x914\x927\xce#|\xc0i\x9e\xe9\
-i\x01x\xca\x1f\xd2\xfa/\xbf\xe5\xb5\xd6U\xcbJ\xd4\
-\xdc\xf4\xc6\x079\xd4\xcc\xcey\xc59u\xfdw\x7f}\
-\xdb>\xf9\xdb\xd6QV\xf8\xe2\xc1\xb5\xb3\x9a\xdc\x12\x16\
-\x18<\x1c \x1c\x1f\xa6\xc2\xa9^\xc3:S\x1f<\xe9\
-\xa8\xb4_n\xe8\x90H\x90\x91\xff\xd2\x06\xc7F\xc1\xcb\
-\xb8\x1d\xd8\xcf\xb4\xb7)\xe6\x8b]p\xf0\xb1c\xd2\x90\
-7\xc6\x221\xad\xc7\xf1o\x1d\xb4\x8e\x92X\x0e\xde3\
-\xfc\xa3\xdc\xfe\x9b\xc6'\xbc`\xd4\xfe@\xbc\xb8T\xd6\
-\xa9\x8b\x1b\xff\x12y\x17>\x12\x22\xc5)\xc0D\xb6]\
-Z\xf5:\xe9\xfb\xa93rdN\xac\xd1;\xec\xcdv\
-r\xa0\xe2\xa4\x12\xe1Z\x07\x16u\x1a\xb1'_\xe2\x07\
-\x8aB\xdb4\xb8\xfa9c\xbf\xcb\xa5\x11u\xe3\x0c\x89\
-\xf9\x8e\x8b\x82\xe3\x07\x00\xffd\xe4\xea\x17\x00d\x0b\x0f\
-\xbf\xfcP\xbc\xd7\x8af\xf3\x82EE\xd9\xe3n\x00\xf0\
-\xf4\xd3\x84\xf7fe\xe5\x18yC\xac\xaf\xc5\xde\x98\xec\
-\xe4\xda\xdc\xec@G\xbb\x22V\x84\x8c\x93*=\x18U\
-,\xdc\xc9\x8b\x8f\x0c,\xbd\xf8\x92\x9e\xfb\xf4\xb5\xbc\xff\
-\xe0o>\xb9\xfd\x95'\x1eq\xbc\xf4\x11\x7f\x0e\xa6\xb4\
-\xf10\x89\x1f|\xd0'Z\xa8\xd2\x1f\xc7O\x14\x82\xde\
-;\x22\x99\xb1\xccG\x90\xf7jy\xbf\x16\xfa\xba\xbe\xbe\
-\x15\x03|\x06\x93ZH\x0c\x9c\x0a\xfb\xb3C\x11\xed\xda\
-\xba\xe8\xa7\xed\x7f\x0b\xab@\xf6\x0d\x1f=~\x00\x13\x0e\
-\xa5w\xdb\xbe\xd3\x93\x80\xb8\xd1\xc7\xb7\x1f\x13\xebS\x86\
-\xbd0\xa1\x1f\xeb]\xa6\xe7\xdb(\xf83\xa8\xfb:,\
-\xf3\xe0w>\xe1W\x0f\xba\xbe\x91\xe3\x0bY\xe5\x1e3\
-\xf1\xa9\x8bQ\xbaz\xd5\x05\xeb\xa2\x96?\xce>t\xcc\
-\xc0<\x9d'.&o\xd5WOS\x98_t\x9ag\
-\xe4\xd8~N\x89&\xfbx\xdb\x89\xe2\x9c\x9ey@\xe7\
-~}{\xe5\xdb\x1f\x7f\x99&\xd2\xcf\xd8\xf4_3\xc9\
-(6~\x94\x9d\x9d\x93Y\xe4\xa9\xb8\xd8\xea\xe7\x9a\xfe\
-L\xf0\xfaG\x7f\xcdv~\x1a\x87>\x12\x9f\x83\xd2\x9b\
-'\x09\xb9\xd0Hn\x02j\x88\xe32;V\xc2l\xa1\
-\xcf\xd2\xd2+y\x02]^j\x870\x87X\x99o\x13\
-\xfc\x0f\x96*z\xc2o\xe5\xc4Mq]=\xb7\xcd6\
-\xe6\xc1\x96\xff\x9d\xcd\x99?8\xad\x0f\xc5\xc5\xe7\xf8\x9f\
-X\xe8\xeb\x19\xff\xd35G\x91P\x80M<!\xdc\xbe\
-\x0c\x87d\xdbe\xe8\x09\x89\xa8~\x904M\x88\x99W\
-\xf7\xce\xc9T\x01\x9c\xa1\xf7D\xac\xbd\x12\xa6j$\x86\
-\x93\x03\xdc%\x91\x0e\x85I\x0a\x0c\x94(\xaej\x8f\xad\
-\xddp<\xb17\xdfl\xcc\xf6\x12\xfb\xc3'\x8bE\xac\
-O\xecW~\xad\xc7/q\xd6\x86z\x8d_\xcb\x93d\
-\x91V\xc7\xe32\x18\xf0<~#\xa4Z7\xcab\xc1\
-\xf7K\xc1\xf7\xa4e\x09\x0aO5\xc4\x12\x07\xb4\x1fw\
-\xb3\xa0x\x13U\x14Z\x80\xbcl\xa9\xbd.v\xd7u\
-\xe7\xff\x90\xde'\xff\x87\xdf\xfd\x8e\xed-\x8f>`\x1d\
-\xbc]\xe1\xbbO\x84\x03V/,xz!\x86\xee\xd8\
-g\x81\x9d\x9dy\xd8\x8a#\x91fa\x86F\x1b\x7f\x13\
-\x8f\xe4,\xc6\x8c\x09\xef\xd1\xfa}Z\xd1\xd9 q\xc3\
-\xe6x\x8ca\xd0\x0c\xb3\x1f\xc6\x85\xac2&\xde\xc8\xe5\
-\x03O\xd0\xc8\x1d\x8f\xfa\xe91\x1a\x9e\xfbb=t\x90\
-\xd05\xc6\x0e\xa4\x9b\x17.\x10b\x1b\x9d\xbe%`\x0c\
-\xc6f\xca\xaaS\x1e\xf5\xca\xaf\xaf\xfam{\xd5\xff\x12\
-}\xfe\x08\x9c\x8e\x15\xed\xf2\x18\xcfu\x9cA\xc8g\x00\
-\x92#\x12Z7\x17\x04\xc3S\x060\xf5\x99~\xcd#\
-:\xe2aw\x0b\x17\x10\x12\xbc\xe7\xc9\xd7\xe6n]z\
-\x9c3h\xe4.\x9e3;\xfa\xc4@\x8e'\x9el\x88\
-7>\xf9\xd1\xed\xdao\x7fP\xdai\x83\x9d\x22M\xf2\
-\xd2\xe7\xa4\x5c\x98\xcdy\x99\x1cl\x8d\xaesd\xac\xa8\
-\xa2A?\xcb\xc4\xbf\x8a\xe3\x0e\xcf}\x81\xa9\xd7\x19{\
-\xb5\xad\x8b\xba~\xdc\x98\xea\x8c\xbda\xa2\xe9>\x056\
-\xdc\x01X\xc7\xd9\xe3\x8f\xff\x91\xb9=\x8d\x9b\xfb\x1f\xd0\
-\xdd\xff\x11[cD\xe3\x8c\xfd\x98\x5c\x86\xea\xd2\x5c\x00\
-4\x11:i$Lx\xa9I\xe6$t\xdb3\xa9$\
-\x88\x92\xc6\x89,\xd2\xf6f\x8d\xbd\x12\xa3\x93\xef\x5cZ\
-\xda\xe1\x8f=\x89<\x1eH\x0cd\xc6t\x1c\xc15\xf6\
-\xc8\xaac\xde`\xc2k\xf2\xc6\xde\x82\xc5\xff\xf8\x12p\
-\xec&\xd9\xf1e\xff\x13\xff\xf80od\xed\xbd\x22C\
-\xea\x05b\x8f\x1f\xeb\x04\xbboZ\xa8\x99\xc5A//\
-0r\xeaE\x82\xda\xa1H\xc6.\xc7b\x84\x0e|w\
-\x02\x17,P\xf2#>?\xfe\x87>2\xe2=Ld\
-\xe5\xf3\xa5>`\xe6?\xe4]\xdb\x1e\xd5?\xe7\xf9\xcf\
-\xbf\xf7\x1d\xfa\x17\xb9\xcf\xb5\x1dw(\x92\xea?\xf3\xe5\
-}q\xe8,n\xe9\x91\xd1\x89Q\xe5\xcc\x9d\xbb\x03I\
-<A\x08\x8d\xad/j&\xd6\x8c\xb3\x16Y\x05\x9f\xbb\
-q\x90\x82\xc7\xdd[[\xc0\xed}\x83V\xa3wt\xbb\
-\xcc\xdaQ,\xcf\xb5\xb0\xfd\xf6\x05\xfdGG\x07\xd7\xc4\
-\xad\x977\xf1\xe9\x83\xc5\xd2[7vb\xa6\xed1\x9e\
-\x98\xd0\xa3p\xb1\xd2\xd2qi\x9bz\xe5\x95.\xd6\xaa\
-\x07\x0d~u\xcek\x9f\xea_\xd6\xf6:\x06\x9f\xaf\x8f\
-\x8c\xd9Zj\x9b\xbc\xca\xdcv\xce\xd7\xf1\xe5\xae\x9e<\
-s\x0e\x89rN\xaa\xbe\xc1\xd3'\x15p\x98\xdb|\x0d\
-\xb1\xe6^\xe7\xc1\x97?\xf1\xca\xed\x9e;ow\xce\xf0\
-\xef\xb4\xc9\x1d\xcd\x18Dj\xd2\x09\xdb\xf2\xfc\xef\xb5\xd5\
-\x92\xca\xf5\xcf\xea\x9fX\xfd\xf6/\xe9\xbf\x5c~\xce\xda\
-(\xf2D\xa0y\xa8Sr\x8a9\xce\x85\xf4M\xd8\xce\
-\x0b\x80\xc7\x17}\x16\xe9\xca\xac\xe8\x04\xcc\x01\x1c\xf6\xf8\
-\xc1\x1e!\xf6\xa2\x83\x8b\xff\xe1/\xbcF\x81\xec\x8c\xff\
-\x0aT\xef\xf6\xe0\x9e`&\x86\xc5\xcf`\x13\xe6\xe1?\
-`\x89\x0b\xc0\xc4\x12\xee\x1c\xf7\x98\x12\x87\xed\x0d\xde\xb8\
-\xceh_\xd8\xc6\xb1z\x5c\xd8.\x9c\x0d\xbcIC\xc2\
-9_]3}\xceD+g2\x9d\xc3\xe1/\x10$\
-\x1eI\x8a\x8e\x93v\xa9\xe1SnnOrX%\xf6\
-\xa3\x988\xc4?\xd7~\x01\xb4\xca\xf8\x97\xad\xcd\xa9\x07\
-\xa7\xf6\x9e\xb4\xca\xc7_\xbc6\x91sb\xc5\xcc#\x01\
-\xf2\xbc\x0e\xbc\xe0\x1e\x00\xb4=~bA\xb3\xa1\x13D\
-\x165\xcc%\x90s\xd8\xc0\xa5\xceX\x11\x93\xc7\x0b}\
-\xfe\xccM\xed\xc6\x99o\xf3\x83\x9fU\x86\x0f1y\xd7\
-g\xf3\x07Jm\x16\xbe\xe7\xdfuu\xfb\x8f\xbe\xf3\xc9\
-\xedE\xfa~|x\x8e\xc5A\xca\x07\x9b\xa8h\x9f\xf0\
-v\x1c\xbb\xd8\xe7b\xc3\x9fwHh:\x12\x8f^:\
-\x8c\xfa\x8e\x09.\x0b\xae\xf1\xa5\xb3n\xa2\xb6\x1b?\x95\
-\xd7\xde2\x0e*\xc5>\x1a\xa2\xe8\x97^\xab\xbe\xe5\xf0\
-\x90\xcd\xa0!w\x9eY\xc88\xc7\xa2\xfeZ#\x86\xe6\
-\xe5~\xab\xdd1Xu\x06\xc6\xd5\xb3\xf1k\x8b\x22t\
-q\x8b\xbd\xe2|\x89~\xe6\x08\x9c7N\xeb\x98\xd6\xe2\
-\x94\xb7\x8f\xb32\xc3\xf3\xae\xf9\xf4\x93'\xe6\x9d\xb9\xed\
-\xc5\xa7\x00\xb8\xe8\xf4y\xe3Tb\xde\xa5\xc2E\xb0j\
-\xfe\xbc\xf5/=\xf1*i\xa9\xadS\x89\xac9\xf2(\
-\xba0'\xd3r\xd1\x0e\x8e\xec|\xc1\xfd\xb9\xcf\xe8I\
-\xc0/\xe8\x1f\x0a}\xda\xc6\xd8\xf3\xf6\x81\x0dL&\xd7\
-\x1c\x93\xd8\xf8\xa6\xb4\x86\xef\xb6\x8f\xf1_\xdba%\x1e\
-\xfa\xe4\x9fp\xa1\xed\xe4<\xfb\x02\x8c\xaf\xe6/\xcd\x8e\
-w\xebs\xfd\xd7~\x02\xb0\x8bS?\x83}\xd8\xab\x1f\
-\xe2\x95=\xa6\xae\xe2\x7f\xfa9\x0a{\xff\xc7\xd7\xd1^\
--/&\xed\x5c\xbb\x98\xa1\x9f\x8d\xda\x93B\xe2i\xd2\
-f\xfeS\xab\xc1\xa4\x9agY&\xd7\x13=mN\x22\
-\xcf\xb5\x94H\xd6h\x90\xb2P\x1c\xf3C\xca4A#\
-sZ\x9bg{i\xc7\xff\xe2c\xf7/\x9e\x84\xbb=\
-\x01M\x1b\xde\xe1?\x98\xf4\xce(: 7=\xd1X\
-\x86\xfd\xb4\x91\xc6\x7f\xeb\xc6\x11\x0d\x1bs\xa2\xa3?@\
-G\x1c\xc1\x8f\x7f6\xa3\xa4\x84\xfb\x01.\x06s\x87\xdf\
-\x13\x11]\x8fH\x8d\xa4\x9c\x0f\xdb\xe5\xce\x9e~YW\
-\xb7\xf6^x\xec\xb4\x8es\xe7\xe3\xf7>\xc1\xd1E\xc0\
-\x0d=\xf6\x7f\xae\xde\xf3\xff\xc9\xbf\xf9\xb6\xed\xc5\xf7\xeb\
-\x93\xfe\x13\xa4\xef\x8e\xe2\xcczG[\x18\xbeeQ\x14\
-\x82\xe5\xcf\x10\xfd\x95\xaa\xa6g\xb9\x19\x0c\xfa\xcc\x9f\xfb\
-9T\xd1\xd4\xc4\xd6\x17r\x8f\xaf\xf4Okd\xdc-\
-\x9f\xde\x8d\x9fn\xd8x4\xbe\xc1\x83G\x161\x86~\
-\x01\xa4b\x9fh\xcaW\xf4}\xb4\xdf\xde\xedU\xcf\x06\
-\xb5\x01D\xa5\xf1\xb91\xed\xd2\x1e\xefi@\xf7\xa2\xa6\
-\xf3\x0c\xef\xd4\x1e\x9dS; jS\xec/\xd5\x9f\x7f\
-\x04\xd6qD\x9b\xf6\xfa\xf2\xc6\xee\xb7\x9b\x0e\xac\xe4\x80\
-\xc6[9\x96\xf3\x81\x1c\x9c\x8bd\x09\x91;\xf72\xfd\
->\xe7\xfe\xf2[_\x9dy\x94\x8c3\x8a\xa7g#\x16\
-?L\xb7E\xe7\x9b\xff 8\xafGY\x7f!\xf09\
-=\x09\xb8\xfe\xe9\x8f\x93\xa187\xae\xbf\x93c\xf2\x92\
-s\x1b\xd4\xe29\x1fh\xa0n\xe6\xd4\xe3\x08\xfd\x90\xd4\
-d~Jj\xa4\xe5,\xf6\xa3\x83\x130m\x8f\xd7\xc9\
-S\xc4\xf5\xdbZ\xc2g\xfa\x174\xe8\x87\x7f\xda\xe2\x88\
-\x11\xbf\xc1\x8fVy\xaa\xdd\x0f\xacV\xff\x8a\x03\xbb\x09\
-\xf7L\xbd\xf3\x86 \xc0KP.\xcd\x05\x80g|&\
-\x8fId\x16]\x8b\xa4\x86E^\xb48Q\xd1\x99\x9f\
-(\x90\xbcM\xc6\xd6\xd8\xf2C9\x00\xe2\x22:\xeb\xc9\
-\xefd\x9e,2\x1f\xdfj?\xc3^\x0c\xeb\x0a\xd5q\
-F\xe1\xf0/W\xc3\xb2w\xe8\xbe\x88\x03\xc4\xdd~\x91\
-\x10\xa5\xf1\xd0\x19\x00\xea!\xc5K\x1f\xe0\xd5\xde\x8f\xbe\
-\xc9\x84\xe1y\xb1\xd0\xd8\x98\x85\xad\x94\xb1/\xde1\x0c\
-|\x80O\x9b\x0dg\x0a\x9b\xbd!R{\xfc\xedJ8\
-\xdc\xbd\x13\x0f\x8b\x1b\xba\xba}\xe1-\x05/|\xfa\x16\
-\xc0;d\xf8\x1f|\xfb[\xb7\xc7\x1f\xbaW2\xca`\
-\xa4\x91\xbb\xffy\xd4\xed\xcf\x128\x10\xbc\xe5\xee\x9d9\
-\xc3\xe6l\x91O\xe9\xc1\xed\x93\x01\xf7c:A\xdfy\
-\xad\xa5m\xf4(\x1e\x1f\xd1\xb5k\x8d\x0c\x9a\x0d\xb4\x17\
-%n/\xba\xc7`\x19\xc9\xfdv\x7f\xbd\xe0\xca~\xb7\
-\x9d8\x15\x0b\x8b=8\xc5_\xe3)m\xa1\x0e\xd5+\
-\xbf5rh^\xd5\xa1\xe6U\x9d\xf2\x8b\xf5\xa5\xfaO\
-g\x04<\xfeJ\xb9\xe6#y\xeb\xfc\x91{f\xdds\
-64\x11q1\x90l\xd0\x19\xa3'd\x9a\xc5\xed\xf5\
-\x8f=\xb2\xddy\xfbUQ\x02b\x9e\xd1[m\xa6\xad\
-Js\xce\xb15\x0d\xbd\xb8X\xd6\x13\xba\xeb\x1f\xfe\x95\
-\xed\xfa'~\x17\xce\xaeG\xa31\x00\x1a\xfb#\x8f\xec\
-\x08@\x11\xc4\xb2\xe7SP\x22!\xefv\x1d\x13\xd3\x0e\
-\xdd#:\xb6\x9f\xdc,\xdf\xfe#t\xce\xc2\xdf\xf3U\
-\xd8-\xbb=r\x98>\x10Ybcl\x88\x11Aj\
-\x94nb?\xb6\xd6\xc0\x8e\xf6\xde\x7f\xfc#Y\xca\x01\
-\xb30/&yy.\x004q\xe4\xc7>W\x22H\
-&\x9f\x22\xe2\xbb\xd61\xc9\x10~t\x99M\x14V^\
-&\xd3\x12@\xb1v}$C\x12\xd5Nl[\x9d\xc3\
-\x7fN\x90\x98\x07\x1b7M&\xf8\xbb.\x0d\xff6\xbe\
-\xfa\xaf\xdf\xa3n2\xef'\x0a\xaaqb\xa3\xe2\xbb!\
-Lp\x8b\x8d\x9eO&\xd5\xb6w\x048\xce+<\xe9\
-\x0f\x88M\xbbi\xd3P\xf1\x9f\xe99\xf0\xc4\x9a\x0f\xf3\
-E\xc6\xdd\x84\x0b\xf8\x10\xf6\xa3;\x0c\xf0y\x8c\xe9\x05\
-\x0dZ$\x7fS\xcf{\x90zo\xffG\xde\xf3\xf8\xf6\
-\xb6\x97\xe9?\x9a\xa9\xe0\x9aG\xa2\xb6\x11\x8ak\xc77\
-8\xf8\x96R64,\x88#e\xed;t?\x13`\
--\xc7\xd2q$\xb4\x19\x0b\x10D\xf3^\xeb\xd5\xabg\
-\xbf\x17\xabw\xc8\xf8\x8a\xbf\xc3~\xc5\xac\x9c\xdaO\x07\
-\x1c/\xfd\xcd\x0b~c\xb6\xae\x8c\x1b38-\xe9s\
-[\xe7\xd7\xc6\x92\xa8\xbamW\xdb\xf8\xf2\x87\x9c\xd7\xa9\
-\xbczk]\xdd\x95W\x9c\x95\xf7%\xfa\xec\x08<\xdb\
-\xd8\xae2\xc6\xd7\x17w\xab\xb9x\xfd\x8c\x09\x17\x04\xbe\
-\x98\xe4B\xd9\x17\xcbN\x17\xe7\x12\x17\x8d\xe4\x11\x17\x8c\
-\x9aQ\xbfu\xf0:}50\xbcd\x115\xe7\x12s\
-\xee\xa3\xd9j\xe9\xa7\x85\x96\x8a\x14\xa8\x1d\x9b\xce\xc5\x1b\
-\xbf\xf7\xeb\xdb\xf5\x8f\x7fHo\xcd\x899/\xaf/M\
-N\xeb\xcbb\xecD\xc8K\x84 U\x0d~^`\x8b\
-l\xc1N/\x8ak\xd1\xf1\x1d~i\xf0\xfb\x8a\xb9\x8e\
-\x10\xd8\xc7Xup\x8aO;\xb1\xc0\xc7\xde\x8aKL\
-\x06\x88_\x09'\x8c]N\xdbXc\x8e5J\xed\x9f\
-\x15\xf1\x8f\x22\xb5}L\xfcqf\x93\x8b~\xb84\x17\
-\x00LP\x92'\x93\xc6\xc41\x99\xe1M>y\xb6\x9c\
-);\x1f\x16\xba\xccsu\xd3\x0e^Odj'\xc3\
-L~u1r\x0ea?\xcc3\xf68\x10\x9fH\x92\
-D0h'\x0eh\xdb\xeb\x98h\xd1\x22\x9e\xfa\xb7\xb9\
-\x16\x03\xe7\xe1h\x87\x87-e\xd7\xc7\xbf\xfb\x22D\xc7\
-3\xfd\x17\xdfw\x1d#'P\xc8\x1c\xac\x8a\xba\x1f\xe3\
-\xd3\x87~*\x1f\x9fh\xa2{K\xfe\xb8\xdf6\xe86\
-~\xa4\xf8\xd7\x0a\xe7\x93\xdb\xb8j\xfb+}\xf5T\x80\
-\x7f\xf6\xc3\xa7\x8f\xfb/\x8am7\xcf-\xe1\x7f\xe5\xe3\
-\x0fn\xdf\xf6\xb6\x97:n\x169{\xc3/1\xf2R\
-\x10\xbdc\x92\xd0\xc1zQ\x94\x8f\x9d/6\x859L\
-\x9d\xf1\xeb\x06\x0e\xef\x99\xf3\x88>\x18\xf9\xa0\x15\x0b\xf4\
-z\x07^\x9c\xb5\x86~\xb6\xd2y?O'\xe3r\xf4\
-\xab:\xd8P\x88\x8fX\xda.\x8f\x1a^\xc7\xa3\xf2\xb6\
-W=\xe8\x96UN\xbfj\xb7bU\xf7K\xf5\x1f\xcf\
-\x08\xacc\x0e\xe2\x9a\x7f\xb4\x99\x87\xe60\xba\x9e\x0b\x04\
-.\xca\x03r\xc1\xf9\x90s\x1f\xf6\x8e9y\x02\xc0\x9b\
-^\xa1\x7f\xfac\x1b\x9ds\x22\x949\xb6\x13$\x16:\
-\xf7\xc8\x7f5\xc8\x1b\x14\x07\x13Y\xdeb\xc0(\xe7\xed\
-\xf5\x8f\x7fd\xbb\xf6\xbb\xbf6|\xf1t5@\x5c\xfc\
-\x80\xb7\xe7-0\xc0\xcf\xb1|s\xd0\xb7\x0f\xc4\xa1\xdd\
-\x16@\xf5\xdc\xdf(\x1b\xb4|\x14\x1c\x22\xb2)\xf6?\
-x\xd5\x03\x89\x98\xc0\xa7\x94\x0f\x05k\xf7/\xd9\x19\xfb\
-Q\xa4/c:\xf6\xc1\x89\xff\x89\x1f%\xbcH\xb1x\
-6\x9f~\xd8b\x051\xd2\xc5>\x5c\x9a\x0b\x80\xcc3\
-S\x94\xa4k;\xd3\xcc\x84&ihwr;\x979\
-\xc9\x8e\x89$\x0f\xe0a\x14\xdd\xd4\xc3Z\xec\x85\x06.\
-\xfa\x98\x03\xae\x02\xed6\xc9\x04\xd3\xbf\x9c\xd4p\x8b9\
-\x09\xad6\xfc\xea\xef\xf6Q%\x04\x17\xe2\xc0\xcf\x1e\x93\
-h\xc7&\xb9\xe3G\x0b])\xa1\xc6\xcb\xba\xad\xb1\x87\
-V9\xfa\x1fL\xf8y\x0f\xdfb\xe9\xe9\xc7\x9d=\xd9\
-8@  \xc7\x22\x9d\x89i\x1f?d*\xe6\xbb\x96\
-\xaa6y\x16$\xbe\xe3\xde\xb6,\x82z\x04\xc9\xfb\xfe\
-\x0f\xdds\xdb\xf6w\xbe\xf1M\xde\xe4\x1d7\x0b\x97d\
-|G:\x96\xd1\xcf\xdd\xd3\xf4\x08x\xc7\x96>\xa4G\
-\xdd\xe0<>\x92w\xe1Eg\xed\xab\x8d\x179qc\
-{M\xffN\xb5\x05\x1e\xf6\x14\x8f\xc1\x08\x8a3\xcd3\
-\xd5\xea'c\x11\x8c\xc6\xb1\xe2`\xb8bUF\x1c\xbc\
-\xda.f\xf1\xeap\x95\x97\xb7\xe2\xd5\xae2\xea\xda\x9c\
-bU\xb7\xfc\xb5\xbd\xda_&\xba}\xa4\xfe\xe3,\xc5\
-\x05\x93\xf1<mw\x8c\xedSiK\xae\xa2\xb3\xdf\xf1\
-O0d\xb4u\xdd\xeeEnb\x0d\xe6\x8d\xed\xcd\xaf\
-|\xb1\xceD\x9d\x9b\x9cW\xd2\xe3\xc8~\x8f\x9d@\xf3\
-\xb9>\xef\xfc\x80!\x8f=+\x8eu8\xdb\xdd\x7f\xf2\
-\x5c\xd6\x9f\xfa\x98\xbe>\xf8\x97t^~\xce^\xe7\xfa\
-<\xc6\xe6\x00;\xeb\x07\xf8\xb6\xc5tp\xe5\x97\xb8\xc1\
-\xa2c\xd0\x84R9|\xdbGiaK?&c\x0f\
-\x86CV\xdb\x00j\xe1\x83\x1e\x8c\x7fZ\xf5?2|\
-\xd9\x9fd\x94\xbdmS\x0e\xb1iL\xb6\xa7\x01\x8e^\
-\xfbx\xd3\x16\x1f\xcf\xbc\xf6\x22\xfe\x19\xff\xf6\xbbK/\
-4qi.\x00\x98\x05\xe6OG\x0e{\x92t\x22=\
-\xf9\xe2{r\xa7\xe1-\x18#\x1bj\x8aw:'0\
-89\xa9&!\x92\x1f{r\x80Eb4\x1fL\xd7\
-\xff\xd4M\xe4\xc4Al\xe2\xb8\x91\x84\x8ek\xf8\x13s\
-\xc8\xc4\x22=\xee\xc2\x81\x1a\x13\x02:\xc7?I\xdcX\
-\x06\xcb\x88c'\xda\xf6'\xbc<U8N,\x10\xbc\
-HX\x0fZ\x1b\x19\xfed\x9cDI \xd5\xe1\xa2\xc1\
-\xefS\xb2q\xe9G+\x88\x10\x12\xcb\xdcz$~\xf1\
-\xfcg\x84\xaa\x1d\xa5\x16\xae[E\xfe\xdb\xef\x7f\xcbv\
-\xef\xdd\xf9\xb3&\xed~\x0a\x12|\xa1f]J\xd0\x0e\
-\x5c\x07j\x0d\x16\xb1P\xb2\x90\x81wv\xc3\xa7\xdd\x05\
-\xc2'\xf6\x18\xac\xf4\xe9F\xbbn\xf8\xd8\x22o\xa9\x1d\
-:\xeb\x86^>\xf5*\xc3\x0e\x1e\xa5q\x80\x07\xdd\x97\
-\x85\xcb\xa1\x18\xd4\xb5\x81>\xaf]3d\xe7\x95\xda!\
-+V\xe9Uv\x9e\xed\x97x\x7f\xf2#\x904N.\
-\xeco\x17\xd9-\xe7\x1b\xb9C#r\x92\xdes\xc8i\
-\xb1L\xf7+_\xfc\xc2\xed\xee\xbb\xee@;\x17\xdb\x9c\
-\x06,$\xbc\x8c\x82\xbe\xd1ra \xae\xf9\x96KM\
-\xe7\x19\xe70~\xf8\xe5sA7\xae}Z\x7f!\xf0\
-\x8b\xfas\xdb\xcfZ;O\x0aL\xfa\xb0\xbb\x17\xee\x1a\
-K\xe2\x03k\xdc\xe3C\xca\xe3\xca\xb4}XA\x07\xc9\
-v,\x09\xf8\x89\xf2\xd0\xb4U\x8e\xdc\x8d\xf6a#\xfb\
-\xa5\xd1\xf1\xd9mb~\xd8\xa3\xac`l\xe2\xd8\xb2R\
-\xc5\xa7D1\xe4\xb8\xc42\xb4\xb99,.\x85\xb5\xb6\
-\x16\xa5\x0bH^\x9a\x0b\x00&2s\x9d\x0c\xe0\x04h\
-\x12\xb5f\xd2\xa1\xd3v\xea\xc9F\x93\xa9\xdf\xe4FN\
-\x0b\x1a\xc6bB\xd1'Mf\xcem\x9f\xb41\xbf\xc9\
-\x80\x0e48\xa4\xcfA\x07\x1b.%\xfe\x0f\x1a?`\
-\xc3w\xcc`\xebw]\x1c\xe2\x1fEQ\x8e\xc7@\xa8\
-y\x83m\xac\xd1\x10Se\xb4\xdd\x0f\x03\x9a;\xf6\xf6\
-u\xf8\xac\xb6}b\xcb\x02!P\xfa\xe2\xf8\xf0$@\
-\xf6g\xfc\x9b\xd6&\x0e#\x9b\x22\x1e\xb8{\xe5\xceB\
-\x9b'\xf8(\xf1\x9e?\xfa*O\xf3o\xc8\xa4\xc3\x93\
-\x80+\xfa\xa6\xbfox\xe2E\xdb\x13/\xbe\xdfxH\
-\xe8H\xfe\xdc\x09\xdf\xb3\xd9\x1a\x03{\xf0\xe4\xce1\x05\
-\x0f\x93\xd3r*w\xacR\x82\xcf\xab\xa5c\xbdn\xe8\
-\x95\xb1Y\xf3\xe23\x01\xa7x\xc5Y\xeb\xda\x9dWW\
-\x0f\xac\xbe\xd6\x8b\x85\xcak[\x19\xf5\x1a;\xf2\xb6\xab\
-\xbb\xdaB\xb7\x9cG\xaf\xba\xe8\x81\xd51@v\xda.\
-\xd6e\xa8\xdb\xb7\xd6_H\x9f\xfe \xba\xa7x7\xb3\
-=\x9d\x03\xce\x8f\xfd\xb3.s\xbe\xf8--hN-\
-Mi\x9f\xa4\x81INfn\x93\xcbox\x99\xbe!\
-\x93\xf3B+8gDS\x00:\x8b:\x1e\xd4\xe2<\
-\x85\xa9sO'\xeb\xb4\x05>O\xb9\xf2N\x81\xda\xd2\
-{ZO\xc2\xae\xfd\xd6/\xe9\xbf\x0a~\xeaL\xee\xe3\
-\xdf\x0eT\x9b6\x9e\xe8\xc5/\x1e\x88\xc1\xdc\xaa\xa3\xe1\
-_4)c\x0f\xd3-\xd9\xe8\xa7\xc5\x11[\xc4\x1a \
-\xed\xa1\xeds\x0c\xe2\x7f\xec\xa5\xe01\x01b\xe8\xf8\x0f\
-?\x11:\x84}\x80v,L\xf4sxO,\xb5I\
-,\x87\x1f\xa4\xb6 \xa8\x04FD\x17\xbe\x5c\x9a\x0b\x80\
-Nd\x17\xb4&D\xebN\xbcO,O\xdb\xa4\x9e&\
-\x93\xf9\xb4\xbd\x88L\xb3\x14\xca\x13\xb9&\x03\xf4\xee\xcb\
-8\xd87\x91H\xbc\xc9\x0fx\x01\x1d^\x92\xe9\xf0\x1f\
-\x5c\xfc\xd8\xde\x86\xe2\xa9v\x12\x16\xb31\xa9\xa6\x00y\
-\xd6?\xa1\xd6?'\x7f\xa5\xf0\xa0\x89#\x8b\xbc\xedE\
-\xfb\xa9\x82\x1a\xe8F\xfb4V\xf9\xd0\x82\xc0\x1a\xe1\xc5\
-HZ\xc4H\x04~\x22\xa0\x9a\xc5\x0bl\xee\xdc\xdb\x7f\
-\xee\x1a\x90G\x93O\xfaS\x88\x83M_z\xc2\xa4\xbe\
-\xef\xce[\xb6\x1f~\xef\xeb\x042O\x18\xf8\x0a^d\
-\xc2$&\xde\xe3\xe7B\xc18\xd2\xf1I\x0e\x92\xdc\x95\
-6\xf4\x17xp\xec3~\x98\xb0\x19\x97\xd7\x8b\x00\xf8\
-\xf0\x90u\x03\xa6\xddR\xfd\xb6\xd7\xba\xb2\xd6\xabl\xa5\
-\xcf\x93\xb7?\x95\xb5.\x7f\xb5_\xe9\xea\xc1\x83\xa6<\
-[\xdc\x9f\x0f\xcf\x00_:\xfc\x89\x8f@\xe7\x0aG\x9c\
-A\xfb\xbc\xe4D\xb4\x7f\xa5|\x8a\xeaC_g\xc3\x9c\
-\x17\x08\xdf\xa4\xb7\x01|\x860\xf5\x9e\x7f\xce;\xcei\
-\xe9\xd1\xd6\xcb_\x09,^.4D\x98\xe6\x18y\xdd\
-p\x1e\xfae\x91\xde\x12\xfb\x88.\x02\xf4\x8f\x84\x1c\x87\
-p\xb8!h\x1c{l`\x15\xca\x9e\x03\xdb5\x07\xff\
-\xa5\xa9\x85\x80\xf6\xf0L\xc6\x1eIDb\xe2\xcb\x95C\
-,\xcd\x18\x1d\xfe\xf7\xa8cO?\x01@\x19\x9f\x15C\
-\xe3f\xea>\xd1\xa8\x18Q\xe2\xc3\xd5\x1e@x\xe05\
-\x96\xa9\x0f\xffX^\x9eri.\x00\x98 O\x92'\
-\xef\x98 O\xed$\x01\x19Qq\x13\x02\x1eI\x91$\
-\x98D\xa8\xd2\xc2o\xe24\x11Z\xe3)\xb9'\xdb1\
-71\x06\x89)>\xd0\xad]j\x19\xd4\xbf}*i\
-\x1b+\xca*\x85\xdc\xfd\xef\x1c\x92=R\x9f`\xd8\x0f\
-FU\xe6\x9c0\xcan\x8f\x8e\x1a\xed?:\x96\xd9/\
-\x18\xf1Z\xbe\xbf\xff^~\x8eD\xd1&\x89\x0a\x17\x08\
-R\xf2\x0f\x00\xb2\xf7\x9f\x03N\x0c\xb9\xf3gN\xf2D\
-@o\xecc\xe4\x0b\x86\x1f\xfa\xea\xd7n\xf7\xf3\xe8\xdf\
-E:\xdc\xdd\xccUI\xe3\x1a\xe1\xf4)-b\xa2\xac\
-cX:\x12\xf5EJ\xe5A\xef\x0b\xec( \xab\x9c\
-\x9a;\xab\x96S\xdd\xda\xb7\xae\xdeZ\xaf6\xcf\xa6W\
-\x9f\xab\xfe\x8asJ\xafX\xd8\x9egW^u\xe9K\
-\xfd\x80W~\xb1\x91\x15\x0b\xd9i\xbbz\x17\xb1n_\
-N\xeb?H_j\xfb\x07\xb1\xf9\xc3\xeaj&b\xaa\
-9\xe9\x9d\xbf&$\xe7\xa2$Y\x07\x92\xf0\x1c9\xcf\
-,\x9c\x5cx\xe5#/\xccfo\x1c\xe6R\xe7\x90/\
-\x09\x06V\x15\xfdq\xe1\xe2\x1a\xc2\xed`\x1al\xda\xfe\
-K\x1eTYO\xa4\x0b\xe4\xf5\x8f\xfc\xdav\xe3\x13\x1f\
-V\x0e\xc5m\xad\x8a\x99\x1a\xa3\x09\xcbq\xd0&\xc7\xcc\
-^\x0eG\xbf\x0e{\xd6\x85\xa8\xe0\xc3|\x0c\xfd\xbb\x02\
-\xc0\x18\xfb\xea\xe1\xa5N8\xc7\xd7\xf6y\xf6\x92\xef\xf1\
-\x8f\xd3g\xc4o\xdf\xf8\xddgF\xb4\x9b\x8ei\xb7_\
-C\x8b\xc6\x85>\x1e\xeb\xfa\x85\xee\xc6\x92\xa4\x9a\xa9c\
-\xb28)Tt\xf0\xb4j\xf2*K\xda\x1c\x89\x14\xfe\
-\x1c\xc9H,\x9ax\xb2J\xbe)\x11\x07\xa0\xf5\x9e\x87\
- \xef2\x11\x12\xc4>|\xe7\x0dx\x83=\xaa\xd6\x99\
-\x10\xa9\x5cV\xd9J#\x9ct\x9f8\x8e\xcd\xcew\xf3\
-\xc6\x96F\x5c\xc6\xff\x00\xec\xfd\xa7\xedq\x88\x92c\x1c\
-}w@\xb4\x1e\xc0[\xa92\xdeH$~\xbf5\xa0\
-\xda\x85\xc5B\xfd\xf1\x87\xfb\x02\x186\x17\x0b\xc6\x97\xc7\
-YL\xc0\xe1Q#\x1f\xfe{\xe9\xf3\xee\xda\xbe\xf1\xad\
-\x8fF\x97#\xc0\x92\xbbPM\xf0\xa8\xfb\xe5>E\xbc\
-\x1e\xfbH\x94\xf1\x5c7\xbe\xc4\x9cq\x81>\xdd\xe0\xbb\
-\xf1\x81\xc5\x1d3\xaf\xd2&tXu\xa0y\xad\xc5\xfd\
-i\xcc\xa3\xbf\xea\x9d\xa7_\xfb\xda\xae5\xfa\x8dc\xc5\
-\xa9\xcd)^\xf9`TV\xbamt\xca[\xe9U^\
-\x9c?\xcf\xf5:\x0f\x9fo\x1c\xd0}\xb6\xf2l\xf2\xfa\
-a\xfc\xfbV\x9b\xcf\x0f\x01V\xc6y\x90\xf9\x89\x1f\x9f\
-u\xe6I\x89\x14\x1c\xf7\xe4\xf4\x8b_p?\xcf\xd5v\
-^\xec\x8e\x5c\xc56\xe7\x8fTDX.\xdf>\xc5\x80\
-\xe2\xfc\xa5\x00\xc1[w(\xd3\x9c\x1a#\xff#\xa1\x8f\
-\xfd\xa6\x98\xac\x1e\xe8\x83\x89B\xb01\x0e?\x5c\xec\xe1\
-\x15c\x1d\x8f\xd2\x96\x09*\xf1\x08i\xc6\xd4n\x11\xf2\
-;J\x95\x01\xe8h;\x16\xf6bg\x00\x98\xb0\xfd\xb0\
-\x1ac\xec#\x89\xda\x12\x7f\x0dV\xfb\xe15\xc6\xc3?\
-=\x96\x1f\xc7\x8d\x93\xf8\x1cw\x17\xba\xba4\x17\x00I\
-\xc4\xe4Ci\x12\xa9\x13\xd7Y\xa2\xdd\x89\xa5\x9e\xf4\x98\
-<\x8a\xacr\x12\xa1\x89\xd3IGVy\xec\x93\x0c\xe0\
-\xa2\xbc\xcbe|\xf8?\x12\xc6\xf2\x09\x06n\xf3\x10[\
-hp\x8ao{\x07P{\xea\xd2\xb8\x8bM\xec\x02Z\
-\xdb\x9cH\xd1YLv\xfb\x9e$\xf6\xbf\x07\x22\xc2\xf4\
-\xe0J\x18Q\x8e\xe8z\xdd\xc0\xef\x9c%~\x9b\x00>\
-w\xf1R\xe0_\x98\xdaJ\x0b\xc8\x15]\x09\xf8\xd4\xe5\
-)\x80/\x06\x9e\xde\xbe\xe7]\xaf\xd8\xae\xfa\xb3\x02\xd2\
-3>w@J\xc3\xda\xc9\x1a\x1a\x94\xb5\xc4_8\xd0\
-\xdd0\xe1@\x1fcuV\xa7z\xb5\xaf\xed\xa9~/\
-\x14\xe0\xaf:A;{\xac\xceY\xee\xe1\x17\xaa:\xad\
-\x1b#uid-\xfb\xbc\x951\x18\xe7\xf1\x17\x15\xe7\
-\x80\xf3@X\xd5m\x9fW\xbd\xcb@\xd3\xbf\x9b\xbd\xbe\
-\xd8\xfa\xd78\x9f-\xae\xce\x17:>\xb7\x9c{\xb1 \
-5\x90\xc3\xb7\xde\x9c\x1f\xe4\x0c\xed\xfb\xee\xb9k\xbb\xe7\
-\x8e\xdbs~a\xc2\xd8\x8c\xeez\xeep\xea!\xcb\x09\
-\x95\x1b\x22\xa3rU\xc0y\x83\xad\x8am\xe6\xa6\x1c|\
-\xda\xc8\xae\xf3\x8f\x84\xf44@W\xf3\xa8\xa90\x07C\
-\x89\x88\xfd\xc1s\x1c\xa3\xd0>D{\x8e\xc6\x0e@\xfb\
-\xd7\xd8\x13'X\x91\xbb\xaf\x98\xb9\xbd;%\x02\x83\xb5\
-\x8e\xca\xc8\x1d\x1f\xf4\xac\xbf\xabm\x14\x03'z\xdc\xc0\
-\x0d&fb\xda\xbf:\x16\xffb\x16\xda\x8a\xabW\x18\
-\x17\xbb\x5c\x9a\x0b\x80lhs\x229-\x998\x12\x94\
-\x14]\xebL\xec:\xab$B\x12y\xeccb\x15\x92\
-\xd88\xce\xe6\xca\xc5lR\xcc\x09i{\xd1\xd4\xa6\x01\
-\xb5\xff$\x88y#+\xbd\x83\xa07L*\xd3\xd8\x13\
-7\x0d\xe2S\xe5W\xe5\x83\x85\xb3\x9eH\xc8y\x92\xae\
-_\x98~\xb5\xff~\x5c\xaf\xdd\x1bYy\xa1\xad\xbc\xf3\
-m\x8f\xed\x08\x9d \x026_<\x7f\x9a_\x8d\xfd\xad\
-\x0a\xe9\x12i\xde\x0e\xc8\xa7\xfb\xd1\xd1\x8e\xef_.\x00\
-\x12\xf7\x8d\xed\xe1{\xef\xd8\xbe\xee\xcd/\xcdE\x02\x80\
-<~\x970'<6z\x0d\x9e\xe3'\xb4)]\x14\
-\xa8oFwc=O\x0e\xcc\xca\xa7\xdd\xc5\x14\xfe\xba\
-iV\x0f\x9d\x16t\xd7\xd7\xcd\xf8\x9e\xaf\x0a\xa7\x06\xaf\
-\x17\x18\xd0\xbcN\xb1\xda\xae)\xed\xc6\xd1\x1a\xd9\xa9^\
-\xf5W\xcc\xea\xa3{^A\xbe\xea\x9f\xa7\xf3g\xc9k\
-|\xa7\xf5\x9feL\xcf\xe6\x9b8oV\xda\x87U^\
-\xdei\xcd9\x07o\x9f\xb5\xc1\xa5\xdd|\xb0\x8d\xda\xd4\
-/~\xc1}>_8\xd1\xb0\xe2\x5c\x13#O\x18\xb0\
-e\xfe9\xcfT\x92\x0a\xa1\xfd\xef\xb7E\xa2\x8fZ\xde\
->\x80\x01F\xf2\x1c\x1c^X\xdc\xf8\xcc'\xf4g\x82\
-\x1f\xd4\xbbx\xfas\xd9\x815&\x07\x9531\xab\xed\
-\xbc\x0b\xf0N\xef\xbcE\xeeht\xc0\x93i\xd5\x94\x9d\
-\x16Fi\xe2j)]\xce3\xfdK\x13\xff\xc4\x8fR\
-c\x86\xa5\x92\xb1\xc0\x0f\x02T\xc7\xcf\x00\x1a\xbf\xf1\xdb\
-o\xe3\x08@\xfd\x06\xedb\x1f/\xcd\x05\x00\xd3\xa0t\
-\xf6l0\xa1n\xab*m\xe9\xf0I\x0eO\xfa\x9a\x1c\
-\x93\x08M\x08\xd7\xe0\xd5f\xc1\xb7\xbddN\x04\xc9\x9b\
-\x10\xf5u\xb6N,\x89\xa7\xf4\xf8O\x94{B\xc6N\
-i\x89\x9a\xe3\xc1im\x96\xbe\x88\xe5\xf8\xa5t\x85;\
-\xed\x89`\xf7\xebqpz\x03`/\x1c\x80\x8anx\
-\x8d\x9b\x13\x02~\xedw\x9f\xa8q\xe1\xef\x18&\xe6\xd9\
-\xfc\xc1\xe5\x07\xbb[\xbc\x91#\x97.\x8f\x0b!\xfc\xd2\
-\xc2\x84l^\xdf\xad\xbb\x7f|\xda\xafT\xfcoN\xd1\
-3CHsf\xbai\xb7\x00\x1e\xc5}\x96N\x17C\
-\xea\x95n\xfc\xbd\x10\xc0\xb2:\xa5[W\xf7fr\xf4\
-\xd6\x82\xfe\xfa\xaal\xe5\x95.\xe6\xb3\xd5\xb5?\xad\x8b\
-AM)F\xfbT~\xed*\xa7\xa6TN\xbbX\xd5\
-\xa9\xcd\x9f\xc7\xbacqZ\x7f!cQ\x9bS]\xf8\
-\x7f\xa4\xa2)c\xda\x989\xcf\x1fx\x83i\xec\x91\xd7\
-\xbf\xe7\xb1\xba\x92\xbd\xf8\xc1\xe7\xe5\xec\x96\x99?s\xe3\
-p$\x00\x83\xf9\xe7\xa9\x1b\x1a\xce\x05\x22\xe5|Im\
-U\xdan\xb2V@\x85\x8b\xbf\xb6\xfa\x8f\x84n\x5c\xfb\
-\x8c.\x02~\x99\x7f+h\xb5\xc6\x87/\xc7.\x83\xf2\
-\x5c\x17m\xfa\x83\x9b\xa0C\xb0rLK\x95c\xb0\xfc\
-\xf0o}\xdb\xc2;\xcb\xa7]\x1f\xd0\xeeS\xfd\x1b>\
-\xa0\xd6\x89)pX\xb9\xb6\xff\xc6\xa5:\xfe\xbb\xfe1\
-\x16\xe3o\xacb$\xfb\xda\x94q\x09\xeaKt\x010\
-I\xcb\x84NFQ\x97\xce\xe4U\xf0\xcc\xa4c\xce\x91\
-\xa27Z\xa9\x07\xe0t\xf2\xab\xd3d!\x17l/ \
-\x9f\x10\xb4m\x1b\xcd\xb3\xf6s\xe2\xd9\x1f\x96)\xb6\x7f\
-\x86\x7fp\x90/\x99\xacvP'\xa9GNE<\x95\
-\xedu\x04K\x5cs'o\x05\xf4\xa3\xe9\x9b\x85\xf1\x0f\
-\xc7~\xd9\xf0GO\x7f\x187q\xc4\x07\x8b\x0e?|\
-K o\x0d\xf8C\x80l\xf6S\x82J\xe3\xc6v\xd7\
-mW\xb6\xaf}\xe2\xa58N\xf0z\xa4x\xe3Z\xfe\
-k\xa0\xd5\xa5L\x0f\xbd\xc8\xc9ak\xcbt\xf0\xbc\x0c\
-\x1f^\xc7x\xa5\xcb\xebX\xb7\x8dN\x0b\xb2b\x95w\
-\x9e^e\xad\xd1\xf9B_\xb5i]\xbb\xb6\xcf\xab\x1b\
-Cu[\xa3\x0b\xcd\x13\x84\xf6\xab\xf1\xaf:\xc5,o\
-\xd5\xa9\x0c\xdey\xfc\xca\xff\xb4\xeb\xc6sZ\xffQ\xe2\
-8\xc5j\xfb\x8f\x82\xc9\x98~\xa1\xe5\xd4\xdfi\xbb8\
-E\xe4\x1fU\xa1\xe33w\xe6\xc7\x17\xcd\xa2\xabCm\
-Zj~\x8b\x0d}\xc5\xf4\xc8\x03\xf7\xf9\x06\xa0\x9f\xf6\
-\xf7\xfb\xfa<\xaa\x1fC\xfe\xb8\xc6\x0d\xa9\xf3\xc4\xdf[\
-\x1b4l|\xe9\x07^\x18\xfc\xd5\x8e\x95b\xbe?-\
-DY\xa7\xadDO?\xfd\xd4\xf6\x94\x9e\x04\xdc\xf8\xdc\
-\xefGG|c\xa1\xd0x[\x07\x0a\x89\x0b}\x14k\
-/\xa5\x89\xa1%<\xe9\x8d0\xf5pof_s\xd5\
-\xd6\xb4^lt\xc6\xeecq\xd6\xbf%v\x1bs\xf4\
-\x1b_\xeb\xdd4z'\xfe\x1b\xf3E\xaf/\xcd\x05@\
-N\x22MZ\xe6\x9e|\xd4\x8bCj\xa6\xdc2\xf1\xa2\
-\x9b+>\x9f\xdc\xf0&\x11\xc7\xdc:N\x8e\x91\xc1_\
-eL|\x92\x0an1\xcf\xea\xc4\x7fd\xf8\xde}\x11\
-\x97\xda\xaeb\x9e\x98\xd0\x01\xd8\xb2\x89i\xf5\x9f\x0eD\
-7^\xa3\x0f\xd0\x14\xdb#\xc3N/LZ#\xeb\x18\
-@\x84o\x05,,\xb4\x5cg{!}g\x81\xddn\
-+\xa2\xfd\x952\x9b>\x0b\x16\xd1\xc2\xc7\xde\x7f\x9d\xa0\
-\x85H\x0f\xbe\xc5\xe2\x9b\xfdnl_\xfd\xda\x17mw\
-\xde\xa6\xbf\x1f`\x81\xd2\xa2\xe7\xaf\xfd\xe5\xbd\x7f\xecp\
-V\x87\xc0Oi\x1fhv\x11\x86\xd7\xf6*_\xf9l\
-\x96}\xe4n\xe59\xa0\x03N\xb1J\xd7v\xd5\xfd\xd3\
-\xa6OcX\xdb\xa7q\xaf\xb1\xad\xb2\xf6k\x95\x7f\x89\
-\xfe\xb3\x1b\x81u\x0eO\xa3\xa8\xac\x1f\x08D\xde|t\
-=\x06\xd6\xf3)\xaa\xbc\xe7$Tqn+\x97\x1f\xd1\
-\x13\x00}\xf8\xc6w\xff\xfdP\x9fs\x80Sd9\xa5\
-|N\x93\xfb\x18\xfb\x90\xf3\xc0JjG\x8ep\xce-\
-(1\xfd\x82\x0dM\x05\xad\xf3\xf9\xfaG~\xd5\xdf\x1e\
-\xe8\xdc3o\xd6*\xe8\x16\xfb\x0f\xde\xae7\xb2\xf4}\
-\xd6\x1f\xa3f\xad\xaa\xa9k\xc5\xab_\xf9K\xed\x18\x09\
-\xe0\x14\xd7\xbc\xf3\xfc\x0f\x0f{\xfd8\xf6\xfaro\x0c\
-5|i\xd8\xd9\x12\x81\xfd:\x00\xcb\xe2_(;\x7f\
-\xd1\xbd\xc0\xe4\xd9\xff~r\x81;\xd2\xd0\x9bl\xfb5\
-\xde\xff\xcf\xde\x9b\xfd\xda\x96]\xe7}\xfb6U\xb7\x1a\
-6E\xb2H\x8amI\xa4:6\xa2DI6DQ\
-R\x04G\x8c\x22\xc5Vl\x19Vb\x04\xb1^\x1c$\
-0\xe2\x04\x88\x1f\x92\x97$\x0f1\x90\x17\xbf\xe4)/\
-\x89\xff\x81 @\x9e\x0c\xd8\x0fy\x08\x10#\xb0\x92\x00\
-qb\x04\x8e#\x19\x96)Y\x0aI\xb1o\xaa\xb9\xf7\
-\xe6\xfb}\xdf\xfc\xd6\x9ag\xd5\xdag\xefSuo\x15\
-\xcfA\xcd{\xf7\x9ac\x8e\xf1\x8do\x8c\xb5f\xb3\x9a\
-\xdd\x1c\xf5\x99e:\x98\xfeT\xf1`@\xef\xfe\x1d\xca\
-\x98\xc6`Y\xbc\x07\xde\x1e\x92\xc1r\x02\x098\xf5\xc6\
-_M\xa6\x8bm\x81'\x1e.\xe4\xd0\xb8j\xfa\xea\xeb\
-\xa2{\xe2\x07\x96 \xda&\x1b)\xf1w\xbb:7\x1d\
-k\x982X\xc1(\x01/\x06C\x06\xd9iL\xfa\xcd\
-\x8fc\x90\xfd\x88\x9d\x08\xfd\x83?\xddk\xbf\xef\x0fh\
-\xc9_\xb2\xcf\xdd|\xa8\x08\x8f\xe6\x95\xc9\xe6\xef\xfb\xa3\
-\xf3E\x80\xcc\x92\x7f\xfd'\xf9\xe4?\xc7E\x1f\x82\x13\
-\xd7\x03\x7f-\x90;\x0b\xb1;y\xf0\xf8\x93O#G\
-v\x9fJ\xd7I\x8a\x9dE\xb0\xb8\xd9\x8e\xae\xdf\xf3'\
-\xf2\x5cx\x8c>c\xcb\x07\xa6\xb6\xd9>\xfb\xbeVy\
-\x8eq\x8a\xa3\xfbS\x5cs\xa1\xbd\xb5\x15C\xbd\x17c\
-\xc6\xd7>\xebf\xff\xc7)7\xf6u\x8e\xb1\xdd\x87\xb6\
-[\xb3o\x95[o\xf7\x17\xfd\xfc\xba`g\xb8{\xf8\
-g\x0e\xb0F\x84gZ\x87\x18\xf3zb\xe6\xa7\xfa\x82\
-\xf3\xf3\xd5\x1f\xd0\x13\x00O\x1d\xee\xd6\x1f\x8e\x0f\xf4i\
-^\xfat\xe7\x89\x04\xdf\x88\xc4\xd8G\x94\x03s\xd0f\
-\x02y^\x8dy\x16\xcf\xc3\x03\xe9<\x03\xf5\xd8\x80'\
-\x07\x94Q\x0d\xe9\xe1\xe1\xbe\xbe\x1dp[\x7fZ\xf8\xce\
-\xdb\xdfs\xc1J\xder\xb7\xae\xe3-u\x13qH\x00\
-\x03\x17}\xf9\xd9\x9f\xe1\x9e\xf5Y\x0d\xb7\x0dc3r\
-CO\xd3\xfa\x81\x19\xcd\xacI\xab\xce\xfe\xb2\x15\xdcv\
-k,\x95\x9d\xbf\x15\xc4\x09\xf9\x92\xffH\xceq\xc1\xdc\
-\x80\xe2s\xd0\x0d\xd8\x8f1H\x18\xfa\xa3\xdb\xd4\xa3\xee\
->u\x9a'\xde\xd8\xc91^\xc6\x04\x0b\x86\xd3N\x07\
-\x80\xfd\xe9h\x95L\xc2u\xe22L\xa2\xab\x8d:/\
-\xfb\xab\xc1\xe0_b \xd9\x1e\x0e\x82\xbc\xca_\x80%\
->\xfe\xc4utI\xfc\x1f>\x0b\xe7\x85\xdc\x9c\x919\
-s\xd7M\xfc\x0e\xdb\x11\xcb\x09\x0e\xd9\xe4#G\xe7\x8a\
-\x82x\x89\x8b\xcc\xc9\xdf\xed\x11\xd7\xbc\xc3\x0f\xbbw\xd8\
-5'\x7f\x1b\xa4\x02\x1c?j\xb4V\x80\xd0\x89\xfa\xfd\
-o\xbfw\xf8\xecG\xdf\x83)j/R\xc1\x11\x0b\x07\
-\xf2\xee\xcb8A3\xf1.\xd6\xde\xbf\xe9\x18p<\xe7\
-\xf7\xc7{|g\x1ca)\xd8\xf6\xf4\xd8\xe6'\x06\xe5\
-@\xffz\x0b\xf1\xce}\xcd\xb1\xf0\xa1\x90\xcb\xfcB\xb7\
-\xe5C\xf7Vys\x8e@\xfb\xe6uE\x1f\x03\xde=\
-\x9en7\x1dC\x80\xbe\xf6\x136\xcd#\xb5\xfc\x17\x04\
-;?\x9e}*\xbf\xa5\x11?\xc6\xc9pf\x9ck^\
-\xa9\xe2\x0a\xdbw\xf24<\xa6\xe0\xb3!SQ\x03_\
-\xfa)\xfb\x92\x0b\x83\x88)l4\x0ad\xe6\x8b\xe7[\
-\xfaCB_\xfb#\xe7G\xdbH\xf3K\xa4E\x1cx\
-\x5cW\x97\x1a\xbd\x8b!\xab\x1c\x96\xb4\x9dA\xfdG6\
-\xc9J\x9e\xf6\x9f\xd1\xb0\x91)\xdb\x94%\x04\xc2ht\
-\xdf\xdb\xa6\x9eu\xec\xe2\x05\x7f\xbb\xb2\x11'\xb6\x92\x8e\
-\x18\xd7\xbd\xba9O\x00\xdcs\x0c\x8f\x0c\x02:\x96\xc1\
-@i\x9dVz\x12\x1d\x9d\x99\x85vED\x07\xb2\xb6\
-Q\xbb\xe3\xf1MI8b\xc8wu\x0f'\x0aA3\
-)T\x8f\xdc\xc8\x89\xc2\xe4\xc4e\x8de\xb57kN\
-\xc1\xa0\xc4}.\x8di\xacN\xa6\x8d\x03\xa9u\xf8$\
-\x01]%K\x99\xff\xce)\x9bzd\xdf\xcaG\x8c\x1e\
-?\xe7\xa8\xc0\x84\xe6\xc5=C\xdec\x0c\x8a\xbbx\x16\
-&\xf6\xcdX\xef[\xee\xec\xf3~\xa1\xf6\x95'\x00\xd2\
-\xff\xf2\x8f\xbd\xdfw\xfd\x10\xf1\x89c\xfd\x1c\xc0\xf2~\
-\xa3\x14\xfc_~\x08\x08v\xe2Q\xf0m!N\xdb\xe9\
-\xb3X\x90\xfb4\xa0w\xf1\xb3Oe\xea\x99\xa3\xd8r\
-bG\x9e\xb9\xd1\xcde\xc6\xce\xfa\xcb|f\xdcU\xe5\
-c\xbc\xdb<\xb68\xec3fk\xbfj\x1e\xe7\xe0\xe7\
-x\xe7\xe0\xbf_1{\xfb\xb1\xd5m\xdb\xdd\x97Y\x8f\
-<\xbf\xc0\xcc\xf6\xb6\x8da\xae\xce\x05_\xfe\xf1nY\
-o\xf9\x87\x1d\xbdg\x88&\xc9\xbd'\xb4|3Y\xf4\
-\xf2[u\xbez\xd7\x93\x00\xeb4/5\xf7E%\xa3\
-d\xe6\x0fo\xbdQ\xbb-\xbdlnG\xcc\x9c\x94\x0c\
-\xa11#-\xb5\xacs\x15\x09P0|C\xe0\xfeK\
-\x87;\xef\xfa\xb0\xdf\xd6c\x7fD\xcf\xce\xa6\x96H\xb3\
-\xbe\x88\x0b\x1d\x18\xfe\xd9!z\xf6/\xf8\xd8\x00\x83\x89\
-\xd3H\x08\x0e\x15\x7f{\x81}Is\xe8\x84\x1f|\xa5\
-M{\xf6\x95,\xa3s\x95Wq\x10p\xbc\xd6\xf8\xa6\
-\x8c\x1d\xf7\x99\x22\xa6k\xbf\xbd1O\x00\xe89\xfag\
-\x1e\x0c\xf4X']\xeau0e\xa0\x8e\x81E\xaf\x0f\
-l\x06\xc3`\x81\xd3&\xb8%\xe8\xbf\xed\x882,\x03\
-\x13\xd0\xa2\x9b\x93\xa8_x`\x1d\x0f\xea\x80_\x18x\
-j\x86s\x8c\xc6\xc4\xc1\x0fdl$\xc3#sj\x02\
-\xf6-t\xb7\xa5KN\xe2\xa5W\x15\xcc\x0b\x80p\xd9\
-\x1bj\xfc\xc9:\x1ar\xf1\xe4\x9e\x9e\xa5q\xf26\x06\
-\x7f\x02\xab\x80q\xbe\x92\xb0\x93\x1b\x1a~\xc1\xcc\x0f\x13\
-Y\xa9\xac\xe3\xa7\x80%\x02\xe6\x86\x05\xbdp?\xfbC\
-\xefe\xc7%\xe6\x98\xf1\x08\xb2\x1ffbr\xfa\xa7J\
-m\xe6\x87\x85\xb2\x1fk\xff\x10O\xa4\xc3\xde\xe3\x81\x0e\
-\xf9\xfe\xfd\xfb\xcb\x13\x000\xc5\x22\xcf\xa5\xf8\xea\xe6;\
-\xfe\xea\xa8\xe1l\x8c\xea\xf1=\xf5*\xf6Q\xd6{1\
-\x1f%\xff[\x5c\x17\x8f\xc0\xb6\xdf/Z\xd3\xea\xf8h\
-\xbd\x87\xd9\xd3\x95\xbb~\x17\xda:1/\xfaq\xc2o\
-\xfb\x02\x17s\xccS*k\xc2SO=\x91\xb9\xa6\xa6\
-\xc7\x8a\xc1\x00T\xc6\x85\xbf\x883\x7fy\x820\xe6\x91\
-\x8c\xfeO\x9b\x13=\xd7\x0d\x9e\xe3\xd8\xf5b\xb6\x8d\x95\
-\x01\xa4Kf.k\x83\x8d\xd6\xfbC\xc0\xe2?\xbc\xfc\
-\xe2\xe1\xfe\x9f\xfc\xbe\xea\x97\xeck\x07p\x84\xc1\xee\xff\
-\xa9\x09\x81\x02}\x22\x19\x04\xd0z\x9b\x17\x16\xe1\x80\x0f\
-<R\xec\xc0\xe5\x1f\xb2\xe1\x0b\x0c\x1d\xa8Q\xd4N|\
-j\xe9\xea\xe3\x90\xc4/\x0e\xdb\xb0\xa3\x9a\x0c\xce`\xe0\
-\x01-9\x83\xbb\x01\xe5\xc6<\x01\xa0\xa3\xda9\xf4%\
-\x1d\x9a\x05\xd4-\xcb\x194\xb4;\xbc\xd3\x83+>~\
-\xeet\xf8\x98\x0c\x81\xc7\x83\x01\xd4;\xea\xa1g\xa2-\
-\xf8\xd0\x8dAG\xfcu,!3\x08\xfdH\xdd\x19\x0c\
-0!=:\xb1\x05\xe4|\xc08~Z\xbe\xe3F4\
-\xc9\xca\x0bK\x10\xdd\xff\x89OY{\xc2\xc2\xa5\x7f9\
-F\xa0s\xa4\xf0\xa5\x8c\xf09y\xd3\x86QJP|\
-gXU<x\xdf\x9e\x9cd\xf7q\x09\xd2\xba|\x97\
-X\xce,f\xd8\x03\x10\xf6\xc1\xe1\xa7_x\xdew\xe9\
-\xec\xe7\x9d\xdb\xfc\x900\xb5.\x1d\xd4\xee\xbeK\x99\xfd\
-E\xd8\x94b\xe6\xf7\xf69\x81s\x17O\xc1\xce\xb1*\
-\xce\xc7q\x87\xa3zp\xc5\xf6I\xc0l\xdb\xb8.\xd8\
-\xad\xbe\xedr\xb5\xfd\xa8\xea=\xde\xe6\xd9\x18\xf3\xbeT\
-\xd7z\x8b\xad\xfe\xb5\xd4{\xb9\xbc\x16\x9e\xef'\x9fc\
-\xfb\xb4\xd5o\xdb\x1c\xd7\xea\xb65\xfb\x87\xae\xfay\x7f\
-g\xfd\xc2\xa1\xb9\xa5\xe9\xb0\xe0\x99;\x9em\x8aaq\
-\xe1+.X\xae\x13\xee\x08s\xf7\xee\x9d\xc3+\x9es\
-\xf2\x1ak\x93g\xae\xe7\x1f\x9f\xb7\xe1Z\x9c\x09L\xa0\
-\x11\xc7w\x08n:F\xf06\xe6\xae\x9e|\x86\xd9n\
-\xe2\xc5{\xd1as~xb\x90E'\xffW\xbe\xf6\
-\xc5\xc3\x9dw~\xe0px\xe2)\xb4\xb2\xc5\x0f\x90s\
-\x83\xc1$YC\x0c\xd2\xe6\x02\xaf\xdb\xe02\xa7\x935\
-\xe1$\x11g\xecG\xf5p\xd8\x7f\xe0\xc1\xe4\x18\x06\xea\
-\xc3@\xfc\x02\xcd\xa16N(\x09\x15\x86\x91\xad\x15#\
-\xd4\x9ag\xe6\x12N\xbcnN\xc9\x0az\x03\xf6g\x1d\
-\x10\x19t\x19\xb8\xeaZ\xf7\x175\x03J;J\xff\x8e\
-A\xe0Zm\xf4\xf6\x07;d\xb3\x08\xe7\xc11|\xc2\
-\x1c.\x0e\x99\xfd\x85@o\x7f\x94*\xc8c\x9c\x0e\x8c\
-\x14K\xfc\x1d\x7f\x81\xe3/.\xcdX&\xad\xdb\x8e\x1f\
-\xdf\x91\xb2\x1a\x14\x12m\xfc\x11O\x1e\xde\x0f9rg\
-\xaf\xa9\xafvp\x9c\xb0\xf1\x09/\xcc9\x16\xde7\xf0\
-r\x5c\xee\xfa\xddF\xc7\xe2\x01B~\xbe\xc8\xe1\xee^\
-1|\x0b\x92\x0b\x83\xf0\x12\x8f\xfd\xe58\x84\xd7q\xc9\
-]\x0b\xd3\x8f\xbe\xff\x1d\x87g\x9f\xbak\xbe;^x\
-\xf8\x84~\xf2b'y\x1a\xe0o\x04\x90\xfc(9\xae\
-i0\xf1\xfa\xe2n\xbf6N\xdc\x5c\x04\xf4N\xbe\xfa\
-L\xd4\x8b\xbe\xe5\xa5\xde\xc3\xcd\xf6\xb7\xe4\xb7\x8e\xc0\xde\
-\x11`\xdc\xcc\xaf=\xccV\xd7\xb1\x86~+\xcfm\xec\
-\x1d\xfd\xad\xe5\xe0\xb97M\x0bT\x06b\xa1\xb0}\xea\
-\xde\x13\xc6\xd1\x88V\x17\x06\xccQ7@\x22s\x090\
-\xf8X_\xec\x9b5\x07-\x17\xe9\xc0\xc7\xf5\x03\x93\xd2\
-/\x96\x8f,!d\xe5\xcb\x08\xe7\x09\xce\xc9\xa8v\x98\
-&\xa9\x0f&\xde\xff\x93?8\x1c\xbe\xf7\xad\xb1?\xb6\
-\x1a\xdb\x9c\xe5\xe9L\xa8\x87\xb7\xb1P\xb6 {\x1e\xb3\
-\xc3\xdei*\x92!\xa0\x98,\x0bD\xad\x97\xd7\x07;\
-\x83\xf1\xff\xc4W\xb3\xea\xf5x\x0f\x7f\x0c\xf8\xabp$\
-\xd6\xf8\x91\xb2K\xf0\x83\x98}p+1\xb6\xeb]n\
-\xcc\x13\x00\xba\x81\x8eq\xf7iC\x1fy\x1c\xdb\x90A\
-\xe1\xce\x94-\x83::\x06f\x07\xf9\xabd\xf9v\x9a\
-dX\xa4\xe3#\x0f\x7fb\x0e\x85\xe3\x8fF\xe5\x9c\x90\
-F^\xe4\x22\xfb\xfc\xd5:\xe7\x99Q\x96\x9c+\x93\x97\
-\xfeq\xd2\x1d*\xbc\x97X\x96\xb5q\xceC\xdf}\x1e\
-\x99\x011G/\x04\xac@'\xca\xeeC\xf2\x0c\xce\x81\
-\xd8\x9fqwn\x9c\xe3\xeb\x22\xc0\xce\xd8\xc8\x87\x09\x81\
-\x0f\xd1ifq\xb0\x12\x1ck\x0e\x00\x9d\xa0?\xfb\xc2\
-\xbb\x13P\xea\xfc\xc1\x1f\xed\x95(8q\xbb\x16C\xfb\
-\x03\xd7\x16\xfb\xb7\xa1\x9a\xe3\xc8I\x9f\x1a\xdb\xfc\x04`\
-\x82-\xe2\xec\x9f>\x189\x0d\xc4\xac+\xe7\xe2\xfc\x98\
-\x04rj\xdc\xd7\x1ab\xde\xaf-\xc7\xeb\xe5.\xdfe\
-1\x8a\xb9.\xf5\xa9}\xd9\xb3\xef\xe9zlg[\xe5\
-\xb9>&\xf7xa/\x86\xf9\x92\x0bXfR\xc6'\
-o\x81\xf5m0\x94\xe8/\x14t\xba\x80f\xeep\xe9\
-\xfd\xd4\x13O\x1c\xbe\xf9\x9d\x97\x98\x8cc>\xea\xc9\x9a\
-\x8dxr+\x10n3I\xcf\x5c\xebW\x06\x1f\xea\x9b\
-\x03)\xe2Ch0\xa9\xbd\xae\x08<\x7f\x16\xc0Xs\
-\x08(\x07\xa5\x1a?\x0cI\xc8$\xf7\xbf\xfeG\xfaq\
-\xb0\xe7\x0f\xb7\x9fy\x0e\x83u\xe6\x97D\x99e\x8eE\
-\x5c3\xafm\x93b\xd6\x13(>\x04d\x1f\x9a\xe8\xc8\
-s4\xed\xb3 \xf1\x91\x17\x8es\x9e\xd6N\xfeK|\
-\xf6\xa7\xb9\x8c}\xc37\x81[\xb9m^v\xe4\x06\x94\
-\x8e\x80k\xbf+\x8c\x09\x06\x92\xbb\xb6\xf2\x18(>M\
-\xb9#3\xf9\xdc\x16\x86:\x9d\xc9$\x89l\xff\x8d\xcc\
-\xc0hAn3\x03&#\xa4r\xb0\x0c\xa4\x0cb\xfc\
-\x8cwr\xf8\x12)Jj\xd4\x14j\x9eh\x0f\xeb\x18\
-\xa6B\xf8\xbf=\x84\x99\xfc\x07r\x19\x8c\x82\x84K\x1a\
-q\xad\xbc\xf1q\x0c\x0fc\xb8\xc2G\x93;}r\x85\
-\xdb\x17\x1b\xc8\xb2[&\xaf\x816'$\xc3\x97\xb6\x8f\
-X\xe3\xd6\xdf\x17\x03\x5c\x10\xe4w\x00^x\xfe\xed9\
-\xc1\xfb\xb8\x8d\xb8b\xf1\xc5\x80H\xfcT\x81\x98;/\
-\xa2\xf58\xcew\xfa=\xd6\xd8\xcf)>\xe6\xed49\
-\xc0\xf9f\x947+\xee\x9b\xb1\xaf\xd7=f\xc7\xcc\xb6\
-\xbe\xea~\xe1\x7fN\xf1<\x1bs\xe4\x98\x8f\xf5c\xe8\
-\xc2\x0a\xf5\xd3z\x02\xe0I\xca\xbcd\x5c;\xdcX\x7f\
-\xd4\xe8z\xc2\xed\xbdc\x90\x8c0}\xca\xe8\x95O~\
-\xb8\xf1\x80\xaew\xf7>1\x0c\x87\xb0\xa8\xe1\xf6`D\
-\xa68\xa6\x83&\xa1h\x0f\x0f\xf5\x97\x04\xef\x7f\xe3K\
-j\x09?\x1d\x03\xcb\xa3\x8d\x9c9!\xb2!'\xfd\xae\
-\x9f\x90%z\x93\xe7f\xc3E@,\xd9\xab\xe0\xbcV\
-HG\xc9*f\xd0\x88\xef\xe4#'\x08!\x9d\xbe\x1d\
-\x86\xdc\x5c\xb3[\x06\xc6\xa7\xfb\x8e\x13\xaf\x1bRn\xcc\
-\x13\x00:\x8c\xbeo\xc7\xe9|\x94\xc1\xc1\xc0\xd2?\x0f\
-6A\xa6i \x99\x92\x01]y\xd0\xe01\xecp\x0e\
-\x7f\xd5\x1e\xb0\x1e\x00a2\x031F\x02\x0b\x16\x7f\x91\
-q\xb5j\xceQ'\x8e\xbclsxg`\xb6\x91s\
-\x06v\xae\xdf\xc9\xcf\xfe\xa3v\x18\x82\xaa\x84k\x0cF\
-\xf8\xf8\xa7\x9a}\xed\x09\x5cn#7\xeck\x9e8\xe3\
-\x8f\xae\x5ci\x0fb\xef\xd3\xc0`\x18\xbe\xc1\xd7\x878\
-\xdc\xc5\x80\x03\xa4_\xf6\xa3b\x8e\x12W\xd5\x0f\xbd\xf7\
-\x1d\xbcY)\x13\xfb\xa1Z\xbc)\xa3\x96\x03\xaa\xeeW\
-' \x98\xe5X\x0e#6\xef\xdbx\x12\x90\xa7\x08D\
-II\x1f\xc4\x0f\xb9O\x09f\xceb\xa9\xcb\x8f\xbd\xbe\
-\xc7\xb0\xb3\xdf\xf7\x93\xdc\xbc_KN\xd7i_O\xe5\
-\xfaZ\xec\xa7|\x8e\x1d\xd3\xfaQ\xcf\xf2e\xf8\x19W\
-\xbfY\xd7\x0b\xdc-\xc7}\xfd\x88\x96\x7f-\xd0\xb3)\
-s{\xf1\x13\xf8\x89\xbbc\x09\xf7\xd9[\xe3\x983\xfb\
-\xc0\xe6-<]\xe0w\x82\xf9\x22@\xf3\x15\xac\x8ag\
-\xa0d\x5c<e\xb1\x0fljpLn>\xaf\xa3:\
-\x0e\x83\xdd\x14\x99\xcf\xcc\xcf\xc6@\xad\xb6s\xfc\xde7\
-\xf4!]\xfdV\xc0s\x1fp\x1b\x98\xc7+X`l\
-$\xd3\xc2\x86\x9cz\xc8\xaa\xb2\x8e\x84\x8f\xf5\xc3kH\
-<\x96<\xb2^&\x87\xd5>\xf8\x85\x85\x93|\x12?\
-\x9cP;>M\xdb\xd2\xba\x90_\x1c\xe5\xd7\xf8\xab\x0f\
-\xfe7\xa1d$\xdc\x80=\xc9\xa4\xd0PRg\xce%\
--u\xfePf\xb8\xa5\xd3\x8b\xc3f\xff\xfa\xb6\xae^\
-\xf5\xe2\x8fM\x8d\xc4\x0b\xc3\xeao\x0761L\x92\x86\
-\x90u\x17\xe3G\xb7\xf8\x1b#\x9d\xfeg \xafL\xed\
-\xa8\xa6V\x1e\x0fj\xe2\xd8\x80o8\xf1\xc4\xe6Z[\
-\xfb3\x90\x1d\x03\xfd(\xc2`\xb3\xbe\xbe\xaa\x19\xf4\xb8\
-\xf3)\x7f\xbc\xbc H\xcf\xdb\xf7\x9d$\xa6'S]\
-\x04x\x81\xc0\xc8\x7f\x0cZ0\xc8\xe9#\xef~\x96\xe7\
-\xfd\xcb\x1d\xff\x1a\x1f\xd0`H\xa5v\x0a~}\xa1q\
-.\xe4\xa3\xd7\xfc6\x80\xf3\x18>\xb3\x5c\xdf\xea\xa8+\
-\xcf|\xc3\xf5\xad\xea\xfb\xe4\x08\xb4\xdf\xf6\xea\xc7\x95\xe2\
-^,t\xa7J\xfd\xf6p\xb3\xff1y\xcfo\xabK\
-\x16L\xa8u>4\xb5\xda^\xd6\xfb\xee\xf9\x09n>\
-\xa0k\xa8h\x86\xc0Y]\x85\x19\xcc\x14\xc3\xc7\x7f\xfa\
-\xd7Jta\x01\x8f\xa4i\x12W\xdc\xad\x1bv\x05\xcd\
-\xfcY=\x16\x07;\xd5\x19b\x15\x92D\xaf\xea\xe1\xcb\
-\xdf=\xdc\xff\xea\x17\xf5{ \xfaCB6\x85s9\
-.\x82\x11vi\xe3cr\xc3\xb1X\x00C\xa9m\xc1\
-Kw\xc1\x1fD\x0fR\x1c\xd8\x1a\xe3\xa6sk\xbc\x95\
-\xdb>\xd8\xf4\x8a\xd6n\xd9H\xd7\xf8\x93\xf6F\x887\
-\xe7\x09\xc0\xd2\x1d\xeb\xc0\xa6S;>#g\x22\x00\xdd\
-\xd5\x0f\xa5\x07\xfb\x18\x08\x0b\x0e\x9f\xf2i\x84t@\x98\
-\x17\x1b\xa4\xa34\x0a6\xde\x85\xa30\xa8|\x22u{\
-\x1dP\x0c7_\xb4\x1b\x95M\xef\xde\xb1\xc1E\x0e\x8e\
-\xc3\x15\xfa\x08t!\x86\xae\xd0Q\xdb$\x00'm\x8a\
-\xe3\xab\xbd\xfaD\xdf\x93!q\x1d\x83\xbb\x80\xfa\xe3\x88\
-\x0f\x96\xee/\x04\x8a\xed;\x0ad\xdd\x95\xf0\xa7~\x99\
-,\x5c\x11\x10\xd7\x17\x11\x22\xe4\x87\x7f`\xa5\xbc\xe3\xa9\
-;\x87w>\xf3\xa4n\xfe\x1f\x1e\xee\x82\xe2gK\x15\
-\x0b?SB!\x1c\xfe-\xe4\xd6\xfc\xaa\xa3F\xd7\xbb\
-$\xf2\xf2\xbe\x8d'\x013.9\x87\x11\x9fm\xbbX\
-\xf4\x94\xc6j\xbb\xf6\xea\xdb\xbeJ\xbd\xe5\xba\x8a\xef\x16\
-\xfb\xfd\x92\xc76\xaf7\xab}\xea\xd8\x1e\xb3\x1f\xd3\x9f\
-\xb3\x1f[_\xda\xb3n+\xb7\xdd\x9a\x18\xc8\xa7\xdb\xc9\
-\xc6\xd8\x91\x18\xc34#\xd5,\xe2X1X^|\xf9\
-e\xdb\xbdf0w0\xf3\xf8\x13\x9c\x1a\x9e\x97\x9e\x07\
-jj\xceb\x8f)'\xf3\xcc\x14\xe9\x87\x0bN<\xb0\
-K\x0e\x03\xddy\x04\xa5\x1d\xe2e\x22\xe9\x96B|\xf6\
-3 \xa9G\x12\xaf\xe8\x1b\x02_\xfd\x03\x7fC\xe0\xd6\
-\x13\xfa\xf1\x22\xa9\x07\x03\x81\x84\x1by\x0f\xa2\xb4\xc4c\
-K\x94\xc0\xb8\xd1\xa8m\x0d\x11\xb2\x85\x0f\x1f\x8cR\xc3\
-\xd0\xf9c\xd9\x1c\xd8r\x1c\xbc3!v\xde\x8e$3\
-\xc7\x82\xc21(\xaf\xfd\x97V\xec7a\xcb\xf8\xb8\x11\
-\x85~\xa4\xd0Q\x95=\x0e\xda\x88\xd9\x9d\xda\x89x\xb1\
-\x83q\xc67/\xfa\x9a\xc1c\xf7\x89\x03\x91\x18\x14\xea\
-y\x80TW;\x835\xf2Hn\xf8\xb4E\xbd\xf8\x8f\
-\x18\x8e?\xf8\x17\xff:\x08\x0c_\xf9\xa9\xe3\x1f@&\
-E\xac\xe8\xc7<\xc0\xc9\x91\xb3\x95]\xb1\xb0Sw\x00\
-$<@\xec \xb5x\xe8\x84\xee;\xfe*\xe2\xa4\x09\
-.\x7f]\x10\xf4\xed8f\x8c\xa3\x0a\x0c\xe7\x03=\xee\
-\xe7\xd1\xe1\xf3o\xbb\xa7\x8b\x86|\xc6\x00>>\xbc\xd4\
-\x02%\xf95\x0fN\xee\xbc\xbc\xff2\xb6\xae\x0e\xbfN\
-\xe6rP\x83;U\x8a\xc1\x7f\x8f\xe3\x94\xff[\xf6G\
-\x7f\x04\xda\xbfs\xfd\xe8\xa3\x84\xb1\xfd\xff(\xf8\xcf\xe5\
-\x9aq\xb3\xdc\x1cf\x1d\xf2v\x14[7\x8dmD0\
-\x0b\xd6\xed\x87\x87\x97^\xd6\x9d?\xfae\x93\x06O\xe1\
-<\xb7<3\x19\xf7`X\x8f\x98\xf1\xd4-\xa0d\xa3\
-\xd2\x0b\xcbxp`\x9f\x18c[d\x04'\xd4\xf5\xc7\
-\x16\xeb|\xf2\x1fyw\xae\x91\xf3-\xfd\xfa\xd7\xfd\xaf\
-\xfd\xe1\xe1\xe1\x8b\xdfQ\x84Dom:S\xa0G\x1b\
-;\xeb_\xc45[\xe2\xc2g\x1f\xea\xa4\xbf\xf8,v\
-\xf6\xc5;-\xcc\xc0\x0f\xa7\xc1\x8ez\xf0\xaanL\xfb\
-\x0fD\xa8\x8b\xb1\xb76k\xfcj\xaes}s\x9e\x00\
-\x8c\x81\xe0\x8a\xcd\x18\x1c\x1d\x04\x19\x8cc\xc020\xd4\
-\x91\xc1j\xc8\x0b[\xbf^\xfde\x0c\x0c\xbd\xd0\xb6\xbb\
-f@\xa4U\x9d\xfdG\xa3\xbay\x8a\xc9a\xf2\xa7\x95\
-\xe2;u\xe5\xb2\xc4\x97\x1a\x7f\x0f\xfc1\x08}e\xdf\
-\xfc\x9a\xb3\x11\xc9\x8d\xfdb\xf0\xf6IC\xfc\xc3\x0f\x8f\
-\xdb\xde\xa9d\x06\x9f\xff\xf9$\xaeX\xe3\x8e<O!\
-d\x09,~\xc4\xe5\xae\xdeu\x0e\xa9\x1f7\x82\xd1a\
-\xb83\x0e\xd6\xfa\xa9d)\xfd\xa4\x00\xec\xc3\xc33\xfa\
-\xa5\xb2\x07\xc2\x92\x1b9\xb2\xb0\xf8+Jf7\xc5\xd8\
-\x90\xc7\x08\x9c\xd4\x97m\xf5\x5c\x08 \xf3\x16\x00\x05\xfe\
-\x96\xca\xd8y\xf9x\x8e\xba\x98\xb9\xae\x1d]}ko\
-\xbc\xb6_K\xfd(8\xce\x8d\xbb\xcd\xff\x5c\xbf\xeb\x80\
-;\xb6o\xc7\xf4\xec\xd3e\xb6\xab\xee\xf3\x96k\xdb\xde\
-\xf2m\xed{mt\xd53\x82\xe7\xf6\x1e_\xb1\x17l\
-\xeb\xd0?\xbc\xf8\x12\x8f\xd63\xee\x99V\x9e\x92\xfe\xa9\
-\x0d\x1a\xeb\x9cbL\xb2\xde8\xa6<\x98E\xa1\x89n\
-Y?\x98\xef\xcc\x1d\xac\xcc{\xaf\x0f\xf0\xa8]>\xe6\
-\x9e\xe46\xc1i\xa1\x10F\x957\x99\x83\xfe\x06\x81\xda\
-}\x22\xc0W\x88\xef\x7f\xed\x8f\x0fw\xde\xa1\x1f\x06{\
-\xea\xd9\xb1\x0at\xbe\xe2\x98\xb2f\x0d\xaftSh\x1a\
-\x9d_\xc5q\x8c*\xc3`\x99\x9c\xda\x184Q\x0c\xbb\
-\x1a\xf5\xb1\x7f\x1b\xd2F\x1c\xfen5\xa6tp-;\
-^\xc6\xeb[\xa7\xd7\xaeo\xfe\x172\xefdq\xadN\
-\xf2\x18\xe8@\x10r\x11%\xccr\xfb~\xf1\xa7\x97\xc1\
-\xbbF\x1e\xed\xd5I\xfe\xd1a\xebx\xa8n\xa9\x87\x9f\
-\xc9\x16\xbe\xb4\xc2\xad\xc8\xe2q|\xe7\x0bW\xa7\xe9\xf0\
-\x22\x0e\x00\xa0\x83\xcf\xd3s\x89\x9f\x13lr\x08\x17\xf1\
-=H\xcd\xdd<\xc3\x17*\xe9\xa0\x1d'\xf7\x9cS\xc1\
-\xe1G(\xeap1ii\xb7,\xfe:\x9d\x1b\x07\x16\
-#\x94\xa6\xd0]\xfc\xb8\xd3\x7f\xfa\x1e\xd7\x97\xe1\x05u\
-a\xe2\xd8\x09\xeb\xca\xdd\x18\xd43\x16\xb9\xc7\xb4\x98\xd9\
-\xbe\x87\xdf\xda\xc1\xc0\xb1\xe5)\xdf[\xf5\xa3?\x02=\
-\xde{\xf59\xd1\xf6\xfc.\xeb\xbf\xcbl\xe7\xc4;\x86\
-i\x1e\xc7\xec\xb3\xfeJ9x\xc2\xac\xde\xfd\xfa\x9f9\
-2m.\x8c\xd9\xf9iXg\xcdKz\x0b\xc0\x85\x89\
-+\xa5\xc7=\xb5\x94\xc1pBc\x96\xa1\xc9\xc9m\x99\
-\x1b\xf2\xe1\xc2?\x96\x81\xf7\x1c\x01\x1a\xadS\x1c\xdcJ\
-\xc6\xa1.l\xb0\x8d\x9b\x08\x7f\xeeGF\xe7?|z\
-<\xf0\xe4\xc5\xbar\xff[_:<\xf8\xd6\xd7\x06\x8d\
-2#\x94J\xe9\x17\x1f\x14V&n\xf4\x02KW\x0c\
-\xf2p\x8f\x0e\xb3#QC\xca&e\xf1Qs\x95\x89\
-\x0f\xc3\xba\xc6\xd4\x96\xd0\xe4\x80\xff\x88\x09\xd4\x06t\xd7\
-\xbf\xdc\x98'\x00tP\xfaf\x1d\x10\xb4\xa3\xa4\xcf\xa6\
-\x91 \x83?\xd4F\xa7\xe37\x06\xab\xfd\x07O]K\
-p\xc1\x7f\xd0\x82\x81\xb6\x03\xd8\xf1\xa4\xe85dk\xe3\
-\xf1$\xf0)\x00\x00@\x00IDAT\xc4;\x17c\
-\x1d\x1d\x7f\xb5\xe4\x97\xf7\xfe7\xf9\x0f\xa7\x0e\xea\xf8\xe5\
-\xf1\xbcs\x9b\x12h|\x1e\xddS\xc6\xcd\xf2`\x98*\
-\x99\xb9S\x00\xe5\xef\xf0\xf3\xfc\x8f6~\xce_\xb2r\
-\xf2\xdd\xfe8F\x00\x98\xbc.\xdc\xe5{\x7f8~}\
-`\x98\x0b\x02\x10\xd8\xf8\x12\xe03\xfa\xf3\xbf9\x06j\
-s!\xe1\x03ET\x15\xe2\x0d\x11\xfd\xf6\xf8\xcem\xe4\
-\xf8\x92^\xe4\xda\xab\x0fi\xb6[\xdd\xb6\xed\xf0\x1c\xb7\
-\xa9\xeca&\xf3\x9b.v\x7f\xdf\xf4D\x1ea\x02\x8f\
-j\x9f\x1e\x15Ow\xed\x14\xdfe\xf6c\xb6c\xfa9\
-f1\x1d\x99s\x8d\xadC\xd6\x17\x0ar|E\x7f\x1d\
-\x90\xcf\xd7x\x8e\xb9\xd6\xfc`N\xf1b~\x0drx\
-\x90\x99\xa9\xd5!x\xf5\xc3a(\xe7\xa7\x8d\xce\xc57\
-\x08\x83\x84\xaa\xce,,~\xff\x0f\x85\xd8G\x00\xf2@\
-\xec\xc4f\xbd\x18\xd9E\x0ft\xacM\x0f\xbe\xf3U5\
-^>\xdcz\xdb\xf3\xcb\xdc\xb6\xb70\x0d\xe3\x9aE\xc2\
-\xfb\x0e\x13\x05\x80\x22\xf5`\xa0\xc2P?\xd7Af\x0b\
-\x003\xebFd\xb6\x91\x05\xd6\xff\x10\x0f\xfb8\x8e+\
-\x06I\xb0I\xbf$\x18\xd3\xb5\xde\xde\x98\x0b\x00\xc6\x03\
-\x9d\xeas\x94\xeaL&u\xaa\x06\xf8:\x0c\xd3W\xe9\
-\xccI/\xe7\xf8w\x08\xcb\x86B\xc5\x83xp\xc7{\
-\x0c\x06\x053\x0fA\xf17\x16Y\x1cT\xd6dl\xd9\
-fg\x19\xf6\xf4\xf6g\x80c\xafOs2\xbd8c\
-3\xb3\xf3!\x08\x83v\xe4\xdc R\x83$7\xfe\x99\
-s\xe8\xa0\xe8#\x1fj\xfe\x98\x0f\x17\x0b\xc6c\xab@\
-\x8e\xf8\x1b\x0fK8s\xd1\xa0\xb6\xe3&F\xd2\x02C\
-,\x07\xb6\xcc'\xff\x9f\xba\x97\xdf\xfc\xe7'Ky\xf9\
-\xb3\x03@\xc0M\xa5\xc7zR\x9d\x14\xd9\xef=\xbf\xea\
-\xd6\xe3\x15\xaa\xe2\xb7\xf6-\xeed\xe0\xc7\x0ch~\x8f\
-9\xcc\x1bJ\xff\xfd\xbaO\xe4uNn\xc70\xb3\xfe\
-\x5c.\x0e\xfc\x05\xbf\xf1\xb9\x99v\x08O\xcfx\xf1\x10\
-\x0d\x5c\x9e\x0a\xf0Y\x9c\xe4\xda\xcbm\xf0_\xf9\xc6\xb7\
-\xe3\xd6y\xeb\x133\xf3P\x97\xe0\x9e\x98\x9a# \x98\
-+TA{^{\xd5\x10\xa7\xe7\xbc\xec\x0fX\xb7d\
-\xf7\x8aa \xf3k\xf5\x89\xf3`\xf0S\xc11\xff\xe4\
-KXM\xf7\x80\xe5Dhx\xf0_\x82\x22:@V\
-\x0a\xe4\x07\xdf\xfb\xb6~0Hoa\xbc\xfd}2\x8e\
-\xcf\x0a9(\x04\xe0\xa4n-y$(\x137\x1b\xec\
-\x93\xb3\x0d\x96\x5c\x1d\x00 \x85\xe3\x85\xce\xe6\xc4\x1e\x04\
-\xaf\xd2;\x06y\x93\xa0\x0a\xd5\x12w\x8a3\xe9\x8d\xbb\
-\x01\x9b\x1bs\x01\xd0\xbe\xf0\xa0\x18\x839=\xc9vt\
-l\x86\xd4\xd2\x8a\x96a\xd62\x06\x0d\x03\xab.2-\
-\xb2GdYG=\xbb\x0b\x9bA\xb9b`^\xa9\x02\
-n{\xa9\x97\x00\x8c\xbb\xc4v\xce>\xe36{\xe9/\
-\xc4\xcf\x14\xf0]\xf9\xc8\xa1'9v3\x17\xda\x89\x80\
-\xbe'ol\xd6J\xe7\x8b\x01|%\xa0cbP\xf0\
-\xc5f\x9dk\x0c\x8a\xaf\xad\xeb~\x03\xa0N1\xcb\xd4\
-\xc7\xff!\xfa\xce\x8b\xfa]\x00y\xdc\xd7\xeap'\x09\
-ya3\x8d6\xdd\xedN\xbcya,\xa6\xf5\x8c\x01\
-w\xea\xeb\x80\xe7p\x95\xfb\xad\xfa\xb5\x1f\x81\xcb\x8e\xf3\
-\xb9\xac\xaf\x95\xe3*~{\xd8su\x97\xedG9Z\
-o\xb1\xf3c{l\xc5Q{\xdaP\x8f\xd7\xd6\xf7X\
-;\xb3\xebp\xf8\xf2\xd7\xbf\xc5t\x1c\x13\xd6l>\x89\
-\xf9\xcf\x02k\xe2yz\x0e\x12\xe6Zg\xb0\xd7\x11;\
-\x82PQ|KP\x0c'\xf0~\x92\xc8\x95\x08\xa5\xb6\
-!ps\xe0\x09\xec\xfd\xb0\xb7\xf9}\xba\x1cX\xafG\
-v.V4\x82f\x1d\xcb\x9a\xf4@\x7fH\xe8\x96~\
-9\xf0\xce;t\x11p\xe7n\xd8\xc5I\x09\xebZ\xdb\
-h},]\x19A\x10\x97\xc2\xb1\xb4\x958\x83\xa05\
-\xfb\x89q\xa8\x97\x1a\xbf\xea\xbc~\x9bj\xe5L\x1c)\
-\x13b\xc1\xe2w\xdd\xcb\x8d\xb9\x00p\x07\xba\xf3\xd7+\
-\xb6\x9e\x8c=\x9eF\xc7{\x80HnM\xa7\x1a\x97\x19\
-2\xc64\x83H<c0\x8d~\x1f\x93+\x03,\xfe\
-&\xf2\xb8X\xe3g\x9c\xd0\xc6/u\x18<\x90<\x08\
-\xd7\x1c\x1d\x968!\xd0\xc9w\xc4U\xdb\xfe\xb2Q\xfb\
-dm\x8c8\xe34\xc8\x13%\xee\xe3\xc3\x80>\xdb\xc3\
-\x93\xb5\x01\x81\x88\xfdc!\xa1\x91Q<\x8e\x0b\x8e\x00\
-\xc6k\xa3I\xcf\xcf\x01\x1f\xf4\xc7\x7f\xc0\x92\x01\xe7|\
-\xcf\x5cH\x91\xb5\x813\xff\xf5$A\x82\xe3\xdd\xd6\x07\
-}\xe4\xcf\xbfo}\xefE\xebL\x22\x22\xec\xc9\xc5n\
-\xb8\xbap,/+\xf3\xc9\x1f\x5c\xdb\xf5i_\xb4\x9e\
-1\xa7\xb8\xcb\xf1f\xd5\xdf\xef\xf9]\xf5\xb8\x1c\xdb\x9f\
-c\xfa\xab\xf2\x17\x7f\x8c\xef\xaa\xfa\xf2Q\xe3{\xcc\xbf\
-\xf6\x19_y\xcf\xaf'\xfe=\xdb\xd6/\xd3\x82\xed2\
-3\x9d\x07?\x00\x94\x1f\x01\xf2\x94\xcc|\x19S\x85)\
-\xf3\xe5\xaf\xeb\x09@\x5c2\xb7\xc7U\xbb\x97\x07\xd0\xcc\
-oU\xccE\x03\x85\x1d\xf0\xa5\xc6\xe2\x12'\xcf\xf3\xf9\
-\xe4\xee\x05B\xc1X\xbb\xf8\x97'\x10\xf2B\xc8\xe3\x83\
-\x11'\xc7n\xf9\xc0\x9f\xcc\xe4h\xda%\x88\x04\x91\x9b\
-\x7f\xd8\x0c\xd2\x8f\x05\xdd\xff\x9a~>\xf8\x9d\xef;\xdc\
-\xba\xf3\xa4\xf3%\x16y\xbb&\xbe\x13\x97\xae2\x9c\x83\
-\xbc\x22\x5c\x8dg8\x06\x95\xf2\x88,\xfe\x11.\xfa\x1b\
-8\xe29\xae]\x87\xb7\xa0\xa3\xd9}\xaa\xf5\xba\xd77\
-\xe6\x02 \x1d1\x0d\x90\xa9\x133x.vU\x06\x0a\
-\x03&\x03\xdb\xd6e\x80\xa8\xe5\xc1d\x851\xb4\xfd\x1a\
-4\x0c\x08\x0fF\xd5\x1d\x1c\xe6\x1c\x83\x16\xd8\xa2\xb74\
-F#\x06\x95u`KZ\x12\xcc$J\xb3\x83~\x9c\
-\xfc\xe5n\x1f\xf1\xdb\xdf\xe4\x19\xb0\xf6W;W\xd6\xd1\
-\x01c~\xfa\x13\xfc\xd3>\xfa\xda\xc0\x0b\x05\x04\x03k\
-\x91<`\x96\x0eG\xde\xe3\xc3O\x0e|B\xf8\x96\xbe\
-\xfb\xcf\xf7\xf8)\x99\x9a\xcaU_\xf7\xd3C\xfef$\
-}~\xb5\xccy(\xfe\xb7\xbe\xfb\x92l\xc2\x88\x87G\
-\x84\xce\xc7\xb9\x98f\xc4\x8b\xcc\xb1l\xe9\xf1\xc8dw\
-R5\xc9gm\xd7\x07\x1d\xaf\xb6\x01W\xaem!x\
-Kx\xcdG\xa0\xc7\xf45\x13\x5c\xc1\xf1q\xc6:\xc6\
-}LO\xda\xb5\xb5\xbelW\xc0\x1c\xc3mm\xcc\x0f\
-f\x14\xa5\x8f\xf9\xdd\xd8\xdb\x08\xdaYB\xfd\x95\xaf}\
-3sT\xb2\xef\xac\xed\x13.\xcd\x88\xb4\xc6|a\xce\
-6Ng\x10'k_\xd8\xcb\x16^\xd5\xe0\xdd\xd0F\
-\x13\xd6\x8f\xe0\xc7'\xfc\x8b2\xb1mk>\x84\xf3\xdc\
-\xf4\xc5\xbf\xa2\xb9\x8d]\x1c\xe3\xe6b\xac6:6#\
-\x13\xd7\xc9\xe6\xa1n6\x1ep\x11\xf0v}&\xe0\xc9\
-g\x14bA\x8f9OR\xbcF!M\x11\x91n\x18\
-\xa4\xaf\xceB\xda\xb88\xaf\x8d;`\xfb\x1bV\x06\xf6\
-\x90\xb8\x945V\xadV[\x7fQ\x13\xfd\xf5\xdc\xde\xa0\
-\x0b\x00u\x9d;{\xea\x08\xb5\xdd\xa1\x1a%\xe9lN\
-\x14\xb2Oz;\x0d\x17\xba\xdc]k\x108\xbc\xa5k\
-];&\xfd\xeb$S\xd3\xe5U\xba\xfa\x89\xd4\xb9\xe1\
-\x03\xf7\xa4w\x006\x03\xc3\x5cq!\x91\xe2dLn\
-\xf1'\x1f\xca\x1a_\xed\xfc\xcf\x93\x02[\xb5\xc1_\xfa\
-~\x8e\xc1\xef\xf7\xc3;\xb89\x18\xbc\xdf\xc8\x09:\x93\
-\x94;y\x19'\x8c\xfdE\xee}\xe3;}H\x84\x87\
-7U\x8e\x8f\xdf\x97\xe3\x02\x01c\xeao\xeb\x02\xc0g\
-}i\xc0\xb2\xb1/\xa2\x15(\xd7\x92\x09\x9d\xbe\xaa\x16\
-\x1de>\x91#W\xbf\xc5\xb5=\xfb\x14\xebc?\x00\
-\xb3<\xfb<\x0e\xb9\xf1\x1f\x07\xf7\x1b\xcdyj_N\
-\xd9\x1fE\xbe{1\xf6t\x97\xc5:\x07\x7f\x19\x06\xdb\
-\x9e\xbd\xfa\xad\x8d'\x02\x94\xad\x9e9\xec\x11\x9ea\xee\
-\x8b\x00MI\xd7\xe0\xfb\x81?\xdc\x07D:\xc9\xda|\
-\xf9\x1b\xfc\xd5\xbd\xb1\x0a,\x93\x11\xaf\xb5\xc4G\xb9\xf2\
-\x1e\xfbP;\x13\x9d\xa1\xfd\xd4\x0e\x7f\xe6\xbf\xe7\xa6j\
-\xe9\x99\xebC1\x11\xa1\xd3\xea\xc4\xd5=gw\xaaa\
-\xedz\xe4}\x1f\x13;\xe9\x98T\xa8\xec#:\x97\x18\
-MC\x9bf\xe6\xb4\xf6W\x7fC\xe0\xf6\xb3\xcf\x1dn\
-=\xa5\x9f\x10\xe7\x18\xdb\xc6\xb1.N\x8a\x11\xdb\xa1\x9a\
-\x84\xd4\x18|4\x1a\xa8\xfe\xc5\x0ba\xbbp\xb8\x15\xb6\
-\xee\xc9\xac\x83\x8f\x14\xb2\xe6\xa6\x96\xfd\xd5A\x03\xbc\xa6\
-\xdb\x1bs\x01\xd0\x8e\xca\xe0\xc8\xa8\xf0\xc0\x1e\x03$\x03\
-L\x9d\xe9\x9eg\xa0\xaf=V\xb1\x03\x02\xae\x0e\xa6\xea\
-\xa8\x196\x19@\x17\x07J\xf0\x9c\xeb\x06j\x10\xd2L\
-\x1cM6\x09\xa1\x95q\xd1\x8bT\xb2s\x97\xda\xfe\x0c\
-\xda\xfa\xcb\xd8\x0b\x820\x0b3\x8c\xebt\xc6?\xf9\xf8\
-1>\xbbeL\x06\xae\xe7,Y\xfb\xbb\xc1\xd1\x05\xcd\
-\x89\x9f\xf8\x83Y>n\xd7_\xf9\xe6m\x01\xd5\xde\xf3\
-$uK\x0b\x8f\x1eL\x8aQ\xcb\x88]\xd1\x933+\
-\x94\x09%K\xa7\xf67\xf5\x16\x000\xaf\x17\xd2\xdda\
-qqn\xd2\x09\xb2\xc4#\xa6J&W\xe4y\xeb~\
-T\x9e\xf8\xfaX9\xe7 f\x9fY\x9e\xfd\xdf\x92\xcf\
-?\x02\xed\x9f\xf3=^\x1f\xb2\xfd\xf9\xb8\xe2\xbe\x16^\
-|.\xcb\xeb\x18g\xfd\xe6#r\x14+\x90\xf1\x9a;\
-\xfe\xcf\x84`\x5c\xabr\x89:bujqA\xc0\xc4\
-c\xfb\xa5\xaf\xe93\x00\x92\xb8k\x9f\xd7\xb3\x900\x17\
-5\xc7\xf4\xe2\x84\x9f;\xf9\xe8<K=\x87\x06q\xf9\
-\x1d\x9f5B^\xd2=\xf4/\x07&\x16\x5c\xf6f\x0e\
-{\xfe\xab6G\xa2\xd5\xee\xddPc\xa6\xc4\xd6\xe2%\
-b4\x92\xcdh\xc8\xb1\xd9=\xf8\xf6W\xf5\xc4\xf1e\
-]\x08\xbc{\xd9\xaf\xa4KRB\xf1\x7f\x1c\x07\xe4\x1e\
-\xe3\xac\xcd`\x12\x1f>^l\xd7\xbdHf\xd1\xdb\xb8\
-\xfa\x8f\xfd\x91\xc2\xf9g\xdd\x09\xc6k\x8bw\x0e\xff\xd9\
-;\xf6\xeb\xba\xbd1\x17\x00\xe9\xfc\xf4MO\xbaKG\
-\xb6CG/1`\xe8\xc2\xd6\xdb\xeeL\xdb\x88\x0c\x04\
-\x86\x0f>c\x82x\x08\xc8\x1c\x9d\x86\xc3\xd0g\xd8\x8d\
-\xe1\x11\xf7\xe1\xcf\x82\x02\x8e\xa0\xf8\xe5d\xefaf=\
-\x13\x18\x03\x09J^f3\x88e\xcf\x96\x8b\x81\x00\xc9\
-I<\x5c\x94\xe3\xe6\xe2\xa4\xec\x8f\x97\x07=\x13\x86U\
-@`\xf2\xe4<\xcd\xacr*\xd2ab\xbe\xeb\xad{\
-{d\xc6E\xef\x95C\x9b\xa6\x96\xb4\xd6<yl\x97\
-\xdb\x91\xe8\xf2\xe9\x5c\x02xG\x0e\xdf\xfe\xee\xcb\x87\x97\
-\xf4U\xa5\xa7\xef\xdd\x11\xc7\xd8\x0f\xe5\xb0\xe6+\xa8\x8a\
-\x8fKD\xe1\xe2\x1b\xfd\x8a\x5c\x8e\xff\xc0\xf9\x98\xef\xc8\
-\xa8f\x8e\xca\xad\x87\xcbc\xa9\xde\x88\x18\x8f%\xf1\x1d\
-\xd2S\xfbr\xca\xbeCyTu\x8ckO\xbf\xa7;\
-J\xbcc\xd8\xf3\xdf\xd3m\xc7\x17\x98\xe2Z\xcf\xf4\xb5\
-\x1f\xb3\xbd\x0a+E|FM[\xb7\xf9\xbd\xe3\xbf\x80\
-\x1f\x0df\x86\xf9\xc7\x84\xf9\xfd?\xfe\x0a\x936E5\
-\xf6\xdc\x180\xf3;\xdfp\x0a\xa8P\x9f\xb8\x99\xa6\xba\
-\x02g\xba\xe5\xf3>x\xc0\xb0\xa0,\xb3^\xf8\x09\xe2\
-\xb0Jif#9&\xb4YW\x90YH\x5c\xa4\xd5\
-\x7f\xd2\x1c+\xcd\xe43\x10\xb2\x11)y^\x5c\xe7p\
-\xe4\x1b\x02\xbc\xedx\xebm\xfas\xe2\xda\xab\x15!\x09\
-n\xbc\x11T\xb2\xa7\xc8iG\xc7\xb6\x05\x1fE\x1a\xc7\
-m\x91M$o\xebW_\xa8\xc9\xad\xfc\xac\x89\x03\xea\
-\x10\xe4rSJ{\xec\x06\xecO:\xb9\x9d\xd6Nj\
-\xa7\xbbC\xc7^V\xa6\xf6\x84\x1a\xfa\xc8\xe9\xdc\xea;\
-\xb8\xe2#\x9b\x06\xcb\x18G\x1e$\x1e\x83\xde\x0c.\xdc\
-\x05^\xfc\x1d\xa4\x03*\xb6pE\xe7<g\xffq\xf2\
-\xf7\x80\x13\x11X\xe25&\xa9.\xfb$\xbd\xe3\x08\xec\
-I\xaa\x05\xa4\x93\xd8z\xd9o\xeb\x87\xbd\xad#/p\
-\x9c\xec%\xde\xd6\xd5\xbd;_\xf1|\xf2w\x00\xcdv\
-0L7\x12`\xa0\xeb\xbfsp\x5cV\x0d\xday\x02\
-\x00.\x17.\xf5\xe1bA2\xf9\xaa\xe6N\xe1w\xff\
-\xe8\xab\xfai`\xc5\x93\x0eo\xb8(\xad\xd3\x22lb\
-&n\xb5\xc2\x8d\x1d\xef#T,[\xec\xb6\xbdz\xbf\
-%\xed\x1d\x81\xf9xm\xe5=\xfcUt[\xbeS\xed\
-\xabp\x9f\xc2\xee\xc5:\xe5\xb3g\x9fy\xb0\xf7\x03}\
-\xe7`gLy\xd0\xcd\xf2\x82a\x8aM\xc5S\x8ev\
-\xa6\x9d}j\x06\x0a\x076\xca\x97\xbf\xfe\xcd\xc3\xb7\xf5\
-\x84\x8d\xd9\xed9\x22}V\x0b\x00L@\xc3\x0c\xf7[\
-|c\x1e\x81\xcd\xdd\xb3\xec\xf6\x09\xce[0L\xd4%\
-\x11i7\x8f\xe9\xa0u\x0a\xc2\xfaBb\xf02\xe9\xbd\
-\x1e\xc8\xcaj\xe0E@X\xf0\xdd\xba\x01>\xff\xcd\x83\
-O}\x07\xd8\xe1\xf1{\xf0\xca\xf7\xf4\x83A_F\x18\
-\xa6b\xe1t\x16#\xd5\xca\xa9m\x9d\xf7A\x8a\xe4\x81\
-\xc5\xe1\x86\xc0\xae\xcag`/\xca\x81\xd8Q\x10\xfbC\
-?r\x1f\xd6k_\xdd\xa0\x0b\x80tl\x87\x00\x1df\
-Y\x9d\xeb\x8e\x1d]\x85\xcc?\x0arO0\x0c\x02d\
-UX.\xc8\xd6\x0dB\xeer\x83\x01\x05Np^\xf5\
-Q\xcd\x7fs\x0d\xb9\xf1\x8cJh\xe3\x11\x17wd5\
-\x9a\xeb,;\xcf\xc5Y1'\x8e\xe5\xfd{_\xa9{\
-:y\x82\xdf\xe6\x91\xbf\xd9\x15\x9d}\xcb\xd9^\xb2N\
-\xde|\x98\x8f\x1c\xb5\xb9\xedGj\x10\xf6\xc3|\xc96\
-y\xc9NN\x9c\xf0\xd9i\xfesK`Y8\xce\xe8\
-\xc3\x0f}\xfe\xfc\xa8\xcc~\xbf3\x1f\x08\xfc\x7f\xfe\xe0\
-+~\xfb\xc1\x7f\x1f@~\xe4\x92c(V\xf9\x10\x8d\
-O:s\xbc\xf8j\xdf\x9d;\xfa\xf1 \x1fT\xc2\xe8\
-W\xc3\xee\xdfw\x8d\xcd\xfb!\x1b\xf6\xbe\xc8\x80R[\
-Z\xa7\xb7\xc9\x83\xfd\xbez\xa9\xef\xb6\xbe:\xd3\xe3\xf7\
-\xd8\xe6H{[\x8ea\xf6\xf4\xd5m9\xdan\xbf\xec\
-\xd5\xc5l\xebr\x9eS_\xe6\xbb\xb5\xbd\x9669\xcc\
-\xa5\xed97\xecmWn]\xfd\x9e_u[lf\
-\xc1\x1a\xb7\x1f\x06$\x15\x7f\x13`\xe4\x94o\x040c\
-\x0e\x87\x7f\xfa/tbd~\xdbM\xf3\x87\x7f\xcc\x1b\
-\xcf\x1d.\xd0#\xa2+3:7\xc0t\xe5\xe7\x11b\
-\xf7\x99\x9a\x97\xec\xe6\x82\x85\x0f\x1c\xb8\xad\x0aw|U\
-\xb2\x1d:Z\xb8\xaa\xb6\xbb\xed\xc9\xd3\xcb\x8b,]f\
-\xd0\x0a\xeaR\x0e\x87]8\x067qdx\xf8\xca\x8b\
-\x87\xfb\xdf\xfc\x92>p<\xfe\x9a \xf9\x8c\xc2\xf1\x1c\
-\xe9\x18\xeb}\x85Le\x96}\xdc\xcb\x97`B\x88[\
-P\xfb\x93\xc8\x90\xed]=J\xffG\x01+>\x92Q\
-\xde\x90\xd2ap3vg\xf4S\x87X\x07\xd8:\x18\
-r\xa2Y\xf5\xec\xf6\xe8\xd4\xd1\xc1c\x9cH=\x06\x17\
-\x9c\xb2u\xf2\xc2\xd5)5\x5clCo\x1f[\xe5\x84\
-\xbf\x8fj\xea\x0e\x99\xe8r\xb8+\x97\x1b\x87\xe6\xcaI\
-\xbe\xb1\x16\x9dz\x8b0\x14j\x8b\x8a\xc3\x07\x82\xec\xab\
-}\xb1\x8e^\x8d\x8a\xf3\xb3N\xcc\xd2\x9a\x8f\xbb~#\
-|\xe2G\xf2\xdb\x0d\xb2\xe9\xbfN\xf2Y8\x98\xf4~\
-\x8f\x9f\x93\xbb\xf7\x83#\x0a\x08\x7f\xeapp\x1c\xe27\
-\xfe \x09\x17\x04\x5c\x15\x08Ga\x1f\xfe\xc9\x1f}9\
-_\x1e\xd0\x95\x84\xf3\x90\x9e?\x10\xe44d7\x936\
-\xc4\xe1d\xdf\xe2\xe3\xd9\x86j\xe7\xa1\xfd\xa8~9f\
-\x13\xe6-\xf1\x8d=\x02\xf4\xc1U^olv\x17\xa3\
-\x91g\xef\xe4\xb79_D\xbe\xfe\x16\xfc\xa7\x8as\xd8\
-\x80\x9c\xe38\xa6\xb3if\xab\xfc\xcf\xfe\xe8O\xc6L\
-\x06\xd9e\xbc\xd61\xafd\xe1\xc2\x9d\x15K3\x08`\
-\x0ab\xef\x22F\xaenzQ\xc9\xdc\x9e\xf7\xc1\xeb\x9d\
-l\x99\xedp\x07\x03\xa5\xa9\xd827U\xe7\x83\xc6 \
-\x07\x0a@e\xb9\x0dO\xe3\xb3Z\xc5\xaf\xfa\xceo\xaf\
-!U\xea\x11\xe2\xc3o\xfc\x7f\xfa\xe1@=\xf1\xa8\x0e\
-\xd6\xca\xec\xc3h\xd8\x9f6\xfb\x8d}\xd4\xdd\x9f\xc5\xc7\
-Ya\x0fF[\xcb\xa1\x8c\x7f\xb2\xcd\x9e,\xfe\xeb\x1e\
-\xd8\xe5\xbaon\xccg\x00\xe8\xa0\xa5s\xe9\xd4\x8ch\
-\x0f\x00\xfa,\x1d\xab!:\x0d\x08\xeb\x86\xcd\xfa\xa5s\
-M0\xfa\x96\xc10\x06\xb3\xb0\xc5\xa5\x0e\x04\x9e\x0cy\
-\xda\xe0U\x99\x9cj\x08\x98T\xf0c\x92\xd4\xdf\x03V\
-\x89\xdb\x1f\xbf\x9d\xb2<\xb2\xc36N\xbe\x9ch\xd9E\
-\xdf\xd9[\x97\x81J8G$g\xe41\xd1sl\xa4\
-#\xbe\xe3q\xc7N\x1bJmz\xa5\xafL\xfc\x84@\
-\xa1\xe0!O\x88\xe6\x0b\x02\x9f\xd1\xd1;\x072\x8f\xec\
-\xab\x0d\xe9\xfa\x94\x00\xde\x7f\xfc\xcf\xb5P9!\xc1\xe1\
-\x1c\x0d\xea\xdbwu9\xa1\xb8}\xca\x88\x8ex\x8e9\
-\xb0\xc5\xcf\xfa\xca\xb3\xad\xbers\xa1\xbd\xd5\xd56\xd7\
-s\xacY_\xb9\xf6\xb6\xbf\x1f\xebS9\xbe^\xfb\xb1\
-}\xee\xf1\xaf\xfd\xb28{\xb6=]\xb9\xf6\xea\xab\xe0\
-\xf7\xb0\xdb|\x89\x01n\x8b\xdd\xb6\xe7\x5cf\xdb\xec;\
-\xeb\xcb[\xbf\xad\xad\xfa\xe2\x98\x17\xf9p_\xe6\x07S\
-\xc4\xbf\xa5\xc1\xb4\x22?\xd9y\xb9\xb8\xf1\xf0\xf0\xcfx\
-\x02\xc0\xfc\xd6\xe4\xf1\xf4\xd2B\x80\x9f\x8bj`\xb6\x80\
-a\xae2\x83\xbd&D\x1e\x00\xe9G\x1b_\xaf\x01j\
-\xb3\x9e0\x7f`\xd6\x7f2\xf0:!\x88/\xf0\xf38\
-Q\x10\x8e\x9dt\xf8\x1aE\x9d\xe2\x15\x0d\x0e\xf2\x9fj\
-\xac\x81\xb3^\xe1%\x8c\xec\xf0X/\x8d\x0b:\xac\xe6\
-GR\xd17\x04\x0e\xcf\xbe\xebp\xeb\xde3>.\xc6\
-\xc7im\x0bf\x17\x93\x8c\x8d\x14\x0bv$\xccq\x8d\
-N[\xed\xafc\x15\x0e~\xf0F5\xb04\xd6D\x07\
-\xfazW7\xe6\x02`\xed0\x06\x94\x87K\x06\xc5\xe8\
-H\x0f\x0a:\x9d\xf64 <\x10\xa4\x1c.\x1e)\xfe\
-\xc1\x1c\x86\x84q!X\xfc=l\xd6\x01\xd1\x813\x8f\
-\x97\xe6Rn\x86Hd]\xabs\xb6k\x1e\xe2*\xc6\
-\xfec\xc3p\xe4\xff\xd88'\xe3\x98\xc0\xd2\xc2\xdf|\
-\xad\x97\xb6\xfe\xd9?Z#\x7f\x03\xf3\xf8\xdcw\xef\x06\
-\xea\xa4\x0bByx\x1f\x07\x19q3\x15l\xf4\xe3\xc7\
-\xe4\xab\x93\xba\xae\xc2\xe3Jn\xf8\xe5\xe9\x00\x0b\x02w\
-V<=\xf0#J\x1e\xff\xeb\xf5\x80\x0f\xf0\xa8\xfe\xe2\
-W\xbe\xae|\xc9\xcf;d\x0e\xc7T\xb3\x7f\x1f\xa0\xc7\
-@Q\x8d\xa5FG\xc9\xe2\xc0ES\xefrV\x8c\x01\
-om\x1e\xfb\x11h_<\xf6@\x8f @\xc64\xf3\
-\x5c#n\x8c\xa1c\xb4\xa7\xec\xf5{T8x\xc8\x8b\
-\xb2\xc7\xc9ZB\xca\xc65\xf8T\xe3\x8a7\x17\x0b\xbf\
-\xab'kL)fI.\xce5?|\xe2f~\xc0\
-\x81M\xf1\x1eJ\xcf\xb1\x00\x873\x1c\xb6gN\xfa\x91\
-~H\x86q\x1c;Z\x22y\xa0\xb5\xc1k\x85\xda8\
-B\xb1D\x1d~\xf2\xd0\xbf\x85dAX\x18>\xbe\x08\
-\xb0B\x9b$@v\xe1\x93+*SX\x03\x17\xb9\x83\
-->\xfb\xf3\xf0\xbb_\xf5\xcf\x07\xdfz\xea\xed\xb1\xb1\
-\xa3\xc2\x8c%\xec\x82\x9c\xe3\x88Q\xbe\xc2e]\x87p\
-\x89\x8c\xc1A\xd0\xa6(\xa7Af\x9fa\x88\xac\xc6\x0a\
-\xac\xc3\xb5\xaeo\xcc\x05\x80\xc7\x81:\x87\x8e\xa20\xa0\
-\xc68\x1b}\xc6@Y\x17\x85.\x10\x1e\x822e\x18\
-d\x02\xda_^\xf4\xb5'\x11\x8aQh3h\x16\x7f\
-\x8f\xdc\xc4\xad\x0e(r\xdb\x03\x82v\xcd\x0f\x10<\xa3\
-\xf6\xdcu\x1e\xd1\xd9\xc7\x09\x8c\xc1\xca\xfe\x80\xd6\xe0d\
-\x1fs\x17\xbf\xda\x96\xfcu\xfe\xc5\xd7/s\xf3\xe8=\
->\xcb\xd3\x02\x8e\x11w\x0e\x9c\xc4\xcdJ \x1e\xff\x0b\
-\xa7\xbb\x80p\x85\x83\x93\xfb\xed\xf1\x8b\x80,4,>\
-\x99\xecB\xf1h\x0e.\xbd\xf8\xb9\xdf[\xc2\xbd\xfbm\
-O\x1e~\xea\xa3\xef=|\xea#\xcf\x1f~B\xf5\x8f\
-~\xe0]\xc6x\x02)J\xefX86\x04\x222\x9f\
-B\xb6]:jsJ?\xcbj\x1e-\xe6:j=\
-\xcf\xd0\x98\xe7\xa1\xdf<\xd4ey^f#\xe3S\xf6\
-G\xb1W{1\xf6t\x97\xc5:\x07\x7f\x19\xa6\xe3\xa1\
-u\xb1\xdb\xfa\xb2\x1c\xb0\x15_\x5c\xdb\xc7\xea\xd9g\xc6\
- \xf7\x05\x869u\xa1x\x0eES\xbf\xda=\x8f\x99\
-\x90*\xcc\x15\x11\x1d~\xef\x0f\xbf|\xf8\x8e~c\x83\
-\xcf\xf9`\xf7[\x00\x9eHi\xfb\x1b7\xcc-Mx\
-\xf8V\x0cy\xc0\x03\x18R\xd6\x00\xc9\xfa\x8f\xbe\xba\xd6\
-\xa0p\xd62\xe1y\xeb}@\xd7\x12W\xb5\xb2fP\
-\xe3\x03U\xef\xfa\xed\xaf\xb6\xcf\xa9&Tcy\xda\x88\
-A\xaf\x91@\xd6\xc0pE\xadm\x12\x03$\x18m\xb9\
-\xbf\xa8\xdf?\xe0\x83\x81\xcf\xe8\xf7\x02\xec\x8b:+\x19\
-\xf8\xb1g\xb1\xd1\x82x)\xb2K\xd5\xa7\x1796\xd5\
-\x09T\x7f\xb9\xd8\x16\xf0\xe2]\xfb\xaa\xb8\xde\xd2\x8d\xb9\
-\x00h\x17\xb7\xf6(P\xdf\xb4\x13;Pl\xf7@\xca\
-`\xa5\xfb2x\x90@1|(\xa9\xcbw\xa1\xce\xa8\
-a\xe8\xb901\x96\xc7\xd8h00p\x10\x1dk\xca\
-\x03\x9b\xed\xa9\x90\x13\x1f%S9\xb5\xe3k\xe0:o\
-!\xd6\x1a\xbf\x10\x04\x19y\x89\xafx\x96\x15\x9f\x13>\
-|\xce\x8f\x1b\x01\xf8\xf4\x01@\x16\x06?\x9a#\x15f\
-\xa6&d\xf7\xdb\xbb\xe6\x09*#\x1c|\xd5\x8f\xc2\xc5\
-\x02m\xb2\xd5\xdd=_\x01\xa4\x8d\xfe\xfdo\xbfw\xf8\
-\xa5O|\xf0\xf0\x8b\x9f\xf8\xd0\xe1\xd3\x1f\xd6/y\x11\
-K.\xe4\x01\xa4\x05\x1dO\x09\xf8\xbb\x00\xf6e\xbf\x00\
-O\xc51\x94\xc4\xb6\x9e \xb6\xcdO\x04f\xdbM\x90\
-sl\xde\xd8=y3b\xbe\xde=\xbcJ\xce\xe7b\
-\xcf\xc55\xf7\xe2[WO\x8dn\xab\x9f\xdb{v\xe6\
-\x08/\x8a\xe7\xe2\xa8;\x8f\xd0\xfd\xc3\xdf\xfd\xa2\xe7\xed\
-C\xdd\xdd3\xbfs\xa1\xc3\x5c\x95\x91\xff\x83\xc0\xb1\x98\
-k&c#4\xf3\x1d\xb21\x07\x11\xbd\x9e\xd4\x09\x98\
-\x0a\x14\xf8\xf1!ah\x99\xe7ZY\xe4\xca\xc5\x0b1\
-Y\xb5\xf8'\xa3H\xc8\x01<\xa5\xbeM\x84v\x17\x03\
-\xe3\xa5p8\x1c\xf4\x1a,\xf6\xc3`\xbcwXF\x16\
-\x11\xd6'\xe7\x0b\x91\x8al\x0f_\xfe\x9e~jT\x1f\
-0\xd6o\x05\x5cx\xba \xb3\xfd7\xd9\xcc\xba\xeej\
-t\xd0\x91\xd5h\xa9\xb2\xe4\xf84\xf4\xc2>j\xc2\xe7\
-x#]\xffrc.\x00\xe85w\xa4:\xaa\x1d\xea\
-\x81\xd5Q\xa9\xbe\x8a\xdd\x02}\xea\xbe\x95\xb6]\xbf\xd8\
-/\xf2\x08?FL\xf58C\xdb\x81\xe2\xbaq3^\
-l3f\x8a\xaf\x19\x1a/U\x19\xf4\x01w@U7\
-\xc7ir\x0cP\xeb\xc7\xc0.\x86\x89\xb8\x8e\xcd\x0cT\
-&\xa9?\x8c\xa3\xb9\x9a\xbf\xc0G@&\xa8&\xb1'\
-\x13w\xfe\xe4\xaf\xad~\xce\xd7\xbb\xa7T|rv\x8e\
-\x03\xaf\x93|~x\x88\xb6\xb2\x93o\x16\x80\xfb\x07\xbe\
-d\xf0\x8b?\xfe\x03\x87\xbf\xf0\xa7?~\xf8\xccG\x9f\
-W\x0b\xc6T\xe6#\xf6\x88\xe2\xcf\x1a\xf8 \x05\xc5\xb1\
-o\xe1\x83\x7f\xdd\x7f\xee\x8c\xf8\x16\xc0\xbaoq\xaa\xbd\
->\xc7\xda\xf8\xcdeno}f\xdcu\x94\xe7}\xdb\
-\xcb\xff\x94}\xcf\xe7*\xbac\xfc\xc7\xf4{\xdc\xe7b\
-\x8f\xe1\xb6}Z\x5ckb\xce\xf2^\x0e\x97\xe9\xb6\xbe\
-m\xb7\xae\xef\xdc\x9e\xe5\xda\xb75\x18\xe3\xc6x\xf5(\
-G\x1e\xc3\xd7\xf3\xc7\x98\xac1\xd89\x0f\xf2\x02\xf6\x7f\
-\xfd\xde\x1f\x18\xeb\x0bm\x14]W\x084h\xccAS\
-\xf6\xfc\xb0\xcf _\xae\xb7\x1d5s\xdf~\xc2\x81\x97\
-#\xd2\xb0:%\x7fF\x88\xd5\x82P\x0a\x9ay\x9d\xdc\
-\x90\xe9\x87\xb0\x9b\x01\x8d\xfd\xc1S\xa2M\x9a\xbe\xdeG\
-\xcf\x8b$\xc9o\x06\xf1\xdb\xc4\xbe\xc6\x88\xad8s\x09\
-\xdf\x1b\x17\x5c\x0e\xfa\xb1\xa0\x07\xba\x08\xb8\xfd\xb6w\x89\
-K\x7fH\x08.rqmjq\x8b\xcf\x01h\xc7\x8e\
-\xaay;>yP\x08\xb2\xf8\x0f\x1e\xa9Z\x10\x8d\x04\
-wC\xca\xcd\xb9\x00\xa0\xef\xe8\x14:ytNk\xab\
-\xa7\x81@{\xd3\xe7\xf6\xb0\xce\x83\xc4\xcd\x81\x81\x85\x09\
-\x1b\x1d2\x06\x06b\x03-~@\xaa\x96\x9b\xbfb7\
-\xdc\x18|L\xe0\x96\x8a\xd0Fn\xde\x0cRP\xa9\x91\
-\x99N>\xa9\x0fl\xe2\xe56\xdb\x93Q'wt\xdc\
-\x0d0{\xd8vM\xb0\x7f.\xe1\x9d\xf32A\xc0\x08\
-h\x13I\xeb?S\x9b+}K\xe3\xe4\xef\x89\xa2\x13\
-\xff}\xb5\xd9\xe7\xe7\x9e\xbas\xf8\x0b?\xfb\xf1\xc3\x9f\
-\xfb\xe9\x1f<\xbc\xebm\xf7\x9c\x9b\x9d\xe5Ea\x82\xb3\
-O\x14\xe7\xadz\xbdk@f\xbf\x08\x1cT\xbf\xde\x07\
-~\x96i\xfb\xb3\x05\xc2\xfam\x88\xf1\x19\x80\xc5\x1f\xc0\
-5.\xec\xc7\x9bQ\x1eW\xdc\xc7\xc9{\x15\xees\xb0\
-\xe7`\x8e\xf5\x0d\xbe\xa7\xfc\xb7\xf6\xb9=\xcb\x9e\xa8c\
-\x180g)\x99\xaf\x93,\x83m\xc2\xb1~\xf0\xeb\x9a\
-\xbf\xf7/\xbe\xe4;\xe2\xcc/me\xcb\x1d\xb2\xe6\x16\
-2$\x9e\x85\xdc\xb3G\x96\xc5\xa4\xb9\x81\xefI\x12\x1d\
-\x1f\x0e\xc4\x9a\xf5d\xb8A\x22\x1d\xc9Q\x837R\x1a\
-\xae \xb2\x1e\x15\xc3\x1a\xe2\xf5fqV\xdb\xd4\xda\x8c\
-q\xee\x137\x9cP\xaa\x98\xd9\xa4DI\xdev\xd2Z\
-\xe3\x22`\xe2\x12\x182\x15\xe1m5\xcf\xc0\xe9\xad\x80\
-\x07\xdf\xd4\x07\x8d\xf9\xf9\xe0;O\x18Sx\xeb\xb8\xf6\
-\x08\xa8\xb5\xe4\x8be\x94\x91'1F\xb4\xa56b\xd2\
-\xd7\xe5&\xd47\xe6\x02\x80\x89u\xa1\xc3\x19*\xd61\
-X\xb1\xb5[Q\xa7\xdd\x1a\x1c\xc3\xc9\x18\xc3\xe2C\x07\
-gxz\xccd\x03\xad\xfe\x01\xc3\x9f\xbb[\x87\xb2\xee\
-b\x8c\xf8\x83\xe3\xe4\xb6\xb4\xdc\xb6\x9b\xf3@/Fa\
-\x9a\xa2\xeb%\xce\x98 \x8b\xfb\x9a\xeb\x1a_`2\x1a\
-\xb3\x8bI\x0f\x1fm.B\xf4\xce\xbd~\x86\x17\x02G\
-\xf2\x89\x1e_0\xbe(\xb1M\x1b\xe1\xed\xe7UB\xcf\
-\x0b\xf8\x03@\xca\xed\x81\xde\xeb\x7f\xe6\xc9\xdb\x87\x7fC\
-w\xfb\xbf\xf5s\x1f?<s\xef\xae\xf7\xbf|\xec5\
-9\xfb\xc2=J)\xe0\xce\xc9\x1b\x159p\x9c8\xc6\
-\xfcN\xc0\xf6N\x9f\x93<9Q\xc0\xf4E;\xb9\xc6\
-\x86\xec~\xc2\xa0B{\xbeph\xdbq\x06_\x90\xd7\
-k\xcb~\x5cVN\xd9\xb7\xbe\xe0\xe7\xe3\xb6\xb5\xef\xb5\
-\xf7b\xec\xe9\xf6|\xab\xbb\x0a\xfe\x18v\x9b7\xb8c\
-\xd8Sq\xf7\xfc\xb6\xba\xcb\xda[\xdb\x1co\xb6U\xa6\
-\xde\x93\xebG-\x84\xff\xa9\x83<\x85\xc13\xeb\x99\xc7\
-,\x1b\xe6P}_\xfa\x7f\xf4O\xff0'lc\x85\
-\x13\x80\xbbv\xa6\x97/\x02\x84\xeb\x93\x02X1\xe5\xfd\
-xj\x19=s\xb3n\x89\xceM\xbe\x96\xbb\x8c\xb6:\
-\xcbT\xbbAZ\x13\xf2\xf9\x1d\xad\x07\x22\xea\x93\x00N\
-\xd2\x00\xc9\x18\xfaPj+\x0cZ|\x97\x93\x7f\x01\xa0\
-\x9d8\xb8\xe4(\xe0Z\xbc?\xf2\x06\x8f<\x8a\xe74\
-2\x89I\xdf\xe3\xca\xdb\x94<\x09\xb8\xf3\x8c\x9e\x04<\
-q/h\xe7\xe4\xccG\x16R\xfb`4+h\x88-\
-\xfe\x09\x1b\xe7\xc4\xe8^\xb5\xae\xadq\xdb\xbe\xce\xf5\x8d\
-\xb9\x00\xf0\xe8s\xbf\xa5S=l\xc6\xe0Y\x16\x901\
-p:\xa4R3H\xd7b\x08\x03tUe\x0c\x02\x1b\
-\xd0\xda2\xe4'\xa0!\xf1\x05\xb3\xe0*\x84\xdc\x93\xda\
-^\xd5\xbb\x81\x9f\xa7\xbb\xe3d`\x0a\xc0\x7f\xc6;\x18\
-\xf9[\x8fNP\xffq>\xebl\x1c\x18\xc1\x02\xd6\xc9\
-\x1f9\x0b\x09\xa4~\xbb\xc0\xfb\x90\x1d\xe1\xc3\x81\xde'\
-\xf2\x8a\xa0J2'\xfe\xac<ZL\x1e\xe81\xff\x0f\
-\x1e\xfe\xca\xe7\x7f\xe4\xf0\xceg\x9e\x94\x1ar\xa6\x04>\
-\xcaX\xcdHq\xb1U\x1b\xa8\xfd)\x7f\x01\xd0\x81\xe5\
-@\xfaG\x82T\xcfw\xf7\xb6b\xeb\xfeIQ;\xfb\
-\xbb\xf4\x1f,\x13\xee\xbaL\xc4\xd7\x93\xe7k\xf5\xdd\xf3\
-\xdb\xd3q\xec\x8f\xe9\xb1\xbd\x9er./8^\xed\xdb\
-\xcbb\x9e\xc3y\x0e\x86\x183n\x96\xe7\xf8\xd5\xb7\xde\
-\xb3\x1d\xd3\xcd>\xb3\x0c\x9evt\xcc{\xcf\x0e\x94\x1b\
-\x1d\xb6q\xb2\x16F?\xeay\xf8\xcc\xc7>x\xf8\x85\
-O\x7f\xfc\xf0\xf7\xff\xd1\xefi\xc2\xf1\x9e<\x18\x9d\x9c\
-\xf9c\x1f\x9e\x88\x02QS4W\x5c\xdc\xb6q\xac\x09\
-`\xf4\xa2\xe2\xc4\x0e\x8e\x13\xb6\xf8x\xcbO\xb3\x7fP\
-\x11]0t\xac7`4\xb1\x87V5m8\xa0b\
-#\x8d*\x10R[\x8e\x90\xb6\x81(\x1c\xcfN\x09$\
-q\xd5\xe1I;UE \x869\xd8\xc8\xa0<\xb2\xf9\
-f\xe3;_;\x1c\x9ez\xdb\xe16\x7fM\xd0\xb9\x10\
-c\x8a\x8d\xaf\x8a\xa9I\xc3\xa4\xd5Q\xc3K\xf6A\x0d\
-O\xb5\x9bL0\x84\xbd)\xe5\xc6\x5c\x00\xa4O\xd4y\
-\xea\x1dO\x8a\xd6\xea\xa9t\x9b\x84Y\xa7\xc1\x90\x81O\
-\x97\x8fA\x81\xce\xf8\x89G\x9aL2\x19\x90\xc7\x00\x19\
-C!h52(\x86\xffh{\xac\x1a1\xf8E~\
-!7;1\xe99yj\x86\x11_'\xcc\xc6s,\
-\xd9\xcc#_\xe7\xd6\x9a\xf7\xf2II\x05\x1c'f\x0f\
-hsj\x0a3Y\xbd0\xa8\x06\xbb\x80\x85\x96L\x0c\
-\x13\xdb\x1bn|D\xc6\xe3~\xc9wd\xff\xf8\xfb\xde\
-~\xf8\x8f\xff\xb5\xcf\x1c~\xec\x03|\xda6\x91\x0c\x12\
-\x19\xb18~|\x9a\xa0\xd4\x86h\xd3\xb6\x8f\xaf\xda\x8e\
-\x85\xd6O\x16\x86\xdf\xb8\xe3\xe7I@O\xf6\x8e@^\
-*\xf8\xf2\x9a\x8f\x97\x0dGl\x89\x11\xbf\xe2Z\x97\xa3\
-\xed\xef\xa7\xbay\x7f?\xe5D.W\xcd\xeb*\xf8\x19\
-\x8b|q\x9c\xbc\xfaH\xcc\xf8W[\xcf\xd3l9\xe6\
-\xf6,\xc36\xb7\x91\x9b\xdf\xb1H`\xea\xd3\xfa\x18\xb6\
-z\xe6\x08#\x9dzy\xea\xad\x86\x86|\xe6\x166\xc9\
-\xb9!\xcf\x9c\xe0\x82\xfd\x9dO?y\xf8\xeb\x7f\xfe\x17\
-\x0e\xbf\xf8\xe9\x1f<\xfc\xed\xbf\xfb\xbf\x1e\xbe\xfc\xcd\xef\
-\x18\xe7\x13\xf3\xf0\xcd{\xf6w\xb4&hvN\x17\x06\
-2g\xee\xabV\xc2#\x18Z\x1c\xd1\x81\xe7\xca?%\
-\x17\x07\xb9\xc8 \x88y\xbd\xae`\x1f\xd9k\xd9 O\
-\x08Li\x89vbI[\xa4 \xacq<\xe9\x1b\xa7\
-TQ\x0c\x968\xd8i\xe4\xe5\x84\xa4 .\xc4\x88z\
-\xe5i\xc6Xs\x128:#\x84\xd37\x04xby\
-\xfbi}M\x90B\xdf\xa8r\x8a4\xf5\xcf\xd1\xcdi\
-\xc6\xe4m\xae\xd8\x88\x97&\xb9\x98\x22\xfe\x96\x87\x0d\xee\
-\x1bP\xd6\xde\xbe\x01;Co\xcd\x9d7\xc6\x87:s\
-t\xff\x18H\xec*\xaa\xbc7=\x06G!\xd3\x00\x19\
-\xc34\x03\xa6\xc7'c\xd1\x03b\x19\x98\xc3\x17\xc8\x1a\
-?1\x00\x8e\xb7\xaf\xcb\xc0(tN\x19\x9a\x91MX\
-\xff\x10y\xf2\xfbD[\xcf\x8c\xca\xf8K\xe7\xf7\xee\x04\
-\xe8\xa3\xc2\xb8\xf1\x19\x00\xfd\xe3\xd3\xfe\x0a\xcc\xd5\xbb\x9f\
-\x16\x08\xe7Gq\x9c\x84\xd1\x91DO\xfa\xae\x95\x8d\xf4\
-\xbc\xd7\xff\xa4\xb0\x7f\xf5\x17\x7f\xe4\xf0\xdf\xfc\xd5_:\
-\xfc\xd8\x07u\xf2g\xff\xba\x8f4F\x1b\x91\x01\xd4\xe3\
-\xbb@Hd\x85\xd9\xee\x0f%*\x11\xb0\xc4\xe1\xb1=\
-/N\xfe\x94\xd6\xe8(`r,\x83\xaf\xdcXmS\
-S\xaaw\xe3\xfbtC\xae\xdb\xd7\xe3H\xb5\xc7\xe4\x5c\
-\xeemN\xa7\xfc\xaf\x82?\x07{,^}\xcf\xdd\x0f\
-p\xe5\xaao\xebc\x1c\xc5\xd7\xbem\xcf\x9c\xc5\xb4\xde\
-r\xcf\xbe[[}Z\xcf\xf6y\xde {^y\xfe\
-d\x9e\xde\xd5U\x00\xdf\x9c\xb9#\x03\xf5]\xd9~\xea\
-\xe3\x1f<\xfc\xad\x7f\xef\xcf\x1d~\xedg?\x91\xbbz\
-\xae\x22xA\xc0\x15\xbe\xe6\xb7\xdf\x1a\xd0|\x87\x8f\x93\
-7S\x1f\xbd\xa7\xbet<!\xf4\x1a\xe79\x89\x0d \
-v\xbd(\x8a\x85\xc4\xdc\xe2\xc9\x00\xd9\xf8\xea\xc4~\xa0\
-\xa5\x91*\x12[\x8b\x09o\xd1\x1a\xe9S\x9bW\x0e\xc1\
-\x85\xe4\xc2\xbc\xc5\x16B\x98\x82#\x17t\xbc$\x0f\xa6\
-\xb4\xc1\xe0\xa3\xday\xe2\x04\xfe\xa5\xef\x1c\x1e|[O\
-\x03P\xaa,>\x17\xe4\xac+\xb6/1\xa3K\x93\xb8\
-X\x97P\x91\xd9\x0e^+\xae\xf9\xe6\xc6<\x01p\xaf\
-\xac}\x96\xceS\x9b\xbe\xf2\x89O\x12C\xc5\x9d\x8b\xde\
-\x83\xa9C\x87N\x8d\xbc\x0e\x96\xb4;\xfeRw\xc0\xe3\
-?\x06\x06\x01(\x86'\x86\x9b\x04\x12\xc8\xf1\xa5pm\
-\x9f\xa1\xb7\x0cR\x05\xb2Q\xa0\xc1\x95\xba\xfe\xf9\x9c\x81\
-\xb85!G \xbb\xd0D\xc3\xe4\xcc\xa0\x1d~\x8a\xe6\
-x\xdce\x0bp\x9b\x93\xacj/P\x02zZ\xebD\
-O\xb6:\xf3\x8e;\x05\xd9u\xe5\xfc\x81w<u\xf8\
-\x9b\x7f\xf1gr\xd7\xcf\xb9\xb8\xb7'\x12S\xe4\xe5c\
-\xb5N\xa09\xff\xa2H\xc0K\x86\xe2\xf9X;\xc1\xec\
-g\xdf\xb3G?\xcb\xf8\xae\xd8\x8b\xf2\xc2\xbb\x11X\x00\
-\xbc_\x1b\xfd\x9b\xd5|=\xb9\x5c\xd5\xf7q\xe3\xf7\x8e\
-\xe1\xb91\x8f\xe1\x8e\xe9\xe7X\xe7`\x8e\xe1\x8f\xf9\xee\
-\xe9\xb7\xba\xb6[\xcf1fy\xb6Wn=\xe3fy\
-\xcf\xce\xdceFd\xb6\x22\xa4\xc5zE\xa1f\x8e{\
-\x0eK.\x8e\xfa\x09\x19\xee\xe8b\xf9\xb7\xbf\xf0\xd3\x87\
-\xcf\x7f\xea\xa3\x87\xff\xea\x7f\xf8\xfb\x87?\xd1\xd3\x00\xb3\
-\xc9\x9d\x0bnb\xfa\xf6@\xed<\xbe\xb7\xd9k\x85\xd9\
-\x98;\xfa\xe78Z\x0b\xb4Z(\x96\xd6\x07\xcdy_\
-<\x90\x04W\x0d\xbap'#_\x040\x8f\xbd.\xc8\
-\x97\x1d`\x0d\x81c\xe2Z\x16#\xf8@\x18\x12\x1c\x1e\
-\xf6\x89\xb3d\x92cM\xb2\x94\xb8\xec?|\xd4*\xb6\
-U\xd765\xfb7|\xc1%V\xfcn\xdd\x7f\xe9\xf0\
-\xf0;\xfak\x89O\xeb\x06F\xc7i\xb8/\xdek\x1b\
-G\xe2\x85\xc0\xb9Jt\x91\x9a=\xc8\x8a9\xd6\xbd$\
-S\xc4\xb5\xafs\xbbu\xedw#}\xe8N\xd4\xbe\xd0\
-\x9f\xf3\xe0a\xf7\xda\x89\x1e%n\xa3\xa50`\x8a\xa7\
-w#/\xfeQy\x10\x83k\x19j\x0f\x1c\x06\x89\xf1\
-\x1e=\x91\x17\x7f\x1c\xc6 \xb5\xfb \xb1\xff \xb1\x7f\
-\x13\x13\x1c\xdf\x0b\xfePx\x10;\xd1eH\x9a\x1a\x95\
-\x04\x9e\x06\xb8\xa8\xb6<N\xfa\xb7s\xd9/S\xa2p\
-\xc2_\xf8\x85e\xda\xdf\x17\xe6\x81\xbe\x8e\xf7\xb9\x8f=\
-\x7f\xf8o\xb9\xeb\xd7#\x7f\x8ee\xa6\xa5\x5c\xd9\xaf\xb1\
-or\x8e8\xe5\xbb\xc4N\x06\xc3\x92\x93;*\x16\x07\
-\xee\xf0\xbbO\xad\xe7'\x00\xbd\xf3\x1f\x14\xf6\xe9\xc5\x81\
-\xaf\xf2\x1d\xbf\xd6\xd4\xe8)\xe5\x8b\xf6\xcd\xdf\xf6\xf8n\
-\xeb\xcb2\xbb\xca>\x94\xf72\xbe=[\xfd\xb6\xf5\xeb\
-\xc1n\xb9\xda\xder\x1e\xd3\xef\xe1\xb6\xbacm8;\
-\xaeN\xf1\xd7>\xd7\xc7x\x8f\xe9g_\xe4\x96\xad\xbc\
-\xd7>\xe6\x0b\x87\xf1\xe2\xa3fD\xfb\xd77Us\xb7\
-\xcf\xc5\xbf/\xf05\xab\xb4R\xa9\xcd\xefh\xc4\x96\xbf\
-\xdd\xf1\xe0\xf0#\x1fz\xef\xe1o\xfe\xf6\xaf\x1e>\xf6\
-\x81\xf7\xe4|-_>\x7f\xc3D\xf4\xdb\x00\x9e\x91\xf1\
-w\x00\xd9\xb2\x1efnzB\x8b\xd3\xf3]>\x9c\x9b\
-\xe1\xb6[\xa6\x98\x18GYw\xdb\x17\x15\xe4\xe4\xa2J\
-\xa9A\xe2\x13\xb3\xe3\xd0d\x8e\xfaX\x01`\xad\x1d\x84\
-\xe5\x1d\xf6\xe5\x98\x81E7x\xf1\x1f\xb4\x0e\xe3\x8b#\
-\x99}\xe2\x92\x0d\xa42\xd5/\x16F\x0e\x968b`\
-\x0d\xfc\xee\xd7|c\xb3R\x82P\x08o\xb3ae\x5c\
-\x82`\x96s\xf31\xab\xc0Yk\xc0\xe9e\xb2\x89\xe0\
-\x1a\x8b7\xe6\x02\xc0\x1dJ\xe7\xa90d:\x1c\xdc\xb9\
-\xd2er\x81Z;7\x9d,\xac;\x18\xcf\x10,m\
-\xf7wt\xf6\xb7\xfb\xc6_\x03\x82\xc1\x91\xf8\xc2J\xf6\
-\xfb\xf1\xd0\xb50\xa0$\x83\x09\xc5\xca\x09$?\xe7a\
-W\x9a\x03'^`\xc31\xf9\xabaWmD\xe4\x98\
-v\xf0u~\xc0\xfc\x99_\xe7\xc4\xe3\x7f\xfd\x88\x0f.\
-\xe3\xe4\xeb\xdf\x00\xb0\x82\x9f\xf5\x85_O\x01dC\xff\
-W~\xfec\x87\xbf\xf5\x97\x7f\xee\xf0\xdc3\xfaj\x9f\
-\x17\x03\x88Y\x8c\x18\x22\x04u`\x8f\xff\x1c7\xac\xd2\
-\x92\x0a\x07l\x14Pm\xf5;\xfe>>\x03\x83/\x8b\
-v}h\x97\x0f]\xe5\xf2\xa1\x03\xcf\x8b\xb2\xe7W\xec\
-\xe3\xae\x9b\xebe\xf5e9\x5c\xd5\xaf\xc7b\xebwY\
-\x8c\xda\xb6>\xe5\xaa\xfd\xb2\xfa\x1c,\x98\xf6\xc9^\xac\
-\xadn/\xde\x16C\xfbX\xd9b\x89\xbd\x87\xdf\xe2\xda\
-\x9ey\xab\xdb\xd6`\xd0\xb5l\xedm\x177c\xabk\
-][\xebrn\xeb\xce\x15&M\xde&\xcbZ\xc2\xac\
-\xc3\xc6\x13\x00MR\xcfW>\x04\xe8\xb7\x02l\xd3\x85\
-\x80\x14\xac5\xea\x88\xc3s\xcf\xde;\xfc\xe7\xff\xd6\xaf\
-\x1c>\xf7\xc9\x8fh\x1f8y\xe7\xae\xdd{3\xf6\xc9\
-s\xd32\xa4\xe2\x87\x976\xff\xf1\x19\xc5S\xd5`L\
-\x99\x93\x8e#9k+'\xdc\x80}\xb1\x80\x88\x93\x1d\
-#g\xc5\x93,~8\x5c\xc4i\x09\x9c\xf9\x87~\xf6\
-\xc5\x9d\xd7\xb0s\xfcz\xa7o'\xc7 \x8b\xe0\xa8}\
-\xac\x88\xb3\xc4\x97\x92\xa8\xe8\xf8\xb5\xd2o\x7fU\x7fU\
-\xf0\xe5\xc5\xc1}B\x10\xd9!\xea\x9a\xb2\x90\xca\xd4\xf3\
-\x87\x01\xf0\x80\x1de\x96\xab\xbb\xae\xf5\x8dz\x0b\x80>\
-\xca\x18\xc8\xa0\xf5\xb8\xf2p\xd2`\xf0XK'.\xe3\
-D:\x0f00Gd\x0f\x0e\x11\xc7=\x01z\x15\xca\
- \x85\xd1m\xd5\x1e\xea\x0e\xc1\x00\xc5\xc7^\x1e\x1b\xeb\
-\x90%\xc7\xc4\xc3\xea\xf8\x03\xb6\xc8\x0c8x\xad\x17\x0b\
-\x0d\xef\x9c*\xbb\xdaj\xbd\xbf\xe2G\x1c\x81\xfc\xa1\x1d\
-\xa0D\xe6\xe4O\x91\x1e\x1a~\x97\x1f\xc2`\xc0\x12\x83\
-\x05\xe0\x95\xc3\x7f\xf8\xaf\xfc\xc4\xe1/\xfd\xe9\x8f\x19\xdb\
-E\xdd\x8f\x10\x99<$\xc1\xfe\xfb1 w\xf5\xb0\x11\
-Cp^i\xa22g'Sk\xf8\x90\x89GA\xde\
-\xbb\xf3/\xaew\xfd\x06k\x83\xdf\xacs\xde\xceg\x0a\
-\x5c\xf0\xa8\x1bk\xa3~d\xcdS\xfc\xa7\xecWI\xe4\
-\x18\xd7\x9e~OwN\xacs\xfc\xf60\xed\xe3\xd6`\
-\xe6\xbe\x9ec\xef\xf9\xcf\xf6c\xf2\xecwL\xc6w\xb6\
-\x1d\xe3:\xa6\xdf\xfa\xce\xedY\xde\xfa\xcf\xb6Y.\x0e\
-\xddV\xbf\xd7f$gv\xe0Y\xc9\xb3\x98\x1d\xd3\x89\
->'s\xde\x8dSS\x17\xe8\x9a\xdfjd}Q\xad\
-6O\xe1\xf4\xb7\xb5\x0e\xff\xc1o|\xfe\xf0\xc1w?\
-w\xf8\xef\xff\xe7\xffS\x5c\x9c\x1a)\xf2W\x90\xac[\
-Y\x9b\xd4R$\xd6\x09mesT.\x08<W\x01\
-\xc7f\x1cM#\xc4g\x1e*\xc5\xd4\xdar\x9b+\x01\
-\xd4\xe4f\x22\xed\xf3Xsr\xb3\x0f\x8fRh\x10\xc1\
-G\xb4\xec\x8cMb\x1f\xf1\x16\x0e\xe7E0\xbd$\xb3\
-'\xaa\xdc,\x03\xfc\xf9@!\xfb \x0e\xec\xe0\x08\x88\
-\x9f\x8a\xdb\xca\xfd\xe1w\xf57I\xf4\x0d\x81\xc3\x13O\
-)\x9f\xd8\xb0\xb3\x0a:?\xcb\xc2\x93\xabe\x8e\x0e%\
-\x0c\xabG46\xdd\x80\xcd\x0d\xba\x00P\xc7x\x100\
-\x18xu\xc0d\x12bc\x0c\xbb\xc3\xdd\xaf\x0c\x18p\
-\xa3k\x87l\x9d\xc7\xcf\xb0k\x000&\xe2?\xb8h\
-\xc3$\xd7\xe1-\x0d\x03\xc6Z\xd7\x96gN\xc7\xc1\x7f\
-\xf8\x90\x8e\xe3\x90\xcc\xaas0\xda\xb6k\xe0\xeb*\x9f\
-\x9c\xb8\x11g\xb0\xfb\xa4-\xa3\xbf\xe2\xa7\x96O\xc8\xb2\
-w_8\xc1\xeb\xb7\xf4\x04\xd6\x04\xd5?~\xb1\x8f;\
-\x08\x08}\xf2G\x1e<t\xfe\x7f\xfa\x9b?s\xf8\xc2\
-'?\xecx\xe4\x9c\x99F,\x92\xe3\xba_\xfb\xa5\xe0\
-9A\xab-\x88\x7f\xf7\x1fa\x14\x8e\x0d\xbf\x22\xb8\x1c\
-\xcb\xa1\x9fO\xdc\xa8\xe0\xb8{\xf7\xd5C.\xfeY|\
-\xc0\xd1v|\xc9\xadg\xeeY\x06\xff8J\xe3>\x0e\
-\xeec\x9cot\xccs\xe2\x81\xe15\xf7\xc9\xb1\xfc\xd1\
-\x9f\xc3y\xcc\xff\x98\xef1\xfd1\x9e\xea_\xab\xdf1\
-\xffS|\xd8\x8bi]\xae\xb9\x9eq\xd53\x9b4\xe3\
-\x5c:\xb5\xa8=\xbf%\xdc\xe7\x8fk\xd5N\xad\x06<\
-Y\x17\xd6\xb6\x94\x87\xbf\xf8\xf9O\x1d~\xe0\xb9\xb7\x1d\
-\xfe\xeb\xbf\xf3\xbf\xe8\xad=\xcdj~\x04Dz&7\
-\x17\x11\xe1\xcfz\xc5\x19\x0f\xc9K\x86\xea^$\xf8\xa7\
-~\x9d\x90W2n\x15\xf0\x96\x7f\xb2(\xae\xdf\x0c\xe8\
-\x99\xd3'r\xc8\x08B0\xb8)\x15]K\x87\x9a\x9c\
-\x84C\xc5\x1a\x95<\x94\x0ff\x1eCZO[\x0aa\
-\x19\x83F\x09\x10zr\x0a~\xe1\x02g\x82\xe1nV\
-b\xc8\xf3{\xdfTNz\xfa\xc9\xd7\x04\x15\xd4\xa9$\
-\x11\x83\xb3\xa7\xce\xa2YK/\xfe\x11;\xe9\xc4\x1e\xf6\
-\xeb\xbf}\xf5j|\xad\xf7\x89A\xe2\xb1\xe2\x0eD\xa6\
-\x97\xbbx\xd1\xc1>y0\xf0T03p\x96\x81@\
-G\xa3\xc26d\x0f<\xc3\xb6\x03c\xf8\xd7\xe6`\xe8\
-r\xf2\xa2\xe9XbKN\xa9\x9b\x93\xdc\x12\xdf\xfe\x92\
-}\x89\x8b\x8e\xe8\xc2z\x10\xfb\xac\xefs\xb2'\xae,\
-\xcb{\x82#\x1e\x93\x8c\x7f\xe1\xe5\x0f\xf7h\xa8\xab\xc1\
-T\x81\x12>\x18\x1f\xe8\x89\x00\x17\x0dR\xab-Y\xdb\
-\xff\xe2/\xfd\xcc\xe1_\xfa\xf1\x0f\xe4\x18X/\x1f\xee\
-6\xd8wq\x98Y2%\x13R\x1a5\xfd\xa1Dk\
-q\xad}(T-\xfe\xb2U\xc6:\xdf\xf9\xe7\xd8\xac\
-\xfe\xfda p\xe5D.\x0e\x992\xf3U\xdeb\x82\
-|4\xdb9\x97=\xc6S\xf6=\x9f=\xdd1\x9e\xab\
-\xea\xf7\xb8\xd1\x1d\xe3\x99\xf1\xc70=\xbe\xad\x8f\xe1\xce\
-\x8d3\xc7\x9c\xe5-\xef\xb6}.?~\xcdu\xe6?\
-\xe6\x7fn\x9c=\x5c9g\x1br\xdb\xad\x9b\xc7l\xab\
-\xaeu\xd7\x1e\xda\x9c\xf8}Q-\x99\x0bg\x1e\xbc\xd1\
-\xf6\xdbyc\xe5`\x96\xdf\xd1\xc2\xc1\x0f\x04yN\x0a\
-\xc4ld\xe9\xf8\xbc\xbe&\xf8\xdd\x97_>\xfc\xed\xbf\
-\xf7\xbf)\x97\x9c\xbe\xf9\xc3\x80>a\xe2/`N\xde\
-D\xc3K'S.\x068\xb9z\xe6\xb3z\xe0\xa7\x13\
-'\xeb\x09x\xa3R\xeb\x00\xc7O\x95\x7f\x8f\xc4\x94\x1c\
-w\xd6,L\x92\xa1\xe0X\x8cx\xc4\x18F\xd58\xaa\
-*\xab\xf9\x06\x02\x7f\xe9{\x1ew&\xe4 m\xb6\xd8\
-%\xc3=r\xb3\xd1\x09\x0a\xa5\xdabPc\xeb`\xfe\
-\x86\x80\xdf\xf6\xd4\xd3\x80h\x1c\xcc\x18\xbc\xac\x13o\xf6\
-\x0f5\xfb\x04gt\x8b<<\xae{uc.\x00\x98\
-X\xeb\xe0X\xbb\xdfC\x81\xbe\xa3\xa7\xdc\x8f\xe9\xe4\xe0\
-\xd11\xb8\x19\xa4\xa3\xf3\xc1m\x06\x00\x8e\x99Z\xda\x12\
-G>\xa9\x01\xcb6\xf1\x12\xc3\x81\xa8\xc4\xc9\x7f\x0aj\
-^\xa6f\x8e\xc0\x13\xf0\xd07\xfep\xc0i*\xa6e\
-2\x0e\x1f\xff\xc8\x8e\xec\x5c\xa9;\x01?\xe2\x1f\xe1\x86\
-\xec\xf0\x5cY\x0b\xe3O\xf6:\x1d-&\xfa\xf9\xcc\xff\
-\xe47~\xea\xf0K?\xfa\x03N\xc8\x83:\xb3,\x09\
-\x12\xd7\xc9\xce'mq\xb0\xa3\xd9Yg\xc6>\x18:\
-\x8e\x07ru9>9N\xc8\x9c\xfc\xf7\x8a9'\x83\
-\x17;a\xcb3\x99vu\xb3}\x96\xb7\xfem\xcf\xf1\
-\xaa\x9b\xfd\x1e\x95\xfc8\xb9\xaf\x9a\xe39\xb9\x14\xd3\xfa\
-\xaa1\xc0_\xc5\xf7*\xd8\xe6r\xccgO\xbf\xa7+\
-\xcf\xb9\xf59\x1c`\x8a\x9b\xe5sc\x14\x87/c\x93\
-i\xd7\x0f\xd5z\xbaI\xc3\x5cg\xaa\xe5\xed\xb7\xf5i\
-\x1c>\xbe\xb0\xd7\x99\x96\xf5\x8b3.3\xd2\x17\x04\xf2\
-\xfb\xc2O\xff\xc8\xe1\x1b\xfa\xab\x81\xff\xdd\xff\xf4\x0f\xe5\
-,\xee\xf1\x96\x1e\xdf\xf5g=\xe3O\x05g\x06\xe3\x8b\
-F}\xe8\x84\x94\x05\x01u\x06\xf6I\x18Qm\xdf\x89\
-\xe3\xa7\x7f\x5c\x1c`\xe4f\xc3w\x1a\x0b\xd0\x04\xe1\x93\
-\x1fH\x93\x82\x83\xb3m\x94\xe8T\x16\x13\xf6\xa1\xb3\x1e\
-\xb8\xda\xc4\xe6\x02\xc7\xdeC\xa7\xe8\xec\x92tV\xa4\xb6\
-\xaf\xda\xaaa\xee1M\xc6 \xad=\xdcz\xe5E\xbd\
-%\xa0'\x01O\xbf\x83\x00z\x0d,\x829\xa9\xc2\x9b\
-\x0ay\x14\xe7\xd8\xc6\xf5\xafo\xcc\x05\x80\xbb1}\xa9\
-\xce\xa3\x17\xd5\xe1\x8c\x05\xfah\x0c\xa2\xe5\xae\x1e\xd5\xe8\
-;\x0f\x92\xa9\x8d\xba'\x89\x0e t\xe6\xe2D:\x06\
-\x99+\xeb\xd15\x0eH\x87\x93\x03\xff3\xf4\x92\x8ed\
-M\x92\xb8\x0f=\xe01\xb6\x92\x0f\x0d\xb2'qH!\
-\x11\x8bd_\xc5k\xe2\xfa\xab8\xb2\xf3\xf3\x9dLB\
-\x16\x0b$0<\xa2sL\xbb\x22S\xb4\xe5\xceA\x8b\
-\x08x\x9e\x02\xfc\xb5_\xf9\xe4\xe1\xcf~\xf6\x85\xe5\x18\
-\x80\xf1\x8f\x05\x19\xad\xf8\xdcI\xe8\x22\x82}\xe5\x84L\
-\xe91\xf1\x81\xb0\x86\x05)'\xea\xf9\xc3~\xd5\x0d\xc8\
-r\xe2\xe7XR\x16\x9e!\x97\xbf\xc7z~J0_\
-4\xf4\xc2\xc0$cSN\x9a3\xef\x8c\xd9\xca\xb3\xcf\
-l;\xa6/\xe6\x94\xbd\xb8\xd6\xc7\xf2\xb9\x8cg\xcf\xb6\
-\xa7k\x8c\xb9>\x17\x87\xcfe\xd8m\xde[\xec\xb6=\
-\xe7\xb0\x95\xb7\xd8m\xbb\xf8cz\xec\x97\xd9\xea\xbfW\
-\x1f\xf3\xdb\xea\xb7\xedm\xccSv\xf0\x1c\xb3y\x1co\
-9\xe66|\xbc\xf0\xa9\xdc\x18m\xcb\x10\xbb\xc9\xb5\xd1\
-\xfc\xcd\xc9\x9fX\xcc;\xe6'k\x08\xbf\x0e\xa8\xb7\x07\
-|\xc1\xaf\x96N\xf0\x00\xf8P\xb1\xbf\x05 \xc4o\xfe\
-\xfc\xa7\x0e_\xff\xf6w\x0f\x7f\xef\x7f\xff\x7f\x85fm\
-\x19\xeb\x8bZ\xdc\x180+\xb9k\x87+e\xe8X6\
-\x16\xb4t\xe2\xf5r\x04\x90\x97\xd62\xce\xf9^\x8f\x9c\
-\x14\x0eV\xc8\x16&`.\xc6WI\xfcB\xd0\xe58\
-\x98\x943\xba5\xa9}\x9ch\x8b_\xbb\xeb\xda7<\
-\x0a\xe0\xbd\x98\x8e\xd3\xfa\xbe\xbe|\xe3\x8e\xc3\xe0\x1b\xfb\
-4Z\x8e~_\x7fC@\x9f\x0b\xb8\xfd\xa4~0H\
-?Ff\xe4\xd8\xd8\x8d~\x22\xce\xd0Y\x96\xce\xc0\xb1\
-+\xa6\xbb\xe6\x9b\xfd\xdb\xb2k\xb8S\xee\x13:\x88\x8e\
-\xa3V\xf1$C\x18m\x8b4\xf5/r&\x91\xe5b\
-\xb6\xfe\xd6\x07_\xdc\x04]\xc6\x9a9\x81\xd5_\x03'\
-\xf1\xa5\x5c\xddc\x87H\xc5\x83j\x912\xb64\x1d\x16\
-8\x17,KC\xb8\xb4e7\x9fN\xf0,\x02\x9d\xc4\
-\xdc%\x00\xc6\xe6\x93\xbd\x03\x18\xc3\xc9\xdfw\x15\xc2\xff\
-\xc6O}\xf8\xf0o\x7f\xfeG\xb3\x88\x08\xdb\xdf\x16\xe0\
-\x0a\x9b|\x9d\xb3\x16\x94\x9e\xc8\xa1\xe3\xf1<z\x169\
-O\xca\xcc\x0a\xcb\xb4\xc1b\xa7\xd4^.+\xb5\xa9\xbd\
-u\xb1[_\xf4=\xf1\xb7\x1f\xcb\x89m\xaf\xcc\x9c{\
-\xf6\xc7\xa9#\xb7\xab\xbc\x1eg.\xa7\xb8\xc9s>Q\
-]%\xefbO\xc5xT\xf6S\xf1j\xa7~\x1c\xa5\
-\xfc[\xee\xc6\xab\xbd5\xb8\xda\xb6>{\xedSX\xdb\
-\xd97\xbd\xfc\xa1?\xad4\xbe\x88\x1f\xfb\xcb\xf5\x7f\xce\
-\x97\xdc\x0c\xf0\xf8\x9e\xb9\xeb$@\x0e[\xda\xbf\xfd+\
-?s\xf8\xf9O|\xd4\xeb\x03\xbc\x9cL}Y\xafu\
-\x81\x93:1\xf8\xd7'\x0fn\xc3gT\x8e/'\xfa\
-,v\x8cwy\xcb13~Q\x8bA\x1asQ\xeb\
-U\x80,N\x8e\xb6\xed\xaa\xd1\xa9\xa0\x22\x92e\xabz\
-A\x90\xfdB\xef\xd0\x83\x0b\x08q\xc87;\x1c\x0e\xc2\
-E\x07~\xe5\xc6\x0a\xbe1\xe0\xb3\x07\xfb\xa7\xaf>?\
-\xfc\xde\xd7\xb5F\xbe\x0c\x1b\x048\xc7_|9\x9e\xd1\
-\xc58\xecA\xabq\xfd\xcb\xcdz\x020\xfac\x8c\x15\
-wf\xe5\xb5\xa6\x97\xd3\xaa\x8e\x01\xe3\xce\xc6_J\xeb\
-=\xea\xd6A\xd0\xc1`\x1b\x1b\xd1T\xb6\xff\xf0\x8d^\
-\x96e\x10\x06l\xec\x188\x95S\x03]\x07\xbbi\x08\
-6\xe2;\x08\x13\xd5W\xe9\x9ax\xc6j\xf6[\x97\xa0\
-<\xda[\x8a\xec\xf0&'&\xaa\x1a\xaan\xeb3\x00\
-\x9f\xf8\x81\xe7\x0e\x7f\xe3\xd7\x7fR\x5c\x9a\x14\xdc5\x88\
-\x83\x0f\x09\xb1\x90x\x02@\x82\xdeUjN\xc6\xdc\xe1\
-c\xef\x89\xb9w\xfc9n\x04H\xa1M\xe9\xddz\xdb\
-\xc5\x11\x17\xdb|\xc2\x86\x0b^^\xe0j\x07\xe3<\x07\
-\xe7,'\xda\xe9m\xe3\x9fF\xe6x\x9d\x83\xdbb\xe6\
-}\xc1vY\xcc=\xdb\x9en\x1bcn_\x05\xbf\x87\
-m\xbe\xad\xc1\xf4\xd8\xee\xe1\xe7\xd8{\xf21\x9f=\xfd\
-\x9en\xcb\xf9z0[\xdf\xb9=\xcb\x8d\xb9\xa7\xabm\
-\xae\xf7p\xf3\xf1\xc3^L\xeb\xd9\x1f\xf92\xfd1\x1b\
-~\x9e\x0f\xd4\x9a\xab\x5c\xf03\x9f9\x99y\xa6\xd1w\
-\x83\x9b\xbb~Oda\x8c\xc5\xa2\xb3\x22\x1f\xe0\xbd\xab\
-\xd7\xbf\xfb\xeb\x9f;|\xf1+\xdf8\xfc\xfe\x97\xbe\x0e\
-\x9b^x\xfa\xe3\xc2$\x971 \x0d\xc4,?\x5c\x0c\
-\xf0,A\x95jN\xad\xba\x09`\xbd\xe8]\xfa\xc0a\
-\xe7e'_Mp3\x802\xf1\x1dF9\xc19\xb2\
-M\x10\x0cr\xf4\xe7\x10\x0c\x82\x03S\xd6B\x8eI\xaf\
-!Z\xc3\xe0X0\x89\x90\xb0\xfd\x1c\x03\xc7\xc4A\xa0\
-\xb1\xadG\x89\xa8\xd8\x92SRMlAU\xc4\xf9\xdd\
-o\x1en\xdf\xd37\x04\xee\xf2\xd7\x04\x93\xc6\xd8\xa9@\
-\x88\x07\x87#bG\xbe\x19\xe5\xc6<\x01\xa0;\xd4\x95\
-\xee\x95N\xa8\xd4\xe8.\xea\x8d\xccH\x92\xc8`\xb2\x9b\
-\xc4\x09\xe71\xa2vT\xe1mC\xb8\xc4\xc2\xce\xe0\xa0\
-h@\xda?\xd3\x05\xcd`Ct)?\x8dY\xce\xe3\
-=1\xce\xf1\x8b\x19\x9c\xfe\x9c\x82\x09\x89\xc6\x9d\xb8\x01\
-\x1a\xd7\x89\xa2V\xae\xe0\x99\xa4\x9e\xe0\x83O'\x5c~\
-\x1b\xfb\x1dO\xdd=\xfc\x97\xbf\xf5\xa7\x0eO\xde\xd5o\
-\xef\xf3\xfd\x7f\xf9qg\xe1\xf7\xd6\x06\x17\xa4=\xc97\
-\x97\x04\x1a\x93\x82 *]\xfc\xc0z\xb2\xc9o\xc1\x07\
-\xe2\x8b\x06\x16/\xca\xcc9\xe3\x91y\x81+\x966\xa5\
-87\xb4\x81\x7f\x1b\xa3\xb6\xc7]7\xf69\xf5\xa3\xcc\
-e/\xde9\xfc\xf8\xf5x\xeeq\xcc:\xf8\xc0\xa2{\
-3\xca\x9c\xcb99\xeca\xca\xd1\xfc\xf7\xda\xb5]\xb5\
->u\x1cg\xbe\xbd\xdc\xaeb\x9f\xb1\x95;G<+\
-25bR\x7f\xb1n\xf4\xce_\xb3\x83\x15\xc8k\x91\
-uB\xf9\xc2^\xeb\x01\xdf \xe0\xc7\x83\xfe\xfd?\xfb\
-9\xfd\x8c\xb0H\xd4\xd5~d\xee>\x97\x0f*\xc9>\
-G\xca\xc8H\xc8\xe9\x957\x014\x87\xb1\xcb\x88\x9e'\
-\x01\xc1\x19\xa4M\xb0\xe8\x02\x94\x10\x02\x14\x10K\x0d[\
-\xd6\x02\xcfocQ\xb3C\xbc\xc6\xd6~\x8aH\x0c|\
-T\xdb]v\xea\x98\x85'\x1f\xfd\x8bw\xd6\x10l\xbc\
-(\xc6M\xdb(A\xc7\xc7d\xd8\xa3\xf2\x1a\xfa\xf0{\
-\xdf:<|\xf9{\x81.\xbe3\xab\xbc\x1b\xc0vC\
-\xaf\xfd\xe6F]\x00\xd0\x9f\xee\xe4\x08\x1e\xd8\x1d`\x1e\
-\xe0Sw\x0d\xc8\x85\xae\xb4N\xbd\xdc+<\xd7\x03x\
-\xd1\xbf\x88\x0c\xb6\x8e\xa4@\xc7 S\xac\xc6pV\xe6\
-]\x13\xa8\x0d\xde\x94}?\xcf6\x01f\x5c\xf1\xd4L\
-\x84LN=\xb6g\x92\xc17^\x9ev\xe6\x7fx\xf8\
-\xcf\xfe\xf5\x9f>\xbc\xff\x9dO\x9b\x87\xc9\xda\x93\xb2\x17\
-8%\xd3\x85\xa6\x0b^?\x95\xef\xfd\xd6d\x5c'\xa4\
-\xf2\xf4\xc4\xd5\x87\x8dx2 \xfe\xb6\x93W\xb8\xf0\xdf\
-rt\x1f\x8ao\xac^H\xe0\xbf\xb5\xcd\x9c\xb5\xa1+\
-We\xda}\xc1[\xee\xfa\xef\xe1\x8a\xbf\x8ck\xb6\xcd\
-\x5c\x97\xc93\xef)\xf9\xb2\xbc.\x8bQ\xdb\x1e?\xb6\
-\x1e+\xea\xca\xe8\x8f\xe1\xb1\x9d*{\xbeW\xd1\x95\x7f\
-\xf6\xa9\xee\xb2z\x0f\x7f\x99n\xe6\x02G\x99\xf1\x95g\
-\xdc1L\x8f\xdd\xdeq\xec8+_c\xcd\xbc\xb5m\
-us\xbb\xf2\xec?\xcb\xd8\x1d\x7f\x00y\x04o;c\
-\x9e\x8bl\xe6\xe0\x22c\xe3d\xcb~\xeb\x22\x81-\x1f\
-\xfe\x93\xee\x83\xefy\xc7\xe1\xdf\xfc\xe5\x9f\xf2\x9aA\xee\
-\x89\xc1\xbc\x81\x98\x0d\x5c\x95\xb5z\xac\x8bT\xf8\xdbV\
-m\x1b\x8e\x9c\xa8\xbb\xd2-z\x80]\x17\x86\x13\xbc\xe4\
-8|\x86\xd6\x9e\x96\xc7\x9aB\xf4\x8a\x5c\xc8,\x0d@\
-\xf8c\x1f\xf1\x9a\x03\x9c\x98\xcd3\xd9\x9d\xc3\xa2\xc5\xb7\
-\x88XL&|b\xc8\xfa\xd2w\x0f\x0f\xf5w\x04\x8a\
-j\x0d\x84\xd8\x17\xdaV^\xff\xcd\x8d\xb9\x00\xc8`^\
-;\x84\xb6\xfeg\xd0\xb4\xf3\xe8A\xe9\x8a\xf5\xc0\xb1n\
-\x0c\xcc\xd5\xdd\x18\x0f7x\x96\xa1\x13\x02\xebC=\x06\
-\x854\x0ev\x81\xc0:\xa6\xc7\x12\x87\x01\x0d\x1fX\x8b\
-\x1aT\xd61\x19\xe5\x0b\xbd\x8b\x13w\x5c\xcf4M^\
-xF\xf2\xe3\x0a\x19*=\xfag\xae\xeb\x11\x9b\x1f\x0f\
-\xfaY\x99p@e\xe0\x0f\xfb\xf0\x03@\xff\xea\xa7\xf5\
-'D\xf5u\xbf;\xfa\xa5\x10!}\xe7\xcf\xc2\xd1<\
-\x12\x1c>;\xe2\xec\x13h\x17\xbd.\x16\xdbv/\x22\
-\xb2\x7fI\xbe\x188*c/wel{\xfe\xc5\xe1\
-O)GZ\xc9\x11\xccV_\xfb\xeb\xa9\xb7\xb1_\x0f\
-\xd7\xd6\xb7\xfb\xbdWo\xb1\xe7\xb6\x9b\xef\x1e\xe7V\x07\
-g\xf1\xa7\xf8\xb7\xbem\x9f\xf2\xbb\xcc^\x8ess\x80\
-\xab>3\xef\xac\xab\xdcz\xc6\xd5\x7f\xab\xdbk\xe3\xdf\
-\x0b\xc6\x99\xab\xf2\x5c\x1f\xe3\x05\xf3(Jc\x95\xab\xed\
-\xe6\xc7I1r\xe6\x14\xcb\x07/\x1d-\x0e\x98\x97\x10\
-\xee\xfcY\xd8Y3\x8c\x95\x1e?\xb8\xbe\xf0\xd9\x1f9\
-|\xea#\xef\x13V\xf3_k\x84\xb3&\xf7\xb8\xcb)\
-2v\xd6\x9e0\xfa9@L2s\xb1\xc1I\xd86\
-\xd6\xa6L}\xdb\x89j\x85\xf9X\x9c\xd6b\x1c\x1b\xe2\
-\xa9\xb0\x8d\x84Jl\xb6\xc1\x007\xcb\x9a\xb7\xc1\xd8\xce\
-\x87\x15\xb5\xdf\x84\x80\x00\x8b|\xf0[x\xaa\xb7\x15m\
-^\xc9\x18c\x90\x84Z\x8bt\xe6P\xcd7\x04^\xfc\
-\xb6`c}\xc4\x83<\xc0\x0f\x1f\xb7W\xe7k-\xdd\
-\x98\x0b\x80\xf6\x82\xc7L\xfa3\xfd\xa5N\xf3\xc0\x02`\
-\xe3\xe8G\xf4\xd6\xd53\xb5\x5cU<\xb4\xdb\xdfK\x8d\
-\x9e2\xc6\x01c\xe6U\xc5\x83\xc3\x03f\x5c\xa7\x0at\
-!~\xe3\x96g\xe4\x14\xa2i \x8f1\x87>\x13\x82\
-`\x99P~\xec\xbf\xd8Y\x08\x84\xd1\x86\x09\x9d\xef\x0e\
-\x8f\xc5A\xba\xe7\x9e\xbe{\xf8\x1b\xbf\xf6\x19\xd3s\x91\
-\xd0\x13?y\xe6Q\xe1\x94\x9f\x83e\xa7\xb0\xf7\xe5\x09\
-\xa6v\x8b\xf7q4\xb0q\x22/\xb6\x0b\x15m\x9e\x10\
-P\x8a\xe1\x89@\xdb\xd8\xc1\xe2\xbb\xe7\x0f\xae\x18p\xc8\
-\xdb\x82n~\x9dc\x9f\xf1[y\xeb\x7fN{\xcbq\
-Y\xfb\x1c\xbec\x98=\xdeb9\xbe\xf3\x0b\xfde\xf8\
-\xfa\xed\xd5\xf8\xed\x95-\x1f}\xd2~\x99m\xc7\xf4{\
-\x9c[\xdd\xcc3\xe71\xeb\xf1i{\xf6\xafn\xae\x8f\
-ag=x\x0a\xc7o\xae\xab\x9f\xf9\x8e\xed[\xb1&\
-\x18\x9b\xd9o\x96\x8b)W\xdbs]|\xfb\x14[c\
-P3_X\x13H\xd9m\xfa\xdf\x98\xdc(\xe4i\x80\
-\xee\xfa\xd5G\x9c\xc8XU\xf8[\x1fj\x08\x7f\xff\xf0\
-\xef\xfc\xda\x9f:<{\xef\x09\xeb\xd5\x89hm\xf3\x11\
-\xe0x\x8c!\x90\xd5H\x0d\x19|\xa2\x00\xa0\x97\xbf\x0e\
-\x08\x0e\xd9\x1bd\x1a\xd5\xb1N\xa9\xddc\xaa\x16EV\
-\xb4>\xd6\x8b\x8cA\xc5\x17(\x08\xa6\xc1\x1a\x1d\x0a|\
-\xc2\xa5L\xa1u\x1c\x1f\x81\x91\xb9\xdd\x00\x19\x1b\xef\xd8\
-m\x19\xc7g\xcd@\xd0%\x01\x02\xd2\xaeB\xf2}}\
-(P\x7fV\xd8qa\x1d\xfb\x11Lc\xc9p\x03\xca\
-\x8d\xb9\x00pg\xa9\x0f=\x0e\xdd\xa3\xf4\xab\x14\xea\xd8\
-L\x9etp\x06;\xeavx4\xe9\xec\x9c\xf8mR\
-\xe7\xaeux\xe8\xef\xf8\xad5 t\x89\xafZ\x02\xcc\
-\x14\xd7\xb5\x8fp\xab\xbf\x00\x09\xea<\xdd\x11\xe5\xc14\
-x\xf8\xe0\x0d'v&\xb2\xaf\xc8\x85\xb1\xdf\xf2\xc1?\
-b\xcb\xc6\x95\xbb&3<~\x8f\x7f\x9c\xec\xff\xa3_\
-\xff\x09\xff\xbe?qYt|\x12\x86\xa2\x83\x9a\xe8#\
-G\xb96%\xdb\x8b\xa1\x9eO\xd2\xc8-\xe5\xed~\x81\
-%\x0e\xed\xd9\xbf1\xbcx-\xb1\xb5K#/\xf8\xca\
-[\xdf\xfac\xab?2e\xdb\x8e\xf6\xcd\xdd6\xa7\xbd\
-\xfa\xf5d\x06\x1fe\x8f\xf7\x98\xee\x9cx{\xbe\xe7\xf8\
-\xeda\xca\xb5g{\xad:8;\x96\xcaO}n\xd9\
-\xc3\x1e\xe3\x9c\xf9\xeb\xd7z/\xdel\x9b\xe5SX\xf6\
-\xa7\x05\xbfc\xbe[\xdb\x85y\x05\x01k\xc74\x8f\xc1\
-\x8f\xe5\xc4k\x07'T\x9e\x04\xcc:.\x02\x98c\xef\
-~\xdb3\x87\xdf\xfa\xe5\x9f\xf4\x1f\x01\xe3\xe9an\xfa\
-Y\x07\x9b\x1b\xf3\xd7\xf4#\x0c\xc7|=\xee,E\xe6\
-%\x7fr\x99l\xfc\xdeH\xacB@\xa2<\xa8(\xf8\
-\x0c1\xfec\x1d\xf0\x05\x05\x80\x09h\xac\xda\x8b\xcf\xc0\
-rZ\x87\xa3<\xf8\x80\xa14\x9b\xb5=\xb4\x05\xd7`\
-\xb4\x1dV\x9eW\xd9t\x01\xa5_\x0e|8\xde\xe6\x5c\
-\xf7\xa5d%\xb9\xde\xf5\x8d\xf9\x16@GJ&\x82z\
-\xd3\x03\x83^e\x80\xa4\x9e\x86M4\x5c\x1dk`\xcd\
-}o\xff\x0e\xb6a\xc8\x89h\xeexq\x0a\xd3I\x17\
-xb0\x86\xf7N\xe6\x1ei\x13\x85\xd1\xce\xb1\xf91\
-\x90VN~^k\xcdLh\xff\xdc\x16\xbb\xa5;\x00\
-x\xa4B\xce\xb4b\xcb\xc4\xd0?\x1e\xfbc\xd4\x8f\xfd\
-\xfc\xc4\x87\xdeu\xf8\xd5O\x7f\xc4z\xe2'O0\xfa\
-\xddp>\x0c\xe8\xc5\xc8\x99X\xe7E\xc69\x91K\xf9\
-\xf1\x03\xc3\xf5E\x8eWO\xd4=\x06>\x0e\xc2\xb4=\
-\xd7]\xf0\x92\xabi\xbc\xe9\xe7\x03h\xc0\xd7\xa7\x05\xe5\
-\xde\xe2W\xcf5\xafY\x87\xdcX[\xfd\xa3h\xef\xe5\
-s\xae\xee*\xf1\xf78\xeb\xdf~\x00\xd3c|\x19\xbe\
-~\xdb\xfa\x98\xcf\x9e~O\x07\xdf1\xfd6\xd6^{\
-\xeb\xbbm_\xc6\xbf\x87=\x15c\xeb\xd3\xe3X?\xec\
-3\xe6\x1c\xb9\xbe\xadg\x1ftmS\xf3j\x7f\x15\xbf\
-\xad\x8bG\xdf\xfc\xaa\x9b\xe7]u\xccH\xfe\x8a'\xe5\
-\xc1}\xc5P\xdd5\xe0\x81>\xf4\xa7\xf7\xf9\x94D\xee\
-\xa2\x1d\x1f\x80\x8a\x9f\x00\x0a\xf9\xf9O\xbep\xf8;\xff\
-\xe0\xff>\xfc\xf1W\xbf\xed\x1b\x06\xfex\x90.\x19\x14\
-[|\x0bS\xd6#\xdfxH\xcf\x85\x82L\xc6\xf0\xb9\
-#\xff\xae\x89\x14V\xfb\xaa\xa0\x19\x10\x9a\x9b\x11\x9e\x0c\
-\x8e\x5c\x1c\x1d\xf7\x89\x04\xba\xb1\xb68G\xc9\xde\x13A\
-|\xa7\xef\xb6CJ!\x8bs\xc8\xb14\x9dp\xf1\x8f\
-\x9f\xcc\x04\x16N\x18\xb8\x0dJN\x16\xfb\xde\x01)P\
-\x06\x9fw(\x1a\xf3\xf9\x18\x9b[1\xf5$\xe0p\xef\
-Y\x1dH=\xbd\xa4\x1f\x07\xee\xa6T\xeb\xad\xdcu\xdf\
-#u\x0e\xbd\x7f\xb1\x8321\xd0\xcf\x13\x87]\xed\x80\
-\xf3n\xdb\xd7\xcae@V\x9f\xc1\x80\xffd\x97\x1c\x7f\
-\xa3\xa0G\xe1\xda\xf1\x97$\x88\x1f\xbdk\xc9\x0cG\x80\
-\xfc[`\x92]\xc4\x91\xf9\x10K\x1f\xeb\xc3\x9d\xf7\xf8\
-5f\x99\xd7\xdc\xdd\x83\x95\xd3\xfa\x17\xbd\xd4\xe6\x84\xee\
-<t\xf5\xaa\x7f\x7f\xfdW?\xed\xf7\xfb3I\x88\xa1\
-\x892\xee@\xd6\x93ebw\x22:;\xe7\xa1L\xa7\
-\xc9\xd9\xe3\xc5\x09\xba\xbe\xd4\xe8\xe7\x93v}Zg\xc7\
-\x14yp\x81E\xee\x07\x08\xf1\x9f\x178\xf0\xe8\xfa\xaa\
-\xff\xac\xdf\xd3\x81\x7f=\xa5\xf1\x8e\xd53w1\xe8*\
-\xb7\x9eqW\x91\xf1\xefq-\xd7\xb1\x1a\xde\x1e\xfbs\
-c\xcc\x5c\xc7|fL\xe5-\xf6\x98~\x8b\xa3]\xec\
-\xb6\xdeb\xb7v\xda{\xe5\x98~\x8b-n\x8fw\xd6\
-q\x0c\xfb\x9a\xf5\xf0\xb5\xbd\x95\x8f\xc5\x9aq\xf8nK\
-u3\xef\x8c\xa9}\xd6!W_\xbf\xb6\x8bc-\x98\
-\xbf\x0d \x87\xac0:\xf1\xfa\xc3\x82\xccw\xf6S\xed\
-\x9c|\x99[\xfa\x9b\x1c:\xa1\xfd\xe6/|\xc6\xeb\x84\
-?\xd9\xaf\x89\xcf\xf9\x91\x137\xd9\xf32>\x02\x89\xe4\
-\xd5\xa7\x04\xcb>r\x82g~;Y\xf9i\xdd\xc0&\
-Es\xc5\xe4\x82n\x88\xacOp\x82A\xcb\x9a\x109\
-h\xd3-\xe8\xe6#\xad9\xf0\xd5\x7f5\xc3\x87\xff\x90\
-q$!\x975\xde\xa2\xc3\x01\xf0\xb0[V\xb3\x9a\xe6\
-\x8c\x22\xb2\xb8\xf5\xc1\xc0\x87\xf7_\x1a>7\xab\xba1\
-O\x00\xdc\xaf\xa3o:\xb8\x18T\xed\xd8e\x80\x8d\xce\
-\xaf\x1e\x17\x0f\x22\x06\xa2G\x91\xbd\xcdDs\xb9\xea\x05\
-'`\x06\xf7:`\xe2o\x06\xc5\x82\x95A\xed\xca|\
-\x1d\x82\xd8`^\xdbxNxZ\x0a\xf6\x90_\xd3\xba\
-\xa5\xf7\xeb4\xba\xb1re\xce-?->\x14s\xc7\
-I\xa0\x0f\x1b\x09rR/\xaf\xf5\x9a\xe0?\xf7\xf1\xf7\
-\x1c>\xfb\xc2\xf30\xf8\x82\x81\xbf(\xc6\xe7\x03\x5cD\
-\x9c\xef\xf9\xa6\x89\xd6\xb1T{\x12j\xc7\xa9g\x19$\
-\xc7\xa7')\xda-\x99(i\xed\xc9\xe5i\x1f\xd4o\
-\xaf\x06[\x0e\xf7\xc7\x1e\xe8\x0d\xd45\x97m\xc8c\xfa\
--n\xaf}\x99\xef\xd6\xb6m\xef\xf1]\xa6\xdb\xf3\xdf\
-\xd3m9\xce\xc1l}\xe6\xf6\x9e\xff\x9en\xf6\xd9\xca\
-\xe7\xe0\xf70\xb3\xaer\xebsb\x80=\x86\x9f\xfd\xf7\
-\xe6B\xed\xa7\xfc\x1b\xe3\xb21>s\x14_~j\xe6\
-\xec-\xfev\xc7\xb8!\xd0\x04\xf5\xba@\xcd\xba\xe5\xd7\
-X\x8fxK\x80\x9f\x08\xf6o\x040\xe1\xf5\xfe\xc0\xcf\
-\xfc\xf0\x87\x0e\x1f~\xfe\x9d\x87/~Y?\x86\xa3\xa7\
-\x08\xfe\xfe\xbe\xf4\xb7\xb9x\xd0\x9d\x86\xe0>\xc9\xc2C\
-q\xe5\x9f\x0f\xcez\x94\x1bj\xd6\x1f\xad'Nf\x80\
-\xc8\x03Q\x8e<\x05\xe0\x92\xc2\xab\x99\x08m\xd1\x86;\
-O\xff\xba\xa0\xea\xd8\xb3\xbe\x10\xc3\xeb\x84j\xeev\xbc\
-\xdeZ\x96\x13\xf9\xc05\xf8\x13\x05\xa3\x8alm\xb7F\
-\xbd\xfc&\x81\x1bc\xc3\x8e\x0d\x0e4\xe1U\x8d\xa3\x13\
- PX\x92\x8bv\xd0_\x11\x94\xfe\xce=<nL\
-\xb91O\x00.t\xba\xba\xc7\x83\xc4#\x98\x1eU\x7f\
-2\xf8\xe8t\xd5\x9eX\xeell\xd1\xdb\xdf\x03#\xe3\
- m\xbb\x02\x89\xbf\x9b\xd3\xe2\x00^\x85\xc1m\xfc\xd2\
-\x22>\x8d\xd8\xa9\x1d\x7f\xa8\x1c\xdfr?$\x97\x98\xa8\
- \x82-\x1d\xa3\x81\xc7\x15\xb7\xfe'\x7fx\x22\x07\xaa\
-\x86&?'\x7f\xc2\xf9\x8a\x9f\xfd\xd3\x05\xc1_\xfb\x97\
-?m\x1fpwx\xc4\xfe\x0a\x5c\xc2I6\x89\xf1\xcd\
-\x7f\xe2\x9c&\x061\x13W\x19I?/x\xe8{\xe7\
-_}\xf1\xc4D\x9e\xf5\xe8|\xfcG]\x19}\xcb\xec\
-\xbf\xb5c{T\xa5q\xe6z\x8f{\xb6o\xe5=\xfc\
-9:x([\xbe\xea\xcbQ{\xdb\xad\xab?\xb7\xae\
-\x1f\xf5)\x9f\x19{\x8e|\x19\xdf1\xff=\x9f-\xb6\
-\x98\xad~n\x83\x99\xc7W}\xa8)mo}\xaao\
-\xbdg\x9fu{r}\xb7\xf5\x16[;zr\xa5}\
-Y\x99\xf1\xc5\xa1\xeb~2'x\xf1\xf4\xaco\x99\xe5\
-\x91~\xd60\x05\xc8\xbaC\x9c\xca\x22bJ\xb36P\
-\xa3g\xb1\x80\x97\xe6\x9f\xff\xdc\xa7\x16\xd96\xe9\xf9'\
-\x84\xb19\xf9#K\xa5\x0d'd\xf3\xf8\xea\x02\xbdX\
-\xbcXA\x0a\xc6\xf4\xe3m\xca\xdcH\x10\xc7\xe7S\x04\
-^*I#\xeb\x0bo>\xa0\x18\xee\x01hK,\xb2\
-D\xef<\x04\xf3J;\xc2b\xa8\xd7\xd6wi+\xf0\
-*/\x81\x13c\xe4\xd2\x9c\x0a\xec\xea\x0b(}6\xf2\
-{Y\xdf\x10xY_\x15$\xf9\x1bRn\xca\x13\x00\
-\xf7H\x075#\xd4\xb2;8\x9dg\xd1\xa3NCh\
-\xea\xc0\xc5\x87\xce\xd6\xbf\xfe\xa6t\x86\x9e\xbd\xdc\xd5\xb3\
-4\x0d\xa9)N\x06\x8b'\x07\x83V\x19E\xceHY\
-\xfc%x\x10\x0f\xd6\xc4\xc7\xaa\x88r2\x8e\xfcu\xd6\
-\x8fOlR\xc0\xca\x86@\xa0\xcd\xcf\xd5\xbf\xdf\x16@\
-\xe7\x8b\x81W\x0e\x9f\xf9\xc8\xbb\x0f\x9f\xfc\xc8{2i\
-\xa4\xbb/\xae\xdb\xfc\xb1p0z\xe1\x18\xd6DH\x86\
-\xcd\x9f\xdc\x85Q\xe1\x04_\xd9\xb9\x91\x97l,B\xd4\
-\xb5\xb5\x8d\xcf,\xd3\xa6\xf4B\x01\xb9~\xe5\xde\xf2\xe1\
-\xcf\xeb\x8d.\xdd\x979\xee\x9en\xb6\x9f\x92\xf7\xfc\xbb\
-\xbf[\xdf-v\xdb\xde\xe2\xcfio9\xb6\xedr\x1c\
-\xd3\xd7\xbeW\x9f\xf29e\x87\xf3\x1c\xcc\x1c{\x0f\xbf\
-\xd5\xcd\xedcr9g{u\xd4[\xfd\xa9\xf6\x9e\xcf\
-\xccw\x99\xdc\x93\xfb\x8c\xd9\xc6\xabm;/:\xd7\x82\
-g>\x0a\xc9\xdc\x99\xe6(\xbe\x9eM\xb2\xf1\x83`,\
-\x16\xdc\xed\xf3`\x11\xfcg\xf5\x14\xe0c\xef{\xf7\xe1\
-\xf7\xbe\xf4\xb5\xd8\xcc\xc1\x9d\xf7p\x84\x8e\xb5Fgy\
-\xd6\x1f?\xa0D#{N\xd0\xd4\xe2\x1cq\x89\xdf\xfc\
-;\x97Y\xcb\xec\x0d'\xb4\x22\x07O3O\x01\xc6\x9a\
-\x82\xcd\xbae\xe3\x98D\xa78%\x03\x82C\xed\x95\x8c\
-\x5c\x021nh#\x83\x19q7\xa0\x10\x8a\x15\x8er\
-\xb3\xaf>\x8e\xf2\x0eg\xf6\x07\xd9\x18}C\x80\xb7]\
-oJ\xb9)\x17\x00\xea\x9d1\x88\xa8\xe9T\x06\x98u\
-t\xe9\xe8L\x09\xbe\x12\x16\x02%\x16O*\x00\xc8\xf6\
-L=\xcb\xe1a\x84epd`\xcc\xb2M\x1e0\xc5\
-z\xc0\xcc9E!\x86\xe6B\x96\xba\x8b\xe6\xec\xedb\
-\x8b&\x84\xe2KL4\xb2\xe0\x01\x99J\x14\xf6\xf1\xfe\
-I\xc5\xe2\x91G\x5c0\xf1\xb6\x01w\x0b\x87\xc3_\xfe\
-\xdc\x0f\xe7\x91\xde\x9d\x1e\x03\xf6\xd7,\xae\x11ie?\
-\x82!DK\xf7a\xae\x91\xb7\x85\xbb\x90\xf9\xe4\xce\xb1\
-LN$\x0b\x7f\xea\xd9\xb7\xba.|\xd8\x1a\xa7\xb6m\
-\x9cG\xd5n\xacs\xf8\xe6\x9cO\xe1\xcf\xc1v\x1f\xe1\
-\xea\xbe\x9f\xe2\xbd\x8a\xfd\xdc\x1cNq\x9e\xc33s\x9c\
-\x8b\x07w\x15\xec\x1ccO\xbe\x8co\x8eS\xb9\xf5\x1e\
-\xd7\xac\xbb\x8c\xb7\xb8r\xb5\xae\xbe\xf5V?\xb7g\xb9\
-\xf8c\xf5\x16{Y\x9b\xb9\xc3\xda\xe6?\x19<\xe67\
-\x93\xdc\xeb\x98\x8e=\xb5\xff\x88\x90\xa7\xb1\xfaB7\x06\
-,\x00\xd4\x7f\xe6\xb3?|\xf8\xdd\xbf\xfb;\xbe\x91'\
-\xc6-\xbd\xe5\xc8\x05\x02\xeb\x90$<\x95\x22\xeb\xd0\xb8\
-j\xd0]u\xfe\x86\x88\xd4\xdc\xda\xcb'H|\xb4\x00\
-\xf1\xe8\xbe&\xfc|\xb5\xc1Z\xc5\xdb\x01\xb2\xe3/\x00\
-\xb78\xbat\xd0?\xc0#\x1f*\xda\xd6*\xbf\xb1\x1e\
-\xa6\x96E\xff\x9d\x13q\x03\x1c\xba4\xb3\xa7rw\xf2\
-\x06\x9b\xcd\x01\x13imO1Qz7\x06i\x8e\xe7\
-H\xc64\x1cA0\x8a\xbe|\x03+T\xd7y{s\
-.\x00\xd2;S?3\x14\xe8\xb110\xd4qt\xe1\
-\xe8F\x19\x22a\xcf 7\xc1d\x8f\x1fV\x06\xab'\
-\x86jd|\x04\xe4\xbfKli\xf9$\x96\x91$\xac\
-t\xc4UmL\xdc\xe2\x84?<\x0c(\xd9\xedm,\
-\xbcL\x22l@#x\xe0\x91\x0bmO\xb2X\xc4\xec\
-\xf7\xf5xr\xc1E\xc0\xf3o\xbfw\xf83\x9f\xfcH\
-r\xe6\x89\x00\x93Q\x81<\xe1\xa1s1\xb1\xa4\x8b'\
-lbP\x1cK\xf2|rG\x9eO\x5c\xdd't\xfd\
-D\xbf\xf7Q\xfb\x82\x0e{\xfd\x91\xd1\x95\xbf1\x1cl\
-\xb3)\xefF}\xa5\xe6\x1c\xa7\x8e{\xba\xcbl{x\
-r\x9b\x0b\x18^\xe7\xe6<\x1f\xbf-\xcf\xdc\xbe\x8a\xbc\
-\x97'\xfe\xc7\xf4\xe5>e/\xee*\xf51\xcec\xfa\
-\x99\xbb\x98\xd6\xb3mO>\x86\x9b\xf5\xc8s{\x8fg\
-\xd6m\xf1\x97\xf9\xd6\xd6z\xe6\x99\xe5\xbd>?\xe5\x83\
-\xff\x16C\x9b\x17c\xad\xafr\xfb\xfd\xfd1\xbfX\x1f\
-n\xebs\x01\xfc\xfc/\xe7xJF\xadV\x87W\xf4\
-\xe1\xe0[\xfa\x85N}\x00\xf0\x15\xbd%\xc8\xdb\x81\x9c\
-\x90\x7f\xf2\x87>p\xb8w\xf7\xd6\xe1E]\xd0\xb3^\
-p\xc7~\xeb\x01W\x00r\x1e'ZEw\x93UF\
- \xf3\x22\xba\xb4-\xb5]\xac\x941\x8f\x0bra1\
-0c\xa5\x8b\x1b\xfb\xc4\xfe\xd0\x1a\x94\xad\x89f\x15\xf1\
-1\x8f\xda1\x07\x17\xe17nj\x0fm\xf1v\x06%\
-\xbdMC\xae\xa7rH\x91>\xff\x0d\xf3\xf1\x1f\xd0e\
-~\x13\x97\xefV\xd6ex^\xe7\xea\xc6\x5c\x00xr\
-\xd0\x83\xee\xe7e\xf8\xa8o\xdc\xeb\xedn\xb52\x903\
-\x99\x96\xae\x1f\x93\x8b6\x13Mc\x81\xce\xa7\xc4}\xf5\
-\x1f\x930\xf1\x00d\xa0\xaem\x5c\xe6a\x0e\x07$)\
-\x83N*\xae\x7fS\xa8\xf1w\xd1\xc0\xd5\x5c\xf6\xd5:\
-\xd7\xc8\xf1\xd5\xa4vR\xd2\xc8\x8f1\xd8\x1f\xfc\x89\x8f\
-`8\x09\xf3\x1b\xfa3\xbfw4\x99)\xc9\x82\xbb\x82\
-\xf2I\xa90\xcb\x80\x06\xc3\x04\x5cvvm7\x1f\xee\
-\xf2\xb7x\xef\xab|8\xc1#w!*\xae'\xfer\
-\x90\x0be\xdbF\xd7\xd8{6\xec{\xe5\x14\xf6\x94}\
-\xe6\x04{.~\x0f\xd7\xfc[\x83\xe9q\xd8\xe2\xb7\xed\
-9\x8fs\xe5-\xc7\xdc\x9e\xe5s\xf9N\xe1\xae\xcay\
-\x0e\xfe2L\x8fc\xf3\x02\xbb\xc5o\xdb`\xcf\xd5\xcd\
-\xbcW\x91\x8b=U\xcfyTn=\xfbV\xd7\x1a\x1b\
-\xf2v\xffg\x9fb:\xdf\xda^|XBt\xde\xe6\
-D/\x22\x08\xbd^\xb0\x1e\xf1UA\x9f\xf8\xa5{E\
-\x7f\x0a\x17\x1f?\xc1\xbbs\xf7\xf0\x94\xfeN\xc8O~\
-\xec\x83\x87\xdf\xf9\xc7\xff\x5cw\xfe\xfci\x5c\x16\x09V\
-\xca<\xf6\xf7\x05\x01\xc4\xdcx\xd8*\xc6\x11\xcb\x17\x08\
-\xc0\x85\x16\xb5\x9b5Z\xa78~k2\xe9\x90\xb2s\
-c\xf5\xf3\xb9\x14'01h\x8b4\xd6\xb9\x9d\xe8\x14\
-\x00\x00@\x00IDATT\xc9H\x9c\xcb\x89\x97s\
-zt\xc0Y\xe5\xdcZ\x8d\xa8S0\x82\x80\x7f\xb0\xdb\
-\xa1\xf2\xb8\x89\x82t\x1c*\xc3\x92\x87<\x97\x9c\xb2_\
-n\xd7h\xce\x84\xb9\xee[\xf5\xea\xcd(\x192\xd9\x97\
-e\xf8L\x1d\x15q\x1a<\x1e \x8c\x8f\xf4\xeah\x9a\
-\x80\x01\xc18\xb1\xad\xb8(<0\x18TVw\xe4\xa8\
-^\xfc%T.7\xa4L'Jm\xad\xad\xec\xc6J\
-\x06$B\x06\x9e\x1d\xd4\xb4w\xe3rgo\x8d&\xa4\
-d&(\xb1\xb8\x08\xf8\xc2\xa7>,\x9b\xacj\xf3\x9e\
-\x9f*\x17\xbe\x1b\xccD4\xce\xcad\x90\x81\x1d=@\
-\xec\xe8z\xc7O{\xd6o\xdb\xc9\xd5\x90\xe5B \xad\
-L\xa2\xda\xebG\xbb\xba\xe2N\xd5\xf8\xce\xafS\xf8c\
-\xf6\x99c\x96\x8f\xe1\xb7\xfa\xd9\xe7\x98\x8c\x0f\x0b4\xf6\
-\xd7Z\x8eq?J\xcec\xb9mc\x9f\x8b;7\xb7\
-\xe2\xb6q\x8e\xb5\x8f\xc5\xbfL_\xae\xcb0{\xb6\xe6\
-\xb6g\xab\x0eL\xfb\xf72|m\xadg\xff\xca\x97\xd5\
-\xb3\xdfv\xbe\xccs\xa86\xaf\x18\xcc\x13\xc6\x1e\xff\x90\
-\xf5\xcfE2\xbf\xfb\xe1\x19?0\x98h\xdf\x07\xafu\
-\xe1\xe7~\xfc\x05-%hrc\x92\x93._'V\
-a=\x1a|\xd6[\xa7\x0dFL\xdc\xa8\x80\xe1l\xd2\
-\xf9m=@\x15\xe9\x15b\xb1\xb1v\xf9\xd1\xbf8\xc9\
-\x7f\xd0\xb0j9'\xb9^(9\xbf\xd7\x06\xb1\xb32\
-\xda\xde\xce;\xba\x5c|\xc8\xdd\xcd\xa1\x9b\xd9\xe4\xeec\
-F\x10\xfb\x0d:\xda\xb5\xd9]\xbe\xc4A\xd7\xcfB)\
-\x11\xc3\xd8\xd7\x1bRn\xce\x13\x801x\xe8\x17\xf7\xdb\
-\xe8L&\x82\xdf'o\x87\xa9\xcd?\x0f<\xdb\xd2\x99\
-\xd6\xd1\xbd\xb6g\x90\xf4Dz\xa1\xbbkw\x9c\x0c\x88\
-\xc5\xc7\xc1E\xe1\x5c\xf0f\xe0k\xb03`\x18\x8b(\
-\xea\x8fJr&p\x1e\xd7\xddf\x80\xe9\xca\x14\x7f\xfe\
-3\xb8\x99\x9c\xe8yT\x87{>x\x83\x9fl\xfe\x12\
-\x81d=j{\xf8\xf0\x95\xc3\x87\x9f{\xe6\xf0c\xfa\
-\xf0\x1f1\xe2\x8f^v\xfc<1\x87\x09n\xf9SX\
-\xccz,h\x83\xa7$/}\x83`\xfc|/\xfa\xbe\
-\x0c\xd0\xa6\xbe\xb4\x1d\xc71\x12\xb3\x98\xf2m\xdb\xe5?\
-f/~\xaf\xde\xfa\xeca\xb6:|^\x8b\xdf\xcc\xd3\
-\x9c\xab\xdbr\xbe^~x\xb7\x1c\xdb\xf6\x1c\xbb\xf2\xa9\
-z\xcb\xb1m\x9f\xf2\xdf\xda\xf1?\x97\xe3\x18\xae\xc7\x12\
-;\xf2\x1e\xe7\x9e\xef\x9en\xceok?\xd5\xc6\xb7\x98\
-\xd63_\xe5\xdaZo\xf5\xc7\xda\xd5\xb7\xae\x7f\xeb\xea\
-[3\xa7Z\x8a\x99\x8fUm\xdb\xda\xd8\xb1\xa6d\xf9\
-\x18k\x00sR\xe2+z\x92\xe7\x95@\xb2T\xcb>\
-k\x12\xebI\xfd\xad\xc3'\xf4\xf7\x01\xde\xfe\xec\x13\x87\
-o}\xe7%\xfd\xc9_\x9d\x16\xbc\x0c\x00\x14\x9e\x8b\x04\
-\xbf\xaf?\xe6\xb6n\xdd5\x02\xb2F`\xcfJ\x95s\
-/\x0f\x0a\xdc\xa7:\xef\xbb_s\xf2\xcfj\x88\x17\x85\
-\x15\x09\xff\xdc\x7f\xa6e\xd5\xc8\x8d5\x89\xa7\x0f\xb1\xe4\
-m\x02\xe4Q\xd8\x01[\x1d\x9c\x80n\xdb\xaa\x93\xba/\
-R\x1cH\xb8\xb1\xce\x0dO\xefO\xb2\x08\x9f\xa9d4\
-\x05\xf5\xc8\x90j\x1d\x97\xeb\x1ai\xeeb\x16\xd2\xeb+\
-\xa4\x07\xaeo\xfeK\xe6\xd3\xf0\xf0 J\x1f1\xc8\x04\
-qg\x16:\x06\xae\x9a\xf5\xf1\x80\xad\xb9zF\xc4\x18\
-\xc8\x98\x8a\xb5<\x1a\xd5\xc5\xdf#\x0e\xb3\x87\xa6\x83*\
-p\x07q&q0\x95/\xfa\xcbq\x5c\x91\xda\xa7#\
-\x92\x1d \x7f\xfd\x1b)9\x19.\x0cb\xa0\xe6N_\
-\x1f\xe6\xf9\x89\x0f{\xb6\xf9\xa2C\x93\x94\xf7\x02u\x05\
-!\xf7\xfc\xeb\x9dK\x07\xbd\x1c]x\x14\x88?\xaf\x16\
-\xe4>\xe2G7\xcb\xb4\xd7\xc9\xb1\xfa\xa0\xdfr\xa0k\
-\x99m\xd5=\xea\x9a\x18\xc7^\xe7\xc6:\xe6\xbf\xa7?\
-\x97s\x8b\xdb\xe3B\xf7z\xcb\x1e\xefU9\xf78\xaa\
-\xeb\x18:\xc5\x09\xbe\xd8\xfa\xee\xd5\xf0\x14w\x8a\xf3\x98\
-}\xe6-\xa6\xba\xb6\x8f\xd5\xc5Q\xcf\xa5\xed\xda\xb1U\
-7\xe3\x8e\xc9[\xbf\xb9\xbd\xe7S\xee\xd63f\xd6\xcd\
-\xf2\x8c\xa9\x9c\xf5&-\xcfQ\xaf\x13^2\xc6\x05;\
-K\x02\xfb\x9a\xfde\xad\xd0\x8e\xb9\xfd\xb3?\xac\xf5C\
-\xeb\x0ck\x06\xa7x\xaf\x1dY~\xd0\x86\x04\xa4\xf1\xc3\
- \xd9\xcb\x966\xbe\xa9\xe0a\x809Xs\x86\x8b\xa0\
-\xf8\x87\xd3\x04\xc6$j\xf8l\x1f\x0b\x93\xf3F1\x18\
-,\x8e|\xf1\x09\xdb`W\x5cV\xd9\xa5H\xf49\xbf\
-\xfe\xc3\xe45\xd72\x1b\xbd\xc6\x85\xc1\xb2\xfb\x13\xceX\
-\xa1\xd8\x83\xca\xf0W\xbe\x10\x0f\xc35.7\xe6\x09\x00\
-}@g\xfa|)\x81\xceb\xa0\x8e~\x95\xb5mi\
-\xa4\x1f\xc3\xc7r1\xc5\xd7\xe6\x9a\xcd(\xb6;\xc0<\
-8\xd6AR{\xea\x91\x0f\x91\x1c@1\x11\x91\x1d\x9f\
-\xdc\xc8\x05r\xd5|\xf2\x96\x8b\xff%o\x06\xb6&\xe2\
-\xc8\x15\x94\x07$\x0e\x9a\xc0\x91\xb3x\x9aX\xb8_\xfc\
-\xb1\x0f\xc8#\xfb\x9c\x1f\xfd\xd1\xe7\x05\xf8\x09K|\x09\
-\xbe),\xbc\x1c\xa7\xbe\x9a?z\xcava^&\x00\
-9\x0d\xbe\xea\xc0\xcf\xba\xcbd|j\xc7o\xaf\xbc\x16\
-\xfb)\x9f9\xceU\xb0\xf8m\xf1\xdb\xf6\xcc\xbd\x95\xcf\
-\xc5\xee\xe1\xf6t\xe7\xf2\x1f\xf3=\xa6\x9fy\xcf\xc1\x9c\
-\xc2\xcfc\xa3Xx\xb7\xdc\xa7\xda\xf5\xdd\xab\xeb\xdb\xba\
-\x98S\xedc\xb8\xea\xa9g\x0e\xe4\xb9}\x0cW\xbfb\
-[\x17\xbfmW\xcf\xb1\xea\xbc\x033\xe3f\xb9\xfc\xd4\
-\x9d\x9f<\xa5\xf3\xb1\x1es\xd2\xcb\x0akDy\xb8\xd3\
-\xf6\xf4\xd7\x8a\xc2gz\xf4\x8f\x13?v\xee\xb4\x1dW\
-\xeb\xc4\xa7_\xf8\x81\xc3\xff\xf8\x7f\xfc\xaety\xbb\xc0\
-+\x14\x8b\x92lT\xe3\x86\xdd){IC\xf2z\xc6\
-\xb2\xa5\x00\xc4\xd0:\xc6\xf5\xc5\x1d\xf6\xc71\xbd\xa4\x8d\
-u)k\x0dj^+\x07k\x1d%k\x17\x17\x14\xfe\
-\xaa6\xeb\x84u \x83\xce\xb6\xc4\xaa\xb9\xf0\xb0\xef\x80\
-\x94x\xaea\xae\x8b\xc0\x91\xc9e\xc8\x10\x0c;\xf1\xf8\
-\xdf5\xca\xb9\x80\x83^\xb5w\x13\xfc\x0d)7\xea\x02\
-\xc0\xfd\xc2\xa0\x1e\x9d\xe3\xa1A\x83>]\xf4\xee\xdd\x0c\
-\xb0\x98\xdc\xb1\xee\xf4\xc5/Byhe\xb2\x0c\x80\xaa\
-\xda\x18L\x0c\x0c\x82\xa4\xf2\xb410z\x8b\x1et\xbc\
-\xefeO\x01s\x95\xba\x9e\x08i\xc7\x0e~\xcd1\xb8\
-1Y\x15,y(\x86 |\x90\xd0\x94\xaa\xeeH\xf1\
-\xa9\x0f\xbfg<v#\x8e\x01N\x0e\x9f\x00\xe1\xc6\x8f\
-6\xa6\xc4o\x8d\x9eW\xef\xf6\xdb\xf6\xe22\xf0,\x16\
-m\xcf\xf6r\x98x\xe2n{\xae\xf1+\xc7\xac\x7f#\
-db_\xa5\x5c\x15\x7f\x0e\xf79\x9c`xm\x8f\xeb\
-9\xfco$\xe6*y\x9e\xb3\xdf\xe7\xe6^\xae\xd6\x97\
-\xf95\xc7-\xe6\x1c_|\xce\xc5\x95\xffq\xe3\xe71\
-Q\xb91]\x8f\xc5\x09\x19\xd1w\xf9,F\xd3\xd0g\
-\xedx\xe8\xbb\xe7d\x0d\xf6\xa3\xef{\xa7\xc6\x9b@\xfa\
-\x8fON\xad\xf8\xc5\xd1\x95\x17\xb5\xe8|r\xe4\xf8\x98\
-\x82\x935zN\xac\xd1\xf8C~\xce@m\xc7\xd7\x98\
-V-\x94\x8f\xe9,\xcf\xeb\xc1pw\xdcY\x9f\x8cF\
-.d\x17Q\xdcMb\x11\xac#\x92\x22\x0e;`\xd6\
-;'\xeb\xa4\xad!\xe5\xa1\xeb\xb1\x0cB\xd1\x94\xab\xfd\
-\x090\xe3\x06\xc5M\xa8\xae\xdb\x05@\xbbo>\xf6\xd6\
-y\xb0{\x90\xc9\xd4\xc1\x86(+\x00\x86\x867\xb4\xd5\
-\xe3\xb4\xe9\x5c\x0f\xc7\xea\xf0k\x11\xc6~\xa3\xe3c\x1a\
-^2\xf8\xa2\x1a\x1e\xab\xc0f\xc0\xc4\x09\xf2\xe1\xaf\x08\
-\xb6\x11q\xce\x0b\xbd0\xfe\x9c-X%J\xbce4\
-\xeaD\xab\xf3z.\x0a\xfcu\x1a[\xc5\xc1\xa3\xd5|\
-. \xfe\xf2\xd3\x87\x01>\xf1\xc1\xe7\x0eO?y\xd7\
-6\xc2d\xf0\xe6\xae\xc2\xdf\xd9\x1d\xee\x84h\xc1\x9f\xd2\
-\x1a\x19\xbf\xde\x89 \x9bg\xe0z\xc7\x81\xae\xd8=_\
-t\xc5\xcc\xf6c\xb2\xc9v63~6\x1f\xd3\xcf\x98\
-Y\xbe\x0a~\x8b\xdd\xb6g\xdeY\xde\xc3\xed\xe9f\x1f\
-\xe4\xcb0=\x86\xad\x8fa\xb7\xfam{\x8ey\x99m\
-\xc6m\xe5\xcb\xfc\x9a_\xebb[\xc35\xcb\xe5\xde\xd3\
-\xd5\xb6\xad\x8b\xdd\xd6\xc7p[}sC_\x8e-\xa6\
-\xed\xd9~L\xde\xc3\xa2\xeb\xdc\xa9\xbd\xf5\xccS\xdd\x5c\
-wn\xa1\xdbb\xdb\xa6\xe65\xef\x0b\xf8\xc6\xf4R\xa4\
-\x0d\x1f\xf8\x05\xc3\xbc\xf7\xd4\x1d\xb7\xe2\xd83s\xc5\xe1\
-\x7f\x8a\xa5\x0f\x0a\xdb\xac\x87\x04\xcf\xde{R_#~\
-\xf6\xf0\xe5o~\x8f$\xf4\xd2\xff;\xc2z\x99\x18k\
-\x81\x83\xe4q\x80\xb9\x89\xe3\x9cY;\x86 \x8d2P\
-\x03\x1d$6H\xc3;\xce\xacspE\x22#r%\
-DP\xa9\x01\x04\x09\x0bX\xe28\x11\xb5\xf0)\xaf\xcd\
-c#\x9d\xc3\x86\xc9\xc7\x8d@\xec\xa0jD8s\x91\
-\xc2\xb1qK\xfa\xc8eZ\xda\x0b\x97,\x0b\xf5El\
-}\xaekM\x8f\xdc\xa8\xa2~Rgy\x9b\xb1\xa0\xa6\
-\xfb\xd1z6k{\xd1O:\x0f\x1a\xfced\xc0P\
-Z\x1f\xe5\x05cd\x07\x18\xf1\x19\xb0)\x91\xa4\xdb\xc9\
-\x8b\xc7\xfc\x94~\xcfuy\x7f\xae\xce\xd8\xf4X\xcd\xe3\
-\x96\x01\xeb\xd4\xe0'B\x060\xc6\xcf\xbc\xf0\xdeLd\
-M\x8c\xec\x83!\xd98t|\xaa5F\x0dO\x82\xe6\
-5v\xb46\xb0\xcbd\x18\x8em\x83An\x1b\xf3\xac\
-k{\xb8\xbd)\x15\xf9tq<\x95\x00X^oF\
-i\xecS\xf5\xeb\xcd\xed\xb5\xee_\xfdN\xe5W;y\
-\xd6\xe7\xf5\xe6<s\x9d\xe2\xac\xbdy\xec\xd5=\xd1\x16\
-\xfb(\xf2\xbb*Gc7\xbf\xd7\xea\x8f\x1f\xf3\x8fR\
-\xce\xceI\xebt\xe2\x9b\x96\x11c\x8a\xf3P\x971m\
-\x16\x08\xd3\x1c^x\xff\xbbP\xe6\xc6\x03g\xc9\x09\x01\
-@k\xd5p\xe4\x9c\xce\xc9\x835\x08g\xdf\xed\xe7J\
-A-\xe9$\xf3\xe1e\x10\xce\xa1y\xca\xe6\xf6\xb0\xc4\
-\x1bT\x0a5O\x06(\xcb\x0a\xaaf\xe2Dkc\x1f\
-?\xd8\x01\x0dL\xad\x86\xec\xb3\x9b\xe2\x91\x1c&\x07c\
-\xcd\x02\xcd~Y\x90>\xfb\x98zD\x92)^v\xcd\
-\x06\x858z\xcc'\xcb\xb5\x15\xaf\xdb\x13\x80\xa3\x07\xda\
-\x9dEG\xba\x8f\xa8szt\xdb\x9d\x86\xabt\xa3\xb3\
-=^<\x00<\x5c3\xc8\x97\x81\x90\xceW\xf3\x02\x1f\
-\x0d\xfbG`$xT1\xae\x88\xc3\x08K\xdc\xfaQ\
-\x0f~\xcc\xc6\x0c\xec\x98\x1cqc\x00\xc2%\x9b\xea\xc4\
-\x90\x9f\xf8|\x81\xc0`'\x19\x15\xdav\x1dm\xff\xe9\
-OM\xf4\xcf\xe8\x0f\xff8\x8f\xc0\xfc\x08O\xdf^\xb1\
-[2(\xc5\x00\x98m\x8d\xc7\xc2Hl>\x10\xd8\xf7\
-\x14{\xf2\xdc\x1b\xf0\xe46\xdbi\xef\x95\xea\xcb\xd1\xf6\
-\x1ev\xd6\x9d\x8b\xc3\xe72l\xe3\x96\xfb\x18\xf6\x98\xbe\
-~\x97\xc5\xd9\xfan\xdb3\xc7\x9e\xbc\xcdq/\xd61\
-\xce\xab\xe8\x8fa\xf7r\xda\xd35\xcf\x99g\x96\xf7\xf2\
->\xa6\xdb\xe3?\xc6\xb5\xd5\x9f\xe2l\x9e\x8d\x81\xff\xcc\
-1\xcb\xc5l9g\xcc,\x9f\xc2\x1f\xc3\xce~\xdb\xfc\
-:\x8ffLe\xf8\xf68\xab\x9b\xed\xc8yt\xcfM\
-o\xe6#\xdc\x88\xb4[?\xf0\x13E\xfe>\x08\xbf\xf1\
-\xa1\xcf\x08\xe9q&_\x07\xe4C\xc3?\xf8\xdew\x1d\
-~\xe7\x9f\xfc\xa1\x1c\xb4\x92\xdd\xe6>>\xbf\xf5\xe1\xc5\
-\xc5?\xf9\xcb\xc5\x81\xd6(\xee\xaa\x97\xaf\xc7\x8d\xfb\xc8\
-\x9e\x94\xbd\x0af\xbdaYs.\x08*^\x1fID\
-\xcdh\xd6\xbao\x09T\xcf\x1e \x07\x8e\x8344\xa2\
-\x95\xcc\xeaJK\xdb:\xd9AJR\x1a\xeb&\x18\x0a\
-)\xe0n\x0a\xb5\xbb.\xda88\xad\x83N`\xfc\xd8\
-\xe6\xac\x02j\x90\x970\x8e\xd7z{c.\x00\xda\x0b\
-L\x82L\xb0\x9c\x8c\xd1g\xec\xd1kS\xcfy0\x80\
-M\xb7\xda\xbf::ZP\xfb\xb9\xb6A:\xd5K\xd1\
-\xd0 \x96\xda\x0cj\x0bj\xf3\x8f\x09\x02A\xd1\xad\xe3\
-\xba\xe6\x90\x5c\xe5:\xe6\x0fv\xff\xd9N90H\xcd\
-\x13*q\x85;o\xfb\xc3\xa16\x93P5\xaf\x8f>\
-\xffv\xd7\xec;\xaf\xfb\xfc\xd8\x87'\xfa\x80\xa8\xca\x8f\
-\x08%\x1bb\xb7T\xa6\xee\xfb\xff\xd8<\x09\x06.\xb9\
-\xc6\x97E%\xc7\x98<\xc33\xdb\xcb;\xd7\xa7\xec3\
-\xf6*\xf2\x1c\xff*~\xa7\xb0\xe5=\x85\xbb\x8a\xfdQ\
-r\xc2\xf5(\xf9\xba\x1f\xe7r>N\xdce\xdc\xb3m\
-\x96\x9b\xff^}.\x0e\xdf\x19;\xcb{\xbcW\xd5\xed\
-\xf1\xed\xe9\xca{\xccvL\x8f\x9fm\x9a\x92\xd4cj\
-\x96\xce\xeb\x91\xe7\xb7n\xe4\xe7\x8b\x0e\xcfg\x9d\xcc\xef\
-\xeb\xc7\x82^\xf8\xc0\xbb\xf49>\x1e\xf1k\xc5\xd1\xc2\
-\xe4\x1b\x8e\xc3]5\xb3\xcex\x05\xe8\xcd\x8bT^\xfb\
-\x12\x18\x17\xc5\x1c\xeb\x8b\x1a~* [\xd7\x8a\x07\xb7\
-\xf27\x01\xd2\xce\xba\x11\xb4\xfc$X&o\xcb\x0bs\
-\xf4\xacs6P\x13\x10\x90\xd6Xd\x02\x8f\x82\x97S\
-\xe0\xe9\x077@\xc3\x9b\x8a\xe3\x91\x1c\xf1\xf1\x7f{\xa1\
-\xe7x\x85&\xfeK()\xc3.=\x18;:\x81\x86\
-\xbc\xd6\xf5\xcd\xba\x00X:\x91>I\x8fw|\xd0\xc9\
-t\xa4;\x99\x0eghx4\xcc\xfd\xd7\x0e\x1e:9\
-\xd9\xdfx\xfc\x87\xdd\xde\xe1\x0br\x00\xe0\x9f\xe9$g\
-`\x8d\xc1#c\x06\x7f\xae\xca\xfd=X&\x9bJ?\
-8\xe3\x86\x83J\xe2\xea}y\xff?1\xcc/Q\x16\
-\x0d~\x04r|p\xf8\xd0s\xcf\x0a;>7\xa0\xc9\
-|\x9bO\x06cW\xe1\xf3\x05\x02\xf9\x03\x82\x9d\x8c\xd6\
-\x0f;\x8bB\x17\x04\xec\xc8}\x12@\xfe-\xdd\x97\x99\
-\xa3\xb6\x99\xef\x94}\xc6\xce\xfe\xa7\xe49\x97-\xb61\
-\x9b\xe3\x1evO\xb7\xe59\xd6>\xe6\xbb\xa7\xdf\xd3\x1d\
-\xe3\xdd\xea\x8f\xf9\xce\xfaY\x9e\xfd\x8f\xe9g\xcc,\x9f\
-\x8b\xdf\xc3\xed\xe9\xe0>\xa6\xbf,\xee\xec3\xcb\xf5\xd9\
-\xea\xb6\xed\xe2\xb65\xb8c\xd8c\xfar\xcc\xf6Y\xae\
-\x9d\x1a\xfd1\xdb\x8c\xab<\x8f\xd1\xad\x7fyZ\xd7g\
-\xae\xb7\xf1fle\xd7\xeb\x94\xb5;:>7\xc4\xfd\
-\x02\xf7\xf4Li^\xac?\xaf\xf0\x19\x00-A\xac\x01\
-,\x12\x1fz\xf7;X*r\x03\xcd\x9f\x08\xd6Y\x9c\
-w\xf4\xbd\xb2i\xf1\xb1_\x9c\x853\x89\xb1\xd8\x83b\
-\x85\x22\x00m\xd6KJ\x1c\x97\xfd\x1fz\x9f\xa8ec\
-\x9d\x1a^c}\xb4\x937\xe4\x12\x0e\x9a\xe1\xb5\x01y\
-\xb1\xe0?\xf6\x0b=\xeb:'\x7f \xc4\xe2Bf\xac\
-\xb3\xcd\xc8\x16\xdb\x81'B\x18\xb3\x1dK&\x07\x8c\x85\
-S\xfe\xf0\xe0\xa52\xfc\xd2\xb8\xde\xdb\xebx\x01\xb0{\
-\xf8\x97\x0e\x92\xd5\x03S\xfdB\x87\xf9\x0aq\xc8\xc6\xf8\
-\xd2n\xd5\xd3}\x0b\xde\x03\x8aI\x8dV\x98\xf1B\xd2\
-\x10\xb0n\xe9}\xc7\x91E x)\xcb@\x9a\xda\x1d\
-4\xb6\xa1\xcf%kN\xce\xf8\x0e\xd6LB5\xc0\xe8\
-?\x93\xc7_\xe0\xebH4\x90\xe9K \x0dF\xc7\x90\
-RW\xd5\xef|\xf2\xde\xe1\x99{O\xf8\x0e\x9f?\xfd\
-\xeb|\x1c+\x03w\x84p\xd5\x13\xfdV\x97\xe3\x97\x93\
-\x7f\x16\x03\xe5\xa0\xa4\xc8\x1b[\xed\xad\xf1G~#\xca\
-6\xfe\xa9\x98{\xfbx\x99\xcf\xa3\xda\x8fG\xc53\xe7\
-Z\xce\xd6\xb3\xed\xb5\xcap\xf1j\xdf\x9e\xe29'\xf6\
-)\xccl\x9f\xe59\xf6VO{\xab\x9b\xf1\xc7\xe4S\
->\x97\xf1\x9e\xf2\x9dc\x1e\xc3\x1e\xd3\x9f\xf2=\xc7o\
-\xe6\xd8\xca{\xfe\xd5\xb1n \xbb\xcf%S\xe7m\x02\
-\xadm:Yr\xc1/\xed\xe1\xc9\xbbw\xf5\x16`\xde\
-\x12\xf0\x9f\x0e\xc7\xcfx\xfc}.\xd4\xcf\x05\x8b\x8d\x13\
-\xa3\x16(>\x9e4.\x0f\xbcF\xb2\xbc\xf2\xe4\x12]\
-\xee\xd8\xbdb\xc1\x80F7)\x92\xf0\x17koPl\
-\x13\x8f\xd7Jj#\xb5\x91\x22\xebn\xf06\xc8\x8eo\
-\xc0`h\x8e\xd5y\xc0l7\x0e36\x1a\x92dg\
-\x1f(\x85F\x07_\xb1xP\x86\x8fs\x0d\xde*6\
-\x01\x18u\xdd7\xd7\xf1\x02`\xf7\x98/}BG\x8e\
-N^:\xcc\x03D\x03\xce=\xc7\xa2\xd2\x0e\x0d\xb0\xfa\
-\xa5\xd3\xe38\xc5Y\x17L\x94\x9dH!b`\x11\xbd\
-A\x8d\x88n\x19m#\xa6`Q\x91\x0b.\x9a\x0d\xb8\
-i\x16\xf9\x8f\xf9d\x0e:9r\xe2\xce\x1e\x073\xdb\
-AX\x9d\x94\x89\x9f\xebu\xfc\x0e\x87\x0f=\xff\xac\xe3\
-\xdd\xe2;\xff\x5cI\x00[\x9e,\xa81F~\x17\x03\
-\x03\xc6f\xd6\xf5\x84\xdfz\xc6!w\xbf\xb7uO\xb8\
-9\x0e\x17q[\x8eS\xed9\x9f\x19[\xee\xd6s\x0e\
-\xc7|f\xff=y\xcfoO\x87\xef\xac\x9f\xe5-\xef\
-e\xb6-vn\x1f\xf3\xbb\xaa\xfe\x1cN0=\x8e\xad\
-\x1b\xa7\xf5\xcc3\xcbW\xb5\xcf\xf8Y\x9e9\x91\xb7\xb6\
-m{\x8b\xdf\xb6g\xfc1\xb9>\xb3\xbd:\xea\x8e\xe3\
-Y\x87|\x0c\xbf\xc5\xb5\xddc\xdav\xfd[\xa3\xdf\xc6\
-\x9am\x95O\xd5\xe5\xdf\xab\xf1e\xdd\x08\x87\x16\x0f\xad\
-\x01,\x03\xf7\xd1g\x89\xf0\x13\x81\xac3\xc2\xf5\x91\xb9\
-\xd6\x8f\xb7=\xf9\xc4\xe1\x1b\xdf})\xeb\xa5\xf0<\x9d\
-\xf4\x8a\xe5\x85U$\x10C\xc9\xd3\xc7\xae-j[\xe9\
-u\x0bYA\xb8\xf3\x06\xac\xff\x1c\x13\xbb\x81W\xf1\xfb\
-\xfd\xe4\x02\x0fm0\x18\xdc\xc0\xee\x88h\xcca\x1b\x04\
-&K\xe5\xc5/W\x1cV\x8f\x00\xa5\x18\x9eT!\xf5\
-\xdb\x13\x12\xdd\xba\x90\xd3\xea.\xb4\x0b\xd1}\xe9\xc0\xfe\
-\xe31\xfc0\xae\x99\x05{\x9d\xb77\xe6\x02\xc0\x1d\xd3\
-\xcer'\x8dn\x1a\x03\x94Nw7\xab\xbd^yJ\
-\xe3\x81\xe0\x91\xe5\xc92\xc6\xe7\x90\xe3\x85g\xf5[\x99\
-\x09V\xd4\x98&\x1e,\xe65X\x1bb \x13F\x82\
-\xe7\x11m\x15\xfb0!e[\xfcg\xd9\x9e\x02@\xe8\
-\xa2\xfcu\xd7o<8=\xc2{\xee\xa9'G\x00\x01\
-\x94(\x8b\x8b\xdf\x02\xe0b\x01\x95|\xa9-\x9b\x03:\
-\xe5=\xedT\x16\x8a\x18k\x9buX<\x89\x87_m\
-\xad\xb1\x1f\xf3\xc3vN)W\xebS>\xb9k9\x85\
-:\xcf\xde\x98\xadOy\x9d\x8b\x83\xe7\x5c\xec9\xb8s\
-0s\xccs\xf0\xc5\xb4\xbel\xdf\xcf\xc14\xfe9\xd8\
-bZ_\x16\xbb\xb6=\xecV\xd7v\xeb\xfa\xee\xd5=\
-\x19\x9f\x83\xc5\xbf\xb8\xd6{\x9c[]c\xcc\xfe\xc5\x9c\
-\xc3s\x19\x06\xdb\x9e\xbdz\xcf}m\xd2NT\xde\x12\
-\x90\x9bO\xc4\xd8\xb3\x80\xe4\xa9\xc0S\xf7\xee\x1e\xbe\xce\
-\x05\x00\x00\xd6\x88Vn\xb3\x9e\xe4d\xce_\xf9\x8dq\
-\xac\x0d\x02\xf6\x1a\x81\xe7\x00\x14\xd6\xbd~\xaa\x9f8^\
-\x07\xc1Yb-6\x22\xed$bP\xecqX\xd7K\
-a\x03\x97A\xc5\xbeR\x91\x8fr\xcbEF\xd6:\xcc\
-Y\xdej\x13\x9c\xfd\xc00\xcar\xcc\x044v\xc4w\
-5\xf6\xddk$r\xfe\x9bt\xe6(\xd7u\xado\xd0\
-\x05\xc0\x18\x00\x0c\x04\xf5\x06\x03\x88\xa1\xd0\x93_;\xcd\
-W\xba\xa3\xd1A\xd3\xce\x9bOp\xb3\xbc\xe0\xc4\xcd\xe0\
-\xb0\xbbF%\xf2xB\xe4\x01\xe2\xb9\x22e&\x81\xec\
-\x96\x95\x87\x14\x19\xd0C\x17Omy\xa4\xbfdf9\
-\x83\x12\xe6\x0eX\xc9\xbad\xf7^y r\xb5 \x1f\
-\xe9|\xa2W\xd0\xa7\xee\xf1K]Bd\xcee\x22\xd0\
-\x16l\x9d<x\x11+\xdc\xf0\xe3\xef\x01\x8e\x96\xe3&\
-\x87\xc4\x8f\xad2X\xca\x8c\x9d\xdb6\x8eM}\xb6|\
-[\xdf\xd9\xa7r}\xdan]\xce\xb6\x1fE\xbd\xe5\xdc\
-\xb6\x1b\xe3\x98\xbe\xf6\xcb\xea7\xd2w\x1b\x8bv\x8fy\
-s\xdcb.\xd3\x1f\xc3\xd6\xa7\xf51\xdc\x9e\xfe\x98n\
-\x9bg\xb9\xe7z\xcf\x17\xfb\xac?&_\xc6S\x9f\xd6\
-3vO.\xae\xf5\x16sL\x7f.\xee\x1c\xffbZ\
-\xcf\xdc\xe8\xbcL\xb0Q\xe1\xd8\xfa\xfd\xffq\xc2g\x15\
-\xb0=\xc6q\xfc\xb2\x06\xe1\x0b\xfeY\xdfP|\xc7\x7f\
-\xcd\xd7\xdf@f\x91\xd3zs[\xdf\x18`\xf5aQ\
-a-a\xf5\xca\xe3~\xc5\x12\xff\xfa^\xf9\xba\xd2\xb0\
-J\xd2j\x8d;\xf1\x13\x11.\x14\xeb\x1aI\xd6\xb6Y\
-\x8fM/\x17)X\xcc\xc6I?~2H\x0d\xf7R\
-\x17=\xade\xb6\xc9O*\xc7\x06\xc2~6'\x87 \
-\xff\x01\xa0\xe2\x1b\x0e\xec\xf3\x1a?>\xbe\xa5j\x0e#\
-\xd6u\xaen\xd0\x05@z\x97\xbeKa\xe0\xa5P{\
-\xd0Ip\xe7V?\x1a\x1d\xf8\xa8\xbd\x18\x01\xb6\xac\x8d\
-'\x05U\xf8\xec\x12s\xf8%\xd3t,\x09\x89\x19e\
-\x7f\xf8b\x9d\x00\xd8\x9d\x0d\xf4\x19\xcf\x0cC\x08\x5c8\
-!K\xd0\xb8\xe3\xc2e\x8d\xc5`\x95\xcd\xfc\x92\xfdW\
-\x80\x88\x81\xfc\xe0\xf0\xb4\xde\xb7\xf3\x07\xfdx\x0bA\xe3\
-\xb69\x98w%7\x9f\xf7\xc2\xdc\xf8\x12;/O\x88\
-\x09\x9b|.n{\x17\xe3c$\x13\xbe-\xf5\xaf\x0d\
-\xfd\xcc=\xfb\xce~\xf5o\xbd\xb5\xb5\xdd\xba\xb8\xbd\xfa\
-2L\xf3*\xa6\xf5\x1eOu`\xce\xc1\xcd\xf8\xca{\
-\xf5U\xb8\xf6\xfc\xf7t\x97\xe5\xb8\x8d\xb7m\xef\xf1\xa1\
-;\x17w.v\xe6\x9b\xe5\xc6\xdf\xd3]\xc6=\xe3\x91\
-\xe7v9\x8f\xd5[\xec\xb6}\x8e\xdf9>{\x98=\
-\xdd9\xf1\x8a\xd9\xf3\x9fu\x95[\xcf'/8<\x07\
-\xc6\x94E\xf6ZD{,I\xf8\xa1\xe7\x07\x81|B\
-\x97\xed\xd6\x9d\xae&\x01yM+\x87\xd6\xa4\xfc\x91 \
-\xe1z'\xe4\x13'\x8e%\x8e\x7f\xd6\xc0\xb1',l\
-z9\x9e\xb9\x14w\x9cT\x8dN\xa8\x01v\xe2\x1a\x94\
-\xaa\x8d\xad\x1a\x0e)\xaa\xb3\xa3T\xfa\xc7Z\xe8c0\
-x.\xc6\x9ex\xec\x9eu\x96\xa7\x19Iy\x10ym\
-#F\xf0\xa4L\xe1\x82G\xeci\xdc\x80\xed\x8d\xb9\x00\
-\xc8\xe0M\x8ft \xbbEG\xaa\xf7\xe86z\xb36\
-\xd7\x00l\xcb\xa27\xfax \xed\x9d\x0d\x14\xc6\x167\
-x\xac\x13\xb7\xec\x0c\x8a\xc5?!\x17\x82W\xe7\x06\x0f\
-\xd7\xcf)\x0c.\xff\xba\x1fM\x164\xb8\xa4\xc3\x8f\xab\
-\x01\xf8\xc1\xd2\xf2V\x02\xb2\x7f \xe8\x15=\x01\xd0/\
-\x00\xe6\x04'O\xfb\x80oF\xc9\xcbj\x91\xf6\x09H\
-q0\xc675\xfa\xd9\x86\xbd\xa5\xb8\xf9\xc9Au\xf5\
-i]\x1f\xeaY7\xcb\xc70\xd5\x1f\xc3\xd6~\x95z\
-\xe6\x9a\xe5r\x9c\xab+~\xae\xf7|\xb1\xcf\xfaY\x9e\
-}\xaf*\xcf<\xc8=\xfe3\xcf\x8c\x99\xf5\xc7\xe4s\
-\xf0\xe7`f\xfe-~\xdb\x9e\xb1[\xf9\x18\xb6\xfa\xd6\
-[\xbf\xb9}\x0as\xca^\xae\x197\xcb\xd8\xb7\xed\xfa\
-\xec\xd5`/\xc3\xef\xd9\xf6t3w9\xf7\xc6\x008\
-\xdb5\xe7\xfb\x9b\x00\xac\x19\xcc\x7fnvY`\x90Y\
-\x17h\xa3\xb2N\x8a\xa7\xf5\x81b/8>#\x0a\xaf\
-\xb7\x19\xf9\x9b\x22\xc6\xf8\xeeD\xdf\x1aR\x8bU\x95\x9b\
-\x10\xbc}\x03b'P\xb9\xf5\xf1\x9a\xa6\x0b\x83h@\
-\x05\x1b?Z\xf8\xb9E\xf4\x8b\xc5\xd0\xe0C\xf0\xff\xb3\
-\xf7\xf6\xb1\xbam\xd7y\xd7:\xe7\x5c\x7f%\xb1e'\
-i\xe2\xa6$Q\x92&-\x0auePSQ\xaaJ\
-\x84\xa4\x11T\xf0G\xa9\x0a*\x8a\x80\xf2\x07\xffU\xfc\
-Q\x09$T(\x08\x90@\x02$$\x14!\xdaB\x13\
-T\x04*\x1fm\x9a\xa8n\xdd\x84\xa4-u\xb1k\xd7\
-\xb1q\x82\x1d\x7f\x7f\xd4\xf6\x8d\xedk\xdf{\xed{\xef\
-\xf9\xe2\xf9=\xcf\x18s\xcd\xbd\xceZ\xef~\xf7\xb9\xe7\
-:\xde[\x99{\xbfk\xce9\xc63\x9e1\xe6\x9a\x1f\
-k\xae\xf5\xbe\xfb\xddb\x99\xef\xbc\x09\x1c\xb5^0\x88\
-\xc9\xf6\xceQ\xd1\xbe\x88\x9c\xab:\xea\x0097\xc6\x84\
-\xdc'\x01\xdb\xc8B\x0d\xae\x22p\xa9\xfb\x03\xae\x9b\x92\
-n\xcc\x06`\xee\x94L\x08ug\x0d\x04:\x8b\xb1\x90\
-\xbb\xea\x8c\x04\xf7\xa1{\x17\x10\xba\xea\xd2\xa9\xecAb\
-e\x0d\x18\x0d\xc0\x0cW\x06\xaf\x19jT\x8d\x1a^4\
-\x88B\x96A\x16\xde\x1ep\x1dg\xc7X\x91\xc9\x86\x92\
-\xec\x08\x87\x8a&\x9d\x07d\x85\x05c}\xa4&X5\
-\x8e?\xfb\xc3\xa0\xe0n\x04\x1f\x0f\xe0\xad\x00&=\xf2\
-\x8ar\xd8\xd8\x0bn89XW\xeeJ\xd5;\xd6\x96\
-\x91oe]\x9f\xed=y\xec\x97\xc9\x17\xfe\x99\xe3\xdc\
-\xf2Um\x1b\xdf\xf9)?O\x0a\xd3>\xe0;\x87\x13\
-\xfc\xb9\xb8\xe6>'?\xc7\x7f\xfb\xed\xfc2\xdesp\
-\x8d\xe9\xfc\x14\xe79\x98\xd9\xfe\x08\xbf\x95S\xdf\xcaf\
-\x9e\xb9<\xe3\xe6\xf2\x8c9U\xee'X\xa70\xb3n\
-\xf61\x97g\x0c\xe5=\x1d\xb2Y\xde\xe5\xce\xb7\x1c]\
-\xef\x0b\xbdy[X9\xb3\xd1\x17\xfc\xa9\x0e\x9e\x95\x8c\
-\x94R\xe6-\xff\xc8G\x02\x16\x22\xc5\xa12\xeb\x89\x04\
-\xfe^\x12\xdd*{y\x93\x0c\xcc-}U\xb0\xa1\x1c\
-\x5c\xc2\x8e\xb2\x0e\xb6w&M<\xd5\xd6\xc0\xfa\xfe \
-`-N\x01\x86mP\xc1d\x87}\xf1\x87V?\xf1\
-jm\xca\xf6Y:\xb7\xcbQ!\x08^\xb2.\xc7J\
-.$KS\xc9!p#\xfc\xb6.\xf00\xb0\x9eg\
-=\xcdC\x8er\xd4$\xd7<\xbf1\x1b\x80t\xa6:\
-\xc7\x9d\xaf\xbeV\xaf\xa5O\xd3\xa9\xee'\xf7q\x0dX\
-C\x19\x94\x14\xf8\xedr\xe9\xd1@\xe0\x91\x80a'\xe9\
-\x85\x8f*\x03\xc8\xd6%\x8b\xff\x0c\xa8\xe1_\x85\xb6\x99\
-\xf5\x99\xd0\xe1 \xcal\xb8\xb3Cg~\xc5\x09\x05M\
-\xbf\x8a\xb1\xed\x91:p\x1d\xbf\xfa\xe2=o\x8ei\xcb\
-C\xbdi\xe7\x8b?\xedR\xea2\xb1\xf8[\x03i\x92\
-\xb6\xfc\xd43\xe8i\x22mJ\xcc\x89i\x95\xf9\x8bC\
-p\xbe\x93\x1a\x8b\x0a\xae\xae\x93\xf3j\xfe\x1d\xd3!j\
-\x9b!\xb8\xa4\xb0\x87\xdf\x93As$\xdf\xbax\x5c\xdc\
-\x91\xdd\x91|\xebw\xae?\x8e\x0d\xf6[\xbbm}\x0f\
-3\xfb\xbd\xac\xbc\xc7w\xc4y\x84=\xf2\xb1\x87\x9fe\
-G\xe5#\xff\xb3\x9f\xd9v\xc6o\xe5\xb3\xcd^\x19\xfc\
-\x91\xcd\x91|\xe69\x07\xd3\xf8\xc6v\x8e|.\x9f\xc2\
-\xb5\xaem\x98\xb1~u\xfc\xba\x80r\x11\xbf\xcf]?\
-\xeb\x04?\xe80`1P\xc12\x95_\xbc{\x0f\xa9\
-\xfe8I\x12>\x04@\x99]\x80\x92V\x17\xe1s\xf5\
-\xef\xc7\xfe\xb2\x0e\x8fr\xafA\xb2c\xee#'\xc1`\
-9e\xdd\xa1X\x8e\x9e\xf7\xd8\xed[\x08r'b+\
-\xb4\x89uH\x08Q\xab\xec\xa8\x0b\xde^r\x9e\xd2.\
-\xbca\xd3\xd4\xe0{}JY\xea\xe12\x0c\xd8;f\
-LKW\x1a\xd7o;>)\xec\xbd\x9c'\xa2k}\
-\xbc1\x1b\x80\xb9K\xd2Wt\x96\x12\x0a:\x94r\x8b\
-f\x99\xca\xee|\xf4\x95\x8c\x05l|\xc0C&L.\
-l\x0c\xd3\xa4\xd8w\xad\xf4\x1aE\x98\x1b[\x83\xcb#\
-\x09\x13\x05\xd8>\xd9\x05{\xc0Y\xae\x83\x8c\x18\xc6N\
-pT\xd1Q\xb8\xac\x09\xa4/\x072{\xe9\x9e\xfb\xda\
-\x8b6\xf4|\x92&\xbb\xf5\xf8\xce\xc0\xd6\xc5\xbf\xe7\x9a\
-\x90>?X4\xb9e\xd5\xc2I\x86\xbe_\x82\x88C\
-$S\xcay\xa8\xf3\xd7\xa4\x93~\xe6\x9f\xc4\x8fU\x9c\
-\xe3h\x82\x97\xcb\xbfg\xbf'\xc3\xdf\x91\xbcc\xe9\x1c\
-\xdcU\xb0m\xb7\x97\xc3\xc39\xde\xe3;W\xb6\xc7\xdb\
-\xb2-\xc7\xb6\x0enO\xd6\xf6\x9d\x1fa\xae*\xdf\xf3\
-\x07\xc7\x1e\xcf\x9e\xac\xe3\xd9\xe63\xb6\xc7\xec\x8c9\xf2\
-\xd1\xf1\xcc\xf6\xb3]\x97\x8f\xf4{\xf2\xad\xecT\xbdu\
-\x9d\xef\xf9k]\xe7,\x1d\x94\xb34\xe4\x03\x80\x94\xfd\
-\x8a\xd07\x05\x8dO\xce9\x0e;_\x9a\xf3\xc2\xdd\xbb\
-\xae\xf8\xc3\xcbp\xf5\xfb\xfb`\x98\xe7\x80\x85#\xc3\x93\
-/\x94\x12\xf7\xb9%\xe7m\x85N^Y\xd0K\xe6\xef\
-5\x1b\x1ch4\xbe\xd1M`\xff\xf5\x01\x1280\x12\
-\xc0\xf3\xc0\x82\x06&OK\x8b@\x01u\x0c\x89M\xe6\
-\xd3\xfc\xe9\xb2\xc3\x1fr\xf1\xab\x8cN\xbf\xe3<\x04\xe3\
-\x00$''\xf5\x5c\xecz\xa4\xd7\xf9xc6\x00\x1e\
-/\x1e\x00tb\x06\xa5\x07\xe7\xf4\xe8\xa8\xe5\xf4r\xba\
-V]g,]\x98\x8b*\x83\xd9\xb8\x1a\x0cH\xe1&\
-E\x1e\x85\xb9\x19D\x5c\x13\x199\x16\xaf\x0bv\x0f\xb6\
-1v\xb0\x07\xaa\xd7#\xfe\xad\xc8{u\xd9[\x13\xbf\
-a\xcaQ\xe2M\xb9~\x89\xcf\x05\xc5\xcd\xe4 \xa6\xe7\
-_\xd2\x13\x00\xc5\xd1\x1f\x5cu\x1b\xb0\xc04h[\xf5\
-{r\xbe\x8c\xb7\x12}\x95\x89\xf9(\xcd\x98>\x0f-\
-\xc3f.\x1fq\x5c&?\xe28\x92\x1f\xf1]\x15\x7f\
-\xc4sJ\xbe\xe7cO\xb6\xc7\x01\xee\x5c\xecv\xd3\xb5\
-\xc7wU\xd9\xb9\xbe\x8fx\x1f\xd7~kwY\xfd\xc8\
-\xfferx\xb7\xdc\xa7l\xf6\xb0{\xb2S\x1c[\xdd\
-+e\xdf\xbc\x9d\xe3\x97r\xd7k\xca;\x9c.\xd7\xf4\
-\xbe(\xc3\xae^(\x1a\xcb\x0a\xf0\x82\x9e(\xd6J\x15\
-\xb9\xd6\xd0\xf1\x1e\xbf\x97\x08\xd5eP\xcb\x9e\xf2^\xa5\
-b\xa5h\xbcN\xd9\xc6\xc42*\x076w@\x94\x10\
-fES\xc1e\x13\xf7\x1aG^\xeb7\x9c\xe8\xfc\xad\
-~\xb6\xc3G\xbd)\xeaMB\xec\x83\x13'1\x09\xef\
-X\xa0\xb1-1\x13k\x82\xc9zW\x81\xc9\x9c\xb0\x90\
-\xf1\xd4\x94;\xfe\x9cS|VY\xf9\xd6\x06\xaf\xd79\
-\xdd\x9c\x0d\x00\x9dGO\xd0\xd1)\x8d<b\xe4\x9d@\
-\xa4\xe3\xbb\xd3e\x18=\xf6\x05\xec\xfc\x11{\xe9\xd7\x0b\
-;<\x12\xd8\xaf\x8a\x9dG\x9a\xa0\x04\xf1\x00\x84\xa8\xb9\
-]H\x0c\x88I\xa8\xb2\xebv\xb5\x05Hm\xcfp'\
-y\x00'p\x88\xf5\x16\x80v\xec\xda9\xf8.\x1f_\
-\x1d\x9fdy* \xa3\xf2k3s\xc0$\xb1\x1a\xd9\
-\x17\x19O\x18\x00\x95\xba\xde\xf9,\xa7\x9c\xc9@\x08\x89\
-\xaf\xeb\xe4\xc8\xba\xdevG9\xd8NG\xe5\xd6\x93\xcf\
-\x98Y\xbeW\x9e\xb1\x1d\xcf,k\x9b=Y\xeb\xb69\
-\xd8s\xf0\xa70\x1d\x0b\xdc{|\xa7l\xb7\xf1\x1c\xd5\
-\xb7\x1c\xdbz\xdb\x1d\xc9[?\xe7[\xec\xb6\xde\xd8#\
-9\xfa\xad\xae\xeb\x9d\x9f\xc3\xd1\x98\xa3|{~\xa9\xc3\
-\xbf\xf5\x81\xfdVvY\xfd\xc8\xe7e\xf2=\xff[_\
-s<\xad\x9b\xf3=\x0el\xfcV_-X\xcc&\xa6\
-\x14\xebD\xcf,\xf4.\xeb\xe0?\x0b,\x9d\xd7\x0c=\
-\xe6\x07\xef\xf5G\x85\x17\xf5O\x82\x84\xd2K\x97\x87Z\
-7TQ\x82\xc1\xa8\xca#2\xb3|74\xef\xf3K\
-\xe7\xb4\xe2\xf3}\x00\x8eBk\xd4\x8a\x1f\x9c\x0d-;\
-\x9aC\x5c\x15\x98rV\xed\xd8#\xa4l\x13o\x12\xb2\
-n\xf7\xff\x22 V\xf7\xb9\xf1B\xf9f\x09\xe2\xc6\x85\
-\xa7\xc7\xc9\xf0Uz\x90\xd15\x8eXT\xc6a\x0e\x14\
-\xae}\xba\xce\x1b\x80\x1e\x09\xee\x84\x0c\x06\xf7Nu\x8a\
-$\xf4\x97D\x9d\xa7\xe3v\xe4\x02\xd8\x1epSX\xd6\
-\x16%.2\x1c\x03c@ \xc2\x81/\xba\xe5\xd9Y\
-sJa\xeeA\xdcv\xd9i\xda\x1e\x84[c\xb26\
-\xaf\x1c]\x0fZ\x89\xc0\x05\xbc\xf8\xaf\x01%x\xfa+\
-\xcf\xfb\xe2\xcf\x93:\xab\xc0cM\xfb\xc9\x95<\xe9%\
-\x7fJ \xca\x1e\xccQ]\xe9\x88\xdde\xb6\xad\xef\xfc\
-\x1c\x07W\xc1\xee\xf1\x9dc\xdf\x98\xce\xf7xf\xd9\x11\
-\xeeH\xde\xb6\xe8y\xf5E\xa7\xe5{\xf9e\x5c[\x9b\
-s\xf0O\x1as\x8a\xefHw\x15\xf9\x11v\xdb\xf6m\
-}\xb6\x9b\xcb[\x1c\xf5\xde\xe4\xee\xe9\x90]f\x7fd\
-\xb7\x95\xef\xf1\xec\xc9\xb6v\xd4\xcf\xc5mm\xf7\xec\xbc\
-\x9c\x98Sm\xd7X\xe4B\xcf\xaa\xe0\xe5\x03y\xbdf\
-.d\xac\x17_~\xfe\x05\x15\xa6uK\xf6^\xe8\xbc\
-\xfe\x01\xd2\xc5\xbb\x17\x16\x97\xb5\xa6\xa8\x8e\x88X\xfa\xa2\
-\xaaY\xb0\x96\xc1I\xe7k5eG \x03\xd2\xb8\x83\
-\xaf\x08\xaa\x8e[;*\xff\xb1\xa2!*i\x1dC\xec\
-\x1b&\xc1\xd6\x0b?&\xe80\xe6\xa5T|#.\xe9\
-\xba\x1c\x0ck\xb1\xee\xa1\xca.:>K%S\xdb\xeb\
-@Y\xfa\x9b\x96\xae\xf3\x06\xe0B_t\xd7d\xac\xa4\
-\xe3\xbb\xbf:\xf7\x88\x11\xb0\xb1\x9d#`\x8c\x90<\x80\
-]\xaaAj\xbc\x0e\x1em\xc5\x8b\xbem\xcaNU'\
-\x0fz\x97\xb0\x8f\xb4sF\x11\x03\xb5\xe3\xe9\x1c8H\
-l=n\xa9#`\x13\xae<,*3\x0a\xa7,\x95\
-[\xcbg\xbf\xf4\xbc?\xb8\xc3\x9f\x03b\xcf\xdb\x08|\
-\x0e\xc0p\x88\x8a4\x03\xbc\xc5l\x04\xf8p!>\xf3\
-\x82\x8fA\xdeu\xf29\x81\xefI\xb0\xd5\xcdv]n\
-\xbe\x99\xa3\xcb[\xfb\x96w~\x99~\xc6uL-\xeb\
-|\xe6\xa0|\x0en\xcf\xb6e\xdb|\xe6\xdf\xea\xdaW\
-\xe7\xed\x9f\xbc_[\x1b\xea\xa78\xcf\xc1\x9f\xb2?\xa5\
-k\xee#\xccU\xe4W\xc1>N\x9b;V\xce-\xbe\
-x\xcd\xe5\xd6\xcf\xf9QL`.\xdb\x1c\xcc<{\xe5\
-#\xee\x8em\xb69\xc2\xce\x18\xca[[\xeas\x9c\xcd\
-3\xe3\xd8\xd8\xcf)\x1b}$:O\xfc\xf8\x5c\xd5\x18\
-\xebe\x81\xf5\x81\xf3([n \xbe\xf6\xd2\xdd\xe5Y\
->S\xa4\xf7\xf8YG\xd0\xf5\x18\xcez\x82\x10?\xd6\
-\xba\x84D\xa6N\xee\x87\xaa\x8fu\x0f\x17\xf2]\x00\x02\
-0\x7f.\xccR\xb6\x8e\xddA\x97\xbd\xf0\x09\x07\x94\xcf\
-\x1b\xf0c\xbb\xac\x9f\xd4\xd3\xe7\xb4\x0d\xff\xe8Kg\x1c\
-2I\xcdGt\xa0\xc0\xc0G\xbdS\xca\xe3C~\x9c\
-\x0b\x81\xc0p>b\xa7\xacM\xe2\xac\x8d\xaf}~\xdd\
-7\x00t\xc7\x94\xe88u\x99;\x99\x5cu\x06\x81~\
-\xdc\x7f\xdd\xb9\xd4V\x90\x87\x86\xf5\xc6\xa7\xcb\x07\x8f\xb8\
-\x86\xbd<\xa5\x5c\xf6f\x9d\x07U\xf9\x83\xc7\x10\x02\x89\
-\xde\x7fB\xd32\xf1\x10U\x87A,\xf6\x8f\xbc0\xc4\
-\xedH\xa4\xcbN\x94O\xcfbU\x9f\xa2\xc5\x9e$\xbd\
-~\x97\x8f}\xfe+\xcb\xef\xfa\xaeo\xb5\xa8\xf6\x0d^\
-0\x18\xd8|\xff7l\x0ch\xe2\xef\x94\x09\xa4\x89\xaf\
-\x0f\x0f\xcc\x9b\x81\xd6\xef\xe5\x99P\xc4\x99\x0d\xc4\xc5\xc9\
-\x14\x8b\xc6\xec\xd9\x1f\xc9f\x9b\xb9|\x84\x9f\xe5\xe7\xe2\
-\xcf\xc5\xcd\xdc{\xe5\x99g.\xefag\xd9\xbc\x80\xcf\
-\xf2W\xaa<\xc76\x97_)\x7fO\x92\x97x{|\
-ny\xf7\xda\xf28\xe7v\x8fg\xeb\xeb\x95\xa8?)\
-\xbf\xcd\xb3\xce\xe8\xbe\xdb\xd7,\xd7\xfcD\xee\x17k\x84\
-\xca\xac\x0b\xa9+\xaf\xe5\x85\x85\x81\xf5\x83u\x87\xc3\xd3\
-\xcf<\xe7\xb5B5\xd5\xf5\xab\xc5\x87\x0f\x01z\x9e\x83\
-Q\x82\x83\xa3\xd7\xa8\xee\xa7\x92\x9b\xc6\xfa\xe0|\xf3\x0d\
-\x8f\x1d\xc8\x12c\x97c@d\xbe\xf9b?\xe1@\xca\
-\x18\xa2\x0a\x121\x093\xca~+\x81\xb8\xfa\xae-Z\
-\x1d\xcd\xe6\xdc\x9f\x0fpl\x92\x95\xbd\x18\xc41*\x83\
-\x0f;t\xe0\xac\xc7\xb7\x12\xe7\xb7\xc7`\x87\x8cQ\x9f\
-\xf7\xa0\xae\xf7\xf1\xbao\x00\x1e9\xfb\xddi\xf4f\x06\
-\x9d\xbb\x9d\xde\x9c\xb0\xee\xe9t\xb0\xa4\xee\xef\x1a]\x19\
-\x0a\x12b_\x16\x9dO\x04\xb6\x8a/\x06\xcd\x8ah\x19\
-\x83\xaa\xc5\xd6\xcf\xee!\x92I\x06RM.d\x0cj\
-\xab\xacti\xf0\xcd\xf6\x8eU\x18\xbb\xf54\x5c>\xf6\
-\xf4\x97\x96\xdf\xf9\xe67\xfa\x83\x80\xcct\xfb\x84F\xa0\
-\xfe\xf6*NA\x16\xca\xb4\x0d\xee\xc4\xd0\xb1\xc4n\xbb\
-\x98n\xeb\x84\xdav\x94I\x89\xd3\x01EP\xc7-\xee\
-\x82\xf2\xa02\x9f\xcf\x86\xcc<s\xb9\xf5\xe4{\xf2=\
-\xd9\x11v\xe6:\xb7\xdc\xb1\xe2\x872y\xfb\xec|\xcb\
-u$\xdf\xe2\xa8o\xb1\xdbz\xdb\x1c\xc9[\xbf\x17g\
-\xeb:\x9f9\xe6r\xeb;\xdf\xd3\xed\xc9\x1aO~\x99\
-~\xc6R\xeex[\xde\xf6\x9d\xb7\xbc\xf3#\xf9V\x7f\
-\x19\xae\xf1s~\xcaf\xab\xbb\xac\x0eo\xb7\xed\x08;\
-\xcb)\xcf\xf59.\xca\x9e\x9b^\x0fR\xee\xf7\xfa\xfb\
--?f:7\x00\xfd\x16\xc0\xacgI\xe1\xae\x99/\
-%\xa3|G\xb8\xcf~\xe9Y\x09U\x11g\xd1f\x99\
-\x91NB\xff\xaa0\x12\x18'\xa9S^\xd7\xb0V\xf5\
-\xf7\xfd\x1b\xd0\xc22s\xb5\x1d\xb1Z\xa9\x8c'\x05U\
-\xe5\xd5 a\xd5\x05X\x1b\x86\xe6\xa5\x8d\xad\xb3\xa9\xeb\
-\xd8\xd3\x94\xb4\x83\xc09\x8f>\xf7P\xca\x80&\xcd}\
-a\xdfn'\xf2\xc2\xc2\x90\x86A\xadD=\xa5\x9bp\
-\xbcY\x1b\x00:\xb8{\xc5\xbd\xdf\x83\xd1\xfd\xad\x01S\
-\x9d\xe7\xce\x9f\xb0\xd8t\xc7\xb7\xbds&\x1f\x83\xa1\x07\
-\x0b\xc3(\xa3\xa7\xe5\x81\xad~.\x0c\x0e\xfc0`\xa0\
-\xd7\x8b\x01k\xbd\x8c]\x97\xc6\xa5\xf2\x0d\xca\x1b\xd4\xf6\
-\x17\xade\xf90\x1f\x84\xb1\xb5\x7fX\x8c\xbd\xb5|\xfc\
-s_Y\x96\xdf\xc3\x22 =\x8f\xea\xf5/=\xbd\xe5\
-\xd7\xdf\xddf\x01\xa1\xed<\xd6\x22\x1a\xde\xf3Z\x1f\xe7\
-\xd3\x86\x9e\x1c\xbd\xd8\xf4d\xe8z\xeb\xc1\x9eJ\x8dk\
-\xbbS\xd8od\xdd\xe3\xc4\xbf\xb7Qz\xa5\xdbH\x9c\
-W\x8d\xf5\xaa\xf8W\xa2\x0d\xc4\xd0c\xec\x14\xff\x1c\xeb\
-\x5c>e\xf3\x8d\xa6{\x12q7G\xe7\xb4\x91r\xd6\
-\x15Mu\x95}qg\x89\xa8\x13 \x91\xcb\x9d\x0f=\
-r\xd6\x0d\xafLZ\x0dX\x12\xaa\xfc\xf9/=\xe7;\
-\xeb\xbeS\xcez%5O\x01\x94\xad\x1f\xe4\xc3K]\
-x\xf1\x22 \x12\x88\xa3A\x8d\x13\x93\x1b\x8bz\xa4\x01\
-B\xd2cA%\x82\xc5\x0eS\x13R\x15gU\xfa{\
-\x09b\x156\xe0\xae\xdb4\xc4\x88\xda\xde\xb1\xa9\xd28\
-\x87\xab\x03\xed\x87\xd7\xee\xca\xc7\xea+\x01\x80\xb1]h\
-\xc5:\x05f\xaf\xd7\xfbpc6\x00\xe9\xc8\xea\x1cu\
-j\xf7\x17\x03\x81\xd4\xb9\x15s]\xe5\xa0\xc1\x80\x92e\
-~\xd5\xf1t~\x982\x08T\xaeGH\x83\xaf\xed\xb9\
-\xb8\xfb1\x96\x04\xc5h\xfb\x98\xfb\xe2?\x88\xcbS\xdc\
-\xe9b,<|\xf6\xeeQ\xcb\xc0\xf4m|d\xe8\x08\
-@\x17\xf7N\x9ef\xfew\x5c|\x09\xd0\xc3\xe5\xbd\x1f\
-\xfb\x1c \xab\xf9?\xdel\x04\xc0\xb0\xe9\xb9\xedg\xff\
-Y \x82\x08\xcb\x98T\xf6\xa9\xe8\x94s\x11\xebI`\
-\x9f\x82v\x8e\x15\x98>\xd7-\x9f/|[\xdbx:\
-\xff\xd81\xedY\x1c\xe9\xb6\xf2m}\x8f\xabe\xe7`\
-\xc1t\xbb\xb0\xbb\xcc\xe62\xfd)\xdfG\xb6Gr\xb8\
-\xba\x1f(\xef\xe1\xf6dO\x02{\xc4\x81\xfc\xb2\xd41\
-\xf7y%\xc6.c;\xc7<\x97\xb7\xbc\xa7t[\x9e\
-\xab\xda6\xfe\x1c\x1f\xa70\xdd\xd6=\xbe\xad]\xd7\xc9\
-\xe7r\xdbv\xbe\xa7\xc7\x8f/\xf2\x9a\xfb\xfe\xb7\xbfZ\
-\x01\xeek>\x8b\xca/\x8d\x94\xacL\xc2YFM\x0b\
-\x82\x97\x1a\xad\x19\xd8\x7f\xfc\xf3\xcf\xc8E\xca\x0f\xf5\xcf\
-\x7f\xe6\xf5\xc2\xbeYWXOH\xcaR\xd2\x91\xa5Q\
-\x22\xf8\x22\xeb\x0a\x8a!\xc1*\xc9\xb2u=s[M\
-\x80\x9a\x80c\x03\xcc\x8f\xfaMC\xdc\xb1\xe1f\x8au\
-\xdbzd\xc2e\xfc\xd4\x05{\xb8i\x9e\xe4\x16\xbb\x98\
-\xd5\x1eCx\xf0\x99~\xaaqX\xdc\xc3J\x05{\x96\
-\xaf\xbd\xe6\x94\xbbk\x97\xdd\x98\x0d\x80;\xaa\x06\x07\xbd\
-0:\xce\xddV\x83\xc5R&V\x06K\xba\x94\x81\x00\
-:\x83\xc0\x96\xba\xa0^\xe0S=6\x81e\xe0\x09a\
-\x7f\x0c\xb8*\xf7\xe8\x87\x1f\x86\x8eG9\xec\xe64\x05\
-\xfc\x93\xde5\x10\x95\x84\xef\xc1\x18\x0e.\xde\x9a\x96l\
-0\xb4/`\x12x\x10*G\x0e\xf6\x1f~\xec\xf3\xcb\
-K\xf7\x1f\xf8S\xfe\x81=\x5c\xf8JO6\x02\xd98\
-\xa4Mx!\x0e\x99:/\x8f\xce\xe6E\xa5\xe5c\xc2\
-\x99\x8bw\x11\xe3o\xd6\xcf\x98.\xb7~\xce\xd3\xa6Y\
-r\x5c>\xe29\x92\x1f3]\xd4\xcc\xf6\x94\x89i\x96\
-]D\xaf\xb5y\x93\xb3J\xd3\x17s\xfdI\x95\xe7\x98\
-\xae\x12\xe7)\xff3'\xb8m\xfd\x94\xedUt\xa7\xe2\
-=\xe5\xf3\xe8\x1c\xef\xf9>\xc5\x03\xfe2\xfd\x1e\xe7\xe3\
-\xc8\xf0s\x95\xb8O\xf9\x80\xeb(n\xe4=\x7f\x8c\xa3\
-\x8dEF\xee'\x00\x9a\xeb\xe8\x5c\x960r/\x19~\
-\x18h\xb9\xb1\xd1\xf5\x8d\x024\x9a\x06\xfe \xf1G?\
-\xfbE\x97\xcd\xcd\xc1\x8b\x0eo#\x02\xe2\xd7\xab\x87\xb8\
-\xeb\x8dE\x19\x22\xb1\xd2y\x0e\xbe~\x9bD\xf3\x0b;\
-\xdaV7\x221@\xc9\xcb\xa4**\x17\x06\xe7\xf0\xd9\
-\x94\xbc\x0b\x96\xa1\x87\xab\xd6\xf3\x9a\xbb\x99\xc3\xab\x8d\xa0\
-M%\x1e\xd6\xbd0\xfa\xfc\x11\x87\xedM\x15}\xf1\x88\
-\x18\xd3$\x07]E\xdc:.\x17\x1aq#\xf2\x1b\xb3\
-\x01\xa07\xd6\xcef\x00\xf4\x84\xa9\xceww\xd1\xc1\x1a\
-\x0eSG\x1b\x87N0\x8f?\xb1\xa4\x5c\x03'\xe6\x1e\
-B\xa8(\xe4\xbd'\x8c\xca'\xf2\x0b\xe5\xdep -\
-\x02GG\xad\x86#nP\xe5\x0an\xdf\x89%N\xca\
-\x95\xe6\x85\xf0<\xae\x87?\x01fF#p\xac*\x88\
-\x83/\x03z\xbf6\x01\xbf\xf7\xfb\xbf\xd3\x94\xd9\xd5\xf3\
-\xc9\xde\xdc\x05x\x1e\xcb\x9e\x0dA?\x11(\xd2\xb1\x80\
-1\xc8\xfb\x03\x81\x94\xef\xdf\xd7\xff#\x18\xe7\x11\x7f\x89\
-\x01L\x97]\xa8\x83\xe3\x9b\xcap\xcc\xf6\xb3~\xb6\xdb\
-\x96/\xc3]\xa6o\xbe\xcbp\xc4\xd7\xa9c\xed\xfa\xd1\
-\xa2~\x19g\xdb\x93o\xb1\xdb\xfa\x8c\xdd+\xcf\xf8\xb9\
-\xbc\xc5\x1e\xe9\xb6\xf2m\xbdy\xae*o\xbb\xab\xe4\xb3\
-\x8f.w~\xc4s\x99~k7\xe3\xe7\xf2)\xdcV\
-7\xd7Oq4\xee\x1cLc\xc9\xb7\xf8\xb9\xde\xe5m\
-\xde\xf6\xc8y16k\xc9Q]\xd3_u\xe6um\
-\xcf\xb3\xd2x\xeee\x1d\x0a&\xab#e/<\xd8\xe9\
-\x86\x81r\xe6\xc1\xad\xe5\x13O?\xb3\xdcc\xad\xf1\xa3\
-L\xd6)@z\xf9\xfb\xfe\xeft\x18\xc6g\xf9\x01\x93\
-O\xe8\x9bc\xcc'm\x0e\xe4\x88\x1f\xbfu\xa0\xac\xd3\
--=U\x10iU3\xff\xe2)\xeb\xb5\xad\xb8\xf8*\
-\x85\xae\xd7\x10\xafvY{Y\xbf\xf9\xa51p\x0bn\
-\xac\xcb\xc1\x9b@\x8a0\x99\xcd\xe7\x0ap\xda+Oe\
-K\xc1\xf3?T\xe6\x0d\xa6XV\x92\x08n\xd0\xf1\x06\
-m\x00r\xc1fP\xd0y\xee\xd0\xeeXut:\x94\
-N\x07\xa74\xdf\xd5S7&\x83*\xef\xd5\xd7\xc0\x13\
-\x9aAi{\xd9\xea7\xf6\xca\xf5\xcbp\x8aq\x95\x8d\
-\x05_R[W\x1c\x12\x95\xff8\xf3c\xfa\x9e4\x85\
-1\xbfb\x83\x97?\xcd\x09\x91\xd8\x18\xf4\x9a7\xe8G\
-\xd9Jd\xfa\x93\x9d[\xf7\x97w}\xf83\xcb[\xbe\
-\xef;\x12\x98`\xfe\xdeoLq\xec=\xbc\x08\xb8v\
-\x9b\x03\xbd&\xfb\xf0\x9b\x85\xc5\xd0:\xf49\xecs\x8a\
-\xd8\x93\xae\xf2\xd6\xe7\xdcF7\xcbflQ\xbe\xa2Y\
-\xfb\xc3I\xc7<\xcbN9\x7f\x12\x17\xfcS\xfc\xb3n\
-\x1b\xd3\xb6>c\xcf-\x1fq\x1c\xc9O\xf1\x1e\xd9 \
-\xef\xfem\xfbS\xd8\xcb0\xad\xef\xfc\x88\xab\xf5G\xf9\
-\xe3\xda\x9d\xe2\xdbkk\xe3\x9f\x94?x.\xe3\xea8\
-\xf0\xbd\x87E\xe6\xc7\xfe\xe8+@\x96\x0d\xca\xe3\xa9\x00\
-k\x89\xea\xf7\xd88\xf8\xe2\x1e\x9d\xe1\xaa\xf3$\x00\x8b\
-\x0f~\xea7\x9c\xb3`x\xcd\xe0B\xcc{\xff\xdc1\
-SD\xabu\xe8\x81\xfe\xe8\xff6\xff#\xa0\xd7.\xf8\
-{\xcdR\x99\xa5\xca`e.+\x0fV\x0a\xc5kr\
-\x1c\x80S\x8e\x88B\xe7\xae\x89\xdb\xed\x85\x00\x8c\x11%\
-\x93\x00\xd7>7\x8a/vX)\xa9\x92\xb0&\x07\xd1\
-X\xce9\x81\xcck\xd6\x88\x19Y\xec\xf2\xa7\x84\xd8&\
-\x0176\x05\x09Y\xe1oN\xbaA\x1b\x80t\xf8\xe8\
-,\xf5\x91\x07\xc2\xe8\xd8tpd\xe9@w3}\xaf\
-\x9f\xd8M\x9dM\xc7{\xe4I'\xb8\x07\x1b\x9c1\xf5\
-1\xe5u8x\xc0Zc\xe3\xd8\x17\xb7\xed\xe5\xfcB\
-|\x8d\x85\xc2N\xf0\xaf2u\xe2N\xa6c\xfc\x93\xa3\
-g\x90\x0e<`\xfe\x01\x90\xfe-\xf0;>\xf8\xa9\xe5\
-O\xfe\xf8?\xa9\x89\xcf\x13\x03MR\x81\xfb\xb3\x04\x5c\
-\xec\xfb\x9b\x04=\x09\xb4J\xf0$\x80qM\x9d\xb8\xf0\
-\xe7\xbb\x0b\x84J\x1ds\x97\xc9\xb9\xfb\xe7\xc9\x00x\xb0\
-\xe4\xe0f,8\x12\xb2W\x22\x9d\xc3\xeb\xf3\xbc\xe3\xbc\
-c\xdd\xaa\xce\xe1l\x9b-v[?\xc2!?\xc2\xb6\
-\xcd6\xdf\xe2\xb7\xf5-~\xae\xefa\xf7d\xb3\xcd\xb6\
-\xbc\xc5\xcfu\xca\xdd\xffm\xd7\xfa\xce[>\xe7\xa7t\
-3n[>ew\xb4\x81\xbb\x0a\xc7\xcb\xc1\x9ek;\
-\xb7a[\x9e\xeb3\x1f\xf2~Y\xce\x5c\xd5\xd4bN\
-{.3s\xf5\xcb\x1d\xbdq\x02\xf1\x19\x00n\x00\xd8\
-\x0cP\xe6\x03J\x92\xf8IAf%\xb3\x1d1\x8f\xf2\
-\x19\x97\xcb\xf2k\x9fzZ%\xea\xe1K\x86m\xd6\x06\
-;\xb1Q\x0e\xacP\x9a\xfd\xd6\xf3M@\xd9\x04H\xa7\
-\xe0\xb8)\xc1^\xcc\xca\xd9:\xa4\x98\x02G{\xb5:\
-\x07|\x0eF\xb7#\xf6 \xb3\xc6\xb0\xce\xc5L\xb9\x0b\
-\xc8)\xc9\x9fc\xb4\xc3\xb8\xb0\x22\x9cRJ\x86\x0d7\
-J\xc5\x05\xca4\x10T;\xc4\xa4b\xc4\xe8]\x07\x04\
-\xc6\x82I\xd6\xf5\xeb\x9d\xdf\x98\x0d\x00\x03?}\xa4\xc1\
-\xa0\x1f\xbat\xa4\xb9\xff\x18\x18\xd2\x0d<\x9d/\xd1\xa8\
-S6bX\xbb0\xb1\xb9n<\xa3\xa5\xd2\xb0\x97\xec\
-\x82\xbd+\x1d\x1b~\xb8h^\xf4\x07E\x06rr\x1d\
-\x13\xbf\xdb\x04A'\xfcIW\xf6\x19\x95L.\x094\
-\xc9~Eo\x01|\xe6\x0b_Y~\xfb\x9b\xbeE\xf5\
-\xc4\x01\xafw\xee\xac\x04\xb6{\xa0\xcf\x06\xc4\x84\x05\xc2\
-EaY@\x99\x1c}\xe1\xa4={mD\xd6\xa9\xcb\
-{6{\xba\xb6\xeb\xbc\xed\xba>\xe7m?\xcb(#\
-\xdf^t\xb6\x98m}\xe6\xa2<\xd7\xb7\xd8\xc7\xa9\xef\
-\xf1!\xbbj\x9c{\xbe\xb7\xdc\xdb\xfa\x9eM\xcb\x8e\xb0\
-{rd\x8f\x13\xefe\x17\xde=_\x1d\xdf\xb9\xf9\x1e\
-\xc7\x9el\x8fo\xc6\xcd\xe5=\xec)\xd9\xcb\xb1\x85\xb7\
-\xed;?\xe5k\xc6\xcf\xe5\x5c\xec\x99\xc6=\xb73\x96\
-\x99\xc5\xe8\x98\x99<\x5cW\xd1\x17z\x9e0\x0e\x1dB\
-f\xbb\x17\x0f\x8a^\x0c\xfc\x94\x91\xeb\xe3\xd3_~~\
-\xf9\x84>\x00\xc8_\x0f\xf9\xf6Ap\xbc<d\x83P\
-\xb7\xff\xf1Pk\x04k\x05\x1eo\xf3H\x1fn\x12\xab\
-I%\x8a\xe5#\x12\x08\xf1Yz\xe2\x01#\xee\x01S\
-\xb9\xd5\x1e\x8b\xd4\xf8ec \x90\xcf\x1d\x00h\x94\xdb\
-\x1c\xba\xe2uk[\x87\x8c\x04^\xc9\xd1\xca\x88\xaa?\
-\x8a\xa0Rs\x0e\xff\xbe\x10$\x1el\xf0\x07&$\xca\
-]4\x03\xea\x1b\x91n\xcc\x06\xc0\xdd\xedC:\xdb\x03\
-\x87\x0e\xa4\xd7\xf4\xeb\xce\xa4\xef\xaa\xb7\x03\xb5\x02\xa1~\
-j\xa4\xb8\x96\xbe\xcd\xc5:\xc8u0D\x97\x81\xa1\xb2\
-G\xa2\xbd\x84\x1b{LD\xd7\x03\x12~\x97\x8d\x8dn\
-\xf8\x93\x8c\xdd+\x83\xb2C\xe0}5}\x03\x87\xab\x94\
-\x89#nD\xea\xb7\x01h\x17x\x9ch\x97\x8f\xc3\x1a\
-\xbc?\xf7\xce\x0f-\x7f\xf2\x0f\xbf\xd5r\x1e\xef\xa3\xd7\
-\xd1-\xc4\x84\x09\xc7|\xf6\x93\x01+d\x7f\x9f\x81.\
-\xea\xe6\xd3f\xa0\x13\xed\x9e\xdbN\xbbY\xf4y\xdd\xb9\
-s\xc7\xba\xf9\x22\xb0\xc5R\xef\xd4\xb6}\xeef]c\
-\xce\xc9g\x7f3\xfe\x88\xefH\xfe\xb8\xb6{|\xe7\xca\
-\xf0\xf9r\xb1G\x1c\xa7\xe4\xe8\xe6D\x0c\xf4\xc3\x1cK\
-\x97;\xdf\xe2\xe7\xfa\xb6\xbcg\xb3\xc5l\xeb\x97\xd9\x1c\
-\xe9\x91\x1f\xe9f\x1f\xe7`f\xfcU\xcb\xa7\xf8\xb7\xba\
-\xab\xd6\x89\xa5m\x18\xef\x9e\xaaLR\xa5\xfbu\xa7\x9f\
-\xb5,\xf3\x96i\xc6\x05?o\xfb\xe9\x22\xae:\xab\x84\
-s\x95\xefk\x0d\xe1\xc2\x0eO\x16(\xe9\xc5\xe7\xb7\x00\
-u\x91\x7f\xd7\x87>\xad{\x08\xf8\xb3\x96\xf9N\xb9\xca\
-\xb8\x85\x07=\x08\xaf(^G\xb4:\x11\x9b\xed V\
-\x02c\xdfxJ\xbcX\x8c\xb2D\xf9f?\x16\xb2\xe8\
-\xbdD\x14\x14\x0f\xb4;>\xe0\xc3R2\x02\xa0\x5c\xe7\
-@\x1a\xe1\xa8\x17\xbb\xe5\xf1\xa3\xe6X\x07O\x7f^\x89\
-\xb5\xed6\x1b\x09HT\x1ec\xbf\xec\x06o\xc5a\xaf\
-4\xc4\x89\xf3&\x1b\xc7\x8b\xc3\x96\x97\xfa\x1ag7f\
-\x03\xb0v\x90\x87\x8e\x07\x8d;\x95\xce\x9a\xfbKu\xaa\
-\xf4\xb3m\xdcy*\xd5\xa0\xb0T\x00l\x87\xbd\x07I\
-\xf5r\xdbKf\x9b\xb6W\xee\x0b\xaer\x8fU\x0f\x5c\
-U\xec\x9bCym{\x0656z\x912@U\x90\
-\x9e\xe9\xee\x07q\xb6\xcd\xc5\xb8c\x19L2\xe4\xfb\xb7\
-\xe5\xa6\xfe=0\xa5\xfb\xcb\xdb\xfe\x816\x00?\xf1O\
--\xf7\xef\xdd\xf5\x84\xbd\xcd{|\xe2\xe3m\x01\xc7K\
-;\x91\x88\xc8\x1b\x1c\xd1\xdf\xd6#\x01O0p\x9a\xd0\
-\x1d\x93\x08mC\xde\x8f\xfd\xe10F\xed\x9f/\xc4-\
-c\xc2\x81\xe9\x97\xe3\x86@\xa9e\xe4O2]\x85\xef\
-\x08\xbb\x95o\xeb\xdbx/\xd3\x83?\xc2\x9c#?\xc2\
-t\x1c\x97\xe9g\x1c}\xb0\x87\x9f\xfbo\xc6wy/\
-\xdf\xe3\xd9\xc3\xcd\xb2#\x9b#y\xdb\xb6\xbe\xf3\x96w\
-~$o\xfdU\xf3=\xbe=\xd9\x1e\xef\x1enO\xd6\
-\xb6{\xba\x96=\x92\x97\x91\xe5\x9e\xb7\xccg\x0aY7\
-(Rg\xdd\xd1\x15\xcf9\xab\x06\x17x\xe4\xccx\xca\
-\xd8\x03\xb1\x9d\x0e~\xe2\x07^s\xfe\x9d\x1f\xfa\x94\xaf\
-\xc7\xac\x22$p\xb9PwY\xab\x02\x17@\xffV\xae\
-L 9'\xd7\x8b\x84\x0f?\xf2\x17CH$l%\
-z~\xad\x00msr\x999U\x84.{\xdc\xaaQ\
-y\x02\x10L,A\xb1>\x03c5C'\x89\x05\xac\
-O\x9c\x06\xf4\xb9yj\x0c\xb9\xf9\x85\xa3\x84a\x22\xcb\
-\x91\x18z\xae\xf4\x9f\x7f\x13\xadq\xd5v\xd7\xcb\xcaA\
-^\xf3\xc3\x8d\xd9\x00\xb8\x0b9\xa4\xbfRP\xb9S\xba\
-8\xb5.w\xbe\x0e\x1e\xf45\xb0<\x1a\xa8\x0a\xd5\x83\
-\x0b\x99EX2\x04\xa9X=\xca\xc3\xff\xe4;\xd8\xd8\
-\xc4\xc4\x96e\x93\x89\xc9\xc4\xf3\x07P  \xd9\x17\xe5\
-\xd89\x0c\x95\x1d\x96*\xce\xa5\xf5\xe5Z\x10\x86\xf4\x03\
-\x0d\xf8O~\xe1\xd9\xe5W>\xfa\xd9\xe5\x87\xbf\xe7\xb7\
-\x09\x93\xe9tO\xb9';\xf6\xb2\xf0\xa3\x7f\xbb\xc1\x90\
-\x09\xa3\x19Sn\x99\x00\xbe\xd8\xe3\x19\xa7J}~:\
-\xb7P\x87\xf9\x02\xd2\x13g\x96\x81\xebzs\xb5-\x5c\
-WM\x8fc\xb3\xe7c\x8fg\x96\xcd\xe5=\xfb\xad\xec\
-\x08\xbf'\xdf\xca\xb6\xf5\xe6>\x92\xb7\xfe(\xdf\xb3\xeb\
->\xd8\xda\xeca\xc1\x1c\xc9\xb7\xf6s\xfd2\x9bS\xfa\
-\xd6u~\x15\xde\x19{ny\xcf\xcfl{\xa4?\x92\
-\xb7\xed)\xfd\xb9\xba\xc6\x91\xfb%\xf2\x9e;\xbc\xc7\x9f\
-\x0bz\x96\x07f\xb7\xef\xf8\x85\xe1\xe2\x9f\x0b\xbe>\xec\
-\xc7\x13\x02\xcd\xf5|\x03 \xa8l\x04X%xY\xc2\
-\x8d\x81\xe7\xf7\xc3\xe5#\x9f\xfd\xd2\xf2\xcc\xb3_\xcb\x13\
-\x00d\xe3\x15\xdfY*8\xb2z\xd4\xff\x08P\x8d\x0d\
-\x01\xd3\xd8O\x12\xe0\xf6r\xa1\x95\x88\xd8\xbd\x09\x00\x94\
-\xe4\xf5a\xba\xa3\xe6\x09g\xdb\x1b\x81\xad\xb8\xba\xadn\
-\xbb\xde\xf3\xb7\x9d\xef\xa8X\xe1\x04\xc1\x9fJ\x84H\xd9\
-F:\x82\x8b,9OC\xf8\xa0b\xfe\xa2\x01`\x1c\
-`\xc3\x190\x98<\xbfVcOJ\x0cR8\xc5.\
-\xc7\x12\xdd\xa0\xec\xc6l\x00\xe8\x13\x06\x8d;\x8a\x5c\xbd\
-\xe9z\xf7j\xeb]\xd7\x00\xf5\x18\xa8\xce-L\xe3\x93\
-g\x80y\xb0\xb8\xc3\x996\x1ezV\xace\x8f\x9d \
-\xec\x1f\x8b\xe0\x92[U\xfa\x8c;\xa6\x11\xfe\xb9;g\
-\x04\xe2\xde\x17\xff\xcc\x09I\x94\xd2\x10\xae\xcfI\xc6 \
-\x97\x80]1v*v|\xfeN\xa0\xfb\x02\x89\xf3\x7f\
-\xfe\xbf\xde\xbb\xfc\xa7\xff\xfa\x8f\xdb\xee\x81>\xb0Gb\
-\xa1\xd0\x1f\xf5-zho\xea~j\xc7\x82\xd2e\x82\
-\x9a\xbf!\x90\xf3@\x9as\xca\xfd\xcaD\xc9E>\x13\
-0\xe7\xdcFe\xd7\x98\xe6h]\xe7G\xf2\xd6\x9f\x93\
-7\xc7e\xbe\xe0j\xec\xcc\xbb'\x9b\xf5Gv\x8d\xd9\
-\xdao\xeb\x8d\xeb|\xab\xdf\xd6\x1b\xb7\xcd\xc1\xd1\xc6#\
-\xfcV\xbe\xad\xef\xf1me\x97\xd5\x8f8\x8f\xe4\xf0\x1d\
-\xe9f9\xe5Sm\xbb,\xae\xad~\xe6\xde\xea\xa8\x9f\
-\xd2\x9f\xd2m\xb9\x1a\xdb\xf9V\xbf\xad\x1f\xe1f9e\
-^\x17\xc6\xb3\xa7=\xf3\x13\x1dK\x00e\xb5C\x0e\x98\
-\xdb.k\xee\x0f\xbd\xe4\xfd\x19\x00\xf4\xac\x0b`3\xdf\
-Y'X`\x92~\xf1}\x1ff1\x0aFr\x9e\x19\
-\x02\xe6\xc2N\xce2\xd5\x7f\x09`\xb3\x1c\x10\x8a@\x17\
-\x5cg\x1c\x04t\x06\xf7\x1a?^\xd8\x92\x98\x0bJ0\
-J\xa6\xa7\x1c\xb8e\xack\xc6)\x1e\x9eJ\xf2\xd38\
-r\x97\x8d\xcc\x85\xde`\x13\xa4\xbd<\x81d\xc3\xdb9\
-\xc1e\x95\x15\xaf\x8cifXq+\x1f\xd2\x93_L\
-\x15\x14\x0d\xa3h\x5c#\xb6\xd8\x96_\xcf\xfcFm\x00\
-\xbakz\xe2tN\xd7xB\x8d>r\xd7\xa7V}\
-MO\xdb^\xa3s\xf0\x80\xa0\xc28\xb0\xbc5\x11o\
-\x08\xca.\xf6=\xc8=b\x19r\x13o\x0d\xbd2\xcf\
-\x00\xf48C\xa2B\xe2F\xc2\xcc\xcb;wLf\x0d\
-W\x94zi\x8ar\xd7\x8e\x04\xde\x8a\xd1\x03Y\x95\xbf\
-\xfd\x81\x8f/\x1f\xd5\xae\xfe{\xbf\xf3M^\x18\xfc\xa1\
-?M\x0c\xcd\x0cM\xc4P\xd8\x0e:\xfd\xb0(\x98\xc3\
-\x8c\xaa{\x02\xe1'\xfc\x12_H{\x8f\xf9\xe1\x9b\xd3\
-\xb6>\xeb(\xcf}\xb3\xd5\xcd\xf5S<[]\xd7;\
-\x9fy\xce-\x1f\xd9^E~\x15\xec^\x5c\xd8s~\
-\xf6x\xf6\xee\xe6\xf7p\xf0\x1e\xc9\xf7|\xce\xb2=\xbb\
-=\xd9e6\xe8\xdb\xae\xf3\xd9f[>\x859\xa5\xdb\
-\xf2P\xbf\x0a~\xc6\xce\xe5=\xde=\xd9\x9e\xcd\x9e\xac\
-m\xd1\xed\xf5o\xdb\x8c\x9cvh\xde3?I\x1c)\
-\xa6\xc6\xbc\xcd\x9d>\xd7\xf7\xbc\x1e\xfa\xee\x9f9\x9e'\
-\x03u\xe7\xaf\xb9\x1f\x0a]\x00\xb9\xb0\xe2_6\xbc\xa7\
-\xff\x99/>\xbb|\x80o\x11\x15\x865\x80\xb8\xc8s\
-W`\x90\x1c\xca\x86+\xa7\xd6\x0a'\x89\xfdD\x9c\x1b\
-\x16\x96\xa8\x5cU\xa3\x13\xb1/\xb9pI\x22O\xc3\xec\
-\x96\xc0h\xc3!N\xe9\xf0U\x12\xfbv\xdb1DK\
-\xac\xd6ZPm\x10\x1d6uNz\x1dq\xcc\xe2\xcb\
-\xe7\xb6\xe2\xc2\xdfw\xe2\x22\xf6\xb5\x06\xab\xc8\x9ags\
-NB\x95\xdd\x1f\xf8\x8ci\x8endl-\x08\xdc6\
-3\xec:\x97o\xcc\x06\xc0\x83:\xa3 \xfd\xa1\x1e\xee\
-\xfer\xee\x9e\xd5a\x96\xabl\x13\xcb<\x1c\xd7\xbel\
-\x1c\x83\xdf\x03\xa3\x87\xc6\xcc\xdb6\x0c\xae\x0c\xccA\xd0\
-\x9cv\x89\x9f\xb6\xcf\xe0\xa5\x9a\xbbm\xd9i\xf6&F\
-\xc0b\x00\xaa\x9c\xdd\xa9\xeb\xca\x18\xb4\x96\x1bkA@\
-\x1c\x89\x91\xc1\x9a\xad\xae\x1e\xe1\xdfZ~\xe6\x17\xde\xbd\
-\xfc\xfb\x7f\xfc\x9f\xd5$\xca\xce_\x9f\xf4\x93}\xf8{\
-\x01 \xef\xaf\xf7\xc0\xd4\x8d\xa0!\xa3\xc8R\x8282\
-\x87\xa5\xf2|\x11\xf2\xc4\x91\xac\xf3\xc6\xda\xb0\x0e[\x19\
-\xd8\x99\xe3\x14v\xd6\xed\x95\xe1n\xdf{\xfaY\xb6\x8d\
-c\xd6\xed\x95\xf7\xf0[\xd9\xb6\xbe\xc73\xcb\xc0\xef\xc5\
-\xbb\xe5\xe9\xf3\xb3\x95\xcf\x5cW-7W\xe7[\xfb#\
-\xf9\x16\xb7\xad\xcfvsy\xc6\x1d\xc9\xaf\x8a\x99\xf1\xe7\
-\x96/\xf3\xdd\xfa\xce\xb7\xbcG\xf2-\xee\xb2:<\xf4\
-=i\xdb\xbf\xc3\x07\xfa\xc2\xdc\xbf\xc73;\xaa\xacA\
-\xd8d\x9d \x1f\x17yq\xea\xd3\xb8\xde(\xcc\x8f\xfe\
-\xfb\xed\x00\x1e\xc5\x83\xd7B`\x0e\x0e\xfe\xd3?n\xeb\
-\x95\xde\xfe\xee\x0f\xe9H\x99\xb8\x82\xe1\x02\xceO\xbc\xe1\
-?k\x0c\xf7\x10N#D\xadJ\x04\xc6\x01>\xe4\xd8\
-\xf1x\xdf\xf6\x81\xdb\xb1H\xcc\xe35\x8dr.\xc26\
-\x97U\xfb2\x07:\xc7\x8c=q%aO\xbd\xcfc\
-\xceY\x18h\xa3oL\x94{\xcd\xab\xcd\x91-\xb0\x13\
-\x8c\xb7A;\xb9\xa85\xd3\xfda\xb1\xec\xe0\xd6\x0f\xb9\
-\xdb\x045\x86\xd4\xc9}\xce\xa8[\xa1\xfc\xfa\xa7\x9b\xb2\
-\x01\xe0\xf2\xe7\xe4\xc1A\xa9\xfa\xd09u\xf7\x19\x9d\xa8\
-_\xca\x9dW_\x0e{\x01S\xcep\xc0\xd4\x03b\xea\
-\xf4\x8b\xfa\x10\x0c{&\xb9\xc9\xdbNy\x0f<&\xab\
-\xca\x8du\x8e\x0c\x8bT\xec\x85\x0d\x01A:\xce\xa8\x85\
-\xa1\xae\xe1\xd9\x13\xc8\x12fd.\xd2\xfe\xd0\x8aw\xd8\
-\xf7=\xd0\xdf\xfe\x0f?\xba\xfc\x9b?\xfe\xfb\x967\xbf\
-\xe9\x9b=\x99\xbcKgr\x88\x83O\xc3j~8.\
-\x7f\x90P>zA\xe2}F\xef\x9c\xf1E\x18\x15,\
-\xe7\x95P,t\x86^|\x02\xccO\x04\x021\x92\xe2\
-\xc0\xb8R\x07s\x95ms\xcc\xfa\xbd2\xb8\xa3t\xa4\
-\xdb\x93\xef\xc9\xe0=\x92\xf7y9\xf2\xfd8\xf2#\xce\
-\xa3\x18.\xf3q\xae\xdd\xb9\xb8\xad\xbf\xb6\xeb|\xab\xff\
-z\xd7\x1f'\x8e\xb6\xe9\xfc\x95\x88\xf9\x1c\xee\xa3\xbe\x9f\
-\xe3i\x9e\x1e\xf1\xe4\xe3\xe2\xaf\x8a\xbf\xe7_\xb9f\x9f\
-\x1f\xads\xb1\xf4\x1d\xff\xa4\x1b\xef\xff{\x02sa\xab\
-\xa4\xf9\xdc\xf3\x95?\xfd{\xaf>/\xe4{\x87\x9a\xe8\
-\xbdv1\xdb\xb9\x98'\xb1>1\xdf\xc9{A\xc0\x7f\
-\xd6\x10\x13x]\x02\x8f\xb4\xec\xaa\x8a\x0d\xd2L\xe1\xac\
-u\xe6\xf7\xa6\x84\x12\xeb\x08\x96\xf8\x14\x96\xf5O\xb6\xa6\
-\x94\x9dD\xa15\x07\xd8\xc4\xd09\xc4)\xcbN\xba~\
-\x9b\x03{\xdb*#wU\x07\xdakJ\xe7HI\x96\
-\xe8\x88\xb0\x0c\x11uL\xb6n,\xf2\x9b\x91n\xca\x06\
- \xbd\xe1\x81\xa0.S?\xb9\xef\x90\xaa\xdc\x03\x0b!\
-\x93\xcb\x9d\x0c\xc8(\xb4\x8d\xaf\x01(\xc9\xb0\xc7\x1a\xbe\
-\x12\x8c\xb2\x0b\x13\x7fF\xb0\x07\xe2E\x1f\x0e!|\xc2\
-D\x87]\x91j4\xe2\xdfI2\xdc\xb8\xee\xc9\x96\x8b\
-;65\xa5\xea\xc2\x0d\x02\xfbd\xe6\xac\xc9\xc4\x87^\
-\xb8\xa8\xdf\xd3\x1d\xff\x7f\xf7\xf3\xefX\xfe\xecO\xfe8\
--\xc8\x05\x1e\xbc(k~%&\xfd\x09\xa0\xbe\x1e$\
-\xfc\xf8/\x1e\x16\x1c\x9a\xe4\xaf\x0b\x95\x99\x9bG\xcc\x95\
-\x1c\x81\xea\xf8\xee\x97'z\xd5YdH\xad\xeb\xf2\x98\
-\xb4\xa5k\x1b\xf4{\xa9\xed\xc9\xaf\x92\x8e\xf0W\x95\x1f\
-\xf9\xdc\xe3\xd9\xca\xba\xde\xf9\x11\xd7\xcb\x917w\xe7{\
-\x5c{\xba=\xd9\x9em\xcb\xb6\xf8m\xbdq\x8f\x93\x9f\
-\xcb\xd5\xb8\xce\xaf\xe2\xebql\xae\xc2\x0f\xb6\xc7\xf6\xec\
-k{\xc1\x9fu\xb3\x0d\x13\x0c\xdd\xc3\xfa\xa0\x9f\xb9J\
-\xd6O\x02\x98\xb7\x5c\xdc\xfc\x9e?\xf3\xf3\xa9\xa7|\xb1\
-\xbc\xeb'\x05l\x06r\xf1\xf3\x9b\x86\xcc\x17\x9e\xfey\
-\xda0\xf13\x17\xf9\xdc\x11\xff-\x94\xc5\xe3\xaf\xbe\xe3\
-\x03^\x0b\x86/\xc9\xb8QH;\x14\x8f\xccX+\xc9\
-}-g\x11\xa8\x04\x06nV,\x95\xcc7_8\x0d\
-\xc5P\xc91\xc0\xa5\x17\xf8\xc4D\xd9\xc1\x19\x13\xa5$\
-|\xd9\x8f~WV\xd6\x97\xf6Kl\xe8c\xc9\x8dJ\
-\xafS \xf2\x14\x00:j\x9c\x8f\x8aNx|#5\
-\x15n\xbb\x8e/\x07[f\xe8\x9c@\xe7<\xb9\xcf\x1a\
-\x1f\x96\xc2\x5c\xff\xec\xe6l\x00\xdc\xbb\x8c\x8dt\xfa\xc5\
-\xb1%%\x1dKg\xbb\xcf\xa80\x10{`D\x0a\xa0\
-e1H\x07\xf7\xf8\xa0\xb6\x0ev!\xca\xd7<\x80\x22\
-\x13P:F\x1du\x8f>\x9c\x1b\x1fN\x8e~\xbf\xaa\
-\xb7\xbafV\x1c\xbe\xf0\xe2\x85\x0f\x0a2\x0d0g\x22\
-\xd7p\xf6\xee4\x1cM=\xde\x83\x93\x80\xad\xc2-?\
-\x82\xbb\xb3\xfc\xc2\xfb>\xba\xfc\x91_\xfb\xd4\xf2\xd6\x1f\
-\xfc.\x87\xc0]\x7f\xbf\xdf\xcf\x1d\xc2m]\xfc\xfd\xb7\
-\xb1\x0a\xed\xbex\x99{8\xf4\x0e\x1c.\xd5\xf9[\xff\
-\xfb\xf7\xee\x8d\x89\x16\xcfu\xac\xf6\xf9\xdf\x0f\xd7I\xe2\
-\xc2?\xff\x0f\x01\x16\xc0,\x16\x90\xd3\xe6\xe4\xf3\x06\xa1\
-\xd8v3\xf0m\xb3\x0b\x988\xb7\xfa\xed\xe2\xbb\xd5w\
-\x1d\xfe9\xc6\x96\x1f\xe5G\xf1\x1c\xc9\x8fx\xf6\xe4G\
-\x1cG\xf2\xe68\xd2\x1f\xc9\xdb\xeeT\xferl\xe1=\
-\xd7~\x8b\xdb\xd6O\xc5x\x8en;\x06\xcf\xb1y\x5c\
-\xccUc\xcfl\xc8\x9c\xc3v\xd4\x15\x00\x174\xe6+\
-\x97!e\xba\xf0\xf3W\x00*\xb3Vh\x9e\xf2}\x00\
-]'7N:l<\xe1UfZ\x1a/\x0e\xc68\
-u\x1e\x85\x7f\xe0\x13\x9f_\xfe\xdf\x8f\xf3\x1fD\xb9\xd5\
-\xe6\x17\x9d\x0a\xca\xbd.\xdd\xaeK\x83u6\x06\x96\x9d\
-\x801BZ\x80/8`\x00\xe7\xad\x02N\xcdG(\
-\xbe\xe8JI\xfbz-\x03\x1c\x8b\xb4\x99cL\xd36\
-\x99\x99\x9f\xd8\xcd\xabc\xec1\x8c\x14n?\xd67\xb7\
-\xca|f\x00C%\x9e\x94\xe6\x91?>%\x8f\xd8\xc7\
-\xc4]\xac\xce\xec\xad\x02\xc5X/\xaf\xb3\xc18\x90\x12\
-Gi\x9a\x1bq\xb89\x1b\x00\xf7p\x0d\x17\xfa\xad\xea\
-\xdd\x97\x0c\x8c\xb5\xe3sQI\x9d~4\xd8\xd9*C\
-\x9c\xc1\xc9\x10\xf4\x00\x05\x0a\xa0\xe5Uns\xab\x1b\x83\
-\xb0q\xe45hQ\x93\xc2\xd7\x81*n\xcd\x12\xcb\xc6\
-\x98S\x9d\x05@R]\xfe\xf5\x13+g:0\xe15\
-\xde\x85\x89A\xf8$D\xc6;\xfb\xba\x9a?\xd4g\x01\
-\xfe\xeb\xff\xf3\x97\x97?\xf7\xef\xfc\xcb\xcb\xab\x98\xd0\x18\
-x\x22\xc1\x22Va\xfc\xff\x00\x10\xc7\x81r\x15\xb4\x92\
-0y\xb8\xb0?|X\xff\x10\x08Ha\xf8\xec\x02\x9f\
-\x14\xf6\x82a\x7f\xe8\xe4O\xaf,\x22\xa9\xcf\xdf\x1d\x80\
-\x9cW/\xc6}q\xc6f\x9b\xf6d[\xcc9\xf5\x8e\
-e\x8b\x9d\xf9\xbb\xdcyc\xbb\xdey\xcb\xf7\xf2#\xcc\
-\x91\xbc9.\xd3\xcf8\xdar.~\xb6\xa3|dw\
-$o\xfbS\xb6\x8d9\x87\xa3\xb1\xe7\xe6G\xfdv\x99\
-}\x8f\xadmL\xcd\xd7\xf9e<\xad\xdf\xf2l\xeb\x8d\
-#?\xa5\x9bq]\xf6E\x1a;\xdf\x8d#]\xfb\x17\
-\x9d\xe7\xbe\xe7\xd4\xf4\xc8_WH\xfc\xb0\xca\xf1\x1e\xff\
-\xbd\xe9\xce\x9f\x0d=s\xd9\x9f\xdc\x17\xce\x9f\xfc\x17+\
-\x5c\x5c\x18\xb9\xf0\xfa\xad=\xc9\xeej\xe3\xf0\xbf\xfd\xdd\
-\xf7e\xca\xa3\xe3\xad\xc3\x9a\x9f,\x05\x0f\xfco\x80\x99\
-\xcb\x5c\xccI\xf2\xc7|\xd7\x8f\x80\x960ks>\xa9\
-\xa3%\x81c\x1b\xc2\x86\x80\xf5\xc0\xc2\xe0\x10#\xd3O\
-'\x97U5\x0f\xd4\x94\xad\xb7\xa7a/\x80\xdb\xad\xcc\
-\xc98_\xa0\xb3\x0eVd^\x13\x0b\x22\x9e\xd8\xc0\xc8\
-o\xd1Z^\x8e\x22\xb4\xae\xac\xccI\xb9\xea\xf6\xc6\xa1\
-cny\xd7\x07\xe0\xda\x16n\xcc\x06\x80\xc1T\xc3\xc6\
-\xfd\x95A\xb2v\xa5\x07\x0f\xfdV\x03\xa7\xbb\x92\x9e\xeb\
-\xc9\xeb\x81X\xa3\xd6P&EF\xe5:p\x8a\xd8\xf2\
-\xea\xf6\x1e\x0e\x83S\x98\x8e\xa7e#\xb6\x1a\x5c-'\
-BOjn\xcf3o\xccJ\x15\xa8o\xe6\xc9-\xe5\
-\x18f\xee\xdc=.#\xb2\x96-4\xbb\xf7Vp\x97\
-\xfd\xe9/>\xb7\xfc\xaf\xbf\xfc\xbe\xe5O\xfc\xa8\xbe\x1d\
-\xd0\xbb\x86\xec\xd0\x1f\xdc\xe3/\x02\xf2/\x83\xabIV\
-\xb3 qq\xf7\x22\x04\x13u\xf9\xa0\x8d\xb1\xccy\xf6\
-\xc2\x82\x1cNp\xbcD\xc4y\xe1<\xf69\xb5\xb2\x0e\
--K{\xcbn\xc2gA\x99-\x8e\xcb\xf6u\xe0\xe7\
-\xd8*1\xce\xfa\x8ei\x96Q>\x92\xef\xe9\x8e\xb0G\
-\xf2=\x0ed\xa7\xd2\x93\xe4:\xe5\x07\xdd\xeck._\
-fwJ\xff\xa4xN\xf9@\xd7\x1b\xcb\xcbp\xe7\xe8\
-\x9ft\xcc\x8cx\xe6\x0d\x09n\xe6Nj\x9a\xdf5\xc7\
-\xb8\xeb'1\x8b)R\xe3\xc5\x05\x9d\xaf\xe9\xf5\x85_\
-\x7f\xda\xfb@\x17b\xf4\x9e\xa7\xcc\x03\xd6\x11~\x00W\
-\xa2\xdeO\xda\xe0o\xe5\xdf|\xf7\x07\x97/>\xfb\x82\
-|2\xa3\xe5\x9b\x09\x0e\x00\x1e\xbd\x0c\xd5\x91\x1cY\xea\
-\x94\xabN\xec\xe0\x83p\x8e[\x8b\xd8 xmB\x1f\
-\x19\xeb\x0c,Y\x17\x10\xf2K\xbc\xca\x15B\xaf!\xd1\
-\xc7\x1f\xb6\xa4^\x13:\xa7\x0d\xfd\xc4\x13\x7f\xbc\xe0\xe1\
-|\xfa\xed\x8d\xb0\xea(\x5c\xe9\x94\xe1\xd0\x1a\xdb[0\
-\x09/\x5c\xf8\x1d\x15J\xa5\xc4\xcd1e\xb3ZsS\
-\x0e7f\x03\x90>\xa5\xf3\x92<\x18)V\x7f2@\
-<\x88\x18\xbc\x12w\x99Q2\xca\xe0=j\xd2\xe5=\
-a\xc8/\x0c\x0b\xb8\xc0*'\x8d\xf1\xe4Z\x0e\x19\xc6\
-\xd1\x83\xc8\xfbSB6\x17F\xd8+w\xac*\x82\xe6\
-\x86\x9e\x8b~\x85\xa1B\x0f:\xe2\xc7\x04\xc3\xde\x1d\x94\
-\x91$H\x1d\x15\x93\xd9$H\xf4\xe9`\x91\xfd\xf4\xdf\
-z\xcf\xf2#\xbf\xeb\xbb\x97\x1f\xf8\xed\xdf\xee\x0bt\xfe\
-\xb00\xed\xf6\x13\x00l\xb5\x9a\xf0\xe7\x82px\xc2\x12\
-\x8c^L*o\x15\xa4\xc7uBVY\x056\x11,\
-0D\xc8{\x97\x9cGl\xd94P\xe6)\x02\x0b\x14\
-\x91\xdc\xd3\xdb\x08\x96\xf9}I\xc8\xd7\xe4\xc5\x10\xbe\xb2\
-[5\xa7K\xa7\x16{8\xf7\xd2\x93\x92\xefq#;\
-\xe2\xdf\xe2=\xe6J8\xdb\x1c\x95\xb7\xf63n\xab\xa3\
-~\x99~\xcffO6\xc7\xd9z\xb8\x91\x9f\xeb\xe3\x5c\
-\x5c\xf3\x9f\xeaW0W\xe5k\xde\x97\x9b\x9f\xe3w\xc6\
-x\x0a\xed\x8c\xc3\xbe\xc8\xeb$zB\x81\xf3?\xf2\xa1\
-m\xbct\xe8m\xbc\xb1l\xec\xf5\xb4\xee\xee\xdd{\xd2\
-3\xa7\xf2v\x00\x9f\xfeG\xef'\x01\xcc7=\xe5c\
-\xbey\x93!\xccm\xf4\xd5W\xdd\x8f\x9f|\xfa\xcb\xcb\
-/\xbc\xf7#\xd9\xcd\xfb\x8eC1x\x0e\xf7\x85\x97\x9c\
-\x8d\x00g\xcb\x07\xc7\x92\xad\x82D\x0a\x8c?\x09\x0c\x9a\
-h\xa5\x91o\x90^\x9b\xa0\xf3\xd8Xm\xa5rb\x9d\
-\x08\x96\x8b?-Q\xbb\x14?\x17t\xda\xcc\xab\x13e\
-\x9f\x1ep\xc8E\x97\xba\xca\xd4\x05\x80\x81\xa2\xd7\x19C\
-\x90DM\x03\xd2\x06\xe1T\xa0\xfdFCB\x1a\x9b\x14\
-1\x00\xb4\x13+\xc2a\x9fX4c|\xad\x08J\xd7\
-?\xdd\x84\x0d\x00]\xe5\xc4\xe4\xeb\x81>\xca\xd5\x7f\xd5\
-\xed\x1eE\x17\xee\xde\xb1\x99\xed\xbb\xac\xdc\xf2\xad}\xcb\
-\x1bg\x9fT4@\x0e\xca\x0c\xc9\xf8P\xa8*\xa4\x1c\
-\xe2\xf9s\x00\xb6\xf7`d|\xd3\x16,\xbdE\xa6\xc0\
-\x98g\xb4k\x83 _\xec\x12X%\xcc\x86\x22|9\
-\x22g\xca\xe2\xef\xb6\xff\x0d\xe8\x7f\xf4?\xbd}\xf9\xa9\
-?\xf5G\x97\xd7\xbd\xfa)\xbfw\xc8>\xe1\xbe>\x03\
-p\x87\xc9\xc7$\xd4\x0f\x9b\x01\xf3\xf0\x14\x01\xff\xd0\xe8\
-\xc8\xff\x0a\xa8\x8a%\xc4\xc1\x0b}l,\xf6\x81\x05)\
-1\xe8\x91$\x1c4\xa2^^\x98\xe4C\xa6\xd98@\
-\xa2d\xbc\xca\xb4\xf9*\xe92\xfc\x91~O~\xae\xec\
-*\xf15v\x8f\xfb2\x1d6\x8fc\xd7\xbcG9\x9c\
-\xf4\xc9)\xee#\xdbY~\xd9Ez\xc6R~\xb9\xfe\
-\x9e\x14\xc76\xaeS\xf5m\xcc\x8f\xd4w\x8c\xb7\x18\xc7\
-\xad9\xb1\x1d\xd9\x9e\x0bR\xf6\x90g\xe6Q\xb6\xdc\xfd\
-\xa3\xbaf\x06v\xfe\xee\x7fd\xaa\xfb\x03\x80\xca\xfd\xff\
-?\xe0\x15\x009\xf3<\x1c\x16x\xce\x11\x0bs\x8b\x17\
-\xe9Em \xfe\xe2\xdf|\xd7rO\xf3\xfb\x16\x8f\xf9\
-\xb9\xf037\x952O]\xcc\xf5\xb0\xac\xb2\x9e\x16\x0b\
-X\xc7\xd1\x9c\xd4\xf9E/_\xe8\xb8a!h%S\
-sP`\xb7xK\xb2\x90`\xb1\x1a\xe7J\xd5\xb4\x14\
-\xb2I^\xf8\xb6\xf4\x93\x02\x93\xc2\xc7\xb9\x8a\x1d\xfe\xec\
-\xdb^u\xa0\xdd\xf0\xd8\x8b\x03l\xcd\x9a[\x19\x84\x81\
-\xf2\xd5\x09iW\x91\xba^J\xdcw\xfbJt\xad\xb3\
-\x9b\xb0\x01H\x07t\xa7W\xee\x81KOy d@\
-\xd0s\xd5\xe5\xeeE\x97\xa7\x1e\xee\xceE\xc4\xcb]\xaf\
-\x0b\xb2'\x12JY\x17\xa5\xca\x17\xe5(<\xe8\x9cS\
-\x8e9;\xcb\xb6\xf7uU\x1c\xecXq\xe0\x81m\xa7\
-\xc2\x22\x97\xf0\x81\xf0\xde\xa0p\x85fF[\x03\x5c\xda\
-\xdb\xbc\x1f\xef\xa8T\x17V:\x0f\xf3\xe2\xa0\xcc\xa3A\
-\xff\x9d\xaf\xb4L\x90\xdb\x0f\xf4!>\xc9?\xf3\xa5g\
-\x97\xff\xf2/\xff\xd2\xf2g\xfe\xc4\x8f\xf9\x83}Yh\
-\xee\xeb\x8bC8\x0b\x90&\xae~\x0b\x80\xf0\x11\xf35\
-\xc2x\xa1\x9e\xf7\x15\x83u\xfb\x88\x81\xbbv\x10:\xd0\
-N\xd0\xa4\xde\xd9\xf39\x00\x84~\x1f\x12\xbc\xf9X\xd4\
-\xea\xb3\x05!\x8a\x91\xca\xe8\xc7\xc2\x10\xe98\x1e\xc9\x07\
-\xe0\x92\xc2U\xec\x8f\xb0-\xef\x1c\x97sy/\x84\xcb\
-\xf4{6\xa7d\xf0\xf5X\xdb\xc3]\xe6\xef\xb2\x8b\xf7\
-e\xf6\x8f\xe3s\xb69\x87\xff2\xcce\xfa\xd9\xdf\xd7\
-\xab\xec\x0b\x14\xce<\x17\xe2u\x8e\xb3\xe7\x86\xe7\x00\xd3\
-H\x10\xf4L\x09\x97m\xab\x0b\xb9*`\xee\xeb/y\
-\xd4\xd3\xb9\xe8\xab\xce|g\xb6\xa1g\xc2\xf1w\xffv\
-\xa6\xff\xc8wa\xde\xe8\xc2\xeeTs\x8b\xf5\x80'y\
-\x7f\xe9\x17\xdf\xb3|\xf1\xb9\xaf\xc9$z\xe6-\x8e\xf3\
-%?x\xd2g\x87$\xb4Y\x0e\x8aMs\x9f\xf6\xa0\
-Pb\x8d\xf1j\xe0\xfb\x8b\xc82\xeb-P\x80\x10\xc0\
-\x91\xf5\xd1\x9f}\xa2l[d\x8aYu\xeb\xe12.\
-\xcc\x1c9\x19\x12)q\xc0*\x5cU\x90\xa4\x98\x88\xcb\
-\xf6\xda\xc4\xc8\x86\x17Kf\xcb\x86\xe9u\x00\x00@\x00\
-IDAT\x9eB\x98 \x0c\x82\xe3\x03\xde\x10\x0f\x06\
-S\x86N:\xf1\xe5)\xc0dk\x0f\xf1\xe78t\x80\
-\xe6&\xa5\x9b\xb3\x01\xa8N\x1e\x9d\xdd\xbd\xa4\x1e\xa3K\
-\x19 \xe4\xe9\xde(]v\x87V'+\x8b\xbe{\x99\
-Z\x0f\xd2\x0c\xcc\xc1/U\x06\xaa\xb0e\x1e\xacMV\
-\x07p\x0a\x18\xff\x19\xf8m\x10\xff\x93/b\x04+k\
-\xbf\xf7o\x16\xe2\xc6\x19\x83<\xf1\xc4\x9d\xa4\xdaU{\
-U`T\x9a\xac&\x85\xaa\x0cs?\x8a\x83\x8b\x05A\
-\x1f\xf4\xf9\xa5\xf7\x7fty\xcb\xff\xfd\xfe\xe5_\xfc\xa7\
-\x7fX\xf5\xf0y\xc7\xae9\x09\x05\x8b\x08\x0c\xdc\xd53\
-\x9di\x1f\x9b\x12\xc8q\xd5S\xc7`c\xd1\x08\xafI\
-\x0d\xcem\x14\xdc\x9b\x02\xda\xa1\x95\x0a^\x18\xb8\x8b!\
-\xf9\xfc)\xef\x8b\x10>H\xe3\xbc\xa6f.\x17\xa7\xc3\
-xt:\xc9\xaeR$\xbem\xda\x93\x81\xe9\xf8\xb6\xf8\
-\xbd\xfa\x11\xc7\x1e\xb6em\xd3y\xcb\xcf\xcd\xf3Y\x8f\
-}\xf4U9\xaf\x8a\xdf\xf3z\x15\x8e\xc6v\xbe\xc7w\
-\x8e\xec\xe5\xda\x9f\xe3\x03\xcc\x95\xfd\xd40#k[\x8b\
-8x\xc0\xeb\x22\xce,\xd7/\x17s\xc4\xcc\x12f\x08\
-c\x9c:9{s\xec\xb9\xe8s\xa7\xce\x98\x04\x9f/\
-\xfc\x91E]\xf8\xf9\xbao\xdf\xcd3'kB\xd5\xb4\
-\xf2\x93\xb6;\x92\xfd\xe2{\x7f}y\x9f\xbe\xf1\x8f\xf9\
-*\xb0~\xf1\xc7\x07\x03\xf1\x8dw]H\xabD\x8d\x0a\
-T^r\x9aS\x15\x7fF\xc0\xe4>\x0c\x0b\xd6\x11\xcc\
-|\x11V\x81\xb8\xb5\xe4\x84\xa7\xea\xbe\xc0\x22\xa3\x11\xe6\
-\x04\x87\x99\xb0\xaa;63\xa6\xddY\x0bY\x93H\x02\
-\xaa\xc4:\xe3\x95Dxl\xe3 \xd1{\xf5\x12\xd8b\
-T0\xb2n\xea\xa7\x9a0d\x01\xd9\xb9eq\xd2m\
-rD\x108!\x853\xbc]\x8b\xee\xba\x1fo\xcc\x06\
-\x80\x01\xe7\xeec\xe0\xa9W\xba+\xbb\x83\xd6z\xb4\xc6\
-[\x18\xcdZWG\x0b2\x06\x8c\xe1=\x08\xc5f%\
-\x19\xd3R\xb6E<\xfcK\xe0\x01\xd7\x0a\xa2\xd1\xc4)\
-\x98\xed\xa1\x04\xcfdi\x82\xd5\xa7\xacU\xc1?8\x1f\
-\x99\x85\xaa\xc0\x12?u\x91\xc6\xbe8,7\xa6\xe6\x97\
-\x15\x9am<Q\x901\xff(\x88\x0d\xc3O\xfd\xb5\xbf\
-\xb7|\xfb\x1b\xbfY\x9f\x09\xf8\x9eLn&\xb5\xa6\x15\
-Wx\xe6\xb0yt#\x90\x8bw>(\x88\x9cG\x8e\
-\x0f\xb5\x22\xf1t\xe2\x8e>\x8c\x84\xd5==R\xe4f\
-\x82\x9a?K@\x98`5\xc1\xd1;4Z@A\x0a\
-\xa9V\x19eq^\xb8s\x91\x8cD\x0c\x9dzAs\
-\x9d\x18&]c:?\xa5\x03s\x99\xbey\xc8\xbdi\
-\x9a\x05*\x1f\xd9w\x8cG\xfa]9\x1d|F\xda\xb5\
-\xc5\xae\xecw\xf5\xa7t\x1b\x9f\xbb\xf6\x1b\xcc\x5c\xbd*\
-~\xb6\xed\xf2\xe8\xdd3\xcfA\xdb\x91_\xf0\xff\x18\xf6\
-3\xd7\x93,w\x5c\xa3m\x0e6sq\xf8Q\xbc~\
-J@\xee\x19\xa29\xa1\x09\x949\xc0\x13\xb6\x5c\xe0\xe1\
-\xe0\x1a\xc9\x86\x9f\xb7\xd1\xe0F\x96\x0d\x81\xba\xfeN\x96\
-m\xe6\x19O\xfc\xf2\x18\xdf\x93\xcc\xb8;\xda\x18$e\
-\x0e\xbe\xe7#\x9fY\xfe\xca\xdf\xfb\x80>\x12\xc4\xd5W\
-8\x9f7]45\xe75\x9b=\x0f\xe1\xf78\x96\xce\
-L:\x98\x978\x90`\xaa\x1c\x9d9l\x902v\xbe\
-9\x01\x1b@q\x02\xc2^k\xa5\xda\xe9V\xe4>@\
-x\xb3HF\xc2\x19\xbf\xa9Y\xe2\x18\x13?\xed\xcf\x1c\
-\xcbf\x88\xb3\x07\xd2\xb2\x22\x22c\x01#\x0eL\xcdT\
-v\xe0\xed\xc3\x0b\x9c\xd9\x8d\xb5L:B6\x1e\x95S\
-\xe1]\x1e\xd6\x85\x99u\x05\xbf\xc6\xd9\x8d\xd9\x00\xd4\xb8\
-\xab.K\x8f0Lz\xc8\xae\x83(\xdd\xed\xf1\xe5\x81\
-\xa7\x0eU\xc5_0Q\xd6\xf9\xb2\x89\x0c\xc8\xe0\xaa\xcc\
-\xe8\xae\xd1b^\x97\xcb\x9eq\x81\x92_\xcf\x02\x06c\
-\xe0hPg(Q[\xe5=\xf42\xc0\xb1\x95\xd2\xdb\
-h\xdd#\xd8>\xc3\x9d\xa1\xef\xb7\x0ep\xc0\xe6C\x18\
-k\xca\x97k\xbeMWI\x93\x95\x18r!\xce\xc5\x9b\
-O\x10\xeb\xbd\x00\xbf\x1d\xf0\x9f\xfc\xf4\xdb\x96\xff\xec\xdf\
-\xfa\x17\x96\xdf\xf3\x03\xff\x98\x17\x18|\xb3\xe0p'\x0f\
-=[l\x16*\x8an'\x9et\x07\x7f\xa7&1\xbc\
-~\xab\xc0O\x16t\xa7B\xeb\xf4\xeb5B:>\x18\
-\xe8\xa7\x00\xb2\xa7\x0f\xf8\x85\x8b\xc4\x9f\x10\x92\xbc\x93W\
-\xb9\x17\xcen\xbfc\xa6\x89\xb2\xc1\xc8\x0b\xa6-.?\
-\xd8\xe6\x04lO\xdf\xfeO\x98\x0d\xd5e\xd8#\xfd\x91\
-|\x10\x9f(\xec\xc5<\xc3\x8f\xf4\xf8|9~g\x1f\
-\x17\xcb\xdd\x93\xab\xf42?\x97\xe9W\xa6sJ\x1a\x8b\
-S\xa3\xe7\xf29\xd6\xaf\x14\x86\xd92\xc7\xc2\xf0e\xdc\
-3\x88\x9d\xa9\xc4\xd8&\xf5\xd30j\xd8\xb0\x01\xb0J\
-\xf3\x90\x8b.\xb8\x96\xf9\xee\x1f\x1b\xc9B\x97\xb7\x08\xe0\
-\xf1\xba\xe5\x82\xe6\x93\xe6\x9c7\xe1\xaassB\x9d\xb9\
-\xfb\xeb\x9f\xf9\x8d\xe5g\xde\xfen_\x98Y[<\xcf\
-\xbc\xa8\xd1\x8fBTw\x22\x87\x9f*7\x04\xc9[I\
-\xeb\xf87b\xd2\xb3\xb6\xe8\xc7\xb1\xb8\xa4x%g\xf2\
-\x83\xb6N\xcau\xdeK\x22]6>\xe2\xc9#\x02,\
-\xc2'\xa3\xf8\x8d\xc7\xb0\x84\x9dn&.\xde>\xe4|\
-\x80\xb0\xb9\xd7<\x0c\x0d\x90\x5c\xde\xaa!\xa3=\xa0\xbd\
-\x98\xe2\xc9\x88Z\x97'\xc7\xa8\xacs\xc1\xe5B\xb6\xc0\
-y\x22#\xa6\x9c\x17\xa8oJ\xba1\x1b\x00\x06\x1c\x83\
-\x8f\xe1DWQ\xee\xfa\xdaY\xd2\xe4\xd7\x03\x9f\xc9\x97\
-\x01#\x1b\xc9]V\xc1\xf6\x8c\x1f\x0cQ\xa4\x14\x9a\xa1\
-\xd7PQ\xb91A\xe9\x98_\xcbW\xff\x08\xf5\xaa\xd1\
-\x19\xbf\xd8\x0fQ\xb8\x1c~\xfc\x8f\xc1\xe6\xdd3\xf1I\
-\xa9\x17w\xe0~\x9f_\x83\xdby\xb5\x96\xf7\x0c\xfa\xbb\
-\x04\x1c\xb6\x22\xf0cA\xbd\x8f\xc8<\xf0]\xbe(n\
-\xe9\x93\xc1w\x05\xf8\x0f\x7f\xe6o,\xff\xd5\xbf\xfd/\
--\xdf\xfb\xe6o\x97\x07\xae\xf8\xfcj\xa2\xe9B\xef\x8b\
-?\xb1z\xd1I\x1b\xf9n\xf0\xbb<j\x84\x03,&\
-Lzf\xb7\xee\x5cHLR\xa6\x08\xedB\x22\x8d\xa3\
-C'3\xb7\x912\x09.64Y\x1c\xa4\xe7nD\
-vN\x9b\xbc\xcfWi\x03\x19\xe0Y\x9a2\xf8m\xda\
-\x93m1s\xbd\xf1\x9d\xef\xe9fY\x97\xc1{1\xdd\
-\x89a\xc6t\xf9\xaa\xf9^<{\x1c\xe7\xe0\xce\xc14\
-\xf7)\xec)]\xdb\xbfby\xcd\xa9W\x8c\x7fCL\
-[\xdd\xbf\x5c\xb1\x19\xd4$\x153\xe2\xb2&D\xc8x\
-g\x1e\x94Rq2\x93\xb0\xc7\x94\x89d=uM\x16\
-\xe6\x0b\xf3.\x9bp6\x01\xe1\xf4\xe7n\x84e#\xb0\
-\xdaD7b\xc1\x8fx\xee\xe8\xc9\x00\xa7\x039s\xeb\
-S\xbf\xf1\xe5\xe5\xcf\xbf\xed\x9d\xfa\x1c\x0f\x17N&\xab\
-f\xa7\xae\xa0\xbeX\xba.\xb0\xaf\xa8\x89\x8dv\xb9Q\
-`\xc4a.\x0e\x96\x13=\xe4`I\xc8s.({\
-_\x8f\xda:\xc3\x82\xa7\x1djW\xe6D\xf4\x82\x19g\
-\xda\xa0\xec\xcf\xac\xe2\x94k\x85%\x1bmb\xd8\xccl\
-N\xb5\xe3!\x0a\xef\x03\xcc\xe5\xc8lG\xac\x89\x9dH\
-\xca\x93C\xf5\x01\x17J#\x82Q\x8a\x5c\x9c\x96\xa4\x16\
-\x94=\x95\x0dq\x8b\xb7\x1b\x19\xd8\xb5>\xde\x98\x0d\x00\
-\x9d\xd5)\xe5\x8b\xbd\x94\xc1\x16D\x97\xdb\xc6\x03f\xd3\
-\xf1\x19M\xc2\x03f2LC\xc5\x13\xc5\xb2\xf0\xf5P\
-\xbb\xe8\x9f\xda\x1aC&Wd\xa3,u\x10\xcd/_\
-\x1a\xf8\xbep2\x0b\xd0\x12\xa4>X\xe3\xf7\xb2\x98e\
-\x8a\xc7\xf1\xc7Pe\x16\x07\xd9\xbb\x0e\xb8\x22E\x809\
-\x13\xdd^\x5c\x11\x96\xf7\xfd\x1e._\xd3\x97\x88\xfc\xbb\
-\x7f\xe1\xaf-\xff\xf1O\xfe\xc4\xf2\x83\xdf\xfdf\xfb\xe1\
-\xae\xbe\x93'\x82\xdb.\xf7\x9a\x81\xf6A0\xccF%\
-\xfcr'\xe3\xa7\x8a%w,\x8a\xbby\xf0\xdcw\xf4\
-\xe8h\x12\x11r\xbei\x04\x8f7y*aF\xadR\
-`\xfa\xcbJP\x81\xcbd\x96\x15\x823\xd3>\x14\xcf\
-\xc7\xc91I\xdd9\xc8\xb9<[\xee\xf37\x22\xedL\
-K[\xb6\xc9\xd5\xceN\xb3\x8f\xb9\xdc\xfam~\xda\xf7\
-\x8c^}\xb4t\xcb\x7f>\x17\x0c\xbd\xb0&o\xce\xe4\
-\x8f\xfa\x9a\xf5[\xbf\xb3\xee\xfa\x95\xb98g,\x8e\xf3\
-G\x95S\xa0\xbcTn\x16\x17e\x12Y\x9f\x03\x97\x05\
-\xe6/k\xd0\x82a\xaeE.\x01\xf3B$\xd4\x99\x8d\
-\xf01/H\xf9\x10\xeez\xae\xb9@R\xcb\xd3@\x9b\
-\xfa\xc2\x0f\xc7'?\xff\xcc\xf2S\xfa*\xf0\x17\xeej\
-\xa3\x0dN\xeb\x80\x9f.\xb8,+\x9c\x93\xc8U\x8d\x0b\
-\x15t\xf1W4\xca5{\xb9\xc2\xfa\xb7\x00^ST\
-F\xa85\x84/\x10\xe2&\xc4\x1b\x01o$\xe0A\xbf\
-\xb6W\x7fl\xa0\xf5 6\xa8pG{\x91\xd0\xc6H\
-\xda.\xc1\x80\xe3\xbcd\xdb\xa3\x8a\xc1`s\x9e\x88/\
-w\xfc\xc4P\x9c\xc0\xf4\xf2\xd9t\x0c&\xb7\x0dRS\
-T\xac\xb1\x08i4p\x93\x12\x17%\xac\x13\x0d\x8c\xe1\
-\xa6\xd0\x9b\x0e07!\xdd\x98\x0d\x00\x9d\xe7\x11\xa5\xce\
-g\xb2y0\xa8\xc3\xe8f'\xab\x91S\xe0\x97\xae\x8f\
-\x8ds\x80\x8c\xc8\xb6\xa7\xaa\xd7\xc5?\x19\xb4\xda\xb8\x82\
-6\xb5\xf3\x0b\xf6\x13O\x82X\xe3\x02gn\xac*\xd6\
-1\x92\x09)\xb3\xde\x93\xff\xb6?U\x9b\xf6X\xac\x11\
-\xc8\x04`q\xa0\x94G\xedp\xb3\x18p\x9f\xc01m\
-\xe3<\xe4\xf2\x8f\x0ey\x16\x03?\x86\xd7\x04\xff\xf2W\
-\xef/\xff\xde_\xf8y\xfde\xc0?\xb7\xbc\xe5w~\
-\xaf\xe6\xbc\xfeb\x80O\xe7\xd7\xa6!ah\x92\x9b/\
-M\xf4\x91\xe0\x89[\xec\xca\x14\xaf\x9e\x0c\xa0\x90\x01\xa7\
-7\xb3\x84\xb7\x06HxV\x92\xae\x17A\xaa\xc1V\xfc\
-\x02\x04\xa5O6\xdf\xadM\x88d\xc6\xa7\x13lr\xc1\
-^\x92m\xdd\xa03\x0fG\xb6G\xf2\xa6\xdd\xd3\xef\xc9\
-\x1a\x7fN~\x96='\xfa\x8ct\x16W\xf1\x5c\x05\xbb\
-\xba\xde\xf4\xe3\xaa\xf0\x98\x9e\xaa\xd7\xae\xf88\xe7\xa3\xbb\
-\xa5m\xe7^\xca\x06\xc0\xa3_\xc3\x9d\xf3\xa6S\xe2\x09\
-\xe2\xe1\xcf\x14\xf0\x85\x0c\xb9\xcb>c\x9a\xcb\xc2\xf8\xbd\
-\x7f\xd5\xb9\xe0\xa0c\x86xm2\x06\x85\xaa\xbeH\x97\
-\xca3\x08\xcc\xb2|\xf0\x93O/\xff\xfd_\x7f\xe7r\
-W\xf3\x12\x1b~\x1e\xf6\xb7\xfb\x89\x10~\xdb\x1a\xae:\
-F\xf5\xca5>\xb3\x11\xdf\xb6\xc5\x97{\xb7q\x09\x82\
-\xa6\xa4\xfd\x14\x90\x81\xe2G%\x94\x9a\xca\xe3\xee_\xd2\
-x\xd2\x11\x1a3\x93\x1bm\x22J\xec#|\xf1\x97=\
-\xe7\xd41\x98\x1b\x93\xc4U\xce\x10H\x1f{SZB\
-\xa98{w\xd08;nd\x22H\xdbeb\x1bb\
-\x9f\xecU\xebs\x93\xfe\xa5F+nN\xbaA\x1b\x80\
-\xea\x16\x0d\x9a\xeeb\xe7]\x99\xe4\x00<n\xba\x1f\xc1\
-d$;\x8f\xc9\xb6\xab\xc5\xdb\x5c\x82\xe73\x03\x12`\
-\xd7\x8a\xe2\x19U\xe3-\x9cx1.\xffV1\xa0\xc4\
-\xdd\xa3\x8a8\x9b`\x00e\xa3\xc9\x148\x97\xe3\xb6w\
-I\xdc\xe82X\xc9}\xfd\xe6\xa9\x81f\x13\x8b\x87\xed\
-\xc4\xcb\x9d\x00\x13\xf2\xf6-\xbe0D\x1f\xe0\xd3\xee\xfc\
-k/\xdd_\xfe\xccO\xbf}\xf9\xd3\x7f\xf4\x0f.\x7f\
-\xf0\xf7\xfe\x90\x17\x86[z\x12\xe0f\x09\xcf\xdd\x0e^\
-\xf8\x10\xbf\xff\xaa@\xf5\xc4\xc7\x1dB6\x1c\xdef\xc8\
-f\xd6{\xe2\xcb\xce\x09\x02^\x89DGE)\x07<\
-)\x80+\x8b\x04\x18d\x04\xac\x88\xc9+Y\xd6\x95)\
-\xef;\xb1I\xf4H\xb1\x17\xe6G\x14\xe7\x08|\x12\x14\
-\x0by\xa5\xab\xf05\xb6\xf3\xe6\xb8J\xferl/\xf3\
-s\xce\xf9\xbb\x8cc\xd6\xafgi\x96\xee\x97\xaf\xd2\xae\
-\xab`\xf7\xbd\xbdr\xd2m\x9bs\xd1\x9f\x86\x0c\x93O\
-\xe3\xbd\x87\xb3\xef\xfc=\xa4\x98\xa9J:\xa0\xeb\x0d\x02\
-\xb3\xcd\xc3Ms\x80;~?\x06\xf7\xbc\x998a\xac\
-;n\xcfi{`~\xdfZ\xde\xfd\xa1O\xe9_\x81\
-\xbf\xc7|\xcc#\x7f;\x9er\x87\x81\x8dJ\x9e\x7f*\
-\xf1\xb6\x1e1\xf8)\xa1U\x99\x97`\xfa\xc3t\x9e\x8b\
-\xe8\xfa\xe2i\x22!T\xf7\xbd\x09\x9f;\x82]\x99\xe7\
-\xb2\xe7\x8c%8\x88\x99m\xfb6\x22\xb1t\x9ff-\
-\xc1\x98_\xceI\x95\xed\xa7%V*&\xd6\x9e\xc2\xd9\
-\xad\x0f\xf6\x8d\x02[\x9b)\x22'\xfc\x220\xac5e\
-S\xe2(A\xcb\x97 \x99\xea`\xbbN\x0c\x85B\x0f\
-\xf4\x06\xa5\x1b\xb3\x01\xc8\xe0\xa8\x1er\x8fy(\xcd7\
-\xd6\xeaS\xf4%W'\x8e\x01\x83\xcc\x83\x0b\xc3N\xab\
-l\xab\xebz\xe7\x83\x13\xfe\x1e\x22\xc3\xcf\xea\xafGR\
-\xfcf\xb2yx\x81\x95i\x86Z\xee\xd9\x9b\xd3\xd1p\
-\xf1\x97\x18=>\xeb\x9d\x00/\x1c\xdc\xdb{\x17,\xf9\
-:\x09\x98\xd82\x8aE\x22\xf2\xdd\x02D\xc2\xe9\x97\x85\
-\xc37\x08\xda\x04\xdc\x7fpo\xf9/\xfe\xf2//\x9f\
-\xf8\xdc\x17\x97\x7f\xf5\xc7~\xbfh\x98L\x82\xb1\x00\xe9\
-'\xef?z\x0f\x22{>l\x94\xf7\xef\x99\xe1\xfc\x09\
-R\xd6\xa2Z\xb0d\xeb\xcd\x0c\x01;\xd6LZ\x1a8\
-\xb7;AIVo;\xb0x\xb9mvL\x8c\x14.\
-I\xf2\x81\xcd\xa9tZ\x8b\x9bc\x84U\x8f\xe8\xe71\
-r\xca\xb3\xb8[\xedq\xd1\x955?\xe5\x1b\x14z?\
-\xba}$\x86\x95\xa3K\x97q5\xaes\xc7F\x1f=\
-f\xba\xaa\xbfG\xdc\x1c\x9c\x93-\xce~\xce\xc4nm\
-_\xe9\xfa8\x07:\x99\xdd\xd7}\xa1\xc7\xf7\xdcm\xcc\
-$\xdf\xd9\xd6\xa6\x9a\xd9\x89\x112\xdb\xa8\x8d\x83\xa3\x97\
-\x11d\xc5\x8d/\xe6\xac'\x1b\x7f\x0e L>\xed\xcf\
-\x86\x9e~|\xb8\xfc\xfc;\x7fuy\xdb?\xf8\x10\xcc\
-RK\x86\xbd^\xbe\xdb\x9fd\xcci~I\x94\xf1\xcc\
-S?G\xe0uBl\xb2\xcbz\xd2P\xe1\xe0\x8bY\
-\x8dK7A\xfeW\xb9\xd71\xea4\xd0aq a\
-\x9f\x9c\xb6\x8c\xcd\x82\x19\x85\xb7L|4\x0d{\x158\
-g\xbc\xba\xbe\xfa1\xc8\x9b\x10H\xf3\x14\x80U\x8au\
-\xcf\x16\x22\x11&K \x84r\x1c\x1b\xe2H\x14\x89\x9d\
-z\xb4\xd2\x13\xbcR\xd7\x89a$\x09\xf3\xe1n`\x93\
-|\x00\xaeg\xe1\xc6l\x00\xd2ut\xaa\x06@\xf5O\
-wgr:8\x8a\xc6vN\xd7ep\x02\x91\xbd\x15\
-\x19x\xd1\x15\x12{)\xdb.\xf9\xcc\x89w\x06\x0aV\
-\xca\x93\x8d\xf1\x17\xff[\xfb\x02\xc9\xc6\xd62b\xd8c\
-l{\x8a\xdee\x0bW\x03\x9a\xf8\x18\xab\x9eZ\x81\x0a\
-d\xb4\x17\x13O\x1b_\x1ce\xd0\x13\x9b\x7f\xea\x83+\
-p\x9e\xe4\x9a.~\x7fN2\x0a\xba\xa8\xff%\xfd\xcf\
-\x80\xf7\x7f\xec3\xcb\x9f\xfeW\xfe\xf0\xf2\xc6\xd7\x7f\x93\
-&\xb1\x98<\x89\x89Y\x0b\x980\x9c\x02\xa6X/Z\
-<F\xb8{\xff\x9e\xef>\xa0/\x80c7\x16\xa7\x84\
-!\xb7\xdcq\xde\x91o.jl:8\xd7,b\xe4\
-\xfe\xb6\xc12\x87F\x16z\xe9\x8cT\xfb\xfc\xe1%7\
-\xc0J\x1f\xfc\xb7\xf0\x1b\xd9\xaaM\x09\xfb9]\x98\xd4\
-\xb3b\xa7\xbc\xb5\x05r\x15\xfb\x1dJ\x8b\xce\xe7\xd0\xf9\
-\x9f\xaf(G\x84\x8e\xeb\x84rG\xc5i9?\x8e\x1d\
-\x82\xaf\x93h\xaf\x0f\xbeN\xae\x1fu\x93)\x16\xb9N\
- \xf3\xa0\x13\xe72\xe7t\xa8\x01(\x09\xa3\xc1\x9f\xa7\
--\xc9-\x1e\xf2<\xd1\xf3\x87|\x05\xed\xf62\xbf\xfb\
-i\x18\x17p{\x92!\xf9\xad\xa7\xf4\xa7{\xe4:p\
-\xf1\xff\xf2W_X\xfe\xe2\xdfx\x97?\xf1\xcf|G\
-\xe1'\x07\xe0\x99\xebBw\x8e\x8e\xb8\xf9\xe1\x97\x83/\
-\xda\xc2\xfa\xad?\xd6\x18m\xc6\xa3\x12RJ_X%\
-p\xdc\xaa\xf3\x19\x22\x7fa\x19\xbeh\xb7^\xd9\x1cT\
-N\x9d0\xe0\xc6E\x1d]*,\xe5\xbe\xb0\xa3\xa7l\
-\xb4\xe3\x8bm\x85g\x1f\x12\x9b\x85\xb5\xd5\x9b\x1aX%\
-Kk`\xa3\x9d\xe2\xa1\xe8\x05\xd8\xca!K\x1c(\x93\
-@\x82\xa5\xd7\xa2k\xa6\xb5>\xe27i\xfc\xc5G\x09\
-\x9a\xec\x1a\xe77f\x03\xe0>`p\xb9S\x19\x18\x9d\
-\xd2\xa1]\xef\xc1\xea\x99\xe6QU\xfa*3\x10\xa3\x83\
-h\x1d\xbe\xb6\xb7\xaa\x06\x19:\x84\xca`\xf0p*\x91\
-\x85\xcdS4\xb6\x17*Xb\x83;\x04y\xdcF\x1d\
-2a\x98t|\xc8F\x93\x91A\xce5\xc0{\x00\x8f\
-\xf1\xb2\x93\x7f\xef\xd2\xc9\xf5\x03\x13\xe3\xde\xbbd \x95\
-\xaa\x09Rj\x11Q\xe5\x01\x7f- \x9dm\xb8\xbaC\
-\xfc\x80\xdc\xbf\xcb\xfb>\xf1\x85\xe5O\xfd7\xff\x8b6\
-\x01?\xa6?\x13\xfcn]\xa8\xeb1=Dp\x10O\
-}\x80I\xabZN\x95>}l\x1cT\xc2\x99\x1f8\
-~h\x0b\xb1H\xce[\x05|p\xd0u\x1d\xa1\xe4E\
-#\xdb\x0fVY\xf8(q\xbe\x8a\x87\x85\xc9`\xe5\x95\
-6UK\xbb\x7f\xc9\xf7\xd2\x81x@\x8f\xec\x1ap\x99\
-=\xb8\xcb8\x9a\xeb(\xbf\xac\x0d{v\xe7\xc4\xf5\xa8\
-]z\xe2\xe5\xc6;\xf3>I\xae\x99\xf77\xa3|N\
-[\xc6\xf8T\x80\xb9\x08\xe6\x9c\x12/s\xd7\xfd\x22\x10\
-s8\xfd\x9a\xbbT\xef\xebP\xea\x02\xed\xcd\x81\xd7\x8b\
-\xcc\x1fl}\xc1f\x0d\x90\xdc?p\xe9'5|\xc9\
-T\xf3\xf1W?\xf1\xd9\xe5g\xfe\xd6\xbb\x97\xe7\xbf\xf6\
-\x12F\xfa\x95B\xca\xdc\xc1\xb3`(!\x93\xa5s\xe6\
-cU\x91\x81\x03\x95Y[\xd8\x02\xc4\x1b:R\xd9\xa9\
-\xf4 w\x05\xd5\x9e\xe8\xcce\xa4\xac\xcaG\xec\x89\xba\
-\x13\xeb\x87\xea5X\x09\x0b\x9d\xdd)\xe7\x9c\xa0w\x9b\
-Uf\xca\xd3\xde\xb4;\x1c\x9c\xd3\x18\xa1S\xd16\xd1\
-EP\x00\x13\xfb`\x0c\xbahJ?X\xa9\xb7.x\
-<\xdb/\x0b\xaa\x1cv\x0b\x12\xcbZ/\xaf\xd7:\xbb\
-Y\x1b\x00uE&Y:\xb5{f\xae\x8d\xb2F]\
-\xb0\x19d\xc6N\xb2\x8c,\x08\xa5\xc7\x88\xb1A\xd9\xc0\
-\x1cl\xef\xa1\x22ia\xc6`\xf5 \x8f\x90\x81\xd3\x04\
-\x8c\xa9&\x19\xfeQW\xf2\x17\x0ci\x22\xdb\x1fr\xbd\
-b\xdf\xd3\xa1\x06\xa00\x5c(=\xc5k\x06A\x9d\xb8\
-eT3\xc3\xd4R\xe0\x8b\xc9\xe3\xc9\xee\x09*\xfb[\
-\xfc\x89\xa0\xee\xfe\x0d\x12FJ\xe2\xfb\xf2\x0b\xf7\x97\xff\
-\xe0\x7f\xf8\xb9\xe5G\xdf\xf2}\xcbO\xfe\x91?\xb4|\
-\xcbk_-]8\x99\xa4<0\xf0\x87\x94\xf8\xfb\xa2\
-\xb6U\x81\xf7\x04\xf3a\xc4L\x99\x84\x80\x90_&\xb6\
-\xa6\x96W>\x99E\xac\x0b\xbft\x92\xf1\xadf\x8e\x99\
-&\xf0*\x5c\x9a\x94E\xc1\x0a\x04\x95$\xed\xe2\x9a\xdb\
-\x98\xea\x8e\xce\xa8\x8br\xce\xcb\x9c\xe6\xeaV\x17\xdcE\
-\xfb\xd9v-\x9f\x83Y\xd1s)>\xd5\xc7n\xffy\
-<m3\xf3\x5c\xad\x1c?\xfb\xed\xbd\x1a\xd3\xf1y\xbf\
-*\xcf7\x00~:\xfd=J\x10u\xf9\x91\xf3\xe5\x8b\
-\x05\xc3\xb8\x11\x5c\xd4R\xce\x1d~=\x09@\xd4\x17j\
-\xca\x9a\x0c\xb6Q\xee\xf7\xe3\xab\xe9l\x02\x98'v\xa8\
-\xfc\x8e\xfe\x84\xd7\x17G\x95\x9f\xd3]\xff_\xd1\xb7z\
-\xbe\xe3\xd7>a\x19\x1b\x09\xaf\x13\xc5\xe1\xcd\x08\xf3\xbc\
-/\xfe\x10y\xdeC\x0e\xa9^\x92y;\xe2\xb9\x179\
-v\xbe\xe8)\xcb\x94o,\xedBF\xac\x98\xcb\x16\xac\
-\x12\xf5\x9e\xdf\xcd\x9buLXA\x82J\x1b\xcd\xcfE\
-^?E\x03\x83y\xac+>\x87g1oq\x14\xb6\
-\x90q\x0bk\xad\x0b\xb6'\x88\xc8B\x0ce<'\x0b\
-G\xfbBWh\xe3\xb2bI\xa6\xd8\x88\x8e6\xb1\x91\
-1%X\xd3w\xdc\xc5\x8b\x8bk\x9en\xd6\x06@\xbd\
-\xd6\x83\xc8\xfd\xa2:c\x08\x19\x13\xcc\xdd\xc6\xe8\x19r\
-)\x01p\xa8\xd10\xba\xb6\xea\x1e\x0e\x0c\x04\xfdx\xc8\
-\xcc\xf26*\x0a\xb2\xd87\x8b\xac\xa0fP\xe1\x1f\xdf\
-CU\xf5\x0b\xfe+FG$ o\xa4\xa1W\x91=\
-\xe9m\xf6\x00\x9a\x95\x1e\x8c\xe6#*\xa9iO\xe1X\
-h|\x91\xc7\x0fr\xe5\x8e\xbb\x1c?\xe4n\xdf\x04\xca\
-\xb4hx\xa2\xea\xca\xef\xcf\x15\x80yJ\xaf\xfb\xba+\
-\x91\xee\xed\xbf\xf2\xb1\xe5\xef\xbe\xff\xc3\xcb\xbf\xf1\xcf\xff\
-\x81\xe5\xc7~\xff[\xf4D\x22\x1b\x0e\xbf\x05)\x7f\xb7\
-\xf4\xef\x03y\x0b\xdf\x93\x84s\x8c^v}7\xcf_\
-\x07\x10\x16\x17}\xbf\xc7\xaf\xdc-\x94\x0bd\xfa\xd59\
-I\x1c,\x94\xb4\xc1\x0b!F$\x04\x00\xdc\x02\xfa \
-\xc9\x18\xa4\xd6\xa9\x00n$\xf0\xc53d\xa7\x0a[|\
-\xea\xb6\xa0M\x17\xb8\x8fy\xce\xc1\x9d\x83Y=Lq\
-\xac\xc2\xfd\xd2\x15\xe2\xdc'\xe8\xf3u\x05\x9fGD;\
-\xf2\xab\xb5{\x87\xe0\x1bT\xe4\xf1\xab\xd8<\xfa\xea\xc0\
-\x08\x1fC\xa6\xc6\xae\xc3\xd7\xbc\x05\xc2\xde\x9e\x94s\xa2\
-\xf3\xad\x89\x87\x9c\xbf\xc0\x81\xc9C>W\xde\x0c}\xc0\
-\x82\xf1u\xbe\xd0\xb1\x96\xfc\x9d\xf7}d\xf9\xd9w|\
-`\xf9\xea\x8bw=\x07\xf2!>\xf1\x0b\x90\xcf\x03\x88\
-\xc9x|bG\xbf\xc6\xded\xaa[\xae\x95\x82%\x85\
-\xf5\xc3\x9f5\xc1\x91^\xb1!F;\xb4=\xf1B\xc3\
-\xa3\x7f\x92/\x8eB\x82\xf7\xfa*\x9d\xdb\xa1\x03\xef\x91\
-\xb3\x0a\x19i\x888m\x0f\xbf\x92e\xeby\xeayl\
-\xb1\xd4Aq\x94\x84_\x17U\xa0Mh}\x92@+\
-y-\x8b\x85\xcb\xb6.]\x10\xd3\xb1p\x89\xac\x8e\xf8\
-\x83\x1bZ\x9ehz\xf5\x0c\xcb\xdcV\x97\xdb~\xa2\xbc\
-\xe6\xc5\x9b\xb3\x01\xf0\xa0p/\xbaK\x18\x02\x0c\xd8\xea\
-C\x97\xdd\xe3\xc6\xad\xf2t\xbc\x06l\x1b\x90\x0b\xe3\xaa\
-\x94\x1epp\x01D\x8abH)\x1bnm\x0e\x11\xc0\
-\xc0\xc0&\x06\x92\x07y\xc7\x18Q\x8e\x15\xf2\xea\x1f\x1f\
-,\x0a\xedY0\xfb\x84D\x05\x7f\xf4\x96\x08\x10\xc7\x98\
-\xaf\xe9\xf5 \x06\xd2\x0dfu\x92\xd4;|p`\xb8\
-Xk|\xe7b\x8f}\xee0\xbc\x09\xd0\xa2\xe3\x07_\
-\xf7\xc5\xa4G\x8f\xb7\xd9(<\xf5\xaa\xe5\x05\xfd3\xa1\
-\xff\xf6\xff\xf8\xc5\xe5\xaf\xff\xfd\xf7-\xff\xdaO\xfc\x81\
-\xe5\xad?\xf8}\x9e\xe0\xf9 \x8c\xec\xe1\xebx}\xf1\
-\xa7\xdd\xfa\x0f\x84\xfe\xd2 &\x93\x5c+\xa3\x8eGt\
-\xfd\x14\x80\x98\xdc4\x1d\x88\x89\xc4)\xea<g\x80\x96\
-\xa2\x07\xe4_a\x02\xf2w\x06\xb8\x18\x8c\x81uh\x1e\
-\xdb\xce\x95\x19t\xa1\xfc(G\xd4\xab\xbc\xfd^0\x1b\
-\x95sp+\xa6\xcdNs6\xea\x9c\xfcQ\xees\xac\
-\xc0$\x86\xc7\xb7\xbf\xccOf\xd3e\xa8U\xff\xe4\xce\
-\xc9\xca\xf9DJ\xf3)\xf2X\xcc\x08}d\x08\xce8\
-9F\xcf\x10\xa4]\xfd\xa9}\xaf\x0f\x04\xa5\x0b\x7f\xee\
-p\x01h\xber\xf1g\xaeN\x9b\x00\xd6\x0e0\xef\xff\
-\xe8?Z~\xfe\xff\xf9\xc0\xf2\xc9\xa7\x9f1\xc67\x03\
-\xccaa\xbd^h\xfe\xf9jY\x1c\xd0\x87G|\xc4\
-\xa4\x83\xd7\x0c\xad\x07}\xc1GN+\x88\xd1\x18\x10\x9e\
-\xb6i\x04\xe5\xc4\x0a\x90Jv\xfc\xf1\x89\xadDj\x17\
-\x17\xe9\xdb\xdcHh\xfd\xb1e\x14\xe2t\x0dv\xbf\xdc\
-\xb7\x05\xe0\xcb~\x8cn,\x18\x97\x05%\xa2\xc2Q\x83\
-\x87\x189\x91\xa1\xb4\xd2\xb0\x1cT\xf7\x86\xc5-\xf1\xf9\
-f-L\xdbB\xea\x1b\xa5\x8a'\x123\x8b\xb7\xda\xb4\
-\xae\x96\x92\xd9\x9b\xed\x13\x071\xd8=\xd1`x#\xd2\
-u\xdd\x00\xa4w\x1e\xe9\x02\x89\xab\x97\xdc\xcf\x8db\x80\
-\xea'\x17a:1\x03\xc3\xa3\x84.\xb6\x8d\xc8\x1a\xaf\
-\x22\x03g\x16\xc8\xc4\xd4\xb8\xb4\xbd\xd5\x08W9:'\
-d(0\x22\x89?6\x91!Ui\xe8\xe3_R;\
-A^z\xa3\x90\xeb\xb7&\xcb-]\xc5\x03\x83\x81\xab\
-\xa6<\x19\xdfC\x96K\xbe\xe4\xa8mJ\xfb\xa4\xab\x0f\
-\xf4q\x17\xef\x1f\xc5\x84\x9d\xa6m\xcdk\xb6\x03b\xe4\
-\xe2\xaf\xb7\x05\x5c\xd3\x07\x07\x89\xed\xce\xeb\xde\xb0|\xe4\
-\xb3_\x5c\xfe\xec\x9f\xfb\xdf\x97\x1f\xf8\x1d\xdf\xb1\xfc\xb1\
-\x1f\xfd\x91\xe5G\xfe\xf1\x1f\x90\x8fl0\xee\xea\xab\x05\
-k\x09\xd1\x02&\xb7\xe2\xf5\xa2\xe6@\xd3\xf6\xdb\xf5=\
-\xe4\xf7\xee\xdd\xc3\xa9y\xb9\xa8\xc3?\x16\x05\x16\x18\xbd\
-'@|\xf9\xd0R\xe1\xe0Q\xca\x91\x12\x91*\xd6U\
-\xe0:\x07s\x8dZ\x15\xe4\xe3\x89\xa4\x8e\xf5\x12\xb2\x9d\
-\xb0\x0e-\xae\x82m\x92\xdd6\xb6\xf2q\xf2:?O\
-\x9c\xb7c\xb9\xe2\xf9\x7f\x9cs\xd2\xae\xbeny\x0d)\
-?\xe2'`\xd5=\x8f+\x80~\xf4?\x06\xedF\x0f\
-\xb6G%sG\xb3\xd0O\xd4\x9a\xc3\xa7L\x174\xf2\
-\xf7\xfc\xfa\xa7\x97\xb7\xbd\xebW\xf5\xcd~_1\xce\x13\
-\xd6\xf6\xb2\xd4\xc5\xde\x5c\x5c\xf4\xe1\xd0\xd1\xef\xff3\x87\
-\xea\xeb{-\xf4\xa10\xb2\xf5\x0a\xa8\x05\xc03X\xd3\
-\x89;z\x12\x1f\x04$\x96\xf4\x81r\xcbS\xf3\xf8\x90\
-\x1f\x5cQ\xf6&\x22\x93=\xb6>r\xc0\x8e\xf3!\x1c\
-L.\xc3\x8fM\xeb\x03\xd0\xd1\xebP\xe2A\xa7\x14C\
-h\x94\xb0W!\xbf\xd1\x99\x109z\x12\xca\xae\xe4\x1c\
-\xb4\x1c\xde\x00\x15\x13E%\x10\xa0\xa3\x01\x91\xdb$\xc7\
-\x8a\xd48G\xb4\xba\x90\xd0m2C\xfbr\xe5Z\x1f\
-\xae\xeb\x06`\xf7\xa4\xa7\x83\xd49\xea@\x0f\xd0\xeeL\
-\x8b\x10\xca\x8c\xfe\xed\x91\xa0\xaa/6\xd5\x9f=h!\
-\xcf\x00\xa7\xc4h\xd0` \xab4\xcaP\xca\xc8Cn\
-\x94\x05\x12 \xf2\x94U1\x0b9:v\xa2E\x9b\x90\
-\xa8+q\xecq\xccE\x9c\x81\xe9$n>\xabG\xd8\
-<\xa2b\xb8b\xef\xc7p\xc5e\x86\xe9\x8a\xe8\xa8L\
-\xa6;{a\x88\x19\xe8C]\xa1y+\x81v\xf7\xe4\
-&~\xfe?8>\xfbo\x83\x17>\x1f\xa0\xc5 \x94\
-\x8a\xe45o\x90\xc3\xe7\x97\x0f\x7f\xfa\xe9\xe5?\xff\xe9\
-\x9f]\xbe\xe7;\xbfm\xf9q\xbd-\xf0\xcf\xbc\xe5\x87\
-\x967|\xd3k\xf5\x99\x009P\x02\x1fn6\x01\x5c\
-\xcfqF\xbc\xe2\xe2\x03\x80\xec\x10H\x04\xacF\x91\x91\
-\x80\xd1(\xbe\xaa\x18<\xe7o~\x85=G7\xa6\x1b\
-$+p#!\xdfI3f.7tO\xd6\xba\xcb\
-\xf2\x97cK\x9b\xcfI\x17}d|\x9dcw5\xcc\
-y\xb1\x5c\x8d\xf31\xd0\x07}\xf8\x18LO\xc4\xe4\xe2\
-\xb9W\x8fM\xf1ME\xfbj\xac\xffd\xcfc<!\
-P\xe4\xec:\xf7|\xe0B\xca\xbcC\x9f\xf3\xdeg\x9f\
-y\xf3\xac\xde\xe3\x7f\xd7\xff\xf7\xc9\xe5\xef\xbc\xff#\xcb\
-g\x9fy\xd6+\x817\xd5\xd8\xf0\xa3\xf9\xc4\xd3<r\
-\xa69s\xd9s\xcb\x9ca\xca\x1a\xd0\xac\x5c\xf4\x84\x95\
-\xde\xee=\x0dU\x96\xda\xeb\x0c0s'FG\xa5\xba\
-C\x03\x04^~\xd8\x1cT+2?\x0b\xc2\xfa\xe4@\
-\x8a\xbf1\x8d\x86\x88s\xd3\xe7\x0ej\x9b\xd4\xd1\xf2:\
-/\xe0\xbc\xc9\xb0/\xda\xdaX\xa2\x22!\x90\xb53\xce\
-Fden\xc6\x12*[\xd7\x18X\xba\xfd\x8e'H\
-\x15\xc5\xc5\xf9s}\xc6Ke\x1f>\x93A\xe3\x8c\xc0\
-oH\xbaQ\x1b\x80\xd1Ytf*\xeeX\xba4\xc3\
-\x84\x8b\x8a\xc7\x8d\xbb/\x03f\xed\xd16!\xe7\xe5\x8e\
-\xd6\xe0\x18\x03\x97qb.\xe9\x04\x18r\xd8D\x96\xc1\
-\xa5\xbc\xcavf\x8b\x95\xcf\x8f\xdb\x19\x9d\x83\x0bG\xa4\
-\x1adz\xc4\x06\x8f\xe3M\x80\xa2\xf1\xc3yc\x10\xf5\
-\x80uQ\x13\xd3\xb2\x9a\xa4\xfe\x12\x1f\xac\x89\x9b\x07\x01\
-E\x8f\x9a\x22X\xbf?\xe8\x9c\x8b33\x9b\xbbn\xf4\
-\xd9\x09\xeb\xb2\xed\xc5\x84\xa7\x06\xf9\xfb|=\xbe\xd7\x8c\
-\xbc\xfd\xdao\xe6\x93H\xcb\x83\x17\x9e_>\xf1\xf9/\
--\x7f\xfeg\x7fi\xf9\x1f\x7f\xeeo/o\xfd\xa1\xef\
-Y\xfe\xd0[\x7f\xf7\xf2\xfb~\xf7\xf7{Q\xe3\x1c\xe1\
-\x8c\x8d\x07\x13\xd96\xba\xc2\xfb\xf1\xa6\x14\x9c7\xc7#\
-\x18o\x07\xb0p\xf1\x80\xc0r\xe90!pb\x95T\
-\x1c\x1d\x17uT\xb4/<\x80\xbc\xf0\x05\xecv\x04u\
-\xf1\xe8MW\x89\xf0sYjL\xe7\x97\xe1\xbf\xdez\
-\xda\xff[\xe9\xebs\x06\xb6c\xe0\xd4\xb9\x9f\xb1<&\
-\x1f\xe3T\xa1\xd2c\xe8=\xff\xa8K`.\x0dG\xe6\
-\x06\xff\xe6\xf7\xbd\x1f\xfe\xf4\xf2\xf7\x7f\xed\xe3\xcb\x07>\
-\xfe\x8f<\xfe\xc1z\xfc\x83\xed\x0b\xb8\xed\x98\x92\x9a\x17\
-!\x09\x19\xa7\xc3\xe3\x22~\xa9b\x95\xac/\xdd\xd21\
-\xe5-n\x9c\xe6R\x8b<1;n`\x8a\x17\xbc\xe4\
-\xfc\xb8}l:d\xcf<O\xfc\xb1G\xc2\xafC\xb0\
-\x03!\x5cW\x9c*\xf8\x5c\x000\x93\xd9\x5cF\x02\xd0\
-v\x03W\xbe\xe5\xd7!\xd9\x0c?\xdc)t,\x94\xa8\
-JI|\xe4\x91\xf8(F\xe1[FMu\x02*T\
-4%c\xbd,\xab\xf0\xbb)\x89\xcb<\x92\xd2f\x82\
-1g\x0e&\xbb\xc6\x87\x1b\xb5\x01\xa0K\xe8dwP\
-\xfa\xd9\xe5!S\xcd\x03\xa6:,\x03U\xc0\x8c\x04K\
-{\x10\x1aYT\x19\xe4!\xbcP\xc6\xa2\x06\x94\x8d\x19\
-\xbc.Lr\x99Yf\x1c\x91\x14i\x95\xda\xaeF\xbf\
-2\xae\x84\xbe\x1d\x1e\xc1\xb6O\x8fo\xa9\x1f\xe8\xc2\xec\
-\xc1\xee\xb8a\xd4\x05\xdc\xa3S\x83Y\xef)\xde\xaa\xbf\
-\xd7\xe7\xc2\xe8o\xdb\xf3\xf6=\x18O\x09\xd9ya\xe1\
-\x82\xdf\x93\xa7B6\x8d\x1e\x1d\xb2)\xf0\xfb|\xf8\x10\
-\xcf-}s\xe0\xc3\x87O-O\xbd\xfau\xcb}}\
-\x93\xe0\xfd\xaf>+\x84\xbe\x5cX\xb1\xbe\xebW?\xaa\
-\xd7\xc7\x96\xd7\xbc\xea\xa9\xe5\x87\xbe\xe7\xcd\xcb?\xa1\xff\
-2\xf8\xc3\xdf\xff;\x96\xef\xfb\xae\xef\xd4\x87\x97\xea\xf4\
-\xb2X\x09\xcb\x04\xe4\xeb\x8b\xfda%N\x85\xfe'\x01\
-mGF\x83\xf3\x1e\xa9&#\x18v\x05\xc2\xd0B\xec\
-\xb0'q*}:\xad\x84D\xc9\x1dg\xb8\xb1\x11N\
-G\xe9{\xf27v\xd2>R,:<\x5c\x9a\x06\xef\
-\xa5\xc8\x15pU\x9b\xa38\xae\xca\xb3F\xf0h\xe9I\
-r=\xca~}%=\x16h\x81\xcb\xcc\x89M\xea\x8b\
-\x9b\xe7\xa8t\xbe\x9c\x94\xe1x;L\xf2\xfe$?\x08\
-6\xbf\x1f\xff\xdc\x17\x96_\xd3\x9f\xf2}\xf0SO/\
-\x1f\xd6\x7f\xee\xe3\xab\xb85\xe1\xf2b\xec\xbb\xe3y.\
-\xc7\xdcf}Q\x09\xb5J|\xf6\x87\x0dv\xfe\xf2\x06\
-\x09\xb3\x9b#y\xea\x1c#\xc3\xa3jp\x22S!\xb1\
-\xa2\x17\xc2~P\x1a\xe0\xf9\x95\x7f\xd0\x85g|H\xe5\
-'v\xaa\xb9\x12\x0e\xa9XE\xbcI \xb6$\xe6*\
-\x9c\xe1B\x16\xfe\xf2=P\x8a\xc1\x10{\x00\xe5_\xe3\
-\x8d\x91o\x05\xe9\xd3\xed`\x89\x9c5A\x12\xe2I\x03\
-Tn;xHiS\xca\xa1\xe4\x1c\x98\xc71\xd6\xfa\
-J\xdcF\xd3$\xb8I\xe1B\x83\x84#\xbf\xf6A\x9b\
-(\xfa\x17\xec\xf5O7f\x03\xa0\x01\xe7\xf9@\x97\xd4\
-\xf8\x9cz']oA\xf5\xb8\x07(\x821\xe0\xd3\xb9\
-\x88\x02)\xe0\xdc\xdd`!\x07S\x83a\x1d\x11\x190\
-C\xd7#\xbe\xd8l\x14\xa5}f\x82\x94\xd4\xb4\xe5\xdf\
-\x03^\xe5\xb6\x8f\xbb\x00\x85\xf3{\xf8\x9a\xf5\x5c/\x99\
-nn\xab'@\x01\x95=`\x87n\xbf\xc2\x0b\xeb\xf7\
-\xda%A\xe6\x89/;\x7f\x10O><\x97\xaaYc\
-\x07\xed6f\xa2\xf5\xb4\xc8\xff\x0d\x97?\xee\xd8_\xfd\
-\x1a\xfd\xb1\x80>\xe8\xf7\xd5\xaf\x88\xb17\x0a\x0f\x96\x17\
-\xf5\xfe\xfe\xfb?\xf2\xc9\xe5}\x1f\xfe\xa4\xe3}\x9d\xfe\
-|\xf0\xbb\xbf\xe3[\x97\xef\xfa\xf67\xe9\xf5\xc6\xe5\xcd\
-\xdf\xa6\xd7\xb7\xbe~\xf9\x96o\xfa&m\x16\xee\xf8K\
-\x81^\xa5/5\xe1I\x01\xffj\x98\xdc\xe7\x85\xa6\xf0\
-V\x01q\xf1\x9e\x82\xbc\xb0\xd0\xf1\x1c\x84\x94i\xeb\xa2\
-*\x8a\x07,\xb6%\xda\xcb\xe0-\xf3=\xf5\xcb\x92\x9d\
-\xf2{H\xdc\xfd{\x08\xb8\x5c\x916\xe5\x9c\x5c\x8e>\
-\x07\xf1\xf8\x5c\x8eer\xb1\xadO\xaa\xeb_\xdc=M\
-\x99\xbft+\xe3\x81\xf9\xcb\xeb%\xcd\x89\x17^\xba\xeb\
-\xbf\xd3\xff\xfc\x97\xbe\xb2|\xee\x99\xe7\xf4zv\xf9\xec\
-\x17\xbe\xb2|\xfa7\x9eY^\xbc\xab\xaf\xe4\xd6\xcf\xb8\
- \xf3\xfd\xdc\xe2\xf0\xbc\x83C\x5c\xe8,\xf3\xdbt\x9c\
->m\x08PHn_\xae\xe07>AD\x07\x88b\
-\xd9\x9b\x15_\x92q\x0ddm\x90\xcc\xd3\x87:;\x0b\
-\x9bdN\xe5nW\xbc\xac5`\x99C\x95\xea\xb3\xc8\
-\x04'\x1b\xc9\xfd\xdbz\xd9\x13\x1bss\x93\x13\x17^\
-\x937F\xa4\x98\xf6b\xe45P\xbc\xb6\xaf\x90\x08\x0c\
-\xbd\xe3\x84\x81\xc8\x09\x16\x1f1\xaf\xd0\x9a\xac\xaa\xf6V\
-HDn\xf8\xb0'\xfcx\x08c3U\x94(\x09C\
->\xa4'\xc6\xf8u\x89\xdauO7f\x03\xc0P\x1a\
-C\xc5\x9dJ\xc7e\x00\xd2I\xa3\x9c1\x93\xc1\xe3\xb2\
-{\xd7\x03\xc4\x9d\xc9\x00MO\xc7\x06\xa1pf/y\
-\x89\x0c\xb7\x22l\xa9\x03gD2\xc4LM\xb9\xec\x19\
-\xc0\xa5s6\x14\x15y\xa0\x82\xf4\x05\x8dA\xae$\xf0\
-\xf0\xaf2\x9b\x00+\x94\xc9\x8d\xf5PS$y\xc8\xdb\
-&\xf6l\x02\xb8\xe0\xb3-@\xc7\x82\x92k&\x83^\
-Vr\x22\x91R\xfc\xfa\xc9\x01\x0e!T,\xcdk\xc1\
-m\x86\x8c.\xc5\xafz\xf5\xf2\xd4\xeb\xdf\xa8M\xc0\x97\
-\x97\x87\xf7\x98T\xfc\x8d2o%d\xf3\x81\xf9\xd7^\
-\xbc\xb7|\xe8\x93\xba\xbb\xf9\xe4\xe7\xa4O\x5c\xa6\xecE\
-C\x8e_\xfb\x9aW-\xaf}5\xff\xc6T\xbeI\x18\
-\x96\xc7uW\x9e\x08lkP\x1d\x12\xf4,y\x8cr\
-\x9d\xf4\x8d\xe5#\x1e\x81E\xe8\xf3\xb5\x81_Rm\xc3\
-\xd5t\x95\xc4t\x8e\x02]\xbbky\xcbfG\x17e\
-\xb3\xc5E\xcdl\xf3d\xcb;>[4;\x9ae\x94\
-;u\x98\x9d\xb7\xfc\x1b-g\x9cy\x5c*0\x8f9\
-\x05L\xcc\x17R5\xac\xa0/\xbe\xa4\x0b\xbf>\x1d\x1b\
-\xb3\x9a\xc7\xe0\xcdU9\x19\x13Q\xbd\x8du\xca\xa9\xf5\
-_\xd9\xf0!?\x10\xb8cn\xb9\x0c\x87\x7fU\xc3\xd0\
-\xf6\x9a\xd9\x94\x85Ol\xe2l_@\xc0\xa8\xee\xa9\x07\
-\x8ba\xc8\xb4\x02\xf8O\x83%\xb0\x18\x85W\x10[!\
-\xf3\x8c\xa6!\xb2\xe7g$\xe1\xdaE\xe6\xef\xf6\xa4\x80\
-\x9d1m\x19\xf9X\x93\x09\x18\x22\x92\xb2\xf8 \xd6\x5c\
-\xac\x11\xfb\xed\xc4(\xdd\xbe\xac\xb1*\xa6A@\x94\xb0\
-dE+.\x9f\x88\xb0y\x9d\xb3\x9eF\xca\x1fm\xac\
-E\xd3\x14\x84\xee\xb0$\x9f\x9a1\xac\x09\x11\x00\x98\x90\
-\xe1\xf0\xda\xa7\x1b\xb3\x01\xd0`\xd2\x13\x80l\x91=\x04\
-\x18\xac\x1e\x9d\xf4\x5c\x0f\x08\xf5\x97z\xd7}\xdd:\xba\
-\xb0e\x9b\xb2\xcd\x18\x0d\x8c\x90\x1aL\xe4\x88Vn\x8c\
-L!\x19\xd8\xd4=V\xda\xc7\xe4>\xbe4D[\xe7\
-\x11eV\x8d\xcb\xf6#\x0e\xe9mf\xff\x90R\x8b\xbe\
-]DJ<\x19\xb4\xc6\xdb\xbd4\xb2\xd7Pw\xac\x98\
-\xe1\xcfqs\xa0\x0d\xc8T\xf4\xdd\x85%6\x11&\xac\
-V\xca\x10\x0c\xf6\xce\xfc\xa9#MJ\x19\x13\xfe\xa2o\
-\x00|\xd5\xb7|\xdbr\xefy6\x01/\x09\xa3\xa5\x22\
-@\x1be\xd7,\xbf\xaae]\xc2\xc8\xdeav\xf9\x05\
-\xfd-\xf3\x0bZ,\xb9\xcdp|\xe5\x0b\xa7A\xc4\xb7\
-\xc1\x1cZ8\x0a\xb0+U\xe6ra`Ho#E\
-\xe8\xe0\x0c\xe9C\xd3\xb5y\xa3\xd0\xcf\xba.\xb7\xdd\xc8\
-[\xd1\x04CQ\x04\x8f\xba\x9c\x11/\xa3\xdc\x91*\xef\
-\xe2\x96m\x96o\xcb\x85ELz4\xfc>{Al\
-\xcd\xb7\xcd\x9a\xebs9\xec\xdb\xe3\x96m\x8e\xa0u\xf1\
-\xbb\xb5|\xe2\xf5v\xd3Aw~\xb6\xa3:O\xd8M\
-\xe3\x8b\xf9\xc6\x8f'\xa1.\xb0\xde\xd37\x84\x89)\x95\
-?\xc4+\x9b<\xc1\x8au>\xef\x22\x9d6\x06\x9e\x9f\
-\xe2\xf5'\xfdm\x90`\xcd\xcd\x9c\x87\xa37\xcep\x83\
-\xf1\xf4\x94\xad\x8c=\x1f\xedKrx\xa4\xef\xf9\xd9\xdf\
-\xfd\xcf*\x91'\x0c\x00\xc2\xef\x0b\xa8\xaa\xdc80)\
-\xf9\xe9\xf5\xc3\x10s\xcb\xd2pt\xbc\xbd'\x03\xe3l\
-\x22\x19\xb1\x01\xb05\x91%\xb9\x10\xb9\xd5\x96\xa6\xde\xeb\
-J\x7fv\xc8\xb1q\xb3\xe1s) ~qC;\xe0\
-U0c\xbfc\x9e\xf8\xc2\xe7\x8aZk\xd8\xf93\x04\
->q\xc2\xe8\xb7B\xac\xa6#K\xa4>W\xc3_{\
-\x14\xab\x02\x90\x98\x9d\xc9\x8dH7f\x03\xa0\x8eL\xaf\
-+\xf3\xc0\xcbHI\x0f\xd3i\x1ec\x81\x5c\xd4\xd3\xa7\
-\xee\xee\xd1\xa1\x19\x02\xaa\x1a\x9e\xc1\xe9\xc9\x5c\x88\x1e\xd8\
-\xa9\xca\xb1\xed\xa9\x09\xab\xd1\xe1\xe4L\x87\x98\x8f\x81f\
-\x14\xc1\x14\x0c\xfd\xb0/l\xec\x014(4\x96\xeb0\
-\x0fZ\xef\x80u\xf1\x1c;pL\xbc\xda\xf0\x9e?v\
-\x15\x1fF\x0ch>?\x80Sq\xf7]\x86\x075:\
-s\xd7\x89\xd4\xc5\x9e;\xfa\xac`,%\xfc\x95\x00\x08\
-\xe4\x98\xabl\xbf\x0f\x97\xa7\xbeIO\x02^xvy\
-\xf8\xe2\xd7\xec\x03\xaf$\x1e\x1df\xf2\xca\xb2&\x965\
-\xeb\xc1m\x8fcv\xe6\xa1\xd5Q\xd6\x15G\x9f\xcf\xe2\
-\x0c\xb1\xd9\x8d\xb1Q\xdc\xb9\x98\xe0\xa2\x87\xa5\xe3/\xa5\
-%\xf3!\x98U2\xd7\x8f\xca+\x1a\xd6\x8a\x93\xf7g\
-s\xc2\xa3\xc6\x98\xb8:\xb6\xd9h\x94Q\xb6\x97\x93\xc0\
-aqXh\xf3\xce\x9b\xd6\xbb@\x85!yu\xc1\x05\
-\x8a\x86\xb5p6\xefY\xd1\x18t\x94yuy\xceW\
-\x8e\x96\x22\xa1\xbc\x97\xb6r\xeam7\xeb\xba\xdc^\xf7\
-\xb8\xce\x905\xf5\x1e\xb4]\xa0\xe3|\xed\xa5>\x09;\
-:f\x87C\x1fc\xb5{\xb5f\x9a?\x08\xa3\xb3i\
-\x98\xc6\x0b\x17i\x19x\xb8\xc8\xb7CS\x07\xf1e?\
-I\x8c)\xd9\x16m\xf8\x91$8\x9f\x096\x08\x02'\
-,am\xaa\x83\x0a\x0eC\xf7B\x19\x99\xe1\xf4\xc5\x5c\
-:\xe6?\x86\x96j\x8e\xf7\xdb\x0b\xb1\x83\x07\x0d\x960\
-\xcb'6v\x12\x1f\x98\xa3\xbf\xad\xe0\xb3~\x00\x03\x87\
-\x9c\x14\x1c6\xbe!\xaaz\x02m\xae\xf0\x9a_8\x9e\
-\x1bz\x9d\x10\x07\xae\xfc\xf9 _c\xc5\xe56{+\
-\xe38\x88\xac\x1a($Q\x96c\x0c\x15\x04\xb5\xc8\xd2\
-\x82\xd4\xcb\x9f\x82\x02\x06\xc8\x9b/\xe5\x96\xe8\x84aY\
-\x14\x0e\xc2r\xb5\xb1obbc\x15\x9fw0\x0dT\
-\xd7=\xdd\x98\x0d\x80zj\xdcB\xf6\x05\xd5\x1d\x9a\xd1\
-\xeb~\xa2S=D<\x10\xba\xccx`\x98\x90l\xe1\
-\x8bR\x06>\x03'\x1ake\x97\xba\x98\x04uy\xc8\
-0GH\x06\x8e\xc1\xae\x1c\xca\xe2\xbf\xe8\xbf\xa4`\x80\
-\x90\xb0\xaf\x0cn4\x19\x96\x96\x86>N\xa5\x83[Z\
-;`a\x90-\xe6\xd8\xf1>\xbdV\x8f\x07Zi\xd0\
-\xc0\x8f*\xe7\xa5\x19ag$\xc7'\xab\x8d\xde(\x18\
-h<\xf3\x9d\xdf\x99\xc4\x89|\xc4\xdf\x5c\xacP\xa4\xdb\
-\xf7\xb5\x09x\x83\xbeC\xe0\xcer\xff\x85\xe7\xc4(\x8f\
-L*\xc7\x8ao\x22Hr\x88\xb4\x13\x9d'^\xc5>\
-\xda\x11|\x99\xcah\xed\x9d\xe6\x08\x1d\xedXyG\x11\
-\x91\x9d\xa8PM\xb3/\xcb`+u\x91\x95x\x85N\
-\xfaa>\xc9\xca\xecB\x96(tt\xa1<T?\x05\
-X2\x01\xba\x84<\xe5=Y\xeb\xb6\xd6\xa9\x8f#>\
-j\xcc\xacH\x95\xe6FuYb\xfc\x1d\xa7\xd6\xa6\xd5\
-\xebY\xe7,K\x87Z\xaaF\xc1\xd3M$/\xf5\x94\
-\x07\x19\xb6\xd9nF\xc22\x05\xe8r\x8d)T\x17R\
-\xf8\x22j\x0ej%\x9f\xd5\x88gZ\xea\xa4-&\xd2\
-\x1c\xb7\xbaqn\x0f\xf8\x07\xbe\x1c\xcd\x0dU\x99\x8b{\
-\xfaF\xb3\x8c\xb2OV\xe4\x0f\xb5!\xb0L8\xce-\
-\xd8\xac\x17\xa9\xf3\xe7\xb1\xbd\x994\xbbm\xe3\x90ym\
-\xea:W.K\x1f\x1c.\xc5\xe8\xd8\xc5\xa5M\x02r\
-\xfbV\xc1\xd3\xce\xa77\x0c\xfe|P\x00LEa\xd7\
-\xb5\xa1?\xb8\x88\xba\xe8T\xa8\xb1@\x04\xe2Y\xc7\x88\
-\xec\xd8\xd54VF\xbd\xfe\x01\x0dwd\xe3O\xa0\x83\
-\xf6\xfa\x05O\x22\x82_1+P?U \xa2\x0a\x80\
-unn\x1bb\xc7hK\x1c#\xc9\x0aE.A\xd5\
-\x95\xa9\xdc\xd3$\xbc\xc8\xc2\xcd\x06hF\xd2\x19\x17\xac\
-U\xb1\x9e\x98\xf8\xe1d\xb0\xb0\xde\x90ts6\x00<\
-7\xf2H\xa5\xa3\x94t\xf0\x98\xe8\x8er\x07v%\x9d\
-\x9aZww\xe9\x8a\x86\x1at#\x9de/\xae\x1a0\
-\xd8%\x0e\x1de\xbb\xca\xe3\xaf\xa7\xda\xe0\x9f\x0a\xedw\
-v\x0fG\xea\x1c\x19\x8aq\xc4M\xba\xae\xd3va\x19\
-b\x13h\xd7\xcc\xca\xd2\x9f\xdc\x15\x9e\xc9\xc5I\x81\xc1\
-w\xe4*0!\xf9n\x00\xf33\xf8\xd1\xd7$\xc87\
-u\xa1\xc3#\x07\x95\xe1!\x16\x95\xa1\xe7\xd3\x88\xfd=\
-\xfe\xb7_\xa7?\x13\xd4g\x04\xee\xeb\xc3\x81ILH\
--X\xf8(\xbf\x0e\x94\x85It\xa4j\x89}ZH\
-LD\x88;\xc7f\xcf\x01\xdb\x08\xa7\x9d\x8a\xa4\xaa\xe6\
-jb\xc9\xc2\xbd\xb6\x87\xfd\x8dc\x96\xae\xa9`\xa3\xdc\
-\xe7\xbc\xa8\x9c\xcd\x9e\x8c\x93t\x95U\xa9\x15\xe8T\x0e\
-ot\xa3m\xd2)\x0as&O\xdc\x94c\xde%p\
-k\xaan\xb4\xc08\x1d\xc2\x12\x9c\xcb\xf4\x83\x109K\
-\xa5mP\xe7+\xe5\x89\x12`\x98\xe8\xe39\x15I\x07\
-6q\xb6\xc5\x8cnX\xcb&x\x8b\x94g\x1cEP\
-\xfe\x0c\xdcG\x0fC7\xb4\xbc\xd2\x91{\x9d\xd6\xe0K\
-\xa8\x1a\xb6\x9e9\x93K<\xb5\x80\xf1\xde\x83c\x12\x8f\
-N\x98\xcf\x97\x9fE\x0bT\x9d\xe69\xe8\x10\x13/3\
-\xc1\x14\x8a\xdb\x1f\xa8\xf3&\xbd\xc6\xb6c\x95/r\xd9\
-\xf7\x5c\xeb\x5c\x13A\xb2`\xe1\x80\xdb#G\x15?\xca\
-/\x9f\xde\xc4\x0b\xebd\x99QXx\xdc\xa7fg\x92\
-e\x0e\x1a\xa6\x9a=\xa8B\x94\x1dq_\x84co\xcf\
-\x9e\xa7\xf9\xeb\x00\xbc\x88\x11\x1b]\x0f\xc3\x13\xcb\xaaX\
-\x97\xf3\x09\x8eS)n\xbbw\x05ss\xf8\xc4D\x11\
-\xffn\x03\xd1\x0aPC%g\x00\xbc\xe2\x10\x16S\x22\
-\x9a9\xe3\x03\x0c\xa9}6\x16\xbb\xd8\xa0\xcd:\xb0\xea\
-\x5cB\xdf\x0b\x04\x0c\xedDy\xd6\xc4:\x07\xe9\x0a\xd3\
-p\xd8$@\xd7&]\xf7\x0d\xc08\xd9\xfcQ\x0d\xdf\
-|5\x92\x06\xdb\x98\xbb\xf4}\x0d0\x86\xc0*g@\
-\xba\xd7=\x98\x0c\xa1\xd3I\xd8\xeb\x87\x81\xd19\x03\x08\
-`\xd73\xf8&\xfb\x06\x90\xdb\x9e\x81\x03Z9\x9c\x95\
-2a\x988\xe5_\xf2\xb9l\xd8dg\x7f&\x80\xd7\
-\x0f\xccF\xdc\x10\xf3\xa1@\x7fG\xb7\x1a\x80?\x1d\x84\
-\x13?_\xe6\xa3\xf7\x1f\xfd\x1f\x00\x19\xd8\xfa\xbd-{\
-M\xd7\xb2\xd7\x15\x11\x1b\xb7\x08\x13\xf8\xc1\x11\x97\xbc\xf2\
-\xde%9t\xf5f\x9b\xb4\xfe@\x8e\x1f)\xfaO\x11\
-X$\x89II\x8f\x1d\xef\xbc\xe6\xb5\xfa\xf3\xbd\xa7\x96\
-\xbb\xcf\x7fIb<I\xe3\xb5\xadf\xb2|8D\x88\
-0\xc2\x17\x00\x84}[T\x930_q\x0cqA\x89\
-\xcf\x15b,!\xf5*\xdb\xcc\x90\x08`F\xe9\xd8\xc0\
-\x11\x02\x09A\x85S\xaeV\x8c\x01@LT\xb5\xca$\
-\x22L'\x95\x15zR\x85\xcf\xb9\xacH\x0d\xb4\x1a\x9b\
-G\xb8\xc0%\x85b\x8a\xf1\x82\x5c\x95\x01Ma\x1eM\
-\xed\x1eLo\xe8\xdc\x10\xa0(/\xd8\x12E\xfb\x99\xcb\
-\x81\x05\x1e}\x9bW(\xa6\xb1\xbe\x14]\xe66\xa8]\
-\xa4\xdc\xb5\xb8o\xfb\xbd|\xc4\xa2s\x86\xd7\x1e\x13#\
-\x87\xb9Nv.2\xf2U\xfd\x97\xe8/6\x91\x98.\
-\xb6\x19A\xc7\x93\xd6!9J\xee#\xe0\x1e\xff\xe4\x85\
-t|R4\xd5\x96`\x96{c+&\xd9\xb4y\x06\
-\x89@\x12\xe4\xef\xf6\xa1R]\x1bs\x12\x17\xd99\xee\
-\xb4Mz8\xc8\x84A\xe69\x1bK\xd7\xcd\xe2\xb9\x83\
-\x1eDN\xce\xb8h\xcb\x1e\x82\x8e\x83\x98\x12\x97$\x92\
-\xe7\x9c\xaa\x8c\x83\x9e\x7f\xf8C\x84\xef\xc0\x88\xd0q\x90\
-\xe7\x86B\xe6\xc6\xb0\x81P\x81\xc8\x8c\xa7\xdd\xe8\xc2\xad\
-\x92\xa3\xc2n\xd5\xdb\x99lL`\x22\xeb\xe4\x94\xb7\xd5\
-i\x03%\xe2q\x0e\xcch8\x90S\x0bG\xe4\xaa\xd1\
-.c\xa4\xe7\x84\xc9\x12\x09\xf6\x89\xaf\xec\xa4\xf2S\x15\
-\xe4\x94\xdb\x06t\xb5\xd7.\xb0\x97\xd2\xf3\xa9\xc7\x9f\x0c\
-\xe0\x03\xa7L\x91j\xc1\xbb!\xe9\xbao\x00F7\xa8\
-k\xfc\x1d\xb3\xb9\x90\x22^\x07\x0d\xfd\xe6\x9e[\xc7B\
-\xf4\xf4&/\xe9\xd3\xf9t|\x06Pd(\xccd\x98\
-\x94e\xe7,6=H$\x02\x14\x04G\x9b^\xc8]\
-A\x9e\x80F\x8e\xdc!*\x8f\xff\x08z\xcc\xf7\x10\xb7\
-\x7f\xc7\x1a/\xb1\x8a/\xd6\x13\x9e\x04h/\xa0\x89\x1a\
-}/\x0a\xfd\x1d\xdd\xd8?\xe0\xd3\xfa\xfa\x8a_Z\xb9\
-zU\x09\x1b\xc5\x95\xed\x01\x1a\xe9MJ\xce]\xbc\xe0\
-\x0c}MN\xc2\xe7\xe5'\x07\x92Ff@x\xf5?\
-\x04\x9ez\xfd\xb7.\xf7\xb5\x09x\xc0\xff\x04\xd0O\xce\
-\x8c\xc1\xf5\xe8.\xfe\xd2\xa6\xd8\x86T|\xc5\xaf\xac*\
-\xc4GE\x89BW\x0c\x88\xd8\xb6\x01\x10\x90\x03D\xed\
-b\xe7=\x91i[\xf1e\x91\xc8\x19\xb69X\xa9\xdb\
-\x05P\xd5\x90\x96\xcd\xb6\x1c\x95a\xe6ti\xf5/\x99\
-\xcf\x154\xe5\x93z8\x87\xa8=\x5c\xc8Am\x93G\
-\xa7\x09'bx+\xac\x0b\xf9\x05\xe3\xc4u\xfa\xd8Q\
-\xady\xf39\xe6\xf2\xd3\xe7\xc6\xb9\x08\xc3\xd9!\xf4\xb9\
-\xf4\x929t\x17B\xa1\x22BFE\xce\x89\xca&!\
-\x8f\xccs$B\x9bN\xc5\xc1\xd9~M7\x0e\x86_\
-<\xf4E\xb6\xa5\x90\xd5x\x7f\xa4\x07\xdaQ7N6\
-\xf8\xf1\xf8\x9d\x1d6\x17\x83E\xc9\x94B\xfabR\x1d\
-M\x0b\xa3L\xc6\xe9[E\xb9`{\x1e\x0a\xd6n5\
-\xbb\xea:&!\xe3\x15\x85~-\x97y\xba@\x02\xca\
-\xd2\x8d\x1f\xc3\x85W\xbb\xbc\xa9\x80G.h\x867\x05\
-9\xad\xaa \x84W\xb3V\xf9\x03\xc7/\x1b\xcfuT\
-p\x88<nu\xf3\xe0\xa2xRX\xf9M\x13\xac\xa2\
-\x9a\xd7\xb4\x8eQ\x161vLTT%\x0e\xf9H\x85\
-\xdcg`\x1c\x91{\xe4\x18#\xb0 \x9c)8\xbb\xcb\
-\x12_\xce.Xt\x00\xc3\x14\xfb\x9c1\xca\x22(w\
-\xd5U\xaaF\xc0\xd1\xb6R`\x0d\xd62\xe2m\xce\x14\
-\xd2~\x81}\xde\x1e\xe4Zc\xc85?\xdc\x98\x0d\x80\
-\x06\xe6]\x16\x8f\x1e7\xe9Iz'\x03\xc4\xfd\xa8\x83\
-\x070J\x8f&\xd4\xad\x8f\xac\x87UF\x0d=\xee\xdf\
-u@x\x98\xc4\x0ev\x12\x83\xc8\xfc\x9d\x9b\xbb}T\
-\x0e\xd0\x93k\x8e1\xbaa\xcf\xc0\x83\x08A\xa7Q\x96\
-B\xed\xbb\x18?\xf6\xfa\xa5\xdd\xca\xf3\xe7\x81\x99\xc0\x0c\
-h'\xf3E\x8f\x04{\x9c\xe4\xad\x03)\xd91 \xf7\
-E\x9eo\xeb\xd3t\xabs\xa2\xeb=\x9a\x0c~\xe5\xe3\
-\xad\x02\xb5\xd6gM\x8bI6\x0e\xe0\x8a\x0bnl\xf4\
-\x14\xe0\xd6\xeb\xbf}\xb9\xf7\xdc\x17\x97\x07\xf7\xf4\xcf\x02\
-\xecV\x1a-4\x84\xe0\x13\xa6<\x8f0\xb1Wr\xfb\
-\xd7\x1e\x90\x12\xa1U\xc6\xa7\xa4#\xf2J\xad\xaes\xdb\
-\xe2D\x91ZAJ5\xceL\xb1\xc4\x1fJp0w\
-\x04Y`[\x1eMj\xbd$M\xf1uL%rV\
-\x84\xdd^\xfaVgf\xf4\x01>\xbb\xcd.o\x0e^\
-s\xc5\xe1\xbct\xa1W\x84\x14\x94:FWJ\xd6\xa1\
-\x0cY\x9f\x80\xd6;\xae&P\xa5\xc9l\xb0sh\xbb\
-\xf1\x98;\x98\xb4\x876)U\xa5\xa1\x1ec\xc3\x8f\x11\
-\x80b\xd8}\xca\xd2\xde\xa2\xd2X\xf0\x88\x0c%B\x13\
-\xae\xb9E-+\x88\xb2\xdd\xb4\xe5\x1cmnE\xe7e\
-\xdd\x9b\x06\x89\xdd\x7f\x167\xa6\xdac\x0e\x95\x07\x17\xa0\
-\x8c\x1e\x8e#2\x15<\x94e\x9e\xbbP\xc3\x0a\x99\x96\
-a\x99\x0b\xa3F\x88\xf8\x5c\xc61\xdc\xe4:\xf7+c\
-\xe2\xb0\xa7\x8a!\xe3\x00\x07\xa0\xc8\x8b\xd7\xf5\xf0\xf4\xe6\
-\xc4v\x12\xf9\x03},\x1c\x0a\xae\xef\xbeUsB\x92\
-\x8b?z\xc6\xbb\x929\xc5_'$w\xe5vi\xa5\
-\xd7&\xd6\x22\xc7,3K\x89\xc7\x11\xc1\x90\xf3\xe0v\
-A\xc7\x06$xQ;!\xf3\xda\x82[$>q)\
-\xe7!\xa4\x10\xc4|\x81\x15+$,X\x99\x9b\xa9\x9b\
-!<\xd2\x84\xbb\xf8Uw\x83\xfah\x03\xf0\x15\x892\
-\xb7G\xfe\x1d\x0f\xd6\x0cW\x9d\x14\xdd$iA\xdbM\
-q\xb8\xab\xfa\xc6\x14^\xe7\x0d\xc0\x85\x93\xad\xfer\xa7\
-xlug\xae}\x99\x11\xa4>(\x91\x0b\xee`:\
-\xb6\x85\xd5\xd9\xae\xd6 \xa7\xdbzxA\xd2P\xe4\x19\
-\xf0\xd1R'\xb5\xcc\x0eM\xac0=!\x08w\xb2\x17\
-Q\xfcGm\xe3\xb6\xc7\xcb\xdc:\x9c\xda\x1c_\xabb\
-\xd8{!\x95\x9c\x98\xfd\x08 \xc5`e\x5c\xfe\x13\x0e\
-\xf6\xd2\xb0\xe37\x16_q@t\xfe\x00\xa1T6\xf1\
-f\x80G|\xc5\x87\xa9\x12pG\x22\x7f1\xc5^\xc9\
-\xeb\x04\xc6*T\x1cOi\x13p\xff\xf9g4e^\
-t{10\x8dr\xac\x1c\x93rdY\xa0\xaa\xac:\
-\xbb\x94\xe9\x8c!\xb9\x90\xb0\xb7\x7fr\x90\xf8\xadT\xa1\
-v\xd5\xf9V\xd6u\xe7\xd5\xc8\xc8h /\xf1\x16\x08\
-?Y+\x1572\xf9\xb2O\x1a\x0dH\xfa\x1cR&\
-nS\x96\x18\xb5\xcd\xc8\xa50\xdc\xba:\x1f*\xcf2\
-8CYX\xfb@B\x1d\xa6\xb4u\xd8\xc05'\x14\
-\xc0H\x0d\xea\x00\x08\xac\x95\xd393v\xef0\xc1i\
-\xd4J\x17\xc58\xea\xc4t\x7f\x193\xfct\xbft\x00\
-\xc4\xd4,\xe5pR9\xb4\xa1\x0e{P\xcd3\x94\x83\
-gx\x16o\xbaC\x84\xf8\x80wN3\xddD\x13\xc8\
-F\xd0U\xc7\xda\x86\xe4zY\x87\x8f\x8e\x09w\x12J\
-\xc4Xq\xff\x0b\x89{\xc49k\xaa\xe5*\x86@q\
-\xea\x00\xc6\x99\x10\x05\xf6\xdb)\x12\xf6\x9f\x07B\xe0G\
-\xeb\x18\xe1\x0e\x1d\xf6\xd8\xc9f\x8c{\xf3\xf0\xac \x0a\
-\xf2\xee\x8fp\x08[\xfe\xf3\xa7\x85\xe5\x1c.\xc6\x1b\xa4\
-\xd8(\xcb\xcc\xa3.\xbe\x88s^\xa9(PD`\xad\
-S)\xa1G\xdaC\xd5\xed!\x82\x02\xa1]q\xc4\x96\
-\xa7\x100%Ev\x11W\x1a\x05\x85m\xe2D\xb6\xb6\
-\xd21[K\xac\x19\x09Y\x1b5G\x13\x92B\x96\xdc\
-q\xc3\x13[7B\xa4\xf0r\xb0\xb4\x9dS'\xee\xce\
-\x81hMC\xa6e\xe9h\x03\x00\xd3\xb5J\xd7y\x03\
-p\xe1D\xab{\xef2\xe0\xaa\xbfS\xa0\xd3\x85\xa2c\
-=,\x5c\xa1SU\x18\xd8\x94\x9bl\xd8\x97\xa0\x07\xdc\
-:A\x86\xa2\x06v\xd9{\xb00@&\xa6\xe1\xbf\xe2\
-\x10\xd4\x01\x92W\xd1\x85\xaa\x13\xd4\x85A\xe8\xa8e\xd2\
-.\x86U\x0c\xe2\x8a\xe3 \x88\x7f\xf0\x12\xfbO~\xe0\
-TPn\xbfV\x16\x7f\xf2\x97\x8b3fu\xb7\xef\xc9\
-Q\x1c\xf6\x8f\x5c\xa3<~c\x0b\x9f\xd7\x0e\x15r\x17\
-\xc3\xc6\xc0\xab\xd1\x08\x90(l\x0f\xbd\xd7E{]\x9e\
-\xfa\x967\xea3\x01\xfa\xd6\xc0\x97\xbe\x1aNq\xc1\x01\
-g\xb79\x13\x97z\x12\x5c\xb0%\xc1\x1aId-\xaf\
-Z\x9d\xf4\x9c\xe5\xb6X\xcfJ\xacGt9\x17\x83\xbb\
-]\x10\xf4\xca[\xd2\x0a\x01y\xfa\xd6\xed\xd3\x89\xe1\x87\
-\xa5\xd6i\xb6\xa3\x1cW\xce\x8d\x88\xb9\xfb\x01|\xbf\xdd\
-\x12\xe3r\xd1\x15\xf4m\xe4\xbc\x14\xb3\x0f\xfbm'\xe8\
-\x1d\x95c\x0a[\xe9\xe8@\xb4\xb2e\xc8s\xf1p(\
-V\xaf\xe4]*+\xf1\xcc|e#\x8e-.\xbd/\
-\xa9~\xd3\xdd+\xc6\x8d\xc0i\x1bqR\xdc\x06\x09Z\
-\x8eC\x12\x18^\x0e\xa0\x0a\xdd\xde\x92\xcdP\x8b\x0a\xae\
-\xac\xcc3B\xb0F\xd0\x910\xc6\xa0j\x97\xa8\x13\xac\
-K9\x5c\xf0%Q\xc7\xe1\x93\xa6\xba\x09*\x8f\xc5J\
-\xda\xc1\x0c3G0\xf9t0\xa6\xcc\xd7\xf8\x88\xde\x22\
-\x0e\x99\x1fM\xe9G\xf6D^zo\x10b\xee6\xca\
-\xc09\x1b\xc8\xb8\x9d\x95*O\xb1\x00L\xf8\xeaM\xcd\
-\xe7\xf1\xb9\xa3n\xbc\x95\x02)\xf9B'\x83\x98+&\
-\xf1\xdbS&\xa8\xcf\x97\xcf_\xe0!\x1e\xfc\xd8g&\
-\xcc\xee\x89\x95\x80\xda\x8e\xf5\x13\x91\xdf\x96\xe43C.\
-\x1bA\x04\x8dNI\xe7\xc5\xd6\xb2ql\x83X8\x14\
-\x8et=Z\xa4\x03m\xecM\x15\x8c\x5c\xf0Idi\
-\x8a\x91\x96q $R\xec\x85\xc7\xdf\x1a\x98\xeb\xd1\x97\
-.HZ\x95\x7fij\xeb\xeb}\xb8)\x1b\x00=\xfd\
-\xd1c\x19ZC\xaf\xe6W\xdd\xe5a\xe0\x1e\xceE\x0b\
-\x05\xbdN\x97\xafy\x97\xd6\xae\xec\x81\xcb\x80\xcb\xa0\xc9\
-@\x14\xb2\xea+\x96\x89\xc3\xc0AW\xb4\x96\x04\xea1\
-(\xb9Y\x1c[U\xda\xa9r\xdb\x9b\xb0\x08\x90A\xd7\
-v\xdd\x8e\xd5\xe9T\xaaX\x91`\xe0\xf6\xc9\xd8O\xc3\
-T''>_\x91U\xd1\x00\x9f\x8a(\xfd\xa8/\x7f\
-\xd7\xeb\xaa\x0e:\x9d\xf8\xcf\xacQ]6\xe2\xe5\xae\x80\
-\x94Gp\xf8J\x80vi\xb9\xea`$\x90G\xa0\xd5\
-\x86[\xfa\xc2\xa07\xeaO\x04_\xe5\xaf\x0f\x8e\xc2G\
-\x03\xb0\x07\xdd\xe7z\xed#\x84\xf1\xd9\xbe*\x84\x18\xa0\
-\x92a/.\x11\x86\xb7\xac\x5cI9\xf1ty\xd6;\
-H7B\xd2m\xff\xd69e$\xf9\x91\xa8\x0d\x19\x17\
-n\xe6\x858\xf0\xe0\xb6\xa0\xc3\xb3@\x8c\x0e@\xeb\xba\
-\x12\x1f\x89\x06P\xb0s}\xb4\x91\xc6\xcd\x09^\xcc\x91\
-9\x80\xceu\xbe\xa9[\x13\x7f@\x92\x12A\xcec\x97\
-[\x97\x1c\x8bN)\xd3\x7fJq4\xc2i\x1c\xe2\xf4\
-\xef*Y\xf1\xcd\x84=\xed\xafs\xa1\x92\xcb>\xcfU\
-v\xccX\xda\xd1\xd4\xa4\x8a\x13\x1b\xfa\xbf\xdaj\xfb\x95\
-\xd0b\xbc5CX\x9a\x0d\xcdZ\xb6+\xf1M#S\
-Z\xb8\x93\x81m?!.\xd6\x18\xaeD\x06\xd6\x81\x89\
-d\xa7\x89\xb1\xfd\xfb\xc3r\xe6+J\xd4\x1a\x00\xfe\xa0\
-.m\x92\xce\xec\x5c8)d'e\xb0\xe5>\x14\xb5\
-v\xdd`\x10a\xc8y\x8f\x1f\x1d\xbb\xdeJ>\x03\xed\
-29\xfa\xb1E\x15TN\xec\x07\x80jjW\xba\xa2\
-\xf30\xf7\x07o\xf1\xe2;f\xb7\x1f\x8f\xb1\xe3\x22\x8b\
-_\x0eY\x07\xea\x1c\x88\xcc\x91\xe1\xd61\xe8@\x99\x83\
-R\xfedO,\xb2\x1f\xf3\xdc\xda\xf4I\xb7\xcb#\x8f\
-\xd8\x95\xec\xdan\xa9\xab0\x06\xbf\xa9\xab\xa9<\x89\xab\
-uM\x0d\xec\xfe\xad\x11\x1c\xefED\xe66#\xf5I\
-MtvA\xb8\x02\xd8E\xf9\xc7\x8bM\x1d\x0c\x07G\
-\x81\xf5o=\x01\xc8\xe9\xf8\xba\x1e\xe9\xa7\xe3\xf4P\x1f\
-\xccpO\xa6\x97uT*\x13\xf5\xaaUe\xbd\x0e\xc2\
-\xe8\x83-ee\xe3\x82O\xdd\x03CC\xb4FP\xbb\
-\xa9\xd1\x94A\x82\xb0\x9d(7gF\x9b\xe4\x19\xe4=\
-\xdc<\xc8@\x94\xbe\xe5#\xde\xb8\xc4sq*~8\
-!Un7.G\xd8r\xe3+F\xcbt\x15g,\
-c\xcb\x19\xe8}z\x1e'2\xe5\xea\xbc\x08\x0c'\xc9\
-2\xd5\xb3\x13\xf6\xee!\xbe\xd1\xb1\xe0\xd5.\x9b\x22F\
-\x8e\xdd\xce\xa8\xc0\x22\x06\xf9\x8c\x7f\x82\x14\xcc\x93M\xdf\
-\xf7\xaf\xff&\xc8g\x03\xee>\xf7\x8cL\xeb\x09\x03f\
-\xc4\x08\x13\xe6\xcaY\xa8r\x8e\xc8\xe1\xe0%\xa5\xcbk\
-\xd5\x13VU\xab\xc9I\x82\xda\x1dE\x95M9|\xac\
-P\xe4fm\xbc\xee\x92\xa8'u\xc9\xd6\x02\xf6\xc2\x12\
-0\xb1\x92\xdcN\x0au.\x8c&v+9\x80\xe9\xc6\
-\xf49.\xdb\xa8\xc71\x17p\x0cd\xed\x937T\x17\
-\x0b2\xaf\xa8\x0a\x07\xbe\x02\x00\xa9r\xda\xdfr\xc90\
-0g|s\xb4\x88\x5c\xfe\xc6yT\x1d\xdcxBA\
-,%s\xa6\x03\x12w\x83\x0a\x8eY\xb9\xa9\x0b\x0an\
-\x15x4Y$a\xe2N\x08)\x07\x8c\x81^\x8c\xc5\
-(g\xaa\x96\xa1\x1ar\xca\x81\x167:\x04 \x94w\
-\xb1\xb5]'\x97r\xc5r\xde,J^\xe5\xc0u4\
-\xbeT\xa3\x91=N\xcb\x97}v\x1f\x87\xa0\xcfO\xba\
-E$\x9cc.\xe4\x10\xca\xccz\xf1\xf9\xf4\xca\x94\xb9\
-\x86\x0c\x17\x99w\xe2\xc9d\xb0sfa?=@\xe0\
-\xf3 \xb0\xe0\xe1\xacf4\x09\x1a\xb8i\xa9\xf1~\x0f\
-\xbf\x1dk\x1d\xe8p+\x06\xfa\x9f\xcdm\xd0\x89!\x17\
-\xff\x92\x11?\xce\x98\xb3\xce\xe1G\xc6\xbcH\xa8\x9c\xd3\
-\xe8\x10\x14\x99\xb1\xf1\xeb\xf6I\xc5\x98\xb1\x8d\x8em\x9b\
-\xf1\xa7\x9a\xf0k\xec\xc2\xca\x08]\xa2\xb0Re\xc3l\
-m,1\xe9\xec\xe4\xf6\x04F\x9f\xd0\xc2\xf5\x19\x88U\
-\xce\x09e\xf9\xc6\x9d\xceqd\xe0$p\x08\xf1\xe3\xf6\
-\x11\x10bD\x1c\x948\xca\xd7om\x00|6~s\
-\x0e\xea\x92\xbd\xf4\xe0%:\xb1\xe7\x0d\xa0tY\xb0\x17\
-\xcac\xa4\xaa3\x19\xc8@t\x18\x03\x84A\x8a|R\
-\xb8X\x80\xf6\x81Y|Z[\xe5\x90Y>\x22(\x1f\
-B\xe0h\x1e\x96\xa6,\xc2\xf8,.\xfbW9\xd5\xb2\
-I=p\x14\xf2\x02\x0e\x97J\x15\x9eJ\x19\xd0\xc4o\
-T\xe7r\xcf\x84\xb2\xbd\x8dX9\xf4)}\x0dn\xc6\
-\xb7\xff\xf1\x8e\xe5\xae\x94\xef\x8aW\x0bX\xe2\xd3\x05\x06\
-\x02\x9abk.\xe4`\xf0O\xae\x92\xf4\xfe\x12\x22\xde\
-3 \xd9/\xb9\xfeP\xf35\xaf\xd3bxG\x9b\x80\
-/j=\xa9\xbf\x10 p\xab\xcd\x12n\x02\xd2\xe7\x14\
-\xdc\x07\xe5\x0bL!(\xe2\xd0u/ R\xe4\xbc\xc4\
-\x1c\x5c\xbf\xa0\xa2L\x9as\x16#\xff\xc5\xc4\xa4\x0f\x8a\
-c;\xc5\x82r,}'U\xba\xc1%\x07\xf6!X\
-5\x05\x82\x1a?\x92q\xceU_YR6\xa6\x81\x93\
-\xe1\x8ak\x0f\xab\x04\xf8\xc5\xd4\xdc\x95\x03U\xa26\xac\
-\xed\xbf\xc6\x8a\x85\xad!\xc6\xe0\x86Dq\xd0\x96>\xb7\
-\xe3j\x81H\xaf\xdc9\xd6\x983pj\xd7 \x11p\
-x\xbf DQ\xc9NT\x9e\xf3Y\xb7\x81Q\xbd\x94\
-J\x00\x82\xacs\x10<2\x09\xd4\xce5\xd2\x06$\xe7\
-\x0c\xd0\x22\x8eiY\xb5\xcf\xb2\xb2\x124\x18\xe2\x08>\
-\x8f\xd7:(\xf2*\xfb\x1c\xd6UVR\x9fCex\
-#\x0c\x87R\x1c=\x97\xe6;r\x0fd\x9d[\x8f5\
-\xf0e\x1bc\xd5\x1dv\xf92gmPe\xc3\x85\xbb\
-\x9b;>`+A\xa3\xf3$PFJ\xe0\x9c\xdb\x87\
-\xa3\xb3\xcf|\x07?\x9a\xbee`\x0b\x22nArA\
-N\x1e\x8b\xb2\xa3Q\xe5\xf8\xc2\xda);_h\x1d\x01\
-q\xb0\xe6\xc4\x06\x0f\xdeD\xd6\x99\xedx|~\xf0\x88\
-?\xe9@'\xc9\x9e\xf3fA.\xfa \xd6\xf3\x05j\
-\xc6K\xe5\xb0\xd2s6S=\x84\xf0D\x1e\x0ax\xa2\
-C\xeeD\x1d1U\xe5\xce\x90\xdd\xbf\xf0\x04\x00q\x19\
-\xa8t\xcd\xd2Mx\x0b '\xff\xe1\xc3\x17\xe8\x9b\x1e\
-\x84s9\x03\x12IM\x0ep\x1eH\x19P\xee?\xb1\
-xp\xd3\xf9\x0c\x8c\xc0\xdd\xfb\x0c\xa9\xe8P1h\xa0\
-\xca\xd0d\x9a&!o\xa3\xb9\x9c\x01k>\xcc\x9a\x9b\
-1c\x9fm\xde>\x22\x1c\xb1\xccq\xcaV\xda\xf2\x9f\
-R/ \xb0\xace\x22!\x96L\x5c\xb7Gu\x16\x07\
-\xff\xe9\xbeC\xd6\xc1\x8f\xe3\xf4\xdc\xd0m\x12v4Z\
-\xdc\xf5\xe8\x11\xdeb1\xa7\xcf\x05\x0b\xbf9\xf8\x10\x0f\
-\x13Z\xa9\x02\xf3\xe4\xb19\xbc\xf9(Q\xd4\xb1q\xfb\
-\xef\xbczy\xd5\xeb\x7f\x9b6\x01_\xd0\xbbi\xbc\x9d\
-\x06\x19\x04\x84RgT\x22\x99+\xa4^0\x94\xd7\xe2\
-\xe68\xcb\x7f\xfa!\xe6\x84\x958\xac\x0c\xa3\xda\x06\xbe\
-\xcf\x5c\xbc\xe0II\x95\xf4f\xf0\x11\xd6\x11\xbf>/\
-\x9c7\x5cs\xb0H\x80\x94A\xaa\x14?\xe4T\x9ch\
-\x83\xcf\x94j\x19\x0b\xf8]\xb1=>\x82v\x0c\x8a\xb1\
-\xf5\x83fX\x83\x93\xb4\x01U%#u\x9b:\xbf\x00\
-\xb5cE\xa3\xdcMBI\xbb\xdc\xd7\x17\xed\xdb\x81\xfd\
-\xf7m\xa2I-\xb1\x8d\xfb\x97;\xae\x8e\xa5r\xc3\xec\
-+\x9c\x16o0\xb8t[\xed\x9fr]`\xfa\xc4\x0d\
-\xfc|\xfe\x14\x15\xfd\xce\xf9\x11\xff\x0c\x8d'x\x94d\
-k\xf3\xca\xbb-\x0ei\xb4u\x1eK\xb2Q\x1c\xc4c\
-{\xaaf\x80\xac/|\xc5m\x1dq\xf0\x09\xf0\xa0\xd3\
-\x96\x8e\x1f\x1b\xa5\x8a1\xb1p\x8eu\x9e\xfa\x5c+\xef\
-\xef\xf9\xf7\x8cRC<_!\xd2\x5c\x837\xdf\x13 \
-;\x1a\xe9\x0d\xb78\xdd\x00ZS\xb1\xf7\x09\xa0\xcam\
-\xbb\xa7\xafr\x01Q\xd9\x96\x00\x0c\x97\xac\xf1\x929\xe6\
-j,m\xa1\xf5\x08\xed\xa2>\xe9\xcf\xc5\x1f\x5c\x11\x8c\
-\xf8\xbb\x1d\xb6\xa9\xf3S\x96\xb6\xe7\x5c\x86\x9f\xdc\x04\x8e\
-\x89\xa0\xd6\xbeC\xae\x96J\x96{\x03\xfaY\x89\x83C\
-q$UV\xe6\xd8J&\x00\xe8\x8c\xbf6A\x82,\
-k\x17\x08\x1b[\x9a\x92\xe3\x02\xd3n|>\x824\x8b\
-LVNp\xf1\xe3\xf3'Z\xdb\xe9\x80\x19\xecn\xcf\
-\x83\x07\xfa\xce\xf3\x9b\x91n\xc2\x06 =\xd1\x9d\x92Q\
-\x18\x99\x07\xa2:\xb4et\x22\xbdH\xaf*\xa5C\xa7\
-\x8a\x06\xb1\x85\x88JL\xeea\x8a\xce\xa5\x95\xc0\xf6\x03\
-\x08c\x1b\xcde\xfc\x97J\xf9\x5c\x06\xe5d\xbfa3\
-\xc0\xbe\xa4\xb1]\xdb\x87\xbbP\xa5\x13\xc6\x03\xba.\xd1\
-\xc3}\xd5k\xd1\xe8\xf6\xb3\x80fa)\xae\x11\x8c\x15\
-rG\xce\x84R.G\xde\x9d\xab\xe8\xc9*\x99\xb5}\
-A\xb6\xad0\x86r\xf0T\xc4\x81\xca\xc1\xa6\xb1\x891\
-\xaehK\xdd\xad\xe8\xad\x80W\xbf\xe1;\x96\xbb\xcf~\
-\xc1\x7f!`\x87x\xef\x06\xe2\xac#\x920~\xa4D\
-\x1fw\xca\xaan#\xf7R\xd3TK\xd2\x86P\xe6\x08\
-+\xd4E\xe3\x1c\xd9Hp\xc9Y\x1e\x83\xab-l\x92\
-\xd4&\x1e1\xdaC\xe9\xcd\x90\xa0J>\x18T\x80\xbd\
-\xe2q9\x12\x10\x89\x22G7\x16_V\xe8H\xd9m\
-A\x90t\x01\x0f\xd2\x82\xb9\x05\xc2M6\xa8\xd1\x0e\x84\
-t^\xd6\xdco\xe1l<\x18R|\xa4\x9c\x98\xaal\
-\xa5\xec\x05\xa0\xa9\xa9\x16z6b\x80\xf8\x5c\xcc\xc2n\
-Kr\x0fS\x11\x04\x01\xe7jc\xf3\xd6\x19@\xc4\xe3\
-\x92\xa7\x12?\x01\x90\x8f\xb6\x95\x8du\xe8\x95|*\xba\
-a\xd8\xb5!V\xf6iT\x05\x22\xe5\x05\xb2\xf8i\xf3\
-\xe6%'\x1e_\xb0\x89\x04*h\xca6\xf1\x17\xba\xb2\
- T\xc1\xa7\xe7\x03Wd%\xf4\xea\x0b\xfe\x9c\xcc\x17\
-F\x0b8G\x8c\xb1\x00|\xb1\xc1G\xc7\xdb\xb9\xd5\xc3\
-A&&S\x9d\xb1i?**w_\x99,\xed\xc9\
-F\x04\x9c\x12\xe6\xd2\xe1\x836\x91\xfc\x15\x00<ms\
-=q\xe6\x82/e\xb9\x83\x9e\xe4\xb9P}\x9ds\x82\
-\x0c%\x0e9G\xa0H\xe1\xf3\xdb\x7f\x92\xfb-\x05\xe3\
-\xb2>\x84\xd8A*\xde\xb2s\xc3eJ\x1b\xccg\xa2\
-bGFj_\x94A\x95\x1f)\x1b\x01d\xc8\xa9L\
-&\xa3\x08\x86v\xe0\xdb\x00\xd3\xe5<\xe2\xc8\xe7\x15S\
-\xec\xfb\xdc\xe0S\xe9\xe1\x83\x17R\xb8\xfe\xc7\x1b\xb3\x01\
-x\xf0\xe0\xfe\x0bw<\xf2\xe9|\xf5\x19=M\xa2\x92\
-\x03\x85Q\xf4\xe7\x00\xdc\xb9\x91y\xc0[\x9f\xc17\x06\
-\xc5l\x8b\xbe\xeac\x82x\xf0h\xb8\xc9\x8f]\xd6\xc0\
-\x1a\x0byM\x96\xd8Y\xe9\xe0\x86\xbfXy0\xce!\
-wyr\xe9b\xf3\xf4\x9f\xa4D\xd8w\x1anlb\
-\xf1\xd5\xfe\x02\x8b\x03\xec\x7f%\xec;\x19b6Dm\
-V\x9c.B\xc1\x80\xd7\x1d\x81'\xaf\x84\xbe\x8b@)\
-\xf0-=B\xf0\xe2Q\xed\xedv\xd6\xa97_\x9al\
-\xb6\x8a\xb9\xce\x1ak\x8b\xf7&\xf1\xc7W\xa2\xbe\xfa\x0d\
-\xfa\xae\x00\xfd\x99\xe0\xbd\x17\x9e\xc7A\xe1\x8b\x9c\xbb\x12\
-\x15\xcd\xa7\x05\xca>\x1cp\xa6w\x04\x84K]?\x98\
-;~\x98tW%9\xf1\xf5v\x08\x95\xdb\x00>\x0d\
-\xafpdh\xf2\xe6R\x95\xb6\x9a\x17\x99\x18T\xb7=\
-8V|\x7fJ\xb2\xe3]\xfd\xc6\xbf\x91#\x16\xdc\xee\
-&\xfb,\x8e\xf2\xdfq\xe4Db\x05\x970\xc0\x1aC\
-\xec\x94\xdd\x06\xfa\x0aT\xea\xf4#\xc9\xed\xa6\x08T\x07\
-\xcc\xbd\xa6\x95]\xa9\xc69\x8b\x15\x96J\x02g\x03D\
-\x85\xb7s\xc2\x87\x9f>\x97\xb8K\x8ce\x89\x03\x0b\xc9\
-I86(\xa1JRH\xeb\x1c\x860\x15\xaeu\xc4\
-\x99\x94\x88\xfbC\x97\x9d\xbb\x7fm\xbdr9\x9er\x85\
-ux\x01\xd1_\xcd\x988:\x1e[C\xd6\xee:\xc7\
-\xc2\xe7\xb6\x9c(3O\x91v\xac\xdeDG\xb5R\x82\
-\x15\xa7c\xd0\x86\xb1\x9f\xc6\xe5\xc3o\xb9\xe3\xcd\x98\xab\
-\x0d%W]L8\xe8\x7f\x03\xe8\xc6[6#\x10\xa4\
-J\xaa\xf7<&g\x13G\x83=\x8fdC\x8e\x89\xff\
-\x09\xaa\x14}\x82\x04\xf5\xd7\x0d\xc7E\xce\x89p\x1d\x7f\
-\xc3\xfc\xc1_\x99\xd7\x00J,u\xf4i\x90\xc1\x9ag\
-\x8dqH\xf6\x89\xeb\xccc\x87\x8d/\xc5\xe8S\x85\xde\
-:2*V\x22\xd2\xb5\x13\xce\xf4\x8d\x05\xb4\xab\xe2D\
-\x9fTxW\xba\x1f\xdb\x06!e\x8e\xca\x87\x0d4\xed\
-\x8bR0\xa0;\xa6\xb4\xbft\x22\x88}\x98\xb2\xfe\xc9\
-&\xa0\x8a\xd1\x11\xc6\x97\xa9=\xcb\xa0\xfc\xad'\x00\x9c\
-\x85\xdf\x84Do\xed\xa7\x87\x0f\xbf\xe6\xfe\xef\xae\x17r\
-,\x00\xea<w0\xa3\xa5\xc6\x08\x9d\xef\xe4\x0e\xefZ\
-d\xa9m\x073\x03wu\xefq\x0d\x81GWh\x9b\
-\xd2\x13\xb9\xfd\x17\x10\xcb,\xaa\xf2!\x9b\xf2\xbe\xda7\
-\xb5\x14\xed\xa6\x07e\xdc\xe0\x1f+^]\xb6\xc6\xb2\xb8\
-\x09k\xc7\x99\x0f;\x82\xa9\x09\x83\x0f/\x1e\xc9|}\
-u\xfcj\xb1\xfd\xcb\x9e;\x81\x87|\x9c\x98\x95\x86r\
-&\x99J*\xeb\x9cT{\xf8?\x01\xcc\xbeL\x09\xe9\
-L\xd0\xfe\x95\xa3\xd6k\x0d\xd9\x0c\x11\x08;\x9f\xa3;\
-\xaf\x7f\xd3\xf2\xf0\xcem\xfd\x0f\x81\xe7\xa2\xc7pN\x22\
-\x89\x04\x0e\xa5\x8a\xc1\xb1\xa0\xc3O\xe3\xe3:\xb5\xc2\xa1\
-s\xd7C\xc2\xcb\xf2p\xda\xaee\xca\xe1\xcc\xb9\x00J\
-\x9c\xb5\xcaVcl\xaar\xbe\x14)np\x1e\x9b\x14\
-\xaa\xa5\xf1Y\x10\xbb\xa8\xb2\x83\xb5\xaf\xb2s\x80\xc4\x05\
-`\xaa\xb8\x8e\x7f\xac\x95.\xb4\xa7p\x8e\x8f\xfe\xac\xf6\
-\x08s\xc1\x97\xe4F*f\xcey\xc6P\xe8\xc0\xf9:\
-$@\xb7\xd9>\x8a\xa0y\xba\xaf\xa6\x10V\x02b2\
-\x10/\x15}\x8a\x9c\xcc\x08$\xe7\xf4\xc1\x1dU\x98#\
-\xc3\x1cy{\xe3\xac\xd3f\xf0k\xc6Xm\xda\x94\xdc\
-;CF\x18\xa4j\xedTF(e;\xab\x18\xf06\
-\xb9\x1c\xe4\xd0\xe4k\xaf\x85pH9g\xbe0\xe8\x5c\
-\xaf1\xa0\xce95\x17|\xb8I\xe6#\xcdo\x03o\
-\xa6\xa5dc\x8d\xac\xef\xf8\xbd&L\xe7i\x9c\x7f\x99\
-\xbal\xb0\xca`x\xdd\xd1\xd9Q\xce\x14}\x98\x09\x0c\
-i\xb0\x92g\xc3AdDR\xbe\xc4A\xfcq\x9d3\
-\x94yM\xfc\xf0$\x1e\x95\xf0\xaaD.\x85S\xb5\x1f\
-I\x8b\xac\x0bg\xc6\x93\x09\x82\x16\x86\xbe4\x93\xe2\x8a\
-7\xfe1Y\xb8\xc1G\x0b/\xbe;\x87\x1f4\xdav\
-\x948Z\x0a\xb35\x1c\xa4\xe2t$\x97\xdc\x8dH\x90\
-\xe5*\xf1\xf8\x88\x9f\xff\x9f\xbbwk\xdalK\xaa\xf3\
-j\x9f\xbaihh\x10\x92\xec\xff\xad\x1bK7R\x84\
-\xc3V\x84\x0d\xf6\xa5\x84\x02I\x048\x14\x81B\xb2%\
-@a,\x10\x92\x00\xd34t\xf7\x86>\xef\xda\xbb\xaa\
-<\x9egd\xce\xb5\xde\xaf\xaa\x1b\xc2\x17v}\xcc\xaa\
-w\xcd\x9c\x99c\x8c\xcc9\xd7\x5c\xeb=|\xa7a\x8f\
-4Kf&E\x9a\x1b\xad\xb3\xd7co\x19\xd6\x1c\x01\
-\xb2[\xf3k?\x01\x00\xf1\xec\xdb\xdf\x98O\x00^\xbc\
-y\xf5#N\xa0;\xa2g\xb2\xe7\x8f3?'\xd9\xb3\
-\x95q\xcf\xed\xec\x9e9\x85n\x90\xbd\x0b\x16\xe0\xc9.\
-X\xe1\x22\x91\xcb\xbfn\x94\x0c\xd8\x11i\xdd\xb6\xb1\x11\
-\xa2\xb9\x99\xafqQ\xf1\x9f\xfc\xa2zXM*^~\
-\xb7\x1b\x84<f\xe3\x83^>\x82`\x15NvL}\
-\x80\xd2b_\xe3\xb9\xa4p\xc0\xe7\xc2\xa4>\xde\xda\xa5\
-\xb1<<\xdds\xf1u\x09\xaa\xfbA\xdeY$\x1a?\
-\xefZ\xb0\x00\x05\xc57\x12\xac\xb87\xc5hV\xa0 \
-D\xf0K\xc2&\xef\x84\x12C\x87\x19a\xf9\xcbN2\
-\xfe\xf8+_\xcb\x1b\x99/\xe57\x07~\x9aQ\x9f\x00\
-xnc^\xc3\xc4\x80a\xbf\x87\xd6[\x04\xbe\x8d6\
-GQ}R\x8f\xc7\x82\x969\xd8\xf5%Q\xcb\x9d\xfa\
-\xb2(\xfd\xe8\x94\x8fW\xa3\x9f\x87\x15+\x8c\xe3\x9e\x81\
-\xf8\xf8\xa6w\x9cT\xa0\xb6\x1d\xfb\xa6\xb1\xb8S\xb8\xe0\
-\xce\xbf\x05\xe10\xf9\x11\xbb\xb6\xf3\xb5/X~\xda\xe6\
-`6\xbc(c\xdctT?\xf6\xbd\x7fR/\xeb\x09\
-\x8e\x0a\xf6\xc6W\x81\x8c\x8f\xc0\xce\x9f\xca\xa2\x9b\xe1f\
->\xeb\xb0\xfc\x0d\x91'\x0d\x09\xe73]\xbd\xf8k\xed\
-\x8c\xc0\x99/nm\xf0\xa7\xb9s\xca\x90\x06(\xbet\
-}\x91\xba\x19\x08N\xd1\xe6o\xf6\x1e\x13\x02\xdfCP\
-\xcdb\x1d\x9c\xdb\xe0;\x7f\x14\xf0\xf6#\xfa\xcd\xdc\xfd\
-\x80~s\xb9\xde\xec\xa1\xf0x\xb2\xe3\x89\xd8\xb5D\xd6\
-\xaf\x114F\xba\x9d\x91\x9fM\xb1\xd0{B\x8d\xf5<\
-Y.\xe3|\xfc\xa1\x0d-c\xfe>\x87?N\xc8\xb3\
-9u\xa1M\xaf\x83 \x91\x00\x00@\x00IDAT\
-\xb3\xe6T\xe7\xe4\x00n\xfd\xf9\x04'\x85p-9\xc5\
-\x88\xb8\x8f\xf1A\xbd\xe1\x00\xe0S\xcax\xb5\xbb2$\
-I\xd3%\xf1\xaaKgsw\xfeL\xd9\x89G\xb1;\
-\x13\xdd\xb2\xaa\xe6\xde$7\x9aqu\x8e]]\x1d\xa6\
-\xda={U\x00\xa2'\xfa\xc6K\xc1]\xc2\x89\x19b\
-\xfe\xd44\xb5&\x13*LnV\xc0\xbe\x05\xe0N4\
-EP6\x140\xbe\xa9a\x0c\xc7\x85i\xce|\xda\xbc\
-\x9f\x00(\x89\xecsm\xef\xf3\x0b\x00\x16\xd7\xfd\xf1\xd7\
-Z\xdc\xd7\xaf\xf3[f\x82\xf4\x94\xc4\xe0\x84\xda\xea\xe4\
-\x84N\x90S{l =\xc1X\xd36L?v7\
-(\xf1\xd9\x0c\x03\xd5\xe3\xa6\xba9\xea|\xe2\xb8\x86H\
-\xb6u\x8ao\xe5\xdf\xa4\x82\xb6\x00\x06\x9d\xd3^,\xd5\
-\x98\xfa\xe5\x8c\xc7\xcd:\xf3\x97\xde<\xfb,\xed\xbbZ\
-7<\xf8\x00b\xef}h\x97\xcd5r0\xdc\xe0z\
-\x09\xf1\x84\xc8\xcd0~ol\xb9G\xc5\xec\x8d(\x98\
-\xb9\x82\xf6\x1dO\xef<\xe1x\xa3\xa2\x18^L\xd0\xef\
-\xc9\x8d\xaay>\xccO\x08\xfc\xcc\x8b\x8f\xf2\x13\x02\x9f\
-\xf1\x13\x02\xaf\xf8f\xa1`2\x17\xd7G\xc2\x5c\xc4r\
-\xb1\xad\x82\xc8\xa9N\x9b)\xe9\xed\xc1\x8b\x97\x94q\xee\
-\x13n+(\x8f/\x87X\x1f7\xa4\x09\xec9\xf1E\
-P\x0a\xe9;+\xf4,\xaau\xcd\x90\xce%\xcfA:\
-5\xe3#\x90\xa6- \xf5\xd2\xa7\xf9\x8e%kB\x8c\
-\xb6\xd8\xbb\xd5\x00\x91\xb9i\x09z\xcah\xa6\xca\x92\xbf\
-q\x18h\xed}\xbf\xa3\xd6B\x88w\xfe2\xa95\x0f\
-~\x1a\xc2\xb5\x86\x85\x8fq\xec\xfej\xe8`3p\x1d\
-9)\xb4\xfd&A\xfc\x8c}\x86\xc1H\xa3\x18\xc57\
-V\xb7\xc7\xa1\x0f\xa9\x81\xc9\xbd\xa8\xea\xedh5\xd0\x1c\
-\xd1\x84:O\x91\x0b\xa8d\xd6\xb4\xdeM4O\x942\
-\x06\xaf4\xf6\xee\x1f\xec<\xf8/\xad\xea\xac\x8b\xfbY\
-\xfc\xa41\xde\xf31n\xe7\xda\xedM..\x8bj\x8f\
-da\xfa\xd0\x8d@\xd6\xaaU\xfa6\xde\xf5o\xc6\x85\
-\xa2\x1f-\xe6\x9b\x13\xc5;}\xff\x02\xdf\x11\xdc9\x15\
-o\x01\xae9\xf5\xd6\x07\xd5'~\xfd\xd1C#!\xae\
-K\xa6@~\x97\x138\xdf\xe7\xb2D\x22\x01\x12\xabK\
-\xa4\x0cX\xe5D\xcf`@q\xa8\x971k\xb0v\xbd\
-]'|T\xbc/R\xefO\xcc\x93d\xf2\x91\x0b\x8d\
-\x1e\xd5r<\xb5\xc4\x81\x8fpo3\xbb\x9e\xb8\xba\x82\
-\xa7,\x90^\xcf\xac\x1f\x84\xe1\xa0\x17\xb2\x99\x80\xcc\x22\
-\xecX\x9c9\x839<\xeaIK'\xfe\xcdy\x01P\
-\xff3>\xbe\xcf/\x00~\xd2\xb2\xba\x0f\x028\xfd\x9b\
-W\xaf\xbe\xeb.\xcaY\xea\xcd{\xfb\x85p\xf2r\x0e\
-=\x97l\x8a\x9c\xe0\x0ev\x0f\x1e\xc0\xc6\xecO\x15\xa3\
-\xc7x7\xfd\xd8\xb3=\xca'\x9c\x7f\xdd\x90\xf4\xb4\x1e\
-WW\xc4\xad\x96\x96\x11\xcc\x14X\xdc\x0cw\x8a\x86\xa7\
-\xe6p7\x07a7/)\xee|s\x02\xccc\x1a\x96\
-\x97\x09nmIg\xfe>)\x05\xe1\xf7\x07\xc0\x0f\xf7\
-\xd4\x16|s\xf6S\x01\xf3B\x07G\x1f\xe0~2P\
-\x5c_$\xf4}\x93\x00\xf9\x05\xb7\xac\xbd\x89\xf8\x82\x04\
-}nD_\xfaJ\xbf9\xf0;\xdf\x8c\x1e\x7f\xb4(\
--O6\xac\x09\x0d\xa5\xf3$\x9aQ\xe7Am\xdb\xf0\
-\xed\xfa\x97\xb07\x0b\xe6b\xce]\x13jf\x8ePs\
-\xb1\xc3\xf3VE\xdc\x98\x81\xda\xc6\xb2\xd2\xf8\x81\x03\xa1\
-\xcf\x91~>L\x810\xc8\xdb\x0do\xe2E\x9aM\x9e\
-@\x19\xe5\xa8X\xd1\x15ot_p\x99+\xf9+q\
-\xf2\x0fh\x94\xa6\xb6S'\xe70\xe74\x1c\xd6\xc1\x96\
-\xfe\x98c\xf0#c\xdc\xa0\xbdQ\xc7\xd7u\xba\xe6\xe5\
-\x1a\xc2\x8a\x96\x93G\x08\xfb]>4'\x04\xecp\x82\
-\x97>aB\xae_\x9c\x9615z\xdf\x8d\xe3a\x9e\
-\x19 Y\xe1{\x1f[2\xbe\xb4\xb5yA\xe2yF\
-4\xfa\xf8\xc9\x1f\xc0e;\x22\x00\xd3\x13\xe6\xc7\xff|\
-\x9d\x9a\x17g\xe9\xfb\x22\x80]<O\x92S\xeb0\xc2\
-\x0c.\x8b\xc3<x\xf8\xd4\x9c\xb1\x1f\xf5\x93Ko\xb4\
-\xa9G\x1b&\x93\xc3\xd7\x07\x91SC\xac\xfc\xc6\x8ch\
-\xe6l\xf0.\x7fphs\x82>\xcc\xf7\x0b\x5c\xd7\x02\
-9\xa1&6\x8b\xc5X\x8a\xcf\xc6\xb1\xf2\xdf\x17\xaf\xd4\
-\x94A\xebmb\x8e\xdd\xa57M\xa4\xc2q\x9fkP\
-Y\xf3\xe0;\x1f\xb5\xcb\x0dX\xdd\x22\xcc\x9b\x15\xe8\xfd\
-\xab\x9c]\xeb\xbe!hF}\xe1\xc3\xe2H\xeb\x0b\xad\
-]\xad*Q<\x16\x98\xce9\x0c\xd7\x1f\x0ek\x9c8\
-59*\x92ux`g`<X\xfa\xdd\xd71\x0d\
-\xf4\xa7&\x0c\x98-\xd3q)\x8b\x8b\xbe\xfc0-z\
-\xf2\xf3\x5c\xf3v#\xed\xb3k\xcf\xf5\x05\xc0\xdb\x0b\xfd\
-\xfa\xb39)9\xd1\x9ci6\x88\xfd@g\x03,\xf1\
-\x84<\xc3g\xe4\x89\xde\x91=\x22`\xee\xfc\xb8\xd8(\
-\xa7\x01<c6\x9a\xcc\xd3\x8b\x83_w\x86 \x86@\
-g`\xc7\xf0\xdb.|\xc6?6\x7fx[#\xb4;\
-N\x99U\xbbt)v+\xb4\x8c\xcd?\xfd\xfe&3\
-n\x86VE\x0auG+]-.\xf6}\xf7\xc0\xfc\
-z\xa1*\x93\x03\x98\xcdt\xbf\x80Q\xad2\xf8\x80z\
-\x07\x8c\xaf\xe3\x0f\xf3\xd7\x04\xbf\xf4\xf3\x7f\xf7\xc5\x17\xdf\
-\xf9\xd6\x8bW_\xbct\xad}\xd2\x0fv\x9f\x14zk\
-\xd8\x1c\xe8Mm\xad\xf8\xca\xec\x04\xa8w2\x9a\x90\xba\
-\x92V\xbdD\xc4\xe4`\xfd\x99\x8fZ9&\xe0\x0d&\
-\x9c\x9d\x07\x18\x95\xe0\xc4\xe6\x9d3f\xdf\xf5U\x97J\
-\xf6\x11\xd3\xe6Z\xcc\x9a\xe0\x90\x8eaN\xf0\xe4\xbf\x05\
-b'\xd4\xf59\x9b\x0dV\xfd+\xe0\xd3\xca\x88\xa1\xe1\
-J\xc0\xd5\x0a\x7f\xec\x12=6\xcd\xd6\xc2z\x90h\xf0\
- \xd0\xd4\x93\xf3\xdf5\xca\xb8\xa9\xc5\xf9V/\xf8\xb6\
-r\xeb\x1b\x1714\x09\xf5\xd01\x94uk\xcfZ\xc6\
-)t\xe0K\xab\xb7y\x5c\x9f\x0b\x05\xb2mj\xb7\x9c\
-\xb5\x89\xa4\xe0\xdd\x8f\x9d\x1f\xce\x9e+k\x8d\xac#9\
-\xe0\xa5\xd4\xc7\x1b\xf3\xfc\xe3+`\xcdn\xb1s.\x84\
-6\x10\xae\xf1,2\xb9\xa8[\xe4n\xd2x\xeao\xa4\
-*\xd8\xe1\x91O<\xb6*\x19y6\xd3\xa7\xe5\x05C\
-\xe3\x9a}\x9eN\xb8\xdb\xb7\xb8\x9e\xebTj\xbehp\
-\xbd\xae\x14\xc3\xfc{\xf3!/\xeb\xaa\xd4\xcf\xf9f\xe4\
-\xd7\xecb3\x87\x90\xba\x0c\x93\x1f8,\x9d\x082\x0f\
-r/\xee\xce!\x90\xff\x15\x88\x99\x81\xf3\xa9\x96/\xa4\
-\xc2\xf3k\xfd\xaa\x12\x9f\x04\x19\xdf5\x9bC\x90\x87\xd6\
-FvR\xe4h*\x0e\xd1\xc3I]\xc6\x5c\x89\xc6)\
-Wo\x8e\x0d:\xf4{\x1e,\xb4Q\xea\xdcw\xf8P\
-\xbc\xbf\x81\x0fIi\x9d\xb1\xed\xe3O\xc2\xe5\xbc\xf9\xe2\
-\xf3|\xb3\xd2\xdf\x8c\xc6Yz\xae\xcdS\x9d\xe2\xed_\
-\xbf|rR\xe2\xf5Ig{O.h6c\x9c\xbb\
-\xdb\xa6\xafo\x96\xc2\x8d\xc3\xe9\x1e|\xad\xee\x1c]F\
-\xb0@\x5c\x9a\x1d\xf5\xb8y\x82\xb9\xb4\x15\xbe\xc6\xd07\
-\x975\x8d\xc0\xddwt\xc0&p\x1f\x9b\x7f|C\xbd\
-\xba\xc9\x1b\x87\xf9\xe7\xa2 \xde1Fn\x0e\xe4\xb2F\
-z\x06y\x8c\x8f\xb7\xb5\xbe\xca&\xce\xcd%\xf9)\x99\
-R\xb9A\xa1\xd3\xaf\xe1\x93\x0b^nZ>b\xef\x0d\
-F|q\x8b\xe5\xdd\xf2\xbe\xe3\xecG\xc9\x97\xa6\x1f\xc5\
-G\xe3\xc5\x87\x1f\xbf\xf8\xe4\xe7\xfe\xce\x8b\x8f\xbe\xf4S\
-\xe6\xe4@Y^\x9e\xe4ed!\xf5\xa5\x82D\xe3\x12\
-\xc3\xa1\xf5\xbafS7\xcb\xb7\xcd\x9bK\xd0\x5c\xe0\x94\
-^6\xaa\xf9\x070\xda\xca\xf3.\x90\x5ci\xb8Y\x0f\
-m\x0e\xd8qVK\xb7>\xd0\xa0\xf6A\xc4\x17\x12\x1a\
-\x17_+\x1a\xa3^\x02\x18Z\x82\x93\x0a\xb2\xe3\xbe[\
-\x89\xedi\xa3\xcf\x1c\x13\xe3\x9fo\xdfy\xc7H,>\
-\xfc\x9e\x13\xb9\xf0\x8b\xdb\x98\xf3\xb6\x00b\xf9\x7f\xec\x8c\
-\xd1\x83\xc7sG\xfc\xe6\xdd\xb81\xd6\xad<J5\xff\
-\xab\xae\xe5\xa9m\xf9\xee\xa1\x80f\xabyCE\x13\x22\
-s\xa7.\xb5\xc9\x83\xb3\xbd\xf1\x8e\x8a%K\x9c\xf8}\
-\xb8\xee`Y\xbfw\xc4\xd02\x0f\xd1r\xb2\x85=W\
-p\xb4e\xf6iw\xbf\x0b\x1f,O\xbd;?jR\
-?=/\xf2\xfa\xb4\xcc>\x07Y\xac\xef\xb0\x93\xacy\
-\xdaS,K\x00\x9bR\xf8\x04F_:\x11\xc6\xe3\x1c\
-\x7f\xabH$~^x\x9e\xb5\x08\xbe\x1f\xdf\xe0\xdf\xdb\
-uq(\xf1\xab{STr)d\xdd\xfd\xad\x81\xd9\
-\xb7\x88\x90\xdc$\xad\x1c\x98\xd7\xadxb\xd5r\xaf0\
-\x0a\x9e\xf9\xe2\x87\x9ah\xeb\xc6?9\x96\x03\x00d\x0f\
-\x22\x0f_v\xe2\xd7\xbd\xa7\xe0\xa2\x14\x86\xd9\xf9N>\
-\x13\x9aQ\xd5\xe1\x86'0X$Z`S\x96\xa0\xc6\
-\xe6\x13\x1a ,\xde\x9c\xd4\xcf\xb1\xf3\xdc\x99y\xcdv\
-\xd0\xecMY\xfc\xda\xe4\x8a\x87\xb6|\xc1\xaf\xf6\xcd\xe6\
-\x84\xec\x9e\xe7\xe1o\xcc'\x00\xaf\xbf\xf8\x91\x9f\x00\xb8\
-\xb99\x17\xd9\xac^D9\x99\xdd\xd0\xf1\xb9y\xf0\xf7\
-\xa4z\xca\xc6\x9es\xde\x13\xdd+w6\xd9\x13\xfe\xa5\
-&}\x0f\x87\x1fi/y\xf36z]k\x06\x8f\xee\
-r\xe9\x0f?\x15X\xb7y\xa8s\xab\x8f\xfd\xa4\xd6\xf2\
-\xc1\xdc\xf8\xc1\xec\xcd\xe9i_|\xf4\x9a \xa4\xcd\x0a\
-\xbf\xb9H\xa1\xd7'\xf2j{\xdb\xc1L\xd0\x8fH1\
-\x11[:7\xa6\xa9\xcd\x0b\x05\x8d\xf9\x06B\x80}w\
-\x9c\x08\xb5q\x0b\xdd\x13S\x15\x00\x15L=\xca\x80\xa3\
-\xb6|\xf4\xff\xc9\xd7\xfe\xce\x8b\x17\xf9\xd5\xc1\xaf~\xc4\
-\x8bn\xe2\xc4z#\xf4\x22\x9e\xbaw\x95(\xc9'[\
-sA\x89'\x0f\xcf9u\x19\xe7@\xacuSN\x7f\
-eo\xb9\x1bs.\x81\xa9\x01\x06\x0eM<J\x9a\xf6\
-\xc7f\x0e\xc7S\xa37\xe7\xc1N=\x8a\x81]\xb0\x85\
-\x05O\x1c'\xbd\x8d5\x0b\x0e,c\xe6\x95u\xe1\xb9\
-Y(\xb1\xb1\xeb\xf3[\xcb\x9c\xa7p\x0e\xd3\xc0q\xfe\
-X\x0b\xb5\x82\xf2K\x03\xb78\xe7\x82\xf5\xf0\x1b\xcd\x9a\
-`j\x89\xd3\x9a`\xe6\xc5\xdf)o\xb4\xf2S\x1c\xd5\
-\xdcy\x02\x9f\x9a\xc9;\xf8\xcef0\xf1\xfb\xc4\x88t\
-\xd8\xbb\xb7\xee5Q\xda\xbesE\x1f\x1d\xd6\xa3\x0a9\
-\x7f\xbb\x97\xf5\xc5\xed9MO\x9b\xfa\x17M\xee\xf5\xa3\
-\xb5\xd3\xab\xbd\xeb\x96~\xd6\xdfu/\xc3\xf5\x1f\xd3n\
-\xb5\xf8\xbc\xa8-3\x88\x89\x7fkld\x8f\xf4f\xb2\
-\xef\x1c\x86\x8a\x9b\xd8\x16\xc43zi\x02\x5cG\xce\x19\
-u\xa1\xcf\xf7\x05`->\x09\xf9\xa6;\xaf\x8d\x9c?\
-\x9e\xf8\xd0\xb2~06\xf4\x93\xc54\xad\xa5\xba\x8d\xaa\
-E\xf5\xc17\xcbT(\x14\xff\xa8D\xa0\xd8\x8c\xc5\x82\
-\xa6\xdd4w<\xe7\x86\xab\x95\xbd\xd9\xdc\xdbW\x9f\x99\
-T\xa1y\xd1\x99\xd9\xb5~\xb4\xcc=\xfe\xd8S\x99n\
-\xb9\x99\xffdO\xcf:\x0c\x85}:|K\xc9\x00m\
-\xeb\x07\x13\xd2\xe3\xb9\x1a\x1fs\xe4\x9f\x00\x04&\xa7b\
-Qx\xf5\x92\xe7\x1aG\x06\x1f\xedq=\x8f\x8es\xf3\
-7\xa2\xbd~\xf9\xc3\xfc\xb9\xb9\xdb\xe6\xdcY\xb1\x1b\xf6\
-\xc1\x09\xc7\xa6m\x8f\xb9\xe72\xa1\xddJb\xf4\x0f_\
-;\xdbky\xf6\x0aV\xca\x1dH\xfe2=\x82!\x9d\
-\xbd\xe2\x8f\xfc\xe1\x5c\xf9\xd9xO\x9b\x02\xc7y\xf2_\
-\x9eK3\xc9\xbai\xe1\xa4Yc\xd47\x7f\xd4\xcb\xcf\
-i\x17\x92l\x89\xe9\xb3p>\xce'T\xfe\xd0\x81 \
-6O\xd4S#\xce\x80y\x8d\xed\xf7\x0c(E~.\
-\xba\xce\xa2\xbc\xea\x15\x9e\xafm\x22\x15\x1e9}\x22\xc7\
-\x11\xdbK57.^\x0b0\x07\xcf\x03\xc5\xc4\xfa\xe4\
-\xab\xbf\xf0\xe2\xe3\x9f\xfe\x1a\xcc\xc3U\x871e\xd0\xa7\
-\xad\xef\x8c\xe5#?\x11\xf2\xde\x80\xdc\x14\x18O\x94H\
-\xf3\xda\xc76\x105\xfat-g\xd5A\xa71\x8ft\
-\xeb}\xe8C\xb8\x8f\x0fn9\xd6\x05\xff\xc7=z>\
-\xb8}\xf2\xbb\x08\x5cYD\x86Oz\xfcw>\xc5\xee\
-\x18\xbb\xb7\xc0\xce\x92\xfa?\xf4\xc9\xa1s\xf1\x9d\xe6\xe2\
-\x89\xdd\xf5\xc4F+=g\x19\xec\x9eY\xc7'o\xe7\
-n\x8c\xba\xc0\x8fV\xcf\xebUo\xdc\xd6\x86\x9f\xdah\
-\xbc\x18\xa9.\xd1j\x15\xd7Q\xbd\xe3\xcf\xc0\x1bVj\
-)&\x1a1\x9a3k\x8d\xcd|\x88\xf3B\x06\xbd\xb9\
-\xc3Y\xd3\xc1Js?\x8bI\x10\x9c/\x12\xe9\xf3`\
-\x1f\xba~\xf6\xf1\x1d\xee\x9cS88\xcd7\xf8\x0cI\
-\xc7ch\xd6#\x06\xdfp\xfa\x02\x16\x04\xd5\x0e\x1a-\
-\x9f\x8d\x86\xb9\x02\x99\xa2\xefc\x19\xf3\xe4\xce\xa6d\xda\
-<\xa3\xe6\x95\x920|5\x08\xa5\xe1G\x9bu\x9aw\
-\xc1\xeb\x0f\x8e\xe5\xdfw\xfc\xa2\xe5\xd6\x8f\xb8\xd3J`\
-\xb5\xda+\xe0\x1cz=\xa1\xcd\xbdC\x05\x83x\xb6\x11\
-k\xbb,f\x0a\xbe\xfa{\x97\x015\xf38\x9cNg\
-\x11U\xda\xba:/b\x0f\x19L\x8dgjH\x07\x82\
-\x11\xf5\x8a\xcd\xa0\xeb2\xb0\x15\xc8\xb0\xb3\x8d#\xffU\
-(\xb1\x91N\xf2\x04^\x7f\x96\xe7\x9a\xb6\x07\x85\x11!\
-\xf2\xd4_\xf4{x|\x0e\x9f\x00\xecbz^~\xcc\
-\x1a\xbey\xf1\xc3\xef}\x873\xe7\x13\x0b\xa0=i\xd8\
-\x9eL|\x98\xc8U\xaa\x1b\xa4\x17\x0b0\x9a|\xc3\x8b\
-\x83t\x09\x94\x19`\x8c\xfd\xfa\xf7\xa3\x8fMG\x10\xcc\
-\xbd\x8f\x03)\x92\x18\x84\xdf\x0dZ\x1f\xc7n\xd4;F\
-\xf8\xed\xd0X\x1d\xad5\xd9\x8e3\xb3Cs\x1d\xd3\xef\
-\xf0&cm\xc5\xf6\xa3\xc1\xd6t\xe7s\xd3G\xd8\xd9\
-\x0cu\x12\xa5#\x04\x9f\x8b\xfa\xcc*\x03\x7f\xf9N\xfa\
-\xfe]\x81]m\xc1\xa3\xd1\x8ew\xb1]?\xe8\xab\xb2\
-\xf9\xd1&\x07~\x172?&\xf8s\xf9\xaa@\xfe\x9a\
-`\xbe/`\xffb\x19J;\xd7}\xd7\x8fOF\x0a\
-\xbce\xb7D\xdf\xf9\xe2W\xbc8\x02\xdc?mN\xaf\
-\x035\xb8\xe1j\x04\x95\xbef\xce\x91\xda\xcbi\x16F\
-\xd25:_#\x8b\xed\x84\x02\xda\xfcE\x9f\x94\x8a\x8f\
-\x02\x9d\xb8\xd1\x8eM\xdbs\xdb\xfc\x10\xd2\xb2FX\x1b\
-\xc3\xe5\x98\x10\x83\xb4\xed\xdd\x99[\x8f\x81\xa9\x05;O\
->\xee>\xf4\x22\xe0\x9a\x90\xd7A\xcf\xcf}wR\xdf\
-,\x08la\xf5\xb5.k\x0c\xc6\xd1\xe4\xec\x95q_\
-?\xa2\xd1\xbeK\xadn\x98\x9e\xdbyw\xd7$9\xa2\
-\xe5I\x19\xfb\x04\x18\xb7N\x93\x22\xcd\xc4\xed1\xa8\xb1\
-\x9a\xad)a\xd3\xdf\xd6/{\x12<\xee{\xfd\x94\xf4\
-\xd0\x92\x87L\xd2'\xe8s\xf7p\x89@\xe1\xd3\xae\xda\
-S\x88\xa0!\xa6\x03\xd4\xbd8\x09J\xe2T(\xbe_\
-?\x07(\x22O\xfa\xfdu\xc2\x18x\xa9 \xd0\x10<\
-M\x82bgb{o\xba\xf6\xeab \xf6L\xc0m\
-\xf9sfw.\x91\xc5t}\x98\xcb\xf8-\x8aZ\x88\
-M\xf6\xda\xd4\xb1\xd5PP\xfe\x1f\x8e!\x1cg^\xf1\
-\xe8\x84\xd1\x95\x82R\x0d^\xbc\xe1s>\xf4\xe8p\xde\
-\xc2\xb8\x96o\xd6C\x1d\xb8\x8b\xa10\x92\x03\x8e)\xb7\
-\xb5\x02\xdd\xf3/\xbb\x09\x0ef\xb2\x03nn\x1d\x0c\x86\
-\x1f\xd3\x96\xfe\xd5\x0f\xbe\xfb\xaeo\x02\x1c\xc0\xf3\xea\x9e\
-\xc3\x0b\x80\xa7+\xca\xa9\xd9v\xec\x97\xdf\xfe\xe3o\xff\
-\xb4'+!N\xd6D\xdcN^ \xd9&\x9e\xc4+\
-\xd8mt$z\xb2\xef\x98l\x12\xa2nJ7a\x82\
-\x87\x8e^\x06\xd2E\x99TM5\x18\x0e?\xe1\x22.\
-\x5c\xa2J\xd1\xb7\x11{\xdb\xe7>M\x9en^\x00\x15\
-\xdf\xcd\xac\xb2\xb2\xd425\xa9\x94\xc3\xe6\xbf\xf1{1\
-\xa7\xaep\xd6\x9eI^9\xe47'\xfaN\x13\xbcv\
-n G\x17\xbb\xef0\xba\x16\xf3\x82`\xaeTj\xc4\
-\xa4\xb5o}\xfd\xa5 \xd8<\xd9D\xd8Z\x90\x8dO\
-tV\xd1\xe9$\x90F^\x1c\x1f~\xe9\xa7_|\xf2\
-\xf3\x1f\xbfx\xf9\x97\x7f\x0e\x18\xaf\x0d\x8e\xe7(\x98I\
-w\x22`\xb66\xcb\x0af\x99\xea\xa2\xee\xcd4\xc0\x82\
-C \x9f)\xec\xd1\xb4~\x8a\xa2Q\xb3:\x1dnN\
-\xe9\xb8\x166\xf8\xf2\xb7\xb6r'Y\x05\xe6\xdd\xaak\
-\xb19\x12\xd9o\x0e\xa3~c}[j\xfe\xfb\x0d\xd6\
-tS\xcf\xd6b\xce\xaa[\xcey\x22`\xdd\x82-n\
-j\x19\x92_\xf7\x86\xc3\x98:\x9cg\xc7\x9e\x9b\x93\x1f\
-P\xda\xf2\xc4\x03\x8f\x1e\x98\xf4\xd2\xc1hw\xa5\x19J\
-\x02\x1f\xff\xce\xa1t0\x9c\xff]\x1f\xc1\xae\xfb\xbd\x94\
-\x10}\xf2\x9bh\xbb\x99\x0f\xe9\xb7&\xfb\x19/\xdfw\
-\xd00\xf47\x1f\x03W# \xf3\x03N\xb3\xc4\x02\x1d\
-W\xaa\xeb\xe6'^\x93\xc8}\x91\xa0\xcf;!\x95\x97\
-\x0d5\xad\xeaS\x08\xbe\x98\xbd\x16bO.\xc8([\
-?Z>\xbb\xc7\xc8\xf3<~^\xd7to\x0c\xd7\x9f\
-\x0e\xe8j!\xb92\xcd\xc2G\x03\xe18\x9f\x98:{\
-\x9d-\xae\xbe\xf0\x89\xa5\x81m\xdd0\xb7\xd5\x03\x06\x9e\
-\xe7?\xbd\xde\xf8:\x87\x0aP\xfd\xd5\xa8w\xb5\x13\xa1\
-\x0e5\xc0\xf2\xe5?\x90\xcb\xabmvq\xf0\xcc\x10\xc5\
-\xf0\x06[\x0fX\x1d\x18\xb6\xaa\x8cw\xf8\xdd\xc3\xa3?\
-\x13\xdc\xeb\xc7<\x09q]\xe1\xa3\x8e\xce\x8bH\xc6\xe0\
-\xf7\xe4\x18N<(\xb1\x954\xd9g\x9f~=?\xa7\
-\xfcc\xdb\x22\x7f,\xe0}\x0a\x5c;\xf5}\xaa\xea\xaf\
-W\xcb.\xb4\xfdg\xff\xe5\xdf^'%'\xd2\x0b&\
-:\xbbe\xae\x93\x08|\xbdM\xe4>Y7\xfd\xf2\x03\
-[\xe4n\x98\xee\x88\xf2\xf6h\x01'\x90\xd1\xf2\x038\
-\xfc\x05\x8b;\x03\x0dk\xb5\x08\x86w~\xb6e\xaf\x98\
-\xc7M\x18\xd4\xb8\xb1TT\xe3\xb6\xa9w\xbc8tN\
-\x8ap\xb6\xae;\xbfkT\x1cX\x9e\xa0\x8bk\x1d\x9d\
-\xa7w\xa5\xd6If\xeeN\xd40xn\x06\x5c6\xfc\
-\xe3\x1d\x8c\xd1\xe4F\xc9\xe7\xd5\x00\xf9\x9e\x00u9\x04\
-\xc35\xc7m\x0b\x9b\xaf\xffr\x83\xed\xd7a]\x8d\xc4\
-\xe3\xa4~2}\xfc\xa5\x17_\xfa\x85\xff&\xbf\x11\xed\
-#\xd7\x80\x10<D\xd0\xa7\x96\xaa\x13\x88\xe5\xdd\xb3~\
-j\xed\xbe@\x8fw~y \x10\xae/]\xc8\xa1\x06\
-8\xea\x9a\xb9\x81\x1d{\xbf\x81\x91y\xa2\xcfc?\x84\
-\xc7\xd6\x1f\x8d{|\xed~\xe3#y\xab}\xfa\xe0/\
-]\xb8\xadK^\xf2\xde\xf5_\x9f\xba\xae\x1c\xc4yl\
--[\xc7\xf2\xcd3\xb5\xbd\xbe\xcfI_h\xd1\xe4\xc1\
-'+[S\xeb\xb9\xeat\xb1\xc1\xef\xdc\xc0\xce\x83/\
-N\xf0\xe8\x9aF\xeb\xd4\xbc>\xe6\xccZf\x9e\xaeq\
-\xf3P'\x8f\xce\x8f\xe8\xfag\x0d\x88\x0f\xde\x18\xba\x8c\
-\xc5\xed:f|\xd6\x0f;\x8f\x83\xb9\xd5\x12\xdf\xea{\
-\xce\xd1\x88\x9e\xe7$!t\xad\xfb\xd6{\xce\xd1\xd2G\
-\xcf\xdeD\xa66\xe5\xd925\x9e\x93/\x7fv\x7f6\
-#x~\x8c\xa2\xeb\x04\xa66\x1c\xaf\x88\x00\xfc\x97_\
-\xee\x93\x02H_I\x7f\x040\x93\x9a'*\xcf#H\
-\x00\x8a\xc6c\xeeb\xd8\xd3\xfc\xc3\xc5\x91\x7f\x05\x0c\x87\
-\x84\xb6\xd4\xcdb\xc9%\x06\xac\xac2\x03\xc2'\xb6\xb8\
-\xeb\xfe\x833\xe7*\xfc\xe6f\x04\xb2\xe8\xabO%\xd6\
-\xa8\x08\xb2\xd3\x82#\xf78\xca*\xdf\xeaM\xb7\xde\xd4\
-y\xb1\x22\x1d?\xff\xf3\xa8\xbfc\x9c\xfc\x83\x8f\xb6\xf7\
-\xb8\xf0\x12=\xec\xde\xd3\xce\xd0\xe5k\xdd(\x95\xaf\xa8\
-\xc32/N\xe2\xd7d\x8f\xf0\xcb\xff\xf2\xbf\x7f+\xe4\
-\x96\xf2v?\xc9\x1e\xba\xc5>8\xdf\x87\xc1s\xfc\x04\
-\x80u{kA_~\xfbO_fs\x7f/'\xec\
-\xab\x00z\xde\x02\x03\xc93\x83}\x99^,\x9c\xeb\xb9\
-\x18\xc4\x12\xa7\xe9\xa7\x8b\xe1\x86\x8do.\xba\x0d\x0e\xed\
-\xc4\xaf\x0d\xb5\x22E\xaa\xb7\x07I\x15\xaf9\xfaI~\
-6\x99\xd8\xf8\xfb\xff\xe83\x19.\xdcnL\xb7\xfb\xb1\
-\x89\x95\xbf\xb9\x19\xcfd\xc3\xd12\xd5\x5c $O\x83\
-\xb3\x9a\xab;\x81,W0\x13\xa7\x18\xfe\x15\x9b\x1b&\
-_C\x8e\xea\xc5\xbf\xea\xaa.\xe1N\xa0\xa9`\xc3\x88\
-\xd2|\xec/\x9f{Y\x00\xc4\x8e\x16\xba\x9b\x0b\x0ee\
-\x10\x8f\x01\xdf\xe7y|\xf9\x09\x81/\x7f\xed\xbf}\xf1\
-\xf2\xbb\x7f\x9e\xbf(\xcc\x8f\x09&\xce:\x04c\x8b-\
-\x99\x01\x22\xd3V\x87\xb9\xb9%\x02s\xa9\x10\xe6\x19/\
-\xcd\xaf\x1d/\xc5\x02\xaa\xe5\x1a%\xdeoh\x8c,\xd8\
-<\xe83\x15\xf3\xa7\xb3\x16\xd7\x0e\x1bG\xda\xcc*F\
-\xe7K\xbc\x02\xa3\xc0XG\xd4\xb6\xb6\xcd\x9dHO'\
-\x98\xd4\x9d\xae\xe8\xbe\xb8b\x0d\xfb]\xe8\x09\x8b\x98x\
-\x80\xfe\xa9\xe3\xc4Y\x1bj\xa4\xc1}\xc8?\x13!\x87\
-y\x88\xa7\x91\xa7h\x00\xb48\xc0\xe4\x9f\x9e\x1c\x9cw\
-#\xf1\xe1\xed9\x90\xea\xa8^\x88\xc5NM\x89y\xbe\
-\xb2\xe6[[W\xa6+e*s\x01\x04\x1be\xe43\
-\xa86G\x00\xe9\xd9\x8e3\xc4E\xeb\x90cZr\xf4\
-\xdce\x1c\x11\x7f\xea n*\xeb\xef\xc2o\x9cu\x84\
-\xc8\x0c`\x9a/\x06\x19\xf7z\xc0?e\x88u\xa0&\
-/F@\xd2:Sp\x8e\xf3\xca\xc0w\x9c\x84\xf6>\
-\xa2\x10\xf9\xf2\xc0\xe7\xc6N\xdc\xef~l\xfe\xfd\xf4\x87\
-\xef\xb0Y\xde\xbd\xc6\xdd\x1e\xed\xc9?\xb5\x91'\xed\xc4\
-\x89\x90\xaa\xc5\x9c\xf3\xea\xb5\x17'<2\xda\x8b\xc1\xb1\
-\xd7\xbb\x85\x8eVm\xafU\x12\x84\xe1\x8cG\x9bQ[\
-E\x06\x8dx\xd7\xe12\xccV6y]a\xfb*\x1c\
-Bp\xadku\xe7\x149\xb9\xd6\x1b6\xf9G\xb1\xd7\
-\x17\xfc\xa9?~\xca\xea\xfe\xa9\x9dc\xe2\xad\x9659\
-\xeb\x10!\xcf9\x9c\xb4\xad\xeb\xe2\xc3\x8b\xee\xeb7\xdf\
-{\xf9\xe97^\x0aR]\xab\xa5\x8f\xf39u\xcf\xed\
-\x05\xc0\x8f[h\xfco\xde\xbc\xfa\xe2\xd3\x0f>\xfe\xd8\
-\x17\x00{\x01\xcc\xf9\xbc\xceI\xceoOt]n\x00\
-\xcd\xdd4\x0c\xd8xsAw\x97\x14\xccnH\x8c\xe8\
-\xb6n\xa0\x8ev31\xba\xdbF\xbb\xafb\x86\xbf6\
-\x1b\x8a\x8d\xe7\xf8]\xf6\x02aM\x0b\xf8\xb2'\x0f\xa1\
-\xd5\xba\xdb\x07;s\x11\x06\xbb\xf5k\xb1P\xfa\xdf\xa1\
-e\xa2\x1c\x06\x03\xaf\xefBv\x1d6T}\xe6R\xad\
-\x99\xcb\x08\xaf\x1f\x9d>\xd9\x1b\xc8\xa1\x17b\xcb\x81\x83\
-?S\xc9\x0d\xf1\xd83\xafF\xc27\x96\xfe\xe3\xfc!\
-\xa1\xaf\xfd\xed\xfc5\xc1O\xf3\xd7\x04\xfbK %1\
-\xe7\x90\x95\xba\xd7?:|\x0d\xb5\x1f\xe1F\xc3;C\
-\x94I6kE\xadS\xc6\xacs\xc6\xc6.\x7fk\xa1\
-\xfa9/\xe6\xf4\xbd\xa1\xa1\xbb\x1f\xc7\xfe1\xa1\x8b\x80\
-7('\xc9\x9a\xf4\x06\x9eY\xeb\xdaL\x96\x0fr\xf3\
-\x07\x1f3\xad\x11\xeb\xd4\x8c\x1f\xf74\xfdj\xe3\xb8\xf6\
-\xabu!\xe0\x8b8\xea\x22\xe3\xd5\x9a\x87qV(\x81\
-\xe6b\xcc\x80\x8e\xfc\x9b\x89s\xb4\xa0>\x0b\xafZ\xab\
-A\xb9{\x15\xeb\xd2\xd0\x9d\x08\xeb\x0a\xa2\x1a\xd7\x1aq\
-v\xc2#\x8d\xa9z>}\x92\x04\x8b\xd3w\xc81\xe5\
-f\x180\xb5;F\xd1\xb9\x8fn\xdc\x8c\xfb\xb5e\xb0\
-\xab\x81?u\xc3#\xbe\xaf\x90\xa2)?/V\xa9\x8d\
-\xc7Y\xfff'\xeb\xe4$^\x9dk]\xaa\x8f?\x91\
-\x00\xf3\x9f\x89\xda\x18\xe0\xc6\x1fC\xffh\x90\x8by\xcc\
-\xee\xbc\xe0\xd9\x1b\xa9\xb3e\xb2\x9e\xfb\xb2\xab2\xd5E\
-\xb6y\x01v\xfeDv\xfd\x1b\xeb:\xb4\x96\xea\x91s\
-puXWq\x97r\xd7\xacc\xcb\xdf\x90TW(\
-Vu\xc7\x95.93?\x96\xfbL\x7f\xe78\x8e\xee\
-\xf3\xf0\x14m\xad\xf0\xa9\xf66\x1d\xe7CT\xffI\xd3\
-y:D\x02M\x93\x85\xea\xf9\x8f\xc6`\x17\x03\xbf\xae\
-\xc9\xc5y\xbf{\x06\x1f\x81z\x9f\xf0-\xea\xcd\x17\xfc\
-\xae\xf2\xbf1\xedl\xfbg0#\xcf\xff\x93:\xf1\x1d\
-\xff\x07/^\xe5\x0f\xcc\x17\xe1\xc6\x9e\x8d\xe0\x86\xe0d\
-f\xdc\xcd\x11\x90\xb8^t\xdd\x16k\xc3\xbf6\x86\x9c\
-Jz\xec;\xe0q\xb0Qz\x05\x95\xb3\x17QF\xfa\
-\xef\xf9\xddR\x93\xff\xe6/?\xc5\x8d\xd6\x84\xe4\xefF\
-n\xfd\xc5`_\xfe\xc9\x93\xbc\xf8z\x03im\xda#\
-f7\xb5\x95_\x0cK\x00\xae\xd8\xda]\xbe\xd1\xea\xc0\
-\xa5Z\x8c|\xe9s\xf9\xca\xe7\x09\x0c\x1d\xb6\x13u\xa2\
-U\x9fcc\xbd\x80[;\xc2<i\x90\x07,\xe3\xda\
-\xf4\x9dK\x5c\x08\xddp\xa2fN\x86\x92\xe3K_\xfb\
-\xc5\x17\x1f\xfd\xd4\xcf:D\xacJ\xa1!\x9c\x81\xef\xde\
-\x18\xc2#\x9e\xbe7%\x13{VJ\x0e<.[p\
-\xd2\xc5\x87\x16'\xba\xdb\xab1c\xf0\x8c}\x02\x02\x0f\
-\x17'\x0d?y\xb5sP c|$`\xec:\x81\
-\xe9z\xd2\x13s\xbd\xf1\x12\x9a\x1e\x0a\xeb|\xcf\xaf$\
-\xf1\xdbCY\xc0\xf8\xda\x19G\xb3\x82\xe9'N\x0ds\
-\xdf\xec\x1a\x990O3\x1b\x0f\x93\x9c\x08\xc0\x7f\xed\xd7\
-\x06b\xd7A$\x92\xc4[\xff\xceW\xbf\xdcb]\x17\
-0\x95\xb2604Rn\x0ez\xfd\xd6\x8a\x7f\x16\xc0\
-\xbe\xaa\x8al}\xe9-\xb9\x22\x15\x8b\xcf\xb9\xa2M\x82\
-\xc9\x892\xe3\x99\x11\x132\x17c\xcf!\xb1\x00\xe0\x16\
-Y\xa2\xf5T\xe9:\x06X?\xb9\xaaI\xaaV\xcb\x0b\
-\x8bZS\x9c5\xf4\x85\xcb\xf8E\xc6\xce%\xe3\x1c\xd5\
-@\xb1\x8f\xbe\xd0\x9e\xb9%\x81\xbf\x0e\xd8\x9eZ[#\
-PjE\x91j\xec\xa9k\xfc*;\x86\x8f\x1f\x8c\xd9\
-\xcc\x03\x8e|\xcbCoq\xad\x83\x5cD3\xc7\xe9\xe5\
-\xe3\x02ls\xe0\x08%_h)\xc8\xba\xc4\xb30b\
-\xf9W=l\x1a\x9e\xe6\xc4`\x8f\xac\x1a\xb5)C\xdd\
-\x11\xc1.\x16\x7f\xf9\x8c\x99,\x9a\xfc#Yc\xcd\xad\
-\x0b\x0c!\xa0\xd89\x8a-\xf9\x88\x96\x1f\xdc\xcc\x13]\
-I\xc3i\x17\xee\xabW|\xa9\x199\x1e?\xa9\xfdu\
-0?\x89\xff\xffI\xec\xb9}\x02p_\x94\xa7'\xe0\
-\xcd\xeb/>\xff\xb3\x8f>\xfe2g\xb18Ob7\
-\xde\xfaf\xcb\xcd\x89\x0fl\xb10\xee\xf6\xed\xfc\xbaW\
-\x88E\x8fM\xdds\x9f^{xk\xd3\x8b\x8d\x7f\xb0\
-^\x08\xf1\xd1\x17\xd6\xfaj\x03o,\x0c1\x8e\xc7&\
-\xd7\x03\x1f\x10\xfai\xd6\xe5\xf0m\xbeq\x12\x8cvs\
-\xc0\xe9\x05s\xf1\xb3\xf5\x9d\x1ajW\xae\xbb}\xf2W\
-\xd4z\x9b=\xc4\x90\xa9\x06\xcc=Wm\x5ch\x1a2\
-7E\x93\xef\xe2gL\xa4\xe9g\xae\x17\xde\xda\x82^\
-\xce\xc0H\xa8\x13\xff\xc7?\xf3\x0b\xf9\x95\x01\xf9\x09\x81\
-\xfcY\xe1~\x9cJ]\xa4\xe0\xddS\x8c`\xedI>\
-\x02\xbe\x8f\x12\x86\x0fg:86n\x12\xacTd&\
-6\x81\x07\x9f\xb1\xe8\x0f\xdbz\x5c\x87\x03\x8e\xc6\xe4\xb7\
-\x1e\x90\x8aZ\xdc\xa2\xe2\xbb^\x87\x1b&o\x1e\xda\xc9\
-O5~=z\x19S\xd3\x96\x0b\xeei\xdb\xfa\x9d\x05\
-\x1a\xd4!\x01\x0f\x8am\xcey\xe3\xa3K\xc4\xb3\xca8\
-@^\x0c\xccWHRj}V\x17M\x9f\xd8u\x99\
-)\xeeV\xd3\xfcV\x1e\xb5\xdb\xf7\x92\xa8M\x06\xa4[\
-I\x19\x1c\xe3\x99\x9c\xe4%\x8715\xe3\xd8X\xbd\xc6\
-\xc5\x95j|M\xa6+\xec\xd0T\x1a\x8d\x09\x9e\xfa\xbb\
-\x1e\xcdE\xde\xd6\xc6Y\xe1{\x03\x1a\xdd9$6u\
-l\x0a\x12\x8d\xfaX\x19\x11\xdcv\xea\xc6\xb1\xc8\x09\xf2\
-:x[N\x86\xd7Z\xc8\xdd\xb7\x09\xa4\xc6\xad@\x18\
-\xf4\xa3\xbdu\xcfy\xb8i\xf7\xba\x0bx65%\xd0\
-\xd4bq\xe2P\x19\x88\xbc\xcefqM\x92\xc8\xf0\xaf\
-'r|\xd5\xba\x8e\xad\x03\xa5S\xdb\x0dcN\xe6$\
-\x81\xc0N\xa0>\xe3\x94t\xfc\x9b\x9d>xODh\
-1\xabU\xdbs,\x0f\xe1&|\xdc?\xc5\xb3\x06\xf0\
-\xb6\xadE\xf6~:3\xd1\xd1\xb7\x0c&\xec\xdcA'\
-\x89\xe3\x98\xaf\xbf\xf8\xc6\xea4 z];\xb1\x1d\xbf\
-\xf7\xfdu\xe7y\xefK=\x05\xb2\xc8O\x17\xda\xf1\x9b\
-/>\xfbS.\x98\xa7\xc1Gx\xa3\xfe\x98\xda\x91\x0c\
-\xc2\xddT\xc7\xddF\xcfvv\x0d\xe3l\xd5\xdd}\x04\
-\xb9\x98\x18\x0f\xb6\x8c!\xbcE\xbf\xf17\xf6\xc0_\xa7\
-YGr|q\x99g\xf0\xeb\xe5\x82\xc4\x7f\xaf\x01\x1f\
-\xad\x98\x83\x14s\xf0\x22\xba\xf9\xcb\x1f\xfd\xf8w\xbaB\
-f^;Ob\xe6\x228\x89\xe4\xdf\xfd\xc4Fe\xe9\
-\xe5\xd7\xfb6\xbf\xb5\x1e\xecE?\xe7\xd3\xba\xd5\xbd\xf2\
-\xef\x13\xee\x87_\xf9\xea\x8b\x8f\x7f\xee\x17+\x227\xf3\
-Z\xb1\xf4\xe0\xbc\x9eY\x8a\xd8\x86\x10\xc4\xbf\x9a\xf8c\
-\x0b\xa1\x87w\x1f\xdf\xec\x98\xd5\x1f\x0dWx\xf8\xc4N\
-\x0e\xecK\x10Q<\xe9\xb9\xf37\xb3u\xcd3\xac\xeb\
-\xc2\xd7\xad\x81,4\xa3\xadc\x9d+\x89\x14\x8d\xb1\x0f\
-j\xc8\x83\xb9\xfbD\x85\x1f!|\xaa4gk\x1a{\
-\xb8\xd5\x9e}\x14|\xc7]+o\x14\x9b\x84\x1c\xe1\x9c\
-\x9bml\xda\x86\x8d%\xd7\xde3}\xf2\xb0\x9eb6\
-+*\xcet\xf4X\x8f\x9d\xb3\xeb\xb7\xc0f;\xf5\xa8\
-\xd2$\xe6\xbd`\xd4\xdeB(\xbf\xc1j2$\x9b\x80\
-\x87\xfa!\xd0\x8c\x9a\x89\x9a\xac-b\xe5U\x8c\xf5<\
-_\xcf\x8f\xeb\xc4\x0cs\xd0P\xcd\xc3\x16a\xad9\xec\
-\x98\xa0\xbe\xf4\xf1\xb9\x8eC\xf5\x5c\x09\x8d\xc3\x85;%\
-\x9f\xb9I\x9f\xda\xb0\xcd\x1b\x0e\xdc>\xf8\x92\x01\xf3\xde\
-}\xd4d\xc6@O\xa9\xc5(\xd0zX\x83p:(\
-_\xedS\xec\x84\xce<\xaf\xf9\xf2B\x01\xddj7\xdf\
-\xd1\x09\xbf{\xef\xd2\xee\xee\x1f\xc2\xc8t};\x8f\x9e\
-\x81\xd6FI\xbcF.\x9bo\x19\xbd\xe6\xa6\x97\xb9\x1a\
--W;\x9a\xb3|\x1b\xb1\xf8\xe2\x08R+\x891\xc8\
-\x93\x9e\x04\xdb\xbc(3X\x9f\xd0|\x81\xe6\xf3\xcf\xee\
-/\x00\x16\x0dj\x91\xeb{\x16\xfds|\x01p_\xd8\
-\x87\x85\x7f\xf32/\x00rR=\x9f\x9c\x117s\xe1\
-w\x1b\x8f\xe7\xdeP\xcf[7C\xb1k\xcb\x19\xe0\x91\
-\x9aq1\xc94\x01\xdd\x0f\xb1\xb9\x98\x96?\xb9v\xd3\
-\xd9'\xb6uYsE\xba1S\x16\xb1\x93\x07\xfe\x8e\
-\xed\xbb\x81\xcb\xef\x8cW\x93\x9e\xb2\xca\x878+2|\
-bx\x8ac\xb0\xfc\xfa\x18\xc6{\xf1'\xbe\xf5\x10+\
-\x7f1\xc3\x1f\xcd\x81\x97?\xbet\xa3\xc7\xc5\xda\x06\xeb\
-\xaaq5\xef\xe7op'\xff)\xd5\xc0\xe1\x17\x96\x1f\
-\x13\xcc\x1f\x12\xcao\x0e\xfc \x7fQ0\xca\xcd\x13\x90\
-\xebb\xd1\xd1\xb6\xd4\x0c\xb6H\x91\x93;\xb6\xe1\xd1[\
-\x8cy&f|\xebI\xbf/2N\x7f\xd3u\xa6\xdc\
-\xb9\x14\x98\x9cp\xc0\xf8\xae\xbf>\x9f(ygM\x0e\
-bc\xeb\xc0\x97G\xcfs\xe3\x8c\xf5M\x9f\xce\xf1\xfa\
-\xe9\xb7\xf6\x9a\xb3\x1fX\x91\x04\xcdG\x1e7B\xfb\xd6\
-\xc4\xda\xe7\xdf\xe4'\xbc\xc2\x98h\x82c^\xe4\xd8\xf8\
-\xde\xde\xe5\x82kT\x0b\x9b{\xa9/J&\xb2\xb5-\
-o\xca\x12o\x1dX\x11'\x87\x8dZ{6\x95n\xad\
-\xe3J\xacu\x04c}\xf1\xa7~\xeb\x9d\xfa\xfd\xbe\x11\
-=S\x7f\xfc\xad?9\xe0\x87\xb2\xb5\xe3\xefM1~\
-\xf4v\xec$\x82\xcf\xe2\x99/\xfe\xd6\x1f\xb6\xcf4\xa8\
-\xa4A\xd86\xaeY\x80N\x81\xed\x10\xdd\x83\x8b\x98;\
-ux;\xff\xd9\xbd\x80[c\x8b\xd4\x06s\xea\x0e\xcf\
-\x90\xbej\xafF\xcbx\xc46MI{=\xab@M\
-\xac\x82\xfd0\x0b\xd6\xbfsn\xdd-\xa6\xd0\x82\xfc\xe9\
-\x0b\xdcy\x5c\xdfr\x8aC\xd5\xf9\xce\x86\xe8\x9b\xa3k\
-\xbc\xcb\xd6u\x04\xd7G\x8a\x90\x87\xd8\xfa\xacUn\xaf\
-'t\xa6\x8a)\xbf\x1c\xd7\x06VS\xabC\xe4T\x82\
-6\x0e \xdd8\x0d\x9e\x9c\xc4\x16P\x5c\xc7\xcd\xe6\x9b\
-\xcc2n\x19\x82\xbb\xda\x8f\xf3_\x88\xf7\xc8\xea^\x7f\
-\x8f\x0a\xfa\x7fY\x0a\x8b\xfe\xe6\xcd\x8f\xbe\xe7'\x00\xab\
-\xc1i\xdcvl.\xb8\xdd\xcd\xbb\x01\x02\xba\xfb\xd6\xf6\
-bX\xec\x0a\xdd\xf8\xe2f\xe3,\x0c_\xf9\xbd\x98V\
-\xabtn\x1e\xc4;\xc2\xde}WW\xb9r\x12 \x7f\
-\xf9C\x98qG\x8d\x9dy)y\xf1\xbd\x10\xc4\x13X\
-\xfem\x9eG\xfb\x16\x0fl\xeb{\xe0O\xc1\xa1L=\
-\xe1h\xc3M\x9b8Y.>\xd7Q/\xd2\xceA\xca\
-\xe1\xab%\x19R\x8d\xc3\xcf\x90y\xc1\xa7-\xbf\xb6.\
-\xe3C[\xba\x01~L\x90\xbf!\xc0O\x0a\xc8W4\
-\x1aH\xa5\xce\x96z\x15o\x1eB\xd4J\xdc\xc2\xd2\xc7\
-'\x85\xd8\xd8\xe9\x9akp>\xe9O\x8dIv\xc5\x16\
-\xa8V\xde\xeb(09\xf3\xce\xbf\xeaU\xe5y\xc5<\
-\xf3\xb5u\xbc\xe0\xbd)\x12\xe8\xf0Z\x8b\xba*\x89=\
-\xf9\xad\x7f\xed\xc1\xec\xfa\x01&\xe4\xcd\xd7\x04\xad\x05\xd3\
-\x14\x09v\x8d\xfd\x9es\xbe\xd39\x05\xe4\xbb\xe4y\x22\
-\x05$\xb0\xc5t\xc8\x5c\x15\x94\xcfhaM\xcd8\xd9\
-\xe4\x85^\xe8T\x85\xde\xc4\xf1 \xbbuc\xbb\xb6\xe3\
-7X\xdfbH\x84\xac\x87\xd1\xedyn\xc0\xba\xa8\x9f\
-\x18/dpG\x93\xb9\xf3\xdfJO\x1f#\x8d#\x08\
-\xe7\x9a\xde\x1fu\x8b\x8f\x9b#\xb9\xbaw\xb8\x1e3\xc8\
-c\xca\x85Q\xb2\xa8jaZC\xa0\x0f\x0b\xc0\x98\xc6\
-vh\x22\xc5\xa9\xdd\xdaH\x94\xd6X\xb4\x92\xd4<\xe8\
-Q?\xf2cc\x00_\x1f\x1a`*{\xf5=\xff\x83\
-E\x9c6e\xde\xe7Q'\xbc\x16\xb1:\xeb\x97\xb6\xbc\
-#\xd2<\xeb\xdeO\x00\xaa\x8f\x0e\xab\xd0\xa7\x17*X\
-\x1c\xb6\xdb\x0bG`\xcc\xc1O\xab\x1c\xa2\xd9\x00\x0c\xe7\
-U\x18#\xe0\x89\xbb\x80\xb1E\xb4\xc4P\x9c\xffh*\
-\x11a\x864x]\x8b\x19THMA\xc3\xd3\x0ey\
-\xd7\xa1c8*\xa0\xf2\xe2\xf5\x0f\xbe{\xff\x04@\xa5\
-\x04\x9e6\xfc\xcf\xa2=\xe7\x17\x00\xbb\xf8g\xb1_}\
-\xff\xd3\xaf_\xab~\xdcq\xc5\xf6j\x89\x99\x93}6\
-\xc3\x809\xe1\x1b\xc60>\x17C\x03\xc4w;]\xfc\
-\xf5\xc8\x1f-`\x17\x7fx\xea\x83f\xd3^\xfcRn\
-\x1b.\xd1\x8d\xbb\x09\x87G)\x97\xe6\xf2g~Ix\
-6\xec\xe1\xb3g\x13\x7f\x8b?\x19\x9dK\xf9\xe8\x02\xb5\
-\xe9\x8f~\x06\xf0y\x18\xcf\x98\xd0\xe2Z\xcbR\xc2\xaf\
-\xd9\x1a\xc7\x06[\xfe\xe0\xd2\xddq\x97\xd6\xdd?\xe4\xc1\
-\xca\xbf\x5c\xc7\xb2\x96\x19Q\xeb\xb6\xb5?\xf8\x88?$\
-\xf4w\xf3\x93\x02\xf9~\x90\xdb\x9c\xd6\x06\xef\x1c\x12\xa3\
-&\x1er3\xa67\x96\x9e\xb6\x9a\x87\x0b\x07\x1c\x13\xb8\
-\xf1\x0f\x96X\x1e6\x85{\x89\xa9\x8c\x7fc\xa3\xcc\x8d\
-\xcc\xb5\xe0\xc9\x0a.9\x0f\xbd\xe3\x8a\xc5?\xc6\xd6K\
-\xef\x03^D6N~\xfc\x0a\x8f\xa6\xd4\x11\xde\xda\xc1\
-7\xff\xec\xd3\xc4-\x83C\xd4\xd0\xa8I\x1d\xa3O\xb1\
-\xf9?\x19\xf4>=OV]\x89\x16H\xf2\xc9\x8d\x0a\
-\x8f\xe5\xa3E\x0dB\xe8\xacwgB\xa2\xda\x1e\xc7\x16\
-\x8e\x0d7\xf5\xb8~\x8c\xb3\xd4\xaa\x03\xee\xf3D\xe9\x8c\
-\xf3\xf0\x05\xc9p\xac\x91\xa4i\xf0\xe1\xed7>\xb2~\
-\xa17Mz\xe9\x1c\xd2\x02\xcdc\x06\xf4<a\x9cq\
-\x82qun\xc4\x18sH\x07\xe5\xfe\xd0\x09\xa4\xffV\
-\x82\xdcb\x13\x97\x0e\xc7\x86?\x83<\xba~\x89\x07\x00\
-\xa6\xd7\xd9\xf2\x8asM\xaa0\xf5 \x12\xeepZ\x8c\
-d\xf9\x8c7\xafy\x80\xdbN\x01\xebHoe\xed\x0d\
-s\x0e0\xa2\x91\x7f\xab\xbd\xa88\xac}\x95\x9c\x86\xc1\
-\xaeT\xcd\xe1{\x0e\xb19\x81WM\x14W\xfe\xac\xee\
-\x14\xdb\xf3\xdf\x15\xd9\x17\x9c\xe0XU\xeb\xc8`\x99\x08\
-\xd4\x9f\xd8N6\x0b\xe2Z)\x0e8Z\xd8\xeb\xe4\xf2\
-\xdd:\x12\xfb\xe2\xfb\xdf\xe49\x06q\x1e\xdb\xd6\xde~\
-\xfd\xef}\xdf\xbb\xd3{_\xe6)p\x17x\xfb\x0d0\
-~\xf3\xd9\x1f\xff\xf6\x1f\xe2`Sp\xda\xed\xf7D\xde\
-\xfc\x9c;c=\xd3n\xce\x83_\x5cb\x17?\xce\x9b\
-?\x81\x8b\x1f\xfb\x5c\x98\xf7\xbc\xf2\xb7\x96\xe5\xa7'\xe7\
-\xf0\x9b\xbe\x1b\x0e\x8d\xad\x89\xde\xf1\xe4tob\x1fz\
-7m\xf7i\xb0\xfa\xef\xfcI3\xfct\xb6\xaeJk\
-\xb2\xd4x\xcd\x95\xbee]yO\xce\x05\x9aet\xa8\
-\xbffk~\xe07p\xf1\x07\xb8\x8e\x0c\x9d\xe7\xb8W\
-\x9e0\xf6\x0d&b\xf3\xd4\xdfQ9c\x8f\x0e\x1d\x9e\
-\xc5\xf1;\x07>\xfe\xd9\xfc\x84\xc0'_\xb9\x16\x83\xb8\
-\x8b>X\x13r\x93\xc9\xda!0mu\xe8\x8f=\x85\
-\xa2o\x8e\xd19\xe3%\xd3\x9f\x89\x84\xcd;\x16\xf5\xab\
-\xe6\xcdh\xb9\x92s\xa8`yw\xbav\xcf/l\xda\
-=\x9fvr\xed\x13\xfabv\xff\x88\xa6\x04x\xf43\
-_t\xc4n\x1d>\xcb\xe7\x9c\xe6\xad\x99~\x09\x05\xcd\
-\xb4\x9d\x92n8\xd6\xbb\xdd\xee\x99\xf5g-1\x03\x06\
-\xafM\xcf \xedF_\x01\xb1\x0d\xe6(0\xe0\xa9\xad\
-\xc5\xb3\xb7e\x1f\xb7\xa3\x15\x9bz\xfa\x9cQl\xdf\xfd\
-s\x9d\xb0>\xf8\xd0D\xd6\xc3I\x87\xb3\xa9\xfa\xa4\xaf\
-T\x8a\xe7\xc6\x88\x7f\x7f\x1e_\x02>\x1f3\x99\xae\xd6\
-.G!Sg\x98E\xb3\x00i\x9d\x16\xe7\xb2c|\
-\xc7\xc65\x92\x9c\x01K5yy\x9a\x15(\xbbE8\
-\x17b\xee\xdf\xc4\x85\x98k\xceI4+\x9b\xf9\x930\
-M\xea\xc9\x07\xb9\xfcE\x0a\x12\x0c(m\x89\x0e\xf0\xed\
-\x03\xab6?\xb1@\x1d<i\x03g\x0eD\x9d\xcb\xda\
-)\x8e\x17U\xbd\xfeZ\x8f\xfb\x16\x95\x90\xe50\x01\xff\
-w\x9d`x\xfe\xd0tr\x9d\x97y\x9b\xc2\x1a\x1c\xa3\
-A\x0d\x95\x98<\xac\x09@\xfc\x0dl~}\xd6\xdcY\
-\x1c\x0c\x13\x81\xc25!'\x831\xf1\x7f\xf6\xc7\xff\xd1\
-\xe7\x18\xf1E\x82\xa6m\xdf\xd139\xbe\xef/\x00\xde\
-\xb5\xa8\xeb{\xab\xff\xee\xef\xfc\xfa7\xf3\x9ba~\xd0\
-\x93<\x9b\xad;\xd3\x8d\xe0\xf9\xf6\xc4\x5c'}\xf7\x07\
-n\xa1q\x0c\xa5\x9b\xc8A6\xd7[\xc0\x9e\xe1-B\
-~\x0e\xbba\x1d'\xa1\xb5D\xe3\xdd|6\xfeaj\
-=\xf0\xe3)\xbf\xba\x02\xe6\x82\xd1\xbe\x0a\xcd\xb0JW\
-\x9e\xce\x11>\xf3>\xfe\xad)\xbe\xa5k\xccD.\x5c\
-W\xeb)\x1f\xef\xf2\x8ah\x8d\xbb<\xdb/h\xb1\xeb\
-\x97\x1f\x8d{\x03\xb3\xeb\xb8\xfd\xf26G\xfd\x1d\xdd\x8f\
-\xe8,\x06{q\xf8\xa8\xfd\xe3\x9f\xcdO\x08\xfcT~\
-5\xc4\x08\xf6\xe6\x042\xd8\xf8\xb8\x09\xed\x9a\xc3\xd9\xfc\
-\xc4\xd5\xc0H3\xb6Ee|p\xf1q\xbb\xb2\x11w\
-\xa2e\x9e\x1f\x8bl\xd4\xe3C\xfexx\xa2\xacX\xf7\
-\x9dZ\x93G\xd5'97\xaf_\xaa\x98\x986Zf\
-\x98\x9e:\xe2\xa8\xc6\xad^\xfd\xf1Z'\xd5\x8c\x1d-\
-\x7f\xa1\x90\xf54\x8b\xf29T\xa3\xb8\x93?|\xb8\xc4\
-\x5cG\xf2\x8f\xa6e$@\x8c\x07\x8dUj\xae\x8e\x8f\
-\x1d\xfdy\x8e\x14u\x08\xa0-`3&LN\x86\xf8\
-\xb5\x1dT0\xc4\x03',,\x86\xcer8\xcf\xcbP\
-\xc7d\xf1\xe0\x04\x12C\xf3\xf6\xa4=\xb37>\xb0\xb1\
-\x99\x19\x8f[\xdb\x5c\xb8b\x9f\xe1\xc2\xe2\x98\x0c\x92\xb0\
-\xc5L>\xe7\xbb\xb9\x8dQ\xbfb\xf6\xac\x195\xe0\xa2\
-\xfe^\xab\xf1e\x80\xceY/9\x1d\x97\x81=\xd34\
-\xb6uTmu\xaaL\x82\xdbL-\xb05T\xab1\
-\x7f:\x00M\x17\xb2:\xdd\xefT\xd9\xd6OTf\x8f\
-\xc4\x8b\xdfh\x17\x7f\xae?|x\xf3/O\xba\x0d\xf9\
-\xf2\xcb\xf9\xf8e\x84\xd4P.\xf9\xaa\xed:6m\xf7\
-O\x02\xe6\x15\x1b\xcb\x98\xaa3\xad\x99\xf3\xf2\xe9\x87?\
-\xc4\xe2x\x95R\xc7|/LjQ\x18|\xfe\x0a\xc0\
-\x7f\xf8\xb5o\x0es\x94\xc0?\xdf\xf6\xbe\xbf\x00\xf8\xab\
-VvO\xc2\xf6y\x17\xf3\xea\x8f$eC\xec\xe6\xec\
-\x05\x92\xb3\xe8f\x1e\x7f\xec\xe3?\xd8\xc54&\x7fb\
-P\xf7\x02[\xde\xbd\x17\xcb\xe6c\xb3\x8cv\xa8\xe6(\
-n\xf87\xbdG~\xe3\xd0\x0f?&\x18t*{\xd5\
-\xc5\xf8m>\xe4\xea\xc8\x8b\xbd\xfd\xe5\x1f\x9e1S\x1d\
-\x8c\xb9\xe5\x17\x03\xe7-\xfe\xf0\x8c\xe5\xb0u0>\xfc\
-\xd8\xf0h\xd3i\xb36x\x1b\xd15|\xec\xbbwy\
-^\xe6'\xb6\xfa\xeb\xad\xc20\xef\x89\x96\xa1//\x02\
-\xbe\xf2\xb3/>\xfa\x99\xafy\xfe\xbc\x95DH-\xe2\
-\x9e\xb3\xbe\xfbS/>b[\xe7V\xb5Or;\xa1\
-\xc50\xf6\x9co1\xb0\x0d\xf6\xdd\xcb$2\xda\xdc\x09\
-\xe6\x9d\xb6\x9c\x88s\xbf_[\xe2\x93\xfcG6\x06\xb2\
-J\xdfz\xeb\xcf\xd8:\x15Z\xc1\xf8\xb6\xf8\xb0\xe4\x12\
-\xcf\x83s\xb3O\xf6R\x12\xf5\xeb\xfe\x84\xd1\xee\xe7\xfe\
-\xe5\xaf\x08u\x05L\x9c\xb6\xd7\x02\x0c_D\x19\x88\x0e\
-\x98\xc9\xcbJ\xf2\xa0\xd17W\x83\xf2\x09\xa1\x0b\xa60\
-\xb1\x02\x03k\xea+ \x9f\xc3\xd4\xb2$\x11\x80\xef1\
-\xf8\xac\x8a\xfe\xc9\x938\xd8\xad\x85xsS\xe7\xd8\xf6\
-\x01\x01\xdc\x89\xc8\xd9l\x19\xc0\xba\xc5\xc4\xe2\x0eW\x14\
-1S3N[\xb7\x13\xa8\xab\x95L\xc8\x09x0(\
-l\xf9#a\xceDY7\xce_\xd7\x1fxm\xa6\xe9\
-(\xfd\xce\x12\x1f\xb3:~\x853^\xfep\xaesi\
-(\xf0\xa9\xc58\x07\xc6]!m\xe77k\x16\xcdF\
-\xf9\xc8\x9eL\x9b\x9fm\x8e\xc3\xb3\xe0\xa9\x01\xd7\x17\x89\
-\xe9%%\x9e\x1e\x05Q\x93\x8a\xb5\xf5_\xf8~n`\
-\x0fgs\xcd\x9c\x9b\xb8\xf9\xb1\xd3\xd4Y{\xf2\xaf\xdf\
-y\x1a\x83/\xfc\xd4\xdc}\x12's\xe3Y\x91\xe9\xc8\
-\xf7\x15A\x95_\xbf\xe6\xb9\xa5\x93*}m\xfag\xd9\
-\x9e\xcb\x0b\x80]\xe8]\xe4\xfb\x82o\xcc>?\xa6\xf1\
-\x87{2\xbb\xb1\xb3i\xf6l{B\xbb\x89\x10Z\xf7\
-e\xccI\x0f\xce\xcd\xc6&a\xd3\x09\xec\x85\x17\x87\x1b\
-N>\x87\xb4\xa3\x13\x9b\x14{\x81\x96\xbe\xfc\xd1>\xe0\
-k\x07\xae\x85\x96\x930?\xa3jo\xfd\xd5\xad\xff$\
-\x05;.j\xa3\x89\x1b\x1f\xe9\x9c\xcb\x13\xff\xc5\x1f \
-\xdd\xd4\xc6\x1c\xb6\xa1\xb8%\xf7\x82h\xe4\xf8\x16H?\
-\x85\xdc\xe8F\xc7\xed\xda,\xfc\xf8\xd6\x11\xf2\xfa\x8e\xeb\
-x\x1a\xb9t\xdf\x81\xdd\x82\x5c\xc1QX_\xfa\x8f\xbe\
-\xfc3/>\xca\x9f\x15f\xb5\xb8\xc6\x99\x14\xeb\x82\xc9\
-\x83\x0b\xa1\xee\xfa\xc8\xb8\x0f\xb1\x19\xd3|\xb7=\xba\xbb\
-/\x868\x02\x80\xa2\xe4w\xff\xb7n\xab%\x17C\xce\
-\x17\xeftb*\x13\xc3\x9a\xa6\x96\xad\xe9\xe4\x0e\x8eV\
-\xa5`\x83\xd3FG\xee-n\xde\x8c\x11OS\x9f\xde\
-\xd1\xba\x13$W\x9c\xd6\x0f\x07\xc2\xe4w\xc4!\xcd\xf8\
-\x11\xa9\x8a\xb56\xaa.:\xc0\xbd\xb1\xa3\x19=\xe7\x89\
-\xcf\x99U[vL\xf8\xe4\xeaf\xc0Fl\x12\xd2\x9f\
-\x98\x02\x04\x0bI/\xd79>Y?i\xebK\xef\x9c\
-\xe0M.EL\x84\x15o\xf3\xe1\xe1\xf6\xcehV\xb5\
-\xd1\x81^\xbe\xab\x86Za\xec$\xc3\x18\xb9\xf1\xddb\
-\xb3v\xdd'\x09O]\x94\xe5\x8f\x13:W\xea\x8d*\
-Oz\xf6\x1d\xb7\xf4\x00G\x834\xf2\x02:\xef\xb4\x13\
-\x83\xe3\xf5.\x8e\xd85;\x5c\xba\xa1\xce\x9c\xaca\x07\
-\xf6\x11\x98\x15\xa0\xdf\x10\xe9\xc8w\xebj\xe3\xeb\xe6\xc9\
-5\xd3\xab\x06\x05\xc0\xab\xe4\x93p<\xfd\xcd\x09YE\
-u&\x1e\xbb\xeb\x8a\x7f9\xb1\xa3\xc9\xf9U\x9e9\xce\
-?\xaf\xcc\xe0\x8c0Wk\x0c*\xb6X\x0e\x07\x1b\x14\
-\x9a,\x0a^\x13\x0b8\xfcYd\xf9\x0a\xac\x08Xi\
-\xf4#.`\x7f\xffCt?\xff\xaco.U/\xba\
-\xa6G\xd8\xfb\xb8\xb9\xdfo\xf3\xb9\xbc\x00x\xd7*>\
-]l\xc7o>\xff\xe1\x1f`\xd0\xdc\x089\x99\xf4\xbb\
-\xf1\xdbO,'xc\xee\x95\xe0vS\x96_\xdc\x85\
-\xb96\xd7]o\xf7\x0b\xben:\xd3w7Ln1\
-\xb39\xdds\x83\xc5\x7f\xaf\xd7:\xa4\x83\x22\xff\xd4\x10\
-\xbb\x9b[\xb7uo\xad\x0f\xfc\x86\x01k=\xf2\xdf\xce\
-\xb5\x5c\xc0\xcei\xf8[\x07q4hU\xac\x8d\xef>\
-\xc6\xbb8\xec{\xec\x9ec+\xc0wa\x8a\xb8\xe3\xae\
-\x18j\xf7\xc8\xdb\xd8\x87\xc4\xaa.\xfe\xb1\xff\xf0\x93\x9f\
-\xca7\x07\xfeb\xfe(\xcbG\xd7\x95\x9a\xa2\x1fs\x91\
-\xaf\xed\x91]\x1f\xd83\xcf\x18\xfc{\xac\xef\xa66@\
-\xd7\x95w\xfdJ\xb0\x870\xd2;~<\xdc}\xd8\xe6\
-K_Jnp\xe4\xe4\xe4\xf8\xb8q3\xeeMr\x14\
-\x88\xc7\x04K~\xbc\xbd]\x83\xca8\xf5(\xeeh\xbe\
-_\x1b\x97\xba*\xc93\xff\xcc\xa3\xd9\xc2U\x0fMr\
-\xec\xbc\xae\x1a\xb7\xaa\x8d\x1c:e'\xd8j0\x8e\x95\
-\x01\x91\xb4\x05O\xfd\x93\xc2\x90\x88\xf5\xcf\xdc\x1a\x18n\
-\xe6\xc4<\xe1\x14\xd6\x0a\xee\xfb\x9a )\x88\xecz\x0d\
-\xdb\xe7\xb5\xa1+\xabV\xac\xed\xd1m;\x86:\xfa\x8e\
-k\x8c3\x86_\x85\xaej\xd0\x0c\xf3xZ\x17:w\
-,0\xcf\xd5\xf0\x199f\xdd\x94\xf4\xb0\x97\xfa\xf1m\
-\xeab:_\xb4i*\x18\x80\xbb:\xcb\xd8^\xe8\x1c\
-Z\x01\x03\xa2P\xbb\xb6\xfdz?~\x94\xfa4\xd9U\
-e\x0cv\x11M\x97\x98\x02\xd1\xf3\xc5\xce\xce4~\x00\
->\x13\xf1rljHW\x1dj\x1cl|]\x81\x81\
-\x018\x8dA\x1e\xf9\xaf\x02\x07\x13\xd3\x0dp\x033\x04\
-\xb9!e\xee\x03\xb1\x88\xed\x1a\xa5\x7f\xf9\xc3?h\x12\
-KC\xe5\xfeP\xe2\x1d\x87\x93\xed\x1d\xb1\xff\xdf]\xcf\
-\xed\x05\xc0.\xf8}\xe1\x1e|\xaf\xbe\xf7\xe9\xefy\x13\
-\xcb\xc9<7\xb3\xec<7\xdfa1\xe6\xe4wS\x8a\
-c\xdb\xdc|\xec\x0c\xfc\xf0\xec\x0f7\xc6\xf8\xe43,\
-\xc8~}\xd5f\xbbN\x5c\xfe\xb5\x17\xe0,\xb6y\x9a\
-\x8b=\x08\xa7\xfc\xda\xea\xc3'8\x8d\x94`h\xf7\x1a\
-\x17\xb1\xda\x8d\xa3\xf8@\x9f\x1c\xba\x87\xdf\x5c\xf5\x14[\
-V\xf5\xe5op\xfa\xb9,g\x8e\x8f\xc1\xad\x03\xef\xea\
-\x14q\x8d\x96\x0f\xe2\xee\x05w\xe7?U\xa8\x0e\xa0A\
-\xb1\x00\xdb\xf4\xed\xf8i\x1f\xa5\x8f?\xc9\x8b\x80\xbf\x9d\
-\x1fq\xeb/\xc1\xf4< \x95\x07h\x15G\xcf.\x07\
-Un\xb9r\xe6\x02\x8e\x97XA#0\x0a\xc6\x08\x17\
-\xe37\x14\xf9\xf5\xcd\xec)\xea\x94\x13[\x19==\xdf\
-S\x03\xf3\xdaz\x84\x8f\xdf\xda\x16c\xe0\xb6n\x09\xca\
-R;)F\x9b\x9b+ut\x9e\xab\x908\x1f\xf3\xcf\
-\x10\x8a\xa6F\xac\xcd\x9f\xf1\xfa\xa9\x12\xdbj\xd1\xf3\xdf\
-5\x9f\xf3\xc9\x04\x1aEu\x9a\xe2(6M\x810\x15\
-\xcdxt\x8c\x11\x84\xbb\xfcM6\x1c\xfc\xf7=M\x8a\
-\x9d\x1b6sw\x9e\x93\xa7\xb4\xd6\xbf~|\x16a\xde\
--\x87\x99\xa4QT\x01j\xe9\xe2\x90f\x1c\xc3w\xbe\
-\x18\xd3\xa8A\x12\x05\x14\xb5\xe5\xe3Vy\xc9@\xf2\x8f\
-Zl\xe9\xack\x16\x83\xedE\xa8\x9ck\xae\xae+\xf5\
-\xe6\xe1\xf5^Pu\xe4T\x8f\xd2\xab\xdd\x8a(\x1a(\
-Y\xf7K:\xd8\xb4\xfa\x09VW\x7fC\xc6\x0bk\xbc\
-\x8e\xb1\xd5[O_N\xaa\x11\x9d\xb3c3\x1f`\xc8\
-\xf9\xa2\xa0\xc9\x8e\xaf\x91\xe6\xadj\xb8\xc18\x7f^\x05\
-\xb8\x1e\x89\xcc\xbe]}5\x0b\xa2\xea\x95\x999w\x08\
-vC\x16pr\xd7?IRY\xc6~\x99k\xceG\
-\x86\xb6\xf8\xd6,?\xf5\xb8.\xf0?\xc8O\x00|\xfb\
-?\x06\x87gWk\xfb\xf2\xaf\xe3\x8f\xf3_\x88\xf7\xc4\
-zn/\x00v\xd9\xf6$\xdc\x17Z\xdf\xe7\x7f\xf6\x9f\
-9I\x9e0.\x18/\x9a\x9c/\xf6\xce\xd9T\xe3\xf7\
-\x82\x89\xff\xc2t\xf3\xbaA\xdc\x94\x17\xaf\xf4n\x18\xb4\
-\xe0\xb0\xbf\xd6\x8f\xa5or\xef\x05{\xc5\xe1PV/\
-\xd0\xb7\xf8\xd6\x049-\x98\xf2\xef\xfa\xb5\xad9\x10\xb5\
-\x04\xd7F\x8f\x5c40[\x1bcb\xdb\xf0\xd3.\xcf\
-\xf2/\x1f\x18`\x8b)\xbd\xa3\xa1\xabQTq\xb7\x14\
-\xd7E4(\x99\x03x\x17\x1f\xd8\xe6B\xf3\x113\x91\
-\x93`\xa3\xf1\xefd&\x8f*O}\xc3\xbb\xd6 \xfa\
-\xf9\x04\x80\x9f\x10\xe0w\x06\xa0\x8e\x22\x8f\xb5]\x5c\xc7\
-=W1\xbdI\xd17\x164\xba\x10\xe83\xf4\xbc\xdc\
-~\xbb\x1f1s\xee;\x7f\xdfq\x03\xbc4\xbc\xf1e\
-\x88\xcb\xf3\x9d\xde\x969\x08\xcb\x80\x144\x9f\x08v.\
-u5w\x93W$6\xf7O\xb8\xac\xcd}O\xd4N\
-<AK_a\xb0pL\xb8F5\x84\x04\xbc\xb5\x00\
-5Rpo\xdc#x0S\xa3\xd0\x08\xa8AN\x1d\
-9\x10\x07\xccC/\xe3\x0c\xd4\xc17\x8d\xf8!\x8d\x1d\
-\xcc\xe5b~\xc8\xa5>$\xf2\xef\xba\x02*\xefx\x08\
-t`\xf8\xb7\xc2\x862\xb4\x9f'w\xca(\xbb}g\
-\x7f\xf3\x8d\x1e\x9e,@\x0ey\xf0\xa4'\x8fz\x8c\xe8\
-\xdez\xba7\xea\xaf/\xe0\xe0Z\x7f*\x0a\xb9\xe7\x1f\
-\x91\x0a\x9c\xfd\xc0\xbeI\x0e\xe7i\x8er\xc1\x11\xc1O\
-\xfcbfh\x13|\xea).\x81\x07\xa0\x0au\x16\xfe\
-\xc4N\xdc'd\xdc`\xd39QrwL\x1d\xac|\
-\xeb\x8do_\x08\x05+\x82\xf3s\xec\xce\xd3\x08P\xfd\
-\xcbg\x9cO\x00$%\x80j\xb8\xe6In\xfe9K\
-y9\xcc\x82;\xaf$\xd8\xba\x0e\xdf\xa4\xcb'\x11\xc2\
-;\xc9\xd8|\xd8@\xd3?\x11\xf2\x09Q0\xb1\x011\
-\xf7\xfc\xff\xd1\xd7\xff\xe0\xf7`\xc8{\xec\xf1\xad\x7f\xc2\
-o\x8d\xd7\xff^\xf5\xcf\xf5\x05\xc0}\x11w\xf1\xed?\
-\xfdw\xbf\xf2\x07o^\xbf\xfe\x9c\x8d\xc1\xa6\xe8)\xef\
-\xc6\xeb\x19\xcaq6\x8f\x22g#u\x13)\xc2F\x18\
-\xfeb\xba\xc12\xba\xfb\xd9\x92?\x91\xdf2\xadc\xf6\
-\xde\x83\xae\xfcb\xc8\xbbe\x81\x11\xd7P\xe7\xf1\xc0?\
-\x81\xb3\xa5\xf1\x0cDn$NC\xf7\x8a]\xf6\xe6[\
-\xe0\x1d\xc3\xa5\xb3\xad\xfe\x1e\xads\x02O\xf9\x8b\x97y\
-/\x80\xc0\x80/\xd5\xab\x8e^;W\xc4\xdc\x87?U\
-\xc9\xbf0w6\xe7\xc4\xc75K\xd7\xc0z&\xaf\xe7\
-\xe9h&\x92W\xfb\x9f|\xf5o\xbd\xf8(\xbf=p\
-Uw\xfe\xf7\xfen3\x87\xde\xce\xae\xf9\xe4\xd5\x84\xb9\
-\xfb\x97\xe5j\x9b\x97C\xc8\xfb\xf5~\xedSf\xf6\xcd\
-\xd4\x82>\xf9y\xac\xbd9\xe3\xf2\xdc\xd3\xdb\xc8\x9f\x87\
-\xf1\x99\x97\xcc\x9b\x80&\xb8\xe8\x0b\x19\x1c\x9d<^\x90\
-\xac\x8d\xc3G\xe7\xb5{\x99\x1e\x1dZ}\x05r\xf4\x06\
-9\xc1\xa5S\x93X\x8fH\x02\x18\x9f\xa4\x19\xa1[\xf7\
-\x89\x0b\xdb\xf37\xd8\xa1\xaa\xb651\x90z\xcb\xed\xbb\
-85\xb3c\x12de\xecO\xfd\x5c\x9f\xca\x0c;O\
-1\xae{\x9d\xde\xfc\xa2\x07\xc6\xc7@\x0f%\xf3\xe87\
-\xfb\x8d\xc7'\xc1\xb5W7}4n\xb2\x0d\xe8\x98\x9a\
-f5\x9d\xcb,\xc0\x99W\xe4\xbc\xde\xc9\xa5T\xcf\xef\
-^\x7f\xfc8\xebi\xe6\x99\x05`\xb6!T\x07_\xf9\
-\x88\xa0cA'\xde\xf9\xb18\xe4*\x00\x10H\xd1\xb7\
-\x1e\xad\xf5\xc5\xdaz\xf1\x99\xba\xf1VU>O\x93\xbc\
-N\xd9\xaf\x96\xc3\xf7\xa93a\xd7\x7f\x16\x97\xae\xf3\x0a\
-\x1bj\x0e|\xf1ie\xf9\xde\x06fa\x8806\x83\
-\xa9\x81\x00f\x11\xadC\x1b\xd3a\x99]\xe7\xe5\xd7\xd7\
-\xc5\xba\xe1\xf6\x5c\xce'a\xd6\xd0\x02[\xdb\x9cP\xf3\
-\x9b\xf1\xcd\xe7?\xf8\xf7\xbf\xf2\x07\xa8\xa6mFiu\
-\x1d\xffm\xf8\xfe\x9b\xb7\xdd\xf5\xfe\x17\xfb\x8e\x0a\xef'\
-\xa2\xf6\xf7\xbe\xfd\xc5\x8bW\x9f\xff'6A/\xac\xb2\
-zC\xc4\x97\xb3\x97\x83\xe7\xda\x93\x8c=\x9b\x84\xed\x17\
-\x9b\xd1\x15\x87\x9fm+'|F\xd8\xd3#x\xf87\
-\xbbq\xb8i\xf1\xe7\xbf\x9a\x1d^\xfc\xfa'\xff\x0d#\
-\x8eC\x1a\xf9\xc4u\xa8}\xfc1\xb6|j[{\xa0\
-vp\x89m[\x1b?m\xb2\x8bY\xfb\xf2>r\xc1\
-\xf7\x22\xa6.Fwd\xc7u^J\xf5n\xd6\x8c\x86\
-xy\xc0\xde\xf1\xb1\xcfD\x06%g0\x9bxg\x05\
-\xf6\xe0\xc9\xc6\x8d\x03l\xb8\x9b\x8b~|\xac'\x18\xda\
-G?\xf3\xf3\xf9k\x82_\xcd\x8d\xa5\xe7V'\xb6X\
-GQ\xb9\xf2\x8a\x1a\xe9\xba\xd1\xe5\x866\xcetE7\
-\x87\xa90\xe3U38\x91\xdb\x07P\xbc\xd56a\x8e\
-`\xf5'~lU8$\xa2<\x88<\x04\xa6\xa3\x94\
-xh\x85d4\x05l\x16\xb4\xd6V\xc3\xdaB \x8f\
-\xcc9L]\xf8\xfcs\xb4\x89b\xfb\xb1;\xb6\x09\xc6\
-\x07&\x99\xcb\xa7\x9e\xb5\x0d\x04\x9b\xde\xb6\x99q\x04\xdd\
-\x22\xdbSy\x05:\x07\xef\xf4\xd1\xa1~\xfc\xab\x99\x9e\
-s\xeb5(>\x9a`\xa9\xdf\x9bz3)o\x16\xb0\
-\xa1\xeb.W{\xd3\x0dG\xa9\xa1\xd2\x9dq\xb4\xef\xf6\
-\x89X\xdfF\xaa\xbe@\xcf\x1csS'\x18\xb0\xd8\x16\
-\x92z\xc9\x1d\xb7\x10{\xe2\xb7<\xa2\xa9\x95l\xfb\xb3\
-\xf0\x00\xe1t\x0dw\x0f\xc7;\x5c\x82\x0e\x00M)\x08\
-d]H&\x99\xdc\x80x\x94\xb9\xdd\x19\x8fH\xa5\xa2\
-C>d\x90>\xba\x8b\xc6\xcb\xefL`\xc6\xec\x85j\
-\x82\xf7\xc1\xda\xb9~\xf1\xdb\xc7\x9f\x9e=\x04\xb2\x9c\xf9\
-\xdd\xfe(\xc5o^\xf3\x8d\x0d\x0f=\x22!\xf5tM\
-\xa6\xc15D\x0eT\xdb\xb6\x168\xba\x0d\x85\xd0\x0cj\
-\x89$\xe8\xb3\xe0\x02\xcdT\x11\xf4I\x1e\xcc\xeb\xcf\xbf\
-\xf8\x83\x97\xdf\xfb\xf4U\x02(\xfd\xb8\x07<b\xcf\xa6\
-=\xc7\x17\x00O\x17\x9f\xc5\xdeE7\xf6\xea\xe5\x0f\x7f\
-g7\x93\x1b\xfel\x8c^\x00l\x83\xd9Rn\x8e\xc5\
-\x02\xf3ba\xa3\xc7v\xbb\x8c-%\xce^@\xd0\xab\
-b\xc2\xd1_\x9b\x106\xcd\x9bU\xcdj\x0eo\xf7!\
-!s\xd2k7/~\xda\xc9\x17\x9b\xf8\x8e\x9b\x1d\x04\
-\xfc\xf6Om\xc6\x9bn\x11O\xc7\xa8^\xf4G[\xfe\
-\x12\xa7o\xde[\xf6$?\xfcw\x14r!/\xeb\xa1\
-\xa8wpLu\xfc\xc3\xbb\x17~l\xce\xd3\xc9\xfe\x0e\
-;\xdc\xc1\x1eJ\x16~\xd7\x90\x18\xfc\x8f\xf8CB?\
-\xdd\x1f\x13$7\x8af\x85\x94GP\xa3\xb3zF\xbb\
-\xf0\xe1\x1bG\xd7\xc2\xcb_\x8ay\xd5@x\xb1\x05Z\
-\xb9\x80\xe6\x83\xcfC\xff\x99\xd7\x13]\xf0\xc6\x82\x12X\
--y\x89\xf5\xc5B\xceIb\xea\xe1[\x5c\x0c\xbf\xf4\
-\x09e\xf2\xda\x0bn\x9e\x93\x7f\xe2z\xefXT3\xde\
-|\xf4\xbbF]\xd7+\xf7\x14\xd0\x9b\xf6j\xc8\x9f\x82\
-\xa6\xb0\xd5X|\xdd\xc5\xec\xb9r\x8d\x9d\xd3\xec\xb7\xe8\
-i\x8d.\xb8\xfecy\x00\xaa\x1a\xdfe\xa3Xo\x8c\
-\x19\xc0\x11\xce<N[\xa58B8\x1c\x07\xd7\xc8g\
-\xa6\x08\x9d\x1a\x09\xe51\x15\x96k\x1d`\x10\xbf\xe9f\
-4\xd3'\x90\x08{C\x8a\xa55\x08~n\xd1\x11(\
-\xbe/6\xd1c\x9e\xceox%\x82\xab\x16\xba\x9e\x1b\
-\x84\x99\xef\xbbZ\x0bKd\xb3K\xc9\xd4J\xe8'\x00\
-K\xee\x8f\x8fV\x06<\xb2\xc9'\xf6\xe2\x8b\xe6\x10\x97\
-\xf5\xc5.:\xbe\xf3\x8cC\x046\xa0\xd6\xdbR\xe2\xdd\
-t+\x89#6\xcf\xc5\x15\x9aut\x9e8q\xa7G\
-\x80\xe1\xce\x1f{\x5c\xeb\x9fW\x10\xc5\xba(a\x9a\x0f\
- \x0f\xf2o\x01\x03\x8b\xcc\xeb\x97\xdf\xffm\x94o\x8f\
-\x98\xb6\x0b\xbc\x9eg\xd4\x9f\xd3\xf1\x1e\xd7\xfcW-\xf0\
-\xfd\xa4h\xbf\xfe\xfe7\xff=\x17\xe5\x12\xe9\x1d\xc7\xe0\
-\xe4\xd6\xdf\xde\x1bG\xce\xfbb\x5c\x076\xd0\x8d\x8fo\
-\xc7gs\xcc&\x91/\xa9\x18LB\xf8\xdb\x9am\xc7\
-\x17\xbfQ\xf7\xdc \x0f&\xe3\x8b\xbe\xfcQ\x9b\xbc\xf5\
-\x067\x5c\xba\xc3\xc1\x1e\x7f\xe1\xbd\xc0p\x9d\xfc\x13\xf7\
-\xc2\xf9\x09\xb6y&\xa7\xfc\xb3\xaa\x1d=&%\xebT\
-f1\xb3\xd67\xbe\x8b3\xf9f\xa1f\x14\x1e\x9c\xc5\
-\xde\xec{\xcd\xb5\x9b\x03{\xd7\x0c\x1e\xf6b\xefv}\
-\xadM{r\x5c\xfc\xdcf\xf3\x13\x02\xfcY\xe17\xf9\
-\xc8u\xd7\x0e\xcd\xd5\xeb\x06az\xc9=\xbf\xdd\xcfz\
-\xfd\xd8\xb2~\xab\xe2\x90:\xfc\xe8\x1f(ctpc\
-\xe6h\xde\x19\xd7\x87\xffz\xe0\xdbyy\xd3\x9b\x98>\
-\xb5\x82`}h\x98!\xf3\x91\xab_V0a\xe6\xc3\
-Z\x08\xc8\x91z\xc4\xe6\xa3Y\xbe\x04 \xed\xe6\xc73\
-5\xee|\xc1\xc0\xa7rm4\xc0\x00E+\x0d?\x8d\
-\x94\xa2\xa6\xd7O}\x8e\x17MO\x04gz\xe2\xb4\xf4\
-\x96\x5c\x91\xc4\x12'\xd7\xc4\x8d!\xa5{\xb0\xcdV\x1c\
-r\xfc\x0b \xe6\xc1u\xf6\xc57\xeb\xcc\xc3\xa4 C\
-\xf7\xa8\x8c\x5c\x86\x07\xe5\xb3\x02\x89\x07\x04\x1a\xdf\x16$\
-9c\xea\x07t\x87\x86\xe2\x8a\xdf\xe0\xbc\x93dJ\xd0\
-w.J\xcao\x9a\x84\x12K\x05\xa4\xe2\xa3\xff\xec\xb3\
-\xdd+\xcb\xe9\x5c\xa9\xa9z\xf4\xe5\xe9\x1a>\x02yP\
-\x19D\x12\x89Z_\x86\xfa\xe8\x89\xd3\xa9\x127\x1c:\
-4\xe2\xcf\x835\x19\xd3/\xa1\x5c\x8a\xf3\xf2d$\x9a\
-\x13\xb1\xdb\x5c\x95I\x8d\xf4\xc1\xa1\xed\xa7\x0aE\xc5\xd9\
-s\xa4D@\xf4d\xeb^'w\xc7\xed3Hl\xd7\
-\x1b\x9b\xff\x88\xea\x0b\xe8\xcc\x97\xf9C\xa2\xb9\x16\xd3S\
-\xc8\x06f\x8er\xf11\x96\xb3\xf9\x19\xc7\x11\xfe\x17\xdf\
-\xfd\xe6\xd3\x17\x00 E\xbf\xa3\x8f\xeby\xb4\xe7\xf0\x02\
-`W\xf2\xbe\xe0\xf8v|?\x09\xfa>\xfb\xe3\xff\xf4\
-\xdb{!\xb5g\x93\xf5\xd2\xde\x1bKw\x0e*9\xfd\
-a\xed\xcd\x95^\x91\xc1\xdfuH\xba{i\x0d\xe2\xe0\
-\xf1/\x16\xdc\xe6S{\xc6\xf8\xd9~\xb61\x88\xcb\x8f\
-s9\xc4\xf1\xdb\xb7;\xe3\x19nz\xb9\xeb[\xce\x9d\
-\xd7X\xe7\xb46\xfd\xd61i\x0c\xfd8\xbb\xc96\xba\
-\xcc\x1f\xa7B\xfc\x09\xb6\x8bc\x8eS\xb8\xf4\xdb\x22l\
-E\x07\x1b\x8dY\xec=7\xa5\x5c\xf9\xf7\x5c\xb2no\
-c\xb9\x91\xb6\x16\xcf\xa9\x8b3\x17\xf6H\x8c\xbc\xeb\x0e\
-\xff\x83O\xbe\x9c\xef\x0b\xc8\x9f\x14\xe6#\xfd\xa9O\xe8\
-\xe8\xb8j\x1b#\xee4g\xae\xbc\xb5Fc\xbf\xa6\xb8\
-%\xe1C\x84\x83\xc6\xd8C\x87m\xf8\xd6\xc7|\x5cA\
-4t6\x976\xe34o\xaa\x89[1\xb8<@\xf9\
-\x07m\x02d\xdaS\x92\xfe~G\xb8T\x83\xe6\xb7\x80\
-\xe6\x80\xcfP\xff\xc0\xe86\xe7\xf6\xf8\xc0\xd0\xc8X?\
-k^\xdfnX\x87\xeb\xdc\xd8\x8d\xf9\x90\x88\xdc\x83\xbd\
-\xef\xe5G\x8d#\xd2\xfa3\x94\x03\x97Z&\xbc\x15\xd5\
-\xc1\xe8\xc6\xdb\x1cS*\xddF\xbbz\x19\xf9D1\x00\
-\xf1\x99\xad\x13^\xe4\xb0\xf0Q\xac1t\x12\x87\x8eC\
-\xe8=\xf7\xfaF7\x00h\x1e\xa9\x9f\x87O\xfcH\xe6\
-%\x9d_Z\x02@\xac\x1c\xf5'\x99s4\x1d<\xe2\
-\xe0L\x1e\xbb\xca\xcbk-\x8b\xa1\xbf7DH\x00\x97\
-\x9en\xeb\xeeG\xfc\xa8\x8d\xa2\xf1\x1e\x98e\xbd\x8c\xfb\
-\xe5!\xfa`\xf3P\x12=j\x03\x96\xd6\xfa5t\x89\
-\xbb\xf9\xf7\xfc?\xe0#Q^k\xeb\x11I\x12\xad\xaa\
-\xa0\xce\x1f\x17y\x01:\x1fp\xcb\x22\x98\xc6\xf0\xa1P\
-\xf0\x99\xb3\xfe\xc0-\x8c\x0c\xcd\xfc\xa3?\xfd\xfd\xdf\x0a\
-\x83l\xefz\xc4\xddJ0n\xcd\xean\xe3\xf7\xce\x9c\
-;\xdd{W\xd7O*hO\xc0bv|\xfa\xbf\xf8\
-7\xbf\xf4\xfby\xab\xf3\xdd\x9e\xe5\xc08\x99\xb4\x9c\xdd\
-}\x92\xf5\x04\x8f\x8f\x8e\xb1\x02\x8b}\x881\x90\xae\x14\
-{d\xf9\xbba\x97\xb6}\x09\x1e\xcf\xce\x90W\x97:\
-\x98\x87\xbf~\xfb\xd6\x0b\xfe\xde\xee\xe3+\xff\x22f\x8e\
-\x0e\xef\xf6\xc6\x1f\xfb\xc3?\xee\x1b\xe7a\x12\x0b\xd8\xec\
-\x83{\xc0$v\x1b\xdf\xcc\x90\x07\xef\x95\xc5\xb0\xe3\xe6\
-\xbfb\xf7q\xbd\x93o\xc5Nz\xa2=\x8f\xab\xcd\x1a\
-\xca_mK^\xbe\x03\xafw\xac\xe6Y\xfc\xc4,?\
-\xe7?\xfc\x0f>\xeaO\x08\xbc\xf8\xf8\xe3-\xb55S\
-?\xfa~g067\xe8\x9b6\xdf\x05e\x98\x03\xb7\
-\x0d;\x01{\x13I\xe48\xb1\x87>\x18\xe9\xb9O\xa5\
-\xb6<\xfan\xbb\x08k\xc6\x97\x7f\xab\xe5\xb2R\xd34\
-\xf4\xc0\x89\xa5Nb\xd3\xdb%.\xda\xc4\xa3#f\x15\
-&?:\x83\xed\x97\x132\x1e-k[\x9d\xc5\xa0\x9a\
-8\x1c2\x90\xcb\x86\xef\x947\x8a'\x18\xc4&\x89y\
-\xc1\xa8\x9fXf\x89SL5\x1d6\xd8|qx\xed\
-\x1c\xcd\xbd~\xa1u\xa5<\x9f\xcaL\x06:\x9f\xd8\x9a\
-S\xcd\xb8Z\x80A\x07\xa4m\x1b\xde\xa9\xf50\xacQ\
-^\x5c\xfeb\x9e\x03\x0d8\xff[[\x9d\x94\xd8%\xcc\
-\x18\xad\xb4\xad\xad\xa3\xf8\xb3\x7f\xf2\xcd\xcb\xfa\x8d\xe5\x19\
-}1\xf4\x14I\xbfZ\xf0P\x9fP?\x022N\xb2\
-\x0b?\xa8AC\xc8\xa3\x13\xbe\xf5\x98\xe5\xf9M\x8f\xae\
-\x91\xea\xae%+\xcb\x88V{\xffnB\xbc\x99\x98\xe7\
-\xcaXj\xbcaL\xc58u9\xff\xc0\xf9\x9e\x06\xcf\
-\x0e\xbe\xc4,H\x7f\xd1\xce\x11\x15|\x05\xa8).\x16\
-\xff\x1a$5\x80b\xed\x09\xf1\xa0\xb9\x065\x97R\xec\
-\xc5o\xe1TC\x8b\x9f\xff\x84\xf3@z%\xde\xbcz\
-\xf5\xdd\xbf\xf8\xcd_\xfe\xfdD\xf8\xa0m\x10\xa7\x8fK\
-\x9b\x9e\xb6\xf1\x8e\xde\xf3\xe3s|\x01\xb0Kz_\xe8\
-\xb5\xdb\xbf|\xf9\xea\xf5\xcb\x1f\xfc\x1b7\x1e\xe8\xd9\xa1\
-\xdd\x88\xdd\xa4\xeb^\x9fc\xa1\xbb!r&g\x93v\
-\xa31\xae\x14Ihn?0\xddA\xf5\xb1q\xb4\x8a\
-\x177\x0exw,\xb1\xcd\x81M+\xb4\xc7{\x9e \
-\xddY\xab\xbdH7\xec[\xccEU\xc1\xd1\x05\x14\xbd\
-\x85l\x8e\xd5\xab\xd4\xf0\xef\x9ccO\xecLd\x14\xce\
-\x989\xde\xf9\xb5\x99\xe7]\xbb\x98\xc4\xc6\x7f\xc6\x01-\
-_\xceh-}\xeb^\xfc\xea\x0a\x1blcY/H\
-\xcb79\xe7\x8az\xa6\x8f]~\xcf\xf9j\xf2c\x82\
-\x9f\xfc\xcc\xdfz\xf1a~L\xd0\x06G\xad\x8crc\
-V\xc2\x03\xd1h\xc4\x96\x1b\x98\xef\xb0\xf3\x96\xfbZW\
-\x10\xd0\xeb\x01\xc7X\xdf\xf4\xe9\x8eoc[\xb7\xb1p\
-\xa0\xb3\x03H\xeb\x8d\x11\x9d8\xcdmm\xad\x81\x8f\xfe\
-\x9b\xe1*Y\xf1\x0aU6x\xf3\xcbC\xf71?\xd0\
-{\xe3Fh\x9e8\xe1mm\xa88N\xdc\xde\xd0X\
-\x93\x03\xf8$\xd5\xc4\xde\xb5j\xe2\xceM\x8c1\xf0\xf3\
-\x9d\xe1\x02\xa0\xb3\x9e$\xe9\xdc\xa8\x87,\xacic\x8c\
-[K S\x0bFk\xf1\xc8\x5c\xf3\x9f\xc5\xc3\x04t\
-\xaf\xbfA\xfc]\x9bXi\x00\xd3\x5c\x80\x9a\xd6`\x92\
-j#\xd6\xda\x1awn1\xf5\xe1\xa2frMN\xe2\
-\xfb\xa8\xabH\xf6\x8d\x0f\xe2|d\xb3\xb9\x99W|\xf0\
-\xd1\xe1\x91#\x07\x11\x89\xd6\x9a\xe0\xe6'^\xacV\xf3\
-\xd7\xccq\x8a\xd9\xa2\xf0\xb3\xa9\xe6\xc1\xe7I \xa8\x0c\
-}\xfeuL$\xb8\xac\xc7|\xe0\xa0\xee\xae\xd8\xa9\xef\
-$N\x04\xb8\xfc\xa2\xf6\xc5\xd2Tm\x8c\xbc[\xb7k\
-C\x0e\x12N[\xacJ\x15\xc4L\xee\x9dG\x80\x9b\x13\
-0\xc1\xbb\xc6\xae'\xf3\x0bN\x080\x17\xb5\xdd\x14:\
-2\xcc\xb7s\x16\xfc\xc5\x0f\xff\xed\x8b<\xa7\xc0x\xf2\
-P\x85C\xda\xad\xe2:\x9e\xc3\xf1\xb9\xbe\x00\xd8\xc5~\
-zBv\xfc\xfa\xf5\xf7?\xfd\xd7^8\x9e\x9a\xc29\
-\xf1\xd7\x8dxN\xfc-.9\x9b\x82\xde}\x96\xc3\xfa\
-\x80\x95\x8f5vM\xf7\xd1\x98\xda\xf2\xc1\xcc\xa6t\x9f\
->\xc1\x9eM\x18?\xf8mw{\xe8\x13/\xa3\xf1;\
-\xea\x91y\x8f\xefV\xd7wOx2\xdet\xeeEn\
-\xdc\x02n\x18Se\xbcX\xfb\x11^\x1f\xdc\xb5\xe1\xaf\
-}\xca\xcc\xfa\x8e\xcf\xfe\xac\xd1\xe4Il\xe3\x9e\xbf'\
-|b\x1b\xa7\x7f\xba\xc6W\xbc7\x95\xc56}\xce\xa7\
-\xfc\x8e\xca\x1f\xdb\xae\xdar\xf2$\xf4\xf1W\x7f\xfe\xc5\
-\x07_\xce_\x13\xa4\x06\xe7\x12\x10_\x97-%GV\
-\xb8769;u\x00\xc1\xcf\xd4\xc4\x9f:\x87+\x04\
-{\xe7\x9f\x9e'Y\xda\xea\x1fN\x1c\x84<\x9f\x04\x19\
-3\x8f\x982\x08:/\xde_\x11\xee\xed\xeb\xc3}!\
-\x22p\xb5\x11\xea\xbe\xa6\xc7\xcbcdc\xb5I\x19\x9e\
-\xf7\xcd\x9b\xdf\x5c\xad\xa6d\xf2\xa7\x017\xb6\xa2\xadN\
-\xdf\xce\x13Pq\xc1\x06't\xeao,\x1e\xd6\x9bp\
-\xce\x01\xad\xf3\xc1\x11{\x9e\xfd\x9d\xfd\xe4E\xc3\x19K\
-\xeb9\x86\x87\xdf\x86\xc1\x5c\xd3\xfbX\xb7\xe7u\x06\x8b\
-\xced\x9b\x1d\xce\xc4X\x80m\xae3\xab\x9c\x16\x9b\x1a\
-\xcfy\xd1\x05;\xf8p,/C\xd3 \xa1M\xbc\xe7\
-N\x07\xec\x00\xfdK\x8c\x86\xf8\x14`\x22#\x80[3\
-\xfdi\xd1\xb3\xaa=d]\xdc\x83\x01\xc0_\xed\xf6O\
-\xf9SLD\xa5\x03\x0f\xdf_G\x1cG\xdf\xa5\xf3\xc9\
-\xfd\xf5B@H\x0e\xec~\xbf\xb3\x1f\x5c\xf2P\x17{\
-\x91F~\xbfk\x1e\x0c\xday\x10\xc9\x88Y\xd6\xe6\x93\
-\xb38\xf1\x9b\xdd\xf3\x09\x0f\x8e\xe0\xf6\xb7\xda\xc4\x92\x88\
-V\xc1\xf4\xd5t\x02\xf2\x08\x10'OlIu\xf93\
-\x8a\x00\x07\xd7\xd3Y\x80\xaa\xfa\xe1\x22;\x83\xd8\x5c?\
-\xf8>\xfb\xce\xb7\xffu\xa3\xaa\xbe\xebS\x00\xc4h\xdb\
-w\xf4\x0c\x8e\xcf\xf5\x05\xc0}\xb1Y\xf4\xfb\xc3\x13\xf4\
-\xa3?\xfe\xdd\xdfdS\xb1o\x08n\x0f\xd1\x1b\xeb\x9c\
-\xaa\xdd\xa4\xc7\x8f\x91\x16\xaa\x9b\x92\xed@\x9bmQ{\
-4\xf5/\x00\xcc\xcd\xb6 7\xa9\x94\x87\xc3C-F\
-Z\xcc\x8d^\xef\xd4\xf8@\xce\xe0v\xd9N\x08\xe0\x9d\
-]\xfb\x91\xfev\xfcp\x98\xec\xbd\xf8wh]\xf1\xe8\
-,v$\xbd\xf1\xac\x0f\xae\xf6d\x1f\xdb5\xa7Z\xc3\
-%\x0e\xbd\xeb\xbc\x83\xe0{~\xca/\x8f\xf3xq\xd6\
-\x9e\xc9?\x9e\xa7\xc0\x88[S\xce\xbcX\xf7\x01\xfc\xbb\
-\xe6\xb2\x17\xcb\xb8+K*\xf9\x81\x7f\xfc\x95\xaf\xf9\xd7\
-\x04\xd5\xb1\x04\x0f%'\x8e\x22\xcb\x97D>\x88N\xa9\
-dg\xba\xa7\xad-<^\xb9\xf4!p\x13\xdd8\xf7\
-Db\x0a\x13\xc3N\xdb\x17\x08\x8e7I\x90\xbb\xfe\xb8\
-\xaeX>\xa6\x8d\x88o~\xee\xfa\x14\x9b\xffG\x13\xdd\
-[n\xf2\x1c\x0d\x0c'\x87s\x19\xdc`\xa9\xc9\x0a\xd5\
-\xf2\x86{\xe3\xdd*>\xbc\xa3\x19\x9cT\xf4(%\xfa\
-[?\x89U\x07\xdc2qmA<G\x1d\xce\xe6\xd0\
-\x95Cy\xa2=\xe7\xf8\xb7]\x1a\xd2\xfb\x04C\xd0<\
-|\x9c]\x9e\xf8\x98g\x84\xc8\x0c\xce\xf9w\x91\x8f3\
-e\xf6\xdf\x1d\xb7K%\xfd\x88\xa5\xe2\x09\x9c}\x11\x00\
-\x18\xd7?1\xc3\xf6!\x11\xf0\xc0L\x1dX\xcc\x9c>\
-m\x10\x9c\x1f\xd7/O\x5c\xf2\x03\xdd<\xc6\xb7\xb0\x0e\
-\xe6\x88\x1e\x85\x01\xc6\x95\xde'\xbe\xbc\x98\xd1\xd5\x8c<\
-\xd9\xf3\x04\x01\xba\x7f\xd9\x0f,\xfay\x0c\x8e1q\xaa\
-$\xd0\x18\xa2}\xa2\xb7&c`h\xd5\xae?\xdc\x90\
-y\xc0\xf7\xfc\x22\x13\x14\xab\xaa\xe5\xb8L\x02\xf5C\x18\
-\x9f\xf3\x07\x0a\x90GV\xd7\x10\xc2\x8c\x13C\x9bn\x9b\
-\x09\xc7C\x9a\x93\x8a\xfa\xe1\x13\xcb\xcb\xa0I\xf3\xf2\x8f\
-\xff\xc3\xfd\x05\xc02\xb6_\xd5g\xd9?\x97\x17\x00,\
-6\xed\xe9\xa2\xef\xf8\xad\xfe/\xfe\xb7\xff\xe1\xffz\xf1\
-\xea\x8b\xafs\xae\xdb\xae-\xe0Mg\xbc^<\xb1=\
-\xe5\x01w\xf3L0\xdd;\xe8n\xd8E\xac~\xf9\xb3\
-\xdf6x\xe37{\xd5\xca\x19[\xec=\x8ac\xb3n\
-/(\xee\x1bg\x13\xdf\xf8\x87\xb7\xb1\xed\x0f\xfd\xd2\xdb\
-y\x97\xde\xfcG\x7fy\xf6\xef\xe6\x94_\xde\xb9\xe1\x0c\
-oc\xf6\xfaf~\xc7\x9e\x9b\xd6\x5ch\xe5\xe7\xc6p\
-\xe7'\xc6x}\xd4\xa9\x0dg\xfc\xf2b\xdb\x0f\x9e3\
-\x00\x0e_\xbar\xce\xfc\x13}\xe07\x8e\xab\xf8\x10\x86\
-\xe7xr~\xc8\x1f\x12\xfa\xca\xcf\xe5\xacp\x83@\x8c\
-\xc3\xddf\xd8\xba\x08\x91WX\xdc\xd6B\x9f\x07\xad\xcc\
-\x9bM\xad\x12Ro\xdd\xbdo\x99\xa8s\x90G\xf0\x86\
-\x13;\xb5\x92\xdbO\x04p&\x019\xc6\x94\x02_:\
-at\x01`\xb7\xd3\xa7\xde\x8c\xf7\x05\x89\x1c\xb4\xe3\xdf\
-\xf3p\xa3\x1f\x01o\xdcp\x0b\x04\x1d{\xd4\xb7f\x13\
-\xec\x9a\x01\x06\x12\x0c0z\x93\xd1]\xe7\xaf\x9f\xb6\xb0\
->\xac\x0d\x9a\xcb\x814\xd4C\xbf\xad\x9f*B\x022\
-\xf1)\xcdt\x09Q\xd6\xb6\x87\x9b\xe0\xcdo|\xc6\xe2\
-s\xe8j\x10\xb9\xd9\x88..\xc6LY\xdf\xda]\xbf\
-p\x9ck\xc1|\xc3\xdf>\xe1\xe01\xc7m\xfe\x8c\x8f\
-\x8f\x94i\xbbd\xe6c\xa0/\xfd\x9e\x04kA\xad\xb1\
-\xadK\xe0\xfa\xa6g.\x22\xa3cY<i\xc7\xb8\xb1\
-}\xc7\x8f\x16\xf5\xe3\xf7\x85\x80\xe7\x03\xc5xb\xabC\
-\xfe\x16\x1b\xd7u\xce\xce\xfe\x87\x9cF\x1e\xf0\xdd\xe4]\
-C\xc7\x89\xf1|\xad\xa4\xb8\x0ev\xdf\xa9\x1d\x0d\xd7\x0f\
->\xcdn\xd8\xe8\x9b?Nl\x12i@\xc2\xc2\x89\x89\
-\x9fG!T\xe00a0\x8c\xcd)?/c^\x7f\
-\xfe\xf5o\xff\xc6?\xfe\xdd\xc0\x7f\xdc;\x7f\x84\xf7\x81\
-\xec\xb3j\x0f{\xff\x19U\xfet\xc1w|?I\xaf\
-_\xfd\xe0/~u\xcecOj&\xe8\xe9\xef\xf9\xd7\
-\xfa\xfb\xf4\x81\x00\x00@\x00IDATf\xcel*\
-\x04h\xb3\x87\xbb\x7f2\x1e\xe8\xf1\x83Y\x1f6\x8d\x1c\
-\x87_\xd7\xc1,\xb6\xf1\x1d\xc9\x1a\xe4\xdbzx\x8a\xbc\
-\xe3\xa3\xb0\x93\x91\xbe\xb1\xcd|\xd3\x5c\xdc\xf6f\xca\xd6\
-^J\xc6\xbd\x90b\xec\x84\xa5\x03\x007@\xfb\xb1\x83\
-\xbb\xd1/\xad\x07~\xf5\x96o?Z{# \xcd5\
-\xbf\xb7\xd3\x8b;\xe9\xb3\x0eS\xc3\xb9\x11H\xbf*y\
-:\xfb{\x1e\xa8[\xc3\xbb\xf9\xabC_\xa5;\x0e/\
-|K\xf8\xf8\xcb\xf9]\x01?\x1fG.\x99\xa1q\xc3\
-\x1a\xd3\x89`\xbbJ\x12&66e\x93a\xeb\xf5\xdd\
-\xfc\xc4\x1e\xde\xd9\x07\xa3&\xeb\x1a\xc3\x0b4\xfd\xf2\xfc\
-\xa4\x00\x1e\xe7C\x0c{%7\xae\xf8\xa8\x15\x97k\xa0\
-\x08b\xc4\xdb\x13\x5c\x1d0\xd8\xc4\xe4\x8e\x9d\xaemx\
-G&^\xe76\x02\xc7\x0e\xc0\x1b\xb7\xac\x0c\x96\x80z\
-4\x1e\x1a9M\x0a\x09{*\x18\xdf\x81\xc7\xa8\x8b\xd9\
-\x8f\x06>8\xe3\x81\x8aM\xc3\x06U\x16\xfd\x95\xf7\xd8\
-K\x94\x01\xb8\x8c\x1d\xda_\x05\x00p=\xe9+G\x12\
-2l\xd6\xdaRf\x01\xdckc\x9b\x8e\xa0\xa5\xb4\xdf\
-\x9a\xf9\x1a\xbfs\xd1Q\xfb@\xd1\x97C:jh>\
-\x5c\xc0\x8d\xc5\xdf:\xea\xb8\xd6q\x89\xce\xa6\x07\x84m\
-\xe9\x15\xd8\xe1\xe4\xa9|\x11G\x97!\xb9=\xce\xa7\x00\
-]I\xcf\xfb\xaeA\x00\xa8\xef\x13\xfe\xee?\x8b4F\
-\xbc\xd7\x8b8\xb0g}\x92\x18;\xff\xc7\xa5\x16IU\
-ujcC\x8e\xd79O\xbdNE\x8c\xa1\x1e6\x09\
-J\xfcg\x02\x186\xfa\xeb\xec1\x05k\xf1\xc5\x0a\x80\
-\xe4\x02?\xfa\xcb|\xf5\xdd\xbf\xfc\xe7\x12\x1b\xb9?\xbf\
-\x80\xdc\x07\x02\xb4a\xbfe\xebx\x1f\x0f\xde_\xde\xc7\
-\xc2\xfe\x9a5\xed\x09\xa0\xbf\x9f\x1c\xed\x97\x7f\xf2{\xbf\
-\xfa\xb0\xe7s\x82%\xcci\xa2s[\xdcA\xc7\xd7\x0a\
-\x06\xea\xc0\xfd\x14\xeb\xee#P\xfa\xa3\xb7\xa3\xddp\x1d\
-\x91\xabm\xb1\x8b\x8a\xf7I\x0dF\xd6g\x7f\xb1\x0f\xf6\
-\xe6\xefM`\xf5\xe9\x93{\xf8\xe7\x06\xb1\x17\xc3]w\
-&\xb5\xd8s\xc1\x04\xb3>{p\x0f\xd8\xde\xb8\xea[\
-\xec#\xa6\xfc\xc6\xbc\xb8\xee\xfc\xd8\xc4{\xd1]\xfc\xbd\
-h\x89\xc9\x9f\xbe\xe9\xa3\x7f\xc6\x17\xff`\x032\xc5h\
-\x07\xaa\x86y\xb2\x22\xf7\x5c\xe0\xf4\xdf\xb0\xc4\xe3\x16\xa7\
-&\xabh\xbe\xae\xca\x87\x9f|)\xbf9\xf0\x17\x82\xf1\
-[\xa1\x12\xcc\x7f\xa6\x1c\x9c\xad\xa2\x8e9\x7f\x9e\xc3\x09\
-\xd1\xa9=~l\xe3\x93smo\xb0\xe8\x10\x8f\xb3\x1a\
-\x1dS\x1fO\xd6\xa7\xee`&R\xf0\x8c\xfbqm#\
-\x8a\x8c\xd8\xce\x8f\xa1k\x81\x91\xe6\xa7\x07\x9b3\xbd/\
-,\xe2\xa7\x96\xe6\xaf]\xc8TD\x1d\x90s\xe8\xaa1\
-\x98\x06\x90\xa0\x80\xb13\x94ol\xce\xfb\x0d\xce\xbb}\
-\x94\xa8\xb7z9\xff+\xc2T\xf0\x87\xab\x09\x02\xc3\x86\
-M-$k\x14w-\x0bp\x09\xee\xe7\xc9\x0c\xb9\xf1\
-7:`H\xab\xe1\x93n\xe2\x9c\x00|\xf4\xe6>I\
-\xa9\xe0bh\xdeb\x98\xd28\x08\xcb\xa1uR7_\
-\xef?\xbf\xe27c\xe1\xe0\x98G\xfaj\x93\x9f\xd4D\
-+\xe37\x072N\xc0\xf3'\xe7\xc2#\x04\xa7\x8aC\
-\xda9\xd1\x93\x1c\x90Oz]\xb3\xd5a5\xfaK\x7f\
-x\xd1\xd9sk\xfe\xf8'\x0d\xccM\xd0\x14\x00\x90\x03\
-\xcf\x9a\x09\xa46\xcc\xfd\x97\xf3\xba\xa1\x04\xd00\x17s\
-\xed\xa0>\xec\x89\xe9\xc0v2\x88^\x9c\xc6\x9ac\x02\
-v\xbd\xfdG\x84:\xd02-\xdc\x19\xdb\x13/\xdc\xa5\
-\xc0\x87C\x1f\xf6\x0c\xa9-N\xf2\xff\xe8\xeb\xbf\xfb\xab\
-\xf1\xfa|\x92~\x04O\x0f\x836\xe4\xb7l\x1d\xef\xf3\
-\xe19\xbf\x00xz2v\xbc'\xeb\xf5\xb7~\xfd\x1f\
-\xfe\x1f/^\xbf\xfa\xd6\x9c\xf3\xd9P=\x1d\xdd\x00\x8f\
-g\xee\xe0\x9e\x9c\xb1\xe3\xbf\x9d\xe6\xf5]\xd0n\xeew\
-+\x16}\xd1\x97\xbd}TNA\x17\xea\xf86\xb6\xc9\
-v\xbc\xfd\x8d>w\x00<\xa1W\x7f\xfbS\xdb\xf2\xb6\
-\x17]\xf1s\xd1%\xb6\xbc\xedW{i\xc7\xdf+H\
-\x01\xf9\xb9p\x885\xbe}\xc2^\xd0s\xbd\x91s\xa7\
-\x7f\x0c \xb9=\x1c~A\xab\xa3\xf6\x0d\xfb\x0e\xba)\
-\xcao\x9eSG\xc0\x8f\xfces\xa9_\xcdMd\xfe\
-\xfaH\xd7\xfc\xe5\xf3c\x82\x1f}\xf5\x17\xf2\xcd\x01\x9f\
-\x94\x17\xc2y\xf7m\xb9\xdc<&\xf7%{\xac}\xb7\
-M\xa1{\xcf$h\x0d\x9bw\xb6\x80\xb97\x96^w\
-0.\x1c\x84\x00\x98\xd3}^`\x86\xde\xbaw\xbd\xa6\
-'\xb6\xf3\xa5_\xfc\xf94\x01\xbd\xc1\xf66\xd8<\xad\
-\x0f|,\xe2\xd6\x8a\x9d8*\xa7o\x0c\xef&\xda\x12\
-\xe4N\xfd\xd6\xa1\x8eR\xd6Z\x1fjZ\xa1\xa3\xaf\xf0\
-\xe9\x1b\xe1Xy\xacE\xeb\x94\xd3\xe0~\xdd\x1a\x89Q\
-1\xe0\x19\xca\xb3\xcf\xf1E@\xc5\xf8\xcc\xed\x00\x12\x08\
-\xf6oo\x93\xad\xab\xda\xbe\xeb\xb5~\xce\x01\xd0D\xed\
-;\xb6\x0c\x13\x9f,!^\x18l\x22pH\xd7=\x16\
-_8\xf8\x9a7\xc7\xb9C[\x8aX\xd1\x00\xd2TH\
-\xb7>\xf8\x8d\x9c\xb0\x86\x82u\xb9\xe9\x02\x0a\xb0+\x90\
-\xaf\xf4\x0f\x7fQ|\xed\x1f\x99\x22\x98?\xd4\xfe\xe8_\
-\xad\x13aF\x9d7k7\x9a^\x7f\xc3\x87\xd7\xff\xe9\
-\x93\x00\xbcs\x8d\x8d\xac/\x02b\xf1\x0fO\xe7\xdfJ\
-\xba&\xf8\x8dt\xa1\xba\xc8\xb5\x1b\xaa\x08\x0b%MU\
-9\xcd\x10\xcd\xe3\x8f\x1b;\x10;\xa1\xad\x9fIv\xdd\
-o2/\xde|\xeb[\xff\xf2\x1f\xfe\xbba\x9d\xe7\x95\
-\x19#\xb1\x8f\x98\xcd\x8e\xf1\x9c\xdasz\x01\xc0b\xbf\
-\xab\xedI\xb8\xf7=Y\xfc8\xe0\x0f\xbe\xf3/\x96\xb8\
-\xfb\x05\x11\xf7\xd1\x13\xb5\xc5\xe1~\xc0>\xe0\x8a\xbac\
-\xf7\xdc\xd7wg.\xf1\x86\xde]\xb6!\xfa\xbb\xcf\xab\
-m\xf1\xd3\x1b\xaf\xed\xcd^\xee\x85\xa9o\xf2\xc2_\xbd\
-{\xaf\xcd&\xbfk6\xb7\xbe\xc9{\xdd\x80\x90\x01\xcb\
-\x05\x92\x9e\x87\x17\x09\xbeG\x1d\xe2\xa5\xf7\xe2\x06A[\
-\x1e\xbd\xf6\xf2-\xf1\xd2y\xca/\xbb)\x97[L\xf3\
-2\xd3\xbb\x9e\xa5\x8d\xaf7\x0d\x14\x82\x1d_5(\xff\
-\xaa\xfb\xd2\x8b\x16\xf0\xb4\xfaj\xc3\xaf\xaf~\xab\x95\x1f\
-on6\x1f\xe5\x9b\x03\xf9\xc5A\xa7QD\xdaj\xad\
-m\xadFr\x08\xff\xbc\xdb\x8e\xfd\xb0\xc9\x18\xe3\x18\x1d\
-\x174b\xdcT\x9dk\xa2^\xac\xe0XO\xdeE*\
-\x99c|\xd84\xe7?\xe3\xe5m_\x04\xf4\xf03\xd8\
-Z\x97\xeb\x18\xfdi\xcd`\xbazH\x15\xeb\xe8\x8dN\
-\x85\x86\xf7\xa4\xfe\x87)\xa1b\xfd\x8a\x846\x1c\xbb\x1c\
-\xd4K\xdf\xff\x89\x17q\xf2A/u\x22\xe5\xe0\xb3\xad\
-1\x13\xe3\x9b\xb8h\xdc\x0cB\x90\x5cW\xf7\xc6\xba\x0d\
-\xc9%\xdf\x88\xac\x96U,k\x9c\x0c\xf3\xb8\xd7\xd5\xca\
-p_X\xe2d\x12\xc7\xbad\xdf8\x86\x0elS\xad\
-\xac\xd4p\xeec\x9eX\xf1\x0f\x9e\xfa\xce\xd9\xcb3\x9b\
-\xb1\x15:}\xf0\xa7\x8dX\xc6X\xfb\xb1w\x7f^\x04\
--\xbc\x9d5\xba;\x7f\xb1\x9bi\xea\xf2\x1bJ\x83\x00\
-\xc7\x9c\xfa\xe4=\xd30\x8d+\xdd\xcc\x19O\xc9\xd6\xa8\
-D\xeam\xfd\xc4\xe2\xd1Yx\x07\xf5)e\x01\x05\x9c\
-u\xde\xc0\xf2X\x9b\xa5\xdb\x97\xaf)6\xe3\xf4\xc5t\
-\xa6\x0b3=\x13p\xb1g\xd6p\x04\x17\xfb\xc5\xf7\xbe\
-\xfd/_|\xfe\xf9\x17\xf1>}\xf2\xdf1\xe8}(\
-\xfd\xdc\x0e\xcf\xe9\x05\xc0\xae\xed}\xc1=]\x13\xc0\xe6\
-\xc4\xec\xc9\xd1~\xf9\x8d\xdf\xfb\xe7\xe7\x82Z\x85C\xb8\
-\xe8\xee\x17\xfd\xf5]\x91\xd9\xe0\x87{!\xe7\xeaKd\
-/\x9b\x98\xbd\x22\x0f\xba\xc6\x8ds3\x0fv\x0b\x04,\
-\x7fA\xd3\xcf&%\xbc\x11\xac^\x18\xc9}\xe3\xeb\xdb\
-\xf1\xbd_\x1b\x11Z\xc6\x8b\xbd\xf8\xf5u\x9c\x8b@\xce\
-\xe8_\x89\x87\xfe\x94\x1f\xc0h\xca\xcb<\xec\xe3\xa3\x7f\
-\xa4\xd7G~Rl\x1e\x06\xebk\x0f\xae\xf1\x07\xfe\xf8\
-\xc48\x15\x1d\xea\xac\xef\xf07n\xd5=\xabh\x91\x13\
-\x0c\xcd\xfa2&\xd7\xb8N\x1d\x1b\x17\xb8A8\xb9\x1b\
-~\x98o\x0c\xe4\xaf\x09\xd2PR\xd7\x81\xb7\xb73\xe7\
-\xf5\xef\x9eb\xbc\xed\xd8\x06s\xa0.\x82\x1c\xa6 \xd7\
-'v\xff\x92\xdd0\x89\xa5\x89\x1d\xd7\xe2\x99D\xe9\xa3\
-\x1e,\x96>\xb03\xc6'\x22\xe3\xf3\xc9\x84\xba\xe5i\
-\x06\xd1\xd1\x0a\xdc\xc6\xea$* \xea\x87\x1b\xc7&k\
-!\xc6\xf6\xdcPBk\xb8\xf6\x18\x15{\x1e \xf2\x1f\
-\xd9\xe8\x95~\xd5\x7fq\xb5\xc4\xd4W\xde\xb1c\xf4\x09\
-k_8\xc5\xa1\xa8\x08K\xde\xa1\xea\x0c\xf0\xda\xe5\x90\
-5\xd4\xdfE\x80\xec?\xcf\x05\x12@\x99\x7f\xdf^\xba\
-o\x80\x96\x03\xbd\xf3Q%\x858\x17\xf7\x8f\xa0\xd6\x9d\
-\x92Wo\xf1(\x08#E\xa0\xe4\xed\xef\x05`\xc0j\
-\xac\x9fqu\xf57d\xbc\xb0\xc6\xeb\x18{j\xc5g\
-\x9d\xab\x97\xd1\xf1\x0d\x86\x9b\xe7|\xa1\xcb\x18\x87\xd6E\
-\x22\xd8U\xf0\x1b4C_o\xa5\xeah\xfd\x17\xf6L\
-?`\xd9\x81\x9d\xf9\x9b\x05\xc7\xccR\xc1\x0c&\x9b\xba\
-\x08\xe8*\x8e\xb7\xf6\xcb\x97u;\x1f%\xae\x18\x22]\
-\xd7\xad\x89qm\x91\xb3\x12\xc2\xccH\xaa\xcf\xbf\xf1\x9f\
-\xf9\xf8\x9fJx\xec\xf3\xca\x8e\xb7O\xe8\xadF\xecY\
-\xb4\xe7\xf8\x02`\x17v\x17yO\xc4\xbd\xdf\x93\xf5\xfa\
-/\x7f\xe3\x7f\xfc\xcd\xd7_\xbc\xfa\xf6l\xab\xee\x9fU\
-\xb8\x8dV\x8c\x1d\xd6m\xb7\xa0\xdeL\xcfU\xb9n\xf6\
-\xc4m\x07\x1d\xfe\xcd'\xb4W\x8d7\x84RG\xdd\xcd\
-\xfc\x98i7\xf1IA\x8e\xa7\xfc\xd5\x8f\xffa\xf3C\
-z\xf0u\xbcOr\xed\x97\x939\x1d\xecc\x8eK\x93\
-\x0b\xa6\xb8\x91\xbe\xe9\xdf\xf8\x0f\x18\xf4A\xa7\xc5\xb8\xf8\
-]\xc3\x93s8\xe4\x8a).G\xfb\xd2\xb98\x97\x1f\
--\xf0v\xad\x7f9\xe4Z\xbf\x18\x02\xb4\x04\x0e?C\
-\xf2\xd2\xe8\xf4\x8f\x0f>\xcdx\x82\x17}\xf9\xb78\xb8\
-<\xe0\xd3\xd4b\x9c\xbf$\xc8_\x13\x5c]\x83\xe4\x07\
-3\x0f|>\xc1N\x82V\x83\x17L\x90h*\x9bC\
-\x82\x5c\x94\xe6\xb9\xe3MX]\x89s\x80&\x95\xf1`\
-0\xf1\x99'\xbec\x13\xb85?] \xf7\x1d\x83\xc6\
-\xb6\x98\x8e\x80\x1c_,\x04y\xe8e\x9c\x81:\xeb\x9f\
-\xfe\x90\x80\x16\xf7\xd4\xe5\x9e\x88\x0e3\xebYVXy\
-\xc7C\x90\xae\x97x\x9d\x1e\x0b\x8f\x0b~\xcb\x98\xe2,\
-b\x7f\xc4\xaf\xab\x90\xc8\xea\x11\xf5I\x1fj\xa2\xea$\
-\xb8\xf3\x8f\xa3\xf5\x04Xe\x8c\xf1\x05<P\xdeQs\
-\xae<\xffjs\xd8\xf1\x82V!\xe3]\xa7Q\xea\xde\
-\x5c\xbc)\xa0\x1f\x9c\xe5 CB\x1a\xb11k0\x88\
-\x13\xbf\xedn'\xb6\x13N\xef*w\xa2\x97\x84\x1cp\
-\xcd\xe1|\xe2c\x0f\x8e\xb2\x88\x1eZ\xe7j\xa2\xe8\xda\
-%Hzk\x844\x8d\xda\xf5\x99\xbb\xe7\x18\xd1\xbe\xd6\
-j\xc1\xce\x9f\x92\xadKB\xd9\x0a\x9aa\xc4\x11.\xc7\
-\xca\x10\xc1\xd5\x8d\x91\x88\x84\x0c\x07\xe3\x10@ZC\x9a\
-\xf5\xccq\xce5\xa9\x87\x95\xda\xc6z\xf3\xc5\xb7\xff\xec\
-\xd7\xfe{~\xfc\xcf7\x92\xe9!\xddm\xf5\xc6\x8fM\
-\xbc\xc2\x8c\x9eI{\xce/\x00X\xe2]\xf4{\xbf'\
-\xc9\x17\x01\x9f\x7f\xff/^\xbe\xfe\xce7\xff\x97=\xc5\
-\xf73\xb4'\xfd\xe9y\x133\x9bcy^\xb8\x0f'\
-\xb5[N\x97\xd8\xbbr6\xee\xf2gC\x9d\x0d\xbe\x1a\
-\xbb\xd1\x18\x83\x15\xbf\x9bo\xf9\x19\xdf\xf9\xab\x09\xe7*\
-~\xe8\xd1\x10[n/\xac\xb9`\x81'v\xd1o\xb5\
-G\x88\xca\xc1[cz\xec\x1do\x99\xf2\xc9k\xbb%\
-\x1f\xc0\xe2\xc9\xf1\xc0\x1f|\xe7\xcf`\xeb4\xd0\x9cx\
-u_\xb5\xac\x9e\xa8\xe48\xfc\x00\x8f\x9d\xda\xd7f\x0e\
-\xc7>\xf5_9\xee\xb1\xb5Y\xc4\x9d_\xf9\xc5\x9f\xfa\
-;T\xf7\xe0\xcc\x7f\x02\x9e\x86\x0f\xf2\x87\x84>\xfc\xa9\
-\x9fC\xcd\xb5\xbc\xad\xce\xa9IFD\x1e\xdfiSA\
-2\x93\xdc\x02\xaa\xeb\x13\xb3\xdf\x14\x971s\xaf\xdb\x9e\
-\xdah\xebsDq\xe0\xe8\x89\xa5/\xaa\xb6N\xfcy\
-\xac\x1f\x1fc}\xcb\xc3\x99v\x9f\x85\xa1\x90TFW\
-\xa3\xa8\x01\xe7\xb6\x18\x00\x0f\xc5\xf4\x9e\xc3\xd6DP\xea\
-\x14\xb0z\xd4\xdd{y\x9f \xb0\xaf\xfa\x99\xd3HM\
-!\x9d\x7f\x9d\x1eG\x0f\x94\xef\xf8\x19\xe7\xd1e\xe2\xaf\
-\xd7\xe1h\xee\xecj\xed\x1cZ\xeb\x18@\xd4=\xc9\x8e\
-@k\x1e\xbfs\x99\x058\xf3J\x11\xee\x97h[w\
-\xa8\xd4e\xae\xf0\xc4\x1d\xdd\xccu\xce\x1f\xa5\xe0\xaeN\
-\x06\xf2-h\xd6)\xbe\xdc\x9d\xcb/\x96\x85j\x9d\xc2\
-s \x13\x0f\xda\xf6h\xad\x1dk\xeb\xc5\x9b\xd0\xfe\x92\
-\x9f\x22v]\x98\xc3\xf9\xd6V\xf9\xdc<m\x01\xb6F\
-\xfa\x99\x17\x9a\x0a\xf0\x19AjZh\x00Wv\x00\xcc\
-?\xdd\xd4\x00\xa7T\x9d\x8d\xeb\x04\xc3\x10?\x1d@\xad\
-\xda\xf56\xe7\xf8\xfb\x22$8\xb1=\xb3\x02\x90x\xe0\
-K\xae\x021\xf9\x95\xda\xa3\xe7/\xfe\xe6\xe5<\xe6\xdd\
-\xff\xa7\x7f\xf6\xbf\xbe\xf8\xc1_|\x1e\xc6\xc3\xf3\xc9(\
-\xa0\xb2\x8f\x98\xab\x8a\xf9\xbc\xdas{\x010\xa7\xefa\
-\xf1Y\xf1=\x19\xf7\xfe\x9c\xb8\xef\xfc\xd6\xaf\xfc\xcf\x81\
-\x9c=\xbd\xe7k\xc5v#<\x9c:v\xc1C\xbb\xd0\
-\xb9Z\x8c\xec\xb6s\xc7\xb0\x91O\x9b\x0b\x7fP\xed\xe0\
-t\x07\x9e\x9b\xc0\xee\x1br\xdd\xf3\xc5\xeeE\x17\xce\xe6\
-\xa2\x07\x93\xbe\xfc\xdah\x83-\xde\xd15>Xh\xf3\
-\xc4\xb9\xbep\xb6\x8e\xf2\xe1\xa6\xa9UM\xe2\xf9o[\
-~}{\xb3#X\x9b\x99\xd1\xd4\x9a^\xac\xde+?\
-z\xd5jO\x82\xab\xf6\xcb\xeeT'yr\x1cN\xf4\
-\xb4\xa7\x7f\xe0\xdf\xb4\xa8gk\xc7X>\xe5\xdc\xf9`\
-6\xff\xdd\x16\xc7!\x0d\xbc\xb1\x0e\xb5\x8f?\x06\xb5~\
-\x90\x9f\x10\xf80\x7fR\xf8E~\x8d\xb01\xd6\xb1\xa0\
-\xdc\xf4\xc6\x06\x8b/c\xf4\xec\xf1\xe8\xcc\x98Z\x88\xdb\
-\xf0\xe7an\x8b<\x1c\xfd\x17\xaa\x16\xb8\xf1\xd9e\x8c\
-\x16\xbe3\xdf\xd8\xf8\xf4\xaf\xf6\x8e\xc1\xe5a\x94\xfa\xb4\
-s\x88\xb1\xf7o\x06pG!]F\x00y\xe6]\x9b\
-h\x13h\x90[\xcc@\x11\x10\x1aw\xb3Ds\x12\xf4\
-\x9b\xd1\xd0O3^*\x12Hr\xdc\xfd5\x8e\xb8\xd8\
-3\x86D\xe0\xdf\xb1\xa9\xa3\x1d\xfa\x94\x80\xddu\xeaG\
-\xd7DhU\x17D\x8e#R\xde.\x80s\x99|\xd6\
-\x04\x8d\xda\x9c\xd0`M\xaehT\x9a\xad\xeb\xdfI\xe0\
-\x1b\x9ay\xd1!\xff\xc3;W\xc7q\xbb.\xd1\x10\xc4\
-\xc4\x98+\xec\xda0[\xf3\xdd \xbe\xe3\xe8\xf2\xac\x9f\
-\x87Y\x0d\x95oZ\xeb\xe3u\x06>^\x1a\xb46\xe5\
-\xe3q\x1dX\xbf\xc9\xef\x9c3.\x1al\xe7\xd7q\x14\
-\x02\xc0\xe60\x19cP\xc3jY\x8a\xb9f\xda\xe2\x16\
-\x1f\x01\xd86\xf8c\x5cn\x84\x003'\xc2\x0c1\x5c\
-\x13\x1c<\xc6=\x86\xeb\xaa\x9by\xc0M\xfdy\xe0\x92\
-f\x8f?\xec\x99g\x5c\xaf\xbf\xf7[\xff\xe4\x97\xe8\xe7\
-\x01\xfcn3\xbe?2|\x9e\xed\xb9\xbd\x00x\xba\xca\
-\xf7\x93\xb0'i\xfbs\xc2\xbe\xff;\xff\xe2O^\xfd\
-\xe8{\xbf\x0e\xd9=3G\xc5n\x9b\xee\xdai\x89\xdc\
-\xfd\x02\xcb\xac\xb96\x9b\x8atm\xef\xb6\x07\xbb\xbb-\
-\xb9{\x11\xc3Y~5\xde\xe6\x87;\xbc\x8b~\xe3\xc7\
-)gj(\xff\xa6\x95xs\xcd\x85iJ|\xad\x97\
-\xfe-\xbeZ\xd5%.\xff6G\xc6C\xb7'\xa4\xc6\
-h\xd5\x1e>3l\x92&\xcc5s\xf1\xabB\xb5p\
-\x18\xad\x16\x18l|k+\x80\x0f=\xda\xf4\xcb\xc7\xb5\
-\xb6)q\xa4\xc9\xafY\xcd\xc3\x1fg:k>\x98\xdb\
-Z\xc5w\xf2\x81\xbb\x8d\xa7\x0aY\xd4J\xfb\xe0\xa3\x8f\
-\xf3\x9b\x03\x7f\xee\xc5\x8b\xfc\xa4\x80\xc9\xea=\xeb%\xcc\
-\xe2\xc8\x91Q\xfe\xdb\x8bC \xae\x89\x1f\xd7\xd6\xabc\
-~\x07;\xf6\xfa\x17\x9f\xde\xf5J\xe8\xe4\x01\xf6\x14;\
-c\xfc\xe7\x85\xc9r\xd5\xcc\xad\xd7\xba\x86L\x0cAc\
-\x92c\x9b!\x02\xe9\x0fv|\xc1u=:\xde\xf5\xb3\
-\x8e\xc1\xba\xc2\xe0\x90\xb3\xc5C\x1e\xff!\x0bP\xc6C\
-\xfd\x17>$\x06\x9d\xc4\xa9\xd7\xbc\x82\x08D-\x1dY\
-\xaaD\x22|di\xeb4\xc8=c\xfa8O\x9e\x8c\
-[\xffbZ\xe1\x22:\xcf\x8b+=C\xf9S\xc7\xfe\
-\x04\x81\x95\xe0\xe3\xbb\xd5\xa9!`\xf7\xfd\xac\xe5\xd6\xe0\
-\x13&5#F\x1b\xecUT\xdd\xe7x\x01\x01\xeb\xf6\
-\xfb\x12\x86\xbf/\xae\x08P7?\x19a\x19\xc1Z\x22\
-\xbd5tn\x0a4P\xad\x83\xca\x10\xdcy\xc6\x80\xcf\
-\xda&Q\xff\xa7\xd4&=\xeb\xc2\x90\x87\xe73\xdd\x8e\
-ee\x10\xffL_\xcf$\xac\x9f\xc1\xe0\xe9\xb4\xa9e\
-j\x1da\x03\xc6\x01\x90?\xff\xef\xd7\xf3~\x8f\xc6\xf2\
-\xc1\x9ey\xa3\xbbs\x0d\x97\x18\x12_\xfc\xe0\xbb\xbf\xf1\
-\x9d\xdf\xfa\xb5?\xc9p\x9fC\xe8A>}\xc4e[\
-?\x83Ul\xe4=?\x9e\xd3\xf9\x9e\xd7\xf9\x93\xca\xdb\
-\xc5\xdf\xfe~\xb2\xce\x09|\xf9G\xbf\xfb?!r\xdf\
-\x1c\x9e\xab\xd9\xb4&\xd0\x9e\xf3w\xb3\x1f8\xee\xee\xc1\
-\xb0\x81\x0f\x7fl\xe3l$w\xa2\xb2w\xbe\xf6`\xb0\
-\xcb/\x16{\xb1w\xbb>\xb6g.9\xb8O\xf9\xc3\
-+\xc7\x94\xea\xae\x96\xf0\xa9\x07\xdf\xd0\xed\xcd/\xbf5\
-\xcf\xcc\x86_-|[\x8f\xfc\xba\xdd\xe9\xf87\xafZ\
-\xc4\x92@\xdf\x13\x1cy/~3\x95\xcf\xccf\xcd\xde\
-\xc1\xc7\xb5z;\xa7\x9d\x84|\x00i\xd84\xf2\xac]\
-\xe5k\xbc\xfc]\x83\xa1\xc8[Nk\xd1U\xb1\x98\x8b\
-;\xfc\x097c\x07b\xf2\x09\xc0\x87_\xf9\xf9\xf3\x87\
-\x84\xbc\xe9%|\xe6\x97\xc4Y\x9dK\x10R\x82\xc69\
-\xb4\xf8S\xbf\xf9\x82!\x0f\xf5\xf9g~I\xb78l\
-\xa2\xea\xd2!\xa2G\xcd\x8e\xe2G\x03L\xfa\xf5\xa1I\
-\x83bM\xd3\xeb\x0f\x0e \xd5\xb6\xd17\x8fw\xf2\x89\
-\xf3\xee\xdf\x94g\xa2\xc1\x91\x8bx\x9a\xb1\xa1I)\xd8\
-\xf9\x10gf(Sw{\xe8\xeb\xad6J\xb3jP\
-\xc4\xd6\xf0H:\xef\xd4\xf6\x1c\x82\xf6\xc7\xf2\xccR}\
-\x15y\xf20?<\xb2\xa5\x05\xaf\xb5\xfdT\x06\x9e\xc0\
-U\x7f<\xb8\x00g\xae\xce/cz]`\x09\x05\x80\
-\xa7?\xe7\x9f\xaa\x1d7\xd6\xca\xeas\xe68@\xc3\x85\
-\xac>|\x853\xbe\xb0\x0f\x0a`\xc1\xd8\x1c\x8c@l\
-9Q\xe0|\x00\x99'Lk\x8a\xe3\xf5\xf9 \xb4\x09\
-y\x02 \xf7\xaaUs\xe6J\x0c\x89\xfc\xf3k\xfd\xd1\
-\xb4\xd6h*\xcd1\xff\xf7\xdc\xb1.\x8bw}2\xd8\
-q\xfb\xaas.\x15`\xc8\xa7G\x11\xd5\x17'Z\x06\
-]\xec\x98\x0ci\xba\xc1\xce \xe6\xc6\xcaM\x80\x98\xf1\
-\xd6o=\x8c\xe7\xc4y\xae\xd4\xef9B\xc9_\xca\x84\
-a\x0dto^\xbc\xfc\xa3\xff\x93\xe7\x8a}\xee@a\
-\xed\xed7\xd3\xf6(<\xcb\xf67\xe1\x05\xc0.\xfc\x9e\
-\x8cw\x9d\xb0\xd7\xdf\xfag\xff\xe0_\xbd\xf9\xe2\xf3?\
-t3,\xe3\xecB(\xdbn;k\xe2\xdd\xcc\x83a\
-3-O;\xc3\xdd\xb4H\xccfs'N\xfc\xdax\
-\x84\xc3Gb\xa0\xf4n\xfa\xa7\xd8h\x8a\xcd\x8e\xbe\xf8\
-l\xec!?\xe1\xaf\x7f\xb1h\xea\x9b~s,\x8e\xbc\
-\xabt\xb0j\xf6\x22\x5c\xdfc?\xf5C>-\x97\xdf\
-\xe6\xdaZ\x13\xab\xefI\x1f\xff\x95\x7f\xb2\x87\x9b\xff\x8f\
-\xb5.\x7f\xfb@\xd1\xa3\x9d\xe9\x8f\x81\x9f\x08\xc3\xcd\x09\
-n\xf1j\xdf\xc6;\xe7\xd5\x19Y\xd7B>\xe4\xb4\xf5\
-\xcfY?\xe3F\x93o\x8c\x8d\xdf9\xcc\xf1\xc3\xaf\xfc\
-\xac?&\xb88\xfb\x11]\x9f\x12S<>\xdf\xfd\xdf\
-\xe65)Z\x1bq\x1c[8v\xf4\xea\xab\x1f\x0dr\
-\xab\x85\x9d\x07M\x7f\xcd\xe3c\xb8\xb5s\xdb.\x96=\
-3\xc0{\xad8\xad31\xe3\xc3\x5c\xffP \xef\xf9\
-\xdd\xf5\x87(e\x0f\xbc\x03\xbe5\x9f\xa7\xd0\x81\x1b?\
-&m+\xaa\x83\xd1\x04\x08.hLJ]U\xfe|\
-\x0dh>\xee\x85a\xd9\xc1\xeb\xb5\xec\xd1Y\x0d\xc8>\
-\x10\x9e<\x81\xb8\xb2B\xef\xb9\x83\x1d:h\xc4\xbbg\
-b\xe4\x89\x8c\xd0\xfe\x82\x1f\xfe\xb4\xaf`\x9dSrr\
->\xd0\x99<(\xfc>\x13\xd3/\x02\xf1\x8c\x19\xc6\xbc\
-\x88\xe3\x83xZ@\x02\xd3\x8f\xe6~9e\xa9\xae\x89\
-\xf8\xea\xf7\xb8\x1f\xfb\xb3>W#\xc6\x92\x1c\xa4\x8e3\
-*0C8\xc5\xa5\xa6E\x17\xd6`\xe2\xfa\xe3k\x9c\
-\xe0\x22\x072\x89\x0f\xcey ,I\xfcH\xc7\xa6m\
-\x825)\xb4\xba\x84\xd6\xa4\xae\xeb\xc5Oy\xa6Z\x00\
-\xae\xb4k\x9f\xa6\x82\xc4\xde\xbc\xfa\xfc\x8f\xfe\xec\x9f\xfe\
-\xfd\x7f\x95\xd0>\xd9\xdf{$\x9e>\x90y\xb6m\xaf\
-\x9b\xe74\x01\xcfc\x0a~z\x22v|?a7\xfb\
-\xf3W_|\xeb\xff\xfe\xc7\xa5\xddO<S\xcf\xceq\
-\xc7t\x19n\xe6\xa4)\xc4\xe8\x04\xbbq\xa6\x146\x8e\
-\xfe\x8e{\x9c\x8d:\xf8\x19\x0dn\xf0\x87\xbec\x1c\xc7\
-yOw\xb6\xbdy&\xdf\xd6\xc9\x9e\xc6\x7f\xaf\x01\x1f\
-\xadj\xa3\xc9887:x\x11\xce\xfe\xe2\x8f\xe8\xd6\
-+d| \xcb\xafN\xe9E6\xff\xddOtcE\
-ru\xca\xcf\x90\xde6\x85\xca\xbf\xfb\x09\x9e\x98H\x87\
-K[\xfe\xf5\x84S\xcc\xc6o\xf4\xc7y\x16\x96\xfc\xab\
-95\xae\x7fz\xba\x875\xb8\xf91w\xf5v\x9d\x1f\
-\xc2\x8a\xe7E@~:\xe0\xc3O\xbe\xd2\xfc\x023\xff\
-U\x05\x13\xdf\x95#c|\xfb\x00?\x98]3\xb0\xe2\
-\x13\xf3\x1d\xfd`\xf01\x9d}\xb0\xe9\xd7g?\xb8}\
-\xf7\xaf\xc6\xc1d\x84^\xc6\xb0Hi3G,\xc79\
-\x8c\xc6\x00\xc7\x7f\xa05B\x96\x9f\x83\xe7\x05.:\xd0\
-\x91j\x10g\xef\xef\xab)\xbb+\x0a\x845\xa2\xa2\x9d\
-\xf7Y\xb3\x88\x80:\xcf\x91h\xa2\xa6\x1f\x06Yx<\
-\x1eO\x01\xc6`\xa4mQ![\xab4\xb3*\xda\xfa\
-\xab%4\xe6\xf5\xf5d\xec\x99#\xc9\xd1\xcd7A\xe2\
-\xe3\x89\xbfx\xb4Z\x07c,\xe3\xfb\xa4\x8e\x07MB\
-i}c^\x0d\x9f\xb8\x82c\xae*\xcc\xbb\xf8\x029\
-\x92\x93\xb6=f\xb0\xf7Gb[\xc1\xa8\xc8\xe8\x81_\
-\xeaC\xfc\x9a{\x95z\xec7\x0a\x86m^jd\xae\
-\xe93\xd6F\x99t\xabH,\xffh\xf8\xf9^\x02\x82\
-\xf3Zd#D\xfdg0\xeb\xd5k\x17,J\xe9\xf3\
-\xdf\x07\x07r3\xa6\xd1[\xc0\xf87\xb3<\xd5\x0a\x82\
-\x02\x16\xd8Hf\xe4\xba\x0ft\x00\xd4\xdf9\x11\xdf:\
-\xf0\xbd\xfc\xe6\x1f\xe59\xe2s\xfe\xf4\xef\xed\xb9C\x1b\
-e|\x93!V\x1b\xe3mw{}\xefu\xff\x1c_\
-\x00\xbckA\xf7\xa4\xdc\xfb=\x81\xe7d~\xfb\x9f\xfd\
-\xbd_\xce\x05\xfa\xe7\x08\xf4\xa4c\xcd9;;\xe4\x8a\
-\xb1!2\x02\xd4\x8d\x85\xb1\x9b\xce\x9e]^~\xdd\xc5\
-\xde7\xd4\xe2'\xcb\xd9lbBj\x8e\xc92\x9a\xc6\
-\xa2\xdbM:\xf9\xc9\x9dZ7F\xcfck\x04e,\
-\xf5\x16Ci{\x91U#\x8e\x1b\xbfx\xf9\xe6\x1d\xfe\
-\xea\x92M\xbc\xc29\xec\xf8\xba\xf87\x7f\xf3\xc2\xaf\xc6\
-\xc8\x95/}\xe60\xf9\xaf\xb5\xb84\xd1\xdf9L\xb5\
-\xf2\xf5\x8f`\xe8\xe6\xc0G\x03wj\xd4\xf3\x18\x07O\
-;\xf5`\xeb\xb9\x0e\xf2\xaf\xe1C\xfc\xd4i|G\x0b\
-\xae\xd2\xe6X\xaf\xfd&\xcc\xe0\x83/\xff\xf4\x8b\x8f\xf2\
-\xc7\x84\xba\xcd\xe6\xa6\x03\x95\xb7|!\xfb\xae\xdf\x89e\
-\x1c\xde\x9e\xc3\xa7zf_\xdd\xe0\xb9p\xf7\xdc\x11c\
-\xac\xec\xf4\xe9\xd4\xb3\x9b<\x1b\xdf\x05I5\x9do\x04\
-:\x1b(c\x85\xe3\xfd_R\x0e\xd4H\xe3\x9d.\x98\
-\x81\xa1eH\x1f\xb1`\x80\x0b\xe6X\xbcci\xe4$\
-s\xebGkP\xfa\x94\x91\x0b\x18TS9\xd7\x00e\
-\xd3\x13\xe2\xa0pl\xea\x15<\xda\xd8\x93\x87@\x9f\xcb\
-J\xbc\xea\x87\x7f\x9e\xbad\xec\xfc\xd7K\x0e\xd3\x90\x07\
-\x1d\xc7;'r\x15Y\x7f\xe2\xfe\x81\x1f\xa5\xe60X\
-\xea\x93\x8f;F\x1a\xeb\xc6|(\xaey\x8b5x\xb0\
-\x8cf\x8dk\xe68\xc5 0Z>\xdb\xf2\xe2\xc2g\
-\xdd\xd1\x07\x9f\xe6^\xd1\x22\x1b9\xbaF\xb8\x94\x98g\
-jY\x1e`\xb41\xf4\x1b&]K\xb8\xf1\xf4\xffT\
-\x91\x01y\xf1\x83M\xef7\x15R\x1a\xe2y\x10\xf1\xfc\
-\x99{\xc8\xd9G\xeb\xabP\xf9\x82\xad\x185D\xd2\xd4\
-\xde\xb92\x83i\xe8'\xe6\x1c\xc0\xf0\xdf geP\
-\xfa&\x97p\xf8\x89\xe6<\xc9\x8b\xd4\xc8\xa4\xff\xe2\x9b\
-\xdf\xfa'\x7f/?1\xf6W>\xf9S\xcc>(\x06\
-\xfbY\xb6\xebL?\xcb\xf2-\xfa\xbe\xf8{R\xf6\x95\
-\xda\xbe\x08\xa0\x7f\xf5\xf9w\xbe\xf5\xa3\xcf\xbf\xf9_\xff\
-Q7^<\xdd9\x15\xb9\xed\x86\x8d\xbb\xa9\xd7/\xaa\
-\x9c\x8d\xdbw\xc7U\x0aL\xf0\x8d\xf7\xa2X\xecE'\
-\xde\x11\xb1\xa1\x9f\x1d\x84ON\x02\xe4\x7f\xe4w\xbc\x13\
-\x96?\xc2\xf5\x95\xfb6\x7f\x18\xa3\xd7Q\xb5\xe62\xd9\
-\x82\xcc\xa7\xee\xc9\x9f\xd0\x14\x1c\xd7U\xcfCm\x93=\
-\x1d\x5c\xe0`\xad_\xfaf\xbc\xf8\xd5\xda\xe2\x87?X\
-F\xd4\xe5\xfa\x8f/\x9dmJ1^\xd6)\xef\xad\xf8\
-\xc5\x1fr\xba\xe5\x5c\x9eG\xdf=N\x8d\xb4\xfafp\
-\xf3h\x9e\xc3\x9d\xb9\x8cr\xfc1\xc1|I\xc0[1\
-!&\xe1D\x86\xb3\x8b\x11_=\x8do\xfd\xf7\xb5`\
-a\xf7\x9d<\xb6\xb1H\xee\x86\xdfr\xd0\xd9_\xef\xeb\
-\xa7\x05\x13P\xdf<\xe5\xceB\x1b\xbdb\x90y\xe4\x80\
-\x93Z\xb1i1O\xe9q\x15\x06\x8e\x80\xff\xe7\x00\xa5\
-O=\xcc\xaalj\xaf\x963\x1dMb \xd4\xb5\x0f\
-&\xad\x9c\x1a\xac\xc5\x96`\x90\x83u\xcdh\x82\xbcK\
-\x87-w\x05\xb6\xae\xe1x}\x80\x08_]%\x0a\xbe\
-b\x93\x0fn\x1e\xcak\xe7\x90\x0c{\xa6\xc8\x04\xd3}\
-\xaff\xbf\x97\x9e\xe7\xd4\x9e\xbf '\x8fin\x87\x96\
-\x8c(\xe0K\x93|\xe4@\xbb=Z\xf8\xb6\x8d?\xce\
-\xe3v]\xa3\xa1\xa35\xf6\xbb\xfb\xbb7\x96i\x96\x82\
-\x9a\xe1\xe0\xc9t\xaf\x85\xec\x9c/\xca\xe3\xect]]\
-\x1f`\x114\xfb\xe6M\xd1\xca*\x91\x03\xb5Q4|\
-\xb0;\x01\x06\xfc\xc8(kB0\xff}t\xd2\x82\xf9\
-\x04B19\xc5\x06U\x1cU\xc2\xb9*\x18~]~\
-JC,\xff\xcdY\x93\x81\x8f\x9e\xa7\x84\xc97\x18B\
-\x0c_~\xe3\xbf\xfe\xa3<G\xfc0J>_L\x8f\
-\xbd\x8f\xa0L\xbc}\x86\xcf\xbb=\xd7\x17\x00\x9c\x00\xda\
-\xbd\xdf\x93\xb2\xfd\x9e\xb4\x87\xfe\xd3_\xf9\x07\xbf\x94\xcf\
-\xdb\xfc\x14\xc0\x8d\x87\x08\x9b\xd1M\x95A\x8c\xbdpI\
-\xd0@o\x14\x1d\xe3*x)\xf2\x0d\x16\xdf\x8d\xd7\xd2\
-\xd6\xbes\xd6.\x85\x1b\xdfN\xa3\xe9\x88\xd7\xd7\xbc\xad\
-\x8fl7\xcd[\xbe\x8b\xef%e\xc9\xfa\x9c\x17ZS\
-\xf3\xe4i\xfe\xc9yr\xb5vd\xcd\x14\xec\xe6\x05\xc9\
-\x94\x87\xde\xf9\xdf\xb4\x1e\xfc\x08\xa4\xe1+\xbf\xe3\xab\xfa\
-\xd6r\xe7L%g]\xe5\xab\xc1M\xe2\xe2\x8f\xd9Z\
-\xd6\xbf\x80\x8c\xe7\xb4\x18A\xf3Z\x97\x01Ow\xa3\x8c\
-~+\xb8\xfb\x81n\x8d\x8fl\xd6\xe7\x09R\xe0\xddW\
-{\xe7\x05\xff\x83\x8f>y\xf1\xd1O\xe7w\x05\xf8\xa4\
-\x98\xb8\xc5\xa6\xefB\x9d\xe2e\xceD\xe0\x9fqp\xda\
-\xf4k'\x0e\x86o\x0c\xbc_\xc8\x87\xf3x\xd2\x82\xa4\
-q#g\x06S]\xba]\xa7\xe5\xb9?\x0c\xe7\xc0\xe7\
-\xed\xe9Z\xae\x88\x91\xa9\x1f\xae|\x00>Q\x80%\x16\
-\xffdj\xe1\x93s\xf2\xed\x1a\x92&\xd0Ve\x92T\
-\x97\x1e\xffi\x0c*Y\x7f\xecm\xe8\xf8\xcb~\x10\xa1\
-QF-uw\xe0\xdf\x05 `\x9d\x18$m\x1e\x99\
-C\x227\x10\x9ai\xc7F\xd5y\xe9'k\x02\x01\x80\
-a\xfe\x17\xcfH\x03U8zhP&\x1c\xecm\xac\
-\x13\xcfj\xe6\x8d\xb9y\x1a\xbfp\x8b\xaf\x02~\xc0\xa8\
-\x0d\x9f\xaa\x18\xaa\xcd\xba\x5cY\xd0^\xa5\xab\x8f%\xbe\
-;\x02\x848\x9ea+4\x1c\xc6\xcb\xef\x9a\x9d5\x0a\
-\xbf\xbf\x02br\x8b\x03\x830\x83\xf8\xa7\xa7\xd3\x9f\xbe\
-\x93M\x9f\x059\xfbG\x1c!\x00\xa9\xde:\x04W#\
-^\x1b\x8b8\x05`n\xaa8\xe3\xee\xb9\x98L\x03c\
-~\x87\xa2\x849\xe2<\xfb\x97w\xff\xff\xf4\xbf\xfb\xe5\
-\x04\x1f\x9e/n\xe3\xcd\xb4=:Om|\xcf\xaa\xdd\
-\xef\x1b\xcf\xaa\xf0w\x14\xbb'c\xfb\xfb\x89\xdc/\x03\
-\xe4S\x80?\xbd}\x0a\xc0\xb6\xd8\x0d\xc7\xc5\x09\xb5\x9b\
-\x82\xcd\xe4x|w\xbf\x9b\xebl\xc2\xd9p\xd9\x90\x0f\
-\xfc\x19\xebk\x9a\xc6\xd9\xb8\xe1\xe2w\x0f\xdb\xb3q\x97\
-\xdf\xbe\xe3\xd62thr\xe0\xca\x9fZ\xd19|u\
-f|\xe6B\xf5T\xcd\xac\xaa\xa9\xd6\xd8\xf8\x96o\xef\
-8\x874\xeb\xd7j\x15\x87\xaf\xef\x8aSC\xe7t\xe1\
-\xca\x1f \x80i\x97\xe6\x8d\x9fX\xf9\x8bj\xdf3\x12\
-\xfb\xa2\x07wa\x9e\xda7\xd8\x05:\xf4\x12\xdf>\x96\
-u\xc9\xae\xb5\xfdHM2\xbd\xf7\xc4gn\x83\xdf\xd8\
-\xf6K\xcf\x93\xff\x07\xbc\x08\xf0w\x05\x04\xbb\xbc.\x9e\
-\xa8\x93qc\xc3\xa5\xf3\x86\x8e?\x0fp;\xd7\xfd\xd1\
-\xae\xe5\xfa\x8e?\xb9\x19\xef\xbb\xff]s\xe9\x88\xd1F\
-`u\xf4Q3\x8fy\xe2\xf7\xee\xee\xc7\xb5\x89\xc6\x7f\
-/\x8b\xbd\xa2\x06\xbd\xc9\xe8v\xff\xe6\xd6b\x0d\xf1 \
-\x09 \xb8r\x9a\x91\xa3\x0f\xe9\x9d\x13\x1e\xb0\xf8+\xc9\
-\xf1j\x94E\x80\x12it\xdc\xc4\xce\xbe\xbd\xc1\x81\x0a\
-\xa0\xc3\x9f\x87>\xfci\xc7\x1eM|\xe4\x06\xeb<\xd3\
-\xaf\xdd\xf5c\xfe\x01Or\xed\xe07\xb7n\xc2h\x07\
-\xc7\xb8\xd0\x9d[uO\xde\xa9\xa0O\x90\xb0 \xe6\xb1\
-B\x8c\xc7\x8d\xd9\xe0c\xefJQS\x16\xd9\x7f\x97\xb8\
-\x8c\xd2\xa7\x16\x14\xa8\xcb\x08\x07,\xb2\xf7['\x1d\xc7\
-\xe5;\xfe<\xf9\x8e\xe2\x94\xc4\x08~\x19-\x91\xec\xf3\
-\x91\xbfj\x90\xf3?A\xd7&\xdf\xd8\xb0\xfb\xce9\x9d\
-\xaf\xfbO\x91v(\xc4@|_\xb2 \xee\x0bev\
-<6G\x01\xc5\xe2H\xa3\x16\x83\xf4\x86A1W8\
-\x902\x1e\x9b\xb0u\xe5\xa3\x7f\xb1\xf1[#\x8a\xc1~\
-\xe6\xbb\xffo\xfcU\xef\xfe\xa7 \xf2NA\x9a\xcf\xf7\
-\xf0\x9c_\x00tG\xcc\xe9\x9cS\x80o\x9f\xf8=\xe7\
-\xb7\xf1y\x11\xf0\xe9\xaf\xfc\xfd_~\xf1\xea\x8bo\xc2\
-9\x1b4\xb6\x1b\xeal\x0c\xc6\xd9D:gSA\xb0\
-\xb9e\xb5\xd8_\xdb\xdc\x87\xf2\xeb\x81\xbf\x9b\xec\x9e\xa7\
-\x9a`\xee\x17c9n\xd2\x9a\xc2\xb6\x86\x8b\xbf\x9a\xd0\
-\xc9H3\xb3\xd6\x85\xab\xb75\xdc\xe6yj\x1a\x9a\xf4\
-\xf0g\x22\x17\xbf\xda\xf2\x839\xfe\xb8;\xa7\xea\x97\xce\
-\xfa`\xddq\xcb\x7f\xf4\xe3=e7\xa4\xde.\xe3\xea\
-,\xa6*\xa7<\x19\xeb\x1b\xfa\x83\xde\xea<\xc5\xd4\x7f\
-\xf7^\xf6e\x1d\xc5\xadl\x1d\xe9\xa3\xb0E\xe1=\xf6\
-f\xd4\xc9\xe1\x8a\x1dL|\xb3/\xf8\x04\xe0C_\x04\
-|\xdcI\x91\x9cI\x07\xbb\xeb\xba\x8bi]\xf8\x81\xd0\
-\x07w\xb2\xdd\xec}\x92\x7f\xb8\x98\x87\xb7sS\x03\xa5\
-\x11\xe0F\xa9MG\x90\x16N{\x8e\x01\xf2l\xbb1\
-j\xcc\xa0]\x9c\xe4\x1f_u\xb6\xfe\xe0\x08\x83V\x0f\
-\x81<b\x83\xaf\x8at\xed\x04\xd5,\x8a(hF\xb2\
-RBm\xc0['.\xe7\xacQN\x09\xf7\xeb) \
-\xb9\xf4D\x83\xcb\xf8B\xd7\x162\xc2\xd6;6\xb8s\
->\xac\xbfu2\x07\x9e\x9b\x9c\x0bv\xfe\x15;iH\
-e\xbe\xf2\xf7\xe7\xd0q\xb9\x5c\xc4\xe5\xc0\x92\x99c\xfb\
-k\x82\x82z\xb0@\xcc(\x5c\x02\x19\x86\xd3WV[\
-\xc1\xad^\xf4\x12\xb6\x8ek5[Cc\x02\xc2\xd4\x97\
-\xfcX\xccw\x98\xa6\xd3\x07\xc2\xff )\xa1}\x07\x8d\
-\xad\xcb\xf5\xc2\xe5\x02\x05\xc1\xf7C\x0c\x1f\x11q\x93\xde\
-\xbd\x83}\x93\xb3`\xe7\xd8\x9d|>-3\x19\xc0\xfb\
-\xfe\x9fZf\x0d\x10\xea\xb9\x14\x5c\xc6\xff\xd3\xde\xbb\x05\
-\xed\x96]\xe5y\xfb\xd8\x07\xa9uF\x08$\xc0Rd\
-@!`,\x9c\xd8E\x88\x81\xb2\x8d\xcb)RN\xa5\
-\xb8q\xca\xb9\xc8ER\x95\x5c\xc4\xa4B\x12\xbb\xecJ\
-%\x17&\x17\x09\x0ev\xb9\xe28q\x5c.\xb01\x15\
-W\x1c\x88\x00\x07\x1c\x10\x10P\x01\xe2,\x0e\x12'I\
-\x08th\x1dZ\xadVw\xef\xdd\xbdO\x19\xcf\xfb\x8e\
-w\xae\xf9\xad\xff\xfb\xff\xbdww#\xd4{\xcf\xb9\xff\
-o\xcd1\xc7x\xdf1\xc6\x1ck\xae5\xd7\xf7\xfd\x87\
-\x8d\xa2rQ\x0es\x5c\x1eh\xf1\xc6\xf9+\xc8\xcd\xeb\
-\xcf\xce\xef\xfe\xc7>Q\x90\xc8\xc0\xb3\xf9\x8b\xaa\x00\xf7\
-\xc0\xe1\xe0\x9e\xf1\x22\x9fONL\xfa<\x08\xcc\xbdN\
-\xe8\xb5'\x1e\xbdr\xed\xa3\xef\xfd{^\x00\xb5\x02j\
-!hA\xb2\x1a\xb5\x8a\xbc8\xbcHmcq\xfb\x86\
-\xd0\xd8\x1a\x9f\xe0\x0bC\x15m;\xe4\xe3z\x8b\x85\x1c\
->}\xe4B(\x07\xeb\xb6<\xd0\x87cl\x16pb\
-\xd9~\x80+N\xfc\xd8m\xb0\x5c\xf0\xd8&\x9f\xf2\x0f\
-J\xe1\xc5C\x16\x1f\xa1\x9a\xe3[\xc7\x98B{JH\
-%\xeb\xe8\x1e\x1e\xad;\xc9\xe2\xefu\x1a\x1b+P\x1f\
-\xc2\x9b-\xc4\xa2\xcd:\x8d\xa58\xd4z\x14\x9d\xfb\xe4\
-\xb7y\x98P\x09\xa8\x08}\x88N\xfd\xc6\x1e\x93\x9a\xf4\
-\x99\xefF\xcf\x9a\xa2\x06\x15G\xc9\xdb\x07C\xfe#!\
-\xffo\x82\xbd\xaeJI6 \xa8SjE,\xe9\xab\
-\x97\xbe\xec\x1a\x17f\xe0\xc1tq\xf2\xa0@\x1e\x9ce\
-04dC\xac\xd9\xfc\x13s\x9a\x9b\x13\xd8nw\xd8\
-\x1c\xd0|\x9ct.\xf6\xdcS\xd3\x8f\xb1\xb7M\xef\xc9\
-\x9d\xb7\xc8\xf8<\xc8?\xb9\xe0\xc1\xf2\x98}\xe1\xd2\xd0\
-e\x88\x96\x9b\x15c\xe6\x92\xf7\xac\x9a\x07\xfe\xab1[\
-\x89:\x00\x84%\x82\x92\xf4<\xd1\x81u\x03\xe2\xbaD\
-\xd3ch\x09\x0eT8r\xad(uG\xa17\xd11\
-\x03\x95?yw\xee\xd90\xa5\xd7\xc7\x17\xc4\xd1\xd9p\
-\x02u\x1cy\x95\xc9~\x8c!\xa6\x02\xb7?\xc7#n\
-\xf1\xc7\xae\x0b\xa4\x89\xc2\xc7_\xe59\xf8\xe8\xdc\x88\xa5\
-U!\x05\xb7\xc6\xb2\xd5\x5cnf#\xc5w\xe9\xa0\xf2\
-\xd3\x0c9\x07\x8c5\xe5\xd2\xe8\xa7\x1c\xa8C\xfd\xe3\xcb\
-x\x10\xe6Y\xc1\xfc\xd1\x81\xb1\x1f\xd7\xcc(\xc9\xcd\x17\
-\x1e\x19\x01grh\xce\x08\xa0@m\x07\x02\xa69\xb3\
-,\x17(\x14\x96C\x7f\x0a\x01\xb5\xf4\xc2V>\x8eo\
-\x0f\xcf<\xfa\xde\xbf_{\xc2\xd5r\x98\x0d?\xfd\xbc\
-w\x90\xe0\xb1W\x12\xa1\x7f\xd1\xb5{\xe9\x01`.~\
-N\xd4|\x02#\xeb\xe4~\xf4{\xbe\xed\xff\xbeu\xed\
-\xea\xbbE\xf2\x0a\x92\xa8E\xdb\x0bDj-\x1a\xad\xb6\
-^\xd0\xbe\x5c\x01[;\x0b\xb5BXs\xe1\x0b\xc4\xa2\
-\x03\xc9\x05Y\xc6)V\xf8\x93\xca+L|\xc8Y\xb4\
-\x85\xac\xaf\xf8m\x8b\xbbb\xc4\x0f\x0aM\x1c~[\xf1\
-\xad\x85\x8fm\xf2;\xf2 \xa7\xd1\xcc\x9aUh\x92\x9f\
-\xf8\x8d\x1d\x17\xd0I\xbar\x18.\xe1\xf7@\xf3\x1f|\
-\x0bG\xe8\x8d8\xd9\xed\xf3:D\x8c(\x93::\xf7\
-[\xacC\xbd\x08\xdb$7~t\xe9c\xc98}\xe9\
-#ns\xccyw\xfdMu\x06\xa9\xdd\x85\xfa\xed\x00\
-~@P\x9cv\xb0\xe5\xc8\x1b\xf0\xca\xb3^\xcav\xb2\
-\xe7\xa2\xd5\x86X\x8e\xc5\xa18`\xaa\xcf\xc3\x00\xb7\xe8\
-p\xd5\x17D\x9a\xc6)\x8f\x18\xd2\xc3\xf07u\xcb\x9f\
-\xb3\xee\xd0\xe6v\x1cb\x8a\x8f\xcf\xd2!G\xc7\xad\x1b\
-\xb2\xe8\x8a%\xb0\x9c\xd9\xc2\xd1\xee\x91\xc8\xa9\xd18m\
-\xb6=@\xe7\x95\xcd\xdf1\xedEN8\xd4P\x1ek\
-#t\xdf\x96\x91\xbf+\x96\xbcH\x8c=S\xbej\xe0\
-)\x95\xb5\xc8\x9a\x07N\x86\xbd}\xa9\x03\xe3\xb9j\x13\
-.\x1d\xb9\x0b\xaeD'~\xe9\x93;Td\x80^\x1f\
-\x0ch\x04!h\x07\xc4[L\xb2\x19%bDm\xd4\
-\x15\x13*\x98\xe2l?X\xa9\xa1\xf2\x01n\xbb\x80\xd2\
-\x11\x85\xa6\x0f\xed\xcb\x81\x1e\xa3\xca\x1f\xf3\xbeP/|\
-b-M\x1d\xa99\xc7\x9e\x072\x18\xf4$Y\x82j\
-\x05\x04\x0c\xf6>f=\xa7\xbeLJv\xc8.\xb2\x1d\
-e\xb2>\x19\xd6\xe1NQ\xecO>\xe1\xc9\xfffB\
-%z\xf9\xc3%\x03\xf5@\x10\xeaaK\x7fS\x81\xd8\
-\x02b7V)\x8bR\xbag\xaf\xbc\xfb\xd1\xff\xf3\x7f\
-\xf8\xde\x1af\xd3O\x9f\xfd\x82\x9e\x08\xf3\xab\x86\xf7F\
-\xcb\xbd\xe4\xc5:\x1bN\x0am>9\x91\xe7\x13\xc8I\
-\xcd\x0b}\xc9\xd7\xae?\xfd\x9b?\xfd?\xd6\xa2\xa0\x8d\
-\xc5\xa4E\x8d\xc7jZPZ4,\x1c0^D\xac\
-E\xc6^t\xdb\xa2\x0a\xc6\xecN\xea\x08\x9f\x05\xb8\xe7\
-;\xde\xee\x06\xd08\xb0\x0e\xd7\xf1[\xef|\x1cg\xf0\
-\x11hZ\xf4\xc4q,\x8a\x82\x8a1-\xb9\xf6p\xd3\
-I\x02\xeb\xcb\x04{8\xe2\xb7\xdd\xfc\x1e\x0c\xdd6n\
-\xba\x14\x89a\x8f\xc6h>\x1b\xfc\x00\xc7`\xc6\x1e\xc2\
-\xec->m\x9bG\xc7\x98\x93=\x93\x99\x9d\xce\xba\xb9\
-HZV\x05\x94\xbd\xe3\x0el|zm$c\xd5-\
-\x98\xeeu\xae%o\xe7/E\xbd\xc0\x7f$T\x0f\x02\
-\xfdA\xa5\xea\xaew\xf1\x156\xff\xfd/\xfd\x16\xcd\xe7\
-.w\xa5L\x83Y\x83\xc9yC\xef\xdbx\xa7\x8f\xa2\
-@\xc2M\xf9I\x94\xf3\xb2\xa8\xefH\xd3\xc9\x0e\x1c\xee\
-XD\xcaI\xde\xac\xc3\xc6\xbb\xad\x0e\xd2\x16\xc7\xb3c\
-\x10\x1d?\xb9\x113Yv\xf8`\xaa'\x13bg\xae\
-\xf9d\x99\xfa`K\x8c\x12=pt\x0d\x95\xa7\x10\xf8\
-\xf1\x9c\xc0\xab\xc91\xbe\xad\xb7\xd2\xd6\x0d\xebs\xe5\xe5\
-\x10\x1c\x9bI\xf2*\xa1\x1d\xa2\xa3\xd9\xddv\x0d{\x8c\
-\x1f\xdb9\x9a_\x8a\xde\xf8\x831\xa2\x1dmp\x18c\
-$I\x9b%\x0e\xb7L\xd9\xb9\x07\xaa\x93a\x1c\x04\x09\
-0\x1e\xb9\xcb\xc2\xb9J#\x1f3|\x04\xecy2\xd6\
-\x0f\xed\x03eP\x87\x11]B\x1d\x98\x84l(*\x97\
-\x8c5\xb9\xcaB\xfd\xc6w`x\xf8\x82c\x9e\xce4\
-\xf3\xa3\xc5_\xf5\xc1\xb4\xc5p\xe8\xc1\x12S$\x94\x12\
-4\xbeE\xe2\xd5\x1c\x9f\xf3\x02\xaa\xf3\xaf\x9c\xf8z\xf2\
-=?\xf9m\xfd{\xff\xf3\xfe0\xef\x1d\xb3\xdc\xdeG\
-\xd2\xf2\xffb>\xbc\xd8\x1f\x00\x8e\xd5\x9e\x934\xbf\xe6\
-\x13\x88<N\xf4\xe3?\xfe\x1d\xbft\xf3\xa9\xc7\x7f0\
-\x0b\x83\x8b\x80\xc5\x92\x9b\xb8\xfa\xd2\xd1\x8f\xc5\xd7\x11\xd1\
-\x19[K\xaad\xb8\xb3.~l\xda\xb3\xcd\x11\xa6\xfc\
-\xc9\xbf\xf8,\xd6\x1a3\x81\xce\x03Y\xfe\x15\xd7\xeb\xcf\
-\xba,\xec\x1d_\xb8\xf0=\x18|\xd3\xa5$/b\xd0\
-\x92\xa3\xe2J\xd3\xfc\x96\xc3o\xb8\xb4\xc2\xb6\xbf\xe4\xd3\
-pu\x07X\x00\xd5\xa6\xf0=\xde4\x0d\x19\xa8\xcd\xe2\
-z\x88\xa0\xc3\x86T\xb1N\xd5m\x8c\x03\x0f\x07\xf4L\
-`S\xaa&\x14d\xf6\xab\xb1u\xb1\xe0\xd3\xf5\xf3y\
-O\xb4\x03~\xfbQ\xfd\x86\xcf\xb8n~\xe9\xf5\xad\x80\
-\x87\xeao\x05\xe8\x07\x94j\xfdU\xf1\xc8,\xdf\xff\x86\
-\xafw\xc0\xa5S\xfc\x1e\xe3)\xe3<4\xe8dZk\
-\xb1\xe4\x913N\x89\x07\x91\x86\x5c/+\xca\x98\x8f\xa8\
-\xd1\xe5S\x80\xc6\x81en\x07\xdc\xca\xd2k\xa3lr\
-\xc7cLI|\xc9m\xf4\x8e\x09F\x8d\xb8Cl\xa9\
-6\xc4\xe8<\xfbN\xa7p\xe3&\x85\xd3\xce\x01l\xee\
-\xff\xc8\xdbG\xe25\x22\xff\xe4\x8a\xacf\xaf\xce\x17\x02\
-0\xe6\xef\xac\x0a.Z2\xd3\x5c\xcb.}%\x006\
-\xe7[\x5c|\x8ac\xff\xc1\xe3\x18\x0e\xcd\xa1\xb7\x1ai\
-\xd3/\xbb\xf5\xe4\x88\x0c\xbf\x08\xcdQ/\x19\xbd}\xbb\
-/\xbf\x9d+\xbe\xd1\x8d!\xae\xa2k\x89\xf1\x98K\xfc\
-\x94\xd2\x1e\xb10\xa9\xcaM'\xaa|\xd7?\xb4\x1a\x82\
-\x02+\xb0>/@\xe3y\x95@\xdc\x81\x05T/\xe2\
-\xa1\x85\xa8O\xa0P\xc8\x01H0\x98D4N<j\
-\xc3\xd95O\xdf\xaf\x1f\x93j\xbe\x1c\xc3\xaf\x18\xd0\x81\
-\xca_yU\x22R8~\x19e/\x15\x9b\x7f\xfe*\
-#JP^\xbfrX\xaa\xf3\xe7n<\xf5\xd8\x0f=\
-\xf6\xa3\xdf\xf9KebO\x98\xf7\x86\xb1G@;\xf2\
-*\xd5hv8\x86/.\xc1\xffu\xd9\x8b+\xe7c\
-\xd9z\x15l\x16\xc6\xd1e\x85E\x97^\xfa[W\x9f\
-\xf8\xf5\x87\xde\xf8U\xdfT\x0b\xe2\xb2/b\x9c\x14\xa4\
-\x16\x88/x\x89\xbd\xc0\x91\xbd\x10\x85:\x90\xe7\xf5\xcd\
-B\x9c\xf8\x80\xbbI?d\xaf.\x86$\x95\x95\x04f\
-\xe67\x5c\xdd\x01\x7f6L\xb2\xf9\xcegR\x0f\xfe^\
-\xb7\x1f\x8b_\xca\xe43\xdb+\xb5\xdb\xb6\xe3\x18\xbc\xf9\
-B\xdc\x1c\x1cs\xb6\xc7\x987]\xfdM/\xfd\xb1@\
-{]\xdf5\xe6\x1b\xb4\x1c\x94\x9ey\x1e\xb6\xbd\xaen\
-f\x0a\xe3s)|s6\x7fx\xd8r<\xf0Yd\
-Y\x8a\x93\xb5e\xfb\xe6W\x5cb\xd4o\x06\xdc\xbaP\
-?\x18x\xb3\xee=\x9d\x1bw$d\x1e\x04\x90\xc9\xf6\
- cr\xe1\xd5\xf8\xceB(p5\x9b:6\x84^\
-\xa3\xe9`\x90\x01\xf23\xd9x\x18\xc0!\xadc\x1c\xd4\
-;\xba6\x0fW\x22@\xa99s\x83\xd6&\xa7\x14\xa5\
-s\x16dV\xf6`\xd5{\x8c\x1f\xb8r\x0f\xc6\x82s\
-h[\xd34\x1f\xc5\xad\xc3A\xdd\xb1`\xf0\xa1\xfa\xad\
-2\x87z@\xc4\xf2\xab\xca\xa8\xb8`\x94?\x0a#\xc6\
-\xf9\x8b\xcf\xa4%\xfb\x9e\x0f\xa7\x01\x8a\x5c\xb2\xce?\xe0\
-\xe4\x84}lv\xc82Bl\x19\x85\xe3[\xd1\xc9\x05\
-\xe7\x9dZ$T\xd0\xdc,P\xdf\xf0\x91Y\x89c+\
-O\x5c\x11\x8b+\xd7\xc1\x84o\xb6\xf3\xf7\xee\x98O\xa9\
-FhA\xbd\xca<\xdfZ\xa5\xda\xd0\xc9\xa7\x8cU?\
-\xf3-\x97V_\xf6,\xb2s\x94\x9aq\xa1E(\xb1\
-\xf9\x83\x83\x9e\x16\x9a\xec\xad*Y\xea\xe9\x04\xeao\xfc\
-\x8f\xf3g\xb7\x90\x95\x97h\xb7\xae|\xe2\xed\xdf\xf9-\
-\xd7>\xf1{O\xd4\xf0z\xbf\xb2\xf1\xa7\xcfC\x01\xd1\
-u9V\x9fLJ|\xf176\xc1{\xb1q\x92\xf2\
-\xe2\xc4\x1d{\xe9$?\xf5\x1b?\xf5\x91g?\xf1\x81\
-\xff=7t\xd6\x0cr\xc6^o\xd3\xc2)\xdb\xb6\x88\
-X\xa7F\xc0CV\xd0\xc1\xef\xd2\xb2@\x1b\xc7E1\
-d-Hc\xe0E\xbf\xc5\xb7\x0d\xfdF\x9f\xf8\x93\x1e\
-\xe4\x8cQ>\xa6K\x9f\xeb\xc6\xf3\x9a\xfc6\x86n\xc6\
-\x90OZ\xf4\x8c\xf7~\x83\x99{0'\xaf\x93\xae\xd3\
-\x04\xdc\xfc\xce\xd1\x9ai'\x85nT&7\xf8\x1b[\
-I\x1d\x5c\x97>\x7f\x826\xcf\xb5\x9d\xe2L\xfe\xa8\x89\
-}\xb4\xcf\x1aK7\xdd0\xc4\x1f9m\xb5&\x86\xe9\
-\xe5C>\xcd\x15\xbf\xc69\xa7\xf4\x1b\xbd\xf4\xd3<\xc8\
-\x0a\xfc\x85\xfa\xdf\x04\xf9v\x00\xff\xa50\x0b\x16\xcc\xf8\
-\x14\xa0\xf1\xd3\x0cd\x97\x9f\x9eK|z\x15\x9a\xdf)\
-9\x1e9\x00\xd2\xab\xd1\xdc\x01Hl~\xc7\xdf\xb1\xe8\
-\x92?$14\x89\x96\xb9\xd9\xd7\x0b\x9f\xe4\x85V\x9f\
-D\x10G>J\xd3a\xe6\xda\x80\xa4q\x8c9cz\
-\xc8\x0aS\x07<\x91\x83q\xf1Z\x18)\xac\xd5~\x06\
-!\xceP\x18\xda\xb0\xc6\x91\x8c\x0aP\xd0$\x86\xaa\xb8\
-\xbcr\x8e4\x8f\xcc 8%\x96y9GL\xf6C\
-0\xf8\x02u_gp\xd8K\xd4\x9d\x16~\xe7\xa9\xfc\
- \xd4\x8b\xdcG\xf2\xb3\x8c6NK\x16G\x87\x11\x8b\
-\x88h\xf88<X\xe7\x8f\xa5\xa4Jj\xfc+\x07\xf3\
-C\x99\xec\xc5\xbbY\x18E\xed\x1e&\x95\xc7\xae\x0f\x85\
-\xe4\xbbt\xa4Z/\xfc\xf9\x0b\xa9&\x06\x99\xf5\xc3'\
-Xb\xd5\x01\x1d\xc8\x14\xa59\xd6\xb3nlWa\x0a\
-+\xb80\xf8\xae\xd7\xe0\x83s\x93+\x03Mo\xbc\xcf\
-_\xd1\xf2\x09Z\xc1\xf3\xf1\xbf\xc3\xe8Xh\x9fg\xbc\
-]\xfb\xe8\xef\xfe\x83\xa7\x7f\xf3\x1d\x8f\x96\xc8\xa5\x96\x0d\
-\x7f\xee\xb3g\x10\x11\x99\xd6\xd1O\xf4\xb6\xbe\x08\x8f\xf7\
-\xca'\x00\x94\xdegy;\x09\x8c\xa3\x8b|\xb4\xaf\x85\
-\xf0k/\xff\x8a?\xfb\xd5\xe7/=\xf0:_0\xbd\
-\x06\xb3\xd8\x8a\xa5\xfb\xcbt\x81h\x8d\x96]\x0e\xb52\
-\xcd\xc9\x82G\x9f\xd52\xb0\xf8\xe9\xfc\x0e\xed\x8cv\xbe\
-j\xbc\xc7\x1a%\xe8\xc1!1Qv*\x07\xf6\xdb\x0d\
-f\xcei1\xce\xf2q\x9c\xb3\xd72\x9b\xe8f\x19\xcf\
-\xd1OQ\xe6\xa4\xa4\x9e8>\x19\xa5m\x9d\xb0\xb3\x8f\
-\xf9\xc6cLn\xf0pr.[\xf0Mj\x8eW\xb2\
-kZ\x5c\xd1\xeb\xd6Q$\xe9\xaa\xb7j\xd3\xa1\xdf\xce\
-\x81\xe5\xd3\xb0\xf8\xa1a\x8fO\xf3\xa5-C\xbd\xcf\xba\
-|\xb9nIu/\xd2\xf7\xd4K\xef\x84\x01l\x8d|\
-[\xcf\xcc\xed\x95J\xd6\x08\xdf\x96\x84\xf7M\xbbDL\
-=\x1f3\xf0Q\xfa|\xf4/\xb4`\x96\x12\x83\x11r\
-\xf7VO\x1b\x1e\x8ee\xf3A\xa3\xf2+\x1c*\xc9h\
-\xbb6V\x89E5y\xc8QZ \xda\xd5\x96\xb3m\
-e\xc2\xea\xae\xa5\x81\x19Z\x0b\xaa}\x1cI\xb5\xf1p\
-\xe1\xdaw\xac\x91\xdb\xe6D\xfc\xe4\xaf\xc4\xc8\xbb\xecu\
-He\xad\xaeQ\xf3\xb5\x01\x8f0\x9b\x9e\xc9\x07K\xf1\
-\xed\x9b$\xa4\xed\xd30\x88\x04\xe9D\xda\x0e\x0e\xd5\x98\
-l\xe5P\xf2\x18\x8a!@\xf3\x9c+\x9ax\xc2\x807\
-4C\x17\xa1z\xde\xd9\xbby\xd5\xa4t\x99\xad\xcd'\
-\xb9\xb0\x94e\xad\x9f\xceV1\xc0{l\xbf\x076\x02\
-\x0d\x22\x83j\x0a\x08\x8a\xe6\xa8\x02\x09g\x1f&\x95\xcc\
-9\xa8\x97|\xca\xde5\x95\xa6\xb4\x5c?v#o\xe3\
-\xa0\x18\xcd}\xf6\xca\xaf\xfc\xfew\xfd\xb5o=w\xf3\
-\xe6\xb5\xb2\xe7\xdd\x7f\xfa\xfdC\x00\xa1x\x00\xa0\xe7u\
-O5?\xb2\xddSS\x1a\x93\xc9\x09K\x9f'\xba\xf9\
-\x04[\xbev\xed\xfa\x13?\xfb\xbd\xffm\xfd?\x01W\
-t\x83f\x81\x15\x8b\x85\x94\x9b\x85\xbc\x96R\x17\xb0\x06\
-Zf^\x15\x80\xab\xd1\xf9\xa6\xbe\xad\x94C\xbe\xfd\x99\
-n\xbey\xcd\x97\x0fb\xec\xf8\x22X\x97\xf8Z\xcf\xd1\
-w|\xfbr\xdem\x9a\xf2\xb5&\xbc-:9\x07\xbd\
-\xc5\x8d&\xf81\x8e0z\xdf\xe0<\x9c\x1c\xf5\xb5\xb2\
-\xc5\xd9\xa4\x83\x0c\x0f\x82O\xfcY/\xe7\x13\x7f$\xc5\
-y\xda8\xc7e\xf3R7b\x0f\xb9\xfc\x98c\x1f'\
-\xf9\xc5\xedX[\xc8\x8d\xefs[\xdc\xceA\xfcY.\
-\x92cqcuc\x1c_\xf4p\x12w\x93\xeb&\xc6\
-\x0f\x06^z\xc0\xdf\xff\x9e\x08\xf8\xc9\x0bG\xf2\xdb}\
-b\x91\x82\xf5\x80\x0b\xc3\xf4&\x1f\xe3,w\xae\xb2\xe7\
-\xdeV8Wc\xcb\x17I\xfe\x0aO/;\xef\xfc\x0d\
-\x91F\xf3*\x85\xecJ@\x8c\xce\xc3\xac\x0d\xdf8\xf9\
-\xdd\xae5\xdc)%\xcd'\xfc\xa9v\xe03\x0f\xe4v\
-\x18\x9d\xfa\xa2\x8d8%\xdb\xe6k\x8a\xa8\xfc\xcb\x8a\xf5\
-\xf4\x8d\xc6\xad_Y\x13dS\xe8\x11\xcfy\xa2\x03\x88\
-\x9a\xf3\x95\x9f!\x180\xfcOz\xfb(WI\x8a\xbe\
-\xb8\xa3\x0d\x22\xca6dbh\xd8\xe9i\xea<\x0f\xab\
-\x98G\x1b|\x82\x0b\xc2\xbfje`\x8e\x09\x89J7\
-zp\xe4.T\xfbE\xf6\x97l\xa2\x8b_\x12z`\
-\x9aOu=\xb6\x07\x19|\x0e\xb0\x03\xa6Y\xed\x11r\
-\xbd\x94\xa9\xcc\xc4\x17\xaa\x81\xc80\xc9\x14\xa0\xc0\x07y\
-\xa7\xbe\xe6\x11G\xd3\x13\xde\xd7M;\xecy\xe1\x0bo\
-4,9\x7f\x8d\xaa\xad\xfc\xe6\xd5'\xde\xf9=\xff\xdd\
-\xb9k\xd7\xd8\xfc\xb3\x17\xb07 \xcf=nx\xed7\
-\xff\xb8O_\x90\x17o\xbb\x97?\x01\xe0\xach\x0d\xf4\
-\xe9\x89|\xac\xbf\xf0\xec\xa3\xef}\xe2\xe1/\xfc\x8a+\
-\x17_\xf6\xea\xaf\x11\xa0\x16\x14gx,\xa0\x1e\xb7/\
-_\x18mg\xdd\xd2\x82\x9d\xe5\xd96\xaf\x98\xa6\x883\
-\xcbr4\xf9\xda\xf8\xb1\x1c\xf6\xb1\xa3=\x8co\xdc\xf0\
-}H\x1b\xa3\xd8Q\x1c\xf8\x1a\x08\x04U\xa25\xb3\x8c\
-j\xf3\xe0\x9b@\xec\x9b^w\xf58\xaf\x9b\xc5\x16h\
-\x96qU\x9c\xd8\x85\xb7/\xdfP\xed\xcfr\xc7\xd5\x8d\
-)q\xb89\xd69k\x9dj\xd1\xbe\xa2\x83%Y\xf4\
-\x0d\xab94/\xd8\xd9Wt\xd4\x01\x97\xa6O\xfc)\
-\xae2\xae\xf1!\x9f\xa9ynMo\xbb\xf5\xc66\xa6\
-\x9c\x03\x95\x8e\x9f\x09\xc0\xd7\xad\xba75\xbf\x8d\x07\x0b\
-\xdb\xb7\xc5T\xdf\xbd\xf1\x951\xbe\x94p\x1f\xba&\xb1\
-\xfb\xdd\xff\x00 8&\xf1h\x9e\x90\xfa\xcc\x09n[\
-\xab\xf7u\x22\xacr\x84\x1e;5\xf2Xn\x9a\x95z\
-\xc6\x87\xc2\xd4@?v\x00\x97s\xe1\x1dK\xfe\xb1\x83\
-\xd5\x5c\xf0\x87\xdc\xbam\x10o\xee3*\xd8 +=\
-\x9d\xc0\x8a\xc1\x80/\x1ed\xa4\x13\xd2p\xe9\xf1\xc0f\
-\xe2\xb9$\x9e6_r O e\x0f=\xfe\xb7\x1f\
-l\xf3O\xda\x0f\x0f\x22\xb4O\x81E\xc7\xc94!\x06\
-0\xe4\xbc\xc4\x0a\xd6\x13G\xa7\x5c\x8bk\xab\xfb\x91\x9b\
-\xb4d\x5c\x0f\x90\x05\x88\x1e\x8f\x98p\xa5\x8f\xfbK\xf0\
-\xfb\xe4\xe2\x83\xab\x094K\xbb\x1d6\x9fk\xf3L\xd6\
-QN\x85\xd6\xc9*\xbb>=J,\xd6BW,\x09\
-\x10[yu\x97\xa4b\xa7\x1f-\xb2\xf3\xd2\xbc\xb19\
-\xc9\xce\x09\x07V\xa1\xd7\xf7\xfa\xa59<(\x7f\xc5\xad\
-|:\x16\xdd\xd5\x0f\xff\xf6\xb7\x7f\xfcG\xfe\xe1;\x0a\
-\x9dw\xfc\xe9y\x00@\x9e\x1f\x0a\xb2\xf9\xe3\xdc\x81\x91\
-\xee\xa1v/=\x00pZ\xb6\x15t\xba\x0c\x8e\xdb\x0b\
-\xd8\x83\xd7S\xef\xf9\xa9\xf7<\xf2\xc7\xfe\xcc\x1f\xafo\
-\x05\xbc\x01P\xaf\xbb\xado\x9dm\x09\xc5\xc8X\x96\x88\
-\x16\x9bU\xbd\xfc\x1c$\xab'\xac\x19'~\x1d\xc0\x10\
-\xf3\xac\x16\xf3i\xb8\xd8\xcf\xf2\x81\xedNq\xf63\xa3\
-g\xf9X\x94#v%\xab\xd9\xed&\x18l\xdb\x94\x18\
-\xba\x8cm\xf7\x05\x5c\xba\xf2\xe3\xba5/E\xe0\x0e\xdc\
-\xf2\x86-7\x93nl:\xe8D\x8f\xaf\x8aV\xfc\x9c\
-\x0fz\x8dE\x07h[0\xd8M\xdf\xfa\xd8\x0a,?\
-\x8c#\x97\xb3\xa1\x13w\xca)\x98\x93|\xd1\x9d\x13\x7f\
-6\x98\xdd\xb0~8\x90\xdb\xeb\xc8\xb3 s\x95\x94S\
-\xe9b\xb7\x87L\xb5\xac\x02W\x0f0\xb2g\x12(\xe4\
-\x8d?j\xda1\x9b\x0a\x86\xd6\xb3\xdf8]\x976\x93\
-\xa9\xbdK?F\x8e\xd5\xd8\xe4o\x7f6y\xdf'\x86\
-\xe3H{D\xdc\xcf38E\x0d\xbe\xfb`\xe7\x9f\x1a\
-\x97\x8e\x04\xaa)\xe7\xc2\xa2\x0b\xd6\xd3G\xe9L\x8c\x19\
-\xb3\x16.\x1f\xfbc\x93\x9d9K(\xc7\xa5\xe36\x13\
-=#\x0dJa\x1dci-H\x89\xa2\x95\xfdn\x1d\
-\x84s-\xbd\xcc\xb67\x0as\xa9\xb52l\xd6\x11-\
-\x9b\xbc\xaa)\xbe\xe6\x03\xb2\x89\x99'H<\xf8\x81\x80\
-s\x0ds\x8b\x81\x84\x8et,8\x1a\xb2\xcf\x9f\x085\
-\x04\x04\xa4\x0ei\x11\x0fz@\x00\xd2#\xa2\xf08b\
-;\x97\xde\x9f\x024\xbe\xfd\xbb&\x95\xc1X\xa7\xe4\x85\
-+\xe6\xd8\xd7\xf0\x84%\xd7\x9b\xcf<\xf9\xce\x0f}\xe7\
-\xdf\xf8[%e\xd3\xdf\xf7\xd9\xfc\xe9\xb3\xf9C\xe5E\
-\xdb\xf7\xd6\xbe\x88\x8f\xf7\xda\x03\x00\xa7\x82u07\xad\
-\x8bR\xdcA\x7f\xf3\xfc\xcd\xab\x8f\xff\xe2Co|\xeb\
-\xbfS\x8b\xe8A-\xb2\xc9\x93\x17\x96\x1de%\xec1\
-\x13\xfc\xf0b \x81\xca \xbc\xe0\xce\xe4\x07\xd4=\x13\
-8\xc9\xdf\x814\x04\xe5\x0b\xe2\x98\xd5\xba=\xc6c\xd3\
-K\xee\x8b\xe7T\xfe\xb8\xf0\x1a1\x8d\xe7\x0dm\xe3\x93\
-=\xcdq\x0e1\x87\x17\xac]\x1d\xe2}V)\xa0s\
-3\x1f\x7f\xa5\xcb\x05\xafa\xdf\x98\x92\x7f\xe3\xe5-\xb8\
-\xf4\x8d\xf7y\xed\xdb^\x87\xcdy\x99s\x19\xb8\xe6\x9b\
-\xce\x0d\xc7ii\xcc\xa1\x1a:r\xd3l'\x9f\x997\
-\xbd\x10\x05\xc4\xec\x91T\xd6\xdbh\x99\x87\x00~K\x80\
-\xdf\x10\xa8\xd6\xee\x9a\xd77\xbc\x1a\xf1O\xf1\x04*\xb9\
-\x80\xc1:\xa1\xb2\x8e@\xc3\xb2a\xe4\xdd\x07\xcd_\xce\
-\x0aW\xb9f\xee=1M\xd0\x18\xdb\xec\x18,\x09:\
-\x93\xd4\x8e\xca&\xdax\x87\x08\x8cP\x1c\xf4\xaa\x03E\
-s\xe1\xb0\x0c\x0ef\x06\xea\x91\xe7F\xac\xc1kD\xe5\
-\xa0?\x02\xa3\xb7\xeb\x80\xc10\x8d\xd9\x03yo\x1b\xe4\
-V\x17;\xd7|a\xc2S_\xf5\x1c\xe7l\xc2\x10\xab\
-@Y\x8f\xc2\xca\xcc\xb9\xe8\xdaL\x9by;\xb3\x831\
-#\xf2\x82Y-)\x12\x18]\x9fD\xa9c\x13\x88\x9a\
-\xfa\x9f9\x8el\x967\x7f~\xe0O^K)w\xd5\
-3f\xb3gw\x8b;l\x8c\xa3\x11\x869\xc1+\xad\
-~p\xb0\xc6\x92AQ7\xad\x098\xd50\xa8\x05Q\
-\x03\x9c*8\x86\x122\x16\xb6\x09\xe8\xaa\xf5\xe8PB\
-)~c\x1aK\x5c3R[\xe7U\xca\x83\x96s\x12\
-\xef\xf5)\xda\x13\x9f|\xfbw|\xf3\xb3\x1f\x7f\xff\xa7\
-\x0a\x98\x8d??\x03\xc0\x85\x95w\xff\x94\x22\xaf\xcc \
-\xfdA\x8c{ap/?\x00\xb0r\xb6\xb5\xe5\xb3\x15\
-\xdd\xa9\xfd\xb5\x8f\xff\xde\xd3\x0f\xbc\xf2\xf3~\xeb\xd2k\
-\xbe\xe0/\xc0\x170\x8bO\x0a.\xec\xcd\x99\x96\xe3\x14\
-\x85\x857\x0d\x05D\x976\x89\xc2\x89\x1fc\xf5\xb3=\
-\xeaY\xb7y\x8a\xf5\xb0\xb7\xfd\x10\xe5\xd1\x89H\x87\xc4\
-9\xeb\x11p\xe2\xf8n\xbeq\xf6\x981f\x0e\x1d\x7f\
-\xe2d\xe3\xcb)\xd9c\xc6\xb8\x22D\xde8\xba\xdfX\
-\xdf\xbe\x8d\xc9\x8d\xb7jN\xc8\x03[\xdd\xfc*\xfd\xe1\
-\xab\xfdz\xbc\xdd<\x12C\x19\xdb\x899E\xd6\xec\xdb\
-'\x13G\x14\xbfl\xf4\xbc\xc2\xb7]\x80\xd6\xa3I|\
-y\x1fcq\xda\xb6\xe7\x0f\xbfB;f9,\xa1n\
-\xdb\xf5?\x0a\x9e\xe7\xcdK\xbb\xab,\xea\x9f\xcfQ\x22\
-(\xbfp\xbb\xf7g\xeb\xe0\xaa\xd5G\xb6\xfc\x1b\x0d\xdf\
-4\xc5\xf0\x9clF\xaf\x02\x96\xa9\xbf\xdf_\x18\xb4z\
-\x95\x9c\xdc\x93\x81\xf5\xd8\x1b5\xe1\x83\x9dc\xeb7\x06\
-:-R \x87\xccG\xe3>\x94\xda\xef@\x85\x01\x86\
-\xc2\xf8>\xc95\xe8,\xb0\xd1\xba\x93\xcf\x92\x89o\xb9\
-b\x10\xa7^\xcei[[r+\xdb\xe6`\x8fU\xec\
-\x9e_\xbbt8=L\x90\x7f\x05#6~\xe4F\x83\
--M)\xdb\xff\xec\xc0\xa4:\x16\x80Dh\x9a\x92\xfd\
-\xf8\xd9\xc5\xb2\xf2\xb4\xf7\xccz\xb0E\xd7\x16_\xeb\xb7\
-\xdc\xb0\xd9\xf3o\xc8&\x03\xebf{\xf2\xd5|\xc1\xcb\
-\xea\x15\xa69\xb3\xe6\xf9\xa7\x8f\xfc\xcb\xca3@a\xd0\
-i\xc2\xc9Y}\x19\x15\xc0\x08}\x82\xd5\xd1\x1c\xc7\xde\
-\xad\x9a\xf8%\xda\xcd\x10\xa4 \xbe\xce\x1f\xd1J\x06#\
-]g@0\xbc`P\xae\xc2I\xd1\xd8[7?\xfd\
-\x9ew\xfc\xd5\xc7\x7f\xe6{~\xbd\xb4\xd9\xfc\xe7~\xff\
-\xce\x9f\x07\x00\x92\xcc\x0bgI:=\xba\x17}\xbb\x17\
-\x1f\x008)Z\x0f\xbb\xb3\x13\xdd\xdc#\xef_\xe7\xae\
-\xbc\xf7\xe7?\xf4\xf0\x9b\xdez\xfd\xd2K_\xf5'\xe7\
-\xb3\x0d0c\x16\xe1\x90w\x81\x18\xca)\xa0S\xda\xec\
-\xeb\x14\x88\x16\xefi\xb6;\xd1\x1fF\x9fGd>\x8f\
-\xf16\xeb\x22O\x18\x89=\xce\x8d+\xbd\xe8\xc5\xd1|\
-\xab\x17\xbd\xb0*R\xf4\x0c\xe1o\x1bs6\x05\xd3\xbd\
-\xa9r\xa74\xdd\x17\xf3\x8c\x11\x7f\xb2\xcf6\xa7\x92\x1b\
-\x85c\xe9&Q\x06\xc7\xb5\xce7\x92M\xf6)\xf2\x0d\
-/x\xf2A\xce\xf8L\xbe\xc1\x1c\x0b_\xb3#y\xc9\
-3\x7f\xd3\xed\xe3\x07\xab\xbe\x0eM\x9f\xe2\x97_\xd3}\
-\xf3\xad\x87\x80s7\xae\xb9F\x1c\x09\xeaI\xb4n+\
-\x7f\xf46\x0c/\xed\xad:\xa8rQ\xc2\x96x;\xc0\
-m8\x82\x9a\x07\xa7\xf4:K\xd5\x83\xe0\xc5\xf6@\x9c\
-\xb9f\xe8i\xcci\xf6%%:\x84\x80F\xac(\xe0\
-lf\xf9\x08Q\xbc2\xf6\xb95c\xe3\x19\xe6\xfa+\
-8a0{\x17-\xd9k\x90\xd8\xcc 9\x03\xf2\xcc\
-d\xc0\xac\x04(\xcda\xfe\xb2\xc8\x8f\x00B\xf6\xba\xc5\
-\x83\xf0\x1d\xb4\x07\xf1\x85Ks\x0c\xb2't\x8cg[\
-\xc7,u\xbbG\x01\xa0\x1ay\xa6\xaeR\x14[g\xc0\
-\xd3m?\xfa\xfb\x11\xc85_3\xe0\xc4!<\xe6\xee\
-\xb8\xa4i\xa7\xf6\xccC_\xc2\xf1\x09\x80\xe6?\x14p\
-\xa7,\xd0\xcb\x81\xb5\xce%\x0f\x01\xe8\x88Q\x18\xf1[\
-F\xad\xf8\xea<\x99\xd6y@n\xf8E9s\x22W\
-_\xe7Sn\x8d\x10\xdb1\xcc\xc9y}\xe6#\xef\xfb\
-{\x1f{\xdb\xdf\xfa\xbe\xd2\xe6\x9d\xfe\xbc\xf9#\xe7\x01\
-`~\xe7O\xe4\xf9\x85\xd3{\xae\xdd\xeb\x0f\x00\xacf\
-\xda\xb1\xfe4\x1d\xfa\xf3O\xfd\xda\x8f\xbd\xeb%_\xf6\
-\xb5o\xbe\xf8\xe0\xc3\xffJ\x1c\xb0\x1a$\xd7\xaa\xcbz\
-\x1fk\xb4\x0c\xc8\xfbvD%\xdc\xf05\x11\x8e\xf1'\
-\xf3\x10O\xfa\xc4[.\xf1\x01;C\xd8y\xe8\x9b\xd4\
-F\xd8\xd9e\x98tI\xb4\xfby#V\xa9c\x87\xd7\
-\xf2|\x03\x8dl\x13\xb5\xe4\x06#\xb0\xf0\xb6\xf7\x9cd\
-\xe8\x1b\x90\xf2\x00\xb2\xe5\x82,~\xc7b,{\xcf)\
-\xb2\xfa3\xf8\xa6\xbb\x86`\x93\xd3&\x13\xd3gm\xef\
-\x0bl\xf8\xee\x0bi\x95rq*\xf6\xb9\xe16\xce\x09\
-~\x81\x9an~\x8d\x99\xb2}V\x8e\x97\x1f\xf4\xb71\
-;\x08X\xb2SU\xc6\xfcKA\x83\xa8\xae\xfa\x96[\
-\xb1\x051@\x0e\xa8\x80\xe6'\xa7\xae\x07\x8e\xf1bO\
-b\x1bcQ~p\xed\xba\xf8\x5c%'\xb9\x1e\x07\x87\
-\x9c\xfd\x90\x93?\x09\xc8&\xd3\xfe\xabS\x0d\xf0[\xb2\
-|\x87\xa8y\x945\xf3\x01X\xfb\x0d\x0d\x9c\xf3`\xb0\
-A\xbc\xa1\x0d\x07\xc6(\x80h\xe6)b\xcfY\xbe\xb0\
-\xe1\xcf=r\xbe\x8d\x90\xb9\xb2\x09\xe1\xc6q\x1b\xdf?\
-\x18\x07\xde\xe4)W j8E\xefN8r\xc7\xa6\
-\x80\x92,\xa2\xd2~\xda:\xa3@6\xbdj'\xc9\xbf\
-\xb7\xef_\x13\xb4\xce\xee[_\xf8\x81,\x032M\xf9\
-\xcbC\x8d\xf9\xaa\xf8\xbe\xa6j\xc0'F\x00\xfa\x9d\xbf\
-\xb0\xd0x\xcd|\xe5\xecM\x7f\xd4\xc6\xce\x00\xca\xa7#\
-i\x88\xa2\x85\x8c\xe9\xa9ue%\x1b\xb5al\xfbV\
-_`\xcc\xb6\x0c\x93\x0bs\x8c7\xc7\xf2\x8d\xa7\x1f\x7f\
-\xfb\x87\xfe\xf1_\xfd\x9f\x8a\x95M\x7f\xff\x10\x90\xcd\x9f\
-\xfe\xd8;\x7f'\xe0#\xd3\xbf\xa7\xda\xbd\xfa\x00\xc0I\
-\xca\xf2H\x1f\xdd\xb11\xba\xf9%\xec\xd5\x0f\xfe\xda\xcf\
-\xbc\xe4K\xbe\xe6O\x9f\xbfx\xe9\xd5Y\x88\x18\x8e5\
-\xc8\xba8\x8e\x19K\xe7\xa0g!f\xe2)8\xef$\
-\x0d\x9c1\xf6><\x0c\xdc\x8c\xa9\xfcJ\xef\x0b\xa5\x90\
-\x03S\xf2\x98\x9c\xf1\x037cD\xd9\xf8\x03#z\xc7\
-o|l\xee\x0b\x90\xd9O\xf1\x83\x91U\xf1\xfb\xa6S\
-rl\xea\x07}\xd3Si\x87r\xd55\xa7=\xaf\xc7\
-\x1b}\xe2\x17Y35]5\xc1\xc7A\x5c\x8da\xbb\
-\xd9\xeeR\x11\x9b\xd6t\x95\xef\x90\x0f\xaekb\xe8\x18\
-\x87\xd3\xea\xd1\x1d\xf0\xf1}H\x1f\xfcA\xe0\x93\x00\x9a\
-~8\xd0\xe2\xc1qv0dn\xf9\xed\xb8t\xca\x91\
-!\xf61)\xcb\xb2\xb9\xc8\xd3<\x9b\x0d\x17Z^P\
-\xda/\x16\xbf\x03\xa4\xa79\xa6W\x969R\xe7\xd0\xbe\
-\xe6\x09\xe3\xf7\x18\x1e]\xfe0\x12\xf4\xce\xc6\x9b\xbf\x83\
-)\x00i\x0b\xa79\x15\x8a\xfc\xe4\x90\xf5\xeb'\x05\xe6\
-\x97\xf9\xd3\x9bn\x8f\x82\xa2\xb3R8d\xfc\xe4E|\
-\x05\x96\x8eC\x01L\xacs\xd2` \xd1!w\x8d\x0e\
-\xfa8\x9c\xf9\xc2\xce\x87\xf2\xaf\xe6\x9c\xe5\xb2\xc6\xd1\xe6\
-\x87\xfd\xf2\xce\x9b\xff\xd9\xefB=\x98\xd0\x1b\x0b\xd2\x92\
-\x9fM\xcc\x8c\xeco\x13\x80\xc8\xb9\xaa\xbe\xff\xa8\x8e\xaf\
-\xc1\x8eT.HW\x91\x95\xb7eW\x0d\x19@\xd57\
-\xc5\xd2\xd8p\xac\xf0\xec\xa9\x8e|\x0d_e\x22=\x1a\
-\xca\xf0\xb7\x13`\x9b\xcc\xd8\x0d\x13\x1d\x9f\xc5!O\x9a\
-e\xdbo>{\xf5w>\xfc\x7f\xfd\xf7\xff\xe5\xcd\xa7\
-\x9f\xb8R\xa6\xfd\xc6?\xbf\xf3\xcf\xe6\x9fO\x00n\xf7\
- \xa0X\xf7\xc2\xe1~x\x00\x98\xcf\x93\xd7L\xad\x8f\
-I\x89\x9cqd\xf5\xb5p\xae\xdfz\xf6\xa9\x9f}\xe8\
-\x0b\xff\xb5?_\x0b\xfba8\x01L|\xaf\xd9Y\x01\
-\xae=v\xd7V\x8f\x0eu[\xf0\xcdE.\x94M#\
-)N=\x18\xc6\xbd\xbf\x11|L\x0b(7\xbf\x099\
-d.\x9c\xe8\xe9'\xdc\xc0\xa0F_}c\x87\x9c\x8b\
-U\xa6\x02\x08g\x7f\x8egy\xdb\xcc\xdb\xd6\xf8l\xba\
-\x13}\xc4\x11_\x81\x0e/\xf0-\x07\xdf\xa43/<\
-\x8f\xd9\x14\x0f}|\xcc7\x88\x0e \x9b\xf0\x9e\x0c)\
-\x8cfnEj\x1f3_>\x0by\xd8\xfb\x06\x14\x07\
-\xe25\x06\xf7}\x7f\x1a\xfe\xc0%\xac\xfc\x04\xd0\x0ef\
-\xdf\x99W8\xc3\xd6\xbf&X\x7f\xbf\xc2g%\x0e\x05\
-\xec\x00*w'\x10\xfb\xde\xa1\x8b0\xe6\xd3\xce\xc6\xd8\
-.6\x1f\xa2w\xa1#{\xbeVf\xf5b\x9be>\
-\x81GG\xcb_\x0c\x9c\xd7K\x0ab^\x81\xe6|5\
-\x0c\x1b\x0f\x96\x05\xe9\xd2\xbb\x8eD,\x1b_\xd3f\xef\
-\x0dz\xe3\xa4\xdcp\x9cu\xad\xef\xe6\xb9\xabQ\xd9\x9c\
-\x02}m\x8f\x05T\x8c\x02X&\x8f^s\x06\xd6\xa8\
-b\xe8\x19\xc3\xb1\xda\x81\xf5\x22\xc1\xc0\x863\xba:\xb0\
-\xf9\xd7\xc0\xf9#f\x5c2z:\x83%E\xe6g\xf7\
-\xd3\x84* Lb\x92\x0e<\xf4\x99\x83l\xd2t\xce\
- \x0cR'^sd\xc0L\x0d{>>\x7f\x10\xe0\
-O\xf5\x92\xa6\x0e\x04r\x02\x92\x13\xd7fx\x9eW\xe0\
-\x8eQ\xba\xe6\x08O\x10Z\x0dT\x0fz\xc6\xa1RC\
-?\xb9\xa0\x15F\xd7f\xe31\xab\xdd\xbc\xf1\xc9\xc7~\
-\xf2\xbb\xff\xca\xd5\xf7\xfd\xd2\xc7j\x9cw\xff\xd9\xf43\
-\xce\xbb\xffl\xfc\xb0\xe3!\xbd\xfdm\xfa\x8c\xef\x89\xfe\
-^~\x00\xe0\x04\xf5j:\xd1\xe7\xe4\xcdv\xe4\x13\xe3\
-g?\xfa\xfeO\xd7\x0f_\xfd\xfc\x03\x9f\xff\xc5\xdfp\
-\xe1\xc2\xf9\x07\xf6\xab\x02\x82u\x1cC\x8f\xfbC\xdd\xde\
-\x1a\x94\xfa\xf9\x8e\x12\xc3\xd0\x1d\xfa\x99\xae\x86B\xda\xeb\
-\xbc\x91n\xf4\xde\xcc\x87\x9f\xb6d\x9c\xbe\xd4\x1b?Y\
-n7\xbc\xbd-\xe3\xf4\xe4cW\xc5\xd5U,\x87\xbe\
-fK\xb5\xb7\x85\x97\x1e\x80f\x98\x8b\xbe\xe6\x84\x8dF\
-6\x87\xb6-V\xf8\x03+>\xa4\x8d\x8f\x0f\x1ai\xf9\
-\x06\xbb\xc5:\xca\x17\xf6\x08\x7f\xa7\xc7_\xe65\xc7w\
-\xac\x93\xfc\xbd~\x9e\xd7\xc6\x07\xe5\x5c{\xfaV\xf4\x91\
-\xfc\xf7\xfa\xf3\x17\xeb\x12\xe6\xdd\xda\x8d\xba\xa7\x91\x14M\
-\xc9u\x9f5Y:\x99\xdb\xa6Z4V\xfar\x9c\xfa\
-\x0c\x1b\xf6j\xb3\xdeygS)\x1b\xff\xa8E\xfdc\
-CJM\xe1Y\xe7\x9c\x0eVp\x11j&xv\xae\
-\x86x\x08\x0f\xb5\xf8\xeeK\x14\xce\xb0\xe2\x15\xc09\xcb\
-\xa2\xfc\xb2F\x1aZ\x18\xa2O\x9b\x948\xf0\x5cC\xcd\
-\xa9\xf3p6\x1c\xc9\x99P\x96\x5ck\xc7\xf2\xaf\xfc\xb1\
-\x13b\xab\x07\xae\xda\x18\xb1\x83u^\x22n|\x91\xcb\
-\x22#\x07\x81\x9b\xdfy\xd5\xa8\x1c\xd4~o\xbbs\x82\
-\xc2XD\x10\x1aS/\xf4\xb6\x95\x5c<\xe6\xa7w\xff\
-\x05\xc5\x05\xef\xfa\x0bP:\xff\x94?s\xe1\x15_\xd9\
-7\xd1\xf9\xaf/N\xf5\xc1\x7f\xfb\x1c\xef\xfe\xedN\x1e\
-\xe0$?\xbcJ\x96\xf7\x80\x0aQ|\xcf\xb3\xea\xa4\xe2\
-\x88:\xe9\x83m\x15f\xe6\x0fM\xa2\xf9\xf2\xad\xc4u\
-\x18|\xf2j\xe8\xe8\xcd/m\xc2\xe3\xe8\xd6\x8d\xa7>\
-\xf5\xf3\xdf\xff\x9f=\xf1\xf3\xdf\xff\xdb5\x9a7\xfb\xbd\
-<\xbf\xf3'\xd8\xfc\x92'\x0e\xd5:\x11\x0f\xee\xa5\xe3\
-\xbd\xfe\x00\xc0\xb9:\xb1fZ\xb7\xd7\x1f\x1b\xa3;\xff\
-\xcc\x07\xdf\xfd\xd8\x85\x87_\xf1k\x0f\xbc\xf6\x8f|C\
--\xb8\xfa\xeb,\xbd&\x11F\xf3\xa59\x86\x12\xe2\xf2\
-P\xcb\xe8\x84%WA.*\x81\x82J\x1f?\x19\xa7\
-O>5\xf6]I@_\xa4\x04\xdbpm\xb0\xa3I\
-/D\x8d}\x03\xc7\xcc\x85i^z_\x07\xb9`7\
-{f\x03N|\xd1cO_\xca\xce-\xb1\xec\xbeF\
-S\x9cm3\xec8eK\xfcysAw\xe8\x077\
-\xc4'\xb8e\xec\xc2\xc9\x7f\xe6&\xd6\xf09\xfc46\
-W\xba(\x07\xfc\x9e}\x1b\xe0\xd1\x82\xb3l\x9dd\x0e\
-\xd5\xb0\x07\xab\xb1\xb4\x87\xbaV\x1d\xe0\x86\xae\x849\xc6\
-\xd0\xcfJ\xbdK\xabK\xf9\x16\xf7\xb7\x0a\xb8\x15A\xf0\
-\x91\x15\x9c\xfd\xfa\xd8c\x0b3j\x00\xbb\xc6\xfe\xef]\
-]ol\xf1G\xcf\x16\x82\xa6\xcf\x86r\xedme\xe8\
-\x0a \x14\xbd\x01\xe5e\xce_\x06c\x0e\xfcw\xa0\xb9\
-~B\xf5>l\xbdA\xa8\x94\x8b\x93\x92\xff\x0b\xf3'\
-\x00\x07\xa1\x0d\x22g\xe7\x0f\xbct|1\xff\xaa\x09\xbd\
-_N.\xe9\xba|\xf0m\xd7\xbbu\x86\x22\xf7\xcce\
-\xc6\x99\xb9\xdb\x11]\xcfP\xb6\x1e\x0f\xb9\x90\xa3\x00d\
-\x87\x818\xa9\xb3]\xda\x22\x92\x15\x94\x93 \x06\xfaa\
- \xdc\xe6\xc3\xc15M\xf3R\x9cbU>~\x00!\
-N\xc7b\xfe\xcd\x93g\xf4\xf5\xcf\x8d`%\x87\x9f\x84\
-\xa5\xc3_\xc3\xe8$\x87\xd96\xf1\x8c\x812%\xb5\xf9\
-t\x91\x95\x8f\xdc\x08\xb89\xb6\xdb\xf2\xab\x988$\xa5\
->o\xe7n=\xf3\xc4\xaf\xfc\xd8\x7f\xf1\xf8O\xfe\xd3\
-w\x95:\x1f\xfb\xa7\xe7\x02\x89<o\xfe\xf9\x04\xe0\xbe\
-\xf9\xe8\x9f\x9a\xd1\xee\xa7\x07\x00\xcf\xf8\xe4\x91\xf5\x94\xd5\
-u\xac\x97\xee\x99\x0f\xbc\xeb\xd1\xcb\xafz\xfd\xef\x5c~\
-\xf5\x17\xfc\xd9Bs\xbf\x19\xa4\x93.\xcf\xb2MW\xc0\
- \xce:\xc2e\xbc\xef1\x95n\x5c9\x9d\xee\xd0\x95\
-=\x17\xc5\x89\x9e`\xdb\xcdm\xf6c\xba}\xf9B\xc2\
-M\xb0\x1dR\xf4\xe8\xb6\x1e?\xca\xb2s\x12Oi4\
-\xa6d\xec\xb4\xcd\xe7\xc6\xdf6\xfc\x02hj\x87y\x88\
-\xd8\x87\x8d\x9f2\xd8\x0f\xe6Q5\xe5\xd1\xb1f2\x98\
-\xcc\xa9\xe4\xe4\x9c\xf8\x816]\xd8\xe8\xd2\x87\x7f8\xce\
-\xc8}\x9f\x91S\xf8[-@\xe3\xef\xb4v\xcc\xb6G\
-\x1f\xd0\xf5\x10P\xcf\xa6|\x12\xc0\xec\xf2vo\x0a \
-\x9f\x908\xe1\xb48\xa8^\xbe\xb3\x8ej\xc0x\xd4\xa8\
-\xb1\xe8\xa4\xb7\xa1\xe4\x1a\x15\xc7n\xea\x5c\xc8\x9e\x1b~\
-\xf3\xf1S0x9\xe8\xe3\x7f\xc6sk\x8cp\xe8\x11\
-:M\x0d\xda\xae\x14g^\xc3F\xbd\x0a\xa7w\xc6z\
-\x87\xee\xdc\xb6\xe9\xb2i`\xc79yv\xc6\x0c\x19\xd5\
-\x10\xfb\x98\x8f\xe6\xe65f\x9d\x7f2\xde,Q\xf8\xef\
-\x1a\xe4\xa9\x0eV\xa8GN+E\x13\x5c\x19\x02\x94B\
-:\xc0\xd8\xbbf\x1ar\xb0\xcf\xbe\xb2j\x04\xb8t\x95\
-\x84%,\xcc\xa2>\x85(\xb8\x18u\xc0\xe6w\xf6\x1b\
-\x16\x1bz\xa1\x1bh\xb6?)(S\xf1\xcb\xc0\x97\x0a\
-\xd5\xb9\xf0\xa9\x12\xad\xc8\xf0\x83\x11P\x1a\x8c\xfcz(\
-\x9e\xcd\x0f\x92a\x17\xb1{< b\x98[\xc6\xe5A\
-\xa2#\x81\x18\xff\x9b\xdf\xe0T\x1c\xc9\xe1\x08\x05R1\
-\x9a~\xe3\xa9\xdf\xfe\x99\xbf\xfe\xd8\x0f\xff\x83\x9f.\xc3\
-\xbc\xd1\x9f\xf5\xce\x7f\xde\xf4q\xead\x91\xdc\xf6\xe3\xe8\
-\xef\x89\xfe~x\x00\xe0De\xd5\x9c\xd5\xdf\xd6v\xe5\
-\xbd?\xf7{\x0f~\xee\x9b>|\xe9\x95\x9f\xf7u\xf6\
-9-\xd8\xb1\x1c6\xddP\x1d\x08\x09S\xca\xdcqF\
-z\xb3\x0eR\xb0\xe9\xa3b\x9c\x1bS\xc9\xe3\x22\xc1e\
-.\x14 \xcd\x9b.\x1ci\x18\xd7+\xd8\xf9\xc2\x8c\xae\
-\xd8\xe3\x82\x93=\xbeZ\x8f.\xd8\x8d\xbf\xe9\xb8\x8e\xc2\
-\xa37\xdd\xf9x\x1c\xec\x16g\xce\x89\xda\x04\xa7\xde\x09\
-q\x94/t\x8a\xaf\xb1\xe73t5ti\x1d\x17}\
-x\xea\x9b\x03\xdfzp~\x89WJ\x9dEt\x8d\x15\
-\x8eC\xb7\xc4b\x18.X{4\xa8\xc3\xcan\xcdv\
-\x9c\xb1\xe0\x92\xe3\x86\xd8\xa4\xb3l\xa0\x9c\xa3\xa5[\x97\
-\xeao\x05\xb0+\xd5\xcf\x05\x94S;q\x00\x15e\xf8\
-*\x9dy\x8d\xc1O\xebDj9\xdf\xab\x075V\xf6\
-\xc0e\xad\xd5\xb9\xa8\x7f\xf6\x88DN\x1e\xe1kD(\
-^\xce+\xfa\x18\xb0\x1f`\x84+\x1d\xbd^\x80\xedu\
-\xfc\x10\xa0\x08\x15\xa3{\x10\x96\xf1eo\xf0\xbd\x0e\xec\
-+\xeb\x15s#\x1c\x03\xef\xe5\xde\xb5\x81\x83\xdf\xcc\x0d\
-}o\x86&\xd5\xb8\x83\x81\xe3AK\x1b:=\x8e\xea\
-E3\xe8P\x06\x97\xe0e\xd7PX\xab\xb1\xf9\xd3\x16\
-+k\x84P\x0d\xc92Gd\x7f\xf4_9\xca\xa5m\
-|@\xce\x03\x81b\xd4Q\xa9\x09m;'2bw\
-\x00\x00/\xf6IDAT\x16\xf22\xbf\xb1\x8c\x95+\
-\xa6\xc2\xd5\x97\x1f\xd0,\xa3\xe0\x1f_\xa3\x98\x1a[\x17\
-\xae\xec\xf2\xa5(\x04\xaa\xafz\xa9\x1e\x9b\xecP\x1e\xfb\
-W\x10K\xa61\x91\x99\xafs\xd0\xfc*?9t\xf5\
-\x0co\xac\xfcA\xad\x15\x7f\xe5w\xdf\xf57?\xf6\x03\
-\x7f\xe7\x87\x0b\x90\x0d\x7f\xee\xe7\x07\x026\xfd\xfd'\x00\
-\xb8\xe7E\xdb\xf7\xd6\xde\x83\xc7\xfb\xe5\x01\x80S\xd7+\
-m\xf4\xa7\x9dNp\xc1\x867\xc6O\xff\xd6O\xbf\xf7\
-\xc1\xd7\xbe\xe9\x83\x17_\xf9\xba\x7f\xab\x16e\xdf\x19f\
-W\x03\xdaJ\xd6R\xe9r'\x1a\xd0\xd2\xfbj\x18\x1a\
-\x09{]\xf3\xc6\xcd+\xa9\x95~\x5c|\xc3\xc3^W\
-7c\x85\xe1\xa6\xd6\xb6\xf6?\xc6p;\x06\xfd\x81\xcf\
-\x1a+\xfb\xe2\x18O\xca\xcco\xf3;\xcb\x07>+O\
-\xc64(\x0a!\xd9\x83\xf8%@\xe4\xc4P\xbd:\xa6\
-\xf8u\xb0'\xc7o\xb7\xcae\xd3;\x86\xf0\xc5%\xcf\
-\xc4G\x97&}\x0f\xc8+\xcd\xb3\xf2\x08\xccY\xfc\x99\
-\x13y\xee\xcd\xdf\xf2\xd9\xdb\xe6\xf11Y\xfcc\x86\xd2\
-\xcd9\x1f\x83p\xa3<\x7f\x89\xefRQX\xees\xd5\
- \xe9\x04\xcc\x13n\x9d\xcc\xb0\xc4\xc8\xea\xf2\xfc[\x99\
-Zx#\xb4\xf2\xf0\xa8\xa8>\x8f\xf2`\x7f\x84\x1e\xef\
-\xf6\x93xz\xe2\xf6\x8bM\x8b\x18\x07MC\xce!6\
-\xd6[\xf9\x0c\xa1\x98\xd6[\x81~\xcbQ\xc41\xc6\xe7\
-f\xd3Ha\xe0lk\x07\xdf^/\xc9Cs\xad \
-`l\xab^\xa3\xba\xe4E$h\x09C\x96[\xc0\x00\
-a\xd5K\xc6I\x96\x01c\xb5\xc6\xd1\x15l\xdcI\xe0\
-\xcbJ4\xf3\xa9fgR\x1b\x7f\xc9qS\xbdj\x07\
-\xbfd\xce6X\xcc\xbc\x18\xcb\x03\xb8\xc9\xc6\xc8\xa8\xf6\
-\x0f\x18;E\x85\xc9\x17\x0ek(\x8d\xe4\xcd\x16o\xee\
-\xa1\xd8\x1b>:\x90t:I\xedOz\xec\x1dK\x09\
-\xe3\x12\x95\xf8\xc4+\x05\xb1\xf8\xaa^f\x0f\x9b^q\
-\xb07\xc7\xd7\xb7\x00\xd7\xaf\xbc\xff\x97\xff\xe6G\xdf\xf6\
-m\xffO\x99\xb2\xd1\xcf\x9b\x7fdlyQ\x9e\x94\x88\
-P\xf3\xab\x86\xf7G\xbb\x1f\x1f\x00\xf6g\x96\x15\xe5U\
-u\x87=\x0f\x01\x97_\xf9\xba\xdfz\xe0\xd5o\xf8\xba\
-Z\x91u\xb7\xd5R\x9d\xdc\x94\x98\xc5\x1c\xd7Z\xb8\xe0\
-\xf6\xa1\x1a[\x9d\x16?}\xf93\x9d\xc5m\xbc/\xc8\
-\xe2\xf7x\xf4\xa0u\xe1bj\xdf5V\xa4\x1aGG\
-\xef\x0d\xb6\xfd\x11\xa6\xf1#{\x8d\x1d\xdbf\xf8\x92\xe4\
-g\xe4\xd4s\xb0\xef\x8e)w\x8e\x01\x83\x86\xddt\xe7\
-\xe1\x9cd\x18\xf6\xe4\x10|Oe\xb3\x0b>\xcd\xa3\xc7\
-\xc1g~\x19\xd3\xa7\xf5\xf4\x9cG\x06e\x0cG\xf9m\
-\xe9\x0f\xfd\xe0\xb7p\x1aN\xfa\x80\xe5w\x1aL\x22\xa1\
-\xa70c\xca\xc9c\x82\x1e\x15g\xee\x0c\x98\xa64\xab\
-K.\x86>\xc2\xa5\xfe\xdc\xe3\xdc\x14o^+Jl\
-K\x8e8y\xc7/X\xd9G\x8e\xb5CqK\x1e\xfa\
-\x1a\x81\xf7\xb1\xfd\xbb\x93\xbeE\xcfu$\x9a\x8dG\xc4\
-\x03\x1c\xf8\x01+\xc7\xc4!\xb6\xbe\x93A\x1er\xe8\x88\
-\x88\xf5\x03\xb9\xd2``]\xf3\x8f\xef\xf9;?\x9b8\
-\x8e\xfc[\x1ek]\xe3\xd8\xad56\x0f\xc1J\xa0\xf9\
-\x15_\x8f\xfa\xde\x94\x0e6k%\x0dv~/\xd0\xb9\
-\x11#\xb3,\x95e\xb0-\x07\xa6\x1e\xab\x15\xf4d$\
-M\x17\xc52\xe7\xa7\xf4:\x14\xa0\x10\xfc\xe0\x1f\xe7L\
-r\xf5\xe6\xd9\x16\x8e\xbf\xc7\x0f\x04\x1c\xf3\xebo\x1dT\
-\xef\x88\xb0\xab\xb9\xd8\xad\xb3O\xe9;\x07\xf1S`\x13\
-LTP)\x1c\x03<\xba\xf2\x14\xaaF@\xa4\x07\xc6\
-\xa0^\xc2:k\xe9\xca?\xbd\xc2(Wpn\x13}\
-\xf0k}?\xf3\xd4{\xde\xf17>\xf6/\xfe\xee\x8f\
-\x14*\x1b\xfd\xbe\xcf\xa6O\x9f\x8d?=\xc1\xf3r \
-\x1f;\xd3Yu\xef\xc9\xf7\xd3\x03\x00g/\xab)\xfd\
-\xfe\x8cF\x9f>\xf6y,\xb9\xfeZ\xe0\xef\x9f\x7f\xf8\
-\xe5\xef\xba\xfc\xb9o\xfc\xfa\xba\xa0\x1e\xd8\x5c7e^\
-\xf9\xa8X\xd1\xd1\x0d\x995V\xee\xd0\xc7&:\x17\x0e\
-a\xb2\x06\xb9 \xb6\x1b\x93\xe9eo?`\x8d\x17Y\
-\xbe4\xc6N+\xfb\xe0\x97NQ'\x9d\xf9\x02\x02V\
-*\xe8\xe0H;a\x8f\xe9\xc47Py\x90\xf9\xe9|\
-\xb9\x1c\xf6r-9q\xe0Y\xf6\xf4fY>e\xd5\
-\x94<\xfd\x1a\xcf\x9c!\x97~\xab\x9e\xe5v-\x0fD\
-\x19\xf6\xc4\x9c|\x09\xb4;8\xb3\x9dr\xc7\x99c\x9c\
-D\x1e\xd7\xcc\x9c\xd3b\x1cg\x9e\xa5-O\xfc\x1f\x02\
-\xac/\xfe\x0f\x01\x05\xa9\x19W\xaf:\xd6\xb9\x9dk%\
-O\x0a^\xf6v\x0bE52M\xbe\xe0\xd4\xca\xa8\x7f\
-\xe9\x89\x80F\x91\x9aY\xbc\xe2\xda\xddl\x8bg\xdb\x82\
-A\xbbYJ&0/\x9a\x12`-n\xaaC4\xfb\
-\xd6\xbc\xf96\xbf\xf1Z\xc2\xe4\x5c\xee\x92\xe3\xc8\xb7\x94\
-\xf6\xbb\xf5\xf1=>q(\x96y\xe4\xc4\x17yY\xd6\
-$\xc91\xb9\x22\xcbN\x9fh$\xc2\xb095P|\
-\x86\x81\x00\x1f\xad\xac\x82\xda\x98\xa3\xeb\xed\xe8\x82\xe2\xb3\
-\x1an\xfb\xd1L\x11\xb5\xa5\x97\xce<@\xd4?l\x18\
-\xa5C\xad\xf3\x0f\xael\xf5\xb0\xb8\xa5\x82\xf18_\x86\
-\x89/?(M\xb1\xb9\x06D\xdc\xe2\xb4Z b3\
-?\xea]q\x99hzq\xc0z\xfe\x86O\x8e\xc1\xca\
-\x16~\x0d\xeb\xa7\xfd\x9fx\xd7\x0f\x7f\xcbco\xffG\
-?S\xa3\xfd\xa6\xcf\x98\x0d?\xfa\xfdC\x00I\xce\xaf\
-\x1a\x8e$\xd0\xdf\x17\xed~{\x00\xe0\xa4fU\xa5\x9f\
-u\xa7\xc9G\xb1\xfc``\xddd\xdf\xf9\xe0\xe7\xbd\xf9\
-\xeb\xea*zx,j\xbc\xf8\xce\x82\xe4\xa6\x05\xbc\x97\
-\xa7\x0b\xa1L3\x7f\x93\x1d\xdatd_\x00\xf2TJ\
-\xe3\x18\x1d\x93\x0b\xdfq\xe5\x05\xb9^\xba\xf0`\xd4P\
-i\x8a\xde\xfcY\x1eX_\x0f\xf0\xfc\x12H\x85\xcc\x95\
-\x12_\xa6o\xb9\xe4\x22o\xb7\xe6g@\xdf\x8d\xfc6\
-_\xf0\x99\x119Z\x06\x96\xb1d\x02\x9e\xd2\x94K\xdb\
-\xc4\x9fp\xca\xa7\xc6g\xd0\x15'\x94\xe0\xf7\xe3\xd3\xa3\
-\x07\xe9\xfe$\xff\xd0~\xbb\xd1>\xcf\x93q\xa9Z\xb4\
-G\xe4\xfe\x8f\x84\xf4\x7f\x08P\xd3r\x08j.\x00l\
-\xf4\xfa(\x1a;\xc5\x8f\xce\x82\x22x\x1b\x91b\x1a;\
-v2\xc0\x8ao\xfe\xa5\x1d\xd4\xa0l4\x8e\xbc\x88\xb4\
-}_\xbf42\xf7\xf9\xaf}\xdd\x5c\xde\xdd\x17\xb0\x8c\
-\x1aO;\xa760h\xd8\xbb\xef\xf4\x85Ml\xe7\xd3\
-y\x91_a\xb5\xc6\xe0\xc5/b5\xeb\xc9\x0c\xe3\xf6\
-.YC\x1fl\xc2\x89\x1c\x01\x05+g\xd5\xb9~\x8c\
-\x1d\xb7L\xb2\xb1\xd9\xf6z\x16\xd7z\xb3\x8cm\x0f\xaa\
-K\xd8\xce\xa4xe\x9ck\x15=\xae\x85U\x0e\xf8t\
-c\xee\xa8\x84\x93\xcd\x9bn\xce3\x13\x85G\x1b%m\
-\x1f\xd2\x22\xfb\xabz4\xe5\xa9\xed\x93!\x1el\x13Q\
-\x1e\x0d\xc9\xb8\xf9\xe4D>2f\x96`J?\xe7\x1b\
-\xc4F\xb7\x94\xf0\xf5\x1fc}\xf2\x89\x9f{\xdb7?\
-\xfe\x8e\xff\xe3W\x0a\x9bM\xfeX\xbf\xdf\xf8\xf3\xce\x9f\
-\x9eT\x9c\xce\xd6\x13\xfa\xbei\xf7\xe3\x03\x00'w\xac\
-\xabI\x9e\xf5\xc8i\xc1fL?t\xcf~\xf0=\x8f\
-\xdd\xba\xf2\xe4\x8f?\xf0\xfa/\xfd\xd7/\x5c\xba\xfc\xaa\
-qWa\xa5\xf6\x1df\xdb\xccQq\x11\xda\xc5\xacg\
-\xfd\xe9\xe2\x90\xdd\x17C\xec\xe9aI\x16\x9d\x1b\x899\
-J\xa7\xe5\xea\xfaB\xda\xec\x03W\xc6\xacv\xc72\x96\
-\x84\x82\xc1\xee\x0bq\xd2\xb5O0i\xe2\x1f`\xdb\x97\
-t\x96\x93K|Nt\xc5\xc0\xd7\x88\xd5\xb2t-\x87\
-'\x1d9\x22ts\x0d\xc3\xb7\x12_i\x91\xf7}\xec\
-\xe9\x15\xbf\x07\xc12\x8c\x1c\x8f\x93\xebP\xd5\xcf\xfa\xd3\
-d\xf9;`\x1d\x1f$\xd6I\xbc*\xd1\xa4Y\xde#\
-\xf1\x10\xfb\xe6\x8d\xdb\xfc\xb9\x8b\x97\xea?\x12\xba\xa1\xf3\
-\x5c\x93\x1b\x0b8\x0c9g\x02u\x92T\x93\x9e\x8c\xcf\
-a\xbcr\x0e\xca\x7f}\xcdu\x83\x9b7\xb8\xfa\x16\x82\
-H\xa5\xc4G\xfb\xb1\x7f\x80\xa5rgU\x0f\xc8\xd1\xe1\
-\xdd\xb3\xe1g\xbd0#X\xd8o\xb6R\x1f\xf7\xd7\xae\
-5>\xf6\x17\xc6\x07\x87\xb5c\xf9-5>\xa4\xb1\xba\
-|\xd9\x1fZ\xbb\xf4\xbc}\x1d\xf0\x89B\xf8\x8al\xc7\
-C\x07\xb7\xecq\xda>e\x16\xb2\xec\x19dg\xad\x1e\
-\x9d\xae!b\x0f\x9c\xdd8\xc0\xe6\x08\xff\x9b\xfb\xd2\xf3\
-U\x0a}\xdc\xaf\xa1c\x90\x06\x13\xc0\xbb?\x09p\xbe\
-zP\xc0\x81,\xe6S@\xf9@'b\xe9\xfb\xc3\x13\
-\x9f?\x9f_e\x87\xbd\xf9\x0a\xce :b\xf2\xc2N\
-?Z\x06\xe5A\xf6\x1eK\x86\xce\xfc\xd9w-\x03\x92\
-KN\x80\x05\xf7\xd8\xeb\xc5\x9ch\xe4\xa3P5\xa4~\
-\xb7\xae=\xf3\xde\xc7~\xf2\x9f~\xf3\x13?\xff/~\
-\xa7\xcc\xfbM?\xff\xc3\xdf\xac\xcfC@6\x7f\xdc\xed\
-_\x84\xa2\xa1\xbfo\xda\xfd\xfe\x00p\xd6\x89\xf6\xea\xf3\
-Z<\x86\x8b\xfd\xdc\xb3\x1f{\xff\x93W\x7f\xf7\x97~\
-\xe8\xe17\xbe\xf5\x0b/<\xf8\xf0\x9b\xbc\x86\xca\xcc\xa2\
-\xae\xe6\x9bE\xad+-xt\x93\xbeF\xbe\xe9L:\
-]\x10\xcdk~0\xf2%h_d\x5c\x1c\x85\xf7\x05\
-m\x8e\xc6\x89\xcbeTq\x83A6}\xebc+\xca\
-\xc0F.\xe2\xd01\x9d9\x8e1\xe4\x1f}\xb0X6\
-_#~\xebbS_\x07\xae8\xf9M,\x0c\xd5\x88\
-g\xdf\xee\xa3s\xafY \xaam\xd8M\x8f$\xdf\xdd\
-\x03\x8c5\xf3@G\x9b\xb1\xd6\x9c}$\xde\xf3iw\
-G\x9f\xd1\xb3|,\x83\x93v\xcd\xb5\xd4\xe7/\xf0\xe7\
-\x83\xeb\x1e\xc8_\x0e\xcc\x04\xaa\xb7\xdd\xeb!\xfa:\x93\
-\xfa\xc7I\xc0\xa3\xbd\x1e\xeaR[\xb2HT\xf5\xf2\x1d\
-\xcdd\x9c\xc5\xf6\x0bw\xf8)\x0a\x1b\x17c\x0e\xf9d\
-_:\xad\x8d\xd2'\x1fb\x08\x88\x0ep\xe5\xd6/\xd1\
-\xa5r\x0e\x1c\x81\x87\x8b\x1dl\xd6-6\xcf\xdb>6\
-\xc7y\xf7o?\x85\xb2\x8fi\x88\xaf\xe8\xd5\x8fJ\x90\
-\x9c\x81\xf2\xcd\x0eKS\x22\xb1\xb4J\xb8\xd4\xd9=[\
-z6\xf4<\x0c\xe1!\xf5q\xef\x8d\x1f\x86\xb1\xdb'\
-%\x89.oET\x89\x1cNG}\x12Q\x92\xec\xa9\
-\x15\xb8\xce\xcf \x8e(\xe7\xde*4\xd6\xd3\x030.\
-\xa2\xceM\xf3\xec\xd2\xf61\x7f\x94\x9c\x00\x9ad:\xcf\
-\x9d^\xf9\xa3\x979}}\xa6\xff\xd4\xe3?\xfa\xe1\x7f\
-\xfe\xad\xff\xd5\xd5\xf7\xff\xf2\xc7\xcb4o\xf2\xc7\xe4l\
-\xfc\xf4\xf3\xe6\x8fL\x88\xbcJT\xeb\x842\xbc\xf7\xfb\
-\xfb\xf5\x01\x803\xebUu\xf69\xbe\x1df\xd8o^\
-\xf9\xf4\xb5'\x7f\xf9\x87~\xec\xc1/\xfa\xcag/\xbe\
-\xf4\x15\x7f\xa2\x16\xb1m\xd9\xc14\xaaC\x8f\xbd\xe9:\
-\x0d-\xf8\xd2\x1br\xb8\xf8\xb39\x0f\x1b8.\x90\x09\
-\x9f\xb1\xbc\x09\xe8\x8b\x89\xb1\xc3Y\x19\x5cz\xe3\xeb\xa2\
-+38\x8d\xdd\x1d\xe6\x12]\xe2v/|\xc9x?\
-v\xe5\x10gn\x89;\xe3\xf7\x98=~?N\x9e\xd1\
-\x9f\xcd\x0f\xca=\xe9\xec\xf3<\x93\x7fH?\xba`v\
-Sl\x06Q\x0e\xe7\xbes\x95\x133\xa1&\x8eO\xda\
-\x09\xca\xac\xc8\xba\x18\xba\x89s\xc2&P\xe5C\xb2\xfc\
-\xf9`\xaaP_\x9a{\xf1\xd2{!\x94\x19((a\
-\x80\xe6\x1cK\xdb\xa3\xc6\x18\x8e\xb3\xedU:\x1ah\x9a\
-z\xcc%O\xb3l=?\xe8\xc7\x9a\xc7\xba\x81\xf4C\
-~\xb5i\x92\x03z\x9f'p\xceF}\x17\xdf\xf9\x83\
-\xdb\x1a:\xc5*\x97\xee\xf1%gJ\x15\xa40\xa5\xc2\
-\x8dkV^{\x8c]<\xe5ei\x13\xc9\x956\xf7\
-`\xe6V6v]0\xfe\xda\xe0\xe2QS\xff\xd3\xb0\
-\xa39*\xd0\x90J\x83X/T\xc9)=\xea\xbd^\
-*\x08\x15_~`\xd5\xd8\xd5\x03nG\xf2\xd9|:\
-9R\x04D0\x9d\x7f\xf3Gq\xa4\xc6\x7f\xbd\x9a%\
-\x01\xbfj\x15W|\x06\x8d\x19\xfe\xa2k\x0c\x08l\xa1\
-b&]}\xab$\xf1\xc1\xdc\xbay\xf5\xc3\xbf\xf3\xbf\
-~\xe8\x9f\xfc\xb5\xbf]\xf7\xda\xab\x85bS\x9f7\xfd\
-\xfd;\xffl\xfe\xd9\xf8\xe7\x1e\xc7\xbc\xe6\xb6\x1f\xcf\xb6\
-{V\xbe\x9f\x1f\x008\xa9\xf3\xb2\x9bO\xf2i\xfa\x19\
-sT~\xfa\xdd?\xfe+\x17_\xfe9\xbf~\xf95\
-_\xf8o\x16\xe0A-\xee\x12|ca\xa1\xdb\xb5\xf5\
-\xbe)!K}`\xcb\xcd\xc8x]\x0a\xa23\xee\x8b\
-\xa7\xf0\xb9\xd9\xa3\x8dO\xf5\x15\xd0\x1c\xf3\xcb\xac\xc9\xc6\
-F(\xe4\xf0e\xb7\xd2z\x14\xd5\x84G\xdfmp\xda\
-v\xc87^\x9c\x81o\x1fc\xccm\xc8\x0d\xb7\xa3.\
-\xa5\x22\x0a\xdc)\x9c\x80\x87\xfe\xa6\x5c\xca\x9a\xba\x08\x18\
-~\x06\xdd\x1f\xf2wF8\x93j\x1f\x1b\xd3\xac\x9b\xb1\
-\x13m\x88\xb6\x1fC)\xd3\x81;p*\xed\xc4\x19\x01\
-'\x8e\x0b5\xf8\xf3\x9cL\xdf\xf8\xb1\xcd\xe7f\x93\x0b\
-W\x0f\x01\x9c\x85\xfa>j\xf5%\x95\x0a\x0e\x1e\x08\xdd\
-\x12\x82d\xf49O\xb69\x0d}\xdco\xd1G\xe5=\
-\xe5\x1c\x9b\x1c\xc8\x9d\xfd;H)\xbc\xfe\xe8\xf3{\xf7\
-\xc9\x1d\xaa<\xf5\xcf\x01\xb0\x9a\xa1\xf1\x91\xbf\xe8|<\
-P\x00\xe4\x91[\xc9\x9a\x07\xf14\x9b\x8c\x1d\xc7<\x8c\
-~\xcd%u\x5c|\xe3\xc4|w\x8c\xa9\xd6P;1\
- 4\xf0j\xf4T\xc7\xf8VZW*\x7f\x00\xe0\xea\
-\x05\x89\xa3\x9aUX\xf6\x22\x7f\xc6\xe9\xbc\x94V\xef\xee\
-q[\xffxX\xaa\x8e\xaf\xce\xc9\xfc\xe4!\xbb\xacr\
-W\x87\xb2\xc3\xa9\xc9\x0a\xd9| \x9e\x13\x9e\xea\xa5\xb8\
-\x88\x19o\xfca\x13n\x83\x1a\x11<>b\xd3Ik\
-\xb3\xe3\xb3\xfe\x00\xe4\xfc\xd0KG\xbc>\x8f\xc4\xc1\x9b\
-z\x0b\x0a}\xfe\xd6\x8d'\x9e\xf8\xf5\xff\xef\xaf\x7f\xec\
-\xfb\xbe\xfd\x07\xca\xba\xdf\xf8\xe7\x87\x80\xc8\xd9\xfc\xd3g\
-\xf3'\x89\xbc\x88\x84LK\xef\xd1}t\xbc\xdf\x1f\x00\
-8\xd5ZjS\x9f\xd3\x7f\x9a>\xf6c\xbd\x16\xd2\xd5\
-\xf7\xfd\xe2\x87\xae?\xf1\x91\x1fy\xe8\xf5oy\xf3\xb9\
-K\x0f\xbc^\x17 \x01\xb2\xe8'9\xb6\xdc\xc4|\xa1\
-\x18\x1b|0\x19\x1382\xd7\x0fS pt\xd2p\
-1u<\xfa\xe8f\xff\xc8\xa6\xc7^WB_\x0ap\
-\x06_\xec\x93\xfe7_\x0d\x98\xba\x8d\xbf)Ic\xf6\
-?\xe4\x0d2$\xb0\xc9{('\x81\x8c\xcf\xbaj\xb1\
-\x9f\xc5\x9f\x5c\x9d*v\xd9N\xb5\xdf\xce@\x0e\x87-\
-\x1a\x9d\xadC\x93\xcf`\xebb\x0f\xbe\xd5I\x88\xc2\xa5\
-\x98\xad\xd3\xb9\x94\x5c6\xd1}\xfeT\xf0\xc6\xa8\x1e\xc5\
-\xc5\xecO\x02\xcaM}2J\x14\xe9\xea`\xb7l\xb6\
-\xdc\x8cm\xd1\xd6\xa1T\x0e\xf39Pu\x0c<*<\
-1\x1a\x1e\x16=6\xd9\x0bO\xcelX\xd2\xd7n\x87\
-\x0b\xad\x89\xea\xd1\xea\x93\x01\xc0\x8c\x04\xc2w)$K\
--\x91\x5c\xb5\x16\xe5\xcb\x9b*\x06`\x1c\x5c.\x8d\xd0\
-T\xb3\xac?D#\xd9\xe3\xe0\xd4\xf3\xbd\xf1$$\xbf\
-\x83f=\x94\xe8K\xf4\xac\xe818\xc7\xb1\xfeZ\xe5\
-I\x18\xe3\x99\xf4\xbc\xc4\xd0D\xcd/<\x14\xcd\xbfb\
-\xdc\xeaw\xf2 \xf2\xc8\x80L\x8d\xf2\xd9\xbe\xeaV\xba\
-\xc4\xc7\xe6s\xd8\x1c\xe6\x22s\xf5&\x9b\xaf\x5c\xd1m\
-\xf1\x13c\xcb\xb7l\x83O\x88\xf6\xa5\x18\x8c\xeb\x15\xfa\
-\x188\xbe\xf5\x13\xff \x1e\x18\xbb\xdb\xe8\xf1\xed5X\
-\x7f\xd5\xff\xe7>\xf6\xf6\x7f\xf4-\x9f\xfe\xd9\xb7\xbd\xa7\
-\xa2\xb0\xc1\xdf\xee\x01 \x9b~\xfay\xf3GN\xa8}\
-_\xa6\xfb\xaf\xad\x07\x00\x9f\xf3\xac\xba\xf4Y\x09\x8cY\
-({}\xecYD\x19\xa7\xbfu\xfd\x13\x1f|\xea\xc9\
-_\xfa\x7f\xff\xe5\x83o\xf8\x92O]z\xe4Uo\xad\
-_\xb5\xe1\xb3W9\x1a7\x06\xc6u\x05\xe8\xe6-c\
-.\x88\xd6UTa\xeb\xe24\xc7\xe1\x8e\xf1M/\xfe\
-\xce\xe7\xf0\xcf\x95\xd6\x17\xf9Y\xfcN#P\xe77\xf9\
-L\x9c\x5cG\xf6\x8f\xb6s\xa5\xafW\x0a\x93XS\xf8\
-1\xe7p\xf6X\xf4i\xf0h\xddY\xa6f\x92\x88\xd9\
-\x02\x98y\x10\xfbf\x1e\xd2\x0c\x9b\xe8\x071\x06\xf8\x88\
-0sl&\x9b\x93\xdaC\xeal\x9f\xe5Bq^\xe6\
-\xa4\x8e\xf9\x9a\xed\x91\xbb\xdf6\x7f\x22\x96\xef\xd85t\
-\xacQ\x9b\xb2m2\xef\xd4\xeau\xa3>\x09\x10-\xd8\
-\xe9O\xbc\x96?i\x13\x0b\x9f\xd5\x8cD`\x83*L\
-\xe6\x80\x1f!\xfa\xd0\x03\xc5\x9c\xe5\x5cV\xa5\xd3\xb2\xac\
-\x1e\xb3\x1e\x08\xf0\x89\xbd\x14\xda\x04K\xce;\x7f\xa3z\
-\x0eY\x04J\x83<}\x1e\xf0Cs\xca`5B\xd3\
-\xeb:\xbaR\xd5\x83\x87X\x85\xc9\xcf\x1c\x18\xdf\x1c\x06\
-\x99\x9b\xddc\xa8\x86\xd3Rt\xd7\x05\xd4PJ\xf1J\
-\xc2^\x8d\x9e\x0c%\xab\x8f\x8c\x17=b\x95\xb6?\xdd\
-(\xb7\xdb'\x06\x0ej\xfe\xc4.\xbaY\xcaB\xbe\xf9\
-\xa4\xc0\xae\xf1\xddV\xa9\xa2o,f5\x0b\x8a\xa0D\
-\x8d\xf3\xfap\x5c\xf9\xc3;\xd0\xc1C\x9e\x07\x85m@\
->\xc9Q\xa4\xd2\x05\x86\xcf\xc8\x84\x1e1Z\xe9\xb11\
-R\xdd\xbcu\xf5\xea\x87\xde\xf3w?\xf4]\xff\xcd\xdf\
-\xbe\xfe\x89\x0f<Q\x94\xd36\xff\xf9\x81 \x9b~\xfa\
-\xfd\xe6Oh\x1a\x93[\xad*\xb0\x1e\x00\xb6e\x90\x15\
-\x9d>\x16\xc6\xf3\x82\x99\xe5`\xe8\xf7\xfa\x1a\xdf<\xf7\
-\xf4o\xbc\xe3\xdd\xb7\xae<\xf1c\x0f|\xfe\x97\xbc\xa5\
-~\x12\xfbs\xb5\xd0\xeb\x86\x028\xb2\xfaZ\xf5\xb9\x91\
-o\xbd\xdd+!\xd9\xcd\xc1N\xe3B\xc9\xbd\x09\x1f\x1b\
-\xcf\x0f\x0csB\xb2O\x1c\xf1\xeb\xa0<\xa4\x9f\xf9\xf6\
-\x0d&M9\xd6`_\x8c\xd9>\xe27.6\xfa\xf0\
-g\xdd,\xc7/s:\xd6N\xd3\xef\xb1\xa7\xd0\xfb\xde\
-\x95\xd9\xeeY\xfb\xf1)\xb8\x14\x1b\xf8,\x1f\xdc\x19g\
-\xdb\xa1\x9f\xd4\xc7t\x9f#d\x9dH\x09\xc6\x0f\xdcA\
-\x0cBn\x9cYNm\xa3;\xec\x15\xc0\xde\x8f\xf1\xd9\
-\xf5\xf4G\x83\xfc\xe6\xa8n\xc1\xb5&\xbcy\x90\x0d+\
-\xc4:\x9f{\xea{P\xe3:1\x1a\x9fq\x82\x82\xc7\
-\xdfxW_\xca\xc8\xa4\x00\x86\xe9\xd6\x1e\xa8>6U\
-DF\x02o\xf3g\xce\x9aw\xd9\xe8\x9d\xabs1\x87\
-\xf5\x5c\x1ch\xd8K&E\xf3\x84\xc0R_\xeds\xc4\
-(\xc1\x0ed\xb6cpr\xb4\xd9pleu\xd8\x8b\
-\xb4\xe7\xc1Q\x8b\xe0\x9c\xa7\xe8\xa6\x94\x1f\xdf\x11\xfa\x07\
-\xff\xe2\xaei\xd3\xac\x14\xcaq\x1d\x16\xd9v\x02\xc5s\
-\xea\xd4\xf7\x19\xf2\xc4W\x99IU\x03\xe5l\xf9\x80\x8f\
->\xc5\x0aA\x1c\xf8\x85\x1c\xfc\xf8\xc2\x1d\x1c|U\x93\
-\x5ck\x89\x93\xba\x9d\x80\xe1S\xe7\x8c\x8c\x8b\xb2\xc9\x9c\
-\x1f;@w\xe3\xea\x93\xbf\xfa\xf8;\xbe\xfb[\x1e\xfb\
-\xb1\xef\xfc\xa9\xba\x87\xee7\xfey\xc3\x9f?\xf2\x0f\x8e\
-\x85\x0cf\xde\xfc\x93\x1d}\xe4\x12\x0fd\xc6\xf7]\xcb\
-\xa9\xbd\xef&~\xca\x84S\x8f\xb9G\xae\xd5\xacK\x88\
-\x9e\x87\xa6\xf4\xc8\xbc\xb3O\x7f\x9a|\xf1\xdc\xa5K\x97\
-?\xe7/\xfe\xd7\xff\xfe\x83\xaf\xfb\xa3\xffa\xad\xfc\xf1\
-7\x03r\xb3.\x1f\xbaHX\x9d\x0a\xce\x15\xa2\xf5\xe9\
-T\xe6\x0b\xc4P_\xe43?\x18\xec\xba\xb8\xa6\x0by\
-\xbb\x167\x7f`\x06\xbf\x00\xf3\x95q\x9aM~\xc9\xac\
-\xf0\xa4\xe8\x10\xdb\x05Ll\xda\xcc?\xc8K\xc6\xe6\x95\
-\xac\xf9v\x1e\x98\xd26\xbe\xb1\xd1\xd3\xa72\xd1\x05\x9b\
-\xb10\xc9\xad\x06\xf3\xbcfL\xe4\xbd?\xf1\xef\x80\x17\
-\xfe\x9d\xf5\xe3\xcc\xee\xe0\xa7\xe9\xf7\xb0\xc2\x91\xa8\x0f\xd5\
-\x9b7\xce_\xe0>!\x19\x8d>\xe7 \xe7\xafO\xdc\
-v\xfe\xb9_^{\xa6\xbc\x9f\x9e\x0f\xefJ\xd9\xe7h\
-\xe3\xfb\xffs\xbc^\x10\xa9\xa7b\xc9\x9es\xd8\x1bH\
-\xe9j\xf5h\xfd\xd8[\x8e\xbd\x8e\x88S\xbe\xe4\x87i\
-\x97|\xb3\xfe\xe5/\xdau\x18\x91\xb0u%j\x0c1\
-\x95\x81M\xcb|*f\xfb\x02\xe4\xba\xcdLE+|\
-\xf7\x0a\xc2\x10\x87\x22v\x8f\xcf`[\xd6\xe6\xef\xf9\x00\
-U\xcc\xe2\x19\x95\xbe\xf5t\x83o[,\x09ELn\
-0]%\x7f\x1aP~\xe5\xba\xb8\xf6\xab\x0a\xb6+,\
-\xa5\xe5\xcb \x5c\xb6\xad\xfb2\xc6\x1f\xa6!\xcb\xd9\xc6\
-\xef q\xa7\xa9+\xa0\x0e\x8d\xc3A\x9a\x93\xa9Q\xe5\
-U\xc1\xf9\x03J\x07\xf3/\xca6/L\xadh\xbe\xce\
-_t\xb7n^y\xe6C\xef\xfd\x8e\x8f|\xef\xb7~\
-\xf7\xb9\xeb\xd7\xf9\xa1\xbel\xf6\xfb\xfe\xd8\xc6\x0ff\xde\
-\xf8y\x00 \xe1\xfd\xabTj\xe8\xef\xfb\xc6\xd9Zm\
-\xab\xc0\x5c\x8f\xc8\xf4\xbc\xe6\x87\x80\xf9\x01\x80\xcd?/\
-\x1e\x00\x8e=\x04\xe4\x01\xe1\xc2K\xde\xfc'^\xf7\xb2\
-\xaf\xfeK\xff\xe9\xa5\x97\x7f\xce7\xd4M\xa8\xd6\x7f\xdf\
-\xf4\x08\xc2\x95\xa2\xf5\xba\xe9J\xa1&\x13i\xd4\xc5\xc2\
-\xca\xcdEu\x82\xdf\x17Sn\xf8Mo\x1f\x9b\xdf\x11\
-\xe9 \xbe\xdc+\x8f\xdb\xf1\xe37y0\xde|\xdaO\
-0\xe9\xe7\x5c\x87\xae\x84\xfd\x95\x18?\xc1\xa4\x9fcE\
-\xb7\xf5\xaa\xca6\x94t\xa8;\xcd\xaf\xa1\x85%\xc0\xdc\
-\xc6\x8dio\x8b\xdf\xf4\xcc\xd7\x0fd\x87t\xeb\xf6\xb6\
-\x8c\xd3\xc3\x99e\xf9\x18\xe7\xd9\xe7\xcck\xc3\xde\x83M\
-O\x05\x9d\xea\x96?6Zjv&?\xb1 \x5c\xcf\
-C\x80\xbcr[G\xdb\xabRb\xd7i\x9b\xfbv\xe2\
-\xcbT\xea\xec\x01\x8dVG|\xd7\xdf\x9b\x04\xbf\xdav\
-\xb3\xb0.y\xcd\xb1\xfe\xf9]\xbfk\x96\xdf\xf7\x87\xac\
-\xdc\x85\xed\x5c*_t\xce`>v\x9er\xea\x9a\x84\
-\xbf\xd5\x0aMs\x86O\xc6\xd5\xf0)]\xc9\xaa_\xc5\
-SH\x0e\xe6\x00Cf6\xe4\x0cGs\x8e\x0eJ\xa9\
-y@2\x07\x17\xc6\xba\x02h\xa7uQ6\xbe\xe4]\
-<\x0d\xe5\xed\x90_7 p`\xca\xb3\xe6O\x1d\x9a\
-?\x12GG\xec\x81#\xdf\xe6 \xc8V\xc6\xf4G\xf8\
-\xb6\x01\xaeV\xae\x06Vs\xaa\xf1\x01\xbdg\xa7\xb8\xfc\
-)\xe6\xcc\x0d2\x99V\xebX\xca\xab\x86hq+k\
-\xd9\xc8\xf6\xda\xa7>\xfe\xc3\x8f\xfd\xc4w\xff/W~\
-\xe7\x9d\x8f\x96\x89\xcd;\xef\xe8\x8fm\xfe\xb3.\x1b\xff\
-\xb1\xcd\x1f?4Bu2c,\xe1~?p\x1eV\
-;\xac\xc0\x5c\x93\xc8\xf4y\xb1\xf9\xcf\xafl\xfe\xd9\xe4\
-\xcf\xea\x07\xf6\x15_\xf3\x97\xbe\xe2%o\xf9\xd3\xff\xf9\
-\x85\x07_\xf2\xa5\xac\xcd\xban\xea:\xe1\x06\xe4u\xea\
-\x8bX\xca\xce\xee\x10\x13\xac\xae\xc9\x82\xc1\x8a\x0eB_\
-s\xd2\xc9A\xf95\xa6\xb0r\xebXL\x0a=\xed\x80\
-_\xe3\xe0\xcb\xb2\xe55\xf4\x9b\x0e.m\xe6[\xe3c\
-ry.\xba\x993\xcbs\xde\xb3\xfe\xf9\xcb\x9a\xf5s\
-pc^n\x80w\xed\xc0'Eu\xd69\xd5r\xdb\
-{In\xe97{\xe2\xaaGm'\x1b\xa0\xa4`z\
-\x01\xa0\x01(Ll\xeao<[\x9bX\xde@\xd9.\
-\x10\x87\x9c\xcc#\xfe\xe7s\x22V+\xb4.\x8a:b\
-\xb4\x1b?)\xe0\xb4\xd7&\xb9\xd4\x97q\xe8\x19\x10\xb2\
-\xd7\xaal\x1e\xcbPvf@\x033tUK\x8f\xb1\
-d\x8e\xee\x93\x83|\x0f6\xb8\xe2\xe7\xe9%\xaeZM\
-\xe7\x16\x03\xd8\xd2(\xf8\xc8`\xd3a+@ )\x99\
-}x\xd3\x8em\x9a\xb9\x1e\x1a\xf8Y\x0a}\xd2\x22v\
-g/\xb0\x19\x9a\x85\x1c*D\x01\xec\xcf\xb3\xb3Ns\
-\x84\x0fe\xcb\x82A\xb5B\xee\xf8\xc2\xd8}s\x0c\x0b\
-\x9f*\x13e\xefJ\x941\xfd\x1a%\x89^\xcb\xb6\xfb\
-\x5c\xa0\xb2\xbf\xeet\xbej\xa7\x7f\xe6\xa9\xdf\xf8\xf4\xaf\
-\xfd\xe8\xdf\xf9\xe4O\xe8/\xfa\xcd\x9b\xf9\xbc\xc9\xe7a\
-`\xdf\x07\xcfb\x9d_D[\x9b\x7f\x15\xe1v\x8ds\
-\xb4\xda\xc9\x0a\xccu\x89L\x9f\xd7\xfc\x00\x109\x9b{\
->\x018\xf6 \x10\x1d\x9c\x92/]z\xcd7\xfe\x95\
-o|\xe0\x0d_\xfa\x1f]\xb8x\xf95\xbaF\xea\xc2\
-\xc8M\x8a~n\xb9\x11F\xb7\x1f\xa3\xd7\xb5]\xb4\xe3\
-6\xfb>\x93_\xc69\x8f`\xe9\xe3;\xbac16\
-\x9b\xeeM\x19\xaa\xa7x\xf3\x8c\xf6\xe3\x19|\x96m\xc6\
-YV\xc6'\xd5\xc74}s:0\x9d\xd0\xc5\xdf\xbe\
-gN\xbe\xa1u\x95\xe4f\xd3\xb5\xd7\xf8\xeb\xdevl\
-\xdb\xb9\xe5\xc6\xad\x82VE,2c\xb7\xf8\x0bOv\
-L\xbb\xb51\xd7\x1f9>\x0f\xf8Ec\x16\xb4\xe0\xf7\
-\xbdm\xa1;\xc7\x0b7\xaf\xf5\xaf\x09\x96\xbe\x5c\xb37\
-f\x03\x18\x1f\xff\x97*\xea\xd8r\xde\x92\x0e\xbeM\xf4\
-;X\xde\xf5\xa7\x09\xc3\xa0t\xca\xa9\x84\xf0\xfc\x17\xfe\
-0\xd4K\x1f)\x18\x03X\x9bQ\xd1*S\xc9pJ\
-\xe0K\xfc\xea\x90\xc6\xb9J\x1d\xd1\xd1F\xe9k\xc8s\
-\x8ej\x87a$\xcf \x0d\x10y\xf0ED\x9a\x8f#\
-\x98\xcd\x9d\xa6\x9d\xf4\xfb\xe2\xc2\xc6iI\x95(\xae\x06\
-\xdfNGm1\x85\x17\xec\xc4.~!\xfc\x85\x13a\
-Q\x88C~r\xde\x0c\x15\xa5@\xe0\xb1\xd5?\x0dF\
-o\x0f]A\x00ev\x06\x921\xd3rB$&\x7f\
-Y\xd0\xd4\x0b\x0e0\xd7;\xba1\x1ey\xf8\xba\xf1\xb9\
-\xab\xa87\xae}\xe2\xea\xef\xbd\xe7\x1f~\xf4m\xdf\xfe\
-\xfd\xf5f\x7f\xde\xc8\xe7\x8d\x7f\x96\x8fm\xfel\xf2`\
-\xb2\xf9\x93\x0c2\xbd\x13\xdb\xfaR\x0d\x1d\xf2jU\x01\
-\xce\xe0j\xa7W \xf5\x99{d^l\xe2\xe9{C\
-\x97\xeeN\x1f\x04\x82\xbbp\xe9\x91\xd7<\xf4\xaa?\xf7\
-\x1f\xff\xc5\xcb\xaf{\xf3\x7fP\xff\xb7\xc0kp\xca\xea\
-\xe5\x22\xca\xdd*7\xb1\xbe\x17a,\x93\xd7\xb8p\x85\
-\x87\xd5*\x8d6\xba\xb1\xf1\x8b16\xcbX\xaa\x159\
-W\x0d\xc3\xe0\xc7\xc5\x8c\xb2[l\x0c\xc5\x9e\xf2\x09&\
-\xfd\x1c+\xba}\x7f\x16f\x8eu\xc8S\x95\x0eU\xae\
-\xdcNw|\x98\x8dr\xb6\x1e\xd3\xcd\xf6>3R\x1d\
-\xc3\x1e\xd3\xcd\xfc\xd9>\xcb\xc1\x1c\xd3\xc5F?\xdbg\
-9\x98M\xb7\xaf\x8d\xc7\x9b=\xbe`\xea\x0c\xcaE\xec\
-\xea\xf9\x8b\x81\xb7\xea[\xb1YT9I\xf4\xb4>1\
-\x1b\x1b\x9dG\xf0\xf3\x83|\xd4l\xdb\x84\xca\x8e?\xae\
-\x18m\xec[\x9er\x8f\xdfR\xb1\x12\xf3\x10`\x97\xbd\
-\x86k _\xd0h2z\xdd\xe7:\xf0\x1cd\xac\x03\
-@\x05C1\xb5N\x9eIL\x0f\x19\x03\xe0\xa0ch\
-!\xb9\xba\x8f\x07\xd9\x18\x94\xaf\xbc\x83\x97\x5c\x9a\x91\xa6\
-\xe4\xde\xac\x85\xecC\x01\xf2\xed\x02m\xd2\xe5G\xf9+\
-/Hr\x5c\x02\xbe\xbc\x89nN;\x0f|`k\x8e\
-\xb46\x15\xab\xf9t\xd4\x9dy\xc5\xb6\xef\x092Z\xe1\
-\xc4iE\xcb\xa2\xfbd\xf6\x5c\xdb\x1fN\xcbXg\xa7\
-\x97K\xc9\x98:\xc6p\xc5\xc6\xff\x91\xdf\xfe\xaeO\xfc\
-\xe0\xff\xf6\xb6\xebO}\x22\x7f\xd0'\x1by\x1e\x04\xb2\
-\xd9\xcf\x0f\x00\xb3\x1c|6\xfel\xfa\xe9\x89JK\xbf\
-\x97e\x5c\x87\xb1:V)\xce\xa8\x00k7\x0dy\xff\
-\xe2\xee2\xbf\xd8\xd8\x19g\x83?\xf6\x89@l\xe9\x85\
-\xbf\xf4\xd2\xd7<\xf4\x8az\x10\xa8\xff\x5c\xe8/\x9f\xbf\
-x\xe95\xdc\x08\xf6m\xde\x8c\xc7\x05\xb6\x03\xcd7\xc2\
-\x9d\xa9.J\xdfH\xf7\xfayl~.\xe4\xd9\xa2k\
-\xbc/\xf0C\xfd<\x22/.\xbd\x93\xd9\xbbx\xc7\xf4\
-\x07|\xd3g\x95\xef$r|\xa8\xbe\xfd\x88h\xdb\xe6\
-\xb1\xe1\xad\xdf\xc6\xc7%o&'\xf9\xd1\x9b\xd5\xber\
-\x83\x1d\xae\x5c\xc3\xd4<\xe7\x05\xf3\x01\xbfy\x07\xba\xc6\
-\x80\x1d|\x0f\xb0\xe8\x1c\xc8_q\x15\xbd\xcf\xeb>F\
-(YJ\xc78\xc6\xf4\x1cC \x0a\xa4[7\xce]\
-\xd0\x0fbc8l}\x9auRu\xeb\xef \xe8\xb9\
-J\xfc\x03a\xc8\xf8\x91v\xfb\xe1\xf0Rq:\x93;\
-\x14\xcf\x1f\x81\xcdcZ\xa7P\x1b\x8fcs\xc0\xc3\xc2\
-\x8f}\xa7~\xe8\xe5;\xf9\xc8\x17:\x08u\xa9\x05 \
-O\xf2\xc0\x01\xd7}P\x84\x92;\x80\x0c\xd1\x81\x89\x5c\
-}\xf9\x96\xdb\x9e\x8b\x9dd\xa37_\xb5i\x8e\xa7\xd2\
-v\xa7}\xc076^\x88\xa5\x10\xae\x8dn+hv\
-\xfe\x99\x1f8\xcd\xb7\xe4\xf2\xdb\xae\xad\xa7\x18\xf9\x81\x0b\
-\x0c\x8d\x1b\xf3c\x0e\xf2\xda\x07\x06p\x82\x9b9\x01\x0e\
-;P\x94\xc0]\x0fx:\x7f\xd2:\x97\x9b\xd7\xaf}\
-\xe2\x99G\xdf[\x1b\xff\xdf\xcf\xc6\x9f\xcd;\x9b\xfe\xdc\
-\x9f\xf6\x00\x00\x06^\xfal\xf8\xe9)\x83\x8b\xbe\xf5d\
-\x11\x1d\xf2jS\x05|\xe6&\xc5\x12\x8fV`\xae\x13\
-r\xc6l\xdc\x19#\xe7\xb5\x7f\x08\xc8FO??\x10\
-\xccz\xb8\xe2]z\xe4\x15\x0f\xbe\xe2\xcf\xfc'\xf5 \
-\xf0\xa6o:w\xf1\x81/8\xb8\xc0\x08X\x17\x5cn\
-v\xacm]\xa7\xd2\xd7hZ\xea$\xc6\xd0\xfc\x938\
-\xe9\x8b\x10J\xf0E9h\xba\xbe\x0b\xb4\xc7%\x8f\x03\
-\xf0\x91\xc1\xa9~\x0b\x1b\x9f'hL\xa4o,'l\
-'\x14\xf1B$\xb7\xad>\xd1\xd0\x83\xdb0\xb1\x08\xcb\
- \xf1\xba&\xae[P\xd5\x9f\x92\x93n|\xa2\xdb\xf7\
-~\x1c\x0f\x079M\xbe\x0e\xf0\x1d\x1bN\xce[r\x9e\
-\xf9{9\xf8\xf8\xcax\xce\xd9\x1cYJ\xed\x9b4\xa3\
-p\xf6\xe73c\xb6\x97\x0b\xf5s\x01\xac\x94lP\x94\
-Q\xfb:\x0e\xbaQ>\xa6\xa5\x12\xeb\xf4u\xad\xe9t\
-\x8a\xf0d\x1f\xe1\xe0D\x9cR\xe4\x1d\xff8E\xedK\
-1;_\xb9\xe9\x10\xc6\x0d\xe7\xadm\x92\x03\x06Y\xbd\
-\x1b\xb1r\x9a%\xc8!\xca\xba\xfcd\x04\xd7yw\xae\
-\x82\x0c\xd9#\xe5\x94\xd0\x82o\x9bh\xd4LZ\xe7\xb0\
-(\x9aw\x05v\xad\x0b\xdb\x1cb\x8eo\xa9\x94n\xa4\
-PY\xa8R*r\xd7\xad\x0b\x9c\xd8z\xf0\xf0\xb4|\
-L`\xf5u\xa0//\x9e\xe7\xd4c\x10\xa6\xcc\xe9\x81\
-\x0a\xdf6\xb6T\xc4zi\xc63\x1d\x93\xe6\xd2\x1c\x92\
-.\xb0\xd3\xf3\x9c\xa5b\xd67\x9e\xfd\xfdk\x8f\xbe\xef\
-\x9f\x7f\xec\x07\xff\xe7\xef\xbb\xfe\xd4\xa7\x9e)`6\xef\
-\xb9G\x9e_\xf3\x03\xc0\xac'\xab\xfd\x8b\xe0\xf3\xab\x86\
-N\x19\xa1\x1a\xb6\xd5N\xa9\x80N\xf9)\xb6\xa5>\xac\
-\xc0\x5c\xab\xc8\xf4y\xb1\x81#\x9f\xf6\x10\x90\x0d\xfe\xb6\
-\x0f\x00\xe5C\x0f\x02\xf5\xacp\xf1\x95_\xff\x97\xff\x8d\
-\x87\xbf\xe8+\xff\xbd\xf3/}\xc5W\xd7Ew\xc1\x17\
-V!\xa6\x96\x1b5\xaaY\x9e \x12I\xee\xd8\xd5\xd0\
-\xf7\x15c\x0at,\xc6\xde\xd7<>\xcd\xef\x8cy\xfe\
-2\x99\x13\xa9\x1a\x09\x92\xf4\xdd\xb4\x89\xb3m~\x93\xcf\
-\xa3\xbe\xca.\x88o\xdc\xd4\x16\x85]\x95<\xf9<N\
-\xe7\xb6\xbf\x9d\x93\xf9\xdcD\xb6O\xd8s.\x96\xf7\x1b\
-s8\xa0#\x0f\xfe\x9cK\xcbw\xc6\x97\xb7\x9aJo\
-Vd\x22\xd9\xd3s\xac\x92\xeb\x1d\xe4\x85\xe9\xdb\x01\xaa\
-\x84\xcb\xa1\xb32g\xef\x9d\xc03\x1a\xfc\x02h\x9d\x95\
-B\x1bX\xcd7\xfd\xd8\xf8\x01\xd3\xe2\xb7K\x0c\xd1[\
-\xa0M\x1c\x15\xaf\xf4\xc9;9\xc7A\xf4d\xc1'\x11\
-\xae\xd3\x9c\xe5,wL\x91\x09^m\xd4\x13\x1c\xad\xf5\
-\x1eh\xd8{\xb3':\xcc\xc4\x82\x9e\xf9A\xd8b\x05\
-\x96w\xe9\xb6dv\xb8-\x84\xf8-\x8bm_\x09\x9d\
-'\xafy\x0d\x1cF\xe8u\xd793\x92\xdf8 \x89\
-1\xbf(\xd3\x834C\xf4L\xbf}\xd1\xc9^\xfa\x83\
-\xf8\xf8Sc\xfe\xb7n^{\xeaS?\xf5\xcc\xfb~\
-\xf1{?\xfe\xf6\x7f\xfc\xce\xfe\x1e\xff\xbcq\xdf\xe9\xe6\
-\x0f'\x0f\x003\x1f\x99\x80\xc7^\xca\xa2m\x91W\x7f\
-J\x05X\x0a\xab\xddy\x05\xe6zE\xa6\x9f_\xf3\x83\
-@o\xe4z(\x98\xdf\xedG\xceCA\xc6\xc1\xa7\xcf\
-\xc3\xc4\x85\x87\xff\xe8\x9f\xfa\xbc\x97\xfe\xf1\x7f\xfb\xdf}\
-\xf05o\xf8\xc6[\x17.\xbe\xca7\x99\xe3\x89\x93\xcc\
-\xb8\x1c\xfb&\x19\xe4\xb8h'Ll\xc7\xfa}\x9c\xfd\
-\xd8\x91R\x0a\xa2F\xb6\xb79\x174\xfb\xf1\xc1\x8dh\
-\xbe)\xcd\xb2]\x1d=n7\xfa\xca\xa48\xbe\xd1\x1f\
-\xcaG\x89\xad<\x8d3\xeb\x0d=97\xf4\xc6!e\
-3\x9a\xe5\xa9\x16G\xe7\xc3\xe6\x04\xbe\xd8}\x9e\xc4\x88\
-L\xb1\xd5\x8c\xcb\xdcF\xcd\x8b\xbc\x9dgr1z\xf8\
-\xb23\x19\x94}\x8f37\xfac-|l\x072c\
-\x1e\x02\xf8\xd9\x80\x92\xc3\x0eF}i\xb5\x85( \xef\
-\xea\xebw\xf8\xeb\xe1\x81\xa9\xa0\xd2\xb8\xe2f\x9b)U\
-\x9f\xb3&\xa0h\xc7\xf8\xcb0\xf1\xa4\x91>5\x01a\
-\x9c\xc0u\x98\xcf\x89m\xed0\x80d/?\xc5\xa5\x0e\
-\x1d\xcb\x90\xe0\xc9\x92t\x18[r\xde\x0c=F\x9f\x0d\
-\x13\x0d-g\xc5l\x8f\x85*\x800\xe5n\xff}\xff\
-)\x84DX\xf5\xbc/<\xbf\x12\xa9Zt\x9e\xdb;\
-\xff\xcekK\xc5y\x81\xa3eN\x99_zl\xdb\x94\
-\x04\xe3\x8c89l\x1b_\xae\x85-\xa9\xf4>\xc7\xcd\
-o'\x84\x11\xe3\xc6\xf5O^\x7f\xec\x83?\xf0\xa9_\
-\xf8\xbe\xb7=\xf9\x1b\xef\xfcH\xa1\xf6\x9b\xf6i\x1b\xff\
-\xbc\xd1g\xc3\x9f\xb1\xb3\x1fB\xcd\x0f\x005T\xf8N\
-\x9a\xa1\xd3\x91\xb4\x0egV\x80\xf3\xbb\xda\xddU`\xae\
-Yd\xfa\xfd\xebv\x0f\x02\xc76\xffl\xfc\xfb~<\
-\x08\x5cz\xe8\x91\xcb\x8f\xfc\xc9o\xfa\xaa\xcb_\xf0\x96\
-\xaf\xbb\xfc\xc8k\xbe\xe6\xfc\xa5K\xaf\xde\xaeWoB\
-LG\x17*\x17l\xc9\xd3\xf5\x8b\xe9\xa0\xc5\x8eR\x17\
-r_F\xb3^\xb6:\xccW\x18\xba}\xdbs\x86\x9d\
-\x04\xf77#\x19\x95\xd9\x80Y\x98u\x96\xb3aa\x9f\
-\xe5\x937n\x01N\xc4\x9a9\xf3\xe60\xeb\xe3k\xd6\
-ENO\x05\xf6\xb5\x1e\x9b\x14\xb5\xae9n\xd8-\xd7\
-\xa1+\x0c3\xa2\xdd\x16[\x98\xf0\xe6^\xe4\xdb\xf2A\
-m\xb9\xdc5_\xf4\xd3\xf9\xe7\xeb7\x04\xfck\x82]\
-\xea\x9a\x14+m^?\xf3\xef\xf9\xfb,\xb2:TA\
-\xf5\x9a\x7f\xb1.\xd4?\xf2\x9b\x9b\x97\x8aW\x93\xfc\x8a\
-\xc7\x8c\xe0\xbb\xb9\xee\xf6\x1c\xfe\xbe\xa6\x8a\x96w\xff\xc4\
-\x90c\xceA\xb6\xe68k\xc7N\xb1\x06\xb6;\x96c\
-\xf4\x0c\x8bk?~\xf7\x1f\x9c\x91[\x86s-\x1cM\
-\xef\xf8\x0bv\xb0\xf1\x13\xbeb:\x7f|U\xcd\x93\xdd\
-\x98l|\x83-\x04>\xc0\xa8\xd8\xe6\xe3\x06\xd4\xa9\xfc\
-\x04\xdfq\x9a\x04\xbd\xdb(@\x9f\xcbN\x22]\xf1o\
-\xe9\xd7C+\x122\xac\x9b\xd7\x1f\xab\xdf\xe1\x7fG\xfd\
-\xd9\xde\x1f\x7f\xec\x1d\xff\xec\x17\xce]}\x92?\xe0\x93\
-\x0d:\x1b{6\xf0l\xee\xd1g<o\xf6\xb3\x1c\x1e\
-=\xe1\xd2#\xe7U\xa2SA\xa8\xa6\xb4,\xae\xe3\xed\
-*\xb0\x9d\xf1\xdb!\x97}\xae\xc0\xben\x19\xd3\xcf\xaf\
-l\xdc\xe8\x22\xef7w\xc6\xb3n\x96\xf3\x90\x10\xee\xdc\
-\x9f\xaf\xdf\x22\xbc\xf4\xf2?\xf5M_\xfe\xe0\x17|\xc5\
-\xd7^~\xf9k\xbf\xf6\xdc\xa5\xcb\xaf#\xd0\x9d\x5c\x01\
-\xba\x17\xdc\x09\xb0\xfc\xfd\xc17\x12!\xf33\xda\xb8\x81\
-\x1f\xc1\xecm\xfbqQ\xb2\x09\x1ea\x9f\xb0\x19\x0br\
-\xcb\xe9\x80?\xfc;\xef\x03[\xc7\x12\x9b\x22\xebll\
-\x9b)\xfa\x81o?c\x8c\xb1\x1ac\xda\xbc\xa1\x19#\
-\xed\xe0Gg7\x87\xb1\x8e\xf2\xad<\xe4\x97N\xb3\xc8\
-\x82\xe0\xc6>\xe2\x93\x0by\xb8o\xbat\x17\xea\x87\x03\
-\xfdWZ\xd1\xbaR\xec3\xbcg\xe5.\xdd\xd3V\xbf\
-\xcd\xc3@|\x1e|\xec\xaf\xb7\xb4l_\x99C\xe2z\
-\x93A\xebSa{\xe6\x9b\xf9w\xf4\x80@\x9f\xd2\xe4\
-\xe9\x08\xbc\xf5\x07,U\xa54\xbd\x81\xcf\xb6\x82\xfb\x01\
- J\xf3g/\xd9\xc8]\xdb\x9e\x0fp\xea\x8b\xcfQ\
-g\xcfz$\x85\x93*d\xa2\xf7P\xf1\x12m\xf0q\
-Gar\x92\x92\x00d\x9a\xc8\xa7\xf4\x02\xf4A'\xd8\
-\xb8PF\x02\x95\xcb\xf8\x0b\x7f\xed\xff\xd6\xf5g\x1e\xbd\
-\xf1\xa9\x8f\xfd\xc4\xd3\x1f\xf8\xd5\x1f\xff\xe4O\xfd\xb3_\
-\xad\xbf\xda\x97M;\x1b4}^\xb1\xcd\xfdi2\x9c\
-\xd8\xc2\xa7gF\xbc\x90i\x19G\x96\xb2\xf5\x91W\x7f\
-\x07\x15\xc8\x92\xb9\x03\xe8\x82\x1c\xa9\xc0\x5c\xbf\xc8\xf4\xfb\
-\x17\x1b7\xbay\x03G>m\xb3?M\xbf\xe7\xc7\xa7\
-\xe2\xbd\xec\xad\xdf\xf8\xc5\x0f|\xd1\x97\x7f\xd5\xa5W\xbc\
-\xee\xad\x17\x1e~\xd9\x1f\xbbp\xe1\xe2#\xb9\x17T\xac\
-]\xc3\xc2\xc5\xed\xfb\xc7\xa1\xd1\xb6C\xddn\x94\x9b\xce\
-Po\x1c\xdf\x98I\xe9X3n\x8f\x99\xc7\xb3|\xc2\
-C\xc7\xddc<\x06\xed\x0d\x8c\x1b\xac\xda\xc8\xf30\xee\
-\x8c\x07\xa71B\xdf\x98\xc3O\x9cc\xbd\xe1\x8e\x83\xbd\
-\xe9}?\xde\xf4\xb9\xd9\xef\xfb\x8d_\xb7t\xd3\xe5C\
-\xfav\x96\xbc\x94\xfd\x94\xdb\x16\xcf\xf3\x1d\xc4IH\xbc\
-\xa82&\xb3\x84\x8b.\x98\xb9\xdf\xdbN\x8c\xf5\x1b\x02\
-u\xbf.\x87'\xf2\xef\xfa+\xcf\xb2{\x9bc\xeb\xda\
-\x1a\xfe\xa4\x98\x13j\xb3b\x95,H\x91fH\xbb\xc6\
-\xea\xf3V\x0a\xd5\x09w\xda\xb0\xec\xc4\xa7>\xcc\xea\x87\
-\x88\xc0^\xc2\xe5\xa4\xca\xf6\x18}\xda\x00\x97b{\x17\
-ok\xd9\xc8I\xdd\xe1fn\x7f\x84\xaa\x9c\xe2\xbbp\
-\xf1\x06_\xb6\xc1o?\x95,\x7f\x00\xd8\x1c|Vn\
-*j3+\x98~\xc5\xb0\xf9\xca\x03\xd3A\x9b\xa2(\
-\xb9\xcc-\xc1\xd2C*\xac\xa6O\xdc-k\xbb\xcb\x9c\
-\x8c\xbbu\xf3\xfa\x937\xaf|\xfa]\xd7?\xf5\xe8/\
-^\xfd\xdd_\xfe\x85\xc7\x7f\xee\x07~\xbb)\xd9\x9c\xe9\
-\xf7\xf2\xbc\x91G\xbe]\x1f?\xe9\x99@\xfc\x22\xe7U\
-\xa2d\xfa4l\xab\xdde\x05N,\xa1\xbb\xe4/\xb8\
-\xaf\xed\xb9\x0e\xd44u\x8dL\xcf\xe5\x96>r6z\
-\xc6\xbc2N?\xeb\xf6\xf2\xec\x0b[bY\xbet\xe9\
-\xe2K\xbf\xfc\xcf\xbd\xf1\xa1\xd7\x7f\xd9\xbfz\xe9\x95\xaf\
-\xfd\xb2\xf3\x0f\xbf\xfc-\xe7\x1fx\xf0\x8du\x93\xe1\x87\
-\x10\xef\xb0qM\xe1\xb6\x9a\xef\xa6\x96\xef\xf48q|\
-\x83n_\x07\xfc)\xc6\x81\x9e\x90\xbe\x11\xa1\x9e\xe5\x03\
-\xd8\x14\xe3@\xbf\xe3\x9c\xc6\xdf\xf4\xfb<\xbc)k\x93\
-\x1a\xbe\x88\xc0\x1c6l\xf8\xe9A\xd0\x18\xd3\x0e\xf8V\
-\xf4\x5c4\x18\xf3\xba\x13~\xfc\x09{\xe0k\xdb\x00s\
-\xbeF\xfc\x097\xf3[]\xf1\x9d\xe3\xec\x13\xa5\xb3\x07\
-\xb5\xd9O\xc8(\xea#\xe1\xf3\xb7\xf8\xa1\xedb\xd4\xe6\
-{\xa1>\xfb\xe7{\xfeY6@\xf2}\x7ft|B\
-0|\x03+]r\x90\x8f\xa9\xbe\xe0\xfc\x90\xd0[\xa9\
-\x96\x8f\x0e\xb8\x1d\xb5\xdbxR\xf7\x01\x9c<h\x8c\x07\
-?\x84\xcc\x98\x92I`\xc2ed\x94\xf9\xd2q\xc0\x83\
-\x92\xb5\xdcY\x09\x1a\xde\x98Oi\xab\x1c\xe3\x9d\xbbd\
-\xe6&?\x18wQ\x87\x03\xdb\xe44y\xc9\xd6\xf9\x87\
-\xdf\xb01\xa7=\xbf9\x0a\x18N\x97#P\xc7h\xe3\
-\xc0\xdc\xba~\xf3\x99g\xdf\x7f\xf3\xea\xe3\xef\xb9\xf6\xf8\
-\xa3\xbf~\xe5\xf7\xdf\xfd\xeeO\xbf\xeb_\xbe\xbf\xdf\xe5\
-\xe3!\xafl\xcc\xd9\xacO\xeb\xf7\x9b>\xb8c\xba\xf0\
-\xf1\x8f<\xc7\xa9\xe1\x18G\xa6\xa7\x81[\xed9V \
-\xa7\xfd9\xd2\x17m\xaa\xc0\x5c\xcb\xc8\xf4\xa7\xbd\xd8\xa8\
-\xcfz\x9d\xf6\x10p\x8cC\x8c\xe8\xe7x\xe8\xb6\xf1C\
-\x0f]|\xe9[\xbe\xfe\x8b\xea?$z\xf3\x85\x97}\
-\xce\x9b.\xbd\xe4e_t\xee\x81\x87\xdfp\xe1\xd2\x83\
-\xaf/\xd4\xc3\xdb\xdd\xa9X'\x1a\xd7\x19\xae\xaa\xf9\x8e\
-\x8dP\xaf\xbdN\x80M\x1f\xcc\xc4\x197\xfc\xa1\xc3e\
-6\xfb\xba\xad\x96\xdbl\x9c\x895\xeceT\xd4\xba\xd3\
-\x0e\x1d\x994\x9f\x9e\x16\xfe\xacG7\xdbc\x03\x1fy\
-\xb6\xef\xf5\xc7\xf9\xa0\xb6\x5c\xee\x96/v\xe6R\x03g\
-\xbf\xcb\xbf\xf5\xc7\xe2\x9bO\xfeH[\x9b\xe7\x1f-g\
-*\xb0\x03_\x93~`uZ\xb7zE\x9f\xfe\xc0W\
-y=\x7f\x83o\xfdv\xeb%16\xfeRgc\x04\
-\x81\xec\xdd\x91Q7\x12+CE\xc4[\xc9\xf5%\x9d\
-\xe7\xe6\xf9\x8c\xec\x0b<\xcb\xf6A\x0d2/\xc5\xc0\xc9\
-\x8ccx\xd0\xbc}\xda\xd3\xec\xcf\xb2\xb3)B\xdc8\
-\xf1Y\xd1s!\xca\xc4o\xbc~\x0e\xa2\xc9\xc3W\xe1\
-\x22+\x9d\xce)\xe7/\x19\xa9o?\xaa\x08\xb1\x09\xa1\
-\xbe\x84AF\xc6\xb6\xc5w\x05K\x07F\xea`:u\
-\xf07o\x5c\xb9y\xed\xd9\x0f\x9d\xbbv\xf5\x83\xd7\xaf\
-<\xf1\x81\x1bO|\xfc}W>\xf8\x9b\xef\xfd\xf4{\
-~\xf2\x03\xf5}\xfc~\xa2\x13\x1b\x0fy\xed7\xe6\x8c\
-\xb3y\xcf}6\xf9\xe8\xce\x1a\xe3\x7f\xf6\x95xs_\
-\x10\xcf\x06\xa1\x1b\xf6\xd5\x9eG\x05X\x22\xab\xbdp\x15\
-\xd8\xd73c\xfac\xafl\xd0\xd9\xbc\x9foO\x8c\xf8\
-\xdc\xcb\xc7\xe23s\xe9\x1f\xf8#_\xf9\xea\x87^\xff\
-\xa5\xaf\xbf\xf4\xf2\xd7~\xee\x85\x87^V\xafG^{\
-\xe1\xc1\x87_{\xee\xd2\x03\x9fS\xff\x8d\xf1+/\x5c\
-\xb8\xf4\xca\xfa+\x85/\x81\xb0o\xd9<\xf7\xfa\xdb\x8f\
-\xb9~\xb7\xcd\xf3\x10o\xdb\xa1\x8e\xd1\xa4\xf7\x1d\xbf7\
-olL\xa5[\xdb4:EN\xde\x87\x9b\xf6\x9c\x13\
-\xec9\xbf\xba\xb5\x96y\xde\x5c\xb3\xe1\x08\x99\x1bq\xf5\
-\xf2me\xe7W\xb9\x15Y\xde\xc1U;\x16\xdf:A\
-\x85\x89\xff\xf4(\x15\x7f\xf25\xe7\x1fY\xe4\xc6\x9e\xe6\
-3\xbe\xc2\x99cl\xfc-\x97M\xe7\xf9\x99\x1f\xfb\xad\
-s\x17\xa7?\x18\xa4\x99\xd64\xf9\x1f\xfc\xb4!\xf5\x9c\
-\xc7-\x9c\x12P\x8cn\x9a\x93\xab#\x8d\xeb\x84\x18\xe0\
-V3i\xe5\xafP\xfa\xaa\xed\xd2fq\xb7C\x94\xf2\
-fuT\xc3o\xa9\xb7`\x93\xd6\x1c\xe0~\xf7\x0e\xdd\
-s\xb1\x84L\xf3ql\xea\x22\x84\xe3\x81\xb6\xfc\xe8\xc5\
-\xe1\x1c\x16\x06\xc7\xe2\x83\xe0\xb2\xad\x86\x8aV\xe7w~\
-\x08\x88\xdeY\x19\x92\xdaH'\x87\xa5\xc7\xef\xcd\x1bO\
-\x9f\xbbq\xfd\xf1\xfas\xbb\xbc>~\xe3\xea\xd3\x1f\xbb\
-\xf5\xccS\x1f\xbb\xf9\xf4\xa7?z\xed\xd3\x8f~\xf4\xea\
-\xef\xfd\xc6\x87\xae\xfc\xee/?F\x94\xf6D?\xbfP\
-3\xce\xa6\x1c[\xc6s\x8f|\xbb\xd7~\xf3\xdf\xf3\x8f\
-\xc5BG\xdb\xf7\xb3N\x80ux\xee\x15\xc8r{\xee\
-\x1e\x16\xf3X\x05\xe6\xbaF\x9e{\xe4\xf9\x95M;\x0f\
-\x00\xd8\x22\xdf\xae\xdfc3\x8e\xff\xf8\xce\xf8X\xcf\x1c\
-\xd0\xd3b\x8f,%\xfaK/}\xc5\xe5\xcb\x9f\xff\xc5\
-\xaf\xbc\xf4\xf2\xcf{\xd5\xf9\x97\xbe\xea\x91\x0b\x0f<\xfc\
-\xc8\xc5\x87\x1e~\xe9\xb9\xfa\xd5\x84\xfa\x14\xe1\x91\xfa!\
-\xc4\x97\xd4\xc3\xc2Cu3{\xe8\xc2\xa5K\x0f\xd6-\
-\xec\xa1\x0b\x17/>x\xee\xfc\xc5\x87\xea\xa7\x9f/\xd7\
-]\xef\x12\xaf\xb2_.\x7f\x17\xeb\xf3\xe2\xcbu\xe3\xe7\
-\x93\x0e^\xfc\xb1\xb2\xfa\xd9\xb0\xba\x93\xd5\xa7\xca\xd5.\
-\xd4\xc6\xe1\xfb\xba\x8fc\xc3\xe4\x9e0o\xc4pi\xde\
-\xe8\xbc9\xb1\xa1l\x1b\x1b\xd6M\x0f\x99\xbb\x0a\x98v\
-\x04\xe0T>\xb6\xf8Ko\xddL\xdf\xfc\xcfy\x80\xa3\
-\x85\x97\x90\xd6\xfa\xa8\xc2w\xbe\xa7\xe1\xa2\x9fy\xb3\x1c\
-\xfb\xe8\xcb\x98;'\xb8\xe8g\xce,\x93\x83k\xe29\
-\xcd6\xe4cy\x9f\xc0\x80\xeb\xbf\x15\xe0\x0d\xd1\x19\xc0\
-\xb5s\x18\xd4\xbc\xf3\xe9\x0c\xb3y\xb6\xb5\xb4\xb5r\xea\
-{\xe0\xdb\xf9\xeb\xda\x0ap\xe0\xac4\xca\x1aK7\xfc\
-+@\x8d'\x1b4\x9aT{\x1f1\xd0O\xb6p\xa2\
-\xab\x0d[uhTXf\xe0\x18v\xe5Z\x8a\xf9\x87\
-\x04\xeb!\x88\x15\xa7M\x8f\xd3\x5c\xf9!\x93\xca\x8d\xf3\
-7\xcf\xdd(\x05\x7fo\xf9F\xbd+\xbfV3\xbf~\
-\xbev\xefrq\xed\xe6\x8d\x1bWo\xdd\xb8\xf1L\xfd\
-\xc6\xc5\xd5[\xe7n<s\xeb\xc6\xcd\xab\xf5\x83\x97W\
-o^\xbf\xfe\xf4\xcdk\xcf<y\xfe\xfa\xd5'o\x5c\
-\xbd\xf2\xd4\xcdg\x9fz\xf2\xc6\xd3\x9fz\xf2\xd9O~\
-\xe8\x93\xd7>\xfc[\x8f\xd7\x1f\xdc\xe1\xe3\x18'D\xa0\
-M\x8e\x8e~/\xcf\xbal\xd0\xd1\xd1G7\xf7\xc8y\
-\x05\x93\xf1Y}\xb0\xf1\x0f6r\x89'dti\xe0\
-V{\x81*0\x96\xf8\x0b\xe4o\xb9\xd9*\xb0\xafm\
-\xc6s\x8f<\xbf\xb2Y\x1f\xeb\xe7\x07\x018\xa7\x8dc\
-\x9b\xfb\xbd\xcc8/2\x8eLO\xbb]?cD\x98\
-8\x19\xa7\x8f\xaf\x8c\xef\xb6\x7f\xbe\xfc\xbb\x8d\xb7\xf0\xab\
-\x02/t\x05\x9e\xcf\xa6u\x1aw\xaf\x9f\xc7\xc7dt\
-\xd1\x1f\x93\xa3\xdb\xf7\xd9\x9c\x8f\xf5\xb3\x0e9/|D\
-\x9e1\xd1'Fl\xd4;:zZz\x8fN\x8e\xa3\
-_\xfd\xf3\xa8\xc0\xba\xb9>\x8f\xe2\xdd!u_\xe3\x8c\
-\xe9\xf7rt\xf4y\x08\x98\xe5l\xfa\xd1\x053\xf7\x91\
-\x83\x99{\xe4\xd3^Lg\xb6e|\xac\x9fu{\x99\
-1\x0d_g\xb5\xdb\xd9\xcf\xe2.\xdb\xaa\xc0\xbdV\x81\
-\xfd\x86\xb7\x9f\xdf1\xfb^\x97\xf1\x9d\xf4`\xee\xe4\x95\
-M\x1ald\xfaY\x8e\xed\x98.\xb6\xc4\x0a\x861-\
-\xfa\x8c\xa3\x93\xb1\x0f\xb3m\xd6/\xf9yV`\xdd\x84\
-\x9fg\x01\xef\x82\xbe\xafu\xc6s\x8f|\xda\xeb\xac\x8d\
-=\xb6\xf4\xf88M>\xcd?z\xdal\xcf\xf8X?\
-\xeb\xf62cZ|zt\xfcx'\x98\xe3\xcc\xa5]\
-\x15x\xf1W\xe0N6\xb7c\x98YwL\x8en\xee\
-\xf72\xe3\xbdn\xde\xa0c\x9fu\x91o\xd7\x1f\xe3F\
-7\xc7\xe4\x0c\xee\xc79\xab\xd1g\xbc\xfa\x17\xb8\x02\xeb\
-\xe6\xfb\x02\x17\xf46\xee\x8e\xd5;\xba\xb9G>6F\
-7o\xec\xb7\x1b\xef\xb1\xf1{V\xcf\x14b\x8f|V\
-?\xdb\x90\xd3\xf0q\xac\x9d\xa6?\x86]\xbaU\x81\xfb\
-\xad\x02gmz{\xdb<\x8e\x9c\x9e\xba!g<\xf7\
-\xd1\x9f\xa6C\x9f\x0d~\xc6\xce\xbaY>\x0d?s#\
-\xef\xf3\xca\x98>\x0d\xecj\x9f\x81\x0a\xac\x9b\xf1g\xa0\
-\xc8GB\x1c\xab{t\xc7zty\xe1.\xf2\x9dl\
-\xf0gaf_\xf19\xeb\x22\x9f\xd5\xcf6d\x1a\xbe\
-Nkg\xd9N\xe3\x1c\xd3\xbfP~\x8e\xf9^\xbaU\
-\x81\xbb\xad\xc0\x0b\xb9i\x9d\xe6k\xaf\x9f\xc7\xc7dt\
-\xd1\xcf\xfd^\x9f\xf1\x9d\xf4\xfb\x8d\xffv\x1c\xea\x18L\
-dz\x1a\xfa\xb9\xed\xc7\xb3m\xc9\x7f\x00\x15X7\xd1\
-?\x80\xa2\xde\x85\xcbc\xf5\x9fu\x91\xe9\xf7\xf2\xb1q\
-p\xb7\xebIq\x8f\x99u\x91\xd3'V\xc6s\xbf\x97\
-\x8f\x8d\xd1\xd1f?\xd6<\xbf\xe3\x0b\xed\xef\xf9e\xb3\
-\xd8\xf7s\x05^\xc8\xcd\xeb4_{\xfd<>&G\
-7\xf7{\xf9\xd8\x18\xdd\xed^\x9c\xebc\x98Y\x1f\xf9\
-X\x8f.-9d\xbc\xfa\xcfP\x05\xd6\x0d\xf43T\
-\xe8\xdb\x849v\x1ef]\xe4c\xfd\xacC>6>\
-\xa6#\xa5c\xf8\xe8\xd3\x87\x9b\xf1\xdc\xef\xe5cct\
-\xb4\xd9\x8f5\xb7?>\x17\xce\xed\xbd.\xc4\xaa\xc0g\
-\xb6\x02\xcfe\x83;\x8d\xb3\xd7\xcf\xe3crts\x7f\
-\x96\xbc\xb71>\xa6\xa3\x82\xc7l\xd1\xcf\xfd^fL\
-\x8b_\x8f\xd6\xf13^\x81u\x83\xfd\x8c\x97\xfc\xb6\x01\
-\x8f\x9d\x93Y\x17\xf9N\xfa\x19s\x9aLB\xd8f{\
-t\xf4\xb4\xbdm\xd6\xede\xc6\xb4p<:~\xbc\x13\
-\xccq\xe6\xd2\xae\x0a\xdc;\x15\xb8\x93\x8d\xf0\x18f\xaf\
-\xcb8=\x15\x8a|V\x7f\xcc6\xebN\x93\xcf\xf2?\
-\xdb\x90\xe7\x16\x7f\xb3n\xc9\x7f\x08\x15X7\xe0?\x84\
-\xa2\xdfa\xc8\xd3\xce\xcd\xac?&G\xf7\x5c{\xd2\xdb\
-sg\xddY2\xb6\xb4\xf8\xc8\xf8\xb4\xfeNq\xa7\xf1\
-\x97~U\xe0\xc5^\x81;\xdd\x10\x8f\xe1\xf6\xbay\x1c\
-9=u\x8a\xfcB\xf5\xb3\xcf\x9c\x87\xf8\xce\xf8\x18f\
-\xb6-\xf9\x0f\xa9\x02\xeb\xe6\xfb\x87T\xf8\xbb\x0c{\xda\
-y\xda\xeb\xe7\xf11\xf9Nu\xa4w\x0c\x9b\xb4g\xdb\
-\x1e\x1bL\xfa=6\xfa\xd5\xaf\x0a\xac\x0a\xdc\xbe\x02\xc7\
-6\xd3\xb0\x8e\xd9f\xdd,\xc3\xc98\xfd\xac\x9b\xe5\xdb\
-\xd9g\xec^f\x9c6\xfb\x89n\xf5\x9fE\x15X7\
-\xe7\xcf\xa2\x93q\x87\xa9\x9cu\xce\xf6\xb6\xb3\xc6\xcf\xd5\
-\x964\xf7\xfc\xdb\xe9c\xbf]\x7f\x9a\xdf\xdb\xf1\x96}\
-U\xe0\xc5P\x81\xe7\xbb)\x9e\xc5\xdf\xdb\xeef|\x16\
-vo\xa3\xce\xc7tg\xe9_\x0c\xe7\xe6\xbe\xcbq\xdd\
-l_\xdc\xa7\xfcv\xe7\xef\x98\xfd\x85\xd6\xcd\x15<\xe6\
-{\xb6\xdf\xad\xfcB\xfb\xbb\xdb\xf8\x0b\xbf*\xf0BT\
-\xe0\xb4\xcd\xf2\xf9\xf8>\xcb\xe7i\xb6\xbd~?&\x9f\
-c\xba\xb3\xf4\xb7\xb3a_\xed\xb3\xb4\x02\xeb\x06\xfbY\
-zb\x9ecZwr>\xcf\xc2<W\xdb>\xdd\xb3\
-\xfc\xec\xb1k\xbc*\xb0*p\xe7\x158m\x83\xde{\
-8\x0b\xf7\x5cm\x89q\x16?\x98\xd5\xbf\x08*\xb0n\
-\xd4/\x82\x93\xf4<R\xbc\xdb\xf3{7\xf8\xbb\xc1>\
-\x8f),\xea\xaa\xc0\xaa\xc0\x1dT\xe0n6\xe5\xbb\xc1\
-\x12\xfan\xf1w\x90\xee\x82|6T@\xff\x0d\xebg\
-C\x22+\x87\xcfh\x05\xd6\xe6\xfd\x19-\xf7\x0a\xb6*\
-\xf0\x07^\x81\x17b\x93~!|\xfc\x81Ot\x05x\
-\xe1*\xb06\x82\x17\xae\x96\xf7\x92\xa7\xb5.\xee\xa5\xb3\
-\xb9\xe6\xb2*\xb0U`m\xf2[-\xee{i\xdd\xe8\
-\xef\xfb%\xf0\x82\x15`\xad\xa5\x17\xac\x94\xcb\xd1\xaa\xc0\
-m+\xb06\xf2\xdb\x96h\x01V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05V\x05V\x05V\x05V\x05V\x05V\
-\x05V\x05V\x05\x9eS\x05\xfe\x7f\xb9\xbd\xd6\x10\xad\x88\
-\xb6\xef\x00\x00\x00\x00IEND\xaeB`\x82ic\
-04\x00\x00\x03(ARGB\x04\x00\x01\x05\x09\x0b\
-\x83\x0c\x0a\x0b\x09\x05\x01\x00\x01\x0a\x91\xe7\xfb\xfe\x81\xff\
-\x07\xfe\xfb\xe7\x95\x0c\x02\x05\x91\x89\xff\x03\x95\x05\x09\xe7\
-\x89\xff\x03\xe9\x09\x0b\xfb\x89\xff\x02\xfd\x0b\x0c\x8b\xff\x01\
-\x0c\x0c\x8b\xff\x01\x0c\x0c\x8b\xff\x01\x0c\x0c\x8b\xff\x01\x0c\
-\x0c\x8b\xff\x02\x0c\x0c\xfe\x8a\xff\x02\x0c\x0b\xfb\x89\xff\x03\
-\xfd\x0b\x09\xe7\x89\xff\x03\xe9\x0a\x05\x93\x89\xff\x06\x96\x06\
-\x01\x0c\x93\xe8\xfd\x83\xff\x09\xfd\xe9\x96\x0d\x02\x00\x01\x05\
-\x09\x0b\x83\x0c\x04\x0b\x09\x06\x02\x00\x8f\x00\x03\x19\x1a\x1c\
-\x1c\x82\x1d\x02\x1b\x1c\x18\x80\x00\x01\x19\x1c\x80\x1d\x03\x1c\
-\x1c\x1d\x1c\x80\x1d\x05\x1c\x18\x00\x00\x1a\x1d\x80\x1c\x81\x1d\
-\x00\x1c\x80\x1d\x03\x1b\x00\x00\x1c\x82\x1d. F_-\
-\x1c\x1c\x1d\x1c\x00\x00\x1d\x1c\x1d\x1f$*\x94\xf6\xfb\xdb\
->\x1c\x1d\x1d\x00\x00\x1c\x1d\x1dI\xdb\xe7\xfa\xfe\xff\xfd\
-\xa2\x1b\x1d\x1c\x00\x00\x1d\x1e'\x84\xfb\x80\xfe;\xfa\xf5\
-\xb1\x1a\x1b\x1d\x00\x00\x1c k\xf6\xfd\xfa\xf6\xf3\xef\xe7\
-\xd2=\x1a\x1c\x00\x00\x1d\x1e\xb2\xf1\xef\xeb\xe7\xe2\xdd\xd7\
-\xd2j\x1b\x1c\x00\x00\x1c\x1d]\xcf\xd3\xce\xcb\xc8\xc7\xc7\
-\xaf5\x1c\x1e\x00\x00\x1c\x1d\x1c\x1e\x81#\x18$&\x1c\
-\x1c\x1d\x1f\x00\x00\x1c\x1c\x1d\x1c\x1b\x18\x18\x1a\x1a\x1c\x1c\
-\x1d\x1e\x1e\x00\x00\x18\x82\x1b\x07\x19\x1a\x1b\x1d\x1c\x1f\x1f\
-\x1a\x80\x00\x0b\x17\x19\x1b\x1a\x19\x1a\x1b\x1c\x1d\x1d\x1e\x1a\
-\x8f\x00\x8e\x00\x02\x1a\x7f\x91\x80\x96^\x95\x94\x93\x92\x90\
-\x8bx+\x00\x00}\x94\x93\x93\x92\x91\x90\x8f\x8e\x8e\x8d\
-\x8c\x8bt\x00\x00\x8a\x90\x8f\x8e\x8d\x8d\x8c\x8b\x89\x88\x89\
-\x88\x87\x82\x00\x00\x8b\x8c\x8b\x8a\x88\x87\x82\x8f\x9b\x83\x81\
-\x82\x83\x81\x00\x00\x88\x87\x85\x84\x82\x81\xbb\xf7\xfb\xe6\x81\
-~\x7f~\x00\x00\x84\x84\x81\x8f\xe6\xed\xfa\xfe\xff\xfd\xbc\
-m{y\x00\x00\x80\x80~\xae\xfb\x80\xfeH\xfa\xf5\xc4\
-^lu\x00\x00{{\x9f\xf7\xfd\xfa\xf6\xf3\xef\xe7\xd6\
-vek\x00\x00wv\xc9\xf1\xef\xeb\xe7\xe2\xdd\xd7\xd2\
-\x90gh\x00\x00rp\x90\xd5\xd8\xd3\xd0\xcd\xcc\xcc\xba\
-pgi\x00\x00nnjd_`bdehb\
-gik\x00\x00h\x80k\x0cg]^`deg\
-iki\x00\x00Z\x81j\x18hbceghk\
-m\x5c\x00\x00\x15Xejihigfhki\
-\x5c\x14\x8e\x00\x8e\x00d3\xc5\xe0\xe8\xe7\xe6\xe5\xe4\xe2\
-\xe1\xde\xd5\xb7@\x00\x00\xc1\xe4\xe3\xe2\xe1\xdf\xdd\xdc\xdb\
-\xda\xd9\xd7\xd5\xb2\x00\x00\xd5\xde\xdc\xda\xd9\xd8\xd6\xd4\xd3\
-\xd1\xd1\xd0\xce\xc6\x00\x00\xd6\xd6\xd5\xd3\xd1\xcf\xc5\xc0\xc3\
-\xbd\xc8\xc7\xc8\xc6\x00\x00\xd0\xcf\xcc\xcb\xc0\xba\xd4\xf7\xfb\
-\xed\xac\xbf\xc1\xbf\x00\x00\xc9\xc8\xc3\xbd\xee\xf2\xfa\xfe\xff\
-\xfd\xcd\xa4\xb9\xb7\x00\x00\xc2\xc1\xbb\xca\xfb\x80\xfeX\xfa\
-\xf5\xd0\x8d\xa1\xb0\x00\x00\xba\xb6\xc0\xf7\xfd\xfa\xf6\xf3\xef\
-\xe7\xd9\x9b\x94\x9f\x00\x00\xb4\xaf\xd9\xf1\xef\xeb\xe7\xe2\xdd\
-\xd7\xd2\xa9\x97\x99\x00\x00\xac\xaa\xb2\xda\xdb\xd6\xd3\xd0\xcf\
-\xcf\xc3\x9a\x98\x9b\x00\x00\xa5\xa5\xa0\x93\x86\x88\x8b\x8d\x90\
-\x93\x92\x96\x9b\x9e\x00\x00\x9b\xa0\xa0\x9f\x9a\x8b\x8c\x8f\x93\
-\x96\x99\x9b\x9e\x9a\x00\x00\x86\x81\x9f\x18\x9c\x92\x93\x96\x99\
-\x9a\x9f\xa0\x88\x00\x00+\x86\x98\x9d\x9e\x9d\x9d\x99\x98\x9b\
-\x9d\x9a\x86'\x8e\x00ic07\x00\x00>S\x89P\
-NG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\
-\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\x00\
-\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00D\
-eXIfMM\x00*\x00\x00\x00\x08\x00\x01\x87i\
-\x00\x04\x00\x00\x00\x01\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x03\
-\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\
-\x00\x00\x00\x01\x00\x00\x00\x80\xa0\x03\x00\x04\x00\x00\x00\x01\
-\x00\x00\x00\x80\x00\x00\x00\x00H\x8e\x04w\x00\x00=\xb5\
-IDATx\x01\xed\x9dy\xb0d\xd7]\xdfOw\
-\xbfe\xf6\x19\xed\x8b\xb5Z\xd8Z\x1cK\xb2\x16\xdb(\
-\x0e\x96\xc0`\xc0\x90x\x85\x90\x04*E\x80\xc2q\x91\
-\x98\xa4\x08\xd8T\x05R\x90\x0a\x8bY\x8a@HX\xfe\
-\xa0B\x05\x12\xb3\x05*^#\xdb\xac\xc66\xd8X\xb2\
-\x91-k,\xcb\xd6\xbe\x8d4\x9a\xfd\xbd\xd7\x9d\xef\xe7\
-\xfb;\xbf{\xcf\xeby3\xf3\xfaI2\x86\xbc\xf3\xe6\
-\xf69\xe7\xb7o\xe7\xdc\xdb\xb7o\xf7\x94\xb2\xd96#\
-\xb0\x19\x81\xcd\x08lF`3\x02\x9b\x11\xd8\x8c\xc0f\
-\x046#\xb0\x19\x81\xcd\x08lF`3\x02\x9b\x11\xd8\
-\x8c\xc0f\x046#\xb0\x19\x81\xbf\xfb\x11\x18|\x89\xb8\
-\xf8\xa5b\xc7\x17;\x1c\x93/\xb6\xc2i}\x7f\x13\x81\
-ou\xe68{\xeck\xc7\xd3\xf6\xfe]\x99\xb7\x89\xcf\
-q\xf6\xf8\xd8\x8e\x9fU\x9f\xbfX\xc1N=\xf4\x83r\
-\xf3\x0f\xcf\x9f\xff\xf5\xaf\xbf~\xb8\xb0\xf3\xaa\xc9pp\
-\xc9`8w\xb1\xc0\xcf\x19\x8c\xca\x8e\xc9\xa4\xec\x1c\x0c\
-\x86\xdb\xc7\x93\xc9\xc2p0\x98\x13\xfdh\x5cDe\xc6\
-A\xc8\x99\x94\xc1\xa4L\x06\xa2S\xa4\xd4\x17\xc3\xd5M\
-\x065t\xc2\x1bh\xb6\xc9\x04\x1a\xe9\x0dn\x87W|\
-\x9e\x12\xe9\x04k(\x1c\x9c\xee$\xcc\xd2\xc4\x8e\x00D\
-\x1a\x0fc\xc0\xa4PrB)\x02\x83^\x16\x098.\
-E\xd6A\xbb,\xfb\x97\x87e\xb0$\xe0A\x19q\xa0\
-LV\x0e\x8cW\xc6\x0f\xca\xa8\xcfM\x96\x8e}\xaeL\
-\x8e}j\xf9\xd6_\xff\xf0C\xefy\xdb\xd1*\xa3\x93\
-\x952\xd5?+m\x95\xef\xcf\x82\x06\xe4\xfb8\xf3\xad\
-\xef:{\xcbyW~\xeb`0\xff\x8a\xc9px\x93\
-\x02\xba=\xf2F\xb0#\xb6\x10\xc6HL\x8aN\x0f'\
-\xafI\x13c\x1bNZI\x01\x86\x13\xeb\x96'P\x96\
-H\xe6{\xfe\xd0\x07m\xb6\xd0C\xae\xaaN\xa1\x5c-\
-\x96=%\xd7\x12\xc3\xa9\xd5\xfc\x01\xeb\xf5 _3\x19\
-\x17f\xa6\xfd@\xa7\xf8\x81L\xca\xe1\xc1d\xe5#+\
-K\xc7\xde7~\xec\xc1_{\xf0\xc7n\xb9\xb7\xaaR\
-)\xb9\x85\x80:y\xa6\xba>\x0a\xcf\x94\xc4\x90\x83\x5c\
-\x8e\xe1\xf9o\xfb\xe4KG[\xf6\xbc\xa9\x8c\xe6_\xa3\
-p,\x82n\x13\xd2\xce\x9d\x14\xc7\x82d@\x18\x09\x09\
-x\x0d\xedT\xa2\x83\x9f\xd7\xbeA\x99\x8ee\x02\xc0\xf6\
-\x05\xe5\xd4D&\x04w-4Y\x81\xae\xe3\x07\x0f\xb3\
-Z\xc7/\x00rS@\xe2\x81\xd0:\xfeJ\x97\xf8\x13\
-\xf3C\xd1\xe7Wt\xcb\x83\x95\xe5w,\x1fy\xea\xbf\
-<\xf0\x83\xd7\xbfOH\x8a\xe0Y)\x84\xb4M\xf2\x9f\
-\x91\x86<\x1f\xcf\xf9\xe1\xf7\x9fW\xcex\xde\xdb\x86s\
-\x0b\xdf\x1c\x09\x11\x18\x8c#\xb7z\x5cS+t\xbf\xba\
-#\xbe\xfd\xea\xeb\x16l\x1f'\x84\xd9\xe8\xa0\x8dD:\
-\xf8\xb5p\xc0\xb72m\x80+\xc2l\xd5\x96\x94\x92\xe6\
-\xf5:\xa1\xb2\xc9UNp5\x060\x14A\x97XM\
-\xd3W\xfb$<vw*-\xac\xe1\x0f\x81=\x7f\x95\
-\x956\x1b=^z\xe7\x91{\xf7\xbe\xf9\xd1\x9f~\xd5\
-\xdd\x9a\xafXEor\x95\xb0\xf1\x0e\x93\x9e\xa9\x86,\
-\x8e\xd1\xf9?\xfb\xb9\xef\x1c-n\xfdO\x1a\xef\xca\x08\
-\xa4\xdb\x10L\x8f{#\x146!\x8fOv\xc0\x91n\
-~\x17\x11tu\x87\x90\xcc@d\x02* #/\x99\
-NH\x92U%)\xcb\xfa=I~CD\x9d\x96j\
-\x94:\x1bh\xc7\x9f\x02D\x03GN\xed\x8c\xe6\xb4\x8e\
-_\xc8*\xaa\x9a\x9c\xbb\x8d\xa5\xf5\xfc\xc1\x14\xc2\xc6\x93\
-\xc3\xe3\xa3\x07\xfe\xe3}oy\xd1O\x0aL\x11\xb0\x1b\
-\xf4\xc6A\xbb\xc16\xda \xdf4\x1b\xd6\x0f\xcb\x97\xbf\
-a\xf1\x82\xef\x7f\xf7\xcf\x0d\x16\xb6\xfc{\xcd\x9b\xed\x1e\
-?\xf8\x0b\xab\xe9\x89\x02\x89v\xb536\x8e>v\x81\
-t/V\x10\xb4\xc2\xb4\x01\x16\x01\x94\xab\xf8-3\x8a\
-\x22\xe3c\xb9\x15n\xc9\x0a\x1b2\xad_]\xaf\x17P\
-\xe8\x89dE|{<\x9a\x92\xa6\xe1\x17\xd0|\xb2%\
-\xf85\x17\x1a\xf9\xb4U\xf6\x03\xae6\x83\x07\xd7\xcaL\
-~\x04\xd8\x86\xc4\x972?\x9c_\xf8\xca\xdd_\xfd\xdd\
-W\x8c\xc6\xcb\xef>\xf2\xd9\xbf\x5c\xb6\xf0\xaa\xaa\x8e7\
-\xd4\xa1\xff\xe96d\x0cw~\xdb\xcf\xef\xd9s\xe3k\
-~s27\xf7\x8a\x14J\x08\x18\xa7c\xc4$\x82\x1f\
-*W\xad\xca\x966\xd0\x0e\xa4\xf9\x1d4\xe4T\xfe\xc4\
-g\x90\xeb\x9c.u\xc5\xf8x}i[\xd2\xd2\xaf\x82\
-e\x82\x04\xefd\xe1\x08\xf3jG\xccb\xce\xd8\xa5a\
-\xe3*O\x95\xd8%[|\xb4\x90'm\x1d\xad\xa1\xc1\
-\xdf\xd1T{L\x16\x05i\xfa\xca_\xc6+\x1f:\xbc\
-\xf7\x0f_\xf7\xd8\x7f}\xe3C\x02\xb5\xd7\x06\x08\x9b\xb9\
-=\xdd\x1d\x80\xd8\x0d\xcb\xd5_\xb3\xe5\xaco\xfc\xbe\xdf\
-\x1a\xcc-\xbc\x02c\xdb\xad\xb9O\xb2\xd7\xaa\x83@\xe8\
-X\x8d4\x07\x9f\x17\x92k\x08\xb8X\xc5\xb9zL\xa7\
-\x89W\xb0i*\xadu\x05\xa0\xc6T\x93\xca\xef\x9eX\
-W=\x12\x9e;\x88\xe5\xf1\xd2\xf1\xf7\xfal\x87h\x9d\
-\xac \xb12l\xb3\xfe\x10\xa71-t\xc5\x88\xb1A\
-\xcd\xaao\xf4\x0b\x05\xde\xf6h\x10\xb4\x95_\x93\xd4\x87\
-\x88\xa4\xcb8\x1a\x96<\x83\xc1\x05\xf3{.|\xd9\xe0\
-\xf0\x13o?\xfa\xf9\xdb\x97\xc0\xa9U\xabb2\xcb\xeb\
-\xd3)\x00\xec\x1c\xea\x98?\xff-\xef\xf9\xcf\xa3\xf9\xad\
-\xaf\xcf\x08\x10(\x904z\x0e;X\x81-\xce\x05B\
-\xf2\x13HRN\xc8/\x22\xe3C(,'\xe4\x8f\xea\
-\xe9\xf5[fp\xa4*\xeb\x94<\xfe\x12\x96\xf2=\xaf\
-\xbaBTMVC\x1b4a\x83\xc7\x15@\xe7a\xa5\
-e,Q\xf6\xb1\xf7\xcd\xfb\x860\xe0$\xdb\x0czi\
-tv\xe3\x96\x1f\xfcp\xf4\x9c\x85\xcb^\xfc\xfc\xfdw\
-\xfc\xc1\xff.O=\xf5\xb4\xae\x076Z\x00\x98\xcb1\
-\x7f\xc1O\xdc\xfe\xdd\xc3\xad\xbb\xdf\xdaUpu J\
-2\x02\xdb;\x88'\xc1\xe8\xc4e\x80\xe4\xfd*\xfe:\
-\x17u\xbf\x9a\x98\xd0j\xb0\xa0G\x98\xaf\x0d\x1c\xb7\xd0\
-e\x98L\x0b|\xcb\x8f\xb9\xb4j\x93\x87\x95\x1fh\xb5\
-\xbb\xc7K>\xb6Zv\xf4\xb0X?]L\x1c\x04$\
-w\xfc\x1dOP\xe4\xbe\xd5i_e\x7f\xc8\x0d\x1d\xd8\
-%\x9ei\xfe66\xd6[\xfd\x1c\x8e\xae\xdcq\xf5\xab\
-W\x9e\xfa\xc0\xaf\xfcYg\x8em\x9a\xede\xa3\x05\xc0\
-\xca\x1f\x9d\xf5/~\xe5\xa2\xb9\x8b\xae\xfeM9\xb7\xe8\
- \xc8\xfa\xa8\xeb\xde\x910'\x02\xdd%E@\xe8\xcd\
-C@\xba\xa0\x04,\xc3\x0b\xde\xcd\xf8\xd5I\xed\xf8\xad\
-3\x82\x22\xb2XI\xea\x91\xd1\xd9\xa2Y\xea\x02\x93\x17\
-\x94\x86u\xfc\x84?\xe4@\xe3Dg\xf6\xe11\x08\x05\
-\xfc\x8b\xb4&\x8c\xbeO\xa2&n\x8d\xfejW\xef\x7f\
-\xc3/Z\xf3\xc3\x83\x9f\xe6\x8d\x97n\xdc\xc5\xc7\x8eY\
-\x17\xd6\x0e\x17\x16^\xbax\xc9\xb5\xbfw\xe8\xa3\x7f\xf0\
-\xb88\xd8\x09fn$r\xd6\x86]\xde\xfa\x17^\xf0\
-\xf2\x1f\x93\xe3\xbbp\xcc+\xa0\x06\xdec\xc2\x09|<\
-\x0e\xa7to\x14\xa3\x1df\xc1I\x10\xf7K\x11\xd6\xf1\
-\x0b\x16p\xd1U\x99I#A\x95_\x14\xe3\xa4\x13L\
-\xc3U\xfc\xe6\x0b\xb9\xf0\xd8\x16\xf4\xe9@W\xe8\x8b]\
-3e\x07?\xb2\x82.\xe1\x1d?vM\xf3k\x9e\xbe\
-A\xef1\xfc\xe9\x97\x87\xc0\xc3\xe7\xe3\xf8\xab\xdf\xe1'\
-v\xf6;y\xe8Gg\xc0\x89\xd9*~\xc5\x94&u\
-\x8b\x8b\x97^\xf7\xd3\x1a\xce\xeb\xd8\xd0b\x9e\xb5\x002\
-\x86\xa3s~\xe0]7\x0d\x17\xb6\xbe\x0eC2\xb1v\
-\x1e\xe3j l8\x04\x04\x0b\x98\x83\xe2\x97U\x01\xeb\
-\xf8M\xd7\x07\x22\x1c\xb7\x80\xe0\xf70\x0a\xc1\x89e.\
-\xa1k\xf2\xdb\x86\xc0C\xd3\x078\x12\xdd\xf1\x8b.\xf8\
-\x836\xec\x0c\x1b\x81\xd8h\xec\x0a\xe35\x15=s\xf3\
-\x05>\x83b=\x14'\xec\xf1R\xfb\xa07\xcc|\xcc\
-\xc3\x0f`\x1d?\xac.\x04\xd8,\xa4\xf6'\xe6\x1f\xcc\
-m\xb9\xe5\x9c\xef\xfb\xbdW\x89\x83\x02 \x9f\x88[w\
-\xe3\xc3\x96Y\x9bW\xff\xfc\x99\x97\xbe\x11F*\xbfo\
-8S\xf5;H\xb2FS\x07K\x83t\xae\xb5\xd00\
-|\xadA3?\x04T\xbf\xba\x18J.\xfcU\x172\
-\xfd\xd1\x8c\xfaHX\xea\x89\xde\xf6\xb4\xfc)\x87\xe0J\
-\xa8\xf9MT\xf9\x8dW\x90+\x9dQ\xb6\x1f\xbd\xd0\xa4\
-|(4\xf6_\x8cc7\x02f\xd1\xees\x82D\xc3\
-\xa5\xd6r\x1c\xaa\xf0\xc5\xbbM\xe5AA\xab\xc7\xd2\xd0\
-o~\xe2V\xe5\xa0\xd2\xb4\xb2@=L\xc4on\xd7\
-\xb9\xdf%\xcc;t\xe4M\x22\x0d\xd7\xd76\xb2\x03\x8c\
-v\xbd\xeeG\xce+\x0b[\xbe\x01\xe52\xa19P*\
-\xb3\x09\xb4\xfa<\x08\x82\x0d\x07\x86\xe1\x95\xc6\xfc\xf8\xa1\
-y\x1c&\xec\x12\x9d\xb4\xab\xf8-\x031\xd2\xe3\xed5\
-\xf8\x91\xe9\x0f\xec\x80[\x7f\xc8\xe25\x82-<\xaa\xe1\
-\xe7\xd5t\xe8\x85?\x1a6\xa03\x8a*l\x02\x94\xf0\
-\xb4\x03\x19k\xf3#'\xec\xa2\xcf$\xf7\xfc!?u\
- \xa3\xf3\xdbz`O\xfb\xe1\x0fy\x96\x03\xad\x0e\xe4\
-\xf6\xfc\x11\x7f\xed\xc47\x9f\xf9\xcf~\xe2yB\xce\xbc\
-\x0b\xccR\x00\xf8\x0f\xfd\xdc\x8e\xeb\xbe\xf6\x9fhE.\
-`\x08-\x83A\xe0\x9dT`\xf5\xdc\x17+$\x9cJ\
-\x87\xa37#/\x0d\x7f\xd0\xa1(\xe4\x04.h\x90\x1d\
-AH\x9c\xaf{\x04\xf3\x1f\xbdt\xa6l\xd3\x00\xab\xc5\
-\x08\xbc\xe3\xd3N\x92I\xe9e\x87|Q\x19g\xbe\x8e\
-\x1f{\x92\xdf\xce\x1d\xc7/\xe5\x96\x1f\xfaE[w\xab\
-\xae?\x8e_r\x9ad\x8ay5\xbf\xe6i\x9b)\x8d\
-\xc76\xc0}_q\xc3\xc5K\xae\xff6\x8d\xd9\xd1M\
-\x02|=m\x96S@W\x00\xc3\xc5\x1d7G0\x05\
-\x92\xe3\xab4\xba&\xc2x\xfc\x03\xe7b`\x8f\xab\x8d\
-\xe0G\xa0\x92\xdfT\x89V/F\x07@\xfc\x90\xd8\xe1\
-i\xfe\xc0Ag\xd1\xd0\x07\xb1\xd9\xcd\xaf\xb9%\x9b_\
-b{\x11\xd5\xa6P\xd5\x80;\xbd!\xa4\xf2S0\x1d\
-\x11\xb6\xf1/\x93\xd0\x8b5\x89\xed\xa8\xaeT\xbd\x14\xc1\
-*~\xd46qK\xd1\xd1\x87|t`/\xb0\x96\xd6\
-p\xc3\xaa\xdf,4\x88\x16\xb7\xbf\x5c\xaf\x5c\x0crs\
-(\xb7`\x0dO\xdef\xdf\x01\xcez\xc1\xd62\xb7\xf8\
-\xe2\xdc\x9e\x10\x1f\xab\x03\xc3k\x15K\xbf\x9d\xf1<\x03\
-\x158\x0a&\x12jN[\x87\x83\xc0\x92\x9f\xde\xfc\x84\
-\xb9n\xf3-.\xf8\x83^L\xa2\xa9\xfc\xee\xe5;\xfc\
-\x8e\x5c\xacJ\xaf\xf6*+\xe5\x04\xcc\xc6\x0b$:\xf1\
-\xa6m\xe6\xb7y\x0d\x7f\xf5\xe58~\xe4\x1a7\xcd/\
-\xfb\x8c\xab\xc9_\x17\x7f\xc8\x0a\xfd5\x1e\x14\x8fm\xa9\
-\xb8\xaa/\xe2\x03\x02wE;\x9a{\xe1\x96k_\xbd\
-[Sr\x0a\xba%\xd1t\xed\xb6\xde\x02H\x81\xa3\xb3\
-\xbe\xf9-/\xd2\xf6\xbfM\xe6D\xe0\xab\x81y~\x8a\
-\xc0c<EH\x8b@\xb8\xafA\xc8\x1d \x03\x1f\xc2\
-\x83\x8e1p\x82\x10\x0dYU\x86\xf9# \x11t\x82\
-\x12\xf3Lh\xf0'\x8f\x85U1\xc8\xc8\x84\x12\x1d\xcd\
-k\xd2\x09\x02\xcf\x16\xc1K\x8f\xad\xf8c\xbb\xb27\xac\
-\xe7\xc7\xa6\xde\xfe\xa0\x15\xa3\x0b\xcf\x09\x11\xbe\xb5\x1b\x99\
-\xc1Si\x93\xdf\xf2\x93?z\xf3\xa7\x1d\xb5G62\
-bA +\x8a\xd6\xfe[\xc6`\xb4\xfb\xcb_{\x93\
-\x88\xb8\x0e\xc0\xf4u\xb5YO\x01\xa3\xb9\x9d\xe7^\x89\
-!\xad\x06'L\xea\xd8\x150\xdeW\xec\xea\x93\x8e\x91\
-\x83i\x93 \xaa\x16\x82P\xeb\xf8\x19\xeb\x80\xd60\xe8\
-4A\x94\xf9\x03a\x22\x86A]i5\xe3\x220i\
-#\x88UV\xdd&]\xed\xd6\x19\x02\xb3hls\xf5\
-I\x12\x0a\xcf\x9f\xd9|\x8f\xa1\xa2 \xab\x0d\x8d\xde(\
-z\xd5Q\xe7\xabh5N\x9ba\x8aXd\x91\x9a\xd9\
-\xb2\x18\xf5\xfa\x99\x11S \xb5G\xa6e\x09\xc6\x22\x93\
-M\xf5\x84t\x02~e~\xc7\x9e\xcb%\xe8Y)\x00\
-\xe2\xcd1\x1c.n\xbd\x88*d\x06 \x82\x07V3\
-\x07\xc2@\xe3\xd2\xd2\xa4\x13&xj\xcf<\x02\x06\x85\
-'\xd1\xeb\x15q\x96\xa7\x07\xec\x1c\x16\x07Dc\xab\x89\
-\x80B\x9c\x01c\x1c\xf4\xeaEc\x89\x98\xe9q\x14\x86\
-iL\xa6$3\xb1,\x22\x06QL\xf4\x8a\xd0\xe0\xcf\
-Wr\x01\xbc\xbe\x8e\xf3\xbc+<\xf6\xfb\x81E\xa3\xa1\
-\x0ab\xcb\xa9\xb0\xb0?eBA\x92i\xc6\xd4\xb1\x89\
-\xe3J_\x85\x1c\xc9\x16\x8c\x22\xa0\xb3\xcej\x85a\x82\
-\xea_\x1f\x7f\x11\xcd\xcd_\xac\xd7\xd8\xd0B]0\x08\
-x\xa26\xf3\x0eP\xe6\x17.\x8cX\x85l\x1b\x87C\
-\x9aF2\xa5\x8a1/j\x81\x8f\x9ey&<\x0d\xef\
-\x13\x1a\xc1dn:\x8aL\xad[\xd5\x16D\x22#8\
-\xa9+\xc0\xac\x90\xca\x1fQA\x91\xf9\xd1\xdc\xd1\x8a\x98\
-\xf1\xd0K\x5c\x18\x91\xc4j\xa7\xa0j2\xc2\xa0j\x7f\
-\xa4\x01_\xf4\x80\xaa\xe5q\xd6\x18\x89i\xecS\x8fl\
-\x11\xb8\xae\x87\xaa\xc7J|\x15f\xfb\xf5\x12\x09\x87?\
-\xa2\xe2\x11~\xd4D\x87O\x0d\x9dp\xc0\xccoq\xd0\
-\x86\x5c\xa0\xc1\x1f6w\xb2 \x9e[\xbc@\xaf\xcf\xda\
-\x0e\x10\x955\x9c;\x97\xf3O(Fk$\x84\xf3k\
-\xc2\xe8\xd30\x22\x94[e\x17\x88\x96_\x1e9\xb6\xc0\
-\xc4\x84\xdf\xc9\x8fl\x1e\xb1%5\xfe\xe7\xa0\x05Q'\
-\xbf\xea\x0a\x9bHv\xd8\x112\xc3\xbe!\x99\xa6\x8d\x07\
-N\x9e\xc7\x16C\xa0S_$\x13\xfe\x5c\xd1N\x82\xe8\
-\x5c\x1a\x22DJ\xe2FR`\xbc\x80\x96_Ut\xfa\
-\xad$^\xec\xbflH]@\xd3~d3Fx\xf8\
-_\xed\x07F\x03\xee\x1e\xfe\xb0qMZ\xec\x18\x8d\xce\
-\x16)y\x82%\x8fj\x19B\x8eo\xeb\xd9\x01\xac_\
-\xac\xf4z\xbay\xb0\xdd\x86 \xcb\x06\x01\xae\xc6\x01\xa3\
-\x09\x144r\x8f%\xa39T\xa6T\x80+\x89\xbaZ\
-<2\x91\xf0:O\x98\xdb\xf2\xd7\xb5\xd4\xf1#\x0f\x12\
-\x0b\x0b\x99=}\xf8j\x14j=\x08\x81\xac\xa0\xd8M\
-\x82\x86D\x82\x86&\x13\xcc\xd8\xd4\xf1\xa0\xb7\xe0\x5ch\
-AD\x92\x85\xd3R\x17\xc4\x00\x9e@\xb7\xfdt\xa2q\
-r\x15\xfa8=B\x1cz\xec\x97H\xb2\x90+\xd8\xba\
-\x05\x04\xe3\x16z\x19\x86\xfcLv\x17k\xec\x17\xae\xe3\
-\x87\xac\x9b\x08\xc3x<\xd8!h\x16\x00\xc2N\xd9\xd6\
-S\x00\xad\x10\xc5q\xb8\x1dCh\x04\x0c#:'q\
-\xabF\x0c\x14\xe3\xe85\x84\xdeG\x8eb\xde\xf3\x0b\xdb\
-\x10{\xa8\xc8Fo55Y\x08V\x93\x98\xb4\x83\xa0\
-\xe7\x16\x9dA\x19*\x0c\x91$\x12\x0f\xbfd\x096\x84\
-\xcf8\xf5T\x9cq\x13\xed\x0c\xd0c\x9b\x0ezp$\
-\x16<\xbd=\x08~\xeb\xe7;\x09\x90\xaa \xb1\x12\xfd\
-\xcc\x87\x96A\xd5H\xa0x\xb0_\xe0\xd0_\x93\xa8\xa9\
-\x1b8\xb0V\x17\x13\x08\x0d#\xdd\x8c;\xb0\xf4\xb8\x88\
-\x8d\x17\x89\x10\x81\x13\xbf\xfc\xb7\x8fC=j\x1f\xe0d\
-\xd3\xf4\xe4m\x96\x02@\xa8\xec\x1an\xc30\xcc\xe4\x05\
-\xc5 \xa2R\x0d\xb5\xe1\xa60>\xaa\x13:ZVt\
-\x95`\xde\xe0\xaf\xc9F\x84\x00\xaeh\x0fIs\x0d\x84\
-p\xe6\x97\xb0\xc4\x13f;\xaf,E\x11D1\x90\xb4\
-2\x88\xa0\x89\xab\x8c$\x13=$]\xdb\x98F(b\
-\x1cm2^1\xd4E+f\xf8\xe3</*\x8d\x9d\
-NUO\x14\x95k\xc3\xdc$\x0a\xd9c\x9d^\xbcM\
-H\x9c\xbf\x9f2X1_\x9e\xbb\xbd\x83\x107bb\
-\xcd\xe8\xc5/\xa7:\xfc2\x08\x02\xfc\xc3\x01\x0f+N\
-\x5c\xe6\xaf\xc96\x9a\xb1\xf8\x8d\xc2\x9f\xb2\x0d\x96\xe6\x00\
-v\xd2\xb6\xde\x02@(M\x8bd<o\x0dx\xa2\x96\
-\x0e\x05\x01\x0e\xd5&D:\x8f\xa3\xfe\x97\xc4\x22!\xad\
-\xb4\x04\x99\x0f\x1e\x03\x8d\xaa\xb2\xe0\xd5!\x04\x9d\x13f\
-\xba\x9e\xdf\xdb\xb9\xf0\xac\xe0\x08(\xbaCF\xbc\xaf\xd7\
-\x95\x11s\xe1\xdd\xbb\x08T\x1c\x08T\x1b\x10l\x1d\x93\
-\x95x\xeazA\x89~\xce\x9e\x85\xb2g\xcb|\xd9\xb9\
-8W\x96T\x1c\x8f\x1cX*\x0f=u\xac<yh\
-Y\x9f\xb8P8#\xe5{\xc8&\x11~\xeakM\x88\
-\xd1^ \x88\xf4\x8f\x87\xbe\xd8\x1cs\xcaB\x8fw\x8c\
-\xea\x1f<:\xdc\x9aD\x13\x12\xc3\xed\x07\xb6i\x06\xaf\
-\x87\x14O\xf2\xe3%@\xb5\xe4\x0fN\xf2\xd9\x896\xfe\
-\x14/\xeb-\x00\xc4X\xb0\x92:\x8a\xf7\xa5Q\xa5$\
-9Wcj\xceU\xea\xa0\xcaN'\x83\x1e)\xea9\
-\x93\xda\x05\x1c\x12p\x15\x7f\x95\x97\xb2\x08\x00\x09\x86/\
-a\xd0s%\xef\xbe\xf2\xb3\xfa\xad\x07R\xe3)\x16`\
-\xa2\x15\xaf/\xd4D@?\xf0)\x03C\x94p%\x97\
-\x1bBW\x9d\xb5\xa5|\xcd\x95\xe7\x94k\x9f\xb3\xab\x5c\
-~\xce.\x9f\x12\x90#\xaap@\x83\x15\x05{\xbc2\
-)\x1f\xff\xc2\xbe\xf2\xfe\xcf<Z>\xa0\xe3\xbe\xfdK\
-\xf2\x86K#\xbd\x99$\xc9:\xd8K\xd0\xe3]A2\
-\xbc\x10T\x5c~\xf7!qRo_bg\xab\xf1\x03\
-V\x1dDo\x0cC\xbf\xc7\x95\x07s\xf2\xbe@\xd0\x89\
-_\x7f\xbc\xea\x85w\x003\xb5Y\x0a\x00\xc1\xc4S\x9e\
-Je\x1a\x99}U\x0b<\x9az\x0f\xa3gX\xfd\xf3\
-\xca\x0b\xa3\x832\xe1\xcc|\xd1\x08m\x05:\x04\x9c\x88\
-I\x5c\x90+\xb8r\xd7I\x84NP\xeb\x81\x19\xc6\xb1\
-\xaf\xf4Y\x87N\xb6\xec\x19\xb2\xec\xd5s\xa3\x9c\xa4;\
-d\xe3\xe52'\xd87^uz\xf9\xa6\xeb\xcf+\x97\
-\x9d\xb9#dI\x08\xb2-\x0a=\xacq|J=\x12\
-u\xf5\x85\xa7\xf9\xf8W_\xf9\xbcr\xc7\x03O\x96_\
-\xfc\xc0\xde\xf2\xc1{\x9e\xd4\x22\x9f\xab\xc9\x9f\xd3\xb7\x19\
-\x15&\x15\xe9`\xc2\x1e\xa4?\xaa\xd0\xdb\x85Da\x06\
-\x22\xb1\xc7~\xa1MM]hfb\xacc\xc5\xd0\xf1\
-\xb6\x0d\x11\x87\x8e_\x1cN\xbe\x89\xba\xb7\x80\xc1\x8c\x98\
-S\xb4Y\x0b\x80\xf3\xe2\x9c6\xb7\xaa4\x1c\xc1l4\
-\xe2F\xa7\x19gde\xee\x10\xd5vS\xb1\xfa\xc3h\
-\xd1\x10\x14\xf3\x87\x04o\xf1\x1d1\xab_p\xe4 \xd9\
-^\x87.\xc0\xd1\x10 :\xf0\xfa\x07=;\x86\xe5\xb0\
-6I\x82z\x96\xc6p\xa0\xc7\xe9\xb5\x12G*\x82\xeb\
-/\xd8Q\xde|\xcb%\xe5\xb9g\xf0\x15E\x84\xd9`\
-\xf5\xd01\xd3\x9f@s\xc2Y\x83\xc6\xbc\xf5\x83t\xd9\
-F\xcb\x03\x11<_\xbb\xc5\xcf\xfc\xe3k\xcbG\xf6>\
-Z~\xfe\x0f\xef*\x9fz\xf8\x88\x12\xaf\xd3\xc9d\xa4\
-XI\xabv\x04\xde~\x22\x94\xd5\xc3\x19!\xf4Y\x95\
-\x8b\x8dQ\xb5\xc0}L\xf2\xfd\x86l1\x8f\x88\xc4,\
-3l\x83D\xb9\xb9`4F6]@\xd7\xff:s\
-\x01\xc8x\x95\xb7\xc3c-\xadF\x8f\x8d\x0bKr\xee\
-dW\xeb\xbcC\x08\xe1^\x12\x92?\x0b\x22\x13A\xa0\
-\xf3\x82\x0b\xe7\x0c7\x9f\xe0\xac&\xe9\x817\x12\x1f\x89\
-\xf1\x9c\x17\xd1\xb3\xee\xc0\x0dE\xab|h\xa4-xe\
-YI\x5c)oz\xd9\x05\xe5[n\xbc\xc8\x81D\x08\
-+\x9e\x06\xab\xc4F\x805sH\x05\xf3E^\x9d\xf1\
-\xee\x82\x22[\x81\x07_\xc5\xb4\x22\xf9/\xba\xe4\x8c\xf2\
-\xcb\x17\x9fQ~\xe1\x1d\x7fY~\xf3\xf6}e0Z\
-\xd4\xa9G\xa7\x0c\x15\x00;\x03\xd7\x04\xd4\x81\x1bJ\xdc\
-(NZ\xaf\xdfS\xc9\x03\xe1k\x14\x8a\x0e|\xb2x\
-,H\xf5\x9f8\x19)CLj\x01\xeb\x7f\x99\xb5\x00\
-(^\x15@\x5c]\xb7\xc9\xc4\x8e\xb4\xd1c\x1b\x18A\
-\x84iU\xc2\xab\xf1\xc9\xdf3\x86\x04\x12\xe7\xaaW\xf2\
-\x82&\xa4\xf3\xca]8z\xb6W4\xd6.\x92\xe99\
-\x17z\x0e\x86\x03G\x12\x86T\x80V\xfe\xee\xc5\x95\xf2\
-\x93\xff\xf0\x05\xda\xbewK~\x8dr\xb5E\xc2\xdc\xc4\
-\xda\xb5v\xa5\xc6\x05\xa6P\xc2\x03\x8f\x9dF\xb2e2\
-^\xae(\xbb\xdc\x22~\xd3\xd7__.9\xf3\xd3\xe5\
-\xa7\xdeww9\xa6\x22\x18\x0c\xf5\xd8\x84\xd8\xb86\xe0\
-t`\xe3\xf5BM\xb3\x9e36\xe1M\xa8\xf68c\
-$\x99\xb6I\xf4\x14d\x98\x17=r\x91C\x8c\xbc\x03\
-\xe0R\xd5\xe0\xd1:^f)\x80\xd0\xad\x1c 7/\
-D\xf0.\x11\xeeeL\xdf\xaa\xa1\x0av\x1bXx\xd2\
-\x19/n1$\x9e\xb9W8B4&\xc1\x04\xd8\xbd\
-\x03\x0f\xb3\x0e5\x0a\x85\x0d\x1a^\x12B\xcf\x8ek\x19\
-z\x09\xe7d\xc3d\xb9\xec\x9c\x9f\x94\x9f}\xed\x0b\xcb\
-\xe5\xe7\xea^\x09\x01C`\x95\x93I@f\x9bt\xe6\
-4\x02<\x1a\xe9*_=W\xf5\xe8\xe2-\x22\xc5\xe8\
-=]\xf6y\xa7\xd7V\xb0\xa4$|\xdd\x0d\xcf/g\
-\xed\xdeV\xbe\xef\xb7o++#v\x09\xed\x00s\xba\
-\x02\x91m\xde2`\xd3\xd0\x1b\x99zM\xd5\x88\x15\xa3\
-\xf0-l\x03\xc2\x22\x08\x9a\xa03\xb1m\xc99~\xc3\
-\x96\xf3\xa0X\xdf+&\xcd\xd6dM\xdc\xee\xec\x0d%\
-0^Q\x0a\x0ac,\xc6p\xfa\xa0\x95\x0a\x8fW\xc3\
-z\x83+\x9dE\x06\x0d\x17pl\xbdl\xe5\xba\xe8P\
-\xd5\x11x\x1d\x9a\x13w`s\x0a\xae{\xd3\x8e\xcb\xbc\
-\xf0s\xb2aA\xdb\xfc\xbc\xe8FE[\xbe\x92\xbf\xa8\
-\xf9O\xbd\xe6\xcar\xc5\xb9;k\x90\xb0/Z\x9b\xf0\
-\xb6\x10\xda\xa0\xb4\xf0!\xe7\x005\x0a\x02\x19\xf3\xea\xe7\
-d\xd0\x9c&\xf3\xd8$\xbd\x14\xc9\xb5\x97\x9d_\xbe\xf7\
-\xe6\x8b\xca\xe4\xc8~\xed>zF#\x0f\xe1\x88\x15~\
-8k\xf4]\xdc\xda\xf8\xa1%\xe6\x19Kb\xd8\xc7\xb4\
-\xe1G\xa6d g\xd6\x16\xde\xcc\xc0\xd5%T\x86\xe3\
-\x08\x09\xc7\xc0.\xa0\x92%\x8c\x0de\x14\xef\xb51\x16\
-\x04\x89\x0eZ\xde{#\xcb;\x89\xe8\x86>\x87\x09'\
-A\xc8\xc30\xdee\xcf)\xb9\x14\x03\xabNkP\x01\
-&\xd1\xeau!7\xd4\x95\xfcP\x09\x1e\xe9\xfc\xce\x85\
-\x1d2\xd9\xf2\xe9G\x93%\x9dw\x05[>Z\xfe\xe5\
-M\x17\x96\x17\x9c\xafg%\xc4\x87|\xe2H\x9bN>\
-\xb0L0\xb8i|\xc2\x92\x86\x22\x08\x1e\x15\x80\x8a`\
-A\xd5\xb8\xa0\xaa\xa5\x10\xb8\xaex\xe5\x0dW\x96\xd7^\
-\xa5\xd3\xcd!=\xb6?>\xa6\xc2\xe0;\x9d\xcb\xf6\xcf\
-\xbe\xcb\x1e\xbf\x15\x15\xd4I\xae}.\x22dG\xf2\x19\
-\xc5\x22\xe9\xe2_c\xc9\x9c\x96\xfc\x9e\xcc\xf02k\x01\
-\xd4\xeb1\x0c\x0f\xa5(\xc6\xe04:\x0cLX\x18g\
-#ILghd\x80\xe2\x88\xb7j \x90I\xc1\xb0\
-\xd2\x15|\xe8I\x98Q*\x04\x92\xef$\x93l\x92\x1e\
-\xab\x9b\x0b\xbb\xa1\x82;\xd01\xd21\x1c\x1f\xd5\xc5\x9e\
-\xe6\xcb\x1cG\xcbM\x17o/\xaf\xbf\xfeBIAg\
-\xd8\x95\xf7\x10\x04X\xb3M'\x9e\x84sd\x01\xb4}\
-\xe2\xe89%\xb0#Q\x00#\xd9N\x11|\xc7\xabn\
-*\xcf\xddz\xa4\x8c\xf7?R\xf4\xa3\x0f\xb2SE@\
-a\xe2\x1f\xe7w,\xd08\xe2\xc7\x82\x00F,bq\
-\x84\xcd\xacn\xc1E\x1c\xf45~\xa2\xcby\xf2\xaf\xe9\
-\xd0I\x80\xb3\x5c\x03T1\x11D+\x96E(\x8e1\
-\x8e\xd4Jto\xa8\x81\xce\xad\x8d\x0d\xc3q\xc6\xde\x80\
-\xd5\xb8\xee\xaa\xb1\xea\xc5\xa6\x9fJQ0\xa9M\xbdw\
-\xe7v.\x82\x15\x10v\x04\xee\xb5\x8ft\xf2\xbc\xe6\xbc\
-m\xe5\xd2\xd3\xb7\x97\xd3\xb7\xcd\x97E\xdd\x9b|\xf2\xf0\
-r\xd9\xfb\xe8\x81r\xc7\xfd\xfb\xcb\xa1c\xac4\xd1\x8d\
-\x97\xca\xf7\xdcr]D\x0d\x11\xe8\xe2d\xad\xd6&\xb9\
-\x9d\xb7p\x07U\xc8\xec\xa1\xcb\x96ta\xbfn\xfe\xf8\
-F\x8f\x8a\x80\xd3\x92\x12\xbc\xa8\x9d`Y0\xe8\xbe\xfd\
-\xeb^Z~\xe0W~_\x05\xa9\xa2=\xed|\xaaC\
-\x97\x02\xda=d\x0a\xa1\xc0@\xfe\x988j\xc0\x1c\x07\
-\xf5\x1a\xe3?t\xc4\x91\xa6Y\xd0yl\xd2:\xaf\x04\
-\xa6Z\xdf\xcb\xcc\x05\x80\xc3T\xa2{\x1b\xdc\x17A\xe0\
-\xc2\x11\x8c\xa4\xe1P\x07\xaf\x8ep\x0egW\xf0J\xc7\
-=\xc9\x01F\xa3\xe3\xdc\x0f\x9e\xf3j\x5cdi\x95k\
-x\xd6\xf6a\xf9\xf6\x17_X\xbe\xea\x8a\xb3\xcb\xae-\
-\xba\xb0\x92!\xdc\x9d\xc3\xa0\x15\xdd\xa1#H\x87\x8e.\
-\x97\xf7|\xf2\xde\xf2[\x1f\xfely\xc9%\xe7\x94\xf3\
-U$\x98\x02-\x7f\xbd-\x12X[&\x93i\x8bo\
-\xe1I\x9b49O\x1aN\x07\x9c\xfb]\xb8\xba\xde\x1b\
-\xeb\xb4\xb4\xa8\xad`\xe9\xe8\xb8\xbc\xe8\xf9\x17\x95\xeb/\
-\xbb\xa0\xfc\xc5\xde\xfbU\xc7Ke\xee\xccKl\xb3\xde\
-K\xb8\x08\xe23\x07]\x158\xb68-_rw\x90\
-\xdd\x86\xa7B\xe1z?\x22^\xc9G?k\x9b\xb9\x00\
-dN\x04\x1431\xd8\x061\xa9\xc6(\x08\xb2Y\xf0\
-\x801H\x9e\xaer+\xad\x04\x886\x8c\xe6\x8a>/\
-\xf0\xe0X@\x80.\xde\x86\xec\x06ZQ\xdfr\xc3y\
-\xe5\xbb\xfe\xfe%e\xebB\x9cw)\x10\xe4\xf1\x96\x8f\
-G\xb2\xe6T5\xbc\x0d\xdb\xa1\xc2x\xf5\x8b..\xff\
-\xe8\xda\x8b\xf4\xd6\x8c\xad\x139~\xc1\x22\x17\x82\x07u\
-\x9c\xc1K\xd8zz\x92\x9e\xc1\x9e\x1e\xc3\x8f\xe9|\xba\
-\xc8\x87&\x9c\x0a\x8e\xa98\xff\xe9W\xbf\xa4\xfc\xe5\xde\
-\xdf\xd5\xf5\xc0\xfe\xb2\xf2\xf0\xdde\xa8\x22`o\xa3\x02\
-\x5cD\xf2'd\x05\x14\x8c\x8dw\xac\x22F\xe4\x97\xd8\
-:n\xee\x88\x7f\xe8K\x98\xa63\xb5\x99\x0b\xa0s\x1c\
-5\xb6(\xf4\xe50\x92\xcdk\x18\xd7W\xb2\x0c\x85\xa8\
-\xb6pD\x13y\x90\xdb\x9f\xee\x9e\x9a\x86\xf3\xa8.\x9b\
-u.\xe7\x8a~\xb9\xbc\xf5\x95_V^u\xcdy\xa6\
-\xf3\xf5\x84\xb0\xec\x1eH\xcb\x00\xf8m\x99&\xc0,G\
-[\xfd\x90\xdb\xb1\x9a\xd32\xd1\x990\x07]p\xce\xdd\
-\x1bi)\x07\xde\x94\xc5\x18y\xd6\x05\x5cI\xe5z\xe0\
-\x98\x8cx\xde\x85g\x97\xb3\xf5\xd6\xf0\xe1'\x0f\x95\xf1\
-\x91\xa7\xca\xe4\xe1\xbdex\xf6s\xf5\xf6\x91\x1fR\xa1\
-\xf4e9\x17\xc2\xd5\xa9\x8c'\xb7\xa2\xc3\x07\xaf\xfbf\
-g\x10\x1b\xb44\x08\x1c\xdb\xf4\xd6\xd0u\xbd\xcc\xec}\
-\xdc\x10As$\x18\xc5\xdd\x85\x0bn`\x08\xd5\x8cz\
-\x8d\xd3$\x12\xc7\x98\xb4\xe5\xc5]\x9c\xe6\xb5\xfd\x0b\xe6\
-\xb7y\xa2\x8f\x9e\x0b=\x9d\x22tQ\xf7oo\xb94\
-\x92/\xb1\x9c&\xe2\xb4\x81\xf0\xf0;F\x01G\x1f\x17\
-b\x1c\xd0\xa2o:\xf19\xb7\x9d\xc9\xbc\xc1\xbeM\xfc\
-\xb4\x08\xec\xf4E!v\xc8\x17\xfc\xbf\xf1\xf2\x8b\xb1H\
-\x00\xedV\xba@]yh\xaf\xde&\x1e\xd4\x0e\xa6\x0f\
-\xa4\x04\xa6E!\x107\x00\xab\xe3\xd7\xceA'\x0d\xf1\
-\x8f\x96}\x9d\xae\xa3\x9b\xb9\x00\x22\xc1$=\x9cB\x07\
-\xab9\xe1\x18I\xf3\x16M10'\x99\x1ef\x81\x04\
-\x1c\x1a\x02\xe5d\xc9\x12\x1c\xf2i\x00\xb8\xae\x96\xbf\xe1\
-\xaa3\xcb\xebt\x05\xcf\xaa \xd8l\xf5k%\x0e\x1c\
-G\xb7\x9aEG\xf2Elx\xf2\x80\xcf\xa4u\xb4\xd0\
-=\xcd\x96\xf2\x11\xd3\xda\xc2\xbb\x0d\xaeg\xe6qP\xbe\
-\xddx\xe5\xa5>MA\xe7\x9b@\xf2q\xf9\x91{t\
-\xe1\xb2\xbf\x8f_\x173|\x8d\xab\x7fz'\xdb\xfe\x0b\
-Vc\x9a1gA%-\xb2gi3\x17@V\x1d\
-.q\x90\xdcX\xf1$\xba\x09\xbc\x83\x0f\x9ed\xd3\xc2\
-H\xce\xe0lf\xec$l\xd0qe\xaf\x84k\xccE\
-\x1f\xbb\x02\xf7\xed\xb7\x0d\x97\xcb\x9b\xf4i\x9b\x9dW\x00\
-[\x073\x89H\xcd\x80\xb7\xe3\x84\xb5=x\x02\x96\xbc\
-9n\x93\x07\xcdz\x1b|\x5c\xf4\x9d\x88\x1f\xb8qN\
-\x1e\x0b@\x1f\x1c]t\x8e\x0b\xdc\xa7B\xef\xf5De\
-\x5c\x96\x1f\xbd\xb7\x8c\x0f<\xa6I\xbfs\x8aYq\xa0\
-\xa9\xd7\xd8\xa3\x84\xd5y\x16\x85VF\xd0V\xb8\x89\xd7\
-\xf92\xf35\x00\x06\x91s-\xb8\x08\xa8T\x0bR\x8d\
-\x95V\xd7\x81\xe6\x10\x10 \x81\xb2\xca\xbc\x10l\x98\x1c\
-\x15\x1aN\xde\x96\xd1s3\x07G\xb9\xd13\xd1\xfb\xe5\
-\xd7\xdcp\xbe\xde\xe2-X \xbbM\xdb\x08l&2\
-\xe19\xa7o\x93\x92\xf3\xc4'.\xe7\xd9\xa7\x9c\x13\xf5\
-\xc9\x07\xbe\x1d'=0\x0e\x8a\x22iH`\xfa\x09\x0e\
-?wlY(O-i\xcb\x07W\x8f1+x\xff\
-\x03eE\xf7.F{\xce\x91\x9c\xc0\x11<\xf3Ah\
-~\xb8\x12\x16~\x1a%X\xad'\xe3gy\xc9\xdc\xac\
-\x9f\xa7:\x12\x0e\xc1\x16\x8e\xd1sx\xa5\x86\xe5v\x90\
--=\xae\xf4\xeb5\x00\xef\xeb\xab3\x5c\xc1\xfb\x96\xaf\
-\xf6C\xc6\x5c1\xdbQ\xdd\xe8\xb9\xe5\xf23-\x8fS\
-D6\x92\x95G\xc2\xe8\x136\x9d\xcc\x9cg\xdf\xd2b\
-\xff\xa9\x1a4y$\xed\xc9\xf8\x12\x97;\x83\xe7\xc8\xa0\
-(\xb4j8W\xef\xd9\xb9\xcd\xfe\x135|%f\xb6\
-\x9f\xab\x9fC\xfb\xbc\x1b\x0c\x5cD\x15\xe7XBJl\
- 7\xa7\x17\x17\x05E\x8b\x1d\x02|\xcc\x0d\x5c\xe7\xcb\
-\xcc\x05\x10N\xca\x88j<\x09\xef\x1d\x0d\xe3HY^\
-\xf8`\x14x\xd6\xb9\xce\xe21\x16\x01\xc9\xf6]@9\
-\xc1\xce\xe0\xb1`\xec\x04\xa7o\x19\x95\xab\x9es\x86\x03\
-\x13\xfaj\x00$7\xe7\x0eZ-\x08|m\xe7\xed\xb9\
-\xbe\x853\xa6!#\xc7\x064/\xe0\xf2h\xc0k\x0e\
-\xa1#\xd9y\xe4<\xfb\x84K`Gs\xda\x0e\x1e\xdb\
-\x8b\xa4\xf1\x81\x14\x11\x8bg\x085\x22\x10\xc7\x0e\x96\xe5\
-\xc7?\xef\xcf\x0er\xe7\xf3i\x10&\xc7\x9ab\xaa\x89\
-\xa6k\xe3\xaf\xf1\xacmC\xa7\x00\x0a\x0f'1\xdc1\
-\xc5 \xd9\x1ec\x86XF\xc2#\xd0\x84\xbd{\xbf\xaf\
-\x09\xef\x91#\xe9|\xa8\x13\x17\x81\xdc\xf3\x8fw\xf8\xe3\
-r\xee\xcey\xef\x08\xd2\xd2\xf9\x93\x09\xcb\x1e\xfd$\x9a\
->[;na\xc9\x93\xb0\x9c\xafE\x9f4\xd9O\xd3\
-0OX;\x86>\x13N\x9f8\xc6\xdc%d\xee\xfb\
-\x12\xa2\xe3f$1!\xf9\xecp\x92\x08\xbb\xe2)\x18\
-H}p4\xdewo\x19\xec:OW\x90\x0b\x8ec\
-\x90\x10\xf3 D\x1e2\x90\xe4x\x0b\x1es\x03\xd7\xfd\
-2s\x01\xc4\xcaO\x07\xd8\xce\xc3\x01\x1b\x1f~\xb8\x10\
-\xb8\xb8\x91+ni\x18=W\xc5\x5c\x01s\x85\x1cE\
-\xc0\xf6_w\x03\xde\xce(`gn\xd7>\xa0\x9b?\
-\xbc\x8d\xa2\xe1\xec\xf4U{&?\x93\x09];f~\
-\xa2\x86\xbcS\xb5\x96\x86\xf1\xf4\xbc\xe5O\x5c\xdbg\xe2\
-]\x0c\x22^\xd1=\x0d\xdd\x0f*\x07\x0e\xeb\x89!=\
-\x170\xae\xbb\x11\x1e\xc6\x0f\xdeS\xfeuu\x13\x06\x15\
-M\xd9w_\x19\xed>\xa7\x0c\x16\xb6\x8aHE%\x0a\
-GD\x03\xf3\x09\x12s0\x22\x89*\xf1x\xbd/3\
-\x17@\x08& \x04\x1c\xad2\xa2\xebk5\x0a\xecB\
-\x11\x22\xeb\x9b\xa4\x8f\x94}*\x1er\xcf\x95xv\x00\
-\xde\x0d\xf0I\x1f\x1f\xf7rC\xe7\xe0\xe1\xa3Z%\x94\
-O8\xb6V\xb2\x09\xf6z\x13.An\x99\xa0\x9cO\
-\xf7\xe0[\x9a\x13\x8dIj\xb6\x1cC\xebd7\xbda\
-\xf2gyyE\x8f\x91\x81W\x01\x1c\x92o\xf2s\xa8\
-\xa7\x84\x08\x04\xc9\xe7\xf4\xe8/\x98*\x1e\xf1\x7f D\
-\x8c\xd01\xde\xffp\x19l?\xad\x0c\xb7\xe8\x99E\x18\
-\xdc\xc2\xce\x98c\x8b\x13\xd0a+\xd1\xba\xba\xd9\x0b\x80\
- \xe9\xcf\xa6D~\x5c\x04\x02\x0b\x968\x99&\x82n\
-kbL\xe2E\xc3\xb9\x9e\xb7D\xdc\xba\xf5. 3\
-y+\xc8G\xb7\xfa\x7f\x15\xe4\xf1Ryp\x9f\x82T\
-\xcd'\x88\x99\xe8v|*\xef\xa0=Y\x9b\xc63o\
-a\xed\x189->q\x09\x9b\x9e\xb3\xe5S\x0cqh\
-\xf5K6;\xc0\x11=-\xb2\xef\xe0A\x05\xa3\xde\xa1\
-\x94\x93\xb6\x92`\xc9cJ\xc1\xa7\x80j\xba6W\xc7\
-prp\x9fd\xe9\xce\xe8\xd6]\x9dK\x11\x9f$l\
-v\x87\x8eb}\x83\x99\x0b\xc0\x17$\x18L\xc0\xac\x83\
-b\xe0O\xb3zM@@\x0c\xb3\x95\xacl\x1e#\x05\
-\x06\x0d;\x015\xaf\xf3?\x02\xd8\xea\xa9|\xee\x86i\
-L\xbfU\xf7O\x91n*\xab\x12\xdeA\xaa\x85T\xc7\
-\xd3.f\x22\xa6\xe19\x9f\xc63_\x0b\x96\xf4\xb9\xba\
-\x99\xb7t9n\xf9sL\xf2iN\xbe\xe4\xb3\xa3\xa9\
-s\xbb\xfb\xbe\x87\x04\x97/\xba\xe1\x91.8&\xf25\
-N\x00D\x858\xa9%A\x1d\xf3`\x89\x9f'\xd8\xa6\
-\xdd \xc8L\x8bh\xa6\xe6\x81v\xc66s\x01D\x12\
-\xc3\xa3Ni\x9e\x9f\x94H\x9cu\xe2:\x98,\xd2j\
-\xe0\x0a\x97\xb4\xfay=_\x1f\x88\x9b\x0fz\x04\xa3\xa8\
-N[\x1c\x96\xd7^wiy\xc5\xdf;\xaf\x9c\xb3K\
-W\xca\x923\xa10\x14\x88\x0c8\xbe\xb5\xe3\xf5\xfa\x9a\
-<\xd3}\xf2'\x9c\xf9ZI_\x0b\x9f0\xfa\x1c\xc3\
-\xcb8/\xfa\x90\xe7\xdb\xb4\xf2\x0f\xdf?{\xefCN\
-\x94\xdf\xda\xca}.y\xb8 ^\xc1Gab\x19\x11\
-+\xed\x89\xda\xd9\xb3\xe8\x91\xe3x,\xe9\xfa\xe1\xc0\xa3\
-e\xa2S\x02\xa7\x0a`\xae\x93\xac0\x13\xce\xf62s\
-\x01\xd8\x16)\xcc\xe4\xcb\xfdj:F\x92\xb00\x80\x9e\
-!N\xb1\xed\x1b\xa7\x22p\x01\xc9\xf3\xb8\xe3'\xb8V\
-\xfd7\xddpa\xf9\xf6\x97=\xb7l\xf1'}pI\
-\x8e\xcb<eE\x11\xac\x0aH\xa0\x8e{\xcdd$\xa2\
-M\x10\xb0\x16\x9f\xe3\xec\xd7\xc2'.\xfb\x96\x06X&\
-\x9dq{\x18\xae,\x92x\xde\xe1,\xea\xc1\xd4\x97\xbf\
-\xf0\xd2r\xfb\xdd\x0f\x94{\x1e\xd5cb\xa2\xc7E\xa5\
-\x1b\x91\x8e\x13\x05\x11\x89\x8d\x98\x1a\x91/\x0a\xa8)\xf5\
-\xb0K9\xa8'\x8c\xb6\xee\xd1J\xd3\xf2aG1\x82\
-\x17\x09\x98\xb1\xe5\x85\xfa\xfa\xd9T\xcdV%\x07\x9c(\
-^\x05\x0b\xe5\xd5\x00\x82A\x09\xd7\xabZ\xc6T:W\
-\xb2<\xb2\xe5U\xaf\xfb\xe0[\x15\x94\xb7\xbd\xe1\x9a\xf2\
-F\xdd\xf2\xdd\xaa\xaf`\xd5r\x16!2\xfb\x802'\
-\xf9Y\x00\xe0\xa6[K\xcf\x98\x04dr\xa0M|\x8e\
-\x13\x97}\xf2d\xdf\xc2[\x18pVx\x9e\xe7S.\
-\xf0\xe9\xc38\x0a@\xbeo\xd3\xb6\x7f\xe9Y;\xca\x7f\
-\xf8\xd6\xaf.\xaf\xbc\xfe\xf92#\x12\x1a>\x85\xaf\x14\
-\x04k\xc5\x01vR\x19GbMg\xbf5\xd7\xa2\x99\
-\x1czB\x1b\xa8\x1e{3ZL\x8a+\xfafm\x1b\
-\xda\x01\xa4\xc9\x8aQ\x88~\x0e\x0c\xc0H\x92M\xef\x05\
-\x0c\x9e\xbb|F\xd7\x9e\xcb\x7f\xdd\xec\xe1\x89\x99\x1f\x7f\
-\xfd5\xe5\xba\x8bNw(\xd2x\xcbD\x8euX2\
-\xd2\x8fs.\xe9\x137=7S}\x01\xb7\x16>a\
-\xd9\xa7\xac\xe4%\xa1\xd9r\xdc\xd2&\x8c\x1ex\x1e-\
-\x5c@\xf9\xa7\xd5\xae\xd3\x1d\x1f\xfcN\x14\xf1o\xbd\xf9\
-jo\xf3\xef\xfa\xe8^_\xfc\xf2\xb5\xb2\x1a\xc42\xd6\
-\xd6\x08}d6\xb4\xd7\xb5o\x18c\x22\xe8k&\x15\
-A\xd1\xbb\x03\xfd0\x04\x01jY\xd2\xecS\xf63\x17\
-@$Xr\xb1\x82\x83\x96U(@\x14\x83\xed\xf1U\
->\xd5\xea\xfd\xdedq\xa1\x07\xec{\xbe\xea\x8ar\xe3\
-\xa5g\xc9\xee\xber\xdb\xe0\xc6\xca\xc0\xe7\xbe\x18\x12O\
-\x9fp\xeb\xd7K\xe2\x98\xaf5\x9e\x861oa\xc9\x97\
-\xb0\xe9\xbe\xc5'oK\xc3\xb8-\x84,\x02\xf8\xa4\xc8\
-icQ\xf0@+\xff\x09\xde7\x7f\xc5\x0b\xcb=\x0f\
-?Y\xfe\xfa\x0b\x8f\xf9Z\xc7+\x98\x85#r\xef\xb1\
-ml-\xa3\xc6B\xfcu\xef\x88\xf0\x1f9P\x06\x8b\
-*T\x17\x01\x84\xb3\xb5\x99O\x01\x99`\xb4G-\xca\
-\xa1f\xa58(N\x90\x08\xec\xb8\x0cR\xefm\x8b]\
-B\xb47^rZy\xfd\x8d\x97j\x1b]v\xd00\
-\x19>\x92\x9a\x89\xcf\xe0\x12H`\xf4\xd3\x01\x86&\x8f\
-\x94\x914-}\xc2\xa6\xb7nxh\xd3\xb4I\xdf\xda\
-\x00lz\xdb\x07\x9f\xb0\x94\xd1\xf2\xb6\xb6\xd9\x07\x1e`\
-%\x06\xda\xba\xf5_\xbf\x94\xef\xfc\xda\x1b\xca\x22\x1f\x81\
-\xb2\xa5\x0bNL\xe9#\xc1\xc4#\x92.\x80\xc7\xf4D\
-\x9d&\xd2n:9vX\xb7\x90ul\xa0\xcd\xbe\x03\
-` \x96\x11|\x8c\xa8\xc6u\x86\x0bn\xcb\xf0\x87\x13\
-\x9a\x08\xc0\xf1^\x9f~Y\xef\xf3\xbf\xe3+.\xd3\x18\
-\xeeh\x04\x0d\x99-\x0cL\xce3\xa8-,\xc7I\x93\
-}\xc2\xe9i\xf0fK\x9a\xec\xa7\xf1\xcc\xc1%~-\
-\xde\xe4\x99\xa6IZ\x0a\xa2\xa5\x81\x0e\x5c\xc2\xf9\x1d\x02\
-\xbfK\xd2}\x81m\xf3s\xe5%W\x5cX\xde\x7f\xfb\
-\xe7\x14KAY\xdd\xf5\xce\xaa\xb7\x02B$~\xc7\xbb\
-\xc6\xc7c\x058\x16\x1f\xc5\x10\x8bf\xa2\x07L\xf8\x18\
-}\xd66s\x01\x90z\x19\xe5\x0e\xf5\xae\x02u1\xa6\
-z+L\x03W\xb2+Z\xab\x97Z\xd0\x8d\x9e\x17\xe8\
-\x9b9W_x\xa6D\xf4\x899Y\xf2\xc3a\x84\x12\
-\x8b(\x9a\xb6\xcfqP\x04M\xc2\xb2\x9f\xc6\x01\x9f\xc6\
-\xa5\xfc\x16\x974\xd3\xb0\xe9y&7\x8b\x00Y\x8c\x93\
-\x9f9~\xa4\x9f>\x8d\xb2@to\xf8+\xae\xba\xb8\
-\xbc\xff\xb6\xcf*V^1\xf1\x7f\xa4\x12;BL4\
-\xe9x!~\x92\xd15\xde\x06\xd6\xe0[\x0f\xb8Z|\
-\x1d\xcd:\x063\x17\x80C\xec\xffI5V,&\xb1\
-\x17\xd8\xb4\xfa\x12\x06\x85}\xba^V1\x0b\xaf\x0a\xd0\
-\x86Yn\xbaL\x1f\xf3r\x1e\xa4\x22j\xcb\xc0\xadr\
-\xb0\xe22\x88\xf4y$_\xe2\x98\xe78i2\xd8\x89\
-k\xf1'\x82\xb5p\xf8\xd3\xae\x94\x09~\x1a\xd6\xe2\xda\
-q\x16@\xc2\xe8)\x14\xcf\xd9\x95\x88\x87\x0a\xe0\xb4\x1d\
-[\xcas\xcf\xd9]\xf6>|\xc00n\x13;\xf7\xfa\
-f\xb1s\xec\xc8\x8a\x96\x02\xc2\x00^= ~uL\
-qh\xd6G\x14\xba\xf5\xb5\xd9\x0b\xc0+Z\xea\xdc\x87\
-\x12\xdb\xc3P\x16h\xc3\xf3\x16\xe7\xc5\xcag\xffQ\xd8\
-r\x5c\xdb\x93\xce\x81\xd7\xeb[\xb4i)A\xca\xa4g\
-\xa0\xd2\xec\xe9\x04&\x1c:Z\xf6\xed\xb8M\x8e\x89\xa6\
-\xe8\x12\x9f<\xad\x0c`\x89omI\x9a\x84e\x9f2\
-Z\x9ev\x9ct\x99\xf4\x16G\x00\xd8\x01\xf5\xff\x07\xfb\
-\x13\xc23vl/{\x1f\xd4\xbd\x01\xbdW\x86\x8fo\
-\x12\xc7)@\x8b\x8c\x1c;\xf9\x0c\x1c\xe0\x88\x1f+^\
-\x8d\xb2\x88\xfd8\xe8\x0c\x9c\xe1e\xe6\x02\xd0\xf6\xa5\xdb\
-\xd5202,U\xb12\x9d0\x8d\xc3.\x19'<\
-\xc50\xd0\xb7fW\xf4x\xf7\x9c\x9c\x9d\xe88Kw\
-\xf9\x08F\xbe\x9b\xf0\xb8&\x15\xbb\xb3 \x18g\x10\x19\
-g\x00\x19gka\xed\x18\xbel9^\x0b\xbf\x16,\
-\xe9[\xdd\xed\x18\xb9\xf0%\xac\xed\xc1\xb5\xf3v\x0cO\
-w\xd4\xc4s[\x98]\xfb\xf4\x9d[#\x1e\xba/\xc2\
-[B\xffW\xd9\xc4Oo\x99\xeb\x9bB\xd2,\xe1\xae\
-\x06\xd4\xa8\xe1c\xdd\x85\x15ttm\xa4\xcd\x5c\x00\xaa\
-8\xbc\x1f\xa1\xd0Fa\x13\x9a\x993\xb0\x1dZ\xf6\xc0\
-m\xb0\xe0\xda\xea\xc4$\xdcr\xd9\xb3}Q\xbb\x1f\xbc\
-\x9c\xb2\xea\x96X\x8do?\xf2\xcd #\x9a\x96\x0ef\
-\x0f\x0c\x1aZ\x0bc<=O\x9a\x84'M\xce\x13O\
-\x7f*\x99\xad])'\xf9[\xde\xc4\xd1'<y\xf9\
-\xc6\x90\x93\xcf\xee(\xfcn\x1e}S@\x22*u\xcb\
-T!\xf8\x96\x89\x82J\xac\xdc<\x88D\xc7B\xe90\
-\xf1\x96\xbb\xa7L\x8eS\xf6\xb3\x16\x80\xb4s\xf2\x0a\xa3\
-X\xe3\xbej\x95\x13\x98Bb}\x03H'/\x1c\xe4\
-\xb3\xff\xb8\xd8\x93S\xdc\x0fP\xe5\xef;pD?\xbc\
-\xb4\xddp\x9c\xa7\x08\xbc{h\xcc\xbc\xdd\x01\xd2\xfa\x0c\
- \xf3v<\x8doq\xc8\xa2\xd1\xb7\xe3\xe4I\x18\xf3\
-\xb5\xf8\x12\x06]\x8e\xa1M>\xfa<RF\xe2\x92\x0e\
-\xbe\xa4\xc91=q:\xc6G\xc4\xda\xea\x97\x15\x93#\
-\xfa*\x1b;\x22\xbfc\xe0H\x0a\xef'}I~}\
-'\xe5\xd5\x8f`\x02\xad\xf8\x8b$h\xd4\xf3\xa9j \
- \x98\xad\xcdZ\x00R\xaed*\xc18\x16e\xa0m\
-\xab\xea\xcc\xdeI\x97a\xde\x00\x84\xa3P\xb8\x06\xe0\x19\
-\x81\xfb\xf7\x1d(\xe7\xef\xde*\x1e9\xeb\xf7\xbfQ\x04\
-\x88 \xf9Y\x0c\xd9W\xd1\xd6\xc78\x03\x9a\xe3S\xe1\
-3)m\xdf\x8eSN\xc2\xd6J64\x09\x9f\xa6\xcb\
-y\xca\xc9>\x13\x9e\xbcN<\xc9\xd7\xc2 \xe9\xcb\x0a\
-\xe3\x92\x8a\x80+\xa6'\x0f\x1dv\xac(\xd9\x88\xa9\x22\
-\xc9?\x034P\xcf\xee\xda\xe15A/E\x10\xbbf\
-\x14\xa3\x99P8C\xdb@\x01`\x87\xebTj0\x89\
-\x8e\x14\x87zF\xb2UG\x5c'p\xdeOg0\xfa\
-\x8e/<R\xae\xbd\xf8,\xdf\x101\x9f\x82\xc2.\x90\
--w\x80\xec3\xc0\xe1p\xd5'\xe2\x9c'\x1e\xfe\x1c\
-g\x0fl:qI\x974\xf4y\x80\xa3M\xcf\xdbd\
-&>\xfb\x94\x93\xf3\xd4\xd7\xce\x93\x9f\x9e\xc7\xc2\x96t\
-J<\xb6\xacB\xf0\x0fH\x95\xf2\xc0\xa3OJ)Q\
-Ss 3\xdb\xea}\xe1\x17+\x9e8\x92t\x16\x0f\
-\x1f\x1aQ\x14n5\xf8Q<\x15\xb6\xcen\xe6\x02\x90\
-\xc3\xbc#\x09Cem\xd5\x8dm\xd1\x00\x00\xf5\xa5\x82\
-:;\xc0\xb6\xc7\x15\xc3\xa0|\xe0\x13\xf7\x94\xd7\xbe\xf4\
-\x0a\x7f\x07\xc0O\xbfr5\xac\xa0\xd0\xe8I|\xae\xfe\
-\xe9\x22H\x1a\xfa\xe9\xc03O\xd8Z}\x8bo\xf9[\
-\xdai\x9a\xb5\xe8\xd2\xd6\x16\xc7\x98\x06\x7f\x8bg\x9c0\
-\xc6\xac\xfcc:\x8e\xaa\x00\xf4\x9dQ\x15@Q\xbfR\
-\xee\xbc\xffQ\xf9\xec\xdf0#`:\x84\xc8\x9f\x93Q\
-\xdc\x1c\x0f\xc9'\xc1\xb6\x97\x8bp\xc7>v\xe2x\xca\
-\xaa\xcb\x00\xa6\xac\xbb\xcdR\x00N\xad\xaaO\x91\xc6\x80\
-h\xa4\x95\x7f\xd9(\x89H\xa0<\x04n\x9c^l\xdf\
-\xa0|\xecs\x8f\x95\xfb\xf6\x1d,\xe7\xee\xda\x12\xbb\x80\
-\xde\x1a\xfa\xb4Bi\xabe\x00\xd9\xda\x18g\x11\x80\xb3\
-\xf3\xb5o\xc7\xe0h\xc9\x0b.\xf1\xc0s\xdc\xc2\x13\x96\
-\xf8\x9cO\xf7\xd3\xf8\x9c\xd3\xd3Rf\xf2\x05\xb4\x87c\
-\x138\x1e\x0b[R\xe8\x8e(\xeb\x87u\x1c[\xd1\xbb\
-#\xb9\xfc\x89\xbb\xef\xf7\xe9\xc0?e\xe7wW\x04J\
-\x87\xc6\xbc\x1b\x88k,@\x82\xd5\x18FL\x98D\xac\
-\x0d'|\xc6\xab\x9f\xa1\xcdR\x00)V\xfe\xc46\x0f\
-\xc0\x097\xa6\x1a$C\xa2\x08\x00\xc6\xcaf\xc4M\x0f\
-\x0c\x5cR\xf7K\xef\xfcP\xf9wo\xb8Y\xf7\xc39\
-Q\xe8\x80L\x81\xe2\xe9\x19E\xcbI_Z\x8a\xff\x17\
-9\x8a\x09\xef\xa2e\x92\x99\xb5Ao\xe1\xed\xb8\xb2\xb9\
-k\xe1'\xe2\x05\x9e\xb8v\xdc\xcaa\xbc\x16n->\
-.\xf8x\x1c\xcc+_\x89?\xa4\x00P\x00K\xf2\x9d\
-\xad\xf4}\x1f\xdb\xab\xb8hAq!\xc7i\x80\xb5\xe5\
-]\x10;4\xf7\xbf\xba\xf2E\xc7\xb3\x15D\x03]~\
-\xb0\x04\x02\x00\xea6\xd2f/\x00\xdd\xc2\xf3\x83\x8b5\
-Q\xd6\xab1V\xf0\xc76%\xeb\xf8g\x9b\xf8\xd6\x0b\
-\xa5\xce7v'KrD\x0fC\xbe\xfb\xaf\xee)_\
-{\xc3C\xe5\x8a\x0b\xf4\xec\xbf\x02\xc1\x0f6r:P\
-\xcd\xeb\xcdB\xfd`\x04o,\x97.\x9cN\x07\xd7\x0a\
-t\xc2\x82\x0d\xfd\xd8Ty\x9b\xb1\x81\xf5\xc5r+.\
-\xe1m\x91$\x8c\xbe\x957]\x94I\xd7\xd20\xf6\x05\
-\x9fV\xfd\x92\xae\xf8\xd8\xf6\x0f\xebRG\xbfc\xa1E\
-\xa0`\xe8\xf7\x04\xfe\xe8\xb6\xbb\xca>=$ZF\xfa\
-%1\xce\xe9DLo\x9d\x22\x861\xf7w\x07\x88e\
-\xdd\xf6%\xae\xbe\xd3\xca\x8c\x83$\xe6\xb2\x82~\xc66\
-s\x01\xc8\xb1z6\x97&Vl\xb6\xb4C0;\x00\
-\x5c\xc9\xe7N\xa0\x9b\x12\x8d\x7f\xfe\xec{n\xa1\xfc\xd0\
-\xaf\xbf\xbb\xfc\xdc\x1b_]vo\xd5s\xef\x928T\
-p\x86\xfe\xa0D\xfc\x92\xd1\x05\x93-\xd4\x7ff\x8fb\
-h\x92\x06]\x1eUS\xc7\xcb|\x1a\x07l:\xc9\xa9\
-\x0b\xdct\x037M\xdf\xd2\x80\xcf\xd3\x94imO\xe4\
-\x83\xeb\xdf\xa3~\x22xX\x8e\xc8?\xb6\xff%_\xf8\
-\x0d\xca\x9d\xf7>R\xfe\xef\xc7\xee\xd2\xf3\xa1J\x81\x9f\
-\x91T\xc2}\x0a`\xebg\xa5\xb3C\x84\xfd~J\xc8\
-\x19&\xf9\x91\xe4\x88q\x04\x1dH\x5c\x98\x05\xae\xb5\xef\
-T\xe3\x0d\x17\x00\x82IL\x9ac\x97\xb1\xc7\x1a5 \
-\x10\xd0\xe8\xc5+\x9bb\xe0O[\xdcX\xbb\xc0\x13G\
-\x8e\x95\xb7\xe8gS~\xe8\xdb\xbeN7\x87\xb6\xea.\
-\xb18u^\xe4\xe6G<@\xa2\xc4+\xf9\x96k\x99\
-\xc8\x8ad3m\xc79\xafd\xee\xa6\xf1\x00\x9dH\x0c\
-\xaa\x0d\x9a\xe9\xd6\xc2\x8e\xc7NS#\x13\xaa\x9e\x12\x91\
-X\x0dxY\xab\xfe\x18\xef\xf5\x95\xc9\xa3*\x80\x15%\
-\x7f87W>s\xef\xc3\xe5\x7f~\xe0cJ4\xf7\
-\xfb\x95\x02\x9f\x02\xe24\xe0d+\x14\xfe$\x95\x13$\
-\x85 \xa1\x91w\xa2\x9bG\xda\x22|\x1d\x82\x99\xb5\xcd\
-\x5c\x00\xa1.T\x86\xc2HJ-\xcc0\xb6\x96\x81&\
-\x1a\x09/B\xee\x06\xe2\xc5D;\x81\x9d\x9c_,\xf7\
-\xea\xc7\x12\xbe\xf7\x17~\xa7\xfc\xeb\xd7\xbd\xbc\x5cy\xc9\
-\xf9~8r\xac\x22\x18\xf3\x93j\x0a\x1c\x1f\x18E\x8e\
-85\xd4b\xa8\xdef\xa2\xb2O\xc7s>\xdd\x07^\
-\xfa\xc5\x9f\xb8\x08frf_\xbd\x0a\xc5\x09<IO\
-\xb9F\xc34\x0e'\x9f\x9dK\x09\xe7\xc2\x8fw@X\
-\xaf\xff\xd1\xa3\xfc\xf1m\x9f)\xef\xfa\x8bO\x97\x89V\
-\xfep\xc4o\x07\x8a\x9f\xdf\x11\xa4\xf7\xc3r\x5c\x17\xc9\
-wb\xc7\xf5\x00\x12m\x12A\x0c\xdb\x80\x06\x9c%\xa5\
-\x18\x99@#N\xb73\xb6\x99\x0b@\xde\xe8\x84\x1e\x8a\
-B5F\xa8e\xc0@a\x88\xe6\x1e2\x96\xf7\x8ci\
-\xde\xaa\xe4\x88\xbf\x0e2\xb7\xb5\x1c\x5c9\x5c~\xe4\xd7\
-\xdf[\xae\xb9\xf8\xf4\xf2\xda[^\x5c.8\xfbLm\
-\x93\x04\x8d\xfb\x03b\xad\xa7\x00\xaa\xc82\x90[\x85\x11\
-\xa4>\x99!\xdf:\x92\xa0\x82\x92&\xfb\x9e\x123\xd3\
-\xb2\x16\xba\xb1q\xcaB\x22E\xcf\xc9k\xe0\x9f;\x99\
-\x94O\xebj\xff\xdd\x1f\xfa\x84~v\xfe\x88r\xae\x84\
-+\xf9$\xdd\x89\xe7\x81I\xae\x01\xb8\x10Tl|\xb6\
-\x8c\xec\xdbWN\x0d\xc4\xb8\xb3\xd4\x89\x16\x0f\xfe;\x96\
-\x91|E\xb5#Y\xaf\x073\x17@M\x83\xcd\x89\xc4\
-S\xdbjT\xa7\x0c\x0a\x18\x00\xc6\xc0<\x04P\x83-\
-\xa8V\x02\xe5A\xad\xeby\xd92\xd2\x97A?\xfe\x85\
-\xfd\xe5c\xff\xed\xb7\xcb\xe9;\xb6\x96\xeb\xae\xb8\xa4\x9c\
-}\xfa\xee\xb2K\xa7\x86\xc5y\xad\x12\x89\xc9\xad\xb6\xdf\
-\x15,\xb2\x93\x9b[e\x0f\x8dQ&e\x1a\xde\xce\xd7\
-C\xd3\xd2\x9fp,;\xb1\x83\xdd\xea)}\xbb\xe9\xe0\
-\xa1#\xe5\xf3\x8f<V\xeeP\xf2\xf9R\xc8`n\xa4\
-\xff\xdfQ\xf7\xfd9\xd7k\xeb\xf79\x9f\x22p\xb2Y\
-\xee\x91\xe8\xfe\x9aB \xe2\xeaF\xafX\xd7\xc2 \x0f\
-q\xdeW\x5c\x9dw\x94W\xd2\x19\xba\x99\x0b@J\xa4\
-9\x92\x1eI\x14\xc0\x89\xef\x8b/\xe6a0\xd0(\x1a\
-\x0ctI\xd4s\xbb\xa08/qH\x1b.\xea\xbe\x80\
-\x02\xb4\xef\xf0\xc1\xf2\x1e\xad\x94\xd4\x11<\xbd\xec\xceI\
-\x83\xa6\x9d\xde@\x04\xccrb>,f5\xcbL\xe7\
-\x22\xfc\xf1\xd4a\xae(\x8fy\xf1\x1c?\xd9Y\xbc\xad\
-\x0b\xa6~\xa8\xa7\x7f\x98\xfbj_\x0b\x80m\x9fB\x18\
-\xf8q\xe9\xba\xfa\x1d\x8d\x1a#b\x9a\xfc!U\xfa)\
-\x12\xe9\xb6\x11\xd2\xe4\x7f]t\x81\x83\x99\xa9\xcd\x5c\x00\
-Z\x81+\xb6C\xaap\x96]\xc7=c[V\xe1\xd5\
-\x96\xf8\x8e 8n\xea\x04I\x04\xb5\x9e\xeb\xb4\x12\xa8\
-{\x7f%J\x82G\xdbe\x92~Ww|\xe8)\x98\
-$\xac\x93\xae\xb9\xc6\xdd.\x07\xdc\x91H\x85\x81\xaf\xb0\
-\xc4\x0aX\xed\x9c\x92\x03b\x95\xfc\xe4P\xef\x7f=}\
-7\xaa\x05\x0cg\x07\xd3\xa8\x1b\xdb\xd6\xb0\x89a,L\
-\xe1\xfd\xd4/\x00y\x0aB\x89ur\x99s\xdew^\
-\xd9\x15zY\x99\xec\xf4\x11\xa9\x90y_\xed\x14VC\
-\x84\xf4\xa9\xc0?6\xe4\x00\x08\xb1\xbe6k\x01hq\
-/\xaf\x0c&\xdc\xb6\xc4$5.\xd4\xd4\xe1\xac{`\
-\x18\xe8y-\x0e\x9680\xae\x8e\x84\xb0\xb1~;\xe4\
-\xb5\xaf\xb9\xe0\xf2NO\xd0+@\xc32\xb7ugY\
-\xd1V\xb9|P\x8f=\xd7\xdd\xa6\xf3\x99`\xd2(6\
-\xd1f\xb3\xcaL\x10A\x16>\xb7\xd2P\x1e\x94\xc0\xaa\
-\xc5\xc9\x1a\xe6\xc2\xcb\x81\x89\xb4N\xe1q\x13\xe1V!\
-\xeb<\x92\x87\xec\x94\xe3;y\xa6\xad+\x1c{Y\xd5\
-fg\xeb\x8f\xd5\xcbE\x1f\xe7}/\x04\x16\x0a\xa7\x08\
-\xdb\xe1t\xcb\x15\xf5\x82Y\xb6\xcc\xb1\xfd\x96+~m\
-O\x88\x83F\x03]5\xcd\xd6f-\x00\x05\x88op\
-\xca\x04\x8c\xaa\xbaV\xf72\xa4\x061V\xbf\xcd\xeba\
-\x15\xc9\x05\x92\xd3gG\x08\x0a\x8e\x10\x10\xbd\xeaF\xc9\
-H\x81\x1a\xe9B\xe9\xd8Szl\x9a\x22\x13qWd\
-\xf0 \xd6\x8a#\x00\x98\x12S\xbd\xa2\x9f\x0b*\x9a\xe5\
-\xc7\x10\x8a\x0c^\xcf%r\xd1\xd8\x16\xc8*\x1f\xdc\x11\
-\xfe\x10\x17\xb2{\x98\xe5\xa2\xca\xe7\x07\x113\x8eN\xaf\
-\xa8E\x83\xfe\xd4\x1b\xee\xe4\xa3\x05IJ\xb5\xeb\x80\x94\
-\x87\xcf\xa1\x96]2h0\xbb\xb3\x15\x165\xd3z\x0c\
-\x9f\x01V\x0a]\xc8!7\xb3\xb5\x99\x0b@\x97\xe6\x87\
-\xbc\x85\xa1'=\xa6\xfa\xa6Z\x1a\x15+\x18o\x80d\
-H\xe3\xb11X\x228F+\x11r\x8c\x80\x12\x03*\
-[_\x15[\xd8s^9\xc6\xf7\xe1tk\xd8Zj\
-@\x9d\x00\x91\xe1\xb8\xaf\xb6k\xc0\xd1@\xa5D\xb0x\
-5QU\xc48\x02\x9c\xa6#\x07\x1a\xefJ\xd0\xd6f\
-9\x1a\xa7\xc5\x10uch`\xc2^+\xa8s\xe0j\
-\x99\xfc\xa8\x0d\xc9\x87\x08\x7f\xf4\xe7]\xc1\xccZ\xd1u\
-\xbb\xe9d\xe0\xb8H\x11i_\x11\xd0\xccc\x1a\x05e\
-\xfb\x05\xe8b\xca\xe9ce|\xc8\x06T\xf6:>i\
-7k\x01H\xefX\xdfo\x96\x86\xdc\x01li\xab#\
-\x00^\xfd\x15\xcce\x1eNq\x84m2\xdc\xd7\x04\x0e\
-\x89@x\xc9\xff\xc2%^\x17\x0at\xc0\xb42\x05[\
-\xd4\x8f$,\xebW\xb4\x96\x8f\xe9\x07\xa0A\xa9\xe5\xaa\
-\x855\xd6C`\xba\xfb\xe3\xa2\x8c\xc0\x8b\x98\x08\x83\xae\
-\x1d\x03[)x\xd0\xd4\xd4\x9a&\x08y\xa5A\xe7\x04\
-Ak\x88^\x19t\x88$\x08\x98\xe5A\xc2\x81;\xde\
-\xce\xc5K\xdd\x89\x91oJcs\xbc\xa0\x1f8i\xc4\
-\x0bO<\xf3*\x88i\xa82\x95^\x04\xf3\x07D\xa6\
-\x92\xdda\x9cD(\xcac-N\x84\xcd\xd0f)\x00\
-\x0b\xd6C\x1c\x07\xb9U\x1b\xb6\xf1\x8a\x978`\xdb\xba\
->l\x08\x5c\x18\xc9\x18\x22\x92\x8f\xe1\x8e\x88\xc9:n\
-\x89\x8b\x1b\xcdr\x9fs\x1erqX\x17\x8as;\xcf\
-*\x83CO\x96%\xfd\xb0\x22Z#q\xd1;\xd0\x92\
-[\xad\xa9AA\xb4 \xde[\xc3:xbT\xf9\xad\
-]\xe3z\xb5\xdd\x0b\x08\xdb\xaa\xb9\x96c;:fV\
->\xb6E\xe9!\x06\x94\x8b\x0f#,\x88.S*\xbc\
-\xe0\xcc\xa2\x87\x18:sA\x08im\xa1\xa4\x8b\x99e\
-\xd58\xc0/4\xa4\xe9\xbfg\x00$X6yq\xa6\
-\xa4\xf5\xf4\xeb-\x00\xac\xa2M&K\xc7\x1e)\xfe\xc9\
-\x12@2\xcc\xc9\xec\x1d\xb5\x1f\xb6\xb2\xf3\xc8\x8c\x18*\
-j$\xd8x\xf8\xb2Q\x0c1W@\x09\x8cp\xfc\xc5\
-\x07!\x92C \x95\xc8\xd1\x8e\xd3u\xb3l\xbe\xac\x1c\
-\xd6O\xadrq\xc8\xea\x82\x9c\xed\x8f\xbe\x09x\x17\x18\
-a\x22\xf1a\xcf\x89\xe8L\x83I)\x0b\x89\xc1\xa2^\
-va\xaf\x9fqC\xa3t9\x83QPA\xda$7\
-\x94\x04\xbf\xd8\x06\xe6\xabv\xe0[\xcd6V\xa32\xa6\
-b\xf2\xa4/*+\x02\xef\xc5\x10\xb3\xe0Ql\x5cI\
-\x11\xd3\x18\x8b}y\xe5\x11Q!\x85c]-\x22\xb8\
-.\xd2*x\xf9\xf0}$([T\xa2\x9c\xaa0\xf7\
-\xf2\x88\xbe\x1dc\x93i\xcd\xd8\x8f\x1d\xab\x94Wy\x22\
-\xee\xc8\x08-\x96\xa5!\xf0\x91\xde!\xcc\xed8-\x92\
-/@\xd0\x06\x1dc\xb3\x10\xd1\xc4\xa9O9P\xb9H\
-\x1cqB\xc9\x96\x0c\x97\xae#\xc4\xd8\xdbW\xf9+\x8e\
-bD^}1]\xdc\xb5\x83\x07x\xf41\x0ey\x81\
-Px\x05\xf4\x85bC\x88\x1e\xfe\xc0\x85\xce^\x88w\
-\x16K\xc4\x93\xa0\xe1\x228ZM8\xb2\xea\xce\xd6\xd9\
-\xac\x82\x98\xac\x1c\xbdOtI\x9c}\xe5]\xbb\x9b\xb5\
-\x00\xc6+G\x0e\x7f\xc1\x89\xadQ\x8d$\xe3\x8b\x8c\xea\
-\x22\x1d\x09\xaenY3(\xd3ba\x1d\x83O+\xe1\
-\xcf1=\xe2V7\xa7\xc1\xa0\xe1\xfc\x962\xbf\xf3L\
-\xd1\xe4\xbb\x07\x81+C\xd8\x01\x19\xf2\x10\x92A\x0e\x1a\
-\x8b\x95\x01\xee\xc5\xe3w\xa8\x9ax\x172u\xbc\x18\xaf\
-!-\x82L\xcad\x99\xf5\x84\xadA\x03\xbc\xda\xce\xaa\
-\xa4eo\xfa\xca\x8f\xd3\xe2\xadfV_[-U4\
-\xd2\xa0\xd3_\xfd\xe7yL\xb0\x1b\x1e\x1dU\x9e\x05!\
-T\xff\xc6G\x0e\xdd+$.e(5<y[O\
-\x01\xa40\xfa\xf1\xd2\xbe\x07\xef\xea\x93\x15\x89\xc6\x16\x1a\
-\x9dq\x1a\xe4\xaa\xb5\xa1\x86\xdbF\xc8\xaaCIo\x90\
-\xe9\x81\xe0\x1e-\x8b\xa5\xce\xd4u\x18\x04\xe8\x8d\xc8|\
-\x99\xdb\xa5/\x99\xf8\xaeZM\x80\x89#\x181\x8cp\
-\xd9\xae\xc4!\x89SN\xcd\x04RCk\xea\x06\x92\x87\
-\x86\xac\xb4pL6i\x5cQt\x99\x83*J\x10\xb5\
-\xd5\x13\x91\xc7\xe9-\xb6qv\xc5J\x86 \x8f\xc3:\
-,\xcd\x11\x08[\x13\x80\x0a\x07\x8a~\x0e+\x0a~\xe6\
-\xa2\xa3[9\xf8\xc4]\xc2\xb4\x05\x80\x84\x93\xb6\xf5\x14\
-\x00\x02\x10\xc41~\xfc\xcf\xdf\xfeq\xbd\xb5;\xdc&\
-\x1a{HX\xf6\x9a\x86\x8d\xcd\x00\xc7\xd3\x9a6\xb9\x19\
-\x10H\xe1\xea\xd79\xd2\xb2\xd5\xb1\x89\xeb\xd8\x81\xd0\x7f\
-\xd8\xb4C\x0f\x95\xe8\xce!\xf68\x0a\xd0h\xecye\
-\xefp\x92\xee\x8bO\xd1x\x07\xadtH\xb4T\xcd\xb3\
-0,\x0b\xa8\xc5U\x0a\xe8;\x1b\x95Z\x0b\x09f\xe0\
-\x96\x82~\xef\xfc\x9a#Os\xdf\xd8\xb1n@\xc0\xab\
-B\xae^E\xcc\x94Q\xc8\x86\xa6^\x0b\x19!(}\
-\xc5\x071F\x05\xc4\xaf\xd2'\xc8\xf8\xc0m\xef\xf8\x88\
-\xe6Y\x00\x88<e[o\x01 \x08\x81\xfa\x94\xe3\xd1\
-c+G\x0f}\xbcMb\x18\x13\x04\x10\xa6C\x8c\x93\
-\xae\xfa\x00\x00\xb0[\xe2\xea\xacBkW\xe9L\x93<\
-5\xa0-\x8c\xe0\xcem\xa7\x08\xf8\xf9\x05\x82\x87\xa6N\
-\x9ba1\x17\x8c\x95\x8f,\xf1\xc4M\xc9\xb0\x85\xd7L\
-|\x97 \xbbk\x81\xd5d\x8a'\xccgU3\xeeN\
-\xcdq/\xd7j\xcc\xdf\x9d\x02\x04\xeal\xc6\x94\xb4\xab\
-\xef;s+\xc8\xf4\xe8\xb6i\x00c7\xb0HOA\
-\x906M\x5c@a\xd3\xe4\xd8\x91O\x1d\xbc\xfb\x93\xfa\
-~\x99\x0b\x80\x22XW[o\x018F\x92\xc8\xad\xc6\
-\xe5\x95\x03\x8f\x7f\xd0\x86W\x15]~<\xef\xd7p\xa0\
-\xc3\xb3\x0e\xda0:X\x22\x8aB\xa8tv\x5c/\xa6\
-#\xe88\x1a+\xa9\xaa\xeb`\x11\xdc\x08\xd1\xdc\xb6\xdd\
-e\xc4\x17ND\x8b$\xc4Xb\x95\x83\x0c\xe6\x96'\
-\x83{\x5c\xc0\xba9\xce\x98G\x90\xec\x15\xa5\xb45`\
-\xa13\xde\xf6\xc1\xd9i\xd3(V\xac\xc5\x08\x13J+\
-?\xf2\xac(X,^\xacaM\xe0\x82\x8f\x9d0\xec\
-\x85\xc1\x7f\x10\xa3\x06\x01\x96\x11:\xc3D\xfd\xffD\x87\
-\x9e\xfas!\xb9\x13H\x8e@\x9aZ\xfdI\xdbz\x0b\
-\x00!T\x95\x0b\xe0\xd0m\xef\xfa]U\x7fw\xdb\xd1\
-\xf6\x08i\x8d\x9dZ\x0d\xf0\x86\xe6>\xa8\x22\xd9\x80T\
-\x12\x15\x1f\x89\xec\x18\xc5\x10\x09\xef\xd9\x13\x17}\xf2\xd2\
-;\xa6z\x013P\x01\xf0\x83\x8a\x91\x04\xe9\xe3\xed\x93\
-\x03&7SX08\xa1X\xe4\x95\x0f?p\x1a}\
-U\x17\x90H\x05 D\x003\xa9\x96\xa4\xc9|] \
-(\xff\x82\xa1\xeaDX\xf2PA1\xf6\x00\x84N\x1f\
-yMA\x12`\x8d\xb7s\xb1T,J\x02\xbb\xcdD\
-\xca\xac\x0f^\x06\xc29n\xe2D\xf4\x81;\xff\xe4\xb7\
-\x04m\x0b\x00\xcaS\xb6\xf5\x16\x00*9(\x82\xa5\xa7\
-\xfe\xfaO\x1f\x18\x1f|\xf2})\xbd3\x0c@Fa\
-z\xac\xb9\x13\x06\x5c\x0d\xb2.\xf1N$\x01!\xa1\xd1\
-\x07\x0d\xae\x85\xf4\x80\x9b\xd541\x0at+\x97w\x08\
-\xa3m;\x03-V\x07R3\xf8i9\x8fI\xac.\
-\xc3Q\x13F\x05-v\x18aJ\x879e \x85S\
-O\xc8\x0a\xfbB2I\xa9#N7fM\x8d\xe0\xac\
-$hb(\x9a\xaa\x07i\xfe\x172`\xad$)\xda\
-|\xc9\x8c\xd4,\xda\xe5#\x07>\xbc\xff\xcf\x7fo\xaf\
-@\x14\x009\x0a\xd5\x1a\x9c\xaa\xad\xb7\x00R\x0e\xc2Q\
-r\xec\xf0\x17n\xfb\x1f\x04\x9e\xe6\xde\xe3f\x8e7\x82\
-\x19gkI\xae\x88\x09\xaci\xa3\x07\x06W\xcaB^\
-6`\xe9I\x8bg\x8c\xa8\xe0\x0c\xea\xa4\xf3l8_\
-\x86\xdb\xf43j\x12\x8e\xfcL\x9c\x8b(\xc8\x1d<K\
-I\x03\xb2\xb7\xce\x90\x06=\x7fd\x00H\xca\xf2\xaaL\
-@\x5cM\x1a\x87[!3\xfc\xf1\xc5\x9c\x99\xc4l\x91\
-\xec\x04\xc4D\xf2\xb0K\xe0,#\xc6\x90\xf8\xe8\xf0@\
-\x01\xd6\xde\x1c\xd8Qw6=-\x85\x8dG\x1f\xfc\xcc\
-o\x88J\xbf\x1fWx\x96\xfeY;\x05`\x9bw\x00\
-\xf5G\x9f\xb8\xf5W?49\x1c\xbb\x80\x03\x8c\xa3\x04\
-\x8a(d3\x8cI\x04\xd0.W|O\x17\xce%i\
-\x0f7uJr\x9fa`\x12ZZH%\x95|d\
-q{w\xa4\xeb\x02>\xb8Bf\xae\x16\xa82\xb1\xa9\
-\xd3\x0c\x81\x00)k\xf5W\x91$\xd4\xf2\x8c\xe7E$\
-V\x9e\x16\x84\x0d\xcc,\xd7\xd3\x9e?/\xd4$\x86\x7f\
-P\xd5\x01\xb3:V\x87}@\x80Y_\xd5\xdf\xd1T\
-8\xf3\xd0\x0c\xa9\xeec\x1c9\xf0\x17\x8f\xfc\xfe\xcf\xbc\
-W3=_\xfe\xec\xee\x00\xe8\xa5\x00\xa80\xaa\xed\xc8\
-\x93\x1f\xfc\x9d\x1f\xd7g\x03\x87\x1c`\x82L\xf0\x85 \
-\x10\x09cnx\xc2\xc0\xeb\xa0%\x8e\xb1X\xbb\x96\xf8\
-f\xfd\x1b\x07\x09\xb2V\xb5\xaa\x17\x98q\x0e\x5cH\xc0\
-\x9a\xe1\x96]\xba\x15\xcbC'a|\xf0\xca>+7\
-\x93\x03\x09\xbc\xd3k[%O\x10`<\x06\xe9\x82\xf0\
-\xb2\xadTU\x0f\xe6xX\xcdJ\xf3<\xad[\xbe3\
-\x86L\xcd\xa3xRW&3\x8cq\x91Z\xbc^,\
-h\xb5\xf0N\x17\xc6\xaai\xbe\xbc\xff\xa3\xef\xfcO\x1a\
-\x1e\xd1AN\xd8\x9d\xab%\x1a\xad\xa3\xcdz\x0a@x\
-\x16\xc0\xe1\x83\x9f\xfa\xa3{\x96\x1e\xda\xfb\x8b\xe8!\x08\
-\xdd\xaa\x91e\xf6#\x11\xea\x8fK\x1c0\xf0k\xb4\x1e\
-\x9eR\xb2\xcf\xc0\xa5<QJq\xea\xcd~\x95.\x0c\
-[\xd4o\xe9\xe9\xcb\x17q\xd5\x1e.;\xb5\xe0t.\
-w\xb05\xf6*D\x9elBV\xf4\x8c\xeb\xf9\x1c\x00\
-\x0d\x9c\x8f\xa0s\xa1p*\xe0\x9f\xe0\x0c\x82\xdb\xc4\xec\
-\xf3n\xc0\x5cC\x1d\xa0\x8fSp\xe8\xd5\xfc\x88\x089\
-\xc1\x19spY\xe4\x8c\x97\x1f\xfb\xfc\xaf=\xf1\x91\xdf\
-\xff\x94\xb0Y\x00\xe4f\xa6k\x00\xddK\xddPK\xeb\
-\x86\x07\xef\xf8\xe3Oo\xbf\xfce\x17\x0d\x16\xb7\xf1\xf3\
-\x97n \xfb$:.\x15\x03\x14l\xb6\x9c\xd7\xde%\
-\x0e.\x1cu0\xb2\xec\xd5\x9b\x8a\xc0P`\x0e\x06q\
-\xaaAI\x91pO\xc1\x9cx?\x88\xaa\x00\xf3;\x05\
-\xd9\x9a\xe4\xdb!\xf8*\xce\xc9b\xa6\xe4crgu\
-=\xe7C\xe6\xfb\xf6&\xc1&\x03\xcc\xed\xa19\x82\x11\
-Y\x226\x8es~O\x1a0\xa4W\xb4i:mF\
-\x83\xd3\xa0nY\x1e\x8bJw\xfd\xfe\xf8\xbe\xdfx\xeb\
-\x8f\xea3`\x9e\x9d\xe3S@N\x018\x87\xf8u\xb7\
-\x8d\x16\x00\x0a\xc2O\xd5\xf7\xd1\xbb>\xf4\xe1\xadW\xfc\
-\x83\xeb\x87\xf3\x0b\xfa/.\xd6h\x99D\x07%\xf0T\
-r:\xd3;\x8c\xc7\x19\x14\x8dp\x5cG\xd0\xd69\xec\
-\x0d,D;\xc4\x9d<\xd8\xb21\x86FL\xba\x1c\xd0\
-\x87\x9f|\xf4\xcb\xef\x15U=\xa9\x03\x99x\xc4<\xa4\
-A\xa1\xbf*\xcc\x1d8\x1f\x9dt\xbf\x1b`\xe6\xb5\x8c\
-\xb9\xe6A<\x85c\x00\x93F\x0e7\x91(\x02(A\
-\xf58\x07\x14\x1e\xc3\x03\x17chbn{\x96\x0e\xdf\
-\xf9\xc0\xdb\x7f\xf4\xcdz'\xa6\x1f\x0d.\xfau\xa9\xc2\
-\x8f\x04r\x018\xd3\xea\x17\xbd\xbf\x84C\xff\xb4\xdax\
-\xe9hY~\xe03\x1f\x5c\xbc\xe4\xbaku[\xf6\xdc\
-\xb0\xb6\x8a\xec\x92\xcf\xbc\xd6\xcc\xaa\xe4\x03\xeeW\xb7\x93\
--\x90\x1d]\x05\x87?b\x8a\xc8\x18G\xf0\xbc-\x06\
-\xa8{5\x7f7k\x06N\x8c\x9e\xc7\xa3\x08\x08\xbeP\
-I\x9b}\xb5\xd2\xf0\xd8\xb2M$B\xf5\x06P\xbcJ\
-d\xb7\x1b`G\x97\xd20\xd2\x19\xab\x92\xba\x9cj\xe0\
-q$\x14\xed\xa13\xe8R\x7f5\xca\xe12\x0c\x87\xb1\
-U\xc7\xca\x91Cw>\xfa\xde_~\xf3\xd1\xfb\xef|\
-@\xd6\xb0\xfay\x08$W\xbf\x86\xb3\xb5\xa7\xbb\x03`\
-\xb9\xdb\xf2\x81\xc7\x8f\x1d\xfd\xf4\x9f\xde\xba\xe5\xb2\x1b.\
-\x18.l\xfb2\x0cv\xab\x0e3n\x13\x97I\x07\x8e\
-cA\x16N\xd6\xb0E \x13\x9f\xf2<\x87\xeb\xf8\xd6\
-\x90\xacBVK\x04\xab\x92k\x11\xc4\xe3j5\xb8\xb2\
-\x802\xc4\x12\xcb\xa96\xc1\x1b\x89\xf1(h\xcc/8\
-\x12ao\x0a\x81\x95_\xbd\x09\xfb\x91cY\xa2\x86!\
-\xcf\xff\x95*\x0a,q\x08\xac\xf2\xbc\xe5k^\xf9a\
-\x1e\x1f\xdc\xf7\xa7\x0f\xbc\xfdG\xfe\xcd\xd1\x07\xee|P\
-\x98\xdc\xfa9\xff\xe7\xc5\x1f\x0e\xce\xd4\x9eN\x01\xa4\x22\
-\x94\xfa\xd0\x7f\x87\xaa\x0f$\xde\xfb'[.\xba\xea\xd8\
-h\xdb\x9ek\x14\xce9\x9c\xcf\xed\xbeMtD\xd9\xfe\
-5\x85Q\x03\xaax\xac\xe5I$\x22\xd4:\x96i\xc1\
-\x89\xfa\xbarzt\xc3E\x12\xf9\x86\x8e\xaf\x09j\xe2\
-\xc9\x90\xec\x0d\xdb\xa2\xb7\xfd\x12\x10\x85\x11\xfcq\x13\xa8\
-\x8e\xed\x1f,\xc9\x87\xe5\x8c\x83't\x0b&|\x7f\xfe\
-\xafE&/{\x9f\x82'L\xe0\xaa\x11\x1c\xdc\xc4O\
-O\xc3=r\xf7\x7f\xbf\xff7~\xf0\xc7\xc6\x87\xf6\xef\
-\x13\x90\xe4\xb3\xf5g\xf2g\xde\xfa\xc5\xeb\xf6L\x16\x00\
-F\xd8\x90Cw\xfc\xc9'\x97\xf7?~\xeb\x96s.\
-\xbd@\xff\xe1\xd1E\xf8\x91\x09]5\xae\xc1\xc3\x12\x07\
-:\x89\xea\xdcp^\x8ek5\xc8\x86\xb7\xe3)\xc2\x88\
-`P)\x8a}@\x9b\xb1\xae\x09\x1cn\xe3\x1dqr\
-`Z\xdf\x9a\xe5TN\x12j\xb2r\xb5gQ#<\
-\x92o5\xcc\xcc\xdc\xf1\xc0M\xb1\x19\xce+\x7f\xc4C\
-6p\x11j8<\x1a\xd2\xa0\x95K\x8e\x87\x80\x93\xc3\
-O\xfd\xd5\x13\x7f\xf6\xbf\xbe\xff\xb1[\x7f\xf5\x9d\xf5\x82\
-\xafM\xfe\x86\xce\xfb\xa1(^Sm\x0b\x9bu\x8c\x0c\
-<\xe1\xf12>\x92\xd3\x7fqU\xf8\xcf\xf1\xb6\xd3\xef\
-\xb9\xf9\x9f\xdf\xb4x\xe1\x0b\xdf0\xb7\xf3\xb4\x97j\xce\
-\x7f\x17\x14\xce1P\x8b\xc4+\x18\x1ag*\x03c\xf4\
-I^\x92\x1aF\x8d]L$6\x5c\xca\xeb\x82N~\
-\x03_\x136\xd1o\xef\xfb\xceZ\x88\x93@\xffkW\
-m\xda\xd5\xeb\x10\x09\x9e\xe3~\xb5\xc1~\xd8\x04\x8f\xc2\
-?\xc92H\x94\x1e5x\xec\x0e\xc7\x83\xa2\xda6\xd1\
-co\x1f=|\xcfm\xbf\xf3\xd8{\x7f\xe9\x03b\xe3\
-\x22\x8fs=\xab\x9e\x9e\x95\x9f\xc9g\xd1m\xb8\xa5]\
-\x1b\x16P\x19\x91C(\xd8Q\xf4\xe5\xb7U\x85@A\
-l\xd9\xfa\xbc\x97\x5c\xb0\xe3\xeaW~\xe3\xdc\xae3o\
-([\xb6_\xae\xc0\xfa\xbf\x0c\x12n\x86\xd6$\x1d.\
-\x07\x9dA\xefF\xbb2s<\xdd\xd7\x88\x8b=R\xea\
-\x1ch8\xe4\xb1zN\x09\x02\x90x?nN\xca \
-\xe8Tt\x03\x14\x0b\x0eeHt2k\x19wy%\
-,\xdc\xfd\xd19\xdd\x9c\xc9\xde\x13X\xbe(\xc6\xe3\xc3\
-\x07\xefZ:\xf0\xe8G\x0f\xdd\xfe\x87\xffg\xff'n\
-\xbd[b\xb9\xb8#\xf9Y\x00\xf4\xc08\xe7\xe7\x8e\xab\
-\xe1\xc6[\x9a\xb3q\x09='\xb28(\x02v\x83,\
-\x84-\x1aS\x04\xec\x0e\x1c\xf3s\xbb\xcf\xde\xb1\xe3\x9a\
-W\xbep\xb4\xe7\xdcK\x87[v\x9e;\x5c\xdcv\xde\
-`~\xcb\x19\xba}\xab\xdf\x8f\x1b\xea\xffV\x1dnU\
-\x5c\xe7tcF\xff\x9f\xaa\x1e\xa9\xf4*#b\xe4<\
-v\x0b\x82\x9d\x89\xed\xe0\xa2\x88\x85\xd8\xe3\xfa$\x07\x0c\
-\xda\xe9\x96;\x02p?\xf1\xec\xb7\x89\xe8\x89\xe4+9\
-n.\x04&\xbe\x9dW\x13\xeb\xba\x17P\xf68\xc5\xb6\
-\x81\x9dH\x9b\x9d\x19\xf5\x85w\xbe\xec<(Kz\xb0\
-\xf4\xc8dE_\x87\x9e\xe8\xee\xe9\xf2\xd2\xe3\xe3\xa3\x87\
-\x1e\x1c\x1f\xde\xff\xe0\xd2\x93\x0f\xdfs\xe0\xf6[o;\
-\xfa\xc8=l\xef\xacl\x8eL>\xab\x9d\x839\xf0L\
-~\x9a%\xd0\xc6\x9b\x83\xbaq\xf6\xe38S^\xee\x06\
-Y\x08Y\x0c\xf4\x1c|\xb7\x0c\x1c\xc5\xc2\x01=\xbc\xd9\
-\xa7\x1c\x81\x0c\xa7\xff\xdb\xdc2Ym\xef\xeb%9\xc5\
-M\x09\xc6$\x96\x83[\xba\x1c$<{\x12\x0f\x1d\x07\
-2R\x8e\x86O\xaf\xb5\x81~z\x92Vs#7\x13\
-JRI6G&>\xe7Y\x04Y0\xc9#R\xf3\
-?[\xf6!\xff\x8b\xdd2q\xd9\xe7\x16\x9e\xc9'\xb9\
-\xb9\xc2\xb3\xcf\xa2HZl~\xc6\x92\x8f\xb0g;\xc0\
-\xc8\xcf#\x93\xbcV\x0f\x8c#i\xb3\x17\xa8k\xc0\xfe\
-\xb6\xb5\xe9de\xf2\xb3\xcf\xc4\xd2\xe7\x0a\xa7o\xe1I\
-;-\xeb\x19\x89\xc5\x17+\xa8\xa9'\x13K\xbfV\xc2\
-\x13\x9f\xce%_\xce\xff6\xf7m\x02\xdb\xa4\xb6c\x12\
-\xdf\xce\xf1\xb7\xe5{\xc6\xfd\xff\x9b\x08p\xea\xcc\x1e\xa7\
-r\x9c\xfd3\xee\xe8\x97\x98\xc06\xa99\xce\x1eS\xdb\
-\xf1\xb3j\xfa\x97J\xc0\xbfT\xecxV\x83}\x02\xe1\
-_\xb4d\x9f@\xff&x3\x02\x9b\x11\xd8\x8c\xc0f\
-\x046#\xb0\x19\x81\xcd\x08lF`3\x02\x9b\x11\xf8\
-\xff*\x02\xff\x0f\xa47\xd7M\xf6\x06;\x86\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x0bA\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x03\x00\x00\x00k\xacXT\
-\x00\x00\x01\x17PLTEGpL*\x7f\xb8*\x7f\
-\xb8*\x7f\xb8*\x7f\xb8*\x7f\xb8*\x7f\xb8*\x7f\xb8\
-*\x7f\xb8*\x7f\xb8*\x7f\xb8*\x7f\xb8*\x7f\xb8\x22\
-f\x94*\x7f\xb8*\x7f\xb8#k\x9b\x22h\x96\x22h\
-\x96#i\x98\x22g\x95\x22h\x97\x22h\x96*\x7f\xb8\
-\x22f\x94#i\x98#k\x9a\x22f\x94#i\x98#\
-i\x98\x22g\x95#k\x9a(z\xb1\xff\xff\xff\x22f\
-\x93*\x7f\xb8Y\x8c\xae*~\xb6\x22g\x95(z\xb1\
-#j\x9a_\x9f\xca\xf2\xf7\xfb\xca\xdf\xed'v\xaa7\
-\x87\xbc%o\xa1R\x97\xc5E\x8f\xc1\xe5\xef\xf6&r\
-\xa5\x95\xbf\xdc\x91\xb3\xc9\xa2\xc7\xe0\x88\xb7\xd7m\xa7\xce\
-\xb0\xcf\xe50p\x9a\xd6\xe3\xeb\xc8\xd9\xe4z\xaf\xd3>\
-y\xa1(y\xaf)|\xb4$n\x9fu\xa0\xbc\xd8\xe7\
-\xf2\xbd\xd7\xe9L\x83\xa7\xe4\xec\xf2$l\x9d%q\xa3\
-\xad\xc6\xd7&t\xa8\x9f\xbc\xd0\xf2\xf6\xf9#i\x98\xbb\
-\xd0\xde'w\xacg\x96\xb5\x83\xa9\xc2_\x9d\xc7x\xaa\
-\xca\xae\xca\xdd\x93\xbb\xd5\xa1\xc5\xddv\xa2\xc0E\x8e\xbf\
-\xa0\xc0\xd6A\x85\xb3\xc9\xdb\xe8h\x99\xbaL\x84\xa9i\
-\xf2Q\xb0\x00\x00\x00!tRNS\x00P\xd0@\xa0\
-\x800\x10\xc0\xf0\x90p\xe0\xf3` \x13\xac\x8d[\xc9\
-8\x9d\xb0\xe5l%\xd8|J\xbb\xe42\xf6\xa4\xf2\xcd\
-\x00\x00\x09\xb8IDATx\xda\xe5]iC\x1b9\
-\x12\x95\xdd\xb7\x0fln\xc8\x84\xddU\x0b\x03\xbeb\x83\
-\xc3\x192\x19\x8eLH\x98L\xb2\xf7\xf9\xff\x7f\xc7\x12\
-\x07'&\xd8t\xb7T%\x95\xba\xdf\x97|\x0b\xd4C\
-\xf5^\xa9\xa4V1\xa6\x17\x81\xe3x\x9e\x1b\x86e\xf1\
-\x03\xcaa\xe8z\x9e\xe3\x04,\xaf\xf0K\xdez(R\
- \x5c\xf7J~\xceb\xaf\xbae\x91\x11e\xb7\x9a\x0f\
-\x16\x1c/\x14\xd2\x08=\xc7\xf2\xbf\xbcB\xf0\xdfH\xb0\
-u%\x94*5\x01\x84Z\xa5d]\xf4n$@\x11\
-\xb9\x16q\xe0CG?\xe1\xc0\x8a\x5c\x08\xaa5\x81\x86\
-Z\x95z\x99\xe0\xb8\x02\x19.e_X\xa8\x09\x0d\xa8\
--\x10]\xfb^$4!\xf2\xe8eB\xa3\xa2-\xfc\
-1\x05\x95\x06\xad\xf0]\xa1\x1dn\x83\xd0\xe2\x17F@\
-$\x114\xe6>I-\xd0\xa3\xfcd\x1d\xc1\x0f\x85a\
-\x84&\xcb\xc3\xa0\x22\x08\xa0b,\x0fJ\x91 \x81\xc8\
-\xcc>\xa9\x11\x0a2\x08\x0dXb5\x12\x84\x10Uu\
-g\x7f(\x88!\x0c\x8a\x98\xfd\x86\x94\x80\x86\xf8\x9b\xb3\
-\x03\xbf,\x88\xa2\xec\x17u\xf9\xebL\x83\x8a \x8dJ\
-\xe1\xd4_\xaf\x1b\xf85A\x1e\x98B\xe0D\xc2\x02D\
-hm\xd3\x05a\x09\x90\xf6\xc8\x9e\xb0\x06\x1eF\xfc\xae\
-\xb0\x08n\xc1\xe3G`\xc0\xb2\xf8\xa1\x19\x08\xca\xc2:\
-\x94\x83b\xc7\x0f\xca\x80\x95\xf1\xdf1P\xd8\xfc\x07\xd6\
-\x01k\xe3\x07b\xc0\xe2\xf8A\x18\xf0\x84\xd5\xf0\x0aS\
-\xff#\xed\x0b\x1ca=\x94\xf6\x86~d?\x01\x91_\
-\xb4\x02\x08\xb0 \x0aE.\x10\xe6\xb4\xff\x89\xde)-\
-\x89\xdc\xa0TT\x01T\x11\xc2|\x08\xa0\x82\x10VD\
-\xaeP)\xb0\x00H\xc9@\x10\xe5\x8d\x80((b\x05\
- ]\x0dTE\x0e\x91\xe1\x16M#\xca#\x01Q\xa3\
-\xc8\x09\x90)\x09J\x22\xa7(\x15\xd5\x012:AE\
-\xe4\x16\xa9\xca!_\xe4\x18~q\x150\xb5\x0e.\x88\
-\x5c#\xb1G\x1a\xd4\xf2M@-I\x07=\x91sx\
-E\xb5\xc0\x94V\x98\xfb\x05\x90\xb0\x04\x1a\xa2\x00h\xe4\
-\xf5 4-\xdc\x82/\x80\xa7\x96\x80[\x0c\x02*\xc5\
-\xb5\x80\x04#\xf0DA0\xcf\x08\xa2\xa2\x10\x10\x15r\
-\x17\x90\xbc# \xb2\x0b\x18\xb4\xef\x81\xb9#\xa0y\x19\
-dx~\xd8\xed\xf0)tO\x8e\x068?\xca\xa1\xe7\
-\x81\x83\xc3}>\x0b\x9d\x93c=\xc5P`\xf4o?\
-\x9a\x1d\xfd\x84\x03\xf8u\x10P:\x0b\x19\x9e\xf0$t\
-\xa1\x97A\x95\x8e\x04\xa6\x08\x7fLA\x1bW\x06M\xb5\
-B\xfb\x87<-\xbaC\xc8\x1f\xec\xd3\x90\xc0\xf6>O\
-\x8f\xce\x11\xa2\x0c\x9a\xa9\x02\x0fy6t\xfbX\xd5\xa0\
-\x91\xd3\xb0\xfe%\xcf\x8a\xce\x9f\xc1~z\xc9x\x06\x0c\
-:\x5c\x02\x7f\xc1\xc9\x01\x03\x19\xd0\x96\x8a\x9f\xf3\xbfa\
-\xe4\x80\x81\x0c8\xe7\xb2\xf8+B\x0e\xe8?\x0fms\
-y\xfc\x0b\xbe1T\xb3#\xff'\xf8G\x0b\xb8\x16\xd2\
-^\x05\xf5\x95\xe2\xe7\xfc\xbf \x0c\xf8\xe6\xf6\x01\x97j\
-\xf1\xf3\xdb\xff\xed\x82\xee\x07t\x9f\x88\x1frU\x9c\xed\
-\x000\xf0\xfd\xac\xdc\x22\x01\x9c\xe0C\xdcS\xffE\x0c\
-\xf5\x82\xfa\xfb\x00\x04\xf0\xed\xf8=X_\xc8\xb3-\x01\
-\xc6I\x10\xc7/T\x7f\x13O\x83\x04\x0c\xdb\xc7\xa3\xd1\
-\xa8\xdd\xfe\xbe\x8b\x19r\x18\x5c\xdc1\xd0\x82\x11\x014\
-\xb3\x1fu\xa7\xb61WG_\xf7\xf3] \x02nO\
-\xe3x\xaf\x05!\x028U@\xff\xe8q\xaaw\xcfa\
-\x14\xf0+^\xc6w\x0c\xbc\x01\xa8\x040\xaa\x80\xfeh\
-v\xa9\xb3\x7f~\x05F\xc0\xed\x1d\x01\xb1\x9a\x1dV\xb1\
-\xb6\xc2\xc7\xfb\x5c\x03.\xc6\x0c\xfc\xae\xbc%\x06\xff8\
-\xa8\x7f\xc2\xb5\xe0,\x1eC\xa1 (\xa3h`\xff\x92\
-k\xc2\xf5W\x06\x0e\xd4T\x10Z\x03\x07\x1d]\xf1\xdf\
-\x95\x83_\xf1BI\x05\x81\x9b!C}\xf1\xf3\xb7\xf7\
-\x04\xc4\xbf\xc8\xdaa\x09\xbc\x0e\xd4\xb7\xfe\xbf\xe0\xf5\x84\
-\x01\xd9\x82\xe0K-\xb8\x0eJ@Wg\xfc\xfc\xf3\x84\
-\x80\xf879;\x5c\x87.\x84\x8f\xb4\xc6\xcf?~#\
-@\xb2 \x08\x81M@\xa7\x00<\x10\x81/\x0c\xf4\xe4\
-l\x00\xf4X\xfc\x8akF<\x0d\x19\x06\x02\xd0f@\
-[w\xfc|\xfb\x01\x03\xefdZ\x02\x8e\xcd\x0b\x80\x7f\
-z@\x80DA\xe0@\xba\xe0P{\xfc\xe3\x1d\xe14\
-~me\xf6A\xcfZ\x0b\x98E@\xe6\x82\xc0\x83\xdc\
-\x0b^\xea'\xe0\xc3\x8f\x04d\xb5C\x17\xb0\x0c\xe8\xeb\
-\x8f\x9f\xbf\x8a\x15\x19\x08\x01\x098\xa6A@6;\x0c\
-\x01\xbb\x01#*\x04da\xa0\x0cX\x08\x9e\x18 \xe0\
-f&\x01Y\xec\x10\x90\x80.'\xe0\x02\x13\x06Z\x05\
-' \xbd\x1dZN\xc0\xe7x.\x03o\x0aA\xc0\xf6\
-\x5c\x02\xd2\xda\xa1\xe5\x04\x9c\xc6O0\xf0s\xfe\x09\xb8\
-\x8d\x9fDO/\x01\x87T\xca\x80\xef8\xd0H@\xff\
-\xb8K\xc8\x04\xd2\x17\x04@\x04\x9c_qNK\x03\xd3\
-6\xcc!\x08\x98w\x12\xaa!\x05^'2\x90T\x10\
-\x00\x10\xa0\xe7$t\x8e\x0a~Jf`\x17\x97\x80\xfe\
-\x157\x8a\xcf\x89\x0c<]\x10\xa8\x120\xd8\xe7\x86q\
-\x93\xcc@\x0f\x8f\x80\xe3\x0e7\x8e\x0f\x89\x0c<U\x10\
-\xa8\x11p\xce)\xe0\x22\x99\x81\xf9\x0ds\xa5\x86\xc8\xa0\
-C\x82\x80\xc9=\x01\x99\x82\xa0\xac\xd2\x12\xeb\x13\x89\x9f\
-\xbf=Mf`N\xc3\x5c\xa9'\xd8\xe5T\xf02\x99\
-\x809\x05A\xa8\xd0\x16?\xe2t\xf0:\x05\x033\xed\
-\xd0\x95?\x18!\x93\x00\xe9\xbcp\x0e\x03\x0a'C'\
-\x9c[\xb6\x04f\xd9\xa1'}8:$\x15\x7f\x9ab\
-`&\x03\xf2\xa7\xc3#Z\x04\xbcMG\xc0#;t\
-\xa4/H\xec\xd3\x22 \xc5\xcex&\x03\x81\xec\x15\x99\
-\x01\xb1\xf8S9\xe1\x0c;\x94\xbe$5\xa2F\xc0\xab\
-85\x03o\x1e^\x92Z\xb7\xbc\x08\x9a 5\x01\xd3\
-v\xb8.}Q\x92\x5c\xfc)\x8d\xf0\x87\x86\xb9'{\
-UvH\x8f\x80\xed8\x03zSWe\xa5.K\xb7\
--'`\xf2\xc9\x99/{]\xdez\x02\xee\xedP\xfa\
-\x83\x09\xfb\x09\x187\xcc\xcb\xd2\x9f\xcc\xe4\x80\x80/\x05\
-\x81+\xfd\xd1T\x1e\x08\x88\xf7v\xab\xd2\x9f\xcd\x11$\
-\xe0:3\x01\xf1\xce\x9f\xa4?\x9c\x1c\xd0# \x96\x80\
-\xc2\xa7\xb3\xe4\xe2?\x93\x88\x7fE\xe1\xe3\xe9Kj\x04\
-\xdcH\x10\xb0\xa4\xf0\xf9\xfc!5\x02.$\x08\xd8R\
-x@\xe1\x98\x1a\x01\xa7\xf2\x12 '\x02\x1dZ\xf1\x7f\
-T\x90\x00\xb9J\x80VO\x94\x7f\x92 \xe0\xb9\xd23\
-:\xb4\xf6\x83oeLpU\xed!\xa5\xae\xed\x12\xb8\
-\xa1\xf8\x94\x16\xa5Z\xe8\x95\xcc\x02XS}L\x8d\x90\
-\x13^\xcb\x10\xb0\xac\xfa\x9c\x1e\xccs8Z;\xc2\xd3\
-\xa8\xab?\xa88\xb0\xd8\x02\xe3x\x11\xe0IM\x1a\x17\
-D\xceNc\xe5\x0c\x90}R\xf2\xc8\xde\xf8\xeb0\xcf\
-\xea\x1e\xd9\x1a\xff\x0f\x19 \xff\x90\x86\xe9,\xf8(\x19\
-\xfft\x15\xa4\xf6\xa8\xa4\xd9\x8b\x82/%\xc3\x7fP\x05\
-)>\xaa\xd8\xff\xbb\xb9\xfa\xe7Z6\xfe\xa9}\x00\xc0\
-\xf3\xfa\xff\xfc\x8f\x99\xfa\xff\x22\x96G\x13v\xc0\xc2\xbf\
-on\xb5'\xff\xb6B\xf8\x8f$P\xf9Y\xc5\xdd\x9d\
-O\x1f\xce\xf4)\xff\xcd\xc5i\xac\x84-\xf0!+\xad\
-\xbd\xbb\xff\xf6\xf5\xf6\x18\xf7\xff`\xe1:V\xc6\x06\xc6\
-\x98\x9dw\xb1=\xd8D\x19\xb4\xd4\xdb\xb1%\xfe:\xd2\
-\xa8\xad\xdd=K\x08X\xc2\x1a\xb6\xd6\xfa\xc5\x8e\x05\xd0\
-\xc4\x9b9}`\x03\x01k\x98\x03\x17\x7f\xb6@\x08\x9e\
-\xa1\x8e\xdc|C^\x08\x16\xb1\x87\xae\xbe \xae\x00\xcf\
-\xd0\xc7\xee\xf6\xac\xb4\x00\xc8\xa9\x9b\xbb\xbf\xd9h\x01\x90\
-\xef\x8c\xb7~\xb5t\x01\xc0\x0d_\xa7\xea\x87\x1b\xcd\xa4\
-\xf1\xf3P\x837\x7f\xa7\xe9\x87\x9b,\x11POK\x91\
-,\x8cW\x92\xe3\x87{g\xb8E\xd0\x0fWS\x10\x00\
-8t\xe8\xbd=E0\xd2\x00\xea\xdd\x1d\xab,\x10a\
-\xf0V\x8b\x94\x10,\xb3\x94\x80|j\xf8\x9d]\x0ax\
-\xbf%\x80\x1c>G\xa6Q\xf4\xf4&\x00q\x04-\x15\
-?|\xce2\x00\xf4\xbdm\x1a\x8d\xa2\x95,\xf1C:\
-\x01\x91\xc28\xad\x03 \x8d`4\xdf(Zf\x19\x01\
-<\x83\xd1t\xa3h-k\xfc,\x80\x9e\xbdb\xb40\
-\xfe\xa9\x99\x99\x00\xe6C\x0fb5\xd8(\xaa\xaf2\x09\
-\x80Ob5\xd7(ZfR\x00\x1f\xc5j\xaaQ\xb4\
-\xc6$\x01?\x86\xee\x80~\x05\x80*\x84F\x1aE2\
-\x02\x88&\x84\x06\x0ac9\x01D\x9c\xc6\xa9\xbbQ\xb4\
-\xc5\x94\xb0\x00\xcf\x80\xdeF\xd1&S\x04\xc6@R\x8d\
-\x8d\xa2%\xa6\x0c\x84q\x84\xfa\x1aE\x8b\x8c\xd1d@\
-S\xa3\x08$~$\x06t4\x8a\x80\xe2g\xf03)\
-\xf5\xf8\xe1\x0aT\xfc\x18\x05\x91\x86F\x91J\x01\xa4\x87\
-\x01\xdc\xc2\x182~,\x1d\xc0l\x14-2`\xe00\
-\x80\xd6(\x02\x8f\x1f\x8b\x01\xa4F\x11B\xfchC\xea\
-{4\xeb?]\xfb\x02\x94F\xd1&C\x82\x13\xa10\
-\x00\xdc(\xaao14\xf88v\x08\xea\x87?\xad2\
-D\x04!\x0e\x03p\x8d\xa2\x95&\xc3E\x05I\x08\x80\
-\xfcp\x8d\xa1\xa3\x84$\x04\x10~X_f\x1a\x80%\
-\x04\xef\x89\xa7\xff\x94\x10`\xa5\x81\xa2\x10\xac5\x99.\
-`\xa5\xc1\x1e\xf9\xe5\x8f\xed\x06\xf2\x8d\xa2?4\x99^\
-Tq\x16\x81d\xa3\xa8\xfe\x9ciG#\xa4\xe3\x87+\
-\xcf\x98\x09\xe0(A\xf6F\x91\xde\xec\xd7`\x07\x07d\
-\xc5\x7fFM\x80\x92\x07Y\x1aE+\xab\xcc,\x16j\
-\x08\x0c\xa4n\x14ml2\xe3\x08<\x0c)HU\x18\
-\xd7\x97\x9a\x8c\x02\x02\x8c^Q\xcf\x9a\xf0\xc7\x96\x88\xd0\
-0Lj\x14->c\x94\xd0\xa8\x80'\xc2S\x8d\xa2\
-\xfa\x12\xad\xf0\x91\xb4\xe0\xc0\x82\xc5\x8f\xeb\x083\x1bE\
-\x14\x94\x7f~\xdb\xd4\xc5.\x8c\x17\xb7\x18m\x04U\xd0\
-e\xf0\xb0Q\xb4\xf1\xbc\xc9,\x80\xefB\xaa\xc1\xb7F\
-Q}q\x95Y\x83\x12 \x07\xe3\xc2\xb8\xbe\xb8\xcc,\
-C\xa9\x02\x95\x0b\xad?\xaeY\x17\xfd}.T\x01\xf6\
-Ja\xd5g6\xc3\xf1\x14H\x08=\x87\xe5\x01~\xd5\
-\xcd\xdcJ/\xbb\x96\xff\xe5\x1f\xb3P\xf2\xd6S-\x86\
-p\xdd+\xe5,\xf6\xe92\xc1q<\xcf\x0d\xc3G+\
-\xa2\x1c\x86\xae\xe79N\xa0\xf9\x17\xfa?y\xf8 \xd8\
-l\xefn\x95\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x03\xc4\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22?>\x0a<!-- Gener\
-ated by Pixelmat\
-or Pro 3.6.14 --\
->\x0a<svg width=\x2212\
-8\x22 height=\x22128\x22 \
-viewBox=\x220 0 128\
- 128\x22 xmlns=\x22htt\
-p://www.w3.org/2\
-000/svg\x22>\x0a    <p\
-ath id=\x22path1\x22 f\
-ill=\x22#000000\x22 fi\
-ll-rule=\x22evenodd\
-\x22 stroke=\x22none\x22 \
-d=\x22M 64 5 C 96.5\
-84801 5 123 31.4\
-15199 123 64 C 1\
-23 96.584801 96.\
-584801 123 64 12\
-3 C 31.415199 12\
-3 5 96.584801 5 \
-64 C 5 31.415199\
- 31.415199 5 64 \
-5 Z M 37.622307 \
-58.001968 C 32.3\
-70365 60.228371 \
-28.690266 65.396\
-515 28.690266 71\
-.416672 C 28.690\
-266 78.471954 33\
-.324383 84.64879\
-6 40.039822 86 L\
- 87.960175 86 C \
-94.675613 84.648\
-796 99.309738 78\
-.471954 99.30973\
-8 71.416672 C 99\
-.309738 65.15152\
- 95.323997 59.80\
-912 89.728813 57\
-.744911 C 90.219\
-368 56.066925 90\
-.4823 54.293068 \
-90.4823 52.45833\
-6 C 90.4823 41.9\
-87938 81.91925 3\
-3.5 71.356194 33\
-.5 C 63.373318 3\
-3.5 56.532719 38\
-.347771 53.66719\
-1 45.235352 C 53\
-.194351 45.18991\
-9 52.714958 45.1\
-66664 52.230087 \
-45.166664 C 44.7\
-0145 45.166664 3\
-8.493591 50.7719\
-65 37.622307 58.\
-001968 Z\x22/>\x0a</sv\
-g>\x0a\
-"
+# Built from resources.qrc with `pyside6-rcc --binary`. Qt memory-maps the
+# file, so the icons are paged in only when used instead of living in the heap.
+RESOURCE_FILE = os.path.join(get_base_path(), "app", "resources", "resources.rcc")
 
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x05\
-\x00z\xcf\xb3\
-\x00t\
-\x00e\x00x\x00t\x00s\
-\x00\x0c\
-\x0aYz\xde\
-\x00.\
-\x00a\x00p\x00p\x00-\x00v\x00e\x00r\x00s\x00i\x00o\x00n\
-\x00\x08\
-\x0aaB\x7f\
-\x00i\
-\x00c\x00o\x00n\x00.\x00i\x00c\x00o\
-\x00\x09\
-\x06\x14)\x13\
-\x00i\
-\x00c\x00o\x00n\x00.\x00i\x00c\x00n\x00s\
-\x00\x08\
-\x0aaZ\xa7\
-\x00i\
-\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x01\xea\x5c\x87\
-\x00m\
-\x00e\x00n\x00u\x00-\x00i\x00c\x00o\x00n\x00.\x00s\x00v\x00g\
-"
+_registered = False
 
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00 \x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x98:\xd0#\x7f\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x03\x5c[\
-\x00\x00\x01\x97\xfd\x16BG\
-\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x00I\x08\
-\x00\x00\x01\x97\xfd\x16BG\
-\x00\x00\x00>\x00\x01\x00\x00\x00\x01\x00\x00\x00\x0a\
-\x00\x00\x01\x97\xfd\x16BG\
-\x00\x00\x00l\x00\x00\x00\x00\x00\x01\x00\x03Q\x16\
-\x00\x00\x01\x97\xfd\x16BG\
-"
 
 def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    global _registered
+    if _registered:
+        return
+    if QResource.registerResource(RESOURCE_FILE):
+        _registered = True
+    else:
+        print(f"Failed to register resources from {RESOURCE_FILE}", file=sys.stderr)
+
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    global _registered
+    if _registered and QResource.unregisterResource(RESOURCE_FILE):
+        _registered = False
+
 
 qInitResources()
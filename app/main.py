@@ -1,15 +1,60 @@
+import sys
+
+if "--headless" in sys.argv[1:]:
+    # Keep the widget stack out of headless runs entirely
+    from utils.headless_utils import run_headless
+
+    sys.exit(run_headless(sys.argv[1:]))
+
+if "--control" in sys.argv[1:]:
+    from services.control_service import run_control_client
+
+    sys.exit(run_control_client(sys.argv[1:]))
+
+from services.control_service import CONNECT_FLAG, acquire_instance_lock, forward_launch
+
+# Held until exit; a second instance would fight over the ports and the proxy
+instance_lock = acquire_instance_lock()
+if instance_lock is None:
+    sys.exit(forward_launch(sys.argv[1:]))
+
+from utils.profile_utils import finish_profiling, mark_phase, start_profiling
+
+profiler = start_profiling()
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
 from platform import system
 
+mark_phase("import PySide6")
+
 if system() == "Darwin":
     from utils.macos_utils import hide_dock_icon
 from common import resources
+
+mark_phase("import resources")
 from views.main_window import MainWindow
+from utils.set_proxy import recover_system_proxy
+
+mark_phase("import main window")
+
+
+def report_startup(app):
+    """Report startup time once the first window is up; exit in benchmark mode"""
+    within_budget = finish_profiling()
+    if profiler.budget_ms:
+        app.exit(0 if within_budget else 1)
+
 
 # Run the application
 if __name__ == "__main__":
+    # Before anything can go online through a proxy left by a crash
+    recover_system_proxy()
+    mark_phase("recover system proxy")
+
     app = QApplication()
+    mark_phase("create QApplication")
     window = MainWindow()
 
     if system() == "Windows":
@@ -24,10 +69,18 @@ if __name__ == "__main__":
     elif system() == "Linux":
         app.setWindowIcon(QIcon(":/icons/icon.png"))
 
+    if CONNECT_FLAG in sys.argv[1:] and not window.connect_startup:
+        window.connect_action.setChecked(True)
+
     if not window.silent_mode:
         window.show()
+    mark_phase("show window")
 
     if system() == "Darwin":
         hide_dock_icon(window.hide_dock_icon)
 
-    app.exec()
+    if profiler:
+        # Runs once the event loop has processed the first show/paint events
+        QTimer.singleShot(0, lambda: report_startup(app))
+
+    sys.exit(app.exec())
@@ -0,0 +1,292 @@
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from platform import system
+
+from common.paths import get_runtime_dir
+
+CONTROL_FLAG = "--control"
+CONNECT_FLAG = "--connect"
+CONTROL_COMMANDS = ("status", "metrics", "tail", "connect", "disconnect", "show")
+CONTROL_TIMEOUT = 2.0
+# How long a second launch waits for a starting instance to start listening
+FORWARD_TIMEOUT = 10.0
+FORWARD_RETRY_INTERVAL = 0.05
+TAIL_LINES = 1000
+# Room for bursts of scripted clients; the socketserver default is 5
+LISTEN_BACKLOG = 64
+DEFAULT_TAIL = 20
+
+# Windows has no AF_UNIX in CPython, so it listens on loopback TCP instead
+USE_UNIX_SOCKET = hasattr(socket, "AF_UNIX") and system() != "Windows"
+
+
+def get_control_path():
+    """Get the socket path, or on Windows the file naming the TCP endpoint"""
+    name = "control.sock" if USE_UNIX_SOCKET else "control.endpoint"
+    return os.path.join(get_runtime_dir(), name)
+
+
+def acquire_instance_lock(path=None):
+    """Take the per-user single-instance lock.
+
+    Returns the open lock file, which must be kept alive for as long as
+    the process runs, or None if another instance holds the lock. The OS
+    drops the lock when the process exits, even after a crash.
+    """
+    path = path or os.path.join(get_runtime_dir(), "instance.lock")
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    lock_file = open(path, "a")
+    try:
+        if system() == "Windows":
+            import msvcrt
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    """Serve line-delimited requests until the client disconnects"""
+
+    timeout = 30
+
+    def handle(self):
+        control = self.server.control
+        try:
+            if control.token is not None:
+                line = self.rfile.readline().decode("utf-8", "replace").split()
+                if line != ["auth", control.token]:
+                    self.wfile.write(b"error unauthorized\n")
+                    return
+
+            for raw in self.rfile:
+                request = raw.decode("utf-8", "replace").strip()
+                if request:
+                    self.wfile.write(control.handle_request(request).encode())
+        except OSError:
+            pass
+
+
+if USE_UNIX_SOCKET:
+
+    class _ControlSocketServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        request_queue_size = LISTEN_BACKLOG
+
+else:
+
+    class _ControlSocketServer(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+        request_queue_size = LISTEN_BACKLOG
+
+
+class ControlServer:
+    """Local control endpoint for scripting a running session.
+
+    Each request is one line (``status``, ``metrics``, ``tail [N]``,
+    ``connect``, ``disconnect``) and gets one ``ok ...`` or ``error ...``
+    line back; ``tail`` answers ``ok N`` followed by N log lines. Requests
+    are served on their own threads from state the engine keeps current,
+    so they never wait on the GUI.
+    """
+
+    def __init__(
+        self,
+        engine,
+        on_connect,
+        on_disconnect,
+        on_show=None,
+        get_log_stats=None,
+        path=None,
+    ):
+        self.engine = engine
+        self.on_connect = on_connect
+        self.on_disconnect = on_disconnect
+        self.on_show = on_show
+        # Counters of the UI's log pipeline, merged into ``metrics`` replies
+        self.get_log_stats = get_log_stats
+        self.path = path or get_control_path()
+        self.token = None
+        self.metrics = {}
+        self.recent_lines = deque(maxlen=TAIL_LINES)
+        self._lock = threading.Lock()
+        self._server = None
+        engine.subscribe(self.dispatch)
+
+    def dispatch(self, event):
+        """Engine listener; runs on the engine thread"""
+        # Imported here so a forwarded second launch never loads the engine
+        from services.session_engine import LogLines, MetricsUpdated
+
+        if isinstance(event, LogLines):
+            with self._lock:
+                self.recent_lines.extend(line.rstrip("\n") for line in event.lines)
+        elif isinstance(event, MetricsUpdated):
+            with self._lock:
+                self.metrics.update(event.metrics)
+
+    def start(self):
+        """Start serving, returning False if another instance already is"""
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        if send_request("status", self.path)[0]:
+            return False
+
+        if USE_UNIX_SOCKET:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._server = _ControlSocketServer(self.path, _ControlHandler)
+            os.chmod(self.path, 0o600)
+        else:
+            self.token = secrets.token_hex(16)
+            self._server = _ControlSocketServer(("127.0.0.1", 0), _ControlHandler)
+            host, port = self._server.server_address
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(f"{host} {port} {self.token}\n")
+
+        self._server.control = self
+        threading.Thread(
+            target=self._server.serve_forever, name="control-server", daemon=True
+        ).start()
+        return True
+
+    def close(self):
+        """Stop serving and remove the socket"""
+        self.engine.unsubscribe(self.dispatch)
+        if not self._server:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def handle_request(self, request):
+        """Answer one request line; runs on a client thread"""
+        command, *args = request.split()
+        if command == "status":
+            return f"ok {self.engine.state}\n"
+        elif command == "metrics":
+            with self._lock:
+                metrics = dict(self.metrics, state=self.engine.state)
+            if self.get_log_stats:
+                metrics.update(self.get_log_stats())
+            return f"ok {json.dumps(metrics, separators=(',', ':'))}\n"
+        elif command == "tail":
+            try:
+                count = int(args[0]) if args else DEFAULT_TAIL
+            except ValueError:
+                return "error tail needs a line count\n"
+            with self._lock:
+                lines = list(self.recent_lines)[-count:] if count > 0 else []
+            return "".join([f"ok {len(lines)}\n"] + [line + "\n" for line in lines])
+        elif command == "connect":
+            self.on_connect()
+            return "ok\n"
+        elif command == "disconnect":
+            self.on_disconnect()
+            return "ok\n"
+        elif command == "show":
+            if not self.on_show:
+                return "error running headless, there is no window to show\n"
+            self.on_show()
+            return "ok\n"
+        return f"error unknown command {command}\n"
+
+
+def _open_connection(path, timeout):
+    if USE_UNIX_SOCKET:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            raise
+        return sock, None
+
+    with open(path, encoding="utf-8") as f:
+        host, port, token = f.read().split()
+    return socket.create_connection((host, int(port)), timeout=timeout), token
+
+
+def send_request(request, path=None, timeout=CONTROL_TIMEOUT):
+    """Send one request to a running instance.
+
+    Returns ``(ok, lines)``: whether the request succeeded and the
+    response payload lines. ``ok`` is None when no instance is listening.
+    """
+    try:
+        sock, token = _open_connection(path or get_control_path(), timeout)
+    except (OSError, ValueError):
+        return None, []
+
+    with sock, sock.makefile("rwb") as stream:
+        try:
+            if token:
+                stream.write(f"auth {token}\n".encode())
+            stream.write(request.encode() + b"\n")
+            stream.flush()
+            status, _, payload = stream.readline().decode().rstrip("\n").partition(" ")
+            lines = [payload] if payload else []
+            if status == "ok" and request.split()[0] == "tail":
+                count = int(payload)
+                lines = [stream.readline().decode().rstrip("\n") for _ in range(count)]
+        except (OSError, ValueError):
+            return None, []
+    return status == "ok", lines
+
+
+def forward_launch(argv, timeout=FORWARD_TIMEOUT):
+    """Hand a second launch's intent to the running instance.
+
+    Asks it to show its window, and to connect if launched with
+    ``--connect``. Returns the exit code for the second launch.
+    """
+    requests = ["show"] + (["connect"] if CONNECT_FLAG in argv else [])
+    deadline = time.monotonic() + timeout
+    for request in requests:
+        # The lock is taken before the running instance starts listening
+        ok, lines = send_request(request)
+        while ok is None and time.monotonic() < deadline:
+            time.sleep(FORWARD_RETRY_INTERVAL)
+            ok, lines = send_request(request)
+
+        if ok is None:
+            print("HITSZ Connect Verge is already running", file=sys.stderr)
+            return 1
+        if not ok:
+            print(*lines, file=sys.stderr)
+            return 1
+    return 0
+
+
+def run_control_client(argv):
+    """``--control COMMAND [ARG]``: send one request and print the answer"""
+    args = argv[argv.index(CONTROL_FLAG) + 1 :]
+    if not args or args[0] not in CONTROL_COMMANDS:
+        print(f"usage: {CONTROL_FLAG} {{{','.join(CONTROL_COMMANDS)}}} [N]")
+        return 2
+
+    ok, lines = send_request(" ".join(args))
+    if ok is None:
+        print("HITSZ Connect Verge is not running", file=sys.stderr)
+        return 3
+    for line in lines:
+        print(line)
+    return 0 if ok else 1
@@ -0,0 +1,633 @@
+import os
+import queue
+import shlex
+import threading
+import time
+import traceback
+from dataclasses import dataclass, fields
+from platform import system
+
+from common.paths import get_base_path
+from utils.network_utils import find_free_port, invalidate_race_cache, wait_for_network
+from utils.set_proxy import (
+    DEFAULT_STOP_TIMEOUT,
+    CommandWorker,
+    DEFAULT_PROXY_BYPASS,
+    get_proxy_bypass,
+    get_proxy_settings,
+    get_unsupported_bypass,
+    restore_system_proxy,
+)
+from utils.supervisor_utils import (
+    HOLD_PROXY_MAX_DELAY,
+    ConnectionSupervisor,
+    classify_exit,
+)
+
+RESTART_DRAIN_SECONDS = 5
+
+# Session states
+DISCONNECTED = "disconnected"
+WAITING_FOR_NETWORK = "waiting_for_network"
+CONNECTING = "connecting"
+CONNECTED = "connected"
+RECONNECTING = "reconnecting"
+RESTARTING = "restarting"
+DISCONNECTING = "disconnecting"
+
+# Config keys whose SessionSettings field has a different name
+CONFIG_KEYS = {"server_address": "server", "dns_server": "dns"}
+
+
+@dataclass
+class SessionSettings:
+    """Everything a session needs to run zju-connect"""
+
+    username: str = ""
+    password: str = ""
+    server_address: str = "vpn.hitsz.edu.cn"
+    alt_servers: str = ""
+    port: str = "443"
+    dns_server: str = "10.248.98.30"
+    auto_dns: bool = True
+    proxy: bool = True
+    proxy_bypass: str = DEFAULT_PROXY_BYPASS
+    keep_alive: bool = True
+    debug_dump: bool = False
+    disable_multi_line: bool = False
+    http_bind: str = "1081"
+    socks_bind: str = "1080"
+    cert_file: str = ""
+    cert_password: str = ""
+    stop_timeout: int = DEFAULT_STOP_TIMEOUT
+    auto_reconnect: bool = True
+
+    @classmethod
+    def from_config(cls, config):
+        """Build settings from a ``load_config()`` dictionary"""
+        return cls(
+            **{
+                name: config[CONFIG_KEYS.get(name, name)]
+                for name in (field.name for field in fields(cls))
+                if CONFIG_KEYS.get(name, name) in config
+            }
+        )
+
+
+@dataclass(frozen=True)
+class StateChanged:
+    state: str
+    previous: str
+
+
+@dataclass(frozen=True)
+class LogLines:
+    # Newline-terminated lines, from zju-connect or the engine itself
+    lines: list
+
+
+@dataclass(frozen=True)
+class MetricsUpdated:
+    metrics: dict
+
+
+def build_command_args(settings, http_bind=None, socks_bind=None):
+    """Build zju-connect arguments from session settings.
+
+    Returns the argument list and a copy with credentials masked for logging.
+    ``http_bind``/``socks_bind`` override the configured listen ports.
+    """
+    base_path = get_base_path()
+
+    if system() == "Windows":
+        command = os.path.join(base_path, "app", "core", "zju-connect.exe")
+    else:
+        command = os.path.join(base_path, "app", "core", "zju-connect")
+        if os.path.exists(command):
+            os.chmod(command, 0o755)
+
+    command_args = [
+        command,
+        "-server",
+        shlex.quote(settings.server_address),
+        "-port",
+        shlex.quote(str(settings.port)),
+        "-username",
+        shlex.quote(settings.username),
+        "-password",
+        shlex.quote(settings.password),
+    ]
+
+    # Add DNS server configuration
+    if settings.auto_dns:
+        command_args.extend(["-zju-dns-server", "auto"])
+    else:
+        command_args.extend(["-zju-dns-server", shlex.quote(settings.dns_server)])
+
+    http_bind = settings.http_bind if http_bind is None else http_bind
+    if http_bind:
+        command_args.extend(["-http-bind", shlex.quote("127.0.0.1:" + http_bind)])
+
+    socks_bind = settings.socks_bind if socks_bind is None else socks_bind
+    if socks_bind:
+        command_args.extend(["-socks-bind", shlex.quote("127.0.0.1:" + socks_bind)])
+
+    if not settings.keep_alive:
+        command_args.append("-disable-keep-alive")
+
+    if settings.debug_dump:
+        command_args.append("-debug-dump")
+
+    if settings.disable_multi_line:
+        command_args.append("-disable-multi-line")
+
+    # Add certificate file and password if provided
+    if settings.cert_file:
+        command_args.extend(["-cert-file", shlex.quote(settings.cert_file)])
+        if settings.cert_password:
+            command_args.extend(["-cert-password", shlex.quote(settings.cert_password)])
+
+    command_args.append("-disable-zju-config")
+    command_args.append("-skip-domain-resource")
+
+    debug_command = command_args.copy()
+    username_index = debug_command.index("-username") + 1
+    debug_command[username_index] = "********"
+    pwd_index = debug_command.index("-password") + 1
+    debug_command[pwd_index] = "********"
+
+    # Also mask certificate password if present
+    if "-cert-password" in debug_command:
+        cert_pwd_index = debug_command.index("-cert-password") + 1
+        debug_command[cert_pwd_index] = "********"
+
+    return command_args, debug_command
+
+
+def get_server_candidates(settings):
+    """List the configured VPN server followed by any alternate servers"""
+    candidates = [settings.server_address]
+    for server in settings.alt_servers.replace("，", ",").split(","):
+        server = server.strip()
+        if server and server not in candidates:
+            candidates.append(server)
+    return candidates
+
+
+class SessionEngine:
+    """Qt-free VPN session: zju-connect workers, reconnects and restarts.
+
+    Commands may be called from any thread. They run in order on the
+    engine's own thread together with worker notifications, and events
+    (``StateChanged``, ``LogLines``, ``MetricsUpdated``) are delivered to
+    subscribers from that thread. Subscribers should return quickly.
+    """
+
+    def __init__(self):
+        self.state = DISCONNECTED
+        self.settings = None
+        self.worker = None
+        self.standby_worker = None
+        self.retiring_workers = []
+        self.supervisor = None
+        self.command_args = None
+        self.proxy_settings = None
+        self.proxy_held = False
+        self.auto_connect_since = None
+        self._reconnect_timer = None
+        self._network_cancel = None
+        self._warned_bypass = []
+        self._listeners = []
+        self._tasks = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="session-engine", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def active(self):
+        return self.state != DISCONNECTED
+
+    def subscribe(self, listener):
+        """Call ``listener(event)`` for every event from now on"""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def start(self, settings):
+        """Connect with the given settings"""
+        self._post(self._start, settings)
+
+    def connect_when_reachable(self, settings, timeout, started_at=None):
+        """Connect as soon as the VPN server is reachable, or after ``timeout``"""
+        self._post(self._connect_when_reachable, settings, timeout, started_at)
+
+    def stop(self):
+        """Disconnect; ``DISCONNECTED`` is reported once zju-connect has exited"""
+        self._post(self._stop)
+
+    def restart(self, settings):
+        """Apply new settings to a running tunnel without dropping connectivity"""
+        self._post(self._restart, settings)
+
+    def update_settings(self, settings):
+        """Use new settings for reconnects; proxy changes apply to the running tunnel"""
+        self._post(self._update_settings, settings)
+
+    def shutdown(self, timeout=None):
+        """Stop every worker and the engine thread"""
+        self._post(self._shutdown)
+        self._tasks.put(None)
+        self._thread.join(timeout)
+
+    def _post(self, function, *args):
+        self._tasks.put((function, args))
+
+    def _run(self):
+        while (task := self._tasks.get()) is not None:
+            function, args = task
+            try:
+                function(*args)
+            except Exception:
+                traceback.print_exc()
+
+    def _emit(self, event):
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                traceback.print_exc()
+
+    def _log(self, text):
+        self._emit(LogLines([text + "\n"]))
+
+    def _set_state(self, state, force=False):
+        """Change state, re-announcing it with ``force`` even if unchanged"""
+        if state == self.state and not force:
+            return
+        previous, self.state = self.state, state
+        self._emit(StateChanged(state, previous))
+
+    def _start(self, settings):
+        if self.state == DISCONNECTING:
+            # Still waiting for the previous zju-connect to exit
+            self._set_state(DISCONNECTING, force=True)
+            return
+        if self.state not in (DISCONNECTED, WAITING_FOR_NETWORK):
+            return
+        self._cancel_network_wait()
+
+        self.settings = settings
+        command_args, debug_command = build_command_args(settings)
+        self._log(f"Running command: {' '.join(debug_command)}")
+
+        self.command_args = command_args
+        self.proxy_settings = get_proxy_settings(settings)
+        self.supervisor = ConnectionSupervisor()
+        self._launch_worker()
+
+    def _connect_when_reachable(self, settings, timeout, started_at):
+        if self.state != DISCONNECTED:
+            return
+        try:
+            port = int(settings.port)
+        except ValueError:
+            port = 443
+
+        self.auto_connect_since = started_at or time.monotonic()
+        cancel_event = threading.Event()
+        self._network_cancel = cancel_event
+        self._set_state(WAITING_FOR_NETWORK)
+
+        def wait():
+            started = time.monotonic()
+            reachable = wait_for_network(
+                settings.server_address, port, cancel_event, timeout
+            )
+            if not cancel_event.is_set():
+                self._post(
+                    self._handle_network_ready,
+                    cancel_event,
+                    settings,
+                    reachable,
+                    time.monotonic() - started,
+                )
+
+        threading.Thread(target=wait, daemon=True).start()
+
+    def _handle_network_ready(self, cancel_event, settings, reachable, waited):
+        if cancel_event is not self._network_cancel:
+            return
+        self._network_cancel = None
+        if reachable:
+            self._log(f"Network ready after {waited:.2f}s")
+        else:
+            self._log(f"Server not reachable after {waited:.0f}s, connecting anyway")
+        self._start(settings)
+
+    def _cancel_network_wait(self):
+        """Abandon a pending auto-connect, returning whether there was one"""
+        if not self._network_cancel:
+            return False
+        self._network_cancel.set()
+        self._network_cancel = None
+        return True
+
+    def _create_worker(self, settings, command_args, proxy_settings, standby=False):
+        if settings.proxy:
+            self._warn_unsupported_bypass(settings)
+        worker = CommandWorker(
+            command_args=command_args,
+            # A standby takes over the system proxy only once it is promoted
+            proxy_enabled=settings.proxy and not standby,
+            proxy_settings=proxy_settings,
+            proxy_bypass=get_proxy_bypass(settings),
+            stop_timeout=settings.stop_timeout,
+            keep_proxy_on_failure=settings.auto_reconnect,
+            server_candidates=get_server_candidates(settings),
+            on_output=lambda lines: self._post(self._emit, LogLines(lines)),
+            on_ready=lambda: self._post(self._handle_worker_ready, worker),
+            on_finished=lambda: self._post(self._handle_worker_finished, worker),
+        )
+        return worker
+
+    def _launch_worker(self):
+        """Start a worker for the current session's command"""
+        self._reconnect_timer = None
+        self.worker = self._create_worker(
+            self.settings, self.command_args, self.proxy_settings
+        )
+        self.worker.start()
+        self._set_state(CONNECTING)
+
+    def _handle_worker_ready(self, worker):
+        if worker.stopping:
+            return
+        if worker is self.standby_worker:
+            self._promote_standby_worker(worker)
+        elif worker is self.worker:
+            self._handle_connection_ready(worker)
+
+    def _handle_connection_ready(self, worker):
+        """Handle the tunnel accepting connections and the proxy being applied"""
+        metrics = worker.metrics
+        message = f"Tunnel ready {metrics['ready_latency']:.2f}s after start"
+        if "proxy_latency" in metrics:
+            message += (
+                f", system proxy applied in {metrics['proxy_latency'] * 1000:.0f}ms"
+            )
+        self._log(message)
+
+        # The new worker owns the system proxy from here on
+        self.proxy_held = False
+        outage = self.supervisor.on_ready() if self.supervisor else None
+        if outage is not None:
+            summary = self.supervisor.summary()
+            self._log(
+                f"Reconnected after {outage:.1f}s "
+                f"({summary['reconnects']} reconnects, "
+                f"{summary['downtime']:.1f}s downtime this session)"
+            )
+        self._set_state(CONNECTED)
+
+        if self.auto_connect_since is not None:
+            self._log(
+                f"Connected {time.monotonic() - self.auto_connect_since:.2f}s "
+                "after startup"
+            )
+            self.auto_connect_since = None
+
+        session = self.supervisor.summary() if self.supervisor else {}
+        self._emit(MetricsUpdated(dict(metrics, **session)))
+
+    def _handle_worker_finished(self, worker):
+        if worker in self.retiring_workers:
+            self.retiring_workers.remove(worker)
+            self._release_worker(worker)
+            return
+
+        if worker is self.standby_worker:
+            self.standby_worker = None
+            self._release_worker(worker)
+            self._log("Seamless restart failed, keeping the current tunnel")
+            if self.worker and self.worker.is_ready:
+                self._set_state(CONNECTED)
+            return
+
+        if worker is not self.worker:
+            return
+
+        self._release_worker(worker)
+        self.worker = None
+        self.proxy_held = self.proxy_held or worker.proxy_applied
+
+        if (
+            not worker.stopping
+            and self.settings.auto_reconnect
+            and self._schedule_reconnect(worker)
+        ):
+            return
+
+        self._end_session()
+
+    def _schedule_reconnect(self, worker):
+        """Restart zju-connect after an unexpected exit, returning False to give up"""
+        if not self.supervisor or "launch_error" in worker.metrics:
+            return False
+
+        reason = classify_exit(list(worker.recent_lines))
+        if reason == "network":
+            invalidate_race_cache()
+        delay = self.supervisor.on_exit(reason)
+        if delay is None:
+            self._log(f"zju-connect exited ({reason} failure), giving up")
+            return False
+
+        # Don't leave the desktop pointed at a dead port through a long backoff
+        if delay > HOLD_PROXY_MAX_DELAY:
+            self._release_held_proxy()
+
+        self._log(
+            f"zju-connect exited ({reason} failure), "
+            f"reconnecting in {delay:.1f}s (attempt {self.supervisor.attempt})"
+        )
+        timer = threading.Timer(delay, lambda: self._post(self._reconnect, timer))
+        timer.daemon = True
+        self._reconnect_timer = timer
+        timer.start()
+        self._set_state(RECONNECTING)
+        return True
+
+    def _reconnect(self, timer):
+        # A stop may have won the race against the timer
+        if timer is self._reconnect_timer:
+            self._launch_worker()
+
+    def _release_held_proxy(self):
+        """Restore a system proxy left in place for a reconnect that won't happen"""
+        if self.proxy_held:
+            restore_system_proxy()
+            self.proxy_held = False
+
+    def _end_session(self):
+        """Finish the connection session"""
+        self._retire_standby_worker()
+        if self.supervisor:
+            self.supervisor.on_stop()
+            summary = self.supervisor.summary()
+            if summary["reconnects"]:
+                self._log(
+                    f"Session ended after {summary['reconnects']} reconnects, "
+                    f"{summary['downtime']:.1f}s total downtime"
+                )
+            self._emit(MetricsUpdated(summary))
+            self.supervisor = None
+        self._release_held_proxy()
+        self._set_state(DISCONNECTED)
+
+    def _release_worker(self, worker):
+        stop_duration = worker.metrics.get("stop_duration")
+        if stop_duration is not None:
+            self._log(f"zju-connect stopped in {stop_duration:.2f}s")
+
+    def _restart(self, settings):
+        """Start a second zju-connect on free ports and switch over once it is up.
+
+        The old instance is given ``RESTART_DRAIN_SECONDS`` to finish in-flight
+        requests before it is stopped.
+        """
+        if self._reconnect_timer:
+            # Nothing to keep alive; the pending reconnect picks up the new settings
+            self.settings = settings
+            self.command_args, _ = build_command_args(settings)
+            self.proxy_settings = get_proxy_settings(settings)
+            return
+
+        if not self.worker or self.worker.stopping:
+            return
+
+        self._retire_standby_worker()
+        self.settings = settings
+
+        _, old_http, _, old_socks = self.worker.proxy_settings
+        busy = {old_http, old_socks}
+        http_bind, socks_bind = settings.http_bind, settings.socks_bind
+        if http_bind:
+            port = find_free_port("127.0.0.1", int(http_bind), exclude=busy)
+            http_bind = str(port) if port else None
+            busy.add(port)
+        if socks_bind:
+            port = find_free_port("127.0.0.1", int(socks_bind), exclude=busy)
+            socks_bind = str(port) if port else None
+        if http_bind is None or socks_bind is None:
+            self._log("No free ports for a seamless restart")
+            return
+
+        command_args, debug_command = build_command_args(
+            settings, http_bind, socks_bind
+        )
+        self._log(f"Restarting with: {' '.join(debug_command)}")
+
+        proxy_settings = (
+            "127.0.0.1",
+            int(http_bind) if http_bind else None,
+            "127.0.0.1",
+            int(socks_bind) if socks_bind else None,
+        )
+        self.standby_worker = self._create_worker(
+            settings, command_args, proxy_settings, standby=True
+        )
+        self.standby_worker.start()
+        self._set_state(RESTARTING)
+
+    def _promote_standby_worker(self, worker):
+        """Make a ready standby worker the session's tunnel and retire the old one"""
+        old = self.worker
+        self.standby_worker = None
+        self.worker = worker
+        self.command_args = worker.command_args
+        self.proxy_settings = worker.proxy_settings
+
+        # Hand the system proxy over, then repoint it at the new ports
+        if old:
+            worker.proxy_applied = old.proxy_applied
+            old.proxy_applied = False
+        self._sync_proxy(worker)
+        self._handle_connection_ready(worker)
+
+        if old:
+            self.retiring_workers.append(old)
+            timer = threading.Timer(RESTART_DRAIN_SECONDS, old.stop)
+            timer.daemon = True
+            timer.start()
+
+    def _retire_standby_worker(self):
+        """Abandon a restart that is still in progress"""
+        if self.standby_worker:
+            self.standby_worker.stop()
+            self.retiring_workers.append(self.standby_worker)
+            self.standby_worker = None
+
+    def _update_settings(self, settings):
+        if self.settings is None:
+            return
+
+        old = self.settings
+        self.settings = settings
+        proxy_changed = settings.proxy != old.proxy or (
+            get_proxy_bypass(settings) != get_proxy_bypass(old)
+        )
+        worker = self.worker
+        if proxy_changed and worker and worker.is_ready and not worker.stopping:
+            self._sync_proxy(worker)
+
+    def _sync_proxy(self, worker):
+        """Apply or restore the system proxy for a running tunnel as configured"""
+        worker.proxy_enabled = self.settings.proxy
+        worker.proxy_bypass = get_proxy_bypass(self.settings)
+        if self.settings.proxy:
+            self._warn_unsupported_bypass(self.settings)
+            worker.apply_proxy()
+        elif worker.proxy_applied:
+            worker.proxy_applied = False
+            restore_system_proxy()
+
+    def _warn_unsupported_bypass(self, settings):
+        """Log bypass entries the system proxy cannot apply, once per change"""
+        unsupported = get_unsupported_bypass(get_proxy_bypass(settings))
+        if unsupported == self._warned_bypass:
+            return
+        self._warned_bypass = unsupported
+        if unsupported:
+            self._log(
+                "System proxy cannot bypass IPv6 ranges, ignoring: "
+                + ", ".join(unsupported)
+            )
+
+    def _stop(self):
+        self._retire_standby_worker()
+        for worker in self.retiring_workers:
+            worker.stop()
+
+        if self._cancel_network_wait():
+            self.auto_connect_since = None
+            self._set_state(DISCONNECTED)
+        elif self._reconnect_timer:
+            self._reconnect_timer.cancel()
+            self._reconnect_timer = None
+            self._end_session()
+        elif self.worker:
+            self.worker.stop()
+            self._set_state(DISCONNECTING)
+        else:
+            self._set_state(DISCONNECTED, force=True)
+
+    def _shutdown(self):
+        self._cancel_network_wait()
+        if self._reconnect_timer:
+            self._reconnect_timer.cancel()
+            self._reconnect_timer = None
+        for worker in [self.worker, self.standby_worker, *self.retiring_workers]:
+            if worker:
+                worker.stop()
@@ -0,0 +1,48 @@
+from PySide6.QtCore import QObject, Signal
+from services.session_engine import LogLines, MetricsUpdated, StateChanged
+from utils.log_utils import LogBatcher
+
+
+class SessionBridge(QObject):
+    """Deliver a SessionEngine's events to the GUI thread as Qt signals"""
+
+    output = Signal(str)
+    # state, previous state
+    state_changed = Signal(str, str)
+    metrics_updated = Signal(object)
+    # Control requests; may be emitted from any thread
+    connect_requested = Signal(bool)
+    show_requested = Signal()
+
+    # Emitted from the engine thread, delivered queued on the GUI thread
+    _state_received = Signal(str, str)
+
+    def __init__(self, engine, session_log=None, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.session_log = session_log
+        self.log_batcher = LogBatcher(parent=self)
+        self.log_batcher.flushed.connect(self.output)
+        self._state_received.connect(self._deliver_state)
+        engine.subscribe(self.dispatch)
+
+    def dispatch(self, event):
+        """Engine listener; runs on the engine thread"""
+        if isinstance(event, LogLines):
+            # Written here so lines the view drops still reach the disk
+            if self.session_log:
+                self.session_log.write("".join(event.lines).rstrip("\n"))
+            self.log_batcher.push_many(event.lines)
+        elif isinstance(event, StateChanged):
+            self._state_received.emit(event.state, event.previous)
+        elif isinstance(event, MetricsUpdated):
+            self.metrics_updated.emit(event.metrics)
+
+    def _deliver_state(self, state, previous):
+        # Log lines that led up to the change are shown before it
+        self.log_batcher.flush(drain=True)
+        self.state_changed.emit(state, previous)
+
+    def close(self):
+        self.engine.unsubscribe(self.dispatch)
+        self.log_batcher.stop()
@@ -0,0 +1,20 @@
+from PySide6.QtCore import QObject, Signal, QRunnable, Slot
+from utils.startup_utils import get_launch_at_login
+
+
+class StartupSignals(QObject):
+    """Signals for login item checks"""
+
+    finished = Signal(bool)
+
+
+class LoginItemChecker(QRunnable):
+    """Worker class to query the launch-at-login state in background"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = StartupSignals()
+
+    @Slot()
+    def run(self):
+        self.signals.finished.emit(get_launch_at_login())
@@ -1,7 +1,4 @@
 from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool, Slot
-import requests
-from requests.exceptions import RequestException
-from packaging import version
 
 
 class UpdateSignals(QObject):
@@ -22,6 +19,9 @@ class UpdateChecker(QRunnable):
 
     @Slot()
     def run(self):
+        # Imported here so the update stack only loads once a check runs
+        from packaging import version
+
         try:
             latest_version = self.get_latest_version()
             if not latest_version:
@@ -38,6 +38,9 @@ class UpdateChecker(QRunnable):
 
     def get_latest_version(self):
         """Get the latest version from GitHub releases"""
+        import requests
+        from requests.exceptions import RequestException
+
         try:
             url = (
                 "https://api.github.com/repos/kowyo/hitsz-connect-verge/releases/latest"
@@ -1,49 +1,152 @@
-from PySide6.QtCore import QSettings
-from .startup_utils import get_launch_at_login
+import atexit
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QSettings,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from services.startup_service import LoginItemChecker
+from .set_proxy import DEFAULT_PROXY_BYPASS
+
+
+DEFAULT_CONFIG = {
+    "username": "",
+    "password": "",
+    "remember": False,
+    "server": "vpn.hitsz.edu.cn",
+    "alt_servers": "",
+    "port": "443",
+    "dns": "10.248.98.30",
+    "auto_dns": True,
+    "proxy": True,
+    "proxy_bypass": DEFAULT_PROXY_BYPASS,
+    # Last known state; refreshed in the background by refresh_launch_at_login()
+    "launch_at_login": False,
+    "connect_startup": False,
+    "silent_mode": False,
+    "check_update": True,
+    "hide_dock_icon": False,
+    "keep_alive": True,
+    "debug_dump": False,
+    "disable_multi_line": False,
+    "socks_bind": "1080",
+    "http_bind": "1081",
+    "cert_file": "",
+    "cert_password": "",
+    "log_lines": 5000,
+    "stop_timeout": 3,
+    "auto_reconnect": True,
+    "seamless_restart": True,
+}
+# Coalesce bursts of writes (e.g. a dialog saving every field) into one sync
+FLUSH_DELAY_MS = 200
+
+_config_store = None
+
+
+class ConfigStore(QObject):
+    """In-memory copy of the app's QSettings.
+
+    Values are read and type-coerced once. Writes update the cache, emit
+    ``changed`` and mark the key dirty; dirty keys are written back with a
+    single ``sync()`` after a short debounce, or on ``flush()``.
+    """
+
+    changed = Signal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._settings = QSettings("Kowyo", "HITSZ Connect Verge")
+        self._defaults = dict(DEFAULT_CONFIG)
+        self._values = {
+            key: self._coerce(key, self._settings.value(key, default))
+            for key, default in self._defaults.items()
+        }
+        self._dirty = set()
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def as_dict(self):
+        return dict(self._values)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, config):
+        """Update cached values, scheduling a write only for keys that changed"""
+        for key, value in config.items():
+            value = self._coerce(key, value)
+            if key in self._values and self._values[key] == value:
+                continue
+            self._values[key] = value
+            self._dirty.add(key)
+            self.changed.emit(key, value)
+
+        if not self._dirty:
+            return
+        if QCoreApplication.instance() is None:
+            # No event loop to run the debounce timer
+            self.flush()
+        else:
+            self._flush_timer.start()
+
+    def flush(self):
+        """Write dirty keys back to QSettings with one sync"""
+        self._flush_timer.stop()
+        if not self._dirty:
+            return
+        for key in self._dirty:
+            self._settings.setValue(key, self._values[key])
+        self._dirty.clear()
+        self._settings.sync()
+
+    def _coerce(self, key, value):
+        default = self._defaults.get(key)
+        if isinstance(default, bool):
+            return str(value).lower() == "true"
+        elif isinstance(default, int):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return default
+        return value
+
+
+def get_config_store():
+    """Get the shared config store, creating it on first use"""
+    global _config_store
+    if _config_store is None:
+        _config_store = ConfigStore()
+        atexit.register(_config_store.flush)
+    return _config_store
+
+
+def refresh_launch_at_login():
+    """Re-check the login item in background and update the cached state"""
+    checker = LoginItemChecker()
+    checker.signals.finished.connect(
+        lambda enabled: get_config_store().set("launch_at_login", enabled)
+    )
+    QThreadPool.globalInstance().start(checker)
 
 
 def save_config(config):
-    """Save config using QSettings"""
-    settings = QSettings("Kowyo", "HITSZ Connect Verge")
-    for key, value in config.items():
-        settings.setValue(key, value)
-    settings.sync()
+    """Save config through the shared config store"""
+    get_config_store().update(config)
 
 
 def load_config():
-    """Load config from QSettings"""
-    settings = QSettings("Kowyo", "HITSZ Connect Verge")
-    default_config = {
-        "username": "",
-        "password": "",
-        "remember": False,
-        "server": "vpn.hitsz.edu.cn",
-        "port": "443",
-        "dns": "10.248.98.30",
-        "auto_dns": True,
-        "proxy": True,
-        "launch_at_login": get_launch_at_login(),
-        "connect_startup": False,
-        "silent_mode": False,
-        "check_update": True,
-        "hide_dock_icon": False,
-        "keep_alive": True,
-        "debug_dump": False,
-        "disable_multi_line": False,
-        "socks_bind": "1080",
-        "http_bind": "1081",
-        "cert_file": "",
-        "cert_password": "",
-    }
-
-    # Load values from QSettings, falling back to defaults if not found
-    for key in default_config.keys():
-        value = settings.value(key, default_config[key])
-        if isinstance(default_config[key], bool):
-            value = str(value).lower() == "true"
-        default_config[key] = value
-
-    return default_config
+    """Load config from the shared config store"""
+    return get_config_store().as_dict()
 
 
 def load_settings(self):
@@ -53,10 +156,12 @@ def load_settings(self):
     self.password = config["password"]
     self.remember = config["remember"]
     self.server_address = config["server"]
+    self.alt_servers = config["alt_servers"]
     self.port = config["port"]
     self.dns_server = config["dns"]
     self.auto_dns = config["auto_dns"]
     self.proxy = config["proxy"]
+    self.proxy_bypass = config["proxy_bypass"]
     self.connect_startup = config["connect_startup"]
     self.silent_mode = config["silent_mode"]
     self.check_update = config["check_update"]
@@ -68,3 +173,7 @@ def load_settings(self):
     self.socks_bind = config["socks_bind"]
     self.cert_file = config["cert_file"]
     self.cert_password = config["cert_password"]
+    self.log_lines = config["log_lines"]
+    self.stop_timeout = config["stop_timeout"]
+    self.auto_reconnect = config["auto_reconnect"]
+    self.seamless_restart = config["seamless_restart"]
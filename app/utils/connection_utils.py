@@ -1,136 +1,129 @@
-import os
-import sys
-from platform import system
-import shlex
-import gc
-from .set_proxy import CommandWorker
+from dataclasses import fields
+
+from services.control_service import ControlServer
+from services.session_engine import (
+    CONNECTED,
+    CONNECTING,
+    DISCONNECTED,
+    DISCONNECTING,
+    RECONNECTING,
+    RESTARTING,
+    WAITING_FOR_NETWORK,
+    SessionEngine,
+    SessionSettings,
+)
+from services.session_service import SessionBridge
+from .credential_utils import get_credentials
+
+AUTO_CONNECT_TIMEOUT = 30
+
+STATUS_TEXT = {
+    DISCONNECTED: "状态: 未连接",
+    WAITING_FOR_NETWORK: "状态: 等待网络",
+    CONNECTING: "状态: 正在连接",
+    CONNECTED: "状态: 已连接",
+    RECONNECTING: "状态: 正在重连",
+    RESTARTING: "状态: 正在重启",
+    DISCONNECTING: "状态: 正在断开",
+}
+
+# States in which the connect button and tray action show as on
+CONNECT_CHECKED_STATES = (CONNECTING, CONNECTED, RECONNECTING, RESTARTING)
+
+
+def init_session(window):
+    """Create the window's session engine and route its events to the UI"""
+    window.engine = SessionEngine()
+    window.session = SessionBridge(
+        window.engine, session_log=window.session_log, parent=window
+    )
+    window.session.output.connect(lambda text: show_output(window, text))
+    window.session.state_changed.connect(
+        lambda state, previous: handle_state_changed(window, state)
+    )
+
+    # Scripted connects go through the same action as the button and tray.
+    # Disconnects stop the engine directly, as the action is already
+    # unchecked while waiting for the network; the UI follows its state.
+    window.session.connect_requested.connect(window.connect_action.setChecked)
+    window.session.show_requested.connect(window.bring_to_front)
+    window.control_server = ControlServer(
+        window.engine,
+        on_connect=lambda: window.session.connect_requested.emit(True),
+        on_disconnect=window.engine.stop,
+        on_show=window.session.show_requested.emit,
+        get_log_stats=window.session.log_batcher.stats,
+    )
+    try:
+        window.control_server.start()
+    except OSError as e:
+        handle_output(window, f"Control socket unavailable: {e}")
 
 
 def handle_output(window, text):
-    """Handle output text from the worker"""
-    window.output_text.append(text)
+    """Log a message from the GUI side and show it in the log view"""
+    text = text.rstrip("\n")
+    window.session_log.write(text)
+    show_output(window, text)
+
+
+def show_output(window, text):
+    """Show lines in the log view; the session log already has them"""
+    text = text.rstrip("\n")
+    window.log_buffer.append(text)
+    if window.ui_ready:
+        window.output_text.appendPlainText(text)
+
+
+def set_status(window, text):
+    """Show connection status, remembering it for a panel not built yet"""
+    window.status_text = text
+    if window.ui_ready:
+        window.status_label.setText(text)
+
 
+def handle_state_changed(window, state):
+    """Mirror the session state in the status label, button and tray"""
+    set_status(window, STATUS_TEXT[state])
+    window.connect_action.setChecked(state in CONNECT_CHECKED_STATES)
 
-def handle_connection_finished(window):
-    """Handle connection finished event with proper cleanup"""
-    if window.worker:
-        window.worker.output.disconnect()
-        window.worker.finished.disconnect()
-        window.worker.deleteLater()
-        window.worker = None
-        gc.collect()
+    if state == DISCONNECTED and window.quit_pending:
+        window.quit_app()
 
-    window.status_label.setText("状态: 未连接")
-    if hasattr(window, "connect_button"):
-        window.connect_button.setChecked(False)
+
+def get_session_settings(window):
+    """Collect the window's current settings for the session engine"""
+    settings = {
+        field.name: getattr(window, field.name)
+        for field in fields(SessionSettings)
+        if hasattr(window, field.name)
+    }
+    settings["username"], settings["password"] = get_credentials(window)
+    return SessionSettings(**settings)
+
+
+def auto_connect(window):
+    """Connect at startup as soon as the VPN server is reachable"""
+    window.engine.connect_when_reachable(
+        get_session_settings(window), AUTO_CONNECT_TIMEOUT, window.started_at
+    )
 
 
 def start_connection(window):
     """Start VPN connection"""
-    if window.worker and window.worker.isRunning():
-        window.status_label.setText("状态: 正在运行")
-        return
-
-    username = window.username_input.text()
-    password = window.password_input.text()
-    server_address = window.server_address
-    port = window.port
-    dns_server_address = window.dns_server
-
-    is_nuitka = "__compiled__" in globals()
-
-    if is_nuitka:
-        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
-    else:
-        base_path = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-
-    if system() == "Windows":
-        command = os.path.join(base_path, "app", "core", "zju-connect.exe")
-    else:
-        command = os.path.join(base_path, "app", "core", "zju-connect")
-        if os.path.exists(command):
-            os.chmod(command, 0o755)
-
-    command_args = [
-        command,
-        "-server",
-        shlex.quote(server_address),
-        "-port",
-        shlex.quote(str(port)),
-        "-username",
-        shlex.quote(username),
-        "-password",
-        shlex.quote(password),
-    ]
-
-    # Add DNS server configuration
-    if window.auto_dns:
-        command_args.extend(["-zju-dns-server", "auto"])
-    else:
-        command_args.extend(["-zju-dns-server", shlex.quote(dns_server_address)])
-
-    if window.http_bind:
-        command_args.extend(
-            ["-http-bind", shlex.quote("127.0.0.1:" + window.http_bind)]
-        )
-
-    if window.socks_bind:
-        command_args.extend(
-            ["-socks-bind", shlex.quote("127.0.0.1:" + window.socks_bind)]
-        )
-
-    if not window.keep_alive:
-        command_args.append("-disable-keep-alive")
-
-    if window.debug_dump:
-        command_args.append("-debug-dump")
-
-    if window.disable_multi_line:
-        command_args.append("-disable-multi-line")
-
-    # Add certificate file and password if provided
-    if window.cert_file:
-        command_args.extend(["-cert-file", shlex.quote(window.cert_file)])
-        if window.cert_password:
-            command_args.extend(["-cert-password", shlex.quote(window.cert_password)])
-
-    command_args.append("-disable-zju-config")
-    command_args.append("-skip-domain-resource")
-
-    debug_command = command_args.copy()
-    username_index = debug_command.index("-username") + 1
-    debug_command[username_index] = "********"
-    pwd_index = debug_command.index("-password") + 1
-    debug_command[pwd_index] = "********"
-
-    # Also mask certificate password if present
-    if "-cert-password" in debug_command:
-        cert_pwd_index = debug_command.index("-cert-password") + 1
-        debug_command[cert_pwd_index] = "********"
-
-    window.output_text.append(f"Running command: {' '.join(debug_command)}\n")
-
-    window.worker = CommandWorker(
-        command_args=command_args, proxy_enabled=window.proxy, window=window
-    )
-    window.worker.output.connect(lambda text: handle_output(window, text))
-    window.worker.finished.connect(lambda: handle_connection_finished(window))
-    window.worker.start()
+    window.engine.start(get_session_settings(window))
+
+
+def restart_connection(window):
+    """Apply new settings to a running tunnel without dropping connectivity"""
+    window.engine.restart(get_session_settings(window))
+
 
-    window.status_label.setText("状态: 正在运行")
+def update_connection_settings(window):
+    """Let later reconnects use the window's current settings"""
+    window.engine.update_settings(get_session_settings(window))
 
 
 def stop_connection(window):
-    """Stop VPN connection with proper cleanup"""
-    if window.worker:
-        window.worker.stop()
-        window.worker.wait()
-        window.worker.output.disconnect()
-        window.worker.finished.disconnect()
-        window.worker.deleteLater()
-        window.worker = None
-        gc.collect()
-
-    window.status_label.setText("状态: 未连接")
+    """Request the VPN connection to stop; cleanup runs once it has exited"""
+    window.engine.stop()
@@ -1,16 +1,25 @@
-from .config_utils import load_config, save_config
+from .config_utils import save_config
+
+
+def get_credentials(window):
+    """Get the username and password, from the panel once it has been built"""
+    if window.ui_ready:
+        return window.username_input.text(), window.password_input.text()
+    return window.username, window.password
 
 
 def save_credentials(window):
-    config = load_config()
+    # Nothing can have been edited before the panel exists
+    if not window.ui_ready:
+        return
 
     if window.remember_cb.isChecked():
-        config["username"] = window.username_input.text()
-        config["password"] = window.password_input.text()
-        config["remember"] = True
+        save_config(
+            {
+                "username": window.username_input.text(),
+                "password": window.password_input.text(),
+                "remember": True,
+            }
+        )
     else:
-        config["username"] = ""
-        config["password"] = ""
-        config["remember"] = False
-
-    save_config(config)
+        save_config({"username": "", "password": "", "remember": False})
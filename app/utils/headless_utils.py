@@ -0,0 +1,136 @@
+import argparse
+import getpass
+import os
+import signal
+import sys
+import threading
+
+from services.control_service import ControlServer, acquire_instance_lock
+from services.session_engine import (
+    DISCONNECTED,
+    LogLines,
+    SessionEngine,
+    SessionSettings,
+    StateChanged,
+)
+from .config_utils import load_config
+from .log_utils import SessionLog
+from .set_proxy import recover_system_proxy
+
+HEADLESS_FLAG = "--headless"
+USERNAME_ENV = "HITSZ_CONNECT_VERGE_USERNAME"
+PASSWORD_ENV = "HITSZ_CONNECT_VERGE_PASSWORD"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="hitsz-connect-verge --headless",
+        description="Run the VPN tunnel without a GUI, using the saved settings.",
+    )
+    parser.add_argument(HEADLESS_FLAG, action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--username", help=f"override the saved username (or set {USERNAME_ENV})"
+    )
+    parser.add_argument(
+        "--system-proxy",
+        action="store_true",
+        help="also point the desktop's system proxy at the tunnel",
+    )
+    parser.add_argument(
+        "--wait-network",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="wait up to SECONDS for the server to become reachable first",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="don't echo log lines to stdout"
+    )
+    return parser.parse_args(argv)
+
+
+def get_headless_settings(args):
+    """Build session settings from the saved config and command line"""
+    settings = SessionSettings.from_config(load_config())
+    settings.username = (
+        args.username or os.environ.get(USERNAME_ENV) or settings.username
+    )
+    settings.password = os.environ.get(PASSWORD_ENV) or settings.password
+    # Jump hosts rarely have a desktop proxy to manage
+    settings.proxy = args.system_proxy
+
+    if not settings.password and sys.stdin.isatty():
+        settings.password = getpass.getpass(f"Password for {settings.username}: ")
+    return settings
+
+
+def run_headless(argv):
+    """Run one supervised session in the foreground until stopped.
+
+    Returns 0 after a requested stop (SIGINT/SIGTERM or a ``disconnect``
+    control request) and 1 if the session ended on its own, e.g. after
+    giving up on reconnecting.
+    """
+    args = parse_args(argv)
+    instance_lock = acquire_instance_lock()
+    if instance_lock is None:
+        print(
+            "HITSZ Connect Verge is already running; use --control to manage it",
+            file=sys.stderr,
+        )
+        return 1
+    recover_system_proxy()
+
+    settings = get_headless_settings(args)
+    if not settings.username or not settings.password:
+        print(
+            f"No saved credentials; pass --username and set {PASSWORD_ENV}",
+            file=sys.stderr,
+        )
+        return 2
+
+    session_log = SessionLog()
+    engine = SessionEngine()
+    finished = threading.Event()
+    stop_requested = threading.Event()
+
+    def handle_event(event):
+        if isinstance(event, LogLines):
+            text = "".join(event.lines).rstrip("\n")
+            session_log.write(text)
+            if not args.quiet:
+                print(text, flush=True)
+        elif isinstance(event, StateChanged):
+            print(f"[{event.state}]", file=sys.stderr, flush=True)
+            if event.state == DISCONNECTED and event.previous != DISCONNECTED:
+                finished.set()
+
+    def request_stop(*args):
+        stop_requested.set()
+        engine.stop()
+
+    engine.subscribe(handle_event)
+    control_server = ControlServer(
+        engine, on_connect=lambda: engine.start(settings), on_disconnect=request_stop
+    )
+    try:
+        control_server.start()
+    except OSError as e:
+        print(f"Control socket unavailable: {e}", file=sys.stderr)
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    if args.wait_network > 0:
+        engine.connect_when_reachable(settings, args.wait_network)
+    else:
+        engine.start(settings)
+
+    # Wake up now and then so signal handlers get to run
+    while not finished.wait(0.5):
+        pass
+
+    control_server.close()
+    engine.shutdown(timeout=1)
+    session_log.close()
+    instance_lock.close()
+    return 0 if stop_requested.is_set() else 1
@@ -0,0 +1,329 @@
+import gzip
+import os
+import shutil
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from common.paths import get_log_dir
+
+FLUSH_INTERVAL_MS = 33
+MAX_BATCH_LINES = 500
+MAX_PENDING_LINES = 20000
+DEFAULT_LOG_LINES = 5000
+SESSION_LOG_MAX_BYTES = 5 * 1024 * 1024
+SESSION_LOG_MAX_AGE_DAYS = 14
+SESSION_LOG_MAX_SEGMENTS = 20
+TIMESTAMP_LENGTH = len("2000-01-01 00:00:00.000")
+
+
+class LogBatcher(QObject):
+    """Coalesce log lines from a worker thread into frame-sized UI batches.
+
+    Lines are pushed from any thread and delivered on the thread that owns
+    the batcher (normally the GUI thread) at most once per flush interval,
+    with at most ``max_batch_lines`` lines per batch. When the UI falls
+    behind, the oldest pending lines are dropped and counted.
+    """
+
+    flushed = Signal(str)
+
+    def __init__(
+        self,
+        interval_ms=FLUSH_INTERVAL_MS,
+        max_batch_lines=MAX_BATCH_LINES,
+        max_pending_lines=MAX_PENDING_LINES,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.max_batch_lines = max_batch_lines
+        self._pending = deque(maxlen=max_pending_lines)
+        self._lock = threading.Lock()
+
+        self.lines_received = 0
+        self.lines_flushed = 0
+        self.lines_dropped = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def push(self, line):
+        """Queue a single line, safe to call from any thread"""
+        self.push_many((line,))
+
+    def push_many(self, lines):
+        """Queue several lines at once, safe to call from any thread"""
+        with self._lock:
+            for line in lines:
+                if len(self._pending) == self._pending.maxlen:
+                    self.lines_dropped += 1
+                self._pending.append(line)
+                self.lines_received += 1
+
+    def flush(self, drain=False):
+        """Emit pending lines as one batch, or everything when draining"""
+        with self._lock:
+            if not self._pending:
+                return
+            count = len(self._pending)
+            if not drain:
+                count = min(count, self.max_batch_lines)
+            batch = [self._pending.popleft() for _ in range(count)]
+            self.lines_flushed += count
+
+        self.flushed.emit("".join(batch).rstrip("\n"))
+
+    def stop(self):
+        """Stop the flush timer and deliver whatever is still pending"""
+        self._timer.stop()
+        self.flush(drain=True)
+
+    def stats(self):
+        """Return pipeline counters"""
+        with self._lock:
+            return {
+                "lines_received": self.lines_received,
+                "lines_flushed": self.lines_flushed,
+                "lines_dropped": self.lines_dropped,
+                "lines_pending": len(self._pending),
+            }
+
+
+class LogBuffer:
+    """Fixed-capacity in-memory view of the most recent log lines.
+
+    The complete history is streamed to the on-disk SessionLog, so lines
+    evicted from the buffer are simply dropped from memory.
+    """
+
+    def __init__(self, capacity=DEFAULT_LOG_LINES):
+        self._lines = deque(maxlen=max(1, capacity))
+
+    @property
+    def capacity(self):
+        return self._lines.maxlen
+
+    def __len__(self):
+        return len(self._lines)
+
+    def append(self, text):
+        """Append one or more newline-separated lines"""
+        self._lines.extend(text.split("\n"))
+
+    def resize(self, capacity):
+        """Change the line limit, keeping the most recent lines"""
+        capacity = max(1, capacity)
+        if capacity != self._lines.maxlen:
+            self._lines = deque(self._lines, maxlen=capacity)
+
+    def lines(self):
+        return list(self._lines)
+
+    def text(self):
+        return "\n".join(self._lines)
+
+
+class SessionLog:
+    """Rotating on-disk log of every session with a per-segment time index.
+
+    Each line is written as ``<timestamp> <text>``. Segments rotate when
+    they exceed ``max_bytes``; rotated segments are gzip-compressed in the
+    background and removed once older than ``max_age_days`` or beyond
+    ``max_segments``. A sidecar ``.idx`` file maps each second to the byte
+    offset of its first line so a time window can be read without scanning
+    whole segments.
+    """
+
+    def __init__(
+        self,
+        log_dir=None,
+        max_bytes=SESSION_LOG_MAX_BYTES,
+        max_age_days=SESSION_LOG_MAX_AGE_DAYS,
+        max_segments=SESSION_LOG_MAX_SEGMENTS,
+    ):
+        self.log_dir = log_dir or get_log_dir()
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        self._file = None
+        self._index = None
+        self._stem = None
+        self._offset = 0
+        self._last_indexed = None
+
+    def write(self, text):
+        """Append one or more newline-separated lines with the current time"""
+        now = time.time()
+        stamp = format_timestamp(now)
+        data = "".join(f"{stamp} {line}\n" for line in text.split("\n"))
+        data = data.encode("utf-8", errors="replace")
+
+        with self._lock:
+            try:
+                if self._file is None or self._offset >= self.max_bytes:
+                    self._rotate(now)
+                second = int(now)
+                if second != self._last_indexed:
+                    self._index.write(f"{second} {self._offset}\n")
+                    self._index.flush()
+                    self._last_indexed = second
+                self._file.write(data)
+                self._file.flush()
+                self._offset += len(data)
+            except OSError:
+                pass
+
+    def iter_lines(self, start=None, end=None):
+        """Stream logged lines whose timestamp lies within [start, end]"""
+        with self._lock:
+            if self._file:
+                self._file.flush()
+            segments = self._segments()
+
+        start_key = format_timestamp(start) if start is not None else None
+        end_key = format_timestamp(end) if end is not None else None
+
+        for position, (stem, path) in enumerate(segments):
+            entries = _read_index(os.path.join(self.log_dir, stem + ".idx"))
+            if entries and end is not None and entries[0][0] > end:
+                break
+            if start is not None and position + 1 < len(segments):
+                next_entries = _read_index(
+                    os.path.join(self.log_dir, segments[position + 1][0] + ".idx")
+                )
+                if next_entries and next_entries[0][0] <= start:
+                    continue
+
+            offset = 0
+            if start is not None and entries:
+                i = bisect_right([second for second, _ in entries], int(start)) - 1
+                if i >= 0:
+                    offset = entries[i][1]
+
+            try:
+                opener = gzip.open if path.endswith(".gz") else open
+                with opener(path, "rb") as f:
+                    f.seek(offset)
+                    for raw in f:
+                        line = raw.decode("utf-8", errors="replace")
+                        key = line[:TIMESTAMP_LENGTH]
+                        if start_key and key < start_key:
+                            continue
+                        if end_key and key > end_key:
+                            return
+                        yield line
+            except OSError:
+                continue
+
+    def export(self, path, start=None, end=None):
+        """Stream a time window of the log into a file and return its line count"""
+        count = 0
+        with open(path, "w", encoding="utf-8") as out:
+            for line in self.iter_lines(start, end):
+                out.write(line)
+                count += 1
+        return count
+
+    def close(self):
+        with self._lock:
+            self._close_segment()
+
+    def _rotate(self, now):
+        self._close_segment()
+        os.makedirs(self.log_dir, exist_ok=True)
+
+        self._stem = (
+            "session-"
+            + time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+            + f"-{int(now * 1000) % 1000:03d}"
+        )
+        self._file = open(os.path.join(self.log_dir, self._stem + ".log"), "ab")
+        self._index = open(os.path.join(self.log_dir, self._stem + ".idx"), "a")
+        self._offset = self._file.tell()
+        self._last_indexed = None
+
+        threading.Thread(target=self._compact, daemon=True).start()
+
+    def _close_segment(self):
+        if self._file:
+            self._file.close()
+            self._index.close()
+            self._file = None
+            self._index = None
+
+    def _segments(self):
+        """List (stem, path) for every segment in chronological order"""
+        try:
+            names = os.listdir(self.log_dir)
+        except OSError:
+            return []
+
+        segments = {}
+        for name in names:
+            if not name.startswith("session-"):
+                continue
+            if name.endswith(".log.gz"):
+                segments[name[: -len(".log.gz")]] = name
+            elif name.endswith(".log"):
+                segments.setdefault(name[: -len(".log")], name)
+        return [
+            (stem, os.path.join(self.log_dir, segments[stem]))
+            for stem in sorted(segments)
+        ]
+
+    def _compact(self):
+        """Compress finished segments and enforce retention limits"""
+        with self._lock:
+            active = self._stem
+            segments = [seg for seg in self._segments() if seg[0] != active]
+
+        cutoff = time.time() - self.max_age_days * 86400
+        excess = len(segments) + 1 - self.max_segments
+        for position, (stem, path) in enumerate(segments):
+            try:
+                expired = os.path.getmtime(path) < cutoff
+            except OSError:
+                continue
+
+            if expired or position < excess:
+                for suffix in (".log", ".log.gz", ".idx"):
+                    try:
+                        os.remove(os.path.join(self.log_dir, stem + suffix))
+                    except OSError:
+                        pass
+            elif path.endswith(".log"):
+                try:
+                    with (
+                        open(path, "rb") as src,
+                        gzip.open(path + ".gz.tmp", "wb") as dst,
+                    ):
+                        shutil.copyfileobj(src, dst)
+                    os.replace(path + ".gz.tmp", path + ".gz")
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def format_timestamp(seconds):
+    """Format a Unix time the way SessionLog prefixes its lines"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds)) + (
+        f".{int(seconds * 1000) % 1000:03d}"
+    )
+
+
+def _read_index(path):
+    entries = []
+    try:
+        with open(path) as f:
+            for row in f:
+                second, _, offset = row.partition(" ")
+                entries.append((int(second), int(offset)))
+    except (OSError, ValueError):
+        pass
+    return entries
@@ -0,0 +1,186 @@
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+PROBE_TIMEOUT = 0.2
+PROBE_INTERVAL = 0.1
+REACHABILITY_TIMEOUT = 1.0
+REACHABILITY_INTERVAL = 0.5
+RACE_TIMEOUT = 3.0
+RACE_CACHE_TTL = 300
+RACE_MAX_WORKERS = 8
+
+_race_cache = {}
+_race_cache_lock = threading.Lock()
+
+
+def probe_port(host, port, timeout=PROBE_TIMEOUT):
+    """Check whether something accepts TCP connections on host:port"""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def wait_for_ports(endpoints, cancel_event, interval=PROBE_INTERVAL, timeout=None):
+    """Wait until every (host, port) endpoint accepts connections.
+
+    Returns True once all endpoints are reachable, or False if
+    ``cancel_event`` is set or ``timeout`` seconds elapse first.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = list(endpoints)
+
+    while not cancel_event.is_set():
+        pending = [(host, port) for host, port in pending if not probe_port(host, port)]
+        if not pending:
+            return True
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        cancel_event.wait(interval)
+
+    return False
+
+
+def is_reachable(host, port, timeout=REACHABILITY_TIMEOUT):
+    """Resolve host and check that one of its addresses accepts TCP on port"""
+    try:
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (OSError, UnicodeError):
+        return False
+
+    for family, socktype, proto, _, address in addresses:
+        try:
+            with socket.socket(family, socktype, proto) as sock:
+                sock.settimeout(timeout)
+                sock.connect(address)
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def wait_for_network(host, port, cancel_event, timeout, interval=REACHABILITY_INTERVAL):
+    """Poll until host:port is reachable, returning False on timeout or cancel"""
+    deadline = time.monotonic() + timeout
+    while not cancel_event.is_set():
+        if is_reachable(host, port):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        cancel_event.wait(interval)
+    return False
+
+
+def find_free_port(host, start, attempts=100, exclude=()):
+    """Find a port at or above ``start`` that can be bound on host"""
+    for port in range(start, min(start + attempts, 65536)):
+        if port in exclude:
+            continue
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind((host, port))
+            except OSError:
+                continue
+        return port
+    return None
+
+
+def resolve_candidates(hosts, port):
+    """Resolve every host concurrently into (host, address) pairs, one per address.
+
+    Only IPv4 addresses are returned: zju-connect joins ``-server`` and
+    ``-port`` as ``host:port``, which an unbracketed IPv6 address breaks.
+    """
+
+    def resolve(host):
+        try:
+            infos = socket.getaddrinfo(
+                host, port, family=socket.AF_INET, type=socket.SOCK_STREAM
+            )
+        except (OSError, UnicodeError):
+            return []
+        return [(host, info[4][0]) for info in infos]
+
+    candidates = {}
+    with ThreadPoolExecutor(max_workers=min(RACE_MAX_WORKERS, len(hosts))) as pool:
+        for pairs in pool.map(resolve, hosts):
+            for host, address in pairs:
+                candidates.setdefault(address, host)
+    return [(host, address) for address, host in candidates.items()]
+
+
+def handshake(host, address, port, timeout=RACE_TIMEOUT):
+    """Time a TCP connect plus TLS handshake to one candidate address"""
+    started = time.monotonic()
+    context = ssl.create_default_context()
+    # Only the handshake latency matters here; zju-connect does the real checks
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    with socket.create_connection((address, port), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=host):
+            return time.monotonic() - started
+
+
+def invalidate_race_cache():
+    """Forget cached race winners, e.g. after the chosen server dropped us"""
+    with _race_cache_lock:
+        _race_cache.clear()
+
+
+def race_servers(hosts, port, timeout=RACE_TIMEOUT, ttl=RACE_CACHE_TTL):
+    """Find the fastest-responding address among all VPN server candidates.
+
+    Every host is resolved and a TLS handshake is raced against each
+    address concurrently. The winner is returned as a dict with ``host``,
+    ``address``, ``latency`` and ``candidates`` keys, or None if nothing
+    answered or there was only one address to choose from. Winners, and
+    finding only one address, are cached for ``ttl`` seconds.
+    """
+    key = (tuple(hosts), port)
+    with _race_cache_lock:
+        cached = _race_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return dict(cached[1], cached=True) if cached[1] else None
+
+    candidates = resolve_candidates(hosts, port)
+    if len(candidates) < 2:
+        # Nothing to race; don't resolve again on every connect
+        if candidates:
+            with _race_cache_lock:
+                _race_cache[key] = (time.monotonic() + ttl, None)
+        return None
+
+    winner = None
+    pool = ThreadPoolExecutor(max_workers=min(RACE_MAX_WORKERS, len(candidates)))
+    futures = {
+        pool.submit(handshake, host, address, port, timeout): (host, address)
+        for host, address in candidates
+    }
+    try:
+        for future in as_completed(futures, timeout=timeout + 1):
+            try:
+                latency = future.result()
+            except (OSError, ssl.SSLError):
+                continue
+            host, address = futures[future]
+            winner = {
+                "host": host,
+                "address": address,
+                "latency": latency,
+                "candidates": len(candidates),
+            }
+            break
+    except TimeoutError:
+        pass
+    finally:
+        # Losers finish on their own socket timeouts in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if winner:
+        with _race_cache_lock:
+            _race_cache[key] = (time.monotonic() + ttl, winner)
+    return winner
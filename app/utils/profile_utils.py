@@ -0,0 +1,187 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+
+from common.paths import get_log_dir
+
+# Kept free of Qt imports so it can be loaded before PySide6 and time it
+PROFILE_FLAG = "--profile-startup"
+BUDGET_FLAG = "--startup-budget"
+PROFILE_ENV = "HITSZ_CONNECT_VERGE_PROFILE_STARTUP"
+BUDGET_ENV = "HITSZ_CONNECT_VERGE_STARTUP_BUDGET"
+IMPORT_REPORT_LIMIT = 20
+
+_profiler = None
+
+
+class ImportTimer(MetaPathFinder):
+    """Meta path hook that records self and cumulative time of each import"""
+
+    def __init__(self):
+        self.records = {}
+        self._stack = []
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    @contextmanager
+    def timing(self, name):
+        # [name, started, time spent in nested imports]
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            cumulative = time.perf_counter() - frame[1]
+            self.records[name] = (cumulative - frame[2], cumulative)
+            if self._stack:
+                self._stack[-1][2] += cumulative
+
+    def slowest(self, limit=IMPORT_REPORT_LIMIT):
+        """Get the (name, self, cumulative) records with the highest self time"""
+        records = [(name, *times) for name, times in self.records.items()]
+        records.sort(key=lambda record: record[1], reverse=True)
+        return records[:limit]
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` and then gets out of the way"""
+
+    def __init__(self, loader, timer):
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Restore the real loader so nothing downstream sees the proxy
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._timer.timing(module.__name__):
+            self._loader.exec_module(module)
+
+
+class StartupProfiler:
+    """Phase timestamps and import timings for one application start"""
+
+    def __init__(self, budget_ms=None):
+        self.started = time.perf_counter()
+        self.budget_ms = budget_ms
+        self.phases = []
+        self.import_timer = ImportTimer()
+        sys.meta_path.insert(0, self.import_timer)
+
+    def mark(self, phase):
+        self.phases.append((phase, time.perf_counter()))
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def stop(self):
+        if self.import_timer in sys.meta_path:
+            sys.meta_path.remove(self.import_timer)
+
+    def report(self, total_ms):
+        lines = ["Startup profile", "", f"{'Phase':<36}{'at ms':>10}{'took ms':>10}"]
+        previous = self.started
+        for phase, at in self.phases:
+            lines.append(
+                f"{phase:<36}{(at - self.started) * 1000:>10.1f}"
+                f"{(at - previous) * 1000:>10.1f}"
+            )
+            previous = at
+
+        budget = f" (budget {self.budget_ms:.0f}ms)" if self.budget_ms else ""
+        lines += ["", f"Time to first window: {total_ms:.1f}ms{budget}", ""]
+
+        lines.append(f"{'Slowest imports':<36}{'self ms':>10}{'cum ms':>10}")
+        for name, own, cumulative in self.import_timer.slowest():
+            lines.append(f"{name:<36}{own * 1000:>10.1f}{cumulative * 1000:>10.1f}")
+        return "\n".join(lines) + "\n"
+
+
+def _read_option(flag, env):
+    """Get a command line flag (``--flag`` or ``--flag=value``) or env value"""
+    for arg in sys.argv[1:]:
+        if arg == flag:
+            return ""
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return os.environ.get(env)
+
+
+def start_profiling():
+    """Start profiling if requested by flag or environment variable"""
+    global _profiler
+    budget = _read_option(BUDGET_FLAG, BUDGET_ENV)
+    if _read_option(PROFILE_FLAG, PROFILE_ENV) is None and not budget:
+        return None
+
+    try:
+        budget_ms = float(budget) if budget else None
+    except ValueError:
+        print(f"Ignoring invalid startup budget: {budget}", file=sys.stderr)
+        budget_ms = None
+    _profiler = StartupProfiler(budget_ms)
+    return _profiler
+
+
+def mark_phase(phase):
+    """Record the end of a startup phase, if profiling"""
+    if _profiler:
+        _profiler.mark(phase)
+
+
+def finish_profiling():
+    """Write the startup report and check the budget.
+
+    Returns None when not profiling, otherwise whether startup stayed
+    within the budget (always True without one).
+    """
+    global _profiler
+    profiler = _profiler
+    if not profiler:
+        return None
+    _profiler = None
+
+    total_ms = profiler.elapsed_ms()
+    profiler.stop()
+    report = profiler.report(total_ms)
+    print(report, file=sys.stderr)
+
+    try:
+        log_dir = get_log_dir()
+        os.makedirs(log_dir, exist_ok=True)
+        path = os.path.join(log_dir, time.strftime("startup-profile-%Y%m%d-%H%M%S.txt"))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"Startup profile saved to {path}", file=sys.stderr)
+    except OSError as e:
+        print(f"Failed to save startup profile: {e}", file=sys.stderr)
+
+    if profiler.budget_ms and total_ms > profiler.budget_ms:
+        print(
+            f"Startup took {total_ms:.0f}ms, over the {profiler.budget_ms:.0f}ms budget",
+            file=sys.stderr,
+        )
+        return False
+    return True
@@ -1,14 +1,61 @@
+import codecs
+import io
+import ipaddress
+import json
+import os
+import shutil
 import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from platform import system
 
-from PySide6.QtCore import QThread, Signal
+from common.paths import get_state_dir
+from .network_utils import race_servers, wait_for_ports
 
 if system() == "Windows":
     from subprocess import CREATE_NO_WINDOW
 
+READ_CHUNK_SIZE = 64 * 1024
+DEFAULT_STOP_TIMEOUT = 3
+RECENT_LINES = 50
+# Loopback, link-local and LAN ranges; 10.0.0.0/8 is campus and stays proxied
+DEFAULT_PROXY_BYPASS = (
+    "localhost, 127.0.0.0/8, ::1, 169.254.0.0/16, 172.16.0.0/12, 192.168.0.0/16, "
+    "*.local"
+)
+PROXY_SNAPSHOT_FILE = "proxy-snapshot.json"
+WINDOWS_INTERNET_SETTINGS = (
+    r"Software\Microsoft\Windows\CurrentVersion\Internet Settings"
+)
+# Registry values set_windows_proxy may change
+WINDOWS_PROXY_VALUES = ("ProxyEnable", "ProxyServer", "ProxyOverride")
+GNOME_PROXY_SCHEMA = "org.gnome.system.proxy"
+GNOME_PROXY_DCONF_DIR = "/system/proxy/"
+# (child schema, key) pairs set_linux_proxy may change; mode goes last
+GNOME_PROXY_KEYS = (
+    ("http", "host"),
+    ("http", "port"),
+    ("https", "host"),
+    ("https", "port"),
+    ("socks", "host"),
+    ("socks", "port"),
+    ("", "ignore-hosts"),
+    ("", "mode"),
+)
+MACOS_PROXY_KINDS = ("webproxy", "securewebproxy", "socksfirewallproxy")
+MACOS_PREFERENCES = "/Library/Preferences/SystemConfiguration/preferences.plist"
+# Bounded, as each networksetup write takes the SystemConfiguration lock anyway
+MACOS_PROXY_WORKERS = 4
+
+_macos_services = (None, [])
+_macos_services_lock = threading.Lock()
+_snapshot_lock = threading.Lock()
+
 
 def get_proxy_settings(window):
-    """Get proxy settings from window HTTP and SOCKS binds"""
+    """Get proxy settings from the HTTP and SOCKS binds of window or settings"""
     http_host, http_port = "127.0.0.1", None
     socks_host, socks_port = "127.0.0.1", None
 
@@ -27,73 +74,407 @@ def get_proxy_settings(window):
     return http_host, http_port, socks_host, socks_port
 
 
-class CommandWorker(QThread):
-    output = Signal(str)
-    finished = Signal()
+def get_proxy_bypass(window):
+    """Get the hosts that skip the proxy: the configured list and the VPN servers"""
+    entries = []
+    for text in (
+        getattr(window, "proxy_bypass", ""),
+        getattr(window, "server_address", ""),
+        getattr(window, "alt_servers", ""),
+    ):
+        for entry in text.replace("，", ",").split(","):
+            entry = entry.strip()
+            if entry and entry not in entries:
+                entries.append(entry)
+    return entries
+
+
+def get_windows_bypass(entries):
+    """Convert bypass entries to ProxyOverride patterns.
+
+    WinINet matches wildcards rather than CIDR ranges, so ranges are
+    widened to whole octets and expanded, e.g. ``172.16.0.0/12`` becomes
+    ``172.16.*`` through ``172.31.*``. Ranges narrower than a /24 are
+    written out address by address. IPv6 ranges have no wildcard form
+    and are skipped (see ``get_unsupported_bypass``).
+    """
+    patterns = []
+    for entry in entries:
+        try:
+            network = ipaddress.ip_network(entry, strict=False)
+        except ValueError:
+            patterns.append(entry)
+            continue
+
+        if network.num_addresses == 1:
+            patterns.append(str(network.network_address))
+            continue
+        if network.version == 6:
+            continue
+        if network.prefixlen > 24:
+            patterns.extend(str(address) for address in network)
+            continue
+        octets = network.prefixlen // 8 + (network.prefixlen % 8 > 0)
+        for subnet in network.subnets(new_prefix=octets * 8):
+            prefix = str(subnet.network_address).split(".")[:octets]
+            patterns.append(".".join(prefix + ["*"]))
+    return patterns
+
+
+def get_unsupported_bypass(entries):
+    """Get the bypass entries this platform's system proxy cannot express"""
+    if system() != "Windows":
+        return []
+    unsupported = []
+    for entry in entries:
+        try:
+            network = ipaddress.ip_network(entry, strict=False)
+        except ValueError:
+            continue
+        if network.version == 6 and network.num_addresses > 1:
+            unsupported.append(entry)
+    return unsupported
+
+
+def iter_output_lines(stream, chunk_size=READ_CHUNK_SIZE):
+    """Yield lists of decoded lines read from a binary stream in large chunks.
+
+    Bytes are decoded incrementally as UTF-8, replacing anything invalid
+    (e.g. GBK server messages) instead of raising, and line endings are
+    normalized to ``\\n``. A trailing partial line is kept until the next
+    chunk completes it or the stream ends.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    read = getattr(stream, "read1", stream.read)
+    pending = ""
+
+    while chunk := read(chunk_size):
+        text = pending + decoder.decode(chunk)
+        end = text.rfind("\n") + 1
+        pending = text[end:]
+        if end:
+            yield text[:end].splitlines(keepends=True)
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield [pending]
+
+
+class CommandWorker:
+    """Run zju-connect on a background thread and report through callbacks.
+
+    ``on_output`` receives lists of output lines, ``on_ready`` is called once
+    the tunnel accepts connections (and the proxy is applied) and
+    ``on_finished`` once the process has exited. All of them are called from
+    worker threads.
+    """
 
-    def __init__(self, command_args, proxy_enabled, window=None):
-        super().__init__()
+    def __init__(
+        self,
+        command_args,
+        proxy_enabled,
+        proxy_settings=None,
+        proxy_bypass=None,
+        stop_timeout=DEFAULT_STOP_TIMEOUT,
+        keep_proxy_on_failure=False,
+        server_candidates=None,
+        on_output=None,
+        on_ready=None,
+        on_finished=None,
+    ):
         self.command_args = command_args
         self.proxy_enabled = proxy_enabled
-        self.window = window
+        self.proxy_settings = proxy_settings or get_proxy_settings(None)
+        self.proxy_bypass = proxy_bypass or []
+        self.stop_timeout = stop_timeout
+        self.keep_proxy_on_failure = keep_proxy_on_failure
+        self.server_candidates = server_candidates or []
+        self.on_output = on_output or (lambda lines: None)
+        self.on_ready = on_ready or (lambda: None)
+        self.on_finished = on_finished or (lambda: None)
         self.process = None
-        self._proxy_handlers = {
-            "Windows": set_windows_proxy,
-            "Darwin": set_macos_proxy,
-            "Linux": set_linux_proxy,
-        }
+        self.is_ready = False
+        self.proxy_applied = False
+        self.metrics = {}
+        self.recent_lines = deque(maxlen=RECENT_LINES)
+        self._stop_lock = threading.Lock()
+        self._started_at = None
+        self._stop_requested_at = None
+        self._cancel_readiness = threading.Event()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def is_running(self):
+        return self._thread.is_alive()
 
     def run(self):
+        readiness = None
         try:
-            # Set proxy if enabled
-            if self.proxy_enabled and self.window:
-                proxy_handler = self._proxy_handlers.get(system())
-                if proxy_handler:
-                    proxy_handler(True, *get_proxy_settings(self.window))
+            self._pick_fastest_server()
 
             # Run process
             creation_flags = CREATE_NO_WINDOW if system() == "Windows" else 0
-            self.process = subprocess.Popen(
-                self.command_args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                encoding="utf-8",
-                creationflags=creation_flags,
-            )
+            with self._stop_lock:
+                if self._stop_requested_at is not None:
+                    return
+                try:
+                    self.process = subprocess.Popen(
+                        self.command_args,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        creationflags=creation_flags,
+                    )
+                except OSError as e:
+                    self.metrics["launch_error"] = str(e)
+                    self.on_output([f"Failed to start zju-connect: {e}\n"])
+                    return
+                self._started_at = time.monotonic()
+
+            # Set proxy once the tunnel is up
+            readiness = threading.Thread(target=self._wait_until_ready, daemon=True)
+            readiness.start()
 
-            for line in self.process.stdout:
-                self.output.emit(line)
-            self.process.wait()
+            for lines in iter_output_lines(self.process.stdout):
+                self.on_output(lines)
+                self.recent_lines.extend(lines)
+            self.metrics["exit_code"] = self.process.wait()
         finally:
-            # Disable proxy on completion
-            if self.proxy_enabled:
-                proxy_handler = self._proxy_handlers.get(system())
-                if proxy_handler:
-                    proxy_handler(False)
-            self.finished.emit()
+            self._cancel_readiness.set()
+            if readiness:
+                readiness.join()
+
+            # Disable proxy on completion, unless a reconnect may reuse it
+            if self.proxy_applied and (self.stopping or not self.keep_proxy_on_failure):
+                restore_system_proxy()
+                self.proxy_applied = False
+            if self._stop_requested_at is not None:
+                self.metrics["stop_duration"] = (
+                    time.monotonic() - self._stop_requested_at
+                )
+            self.on_finished()
+
+    def _pick_fastest_server(self):
+        """Point -server at whichever candidate host answered first.
+
+        The hostname is kept rather than the winning address, as
+        zju-connect needs it for TLS SNI and the HTTP Host header.
+        """
+        if len(self.server_candidates) < 2 or "-server" not in self.command_args:
+            return
+
+        server_index = self.command_args.index("-server") + 1
+        port = int(self.command_args[self.command_args.index("-port") + 1])
+        started = time.monotonic()
+        winner = race_servers(self.server_candidates, port)
+        self.metrics["race_duration"] = time.monotonic() - started
+        if not winner:
+            return
+
+        self.command_args = list(self.command_args)
+        self.command_args[server_index] = winner["host"]
+        source = "cached" if winner.get("cached") else "raced"
+        self.on_output(
+            [
+                f"Using {winner['host']} ({winner['address']}), {source} among "
+                f"{winner['candidates']} candidates, handshake {winner['latency'] * 1000:.0f}ms\n"
+            ]
+        )
+
+    def _wait_until_ready(self):
+        """Apply the system proxy once zju-connect accepts connections"""
+        proxy_settings = self.proxy_settings
+        http_host, http_port, socks_host, socks_port = proxy_settings
+        endpoints = [
+            (host, port)
+            for host, port in ((http_host, http_port), (socks_host, socks_port))
+            if port
+        ]
+        if not wait_for_ports(endpoints, self._cancel_readiness):
+            return
+
+        self.metrics["ready_latency"] = time.monotonic() - self._started_at
+        if self.proxy_enabled:
+            self.apply_proxy()
+
+        self.is_ready = True
+        self.on_ready()
+
+    def apply_proxy(self):
+        """Point the system proxy at this worker's tunnel"""
+        started = time.monotonic()
+        if apply_system_proxy(*self.proxy_settings, bypass=self.proxy_bypass):
+            self.proxy_applied = True
+            self.metrics["proxy_latency"] = time.monotonic() - started
+
+    @property
+    def stopping(self):
+        return self._stop_requested_at is not None
 
     def stop(self):
-        if self.process:
-            self.process.terminate()
-            self.process.wait()
+        """Request shutdown without blocking the calling thread.
+
+        The process is terminated, given ``stop_timeout`` seconds to exit and
+        then killed. ``on_finished`` is called once it has actually exited.
+        """
+        with self._stop_lock:
+            if self._stop_requested_at is not None:
+                return
+            self._stop_requested_at = time.monotonic()
+            process = self.process
+        self._cancel_readiness.set()
+
+        if process:
+            threading.Thread(
+                target=self._shutdown, args=(process,), daemon=True
+            ).start()
+
+    def _shutdown(self, process):
+        try:
+            process.terminate()
+            process.wait(timeout=self.stop_timeout)
+        except subprocess.TimeoutExpired:
+            self.on_output(
+                [f"zju-connect did not exit within {self.stop_timeout}s, killing it\n"]
+            )
+            self.metrics["killed"] = True
+            process.kill()
+            process.wait()
+        except OSError:
+            pass
+
+
+def set_system_proxy(enable, *proxy_settings, bypass=()):
+    """Apply or clear the system proxy with the current platform's handler.
+
+    ``bypass`` lists hosts and CIDR ranges to reach directly; it is
+    written together with the proxy, and left alone when empty.
+    Returns False when the platform has no proxy handler.
+    """
+    proxy_handler = PROXY_HANDLERS.get(system())
+    if not proxy_handler:
+        return False
+    proxy_handler(enable, *proxy_settings, bypass=bypass)
+    return True
+
+
+def get_snapshot_path():
+    return os.path.join(get_state_dir(), PROXY_SNAPSHOT_FILE)
+
+
+def read_proxy_snapshot():
+    """Get the proxy journal, or None if there is none.
+
+    The journal is written ahead of every change we make to the system
+    proxy. ``proxy`` holds the configuration from before our first change
+    and ``applied`` the proxy settings we last pointed it at.
+    """
+    try:
+        with open(get_snapshot_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_proxy_snapshot(snapshot):
+    path = get_snapshot_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename, so a crash never leaves half a snapshot behind
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+
+
+def clear_proxy_snapshot():
+    try:
+        os.unlink(get_snapshot_path())
+    except FileNotFoundError:
+        pass
+
+
+def apply_system_proxy(*proxy_settings, bypass=()):
+    """Point the system proxy at the tunnel, saving the prior configuration first.
+
+    A snapshot that is already saved is kept: it was taken before our own
+    proxy went in, whether by a reconnect or a session that crashed.
+    Returns False when the platform has no proxy handler.
+    """
+    snapshotter = PROXY_SNAPSHOTTERS.get(system())
+    with _snapshot_lock:
+        snapshot = read_proxy_snapshot()
+        if snapshotter and (not snapshot or snapshot.get("platform") != system()):
+            snapshot = None
+            try:
+                saved = snapshotter()
+                if saved is not None:
+                    snapshot = {"platform": system(), "proxy": saved}
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"Failed to save the system proxy configuration: {e}")
+
+        # Journal what is about to be applied before touching the system
+        if snapshot and snapshot.get("applied") != list(proxy_settings):
+            snapshot["applied"] = list(proxy_settings)
+            try:
+                write_proxy_snapshot(snapshot)
+            except OSError as e:
+                print(f"Failed to save the system proxy configuration: {e}")
+        return set_system_proxy(True, *proxy_settings, bypass=bypass)
+
+
+def restore_system_proxy():
+    """Put back the proxy configuration saved by ``apply_system_proxy``.
+
+    Settings someone else has changed since we applied ours are left
+    alone. Without a saved configuration the system proxy is just turned
+    off. Returns False when the platform has no proxy handler.
+    """
+    restorer = PROXY_RESTORERS.get(system())
+    with _snapshot_lock:
+        snapshot = read_proxy_snapshot()
+        if not restorer or not snapshot or snapshot.get("platform") != system():
+            return set_system_proxy(False)
+
+        restorer(snapshot["proxy"], snapshot.get("applied"))
+        clear_proxy_snapshot()
+        return True
+
+
+def recover_system_proxy():
+    """Roll back a proxy left applied by a session that never ended cleanly.
+
+    Only call this while holding the single-instance lock, as nobody else
+    can own the journal then. A clean start costs one ``stat`` and makes
+    no platform calls. Returns whether there was anything to recover.
+    """
+    if not os.path.exists(get_snapshot_path()):
+        return False
+    try:
+        restore_system_proxy()
+        print("Recovered the proxy journal of an unfinished session")
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Failed to restore the system proxy: {e}")
+    return True
 
 
 def set_windows_proxy(
-    enable, http_host=None, http_port=None, socks_host=None, socks_port=None
+    enable,
+    http_host=None,
+    http_port=None,
+    socks_host=None,
+    socks_port=None,
+    bypass=(),
 ):
     """Manage proxy settings for Windows using the Windows Registry."""
     if system() != "Windows":
         return
 
     import winreg as reg
-    import ctypes
 
     with reg.OpenKey(
-        reg.HKEY_CURRENT_USER,
-        r"Software\Microsoft\Windows\CurrentVersion\Internet Settings",
-        0,
-        reg.KEY_ALL_ACCESS,
+        reg.HKEY_CURRENT_USER, WINDOWS_INTERNET_SETTINGS, 0, reg.KEY_ALL_ACCESS
     ) as internet_settings:
         reg.SetValueEx(
             internet_settings, "ProxyEnable", 0, reg.REG_DWORD, 1 if enable else 0
@@ -106,42 +487,126 @@ def set_windows_proxy(
                 reg.REG_SZ,
                 f"{http_host}:{http_port}",
             )
+        if enable and bypass:
+            reg.SetValueEx(
+                internet_settings,
+                "ProxyOverride",
+                0,
+                reg.REG_SZ,
+                ";".join(get_windows_bypass(bypass)),
+            )
+
+    refresh_windows_proxy()
+
+
+def refresh_windows_proxy():
+    """Tell WinINet-based applications that the proxy settings changed"""
+    import ctypes
 
-    # Refresh system proxy settings
     ctypes.windll.Wininet.InternetSetOptionW(0, 37, 0, 0)
     ctypes.windll.Wininet.InternetSetOptionW(0, 39, 0, 0)
 
 
-def set_macos_proxy(
-    enable, http_host=None, http_port=None, socks_host=None, socks_port=None
-):
-    """Manage proxy settings for macOS using networksetup."""
-    if system() != "Darwin":
-        return
+def snapshot_windows_proxy():
+    """Save the registry values set_windows_proxy may change, None if unset"""
+    import winreg as reg
 
-    services = (
-        subprocess.check_output(["networksetup", "-listallnetworkservices"])
-        .decode()
-        .split("\n")[1:]
-    )
-    services = [s for s in services if s and not s.startswith("*")]
+    saved = {}
+    with reg.OpenKey(reg.HKEY_CURRENT_USER, WINDOWS_INTERNET_SETTINGS) as key:
+        for name in WINDOWS_PROXY_VALUES:
+            try:
+                value, value_type = reg.QueryValueEx(key, name)
+                saved[name] = [value, value_type]
+            except FileNotFoundError:
+                saved[name] = None
+    return saved
 
+
+def restore_windows_proxy(saved, applied=None):
+    """Write back saved registry values, deleting those that were unset"""
+    import winreg as reg
+
+    with reg.OpenKey(
+        reg.HKEY_CURRENT_USER, WINDOWS_INTERNET_SETTINGS, 0, reg.KEY_ALL_ACCESS
+    ) as key:
+        if applied:
+            http_host, http_port = applied[0], applied[1]
+            expected = {"ProxyEnable": 1}
+            if http_host and http_port:
+                expected["ProxyServer"] = f"{http_host}:{http_port}"
+            for name, value in expected.items():
+                try:
+                    current = reg.QueryValueEx(key, name)[0]
+                except FileNotFoundError:
+                    current = None
+                # Changed since we applied ours; it is not ours to restore
+                if current != value:
+                    return
+
+        for name, entry in saved.items():
+            if entry is None:
+                try:
+                    reg.DeleteValue(key, name)
+                except FileNotFoundError:
+                    pass
+            else:
+                reg.SetValueEx(key, name, 0, entry[1], entry[0])
+
+    refresh_windows_proxy()
+
+
+def list_macos_services():
+    """Get the enabled network services, cached until the network config changes.
+
+    macOS rewrites its SystemConfiguration preferences whenever a service
+    is added, removed, renamed or toggled, so their modification time is
+    a cheap way to tell when ``networksetup`` has to be asked again.
+    """
+    global _macos_services
+    try:
+        stamp = os.stat(MACOS_PREFERENCES).st_mtime_ns
+    except OSError:
+        stamp = None
+
+    with _macos_services_lock:
+        if stamp is not None and _macos_services[0] == stamp:
+            return _macos_services[1]
+
+    output = subprocess.check_output(["networksetup", "-listallnetworkservices"])
+    # The first line is a notice; disabled services are marked with "*"
+    services = [
+        s for s in output.decode().split("\n")[1:] if s and not s.startswith("*")
+    ]
+    with _macos_services_lock:
+        _macos_services = (stamp, services)
+    return services
+
+
+def plan_macos_proxy(
+    services,
+    enable,
+    http_host=None,
+    http_port=None,
+    socks_host=None,
+    socks_port=None,
+    bypass=(),
+):
+    """Get the networksetup commands for each service, to be run in order"""
+    plans = []
     for service in services:
         if enable and http_host and http_port:
-            subprocess.run(
-                ["networksetup", "-setwebproxy", service, http_host, str(http_port)]
-            )
-            subprocess.run(
+            commands = [
+                ["networksetup", "-setwebproxy", service, http_host, str(http_port)],
                 [
                     "networksetup",
                     "-setsecurewebproxy",
                     service,
                     http_host,
                     str(http_port),
-                ]
-            )
+                ],
+            ]
             if socks_host and socks_port:
-                subprocess.run(
+                commands.append(
                     [
                         "networksetup",
                         "-setsocksfirewallproxy",
@@ -150,54 +615,297 @@ def set_macos_proxy(
                         str(socks_port),
                     ]
                 )
+            if bypass:
+                commands.append(
+                    ["networksetup", "-setproxybypassdomains", service, *bypass]
+                )
         else:
-            subprocess.run(["networksetup", "-setwebproxystate", service, "off"])
-            subprocess.run(["networksetup", "-setsecurewebproxystate", service, "off"])
-            subprocess.run(
-                ["networksetup", "-setsocksfirewallproxystate", service, "off"]
+            commands = [
+                ["networksetup", "-setwebproxystate", service, "off"],
+                ["networksetup", "-setsecurewebproxystate", service, "off"],
+                ["networksetup", "-setsocksfirewallproxystate", service, "off"],
+            ]
+        plans.append(commands)
+    return plans
+
+
+def run_command_plans(plans, max_workers=MACOS_PROXY_WORKERS):
+    """Run each plan's commands in order, with the plans running concurrently"""
+
+    def run(commands):
+        for command in commands:
+            subprocess.run(command)
+
+    if len(plans) < 2:
+        for commands in plans:
+            run(commands)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(plans))) as pool:
+        # Consume the results so a failed command is raised here
+        list(pool.map(run, plans))
+
+
+def set_macos_proxy(
+    enable,
+    http_host=None,
+    http_port=None,
+    socks_host=None,
+    socks_port=None,
+    bypass=(),
+):
+    """Manage proxy settings for macOS using networksetup."""
+    if system() != "Darwin":
+        return
+
+    run_command_plans(
+        plan_macos_proxy(
+            list_macos_services(),
+            enable,
+            http_host,
+            http_port,
+            socks_host,
+            socks_port,
+            bypass,
+        )
+    )
+
+
+def read_macos_service_proxy(service):
+    """Get ``{kind: [enabled, server, port], "bypass": [...]}`` for one service"""
+    saved = {}
+    for kind in MACOS_PROXY_KINDS:
+        output = subprocess.check_output(["networksetup", f"-get{kind}", service])
+        info = dict(
+            line.split(": ", 1) for line in output.decode().splitlines() if ": " in line
+        )
+        saved[kind] = [
+            info.get("Enabled") == "Yes",
+            info.get("Server", ""),
+            info.get("Port", "0"),
+        ]
+
+    output = subprocess.check_output(
+        ["networksetup", "-getproxybypassdomains", service]
+    ).decode()
+    # An empty list is reported as a sentence rather than no lines
+    saved["bypass"] = [] if output.startswith("There aren't any") else output.split()
+    return saved
+
+
+def read_macos_proxies(services):
+    """Read the proxies of several network services concurrently"""
+    if not services:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=min(MACOS_PROXY_WORKERS, len(services))
+    ) as pool:
+        return dict(zip(services, pool.map(read_macos_service_proxy, services)))
+
+
+def snapshot_macos_proxy():
+    """Save the proxies of every enabled network service"""
+    return read_macos_proxies(list_macos_services())
+
+
+def restore_macos_proxy(saved, applied=None):
+    """Write back saved proxies as one concurrent batch of networksetup calls"""
+    if applied:
+        # Only services still pointing at our proxy are ours to restore
+        ours = [True, applied[0], str(applied[1])]
+        services = list_macos_services()
+        current = read_macos_proxies([s for s in saved if s in services])
+        saved = {
+            service: kinds
+            for service, kinds in saved.items()
+            if service in current and current[service]["webproxy"] == ours
+        }
+
+    plans = []
+    for service, kinds in saved.items():
+        commands = []
+        for kind in MACOS_PROXY_KINDS:
+            enabled, server, port = kinds[kind]
+            # Setting a server also turns the proxy on
+            if server:
+                commands.append(["networksetup", f"-set{kind}", service, server, port])
+            if not enabled:
+                commands.append(["networksetup", f"-set{kind}state", service, "off"])
+        if "bypass" in kinds:
+            commands.append(
+                ["networksetup", "-setproxybypassdomains", service]
+                + (kinds["bypass"] or ["Empty"])
             )
+        plans.append(commands)
+    run_command_plans(plans)
+
+
+def gvariant_text(value):
+    """Format an int, str or list of str in the GVariant text form gsettings uses"""
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(gvariant_text(item) for item in value) + "]"
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def read_gnome_proxy():
+    """Read every GNOME proxy key with a single gsettings call.
+
+    Returns a ``{(child, key): text}`` dict, where ``child`` is ``""`` for
+    ``org.gnome.system.proxy`` itself or e.g. ``"http"``, and ``text`` is
+    the GVariant text of the value. Returns None without GNOME's schemas.
+    """
+    try:
+        result = subprocess.run(
+            ["gsettings", "list-recursively", GNOME_PROXY_SCHEMA],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+
+    state = {}
+    for line in result.stdout.splitlines():
+        schema, _, rest = line.partition(" ")
+        key, _, value = rest.partition(" ")
+        if schema == GNOME_PROXY_SCHEMA:
+            state[("", key)] = value
+        elif schema.startswith(GNOME_PROXY_SCHEMA + "."):
+            state[(schema[len(GNOME_PROXY_SCHEMA) + 1 :], key)] = value
+    return state
+
+
+def plan_gnome_proxy(
+    enable,
+    http_host=None,
+    http_port=None,
+    socks_host=None,
+    socks_port=None,
+    bypass=(),
+):
+    """Get the GNOME proxy keys to write, as ``{(child, key): text}``"""
+    if not (enable and http_host and http_port):
+        return {("", "mode"): gvariant_text("none")}
+
+    desired = {}
+    for child in ("http", "https"):
+        desired[(child, "host")] = gvariant_text(http_host)
+        desired[(child, "port")] = gvariant_text(int(http_port))
+    if socks_host and socks_port:
+        desired[("socks", "host")] = gvariant_text(socks_host)
+        desired[("socks", "port")] = gvariant_text(int(socks_port))
+    if bypass:
+        desired[("", "ignore-hosts")] = gvariant_text(list(bypass))
+    # Last, so the unbatched fallback never points the desktop at stale hosts
+    desired[("", "mode")] = gvariant_text("manual")
+    return desired
+
+
+def write_gnome_proxy(changes):
+    """Write GNOME proxy keys, as one dconf transaction where possible"""
+    if not changes:
+        return
+
+    # dconf only holds the settings when GSettings uses its default backend
+    backend = os.environ.get("GSETTINGS_BACKEND", "dconf")
+    if backend == "dconf" and shutil.which("dconf"):
+        groups = {}
+        for (child, key), value in changes.items():
+            groups.setdefault(child or "/", []).append(f"{key}={value}\n")
+        keyfile = "".join(
+            f"[{group}]\n" + "".join(lines) for group, lines in groups.items()
+        )
+        result = subprocess.run(
+            ["dconf", "load", GNOME_PROXY_DCONF_DIR],
+            input=keyfile,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            return
+
+    for (child, key), value in changes.items():
+        schema = f"{GNOME_PROXY_SCHEMA}.{child}" if child else GNOME_PROXY_SCHEMA
+        subprocess.run(["gsettings", "set", schema, key, value])
+
+
+def snapshot_linux_proxy():
+    """Save the GNOME proxy keys set_linux_proxy may change"""
+    state = read_gnome_proxy()
+    if state is None:
+        return None
+    return {
+        f"{child}/{key}" if child else key: state[(child, key)]
+        for child, key in GNOME_PROXY_KEYS
+        if (child, key) in state
+    }
+
+
+def restore_linux_proxy(saved, applied=None):
+    """Write back saved GNOME proxy keys that have changed, in one batch"""
+    state = read_gnome_proxy()
+    if state is None:
+        return
+    # Changed since we applied ours; it is not ours to restore
+    if applied and any(
+        state.get(name) != value
+        for name, value in plan_gnome_proxy(True, *applied).items()
+    ):
+        return
+
+    changes = {}
+    for name, value in saved.items():
+        child, _, key = name.rpartition("/")
+        if state.get((child, key)) != value:
+            changes[(child, key)] = value
+    write_gnome_proxy(changes)
 
 
 def set_linux_proxy(
-    enable, http_host=None, http_port=None, socks_host=None, socks_port=None
+    enable,
+    http_host=None,
+    http_port=None,
+    socks_host=None,
+    socks_port=None,
+    bypass=(),
 ):
-    """Manage proxy settings for Linux using gsettings."""
+    """Manage proxy settings for Linux using gsettings.
+
+    The current state is read once and only keys that differ are written.
+    """
     if system() != "Linux":
         return
 
-    if enable and http_host and http_port:
-        subprocess.run(["gsettings", "set", "org.gnome.system.proxy", "mode", "manual"])
-        for protocol in ["http", "https"]:
-            subprocess.run(
-                [
-                    "gsettings",
-                    "set",
-                    f"org.gnome.system.proxy.{protocol}",
-                    "host",
-                    http_host,
-                ]
-            )
-            subprocess.run(
-                [
-                    "gsettings",
-                    "set",
-                    f"org.gnome.system.proxy.{protocol}",
-                    "port",
-                    str(http_port),
-                ]
-            )
-        if socks_host and socks_port:
-            subprocess.run(
-                ["gsettings", "set", "org.gnome.system.proxy.socks", "host", socks_host]
-            )
-            subprocess.run(
-                [
-                    "gsettings",
-                    "set",
-                    "org.gnome.system.proxy.socks",
-                    "port",
-                    str(socks_port),
-                ]
-            )
-    else:
-        subprocess.run(["gsettings", "set", "org.gnome.system.proxy", "mode", "none"])
+    state = read_gnome_proxy()
+    if state is None:
+        return
+
+    desired = plan_gnome_proxy(
+        enable, http_host, http_port, socks_host, socks_port, bypass
+    )
+    write_gnome_proxy(
+        {name: value for name, value in desired.items() if state.get(name) != value}
+    )
+
+
+PROXY_HANDLERS = {
+    "Windows": set_windows_proxy,
+    "Darwin": set_macos_proxy,
+    "Linux": set_linux_proxy,
+}
+
+PROXY_SNAPSHOTTERS = {
+    "Windows": snapshot_windows_proxy,
+    "Darwin": snapshot_macos_proxy,
+    "Linux": snapshot_linux_proxy,
+}
+
+PROXY_RESTORERS = {
+    "Windows": restore_windows_proxy,
+    "Darwin": restore_macos_proxy,
+    "Linux": restore_linux_proxy,
+}
@@ -0,0 +1,114 @@
+import random
+import time
+
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+MAX_ATTEMPTS = 10
+# Keep the system proxy pointed at the tunnel only if it comes back this fast
+HOLD_PROXY_MAX_DELAY = 10.0
+# The backoff only resets once a tunnel has stayed up this long
+STABLE_UPTIME = 60.0
+
+AUTH_FAILURE_PATTERNS = (
+    "password",
+    "login failed",
+    "auth failed",
+    "authentication failed",
+    "unauthorized",
+    "invalid username",
+    "certificate",
+    "用户名或密码",
+    "密码错误",
+)
+NETWORK_FAILURE_PATTERNS = (
+    "timeout",
+    "timed out",
+    "connection refused",
+    "connection reset",
+    "no route",
+    "unreachable",
+    "broken pipe",
+    "eof",
+    "dial tcp",
+    "handshake",
+    "no such host",
+)
+
+
+def classify_exit(lines):
+    """Classify why zju-connect exited from the tail of its output.
+
+    Returns "auth" for failures that retrying cannot fix, "network" for
+    connectivity problems, or "unknown".
+    """
+    for line in reversed(lines):
+        text = line.lower()
+        if any(pattern in text for pattern in AUTH_FAILURE_PATTERNS):
+            return "auth"
+        if any(pattern in text for pattern in NETWORK_FAILURE_PATTERNS):
+            return "network"
+    return "unknown"
+
+
+class ConnectionSupervisor:
+    """Reconnect policy and per-session metrics for one connection session"""
+
+    def __init__(
+        self,
+        base=BACKOFF_BASE,
+        cap=BACKOFF_CAP,
+        max_attempts=MAX_ATTEMPTS,
+        stable_uptime=STABLE_UPTIME,
+    ):
+        self.base = base
+        self.cap = cap
+        self.max_attempts = max_attempts
+        self.stable_uptime = stable_uptime
+        self.attempt = 0
+        self.ready_at = None
+        self.reconnects = 0
+        self.downtime = 0.0
+        self.down_since = None
+        self.started_at = time.monotonic()
+
+    def on_exit(self, reason):
+        """Record an unexpected exit and return the retry delay, or None to give up"""
+        now = time.monotonic()
+        # A tunnel that drops right after connecting keeps backing off
+        if self.ready_at is not None and now - self.ready_at >= self.stable_uptime:
+            self.attempt = 0
+        self.ready_at = None
+        if self.down_since is None:
+            self.down_since = now
+        if reason == "auth" or self.attempt >= self.max_attempts:
+            return None
+
+        delay = min(self.cap, self.base * 2**self.attempt)
+        self.attempt += 1
+        # Equal jitter: keep at least half the backoff, randomize the rest
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def on_ready(self):
+        """Record the tunnel coming (back) up and return the outage length"""
+        self.ready_at = time.monotonic()
+        if self.down_since is None:
+            return None
+
+        outage = self.ready_at - self.down_since
+        self.downtime += outage
+        self.reconnects += 1
+        self.down_since = None
+        return outage
+
+    def on_stop(self):
+        """Close any open outage when the session ends"""
+        if self.down_since is not None:
+            self.downtime += time.monotonic() - self.down_since
+            self.down_since = None
+
+    def summary(self):
+        return {
+            "reconnects": self.reconnects,
+            "downtime": self.downtime,
+            "uptime": time.monotonic() - self.started_at - self.downtime,
+        }
@@ -1,9 +1,11 @@
 import gc
 
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu, QApplication, QMainWindow
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
 from platform import system
 from common import resources
+from .config_utils import get_config_store
 
 
 def create_tray_menu(window: QMainWindow, tray_icon):
@@ -12,15 +14,8 @@ def create_tray_menu(window: QMainWindow, tray_icon):
     show_action = menu.addAction("打开面板")
     show_action.triggered.connect(window.show)
     show_action.triggered.connect(window.raise_)
-    connect_action = QAction("系统代理", menu)
-    connect_action.setCheckable(True)
-    connect_action.triggered.connect(
-        lambda checked: window.connect_button.setChecked(checked)
-    )
-    window.connect_button.toggled.connect(
-        connect_action.setChecked
-    )  # Sync connect_action item with connect_button state
-    menu.addAction(connect_action)
+    # Shared with the connect button, so the two always agree
+    menu.addAction(window.connect_action)
     quit_action = menu.addAction("退出")
     quit_action.triggered.connect(window.quit_app)
 
@@ -45,8 +40,33 @@ def handle_close_event(window, event, tray_icon):
 
 
 def quit_app(window, tray_icon):
-    """Quit the application"""
+    """Quit the application once the connection has shut down"""
+    if window.engine.active:
+        if not window.quit_pending:
+            window.quit_pending = True
+            window.hide()
+            window.stop_connection()
+            # Don't outlive a worker that never reports back
+            QTimer.singleShot(
+                int((window.stop_timeout + 2) * 1000),
+                lambda: finish_quit(window, tray_icon),
+            )
+        return
+
     window.stop_connection()
+    finish_quit(window, tray_icon)
+
+
+def finish_quit(window, tray_icon):
+    """Release resources and leave the event loop"""
+    if window.quit_finished:
+        return
+    window.quit_finished = True
+    window.control_server.close()
+    window.session.close()
+    window.engine.shutdown(timeout=1)
+    window.session_log.close()
+    get_config_store().flush()
     window.deleteLater()
     tray_icon.deleteLater()
     gc.collect()
@@ -11,10 +11,11 @@ from PySide6.QtWidgets import (
     QWidget,
     QFileDialog,
     QStyle,
+    QSpinBox,
 )
 from PySide6.QtGui import QIcon, QAction
-from utils.config_utils import save_config, load_config
-from utils.startup_utils import set_launch_at_login, get_launch_at_login
+from utils.config_utils import get_config_store, save_config
+from utils.startup_utils import set_launch_at_login
 from platform import system
 
 if system() == "Darwin":
@@ -53,6 +54,17 @@ class AdvancedSettingsDialog(QDialog):
         server_layout.addWidget(self.port_input)
         network_layout.addLayout(server_layout)
 
+        # Alternate servers
+        alt_servers_layout = QHBoxLayout()
+        alt_servers_layout.addWidget(QLabel("备用服务端地址"))
+        self.alt_servers_input = QLineEdit()
+        self.alt_servers_input.setPlaceholderText("多个地址用逗号分隔")
+        self.alt_servers_input.setToolTip(
+            "连接前将同时探测所有服务端地址，选择响应最快的一个"
+        )
+        alt_servers_layout.addWidget(self.alt_servers_input)
+        network_layout.addLayout(alt_servers_layout)
+
         # DNS settings
         dns_layout = QHBoxLayout()
         dns_layout.addWidget(QLabel("DNS 服务器地址"))
@@ -87,6 +99,19 @@ class AdvancedSettingsDialog(QDialog):
         self.proxy_switch.setToolTip("自动配置系统代理设置，将网络流量通过 VPN 转发")
         network_layout.addWidget(self.proxy_switch)
 
+        # Proxy bypass
+        proxy_bypass_layout = QHBoxLayout()
+        proxy_bypass_layout.addWidget(QLabel("不使用代理的地址"))
+        self.proxy_bypass_input = QLineEdit()
+        self.proxy_bypass_input.setPlaceholderText("多个地址用逗号分隔")
+        self.proxy_bypass_input.setToolTip(
+            "访问这些域名或网段时直接连接，支持 *.local 和 192.168.0.0/16 等写法；"
+            "VPN 服务端地址会自动加入。Windows 系统代理不支持 IPv6 网段，"
+            "只能填写单个 IPv6 地址"
+        )
+        proxy_bypass_layout.addWidget(self.proxy_bypass_input)
+        network_layout.addLayout(proxy_bypass_layout)
+
         # Disable keep-alive
         self.keep_alive_switch = QCheckBox("定时保活")
         self.keep_alive_switch.setToolTip(
@@ -108,6 +133,20 @@ class AdvancedSettingsDialog(QDialog):
         )
         network_layout.addWidget(self.disable_multi_line_switch)
 
+        # Auto reconnect
+        self.auto_reconnect_switch = QCheckBox("断线自动重连")
+        self.auto_reconnect_switch.setToolTip(
+            "开启后，连接意外断开时将自动重连（认证失败除外）"
+        )
+        network_layout.addWidget(self.auto_reconnect_switch)
+
+        # Seamless restart
+        self.seamless_restart_switch = QCheckBox("无缝应用设置")
+        self.seamless_restart_switch.setToolTip(
+            "开启后，连接中修改设置会先在备用端口启动新连接，就绪后再关闭旧连接"
+        )
+        network_layout.addWidget(self.seamless_restart_switch)
+
         # Certificate file selection
         cert_layout = QHBoxLayout()
         cert_label = QLabel("证书路径")
@@ -151,7 +190,10 @@ class AdvancedSettingsDialog(QDialog):
 
         # Startup Control
         self.startup_switch = QCheckBox("开机启动")
-        self.startup_switch.setChecked(get_launch_at_login())
+        # Cached state, kept current by the background login item check
+        config_store = get_config_store()
+        self.startup_switch.setChecked(config_store.get("launch_at_login"))
+        config_store.changed.connect(self.handle_config_changed)
         general_layout.addWidget(self.startup_switch)
 
         # Silent mode
@@ -171,6 +213,18 @@ class AdvancedSettingsDialog(QDialog):
             self.hide_dock_icon_switch = QCheckBox("隐藏 Dock 图标")
             general_layout.addWidget(self.hide_dock_icon_switch)
 
+        # Log line limit
+        log_lines_layout = QHBoxLayout()
+        log_lines_layout.addWidget(QLabel("日志保留行数"))
+        log_lines_layout.addStretch()
+        self.log_lines_input = QSpinBox()
+        self.log_lines_input.setRange(100, 1000000)
+        self.log_lines_input.setSingleStep(1000)
+        self.log_lines_input.setValue(5000)
+        self.log_lines_input.setToolTip("超出的旧日志将写入磁盘，不再占用内存")
+        log_lines_layout.addWidget(self.log_lines_input)
+        general_layout.addLayout(log_lines_layout)
+
         general_tab.setLayout(general_layout)
 
         # Add tabs to widget
@@ -215,9 +269,11 @@ class AdvancedSettingsDialog(QDialog):
         settings = {
             "server": self.server_input.text(),
             "port": self.port_input.text(),
+            "alt_servers": self.alt_servers_input.text(),
             "dns": self.dns_input.text(),
             "auto_dns": self.auto_dns_switch.isChecked(),
             "proxy": self.proxy_switch.isChecked(),
+            "proxy_bypass": self.proxy_bypass_input.text(),
             "connect_startup": self.connect_startup_switch.isChecked(),
             "silent_mode": self.silent_mode_switch.isChecked(),
             "check_update": self.check_update_switch.isChecked(),
@@ -228,6 +284,9 @@ class AdvancedSettingsDialog(QDialog):
             "socks_bind": self.socks_bind_input.text(),
             "cert_file": self.cert_file_input.text(),
             "cert_password": self.cert_password_input.text(),
+            "log_lines": self.log_lines_input.value(),
+            "auto_reconnect": self.auto_reconnect_switch.isChecked(),
+            "seamless_restart": self.seamless_restart_switch.isChecked(),
         }
 
         if system() == "Darwin":
@@ -253,6 +312,11 @@ class AdvancedSettingsDialog(QDialog):
         auto_dns=True,
         cert_file="",
         cert_password="",
+        log_lines=5000,
+        auto_reconnect=True,
+        seamless_restart=True,
+        alt_servers="",
+        proxy_bypass="",
     ):
         """Set dialog values from main window values"""
         self.server_input.setText(server)
@@ -272,21 +336,31 @@ class AdvancedSettingsDialog(QDialog):
         self.socks_bind_input.setText(socks_bind)
         self.cert_file_input.setText(cert_file)
         self.cert_password_input.setText(cert_password)
+        self.log_lines_input.setValue(log_lines)
+        self.auto_reconnect_switch.setChecked(auto_reconnect)
+        self.seamless_restart_switch.setChecked(seamless_restart)
+        self.alt_servers_input.setText(alt_servers)
+        self.proxy_bypass_input.setText(proxy_bypass)
 
         # Enable/disable DNS input based on auto DNS setting
         self.toggle_dns_input()
 
-    def accept(self):
-        """Save settings before closing"""
-        current_config = load_config()
-        settings = self.get_settings()
+    def handle_config_changed(self, key, value):
+        if key == "launch_at_login":
+            self.startup_switch.setChecked(value)
 
-        settings["username"] = current_config.get("username", "")
-        settings["password"] = current_config.get("password", "")
-        settings["remember"] = current_config.get("remember", False)
+    def done(self, result):
+        """Stop following config changes once the dialog closes"""
+        get_config_store().changed.disconnect(self.handle_config_changed)
+        super().done(result)
 
-        save_config(settings)
-        set_launch_at_login(enable=self.startup_switch.isChecked())
+    def accept(self):
+        """Save settings before closing"""
+        save_config(self.get_settings())
+        launch_at_login = self.startup_switch.isChecked()
+        if launch_at_login != get_config_store().get("launch_at_login"):
+            set_launch_at_login(enable=launch_at_login)
+            save_config({"launch_at_login": launch_at_login})
 
         if system() == "Darwin":
             hide_dock_icon(self.hide_dock_icon_switch.isChecked())
@@ -1,21 +1,30 @@
+import time
+
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QMainWindow,
     QLabel,
     QLineEdit,
     QCheckBox,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QVBoxLayout,
     QHBoxLayout,
     QWidget,
 )
-from PySide6.QtCore import QTimer
 from utils.tray_utils import handle_close_event, quit_app, init_tray_icon
 from utils.credential_utils import save_credentials
-from utils.connection_utils import start_connection, stop_connection
+from utils.connection_utils import (
+    auto_connect,
+    init_session,
+    start_connection,
+    stop_connection,
+    restart_connection,
+)
 from utils.password_utils import toggle_password_visibility
-from views.menu_utils import setup_menubar, check_for_updates
-from utils.config_utils import load_settings
+from utils.config_utils import load_settings, refresh_launch_at_login
+from utils.log_utils import LogBuffer, SessionLog
+from utils.profile_utils import mark_phase
 from common.version import get_version
 
 VERSION = get_version()
@@ -27,18 +36,59 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("HITSZ Connect Verge")
         self.setMinimumSize(300, 450)
 
-        self.worker = None
+        self.started_at = time.monotonic()
+        self.quit_pending = False
+        self.quit_finished = False
+        self.ui_ready = False
+        self.status_text = "状态: 未连接"
         self.version = VERSION
         self.load_settings()
-        setup_menubar(self, self.version)
-        self.setup_ui()
+        mark_phase("load settings")
+        # Lines logged before the panel is first opened wait here
+        self.log_buffer = LogBuffer(self.log_lines)
+        self.session_log = SessionLog()
+        mark_phase("open session log")
+
+        # Connection on/off state, shared by the connect button and the tray
+        self.connect_action = QAction("系统代理", self)
+        self.connect_action.setCheckable(True)
+        self.connect_action.toggled.connect(
+            lambda checked: self.start_connection()
+            if checked
+            else self.stop_connection()
+        )
+        self.connect_action.toggled.connect(self.save_credentials)
+        init_session(self)
+
         self.tray_icon = init_tray_icon(self)
+        mark_phase("create tray icon")
 
         if self.connect_startup:
-            QTimer.singleShot(5000, lambda: self.connect_button.setChecked(True))
+            auto_connect(self)
+
+        refresh_launch_at_login()
 
         if self.check_update:
             self.check_updates_startup()
+        mark_phase("start background tasks")
+
+    def setVisible(self, visible):
+        # Widgets are built on first show, so a tray-only start never pays for them
+        if visible:
+            self.build_ui()
+        super().setVisible(visible)
+
+    def build_ui(self):
+        """Build the menu bar and panel widgets, once"""
+        if self.ui_ready:
+            return
+        from views.menu_utils import setup_menubar
+
+        setup_menubar(self, self.version)
+        mark_phase("set up menu bar")
+        self.setup_ui()
+        self.ui_ready = True
+        mark_phase("set up UI")
 
     def setup_ui(self):
         # Layouts
@@ -72,28 +122,27 @@ class MainWindow(QMainWindow):
         status_layout.addWidget(QLabel("运行信息"))
         layout.addLayout(status_layout)
         status_layout.addStretch()
-        self.status_label = QLabel("状态: 未连接")
+        self.status_label = QLabel(self.status_text)
         status_layout.addWidget(self.status_label)
 
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.setMaximumBlockCount(self.log_lines)
+        self.output_text.setPlainText(self.log_buffer.text())
         layout.addWidget(self.output_text)
 
         # Buttons
         button_layout = QHBoxLayout()
         self.connect_button = QPushButton("连接")
         self.connect_button.setCheckable(True)
-        self.connect_button.toggled.connect(
-            lambda: self.start_connection()
-            if self.connect_button.isChecked()
-            else self.stop_connection()
-        )
         self.connect_button.toggled.connect(
             lambda: self.connect_button.setText("断开")
             if self.connect_button.isChecked()
             else self.connect_button.setText("连接")
         )
-        self.connect_button.toggled.connect(self.save_credentials)
+        self.connect_button.toggled.connect(self.connect_action.setChecked)
+        self.connect_action.toggled.connect(self.connect_button.setChecked)
+        self.connect_button.setChecked(self.connect_action.isChecked())
         button_layout.addWidget(self.connect_button)
 
         button_layout.addStretch()
@@ -115,6 +164,12 @@ class MainWindow(QMainWindow):
     def quit_app(self):
         quit_app(self, self.tray_icon)
 
+    def bring_to_front(self):
+        """Show the window on top, e.g. when the app is launched again"""
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
     def save_credentials(self):
         save_credentials(self)
 
@@ -124,8 +179,13 @@ class MainWindow(QMainWindow):
     def stop_connection(self):
         stop_connection(self)
 
+    def restart_connection(self):
+        restart_connection(self)
+
     def load_settings(self):
         load_settings(self)
 
     def check_updates_startup(self):
+        from views.menu_utils import check_for_updates
+
         check_for_updates(self, self.version, startup=True)
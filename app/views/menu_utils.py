@@ -1,15 +1,32 @@
-import webbrowser
-
-from PySide6.QtWidgets import QMessageBox, QMainWindow, QMenuBar
-from PySide6.QtGui import QGuiApplication, QKeySequence
+import time
+
+from PySide6.QtWidgets import (
+    QMessageBox,
+    QMainWindow,
+    QMenuBar,
+    QInputDialog,
+    QFileDialog,
+)
+from PySide6.QtGui import QKeySequence
 from .advanced_panel import AdvancedSettingsDialog
 from platform import system
-from services.update_service import UpdateService
+from utils.connection_utils import handle_output, update_connection_settings
 
 if system() == "Darwin":
     from utils.macos_utils import hide_dock_icon
 
-update_service = UpdateService()
+# Created on the first update check so requests/packaging stay out of startup
+update_service = None
+
+
+def get_update_service():
+    """Get the update service, importing the update stack on first use"""
+    global update_service
+    if update_service is None:
+        from services.update_service import UpdateService
+
+        update_service = UpdateService()
+    return update_service
 
 
 def setup_menubar(window: QMainWindow, version):
@@ -29,9 +46,7 @@ def setup_menubar(window: QMainWindow, version):
 
     # Help Menu
     about_menu = menubar.addMenu("帮助")
-    about_menu.addAction("复制日志").triggered.connect(
-        lambda: copy_log(window)
-    )  # Changed text and function
+    about_menu.addAction("导出日志").triggered.connect(lambda: export_log(window))
     about_menu.addAction("检查更新").triggered.connect(
         lambda: check_for_updates(window, version)
     )
@@ -47,10 +62,36 @@ def show_about(window, version):
     QMessageBox.about(window, "关于 HITSZ Connect Verge", about_text)
 
 
-def copy_log(window):
-    """Copy log text to clipboard directly"""
-    QGuiApplication.clipboard().setText(window.output_text.toPlainText())
-    QMessageBox.information(window, "复制日志", "日志已复制到剪贴板")
+LOG_EXPORT_WINDOWS = {
+    "最近 10 分钟": 10 * 60,
+    "最近 1 小时": 60 * 60,
+    "最近 24 小时": 24 * 60 * 60,
+    "全部": None,
+}
+
+
+def export_log(window):
+    """Stream a chosen time window of the session log to a file"""
+    choice, ok = QInputDialog.getItem(
+        window, "导出日志", "时间范围", list(LOG_EXPORT_WINDOWS), 0, False
+    )
+    if not ok:
+        return
+
+    path, _ = QFileDialog.getSaveFileName(
+        window, "导出日志", "hitsz-connect-verge.log", "Log files (*.log *.txt)"
+    )
+    if not path:
+        return
+
+    span = LOG_EXPORT_WINDOWS[choice]
+    start = time.time() - span if span else None
+    try:
+        count = window.session_log.export(path, start=start)
+    except OSError as e:
+        QMessageBox.critical(window, "导出日志", f"导出日志失败：{e}")
+        return
+    QMessageBox.information(window, "导出日志", f"已导出 {count} 行日志")
 
 
 def check_for_updates(parent, current_version, startup=False):
@@ -62,7 +103,7 @@ def check_for_updates(parent, current_version, startup=False):
         current_version: Current version string
         startup: Whether this check is happening at startup
     """
-    signals = update_service.check_for_updates(current_version)
+    signals = get_update_service().check_for_updates(current_version)
 
     def on_update_available(latest_version):
         if not startup:
@@ -70,24 +111,27 @@ def check_for_updates(parent, current_version, startup=False):
                 parent, "检查更新", f"发现新版本 {latest_version}，是否前往下载？"
             )
             if reply == QMessageBox.Yes:
+                import webbrowser
+
                 webbrowser.open(
                     "https://github.com/kowyo/hitsz-connect-verge/releases/latest"
                 )
         else:
-            parent.output_text.append(f"New version {latest_version} is available.\n")
+            handle_output(parent, f"New version {latest_version} is available.")
 
     def on_up_to_date():
         if not startup:
             QMessageBox.information(parent, "检查更新", "当前已是最新版本")
         else:
-            parent.output_text.append("App is up to date.\n")
+            handle_output(parent, "App is up to date.")
 
     def on_error(error_msg):
         if not startup:
             QMessageBox.critical(parent, "检查更新", "检查更新失败，请检查网络连接")
         else:
-            parent.output_text.append(
-                "Failed to check for updates. Please check your network connection.\n"
+            handle_output(
+                parent,
+                "Failed to check for updates. Please check your network connection.",
             )
 
     # Connect the signals
@@ -96,6 +140,23 @@ def check_for_updates(parent, current_version, startup=False):
     signals.error.connect(on_error)
 
 
+# Window attributes that only take effect when zju-connect is restarted
+TUNNEL_SETTINGS = (
+    "server_address",
+    "alt_servers",
+    "port",
+    "dns_server",
+    "auto_dns",
+    "keep_alive",
+    "debug_dump",
+    "disable_multi_line",
+    "http_bind",
+    "socks_bind",
+    "cert_file",
+    "cert_password",
+)
+
+
 def show_advanced_settings(window):
     """Show advanced settings dialog with proper cleanup"""
     dialog = AdvancedSettingsDialog(window)
@@ -116,15 +177,25 @@ def show_advanced_settings(window):
         window.auto_dns,
         window.cert_file,
         window.cert_password,
+        window.log_lines,
+        window.auto_reconnect,
+        window.seamless_restart,
+        window.alt_servers,
+        window.proxy_bypass,
     )
 
-    if dialog.exec():
-        settings = dialog.get_settings()
+    accepted = dialog.exec()
+    settings = dialog.get_settings()
+    dialog.deleteLater()
+    if accepted:
+        tunnel_settings = [getattr(window, key) for key in TUNNEL_SETTINGS]
         window.server_address = settings["server"]
         window.port = settings["port"]
+        window.alt_servers = settings["alt_servers"]
         window.dns_server = settings["dns"]
         window.auto_dns = settings["auto_dns"]
         window.proxy = settings["proxy"]
+        window.proxy_bypass = settings["proxy_bypass"]
         window.connect_startup = settings["connect_startup"]
         window.silent_mode = settings["silent_mode"]
         window.check_update = settings["check_update"]
@@ -136,5 +207,18 @@ def show_advanced_settings(window):
         window.socks_bind = settings["socks_bind"]
         window.cert_file = settings["cert_file"]
         window.cert_password = settings["cert_password"]
+        window.log_lines = settings["log_lines"]
+        window.log_buffer.resize(window.log_lines)
+        window.output_text.setMaximumBlockCount(window.log_lines)
+        window.auto_reconnect = settings["auto_reconnect"]
+        window.seamless_restart = settings["seamless_restart"]
         if system() == "Darwin":
             hide_dock_icon(window.hide_dock_icon)
+
+        tunnel_changed = tunnel_settings != [
+            getattr(window, key) for key in TUNNEL_SETTINGS
+        ]
+        if tunnel_changed and window.seamless_restart:
+            window.restart_connection()
+        else:
+            update_connection_settings(window)
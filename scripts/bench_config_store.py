@@ -0,0 +1,62 @@
+"""Time load_config/save_config through the shared ConfigStore.
+
+"cold read" builds a fresh ConfigStore, i.e. one full QSettings read,
+which is what every load_config() call cost before the store existed.
+On Linux settings go to a temp XDG_CONFIG_HOME; elsewhere the toggled
+key is flipped an even number of times so it ends where it started.
+
+Usage: python scripts/bench_config_store.py [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+
+def timed(function, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    iterations += iterations % 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CONFIG_HOME"] = tmp
+
+        from PySide6.QtCore import QCoreApplication
+        from utils.config_utils import (
+            ConfigStore,
+            get_config_store,
+            load_config,
+            save_config,
+        )
+
+        _app = QCoreApplication([])
+        store = get_config_store()
+
+        def toggle():
+            config = load_config()
+            config["remember"] = not config["remember"]
+            save_config(config)
+
+        results = (
+            ("cold read", timed(ConfigStore, iterations)),
+            ("load_config", timed(load_config, iterations)),
+            ("load + toggle + save", timed(toggle, iterations)),
+            ("toggle + flush", timed(lambda: (toggle(), store.flush()), iterations)),
+        )
+        for name, micros in results:
+            print(f"{name:<22}{micros:>8.0f}us")
+        store.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Count gsettings/dconf spawns and time set_linux_proxy against fake binaries.
+
+The fakes record every call and sleep 10 ms each, roughly what a real
+gsettings process costs, and keep the proxy keys in a text file.
+
+Usage: python scripts/bench_gnome_proxy.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from utils import set_proxy
+
+FAKE_GSETTINGS = """#!/bin/sh
+echo "gsettings $*" >> "$FAKE_LOG"; sleep 0.01
+case "$1" in
+list-recursively) cat "$FAKE_STATE";;
+set) grep -v "^$2 $3 " "$FAKE_STATE" > "$FAKE_STATE.tmp"
+     echo "$2 $3 $4" >> "$FAKE_STATE.tmp"; mv "$FAKE_STATE.tmp" "$FAKE_STATE";;
+esac
+"""
+
+FAKE_DCONF = """#!/bin/sh
+echo "dconf $*" >> "$FAKE_LOG"; sleep 0.01
+awk -v state="$FAKE_STATE" '
+BEGIN {
+    while ((getline l < state) > 0) {
+        split(l, p, " "); k = p[1] " " p[2]
+        v[k] = substr(l, length(k) + 2); order[++n] = k
+    }
+}
+/^\\[/ {
+    g = substr($0, 2, length($0) - 2)
+    schema = (g == "/") ? "org.gnome.system.proxy" : "org.gnome.system.proxy." g
+    next
+}
+/=/ {
+    i = index($0, "="); k = schema " " substr($0, 1, i - 1)
+    if (!(k in v)) order[++n] = k
+    v[k] = substr($0, i + 1)
+}
+END { for (i = 1; i <= n; i++) print order[i], v[order[i]] > state }'
+"""
+
+INITIAL_STATE = """\
+org.gnome.system.proxy autoconfig-url ''
+org.gnome.system.proxy ignore-hosts ['localhost', '127.0.0.0/8', '::1']
+org.gnome.system.proxy mode 'none'
+org.gnome.system.proxy use-same-proxy true
+org.gnome.system.proxy.ftp host ''
+org.gnome.system.proxy.ftp port 0
+org.gnome.system.proxy.http host ''
+org.gnome.system.proxy.http port 8080
+org.gnome.system.proxy.https host ''
+org.gnome.system.proxy.https port 0
+org.gnome.system.proxy.socks host ''
+org.gnome.system.proxy.socks port 0
+"""
+
+PROXY = ("127.0.0.1", 1081, "127.0.0.1", 1080)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for name, script in (("gsettings", FAKE_GSETTINGS), ("dconf", FAKE_DCONF)):
+            (tmp / name).write_text(script)
+            (tmp / name).chmod(0o755)
+        log, state = tmp / "log", tmp / "state"
+        state.write_text(INITIAL_STATE)
+        os.environ.update(
+            PATH=f"{tmp}{os.pathsep}{os.environ['PATH']}",
+            FAKE_LOG=str(log),
+            FAKE_STATE=str(state),
+        )
+
+        def step(name, *args, **kwargs):
+            log.write_text("")
+            started = time.perf_counter()
+            set_proxy.set_linux_proxy(*args, **kwargs)
+            elapsed = (time.perf_counter() - started) * 1000
+            spawns = len(log.read_text().splitlines())
+            print(f"{name:<22}{spawns:>3} spawns {elapsed:>7.1f}ms")
+
+        with mock.patch.object(set_proxy, "system", return_value="Linux"):
+            step("enable", True, *PROXY)
+            step("enable again", True, *PROXY)
+            step("disable", False)
+            step("disable again", False)
+            step("re-enable", True, *PROXY, bypass=["*.local"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Count networksetup spawns, wall time and concurrency of the macOS proxy code.
+
+Runs on Linux: a fake ``networksetup`` on PATH logs each call's start and
+end time and sleeps 50 ms, roughly what the real tool costs, and
+``system`` is patched to report Darwin. The fake lists two services.
+
+Usage: python scripts/bench_macos_proxy.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from utils import set_proxy
+
+FAKE_NETWORKSETUP = """#!{python}
+import os, sys, time
+
+started = time.time()
+time.sleep(0.05)
+command = sys.argv[1] if len(sys.argv) > 1 else ""
+if command == "-listallnetworkservices":
+    print("An asterisk (*) denotes that a network service is disabled.")
+    print("Wi-Fi\\nUSB LAN\\n*Thunderbolt Bridge")
+elif command in ("-getwebproxy", "-getsecurewebproxy", "-getsocksfirewallproxy"):
+    print("Enabled: No\\nServer: corp\\nPort: 8080\\nAuthenticated Proxy Enabled: 0")
+elif command == "-getproxybypassdomains":
+    if sys.argv[2] == "Wi-Fi":
+        print("*.local\\n169.254/16")
+    else:
+        print(f"There aren't any bypass domains set on {{sys.argv[2]}}.")
+with open(os.environ["FAKE_LOG"], "a") as log:
+    log.write(f"{{started}} {{time.time()}} {{' '.join(sys.argv[1:])}}\\n")
+"""
+
+PROXY = ("127.0.0.1", 1081, "127.0.0.1", 1080)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        fake = tmp / "networksetup"
+        fake.write_text(FAKE_NETWORKSETUP.format(python=sys.executable))
+        fake.chmod(0o755)
+        log, preferences = tmp / "log", tmp / "preferences.plist"
+        preferences.write_text("")
+        os.environ.update(
+            PATH=f"{tmp}{os.pathsep}{os.environ['PATH']}", FAKE_LOG=str(log)
+        )
+
+        def step(name, function, *args, **kwargs):
+            log.write_text("")
+            started = time.perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = (time.perf_counter() - started) * 1000
+            calls = [line.split(" ", 2) for line in log.read_text().splitlines()]
+            spans = [(float(start), float(end)) for start, end, _ in calls]
+            # Most calls running at once, checked at each call's start
+            peak = max(
+                (sum(s <= start < e for s, e in spans) for start, _ in spans),
+                default=0,
+            )
+            print(
+                f"{name:<24}{len(calls):>3} spawns {elapsed:>7.0f}ms"
+                f"  peak concurrency {peak}"
+            )
+            return result
+
+        with (
+            mock.patch.object(set_proxy, "system", return_value="Darwin"),
+            mock.patch.object(set_proxy, "MACOS_PREFERENCES", str(preferences)),
+        ):
+            saved = step("snapshot", set_proxy.snapshot_macos_proxy)
+            step("enable", set_proxy.set_macos_proxy, True, *PROXY, bypass=["*.local"])
+            step("disable", set_proxy.set_macos_proxy, False)
+            step("enable (cached)", set_proxy.set_macos_proxy, True, *PROXY)
+            os.utime(preferences, ns=(0, time.time_ns() + 10**9))
+            step("enable (prefs changed)", set_proxy.set_macos_proxy, True, *PROXY)
+            step("restore", set_proxy.restore_macos_proxy, saved)
+
+
+if __name__ == "__main__":
+    main()
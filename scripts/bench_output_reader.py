@@ -0,0 +1,72 @@
+"""Compare lines/sec of iter_output_lines with a text-mode line loop.
+
+Both readers consume the same generated zju-connect-like log piped
+through a child process and hand it to a LogBatcher: the old loop pushed
+one line at a time, CommandWorker now delivers each chunk's lines at once.
+
+Usage: python scripts/bench_output_reader.py [line count]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6.QtCore import QCoreApplication
+from utils.log_utils import LogBatcher
+from utils.set_proxy import iter_output_lines
+
+LINE = "2024/01/01 12:00:00 [INFO] TCP 127.0.0.1:51234 -> 10.248.98.30:443 ok\n"
+
+
+COPY_SCRIPT = (
+    "import shutil, sys; shutil.copyfileobj(open(sys.argv[1], 'rb'), sys.stdout.buffer)"
+)
+
+
+def spawn(path, **kwargs):
+    command = [sys.executable, "-c", COPY_SCRIPT, str(path)]
+    return subprocess.Popen(command, stdout=subprocess.PIPE, **kwargs)
+
+
+def read_text_mode(path, batcher):
+    process = spawn(path, universal_newlines=True, encoding="utf-8")
+    for line in process.stdout:
+        batcher.push(line)
+    process.wait()
+
+
+def read_chunks(path, batcher):
+    process = spawn(path)
+    for lines in iter_output_lines(process.stdout):
+        batcher.push_many(lines)
+    process.wait()
+
+
+def main():
+    _app = QCoreApplication([])
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    with tempfile.NamedTemporaryFile("w", suffix=".log", delete=False) as file:
+        file.write(LINE * count)
+    path = Path(file.name)
+
+    try:
+        for name, reader in (
+            ("text-mode for-line loop", read_text_mode),
+            ("iter_output_lines", read_chunks),
+        ):
+            batcher = LogBatcher()
+            started = time.perf_counter()
+            reader(path, batcher)
+            elapsed = time.perf_counter() - started
+            assert batcher.lines_received == count, (name, batcher.lines_received)
+            print(f"{name:<26}{count / elapsed / 1e6:>6.2f}M lines/s")
+    finally:
+        path.unlink()
+
+
+if __name__ == "__main__":
+    main()
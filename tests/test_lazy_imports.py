@@ -0,0 +1,65 @@
+"""Startup must not load the update checker stack when update checks are off"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+UPDATE_STACK = (
+    "services.update_service",
+    "requests",
+    "urllib3",
+    "charset_normalizer",
+    "packaging",
+    "webbrowser",
+)
+
+STARTUP_SCRIPT = """
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from utils.config_utils import get_config_store, save_config
+
+app = QApplication([])
+save_config({"silent_mode": True, "check_update": False})
+get_config_store().flush()
+
+from views.main_window import MainWindow
+
+window = MainWindow()
+app.processEvents()
+print("loaded:", *(name for name in sys.argv[1:] if name in sys.modules))
+"""
+
+
+def test_silent_startup_skips_update_stack(tmp_path):
+    # Run in a fresh interpreter so nothing imported by pytest leaks in
+    env = dict(
+        os.environ,
+        QT_QPA_PLATFORM="offscreen",
+        HOME=str(tmp_path),
+        XDG_CONFIG_HOME=str(tmp_path / "config"),
+        XDG_STATE_HOME=str(tmp_path / "state"),
+        XDG_RUNTIME_DIR=str(tmp_path / "runtime"),
+        PYTHONPATH=str(APP_DIR),
+    )
+    (tmp_path / "runtime").mkdir(mode=0o700)
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT, *UPDATE_STACK],
+        check=False,
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "loaded:"
@@ -0,0 +1,40 @@
+"""Lines the log view drops must still reach the on-disk session log"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6.QtCore import QCoreApplication
+from services.session_engine import LogLines
+from services.session_service import SessionBridge
+from utils.log_utils import MAX_PENDING_LINES, SessionLog
+
+
+class FakeEngine:
+    def subscribe(self, listener):
+        self.listener = listener
+
+    def unsubscribe(self, listener):
+        self.listener = None
+
+
+def test_dropped_view_lines_are_logged(tmp_path):
+    _app = QCoreApplication.instance() or QCoreApplication([])
+    engine = FakeEngine()
+    session_log = SessionLog(log_dir=str(tmp_path))
+    bridge = SessionBridge(engine, session_log=session_log)
+
+    count = MAX_PENDING_LINES + 1000
+    for start in range(0, count, 500):
+        engine.listener(LogLines([f"line {i}\n" for i in range(start, start + 500)]))
+
+    stats = bridge.log_batcher.stats()
+    assert stats["lines_dropped"] == 1000
+    lines = [line.rstrip("\n").split(" ", 2)[2] for line in session_log.iter_lines()]
+    assert lines == [f"line {i}" for i in range(count)]
+    session_log.close()